@@ -3,55 +3,115 @@
 
 import logging
 import os
+import time
 
-from PySide2 import QtCore
-from PySide2 import QtWidgets
+# Момент начала импорта пакета, от которого отсчитываются этапы запуска
+IMPORT_STARTED = time.perf_counter()
 
-from .mainwindow import MainWindow
-# noinspection PyUnresolvedReferences
-from . import rfdiagram_rc
+
+# Допустимое время от запуска программы до показа главного окна в секундах
+STARTUP_BUDGET = 1.0
 
 
 def main():
     import sys
 
-    app = QtWidgets.QApplication(sys.argv)
-    app.setOrganizationDomain("new-divos.ru")
-    app.setApplicationName("rfdiagram")
-
-    path = QtCore.QStandardPaths.writableLocation(
-        QtCore.QStandardPaths.AppDataLocation
-    )
-    if not path:
-        # noinspection PyArgumentList
-        path = os.path.join(QtCore.QDir.tempPath(), "rfdiagram")
-
-    app_dir = QtCore.QDir(path)
-    path = app_dir.absolutePath()
-    if app_dir.mkpath(path):
-        log_path = os.path.join(path, "logs")
-        app_dir.mkpath(log_path)
-    else:
-        print("Cannot create application data directory", file=sys.stderr)
-        sys.exit(-1)
-
-    logging.basicConfig(
-        format="%(levelname)-8s [%(asctime)s] %(message)s",
-        level=logging.DEBUG,
-        filename=os.path.join(log_path, "rfdiagram.log")
-    )
-
-    translator = QtCore.QTranslator()
-    locale = QtCore.QLocale()
-    if translator.load(locale, "rfdiagram", "_", ":/languages"):
-        app.installTranslator(translator)
-        logging.info(f"The translator for the locale '{locale.name()}'"
-                     " was loaded and installed")
-
-    window = MainWindow(locale)
-    logging.debug("The main window object has been created")
-    window.showMaximized()
-    logging.info("The main window has been shown")
+    qt_import_started = time.perf_counter()
+
+    # Qt импортируется при запуске программы, а не при импорте пакета,
+    # чтобы модули обработки данных можно было использовать без Qt
+    from PySide2 import QtCore
+    from PySide2 import QtWidgets
+
+    from .rfprofile import StartupProfiler
+    from .rfresources import register_resources
+
+    qt_imported = time.perf_counter()
+
+    profiler = StartupProfiler.from_arguments(IMPORT_STARTED, sys.argv)
+    profiler.record("import Qt", qt_import_started, qt_imported)
+
+    with profiler.phase("create application"):
+        app = QtWidgets.QApplication(sys.argv)
+        app.setOrganizationDomain("new-divos.ru")
+        app.setApplicationName("rfdiagram")
+
+    with profiler.phase("create data directory"):
+        path = QtCore.QStandardPaths.writableLocation(
+            QtCore.QStandardPaths.AppDataLocation
+        )
+        if not path:
+            # noinspection PyArgumentList
+            path = os.path.join(QtCore.QDir.tempPath(), "rfdiagram")
+
+        app_dir = QtCore.QDir(path)
+        path = app_dir.absolutePath()
+        if app_dir.mkpath(path):
+            log_path = os.path.join(path, "logs")
+            app_dir.mkpath(log_path)
+        else:
+            print("Cannot create application data directory", file=sys.stderr)
+            sys.exit(-1)
+
+    with profiler.phase("configure logging"):
+        logging.basicConfig(
+            format="%(levelname)-8s [%(asctime)s] %(message)s",
+            level=logging.DEBUG,
+            filename=os.path.join(log_path, "rfdiagram.log")
+        )
+
+    # Результаты профилирования запуска записываются рядом с журналом
+    # после первой отрисовки графика и загрузки тяжелых модулей
+    profiler.set_output_directory(log_path)
+    profiler.finish_when("first_plot_paint", "warm_up_finished")
+    app.aboutToQuit.connect(profiler.finish)
+
+    with profiler.phase("register resources"):
+        # Отсутствие ресурсов не препятствует работе программы
+        register_resources()
+
+    with profiler.phase("load translator"):
+        translator = QtCore.QTranslator()
+        locale = QtCore.QLocale()
+        if translator.load(locale, "rfdiagram", "_", ":/languages"):
+            app.installTranslator(translator)
+            logging.info(f"The translator for the locale '{locale.name()}'"
+                         " was loaded and installed")
+
+    # Главное окно импортируется здесь, чтобы импорт пакета оставался
+    # легким; Matplotlib и SciPy загружаются после показа окна
+    with profiler.phase("import main window"):
+        from .mainwindow import MainWindow
+
+    with profiler.phase("open edit journal"):
+        from .rfjournal import EditJournal
+
+        journal = EditJournal(os.path.join(path, "journal"))
+        if not journal.acquire():
+            journal = None
+
+    with profiler.phase("create main window"):
+        window = MainWindow(locale, profiler, journal)
+        logging.debug("The main window object has been created")
+
+    with profiler.phase("show main window"):
+        window.showMaximized()
+
+    # Время запуска отсчитывается от начала импорта пакета, чтобы
+    # учитывать импорт Qt и модулей программы
+    elapsed = time.perf_counter() - IMPORT_STARTED
+    logging.info(f"The main window has been shown in {elapsed * 1000.0:.0f} ms"
+                 " since the package import")
+    if elapsed > STARTUP_BUDGET:
+        logging.warning("The startup time exceeds the budget of"
+                        f" {STARTUP_BUDGET * 1000.0:.0f} ms")
+
+    window.schedule_warm_up()
+
+    # Несохраненные данные предыдущего сеанса восстанавливаются
+    # после показа главного окна
+    QtCore.QTimer.singleShot(0, window.recover_session)
 
     logging.info("Start the application event cycle")
+    profiler.mark("event_loop_started")
     sys.exit(app.exec_())
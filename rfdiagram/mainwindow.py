@@ -2,25 +2,42 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import time
 import numpy as np
-import matplotlib.backends.backend_qt5agg as backend
-from matplotlib.figure import Figure
 
 from PySide2 import QtCore
 from PySide2 import QtGui
 from PySide2 import QtWidgets
 
+from .rfbinary import BINARY_SUFFIX
+from .rfbuffer import rows_to_ranges
 from .rfdelegate import RangeFindingDelegate
+from .rfinteract import HoverReadout, PointDragger
+from .rfinterp import DEFAULT_INTERPOLATOR, INTERPOLATORS
 from .rfmodel import RangeFindingModel
+from .rfpainter import PolarPlotWidget
+from .rfplot import PolarPlotController
+from .rfprofile import FirstPaintWatcher, StartupProfiler
+from .rfrecords import BASE_EMPTY
+from .rfscheduler import ReplotScheduler
+from .rfworker import ImportJob, LoadJob, PlotJob, SaveJob
 
 
 # noinspection PyArgumentList, PyUnresolvedReferences
 class MainWindow(QtWidgets.QMainWindow):
 
-    def __init__(self, locale: QtCore.QLocale, parent=None):
+    # Средство отображения графика по умолчанию
+    DEFAULT_RENDERER = 'matplotlib'
+
+    def __init__(self, locale: QtCore.QLocale,
+                 profiler: StartupProfiler = None, journal=None, parent=None):
         super().__init__(parent)
         self.locale = locale
 
+        # Без профилировщика запуска этапы запуска не измеряются
+        self.profiler = profiler if profiler is not None else \
+            StartupProfiler(time.perf_counter())
+
         self.file_name = None
         self.is_dirty = False
         self.update_window_title()
@@ -36,11 +53,23 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.model = RangeFindingModel(locale, self)
         self.model.dataChanged.connect(self.on_data_changed)
+
+        # Изменения модели записываются в журнал, по которому после
+        # аварийного завершения восстанавливаются несохраненные данные.
+        # Журнал прежнего сеанса сохраняется до решения пользователя
+        self.journal = journal
+        self.recovery_header = None
+        if self.journal is not None:
+            self.journal.attach(self.model)
+            self.recovery_header = self.journal.pending_recovery()
+            if self.recovery_header is None:
+                self.journal.restart()
+
         self.delegate = RangeFindingDelegate(locale, self)
 
         self.view.setItemDelegate(self.delegate)
         self.view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.view.setSortingEnabled(False)
         self.view.setModel(self.model)
         self.view.setAlternatingRowColors(True)
@@ -152,6 +181,70 @@ class MainWindow(QtWidgets.QMainWindow):
         self.plot_action.triggered.connect(self.on_plot)
         self.plot_action.setEnabled(False)
 
+        self.auto_replot_action = QtWidgets.QAction(
+            self.tr("Auto Replot"),
+            self
+        )
+        self.auto_replot_action.setToolTip(self.tr(
+            "Keep the range finding diagram up to date while editing"
+        ))
+        self.auto_replot_action.setCheckable(True)
+        self.auto_replot_action.setChecked(False)
+        self.auto_replot_action.toggled.connect(self.on_auto_replot_toggled)
+
+        self.statistics_action = QtWidgets.QAction(
+            self.tr("Statistics..."),
+            self
+        )
+        self.statistics_action.setToolTip(self.tr(
+            "Show the coverage area and range statistics by sectors"
+        ))
+        self.statistics_action.triggered.connect(self.on_statistics)
+        self.statistics_action.setEnabled(False)
+
+        # Выполнить создание действий выбора метода интерполяции
+        interpolation_titles = {
+            'cubic': self.tr("Periodic Cubic Spline"),
+            'pchip': self.tr("PCHIP"),
+            'akima': self.tr("Akima Spline"),
+            'linear': self.tr("Linear"),
+            'fourier': self.tr("Trigonometric Series"),
+            'parametric': self.tr("Closed Parametric Spline")
+        }
+
+        self.interpolation_kind = DEFAULT_INTERPOLATOR
+        self.interpolation_group = QtWidgets.QActionGroup(self)
+        self.interpolation_group.setExclusive(True)
+        for kind in INTERPOLATORS:
+            action = QtWidgets.QAction(interpolation_titles.get(kind, kind),
+                                       self.interpolation_group)
+            action.setCheckable(True)
+            action.setChecked(kind == self.interpolation_kind)
+            action.setData(kind)
+        self.interpolation_group.triggered.connect(
+            self.on_interpolation_changed
+        )
+
+        # Выполнить создание действий выбора средства отображения графика
+        renderer_titles = {
+            'matplotlib': self.tr("Matplotlib"),
+            'native': self.tr("Native (Fast)")
+        }
+
+        settings = QtCore.QSettings()
+        self.renderer = settings.value("plot/renderer", self.DEFAULT_RENDERER)
+        if self.renderer not in renderer_titles:
+            self.renderer = self.DEFAULT_RENDERER
+
+        self.renderer_group = QtWidgets.QActionGroup(self)
+        self.renderer_group.setExclusive(True)
+        for renderer, title in renderer_titles.items():
+            action = QtWidgets.QAction(title, self.renderer_group)
+            action.setCheckable(True)
+            action.setChecked(renderer == self.renderer)
+            action.setData(renderer)
+        self.renderer_group.triggered.connect(self.on_renderer_changed)
+
         self.save_plot_as_action = QtWidgets.QAction(
             QtGui.QIcon(":images/saveimage.png"),
             self.tr("Save Plot As..."),
@@ -192,9 +285,19 @@ class MainWindow(QtWidgets.QMainWindow):
 
         view_menu: QtWidgets.QMenu = self.menuBar().addMenu(self.tr("View"))
         view_menu.addAction(docked_visibility_action)
+        view_menu.addSeparator()
+        renderer_menu: QtWidgets.QMenu = \
+            view_menu.addMenu(self.tr("Plot Renderer"))
+        renderer_menu.addActions(self.renderer_group.actions())
 
         plot_menu: QtWidgets.QMenu = self.menuBar().addMenu(self.tr("Plot"))
         plot_menu.addAction(self.plot_action)
+        plot_menu.addAction(self.auto_replot_action)
+        plot_menu.addAction(self.statistics_action)
+        plot_menu.addSeparator()
+        interpolation_menu: QtWidgets.QMenu = \
+            plot_menu.addMenu(self.tr("Interpolation"))
+        interpolation_menu.addActions(self.interpolation_group.actions())
 
         # Выполнить настройку панелей инструментов программы
         file_toolbar: QtWidgets.QToolBar = self.addToolBar("File")
@@ -223,30 +326,164 @@ class MainWindow(QtWidgets.QMainWindow):
         self.measurement_label = QtWidgets.QLabel(self)
         self.measurement_label.setIndent(10)
 
+        # Азимут и дальность под курсором мыши на графике
+        self.cursor_label = QtWidgets.QLabel(self)
+        self.cursor_label.setIndent(10)
+
         self.statusBar().addWidget(self.location_label)
         self.statusBar().addWidget(self.measurement_label)
+        self.statusBar().addWidget(self.cursor_label)
 
         self.update_status_bar()
 
-        # Добавить виджеты для отображения графика
-        self.figure = Figure()
-        self.canvas = backend.FigureCanvasQTAgg(self.figure)
-        self.setCentralWidget(self.canvas)
         self.is_plotted = False
+        self.plotted_version = None
+
+        # Допустимое отклонение отображаемой кривой диаграммы в пикселях
+        # и ширина секторов для статистики зоны действия в градусах
+        self.curve_tolerance = 0.5
+        self.statistics_sector_width = 30.0
+
+        # Изменения данных объединяются и обрабатываются с задержкой,
+        # чтобы пакетное редактирование не вызывало перерисовку
+        # графика после каждого изменения
+        self.replot_scheduler = ReplotScheduler(parent=self)
+        self.replot_scheduler.triggered.connect(self.on_replot_requested)
+
+        # Начиная с этого количества измерений, диаграмма строится
+        # в фоновом потоке над снимком данных модели
+        self.background_plot_threshold = 20000
+        self.plot_job = None
+
+        # Количество шагов и задержка появления диалога хода загрузки
+        # в миллисекундах
+        self.progress_steps = 1000
+        self.progress_minimum_duration = 500
+        self.load_cancelled = False
+
+        # Чтение и запись файлов выполняются в фоновом потоке. Пока
+        # задание выполняется, новые файловые операции не начинаются
+        self.file_job = None
+        self.file_progress_dialog = None
+
+        # Добавить виджеты для отображения графика. Встроенное средство
+        # отображения создается сразу, а до загрузки Matplotlib вместо
+        # графика выводится заглушка
+        self.figure = None
+        self.canvas = None
+        self.plot = None
+        self.dragger = None
+        self.hover_readout = None
+
+        # Модули, загружаемые в фоне после показа главного окна
+        self.warm_up_modules = ("scipy.interpolate",
+                                "matplotlib.figure",
+                                "matplotlib.backends.backend_agg")
+        self.warm_up_job = None
+        self.warm_up_started = None
+
+        if self.renderer == 'native':
+            self.create_plot(self.renderer)
+        else:
+            self.create_plot_placeholder()
+
+    def create_plot_placeholder(self):
+        placeholder = QtWidgets.QLabel(self.tr("Loading the plot..."), self)
+        placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        placeholder.setAutoFillBackground(True)
+        palette = placeholder.palette()
+        palette.setColor(QtGui.QPalette.Window, QtCore.Qt.white)
+        placeholder.setPalette(palette)
+
+        self.setCentralWidget(placeholder)
+
+    def ensure_plot(self):
+        if self.plot is None:
+            self.create_plot(self.renderer)
 
-        axes = self.figure.get_axes()
-        if len(axes) == 0:
-            ax = self.figure.add_subplot(111, projection='polar')
+    def schedule_warm_up(self):
+        # Тяжелые модули загружаются после первой отрисовки центрального
+        # виджета, чтобы окно с заглушкой графика появилось без задержки
+        watcher = FirstPaintWatcher(self.centralWidget())
+        watcher.painted.connect(self.warm_up)
 
-            ax.set_rmax(50.0)
-            ax.grid(True)
+    @QtCore.Slot()
+    def warm_up(self):
+        # Модули импортируются в фоновом потоке, поэтому интерфейс
+        # остается отзывчивым во время их загрузки
+        self.warm_up_started = time.perf_counter()
+
+        job = ImportJob(self.warm_up_modules)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self.on_warm_up_finished)
+
+        self.warm_up_job = job
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    @QtCore.Slot(object)
+    def on_warm_up_finished(self, job: ImportJob):
+        self.warm_up_job = None
+        for name, started, finished in job.timings:
+            self.profiler.record(f"import {name}", started, finished)
+
+        # Виджеты графика создаются только в потоке интерфейса
+        self.ensure_plot()
+        self.update_actions()
+
+        elapsed = time.perf_counter() - self.warm_up_started
+        logging.info("The plotting modules have been loaded in"
+                     f" {elapsed * 1000.0:.0f} ms")
+        self.profiler.mark("warm_up_finished")
+
+    def create_plot(self, renderer: str):
+        # Заменить центральный виджет графиком выбранного средства
+        # отображения. Предыдущий виджет удаляется главным окном
+        self.cursor_label.clear()
+
+        if renderer == 'native':
+            self.figure = None
+            self.canvas = None
+            self.dragger = None
+            self.hover_readout = None
+
+            self.plot = PolarPlotWidget(self)
+            self.setCentralWidget(self.plot)
+            self.profiler.watch_first_paint(self.plot, "first_plot_paint")
+            return
 
-            self.canvas.draw()
+        with self.profiler.phase("import matplotlib"):
+            import matplotlib.backends.backend_qt5agg as backend
+            from matplotlib.figure import Figure
+
+        with self.profiler.phase("create matplotlib canvas"):
+            self.figure = Figure()
+            self.canvas = backend.FigureCanvasQTAgg(self.figure)
+            self.setCentralWidget(self.canvas)
+
+            self.plot = PolarPlotController(self.figure, self.canvas)
+        self.profiler.watch_first_paint(self.canvas, "first_plot_paint")
+
+        # Перетаскивание маркеров измерений на графике
+        self.dragger = PointDragger(self.plot,
+                                    self.displayed_products,
+                                    self.on_point_moved)
+
+        # Показ дальности зоны действия под курсором мыши
+        self.hover_readout = HoverReadout(self.plot,
+                                          self.displayed_products,
+                                          self.on_hover,
+                                          self.dragger)
 
     def closeEvent(self, event: QtGui.QCloseEvent):
-        if self.ok_to_continue():
+        if self.file_job is not None:
+            self.file_job.cancel()
+            event.ignore()
+        elif self.ok_to_continue():
             logging.info("Start to close the main window."
                          " The application will finish work")
+            self.cancel_plot_job()
+            if self.journal is not None:
+                self.journal.close()
             event.accept()
         else:
             event.ignore()
@@ -267,13 +504,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle(''.join(result))
 
     def update_actions(self):
-        model_is_not_empty = not self.model.empty()
+        # Во время чтения или записи файла документ нельзя изменять,
+        # поскольку загруженные данные заменяют модель целиком
+        idle = self.file_job is None
+        model_is_not_empty = idle and not self.model.empty()
+
+        self.new_action.setEnabled(idle)
+        self.open_action.setEnabled(idle)
+        self.add_action.setEnabled(idle)
+        self.renderer_group.setEnabled(idle)
+        self.view.setEnabled(idle)
+        if self.centralWidget() is not None:
+            self.centralWidget().setEnabled(idle)
 
         self.remove_action.setEnabled(model_is_not_empty)
         self.clear_action.setEnabled(model_is_not_empty)
         self.plot_action.setEnabled(model_is_not_empty)
+        self.statistics_action.setEnabled(model_is_not_empty)
 
-        self.save_plot_as_action.setEnabled(self.is_plotted)
+        self.save_plot_as_action.setEnabled(idle and self.is_plotted)
 
         can_save = model_is_not_empty and self.is_dirty
 
@@ -316,44 +565,85 @@ class MainWindow(QtWidgets.QMainWindow):
             self.location_label.setText(f" {row + 1}:{self.model.rowCount()} ")
 
     def clear_plot(self):
-        axes = self.figure.get_axes()
-        if len(axes) == 0:
-            ax = self.figure.add_subplot(111, projection='polar')
-        else:
-            ax = axes[0]
-        ax.clear()
-
-        ax.set_rmax(50.0)
-        ax.grid(True)
-
-        self.canvas.draw()
+        self.cancel_plot_job()
+        if self.plot is not None:
+            self.plot.clear()
         self.is_plotted = False
+        self.plotted_version = None
+
+    def run_file_job(self, job, text: str):
+        # Выполнить задание в фоновом потоке. До его завершения работает
+        # вложенный цикл обработки событий, поэтому интерфейс остается
+        # отзывчивым, а диалог показывает ход выполнения и позволяет
+        # отменить задание
+        progress_dialog = QtWidgets.QProgressDialog(
+            text.format(QtCore.QFileInfo(job.file_name).fileName()),
+            self.tr("Cancel"),
+            0,
+            self.progress_steps,
+            self
+        )
+        progress_dialog.setWindowTitle(self.tr("Range Finding Diagram"))
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        progress_dialog.setMinimumDuration(self.progress_minimum_duration)
+        progress_dialog.canceled.connect(job.cancel)
+
+        loop = QtCore.QEventLoop(self)
+        job.setAutoDelete(False)
+        job.signals.progress.connect(self.on_file_job_progress)
+        job.signals.finished.connect(loop.quit)
+
+        # Пока диалог скрыт в течение минимальной задержки, окно
+        # принимает ввод, поэтому действия с документом отключаются
+        self.file_job = job
+        self.file_progress_dialog = progress_dialog
+        self.update_actions()
+        try:
+            QtCore.QThreadPool.globalInstance().start(job)
+            loop.exec_()
+        finally:
+            self.file_job = None
+            self.file_progress_dialog = None
+            progress_dialog.reset()
+            progress_dialog.deleteLater()
+            self.update_actions()
 
-    def load_file(self, file_name: str):
-        if file_name:
-            try:
-                with open(file_name, mode='r', encoding='utf-8') as fin:
-                    json_lines = fin.readlines()
-
-                if self.model.from_json('\n'.join(json_lines)):
-                    self.is_dirty = False
-                    self.file_name = file_name
-
-                    self.update_actions()
-                    self.update_window_title()
+        return job
 
-                    logging.debug(f"The file {file_name} was successfully loaded")
-                    self.statusBar().showMessage(self.tr("File loaded"),
-                                                 self.status_bar_message_timeout)
-                    return True
-                else:
-                    logging.error(f"Cannot read data from the JSON file: {file_name}")
+    @QtCore.Slot(float)
+    def on_file_job_progress(self, fraction: float):
+        if self.file_progress_dialog is not None and \
+                not self.file_progress_dialog.wasCanceled():
+            self.file_progress_dialog.setValue(
+                min(int(self.progress_steps * fraction),
+                    self.progress_steps - 1)
+            )
 
-            except OSError as exc:
-                logging.error(
-                    "An exception occurred during loading "
-                    f"from the file {file_name}: {exc.strerror}"
-                )
+    def load_file(self, file_name: str):
+        self.load_cancelled = False
+        if file_name and self.file_job is None:
+            job = self.run_file_job(LoadJob(file_name),
+                                    self.tr("Loading {}..."))
+            self.load_cancelled = job.is_cancelled()
+
+            if job.succeeded:
+                # Модель заменяется целиком только после завершения чтения
+                self.model.adopt_columns(job.columns, job.length)
+                if self.journal is not None:
+                    self.journal.restart(file_name)
+
+                self.is_dirty = False
+                self.file_name = file_name
+
+                self.update_actions()
+                self.update_window_title()
+
+                logging.debug(f"The file {file_name} was successfully loaded")
+                self.statusBar().showMessage(self.tr("File loaded"),
+                                             self.status_bar_message_timeout)
+                return True
+            elif not self.load_cancelled:
+                logging.error(f"Cannot read data from the file: {file_name}")
 
         self.statusBar().showMessage(self.tr("Loading cancelled"),
                                      self.status_bar_message_timeout)
@@ -361,13 +651,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def save_file(self, file_name: str):
         if not self.model.empty():
-            if file_name:
-                try:
-                    with open(file_name, mode='w', encoding='utf-8') as fout:
-                        fout.write(self.model.to_json())
+            if file_name and self.file_job is None:
+                job = self.run_file_job(
+                    SaveJob(file_name, self.model.buffer.azimuths,
+                            self.model.buffer.distances),
+                    self.tr("Saving {}...")
+                )
 
+                if job.succeeded:
                     self.file_name = file_name
                     self.is_dirty = False
+                    if self.journal is not None:
+                        self.journal.restart(file_name)
                     self.update_window_title()
                     self.update_actions()
 
@@ -375,13 +670,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.statusBar().showMessage(self.tr("File saved"),
                                                  self.status_bar_message_timeout)
                     return True
-
-                except OSError as exc:
-                    logging.error(
-                        "An exception occurred during saving "
-                        f"to the file {file_name}: {exc.strerror}"
-                    )
-            else:
+            elif not file_name:
                 logging.error(
                     "Cannot use an empty file name for saving"
                 )
@@ -424,10 +713,13 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_new(self):
         if self.ok_to_continue():
             self.model.clear()
+            self.replot_scheduler.cancel()
             self.clear_plot()
 
             self.file_name = None
             self.is_dirty = False
+            if self.journal is not None:
+                self.journal.restart()
 
             self.update_actions()
             self.update_window_title()
@@ -446,7 +738,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 parent=self,
                 caption=self.tr("Open Range Finding Diagram"),
                 dir=documents_path,
-                filter=self.tr("JSON files (*.json)")
+                filter=self.tr("Range finding diagrams (*.json *.rfd);;"
+                               "JSON files (*.json);;"
+                               "Binary files (*.rfd)")
             )
 
             if file_name:
@@ -454,14 +748,21 @@ class MainWindow(QtWidgets.QMainWindow):
                     if not self.model.empty():
                         self.view.setCurrentIndex(self.model.index(0, 0))
 
-                    self.on_plot()
+                    # Построение диаграммы читает все данные, поэтому для
+                    # документа, отображенного в память, оно выполняется
+                    # только по команде пользователя
+                    if self.model.is_mapped():
+                        self.clear_plot()
+                        self.update_actions()
+                    else:
+                        self.on_plot()
 
-                else:
+                elif not self.load_cancelled:
                     err_msg_box = QtWidgets.QMessageBox(self)
                     err_msg_box.setIcon(QtWidgets.QMessageBox.Critical)
                     err_msg_box.setWindowTitle(self.tr("Error"))
                     err_msg_box.setText(
-                        self.tr("Could not load JSON file {}").format(file_name)
+                        self.tr("Could not load file {}").format(file_name)
                     )
                     err_msg_box.setDetailedText(self.tr(
                         "See detailed information in .log file of the application"
@@ -470,6 +771,76 @@ class MainWindow(QtWidgets.QMainWindow):
 
                     err_msg_box.exec_()
 
+    def replay_journal(self, header):
+        # Загрузить исходное состояние документа и применить к нему
+        # записи журнала. Возвращается буфер измерений или None
+        if header.base == BASE_EMPTY:
+            return self.journal.replay()
+
+        base_file = self.journal.base_file(header)
+        if base_file is None:
+            return None
+
+        job = self.run_file_job(LoadJob(base_file),
+                                self.tr("Recovering {}..."))
+        if not job.succeeded:
+            return None
+
+        return self.journal.replay(job.columns, job.length)
+
+    @QtCore.Slot()
+    def recover_session(self):
+        header, self.recovery_header = self.recovery_header, None
+        if header is None or self.journal is None:
+            return
+
+        msg_box = QtWidgets.QMessageBox(self)
+        msg_box.setIcon(QtWidgets.QMessageBox.Question)
+        msg_box.setWindowTitle(self.tr("Range Finding Diagram"))
+        msg_box.setText(self.tr("The previous session was not closed properly."))
+        msg_box.setInformativeText(self.tr("Do you want to recover unsaved changes?"))
+        msg_box.setStandardButtons(QtWidgets.QMessageBox.Yes |
+                                   QtWidgets.QMessageBox.Discard)
+        msg_box.setDefaultButton(QtWidgets.QMessageBox.Yes)
+
+        msg_box.button(QtWidgets.QMessageBox.Yes).setText(self.tr("Recover"))
+        msg_box.button(QtWidgets.QMessageBox.Discard).setText(self.tr("Discard"))
+
+        buffer = None
+        if msg_box.exec_() == QtWidgets.QMessageBox.Yes:
+            buffer = self.replay_journal(header)
+            if buffer is None:
+                err_msg_box = QtWidgets.QMessageBox(self)
+                err_msg_box.setIcon(QtWidgets.QMessageBox.Critical)
+                err_msg_box.setWindowTitle(self.tr("Error"))
+                err_msg_box.setText(self.tr("Could not recover unsaved changes"))
+                err_msg_box.setDetailedText(self.tr(
+                    "See detailed information in .log file of the application"
+                ))
+                err_msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
+
+                err_msg_box.exec_()
+
+        if buffer is None:
+            self.journal.restart()
+            return
+
+        # Восстановленные данные начинают новый журнал со снимка
+        self.model.adopt_columns(buffer.columns, len(buffer))
+        self.journal.compact(header.file_name)
+
+        self.file_name = header.file_name
+        self.is_dirty = True
+
+        self.update_actions()
+        self.update_window_title()
+        self.update_status_bar()
+
+        logging.info(f"{len(buffer)} measurements have been recovered"
+                     " from the edit journal")
+        if not self.model.empty() and not self.model.is_mapped():
+            self.on_plot()
+
     @QtCore.Slot()
     def on_save(self):
         if not self.file_name:
@@ -485,14 +856,27 @@ class MainWindow(QtWidgets.QMainWindow):
         if not documents_path:
             documents_path = QtCore.QDir.homePath()
 
-        file_name, _ = QtWidgets.QFileDialog.getSaveFileName(
+        json_filter = self.tr("JSON files (*.json)")
+        binary_filter = self.tr("Binary files (*.rfd)")
+        file_name, selected_filter = QtWidgets.QFileDialog.getSaveFileName(
             parent=self,
             caption=self.tr("Save Range Finding Diagram"),
             dir=documents_path,
-            filter=self.tr("JSON files (*.json)")
+            filter=";;".join((json_filter, binary_filter))
         )
 
-        return self.save_file(file_name) if file_name else False
+        if not file_name:
+            return False
+
+        # Формат документа определяется расширением файла, поэтому
+        # к имени без известного расширения добавляется расширение
+        # выбранного фильтра
+        suffix = QtCore.QFileInfo(file_name).suffix().lower()
+        if suffix not in ("json", BINARY_SUFFIX):
+            file_name += "." + BINARY_SUFFIX \
+                if selected_filter == binary_filter else ".json"
+
+        return self.save_file(file_name)
 
     @QtCore.Slot()
     def on_add_row(self):
@@ -506,10 +890,16 @@ class MainWindow(QtWidgets.QMainWindow):
             for index in selection.indexes():
                 rows.add(index.row())
 
-            for row in rows:
-                self.model.insertRow(row + 1)
+            # Вставить после каждого непрерывного блока выделенных строк
+            # столько же пустых строк, начиная с последнего блока
+            for row, count in reversed(rows_to_ranges(rows)):
+                self.model.insert_measurements(
+                    row + count,
+                    np.zeros((count, 2), dtype=np.float32)
+                )
 
-        self.clear_plot()
+        self.cancel_plot_job()
+        self.replot_scheduler.request()
         self.update_actions()
 
         self.is_dirty = True
@@ -527,10 +917,10 @@ class MainWindow(QtWidgets.QMainWindow):
         for index in selection.indexes():
             rows.add(index.row())
 
-        for row in rows:
-            self.model.removeRow(row)
+        self.model.remove_row_ranges(rows_to_ranges(rows))
 
-        self.clear_plot()
+        self.cancel_plot_job()
+        self.replot_scheduler.request()
         self.update_actions()
 
         self.is_dirty = True
@@ -541,6 +931,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_clear(self):
         self.model.clear()
 
+        self.replot_scheduler.cancel()
         self.clear_plot()
         self.update_actions()
 
@@ -550,37 +941,154 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @QtCore.Slot()
     def on_plot(self):
-        axes = self.figure.get_axes()
-        if len(axes) == 0:
-            ax = self.figure.add_subplot(111, projection='polar')
+        # Отложенное перестроение и незавершенное фоновое построение
+        # больше не требуются
+        self.replot_scheduler.cancel()
+        self.cancel_plot_job()
+
+        # Большие наборы данных обрабатываются в фоновом потоке,
+        # если продукты диаграммы еще не построены
+        products = self.model.products(
+            self.interpolation_kind,
+            build=self.model.rowCount() < self.background_plot_threshold
+        )
+
+        if products is None and not self.model.empty():
+            self.start_plot_job()
+        else:
+            self.show_products(products)
+
+    def show_products(self, products, curve=None):
+        self.ensure_plot()
+
+        if products is not None:
+            if curve is None:
+                # Оценить предел шкалы дальности по равномерной сетке,
+                # чтобы определить масштаб в пикселях на единицу дальности
+                # для адаптивной выборки кривой
+                max_r = max(np.max(products.distances),
+                            np.max(products.dense_grid()[1]))
+                curve = products.adaptive_curve(
+                    self.plot.radius() / self.plot.range_limit_for(max_r),
+                    self.curve_tolerance
+                )
+
+            new_theta, new_r = curve
+            self.plot.show(products.azimuths, products.distances,
+                           new_theta, new_r)
+        else:
+            self.plot.clear()
+
+        self.is_plotted = True
+        self.plotted_version = self.model.version
+        self.update_actions()
+
+    def displayed_products(self):
+        # Продукты доступны, только пока график соответствует данным модели
+        if not self.is_plotted or self.plotted_version != self.model.version:
+            return None
+
+        return self.model.products(self.interpolation_kind, build=False)
+
+    def start_plot_job(self):
+        self.ensure_plot()
+
+        job = PlotJob(self.model.version,
+                      self.interpolation_kind,
+                      self.model.measurements.copy(),
+                      self.plot.radius(),
+                      self.curve_tolerance,
+                      PolarPlotController.range_limit_for)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self.on_plot_job_finished)
+        job.signals.failed.connect(self.on_plot_job_failed)
+
+        self.plot_job = job
+        QtCore.QThreadPool.globalInstance().start(job)
+
+        logging.debug(f"The plot job for the data version {job.version}"
+                      " has been started")
+        self.statusBar().showMessage(self.tr("Plotting..."))
+
+    def cancel_plot_job(self):
+        if self.plot_job is not None:
+            self.plot_job.cancel()
+            self.plot_job = None
+            self.statusBar().clearMessage()
+
+    @QtCore.Slot(object)
+    def on_plot_job_finished(self, job: PlotJob):
+        if job is not self.plot_job or job.is_cancelled():
+            return
+
+        self.plot_job = None
+        self.statusBar().clearMessage()
+
+        # Результат применяется, только если данные модели не изменились
+        # с момента запуска задания
+        if self.model.adopt_products(job.products, job.version):
+            self.show_products(job.products, job.curve)
         else:
-            ax = axes[0]
-        ax.clear()
+            logging.debug(f"The plot job for the stale data version"
+                          f" {job.version} has been discarded")
 
-        is_valid, theta, r, f = self.model.prepare()
+    @QtCore.Slot(object)
+    def on_plot_job_failed(self, job: PlotJob):
+        if job is self.plot_job:
+            self.plot_job = None
+            self.statusBar().showMessage(self.tr("Plotting failed"),
+                                         self.status_bar_message_timeout)
 
-        if is_valid:
-            ax.grid(True)
+    @QtCore.Slot()
+    def on_statistics(self):
+        statistics = self.model.statistics(self.statistics_sector_width,
+                                           self.interpolation_kind)
+        if statistics is None:
+            return
 
-            new_theta = np.linspace(
-                np.min(theta),
-                np.max(theta),
-                1000,
-                endpoint=True
+        def number(value):
+            return self.locale.toString(float(value), 'f', 3)
+
+        sectors = statistics.sectors
+        ends = np.append(sectors.starts[1:], 360.0)
+        sector_lines = [
+            "{}\u00B0 \u2013 {}\u00B0: {} = {}; {} = {}; {} = {}".format(
+                self.locale.toString(float(start), 'f', 1),
+                self.locale.toString(float(end), 'f', 1),
+                self.tr("min"), number(minimum),
+                self.tr("max"), number(maximum),
+                self.tr("mean"), number(mean)
+            )
+            for start, end, minimum, maximum, mean in zip(
+                sectors.starts, ends,
+                sectors.minimum, sectors.maximum, sectors.mean
+            )
+        ]
+
+        msg_box = QtWidgets.QMessageBox(self)
+        msg_box.setIcon(QtWidgets.QMessageBox.Information)
+        msg_box.setWindowTitle(self.tr("Coverage Statistics"))
+        msg_box.setText(
+            "{}: {}\n{}: {}\n{}: {}\n{}: {}".format(
+                self.tr("Coverage area"), number(statistics.area),
+                self.tr("Mean range"), number(statistics.mean),
+                self.tr("Minimum range"), number(statistics.minimum),
+                self.tr("Maximum range"), number(statistics.maximum)
             )
-            new_r = f(new_theta)
-            ax.plot(new_theta, new_r, color='maroon', linestyle='--')
-            ax.plot(theta, r, color='darkblue', marker='o', linestyle='none')
+        )
+        msg_box.setDetailedText("\n".join(sector_lines))
+        msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
 
-            max_r = np.max(r)
-            max_new_r = np.max(new_r)
-            if max_r < max_new_r:
-                max_r = max_new_r
-            ax.set_rmax(max_r + 10.0 if max_r > 50.0 else 50.0)
+        msg_box.exec_()
 
-        self.canvas.draw()
-        self.is_plotted = True
-        self.update_actions()
+    @QtCore.Slot(QtWidgets.QAction)
+    def on_interpolation_changed(self, action: QtWidgets.QAction):
+        self.interpolation_kind = action.data()
+        logging.debug(f"The interpolation method '{self.interpolation_kind}'"
+                      " has been selected")
+
+        if self.is_plotted:
+            self.on_plot()
 
     @QtCore.Slot()
     def on_save_plot(self):
@@ -599,12 +1107,96 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
         if file_name:
-            self.figure.savefig(file_name)
+            self.export_figure().savefig(file_name)
+
+    def export_figure(self):
+        if self.figure is not None:
+            # Анимированные элементы перекрестия выводятся при сохранении
+            # рисунка, если они видимы, поэтому перекрестие скрывается
+            if self.hover_readout is not None:
+                self.hover_readout.hide()
+            return self.figure
+
+        # Встроенное средство отображения не поддерживает экспорт,
+        # поэтому изображение строится Matplotlib по выведенным данным
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure()
+        export_plot = PolarPlotController(figure, FigureCanvasAgg(figure))
+        if self.plot.data is not None:
+            export_plot.show(*self.plot.data)
+
+        return figure
+
+    @QtCore.Slot(QtWidgets.QAction)
+    def on_renderer_changed(self, action: QtWidgets.QAction):
+        renderer = action.data()
+        if renderer == self.renderer:
+            return
+
+        self.renderer = renderer
+        QtCore.QSettings().setValue("plot/renderer", renderer)
+        logging.debug(f"The plot renderer '{renderer}' has been selected")
+
+        self.create_plot(renderer)
+        if self.is_plotted:
+            self.on_plot()
 
     @QtCore.Slot()
     def on_data_changed(self):
-        self.clear_plot()
+        self.cancel_plot_job()
+        self.replot_scheduler.request()
 
         self.is_dirty = True
         self.update_window_title()
         self.update_status_bar()
+
+    def on_hover(self, readout):
+        if readout is None:
+            self.cursor_label.clear()
+            return
+
+        azimuth, distance, coverage, row, nearest_azimuth, nearest_distance = \
+            readout
+        self.cursor_label.setText(
+            "{}: {:.2f}\u00b0, {:.2f}; {} = {:.2f}; {} #{}: {:.2f}\u00b0, {:.2f}"
+            .format(
+                self.tr("Cursor"),
+                azimuth,
+                distance,
+                self.tr("Coverage"),
+                coverage,
+                self.tr("Nearest"),
+                row + 1,
+                nearest_azimuth,
+                nearest_distance
+            )
+        )
+
+    def on_point_moved(self, row: int, azimuth: float, distance: float):
+        # Сохранить представление азимута, ближайшее к исходному значению,
+        # чтобы перемещение не меняло знак или оборот азимута
+        azimuth_index = self.model.index(row, 0)
+        previous = float(self.model.data(azimuth_index, QtCore.Qt.EditRole))
+        azimuth = previous + np.mod(azimuth - previous + 180.0, 360.0) - 180.0
+
+        self.model.setData(azimuth_index, azimuth, QtCore.Qt.EditRole)
+        self.model.setData(self.model.index(row, 1), distance,
+                           QtCore.Qt.EditRole)
+
+        self.view.selectRow(row)
+        self.on_plot()
+
+    @QtCore.Slot()
+    def on_replot_requested(self):
+        if self.auto_replot_action.isChecked() and not self.model.empty():
+            self.on_plot()
+        else:
+            self.clear_plot()
+            self.update_actions()
+
+    @QtCore.Slot(bool)
+    def on_auto_replot_toggled(self, checked: bool):
+        if checked and not self.model.empty():
+            self.replot_scheduler.request()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+import struct
+
+import numpy as np
+
+
+# Двоичный формат документа: заголовок фиксированного размера, за которым
+# следуют столбцы азимутов и дальностей в виде массивов float32 с порядком
+# байтов от младшего к старшему. Столбцы выровнены по границе заголовка,
+# поэтому файл отображается в память как массив (2, N) без копирования
+BINARY_SUFFIX = "rfd"
+BINARY_MAGIC = b"RFDG"
+BINARY_VERSION = 1
+
+# Сигнатура, версия формата, размер заголовка и количество измерений
+HEADER = struct.Struct('<4sHHQ')
+HEADER_SIZE = 64
+
+COLUMN_DTYPE = np.dtype('<f4')
+
+# Количество значений, записываемых за одно обращение к файлу
+WRITE_BLOCK_SIZE = 1 << 20
+
+
+def is_binary_file(file_name: str):
+    return os.path.splitext(file_name)[1].lower() == '.' + BINARY_SUFFIX
+
+
+def write_binary(file_name: str, azimuths, distances,
+                 progress=None, is_cancelled=None):
+    # Файл записывается во временный файл, который затем атомарно
+    # заменяет исходный. Это позволяет сохранять документ в файл,
+    # отображенный в память, не изменяя отображенные страницы.
+    # Функция progress(fraction) получает долю записанных данных,
+    # а is_cancelled() позволяет прервать запись между блоками
+    count = azimuths.shape[0]
+    header = HEADER.pack(BINARY_MAGIC, BINARY_VERSION, HEADER_SIZE, count)
+
+    temp_name = file_name + ".tmp"
+    try:
+        with open(temp_name, mode='wb') as fout:
+            fout.write(header.ljust(HEADER_SIZE, b'\0'))
+            for index, column in enumerate((azimuths, distances)):
+                column = np.ascontiguousarray(column, dtype=COLUMN_DTYPE)
+                for start in range(0, count, WRITE_BLOCK_SIZE):
+                    if is_cancelled is not None and is_cancelled():
+                        break
+
+                    column[start:start + WRITE_BLOCK_SIZE].tofile(fout)
+                    if progress is not None:
+                        progress((index * count + start +
+                                  min(WRITE_BLOCK_SIZE, count - start)) /
+                                 (2 * count))
+
+        if is_cancelled is not None and is_cancelled():
+            logging.info(f"Writing of the binary file {file_name}"
+                         " has been cancelled")
+            os.remove(temp_name)
+            return False
+
+        os.replace(temp_name, file_name)
+
+    except OSError as exc:
+        logging.error("An exception occurred during writing"
+                      f" the binary file {file_name}: {exc.strerror}")
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        return False
+
+    return True
+
+
+def map_binary(file_name: str):
+    # Отобразить столбцы файла в память в режиме копирования при записи.
+    # Страницы файла читаются только при обращении к ним, а изменения
+    # данных не записываются в файл
+    try:
+        with open(file_name, mode='rb') as fin:
+            header = fin.read(HEADER.size)
+        file_size = os.path.getsize(file_name)
+
+    except OSError as exc:
+        logging.error("An exception occurred during reading"
+                      f" the binary file {file_name}: {exc.strerror}")
+        return None
+
+    if len(header) < HEADER.size:
+        logging.error(f"The binary file {file_name} is truncated")
+        return None
+
+    magic, version, header_size, count = HEADER.unpack(header)
+    if magic != BINARY_MAGIC:
+        logging.error(f"The file {file_name} is not a binary measurement file")
+        return None
+
+    if version != BINARY_VERSION:
+        logging.error(f"Unsupported version {version} of the binary file"
+                      f" {file_name}")
+        return None
+
+    if header_size < HEADER.size or \
+            file_size < header_size + 2 * count * COLUMN_DTYPE.itemsize:
+        logging.error(f"The binary file {file_name} is truncated")
+        return None
+
+    if count == 0:
+        return np.zeros((2, 0), dtype=COLUMN_DTYPE)
+
+    try:
+        return np.memmap(file_name, dtype=COLUMN_DTYPE, mode='c',
+                         offset=header_size, shape=(2, count))
+
+    except (OSError, ValueError) as exc:
+        logging.error("Cannot map the binary file"
+                      f" {file_name} into memory: {exc}")
+        return None
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def merge_row_ranges(ranges):
+    # Объединить пересекающиеся и смежные диапазоны строк (row, count)
+    # и вернуть их упорядоченными по возрастанию номера первой строки
+    merged = []
+    for row, count in sorted((int(row), int(count))
+                             for row, count in ranges if count > 0):
+        if merged and row <= merged[-1][0] + merged[-1][1]:
+            first, length = merged[-1]
+            merged[-1] = (first, max(length, row + count - first))
+        else:
+            merged.append((row, count))
+
+    return merged
+
+
+def rows_to_ranges(rows):
+    return merge_row_ranges((row, 1) for row in rows)
+
+
+# noinspection PyArgumentList
+class MeasurementBuffer:
+
+    # Количество столбцов данных измерений: азимут и дальность
+    COLUMNS = 2
+
+    # Минимальная емкость буфера и коэффициент его геометрического роста
+    MIN_CAPACITY = 16
+    GROWTH_FACTOR = 1.5
+
+    def __init__(self, capacity: int = 0, dtype=np.float32):
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self.columns = np.zeros((self.COLUMNS, max(capacity, 0)),
+                                dtype=self.dtype)
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def capacity(self):
+        return self.columns.shape[1]
+
+    @property
+    def azimuths(self):
+        return self.columns[0, :self.length]
+
+    @property
+    def distances(self):
+        return self.columns[1, :self.length]
+
+    @property
+    def mapped(self):
+        # Хранилище является отображением файла в память
+        return isinstance(self.columns, np.memmap)
+
+    def view(self):
+        # Представление данных в виде массива (N, 2) без копирования
+        return self.columns[:, :self.length].T
+
+    def reserve(self, capacity: int):
+        if capacity <= self.capacity:
+            return
+
+        # Выделить новую область памяти с запасом и перенести в нее
+        # только логически занятую часть буфера
+        self._reallocate(max(capacity,
+                             int(self.capacity * self.GROWTH_FACTOR),
+                             self.MIN_CAPACITY))
+
+    def shrink_to_fit(self):
+        capacity = max(self.length, self.MIN_CAPACITY)
+        if self.capacity > capacity:
+            self._reallocate(capacity)
+
+    def _reallocate(self, capacity: int):
+        columns = np.empty((self.COLUMNS, capacity), dtype=self.dtype)
+        np.copyto(columns[:, :self.length], self.columns[:, :self.length])
+        self.columns = columns
+
+    def assign(self, values):
+        values = np.asarray(values, dtype=self.dtype)
+        if values.ndim != 2 or values.shape[1] != self.COLUMNS:
+            raise ValueError(f"Unexpected shape of measurements {values.shape}")
+
+        length = values.shape[0]
+        self.columns = np.empty((self.COLUMNS, max(length, self.MIN_CAPACITY)),
+                                dtype=self.dtype)
+        np.copyto(self.columns[:, :length], values.T)
+        self.length = length
+
+    def attach(self, columns, length: int = None):
+        # Использовать массив (2, N), например отображение файла в память,
+        # как хранилище без копирования. Хранилище копируется при первом
+        # изменении емкости буфера. Если задано количество измерений
+        # length, то остальная часть массива считается резервом
+        if columns.ndim != 2 or columns.shape[0] != self.COLUMNS:
+            raise ValueError(f"Unexpected shape of measurements {columns.shape}")
+
+        if length is None:
+            length = columns.shape[1]
+        elif not 0 <= length <= columns.shape[1]:
+            raise ValueError(f"Unexpected number of measurements {length}")
+
+        if columns.dtype != self.dtype:
+            columns = columns.astype(self.dtype)
+
+        self.columns = columns
+        self.length = length
+
+    def insert(self, row: int, count: int, values=None):
+        if row < 0 or row > self.length or count <= 0:
+            raise IndexError(f"Cannot insert {count} rows at {row}")
+
+        if values is not None:
+            values = np.asarray(values, dtype=self.dtype)
+            if values.shape != (count, self.COLUMNS):
+                raise ValueError(
+                    f"Unexpected shape of measurements {values.shape}"
+                )
+
+        self.reserve(self.length + count)
+
+        # Сдвинуть хвост буфера вправо одной операцией копирования
+        # (для вставки в конец сдвиг не требуется) и заполнить новые строки
+        end = self.length + count
+        if row < self.length:
+            np.copyto(self.columns[:, row + count:end],
+                      self.columns[:, row:self.length])
+        if values is None:
+            self.columns[:, row:row + count] = 0.0
+        else:
+            np.copyto(self.columns[:, row:row + count], values.T)
+        self.length = end
+
+    def remove(self, row: int, count: int):
+        if row < 0 or row >= self.length or count <= 0:
+            raise IndexError(f"Cannot remove {count} rows at {row}")
+
+        end = min(row + count, self.length)
+        if end < self.length:
+            # Сдвинуть хвост буфера влево на место удаляемых строк
+            np.copyto(self.columns[:, row:row + self.length - end],
+                      self.columns[:, end:self.length])
+        self.length -= end - row
+        self._release()
+
+    def remove_ranges(self, ranges):
+        # Удалить несколько диапазонов строк (row, count) одним сжатием
+        # буфера по маске оставляемых строк вместо сдвига хвоста
+        # для каждого диапазона
+        ranges = np.array(merge_row_ranges(ranges), dtype=np.int64)
+        if ranges.shape[0] == 0:
+            return
+
+        starts = ranges[:, 0]
+        if starts[0] < 0 or starts[-1] >= self.length:
+            raise IndexError(f"Cannot remove rows at {starts[0]}-{starts[-1]}")
+
+        # Объединенные диапазоны не пересекаются и не смежны, поэтому
+        # их границы различны и маска строится накопленной суммой
+        marks = np.zeros(self.length + 1, dtype=np.int8)
+        marks[starts] = 1
+        marks[np.minimum(starts + ranges[:, 1], self.length)] -= 1
+        keep = np.cumsum(marks[:-1], dtype=np.int8) == 0
+
+        length = int(np.count_nonzero(keep))
+        self.columns[:, :length] = self.columns[:, :self.length][:, keep]
+        self.length = length
+        self._release()
+
+    def _release(self):
+        # Освободить память, если буфер заполнен менее чем на четверть,
+        # оставив запас для последующих вставок
+        if self.capacity > self.MIN_CAPACITY and \
+                4 * self.length < self.capacity:
+            self._reallocate(max(2 * self.length, self.MIN_CAPACITY))
+
+    def clear(self):
+        self.length = 0
+        self.columns = np.zeros((self.COLUMNS, 0), dtype=self.dtype)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from .rfinterp import adaptive_samples, create_interpolator
+from .rflookup import RangeLookupTable
+
+
+@contextmanager
+def writable(*arrays):
+    # Временно разрешить изменение защищенных от записи массивов
+    for array in arrays:
+        array.setflags(write=True)
+    try:
+        yield
+    finally:
+        for array in arrays:
+            array.setflags(write=False)
+
+
+def measurements_digest(azimuths, distances):
+    # Хэш содержимого столбцов измерений, используемый как ключ кэша
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.int64(azimuths.shape[0]).tobytes())
+    digest.update(np.ascontiguousarray(azimuths))
+    digest.update(np.ascontiguousarray(distances))
+
+    return digest.digest()
+
+
+def build_products(kind: str, azimuths, distances):
+    # Построить продукты диаграммы по столбцам азимутов (в градусах)
+    # и дальностей. Исходные массивы только читаются, поэтому функция
+    # может выполняться в фоновом потоке над снимком данных
+
+    # Привести азимуты к диапазону [0, 2π) и упорядочить измерения
+    # по азимуту, не изменяя хранимые данные
+    azimuths = np.radians(np.mod(azimuths, 360.0))
+    order = np.argsort(azimuths, kind='stable')
+
+    # Замкнуть диаграмму, повторив первое измерение через период
+    length = order.shape[0]
+    azimuths = np.append(azimuths[order], np.float32(0.0))
+    azimuths[length] = azimuths[0] + 2.0 * np.pi
+    distances = np.append(distances[order], np.float32(0.0))
+    distances[length] = distances[0]
+
+    return DiagramProducts(
+        kind, azimuths, distances, order,
+        create_interpolator(kind, azimuths[:length], distances[:length])
+    )
+
+
+class LRUCache:
+
+    def __init__(self, capacity: int = 8):
+        self.capacity = capacity
+        self.items = OrderedDict()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def get(self, key, default=None):
+        try:
+            value = self.items[key]
+        except KeyError:
+            return default
+
+        # Отметить элемент как использованный последним
+        self.items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.items[key] = value
+        self.items.move_to_end(key)
+
+        while len(self.items) > self.capacity:
+            self.items.popitem(last=False)
+
+    def pop(self, key, default=None):
+        return self.items.pop(key, default)
+
+    def clear(self):
+        self.items.clear()
+
+
+class DiagramProducts:
+
+    # Количество точек равномерной сетки для вычисления кривой диаграммы
+    DENSE_GRID_SIZE = 1000
+
+    # Локальное обновление сплайна оставляет небольшую погрешность
+    # относительно полного перестроения, которая накапливается. Поэтому
+    # после этого количества локальных обновлений или изменения этого
+    # количества различных измерений продукты строятся заново
+    MAX_UPDATES = 8
+    MAX_UPDATED_ROWS = 4
+
+    def __init__(self, kind: str, azimuths, distances, order, interpolant):
+        self.kind = kind
+
+        # Упорядоченные и замкнутые через период измерения, а также
+        # перестановка, упорядочивающая строки модели по азимуту
+        self.azimuths = azimuths
+        self.distances = distances
+        self.order = order
+        self.interpolant = interpolant
+
+        for array in (self.azimuths, self.distances, self.order):
+            array.setflags(write=False)
+
+        self.grids = {}
+        self.curves = {}
+        self.tables = {}
+        self.statistics = {}
+        self.ranks = None
+
+        self.updates = 0
+        self.updated_rows = set()
+
+        # Ключ кэша и версия данных модели, которым соответствуют продукты
+        self.key = None
+        self.version = None
+
+    def update(self, row: int, azimuth: float, distance: float):
+        # Локально обновить продукты после изменения одного измерения.
+        # Возвращает False, если требуется полное перестроение: изменился
+        # порядок измерений по азимуту, метод интерполяции не поддерживает
+        # локальное обновление или исчерпан предел локальных обновлений
+        length = self.order.shape[0]
+        if self.interpolant.azimuths.shape[0] != length:
+            return False
+
+        if self.updates >= self.MAX_UPDATES or \
+                len(self.updated_rows | {row}) > self.MAX_UPDATED_ROWS:
+            return False
+
+        if self.ranks is None:
+            self.ranks = np.empty_like(self.order)
+            self.ranks[self.order] = np.arange(length)
+
+        position = self.ranks[row]
+        azimuth = np.radians(np.mod(np.float32(azimuth), np.float32(360.0)))
+
+        if length > 1:
+            previous = self.azimuths[position - 1] if position > 0 else \
+                self.azimuths[length - 1] - 2.0 * np.pi
+            if not previous < azimuth < self.azimuths[position + 1]:
+                return False
+
+        interval = self.interpolant.update(position,
+                                           float(azimuth),
+                                           float(distance))
+        if interval is None:
+            return False
+
+        self.updates += 1
+        self.updated_rows.add(row)
+
+        with writable(self.azimuths, self.distances):
+            self.azimuths[position] = azimuth
+            self.distances[position] = distance
+            if position == 0:
+                self.azimuths[length] = azimuth + 2.0 * np.pi
+                self.distances[length] = distance
+
+        for table in self.tables.values():
+            table.update(self.interpolant,
+                         self.grid_slices(table.azimuths, *interval))
+
+        # Адаптивные выборки зависят от положения узлов, поэтому
+        # они, как и статистика, строятся заново при следующем обращении
+        self.curves.clear()
+        self.statistics.clear()
+
+        if position == 0:
+            # Сетки начинаются с азимута первого измерения, поэтому
+            # при его изменении их требуется вычислить заново
+            self.grids.clear()
+        else:
+            for azimuths, distances in self.grids.values():
+                with writable(distances):
+                    for indices in self.grid_slices(azimuths, *interval):
+                        distances[indices] = self.interpolant(azimuths[indices])
+
+        return True
+
+    @staticmethod
+    def grid_slices(azimuths, start: float, end: float):
+        # Диапазоны индексов точек сетки, попадающих в интервал азимутов
+        # с учетом периодичности; сетка покрывает ровно один период
+        origin = azimuths[0]
+        width = min(end - start, 2.0 * np.pi)
+        start = origin + np.mod(start - origin, 2.0 * np.pi)
+        end = start + width
+
+        slices = [slice(np.searchsorted(azimuths, start, side='left'),
+                        np.searchsorted(azimuths, end, side='right'))]
+        if end > azimuths[-1]:
+            slices.append(slice(0, np.searchsorted(
+                azimuths, end - 2.0 * np.pi, side='right'
+            )))
+
+        return slices
+
+    def dense_grid(self, size: int = DENSE_GRID_SIZE):
+        grid = self.grids.get(size, None)
+        if grid is None:
+            azimuths = np.linspace(self.azimuths[0],
+                                   self.azimuths[-1],
+                                   size,
+                                   endpoint=True)
+            distances = self.interpolant(azimuths)
+
+            azimuths.setflags(write=False)
+            distances.setflags(write=False)
+
+            grid = self.grids[size] = azimuths, distances
+
+        return grid
+
+    def adaptive_curve(self, scale: float, tolerance: float = 0.5):
+        # Кривая диаграммы, выбранная адаптивно для масштаба отображения.
+        # Масштаб округляется, чтобы незначительное изменение размеров
+        # области графика не приводило к повторному построению
+        key = (float(np.round(scale, 2)), tolerance)
+        curve = self.curves.get(key, None)
+        if curve is None:
+            azimuths, distances = adaptive_samples(self.interpolant,
+                                                   self.azimuths,
+                                                   key[0],
+                                                   tolerance)
+
+            azimuths.setflags(write=False)
+            distances.setflags(write=False)
+
+            curve = self.curves[key] = azimuths, distances
+
+        return curve
+
+    def lookup_table(self,
+                     resolution: float = RangeLookupTable.DEFAULT_RESOLUTION):
+        table = self.tables.get(resolution, None)
+        if table is None:
+            table = self.tables[resolution] = RangeLookupTable(
+                self.interpolant, resolution
+            )
+
+        return table
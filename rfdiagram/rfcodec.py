@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import base64
+import binascii
+import itertools
+import json
+import logging
+from operator import itemgetter
+
+import numpy as np
+
+
+# Версия формата, в которой записываются файлы
+FORMAT_VERSION = "2.0"
+
+# В формате 2.0 азимуты и дальности хранятся параллельными столбцами.
+# Столбцы кодируются в base64 как массивы float32 с порядком байтов
+# от младшего к старшему либо записываются списками чисел
+COLUMN_DTYPE = np.dtype('<f4')
+COLUMN_ENCODINGS = ("base64", "list")
+DEFAULT_COLUMN_ENCODING = "base64"
+
+V1_KEYS = ('azimuth', 'distance')
+
+
+def encode_column(values, encoding: str):
+    values = np.ascontiguousarray(values, dtype=COLUMN_DTYPE)
+    if encoding == "base64":
+        return base64.b64encode(values.tobytes()).decode('ascii')
+
+    return values.tolist()
+
+
+def decode_column(column, encoding: str, count: int):
+    # Преобразовать столбец в массив float32 за одно преобразование
+    if encoding == "base64":
+        if not isinstance(column, str):
+            raise ValueError("a base64 encoded column must be a string")
+
+        values = np.frombuffer(base64.b64decode(column, validate=True),
+                               dtype=COLUMN_DTYPE)
+    else:
+        values = np.asarray(column, dtype=COLUMN_DTYPE)
+
+    if values.shape != (count,):
+        raise ValueError(f"the column has shape {values.shape}"
+                         f" instead of ({count},)")
+
+    return values.astype(np.float32, copy=False)
+
+
+def encode_json(azimuths, distances,
+                encoding: str = DEFAULT_COLUMN_ENCODING):
+    # Записать измерения в формате 2.0
+    return json.dumps(dict(
+        version=FORMAT_VERSION,
+        count=int(azimuths.shape[0]),
+        dtype='float32',
+        encoding=encoding,
+        azimuths=encode_column(azimuths, encoding),
+        distances=encode_column(distances, encoding)
+    ))
+
+
+def v1_keys(measurements):
+    # Множество ключей записей измерений формата 1.0
+    return set(itertools.chain.from_iterable(measurements))
+
+
+def v1_columns(measurements):
+    # Значения извлекаются без цикла интерпретатора. Отсутствующие
+    # в отдельных измерениях ключи заменяются нулями
+    count = len(measurements)
+
+    columns = []
+    for key in V1_KEYS:
+        try:
+            column = np.fromiter(map(itemgetter(key), measurements),
+                                 dtype=np.float32, count=count)
+        except KeyError:
+            column = np.fromiter(
+                (measurement.get(key, 0.0) for measurement in measurements),
+                dtype=np.float32, count=count
+            )
+        columns.append(column)
+
+    return columns
+
+
+def decode_v1(content):
+    measurements = content.get('measurements', None)
+    if not measurements:
+        logging.error("Cannot retrieve measurements from JSON data")
+        return None
+
+    try:
+        keys = v1_keys(measurements)
+    except TypeError:
+        logging.error("Unexpected measurement records in JSON data")
+        return None
+
+    for key in sorted(keys.difference(V1_KEYS)):
+        logging.warning(f"Unrecognized key {key} in JSON data")
+
+    return v1_columns(measurements)
+
+
+def decode_v2(content):
+    count = content.get('count', None)
+    encoding = content.get('encoding', DEFAULT_COLUMN_ENCODING)
+    if not isinstance(count, int) or count <= 0:
+        logging.error("Cannot retrieve the number of measurements"
+                      " from JSON data")
+        return None
+
+    if encoding not in COLUMN_ENCODINGS:
+        logging.error(f"Unsupported encoding {encoding} of JSON data")
+        return None
+
+    columns = []
+    for key in ('azimuths', 'distances'):
+        column = content.get(key, None)
+        if column is None:
+            logging.error(f"Cannot retrieve {key} from JSON data")
+            return None
+
+        columns.append(decode_column(column, encoding, count))
+
+    return columns
+
+
+def decode_json(json_data: str):
+    # Прочитать азимуты и дальности измерений в виде массивов float32.
+    # При ошибке сообщение записывается в журнал и возвращается None
+    try:
+        content = json.loads(json_data)
+        if not isinstance(content, dict):
+            logging.error("Unexpected structure of JSON data")
+            return None
+
+        version = content.get('version', None)
+        if not version:
+            logging.error("Cannot retrieve version of JSON data")
+            return None
+
+        if version == "1.0":
+            return decode_v1(content)
+        elif version == "2.0":
+            return decode_v2(content)
+
+        logging.error(f"Unsupported version {version} of JSON data")
+        return None
+
+    except json.JSONDecodeError as exc:
+        logging.error(f"An exception occurred during reading JSON data: {exc.msg}")
+        return None
+
+    except (TypeError, ValueError, binascii.Error) as exc:
+        logging.error(f"Cannot decode measurements from JSON data: {exc}")
+        return None
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# Количество точек, обрабатываемых за один шаг. Ограничивает объем
+# памяти под промежуточные массивы независимо от размера входных данных
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+
+def classify_polar(lookup, azimuths, ranges,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1):
+    # Определить, находятся ли цели с заданными азимутами (в градусах)
+    # и дальностями внутри зоны действия. Функция lookup возвращает
+    # дальность границы зоны по азимутам. Запас равен разности дальности
+    # границы зоны и дальности цели и положителен для целей внутри зоны
+    azimuths, ranges = np.broadcast_arrays(np.asarray(azimuths),
+                                           np.asarray(ranges))
+
+    def convert(start, stop):
+        return flat_slice(azimuths, start, stop), \
+               flat_slice(ranges, start, stop)
+
+    return classify_chunks(lookup, convert, azimuths.shape,
+                           chunk_size, workers)
+
+
+def classify_cartesian(lookup, x, y,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1):
+    # То же для целей, заданных декартовыми координатами в системе
+    # полярного графика диаграммы
+    x, y = np.broadcast_arrays(np.asarray(x), np.asarray(y))
+
+    def convert(start, stop):
+        x_chunk = flat_slice(x, start, stop)
+        y_chunk = flat_slice(y, start, stop)
+        return np.degrees(np.arctan2(y_chunk, x_chunk)), \
+               np.hypot(x_chunk, y_chunk)
+
+    return classify_chunks(lookup, convert, x.shape, chunk_size, workers)
+
+
+def flat_slice(array, start: int, stop: int):
+    # Отрезок элементов массива в порядке C. Непрерывный массив не
+    # копируется, а у расширенного (broadcast) или несмежного массива
+    # копируется только отрезок, а не весь массив
+    if array.flags.c_contiguous:
+        return array.reshape(-1)[start:stop]
+
+    return array.flat[start:stop]
+
+
+def classify_chunks(lookup, convert, shape, chunk_size: int, workers: int):
+    if chunk_size <= 0:
+        raise ValueError(f"Unexpected chunk size {chunk_size}")
+
+    length = int(np.prod(shape))
+    inside = np.empty((length,), dtype=bool)
+    margins = np.empty((length,), dtype=np.float64)
+
+    def process(start):
+        stop = min(start + chunk_size, length)
+        azimuths, ranges = convert(start, stop)
+
+        np.subtract(lookup(azimuths), ranges, out=margins[start:stop])
+        np.greater_equal(margins[start:stop], 0.0, out=inside[start:stop])
+
+    # Отрезки выходных массивов не пересекаются, поэтому их можно
+    # заполнять параллельно: NumPy освобождает GIL в векторных операциях
+    starts = range(0, length, chunk_size)
+    if workers > 1 and length > chunk_size:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(process, starts):
+                pass
+    else:
+        for start in starts:
+            process(start)
+
+    return inside.reshape(shape), margins.reshape(shape)
@@ -1,14806 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created: ср авг. 1 19:36:54 2018
-#      by: The Resource Compiler for PySide2 (Qt v5.11.1)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PySide2 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x85K\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00\x00\x04gAMA\x00\x00\xaf\xc87\x05\x8a\xe9\
-\x00\x00\x00\x19tEXtSoftware\
-\x00Adobe ImageRead\
-yq\xc9e<\x00\x00\x84\xddIDATx\xda\xec\
-}\x09\x9c\x5cE\xb5\xfe\xb9\xdd==kf&\xb3g\
-\x0f\xd9\x17B \x90\x10\x14d\x0b\x84\x1d\x15\x5c\x80\x07\
-*n\x88\x88\xac\x8a\xec\x8a\x80\x82\xca\xe2\xd3\x87\xff\xe7\
-cq{\xc8\x22 (\x8a\x08O\xd9\xb3\x91\x10\x08!\
-!\x1b\xd9&\xb3\xef{\xf7\xfd\x9fS}o\xa7\xba\xba\
-\xaan\xdd\xee\x9e\x99N2\x9d\xdf\xfd\xf5\xf4\x9a\xdbu\
-\xeb\xfb\xcew\x96:e\xd9\xb6\x0d#\xb7\x91\xdb\xc8\xed\
-\xc0\xbc\x05F\x86`\xe46r;po!\xfe\xc1\xd9\
-\x05\x05\xbe\xbf\xe0\x84q\xe3FFq\xe46r\x1b\xa6\
-\xdbK;w\xa6\xf4\xb9g\xba\xbaF\x14\xc0\xc8m\xe4\
-6\xa2\x00Fn\xfb2\xfb[\xc3}\x0e\xa8\x00G\x82\
-H#\x040r\x1bf\x90g\xea=\xfc\xcd6y\xdd\
-\xeb\xfcF\x08b\x84\x00Fn\x99\x01\xba\x95\xc6s\x99\
-$\x00[\xf2}\xb6\xea\xb3\xb2\xdf5B\x0a#\x040\
-\x02x=\xe0-\xcdc\x93\xbfS%\x02\xdb\xf0y[\
-\xf8\xdbR<\xb6MU\xc3\x08)\x8c\x10\xc0\x81\x0ax\
-\x13\xb0[\x06\xaf\xa5J\x08\x90\x22\xe8Sy\xceR\xbc\
-\x9e4>#\x840B\x00\x07\x0a\xe8\xad4\xeeM\x89\
-!]\x02\xd0\x81Zw/{\xce\xf2K\x08#d0\
-B\x00\xfb:\xe8uV\xda\x0b\xd8\x96\x07\xe8-C\xa5\
-`J\x02*\xcb/\x02\xd5\x0b\xf0\xe2\xdf\xaa\xf7[\x0a\
-\xd7c\x84\x0c\xf6\x05\x02\xf8\xf6\xc6\x8d\x07\xfc \x9e]\
-P`\x0az? \xf7z\x1e\xbc\xc8a\xf2\xa8Q\x15\
-\xa5\xb9\xb9\xacR+7\x10\x18\x1f\x08\x04\xcaM~O\
-_$\xb2)b\xdb\x1d\xf4\xf7\xfa\xe6\xe6w{\x22\x91\
-\x88\x01\xf0e\x8f\xfd</\xfe\xedI\x06\xcftu\xed\
-\xf3d\xf0\xf6\xc5\x17\xa7gp\x1e}tD\x01d\x11\
-\xe8\xfdH\xf6\xb4\x8eq\x85\x85\xc5\x95\xf9\xf9\x07\xe5\x07\
-\x83s\x02\x96U\x1e\xb4\xac\x83\xf0~*\xbe6\x0a\xef\
-\xe7\xd2\x7fR2~<\x94M\x9e\xcc\xfe\xc3\xd1\x13'\
-BaE\x85\xd1o\xab\xdf\xb0\x01z;\x18\xfe\xa1j\
-\xc5\x0a\x18\xe8\xe9!\x04\xb6\xdb\xb6\xbd\x15\xefw\xe2}\
-]\x7f4\xfa\x1e\x92\xc4\x9e\xdeHd\xc7\x9a\xc6\xc6w\
-\x0d\xc0\xee\xe70\x22\x03\xf7\x1a\xec\x0fD0\xe2\x02\xec\
-_\xd6\xde\x14\xf4\x01\x93\xe7\xe7\x95\x95\xcd,\xcc\xc9\x99\
-\x9f\x13\x08\xccFp\xcf\xc0cVai\xe9\xb8\xea\xb9\
-sa\xec\xa1\x87BQU\x15\x03w\xf1\xb8q\x10\xc8\
-\xc9\x81|\x1e\xe8\xdcb/[x,\xa7/k\xef\x8f\
-\xb1\xf6\xfe\xacH_\xdf\xa8\xde\x96\x96y=\xcd\xcd\xf3\
-z\xdb\xdb\x19It\xec\xd9\x03\x8d\x9b6A\xf9\xf2\xe5\
-\x10\xb5\xed\xf7\xf0X\x8f\xa4\xf0~_4\xba\xa1\xb1\xa7\
-g\xcd\xe6\xb6\xb6=\xf8\xd1\xa8\x02\xe4\xd1L\x91\x01\x7f\
-MF\xc8`\x84\x00\x86[\xe2\xfb\x01|@\xfc\xbb<\
-/\xaf\xe0\xa0Q\xa3\x8e\xcc\x0b\x85\x8e\x0cY\xd6\xe1\x08\
-\xf6\xc3\xc7\x1erH\xe1\x84\x85\x0b\xa1j\xce\x1cf\xd5\
-\x0b*+!\xc7Y\xb7\xc1Vs\xba\xa0v\xfe\x8e\xf6\
-\xf7'>'\x12\x81\x82\x04,\x07\xf06\x0f~\xba'\
-R\xc0#\xbf\xac\x8c\x1d\xf4\xb8\xe6\xb0\xc3b\xefw\x8e\
-\xee\x86\x86\xb9\x1d\xb5\xb5s\x9b\xb7l\x81\xbau\xeb`\
-\xcb\x1bo\xc0\xa4\xdd\xbbw\x22)\xacD\xb5\xb0\xb2\xbd\
-\xaf\xef\xff\xd665} \x01\x7f\xd4')X\x9a8\
-\xc5\x88*\x18!\x80a\xb7\xf6\x96\x17\xc8\xc5\xfb\x83\xcb\
-\xcaf\x95\x84\xc3KC\x81\xc0\xd1y\x05\x05\xc7L?\
-\xe1\x04\x98\xb8x1T\xcc\x98\x01\xa3\xc6\x8caV\xdd\
-\x05\xba{\x1f\xed\xebKx\x0c\xd1\xe8\xde\xbf\xe9y|\
-\x0c\xfcg\xe8\xb1\xa8\x00\xdc\xbf9K\xcf\x03\x1e\x02\x81\
-\xbd\x7f\xbb\xcf;\xcf\x89\x8fsKJ \xaf\xb4\x14*\
-f\xcf\x86\xe9\xa7\x9f\x0eG\xe3s}\xed\xed\xe3\xda\xb6\
-o\x1f\xb7\xe7\xbd\xf7\xce\xda\xf8\xe2\x8bP\xb1fM#\
-\x12\xc2k=\x91\xc8\xf3{\xba\xba^\xd9\xda\xde\xde\xe0\
-\x80^F\x02&d0\xe2\x1e\x8c\x10\xc0\x90\x03_g\
-\xedU\x16> \xfe\xbd\xb0\xaa\xea$\xf4\xdfO\x0d\x06\
-\x02\xc7OZ\xb4\xa8f\xe6\xd2\xa5P}\xf0\xc1P<\
-aB\x1c\x9c<\xd8]\x103`\xf3\xf7\x91H\xfc\x80\
-\x81\x01\x88\xe2\x01\xees.\xe8M\xa4\xbf\xc4\x15\x88\xbb\
-\x04\x08r+\x18\x04+\x14\x8a\xdf\x03\xdd\xbb\x07\x91\x00\
-\xbd\xc7\xb9w?\x13\xca\xcb\x83r$\xb1\xf2Y\xb3`\
-\xce\xb9\xe7B\xa4\xa7\xa7\xbce\xcb\x96\xb3\xb6\xbe\xf6\xda\
-Y\xeb\x9f\x7f\x1e&\xef\xdc\xb9z\xc0\xb6_n\xea\xe9\
-y|]s\xf3f\x01\xfcQ\x1f\x0aA\xa9\x0aF\x88\
-`\x84\x00\x06\x0b\xf8:k/\x02\x9f\x1d\xe8\xcb\xcf)\
-\xcd\xcd=7\x8c\xc7\xbc3\xcf\xac\x9c\x86\x96\x9e,f\
-\x88\xe4\xbc\x03j\x1b\x01\xcc\x83\x9c\x01\x9b\xc0L\xcf\x13\
-\xc0Q\xde\xdbx0\x99O\xafI\x80\x9d\xe9&/\xb6\
-\xe0\x22$\xc5\x0c\x90\x10\x02\xe10X\xa8T\xd8\xc1\x91\
-\x05\xb8\xe4\x81\xf7\x01|\xce%\x84#\xbe\xf2\x15\xe8\xac\
-\xad=\xb4v\xcd\x9aC\xd7>\xf5\xd4\x95U\xabW\xaf\
-\xec\x8dF\x9f\xde\xd1\xd1\xf1\xe4\xf6\x8e\x8e&\x09\x09D\
-\x9dq\x8c*b\x09\x96B\x19\x8c\x10\xc1\x08\x01\x0c\x1a\
-\xf0Ey\x9f\x04\xfc)\xc5\xc555\x05\x05\x9f\xc9\xcd\
-\xc99g\xc6\x09'\xcc\x9a{\xd6YP}\xc8!\x10\
-te=\x82<\xda\xdb\x1b\x03\xb9K\x00t\xa0\xd5'\
-\x90\xd3k\xecu\x11\xd4\xc3\xd0\xc9IY'L\xc4D\
-\xe7\xc8\x93\x02\x01>7\x17,<\xc8\x85\xb1\x88 \x5c\
-bp\xd4B~y9LY\xb2\x04\xa6\x9c|2\xf4\
-\xb4\xb4\x1c\xbe\xed\xd5W\x0f_\xfd\xe8\xa3\xb7M\xd9\xb4\
-\xe9\x1f\xdd\x03\x03\x7f\x5c\xdf\xd2\xf2B[__\xaf\x84\
-\x08\xf8\xc7\x96\x1f\xf7`\x84\x08F\x08\xc0\x0b\xfc~\x80\
-/\x05}u~\xfe\xa8\xc9\xc5\xc5\xa7\xe4\x05\x83\xe7\x8e\
-\x9f?\xff\xb8\xf9\x9f\xfd,\x8c_\xb4\x08\xc2\x85\x85q\
-\xebN\x80\x89\x03\xde\xb1\xea\x11z\xae\xa7'\xee\xdf\x0f\
-'\xd8\xfd\xb3C\xe29\x92r\x89\x90;\xd2\xd9\x19{\
-\x82\x08\x01]\x82 \x1eD\x06\x8c\x14\x88\x0c\x1c\xa5\x90\
-[T\x043O;\x0df\x9e~:\xb4\xef\xdau\xd2\
-\x87/\xbdtR\xe5\xa3\x8fB{c\xe3\xef\xdb\xfb\xfb\
-\xff\xf8vC\xc3r\xfc\x96\x88\x07\x19\x8c\x10\xc1\x08\x01\
-\x0c)\xf0E\x89?\x17%\xfe\x17\x0b\x0b\x0b/\x9c\xff\
-\x99\xcf\xc0\xcc3\xce`\xa99W\xce3\xd0\xbbr\xde\
-\xb1\xee\x91\xeen\x88\xe2\x01\x9c\xbf\xeeJxk_\x1f\
-d\x8ac\xb8\x7f\xd3\xefG2\x88\xe0a\xb9nC~\
->#\x05\xa6\x14\x90\x10\x02Nl\xa1\xa8\xba\x1a\x0e\xbb\
-\xe0\x02\x98\x7f\xdeyP\xbfn\xdd\x05k\x9f|\xf2\x82\
-\xd2\x17^\xd8\x8a.\xc2o>lm\xfdm]ww\
-\x9b@\x00\xbc{\xa0#\x82\xa4x\xc1\x81N\x04\x16\xef\
-/\xa6\xd2\x12\xccm-\xb4\x1f\x00\x1f\x0c}{\xf1\x08\
-\x1eQYybaN\xce\x17j\xa6M;i\xd1\xc5\
-\x17\xc3\x84\xa3\x8eb>\xb1\x1b\x88\x8b\x83\x9ed\xbd\x0b\
-z\x04\x82-I\xd1\x81\xe6\xe4\xf6I\x0e0\x082\x06\
-\x10\xf4\x01TGA\x22\x04r\x15\x1cw\x01\x9c\xd8\x01\
-\x1d}\xed\xed\xb0\xf1\xef\x7f\x87e\x0f?\x0c\xadMM\
-\x0f4tw?\x8c.\xc2V\x07\xf0\x11E\xcc@\x8c\
-\x13\x00\xc8\xab\x19a\xb8H \xddJ\xc0[S\xac\x04\
-tq{@)\x00\x0f\xab\xef\x07\xf8A\xba_\x5c]\
-}\x1e\xca\xfc\x8b\xa6\x1fs\xcc\xa1\x87_x!T\xcc\
-\x99\x13\x03<\x1e\x11\xaa\x9e\xe3-=\x0e8\x03\xbd\x9b\
-\x9e3\x94\xf6\xf6>D\x0a\xa9\xa2'\x8a\x04In\xcf\
-@K\x0b#\x80 \x92A\xc0%\x03'\xa8\x18\xc2\xc7\
-s\xce9\x07f\x9du\x16\xecx\xf3\xcdK^\xfb\xe5\
-//\xa9\xfa\xe8\xa3\xc7\xdb\xfa\xfb\x1f^\xdd\xd0\xb0\x92\
-\x03}\x84\xbb~|\x9c \x0a\x1e\xcb\x9d\x0fD5\x10\
-\x1a\x01~\x02\x01\xc8\x82zJ\xe0\x1fz\xce9\x87\x1e\
-\x8a2\xb5\xa8\xa6\x86Yy\x16\xa1\x17\xe5=\x82^Z\
-\x98c*\xd1\xf6%9\x99*!pc\x13\x0fz\xa2\
-2\x08\xa2\x22\x0d\xd0An\x02\x91\x81\x133\x98x\xf4\
-\xd1\xec\xd8\xf3\xce;\x9fy\xed\x17\xbf\xf8\xcc\xa8\xf7\xde\
-\xfbCk_\xdf\xc3\xef46\xbe\xe3\x5c'^\x11X\
-\x12\x12Pf\x0b\x86\x9a\x08\xac4\x88s\x84\x002o\
-\xf5\xc5\xa0^P\x00\xfeg\x11\xf8_\x98\xbdd\xc9\x82\
-#\xbf\xfeu(t\x80\xcf\x82w\x04~\xb4b\x04z\
-\xf2s\xa3h\xf1u\x12\xdf\x14\xd8v\x96\x93\x83=X\
-\xdf\x83\x040\x80\xb2\x1f::\x98\x02\x08\x16\x15\xc5\x08\
-\x81\xc8\xc0\x09 R\xdd\xc4\xa7\x1fx\x00jW\xaf>\
-\xff\x95\x9f\xff\xfc\xfc\x92\x0d\x1b~\xdb\xd2\xdb\xfb\xf0\xda\
-\xa6\xa6\xf7$\xae\x81\x8a\x04\xb4D\xb0\xbf\x93@h\x04\
-\xf8\x9e\x16?xxe\xe5\xf1\xe4\xe3O[\xbcx\xe9\
-\xc7\xbf\xf9M(\x9e4)f\xf1\x1d\x99\xcf\xac=\x05\
-\xb8p\xc2\x9aF\xf0\xed\x0c\x00y_\xd7\xa9F\xe7\x8f\
-D@c=\xd0\xd4\x04\x03\xcd\xcd\xcc=`d\x80.\
-\x81\xe5\xb8\x08\x94V\xfd\xcc\xaf\x7f\x0d\xbbV\xad\xba\xf0\
-\xdf\xf7\xdcsa\xc9\xb6m\x0flmo\xff\xf9\x8e\x8e\
-\x8eF\x8e\x04x\xd7\x80\x8f\x15\x80\x97[\xb0?\x93@\
-\xe8\x00\x07\xbf\xcc\xc7\x8f[\xfd\xd9\xa3GO\xad\xc8\xcb\
-\xfbr\xcd\xd4\xa9\x17\x1f\x7f\xf5\xd5P\x89\x16'\x1e\xcd\
-we>\x02\x7f\xa0\xad\x8d\x11\x81\x9f\xd4\x9d\x05#7\
-\xcb\x84\x0c\xf8re\xfc;\x82\x8a\x80\xc6\x9cb\x04\xa1\
-Q\xa3b\xb1\x02'\x8b0\xf6\xb0\xc3\xe0\xb3\x8f<\x02\
-\x9b_z\xe9\x92\x7f\xdf{\xef%\x93Z[\x7f\xf4Z\
-m\xed\xfd\x1c\xf8\xf98\x81\xadq\x0b\x12\xb2\x05C\xe5\
-\x12\x0c\x07\x09\x84\x0eP\xe0\xcb\xc0\xcf\xcb\xfd\xe0\xd15\
-5\xdf)\xad\xa8\xb8\xe2\xb8+\xafd\xfe&\x0bVQ\
-\x14\xdf\x8d\xe4\xd3DD\xe0Gy\xe0s\xa0\xf7\x02\xb8\
-}\x00\x93\x82\x9d\xceg\x9c\xec\x01\x8d\x7f\xd4!\x82 \
-\x12\x01)\x03\x9b\x8a\x8e\xd05\x98z\xe2\x890\xe9\xe3\
-\x1f\x87w\x1e}\xf4\xba\x9c\x87\x1f>\xb1;\x12y\xe4\
-\xad={\x9e\xe4\xd4\x00\x1f\x17\xf0R\x04C\xea\x12\x0c\
-5\x09\x84\x0e@\xf0k\x81\xbf\xa8\xaa\xea\xac\xfcP\xe8\
-\x0b\x1f\xfb\xe2\x17?6\xff\xfc\xf3c\x0bq\xb8\x14\xde\
-\x80\x0b|E`o\xc4\xb2\x0f\xaeZ\xb09E@\x7f\
-\xbb\xf1\x96HA\x01\x84\x8a\x8bcAC$\x02\xaa\xb4\
-<\xfc\x8b_\x84\x99\xa7\x9c\xb2\xf0\xa5;\xeeX\x18^\
-\xb3f\xc1\xee\xae\xae_|\xd8\xda\xba\xd3\xf9\xba\x880\
-/\xa2\x1c\xe0\x87\xb5\xa4x(I \xb4\x1f\x83\x9f'\
-\x00Yt?\x01\xf8\x95\xf9\xf9\xc53KK\xaf\x1d?\
-{\xf6W\x97\xdcp\x03[v\x1bu\xfc|\xd7\xe2\x0f\
-\xb4\xb6&\x96\xe5\xca\xea\xf0}\x12\x81u\x00\x83\xd9T\
-\x0d\xd8\x1e\xae\x81\xcd\xb9\x06\xa4\x06\x88\x08(F`\x87\
-\xc3PXY\x09g\xde{/lz\xf1\xc5\x8b_\xfe\
-\xd9\xcf.\xae\xca\xcf\xbf\xf5\xf5\xda\xda\xff\x07{\xb3\x05\
-2\x22\x88JN\xc1\x1aJ50T$\x10\xda\xcf\xc0\
-o\x12\xe1\x8f\x83\xde\xf9;tTu\xf5E\x85yy\
-?:\xee\x8a+`\xfa\xd2\xa51\xf3\xe0\x02\x1f\xad\x0b\
-\x03>\xe5\xf0\xf9\x89\xe7Q\xadg\x1b\x02\xdd\xce\x00\x88\
-\xf6UY\x9f\x89\xef\x13]\x03\xbaV\xa4\xd0B\xa5\xa5\
-\x8c\x08l'\x858u\xc9\x12\x16#\xf8\xd7O\x7fz\
-k\xf0\x8d7\xa66\xf7\xf6>\xf2nS\xd3\xbb\x1c\xe8\
-#\xc2\xfcQ\xb9\x05\xfb\x15\x09\x84\xf6\x13\xe0{I~\
-\x19\xf8\x83e\xb9\xb9\x85s\xca\xca\xae\x9b4o\xdeW\
-O\xba\xe9&(\xa8\xa8`>\xbd\x9b\xc3\xa7\xe0\x1e\x15\
-\xa7\x80\xd8t#\x05\x8bog\x18\xb4v\x16\x90\x81=\
-L\xdf\xab}\x9d\x14\x01\xde\xf576\xb2\xac\x0c\x11\x01\
-\xa9\x02J\x1f\xe6\x95\x94\xc0)\xb7\xdf\x0e\xb3_y\xe5\
-\xc2\x17\xef\xba\xeb\xc2\xe2p\xd8U\x03\x11\xce-\x00\x0e\
-\xf4n\x89\xb1\xd6%H\x87\x04,G\xc1\x0c\xd7-\xb4\
-\x1f\x81_V\xd4\xa3\x04?\xfa\xfag\x90\xaf\x7f\xc2\xe5\
-\x97\x1f=\xf3\xcc3\xa9&:f\xf5\xf1 9\xd9\xdf\
-\xdc\xcc\xfc~\xaf\x02\x9eT\xb6\xf3\xc9\x84t\xce6)\
-\x9fIR\xb0<\xbe\xcb\xf2r\x0d\x9c\x8c\x01\x05l\xfb\
-\xea\xea \x88*.\x07\x89\xc0v\xe2\x03\x93\x8e>\x1a\
-.8\xf8`x\xf9\xc7?\xbe5\xb8l\xd9A[\xda\
-\xda\xee\xde\xd1\xd9\xd9\xc0\xcd\x9d\x88\x1f\x97`0I`\
-\xb0U@h?\x02\xbf\xca\xf2\x07\x05\xf0\x87\x8e\xae\xa9\
-\xb9\xb6r\xc2\x84+N\xfb\xe1\x0fY\x03\x0ew%\x1e\
-\x93\xfbh\xf1\xc9rP\xba\xcf\x12\xfd\xcd\x14,{&\
-\xa3\xfdv\x96\x11\x83\x9d\xed\xdf\xe7\xf47dA[t\
-\xe1Bee\xb1\x8cA~>\x84\xf1\xfe\xd4;\xef\x84\
-\x0d\x7f\xff\xfb\x17\xfeq\xf7\xdd\xd3\xc7\x16\x16\xfefY\
-]\xdd\x9f%$\xc0\x9f^TG\x02\xe9\x04\x07\x87\x8b\
-\x04B\xfb0\xf8}K\xfe\xf1\x85\x85\x15\x07\x15\x17_\
-;\xe7\xf8\xe3\xbfp\xec\x95W\xb2\xa5\xa9Qg5\x1e\
-U\x9d\xf57512p\x01o\x1bZ}\xbfr<\
-\xd3\xd5}\xfbRA\x90=\x88\x9fW\xae\xfdu\x8a\x89\
-\xfa\xf6\xec\x81 \x12\x01\xa9\x01*&\x02\xbc\xfe\xd3O\
-:\x09\xaaf\xce\xfc\xd8_\xae\xbf\xfec\x1f\x0b\x04\xa6\
-\xa1Kp\x8f@\x02|L\x00\x86+.0X$\x10\
-\xda\x8f\xc1\x1f\xe4\xad>\xad\xd8+\xc8\xc9\xf9\xc2\x09\x97\
-^\xbad\xf6'?\xc9R{d\xf1\x99\xd5G\xb9\xcf\
-\x8ay\x0c\xad~&\xad\xf0\x81\x96\x05\xb0\xd2$\x03\xed\
-\xa6\x83Jf\xb0cj\x80\xdc<\xaa\xd6\xc4k\x1e*\
-/\x8fg\x0b(\xe3s\xee\xaf~\x05/\xdd~\xfb5\
-\xc1\xe5\xcb\xcb^\xd9\xbd\xfbfa^\xf1j@\x15\x17\
-H\x89\x04\x12\xb6I\xf2\x88\x07\x0c\x06\x09\x84\xf6\x13\xf0\
-\xbbi\xbe\xa0\x0c\xfcG\xd5\xd4|\xa3\xa4\xa8\xe8\xc63\
-n\xbf\x1d*\xe7\xcc\x89-8q|\xfd\xbe\xc6F\xd6\
-\x84\x03\xd2\x5c\x9ak\xa7\x08l\xfb\x00#\x04{\x90>\
-\xe7\x197pU\x1d\x81\x0c\x89\xbe\xbf\xae\x8e\xcd\x81\x9c\
-\xd1\xa3Y\x11QN8\x0cKo\xbb\x0d\xaa\x7f\xff\xfb\
-\x8b\xe1\xb7\xbf\x1d\xdd\xde\xd7\xf7\xc8\xea\xc6\xc6\xb74j\
-`P\x8a\x86\x86\x9a\x04B\xfb\x09\xf8e\x96\x9f~[\
-\xe8\xe355\xd7\x8d\x9f1\xe3\xb2\xd3\xf0\xe2R\xe7Z\
-\xb7\x01G?\xfa\xfa\x03\x04~ay\xaemh\xb1\x06\
-+\xea\x9f\xa9\x8bke\x09p\x87\xe2\xff\xf5\xeb\x16\x80\
-C\x02\xa4\xfch.\xe48j\x802\x05\x87]x!\
-T\xcf\x9a\xf5\xa9\xe7\x7f\xf8\xc3O\x1d\x19\x0c^\xfeV\
-]\xdd\x13\x9a\xe1\x8c\xea\xfe[S\x12\x10A=\x94\x99\
-\x81\xc0>\x0c~\x19\xf0C\xce\x91\xc3\x82}c\xc6\xdc\
-v\xf0\xf1\xc7_v\xd6O~\x02a\xbc\xc0Q'\xb5\
-G\xbe`\x7f}\xfd\xde\xce\xb9\xee\xc1\xb5\xd5\xb6\x9c\x03\
-\x84C\xf5\xbc\xec\xb0\xf9\xb6\xddC|\xd8\x19>\x86\xeb\
-7\x98\xbcOwM\xa4\xcf\xbb\xd7\x9a\xd6u\xe0\x9c\xe8\
-\xdb\xb5\x0b\xfa\x1b\x1ab\xc5D\xf8x\xcc\x82\x05\xf0\x99\
-\xff\xfcO\xa8\xae\xae\xbe\x1f\xd5\xe3\xa5\xdc\xbcr\x8f\xa0\
-0\xf7d[\xb6\xa9\x82\xd6F\x84-m\xc0:\x08\xe4\
-\x1e\xda\x87\xc1o\xa9\xfc\xfd)\xc5\xc5\xe3\xc7\x16\x16^\
-q\xf4E\x17]p\xe8\xe7?\x1f[\xb9\xe7,\xdaa\
-\xf9aj\xc1\xc5\xe5\xf6m\x1f\x81\xbdT$\xbb=\x08\
-\x17n\xc4EH\xaf^\x80\xb7\xb0d\x04(]Hi\
-\xc3\x90\xe3\x12\x8c\xaa\xa9\x81s\x1fx\x00\x9e\xbf\xf9\xe6\
-\x1bq\x82\x95\xbeV[\xfb#\x90\xef\xb8\x1c\x81\xbd\xed\
-\xc8D\x01\xe8\xa9\x04xk\xefG\x09d\xca\x15\x08\xed\
-\xe3\xe0\x0f\x8a\xd6\xff\x90\xf2\xf2\xc3J\xc2\xe1/\x9c|\
-\xe5\x95\x9f\x9dq\xf2\xc9,\xbd\x17\xb7\xfcd\xf5\xf9\x1a\
-~\x0f\xc9\x9eip\xfb\xbd`\xd6\x01\x08\xeaL~\xa7\
-e\x1a,t\xd4\x06e\x81\x88\x04\xc2\xe8\x12@Q\x11\
-\xe4\xa0Kp\xc6\x1dw\xc0\xcbw\xddu\x99\xf5\xfa\xeb\
-\x85\xaf\xee\xde}\x93\xe2\xd2D%.AFH`\xb0\
-\xe7Gh\x1f\x07\x7f\x82\xe5?\xac\xa2\xe2\xe8\xb2\xfc\xfc\
-\xc7N\xf9\xde\xf7`\xc2\xe2\xc5\xb1\xe6\x1c]]\xcc\xdf\
-'\xc9\x0f\xbc\xbfo\xe0\xb7\xfb\xc9\xbb\xdb\x90}~\xb7\
-\x95\xc5\x00\x1e\x8c\xf3\xb1\xd3\xfcNf\xce[[\xa1\x07\
-\x8dF\xb8\xb22\x16\x17\xc8\xcf\x87\x13\xae\xbb\x0e\xc2\xf7\
-\xdf\xff%x\xf1\xc5 \x92\xc0\x0d\xc2\xbc\x8ch\xe2\x02\
-)\x15\x0c\xf9\xc9\x0c\xecW\x04`\x08\xfe\xa0,\xd8\xb7\
-\xa0\xb2r\x09\x82\xff\x913n\xbd\x955\x88`\xe0w\
-*\xfa\x88\xd9u\xe0\xb7|\x02\xd9\x06}\x15\x9c\x95\xe5\
-@\xd9\x1f\x95D*\xc1B\xd5c\x1b\xe7N\xef\xae]\
-,U\x1c*)a\xa9\xc2O|\xfb\xdb\xa4\x08.\x82\
-\xe7\x9e\x03\x87\x04t\xb7\xa8\xea\xbf\x11I\xc0\x05\xbbV\
-\xee\x0f\x22\x09\x84\xf6\x07\xf0/\xac\xaa:ktQ\xd1\
-\x7f\x9d\xf9\x83\x1f\xb0\xfd\xf4\x98\xe4'\xf0\xa3\xbfO\x8b\
-C\xdc}\xf3\xbc6\xfa\xcb\x94U\xb53\xf4=#~\
-\xbf\xbf\xebbg\xea3Np\xb8w\xf7\xeeX\xa3\x97\
-\xd1\xa3Y\x19\xf1\xe2\xaf}\x0d\xc2\x05\x05\x17\xc1c\x8f\
-\x05\x97\xd5\xd5\xdd\xd8\x17\x89\xf4\x18\x92@\xc2\xcfT)\
-\x81T\xe3\x01\xfb<\x01\xa4\x18\xf0\x8b\x83\xbf\x0c\xc1\x7f\
-\xf6\x8f~\x04\xa3'M\x8aY\xfe\xf6v\xe8\xa3\xa8.\
-\x15\xf7\xf0\x0byR\x98\x90\xd6 Y\xf9\xa1\xf4\xf3\x0e\
-\x04\x05bg\xe8\xffO\xf8\x0c\x05\x07kkY\x10\x99\
-\xea\x05\xec\xc2BXp\xc1\x05\x10\x0a\x87/\x80\xdf\xfd\
-\x0e\x1c\x12\xe8\x05\xf34\xa1\xedG\xf2\x0f\x05\x09\x84\xf6\
-!\xf0\x07\xa5\xb2\x7f\xd4\xa8\xff\xfa\xd4\xddwC\xf1\x98\
-10@\xe0w\x82}$\xffA\x00\xbf\xedS\xf2\x9b\
-\x14\xfe\x0c\x16@\xf7\x07\x85`\x0d\x01\x19\x98\x94U\x9b\
-\xc4\x0ct\xc1A\xca\x10\x10\x09\x84i.!\x09\x1c\xf2\
-\x99\xcfPS\xd2\x0b\xe0\xe1\x87\xc9\x1d\xf8\x9e\x0fw\x00\
-\xc4x\x80\x0bjS\x12\xd8\xafc\x00\x02\xf8-\x1d\xf8\
-\x0f\xad\xa88\xba\xbc\xa0\xe0\x913n\xbb\x8d\x81\x9f\x95\
-\xf4R=?\x07~\x95\xec7\x0d\xd8\x99\xc6\x03\x06\x03\
-\xc8#\x1b\xd7ef\x1c2\xf2y\xaa\x1ct\x82\xc89\
-N\xcd\xc8\xbcO~\x12\x22}}\x17\xc0\x1f\xfe\x10A\
-\x12\xb8\x11\xd4K\x86\x95\xe1\x22\x22\x81;.\xb8@J\
-\x02\xca\xf9\x94a\x150\xac\x04 \xb1\xfe^\x15~n\
-\xaa\xef\x88\xf2\xbc\xbc?\x9ev\xd3MPF\xb2\x9fr\
-\xfc$\xfb\xf7\xeca\x7f\x8b9~/0\x9aH\xfeT\
-\x01=\x12\x0f\x18:\x92K\xb5j\xd0$U\xc8j\x05\
-(\x8d\x8c\xf7a'\xa0<\xff\x9cs\xa0\xa7\xb5\x95\x02\
-\x83\xd1Wkko\xd6|MT\x22\x1c\xd9\xdf\xd7\xff\
-\xfe\xf7R\x12\x18*W \xb4\x0f\x80?\xc1\xfaO-\
-)\x99X\x12\x0e_\xb4\xf4\xdak\xa1j\xd6,\xb6\xb0\
-\x83\x81\x1fe\x9a\xce\xf2[>\xa4\xbd5\x04@\x1d\x09\
-\x02zK\xf4L~\x9f\x97\xab`k\x1e\xc7\xbc\x81\x98\
-Q\xa1\x8aA\xba\x0f\xd3\x93\xe8\x0e,\xfc\xe2\x17\xa1\xbb\
-\xb5\xf5\x8b\xf0\xca+\x11$\x81\xefK\xfeK\x9b#\x01\
-K\x98f\x09$\xa0\xb3\xf6\xfb\xd5j@\x85\xdf\x0f\x1a\
-\xe9\x1f/\xc3\x1cSPp\xd9\x89_\xfb\xda9\xe3\x16\
-,H\x04?\xad\xe17\x0c\xf8\xd9)\x92@&\x97\xf1\
-\x8eH\xfc\xa1S\x0e\x99|?[H\xe4\x90@\x0e\x1e\
-T5\xf8\x89K/\x85\xae\xe6\xe6/#\xc2\xdb_\xaf\
-\xad\xfd\xa9\xc7\xd7De$\xc0\x03\xde$\x1e\x90)\x15\
-0\xdck\x01\xbc\x16\xf7$\x10\xc0\xd155\xdf?\xfc\
-\xb4\xd3.\x98~\xe2\x89\xf1\x96]\x0c\xfc\xceR^7\
-\xd7o\x19\xd4\x95\xebj\xdc-\x9f5\xeb\xd60\xd5\xca\
-\x1f\xa8\x87\xe5s\xcc-\xcd\x9c0]\xeb`q\xeb\x08\
-(5H$\xe0\xae\x1f\xa0\xcf\x9fx\xcd5P=f\
-\xcc\x15\x8b\xab\xab\xbf\x08fk\x06\x12l\x06\xa9\x00\x17\
-\xd8\xa6\x06E\xb7^ k\x15\x80\xa6\xa3\x8fR\xf6C\
-lU\xdf\xf53\x17/\xfe\xe2\xc2\x0b/d\xad\xbb\xdc\
-h\xbf,\xcf\xefw\xd5\x9e*bme\xc8\xc2\x8c\xc8\
-\xfd\xe1\x8d\x11\xf8q\x09l\xd3\xf78\xd9\x01\xb7\x19i\
-\x08\x95\x00\xc5\xa4\xfet\xddu\xb7-\xb4\xed\xc6\xe5\xb1\
-\xeeB\xaa\xaf\x94f\x06\xc4x\xc0P\xb8\x02\xa1a\x04\
-\xbfi\xe7\xde\x10\xb2\xea\xc5\x13\xa6O\xbf\xe4X\x94Z\
-n\x8bn\xca\xf3S\xfb.J\xcf\x98\x96\xf7z\x05\xfb\
-\xfclni\x0d\xc3D6\xd7U\xc3H9\xc3\xd4\xe0\
-2\x9dED\xa9|\xd6v\xd4\x00\xd5\x09\xb8\xe3\x9d_\
-\x5c\x0c\xa7\xdfx#<}\xd3M\xbf\x9cZ\x5c\xbcz\
-S[\xdb6\x90oK\xee\x92\x802(\xa8\x93\xfc\x99\
-$\x81@\x96\x80_)\xfb\x0f)/_TZRr\
-\xeb\x92\xab\xaf\x8em\x0d\xd5\xd9\x19\xab\xf0\xa3\x85\x1b\xb4\
-a\x07\xb7\x8cW&\xe7,C\xc9nex\xb9\xed\xa0\
-\xca`\x13\x10\x0e\xd71H\xe7\x96\xc9\xf1\xb6\x0c\xaf\xbd\
-\xa5s#\x1d\x97\x93\xdc\x01\xca>\x911\x1a\xe8\xea\x82\
-\xd2\xb1c\xe1x4Tc\x0a\x0b/\x03gY\xba\xa0\
-h\xc5=*,\x99M\xf1\xe3\x0a\xeckA@]\xd0\
-\x8fO\xf7\xb1\xfb\x92p\xf8\xc2\x93\xaf\xba\x0a\xc2yy\
-1\xf0#\xf0\xfb\x9c\xb5\xfc\xec\x22\xa4h-L\x14\xc0\
-\xb0G\xf7U\x96\xdc\xde\x0fC\x88\x86{)\x0eF]\
-@*\xee\x00\xbf\x1f\x81\x8d\xaa\xd4u\x07\xe8<'\x1d\
-~8\x1c\xbat\xe9\xf9\xd1\xbf\xfd\xad\xf1\xf5\xda\xda\x9f\
-@\xf2n\xc4\xaa\xcc\x00\x0c\xb5+0$\x0a\xc0\xa3\x93\
-\xaf\xd2\xf7G\xbf\xff\xe6\x8f}\xfe\xf3\x9f\xac<\xe8\xa0\
-X}?\xfa\xfb\xac*\x8b\xea\xb3\x85\x06\x1e&\x96\xc3\
-\xab\xd9D&,L\xcaM7d\xb3$\x155\x91-\
-`\xf6;^\x9a\xdf\x9f\xc9\xeb`\x1a\x1c\xb6MU\x03\
-\xcdC\xea7A\xabN\xc9-u\x9a\x8a\x1c\xfe\xb9\xcf\
-\xc1\xb8i\xd3\xbe\xb5\xb0\xaa\xea\xd3BP0\xa8\x08\x08\
-&\x04\x06\xdd\xa0`\x92\xc5\xcc\xb0{\x17\x1ab\xf0\xab\
-\xfc\xfe\xa4\xa5\xbd\xe4\xf7O]\xb0\xe0\xe2\xb9K\x97\xc6\
-\x22\xfeT\xe5G\xe0\xa7^\xfd\xc2\xca>\x13\xeb\x9d\xee\
-\xea\xbdLw\xf2M\xb2\xee\x1eq\x0cc\xff~_P\
-\x07\xa9\x9e\xa3\xa4\xac;\xd3j\xc02P\x09R5@\
--\xc6\xda\xda\xa8D\x98\x81\x94\xda\x8f\x9fx\xf9\xe5\xf0\
-\xa7\xef}\xef\x9eI\xdd\xddomko\xdf\xceq[\
-P\xf8\x0ai<\x80\xb7\xfa\xb2\xf3\xca\x04\x15\x0ce\x1a\
-\xd0\xa4\xa5\x17\x03\xff\xbc\xb2\xb2\xc3\xcb\xca\xcan9\xe6\
-+_a\x0d\x1a\x5c\xbf\x9f\xca}\xd9F\x9db+/\
-\xf2\xc5\x14\x7f\xeb\x9e\xa3\xc3R<oz\x18\x7f^\xd6\
-\x96\xca\xcf\xfbM?\x97\xcaw\xa6r\x0c\xc6y\xf8\xf8\
-\x1cK\xed\x0d\xc2\xb5\xb3S\xfc.6')=\x88.\
-j?mO\x86s\xb5\xa0\xa8\x08\x8e\xff\xc67`B\
-Q\xd1e\xbc[\x0b\x89\xe9A\xe3\xd4\xe0`\xa8\x80\xc0\
-\x10Z\x7f\x1d\x09$\x04\xfeJss/<\xf1\xb2\xcb\
- \x1c\x0e\xc7ZyQ\xdbn'\xe2\xaf\x0b\xfa\xd9\x1e\
-y~;\x0d\xa9\xe8[\xf2K\xe4\xac/\xd9>\x18\xb2\
-\x7f(\x83}\x99\xfa\x1d\xbaq\xf7\xf3^\x83\xebl\xe2\
-\x0eh\xe7\x18\x11A\x7f?[7@\x8a\x95\x94\xeb\xf8\
-\x83\x0f\x86CO>\xf9\xfc\x8f\xd5\xd4\x5c\xad\x08\x08\xea\
-z\x0b*]\x81\xacw\x014\xd2\xdf\xab\x8b\xef\x0d\x8b\
->\xf5\xa9OWN\x9e\x0c\x03N\x1f\xbf^\x0a\xfa\xf1\
-~\x7f\x0a2\xcf\xf2)\xfb=%\xbf\x07\x0b\xd7\x07\x83\
-\xd0\x1d\x08@\x01\x9esE$\xa2\xffNn\xa7\xdb\xb4\
-\xa4\xb1\xc1\xe731\x89l?\xe74\x14n\x82\x8c\x0c\
-|~\xa7\xdf\xd4\xa0\xf4\xfd\xce\xf8S\xbbq\x22\x01\x0b\
-\xe7\x00=\xb7\xe0\x9cs`\xd7\xbau\x97-\x8cF7\
--\xaf\xab{\x12\xf6n.\xc2\xef/`\x81\xa2TX\
-\xe6\x0a\xecK\x95\x80\xbaM<\x12|\xff#\xab\xaa\xfe\
-c\xfc\xf4\xe9_9\xe4\xd4Sc\x9bvP\x99/\xad\
-\xc2\xa2>~n\xbe_\x13\x9c\xb1\xd2L\xfb\x18\xa5\x90\
-\x0c,\xdb\x0e\xf4\x03\x1b\xf0\xe2w\xe2E\x22\x22\xd8\x86\
-\x8f#\xb2\xcf\xf8\xb5\x96\x9a\x01f\x07W\xf5\xa6:2\
-Y\x89\xa7=\xbc\xc8\xc6\xe0\xb7\xda\xa6\xef\x17\xc6\xc0s\
-\xfc20G\xa4\xefw\x0c\x14\xa9T\xb6\x9d<\xa5\xaa\
-q\x1e\x07\xf0\xf1\x89\x97^\x0a%\xf9\xf9\xf7\xd4\x14\x14\
-T\xa4\xea\x0a$\x87\x91\xb2\xb4\x12\xd00\xea\x9f\xd0\xd0\
-\xb32?\x7f\xf4\xa8\xdc\xdc\x1f\x1eG~\x7foo\xac\
-\xa3\x8f\xb3\xb4\x97\x97\xfd\x96\xcf\xe0\x8d\x05\xe9\xf5\xfa\x13\
--\xab\xed\xa1\x08\x08\xfcm\x94\x00\xce\xcd\x85yg\x9f\
-\x0d\xeb_x\x01:\x1b\x1ba;\xbe>\x1eI\xccx\
-\xc0}\x5c\x5c;\xcd\xcf\x0f{pO\xf8|/\x9e;\
-\x11h+*\xa8\x12\xbc\xf6cP\xfd\x05R\xf9\xbf\x14\
-\xef\xb1}\xbc'\xa5\x80\xa0\xbb\x15YC\x03\x0b\x0a\xd2\
-\xadh\xf4hX\xfc\xb9\xcfA\xcfo~\xf3\xed\xda\xae\
-\xae[8\x15\xa0K\x0d\xc6\xbf\xd2M\x0d\x9a.\x1b\xce\
-\x16\x05 \xb3\xfa\xd2v\xde3KJ\xaeZt\xee\xb9\
-\x90_T\x14[\xdeK\xbd\xfcZ[\xf7\xe6\xfb)h\
-\x93\x06K\xdb~\xfdy\x13\xff\x9d\xbbB\xb6c\xf9i\
-\xd2\xe6\xe4\xe7\xc3\xe1\xe7\x9f\x0fe\xe8\xc6\x1cq\xc1\x05\
-PX^\xce\xd4\xc0\x0e\x9c\xd4\x03\xb2\xf4\x96d\x16\xec\
-\x93\xc5@\xe9\x9e\x13\xdezp\x9c6\xe18\xb6\xe0}\
-\x00\xc7\xab\xc5\x19\xb7\xa8A\x8c%\xc9'\x17\xdd\x04\xd9\
-<\xf0x\x8f\xe5SuZb\x91P]]l\x9by\
-\x9c\xd3\xd3\x16/\x86\xb1\x07\x1d\xf4\x85\x85\x95\x95\x9f\x06\
-}\x81\x90t\x8f\x81\xc1H\x03f\x9c\x008\xebo\xb2\
-\xca\xcf\xdd\xb7\xef\xec1\x93'\x7fa\xc6QG\xc5\xc0\
-O\xf9~\xb7\x857\x11\x80C\x02\xb6&\xdaoK\x22\
-\xb8\xb2\xc7\xb2C\x1aiV}\x97\x22jM\x93\xb4\x95\
-~\x0cZ\xfe\x05\xe7\x9d\x07E\x95\x95\xec\x87\x87\x0b\x0b\
-\x19\x190\x12\xc0\xc7\xdb\x91 \x06\xc4I\xe3D\xa4-\
-Yd:SQ\xf8\xc1\x00|\x86\xa3\xff=\xf8\xf7f\
-\x1c\x1f\x1a\xebq\x87\x1c\x02G}\xedk\x90\x8b\xe3\xd7\
-N\xe3\xe6\x90\x80\xd1w\xcb\xae\xb7\x18\xac\x93\x1d\x92\xdf\
-e+\xe6\x8f\xd1\x1cD\x02 5\xdb\xe7,\x1a\xa2\xbf\
-\x8f\xb9\xe8\x22(\xcc\xcd\xfd\x0f\x85\x1b\x10\xd0\x81\x7f0\
-\x02\x82\x81A\x02\xbfN\x01$5\xf8(\xcc\xc9\xf9\x8f\
-c\xfe\xe3?\xa8\xc3JL\xfa\xe3\x80Q\xbe\xdfvJ\
-}\xfd\xa4fT\xa0\xf7L\x05i&\xb5%\x16~\x08\
-\x87\x0b\xfe \x82\x9f,~QUU\x82E\xca\xc1I\
-|\x04\xfe\xbe\x02\x22\x01|\x1c'\x01qb\xc9\x22\xd5\
-\xaa\xe7\xfd\x1e\x99\xfa\x9eA:/\xea\xae\xb9\x09\xc7%\
-J\x92\x7f\xfe|\x98}\xfa\xe9\x90WR\x02G `\
-rG\x8d\x82vg\xdc\x22&\x04$\xb1\xc6\xe2\xeb\x96\
-\xc7\xeb\xee\xb9\x99\xa6\x07mYZ\xd0Q\x01\x14\xcbb\
-\x99,\x9c\xdb\xe4\x0a\x1cq\xdai\x0bhq\x9bGV\
-@\x19\x13\xd8\x17\xd2\x80\xba\x85>\x09\xd6\xffc55\
-\xd7\x1c\xbet\xe9\xc2Qee\xb1\xb6^h\xfd\xa9\xa6\
-:J\x03\xc8\x07V\xd2\xa8\xdf\xd7\xbdOUu\x96 \
-\xf15i\xbe\xed\x8e\x5c%\xf0\x1fN\xe0\xaf\xae\x96\x0e\
-HNA\x01,\xc4\xc9L\xe4@J\xe0#\x22\x01\xd3\
-b\xa0\xfd9\x0dH>\xbf\x0b~|<\x16\xc1?\xf7\
-\x8c3\xe2\x1f\xcf/-eM7\xf2\xf0\x9e\x94\x00\x91\
-m\x84\x1b+\xcf\xcaA\xafsQ\xbcf\x09\xaf\x99\xba\
-\x9b\x09\xf3\x87s\x05\xa8>\x80\x11\x01\xce\xed\xd9\xc7\x1d\
-\x07\x95\xd5\xd5_9\xa4\xbc\xfcH\x8d+\x10\x90\x19\xfa\
-L\xab\x80\xc0 Z\x7fP\xa4\xfd\xe2$0\xad\xa4d\
-\xca\xe8\xd2\xd2o\xcc>\xf6X604@T\xf0#\
-J\x7f\x1d\xeb\xa6$\xfduV\xc4\xcb\xc2p\xaf\xed\xc4\
-I\xdb\x8a \x0e\x85\xc3\xcc\xc2SoB\xdd\x8dH\xe0\
-\xf0\x0b/\x84QH\x12]D\x02x\xf4\x9b\xca\xea\xa1\
-\x90\xe2C)\xfb\x9d\xef\x22\xd9\xef\x82\x7f\x1c\x81\xff\xac\
-\xb3\x92\xc6-\xaf\xb8\x18\x16!\x09\xe4\xa3\x22 \x12\xf8\
-\x08\xc7|@\xccHx\x5c\xbb\x04\xc5\x22\x9b7\xbcQ\
-\x90\xbcf+\xdc\x0bq\xceY\xb2yG\xae\x00\xcei\
-\x96\x15\xa0\x96u\xa8n\x17\x9fs\x0e\x94\x84\xc3\xbc+\
-\x10\xf0P\x00\x83\xa2\x02\x02\xc3i\xfd\xab\xf3\xf3\xbf\xb0\
-\xe8\xec\xb3Y\x9a\xc4]\xe8\xc3\xf2\xfd\x8a\x94\x9fWA\
-\x8f\xa7\xc57\xb4\x04\x96G\xa0\x88n;\xd1\x125\xe3\
-\xc4\x0d\xe4\xe4\xc0\x02\x02\xff\xd8\xb1F\x83\x13vH\x80\
-\x94\x02\x05\x06I\x09\xf4\x8b\xd6\x0b$\x1d&\xf7\x855\
-\x00>\xad\xbfk\xf9I\xd6\x8fA\x9f\x7f\x8e\x04\xfc\xee\
-\x8d\xdc\x80\x85\x17_\xcc\xdc\xa8\x0e\x1a71\xa0\xea\xa1\
-\xa4,\xd5k\x8aT\xaf%\xbcf\x89\xe9I\x83\xb9\x99\
-\x90\x1a\xc4yMF\x8e\x02\x82\xa4t\xab\x0e:\x08\xa6\
-\xce\x9d{\xc6\x11\x95\x95\x9f2\x8c\x07x\xa6\x05\x87-\
-\x0d\xa8\xb1\xfe\xca\xd5~\x87UT,\x197y\xf2E\
-\xe3g\xcd\x8a\x15\xfcP\xf9$\xde\x13S\xc6\xfd4H\
-^\xcf\xaf[\xdb/VOX\x9a\x94\x98-cR\xe7\
-o\xaf\xb4\xdaN\x94\xfd\xcd\xf4cp\xf2\x92\xec/\x1d\
-?\xde\xd7x\x11\x09,\xfc\xc2\x17`\xf9C\x0fA\xdb\
-\xee\xdd@\x8b\xc6':-\xa6\x8c\xce%[\xd2~i\
-\xa4\x05\xe3\xe0G\xb2\x1f{\xe8\xa1p0\x1a\x02/\xab\
-\x96G$@\xe3\xf6\xf0\xc3\xd0QW\x17\x1b7\x9c+\
-!\x1d\x01\xea\x8a\x84\x84\xcf\xa9H\xc4\x96\xd5%\xf0D\
-`\x92*t\x0awH\xe1Zh4p\xf2\xc0\xa1\xa7\
-\x9f\x0e[\xd7\xaf'\x15\xf0\x8c\x93\xfe\x8br\xa9\xc1\xa8\
-\xc2\xfa\xdb\x99T\x01\x99V\x00\xa6\x8b}\x82\xa3rr\
-.X\x88\xbe\x1em\xde\xc9\xac?\x95\xfa\xba\xd2_H\
-\xf9\xd9\x1a\xeb\xafK\xc9\x98\xa4\x88x\x8bk\xa2\x1av\
-\xb8\x96\x1fI\xe0\x08\xb4\xe4\xb4\x19I*7J\x15.\
-\xfc\xd2\x97\x98r w`\x1b^\xcc~S\x7f5]\
-\xff~\x10\xad\xba\xc9\xff\x13\x07?\xde\x93\xe5\x9f\xf7\xa9\
-O\x81\x150\x9b\x8aL\x09\xa0;@Y\x16RP\xdb\
-HA\xf1@0(\x12JRZ\xba\xf4 W\xfce\
-y\xc4\x09<S\xcd\xb4j\x90\x5c\x01g\xad@\x11\xfe\
-\x96\x83?\xfe\xf1\xc3\x8e\xaa\xae\xbe\xcc0\x18\x98q\x15\
-\x906\x01xX\x7fik\xef\x85UU\x9f\x9d:o\
-\xde\xb1e(\x83#\x8e,\xa2E?\xfc\x22\x1f\x13\x1f\
-K\x9b\x861\xf0\xe1\xf9\xbf-\x838\xc0\x0e\x9cl\xcd\
-\x94\x9f\xc6{\x8aN\x97\xa1\x8cK\xe7F$\xb0\x88H\
-\xa0\xa6\x06\xba\xf0\xff\xdaJ1\x81\xc1L\xdbe\xc1\xc1\
-|~\xfc\x9d\x03\xf8\x1bk\xe6\xce\x85C\xd0\x176\x05\
-?O\x02\x8b\xbe\xfce\x18\xe5\x04T\x19y\xca2\x13\
-\x8a\xd8\x8f.\xd5*\xfb\x0c\x1f\x8c\xb6\x848@Bf\
-Ax>a>\xd2\xdc\xa6\x83\x08\x80\xd6\x09\xd0\xb2a\
-\x9c\xfbs\x8f9\x06\x8a\xf2\xf2\xae(\x08\x85\xf2\x85\xe2\
-8\x91\x04@\xe5\x12d\x8b\x02\xb0L\xfd\x7f\xfc\xb1\xe7\
-\x1fr\xfc\xf1\xd0\x8f\x96\x9fEF\xa9\xa9\xa7C\x00b\
-\xe0O\x04\xbeW.\x16\x14i*K\xf0\xc9d\xf9^\
-e\x90\xc8\xb1\xfcMNq\xcaa\xe8\xf3\x8f\x9e<9\
-#i0\xca\x1e\x90o\xcb\x94\x00>\xde\x82\x03\xd4\xa7\
-K\x99e\x22\xb07T+\x0a\x85\xcf\xf6\xe2\xb1\x89d\
-\xb0\x03\xfe\xf9\x9f\xf9L\x5c\x1a\xfb=XV\x05I\x80\
-\x02\xaf\x94Z\xdd\xea\x90\x80\x94\xe0}\x9c\xa3\xa5\x09\x0e\
-\xc7S\x83\xb2\x022E\x1d\x818G\x19\x09P\xba\xdb\
-Q\x01A<\xefC\x8e;\x0e\xe6\x97\x97\x7fCP\x00\
-\xb2\x8c@\xc6U@ \x03\xa07\xb1\xfeq\xf0\xa3\xf5\
-\xff\xfc\xf4\xf9\xf3\xe7\x15\x15\x17\xc7\x9a|\x10\xf8\x1d\xbf\
-_6\xb8\x96a\xe0O\xea\xd7q\xc0\xb7u.\x81D\
->Z\x9c\xf4\x8b\x83\x1f-\x15\xed\x0dW1mZF\
-\xfd\xa6P^\x1e,B\x12\x18=a\x02t\xe3c\x9a\
-\xcc}\xb2\xba{\xd8w\x1b\x8c\x92\xec\xff\x90,?\xfe\
-\x8e\x1aZ!\xf7\xb9\xcf1?8]\x05E\xe4Y\xe2\
-\xb8Q[\xf1\xfb\xfaL\x02}|\x90OU\x05\xa8\x98\
-\x13\xca`\xb1b\xfe\x89\x01A\xdb!\x01jl\xeb6\
-\x0f\x99\xb6`\x01\x94\x14\x15}ktnn\xb1\x87\x1b\
-\x90q\x15\x10\x18$\xeb\xafJ\xfd\x85\xd0\xfa\x9f7\xf7\
-\xe8\xa3ci?g\x00\xc8/\xb2\x85\x8a?\x93J+\
->\xf5ck,\xbbg\xcaO\xc5\xeaN\xf1I\xa3\x13\
-p\xa1h?\xed><\x187\x22\x81#\xd0\x1d(E\
-\x12\xe8\xc2\xf3\xd9J]g\xfd\x16\xd4\xe8\x8eL\x16\x01\
-\xf9\xfc?I\xf6o\xa4~\xfa\xae\xe5\xcf\x00\xf8\x13\xdc\
-\xa8\xaf|%6n\x8e\x12\xe8\xd3-\x03\xe6\xe7\x91G\
-\xfbp\x99*LJ\x0d\x8a\xeaT2\xa7\x12\xfeO\xd7\
-\x15\xe0T\x00e\xc1\x0e9\xf6X\x98=z\xf4%\x9a\
-l\x80*+`e\x03\x01\xe8\x88\x80\xb7\xfe\x9f\x9b1\
-\x7f\xfe\xdc\x02\x94o\x11g\xa9/\xeb\xf0\xa3\x91\xfe\xba\
-*,\x9b\x07\xb5P\xb9%\xf3\xd9d\xc0\x97\xca67\
-\xe0\x87\x93\xa9\x89~\x04\xde\x1fz\xde\xf9P9k\xd6\
-\xa0ZI\x22\x81\x85_\x8eM\xe6n<\x8f-\xd4u\
-6\xdd\x1a\x01\xd7\xe2\x99\xae\xe2\xf3q\x18\xa5\xfa\xf0\xfc\
->\xc4kK>\x7f\xf5\x9c90\xff\xbc\xf3\x98\x1b5\
-\xa8\xe3\x86\xd7\xabW\x98\x1b\xe0\xc3\xfd\x93\xba\x03\x922\
-b\x19\x11X\xc2\xdc\xb4\xb9x\x94%4\x0fa\x1d\xae\
-\x9d\xbe\x01\x07\xe1\xd8\x14\x17\x14\x5c\x82*`\xd4P\xaa\
-\x80@\x9a`\xf7\xca\xfb'\xb8\x00\xe4\xfb\xcf^\xb4(\
-f\xfd\xe9\xc0\x01\x88\x0a\x1d~\x8c\x02\x7f\x02\x80m\xae\
-\x9e^\x06p\x99\x15\x90\xd6\x85s\xafS\xc0\x8f\xc0O\
-\x01\xaa\xf9\xe7\x9f\x0f5\xf3\x0e\x1e\x12\xa9\x1c\xca\x0d\xc3\
-\xa2\xaf~\x95e\x17zh2\xe3\xd8\xf4zE\xda\x0d\
-^\x1f\x0c\x05\xe0\xf5\xff'\x80\x1f-\xffa\xe8>e\
-\x1a\xfc\xcaq\xa3X\x0a\xbd \xf3\xe3UMATj\
-Qx=)C%)\x1f\xb6\x14\xf3P\x0c\x082\x15\
-\x8c\xc6\xd0\xc2\xc7s?\xf61\x98YZz\x91\x22#\
-\xa0S\x01Y\x15\x04\x94n\xe9}hE\xc5\x89\x93g\
-\xcc\x98SPX\xc8\xd6H\xb3e\xbe\x5c\xdaO\xe6\xdb\
-[\xb2\xce,n:F\xf0\xc5\x12R;|\xeeW\xe7\
-\xff)\xfc7*\xf2i\xa4\xd4\x12\xe5j\x11\xfc\x94\xaa\
-\x1a\xca\x1b-(Z\x88\x93\xb9\xf4\xa0\x83b1\x01\x0a\
-\xa0\x0dE\xda.\x83e\xc1DZ\x9bH\xf6\xe3\xdfU\
-\x04~t\x9f\x02\xa1\xd0\xa0\x8f\xdb\xa2\xaf\x7f\x1d\xca\xa6\
-Mck\x0b6\x93; \xa4\x08-!\xbe\x03\x1e~\
-\xbc%\xe9Q`+\xe2\x02JU$~\xafK\x0a\x14\
-\x0bpZ\xde\xd1\xd6\xf6\x93Q\x05\x8c\xca\xcb\xbb*?\
-\x14\xca\x03}\xc7 \x00\xcd\xa2\xa1\xa1 \x00\xcb0\xf2\
-\x1f'\x81\xe2\x9c\x9c\xf3g/^\x1cK\xfbQ\xad\xbf\
-\xbb\xd8\x87\x93\xfe\xda\x92^\xd1/\xf3\xf0\xe7-\x93U\
-~\xb2f\x1e8a\x1a\x9d\x1f\xc7,\xff!\xf3\x87%\
-c\x16\x0c\xe3d\xfe\xda\xd7\xd1\xa2M\x8e\xc9ZR\x02\
-~z\x0b\x0e\xc7I\xf3\xd1~Z\x0f\x8f\xf7\xb4\x81\xeb\
-a\x17]\x04V04$\xa7\x10\x08\xe5\xc0\x11\xe8\x0e\
-\x94O\x9d\x1a;\x0f\x87\x8cdq\x10P\xad\x10\x94\xbd\
-O\x11w\xb2\x05e*\xa6\x0e-\xc9\xeb|7a\xa6\
-\x02(\x0e\x86\x98 z\x9cq\xd8appY\xd9\xb9\
-\x1a\x15\x90\xd5A@i\xe4\x7fVi\xe9\xc1\xd5c\xc7\
-~\xa2t\xf4\xe8XcO\xfa\xc1\x0e\x01\x80P\x9b\xaf\
-\xec\xcb&\xf8\xf4\x96\xa1\x9f&\xe6qA\x13\x18\x22\xe0\
-\x93\xe5'\x9e\xa6@\x15U\xa8\xc9[\xba\x0f\xcd\x11\xcc\
-\x09\xc1\xa2K\x90\x04\xa6La$@\xa0\xea1\x09\xe8\
-\x01\x98o\xa4\xe1CE\x98\xfc\xbf\x14\xf0\xfb\x10\xaf+\
-\x81\xafb\xe6LX\xf0\xa5/9\xb2\x7fh\xc7\xed\x88\
-\xaf|\x85\xfd\xff\x04\xfe\x0f)&\xc0[f?\xcdZ\
-U\xfd\x01%\xf3M6\x1f\x93\x88@\x0c\x0cR,\x80\
-\x02\x82\x8ea\x9c\x8as\xae0\x14:\x0f\xd4}\x03\x8d\
-\xfa\x06\x0c%\x01xZ\xff\x8a\xbc\xbc\xf3\xe7\x1cyd\
-\xcc\xef\xef\xe9\xd9k\xfd5\x9byJ[q\xc9\xdaF\
-\xa9*\xba8Y\xa6\x94{\xdc\xfb\xa8\xba\x8f\xd2}\xf4\
-\xdc!\x9f\xff<\x8c]\xb8p\x18\xa1\xbf\xf7\xa0\xb5\x06\
-$k\xcbQ\xd6\xd2d\xdeL\x96U\x01\x5c\xcaTX\
-\xce\xe6\x14^\x87/\x17\xc1C\xee\xb9\x07\x9d\xd7&j\
-\x82\x81\xf7\x95\x08\xbe\xc3\x11\x84\xd4\x17o\xb8\xc6\x8d\xfe\
-\xff\xca\xd9\xb3Y}\xc0&\x97\x04T\xbf]\x87 \x99\
-\xb4\xd7\xa4\x12A\xe1\x16$\xa5\x0d\xb9\xd5\x82\xb4\xb9\x08\
-\xf5\x12,@7f\xd2\x8c\x19\xb3\xe6\x97\x97\x1f\x03\xde\
-\xfb\x08\x0c\x8b\x02P\xf9 \xd2\xf4_y^^\xe9\xa8\
-\xc2\xc2\xcfT\x8d\x1f\xcf\x08\x80~$\x05\xff\xdcE?\
-6w\x00w\xc4\x9f\xe7r\xa7b\x95U<~ ~\
-\x96{\xcd\xfd\xac\xadZ]\x88\xcf5\xe1\x05\xa1\x95y\
-\xf4\x9ey\x9f\xfd,\x8cG\xf0gS\xf5\x1c\xf9\xce\x14\
-\x13(C%\xd0\x83\xe7\xf8!\xca\xc6>\xf1\xb7\x98\xa4\
-\xe5\x06\xf1\xe8\xa5\xf3Bb\xa7{J\x95\x1e~\xf1\xc5\
-\xacnbX\xc7\x8d\xd6j\xe0yT\xa1oM\xe3\xb5\
-\x91R\x92\xfc\x9c\xd25\x87\x11\xe6`\x82\xaa\xe4\xe7\xac\
-k\xf9\xf9y'\xce_\xee\xffL\xf8~\xe79\xd6\xfa\
-\x1e\x0fV\x17\xd3\xd9\x09\xd3\xd1\x0d(\x0e\x87\xcf\xf7a\
-\xfd\x87\xd5\x05\xb0$\x11\xca\xb8\xf5\x9fZ\x5c|\xce\xcc\
-#\x8e\x00\x8b~ Y\x7f\x04?p\x1d~\xb5m\xbb\
-\x1c\xe6\x0c(\x02w\xb6\xa8\x00\xc4Q\x91\xbd_\xa2\x16\
-\xa8\xa6\x9cY\xfe\xf3\xce\x83\x09G\x1d\x95\x95\x854d\
-\xd1\x16^rIL\xd6\xe2\xd8mt,\xad\xd2\x92\xd3\
-\x0a\xcb\x96\x96\xd8A\x1d\x96>\xfa\x08\xfa\xb6mK:\
-\xfaw\xeff\xaf\xd3\x11\xed\xe8H)\xc8H\xe7A\xa4\
-\xe4\xca~\xb2\xbct\xbeY1n\xa8@\x16 \x09\xd4\
-\xcc\x9f\xcf\x8a\x906\x1a(\x01w\xae$\x15\xf3\xe8\x5c\
-#\x15\x22%\x01E~{\xaf\xb8\x0a\xc0\xf1ciA\
-\xc4HEe%\xa0\xbb|\xe2\xb8\xc2\xc2j\xf0\xd70\
-\xc47!\x84\xd2\x04\xbd\xae\xec7\xe0\xa4\xfe\xce\x990\
-}z,\xf5G\x04@?\xd4%\x00\x89\xacpWN\
-\xc5\x01\xcf\xb5C\x8e\x8f)\xbd\xee\xbc\xc6\x0f\xb2\xe5\xbc\
-\x06\xfck2\xc9\xeb~\xbfs\xcb'6\xa6\xfes\xdb\
->\x82\xf1\x8b\xb3\x93\x00\xd8d\xa6\x00\xd7W\xbf\x06+\
-\xfe\xfb\xbf\xa1\xfe\xfdu\xb0\x11Iu2N\x9a\x1c\xca\
-%\x13\x80i|iE%\xc5Y(\xc3\xa2Y-\xa6\
-\x9b)\x81\xbc<\xb0P\x8a\x06\x0a\x0b!\x90\x9f\x0f\xc1\
-\xe2b\x08\x8c\x1a\xc5v\xbb\x91F\xfb\xf1\xff\x22\xdf\x9f\
-\xea$\xe8\xfc\xe8<\xb3i\x85\xb2\x15@\x12\xf8\xe2\x97\
-`\xd5\xc3\x0f\xc1\xee\xb7\xdff\x81\xc1Y8\xff\x02\xb2\
-\xea=\x99\xec\xe7\xe7\xa6\xaa\xea\xcfu\x01\xb8\xe7m\xc9\
-k\xb2V\xde\xec9\xea\x1c\x84\xd73\x80*\x80\x82\x82\
-3Q\x05\xd476\x9e\xb3\xb3\xb3\xf3\x97\x12\x15\x10\x15\
-@\x9f\xf2h\x87R\x00\xbe\x8a\x08\x92\xc0?{\xf4\xe8\
-C\xc7N\x9a4\x9d\xfc\x9a^w\xc1\x0fo\xfdU~\
-,\x07`K\xb2DV\xbc\x00\x96\xe6\xb5\xf8\xe7x\xe0\
-\x0b}\xf4\x0b\x1df\xde\xf6\xca\xbfq\xb2X0\x97j\
-\xd4\xb3\xf4f\x85\xc8\xa2}\x09\xfev\xd5U\xf0\xce\xf3\
-\xcf\xb3\x0a\xbb\x85\x08\xd8B\x94\xbb\xfc\xf2g\xe3\x056\
-\x12\x92\xa0\xebDM+\xa8HE\x1c\xcb`I\x09#\
-\x82 \x05t\xf1\xd8\x82\x96\x9e\xc0O1\x8a#\xbe\x86\
-\xe0\xcf\x09\xa53\x1f\x07\x91=-$\x81/\xc2r$\
-\xc9\xbau\xeb\xd8\x22\xa2Q:k-\x01\xb0%#\x02\
-\xdd\xb6]\xc2RdKE$\xf4\x90\x0b\x08\x12\x91\x8f\
-\x9f:\x15\xf2^~\xf9\x1c|\xe9\x01\x07S\x11\x85\xe5\
-W\xad\x92\x1fT\x05`R\x00\x14,\xcf\xcd\xfd\xdc\xf4\
-y\xf3\xf6Z\x7f\x22\x00\xa7\xecW\xb5n\x9fY{\x17\
-\xb0\x90\xb8\x0bk\x9c\x18\xb8\x81\xb5\x9c\xa8=\x08\x9f\xe3\
-'\xb7-^\x10a\xd2\xe7\xe1\xf33\xf0\xd8\x80\xa0\xd9\
-\xfa\xf2\xcb\xec\xf5\xb9\xe7\x9e\x9b\x15\xf3\xd6\xe6\xacJ\xfc\
-7\x87\xc3p\xf2=\xf7@/\x02t\xeb\xbf\xfe\x05\xcb\
-pl\x8fDKM$\xe0\xd9\x17 \x955\xe4\xdcg\
-X\xe5\x1a\x92y\xd7\xf6\xed\xb0\x02-U7\x12\xc0\x94\
-\x13O\x84\xc3\xbf\xf1\x8d\xac\x91\xfd\xaa[\xe3\xa6M\xd0\
-\xf0\xc1\x07\xcc\x00\x15*\xac\xbe-\xb3\xfa\x06\x8a@\xb4\
-\xec\xb6D)\xf0\xcb\xce\x93H\x80\x08\x00\xc7\x99\xb5\xc4\
-\xc7\xeb\x99[T\x04\x13\xa6N\x9d8\xaf\xb7\xf7ck\
-\x1b\x1b_\xd1\xa8\x00\x91\x7f|)\x82@\x1a\xc0\xd7\x05\
-\xff\x82E99\x85h\xf9?]9f\x0c\x934\x14\
-\xe5t\xc1\xafZ\xc1g9i\x14\xb1\xd4\xd2\xe2\xab\xa9\
-\xb8|\xac\xa5\xaa\xb9\x96\xad\x02\x94U|q\x9f\xcd\xc7\
-\xbfg8\x81\x99-/\xbe\x08\xef=\xf6\xf8\xb0\x82>\
-\x1a\xb5!\x12\x89\xb2{\x9b\x0e!\xcc\x1dD\x99}\xe6\
-\x7f\xff\x1a\xa6\x9cp\x02\xb3\xc0o\xe1\x18w\xba`\x15\
-\x0f\x22\x06\xf7\x90\xbd\xee\xf3\xa0\xe2\xa4\x958I;\xa8\
-\xc2o\xde!p\xf2O\x7f\xc6d?\x9do\xfc\x9c\xb3\
-\xacKQ\xe3\x86\x8d\xb0\xec\xe7?g\x01\xe82w\x9e\
-\x99n\x09'\x99/\xb6f\xb7`[V~,\xa6\x16\
-eik\xa7u\x98M\x0b\x85\xd0hN\x99;\x17J\
-rr>\x09\xc9K\x843\x96\x11\x08\xf8\x04\xbe\xec\xb1\
-X\xa6\xc8NrZI\xc9\xc7'\xce\x98\xc1\x80\xca\x22\
-\xff\xa2\xfc\x17Ry\x16H\x9ar(d\x94\xa5ae\
-\xfeq@\x91\xbe\x91\x06\x80(\x16\x80\xf73\x9d\xc7[\
-\xfe\xf9\x22\xac{\xe2\x89!\x06}\x94u\xc8\x892\x12\
-\x8b\x1a\xe5\xbbO\x7f\xe0\x01\x98\xbad\x09\xf3\xc5\x97\xe1\
-\xa4\xe9tU\x12\x0f|\x0e\xbcV\x9a\x07\x91\xcdJ\xfc\
-\x7f:\xf0<\xc7\x1dq\x04|\xea\xb7\xbf\x81P^n\
-\xc2y\xd1\xb9'\xfe\x16{\x98\xc1\xbf\x01\xc1\x7f?\x03\
-\x7f9>\x9e(s\x17\x15s\xc3\xf2\xda\xc1I3\x0f\
-m\xe1y\x11@|L n\xe4\x5c\x12\xc0s\xad\xa8\
-\xa9\xa1\xb4\xe0\xd9dL=2\x02\x90*\x11d*\x08\
-\xe8\x9eL\x90S\x00\xa7\xa1\x84\x89\xa5\xfe\x9c\xc2\x1f\xbe\
-\xdd\x17p\xc1>W\xc6\xc7\xe5\xbc\x10\x13\x10eh\x82\
-\x8c\x17\x02z\xf1\xd8\x81\xf8]\xe2\xf7(>\x97\x8f\xf7\
-\xd3\xf1~\x03\x1e\x9b\xfe\xfewv\xae\xb3\x07\xc9\x1d\x88\
-Y\x1dH\x0b dyO\xf9\xc5/\xe1\xf9o^\xca\
-\x94\xcb[\x9d\x9d\xb0\x18\xe5c\xa1I\xcd\xbd\x1fw\x80\
-Rhx\xedV\xe2\xf7\xb7S\x1b/\x04\xffY\x0f?\
-\x02\xc1\xdc<\xd0w\xe4\xda\xdb\xdd0F\x22\x99\xdf\xdc\
-\xc2\x13\xfc\xf7\xdd\x07\x11\x9c{\xe5\xf8\xffN\x00\x90/\
-\xf9\xf5\x13\x00T\x00\x9e@\x1c5 \x02\xd9\xf7\xd9N\
-\x1c\x80\xc0\x13\x09\x85 \x80F3\x84d0~\xfat\
-\x98\xda\xd1q\xd4\x9a\xc6\xc6\x7f\x80|\x85`4\x1d7\
- \x90\x22\xf0A\x91\xfas\xc1_P\x10\x0e\x9fV^\
-U\xc5|\x7f&\xfd]\xf0\xbb\xd2]\x12H1I\xb9\
-\xc8.BBcH\x1f\xd5m\xaa\x1df\x0a(&\xe0\
-\xbc\x87H`\xfd\x9f\xfe\x94q\xe0\xfb\xb1\xf4&J\xe0\
-\xd4_\xfc\x02\xa6.]\xcaRrovt@'\x8d\
-\xb5\xce\x15\xf0\xe9\x0ePm=\x03?\xf5\xed_\xb0\x00\
-\xc1\xff0\xe4\x14\xe4\xfb:\xcf\xa1V\x06\x8d\xe8\xef3\
-\xf0\xa3\xf1)\xc3\xdf0QC<\x09\xd5\x93\xc2\x99\x8b\
-\xfd!\x12>#\x1c\x16\x1f\x13P\xa9\x04Jm\xf3\x85\
-l\xe2\x12d2\x96\x94\x12D\xc39\x11\x8d\xe8\xa8p\
-\xf8\x0c\xd0/\x0fN\xd9\x0d\x08\xf8\x00\xbe\x97\x02\x88\x1f\
-\xd3KJ>1\x81\x9af8\x11\xcd\x08_\xf7\xcf\x97\
-GJ|\xfb\x84\xa2\x16I\x19\xa5\xcag\x93\xae\xe5\xe6\
-c\x022\xdfK\xd3\xe3\xbd\x90#\x81\x0f\xff\xfaWx\
-\xff\xc9'\xd3\x82)\xb5\xbd\x8e\xe0\xff=@\x0b@\xe8\
-\x9c \xf3\x95oK\xef\xbf\x1f\xa6\x9dz*\xab|{\
-\xab\xbd\x9d\xf9\xe8\x99\xf0\xffI\xf6\xafBR!\xcb?\
-\xe6\xb0\xc3\xe0\xcc\x87\x1e\x82PAA\xc6\xc6#*#\
-\xe24\x0f\x06\xfe{\xef\x8d\xf9\xfc\xf8x\x92\x0b>E\
-\x09\xb0\xd7\xe6\xa9I%\xe5\x0a\xdf\xdeV4\xb2\x91\x01\
-=am\x01_\x15Hc\xe2\x90\x00\x19Qt\x03N\
-s\xdc\x00Y\x1c \xad\x96a\xe9\x04\x01\x95\xd5\x7f\x85\
-99K\x99\xfc\xa7\xf2F\xfa!.\xf89\x7f\x1fD\
-\xffG\xc2\x96\x01I\xf4T\xc6\xa6\x96\xc6\xafW\xd6\x02\
-\xc8T\x88\xf0]4\xe2\xd3\x9d\xcc\xc2&$\x81\x0dO\
-?\xed\xbb\x1a\x8dUz\xd1\x05u+\xc5\x06\xb9b\xf0\
-\xa4\x9f\xfd\x0c\xa6\x9dr\x0a#\x81\xe5H\x02\xa4\x04\xb4\
-~=\xa5\x0f5\x07\x15\xcd\xbc\x8d\xdf\xd3\x8e\xd7\xb0z\
-\xfe|8\xe3\xc1\x07!\x8c.F&\xcf\x9b\xc6&B\
-\xbeo\x86\xc6\x88\x81\xff\x9e{\x98\xe1!\xd9?\x89w\
-\x87<\xdc\x8f\x84\x1d\x86y\xff\xddpNi\xe7\xa2\xc1\
-\xbd\xed\xb4\x10g\x8b\x84\xd0x\x06(\xd6B-\xc4\x8b\
-\x8b\x17\x83\xbf\xaa@k\xb0\x5c\x00m\x0a0\x14\x08\x84\
-sC\xa1\xd3F\x97\x973\xeb\xcfz\xfdQ^\xd9)\
-\x7f\xb4$\xfd\xd3l\xc9j)\x8bg\x5c\xdd\xa2\x0da\
-\x85\xa0\xed\x93\xd9\x95\x9b\x83:\x07\x91\xc0T\x8a'\xe0\
-wox\xe6\x19\xf8\x00I\xc0\xd4\xc2\xb9\xd6~0,\
-\x9c\xea\xa0\x96\xd3KP\xf6NA\x12\xa0\xd5xo\xb5\
-\xb4\xc4\x94@\x0an\x00\xf9\xfco\xb7\xb5A\x1bN\xc8\
-*\x02?\xc9\xfeQ\xa3\x06\xed\xdc3\xa1\x0a(\xcd\xb7\
-\x0cIp\xc0\xb1\xfc\x13\xddrd\xd1\x8d4],\x95\
-\xc2\xbc\xe1\xd5\x81%\x99\xc3\xb6\xc7\x8aJ\xdb\xe9\x1e\xcc\
-:\x08#\x86\xc6N\x9e\x0chT\x8f\xd3\xb8\x01)\x07\
-\x01\x03)\x82_\x99\x02\x9cYRrX\xcd\xb8q\x10\
-$_\x8f_\xf8\xe3n\xf6\xc1\x0d\x8en\xb0mI\xda\
-D\x04\xb9\xe5\xb59\x83\xaaK\xac\x8f\x8bL\x12\xad\x18\
-\xef\xa7\xd3D\xa2\x12\x5c$\x80\x8dH\x04\xaa\x19\x18\xa5\
-T\xd8@\x84\xdd\x0f\xd7\x0a\x22\xaa|;\xe9\xde\xfb`\
-\xda\xe9\xa7\xb3\xf2\xd7\xb7\x9a\x9bc1\x01\x1fn\x00e\
-\x15V\x13\xf8q\x12V\x1d|0\x9c\xf1\xd0\xc3h\xf9\
-G\x0d\xd9o\xe0\xc7\x91\xd2\xa0&\x9fiZ\xff\x01,\
-\xff\xe9O\xd9\xbc\x8b[~\x8fkk\x19*\x0e[\x91\
-j\x06.}\x0d\x0a\xb9\x9f\xd0\xb3B\x94\xfc\x12\x17\xd5\
-%\x00f<\xe9\xb7TWC8\x10\xf8\x04\x0cB9\
-p\xc0\xa7\xff\xef\xb5\xddw\xa08\x1c>\x96\x18\xcb\x05\
-?\xfb!n\xd9\xafDVY\x5c\x0f\x7f\x90\xac\x9c\x12\
-\xcb'U\x12M\x9b\xba\x91H7\xcb$\x0d\xc4\xcd\xaf\
-\x22\x9cP\xd3Pb\xd3\xe76>\xf5\x14\x92\x00)\x81\
-\xbd\xff\x22\xd1\x08Z.\x94\xb1v4\xe1\xf9\xe1\xfa\x07\
-\xc1\x00\x9c\x80`\x98~\xd6Y\xac\x84\x8c\x91\x00\x91\xb0\
-$0(\xca~\xea\xa4\xb3\xa6\xb5\x95Y\xfe\xcay\xf3\
-\xe0\xf4\xdf\xfc\x06-\x7f\xd1\xb0\xfc\x0e\x1aO\x1a[:\
-tc\xdb\xf8\xc1z\xb4\xfc?es\xae\x02\x81?I\
-(J\xd2q\x87*H,[\x09\xa9\x9dW\x127\xc0\
-\x96\xb9\x98\xb2\x1d\x84\xf8`\xb8C\x0e\x84\x1drcr\
-\xf1\x9a\x94\x96\x97\xd7L\x1a5j\x82\x04s\x96\xc28\
-\x0fY\x1a0\xe1\x84r\x82\xc1\x05$\xffy\xff?\xbe\
-2\x8f/\xc9\xe5\xfc{K\xac\xf2sSy\xb2\xc8=\
-\xf7\x9aX\xaa\x19\xd0\xf9y\x5cy\xb1\xed#\xda\xc9\xdf\
-\xa8tt*N.Z\xf8\xb2\x812\x03\xf8\x9dS\xce\
-<+\xeb\x8a^\xe2\xbf\x05\x95\xc0q?\xbe\x8b\xfd\xbd\
-\xe9\xd9g\xe1\xad\xa6&X\x5cQA\xeb\xcd\x95\x9f!\
-\xb7a\x0d\xba\x0d\xad\xf8\x1b+f\xcf\x86\xd3\x1e|h\
-\xaf\xe5\x1f\xf6\x8aH'6DD\xc5]\xe3\xa6\xf5\xeb\
-a9\x82\x9f\xf9\xfc\xf8\xdb&\xd2\xef\x93\x00Xfh\
-d\x80\xb65[\xc2Y\xb2jA\xd1\xc5P|\xa7\xcd\
-U\xfd\xc9\xaa\x07\xe3\xea\x81~\x9bS\x0f\xc0\xb2\x01x\
-P\x1c`\xe7\x9e=\xc7lko\xdf\xea\xa3\x18\xc83\
-\x1d\x18H\x01\xf0*\xff\xdf*\xcb\xcd-)\xcc\xcf?\
-\xac\xb8\xa8(\xe6\xf7\xe3\x8f\xb0\xdc%\x93\x5c\x8aD\x5c\
-\x15\x05\x22\x1b{Xx\xd9k\x96\x09\xcbk\xbe\xcbD\
-\x15\xd0\xeb\xc58\xf9\x0e\xc2\x0b\xd3\xbca\x03\xbct\xcd\
-5\xb0\xfaW\x0fd\x85\xc5\xd7)\x81c\x7f\xfcc\x98\
-~\xf6\xd9\xcc\xaf~\xb3\xa1A\xae\x04\x9cn\xba\xabQ\
-)\xb4\x12\x90\x10\xfc\xa7>\xf2\x08\x84K\x8a\xb3\xee7\
-\xb9j\x8b\xee\x1b\xde{\x17e\xffOb\x11s\xb2\xfc\
-\xe1pr\xcd\x87P\x8cc\xf9\xb1\xf6\x1aP{\x92\x96\
-\x84<\x92\xceC\xd5\x8a\x9co\x1e\x8aj\xbaz\xecX\
-\xc8\x0b\x06\x8fV\x14\x04\xa5\xdc-(\x94\x01\xeb\x1f?\
-\xc6\x15\x16\xce\xaf\xc4\x13uS\x18\xee\xca?r\x01\x12\
-V\xea\x81P\x0c\xc2Y\xff8[\xbb\xc5A i\xbc\
-\xa0Z\xf8#\xf9NK\xf6\x9a\xcc\xea\x8b\xeb\x08$7\
-b\xe2\xfe]\xbb \x07A4\x0d\x7f\xd7\x1a|\xff\x0a\
-\x94\xd9$\x9b\xe7}\xf9+\x90\xad7R\x02\xc7\xdcq\
-'\xbb\xdf\xf8\xd4\x9f\xe0\xcd\xfaz8\xb2\xaa\x0a\x8a8\
-\x99L\xeb\xe5\xd78\xe0/C\xf0\x9f\xf2?\x0fBn\
-qIV\xae\xebqo\xbb\x97\xbd\x05\x7f\xff\xeaW!\
-'/\x0f\xa6\xa0\xdb9\xa9\xb22\xb9\x82\xd4\xa7!I\
-\xb2\xf6\xa6\x9f\x93e\x0d\x5c\x83/S\x08\xb2\x0c\x80\xa0\
-\x04,'\x0e@x*)+\x83\x10\xaak0\xdbA\
-\xd8\xb8\x10(d\x00v\x13\x15\xe0\xa6\xff\x16T\xd6\xd4\
-0\xf0\xb3\xf5\xcd\xfcv_\xc2*?\xfa\x81\x01A\xfa\
-\x83P\xbd\x17\xe0\x96\x03\xcb@oRQf\x22\xf7m\
-\x8f\xd7\xa3\x0e\xf0i{g\x97L\xca\x11<\x87 \xf0\
-\xd7vu\xc1\x8a\xbb\xeff$0\xf7K_\xca^\xb4\
-\xa0\x12\xf8\xf8\x0foc\xbf\xf6\xc3\xa7\x9e\x82euu\
-pdu5#\x01\x02\xff;\xf8\xdbZ)r>c\
-\x06,\xfd\x9f\xff\x81\xdc\xb2\xd1`g1\xfak\x97/\
-\x87\x7f \xf8\xc9:\x96\xd1\xee\xc2\xdb\xb6A7\x12[\
-\x0e\xfe\xa6\x10\x82\x85/.\xb3uU~|\x0cJ\xf6\
-\x1eqQ\x9a,E(\x82\x5c\xf8\x7f-\xa1U[\x92\
-\xfat+\x08EW\x80\x82\x81\xce\x0a\xc1\x1c\xc4PY\
-yy\xf1\xd4\xb6\xb6\xe9\x9b\xda\xda\xd6y\xe0\xd16%\
-\x81t\x9a\x82&\xc5\x00\xc2\x81\xc0\x82\xd18\xf8n\x0a\
-#^\xec I\xc1\xf0\x17'isN\xde\xd7\xf2\x92\
-\xebB\xb0\xd0\xf6q\xf2^\xaf\xd3\xe4\xea\xdd\xbc\x19\xba\
-\xdf}7\x06~\xa1\xa6\xbe\x12\xc13\xaf\xb0\x90\xfd\xbd\
-\xe2\xae\xbb\xe0\xfd\xdf\xfc\x06\xb2\xa2\x8f\x98&;p4\
-*\x81\x19\xe7\x9e\xcb\x9ezk\xcf\x1e\xe8\xc0\x09\xb6\x96\
-\xc0O\x96\x7f\xe6LX\xfa\xd0\xc3\x907\xba,\xab\x7f\
-\xc7\x9ee\xcb\xe1\xc5\xaf}\x8d\x11\xf3X\xb4\xfes\xa8\
-.\x01\x09\x98J\xce{\xb7ne\xd7\xab\x1fU\x1a\xb8\
-\x86G\x91\xc7\xe7\x15\xa5\xe9\x9cP\x05\x15\x95kT4\
-\xf3\xd8\x16\x02\x88\xb6\xe8\x16sk\x03\x88\x04H]\x8f\
-\xce\xcd=\x14\xbc\xd7\x04d\xdc\x05\xd0-\xfd\xb5\x9c\xfc\
-\x7f('\x14ZX<j\x14\xf4!\x13\xbb-\xbfm\
-~\xabo\xda^\xcb\xfd\xf1.\x90\x84\x00\x9d.x\xa7\
-\xb2\xda\x96\x8f\xea\x07\x93\xd1\xa1\x12\xcc\xfe\xdaZ\xd6M\
-'\xc1}p\xcf\xd7%\x02\xbcU\xa2\xcfy0\xfe\xfd\
-^g',\xbf\xf3N\xf6\xdc\xac\x0b/\x84l\xbe\x1d\
-u\xdbm\xacW\xdf\xc6\xc7\x1e\x83e\xf8;i,K\
-\xa7N\x85\x93\x1e|0\xeb-\xff\x1e\xb4\xfc\xff\xfc\xfa\
-\xd7\x199\x8fA\xf0\xcfv\x8a\x92\xf8\xebJ`\xe9\xdb\
-\xbe\x9d\xa9\xb6\x10\xba\x05\xa1\x8a\x0a\xf6{\xb5\xae\x81J\
-\xceK\x22\xfd\xb6\xe23*#fq\x81EK(\x80\
-\xe3\x95A<\x8e\xc5\x19F\xcb)\x0ab\xd9\x0dT7\
-\xb917\xe0\x8f>\x5c\x00\xad\x12\x08\x19\x82\xdf\x93\x08\
-\xa6\x16\x17\xcf)\xc7\xc1\xb6\xdc\xa6\x06N\x00\xc3]\x92\
-\xeb\xba\x00n\xd4\x1f\x04\xe9\x9f\x10\x1b\x10\x09\x81\xf3\xe3\
-\xe3\xf5\xd6\x12\xc2\xb0\x141\x85\xa4\x85D\x92\xe7\x99\xc5\
-w\x81\xdf\xda\xea\x09|\xfe>N\x02\x1d\x1d\xb0\xe2\xce\
-;\x99;0\xf3\xfc\x0b\xb2\x9a\x04\x16\xdfr+\x8e#\
-\xc0\xc6\xc7\x1fc\xe0_\xf2\xe0C{-\x7f\x16\x83\xff\
-\xa5K\xf6\x82\x7f\x96\xdb\xa1H\x88\xdf\xc4\x8d\x04\xceA\
-\xba\x9e\xfd\xa8t\xc8-\xc8\xa1\xf9\x89\xd7\xca\xb4{\x86\
-\xed\x91J\xd6u\x08\xb2U\xc6L\x17D\x14\x9b\x8d\xf2\
-\x81@$\x81\x92\xd2R\xc8\x09\x04\x0e\x03\xfdz\x00_\
-q\x00?A@m&\x00}\xc9\xd9e8\xc0\x11\xb7\
-\xe9\x87\xeb\x02\xb8\x11g'\xbd\xe1\xfe8\xcb)\xacq\
-\x03\x83\x01\xfeBrM>@H\x09Z*u\xc0\xa5\
-\x08=\xad>\xf7\x19\x22\x1cj\xa3\xd5\x87>1\x03\xbe\
-\x00r\x1d\xf0\xf9\xd7+ssa\x0e\xde\xafko\x87\
-\xe5\xb7\xdf\xce\xe4\xf6\xf4\xcf\x7f>\xabI`\xd1\xad\xb7\
-B\xd5\xc2#\xa0\xfa\xc8\xc5\x90\x87V2\x8b\xb1\x0fu\
-\x0e\xf8\xa9\xbe\xa4&?\x1ff\x17\x17'\xa7\xd2\x04\x83\
-bq\xcdc\x06\x1a\x1b\xd9\x11B\x10\x91\x22\xa0Vg\
-\xd2\x1a\x14I \xcf\x96\xf5^\x94)\x04\xb1\x8e\x05 \
-\xbe:\xd0V\xb8\x00I\xca\x80{\xaf\xdb*\xcc-\x0a\
-\xcaC\x9737\x1c\x9eP\x12\x0e\x17\xa1\xcb\xd6o\x00\
-~O\x12\x08\xf9\xb0\xfc\xda,\x00J\x939\xd4\xf7\xdf\
--\xfea\xc1\x0b\xaa\x01\xe0\x14@BG\x1e\xa7F\xdd\
-\xbdPI\x92\x9e\x0b\xf2%\x15V\xf0\x96[\xe3>x\
-\xf9t\xd4;\x8f\x01\x9fZ_\x09)1S\xe0\xf3\xaf\
-U\xa1U\xa2\xbf\xdfok\x83\xe5\xb7\xfd\x80\x91\xdc\xb4\
-,n/F\xb7\xc9\xa7\x9d\xee+\xb55,\xe0_\xb1\
-\x1c^\xfe\xfa%\xe8\xf3\xa3\xe5G\xe0\xceB\x10\x8b\x8a\
-\xd1\xd6dqx\x8b?\x80n\xdd@s3\xebwH\
-D\xc0\xfa\x1c\xea\x00\xce\x13\x81\x86\x00t\x01\xbe\x84\xe8\
-\xbe\xb3\x10\x8c\xff~[Q\xf4\x16c\x10\xae2\x10\x8f\
-\xd1UU0\xa6\xb5u&\x12\xc0[\x90\x81N\xc1\x19\
-S\x00(Mf\xd2\x96\xdf\xd4\xc8\xc0m\x8dlq\xe0\
-\xb7\x05p\x8bRK*\xfdy\xf6\x94\x90\x81\xee\xd7\xea\
-F\x81\x80?\x80\xb2\x90\xb6'S\x02_F\x00^\xaf\
-\xe3\xad\x1a'(\xfd\xbd\x9eH\xe0\x07\xdfg\xbe\xe7\x94\
-O\x7f\x1aFn\xa9\x82\x7f\x05\xfc\xeb\x12\x04\x7f_/\
-\x8cA\xd0\xcet\xc1\xaf\x90\xfd\x09Y#Yz\xd9\x89\
-?1\xf2\xdf\xb6\x8d5?%\xf7 TR\x12\xdf\xb1\
-\xd86H\x09\x9bf\x94d5(\x09q\x00\xc9\xe7\x92\
-\x02\x81\x9c\x1bPZ^\x0eE[\xb6P\xcb\x8a\xe5\x1a\
-\xeboe\xd2\x05P}y\x82\x0a\x08X\xd6\x94B\x9c\
-\xfc\x03hM\xf9\x0c\x80\xcdE\xfcy\xf0\xc4}y\xae\
-w\xbc\xc5\xa5\x08-M5_B\xc7`\x1f\xa9=\x1b\
-\xa5~\x7f}=\xbb\xf8\x22\x80-\x09\xd8\xfd\x00\x9fo\
-\x5c\xe2\x92\xc0\x07\xe8R,\xbf\xe5\xe6X\xc5\xe0\x08\x09\
-\xf8\xbe\xd5#\xf8\xff\xfd\x8dKX\xb4\x9f\x81\x1f\x15&\
-\x88\xa9a\x0d\x19$5\x84\x91\x10\x01Ikj\x8d>\
-\x80J\x90\x88\x80\x9a\x9dZ\xce\x1a\x02U\xb0\x8fw\x1b\
-D\xf7\x80\x97\xf2\x09\x81@\xd5\x8eL\x9a\x1a\x01\xf69\
-\xb7e\xb8\x13\x08,F\x02\x0c\x07\x833`\x88\xda\x82\
-\x9b\xb8\x01\x16\xf5//\x1c5\xaa\x88\xe2\xac\xfd\xdc&\
-\x1c<\xf8\xf9\x8b\x10\xcf\x06\x08\x81:wP\x03B\xbb\
-oQ\x15\xc8\xdc\x85\xa4\x0e?\xdc\x00\xb3\xbe\xf7(\xfb\
-(\xc8\xa7\x05\xb7\x04\xe0Zb\x90\xbd\xee\x92@A\x01\
-\xbb\xdf\x80\x92s\xc5\xad\xb7\xb0I5\xf9\xec\xb3GP\
-\xed\x03\xfc\xaf8\xe0\xaf!\xf0Sn_1\x19m\x83\
-\x18\x80\x96\x08\x1cKK\xc6\x81\x0e\xea|L\xb1\x02j\
-\x8f\xae\xab\x11\xb1}\x06\x0e\x95\xaa@\x15Gp\x5c\x00\
-\xf6\x9c\x83\xabQ\xe8\xb2\x84,k\x1a\xe8\x8b\x81,\xc3\
-\xd3\xf5\x95\x06\x04\x85\xf5\xb7J\xc2\xe1IE\xd4 \xc2\
-\xad\xfdw\xb7\xfdr\xfd\x1d!\xe8\x16\x10\x06\x82\x8fX\
-X\x9a\xc1\x0c\x98\xf4\xb9w-\x04-\xc5E\xd0\xd3a\
-+J_}\x01?\x85\xd7i\xe2\xd2\xe3\x8dx\x0e+\
-\x1d%0B\x02f\xe0\x7f\xf5\xd2o\xc4\xc0_T\x04\
-3Q\xf6\xdabvG\x5cW\x22\xaa\x82\x04\xccK\x88\
-@\xf3:3\x18H\xdcD\x00A$\x02\x8a\x13\xd8\xbc\
-Q\x12\x82}\xaa\x22![\x12;p\x03\x8fQ\xc5Z\
-\x02K\x12\x0bp]\x00R\x02\xf98\xa7\x82\x965\x19\
-\xe4\xb582\xb5\x9er\x10\xd0\x08\xfct\x9f\x17\x0a\x8d\
-\xc7#\xb6\xe5\x17I\x15n\xdb#K\x92\x8eK\x90\xf8\
-\xe2\x06\x1f\x8aT\x9f2\xfa/\x90\x05\xeb@D\xbb\xe1\
-\xa0+\xc2\xfb\x85IV\xdfD\xee\xa7J\x0c\xdck4\
-\x81\xdbqLj;:`%S\x02\x01\x98x\xc6\x99\
-#(\xd7\x80\xff5\x04?\xcd\xa5j\x02\xbfS\xdek\
-y\xf8\xf7I\xd2\xdf\x8b\x08d\xaf\x0bha\xe5\xecN\
-\x1a\xd1\xdd\x1c\x85HAV\xed'k\x01&\x06\x0fm\
-n\x11\x90%)\xfd\x05H^\x88\xe4V\x04\xba\x81\xc0\
-0\x12ANNNyq8\x5c\xd4\xd6G\x0bn\x92\
-\x0a\x81dj=\xad:\x00/\x22\xb0\xc2\x81\xc0\xc4B\
-d\xa6>**q#\x9dN\x07 \x95\x1fo\xfa\xb7\
-\xce\xdf\x0fp\x0cI\xdbZQ\xbfz\x22\x808\xc0u\
-\x006\x95\xfb\xa9\x00_x\xdft\xb4`\xf4:#\x81\
-\x9bof)\xc2\x09\xa7\x9e:\x82v\xe1\xd6\xb0r%\
-\xbc\xfe\xcdK\x99\xaf[\x83\x80\x9b\xe1\xd6\xf6Kd\xbb\
-V\xfa\xa7A\x04\x96B}\xba\xaa\x80\x1a\xae\xb0]\x92\
-\x90\x9c\xe8\xef\x84]\xa9\x14\xf1'K\x17\x1c\x94\x04\x06\
-E\xb7 \x1e\x08D\x02 \x17%??\x1f*\xf2\xf2\
-\xc6 \x014+pi\x1c\x0fH\xc7\x05\x88?FI\
-2\x86r\x94\x03\x08\xc0>\x94\xbb\x90\x9b\x9b\xd8\x01E\
-\x88\xf2'\xe5\xf8\xdd\x1f\xcb\xedf#Kb&T\x0d\
-\x92\xc4'\xd0;[a%Xv\x05\xc8U \xd5\xf9\
-\xf9:\xa5\xa0%\x06\xe1\xf3\xd3\xa9\x1a\x8dH\x00\x95\xc9\
-\xca\x1bo`)\xc2qK\x97\x8e\xa0\x9e\x03\xff\x1b\x04\
-~\x92\xfd\x04\xfe\xaa\xaa\xc4\xf4\x9e\x97\xf4\x97\xf8\xf9&\
-\x16_J$\x1a\xb7\x81\xb5\xeajjb5\x05\x16\xaa\
-^F\x04\xb4\x85\x1a\xce\xf9\xa4\xba\x02\xb1\x8e@\x12\x1c\
-\xb4\xc5\xe6\xa0\x92\xf4\x22ai\x00\xe7:\xe1+\x1f\xc7\
-\x85\x82\xed\x8599\xe3\xf1\x95\xf5\x1e1\x80\x94]\x00\
-\xdd\x0e\xc0I\x81@$\x80\xb1\xf9\xb4\x0c\x13O\x92\xc0\
-HQ\xd5 \xf9*\xc8\x94\x96\xd3D\xc3R\xc8{Q\
-\xea\xbb\x12/i\x91\x025H IF\x9b\x8cP\xb3\
-\x11<,/\x80{Y}\x9d\xdcO\xc3\x15\xb0\x14d\
-0\x8d*\xd1\x88\x04\xf0B\xae\xbc\xfe{\xec\xda\x8c;\
-y\x84\x04\x08\xfco^\xf6\xcd8\xf8\xa7WW\xef%\
-P\xb1O\x84J\xfak\xea\x01\x94D\xc0)\x06U\xea\
-O\xf5\x1a\xfb?Q\x8eSM\x81\x8d\x07\x11:#\x01\
-:\xa8\xc8\x88\x8c \xf7\xff\xbb\xeepTS\xab \xab\
-\x03`\xca\x96T-\x12O\x0e\x1a\x11r\xaf\x0b\x0a\x0a\
- /\x10\x18\x07\x19\xd8 \xc4\xaf\x02\x90\xba\x00\x01\xcb\
-\xaa\xc9E\xa0\xc7\xb7A\xa6\x9dk\xeb\xea\x00(\xb5B\
-D@\x1bL\xe2\xc1\x06\x88R,\x92\xea=~\x90\xc0\
--%vW\x14:K\x22\x03\x12p'Y~\x1d\x88\
-\xbd\xac\xbeA\xe4\xdfJ#U\x18'\x01\xfc\x93H`\
-\xd5\xf5\xd73w`\xcc\x92%\x07,\xf8\x1b\x11\xfco\
-9\xe0\xaf.)\x81\xe955\xca\x08\xba\xe5!\xfd\xc5\
-\x14\x9f\xa7\xc5W\xbdf\xe2\x16\x88\xc0\xa5\x16x\xa4D\
-Q\x91\xc6[\x89S\xd91\x1d4\xe7\xf1`.\x03}\
-7a\x05\x12+\x01\xdd]\xb3X\x83T\xa7%8\xdb\
-\xe8\x95\xeai\xf0\xb3T\xb8\xe4\x16\x05\x91\x0b\x10\x0a\x04\
-\xc6(\x80\xef\x8b\x0cL+\x01A#5\x10\x13\xd6\xe8\
-0u\x90\xe5\x9b{Bl9\xaf+\xd1\x07\x5c\x80\xe0\
-\xfb\x82\xb4\xf3\xac\x00^\xc6\x8e8\x08\xee\xf3\x22p\x8d\
-\xac{\x9a\x8a@\xf5\xfe\x94\x82\x86\x1ab\x98J\x16\x0e\
-\xc7a\x0f\xfa\x95o\xa3;@Sa\xcc\x89\x07\x1e\x09\
-4\xaeZ\x09\xcb\xbe\xf5-F\xee\xd5\xa5\xa50}\xcc\
-\x98D\xc3\xe0!\xfd\x93,\xbe\xac\xe3\x94\xc2\xe2'\xb8\
-\x0e\x8a\xd4\xa0i\xeaO\x99\x12$\xe3E\x81qY{\
-p\x88-!Nh\x15\xee\x10B\x94\xdfB\x9c7\x96\
-N`=\x17I\x05\x8dn\x85\xc65\xcf\xa8\x02\xb0t\
-dP\x1c\x0e\x17\xe6\x04\x83\xb9\x017Z\xc9\xe7\xe4e\
-@\xa3\xdfBR^\xb0\xd2\x96\xbb\xbb-\xbf\xc1%O\
-\x10\xe2\xf7)\x9e\xf3\x04\xb8_R\xd0\xa9\x0e\x8d\x8b\xe0\
-\xa5\x08\xa6:2\xb7\x0eI`\xf5\x8d7\xd2F\xf6P\
-s\xfc\xf1\x07\x0c\xf8\x9b\x10\xfc\xcb\x09\xfcd\xf9\x11\xfc\
-\xd3\xc6\x8eM\x08\x00k\xa5\xbf\xce\xe2\x0b\x80\xf7$\x02\
-\x90\x17\x0cY*5\xa0\x88\x0d\xf8&\x0e\xbe\xf0M\x12\
-\xdc\x8eBb\xd9\xbb\xc5u\xd0\x0e\xd3\xceA\x96U\x0e\
-\xfaJ@1\x15(=\x8dT\x1b\x82\xc4\x1f\x97\x84\xc3\
-ea\xb4\xe8.\xf8\x93V\xdb\x09\x00\x08($\xba\xa5\
-K\xd7I@\x1b\x90\x81?UR\xf0\xfa\x8c\x8fL\x82\
-\x1fE0\x0d-\x1e}\xd7\x9e\x96\x16X}\xfd\xf7\xe0\
-\xd0;\xee\x80\xea\xe3\x8e?\x00\xc0\xbf\x0aV\x5c\xfe-\
-&u\xabF\x8f\x86\xe9\xe3\xc6%[\xe3T-\xbe$\
-\xa0'}\x9d{\x9f\xe5'# \x82Z\xf2\x19\xe9\xfb\
-\x15\xfd,\x13\xde/d\xbf\x12v\x1fvI\x03\x09 \
-'F\x00\xa3\x15\x18\x05?Y\x80t\x1a\x82\xb0[~\
-0X\x12&\xdf\xc6)\xfa\xb1\xdc\x0e\xc0|\x9e^\x04\
-\xbb\xca\x1f7\xf5\xeb\x15\xad\xac-\x15)\xa8\xde\xcf\xf7\
-\xca\x97l\xa0\x09\x92\xd7-\xb1\xb56\xff\x9a\xfb9\xfe\
-=\xee\xdfN#K\xf1{\xa7\xa2\xe5\xabF\x10\x90\x0f\
-\xb8\xe6\xfa\xeb\xa1\xfe\xd5W\xf7{\xf0\xaf\xbc\xdc\xb1\xfc\
-\x04\xfe\x09\x13\xe2\xe3\xaa\x1cw\xdd\x18\x0bc\xad\xbbv\
-I\xd7O\xf6\xbd\x92\xcfz\xce\x9fT\xe7\xa1d\xfe[\
-\x92\xf9\x9f@\x04\x88\xafPL-\x17\x81~}\xce\xa0\
-\x04\x01\x93\x17\x01!\x01\xe4 \x01\xb8K\x7f\x93\xe4\x94\
-i0\x8e\xfb\xdb2\x01\xbfA\x8c\xc0\xcf{}+\x05\
-CW\xc0+MH\xb7ih\x01\xe9\xaf\xba\xe6fX\
-\xfd\x9dka\xfe]wA\xe5\xc7\x8f\xde\xef\xc0\xdfL\
-\xe0\xff\xf6\xe5\x0c\xfcUee0m\xe2D\xa9\xb4\xe7\
-\x8b\xc7\xa4e\xbc\xa2*0\xb5\xf8\xaa\x18\x80\x89\xf4\x97\
-}F\xa3\x12,\xd9\xff\x0d\xf2n\xd6\xee\x1cR*\x01\
-\xa1\xe3U\x98\x02\x8a\x96U\xec\x03\xf4\xcat`\xc0'\
-\xf8\x93\xe2\x009\x81\x00z\x01\xe1\xe4\xa8\xadO\xf0K\
--\xbf\x8aA\x0d\x14\x81o\xd6VX\x00K\xa5\x14\xf8\
-\xd7$V\xc5RY\x1b\xf7u\xf7\xf3\xce\xe3\xa9h\x09\
-\xab\x11\x14\x94Ay\xe7\xbb\xdf\x85\xc67\xde\xd8\xef\xc0\
-\xbf\xea\x8ao\xb3\xc0XUy9L\x9f4)q\x8c\
-\x14\xf7\xe28IU\x81\xdb&<\x95kd\xa2\x00}\
-\xce+\xcb\x87\xc5W~\xb7\x88\x07.X\x18$\x02\xd8\
-\xab\x00LR\xf8i+\x00e\x8a\x01\xff\xc8\xa3\x13\xb2\
-\xc5\xf6\xc6|%\x9f&\x0f\xaf\x05\xbf\xc7\xf3\xc6\x03\xec\
-\xe7y\x83\xf8\xc0`,\x1e\xa2\xdb\x14\xb2\x88\xf8w}\
-S\x13\xac\xb9\xf6\x1a8\xe4\xee\xbb\xa1|\xf1Q\xfb>\
-\xf8\xdf^\x05\xab\xaf\xb8\x82\x05\x7f\x09\xfcS'MJ\
-H\xf5%\x14\x89)\x22\xffF\x8b{L\x14\x81A\x09\
-p\x92\x1a\x90d\x0ad{q[\x0a%\x10\xff\x7fU\
-\xff\xa7\xcc\xf7\x17R\xa1\xf1\x80\xa1\xbb[\x96:;'\
-\x8b\x05\xd8\x99\x8e\x01\x00W\x03\x90\x17\xe4*\xf8\xb4r\
-\xda\x04\xfc\xb2\xa0Y\xaa,*\xb3\x10^\xcfk\xac\xbe\
-\x97\x9f\xa8\xf4/E+\xa6\xb1t\x04\x0e\x02\x09\xc5\x04\
-\xd6\xa2\x12hZ\xb6l\x9f\x06\x7f\x0b\x82\x7f\x8d\x0b\xfe\
-\x8a\x0a\x98z\xd0A\x89\xbf=\x0d\x8b\xef5\xde~\xe2\
-;Z5 \xd9RM\xf7\xbc\xa9z\xb5|\x1aA~\
--\x0d\xb9\xdd\xa5\xb9\xb9\xa3\xd2\xbd>!\x03k\xaf\x95\
-\x13T\xd6@;\xb5\x88u\xd0F\x81=\xbf\xe0W\xe5\
-\xfe5\xc1\x97\x94b\x09&q\x03E@\xd3\xa8v@\
-\xf6:\xaf\x04&Of\xf7\x0d\x8d\x8d\xb0\x16\x95\xc0\xbc\
-\xbb\xee\x86\xd1\x8b\x16\xed\x83\xe0\x7f\x1b\xde\xb9r/\xf8\
-\xa7L\x99\x92h\xf1Dk\xad\x8a\x05\xc8r\xf6&9\
-}Q1\x08\xaf%m\xc8\xc1g\x04\xd2\xa8\x01\x90Z\
-w\xd1\xcf\x97\xc4\x0f\x922\x05\xfc\x98\xa8\x1b\x94\xa4\xd5\
-\x0f \x9d\xed\xc1!\xae\x00\xb8\x8e\xab\x09\xb2_\x06r\
-/\x1f>U\xf0{='Xr\xa5\x05\xd0=/\xf1\
-/}Y \xc1\xca\x81&\xe2=\x15\xc1RYY\xc9\
-|\xe6w\xbf\xfb\x1dhY\xb9b\x9f\x03\xff\xda\xab\xae\
-d\xe7_YU\x05S\xa6M\xd3fFt\x16\x1fT\
-\xef1U`^1\x00\x9d\xd2\xf3\x987Fs\xcf\xc3\
-\xad\xb4\x14\xf52I\xdf\xcb\x91\x09\xa9\xee\xdc@ \xcf\
- V\x97\x91B \xb3<\xa3j\xb5\x1c\xff\xc3u\x16\
-\xd7#\x10\xa8\xb5\xf0\x06.\x82\xd2\xa7\xf7\xfb\xbc.\xa8\
-\x99FF@T\x04SP.\xd3_\x0d\x0d\x0d\xf0\xee\
-5\xd7\xc0a\x0f>\x08\x05\x93\x0f\xcaz\xf0S\x94\xff\
-]\x02?\xde\x13\x891\xf0\xcb\x16\x82i:B+-\
-\xbeA]\xbf\xec\xf3\xda\x18\x80lA\x91\xe2y]6\
-\xc0Ve\x1bRQ\x0d\x5cM\x89-\xce)\xa7\xa9.\
-J\xef\x1cC\xdcf,\x08\xe8A\x15V\xf2\x1a|M\
-\xf0\xcfWT?\x13\xe07d_\xbf\xc1Bm!\x93\
-\x86\x10t\x0b\x87\xe8\xd6\xdd\xd3\x03\x8d\xe8\x06\xd0\xadj\
-\xe9)\x90?ir\xd6nD*\xce\x83\xdc\xeaj\xe8\
-\xfe\xe8#\xa0%\xeb\x03\x91\x08\x84\x9c\x0d;\xa5\x0bw\
-Tu\xfb\x9a\xf7%\xa4\x0aM\x17\xf8h\x0a\x86T\xeb\
-\x0cR\x92\xfe\xfc\x027\x89\xf4\x17\xe5\xbe\x8eDt\xc5\
-m\x1a\xa0\x1b\xab\x81\xc0`\x5c\xfc$\xd9\xae\xb3\xae\x99\
-\x02\xbfL\x96\xfb\x91\xfc\xdcV\xd9F\xdf\xab\x0b\x1ey\
-\xa4\x9f\x12\xdc\x00\x85\xf4%\xf0\xaf[\xbb\x96M\x821\
-g\x9d\x0d\xd3\xbe\xf3\x9d}F\xfe\xd3\xa2\x97y\xf7\xdd\
-\x0f\x05\x13'B{k+l\xda\xb0\x81\x91\x80\x18\xf4\
-\xb3\x0c\xc6\x01<\x02~\xba\xb1\xb6<\x8a\xbd@\x16\xc4\
-\xe3\xcf\xd1\x8fK\xe0\xf5\xbd~\xe6\xb5h($\xee@\
-4\x1a\x85\xdeH\xa4/U\xdf?]\x02\x883\xcc\x80\
-mw\xf6\xd3.\xc0\xfc\xe0qY\x01\xe5\x0f7\xb4\xe8\
-\xa6\xe0\xb7|\xd4\x03(\xa3\xba^\xd5}\xe2\xf3\x8a\xaa\
-@#\xe0k&{\x0f\x82\xff}\x07\xfc5g\x9d\x05\
-S\xae\xbd6\x9ef\xddW\x0eZ\xba:\xf7\xde\xfb \
-\x7f\xfcxhoi\x81\xcdH\x02\x11g\xab.\x1d\xc8\
-ud`B\x04\xaa\xea\xbf$#\xa0\xa9\x1a\xb4|\xce\
-\x9b\xb4\xe6\xa2\xa1\x11\x14\xb1@\x040\x10\x8d\xf6\xa7K\
-\xd6\x814\xc0/|S \xc9\x97\xb7T\xb2\xc5$h\
-\xa2\x22\x8fL\x15\x08q\x80\xf6\xa3&\xb4\xc1?\xd9\x04\
-\xe5'\xb7\xae|\xd5\xb9\xefv\xc1\x8f\xb7\xea\xb3\xcfF\
-\xf0\xef;\x96_\xbc\x85\xd1\xff\x9f{\xff\xcf\x91\x04&\
-0\x12\xd8\xf2\xc1\x07l\xa5\x9bW\x01\x90\x94\x0c\xc4 \
-*\xff\xba\x8a`\xbd\x82\x81\xa6V\xdbc\xae\xa4\xe4\x8a\
-Rl@\xb0\xfa\xb6a1\x9c\xe5\x10@\xdf0\x11@\
-b\xc0'\x1a\xedp\x15\x00\xcf\x92\x96D\xc6\x18\x01\xd8\
-p\xf0\x94\xf2^\xc6\xec\xa9\xaa\x01\x99\xd5WY\x18\xd3\
-J3\xd9\xda\x00N\xf6\xaf\x7f\xe7\x1df\xf9\xab\xcf<\
-\x0b\x0e\xba\xfa\x9a}\xce\xf2\xcb\x94\xc0\xec\xfb\xef\x83\xbc\
-1c\xa0\xad\xb9\x196\xaf_\x0f\x11\xd7\xb7\xf5\xca\xf9\
-\xcb\xe4\xbd\xa1\xcc\xb7d\xee\x9c\xca\xea\xeb\xe6\x8c_\xab\
-/q!\x8c\xe7\xb1\x18OS)\x06\xfc\xfe\x08\xbaT\
-]\x03\x03\xbd\xc3A\x006\x1f\xab@Q\xd7Ol\x94\
-d\x19%q\x01\xad\x04\xf2z_\x9a\xcfy\xaa\x01\xbf\
-\x85D\xbc\x15R-\x1a\xd2\xa4\xabDb \xd9\xff\xc1\
-\x9a5\x0c\xfcU\x08\xfe\xc9\xd7\x5c\xb3\xdf\x94\x01\x87+\
-*a\xf6}\xf73\x12hoj\x82\xad\x1c\x09x\x16\
-\x00\xc9T\x81\xecu\xdd\x22\x1f\x95_\xef\x05n\x0f\xab\
-o\x09\x96\x5cg\xb9}\x91\x80\x88\x1f\xde\xb5\xde\xab\xb4\
-\xa3\x99\xb86\xe9*\x00\x1b\xd1\xdf\xda\xdf\xd7\x17\xebz\
-\x22\x0e\x98\xae\xba\xc9\xc4\xbfOG\x0d\xf8%\x04E\x00\
-P&\x03\xb5+\x09\x15\xa4\xa0\xab\x04d\xe0_\xbd\x9a\
-\x81\xbf\xf2\xcc3a\xd2\xd5W\xef\xf3\x96?I\x09T\
-U\xc1\xcc{\xefc\xd9\x81\xb6\xc6F\xd8\xfa\xfe\xfb\xb1\
-\xf6X\x9a\xaaHY\xa5\xa0\xae\xce\xc23.c*\xe9\
-\xbd\x02\x81\x99\x04\xbc\xdf`!\x9eW\x7fl\xe9}\x1b\
-d`+\xd7\xb4]\x80\x9eH\xa4\xa5\x97\x08\xc0\xb5\x88\
-\xe2\xe0qu\xcc^\xf2\xc6\xe6\x97?\xa6\xeb\x0a\xa4J\
-\x08\x06\x93\xc3S\x0d\x08\xdf\xa1\x0b\x5c\xf5vw\xc3\x06\
-\x02?\xde*\xd1\xf2O\xbaz\xff\xb1\xfcIJ\x00\xc1\
-?\xf3\xe7?G\x12\xa8aJ`\x1b*\x01[A\x02\
-\xbe2)\xaa1\xf7k\xf5\xc5\xef\xf0;\xf7\xfc\x14\x07\
-y5\xa9\x11\x0e\xda\x13\x83\x8c,\x9d\xff@l\xe9}\
-\x87\xa0\xca\x07\x8d\x00\xb4_\xde\xd9\xdf\xdf\xdcG\xfb\x01\
-\xd2\xc5pN\xd0\xd2\xb8\x01~Y2e\xd6\xf4\xe1\xbb\
-\xf9\xae\xf3VM\x14\xd3\xb5\xe7\xce\x18\x11\xf8\xc9\xf2\x13\
-\x08*\xce8\x03&\x5cu\xd5~g\xf9\x93\x94@e\
-\x15L\xbf\xe7\x1e\x16\x1bhmh`J\xc0\xed\x1am\
-y\xf8\xf9\xba\xf1\x04\x93*N\xbf\xc4>D\xf3M4\
-\x82\x96J\x91\xd09\x86B\x8c\x00P\xff\xb7i\xf0i\
-\x9b\x12C \x05\xff?\xe1\xef\xd6\xbe\xbe\xd6\xbe\xfe\xfe\
-X\xf7_\x05\xeb\xf2\x04`\xeb\x22\xa1\x1e\x83\xe5\xfbs\
-\xfc\xc0\xa5r\x81\xb8\xcf\x9a^t\xd3\xc0T\x0fY\xfe\
-\xb7\xdff\xb2\x9f\xc0?\xfe\xaa\xab\xf76\x8a\xdc\xcf\x8f\
-\x9c1c`\xfa}\xf7C\x18I\xa0\x0dI`\xdb{\
-\xef\xc5\x1cZ]\x9aT\xc8\x00\x98.\xe6\x01\xaf\xc5<\
-*\xd7\xce\x04\xf0\xc2\xe7\xad\xc14j\xd4u\xd8q\xb3\
-\xfbh\xa3P\xdbn\xf10\xd4v\xba\x0a\xc0\xd6\xb0J\
-\xfc\xef\xdeH\xa4?\x12\x8dvG8\x89\xe2[\x82\xeb\
-r\x8dn\x8a\xc4\xb0o\x801!\xa4\xfaY\x0f\xcb\xa2\
-LM\xf1\x01?\x04\xffF\x07\xfc\xe5\x04\xfe+\xafJ\
-X\xef} \x1c\xe1\x9a\x1a\x98\xf6\xb3{\xf6\x92\xc0\xbb\
-\xef&\x06\xd3LV\xfc\xa9R\xae>\xaf\x99\xf1<H\
-\x11\xf0\xba\x16r\xb6$\xb7\xee\x02,\xee\xfb\xd3\xffG\
-K\xee\x89\x04\xd0\xd0\xf6R\xb7l\xdbnT`\xd4\xce\
-\xa4\x0b`\x9b\xc8\x0c\xbc5\x12+\x91\x0a\x00\x87\x04\x02\
-b]\x00_\xe3,+\xf9\xf4\x0a\x04f:S\x90\xea\
-\xc5T\xa4y\xa4\xcfK\x02\x82=]]\xf0\xe1\xaaU\
-q\xf0\x8fC\xf0\x1f(\x96?I\x09\x8c\x1b\x07S\x1c\
-\x12hG\x12\xf8\x88H\x80\xaf)Ie\xa1\x8fWE\
-\xa7_%\x98\x86\xd1\xb05ApY\xc3XK\xe6\x0e\
-\xf0$A\xd8\xc2\x83bn\xe8\x06\xd4\xa7\x0a\xfaL\xb8\
-\x00\x09\xf7\x03\xb6\xbd\xb3\xab\xb77~\x82\xd2\xa2\x1f\x0f\
-\xa0\xfbr\x052\x98:\xb4$r\xceJ\xa7\xe6@|\
-\x9e#\x06\x02\xff&\xb2\xfcx+C\xf0\x8f\xbd\xe2\xca\
-\x03\xce\xf2')\x81\xb1ca\xf2\xdd?\x81\x9c\xf2r\
-h\xab\xaf\x87\xed\xe8\x0e$\x14\x96y\x11\x81b\xac\xbd\
-\xea9<\xf3\xf8\x0a\xd7/e\xab/1v\x96\xa1\xaa\
-\x0d\xb8\xf15\xe7\xe8\xec\xe8\xa0\x22\xa0]2\x97\xdc\xe3\
-\xef\x8c\xd5\x01\xf0\xccc\xa3\x0b\xb0\xa7\x07e\x09\xb8\x1b\
- p)A1O*\x8b\xfa{\x95@j}\xa8T\
-*\x06\xfd\xa8\x03/B0,\x16\xa2\x80\xdff\xc7\xf2\
-\x8f>\xfdt\x18\x83\xe0?P-\xbfx\x84'L\x80\
-\xc9?\xf9)\xe4\x94\x95A[]\x1dS\x02\x96{]\
-eq\x00E\xe0OG\xc6&\x807\xb5\xf2V*y\
-}\x05\x0eL\xfd\xff8\x01\xe4\xe4@Wg'\xf4\x0c\
-\x0c\xec\x12\x86qP\x5c\x00\x90\xfc'I\xac\x82rd\
-\x17U\xb1\x05h\xe3D\xe7D\xc9_\xb1}\xe4\xf6S\
-\xcd\xa7z\xae\xafV\xa4tRr\x17\xfc\xd6\x118\x9f\
-\xebC\xcb\xbfy\xe5\xca\x18\xf8OC\xf0\x7f\xfb\x8a\x03\
-\xde\xf2')\x81\xf1\xe3a\xe2\x8f\xefb$\xd0\xee\x90\
-\x80r!\x90\xb8\xe6B\x96}1\xe9\x04\x94F\xe4\xdf\
-\xfd>\xdbk-\x8b\xca=05\x86\xae\x1a\x22\x5cQ\
-\xa0\x1d\x8f.\x9cO\xed\xfd\xfd\xb5\x1en\xba\x11\x19\xa4\
-\xe2\x02$)\x80^$\x80Nd%\x0aP\xb8\xd6?\
-)\xf7\xafZL\xe01\x10\xe9FT3ZD$\xab\
-s\xf0XHD\xe0\xdf\x84\xe0\xa7\x14X)\x82\xbf\x9a\
-\xdac\x8dX}\xb9\x12\x984\x09& \x09\x04KJ\
-\xa0m\xcf\x1e\xf8\x88\xca\xa2S\xb1\xfa^$-\xcbT\
-ej\x8e\x18,\xee\xf1\x95-p\x7f#m\x0f\xe6(\
-\xecn\x9cS{\xba\xbav\xab\x5cr?\x19\x01\xd3 \
-\xa0\xec\xef\xf8\x81rd7\x9d\x14\xc9\x13vH\xd2+\
-\x9e\x03&4b\xc8\x04\xb0\xd3ew#\x0b\xa2\x08\x08\
-\xd2\xd1\xeb\x80\x9fn\xa5(\xfb\xab\xbf\xfd\xed\x11k\xef\
-\xa5\x04&N\x84\x09w\xdd\x05\xa1\xd2R\xa6\x04\xb6\x13\
-\x09\xc8\xe2\x00^\xeb1d\xe9:?\xd77\xcd\xf9\xa3\
-\x22\x01\xdbc\xef\x00\xd1PZn\xf0\x8f\x02\xeb\x88\xad\
-\xde\x81\x01ZU\xb9{\xc0\xb6#\x12\x0e\x85\xc1p\x01\
-@\xe3c\xb0\xc7{\xba\xbb\xb7\xb4\xb7\xb7\xc7\xc0\xefJ\
-\x15\xd5j:\x83J?U\x80\xcf\x1e\x82\x22\xa2LU\
-\x0f\xf6:\xb2\x9f\x1a?\x94\x9cv\x1aT]\xfe\xed\x11\
-+o\xaa\x04&\x1f\x04\xe3\x7f\xfcc\x08\xa1\x12hG\
-%\xb0\xc3%\x01U\xde_U\xa2\x9dNU_\x1a\xc5\
-<\xc6\x87d\xc1\x9c\xcd\xcfsn\x1d\x00\xdbX\x14q\
-\xd5\x89\xae6\x82\x7f\xab\x01\xf8\x8dT@ \xc5\xc8\x7f\
-\xc2\x7f\xda\xda\xd7\xd7\xde\xdb\xd7\xd7@\x9b\x83\x12K\x11\
-\x01\x04$n\x80\x97\xcfd\xcb\xd2%\x19\x8c\x03x~\
-\x8fX\xdc\xe13m\xe4~\x9e\xc0\xbfe\xc5\x8a\x18\xf8\
-OE\xf0\x7f\xeb\xf2\x11\xeb\xeeW\x09L\x9a\x0cc\xef\
-\xb8#N\x02;i\x89\xb4W\x9aU\xb5H\xcbOA\
-\x8f\xe4\x9a\xab\xbe+U\xff_7w\x93R\x88N\xf5\
-\x1f\xc3\x14b\xab\x0d\x0dm_$\xb2Q\x03~_A\
-A?\x85@*\x12`\x07\xb2\xd2&b'\xc6T\x14\
-\x04\xa4\x9a\x00\x95\xe5\xe7,\xbcm\x90\x05\xb0\xf9\xce\xaa\
-\x99fq\x13\xa0\x8b\x93C3A\x08\xfc[\x1d\xf0\x17\
-#\xf8+.\xbf|\xc4\xaa\xa7\xaa\x04\xa6L\x851H\
-\x02\xc1Q\xa3\xa0}\xf7n\xd8\x85J@\xdb\x9c\xc5\x0b\
-\xb8\xfc\xf53]\x10\xe4\xa3ND[\x13\xa0\x08\x88\xdb\
-\xb2\xf48O\x08\x5cf-\x10\x0eC[k+\xad\xbf\
-\xf9P3l0X.\x80\xf6\xe8GVj\xa3@ \
-m\xfd\xed\xec\x89n;\x83g\x1b\xac\x7f6\xc9\xa5Z\
-\x1e,\x9c\x12\xf8S\x8d\x0b\xf0\x8b\x9f8\xf0o[\xbe\
-\xdc\x01\xff\xa9P\xf1\xado\x8dX\xf3t\x95\xc0AS\
-`\xcc\xed\xb7\xef%\x01T\x02\xbek\xfc\x0dc\x00\xe9\
-\xce\x13\xdb4%mZ\xc3\xe2\xb8\x00d\xfd\x83\xa4\xac\
-\x11W\xadH\x00\xa8\xb87\x19rh\xca\x04\xa0\x93\x10\
-\xb2\xff(\xda50\xf0AKK\x0b;\xd1\x00\xef\x02\
-\xe8\x06\x9bW\x02\x82*P\xc9|m\x1c\xc0oG\xa0\
-L\x05\x83\x9cU}\xdbV\xc4Zw\x17\xa1\xe5/\xfb\
-V\xf6[\xfe\x08\x12v\xedu\xdf\x85\xee5k\xb2\xbb\
-bp\xdat\xa8\xbe\xfd\x0e\x08\x14\x15A\x9b\xa3\x04t\
-\xaa-\xd5\x1a\x7f\xed\xb5\xf7c,R\xac]I\x22\x08\
-\xce\xc8\x10\xf8)\x06\xd0\xd1\xd6\x06;::\xb6j\xc0\
-n\x0f\xb6\x02\x90\x12Aco\xef\xfb-\xcd\xcd`\x91\
-\x02 7\xc0\x89\x05X\x8aU\x81\xb6\x0fK\x9fJ\xba\
-/U\xf0\xa7\x12(\xa2T\xdfG\x8e\xe5\x1fu\xca\xa9\
-P~\xd9\xb7\xb2^_G;:\xa1\xee\xfa\xefA/\
-Z\xd4\xfa[o\x81\x9eUog\xf5\xf9\x86\xa7NC\
-\x12\xb8\x13\x82\x85\x85L\x09\xecv\x02\x83V&\xeb\xf4\
-\xbd\xe6\x12\xf7\xdd\xb6GU\xabT\xadz\x14\x05%\xb9\
-\xbbN\xfe\x9f\x145a\xaa\x1d\x8d\x0c*\xed\xf7#\xb6\
-=\xe04\x04\xb15\xc1\xc0A\xad\x03\x88[~\xf7D\
-vuv\xee\xec\xe8\xe8h\xa2&e\xe4\x06\xc43\x02\
-\x12v\xd4e\x01l\x85D\xb2\xb9\xdai+\x9dh\xff\
- \x82\xbf\xe8\x94S`\xf4e\x97\x81\x9d\xe5\xff\x22\xed\
-mP\x7f\xc3\xf7\xa0\xff\xc3\x0f\xa1\xa0\xa2\x02\xa0\xaf\x0f\
-\x1an\xfb>t\xaf\x5c\x91\xd5\xe7\x9d3m*T\xde\
-\xf6\xc3\x18\x09\xec\xda\x15#\x814\x0bz\xd2!\x01\xd3\
-\xcf\xd8\x1e\x01\xbf$5\xec~\xc6\x91\xffd\xf9\x09O\
-\xa4\xb0{\xa3\xd1\xb5\x99\x90\xfe\xe9T\x02\xda*\x22\xe8\
-\xc7\x93k\xee\xe8\x88\x81\x9f_\x1e\xccIw[\xf2\xa3\
-\xb5\x8b&<\xba\xa8Z~\xf6\x1fH\xa3$\xd8\x92\x04\
-\x90\xfa\x91\x91\xb7\xf3\xe0\xff\xe6>`\xf9\xdb\xda\xa1\xe1\
-\xa6\x1b\xe3\xe0\x1f\x7f\xec\xb10z\xeaTF\x02M\xb7\
-\xfd\x00zV\xac\xccn%0}\x06T\xdc\xfa\x03F\
-\x02\x1dH\x02\xb5\x5c\x8a\xd0Rdv,I\x94\xdf\xca\
-@\x09\xb0\xe8\xff\x1b\xed;![\x1a\xaf\x98\xcf\x96S\
-\x02\xcc*l\xf3\xf2\xa0\xa9\xb1\x11\xba\xfa\xfb\xd7\x1a\x80\
-\x7f\xd0\xd6\x02h/Ow$\xb2\xa6\x19Y\x8a\x14@\
-\x90\x02\x81\xe4\x0a\xc86\x0e\x95Y|\x95\x8c\xe2\x07G\
-\x12/H\x17\xec&+\xfed\xef\xe9G\xcb\xbf}\xd9\
-2\x06\xfeB\x04\x7f\xc97\xf7\x0d\xcb\xdfx\xe3\xf50\
-\xe0\x80\x7f\xc2\xf1\xc7Cx\xd4(\x18{\xcc10z\
-\xfat\x80\x81\x01h\xfe\xe1\x0f\xa0\xfb\xad7\xb3[\x09\
-\xcc\x9a\x09e\xb7~\x9f\x81\xa2c\xe7N\xd8#\xd4\x09\
-\xa4\x14\x030L\xf9z\xa5\xff,\x83\x9c\xbfQ\xefL\
-\xe7\xfc)\x9eFX\x227\xa0\xb1\xbe\x1evwu\xad\
-\xe1\x94w\xd40\x1d\x98\xf6r`\x1d\xf8\xe3'\xd3\xda\
-\xdb\xfbnSC\x03\xbb0\x01'h\x01\xb2\xd2`\x85\
-\xe5\xe6\xfd\x1f\x93\x05A&~\x97\xae1\x84I=\xbf\
-\x12\xfch\xf9\xe9V\x80>\x7f\xc9\xa5\x97e\xbf\xe5o\
-i\x85\xa6\x1b\xd1\xf2o\xd9\x02\xf9UU0\xfe\xc4\x13\
-!TT\x14\xffMc\x8e>\x1aJg\xcc\x00;\x12\
-\x81\x96\x1f\xff\x08z\xdez+\xbb\x95\xc0\xccYP\xf6\
-\x83\x1f\x82\x95\x9f\xcf\xdc\x81:g\xed@\xdaR\xdf \
-\x9d\xa8\x9b#\xbe\xfc\x7f\xe19[P\xbeLE;\xe0\
-\xefFr\xee\xec\xea\xda\xd9\xd0\xd3\xd3\xa0\xf1\xffmM\
-\xe0>m\x17\xc0S\x05lmo\x8f\x05\x02I\xb28\
-\x81\x8b\xb8+\xc0\xe7\xfde\xf9O\xa1\xf9\x87\x11\xf3j\
-\x5c\x01\xcb\x1a\x9cRb\x02\xff\x0eG\xf6\x17,]\x0a\
-\xc5\x97^\x9a\xfd\x96\xbf\xb5\x05\x9an\xb9\x19\x06\xb6l\
-\x86\x02\x02\xff\x09'@\x08%\xb4X\x003\x86\x94\x00\
-\x92\x00)\x81V$\x81\xee\xd7_\xcd~%p\xcb\xad\
-l\xae\xb5\xef\xd8\x01\xf5T,\x94\x81\xf2^\xdf\xdd\xa9\
-\xbc\x16\xfd\x18\x14\x05\xf1\x05@\xf1\xf9\xef\xf8\xfe\x14X\
-omo\xa7\xf6\xdb\xefq\xe0\x8fz\x00\x7fP:\x02\
-\x89\xf2\x82\x97\x22Q\x8aN\xf6\x0e\x0c\xbc\xd9De\xc1\
-n \x90k\x0c\xa2\x02\xbd*\x8d\xa2\x0b\x9e\xe86Q\
-0I\x07\x82_u\xe0\x80\x7f\xa7#\xfb\x0bNF\xf0\
-\x7f\xe3\x9b\xd9o\xf9[[\xa1\xe5\x86\xeb!\xe2\x82\x7f\
-\xc9\x12\xc8A\xcbo\xf1\xbd\xf6\xb8\x83'\x81\xf6\x9f\xfe\
-\x14z_{-\xab\x7f_\xce\xec90\xfa\xfb?P\
-\x92@ZU\xa1\x1eK\xd8\xd3\x99w\xb6\xac?\x00\xff\
-\x98|\x7fJ\xa7\x93!E,\xd5\xd5\xd6BG\x7f\xff\
-\x9b\x82\xf4\x8f\x1a\x10\xc1\xa0\xac\x05P\xba\x02\x9d\x03\x03\
-\xaf\xef\xa9\xab\x83\xa0\xe3\x06\xb8\xd9\x00\xe5\xce@\x021\
-\xa8\x82)&\xcf\xd9\xe9,)\xf6x<\x80\xe0\xdfE\
-\x96\x1f\xff\xbb|\x94\xfdE\xfb\x82\xe5on\x8a\x81\x7f\
-\xfbv(\x1c3\x06\xc6\x9dt\x12\x84\x0a\x0a\xa4K\x96\
-\xf9\xa3\xe6\xd8c\xa1t\xe6LF\x02m?\xb9\x1bz\
-^\x7f-\xab\x7fgh\xf6l(\xb9\xe5\x166\xdf:\
-\x90\x04\x1a\xdc\xb2aY\x05\xa7f}@*\xaa\xd1s\
-%\xabN\xed\xaa\xe6\xbb\x13\xfd\x0f\xb8J\x1a\xb1\xb4\x07\
-\xdd\x9c\x8f::\xde\xd4\xf8\xff)\xa9\x80\x80\xcf\x00\xa0\
-h\xfd\x93\x94\xc0\xee\xae\xae\xd7\xe9d\x19\x0185\x01\
-,\x95\xc1\xef\x18$+\xf8\x11\xd4\x80J:I\xa3\xac\
-\xe9\xba\x02\x1a\xdf\x91\x1eS\xb4\xbfv\xd5*f\xf9\xf3\
-\xd1\xf2\x17}\xfd\x92\xec\xb7\xfc\xe8\x8a\xb5\xdd|\x13D\
-\x11\xfc\x05\x08\xfe\xb1\xe4\xf3\x13\xf8e\x9bLH\x0eF\
-\x02\x08,+\x1a\x85\x0e$\x81\xde\x7f\xfd;\xbb\x95\xc0\
-\x9c\x83\xa1\xf8f\x8e\x04\xf8\xc0\xa0\x8f\xad\xbe,\xcdZ\
-\x03\xdb \xeb\xe4Y\x19(y\xbf\xcd/\x02\xa2\x97\xdd\
-\xf3C\xec\x04I\xfewvBgw\xf7\xbb-\xbd\xbd\
--\x12\xdc\xe9jt2\xda\x16\x5c\x1b\x00t\x8f\xda\xae\
-\xae\xddm\x9d\x9d[:\xd0z\x84\x88\x04\xdcL\x80S\
-\x13`\xbb?X\xd6\x0fP\x97\xff7\x1c|;\x83\x19\
-\x01\x17\xfc{\xd6\xacA\xff&\x02\xe1O\x1c\x0b\x05\x08\
-\xfe\xac\xaf\xf0kA\xf0\xdft#D\x10\x08\xf9c\xc7\
-\xc2X\xb4\xfc\x946K\x92\xfd|\xa5\x99\xe4`$0\
-g\x0e+\xc9\xed\xb8\xff^\xe8}\xe5\xdfY\xfd\xbbC\
-s\x0f\x86\xa2\xebo`\xee'e\x07\x1a\x9c\xb2a\xbf\
-\xfbG\x0c\xc6c[5wE\x92p\x08\xc0r\xc0O\
-\xd6\xbf\x1e\x15u\xf7\xc0\xc0\x1b\x12\xbc\xa9b\x010\x1c\
-.@\x9c\x10z\xf0d\x1b\x9a\x9a\xd8\xc9S\x14\x93\x1d\
-\xd4!H\xd6#P\xb2(\xc8\xe6\xf7z\x97I\x7f\x93\
-\xa0J\x06\x94\xc2@O\x0f4\xbc\xfb.D{{!\
-\xbcp\x11\x14Q\x85\x9f\xbbo{\x96\x1e\xd1\xc6\x06\xe8\
-\xb8\xf1F\x88\x22\x00\x0a\x11\xfc\xe3N>\x99Y~\xd5\
-\xce8^G\xb5C\x02\xa4\x04:\xef\xbb\x17\xfa^\xfa\
-gV\xff\xfe\x9cC\xe6C\xd1u\xd73%\xd0\xe9\xb8\
-\x03\x19'\x01\x1f\xca\xd4\xe6\x95\xad\xf0\x1e\xa9k\xe0\xe6\
-\xfe\x9d\xe8\xbf+\xff\x9bz{\x97\xc9\x0cn\xban@\
-:{\x03*U\x00\x9e\xec\xab\xbbq\xf0\x03\xf9\xf9\xcc\
-\x15\xb0\xb8NA\xe2\xe2\x1f]\x94\xd4\x96\xd4\x00\x88\xb5\
-\x03&\xb1\x80T|\xbb\x08U\xc7\xbd\xf7\x1e\xf3\xfds\
-\xe6\xcd\x83\xc2k\xaee+\x1c\xb3\xda\xf275B\x07\
-\xfa\xc2\xd1]\x08\xfeq\xe3`\x0c\x82?\x88\xd7@\x0b\
-|I\x0c@<x\x12\xe8\xfa\xe5/\xa0\xf7\xe5\x97\xb2\
-[\x09\xcc\x9f\x0f\x85\xdf\xb9.N\x02\x8d\xd4c\xd0\x80\
-\x04\xfc\xa6\x99u\xfd*\x93R\xdabk{\xb1\xea\xcf\
-%\x0ag\xf5\x1f\xad\xa9!\xec\xf4\xe1\xd3M\x0d\x0du\
-\x9b\xdb\xda\xde\xd7\x00?\x9a\xca:\x80T\xeb\x00@\x07\
-~:>lm]\xdbP__\xd7G\x1dM\xdd`\
-\xa0K\x02\x82\x1b S\x02\x96\xc7\xe0\x9a\xa6`<\x1b\
-\x8a\xaa.\x1e\xca\xfd\xa6u\xeb`\xa0\xa3\x03B3g\
-B!\xcaJ\x08\x05\xb3Z\xf8\xdb\x08\xfe\xae\x9bn\x02\
-\x1b\xc1_@\xe0_\xbat/\xf8\x15\xfb\x14\xa82\x01\
-I\x07\x91\xc0\xf1\xc7C\xe9\xdc\xb9\x8c\x04z\xfe\xf3\xe7\
-\xd0\xff\xcf\x7fd\xf5x\x84\x0e;\x14\x0a\xbe\xf3]6\
-\xef:\xb7o\x87&/\x12H\xa3\xd1\x87\xed\xd1\xe7\xd2\
-\x96\xf8\xfb\xca\x82 G\xfe[\x8e\xf5\xdf\x85\xd6\xbfk\
-`\xe0\x9f\x86\xd6\x1f\xfcv\x06\xcax\x16\x80\x0c\x11\x1d\
-x\xd2/\xd7R6\x80T\x00\xfa2\xe0,\x0c\xb2%\
-\xab\x01e}\xd4\x8d\xac\xbc\xcc\x7f\xf2h3n\xf2\xb8\
-y\xfdz\xe8mm\x85\xc0\xc4I\x90\x7f\x03\x82*'\
-\x9c\xd5\xabf\xa3\x8dM\xd0y\xc3\x0d\x10\xad\xdd\x0d\x05\
-\xe3\xc7\xc3\x98SNa\x93\x07D\x90k\x1a\x97j\x0f\
-\xe7\xbdUH\x02\xd5'\x9c\xc0\xc6\xb9\xfb\x97\xbf\x84\xbe\
-\x17^\xc8\xeaq\x09\x1ez\x18\xe4_\xfb\xdd\xd8*:\
-/\x12\xd0\xb8\x02\xb6\xa6\xe7\xbf\xae9\x8d\xadZ\xc5\xaa\
-\x9a\xd7\x5c\xf4\x9f\xac\x7f\x10]\xb7\x9d[\xb7B}O\
-\xcf\xcb\x0e\xaed)\xc0h:m\xc12\x91\x05\x90\xaa\
-\x00<\xe9\x7f\xee\xd8\xb6\x8d\xb9\x01\xec\xa0\xca@>\x1d\
-\xa8\x90K\x96\x986\x11\xa4\x94\xa5I#f\x22X\xd3\
-\xfc\xfe\xfb\xd0C\xd5\x8ceeP\x80\xbe\xb4U\x90\x9f\
-\xdd\x96\xbf\xa1\x1e\xbao\xbc\x1e\xec\xba=P8q\x22\
-\x03?s\xbb\x14\x1bg\x82d\xe5\x9c\xe7\xc1\xbd\xbf\x18\
-U@\xf5\x92%\xec:\xf4\xfe\xea\x01\xe8\xff\xc7\x0b\xd9\
-\xad\x04\x0e_\x80$\xf0\x9d\xb4\x94\x80o\xe5 K\xf3\
-Ir\xff\xb63\xbf\xe3\xc5?n\xfbo\xc7\xfaS\xf5\
-_cC\xc3\xae-{\xe5\x7f\xc4\xc0\xf7\x1f\x94 \xa0\
-\xce\xff\x17\xad?\xbb\xa7\x93nll\xac%\x1f&\xe8\
-\xa6\x03)\xaf\xe9\xb4\x0b\xb7\x15\xach+|&]\xca\
-\xd0K%\x80\xc1g\xe9q\xcb\xc6\x8d\xd0\x8d\xaa%P\
-X\xc8,\xbf5\xba,\xab\xc3\xfdv}\x03t\xdft\
-#\xde\xd7C\xe1\xa4IP\x83\xb2\xdf\xb5\xfc\xaa\xdd\x88\
-U;\xe6*\x0f\x09\x190\x128\xf9\xe4X\xd7\xe3\xff\
-\xf7+\xe8\x7f\xfe\xf9\xac\x1e\xa7\xd0\x82\xc3!\xff\xeak\
-b=\xf5w\xec\x80f\x1f$`K\xdcJ[\xa1Z\
-UAm\xcbc\x1e\xf3\xc5?\x0c#N\xf4\x7f\xf7\xee\
-\xdd$\xff_V\x19YM\x1a0\xa3u\x00\xb6\x07\x11\
-\x88'\x14g\xa9\xce\xfe\xfe\xbf\xed\xa0\x9a\x00\x942\x01\
-'\x18\x08\xdc\xa6!\x96\xc8\x8e\x0ako+Z-\xdb\
->Z1{]\xec\xde\xe6f\xe8\xc2s\xa5s\xcb\xfd\
-\xceu`\xa15\xcd\xe6@W\x94RC7#\xf8Q\
-\xad\x14 \xf8\xab9\xd9\xaf\xdaQG\x96\x02\xf4T\x01\
-\x8axA\xf1\x9c9\x8c\x04\xe8\xd6\xf7\xe0\xff@\xff\xdf\
-\x9e\xcf\xea\xf1\x0a\x1c\xb1\x10ri'&R\x02\x86$\
-\xe0\xa7\x19\xa8\xd45\xe0\xe6\xaf%\x89\x1b\xc4\xdf\xeb\xa6\
-\xfe\x9c\x95\x7f\x94>\xa7\xcc\xcdGh\x90vvv\xfe\
-\xd5u\xab\x0d\xa3\xff\xf6P\xb9\x00\xbal\x00;\xe1m\
-\x1d\x1d\xcfm\xfb\xf0\xc3X6\xc0\x89\x05\xc4\x9b\x84\xf0\
-\xc1@\xc3\x85?\xb6\x225\xa8Z5\xa8\x8c\xdeJ\x8e\
->\xf4\xf9\xe9s\xe1\xcf~\x0e\x02sfg\xb7\xecG\
-\xb9\xdf{\xeb\xcd\x00\x08\xfe\xc2\xc9\x93c\xe0\xa78\x8b\
-\x0c\xf0*\xf9\xaf\x91\xf9\x9e\xefq\x1e\x8fB\x12\xa89\
-\xed46n\xfdH\x02\x03\xcf=\x9b\xd5\xe3\x16\x5c\xb4\
-\x08r/\xffvls\x0d$\x81\xbe\x96\x16\xff\xd5~\
-\xba\xe0\xb4&u\xcd\xb6GW\xc4\xaa\xe2\xcf\xbb\xc1?\
-\xc4\x0a\x95\xd37\xb5\xb4\xac\xde\xd5\xd9\xf9\x91\x04\xfc2\
-\x15\x90\xd2-\xdd\xed\xc1m\xcdIE\xea\xbb\xbb\xf7\xb4\
-\xb6\xb7\xbf\xd5\xd8\xd6\xc6\x08\xc0r\x08\x00\xb8\xc5A\xb2\
-\xcd\x12e\xa5\xc1\xd2\x86 \x02y\xd8\xaa^\x00:\xb2\
-\xe0\x8b/\xe8\x8fH4\xbb\x03~{\xea\xa0\xef\xe6\x9b\
-\xf6\x82\xff\xd4Sc\x0dX\xc4=\xf2\x0c\xe4\xbfg,\
-@\xf5:\xf7\x5c\xd1\xcc\x99P\xed\x90\xc0\xc0o\x1e\x81\
-\x81g\xfe\x9c\xd5\xe3\x178r1\x84\xce8\x83\x9do\
-\x1f\xaa>mY\xaf&\xc8,{l\xcbjZ\xc4\x15\
-\xb0b\xe9/\xd7\xf7\x8f-\xfd%CI\xd6\x7f\xd3&\
-h\xed\xed\xfd\xabhT\x0dT@\xc6\x16\x03\x99\xc4\x01\
-\xa2*\xeb\xef>n\xec\xed}n\xdb\x96-\xac\x12-\
-\xc8\xa7\x04\x85\x15\x82\xb6D>%m\xa2 \xa9\xabV\
-^\x10I]\x80\x8e\xed\xc3\xa5\xa5\xec#\x03\x8f\xff\x11\
-\x22O<\x01\xd9x\xb3kk\xa1\xff\x96\x9b\xc0nj\
-\x82\x82)S\xa0\x8a\xc0O\xe3)\xcbi\xeb\x5c\x01?\
-)@\xc5\xe7\xf8\xef-\x9a5\x0b\xaa\xcf:+6~\
-\xbf\xff-D\x9e~\x1a\xb2\xf5\x16AW\xc5=\xbfp\
-Y\x99\xaf \x1f??U\x95}IsW\xb6\x0d\x98\
-\xfb\xba\x1b\x13 \xb7\x98\xc0O\x91\x7f<\x228\xae\xbb\
-\xb6m\x83\x0f[[\xff\xe5S\xfe\x0fjO\xc0\x94\xdc\
-\x80\x0d--\xaf\xd5\xa2\xdc\x1a\xc0\x1fEKP\x99\x0a\
-p\xf7\x0e\x94\x95\x04\x0b\xbf\xc6\xe2\x97\x10\xcbj\x04\xc4\
-\xc1VT\xfb\xd9\x1e1\x82\xdc\xf2r(_\xb0\x80\x9d\
-K\x84H\xe0\xb1?f\x95\xe9\xb2w\xee\x84\x81\xef\xdf\
-\x02\x80\xe0/D\xf0\xc7e\xbf\x0c\xf4\x0a\xdf\xdfX\xfa\
-\x1b\xb8\x02\x96\xf0\xfd\x85\xd3\xa7C\xcd'?\x19\x1b\xbf\
-\xff\xfd=D\xfe\xf4d\xd6\x99\xff\x81_\xff7D\x1e\
-z\x90\x9dc\xd9\xe1\x87C\x18\xafy\xaa\xbd%T%\
-\xeb\xb6H\x18\xc22\xf8\xa4`\xb43\xbe\xf1\x95\x7f\xa8\
-\x00(\xf7\xdf\xd6\xdd\xfdTw$\xd2\xc5\x11@\xc4@\
-\xfe\xdb\x83\xed\x02\xc8\xdc\x80\xa8\x22\x10\xc8\x8e\x88m\xf7\
-\xa3\x94y\xe8\xa3\x8f>\x8aW\x06\x06\x1c\x12Hp\x05\
-\xc4J)\x19p\x85\xa0\xa0\xa5\xdaa\xc5\xa0\xf4W\xf6\
-\x1a\xedS_v\xc4\x11\xecq\x14'p\xe4\x89\xc7\xb3\
-#\xe0\x87\x13b\xe0\xf6\xdb\x00P\xb2\x16N\x9d\x0aU\
-\xa7\x9f\x1e\xeb\x12+\x03\xbd\x0a\xf0\x1a\x19o\x9c\x06T\
-U\xcf\xb9$0m\x1a\xd4|\xfa\xd3\xb1\xf1C\x02\x8d\
-<\xf5\xa7\xec\xf0\xfe\x07\x06`\xe0\xce\xdb\xc1~\xf1\x1f\
-\xec\xdc\xca\x16.\x84\xfcq\xe3|u\xfb\xe1S\xd5\xba\
-Z\x16e\xf6\x8a\x9b\xbbb1\x10\x93\xff\x8e\xf5'#\
-\xb9y\xdd:\xd8\xd1\xd9\xf9\xb4\x01\xf0\xd3\xda\x13 U\
-\x02\xf0Z\x18\x14\x11H`\x00\xa5\xccS\x9b\xd6\xaf\x07\
-p\xa2\x9b\x01g\x9b#\xd7\x0d\xe0%\x91\xccw\xe2\x07\
-R\x15\x08\xd4\x91\x86W\xf1\x06\xff\xf9\x5c\x22\x01\x9c \
-t\x8b>\xf9\x04D\x9fxlx\x03~;\xb6C\xe4\
-\xb6\xef3\xcbO\xb2\xbf\x92\xc0\xcf\xad\xae\x04A\xaa+\
-\xd3\x7f\x92]q=\x17\x06\x89\xdf-\x0b(\x0a\x7f\x17\
- A\xd5\x9csNl\xfc\x90\x04\x86{\xfc\xa0\xaf\x17\
-\x22\xd7}\x07\xecw\xdea\xe0\xaa<\xf1D\xc8\x1b?\
-\xde;\xa7\xaf\x8a'\xf1F\x86\xb7\x88\xa2\xd4\xe7\x09\x03\
-\xc4\xce_\x9c+\xe0T\xfe1\xeb\x8f\xe7W\x8f\xd7\xb9\
-\xb1\xb9\xf9\x8d\x9d\x9d\x9d[\x05\xeb\xef\xe5\x0a\x00\x0ca\
-!\x90i*\x90\x9dtK__KKW\xd73\xbb\
-\xd0\x87e)A*\x0crH\x80W\x01\x96\x02\xd4\xb6\
-,\xc2*\xb9@\xb6\xaa\x98\xc8gj\x87)\x81#\x8f\
-\x8c}\xcf\x93OB\xf4\xf1\xc7\x87G\xb5\xa2\xeb\x14\xbd\
-\xfd\x87`\xb5\xb40\xcb_I\xc1+n\xc7\xa5\xb8?\
-\xaep\x01\x12\xe4\xba\x00\xeaT\x82\x80Id\xa1 \x81\
-|$*\x22\x81\xf8\xf8\xfd\xf1\x8f\xc33~\x9d]\x10\
-\xb9\xfa*\x00t\x9fr++\xa1\xec\xe8\xa3!\xa7\xa4\
-D\xbd\x03\x95I\xf6\xc9c_\x0aU\xeboq\xd9\xaf\
-\x9b\xfas{\xfe\xb9\xc1\xbf\x0dHT\x8d==\xcf\x90\
-\xe14\x04\xbe\x9d\xaa\xfc\xcf\xb4\x02P\x05\x03\xd9\x81\x8c\
-\xf6\xcc\x87(m(\x18HL\xcc\x8a\x83\x9c\xdc\xa7\xed\
-\xa6I8%\x10_:,2\xa9n\x93\x05\x03W@\
-\x95.L\x0a\x0a\x12\x09\x1cuT\xec\xc7\xa2;`\xa3\
-;0\xa4\xb7\x9d\x08\xfe\xdb~\x00\x80\xe0/@i]\
-y\xe6\x99\xf1\xb5\x14\xaa\x02\x1d\x95\x7f\x9e\x96\xfc\xf7p\
-\x03Tq\x86|R\x02\x9f\xfb\x5cl\xfc\x9e~\x0a\xec\
-G\xffwh\xc7\xaf\xad\x0d\xa2W]\xc1\xb2%\xb9\xd5\
-\xd5P\x8a\xae]h\xd4(u\x8aY\xb7\xd6D\xf0\xe3\
-\xa5\x1d~\xf9\xbf\x9d9k\xa96\xc2u\x89\xc0\x09\xfe\
-Q\x5c\x8c\xc0\xdfF\xdb~\xef\xde\xfd\xfe\xfa\x96\x967\
-\x0d}\xff\xb4\xc0\x9f\x0e\x01\x80G:0I\xba\xec\xe8\
-\xe8\xd8\xd4\xd8\xd2\xf2\xaf=(q\x5c\x15`\xb9\xb9k\
-\xbei\xa8d\x1d\x80\xd4\xa2\xf3\x15Y&\xae\x80\xc7.\
-\xc3\xb2\x98A\x98\xac\xc6\xc7?\x1e\x9b\x00q\x12\x18\x02\
-\xd9\xba\xfd#\xb0\x11\xfc\x16Nb\x0a\xae\x91\xe5\x07E\
-\x04^\xb9\xe5\x95i*\xd0+\x10\xe8E\x04\xb2\xc0\xa3\
-\xf3Z\x1eU'\x9ew^l\xfc\xfe\xfc\x0c\xd8\x7f\xf8\
-\xfd\xd0\x8c_S#\xd8\xb7\xde\xcc\xc6/o\xecX(\
-]\xb4(\x09\xfcV\x0a\x9b\xd2\xea6\xb5U\x91\x85\xd8\
-\xeb\xcf\xe6\x82\x7fA*\xfc!\xf0;\xd6\x7f\x13\x1a\xc8\
-\x96\xde\xde?K\xc0\xcf\xff\xed\xa7%\xf8\xa0\xd5\x01x\
-\x95\x04\x8bD0\xe0\xd4\x05<\xf3\x01J\x1c\xa6\x02\x9c\
-X\x80\x9b\x12\xb49\x8b\x9f\xc4\x94\x8aU\x83\xa0\xf0\xf5\
-e\xc4a\x19\xc4\x0ed\xbe^\xd8\x91\x8eL\xb2Qd\
-\xfb\x89'\x06W\xb6n\xdd\x06@\xb2\xdf\x01\x7f\x05\xc9\
-~\xcdV\xeb\x96\xce\x15PE\xee\xfd\xa4\x03\x15\xefS\
-\x92\x83\xa0\x0c\xf2'N\x84\x9a\xf3\xcf\x8f\x8d\x1f\x15\x0a\
-\xfd\xeew\x83;~uu\x007\xdf\x04\x16\xba\x9by\
-55P\x8a\xae\x1c\xcd7m9\xb8\x226\x94T\x81\
-*\x04\xa1m]\xe1\x99\x18\x99\xe3\xe7$\xbd\xcf\xe9\xf8\
-\x13p\xac\x7fW\x7f?\xec\xda\xb2\x05\xd657\xbf\xe0\
-!\xffU*`X\x14\x80\xd7\xba\x80\x84cck\xeb\
-\xaa\xba\x86\x86\x7f\xedil\x8c\xd5\x05\x90\x0a\xe0\x17\x09\
-\xf1USb\xc1\x04'\xad\x12\xf2\xb1\x92V\xe2\xb6\x89\
-[\xa0\xd9\xb1U\x04X\xb8\xaa\x0aF\x7f\xe2\x13\xb1\xe7\
-\x9e\xfa\x13XO\x0eR\x9d\xc0\xb6m`\xfd\xf8N\x80\
-\xf6v(\x981\x03\xcaI\xf6+\xa2\xef\x96\xa6q\xa5\
-\x18#H\x22\x10\xbf\xf2_\xf2\xb9\xa4jC\xcd\xe7\xf2\
-\x88\x04.\xbc0\xf6\xf8\xf9\xbf\x82\xf5\xc8\xc3\x83\xe46\
-\xed\x04\xeb\x96\x9bY\xb6$o\xc2\x04(\xc5k\x96\xd0\
-\x0f\xc1\xa4*TS\xbekIH\xc1\x96\xb8\x04\xb6\xa4\
-\xd7\x9f-\xb8\x06\x01\xa7\xe9\x07\xcb\xfd#\x16\xd6\xafY\
-C\xbe\xff\xfd\x945K!\xf8\x07\xd9\xe0\x02\xe82\x01\
-\x09*`\xfd\xea\xd51\x02pb\x01nJ\x90\xaf\x8f\
-\xe6\xc1\xca\xa7MlI\xda0\xae\x1a<\xd2\x87\xcaf\
-\x0e\xbat\xa1\x1b\x13pH\x80Y2\x22\x81\xc7\x1f\xcb\
-8\xf8\x03w\xde\xce,\x7f\x81k\xf9\x15\x80\xb54\x12\
-\x1c\xbc@\x99\x09\x17@C6\xaa\x80d.\xf5(\xb8\
-\xe8\xa2\xd8\xf8\xfd\xe3\x05\xb0\x1ez0\xb3\xe3\xb7};\
-\x04n\xfb>\x1b\xbf|t=J\x8f9&^'a\
-\xf9h\xe2)s\x05l\x0f\xa5(*\x82\xf8\xe7d\xea\
-\x81\xe69\xcdwg\xc5\x1f\xdb\xe1\xa8\xbb\x1b>\xfa\xf0\
-\xc3\x8d\xab\x1b\x1a\x9e\xe6\xac\xff\x80\x04\xfc^\xfd\xff\x86\
-\xb4\x0e\xc0\xf6\xc8\x08HI\x00U\xc0\xdb\xa8\x00\xfe\xb1\
-{\xcf\x1e\xf6\xe3\xdd\xa5\xc2\x96\xb3\x07:_I\x95`\
-\xdd%\x8a@\x1a\xb9\xe5]\x08\xd9\x92a\x0d1X\x1e\
-\x01D\x0a&\x8d>\xee\xb8\xd8S\xcf<\xcdH\x80\xa9\
-\x954\x0f\xd8\xbc\x99\x81\x1f::\xa0`\xe6L\xa8@\
-\xcb\xaf\x93\xf0JW@\xb1\xd9\x09h\x88\xc4\xd4\x050\
-\xfeN\xd5y\x10\x89\xa2?^\xf3\xa5/\xc5\xc6\xef\x9f\
-/\x82\xf5\xab\x0722~T!\x19 \xe5\x84\xe3\x97\
-7y2\x8c>\xf6\xd8\xd8\xaeT\x9a\x9dym]\x10\
-Y\xb1\xa24i9\xafD\xfa\xdb\x92x\x95\xdb\xe2\xce\
-}O\xd0Y\xf4C\xea\x846gy\xff\xed\xb7\xa1\xa5\
-\xaf\xefY\x0f\xf0\xeb2\x00Y\xa5\x00lE\x0c \xfe\
-\xe3\xf6tw\xff\xd9U\x019\x14\x0bp\xf6\x10H\xea\
-\x8e\xca\xef\x1f\xc8_\x08\x81\x18,\xb1\x8f\xa0L\xc6\xe9\
-\x18\xdckO7\xbeX\x08I\xa0\xec\xc4\x13\xd9D\x08\
- \x09\x04\xd2\xcc\x0eXT&}\xd7\x8f\xc0r\xc0_\
-~\xfa\xe9\xea\xe0\x9e\xa6\xbc\x17<\xd2\x81\x9e\x8dA\x0c\
-\xf6M\x10\xbfC\xa7B\x92\xb2\x15\xces4~c\xbe\
-\xfc\xe5X\xe5\xdb+\xff\x86@\xba\xee\x00\xca\xfd\x10)\
-\xa7\x96\x16f\xf9G\x1f\x7f\xbct\xaf?\xe3\x8d<$\
-$ K\x05J\xa5\xbf\xb8\xbaU\xe6\xa2\xba\xeb\xfd\x9d\
-\xc0\x1fm\xf8\xb1c\xeb\xd6\xf7\xdeil|N\x02\xfe\
-\xacw\x01L\xda\x84\x89n\xc0\xc0\x96\xb6\xb6w\xf74\
-5=\xbd\x05'\x7f`\xd4\xa8\x98\x12\xa0\x80\x08\x05\x05\
-\xc5\x95\x82BI\xb0\xd4\x05\x10\x01\xef\xe5\x0a\x98\x04\x04\
-5J\x81\xb9\x03'\x9d\x14\x1b\xc04H\xc0\xda\xb4\x09\
-\x82?\xba\x83Y\xae|\x1e\xfc\x06>\xabQ\x0c@\x07\
-\xd6\x0c\xb8\x00\x96\x87*Ir\x0f\x9c#\x07\xc7\xaf\x1a\
-\xdd\x016~/\xfe\x03\x02\xa9\xbaS\xedm\x10\xbc\x03\
-\x95Sc#\xe4N\x9c\x08\xa5\x04~]cX\xd1\xc5\
-\x94\x94\xa0k\xa5\xbf,X(Y\xcd*\xf5\xff\x9dE\
-?\xe0\x94\xfc\x92\xe1\xa3y\xff\xce\x1bo@so\xef\
-\xb3\x9c\x91L5\xff?\xe4u\x00&* \xa2R\x01\
-[\xdb\xdb\x1f\xff\x00U\x00[#\xe0\xa6\x05\xa9\xe9&\
-\xd5\x05\xc8J+\x05\xabo\xab\xaa\xb0\xdc\xc1\xe7\x5c\x01\
-[\xb2\x98\xc8\xd2\x15\x12y\xa4\x08\xe3J\x80\x9ab\xe0\
-\xd3A$\x81 Mb\x1f\xe1jk\xe3\x06\x08\x91\xe5\
-\xef\xea\x82\x82Y\xb3\xe4\xe0\xd7D\xf3U\xc0L\x0a\xcc\
-\xa5[\x0elP\x06\xec\xf9\xffJ\xf6`\xc8\xc1\xf1\xab\
-\xba\xe0\x82\xd8\xf8\xfd\xf9\x19\x08\xfc\xf5/\xfe\xc2\xfd\x9d\
-\x9d\x10B\xf0\x07jw\xb3\xf8B)\xbaf\xfcRs\
-\xd0U}\x1at\x96\xb65\xbb\xf8\xc4%=\x9f\xefw\
-\x03\xd7\xc2\x5c\x8b\xabY\x92\xfd\xeeN\xbf\xe4\xf6\x22\xf8\
-\xa9\xe6\x7f\xd7\xee\xdd\xffx\xb7\xa9\xe9\x05\x11\x1f\x0a\xff\
-?\x9a)\xcb\x9fI\x17\x00\x0c+\x03\x13\x88\xa0\xae\xbb\
-{Wcg\xe7#\x1f~\xf0\x01\x04\xd1\x0f\x0a\xd1\xa0\
-Pq\x90\x9b\x16\xe4[%q\xa0\xb6\xc5:\x00\x1dk\
-\xcb\x82{\xb2\x15\x85\x06e\xc4\xb2\xef\xc9\xa9\xa9\x81\xd1\
-\xa7\x9c\x12\x1bH\x9a\xc4\x86k\x07\xe0\xc3\x8d\x10\xfa\xc9\
-\xdd\x00\x08\xfe|\x04\x7f\xd9i\xa7\xe97\xb1\xd0\xecu\
-g\xf2\x9a.u\xe8k5\xa0\x9f\xef7x\x8d\xacv\
-\xb9S6\x1c\xfc\xdf?0\x120\xca\xf4\xf7\xf5A\x88\
-\xf2\xfc;v@x\xcc\x18(E\x97\x8c5C\xf1\x88\
-\xee'I\x7fN1\xca\x94\xa5\xa5\xf2\xe7\x05\xa2\x88?\
-\xc7\xcfW\xce\xd0\xd8N\x9a\x1b\xdc\x9a\x7f\xda\xa0\x05\xe7\
-\xfa\xba\xb7\xde\x02r\x87\x05\xe0\x0fHj\x00\xbc\xea\xff\
-\x87\xa5\x10\xc8te\xa0L\x05\xb0cuC\xc3\xef\xb7\
-\xac[\x07]\x91\x08\x04\xc9\x15 \x15@\xc1\x1b' \
-\xc87R\xe0-wBV@\x92\x1e\xb4\x05\x95\x00\x92\
-\x16\xe3\xaa\x1c\xaf\xb6\xf1\x88,E\x88$Pv\xea\xa9\
-\xec\xb5\x10\x92@\xc8\xc3\x1d\x08 \xf8\xc3w\xfd8n\
-\xf9E\xf0[\x86[YK\xe5u:\xab\x02MR\x84\
-\xb2*C\x83\xffW\x95Fd\x15\x83\x14\xf4t\xca\x86\
-C\x8f\xfe/\x04\x9f~J?\xeb\xa2Q\x08#\xf8\x03\
-\xb5\xb5\x90;~<\x94.Y\x12\x03\x94\xd7\xc6\x1c\xaa\
-\xeb(\x91\xec\xaa\xe7\xc5\x22\x1f[\xb2\xa9\xadX\xbf\xe2\
-\x92\x0e+\xf9E\xd0\x93\xda%\x83GU\xb1u\xcd\xcd\
-O\xa0;\xfc\x9eB\xfa\xeb\x8a\x7f \x1b\x15\x80\xaf8\
-\x00\x1d\x11\xdb\xeek\xe8\xee\xbeo\x0d\xfaA\x14\x0d\xa5\
-\x12\xe1x@\xd0eM\xc9J*0\xa8\x11\x90\x96r\
-j^\x93E\x7fu\x8b\x86x\xb7 \x07\xad\xd0hG\
-\xc2\x07\x9f\xfd3\x84\x14u\x02\x81\x0d\x1b \xe7\xee\xbb\
-\x00z{!\x7f\xce\x1c\x18-\x01\xbf\xc9\xc6\xa5~Z\
-Xy\xae\x0a\x94\xad\x090M\x03\x9a\xc6\x00<~W\
-\x1e\xc5?\xce=\x97\xfd\x1dz\xeaO\x10\xd2\x04\x06\xc3\
-T!\xb9s'\x84Q\xf6\x97\xa0\xec\x0f:\x15~\xda\
-F\x1dBq\x19\xf8\xd8\xbe\xcbR\xe4\xfcm\x891\xe2\
-U*_\xf1\xc7\x8c\x99\xdb\xeb\x0f\x09\xa0g`\x006\
-\xbe\xfd6\xbc\xdf\xdc\xfc;|W\xbf\xc2\xff7m\x03\
->\xecA@\xbf\xab\x03]\x12`?|Mc\xe3\x9f\
-\xb7\xef\xd8\xf1\xec\xb6\x8f>b\xcc\xc8j\x03\xdc\xb4\xa0\
-\xa4\x7fZR\x8a\x90_)(\x92\x80P\xb9%\xdd\x91\
-HV\xab\xad\x08\x0a\xe9\x0aG\xc2.\x098>m\x90\
-\xdc\x01.Ue\xa1\xab\x93\xf3S\x94\xfd==\x90?\
-{v\xccu0\xd8\xb1\xd62\x09\x00z\xad\x0c\xf4\xe3\
-\xdf\xa7\xf2\x1e\x83\x15\x89*\x17\xc2\xfdL\xde\x8c\x19P\
-\xf1\xf9\xcf\xc7\xc6\xef\xa5\x7fB\xe8\xfe{\xc1\xee\xefO\
-\x18\xc3\xd0}\xf7\x82\xb5y\x13\x0b\x22\x96\x1c\x7f<\x84\
-\xa8\x89\x8bG\xacFV(\xa6Rz\xb6\xae\xe0\x87\x9b\
-o\xa0r\x1b\xb8\xf7\xc4\x83\xd6\x5c\xe0\xcf]\x07\xb3\xfa\
-\xdf\xff\x86\x86\xae\xae\x07:\xfa\xfb[5\xc1?\xaf\xfc\
-?\xa4+\xff\x07C\x01\x80\x87\x1b0 \xf1w\x06v\
-tv>\xb5n\xd92\xe8G\xd03\x15@[Y\xb9\
-\xae\x00\xb7d\x18D\x7f\xdf\x8d\x09H\x8a0\x92d\x9b\
-\x84\xc9-M\x86\xc0\xd2\xc8C\xd5\x22\x22\xcas\x97Q\
-\xf5\x1e\xc5\x07P\x09\xe48J\x80,\x7f\xeeO\xee\x02\
-\x0b\xc1_\xe0\x03\xfc\xa96\xa64\xea\x0c\x94\xe2\xa1\x0c\
-,j6X5\xfd]\xb9\x07\x1d\x04U_\xfer\x0c\
-(+WB.\xf5@\xc01c\xf1\x96\xdf\xfd\x16B\
-\xabV\xb2\xd7Ji\xbb3\xa7\x9b\x0f\x98\xf4\xdb7\x88\
-\xf5\xc8\x02\xcc\xe2\xd2^[\xa6$%\xae\xa6\xcd)\x0b\
-w\xa9\xaf+\xfd\xb7o\xdd\x0ah\xec\xfe\x82\xee\xef\x13\
-\x12\xeb\xcf\xe3#c\xfb\xff\x0d*\x01\xdc~\xc5\x15\xa6\
-\x9b\x87\xca\xdc\x006\x00\xb4\xf6\xb9\xa1\xb3\xf3\xa15o\
-\xbe\x09\xa1\x92\x92xV\x80dS\x9cE\xdd\xffD\xbc\
-\x18\x023\xdb\x92\xba\x01>3\x00\x8a\xcc\x80\xa5\xda\xa4\
-T\xe1r\xa8\x8a\x85\x88\x04F;\xed\xb1BH\x02\xe1\
-\x07\xfe\x8b\x81\x1f\xfa\xfa\x98\xec/\x15\xc0\x0f\x19\x00\xbf\
-\x12\x9c:\x0b\x9d\xcaj@\x13\x85\xa1\xd9~\xdb\xe4w\
-\x90u\xaf\xb8\xe0\x02\xe6V\x05\xb6l\x81\xbc+\xaf\x80\
-\x9c\x87\x1f\x82\xd0\x8b\xff`cZ\xf6\xc9OBH\xd6\
-\xc9G\xac\x1c\xe5\xd2\xc7\xaaEb\x96\x08`H\xdec\
-\xc2\x96\x80\xdf\xe2Q(\xcbJ\xb9\xe0\xa7\x80\xb6\x13\xf8\
-\xa3\xa8?e\xbc\xd6\xbe\xfa*\xec\xea\xec|6E\xe9\
-\x9fp\xbb\xe3;\xdf\xc9\x8aB /\x15\xa0R\x02\xbc\
-+\xd0\xbf\xaa\xbe\xfe\x0f[7o~\x89z\xa1\x93_\
-GY\x81\x90\xdb?PU_-\xa6\x5c\x84\x12L\x9d\
-\xf4\x17\xab\xc1\x94\xcd\x1bM+\x09\xb9\xc9F\xfe)M\
-T\xc6\xfco\xbe\x01\x16\x82\xbf\x80\xc0\xef\xb4\xd1\xf6\xbb\
-=\x95e\xf2\xbc\x22\xedf\x1c\x070\xed\x0f\xa0X\x5c\
-\xe4\x97\x08t\xcf\x13\xc0i\xfc\xf2\xa6L\x81@w\x17\
-\xe4\xfc\xdf\xcb\xec\xf9\x8a\x0b/d\x04aT\xe4cX\
-\xdfa\xeb\x88^V\x0c$\xac\xeaK\xe8\xf6\xcb\xcd+\
-\xdb\xd9\xe3\xcf]\xec\x93\x83s\xfa\xed\x7f\xfd\x0b(\xf3\
-\xb5\xbd\xa3c\x83\xc6\xf2\x9b\xac\xfcK6P)\xdeB\
-i\x7f\x03\x9e\xc4\xedW^i\xdfp\xcf=\x16\xa8\xbb\
-\x06[\xce\x8f\x0a8?\x94\xbf\x0f:G?\xa5D\xd6\
-\xbc\xf2\xca\x09\xc7\x11\xcb\xe3\x80Q+';\x1ae_\
-\x10ps\xafn\xe0N\x08\x0cZB1\x10]\x98\x80\
-\xb3\xbe@l*j\x09\xbe[@|M\xe1\xfb\x8bJ\
-A7\xd1r\x90\x04\xca\xcf;\x0f\xfakk\xd9\xdf\xc1\
-\xe2\xe2$\x85a\x0a~\xdd\xee\xb3\xd2\x00\xa5j\x22\xab\
-&\x8el\x22\xb9\xcf\xd9fF\xc6\xf2pH-\xc5k\
-\xb2\xe7Ym\x00\xfa\xf7e\x9f\xfd,\x0c\xd4\xd7C\xdf\
-\x8e\x1d\x90\x83\xca\x8a\xc9~\xd9\xf9\xb8V\xdaUx\xbc\
-*t\x02\x80\xb6\x04\xec\xb6\xc4\x95\x04\xfe;$*\x93\
-\xf7\xf5in\xc6\x83\x81n\xda\xda\xbd\x06\xeeb\x1f\xa7\
-\xdc\xf7\xa3\xcd\x9ba\xf3\xc6\x8d\x7f]Y_\xff;\x0f\
-\xe0G\x8c\xac\xffw\xbfkg\xc2\x0f\x08\x0d\xb2\x02\x88\
-r\xd7\xd4%\x01\x8b\x03?O\x00\xc1\xcdmmkK\
-\xc2\xe1\x07\xdf~\xf5\xd5\x8b\x8fZ\xb2\x04)\xa1?6\
-\xc8\x10\xeb\xeb\xc6_L\xf6\xa5\xf4\xd8\x8d\x11\xb8\xc5?\
-.\xe8y2p\xa5\x8eb\xe2'\xf4m\x13]\x021\
-\xee\xe0N*I\x0d\xbc\xa80\x08\xf4Ati\x94\xa5\
-\xa9\xb2EJ\x9a\x85)\x9e\xcf\xab\x5c\x15\x09\x11X\xa6\
-V\x84\x03\x83-<\x96\xbdGJ\x04\xee\xb5\xf1A\x02\
-\xf1\x09ZY\x19\x93\xfc\xee\xba\x09\xf13\x22\xe8\xdd\xe2\
-\x1c\x99D\xe7^\x8b\xe2\xbcJ\xa8-\xe1\xc9\x82[\x8d\
-js`Ox\xbf\xfb\xd8IM\xc6\x0d\x11Y~\xba\
-w\xf7\xf7C\xf0\xf7D\x22\xf0\x0eZ\xff]]]\x7f\
-v\x15/w\xe8\x5c\x80\x8c\xf4\xfd\x1b|\x17\x00\x07\xe2\
-\x8e\xab\xaf\xf6\xea\x1c\x1c\xd5\x04\x05\xe3\x03\xf2vC\xc3\
-\xffn\xdd\xb6\xed9dK\x06 b\xcf\xf8\xaeBB\
-j\xd0\x16/\xa0\xc2g\x93\xf6\x18\xe4\xad0\x804\xe5\
-\xa8[$\x02\xb2\x85J\x9a\x12T-\x80\xbd\xd4\x80\x09\
-\xf8u\xb9|Y\x7f??q\x00E\xf0PW!\x98\
-\xd6\xf9\x0b\x84\xac\x5c\xa9'\x5ccK\xa1\x88\xc4\x96r\
-\xb2\x0c\x12H\xe2\x00I\xf5\xfc\xeedv\xe7\x988\xff\
-\x9c\xf9\x19\xdf\xde\xcb\xc9j-\xff\xfb\xdf\xa1\xbe\xb3\xf3\
-W(\xfd7\x1aJ\x7fm\xe4\xff\x8e\xeb\xae\xb3\xed\xac\
-\x22\x00\x7f\x8b\x84\xc48@\xbfH\x02\xa8\x04\xfew\xdd\
-\x9boBGO\x0f\x1bD\xb7J\x90\x05T\xdc*A\
-!\xb8g\x0b)BK\xb2`CE\x02*?\xd1\xf6\
-\xb0\xae|)((\x0a\x8bL\xf6\x93\xb7L\xac\xb0O\
-_:\x95\x0aA\xbfG\xaa\xff\xb74\xe0*\xfd\xd9\xde\
-k\xf6m\x8d\xea\x91\xd5\xf3\xdb\xbcB\x90\x9cCR\x1c\
-\x893(I\x85e\xbc\xab\xe1\x92$\xcdQ\xf2\xfbi\
-\xde\xa2\x1b\xfb\xc1\xaaU\xb0c\xe7\xce?sQ\x7f\x99\
-\xe5\x1f\x10\xd2\xe5\xb6\x96\x082\xe0\xfbg\x9c\x00h\xa0\
-\xee\xb8\xe6\x1aYi\xa2\xae8h@V!\xd8\xd0\xd3\
-S[\xd7\xd5u\xcf\xb2\x17^\x80(\xf9Q\xc4\xa4\xce\
-\xa6\x22n\x95`R\xce_B\x02\xd2\xddZ<H\xc0\
-\xd6\xa4\x0fAbi\x12\x9a\x97H\x82\x84\x96n\xfb(\
-\x1f)@+\x85\x94\xa0\x9f\xa5\xc1~\x9a\x81\xa8\x96\x00\
-\xfb\xc9j\xa4\xfa\x5c\x92\xd5\xf7\xd8\x16N\xaa\xda\xc4\xaa\
-=>sd\x02~AY\xc6\xff\x1f\x17\xfc\x05\x05,\
-\x9d\xddX_\x0fk\xdexc\xc5\xbbMM\x0fJ\xc0\
-\xdf\xaf\xa8\xfb\xe7\x0df\x927u\xc7\xf5\xd7\xdb\x09\x99\
-\xaf,\x8d\x01\x80A@\xd0\xe2\x82\x81\x16\x17\x13`\xc7\
-\xda\xa6\xa6\xbf\x86\x83\xc1\x9aU\xff\xfa\xd7y\x8b\x97,\
-\x89\xc7\x02\xa2N<\xc0\x8aF\x13\xd2}\x96$\xc8g\
-s>\x9d\xc5\x05\x04\xdd{K\xf0\x0f-U\xafA\xc3\
-z\x01e\x17\x22\x994\xd5\xa9\x01\x93\xe74\x0aC\xb9\
-\x05\x95\xf0\x7f[)^L\xf0\x19\xe8s\xe35\xb60\
-iU\x01@[na\x92\x83r\xe2\x12p\x9e\xf4\xc5\
-\x00\xa0\xc4\xe7\xa7s\x8a\x8a\x06\xc0\x9dW|`\x91\x8f\
-\xfe;\xaf\x03\xb7\xb5\xb7\xe5\xd4\xf9\x93ab\xfd\xfd\x10\
-\xfc\xe4\xf7/\xfb\xcb_\xa8\xcb\xcf\xb3]\x03\x03m\x12\
-\xf0\xcbr\xfe\xdav\xdfw\xdcp\x83\x9d\xf0;2\xe0\
-\x08\x042a\xf9\x13T\xc0\xb5\xd7\xaa\xaa\x95\xb4\xfd\x02\
-%\xc1\x91\xfe\x95\xf5\xf5\x0fo\xde\xb4\xe9\xb9\x0f\xd6\xae\
-\x85\x1c7\x1e@]^\x9cU\x83\xf1\x8b\xc6\xaf\xce\x12\
-\xfc\xb8\xa4\xfa\x01\x85\xe5\xb7$\xeb\x0d\x92\xe4\xa6\x0c\x5c\
-\xc2\x04TV\x0f\xaa\xd4\x80\x81\xc47\xb2\xfcn\xee9\
-\x95\x8a=\x93\x8e?\x86\xee\x84\xa5\x09p\xa6\xf4\xfb\x04\
-__\x96\xe6\xb3d\xfe>\x9f\xa6\x13\xab\xf8\x0c\x0a~\
-\xc4z\x82$U\xe9\xcc\xa9\x80S\xe9G\xd2\x9f\xd5\xaf\
-\xd0\xba\x04T\xabo=\xf7\x1c\xecik\xfb\x7f\x1f\xb4\
-\xb4\xbc\xa6\x00\xbfI\xd5\xdf\xa0\x04\xfe2\x9e\x06\xe4\xd3\
-g\x02+\xd9\x0a\x22\x90e\x05\x92T\x00=\xb7\xae\xb9\
-\xf9\xa1\xd0\x9boV\x94UW/\xae\xa04\x90\xc3\xc0\
-\x91\xde\xde\xd8\xff\x85\x8f\xa5V\x9e\x8bJ\xc7'\x05G\
-\x02\x96$%(\xe6\x91m>\xc5%\x09\x1aY\x9a\xdc\
-\xb2r\x92*\xca\x8e\x8d\x01\xa3z\xaf\xaa\x0aN\xa6f\
-\xbcR\x7f\xb2H\xbf$\xe5\xe7;\xed\xe7f\x02\x0c\x94\
-\x80\xca\xba\xc7\xb3\x0d\x82\xa5\x97\xf9\xe5\xae\xb5\x8c\xa7\xe9\
-D\xa2\x16-?\x0fr\xee=6\x97\x05\xb0\x9d\xdf\x10\
-\xa5{w\xe9\xba[\xeaK\xd2\x1f\xfd\xfe\x15/\xbe\x08\
-;w\xed\xfa\x93\xe0\xf7\x0f(*\xffT\x0a 1\xf0\
-G\xd6\x9f\x1b\x83\xec\x0b\x02r\x17UR\xa1dR\x18\
-4 \xcb\x0at\xf4\xf7\xb7\xd4ww?\xbb\xeco\x7f\
-\x83\x0e\x04=K\xad\xd1@Sf\xc0\xed%\xa8\x08\xde\
-%\x95\x0a\xeb\x02\x81b\x80\x87\xb3>\xaa8\x81\xb6\xd8\
-D\x96\x0a\xf3\xeaN$\x03\x19\x1f\xd42u\x1b<T\
-\x85\x91\xe57\x8c\x11x5T\x05\x1d\x89\xc9\xd2\x92B\
-\x00P\x19\xe8\x13\xbbE)\x82} \xae\xdc\x13\x8b\xbe\
-\x14\xd5\xa5bE\xa9%\xee\xf0C\xf3\xce\xd9\xd5\xc7r\
-\x82~t|\xf0\xf6\xdb\xb0~\xed\xda\xe7\x97\xd7\xd7\xff\
-\xcag\xca\xcf\xd8\xfa\xdb\x19\x0c\x06f.\x08(\x06\x04\
-\xf7\x92\x80\xd7^\x82\xb2EB\x09\xc7\xc6\xd6\xd6e\xb5\
-\xed\xed\xf7\xbc\xfe\xe7?C\x1f\x15\x0c\x94\x940\xa9\x95\
-\xd0?@T\x22\x9a\x8b\x99T.,\x02OQ\xef-\
-\xd6\x92\xdb^\x1b\x90\x98\xa8\x01\xd0\xf7\xa0\x97*\x06\x83\
-z\x02\xbf\xd1\x7fe\xdd\x7f:\xd9\x00\xcdo\xb3<2\
-#\xb6WV@\x8c\xf2\x0b\xe0\xb7d;\xf1\xca\x0a\xc1\
-\xc4\xeb-f\x98$H\xb4\xdd\xd4\xaa\xb3\xc4\x97\xad]\
-\xa0b\x9fM\x9b`\xf9\xff\xfd\xdf\xf3\xeb[Z\x1e\x92\
-\xcdc\x0f\x12P\x02\xff\xce\x9bn\x1a47 \xa3i\
-@[e\xfd\xcc\xd6\x09(U\x00\x1e}k\x9b\x9a\x9e\
-\xafmi\xf9\xf5\xabO?\x0d\x11\x0a\xb6\x10\xe3:\x9b\
-\x8b\xb8\xdbe\xd9\xb2\x89#\xf1\xe5d$\xa0\xea!\x90\
-Tn,\xa4\xfel\x89\xac\xd6\xedv\xacL\x0f\xa6`\
-\xb5U\xd5\x80^\xe0\x02C\xb0\x1b\x13\x82\x8a\x04\x0d6\
-\xd9\x90\xad\xd03\x19+[\x11\xe5\x17s\xf6\xbab(\
-[f,$\xaf%\xcc\x1f7\xddG\x85>\xce\xf2\xde\
-\x1c\x9c\x8b\xb5;w\xc2\xea\xbf\xff\x9d\x8a}\x9em\xeb\
-\xebkr\xe7\xadF\xf6\xab\x0a\x7f\x92 d+\xac\x7f\
-v\x04\x015\xee\x00\x95+z\xd4\x06\xe8\x16\x09\xf5\x0b\
-\x83\xd8\xf7vC\xc3\xe3\xbb\x1a\x1a~\xfb\xc6s\xcf\x01\
-P\xb4\x15\xfd-V$\xe4l0\x12\x9f\x18\xc2\x7f\x06\
-\x1e\xf2?\x89\x0c\xdc%\xbc\x12\x97\x00T\x0dH\xfd\xba\
-\x04\xbaX\x80\x97\x94\x16]\x84Tz\x04\x0cB\xde_\
-\x1b\xa04\xf8]\x09\x13Z\xa6\x14<\xac>(v\xe5\
-\xb5e\xd5\x9f\xdc5\xe7Kyu\xe0\x07\x1e\xfc\xb4N\
-\x85\xe6 \x82\xbf\xb9\xb9\x19\x96?\xfb,lmk\xbb\
-nG\xac\xd8\xa7\xcf\xc0\xf2\x1b\x05\xfe\xeep\xad\xbfB\
-\x15e\x85\x02H\x8a\xbe\xabU\x80\xae6@\x16\x0fH\
-\x92P\xab\xea\xeb\x7f\xbf}\xe7\xce'\xdez\xfey\xc6\
-\xbeq%\xe0\xee2$(\x01\xf1\xc2\xc6\xd7\x97\x0b\xc1\
-\xa6\xa4\xc9\xa7*\x14\x12\xbe+\xc9*y\xa8\x01/E\
-\x904\xe1}\x14\xc8\xa8b\x04\xf1\x0c\x81F\x11\xf8\x22\
-\x02\x89[cr\x1e\xd2\x82'\xbe=\xba*\x9e!\xe6\
-\xdf=\xac\xbe\xad+\xferSw\x12\xd7\x80w\x19\xe3\
-\xd7\x97'{\xb7\xad\x17\xcd5\xda\xe9\x1a\xe7^Gg\
-'\xbc\xf1\xe4\x93\xb0\xb3\xbd\xfd\xceMmm\xabx\x83\
-e\x08~e\xd5\xdf\x9d7\xdflk1\x97M1\x00\
-\x15!\xdc\x9e\xa8\x02L\xdb\x87\x0d\x08\x91S~P\xfb\
-V\xd4\xd7\xff\xcf\x96-[\x9eY\xf9\xcf\x7f\xb2\xf4`\
-\x80#\x01w\x97!\xb1<X\xe6\x02H\xfd?\x0d\x09\
-\xc8\xd2P\xa2\x1aPv\x93\x95=\x16\xae\xb8\xa5\xa9\x0f\
-\xf0\xeaw\xa7\xca\x02\x18[|\x83@\xa5V\x11\x88D\
-\xe6\xf1[d\xfd\xf3\xa5\x01A\xc56]\x09\xe9=\x85\
-\xd5WId\x9bK\xeb\xd9\x12\x17 i\xb9/\xb7R\
-\xd2\xb5\xfc\x04~\xea\xec\xf3\xdac\x8f\xc1\xae\x96\x96\xfb\
-\xdfon\xfe?\x0f\xf0\xfb\xd9\xe8C\x1aW\xf3Zp\
-5|\x04 \xf3G\xb8Iq\xfbu\xd7\xd9\x1en\x80\
-. \xc8\x93@|\x80\x97\xd7\xd5\xfdj\xc3\xfb\xef\xff\
-e\xed\xeb\xafCX \x01\xb7\x9b\x90m\x10\x07H8\
-T+\x06\xf9\xa2\x0bE\x96@\xa6\x06\x92\xe4\xac\x82\x08\
-l\x89\xbbb$\x9bU\x8a@\xe7\x93k\x22\xf6\x16\xa7\
-\x14,\xc32f]\xcc\xc1\xf2j\xbf\xad\x01\xbc\xd2\xe2\
-\xf3\xa9>>\xad'\xb1\xfa6\xaf\xf0\xc4\xd7$\x0b\x9c\
-d\xc6!.\xfdi+o\x8a7\x91\xe5/,dq\
-\xa8\xd7\x1f\x7f\x1cv77?\xb8\xb6\xa9\xe9/\x1a\xf0\
-\xfb]\xf0\x13\x93\xfe\x9c\xf5\xb7\xed\xc1+\x05\x08e\xda\
-\xf2[\x1ch<j\xdcmIm\x00p\xb5\x01\xfc\x01\
-\xb2\xc7\xcb\xea\xea~\x01\xcb\x97\x07\xc3\xf9\xf9\xa7\xccZ\
-\xb0\x00\xfa\x1d\xa6\x8e\xf6\xe15p\x96\x12\xdb\x1c\xcb\xc5\
-'\x84\xb0bLz\xcf1\xae\xb4\xcaPx\x8d'A\
-\x8bo`\xa2q\x05t\x8a@\x0at\xaf\x18\x82f\xe3\
-K\xd9\xbd\xf2\xfaH\x80)\xe6\xdcA \xbc\xa4\xd5y\
-\xdc\xf3Q\xbe\x9d\xb7\x22\xb5*\xce#[Vd\xc5\xab\
--\x01\xd8*\xc0'\xb4\xf1VXV^\xf9%\x94v\
-\xd3k\xce\xea\xbe\x80\xbb\xc0\x07\x8d\x8c\x8d*\xe0\xd5\xdf\
-\xff\x1ev\xd6\xd6>\xba\xba\xa1\xe11\x89\x81J%\xea\
-\xbf\x17\xfc\xb7\xdej\xf3\xf3\x94\xbf\xcf4\x19\x0c\xe6b\
-\xa0DW\xe0{\xdf\xb3}\xc6\x03\x06<\xe2\x01l\xc0\
-\xd7!\x03\xaf\xf8\xf7\xbf\xff\xb6n\xc5\x0a\xc8))\x89\
-\xf5\x14\xa4\xc0\xa0\xd3W\x10\x9cb\x0d\x10\x8bD\xf8\x98\
-\x80X-(q\x1d@&-\x854\x93\xa5\xaa>\x93\
-d\x15\x94\x85A\xa2ol\xe2\x12\xa8HA\xe3\x8b[\
-\x99\x0c\x00J\xfe_\xdb\xe7\xf9\x8b\xb2[\xfc.\x19Y\
-\xd8by\xb0@\x02\xb2k&\x95\xfe\xfc\x5c\xe0\xff\x0f\
-\xce\xf2\xbb;\xf9\xd8H\x04\xaf>\xfa(l\xdf\xbe\xfd\
-\xc9\x95\xf5\xf5\x8f\xa4\x00|\xbd\xdf\xff\xfd\xef\xdb&\xf1\
-\xb5\xac%\x00[\x13\xac\xb8\xfd\xfa\xebm\x1f\xc5A\xaa\
-\xda\x80>\xfe\xe8\xe8\xefo~\xa7\xb1\xf1W\xab^}\
-\xf5oo\xbf\xfc2\xab\xc4\x0a8K\x88Y\xd9\xb0\x10\
-\x13Hh3.\x9e\x88\xb8\x00D\x12E\xb6\x14A@\
-[\x22\xfb\x93v9\x96\xa5\x175\xd1\xff\x04\x00\xf0\xc1\
-2/\x17A\xa60d 6\x8d7\x08QyKQ\
-x\x93$\xab\x15E>I\xeaB\xdc\xa8Sf\x8d\xc5\
-q\x17\x03\x83\xb2\xec\x8c\xe0\xf6%)\x04Y\xc5\x9fK\
-\x02n3O\xca\xf3;\xbd\xfc\xa9\xa5\xd7+\x7f\xf8\x03\
-l\xdd\xba\xf5\xf1\x15\xf5\xf5\xbf\x16\xe7\xa2A\xda\xcf\xdb\
-\xef\x17J\xebM\x8b\xef\x86\x9f\x00t\xe9.\xee\xe6A\
-\x02<\x19\x18e\x05h\xd0{\x22\x91\x0et\x07~\xfe\
-\xee\xaaU\xcf\xbd\xf5\xd7\xbf\xc6T\x00\x92\x00K\xd3P\
-`\xd0\xd9(\xd2\xed-\xc8O\xd4\xa4l\x80\xe0\xf3\xdb\
-*Y\xea\x96\xb5\xca\xac\x8d\xb0|\xd8\x93\x08Td\xa0\
- \x05\xdb#v`\xbc@(\x85`\xa3\x0c\x8c\xb6\xce\
-\xbdQ\xa5\xfcTu\x1bb\xc1\x8e\x17\xf0\x15\xae\x87,\
-.\x95\x04tQ\xfa\xbb\xae\xa1\xd3\xca;\xe0\xee\xe0\x8b\
-s\xa9\x1f\xdd\xc9WP\xf6o\xdb\xbe\xfd\x0fh\xf9\x1f\
-\xd4X~^\x01\xf8\xd9\xe2\x0b\xee\xe0\xac\xbft){\
-\x06\x97\x01\x0fJ\x0c@\x04\x02o--3\xe1\x10\x15\
-\x9e\x8f\x08\xfe\xbf\xf6\xb6\xbc\xae\xee\xbf\xf0*F\xfb{\
-{\xcfZLm\xc5\x90\xc1#t1{{!\xeat\
-\x17\x02\xe1\x9c\x92@\xed\xfa\xef\xc2\xfa\x02\x90\xc4\x06l\
-\xc1\xf7M\xda}H|\xce\x99\x90\x81@@Z\xac\x94\
-\xc0\xca\xaa\xd2Y\x8f\xf8\x8bHh\xca\xe0\xa3f]@\
-\x02ptk\x02\x04\xab\x9a \xe7%\x9f\x93\xae\xfc\x93\
-\xa8\x9c\x84q\xa1k\xc6\xd5\xffGEI,\xc6\x05\xdc\
-V]\xae%w\xe5\xbe\xe8\xea\xf1\xe8\xa3\xd7H\xea\xbb\
-\xefqJ|\x83N}\xff\xffg\xef\xdac\xe3\xa8\xce\
-\xfd\x99\xb5]\x1a\x12\x8c\x9d\x07\x01B\xe2\xd2\xdb\x92\x86\
-\x9bF\x80\x024\xf7^]\x04\xbd*T\x08]\xaa\xb6\
-\xaa\xaa\xab\xfeq\xff\xba\xff\xb4jU\xb5(Ii+\
-A\x9b@I\xda\xdb*Uhh\xfa\x82\xde\x0a\x85\x82\
-\x0a!Jh\x0a!\x8e\x891\xc1\x0e\xc1\x89\x89\x9d\xf8\
-m\xc7\x8f]\xdb\xeb\xc7\xaew\xbd;\xe7\x9e3\x9e\xd9\
-\x9c\xf9\xe6;\x8f\xd9\xf8\x95dF\x1a\xed\xec\xd3\xde\x9d\
-\xf9\xfd\xbe\xdf\xf7<\xe9\xc9IR\xfd\xfc\xf3\xa4\xa7\xbf\
-\xffO|`MH\xcbo4\xdb\x7f\xdb\x13OP,\
-\xae1[\xd2\x7fNb\x00h:\x8d\x7f\xd9\xc7\x1f\xa7\
-\x92``\xd8^\x81\xc0\x89\xe05\xd8\xad\xad\xad/U\
-\xbf\xf8\xa2\xf3\x02\xa7X\x88\x97\x0d{S\x85\xc4Q\xe3\
-\xc2\xc5\x81\xd5\x09P\x10|\xf25\x8a ECX\xea\
-\x89B\x10A\xeb\x83\xb8\x00\x14\xab\x88+\x22\x16\x00\xdb\
-\x95)\xf8\xce\x14\xfb\xff\xc8\xc5\xaeB\xd5\xd8tY\xc7\
-#\x96\xbe\x0bH|(\xf3a\xae\x1dXd\xb4*S\
-(\xd4\x22\x88\x15\x87d\x16\xc8\xfc\x08\x8d=\xbe\xb4-\
-\xaf%\xe1\xc3\x5c\xbd\x22\x9fD\x82\xbc\xf5\xdb\xdf\x92\xee\
-\xfe\xfe\xdfi\xc0\xaf\xb3\xfc\xf2\xa0\xdf\x93OR\x94\x98\
-5n\xc0\xc2\xad\x04\xc4\x9e\x03\xe9\xb3m\xfe\xfa\xe60\
-EBS:\x12\xe0\x12\xad\xa3\xbb\xfb\xf9\xa3\xcc_K\
-3\xcb\xef\xb4\x11{\xcb\x90\xbb\xa3\xc5dR60\x0c\
-\x02s\x05$EC\xa8k\x81\xb9\x10H\x8aQ&\xf1\
-(\x22\x97\xa5>\xb5\xae\xaa\x10\x80\xd8R\xa4\xf0|q\
-\x03Y&\x01#/\x848\x03\xf1\x13\xf0[C\x00c\
-\xd3\x9e\x03\xee\x14(\xd4\xf1\x913$9!~\x02]\
-:*\xe6\xf9\xb9\xe4\xe7\xcbw\xb9\x8d=}\xed\xed\xa4\
-\xfa\x8f\x7f$\x9d\x89\xc43'\xe3\xf1}\x1a\xe0O\x11\
-\xf3\xd9\xfezP\xcbJ}%D1\xaf\x0a\x80\x1af\
-\x02\xa0\xa4DH\x00\xdb\xf3\x12\x12\x90\x05\x063d\xba\
-l\xf8/\x9d\xfd\xfd\xcf\x1de\xd2\x8d\xaf\xc1^\xea.\
-Cn\xb9\xa5\xc3\xc4\xcd\x10\x10$?L\x11R@3\
-\x04\x98\xcc\x15\x15\x83\xc4r\x89d\x01c\x05\x04)p\
-!\xaa\x1fIf\x05\xb0\xcc\x82\xae\xb9H\xa16\xb0\xb4\
-\x22Ve\xa9\xba\x0e\xa4\xbf\x19!\x01r\xf3\xc5R\x10\
-\xe0S\xe4\xbd\x18Y\x07$\xa6\xf8\x98g\x08D\x7f\xdf\
-]\xbd\xe7\xdc\xfb\xef\x93\xb7\xfe\xfc\xe7\x9a\xd6\x91\x91\xad\
-g\x86\x87\xff!\x01\xbf\xac\xdaO7\xdb\xff\xa2\xf5\xff\
-\xc9OB\xe5\xfb\xad\x19\xae\x0d\x98\xd1\x91`2V\x0a\
-\xc8b\x91\x04\xfc\xe5\x8eX0P\xb6\xd48F\x02\x19\
-\xf1$\x9dJ$^\xee\x1a\x1a\xfa\xdf\xea\x17^ \xbd\
-\x8c\xcdy\x9a\x90\x9f\x5c\x1e\x1c\xf4\xc6\x8by\x17A\x00\
-\xf8\xb2@ \xa6\x14 \xf0\x08^<$S\x05\xd8g\
-\x14\xde\x8fId\x0c\x8cP\xe6\x83\x12\xdb\xb0\x01A\xcc\
-e@\x03\x7f\x127\x85\xc2b\x1e\xa4\xee\xdfWj\x8b\
-E\xe5\xe1\xdf\x96\xa9/H\xba\xe0<Q\x844\x0a\xc3\
-R=\xf0\xf3\xea>\xbe\x22\x15S\x00'^{\x8d\x1c\
-\xdf\xbf\xffPK2\xb9\xb7\xf5byoF\xa1\x00\xc2\
-\x0c\xf7,|\x81\xed\x1e\xf8\xb1\x80\xe5,K\xff\xd9\x8d\
-\x01H\x8a;.\x81\x04t\xad\xc3\x90\x95\x0b'\xec\xf4\
-\xd0\xd0\xa1\x96\xa1\xa1\xc7\xde\xde\xb7\xefm>\x9a9\xe6\
-2<?\xe1\x96\xb7\xf0\x88\x1b\x17\xa0HN9\xe0\x1e\
- R_\x06b\xd4\xf2\xc9f\xd4\x83\xbf\x81Jk,\
-Pf`\xfd}\xf2W&\x91eY\x05l\x9c8\xf4\
-S\x01\xd8\xa9\xea\xc2\xc5Jx\x01YQ$\xffM\x85\
-@ \xe62P8\x1d\x0a\x10\x0a$.\xe7\x9c\xf3s\
-\xcf\xad\xbe\x0b\xfe\xc9l\x96\x1c\xd9\xbb\x97\x9c\xae\xab{\
-\xb5n``W|r\xb2\x07\x00?#\xf1\xf9U\xe0\
-\xb71\xb1\xbc\xfd\xa7?\xa5\x98\xec\x9fK\xf0\xcf8\x01\
-\xe8\xfe9\xd5\xf3N\xf5\xd3\xa5\x91\xc0\x14r\xa2\x9c\xe3\
-\xf6\xb1\xb1S\xb5\xfd\xfd;N\xd6\xd4\xec\xe7E\x1c\xbc\
-b\xb0\xcc]\x8d\xd8r\x97 #B\xf90\xea\x02\xc0\
-\x1a\x02L!h\x5c\x1eh\xc1\xa4\xab=B\xeb-{\
-\x0d1\x98 \xa1\xaa>T)\x01\xe4y\x0a@Na\
-g\x9e\xe2{`\x06\x00\xc6E\x02\xc9q\x8d\x9b\x85\xa5\
-\xf1\xa8$\xcdW\xc8\xc8\xb8\xae\x9f\xe5\xfa\xfb\xde\xc2\x1d\
-\x83\xbd\xbd\xe4\x1f\xbbw\x93\xb6\xf6\xf6\xdf\xbf78\xb8\
-\xc7\x00\xf8\xa6\x96?\xf0\xd5\xb6o\xdb&\x95\xfd\xb3:\
-\xffk.\xd2\x80\x06%\xc0\xc1\xd7\xe2\xaf\x87\xbf\x85]\
-DH\xc2\x87\x8d\xf7\x06\x06\x9e\xcd\xd9vrb\xef\xde\
-\xff\xda\xf8\xa5/\x91\x157\xdf\xec,>I\xd9n\xf3\
-\xd2\xe1|\xde\x19\x14I\xc4\xa6\x10!\xbd\x06\xef\x13\xa1\
-\xc4UL\xfb\x89\xd2\xd6r\xc7\x98{\xc7>w\x09\x8e\
-/\x87VN\x12\x08\xd2\xfd\xbe2\x15\x81\x96\xe0\xc2i\
-\xc7\xa2U\xc7\x16\xdd\x10\xd3w\x98\xaa\x03e\xbfR\x05\
-\x00|}\x22\x93\xf9XJP\x18\xce\xe9#cp\xeb\
-\xfb,\xf7\xb7\xf7\xa6H\xc5\xdcE;\xf9\xdet\xf4(\
-ix\xe3\x8d\xfax:}\xa09\x99|\x87 \xad\xe8\
-\x9a`\x9fq\xc4\x7f\xfb\xf6\xed\xe6\xe9>\xf0\x1b\xcfF\
-O\xc0\xacw\x03j3\x03\xa2+\xe0W\x01D\x91\x1e\
-\xd4\xcd\x11\xc8\x22\xec\xcdo3\x0d\xf1\xf8\xff\x9d\xef\xef\
-\xdfv\xf8\x0f\x7f8\xd9X]=]\xe2\xc9\x03\x84\xdc\
-\xff\xe3q\x01\xd0QH\xb1\xc8\xb2\xaaw\x1c\xf1\x99U\
-\x810\xd3\xc7T\xd6\xd3\xa4\xf2\x8eHR\x8e>\xf0c\
--\xbd\x98\xe4G\xac\xbbX\x1f\x81\x16,!\xcaGi\
-\xedA\x84\x1f\xc6\x01P\x97\x0c\xba\x01\xae\xd4/\xa4\xf7\
-\x84\x95z\xb9\xfaK\xa7\xd3\xe4\xad\xe7\x9e#u\x07\x0f\
-\xbe\xfea\x22\xb1\x93\x81\xbfF\xbcV\x105yi\xe0\
-\x7f\xea)*\x03\xfb\xa5\xa8\xe7\xf9U\x00\x0a\x89*\xb3\
-TX\x95\x97w\x9fWCm\xfd\xf1\x8f\xd1Z\x1b\x89\
-\x12\x90I-\x99B\xa6gGF\xaa\xcbb\xb1\x13\xd9\
-#G\xfe\xbb\xff\xdc\xb9G\xee\xfd\xeaW\xc9\x12\xdeQ\
-\xc8.\x0eg\xd8(/\x1abj\x80\x88\x17\x96(\xc9\
-\xc5F\x0dA\xe6[ \x9a\xedY#K\x13\x13\xc1\x06\
-WX\x0a\x7f\x10SMX\xa3\x8c\xf4|\x81@\x9a%\
-\x14\xcd\xf8\x9e\x17\x94\x8d\xcc\xaa\xa3\xa9N\xf0Z\x15\x91\
-\x89\xbfk\xc1\xc2\x83\xba~\x0a\x94\x16\x95\x11!L#\
-\xf2\xf7\xf0@\x1f\xb7\xfe<\xd8\xe7\xe5\xf8\x99\xf4o;\
-y\x92|\xf0\xea\xab\xa4?\x99\xfc\xdd\x07\x89\xc4+\x12\
-K\x9f\x05\x86\x05.\xe6a\x1b\x83\xff\xe9\xa7\xe5\x96_\
-\xf7\xbb^N.\x80)i(I\xe0\x89'\xe8\xd6\x1f\
-\xfd\xc8\x84\x04\xa8\xa9\xfc\x07\x0a\x82N\xd96=\xc1|\
-\xbd\xacm\xf7N\xec\xd9\xf3?\xb7?\xf0\x00\xf9\xd4=\
-\xf78\x81!\xdeM\xe8T\x0e\xba\x1d\x85\x04\xba\x01\xd0\
-J\xc1\x854\x85\xc7\xe0\x84b\xe9\x09\x06\xf2\x9fJ\xd2\
-?\xf0\xf5\xa8[Pl\x8e\xd8p*0\x05\xa0\x84\x9d\
-kRW@\xa8\xd2\x0bXw\xa4\xe9\x05\xed\xee#\xfe\
-\x0e>\x0a\xef\xc3\xa0\xa5;3\x92\x93;\x07\xffd*\
-E\xea^~\x99474\x1c\xeeM\xa5^\xef\x9e^\
-\xa9\x17\x9b@\x05\xdbye\x0by\xe8\xc1\xff\xb3\x9fQ\
-t\xf0LX\xf0\xeb\xc8}\xa1\x11\x80\xb4\x04X(\xda\
-\x08,\xca\xe9\x91\xc0\x93O\xd2\xad?\xfc\xa1\x8e\x04,\
-\x05\x11\xe8v\xe7\xc4\x9dJ$^]>1qbd\
-\xff\xfeG;\x1a\x1a\x1e\xbe\xe3\x91G\xc8\xf2U\xab\x1c\
-%\xe0\xb5\x15\xf3\xf8\x00\xb4\x88\xb0u\x18\x82\x15-\xa7\
-\xc5\x1ay\x9cob\x17j\x12\xa8\xf0ZK\xd6_!\
-\x89\x88\xc3\xdf\xb7\x08\xdf\xad(\x05\x00-\xb4L\x9e\x11\
-q\xd1\x0d\xd3\xcf\x83\x95\x982?\x1f\xa4J\x0b\xf5\xfc\
-\x5c\xf6\xbb3\x22\x9a\xdfy\x874\xfd\xfd\xefdpt\
-\xf4\x85\x86\x8bm\xbc\xaa=\xcc,?\xfd4\xdf\x90\xe0\
-U\x05\x94\x17\x0e\x01h.6]\x1f\x80\xcfw\x04\xae\
-\x03/\x92\xd8\xfa\xf8\xe3\xbaA(v\x08\xe0c\x05\x1a\
-v|r\xb2\x9b\xed\xcf\x8ee\xb3g\x06\xf7\xec\xf9\xe2\
-\xa77n\x5c\xff\xd9\x07\x1f$\x1fc~\x22w\x07\x08\
-#\x02\xee\x12\xf8\xdc\x02\x00lKL\x1f\x8a\xb3\xeb\xc5\
-\xd9\x03\x92\x1a{\x0b\xe9o\xb7$1\x00)\xe8\x91\xf3\
-!\x1b\xc1\x15h;v\xdd\x00\x19\xf81\x8b.\x03\xb1\
-T\xee\x03y\xef\xfb\x0c\xf0<*\xf9E\xe0\xc3\xbf\x07\
-\xc7\x95\xb9V\xdf\xf3\xf9\xe3\x1d\x1d\xa4\xe1\x95WHO\
-g\xe7\x81\xb6\xb1\xb1W\xd8\xb9\xbe\xa0\x00\xbc\x0e\xfc\xa2\
-\xec\x87\xab`\x07\xdb{\x9fy\x86\x12E6c\xae}\
-\xfeyq\x01t\x99\x81\x80\x12\x90\x93\x80\x8c\x08L\xe2\
-\x02\xb0\xb0(\xb0\x7f42r\x84\xdd\xd6\xa4jk\xbf\
-~\xa1\xa9\xe9k\xff\xfc\x85/\x90\x7f\xda\xb8qz%\
-\x22F\x04\x8e\x12`$`{ME\xa2\xff\x8a\x94\xa5\
-\x12h\x99\x10\x85\x00\xe7\xcd[\x088T\xa0\xa70\x92\
-\x0b2\x16:\xf0\x8b\xd3p,Y\xa3\x0d\xf29\x18\x01\
-\x88\xae\x91\x07h\x8a\x80\x9eJb\x04\x14\xfa\xff\x88\xe4\
-\x0f\xfc\x0eB\xf3V\x8c\x7fw>1\xda\x0d\xf8e\x98\
-\x8a;\xf5\xd2K\xa4\xe5\xddw\x1b\x13\x93\x93\x07\xd9\xf9\
-=J\xf0\x222\x1d\xf0e\xfe\xbe\xb4\xc2\xcf\x01\xbe\x02\
-\xcc\xa1\x00~\xb9L\x04*\x9a\x04\xbc(\xb2\x84\x04x\
-\xc5\xd4\x169\x09x\x18P\xf5ZS\x03\x22\xe0'\xb7\
-\x8c\x1f3y\xf8\xc2\x8d\xa9\xd4\xb1\xa1\xbf\xfe\xf5\xe1\xf6\
-\x13'\x1e\xba\xeb\xd1GI\xe5M7M\x07\x089\x09\
-pU\xc0}Y\xb1\xbb\x10\xfa\xfcX\x0a\x8d\xafb\xe4\
-\x0d(\x81>!\xff,w\x19o\xccUR*\x01\x93\
-\x8b\xc7\x05y\x0c[i\xc7\xbd\xb5%\xef\x0b|\x8e\xc4\
-\x92\xa3\xa4`\x90\x1a\xf4\x91\x85w\x92\x10E +$\
-*\xc8}\xeeF\xb9C;\xcf\x1f?N\x1a\x0f\x1c \
-\x03##/\xbaM<X\x1f\x09\xe6\xe7\xe7\x10_\xdf\
-x\xfd>\xe7z\xdd\xb1C\xea\xf3\xcfg\xc4\x7f\xee\x09\
-\x00\xe9\xcc*V\x09\xf0\xca\xa9-?\xf8\x81\x8c\x04\xbc\
-x@\xcc\xc0%\xb0%\xbbx\x92\xf3}\xa9T+\xdb\
-wOLM5\x0f\xec\xda\xf5\xd0\xdaM\x9bn\xfb\xec\
-C\x0f9\x11d\x8b\xbb\x04n\xdd\x00\x15\x89@\x5cx\
-\x12\x04\xff\xb0\xf5\x0b-\x00nK\xf3\xbc.;\x80\x06\
-\x04\xc1y(,.\x89\xe5\xf9U\xe4!\xc4\x02(\x92\
-\xaaC\xc1\xaer\x13\x80\x9f/K\xf9a\x83Z}\xc0\
-\xe7\x01>\xb7\x9a\x93\xcb\xfdDW\x17\xa9\xdf\xb7\x8ft\
-\xb5\xb5\x1d\xec\x1a\x1f\x7f\x9d\x9d\xc3v$M\x8c\x81^\
-\xe6\xeb\xab\xac~\x10\xfc;w\xe2\xe07\x5c\xcek.\
-\xc1?{\x04\xa0\xa9`\xb3t1\x03\xf1\x82\x15|h\
-\xa7\x82\x8a\x1do\xd9\xb2E\x16\x1c\x84\x81A\x95\x1b\x80\
-\xb5\x1e\x8bJ\xc0\xb9=3<\xfc\x06\xbb}3]]\
-\xfd\x8d\xae\x93'\xbf\xfc\xc9M\x9b\xc8\xda\xfb\xee#e\
-\x8b\x17O\xbb\x03\x9ek\xc0O0\x8f\x11 \xb3\xdb\xc4\
-\x8a>\xee>\x14f\x0e\xc0l\x81\x07NW\x09\xc0\xf8\
-\x08q\xfb\xe1-\x0d\xe8\x1dR\xc2\xa6\xff\x08\x05N\xb2\
-\x22\x1f\x15\x09\xc8Rs\x98\x95\xc6\xd2y>+/Z\
-x\x10+\xf0\x01\xdf\xcd\x1cX\xae\xdc\xa7\xee\x9a|N\
-\x97\xa2\x07|f\xf19\xf0\xcf\x1c<H:\x1b\x1b\x9b\
-\x87\x98\xdcw\x1bxr\x1a\xc0c\xa9=S\xab\x1f\x00\
-\xffS?\xff9\x0d\xd4\x7fHR\x7f\xd28\xc9\x1co\
-\xa5s\x05\xfc\xd0$\x00-\x97\x80l^P\xb1e\xf3\
-f\xd3\x0cA\xb1J\xc0\xd7\x85\xc8W*^4<\xfc\
-R|t\xf4\xcb\xe7kj\xbeRu\xf7\xdd\xe43\x8c\
-\x08\x16\x95\x97\x13\x8b\xbb\x04\x9c\x0c\xbcA\xa4\xfc\xfb!\
-\x83\x1c\x03\xeb\xcb\xb9n\x01lO\xb6\x80\x1c\xb6@\xa0\
-0\xe0>\xf1\xf7\x8b\x96]\xa6\x00D\x7f\xdf\x04\xfc\xf0\
-\x22\xc6\x82v\xb2@!\x0c\xe6\x81\x98@\xa0H\xc8\xfd\
--\x02y|\xd7\xd2{\xf9|\xcb\xab\xe3w\xf3\xfa}\
---\xa4\x89\xaf\xc8\xd3\xdc\xcc\x81\x7fH\x00\xbe\x0a\xec\
-:\xe0\x9bF\xf9}\xe0\x97\xb9d\xd4\xe0\xf7\xa5d~\
-\xb69\xaf\x03\x80%\xb5aH\x22$\x09\x10\xc5\xc9\xb3\
-\x15q\x00XiX\xea)\x82t.\x97\xaf\x8f\xc7\xff\
-t\x0d#\x82ucc\x0f\xb7\xd5\xd6~\xc3!\x82\xfb\
-\xef'K*+\x1d\x22\xe0*\xc0vK\x8a\x039o\
-!\x1d\xe6\xc5\x02\x9c\xef\xe9\x81\xd7\x0bh\xf0cD\x0d\
-H\xe5>v\x01\x89@\x17\x14\x80\x03&aq\x0cX\
-\x07@\xb1\xc0\x9f\xe8\x02\x80\xe7|D\xa0\xa8\x15\xa0\x8a\
-[\xf13l\xb1$\xd9[\x89\xc7\x03\xbd7\xa7\x8f\xed\
-\xbd\x1f~H\xce0\xe0_hm\xfd \x9eN\x1fl\
-N&\x8f\x93\xe0\xcc\x88\x9cB\xe6\x8b\xa0\xcf!\xc4\xaf\
-\x0a\xf4\xf9\xbe\xf0S\xbf\xf8EP\xf6+b\x00\xca\x5c\
-\xff\x0c\xbeva\x11\x00\xe2o\xfa@\x8e\xa8\x07Y\x07\
-\x98W\xa6\xca\x0b,\xb6<\xf6\x98\xaa\x16\xc0B\x5c\x02\
-\xbe\x97H\x94@\x09\xc1\x07\x93\xfa\x88 \x93\xcf\xe7N\
-&\x12\xfbbCC\x7f[\x9fJ=|\xae\xb6\xf6\xc1\
-O\xde}\xf7\xcd\x9f\xf9\xfc\xe7I\xf9\x8a\x15\x05E\xe0\
-\x90\x81\x0bpO\x15Pd\xd2-\x94\xff\x14\x14\x17\xd9\
-\xee\x12\xe8^\xc4\xbb@\x12\xe0K[\xb0U\x16Zx\
-a\x99k\x22T\xffY\xc0\xe2\x8a\xe7\xccV\x04\x031\
-\x89\xef\xed6\xe2\x0a\xd8HZ0\x10\xd0\x83+\x04q\
-\x1f\xdf\x9b\xce\xcb\xa4~g}=ibR\xbf\xaf\xa3\
-\xe3\xbd\x01\x06|w5\x9e\x5c\x11{^#\xf7\xb5\x92\
-\xdf\x01\xff/\x7fI\xbd\xfa\x06[\x97\x125\x18\x93\xa6\
-\x8d\xfc\xcb23\x0b\x96\x00\xc2\xd6\x09H\x88\x00\x0d\x0e\
-\xb2[@\x02\xaa4!$\x02\x8c\x04J\x89|:\xb1\
-H\x04|\xcf\xb3\x13\x9e?5]F\xfa\xdapu\xf5\
-\x17[\xeb\xea\x1e\xac\xba\xf3\xce5\xb7~\xees\xe4\xa6\
-u\xeb\x9c\xd4a\xccM\x1bZ^\x0d\x01\xe2\xe7Q\x98\
-\x97\xf7\xdc\x021\x18(\x82\xcc\x8b\x05`Kx\x8b\xe9\
-D\x00x4\xf8G\xf0\xc6\x1e\xe5\x05\x07\x83v\xc0\x1d\
-\xf0\xc9~\xd1\xff\x17k\x01\xc0r\xee\xe2\xe4!O\xea\
-{\xfd\xfa\xd9\xc9I\xd2\xcd\x80\xdf|\xf80\xe9\xef\xee\
->\xd6\x97J\x1dl\x1f\x1bk$\xfe>\x90\xbc!\xe8\
-e9\xfdp\x92\x9f\x03_\x92\x15\xc1\x02\x80Zk>\
-\xc3\xc0\x9e?\x02(\xa2\x0a\xcd`h\xe8t H\x9c\
-\xe0#\xa8\x03\x9es\xdd\xf2\xfd\xefc\x95\xc5TC\x04\
-1pK\x0d\xd5@N \x02\xbe\xe7>\x1c\x1az\x8d\
-\xdd\x1eX\x9bN\xff\xcb\xf9\xfa\xfa\xff\xa8\xa8\xac\xbc\xb3\
-\xea\xde{I\xd5\xc6\x8d\xe4\xfa\x95+\x0b\x85D^\xe6\
-\xc0w\xf1\x08\x91\xed\xc2*)\x82Oo\xc3\xc1\x9e\x92\
-<\xbf\xaf\xbb\x12\x0c\x1e\xb5L@\xae\x8bNc\xf2\x16\
-)\x0c\xa2\x982 \xc2\xb2j\xa0@\xca\x0b\x8azQ\
-}\xafc\xef\xc2\xe9\xd3\xa4\xed\xd81r\xa1\xb1\x91\x8c\
-\xa6\xd3otOL\x1c\xec\x9d\x98h5\x00~^!\
-\xf5mM\x90O/\xf9=\xf0K\x80\xae\x0b\xe6Q\x83\
-\xbe\x8a+6\x06\x80\x92\x84\xe7\x93j\x9a\x87\xd0\xb8\x80\
-\xfb\x98Wx!\x10\x01\x95\xb8\x03\x16\x02\xfa\x18\x92\x11\
-(\x15\x88\x00\x03?$\x02\xe7\xf8\xect\xb1IM\xc5\
-\xf0\xf0\xb2\x9e\x81\x81\xfb\x1b\x0f\x1d\xbao\xf9\xea\xd5\xab\
-o\xdd\xb4\x89\xac\xb9\xeb.r\xcd\xe2\xc5\xd31\x02v\
-\x918\xca\x00T\xbd\xa1\x037D\xab\xe9\x91\x02\x07\x8a\
-\xe47\xb5\x90t\x9f4\xf0gB\xd6*\xc0#V\x90\
-\x22\xee\x1a\x15\x81.v!z\xcd:.\xf0\x13mm\
-\xa4\xb3\xae\x8et\xd4\xd6\x92d2\xf9~br\xf2p\
-\xdb\xd8\xd8\xfbS\xb6\x9d!\xc1\xeeO\xdd\xb1\xce\xc7\x0f\
-e\xf5\x1d\xf0\xff\xeaWr\x7f?d\xa4\x9f\x1a\xfe\xee\
-a\x88\xfa\xf2 \x80\x22\xb3\x03DC\x02Npp\xc7\
-\x0e\xba\xe5{\xdf\x0b\xa3\x06( \x02\xd1\xfa\x97\x08\xbb\
-w\xf1\x94\x00\xf0C\x12\xe0\xcf\x97\x8ed2\xfdl\xe7\
-\x83$_\xbeyt\xf4\xd6\xae\xb6\xb6\xfb\x97\xec\xdb\xf7\
-o\xab6l\xa8\xa8\xba\xe7\x1e\xc2nI\x09\xf7\xf7=\
-\xd7\x00\xd4\xb5[$\xb8\xf0\x88%XQ*\x02L\x95\
-\xc7\x07$\x00\x01h|Q\xc1\x16e\xd5\xc5/\x8eX\
-G\xfe\xa6\x05\xea\xf5\xd3##\x8e\xa5\xe7\xa0O\xf4\xf6\
-\xb6$3\x99c\x0c\xf4o\x8fOM%\x11\xf2\x0ds\
-\x8b\xf9\xf8y\xc4\xda\xcb*\xfa.J\xfe]\xbbh\xa0\
-\x14\x1a\x93\xf3\x0b\xa0\xbc\xf7\xb2%\x00Y\xe0\x0f\x06\x10\
-\xc5zy\xb4^`\xe7N\xca\xdf\xbf\xf9\xbb\xdf5Q\
-\x03\x96$U\x18C\xacD\x89@\x00\xe2\xadG\x02%\
-\x80\x08\x9c\x9d\xc9\xd6f\xb6\x9fg\xc7\xbf\xff\xf4\xc4\xc4\
-\xc6\xf3\x0d\x0d\xff~\xfdu\xd7\xfd\xeb\xcau\xeb\xc8\x0d\
-k\xd7\x92\x95\xb7\xdfN\xae[\xb6\xcc\xefO#\xb5\xf3\
-\x04\xa9\x0b\x80\xeeC\xc0\xa5B\xca\x91\xa9nm@E\
-v \xa0R\xb0 \xae\xb8\xee\xa2\x00\xf6Bd\x9f\xbd\
-v\xb0\xa5\x85\x0c67\x93>&\xef\x07ZZ\x86\xc6\
-\xb2\xd97{R\xa9\xea\xfeT\xaaK\x11\x7f\xc9)\xc8\
-@\xb6\xdb\x92\xb4\x9e\xb9\xd5\xe7\xe0W\x04\xf6B\x17\xf8\
-\xcc\x93\xbf\xbf\xb0\x08@S\x85F\xc5\x82\x19]\xec\x00\
-\xd6\xb4\x0b\xb9Y\x81\x04dj\x80J\xe2\x001@\x02\
-y\xa0\x08J\xc0c9\x0c\xfc\x021\xf0\xcf*iI\
-&\x8f\xb3\xbdnq\x22\xf1\xec-\xf1\xf8\x86\xf2w\xdf\
-\xdd\xb0\xa8\xb4\xf4\x8e%\x15\x15+9\x19\xdc\xb8~=\
-Yq\xdbmdqe\xa5\xaf\xdc8\xe0\x83\x0b\xe9?\
-q\xf5TO\xea\x07\x5c*\xc9\xca>\xbe\xa0!P\x05\
-4$iX`-\x02\x11\xf4\xf1s\xe7\xc8\xe0\xd9\xb3\
-d\xf0\xa3\x8f\xc8\x00\xdb\xd3\x99\xcc\xe9T.wf(\
-\x939\xd916\xd6\xa4\x09\xbc\xcaH@\x07|\xf1\xdc\
-QbV\xcd\xe7\x07\xff\xaf\x7f\x1d\xbe\xac\xb7\x88T\xe0\
-\x5cE\xfdg\x87\x000\x10\xeb\xcaLM\x83\x83\x1ay\
-\x8b\x11\x85\xa8\x06\x9c\x1c-W\x03\xdf\xf9\x8eJ\x0d@\
-\x97\xc0\xd2(\x02\x11\xf81@\x02\x10\xf89\xe4u%\
-\x13\xb9\x5c\x96\x0f&\xe1\xf1\x02~\xbf\x22\x1e_zc\
-o\xef\xfa\xebkj\xee\xf8xi\xe9\xed\xd7-_\xbe\
-\x82+\x04\xae\x0e8!,\xaa\xa8\xf0E\xd2\x0b\x95\x82\
-\x926`K\xe6\xdf+\xe2,\xd8s\xd8\xe7`\x0a\xc0\
-\xab\xd4\xf3\x08`\xb8\xa3\x83\xf475\x91A\xb6s\xc0\
-\xa7&&\xcer\xc0'\xb3\xd9\xd3\x9d\xe3\xe3\x8d\xcc\xa7\
-\xcf\x12I\xd1U\xc8\xdd6\x88\xea\xc3\xce=\xd9\x00\x99\
-\x8b\xc0\xdf\xbd\x9b\xfa\xda\x97\x11w\x88\x18,\xdcIu\
-\x00\x9eg\x150\xb7Y\x00\xc9\x1c\x00)i\x00\x8bn\
-\xe46\x88\xd3e\x84\xd4\x12\x8f\xdcn\xfe\xf6\xb7Uj\
-\x00\x0b\x14B5\x10\x13\xee\xe71`\x0b\xf7s\x92\xc7\
-\xe1}\xe7v$\x9b\xedc\xfb\x00;>\xc2\x1f[6\
-4t\xc3\xca\xae\xae\x0d\xe5G\x8el\xb8\xa6\xa4d\xdd\
-\xb5\xe5\xe5K+V\xaf&\xd7\xdfr\x8b\xb3\xf3\xe3\xca\
-5k\x02~|\xa0\xcc\xd7t\x13I\x14\x91\xf5\x10\xf4\
-\xde\xf9\x9b\x1c\x1f'\xc9\xeen2\xca\xf6\x91\xceN2\
-\xc2\x80\xcf\xc1\x9f\xcd\xe5\xda\x18\xe0\x1bG\x19\xe0\xbb\xc7\
-\xc7O\xa7\xf3\xf9\x94\x04\xa0y\x09\x01\xd8\x06\x80\xc7|\
-{S\xa9\x8f\x02\xffi\x06|\x8aE\xf4u\x13\x8e\x8a\
-\x08\x08J\xad\xbcjN\xc2\x0c\x93\xc6\xdc\xb8\x00\x97\xa0\
-\x02|\x1a]\xe76\xc8\x02\x84 }#\x10\x01Ux\
-\x16P\x0d@\x22P\x91AL\x02\xfc\x98\x8c\x00\xc0\xe7\
-\x96$&'{\xd8\xde\xcb\x8ey/B\xac<\x1e\xaf\
-X\xde\xdb[\xb5\xa4\xbe\xbe\xea\xe3%%k\x18)|\
-\xa2,\x16\xabZTY\x19[\xb4t)\xa9\xac\xaa\x22\
-e\xd7^K\x96\xdcp\x83\xa3\x88\x1cr`\xdb\xc7\xca\
-\xcb\xc9\xe2e\xcb\x8c\xfc|x<\xd2\xde\xee\xfc~\xd9\
-t\x9aL\xf4\xf7;\xc7\xc3\xec\xb1\xa9T\x8a\x8c\xf7\xf5\
-\x91dO\x0f\x99\xcadF\x995\xef\xca\xe4\xf3\x9d\x0c\
-\xe4\x9d\xcc\xc2\xb7\xf1T\x9dMi\x8e\xe0%\xd7\x18h\
-\xf3\x0a2PYx\x95\xb57\xf1\xf1\x03\xe0W\xa5\xea\
-\xb4\xe9;\x1d\xf8gz\xa9\xef\x19 \x82\xd9\x19\x08b\
-\x02xYo\xba*\x0a-\x0e\xae\x08\x11D\xa4\xa0\xd5\
-\xd6!\x02v\x7f\xf3\xb7\xbe\xa5\x1b6B\x91\xb4\xa1H\
-\x04\x96p,\x06\x06!\xa8K4\xb7\x18\x09\xf8vf\
-I\x07\xd8>\xc8\x8e\xeb\x85\xbfk-\x8d\xc7\x97-)\
-+[V\xde\xd8xk\x89e]\xcb\x88\xe1F\xfe\x1c\
-'\x08\xc7\xb0[V9{\xdc\xc7\x00\x9c0\x1c\x97B\
-\xd8\xb8\xf5.L>r7\x06\xec\x0e\xfe}\x19\x98S\
-\xec\xb8\x8f\x87&\xd3\xb9\x5c{\xce\xb6S\xe3\xb9\xdc\x85\
-\xc1t\x9a\x03\x7f\x92\xc8\xdb\xacU\xa5\xd62\x02\xd0\x91\
-\x84j/\x0e\xf8\xbf\xf9\x8d2\xc2_x\x83Ie\x9f\
-a_\x85i\xff\xc5l\xbb\x0a\x0b.\x0bPt\xaaP\
-\x96)@\xa2\xb5\x9e\xab\xc0\xa3\xbb\x9b\xbf\xf9M\xd5\x9c\
-\x01\x98!\xb0\x10\x22\xb0\x11E\x10\x13\x88@\x06p\xdd\
-}\xb8[\xc8\xb15\x94\xc9\xf4\xb2\x9dO\xb89-\xc9\
-n\xc0[R\xc9HcqY\x99\x8f\x01\xfaR\xa9\x0e\
-\x06\xec\x1c\xf2[\xe8\x06\xad\xda\xc4p\xe0\x8aF\x0d\x98\
-\xdcW\x01><\xf0\xf7\xec\xa1\x01\xcb-\x93\xf2\x0a\x99\
-N1u\xb0\x80\x22\xfdJ\xe1'2\xd6\x7f2\x09\x19\
-v{`\xd5*r%lo\xf6\xf4H\xd7\xdcD\x00\
-e\x89 \x04\xc7:\xf0\xea\x80\xaezo\x0c\xf9[\x96\
-bG\x09\x80h\xe6\x93\x86 \x00;\x84\xf5\x9f\x89\x9d\
-\x16\xe9\xdfS\xe4\xba\xa5W\xc8u[\xd4\xfb\xfe\x96J\
-]\x9e\x0a`\xb66\xef\x82\x00D\xa0R\x04\x16\x88\x17\
-@E`)\x5c\x05\xab\x08\xc0\x87\x05\xbf\x8e\x04ta\
-\x17\x13\xeb\x1f\x86\x04\xa8!\xb0u`W\x81\xfe\xaa\x01\
-\xfeU\xeb\x02, \x22\xc0\x0a\x8a\xa8@\x06\x96\x02\xb4\
-1\xc3cK\x03\xfc\x98\x06\xf43A\x00\x84\x98MY\
-\xa6\x0a\xb0\x9a\x12\x03\xd5\x00^\x96\xbf\x8f\x80\x1f\x11\xc0\
-\x9c\x13\x01\x965\x80.\x82\xadq\x15\xac\x22\xc1n*\
-\xfd\xc3\xc8\x7f\x95\x0b@\x14\xc0\xb3C\xa8\x820\x007\
-\xb5\xf4Tu~\x22\xe0G\x040\x17D@%\x04\x00\
-\x8b\x8cb\xc2\xb1\x0c\xcc1\xc3\xe7\x8a\xb1\xfc&\x0a\xc0\
-\x94\x04D\xf0\xd9\x06\xee\x81\x0e\xe0a\x01\x1fY\xfb\x88\
-\x00\xe6\x9e\x08\x00\x19\xe8\xd2\x872E`\x85\x04v\xcc\
-\x10\xf4\x18\x09\x84Q\x00\xa6\x04\x10\xc6-\xa0!\x81n\
-\x02\xfa\x08\xf8\x11\x01\x5c6\xaa\x80\x12}6\xc1\x0e\x11\
-\xcc+\xd6\xe7We9h\x08\x22\x98)2 !\x82\
-xTE\xb8\x11\xf0#\x02X\xe8\xaa@F\x06\xc4\x00\
-\xe4\xc4\x10\xf0a\xc0oi\x00\x7f\xa9$@\x0c\x00O\
-\x0c\xfd\xf9\x08\xf4\x11\x01\x5c\xb1d@\x0c@\x1c\x16\xf0\
-a\x03\x7f\x97\xe2\x0e\x84!\x06\x9d\x0fO5d\x14\x81\
->\x22\x80+\x86\x0cd5\x05\xc4\x10\xd8*\x90\x87\xb5\
-\xfc:\xe0\x17C\x04an#\xd0G\x04p\xd5\x91A\
-1\x84@.\x01\xf8\xc5\xa8\x00\x13\x120%\x87\x08\xf0\
-\x11\x01D\x1b\xbc\xb8C\x10\x02!\xc1A&\xc5X\xfa\
-b\x15\x80\x09\x80C\x83=\x02|D\x00\x11!\x80M\
-\x11?\x80\x8a\x80\xce \xe0g\x82\x10\xb4`\x8f\x00\x1f\
-\x11@\xb4]\x1a)\x98\x80\xd12\x05\xe3\x0c\x11A\x04\
-\xf4\x88\x00\xa2m\xaeI!\x84r\x98\xb7\xff)\xda\x22\
-\x02\x88\xb6\x05D\x12\xd1\x16mp\x8bE?A\xb4E\
-[D\x00\xd1\x16m\xd1v\x15n\x16\xa5\x91r\x8c\xb6\
-h\x8b\x14@\xb4E[\xb4E\x04\x10m\xd1\x16mW\
-\xcf\xf6\xff\x02\x0c\x00t\xf6\x9b-\x97\xcb\x88\xbd\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x8bt\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00\x00\x04gAMA\x00\x00\xaf\xc87\x05\x8a\xe9\
-\x00\x00\x00\x19tEXtSoftware\
-\x00Adobe ImageRead\
-yq\xc9e<\x00\x00\x8b\x06IDATx\xda\xec\
-\xbd\x07\x80dgq.Z\xff\xe94\xdd\x936\xefj\
-\xb5Z\xad\xf2*\xaf\x02\x12\x88 0\x22\xcb\x12 \xa2\
-\x84\x04\xc8\xe6\x1a\xfb\xc9\xef\x02\xbe\xe4h\xc0D\xdb\xf8\
-\x99g\x1b\xe3k@&\xf8\x92\x0c\x22\x9b`\x11\x04H\
-\x04\x81\xac\x9cW\xbb\xda]\xed\xee\xec\xe4\x99\xce\xa7\xee\
-\xf9\xff\x93\xeaO\xe7\x9c\x9e\xe9\x99\x9e\x95\xbaW\xad\xe9\
-\xe9\xe9\xe9\xe9\xees\xaa\xea\xab\xaf\xbe\xaab\x88\x08\xfd\
-K\xff\xd2\xbf<6/N\xff#\xe8_\xfa\x97\xc7\xee\
-%O\xbf9\xfa\xd2J\xc7OP<su\xffS\xec\
-_\xfa\x97\x1e]\x1a\xb7L,\xe8\xf7\x1e\xban\xbe\x8f\
-\x00\xfa\x97\xfe\xa5\x8f\x00\xfa\x97\xc3\xd9\xfb\xb3^\xbf\x06\
-\x0f\x01\xf6I\xa4\xbe\x03\xe8_zl\xe4\xddz\x0c\xbd\
-`\x96\x9f\xa7\xbd\xbe\xbe\x83\xe8;\x80\xfe\xa5;\x86\xce\
-\x16q_7\x1d\x00\x1a\x9e\x0fm\xbfkz_}\xa7\
-\xd0w\x00}\x83O6x\x96\xf0}\x96\xdb\x0bu\x04\
-\x98\xf1~Tn3\xcb\xf7\x98\x155\xf4\x9dB\xdf\x01\
-<V\x0d>\x8b\xb1\xb3\x0c?[\xa8C\x80\x05\x1a\xfd\
-B\xeec\x96\x9fk\x9fO\xdf!\xf4\x1d\xc0c\xc5\xe8\
-\xd9\x22\xbefu\x0c\x8bu\x00IF\x9d\xf4\xd5t\x1f\
-\xeb\xd4!\xf4\x9dA\xdf\x01\x1c\xeeF\x9f\x14\xa5\xd3\x0c\
-\x9b\xa5\x18=\xcb\x88\x14\xb2:\x01[\xe4W\x0d5\xcd\
-\xe0\xd5\xdb\xb6\xc73K\xea\xd1w\x06\x87\x83\x03\xb8\xf7\
-\xbd{\x1e\xf3\x1f\xe2\xd1\x97V\xb2\x1a}'F\x9ev\
-?\xa49\x87\xdc\xc6\x81ul0\x7f\xa4\xb8\xa3\xe0l\
-\x01\x87\xad\xcd\xf4\x86\x9a\xee\xfd\xe8\xe2,\xbf\xd9\xde=\
-\x7f\x1b6\xddv\x06\xc37}\xdf\xc9\xfd\xea\xedTg\
-\xf0\xd0u\xf3\x87\xbd3\xf8\xf8O\xffdQ\xbf\xff\xd7\
-\xb7|\xb6\x8f\x00V\x90\xd1w\x02\xd9\x17uu\xd6\x96\
-F\x9c\xd1\xc21\xac\x98;\x05\x1cX\xcb\x1cv\x8c\xf7\
-\x93\xe3\x80\xb1a\xef\xeb\xa9\xfc\x8fl]s\x14\x1c\xb3\
-\xeeX\xf1\x07\xb7\xad;\x06\xd6\x0f\xad\xcb\xf4\xde\xee~\
-\xe4.\x98\xae\xcd\x88\xdb7\xad\xbe\x09j\xad\x1a\xbf9\
-\xe3\x99\xe1N@\xdc\xe3}=\x80m\xbc\x1d\x5c\xdc\xef\
-9\x87\x87[\x0f\xcc\xde\x96\xc1\xd8;\xb9fr\x06\xe1\
-1x48\x82~\x0a\xf0\xe8\x8a\xf6Y\x8d\xde\xc9r\
-\x7f~\xdb\xd0Il w&\xcb\xb1\x93\xbd\x9f\x9c\xe8\
-\x19\xf9\xf6\xd5\x83k\x8e<c\xcb\xe9p\xf6\xd6\xb3`\
-\xc3\xc8&\xd80\xb4\x1e6\xaf:\x0a\x8a\xb9\x02\xac\x19\
-\x5c/\xcc\x04\x03[\x89\xfe\x9f\xd5L\x98\xff\xbf\xe8\x85\
-3\x06\x8dVcx\xba6y\xfa\xf8\xfc\xa1\xd3gj\
-\xd3p\xf7\xfe\xbb`\xff\xf4~\xb8\xe7\xc0=p\xe3\xf0\
-\x8d\xfc\xb9\xb9C\xb8\xcbC\x0ewB\x0b\xefqg\x9a\
-\xb7\xb4\xf7U\xf7{\xbf\xeeZ\x8c\xdc\xed\x963\xa0\xc7\
-\xa4\xef\x0c\xfa\x0e\xa0\xd7\x10\xbf\x13\x83w\xd4\xdb\xcep\
-\xa1\x92\xdb4p>\x14\x9d\xf3\xbd\xa8~\x8e\x07\xdb\xcf\
-9k\xeb\x8e\xc1\xc7\x1f\xfb\x048\xf5\x88Sa\xcb\xea\
-\xad\xb0nh\x03T\x0a\x83\xbe\x81\x07\x86No7Z\
-M\x88\xcc\x1fe7\xe0\xdf\x85\xc6w\xc3\xc8[\x8an\
-3\x16\xbc@\x06\xa3\xe5\xd5\xb0\xaa\xbcF<v\xc7\x96\
-s\x85c\x10?\xf1\xbe\x8c\xcf\x8d\x9d\xfa\xc8\xf4\xbeS\
-\x1f\x1c\xbb\x1fn\xdf{\x1b\xdcp\xef\x0d\xf0\xf0\xfa=\
-\x1eZ\xc0\xdfb\xcb\xbbV\xdb?n\xed\x9c\xbd\xdb`\
-\xfcn\x87N\x81%\xf0\x14}T\xd0w\x00=\x8f\xf6\
-,\xcd\xc8\xd5\xaf\xf9\xa3\x07\xb7{\xb9\xfa\xb3\xbc\x08\xff\
-\xa4\xca\xc0\xe0\x93\x9fu\xea3\xe1\x09\xc7]\x00'n\
-\xd8\x0eG\x8cn\x81\xbc\x93\x17F+\xae\xe0\x7fm\xb4\
-\x1b\xda}\x88.\xb9\x1d\xde\xef\xca\x8fI\x84\x01L\x18\
-5S\xbfJ\xb7\x1d\xefE\xcb\xf7s\x0f0<\xb0\x0a\
-F\xbc\xebI\x1bO\x81\xe7\x9cz\x09\xbc\xf1\x99\x0c\xe6\
-\x1a3G\xee\x9e\xd8u\xe4\xed{o\xbd\xe4?o\xff\
-\x1e\xfcv\xf4\xe6C\x1eJ\xf896\xdc\xef\xba\x93\x8d\
-\x9f\xb5\xf7\xd7\xc6\x02\xa379\x81,\xce\xa0\x9f\x1e\xf4\
-\x1d\xc0\xb2\x1b~R\xb4\xb7ExG\xbd]8q\xe4\
-\x19\xac\xe8<\xc7\x8b\xf0O{\xc2\xf1O\xd8\xf4\xbc\xd3\
-.\x86\xd3\x8e<\xdd\x8b\xf0G\xc7Q=0d\x0f~\
-\x07\xc6\xeb\x82\xebzWa\xd4.\xb4\xd1\xff\xbe\x8d-\
-\xefk\xdb\xfb\xea]\xdd\x96wm{\x8fi\x8b\xc7\x05\
- `A\x17\x16\xa4\x02\x8eg\xf49'\xe7]\xf3\x90\
-c9q\xdb\xe1\xdf{\xb7\x1d~u\x1c\xf1\x18~\x15\
-\x0e\x22p\x14\xa5\x5c\x19NX\xbf\xddsd'\xc3e\
-g\xbd\x8cs\x09kw\x1e\xba\xff\x92\x9f\xdd\xfb\xd3K\
-\xbe\xf5\xdf\xdf\x82\x877\xee\xfe=\xb6\xdd\xebq\xa6\xf5\
-\xe5\xd6\xae\xb9\x07\x14\xe3w;@\x08VT\xd0w\x04\
-}\x07\xb0T\x86\x9f\x14\xedU\xc3\x17W/\x97?\xc5\
-\x19\xcc\xbf\xa8P,\xbe\xe8\xb2s^\xb8\xfe\xa2\x93\x9f\
-\x05\xdb7\x9e\x0c\xe5B\xc53V?Z\xb7\xda-@\
-70nqm\x0b\xe3n\xb9\xbeq\xb7\xdc&4\xdb\
-M\xf1\x95\xdfO\xf3{\xb4\x07\xc4\x85]\x82_o{\
-o\x85\xffM\x09\xfe\xf8\xdeA|\x9f\xcf\x15<\x94R\
-\x08\xbe\xe6\xc5U8\x89\xc89\xe4\x84s\xc8{_C\
-\x87\xf0\x9a'\xfd)\x1c\x98\xd9\xb7\xe3\x96=\xbf\xdb\xf1\
-\xa5_\x7f\xe9\xf57\xaf\xba\xf9\xb7\xd8t\xbf\xee\x8e\xd5\
-\xbe\xda>X\x1f78\x017\xf8\x1c]\x0b\x97\xc0,\
-\xc8\xa0\xef\x08\xfa\x0e`\xc9\x0c_\x85\xf7\x9a\xe1\xe76\
-\x9579k\x8a/\xce\x17\x0b\x97=\xe3\x94gl\x7f\
-\xe1Y\x97\xc1\xe9G\xee\x80\x82g,\xbe\x81#\xd4=\
-8\xef\xba~\xc4n\x89\x08\xee\x19\xbagp\x1c\xe67\
-\xbd+\xff\x1a\xe5\xf2J8G\xe8\xd1\xf9\x8c1W\xc0\
-\x11G\x1dj\x12\x8f\xc0\x11B1W\xf4\xdegp\xf5\
-\x1cD.\xc7\x1d\x01w\x0e>ZXSY\x07\x7fp\
-\xe2\xb3\xe0\xa2\xed\xcf\x81\xc9\xf9\x89sn\xb8\xef\xc7\xe7\
-|\xf6\xa6\xcf\xbd\xef\xfeG\xee\xfd\x81\x97&|\xb1\xb5\
-{\xfe\xfb8\xdf\xaa\x1b\x1c\x01\xfd\x9eu\x92\x1e\xf4\x1d\
-A\xdf\x01\xa4\x19\x7f'\x86o4zgUq8\xb7\
-q\xe0\xd9\x1e\xc4\x7f\xd1\x99G\x9f\xf5\xd4+\xce{\x05\
-\x9c\xb7\xed\xf10T\x1a\xf2\x8d\xde\x8b\xf0\xf5V#\x80\
-\xed-\x11\xf5\x9b\xc2\xe0\xeb\x1e\xdc\xaf\x05\x06\xdfS\xf3\
-\xee\xc0\x0f\xa0db\xe1\xf7n\xdb\x15N\x0c`\xde\xff\
-\xd0<\xc4P\xca\x0f@1_\xf2\x1cC)B\x0b~\
-:\xe1x\x9f\xcd0<\xf7\xb4K\xe1\xe2\xd3\x9f\x0f{\
-\xa7\xf6<\xe3\x87w}\xff\x19\x9f\xbd\xf1\xb301}\
-\xe8\xf3n\xb5\xfd\xc5\xd6\xfd3\xbf\x16`$\xd9\x19\xf4\
-\x1dA\xdf\x01,\xab\xe1\xab\x10\xffT\x0f\xe2\xbf\xaaR\
-\x19\xbc\xf2\xf2\xf3/\x87?<\xe3R8r\xf4\xa8 \
-\xd2\xc7F\x1f\xc2xn\xe8\xf5f\xd5\xbb\xbf\x16\xe4\xeb\
-\x08\x8f\xbe\x11\x8d!r\xf1\x5cAc\x0e\xaaM\x7f\x12\
-\x0dw\x00\x03\x9eC\xe0N\x81#\x84\xd0!pd\xb0\
-qx\x13\x5cy\xde\xab\xe0\xf2\xf3\xae\x82\xbb\x1e\xb9\xed\
-\x8a/\xfe\xfa\xdf\xaf\xf8\xee\xe0\xf7vz)\xc2\xbf\xb5\
-\xf7U?\xebN6\xa6\x15\x07@\xd3\x83$G\xa0\xf1\
-\x05\x8fuG\xc0hIh!#\xc1\xc2\xd1B\x8f\x02\
-\xc3\x87\x8c\xb9\xbdz\xcd\x15N\x18~:\x1b\xc8\xbd\xf2\
-\x84\xcd'>\xe3\xcf.|-\x9c\xbf\xed\x89\xde\xc9\x5c\
-\x8c\xa2\xbd \xe7x\x94\xf7\x0c\xbf\xe1!\xda\x9ag\xf4\
-\xdc\x10\xfc\xcf~\xe5G\xf9%;\xf9\x82\x12\x22'\x17\
-9\x0f\x22\x9c\x81\x87\x10D\xba\x10\x11\x8d\x8e@\x083\
-\xf5i\xf8\xfe\x1d\xdf\x81\x7f\xfe\xc9'a|z\xfc\x13\
-8\xd5\xf8L\xeb\xe1\xf9\x9d\x81\xc1\xb7-\x9c\x81\xca\x13\
-\x00\x98\xd5\x8c\xd0+'\xb0h%\xe0\xdf,L\x09\x18\
-\xda\xedc\x0a\x01\xa4D\xfdN\x0c?\xc7\xbf\x16\xb6\x8f\
-\xbc\x9c\x15sW=m\xfbSw\x5c\xfd\xa4?\x82\x93\
-6\x9e\x1a\xb1\xf4u\xcf\xd0yn,rxn\xf4^\
-\x94\xafz\x11\x90\x93z\x88\xf1\xb9\x87\xa9Fr8\xc7\
-\xfe,\x11\x08\xc4\xe7\xc4+\x1d<M\xe0\xdcH\xb90\
-\x08\x03\x85\x00\x19\x04\xce\xa0\x9c\xaf\xc0\x0bv\xbc\x04.\
-9\xe3\x85p\xe3\x83?\x7f\xed\xdf\xfd\xf0c\xaf\xdd\xb5\
-j\xd7\x97\xdd\xf9\xd6gZ\x0f\xcc\xfe\x96\x18}\x9b\x1c\
-?\xca\x13\xb8\x90\xd2\xee\xfcXD\x03\xf9\xbe\xe1K\x0e\
-\xc0D\xeaY\x0d\xffe\xe7\xbdt\xc7\x15\x8f\xbf\x0a6\
-\x0e\x1d!\x0c\xbf\xd9j\x8a|^@|\xef\x84\xae\xb5\
-\xfcH\xcf\xe1~\x18\xed\xd3\x0c\xa3\xab\x06\xcf\x96\xc9\x8a\
-3\xfe\xf9\xa4\xc2=\x0b\xf5\x0d\x9e\xb3\xe4\xa9\xd1L\x8d\
-yN\xa0\xec]92(I\xce\xe0\x82c\x9f\x02O\
-\xfc\x93\x0b\xe1\xb6\xbd\xbf\x7f\xf1\xc7~\xf8\xb1\x17\xdfV\
-\xbe\xf5\x0b\xc2\x11<8\xfb\xdf\xc1q\xa2\x88\x80\x19\x9c\
-\x80\xb5Z\xb0\xec\x8e\x80C\xa0\x1e\xe6}\xf9\xc7\xb8\xf1\
-\x9b\x22>\x8d\xfa9\xc5\xf0_\xc2\x0a\xce+\x9fs\xc6\
-\xb3\xcf\xfe\xb3\xa7\xfe9l\x18>\xc2g\xc0\xbd\x93\xd6\
-'\xf2\xfc\x9c~\xbe9'`~X\xcb_2{c\
-Kg\xbc\xcb\xe1 \xacO\x83\xbe\xa5\xce\xd5ga\xce\
-CM<\x0d\xa8\x14\x07\x052(\x0ag\xc0K\x8ey\
-8e\xd3\x19\xf0\xa9\xab>\x03\xbf\x7f\xf8\xe6\xcb\xff\xfa\
-\x07\x7f}\xf9=\x95\xbb?\xeb\xcey\x8e`\xe7\xec\xed\
-\x86\xd4\xc0\xe6\x04\x12\x1d\xc1\xa3\xdd\x09\xe4\xfb\x86\x9f\x1a\
-\xf1s\x85\xe3\x87\x9f\xc6s\xfc'o\x7f\xd2\xb3\xfe\xe7\
-E\xaf\x87\xa3F\xb7\x89\xbc\xbe\xde\xac\x07\xe5\xba\xba\x88\
-\xf4\xf3\xde\x09\x1b*\xf4\xa0\xdb\xd9=\xeb\x91\x81\xf7\xd0\
-)\xc4\xce\x80\xc1Tm\xd2C\x05S\x02\x11\x0c\x16\x87\
-\xa0\xe4\xa1\x83b\xbe(\xf8\x83\xd37\xef\x80\x7f{\xd5\
-\xe7\xe1\xe6\xdd\xbf\xbe\xf2\xc3\xdf\xfb\xf0\x95;\x07w~\
-\xc2\xdd_\xfdx{\xac~\x888\x01\x9a\x1aP\xae\x00\
-\xd2\xd2\x82G\xb3\x13\xc8?\xc6\x8d\xdf\x94\xe3GQ?\
-\x7f\xd4\xe0q\xceH\xe1\x8fN8\xf2\x84\xab\xdf\xf6\x9c\
-\xb7\xc1\xc9G\x9c\x1e\x95\xf0\xb8\xe1s\xf6\x9e\x1b\xfe\x5c\
-}F\xd4\xef\xd3\xa5\xb6K\x0b\xdf\xd9J\xb1\xef.;\
-\xab\xb0\xcf\x81[kXI\xe0\x1cA\xa58\xec\xa1\x82\
-\xb2@\x05\xdc\x11\x9c\xb5\xe5\x5c\xf8\xc2\x1f\x7f\x09\xae\xbf\
-\xfb\x07\xaf\xf5\x1c\xc1k\xa77L}\xa8y\xc7\xd4\xdf\
-\x13\xe3\xa7<\x01&\xa4\x05R\xb5`\xd9R\x82\x1e8\
-\x81\xfcc\xd4\xf0M\xc6\x9f\x93\xa2\xfe)\xa3oZ\xbb\
-j\xdd\xeb\xde\xfa\x9c\xb7\xc0\x13\x8f\xbbP\x9c\x0b\x8df\
-C\xe4\xf3\xf5\x80\xd0\x9b\xadO\x0b\x85^\x1a\x9b\xcf\x16\
-b\xc1\xb8\x04\x86y\x98!\x04\xb4}D\xc8<\xa7\xeb\
-9\x82\xc6\xbc@\x02C\x9e#\x18\x08\x1c\x01/'>\
-\xfd\xa4gz\xc7\xec\xc9\xf0\x85_\x7f\xee-\xff\x92\xfb\
-\xe4\xd3\xb1\xe1^\xdb\xbc{\xfa\xab\x04\x0dP^ \x0d\
-\x11,oJ\xb0\xccN \xff\x184\xfed\xc3?i\
-\xe4\x12Vt^\xf9'O\xfb\x93\x0b\xae8\xef*A\
-<\xf1\xe8\xce\x09>NP\xcd7f\x85\xe17\xbd\x9c\
-\x1fH\x17^\x92\xb5\xf7%g]\xf4\x1d\xa4\x82\xc2%\
-\xca\xdc\x11\xd7\x04\x22\xa8\x081\x11\xffZ\x14\xba\x82\x22\
-\x5c}\xc1k\xe0y\xa7]\xfc\xb8\xf7~\xfb=\x8f\xbb\
-9\x7f\xf3\xd9\xed\xf1\xfa?\xb4\xf7U\xf7\x04G\xa9\xad\
-\x9c\x17.9\x5c\xbd\x95\x14/\xa3\x13\xc8?\x8a\x8d\x9f\
-:\x00\x13\xbb/\x19\xbe3Z\x1c\xc9m\xa9\xbc\xf1\xb4\
-\xad\xa7\xbe\xe6//y\xaf\x10\xf0\xf0\xe8^k\xd6\x02\
-\xc3\xf7#>\xbf\x9dH\xee\xe1\x22\xf08\x1e\xdee\xbf\
-%C(h\xf7\x06\x02\xab{\x88\x80;f\x8e\x08*\
-\xa5A\x81\x08\xca\xc5\x0a\x14\xdc\xa2h\x9d\xfe\xf8\xcb\xfe\
-\x09~t\xd7\x7f^\xfd\x81\xef|\xe0\xea\xea\xaa\xe2{\
-\x9awN}\x12\xe2j\x81\xc9\x11\xb8\x86W\xc0\x96\x15\
-\x0d,\x93\x13\xc8?\xca\x8c?\x0b\xc3\x1f\x19}p;\
-_\xd8>zU\xa1\x5c\xfc\xd0[\x9e\xfbfx\xf6)\
-\xcf\x13\x87\xb9\xd6\xac\xfb\xe4\x9ewRq\xc3\x0f\x85;\
-6\x82\x8f\xa97pa\x89\x00.wB\xbfb-\x1f\
-\x13\xefR\x7f\xca\x9d\x00\xb7\xdb\xd9\xda\xb4\xe0d\x86\x07\
-F\x05\x22(\xe5yj\xe0\xa5\x05\xdb\x9f\x05\xe7\x1c}\
-\x0e|\xf0\xbb\x1fx\xcf\x0d\xce\xcf\x8fs\xe7\x9a\xd7\xb6\
-v\xce\xddF\x8c\xbe\xad\x9c?\xb6\xb4\xe0Q\xe5\x04\xf2\
-\x8f\x12\xc3O\x83\xfc&\xe3\xcf9\xc3\x85\xc1\xdc\xd6\xc1\
-\xb7\xec\xd8v\xe6k\xde\xf7\xfc\xf7\xc3\xda\xcaz\x01\xed\
-y9\x8f\xc3\xcaY\xefD\xe2\xcc\xb3\x8b4\xe2\x9b\x0f\
-\x08\xa6\x1a~\x86\x03\xc9\x16k4\x8fF\x87\x80\x9d\xdd\
-\x85~;\xd2\xe4\xfc\xb8p\x04#\x03\xaba\xd0C\x05\
-\x5ce8\x5c\x5c\x05\x1f~\xe1\xdf\xc2\xcf\xef\xbf\xfe\xca\
-\xf7|\xe3\xbdW\xce\x95\xf3!\x1ah\x93\xb4\x00\x88\xd1\
-\x87\x12\xe3\xc4\x94`1N\xa0\xc72\x80\xc3s9h\
-\x02\xe4W\x0d?\xa7\x5c\xf3\xe1\xb5p\xe2\xc8\x1f\xe6\xb7\
-\x0d^\xfb\xe6\x8b\xdf\xf4\x9a\x8f\xbf\xfc\x9f`Uy\xad\
-\x88\xfa\x1c\xeaOU'\xe0\xe0\xcc~\xef\xeb\xa4`\xfd\
-c\x11\x8fy\x92\x8e9Z\xb3la\x9ce\x7f\xe8\xa3\
-\xe6\xd2\xd1{6<0\xf1w}l\xc6\x8f\x19'l\
-\xc7\xe7\x0f\xc2\xa1\xd9\x83\xc0\xc7\x98U\x9bU\x91\xc2]\
-p\xec\x85\xf0\x95\xd7~\x05\x9ex\xf2\x05\xef)\x9e\xba\
-\xea\x83\xb9u\xa5\xf5\xf4\xdcP\xce\x19\xd3\xd86\xc9]\
-'\xcc\x87\xcc\xec\x04\x16\xf6\xc3\xc7 \x02\xc8h\xfc\xd6\
-\x5c_\x18\xff)\xa3o\xdc\xba\xe1\xa8\xd7}\xf4\xc5\x7f\
-\x03[Vm\xf5\x1bsZ\x0d\x01\xf7g\xeaS\x22r\
-\xf0\xa8o\x1a\xa7\x95\x1c\xd8\xcd!\x9c=V#\xfd\x22\
-\x90\x01.\x12\x11P40\xebN\x0bq\x16\x1fi\xe6\
-W\x0c\x06`\xb08\x02\x1f\xf1\xd0\xc0\x7f\xde\xf9\xedW\
-\xbe\xef\x1b\xef?\xc1YS\xfa\xb7\xe6=\xd3\xdf \xe7\
-O\xdbp\xa4\x5c\x1b/\xb0Xr0\x11\x09,!L\
-\xc8\x1f\xc6\xc6\xdf1\xe4\xf7<\xfd\xba\xdc\xc6\xf2\x1b\x9f\
-q\xc6E\xaf|\xf3\xb3\xdf\x0a\x05\xa7$H>~\xe5\
-F?U\x1d\x17)\x00\x86\x93tlvk\x9bdo\
-a\xf1\xb0klX\xff\x92\xf8\xd9\xa1\xfa\x10\x0c\xf8\x01\
-\x10\xfd\x19\xe3s\x07E\xd5\x80;\x82rqPH\x8c\
-\x9fy\xf2s\xe1\xe4#N\xbe\xe0\x0d_z\xc3\x05\xfb\
-\xf2\xec\xf8\xe6\x1dS\x1fS\x9c\x00\xe5\x04\xa0g\xbc\xc0\
-\x129\x81\xfc\xa3\xd8\xf8%\xe8/:\xf6J\xb9W\xfe\
-\xaf\xe7\xbe\xfe\xa2K\xcex\x91\x90\xf0rH\xc8\xa3\xfe\
-tmR\x10}\xe8&\x0by\xd0t\x12\xb2E\x1aw\
-\x17\x11\xde\x8a\x11\x02-\xe7\x13a\xb6\x87\x884\xce\xfb\
-o\xae1+t\x1c\xa3\xe55A\xd9\xb0\x0cG\x8en\
-\x85k_\xfdYx\xf77\xde\xf5\xbfnd7\xaei\
-\xdc>\xf9.\xe5\xbc\xa2h\xc0\xc6\x0b,\xc8\x09\xf0\x06\
-\xa8\x90_J\xb5\xf1%p\x02\xf9G\x89\xf1\x87yZ\
-\xceh\xfc'\x8f\xfe\xe9\xd0\xf0\xd0;>\xf6\xd2\xbf\x81\
-\xed\x1bO\x13p\x9f\x9f\x04\x5ck\xce\xa3>\xd7\xf2\xfb\
-\xc33\x17gMl\xb9\x8c\x80-\xb1a\xf6\xdc3,\
-\xc1\x9f\xc1\x98!\x10\xdc\xc0\xdc\x01\xef\xb8W\x05IX\
-)V\xa0X(\xc1\x87.\xfb\x08|\xee\xc6\xcf\x5c\xfd\
-\xbf\xd9\xa7V\xbb\xf3\xadk[\x0f\xcc\xde\x94\x80\x06\x96\
-D4\xb4\xdcN \xff(1~S\xe4\xcf\x07\xf9\xfe\
-[N\xdez\xf25\x1f\xb9\xec\xc30RZ\x0d\xb5F\
-MD~\xce\xeeOV\x0f\xf9$\x1f\x9d\xa9\x17N\xc3\
-\xce\xda\xa7\x8b\xcbp\xfe\xb3\x95f\xe9+\xcb!dE\
-\x01a\xcc\x16\x16\xec\xfdo\xda;\x07x \xe0\xa3\xce\
-\x87\xdca(\x15\x06\xe0\xaa\xc7_\x0d\xa7m>\xed\x05\
-o\xf9\x8f\xb7\xbd\xa0Zp\xfe\xdf\xe6\xdd\xd3_I\xf0\
-\xedn\xd2\x9f\xcb\xea\x04(\x0aX\xe2\x94_\xbb8\x87\
-\xb1\xf1\x9b\x0c?dq\x0b\xc2\xf8O\x1d}\xdf3\xcf\
-|\xc65\x1f\x7f\xd9\xc7a\xa88\x1a\x18\xfe4\x1c\xf2\
-\xbc\xff\xf8\xfcX0=\xd7\x9f\xcb\xe7B<:\x1b\xc2\
-1\xdaI\xffP\xb9v\xf1\x9f\xd6\xac\x86\x87\xe9Uy\
-\x1f]\xfd\xd7\xc9g\xaf\x1cS7\xb8\x8f;\x7f\xce\xff\
-\x1c\x98\xd9\x07\x13\xa2l\xc8\xfb\x0cj\xb0\xe3\xa8s\xe1\
-S\xaf\xfa\x14lX\xbf\xf1\xef=\xf4\xf8g W\x08\
-\xf2\x04i\xd2\xee\xd1EU\x08\x98\xc2\xf6/We \
-\x7f\x18\x1b?\xb3\xe5\xfb\xb9M\xe5-\xce\xda\xd2\xeb\xfe\
-\xc7\x1f\xfc\xf1\x15\x97?\xeeJ1d\x93\x97\xf78\xe4\
-\x9f\x98?$\x0ez8C\xdfB\x1e'F\x15\x96\x82\
-\x04\x965p\xf2s\xdb\xed\xddqb\xb9\x95\x810p\
-\xa1\x8f\xe7\x04\xa1gP<(p\xfd\xc7\x88\xbb\x0a\xdc\
-\xe2 l\x1a\xde\x0c\x9fy\xf5g\xe0M_}\xd3;\
-nc\xb7\xadj\xde1\xf5!0o\x5cnC<\x8e\
-\x8c>=\xcb\x84\x04\xc8\xb9\xd6\x11\x12\xe8\x12L\xc8\x1f\
-\xe6\xc6\x9fS\xa3\x7f~\xdb\xd0Y\xce`\xfe\x95o\xbb\
-\xf4\xcd/\xe1\x0c/\xcf\xf7k\x0d\x1e\xf9gDMX\
-\x8c\xdd\xa6R\xde,\x9dk\xccx\xbc\xecg\xde2\xb1\
-q\xad\x19\xef\xack\xf4\xfex\xe5\x06\xbc\xeb\xe0\x0a\x82\
-\xfaY=B\xc8\x0bpt\xe0\xe5|\x5c\xff\xd1l\xd7\
-\xa1]Y\x0bniH\x88\x87\xfe\xee\xc5\x7f\x07\xef\xfb\
-\xee{\xaf\xf9\x09\xfb\xe9`\xf3\xf6\xa9wZ\x8e\xb0k\
-H\x09\xba\xe2\x04R\x09\x83G\x9b\x03\xe8\xd0\xf8\xa5\xc8\
-\x9f?n\xf8I\xf9\xe1\xe2\x97>\xf0\xc2\xf7\xc2y\xdb\
-.\x10\x91^\xb0\xfc\xd5I\xcf\xf8\x0f\x05\x0b5H}\
-\x9f\x81]\x7f\xcf\x16\x10i2\xa2\x81n\xf8\x07\xb7\xe9\
-\x85\x9e:\xc0@\xb1\x0c\x03\xa5J\xcf\x8e\xd7\xd4\xec\x04\
-\xb4\xaa.8\x95e\xb1\xef\x85\xa3-Lv\x16\xa2T\
-\xc8\x5c\xa1\xfe\xf4\xf7.\xac\x0b\xaa\x04\x03\xf0\xae\x8b\xdf\
-\x0d\x7f[\xfa\xebW\x7f\x1b\xbe\x97k\xde>\xf9v\xe5\
-\xbcl'\xf0\x02\xd9\x9d\x80\x85\x13Xj> \x7f\x18\
-\x1a\x7f\xceH\xf6\x1d?|Qa\xb8t\xed\xdf\xbc\xf4\
-\xc3p\xda\x11;D\xd4\x9f\xf7\x8c\x7f\xb2:\x1e+\xfa\
-\xc2|Z\xf1\xbah\x84W\x1d\x18l\x87i@7\x8e\
-'\x9f\xb8\xedzO\xb4u\xe3\xb1p\xc6\xb1\xe7\xf4\xec\
-\x98}\xed\x86/@\xb3\xc5\x97\x97\xc0\xf2\xab\x19\xb1\xc3\
-\x1f'X\x92OY0\x91\xfeq\xae\xa89\xbd\x17\xda\
-C\x1b\xbc\xf75\x22\x9c\xec\x1b.z#T\x0a\xe5\xab\
-\xbe\x0c_\x83\xc0\x09$\xfag\xdb\xcbP\x9d@d\xe0\
-\x09i\xe7R:\x81\xfc\xa3\xc2\xf8O\x1c\xb9\xa4<R\
-\xf9\xa7\x8f\xbd\xf4\xa3p\xfc\x86\x93\xbd\xa8_\x13\xf5^\
-\xae\x07\xe7l?\x0a\xa2\xcf\x12\xca\x13\x12\xfa\xccv\xbd\
-lC\xfe\xe4?\xb9\x12\x8a\x011\x09\xd7;\xd8\xdf\xd9\
-\xafc\xc2\xb7<5d\x1e\x1ahC\xd3;g\x0eL\
-\xef\x83\xd6P\x0bFq\x95\xe8.|\xed\x85\xd7@\xa5\
-T\xb9\xeaZ\xf8|\xaeu\xf7\xf4;\xb0\xe5\xd62:\
-\x01\xe9/Y\x91\xc0B\xf9\x80\xc3\xdd\x01,\x90\xf0\x8b\
-\x8c\xbf2:\xf8O\xff\xff\xe5\x7f\x07[W\x1f+\x22\
-\xfflmV\xe4\xfb\x9c\xf4\x0b\xc5=\xa8Js5\xeb\
-&\xf9\x00v\x00\xf7\xd3~\x8cKex \xa2.\xf6\
-x\x91@\xc8\xa6\xbbK\xdc\xca\x8c\xddr\x14h\xcf\xeb\
-$\x19\x88\xe7\x08xJ06\xbb?\xda\xdaT\xc62\
-\x5c\xf5\x84W\xf3QdW\xfc\x0b|\x1a\x02'P\x87\
-\xeceBL\x8d\xf0\xcb\xec\x04\xf2\x87\x91\xf1\xe7L\xb0\
-\x7fp\xd5\xf0?\xfd\xc3\x15\x7f\x0fG\x8e\x1c\xe5E\xfe\
-\xaa\xc8\xe1\xc6\xe7\xc6\x04\x02\x88\x95}\xa8\x1f\x05T\xc9\
-\x14\xd3Y\xd0\xf9\x09\xd7\xb5\xa2\x00Kw\x00K\xeaa\
-:p\x00\x99\xa6\x1f\xe229\x82N~))%\x08\
-\xd0\x00\xb6QH\x88\xfdr\xf1jq\xff\xcb\xce\xbd\x82\
-\xef.\xb8\xe2\x1f\xe1\x93<\x1dxk\x07\xe9\x00\xa8|\
-@h\xe4Y\x9d\xc0\xa3\x9a\x03P\x8c\x9f%\x19\x7f\xfe\
-\xd8\xa1'\x15G\xca\xd7\xfe\xedK>\x02\x9bG\x8e\xf4\
-\x07v\x08\xa6\x7fL\xdc\xf6s\xfe\x94S&dQQ\
-\x86\xfc\x0b\xb2b\xd6esLy\x22\x17\xfdk\xcf\x11\
-\x00\x84\xdb\x8a\x97\xd1\x15-\x82\x04\xec\x84\x17\x08\x0f,\
-_s&\x9c\x80\x18\xff\xb6F|\xe6/<\xfbE\x5c\
-Az\xc5\xbf\xc2\xb5m\xcf\x09\xbc\x03\xec-\xc3\xd6:\
-\x13w\x02oy\xeb\xab\xccN\x00\x96\x87\x0f\xe8\xa9\x03\
-0D\xff4\x85\x9fo\xfc\xc7\x0c\x9d\x9b\x1f)}\xf1\
-#/\xfe\x00l[s,\xcc\xd7\xfd\xde\xfd\xb1\xd9\x03\
-\x02\x05\xf0\xe5\x1b\xc6`\xce\x92\x0f>B2\x19\x93\xe8\
-G\x96\xd9\x0e#\xbdM\x8f\x11\x80\xdf.\xbd\xf4)@\
-\x87\x01|q\xce\x03\xe5\x86\x22qx\xbd\xf7\xc9\x83\x8b\
-@\x02\xe0W\x93^\xfa\xb8\x97\xc3Tu\xea\xaa\xaf\xc0\
-\xd7\xdc\xe6\xedS\xefJ\xf8K\xae\x81y\x12\xb7?\xf4\
-\xc1\xcf\x98\x9d\xc02\xa5\x02\xf9\xc3\xc0\xf8e\x91\xcf\x11\
-\xe5\xadN%\x7f\xd5\xfb_\xf8N8y\xe3)~\x0b\
-\xaf\x97\xf3s!\x07\xbf\xcd\xc7u\x9b\x08>\xb4\x12\x7f\
-)'\x08KG\xe9\xd8E=\x7fG$ B\xcfw\
-\x09\x86\x8d6\x88\x8bxO]'\xfa\x16\xc3\x0dX\x9c\
-m\xa0\x1d\x99\xa8\x1e\x22Nw\x10\xfe\xe8I\xaf\x81\xc9\
-\xf9\xc9W\xfd\x10\xafo7\xef\x98\xfaK\xc33\x22q\
-\x02LA\x06\x92\x13\xe8\x84\x14<\xac\x11\x80%\xef\x87\
-\x04\xe8\x1f\xc90\x9d5\xa5k\xde\xf0\xbc?\xbf\xec\xac\
--\x8f\x13e\xbe\xd9\xc0\xf8\xb9\x8c3\xaa\xf3'Er\
-\xe5~\x96j\xdd]>o\xbbD\x12\xf8)\x00\x8b\x8d\
-\xafg\x1c\x80\x1bMLZ\xf4\xeb\xc0%\xf4RY\x7f\
-\x84\x09\x99<\xf3\xb7\x1es5i\xf8\xe0\x8a\xe7\x04^\
-\xf7\x8c\xd7{\xe7\xe0\xf8\x1f\xfd\x0eo\x99i\xde9\xf5\
-7\x19\x9eIs\x02\xd4\xc8\xb3\xf0\x01\xddB\x01\xbd\xee\
-\x05Hk\xee\x91I\xbfSG\xff\xf2E\xe7_z\xc5\
-E\xdb\x9f\xe5\x13~\xc2\xf8\x0fz\xf0\x7fV\xe8\xfaC\
-y/\xd5\x7f\x1bu\xf5Y\xf4\xe9h\xb9vS\xc3\xbe\
-\x88\xaby\x01\xee\xf2_\x91~Uz\x01:~_\xb0\
-D\x9fo\xd6\xbe\x0b\xcb\xf9\x12=\x87\xb8\xed\x8aa\xb1\
-\x13^:017\xee\xf3M\x9eSx\xe7\xf3\xde\x0e\
-\x9b7l~]a\xfb\xc8\xab [\xcf\x80\x14{8\
-\x0a\x08\x8d\x9c\xd2S\xa9\xa9\xe7\xe1\xe6\x00\x12&\xfaX\
-a?\xf8]}o{\xca)O|\xd5\xab\x9fxu\
-\xc0\xf6\xfb\xc6\xcf'\xf8\xf0\xcd\xbb<\xef\xf7\x11@|\
-u\x03\x82*\xba\x82\xe1>\xb4<\xc6\xf0O\xb4\x91\xe0\
-\xca\xb8\xbaA\xf9\xad\xd7Z\x00^i\x09\xc7\xa6\xb9\xca\
-56\xc2e\xfcl \xf9\x18\xa6\x1e{\xc3}\xf2\xe7\
-\xce7>\xb7\xc4\xe0\x18\xdeR\x1c:\x01\xbe\x0d\xfa\xa3\
-/\xfa+\x18\x19\x1d}\x1f\x1f7\x07\xfax\xb1TG\
-\xa0:\x01\x13Le]\x1e\x11\xe6\xf4\xd0\xf8\xb3N\xee\
-\xcd{^\xf5\xea\x93\xb7\x9e\xf4\xda\xbf\xf0\xa0\x16_\xce\
-\xc1\xeb\xfb\xe3\xb3cb\x90\x077\xfe6\xb6\xd3\x0ff\
-\xc4V'\x9f<\xc9F\xd7\xe1u\x81\xffP\xbb\x9a\x22\
-\x9d+\xa7<\xbd\x22\x01\xc3\xd7\x01I\xd7\xa4\x7f\xf2c\
-;6Z\xc3u\xa1\xc78\xc9\x09h\xf7\x89\xcd\xcf-\
-/\x08\xed\x87\xa9\xf9I\xe1\x04\x86\x07V\xc1G^\xfc\
-~(\x0e\x0d\xfc#\xe7\xaaH\x00\xcb\x19Hmc\x1a\
-\x1c:\x01-\xc2/\x91\x13pV\x88\xf1[a\x7f\xfe\
-\x98\xa1\xf3\x86GF\xde\xf3\xce?|\x9b\x10\xbe\xf0e\
-\x91S\xf3\x130U\x1b\xf7\x8c\xbf\x1d\x19\x81\x06\xe9\xd4\
-\x14\x00\x158\x97\x11>.\x0a\x22/\xa8\x8dV\xfb\xd6\
-\xde\xe2\xba\x02\xf4\x80Q\x0a\x80\x8bh~\xd6\x0eWr\
-[qG)J\xd6\x94\xc0\xf6\xf7\x94\xfb\xc2\xc7\x86\x8e\
-\xa0\xe9\x9d\x83c\x1e\x12\x98\xaeNA\xb5^\x85\xcd\xa3\
-G\xc1\x9b\x9f\xfbzp\xd6\x14\xaf\x81\xa0-\x1d\xecC\
-F\x1d0\xb4\x10w\x9a\x0a\x1cn\x1c@\x12\xe9\xe7(\
-^3\xefT\xf2W\xbe\xe7\xd2\xb7C9?\xe8\x1b\x7f\
-uB@\xff&\x89\xfc\xd4\xab\xcb\x9e[\x87\xa5\xc6\xfb\
-,W\xec\xe0\xb1]\xb9\x061P\x8a\x9c\x099\xb3<\
-\xae\xbc\x97\x08`\x91\x9c\x06A\x02\x11\x06\xea\xd2g\x9a\
-\xf9\x18B\xd2\xfd\x0a\xba\x08_\xabw\x9b\xb7\x9a\xf3%\
-\xb1\xdc\x09p\xd99OO\xcf\xdbv>\x5cr\xee\xc5\
-\x97\x17N\x1e\xfd\x8b\x04>\xc0\xc9\xca\x07,%\x0ap\
-z\x10\xfd\xb3\x90~\xe1\xf4\xdew\xbd\xfa\xa9W=\xff\
-\xf8\x0d'\xf8\x0b:j\xd306\xc3[z\xdb\x04\xba\
-%E\x16\x0b\xd1\x931\xb2t\x83\xc4\xca\x1e\xadL/\
-\x91 \x11\x95`#Q\xb7\xb7\x10 |\x1d\xd01\x22\
-\x92??\xe5\x90$=_\x87dc\xe6\xd7d\x22\x87\
-\x11\x13PX\xc8}\xb4\xa1\xde\xa8\xc1\xa1\xf9C\x82\x98\
-\xe6H\xe0\x95O\xb8\x12N\xd8r\xfc\x9f\x17N\x1cy\
-\xa1\x85\x0f\xb0M\xb3\xce\x9c\x0a\x1c\x16e\xc0\x8cy\xbf\
-\xd6\xda\xcb\xf3\xfe\xf3N<\xf7\xeaK\xce\xbc80~\
-N\xfa\x8dA\xd3m\xfaB\x9fP\x04\xc3\x0c\xe3\xbb\x14\
-i/\xda>8\xecR\x89>\xa1\xb4g\x97\x15\xb0\x8e\
-^\x8c\xba\x87(t\x10\xbd\xb7\xff\xd0\x10X\xc6\xb2T\
-\x07c\xbd-\x0f\xc4\x05\x96\x0c\x17\xd5n\x8c\x96\xb6\x22\
-\xf4\xfb\x06\xf8<\x81\xb9\xda\x8c\x07Y\xf3\xe08\x0c\x86\
-KC\xf0\xb6\xe7\xbd\x09\xfe\x9f\xcf\xbd\xeec\xb3\x1b\x1a\
-7\xb5\x0f\xd4v\x13\x0f\x933\x94\x06\xd1T\xa8NR\
-\x09v\x03\x05,g\x0a\x90e\xa4\x97\xdf\xd7\xbfm\xf0\
-\x9cU\xab\xd6\xbc\xfbu\x17]#\x06z\xcc\xd5\xe6`\
-\xd2\xf3\xaeB\xe8\xc3\x19\x7f\xd1|\xd2\x8e\xa0\xbf\x0e\xfb\
-3\x908&\xf2\x082\xb0\xc8\x9d\x90T\x12\xa9\xa7R\
-^\x19\xe9@cT\xa3\x90\x14{Z\x084\x92\x80\x89\
-D\x9c\x9e\xc6t\xf4y\x84\x9f$\xe3\xd7\xce\xc9\xd5\xcc\
-\xe4m\x86\xf3*\xaa:x\xe7\x22OGyp\x9a\xe2\
-\x1d\xa8\xd5)\x98o\xce\xc3\xc8\xc0(\xbc\xf19\xaf\x07\
-g}\xe9\x1a\x9a\xd6*\xe9@\xe6\xd2\xe0R\xa0\x00g\
-\x19\xa3\x7f\x92\x13\x90\x88?g\xb0p\xe5\xdb.~#\
-\x14s%!\xf3\xe5\xc3\x1b\xf9\x95\xe7[\xf1\xc9f\x81\
-\xdeI\x84 v\x17\xf2\xa7C^\xfa\xe7\x13\x88&{\
-\xb7\x8a\x11|\x82B\xbc\xf5r\xee\x1f\x85\xc9Y\xe0\xbb\
-=E\xb2\xbf\x7f#\x91\xab\x09\x8f\x92\xc9\xd7\xae\xa4\x03\
-\xea;\x904\x02\xae\x90\x0b\xfb\x95\x811\x98\xad\xce\x8a\
-\xce\xd4\xb3\xb6\xee\x80K\xcey\x1e\xe5\x03r\x96\xd2\xa0\
-\xd3Q*\xb0\xd2S\x80\x04\xe8\x9f6\xc5\xf7\xedW<\
-\xe9%/<~\xfd\xb1\x1e\xec\x9f\xf3\x87x\xce\xfay\
-\xbf\xab\xcc\xf1c\x1a`\x02?\x1f\xb0\x0e\xfa\x80\xc4%\
-?\x9da\x19\x19\xf22\xeb\x09,\xcf\x13\x93\xa6\xd0\x18\
-q'\xcb\x84P]\xeaTz\x9e\x02P\xe3Z\x00\xe4\
-\xce\x80\xc1\x93\x15{h\x7f\x16\xcb\xe3p\xa1y\x82\xa1\
-\xdd'>r\xbe\xf3\xe0\xeb\xc7x\xdf@.\x97\x13\xd1\
-\xfb\x15Ox9\xdc\xb2\xfb\xd6k\x1ej?t\x7f\xf3\
-\x9e\xe9\xafB\xbc\x5c\x84\xee\x17``\x91\x0a\x1bS\x81\
-.\xf5\x9f,G\x0a\x90\xb4\xc4C\xca\xfd\x0b'\x8d\xbc\
-b\xfb\xd6\x13\xff\xf8\xd2\x1d\x97z\x91\xbf*\xe4\xbd\xe3\
-s\x87\xa0\xe5\xfa\x8c?%\xfd\xc0\xe4\x85\xd3\xa6\xc5Z\
-\xa2x\xc7\xf3z\x114\x82\xcfN\xfd\x91{\x8dQ\x89\
-\x96\xfb\xa0\xa3i\xc1\x18\xce\xb2\xeaq\x19\xd0\xf6\x0a\x93\
-\x22z\xe6\xcf9\xe2:\x0c\xc8\xc3\xf4wU\xe2T\xfa\
-{\xf4\xb5Y\x08\xc4\xac\x13\x88\x11\xb5s\xd1\x0d\xd23\
-\xaeJ\x15;'\xe6'D*\xe0z\xde\xfa-\x17\xff\
-\x05\x14\x87J\x1fsV\x17\xd7-4\x15X|\xe4Z\
-&\x04\x90\x91\xf5\x97\x06z:\xa3\xc5\xd5\xf9J\xe1\xfd\
-ox\xe65\xd0\xf4\xf2\xfeY!\xf69(\xf6\xbe\x0b\
-\xd6_\x1d\xe0\xc02\x10xi\xbd\xfd\x99\xa7\xff2\xfd\
-9TB\x06\xd2\x8fQ\xd4t\x9cBH2\xcb3H\
-\xedeB\x81\xe7_{\x09\x02\xc4\xb0\x0c!\xc3\xc6\xae\
-D\xfcls\x050\x13:\xc8\xf2\x8a\xac\x08\x0a3\xff\
-y\xe3\xf7\x1c\xadr\xb9p\xce\xc9\x89scme\x0d\
-\xfc\xf1S\xae\x84\x7f\xac\xfd\xeb\xfft'\x1a\xef&(\
-@\xf5\x99\xae\xe9\xb4\x09\x1b\x86\xb2\xb6\x0d\xaf\x94*\x80\
-)\xea\x1b\xc7y\xe7\x8e,\xbf\xe1\xea'\xbf\x02FJ\
-#0S\xf5\xa0\x7fu\xd2\xcb\xfb\xa7\x03\xe3w#\xd8\
-\xc3l\x88\x99\xc2~\x96\xee)Y\xea\xd9\xc6\xc8s\xa1\
-\xe5\xf1\x8c@{\xb4p\xfb\xcc\x8e\x19M\x8e\x86e\x03\
-\xd2\xd9r\xe8e\xa9\x02F\xaf\x84\xd99\xfb\x05\xf8\x83\
-N~[\xf9\xc4\x18d\xea\xf2\xd1\xdb\xbf\xd1r\xbf\xdd\
-\xd0\x8d\xdfr\x07\x00\x9c\x0f\x00\x18\x9b;\x08\xf9\x5cA\
-T\x06.<\xf1B\xf8\xc1\xed?~\xe5\xbd\xcd\xfbn\
-i\xde+R\x01\xd7@FdJ\x05V,\x09H\xa2\
-\x7f\x96.\xbfpo\xdf\xa5\xc7m>\xe6\x95O\xdb~\
-\xa1\xe8\xf0\x9b\xa9O\x8b\x0f\x8eOg\x15\x0c\xab\xab0\
-\xb3*\x03\x0f\x09,4d\x93\xf5j,5\x98\x05F\
-&\xf1\x8a\xc6jKZx3\xfbM\x9f'\xa65\xdd\
-\x8eHHw\x05\xe8\x00|\x16\x1c\x0d\xbd\x00)\xef;\
-QO\xa10\xfe\xd6\xc7\xba\xa4\x16\xaf|\xee`\xff\xfc\
-\xb5c\x1e\x9d[1\x8c7\x9e;)\xf5\x0aT\xa4\xc2\
-m\xd13\xd0\x10|\x00/c\xd7\x9b5\xf8\xf3\x8b^\
-\x03\xb9r\xfe\x15`\x97\x09\x1b\x17\x8c,\x15!\x98_\
-\x22\xe3OB\x00\xda\x80\x0f6\x90{\xc55\xde\x07\xc3\
-\xc5\x143\xb59\x98\xf0\xf2\xfef\xab\xe9w\xf8)Q\
-S\xf6\xee,}\xb4w\xc6\x11\xddHHD\x16\xfd!\
-\xfd\xc1H^\x08K\x8c\xd2L\x01)\x96=\x04\xc8\x8c\
-\x11\x93\xa5\xf4)Sg\xd4[\x12\xd0\x8dt\x00\xd9s\
-R\xb4\xa2\x89L\x8f\xb7\x8ei\xb7k\x0c\xb2\xe0\x09c\
-\x1a\x93\x96!X\x86\xcdbpl\xdd\xb6\xaf\x0f(\xe5\
-\x8a^\x9e\x9b\x835\x95u\xf0\xb2\x0b^p\xf6\xe7[\
-_y[\xf3\x8e\xa9\xbf\x82x\xcf\xa0\x0a\xe7\xacx\xa3\
-\x9b(`\xa9H\xc0\xa4F\x1fuq\xe7\xffz\xd1\xf9\
-\x7f\xf8\xb8u\x83\xeb\xbc\xe8\xcf[|\xa7DcE;\
-\xcc+#\xe6_\xd5f\x03\xa4j\xfc3\x94\xeed(\
-\xad\x94\xed\xb4\xe7\x93\xd8&\xc3c\x14\x92) \xe9\x90\
-^\x0d\xaf\xc0^\x924\xfd\x08\xa54\xa0\xd7\x97\x8eg\
-\x02\xcb\x8c\xa7\xf4y\xdb\xcb\x86\xca\xbd\xe4\xf3\xf4IP\
-\xd3'I\xf4\x02J\x9a$\xfd\x5c:7\x12J\x90\x89\
-}\x03 }/+\x05\xc3\xf6\xe1\x091\xb2\x8eK\x85\
-\x9f}\xea3`\xf3\xfaM\x7f\x9c\xdf6t>\xd8{\
-\x05\x1cS\xf2\xdam\x14\xd05\x04`\xd9\x81f*\xfb\
-EN \xb7\xb9|\xec\x9aU\xab\xfe\xf49\xa7=\xc3\
-\x1f\xeb\xe5}@|G\x1b\xaf\xa5\x86-\xaf\xc6\x08O\
-X\x10\xd6A\xb4\xd7K\x86j\xb4F\xb9\xbch\xc0\x09\
-Z\xb1\x0e\x99^\xf6#y<\xc3\x94\xd2`R\x01\x90\
-Y^nx\xd2\xba+\xa0\x1b\xd0\x0d^\x07\x0fb\x9d\
-\xf8\x81\x94\xf0\x8f\xd9\x7f\xd3P\xe9C;\x1b\x91\x12\xe2\
-M\xa5CL)\xffY_\x7f\xa4\x12\xf4g\x80LV\
-'\xa0\x90\xe7J\xc1\x11\xf8\xa3\xa7\x5c\x01\xef\xff\x8f\xbf\
-\xe5\xa9\xc0\xaf\x02;t\x89}\x98\xf8\x80%A\x01K\
-\x81\x002G\x7fgU\xf1\x95W=\xe9\xa5\xc2\xd0\xb9\
-\x03\x98\xaaN\x89\xd5]\xfe\x18fE\xfca\x11\xfbd\
-]\x16\x19F\x0a5\xa2ke&K\xb47\xa1P\xb4\
-!5C\xa9/-\xba\x80i~q\x92\xe6]\x1e\xc5\
-\xd1\xfb\x91 \xa9\x8aDL\xecm0\x7f\xae\xc9\x82)\
-c\x89\xd0p<0\x83\xf1\xd3#\xa0\xa2\xba\xd0\x93\xdb\
-\xca\x7f\xc6\xef\xa2s\xc9\x0fd\xbc\x94]\xf5\x90\xed\xb4\
-@\x01\xf3p\xc2\x86\xe3\xe1\x9c\x13\xce\xbc\xb8p\xc2\xf0\
-\x0b2\xf2\x01\xe9e\xc1^!\x80\x84\xe8o\xed\xf6\xcb\
-\x1f7|\xd1\xf1[\x8e\xbd\xea\x8c-\xa7y\x91\x9f\xaf\
-\xef\x9a\x86\xb9\xfa\x0c4x\xf4\x0f\xb7\xf8\x18Y\x7f\x96\
-\x5c\xe2\xb3\x8d\xfc\x92\xaa\x08L+\xdfaB\xbem\x9d\
-\xf1\xcf\xec\xca~\x0d\x9f!\xb3\xa6\xc8\xea\xb3`J\x05\
-#\xe4\x00\xe2Ug\xbd\xe5\x00\xc40\x16\xfeI\x22K\
-L\x15:\xa3\x04\x92\xb3v\xe3O\x93P\x04\xa6\x89\x85\
-\xecH@~\xed\xa8z*\xeb\xdf\x91D_\xde\xf9\xd0\
-\xf0~\xc6\x97\xd5\x14ry\x0f\xfe:\xf0\xd2\xf3\x9e\x0f\
-\xbf{\xe0\xd6W4\x01\xae#\x5c\x80KJ\x84,\x0d\
-\x05\xac4\x04\x90\xb5\xd9'\xe7\x94sW\x5cy\xc1e\
-Po\xd4\xbd\xe8?\x07S\xb5Ih\xba\xbe\xf1\xbbV\
-\xa9\xaf\xa1\xc3\x8f%u\x8a)\xc7]\x8a\xf8\x105\x14\
-\xe9H\xc2\x98-\xcaD\x1e\xcb\x00iU\xce\xc0R\xba\
-K\x94\xc7\x18r\xe6He\xdc\x85~\xf9E\xc7\x7f\xc9\
-\x09%q,`Q\xdf&\x8b\x81\x00,\xc7\xc2\xf0\xf9\
-&\x1e\x0f\xa9\xb8f\x12\x0b\xe9\xac\x83\xceo\xa0l\xf8\
-L>\x8a\xea{Q\xc7\x89qG\xd9j7EWk\
-\xd5C\xbc\xab\xcb\xab\xe0\xd9;\xfe\xe0\xac\xc2\xf6\xd1k\
-\xc0.\x11\xeeL\x1c\xb4\xdc\x08 %\xfa\x1bG{\x17\
-N\x1cy\xc9y'\xee\xb8p\xf3\xaa\xcd0=7+\
-6\xf7r\xf1O8\xe0C\xfaX\x999\xfa3K\xde\
-/\xd7\xd4\x83\x91\xcejH\xa5u{)\x01'\xb9>\
-2\x8dc\xc0\x90-@\x96\xc0A+\xd5\x01\xa63\xfe\
-\x92t4\x8b\xf4\x97!\xa8R\xa3h\x22P\x8f\xa9@\
-\x97\xbc\x8eN\xd6u\xa31\x91\xee\x04?`\xc2ML\
-~.f\xfbu\xd4\xc2\xbf\x098\x98ro\x94~\x07\
-\x8d\xafK\x0cq\xf5\xbe\xce\xd4g\xa1T\x18\x80|.\
-\x07\xcf=\xe3\xe9\xf0\x83\xdb~\xf2\xbaV\xc9\xf9$\xd6\
-\xc5\x86\xc5v`'6\x8d@\x96\x8f\xb7'e@\x96\
-5\xffg%\xe7\xf2K\xcf~v4\xcf\x9f\xeb\xfdy\
-\xcd\xbf\xed\x1a\xb4\xfe\x12\xb4\xb7+\xc6\xe2O\x86\x056\
-\x8e\x8a\xb1\x91\xcfN-\xbdE-\xc5\xfag\x1c>\x94\
-I\xc6\x8bV\xb5^\xec(,\x0c\x15c\x0a\x1dh.\
-!2k)\x8b\x94\xac\x10W@\x0a@\x90\x1a\xcbd\
-\xf5\xc9\x04\x5c\xa6>\x00L)\xcd!$\x987\x09\xe6\
-)\x09\x06Z\x9c\x16\x0b\xccSy\xc5\x91\x13@3Y\
-\xc8\x8fu\xab\xed\x7f\xc7'\x08\x15\xf3\x05\x18\xc9\x0f\xc3\
-\x0b\xce}\x16|\xb1\xfa\xcd?m\xde9\xf51b\xfc\
-9\xd0{\x06\xa4\xb7\x11\xa0\x80E\x1d}\xa7\x0bF\x9f\
-%\xfa\xc7z\xff\x13G^\xf6\xc4\x93\x1ew:\x87?\
-\x5c\xef\xcf\x99\x7fN\xfcES})\xc1\xc2t\xe2\xcf\
-\x06\xf7#d\xc6\xe4>\x01\x19\xea\x1bH8\xa6\x12p\
-\xb6\x8e>L\xa0\xf1\x82\x93\x9f%\xa4\x0d6b/U\
-5o\xef6\x88\x7f\xbb\x87i\x00Mm\xac\x0f3\xe9\
-\xf7\xb3\xf4\x0e\x80\xb9\xdb\xd1X\x88\xa4\xc74\x84\xe7v\
-\xad\xa4\x9e\xd7\xd3)\xc04\xa2\xab\xa5\xbf\xe0\x0b\x93\xcf\
-\x19\xb9\x19\xcat~\x85\xc2-\xbfW\xa0\xd6\xac\xc2\x5c\
-0<\xe4\xc9'\x9c\x0f\x83C\x95?w\x86\xf2#)\
-i\x00\xd8\x88\xc1^#\x80\xb4\xad>\x11\xfc\xf7\xa2\xff\
-\xcb\x9fw\xe6\xd3`\xce\x8b\xfe<\xf7\xe7\xb5\x7f!\xfa\
-\x09\x17z0\x12\xa4Q'\xf7\x98\x89\xa2c$\x9e*\
-z\x1bdH\x22\xb8\xa1\x8cG#>c\x96\x22\x1d\x93\
-\xa0\x9dZ\x88ea^i\xf0\x8dh\xab(\x1a#\x04\
-h\x1ae\x1b\xcdH\x95v=-\x03R\x1e\x80ef\
-\xf8\x92c>\xa6t\x07`\x92!'\xa3\x82\xcc\xe5G\
-\x05E $t\x17\xa2\xbe\xab\x91\xa6D\x9al\xc5;\
-'\xb9L\x98#\xdfb\xa1\xe8]G\xe0\xf9\xe7>\x13\
->?\xfb\xf5\xd7\xbawN}4\x88\xfamb;V\
-\x14\x00\x8b\xec\x0b\xecv/@\x22\x01\xe8E\xff\x97>\
-\xf9\x94sO\x1d\x1c\x18\x82\xa9Y\x0f\xfaW\xa7\x85T\
-\x92{D7\xdc\x97\x80\xe9\x8b{b*\x80)\xca\xbd\
-\xd8@\xe34\x9d\xc5\x07\x84\xc9\xa9\x02\xd3P?\x12\xa3\
-\xb5t\xfeP'\x81\xfak\xb2\xbe\xe6\xb4\xdc%|\x9c\
-E\xf4\xc6\x0c\x11L\xf0%+f*0\xa62\xfaY\
-+\x03h\xf7\x06)\xee\x03\x13l\x1b-\xc6\x9d-%\
-\xb0\xae\x97'\xe7\x96\x86\x14iP@\xf9\x18\xf3T\xa0\
-\xe6\x9d4\x5c\x22\xcc\xb5\x01\xe7\x1d\xb3\x03\xbe\xfe\x9b\xef\
-\xbfvzh\xee\x13\xeelk\x92\xa4\x02T\x1b\xc0\xba\
-\xcd\x05\xe4\x17i\xec\x00\xe9\xe3\xbd\x1d\x9a\xfb?\xfd\x94\
-'\xc3|m^\xb4\xfa\xd6Zuh\xb5\xfci*V\
-\xe2O\x95\xfb\x92N(&e\xd1\x08\xd4\xe6\x192\xbd\
-\xfe\x87\xca\xa7\x176\xfa\xa0^\xbeC\x83\x1b`\xd1\xc9\
-C\x18\x86\xf0\xf1\x89\x8e\x8b4\xcb(*#\xcd\xe0Y\
-\x06'Bso\xe8\xad\x1cXo\xbf\xcd\xf8{I\xe7\
-/&\xb9\x09L\xf0\x09\x98\xa1\x04hs\x1b\x98\x5c\xca\
-3\x90\x7f\xa88\x05J\xfe\xa9\x0e\x91\x96\x1b\xa3\x0aN\
-\xbb)T\xaf\xa5\xba\x87\x02\xf2\xc3\xf0\xdc\xb3\x9e\x0a_\
-\x9e\xf9\xf6U\xee]\xd3\xff@\x1c\x80\x9b\x01\x05\xac\x88\
-2`\xe2J\xef\xfc\xb1CO?\xeb\xd8SO\x19-\
-\x0fC\xb5Q\x13o\xbc\x15,\xf4\xd0\x86{\xa2>\x8c\
-\x91i\xdb[\xf4RX\x94\x8b\x83!\xe7\xa79\x1c\x8b\
-S\x03\xe3\xc9\xa2\x94\xee\x92\xa4)*\x0f\x016\x9e\x81\
-\x99\x8d\xdb6e\xc6H\x1f\x982\xdf^/\x07\x8c\x84\
-V\xd0\xa1\xf1\xeb\x1f\x15Z\xe4\xd5zU$<\xdb\xcc\
-,\x82\xe9\xb8\xd8\x1e\x89\xa6Z1\x03M\x85)\xbfG\
-\x22.cT\xca\x1cK\x95\xd57\xc7\xb41\xe8\xe8O\
-\x14\xe6#\xef\xbc`8W\xaf\xc2\xe3\x8e\xde\x01\xc5J\
-\xe9\x0d^\xa0\x1c\x80\xe4\x89A\x00\x09MC\xcb\x81\x00\
-XF\xe6?r\x02N%\x7f\xf93O\x7f2\xcc\x05\
-\xd1\x9f\xbf\xf1f\xe4\x00,\xc3=I\xe4v\xa5t_\
-\x86\x04\xa1wuXh\xb4\x16\xe9.cR\x15@~\
-$\x89\xf7LG\xa0Lb\xf0Q\xc1`\x8c@>\xa6\
-K\x89\xb5Q\x06:\xd3 \xaf&g\x06H\x1dW%\
-X\x18y\x95\xaaIOR\x00\xd7\x0d$\xc9\xae/O\
-\xcd\x12\x99\xd3\xb6y\xa2=\xa3O\xac\xf6crZ\xa0\
-:zsQ\x02\xb5\xbf$\xa3zL\xe4\x1b\xe4\x12\xa0\
-\x5c\x16T\xb2\x03\xe0\x0aa\x1e\x04k\xcd\x1a\xd4\x1aE\
-(\x97\x8a\xf0\xb4S\x1e\x0f\xff9\xfb\x93\x175\xef\x99\
-\xfe\x9c\x05\x050\xe8\xda<\xa0\xee\x93\x80F\xe6?\xbf\
-\xa5r\xda\xb6M[\x9e\xb2id=\x1c\x9c:$\xde\
-\xb0\xdf\xed\xe7k\xfe\x8d\x07\x88qe\x19*\x86C\xe0\
->c\xda\xd9\xe4J%@\x03\x95\x87q9\xd1\xa4\x00\
-\x8cK~\xaa\x94\x90i\xf9\xb9\xb1\x82\xcf,\xb9<3\
-\xf9\x03\xb4\x13\x01I5\x96H\x04\x14\xaf\xa9\xeem\xfc\
-\x0f\x85[\x10\xc8\xb7\x93\xd3\xa0tX\x80\xd9\xd2\x04\x85\
-h\xd3~\x13\x93\x9f\x05)\x926\xa2\x7f4\xa6;\xda\
-3\xa2\x0e\xef\xc1\x92\x0a\xa0\xe2\xdc\x84\x03\xf0\xfe\xf1\x11\
-b\xbc\x0d\x9e\xa7\x02O:\xf1\x5c\xf8\xfe-?{\xb9\
-\xf7\xe3\x7f\x0f\xec\xa7\xad\xd8\x15\x9a2\xc2\x85:\x05\xa7\
-\x8b\xc6ou\x02l\xa4p\xf9\xb3\xcex\x8a(\xfb\xd5\
-\x9auh4\x9b\x01\xfcw\xad\xfa~ p)\xfc+\
-J\xe1\xc5P\xe4Am\x08\xa7\xfa;z\xf1\x08\x83\x94\
-\xc0r\xb2H\x15A\xbd\xdfO\xd7i\xa1\x96\x80\x80\xb6\
-\xe9'}\xd6\x841\xe7\xb0\x18MO\xb5\x80\x0b\x9dI\
-\x92\xf2\xde\x12{\xf3\x0c\xb2\x7f\xed\x5c \xc7\xc5\xd4\x07\
-h\xfa\xdbhz6C\xb7`<\xcaM\xd5\xfd\xebg\
-\x17\xfd\xab*\xd0\xf0\x89\x5c\x7f\xc5\x18_.\xc2S\xe3\
-J\xb1\x02g\x1fw\xea\xf6\xfc1CO\x86\xf4=\x02\
-=A\x00\xb6\x1c\xc4X\xfesF\x0a\xab\x86\x86\x87^\
-|\xfc\x86\xa3arvJ\xbc\xc9F\xbb\x0e->\xdf\
-\xdfE\x8d\x9d\x0f\x0bk\x18R\xeb\x8c\xa6\xd1,\xce\xff\
-P.\x90\xf9\x0d\x82\xea\xb3\x10\x0fM\x9fK\x85\xdfH\
-R\x09I\xd3\xc3b4b$\xa4Y\xf4\xbb\xe6H\xcf\
-$\x14a\x9fB\xa4\xa2\x11\xa6j\x8b4\xabh\xf3\x1c\
-2\xe0Oz\x99\x05\x88\xed8\xe8Wq\x1c[\x10\xc2\
-\x8c\x22\x9f\xb4N>\xd3\xbd\x98\x96f`\xf2\xdfF=\
-8\xe8\xbf\x0bz_\x80\xa9j\xa0\x92|\xb2\xb5\xc7\xaf\
-D\x91\x0b\xf0\xfb\xeb-G4\x09\xcd\xd7J\xf0\x94\x93\
-\xce\x83\x9b\xef\xbd\xfdr\xef\xa7?5\xd8\x94\xda#\x80\
-\xcb\xed\x00\xd2\xc8?\x89\x00\xcc\x1dQ\xbe\xec\xa2S\x9f\
-\xe0A~\xde\x0dU\x17\xcb=\xfd\xdc\xdf\x17E\xa8\xb0\
-9.\xed\x91\x96_\x9a\x17Sv\x9f)\x0e#\xca\xd3\
-\x11hQ\x90E\xd6\x1b\x18\x1aC\xd5M\x18\xfd)\x02\
-\xad\xf1\x1br\xfb\xa8\x04\x88\x92\xd13Kn)\x97\x0b\
-\x95D\x85%\xc5?f\x0d\xa1\x88\x09#8\x11\xad\x0c\
-v\x9ci\xb1\xc4\xef\xb3P\x80\xa6\xda\xf7\x82(Af\
-G8\x92\xd9\xa7\xf6\x15!\xa5eR\x1d\x92uz4\
-\xda\xd3\x17\xd9\x98u\xb1\x97q\xbe\x00\xea\x8eK\xfc\x19\
-\x17\x05\x22\xae{\xb6\xc1\x03\xe4\xd65G\xc0\xba\xd5k\
-\x9e\xfe\xc8\xda\xeaF\xf7P}\xaf\x81\x0b\xc84>l\
-\xa9I\xc04\xd9\xaf\xf8\xca\x8a\xceegm=E\xc8\
-~k\x22\xfa7\xc4\x9b\xf5\x07}\xc8\xc7=T\xf2\xc5\
-&\xecG\xd8\xa8\x5cGTB\x8c\xd1\xe8\x1e\x9b\x12\xa3\
-y\x1ac\x11\xd5Gc\xac\x1a\xf1Q\xcd\xfb\xc1\xb4\x88\
-!0`\xd4\x1d\x06\xa6\x91\xe0\x1a\x01\x10\x93\x98\xaa\xa6\
-\xc0\xf4\xcbh\x92\x1e\x07$ \x1f3\xe5*0\xb5\x1b\
-\xbc@\xbc\x9c\x92I\xb7u'\xe3Fs\x09X\x87\xd3\
-s\xb2\x8c\x025\x91\xa1\x98\xc0\x1d\xd8\x0d\x1b\xcd\xdd}\
-\x1a:A\x035\x80\xc6\xbf\x8d&\xd2\x90n\xa2\x8a\x1a\
-\xcb\x12^\x1b\xaf\x06z\xff8\x1f\xd0h5\xa1\xea\x1d\
-\xcf\xf9z\x0d\xfe\xe0\xd4\xf3\xe1\x8bc\xdf\xbe\xccs\x00\
-\xff\x98\x80\x02\x00\x96Y\x08\xd4\xd1\xb4\xdf\xfcQ\x83;\
-\xb6o9\xf6\x84r\xa9\x0c\x07'\xc7\x04\xd9A7\xfa\
-\x86\xcc?J\xa87\x8e\xe6,\xcc\xcd14}\x0c\xe0\
-x\xdc\xb1\xc7\x18\x93\x98uMz\x1f\x1e\x1e\xc6\x8c\xea\
-\x09F\xea\xfa\xda\xf9\xcd\xd0\x10\xd1\x11\xec\x93:\xe2\xda\
-\x02\xcbR\xcf\xcf\xba\x0a \xf89\x17MM\xd7'\xc4\
-\x82\xd4}\xbb\xf7\xc3\xc3\x0f\xee\x83\xf5\xa3\x9b\xa1\xddj\
-w\x9f\xdc3Ac\x83C@\xa0\xfc\x09K&\xfe:\
-X\xcf\x96@\xf4[\xcfHs4N~B4\xe7v\
-`\x9c\xbb\x84\x1a\xfe2|nJ\xa9P\xbb\x0f\xe2r\
-4IA[m\x17\x9aNK\xf0c\x9c$?\xfd\xc8\
-\xed\xf0\xa5\xe2\xf7.\xf3~\xfc\x09\x85\x0cd\x86\x14`\
-\xc1\xc2\xa0\xc5\x0a\x81\x12\x09@6\x9c\x7f\xe9S\xb6\x9f\
-+\x84?\xfcM5\xdaM\xd1\xf2+v\xfb\xd1\x12\x9b\
-\x03q\xd4\x0f\xc7\xff:\xfe\xc7\xe5`\x1c\xc5}\xca\x92\
-N\xa0\x8d\x11A\x5c\x1d\xa0\xf9\xbbo\xf8\xb4\xec\xc3H\
-\x1b!SZ\x860\xec\xd9\x0f\xbb\xefB\xe8\xce\xe4<\
-\x9d\xa9Y>\xc6MHZ\x22\xca\x14>\xc1\x94\xcf\x22\
-\x1a\xe5\xc5<\xbaNT\xc7\x85\xd1OT\xc7<x8\
-\x1b\xfd|\xba6\xef\x8f\xe3N\xe7\xd7\xbb\xef\x18\xc8\x9f\
-\xbb\xe1\xf6\x1fA!_\x80\xed\xab\x8f\x87\xb5\x83\xeb`\
-\xa0P\xc9@n\xa6\xe4\xf9\x98\xc4\xff\xa3\x15\x1d\xa0\xf6\
-\x8d\xa9(\x88\x09%G\xd4\x11\x01\xeaU\x03\xc4\x0c<\
-Bp\xdb5\xa5\x07\x064\xc0\xcf\xc4\xb6g\x1fuQ\
-\x11\xa8\xc3Py\x10\xce\xdcv\xd2\xd6\xdfM\xdfvA\
-k\xe7\xec\xcfR\xb8\x80\x05K\x83\xf3\x8b0\xfc$\xf2\
-/\xc7\xca\xb9\xc1Ry\xe0\x85\xdb\xd6\x1d\x09Ss3\
-\x82\xfd\xf7[~[\x820\x92GyQ5_\x08\x0b\
-X\xd0t\x15G}\xb5\x8b\xcfaa\xdb\xae\xae\xc8\xb3\
-i\xf0\x13\xe1z\x18\xf1I\xbf7\x93N&\xdd\x09\xa0\
-2\xb4$|\xfd\x98R\xd63\xa7\xbbL\x18\xfdd\xf5\
-\x10\x8c\xcf\xed\x87\xf1\xda\x98(\x95\xc6\xbe\xc1\x91\x08J\
-\xc6\xba\xbe,\xb6\xe3K\xb3]\x87\xc9\xb91\x18\x18o\
-\xc3\xae\xa9{\xa0\x94\x1f\x80\xd5\xe5\xf5\xb0\xaa\xbc\x16F\
-\x07V\xfb\xaf\x193\x14\x05\x11S\x07|\xea\xe5\xb74\
-I/*\x83=\x0cP\x1f\x0ce<\x13\x22\xb0\x90\x85\
-\x08\xe6\xf2\x9f4Y\x8a\xbe\x064\xf0%\xe8\xf3\x00M\
-hA\xceK\x03\xea\xcd\xaaH\x03\x1e\x7f\xfc\x0e\xf8\xfd\
-}w>\xdf{\xc4\xcfSP\xc0\x82\xd3\x80|\x87\x86\
-o\xfa^\x1db(\x9c@\xee\x88\xf2\x13\xcf9\xe6\x14\
-\xf1\x01\xd4\x1a\x0dQ\xf7o\xb9\xed`v\x5c\x1c\x99\x19\
-\xf9P\x04\xa4\x8c\xa2o\x00\xdb\x19\x81\xd5\x92\xf5*$\
-\x1a%\xbc\xc24\x81\xc51\x9eR\xfc\x91\x98&\x8c\xe0\
-\x0a\xbbg\xcc\xcb3\xec\x1aP\xd3\x5c\xfa\xb4\x926\xc0\
-\xf0\xbb\xc2\xe8\xab\x07a|\xfe\xa0\xa8\x90\x84\x98A\xab\
-DHH\x81-\x10\xf8u\xf3\x12\xbcJq\xac\x1cQ\
-\xe1\xd9?\xf3\xb0\xb8\xf2\xefG\x07\xd6\xc0\xba\xc1\x8d\xc2\
-!\xe4X\xce\x8a\xc61\xeb9\x8c\xe6\xea\x01f9s\
-\xb3\xce\xf5WJHhj\xc7\x96\xf4\xff\xbac\x91W\
-\xfd\xaa\xfb\x06\xd0Hj\xba\x82\x0cl\x8a4\x80s;\
-\xdb\xd6m\x01/\x88^\xda*\xcf\xbe\x07\xab\xedV\x06\
-.\xa0\xe3\xb3\xa1[$`h\xfc9\x82\x00\x9e{\xe6\
-\xd1'\x89\xda\x7f\xd5\xf3h\x1c\xda\xb4\xa2\x9e\x7f\xbd\xec\
-\x17\x07\xe18\xac9\x22\x222\xa9\xd6\xc7\x90~\xb0L\
-.\xd8\x11\xa5 \x9a\x9e\x9d\x05\x8f$\xa4\x03\x82,(\
-b\xf4\x951\x95cbqE\x02\xc1\xac\x06$\xf9\xbf\
-l\xf4\xe45\x05G|\xa66\x19\x18\xfd\x0113N\
-z7\x8c\x19\xb5\x82\xd1\xfbd\xf1\xeb\xeb\xa9\x1a\x90\xc5\
-\x9f+\x8b\xbe\x89\xa3\xdcd\xed\x90\xb8:\xc2\x19\xac\x86\
-\xb5\xe5\x8d0R^\x138\x034Bi\xb3\xad\x9a\xc6\
-r\x19 >&Dy\x09\xc2\xa3\x159 \xd8\x18|\
-\xa2AA[\xc5\x05\x951c\xa8t1#\x99\x84D\
-\xd0\x82(u\xb7\xbd\xf3\x00\x84\xadp\xc2\xbc\xdd\x1e\x84\
-\x1d\xdbN\x82\x1b'\xe6\x9e\xd0z`\xf6\x07\xa0\xcb\x82\
-\xa9\x13XP\x1a\x90_\xa0\xe1\x83\xa5\xf4\x17\x1a\x7f\xa5\
-4Pz./g\x8c\xcdL\x08v\xd3\xef\xf9\x8fg\
-\xfd\xa1d\xf0\xa85\xe18L\xce\x90B\xc2.2S\
-G\xae|\xd02\x22cq9PB\x0a\x18w\xee\xa1\
-\x92\xa7\xebT\x1fe\xb5\x99\xee_3\x22\x82\x98\xb5\xf7\
-o\xb5\xb0\x09\x07f\xf7z\xd7=\xc2!J\xe4\x9a\xc9\
-\xd8\x01\x0c\xb3\x07\x99\xac\x06\xe9\xbd\xfdK\xe4\xa0\xf4a\
-\x11\xe8;Y\x1d\x17H\x871>\x1f\x7f=\xac\x1f<\
-\x02\x86\x8a\xc3\x0a\xaa\xc1\x04\xae@\xb5\xe6\xc4\x91P\x19\
-7\xfb\xd8\xf9\x06L \x07\xe99\xa4\xa5\x1c&\xfe\x80\
-?\xde\x05#|\xa1\xee\x8ao\xc2\xf2\xe5\xc1~I\xf0\
-\xecm'\xc3Mw\xddr\xb1\xf7\xa3\x1f%\x18\xff\x82\
-\xd3\x80|\x07\xc79\x0d\x01D\xd7\xdc\xe6\xcaS\xce\xda\
-\xb6\xddW85\xfc\xdc\xbf\xe5\x86\xe3\xbe\xe4'q\xa3\
-|\x1f\xe3\xe8)v\xc63\xa2\xbfG\x7f\xbc2\x81f\
-\xaea\xc8&5\xee\x08)0\xc3\x0c\x1f\xd4\xcf9\xa9\
-$h`\xec)/\x00\x8a3\x91*\x0eLW\xa2\xf3\
-\xfb\xe7\x1a3\xc2\xf0'\xbc\x88OS\x1e\x90\xb2z9\
-o`\x06\xe2\x80\xa6\x041\x02\xe8y\x06\x10;\x00m\
-\xfc\x1a\x1a\xca\x9a.\x1c\x9a\xdb/\xae\x9c4\x5cW\xd9\
-\x08k\x067@\xde)\x98\x898\xedf\xcan\x04D\
-\x85\xdc5\xe5\x0b\xe6x\x8f\xcac\xac,>(Z\x00\
-4\xcb\x8b\x11\xd1\xf07\xd4\xd2a\x8c\x06\x5c\xf05\x01\
-M\x8e\x02\x9au8\xca\x0b\xa2E/\x98\xb6\xca\xb9w\
-\x04i@\xdb\x10xq\xa1i\xc0bH@\xab\xfa\x8f\
-\x0d8\xcf\xdaq\xf4v\x01c8\x9ci\x06\x13\x7f(\
-<\x0aK|\x11[\x8f~\xe4\xa6#\xbc\xa8~\x1fU\
-\x86\x1f\x95\x1c\x9f)U\x81@L\x84\xa8\xcf\xf9G\xc5\
-1D\xd4\x1e2\xadd\x08\x06\xc7 }\xde\xb6\x8f>\
-x\xcd\x93\xf3c\x9e\xe1\xef\xf3\x1c\xc0t\x04\xeb\x19\xc9\
-\xdf\x99\xc2\xfcK\xe9\x90Ay\xc44\x0c\xd0k\x12 \
-d*\x9c u1\xfd\x1c\xad\xda\xa6z\xab\x0a{\xa6\
-\x1f\xf4\xae;\xbd\x14a-\xac\x1b\xdc\x04#\xa5Q=\
-\xc2k\x07$\xa3~\xd8\xe8\xf5\xc1Z\xda\xd3\xf2s\xe2\
-\xfd\x95\xf8%\xee\x8e\x82:C\x85\x00\x8aS\x0dT\xd3\
-\x15\xe6\x93~hA\x1c<X6Z\xbe<\x98\xa3\xe6\
-3\xb7\x9e\x00\xbf\x9a\x98\x7f\xbc%\x0d`\x8b\xa9\x06,\
-T\x07`/\x01\xe6X1W\xc8?\xf7\xc8\xd5\x1ba\
-rv2P\xfe5\xfdY\xff\x84t\xc3P\xda+\xd5\
-\xf6c\x03\xf1\x9b\x84bC\x96\x18~\xa6Cz\xc2\xc9\
-\xc8\xbd\xff\x92\xd0'H\x0f\xc8\xe4 *\x22R\xb8\x1f\
-\x22\x12\xb2\xb3\xf8j^\xcfor\x12\x8fG\xb7\x83s\
-\xfb\xa0\xe9\xdd\xa6F\x9f\x14\xe5U\x83g\xda\x1f$\x0c\
-\xc5\xca\xb2\xff\x88\x0443uL\xef\x8e\x92\x9c\x82\x7f\
-\x1eL\xd5\x0e\x89k1W\xf4R\x84\x0d\xb0\xd6C\x06\
-\x85\x5c\xc1B\xf8\xe9\xa9\x02\x1a+\x0a6\x11\x0f\x1aK\
-\x89*\x8c\xd7\xd3\x00\xd9\xb0u\x95\xa2\xfc{\xa8\x22\x0e\
-*^#\x13\xaa\x91p\x03-\xe6O\x0f\xe6\x1d\xb3<\
-\x88\x9e\xb6\xe5\x04\xf8\xf5\xdd\xb7=5!\x0d\x80\x85\xa6\
-\x01\xf9\x05\x1a\xbf\xb5\x04\x98?\xb2r\xd6I\x9b\x8f\x16\
-p\xbf\xc6\xe1\x7f\xdb/\xfd\xb5\x03\xf7\x19V\xedD\x8e\
-\x8f\x18u\xfdaT>\xf3\xbf\x8f\xe2\x9c\xb2\x01\x85G\
-g\x87<\x9e\xbasd@P\x02=X\x8c\xb4\xd1\x82\
-B\x18&,\xfdU`\xbf\x09M\xd0o\xeb\x82\x01\xdf\
-\x03\xe3\xd5\x03r\xb9N3z\xa6CzP\xdb\x91-\
-$ S9\x83\xde\xce\x05\x968\x00U\x9c\xc6\xc0\x1c\
-\x900\xd9)\xf0\x80\xf1\xc8\xcc\xc3\xe2*\xaa\x08CG\
-\xc0`aX3hM\xd2\x8b\xa6\xa2\xa1N\xcea\x12\
-\x91\x88h,\x17\xa2\xb5\x1cH\x9e\xd7\xd4\x11H\x9a\x8f\
-\xb4\xeeED\x9d\xc4e\xfe\xca\xf5\xa6H\x03\x1aB\x1e\
-\xbcu\xddf`y\xe7)\x90<2|A\xca\xc0|\
-\x07\x86\x9f\xc4\xfe\xc7\xf0\x7f0\x7f\xe1\xe9\x9e\xc7\xe2\xb9\
-\xbf\xe8\xf9o\xf9\xdb}\xd5\x02<\xa2R\xe2\x8b\x14v\
-\x18\xb1\xf3,t\x12Q\x9b\xaf\x1c\xe5\xb5\xd9=\xa1f\
-_U\xf0\x99\xf4\xfbh\x1e\xe5\x85d\xa2p\x92\x9c\x8f\
-\xfenX\xfa\x1a\xaf\x8e\x816\x87\x98-\xd4\xe8\x99y\
-\x82\x90\xc6\xc5\xf6\x18\x01 qt\x06N\x03\xb52,\
-\xea\xfb\xdc\xd0\x92n!\x17<Mx\xa8`\x1c\xca\x85\
-AX\xef\xa5\x07\xa3\xe5\xb5\x81\x1c\x9b\xe9\x1dv\x09\x04\
-\xa0U\x1d\xad\x8e\x83c\xf6\xdf5\xae\x0dG\x93\xbb\xc1\
-8\xda`\xf2\xefG\xe5D7~\x10G\xca<e\xe6\
-\xfd3<\x85^\x9d\x1b\x85M\xab\xd7m\xda\xb3\xa1z\
-T\xfb@\xed\x01\xc5\xe6L\xc6\xbfdU\x00\x93#\x90\
-\x9c\x00\xcb\xb1\xb37\xaf]/\xea\x98\x9c\xfd\xe7\xca\xbf\
-\xb0[L\xda\x8e\xc3\xe4\xd9\xfb~1@\x0e\xb1Tz\
-\x132\xfcQ\xca\xa08\x06\xe3\xacF\x167\xf3D\x9d\
-\x84\xb6\xbc\x91\x22\x02fL\x1b\xf5\xfc\xd5{\x8f\xfbg\
-\xf7\x0a\xd8\x1a\xbb!\xa6\xe7\xf4&\xa37\x18\xbc\x9a\x06\
-\x98\x9a\x95\x22\x0e\x80\xb1(\x0f\xe8-\x09\x18\x94,=\
-\xf8\xaf\xf5\x0a$\x19\xbd\x11\x09(\x8c,\xb9\xbf\xd6\x9a\
-\x87\xdd\x93\x0f\xc0\xde\xe9]\x82'XS^\x0f\x8e\x93\
-3&\xf2h\x80\xe4\x90\x05\xea\xab\xcc=\xea,}l\
-\xcd1\xf2r\x95\x8a\x02E\x11F\xc2\x0f\xe5\x92%*\
-\xe5A\xfe~[\xd8\x12H\x88\xa7\xd0\xfc<;\xfd\xa8\
-\xe3a\xdf\xbe\xfdO\xf6\x1c\xc0N\xc8\xde\x1e\x9c\xea\x08\
-\xf2\x0b0x[\xfe\xcf\x9c\xe1\xc2\xe8`\xa5r\xd6\xba\
-\xc1\xd5\xf0\xc8\xc4A\xbf\xe7\xbf\xdd&C?\x82z\xa7\
-\x03R\xd4W0@ \x8d\x95\x099\x95q\x07\x9aG\
-I\xa5?\xba\xc0C-\xe1!i\x10\x8a\xdb\x8b\x99\xc5\
-)h?\x0b\xa2S\xa3U\x13\x8c>\x8fL\xaa\xe1\xcb\
-9}\xba\xd1[\xf3~Ci\x92j\x0c\xe2\x0f\xbf\xb7\
-u\x009\x05pTX`>\x0f1\x09\x09\xd8\x1c\x82\
-\xff-\x0f&\xfbg\x1f\x86\x83\xde\xe7\xcf\xc5E\x9c'\
-\xe0\xeaC\xe3\xb2\x0e\x039kr\xee\xd6)E\xa6R\
-\x1f\x8d\xd6\xf4\x19H\x07!J\xe9'\x90=\x02Jb\
-\x11\x12\x854\xad\x08\x08B\xb1O\xb0\xed\xa3\x00.\xa4\
-;a\xd36\xf8A\xe1\x97O\xf2\x1e\xf6y0O\xdd\
-^\xd0\xb4\xa0|\x17\xa2\x7f\xdc\xfb\xbf\xb6t\xe6\xf1\x9b\
-\x8e\x12\xd0\xbf.\xa4\xbfMQ\xf7\x16c\xa3H\xf5\x8a\
-G~'\xd4\xe9#q\x02\xd1\xc9\xed\xf8\x8a\xc1\x08\xd6\
-\x87\x8d'\xa4#\xd0\xc4\xf0\x07\xd8\x9e\xd4\x06t\xb8\xaf\
-\x96\xeb\xd0\xcc\xf4\xebd \xf3\xbcq\x15\xc6\xe6\x1f\x81\
-I\x01\xf5\x99N\xee)\xd1\xde\xac\xe2c\xe6(o\xe8\
-\x19\x90Yu\x836`%\x91\x80`\xd1\x01\xa8F\xaf\
-Vl\x00\x92F\x1f\x1b*<q\x84\xe6)\x17WN\
-\x0e\x15G`\xed\xe0F\x18,\x0e\x1b\xc9?]\xb2K\
-\xcb}h\xac\xc7\xab\xe2\x1f\xe3\xf3\xd0\xafV\xe4@\xe7\
-\x12\xa2>0\x14A\x9a\xed\x186\xc9\xb5]\x7f\xa1(\
-\xef\x9e\xe5\xd7\x0d#\xab\x81\xe5\x9c\xb3S8\x80\x8ey\
-\x80|\x86\xc3\x9b\x05\x05\x84\xe5\xbf\xb3\x8f\xdb\xb0\xc5\xd7\
-\xfd\xf3\xc6\x1f\xa1\xfc\x0b\xc6WG9}P\xc7\xa70\
->\x18\xf1\x15\x1d\x1c\x167\xd9\xc4U\x03\x94\xc8<\xe9\
-]\x22\xe9\xc0S!=m\xa6\xa5\x91\x1d\xc3\xbf\x0bJ\
-\xb9Q?\x81\x1b\x1e\x04;\xe8\x19\xfe\xb4\x17\xf1u\x98\
-\xafF{\xaaJd\xa9F\x9fd\xf0\xf2\x9a3\x15'\
-\x84\xf1\xbf\xc7)@\xf4\xfaL)\x00\x8b3u\xa9\x09\
-+<n\x8aG\x86x\x87\x03\xaa\xf7\xdb\x9c\x81ws\
-\xae9\x03\xb3\x93\xd30\x90\xaf\x08D02\xb0*\x95\
-\xe9Wa\xbcF\xf7av\xe3\xa6(\x02\x95\xe5 \xf4\
-\x15HjA[o\x00\xf9\xbb\x9c<o\x05\xd3\x82\xf8\
-\x1b=r\xdd\x86\x91\x87\x8e\xa8\x9e\xd0\xdeW\xbd#\xc5\
-\x1e3\xf3\x00]\xe5\x00X\xde9\xfb\x885\xeb=\x83\
-\xa9\x8b\xfc\x9f3\xff\xa2c\x8d\xc5\x94\x0d#e\xb3\xa8\
-\x1f\x80\xc5\xca\xbb0~\xfb}\x00\x86v\xdc0=\xa0\
-\x11\x9b\xc5\x1ff\x04\xeb\x15\xa2Ng\xef\x15L\xc8\xe4\
-\xd4\x22\x84\xfac\xf3\x074\xc37\xc1|\x1d\xe23s\
-\x8d?+\x1f`\xdcdL\x9e\x8f\x85\xcd@\x9d\x8d\xe3\
-^\x22\x0a\xc0;\xf8\x8c4\xfe\x18\x9a!$\xa8eC\
-\x02\x06\x87\x90\x80\x02\xe49\xf1,\xd0\x14\xec\x84\x83s\
-EXS\xde\x90\xd8\x8c\xa4\xfe\xbeq\xaf\x01\x82\x95\x0c\
-b\xae\xba\x12\xcc2\xcd\x10\xcd\xd5\x09U/\xa2\x89\x93\
-\xbc\xcf\x82\x07N\xa1\x0cl\xb5\x84M\x1d\xbf\xf1(\xd8\
-\xbd{\xcf\x8e6\xc0]\x90<-\xb8\xebe\xc0\xa4\xd6\
-_\x16\xd4\xff\xf3N>\xf7\xb8uC\xab\xe0\xc0\xd4\x98\
-\xa8\x7f\xf3\xf6\xc6h\xee\x1f\x8b\x87{\xc8uu\xb9\x03\
-/\x1a\x7f\xe1\x1d8S\xdd\xdfW\x0f\x82D\x02\xea\xb6\
-M\xdb\x80\xe5s\x90\x11HO\xf1\x01\x92\xa1\xbf<\xe2\
-\x8f\xcd\xef\x87\x99\xfa\xa4\xd9\xf0U\x98\x9f\x18\xed3\x1a\
-\xbd\xe2X\x92\x11\x81L\x94\xf6\x1e\x01\xc4R 4l\
-me\x00q\xd7&\x18\xc8\x1c\x0b\x12\x90=\xbc\xdd\x19\
-\xa8\x1d\x99\xbc\xf4,x\x82\xf9}\xb0f`\x9d\xa8\x1c\
-\xe4\x9c\x9cqx\xa7>\xa1\x07-\xe5>=-@@\
-\xa3\xe6@\x86\xfa\xa8u\x0cJI\x07*\x7f\x13\xe3\xc7\
-\xb5\xd1\xd7\x94\xf06z.\x0d\xe6\x9d\xb5P\x10i\xc0\
-\x17;H\x01\x12\x91\xc0b\xcb\x80\x91#\xc8o*\x9f\
-\xb2m\xfd\x11~\x0d\x93\xe7\xfe-\xbf\xf6\x1f.\x8dd\
-\xe1W \xed\xbb$\x05\x88\xc8\xbe\x10]G\x90?@\
-\x06\x04\x118\x8a(\x83\x92yjiO\xee\xfc\xa3\xea\
-B-W\xf0\x22\x88g\xf8s\xfb`\x96\xab\xf6\x16a\
-\xf8I\x8fO2z&\x19\x87\xde\xfd'\xf3\x08lE\
-5\x03\xe8U\x00e&\x173\xd6\xc0R8\x81\xac\xce\
-@\xe7\x11\xf8\x9f\xe5\xe7\x22w\xe4\x87\xaa\x07`\xb4\xb4\
-\x1aVU\xd6{\xf6S\xd4A\x8a\x89\x1cd\x06\x86\x90\
-v\xf024\xae\xb0C4T6\xc3>\x004\x8c\xa7\
-\x0d\xe4\x84\x11\x01H\xfe\xbe\x98\xb7\xe8\xba\x82\x0b\xe0\x8e\
-`\xe3\xaa5\xc0\xf2\xec,\xd0;p\x17\xcc\x03\xe4;\
-?\xd4\xe6++\xe7N>j\xed\xc6\x88\xfc\xe3}\xec\
-m\xd7\x9f\xfc\x1b\x95\xe0\x02o\xe7(\x84^\xd8\xa1\xe7\
-F$a`\xe6\x12\x94\x8f\x95\x82n\xa4\x0e$\xb5f\
-\xce\x9a\xd6<\x8fYw}\xb5\xb4\xa1n\xa7\x13n\xfe\
-\xa5\xd6\x9c\x87\x833^\xc4\xafN\x19\x22\xaf\xe19\x98\
-mc\x1f3Bd\xb0\xf7\xf5%\x806f\xc1r\x0a\
-\x13\x80\xbd\xb6\x7f\xff\xdf\x81\xdd\x07\x13u\x09\x1d\xf5\xfa\
-[\x1fj^\x13\x8e)\xeb\xc8\xf8\xad1\xe0\xc7\xf6!\
-\x0f\x0d\x8c\xc2\x9a\xa1\xf5\xc1\xe0\x12{G\xa0\xf6>\xbd\
-\xd31?\x90\x83|9'\xe3.\x94\x97\xd4\xc4*?\
-\xb5s\xd0_v\x1b\x19;)\x03\xba\xd4s\x04\x15\x83\
-\xf0\xb7[\x01\x0f\xc0S\xea\xb5\xc3\xaba\xa0X:\xaa\
-9\x98\x1f\xc2\xb9V3\x83\xf1/\xaa\x0c\xc82\xa0\x80\
-8\x0f)8\xa7l^\xbd\xde\xaf\xfd\xb7\x9b\x22wi\
-\xbb!\x02\xc0h\x96\x1e3\x10z~\x14\xa7x\x9f6\
-Z3-?'\x03\xfc#\xe6\xae]G\x98?\xd0\xec\
-\xe8\xe4\xe5SX\x0fL=\x02\xb3\xb5i8,/\xd1\
-\x16\xdc\xdeW\x01&\x0eN\x1d\x16\x1f\xd9,\xcc\xc1\x1e\
-\xd8\x0b\x83\xa5!\xcf\xa06\xc0py\xa4\xa3\xdf\x1f\xda\
-X\x86B\xc5Q\xea\xf9\x16\xe8O\x06\x83HCBT\
-]\x81\xe1\xf7#$\xe1\xb8\x81*\xb0)l\xeb\xa8\xb5\
-\x9b\xe0\xee53'\xb5\xe6Z7A\xb2\x22\xb0\xebe\
-\xc0d\x04\x90g'\xad\x1d\x1e\x11/V@\x16\xb14\
-\x12\xe3\xa6\x9c\x90qG\x12a\xa9r/\x1a\xbd\x1dn\
-\xe9E\x1d\xdakL~\xec/\x1a\xb3m\xf1;\x17\x9f\
-\xf5R\xa8x\x077\xe9\xc2u\xd6|H)\x97Z\x1e\
-\xee\x97c7\x9c\xd4S\x12\xf0\x7f<\xfdMR[\xf3\
-\xe1v\xe1\xdc\xc0@\xb1\x02\xa5b\xc9\x8a\xb9\xf8e\xbe\
->\x0b\xdf\xfa\xdd\x17\xa1>\xdb\x84B\xb9$\xc3\x06F\
-\xf9)E\xfdg\x914 e\xfc\x19\xe9\x09\x90F\xae\
-\xf9)@;h\x11\xe6\xe7\xeb\x91k6\xc0=\x03\x0f\
-\x9c\xe0\xfd\xf0\xd7\x09\xd1?\xb3\x1e \xdf\x81\xe1'\x93\
-\x81\x8c\x1d\xcb\xf7\xfe\x1d\xe4\x04\xa0\x10\x00\xb5H+\xa4\
-\xbcz[@\xfd\xb09\xc7\xc1x(\x07\x11\xec\xd0\xf2\
-\x1c:1\x00t\xe8\xf4_2\x06\xacU\xf7W\x8c\x9d\
-u\xcc\x13a\xf5\xe0Z\xe3\x1b\xe1?w]w\x05\xec\
-\xd3\xeb\xee\xa5\x97\xef\xe6\xe9\xa7]\xf2\xa8\xf9\x1c\x1d\xc7\
-\x11W\xd3eb\xee\x10|\xf3\xe6\xff\x03\xcd\x9aw^\
-CQ)\xffQ\xf6\xde\xb4qHYw\xa3\x12\x8e\xd2\
-\xf80\xf9>\x06m?\xa0\x0a\x07\xd0\x82M\xa3\xde\xb9\
-\x9dwNL0\xfe\x8e.\x9d\xea\x00\x8ch\xc0Y[\
-\xda\xb8fxd\x88\x93@\x02\xfa\xb7\xdd`o<j\
-3\xfe\xa5Q\xdd\x8c6\xd8\xd0\xe9\xbc\x94!@\xe3(\
-n\xddg\x986\x05=\xba\x0d\xbf\x7f\xe9\xeeEt\xac\
-zW\xee\x04\xe4\x01'\x04\xca\x87U#uw\x80\xa1\
-\xdd\x19u?\xa0e\xe8H\xfb\x05\x98\xde\x99\xe6\x06\xe7\
-\xb5\xe0\x02\x5c\xce\x03\x8c\x02\xcb\xb1\xe3!Y\x0cd\x9a\
-\xdf\x81\x8bI\x01l\x08\xc0\x97\x00\x0f\xe6\x8f^=4\
-\xec\xe5(\x8d\xa0\xf7\xbf%>H.\xdbt\x82n\xbe\
-\x885'%:q\x7f\x08\xf7%\x8e\x00\xe2J\x01\xb1\
-t\x07\xa9\x842\xac\x1a\x84)\x86KV9\x85\x07\xd4\
-\x15\xd7\xfe\xa5\x7f\xe9\xe4\xc2\x03\x98\x7f.\xb2\xc8\x19\xc4\
-\xab\xeb\xdc(Z\xa3D\x04\x1a\xf4\xff\x08\xd2\xea0\xd0\
-\xee\x07i\xb1\x0bj\xa8\xc2{\x1d\xae\xe3\x0b\x82\x82\x15\
-b\xab\x06G\xb8\xe8b\x1b\x98\xb58&\xb4\xbe\xe8^\
-\x80D\xe3\xe7_Y\xd1\xd928P\xf4\xe7\xfe\x07p\
-\xc5\x9ff\x8b2\xe1G\x98\xfe\xa8A\x878G\x87\xc5\
-\x1d\x81\xfe\x87\x0e\x92\xb7u\x03\xbe\x80\xa1\xfc\xf6\x90\xc5\
-;\xdc\xdc g\xeaG\xfb\xfee\xd1\xa9\x15\xaf\xc5\xb7\
-\xfd\x11\xf6\xcdf\x13\xaa\xf59\xa8\xe4*q\x80B\xbd\
-\xde\xef\xaa!\x1f\xe5]\x91\xb1\x22\x90\xea\x02P\x9a\x11\
-\x18\xeb\x0bP\xf4\xd1\xf8<\x80oW\xc0\xdaP,\xe4\
-\xd76+\xf9!\x9c\x17$\x96c\x88\xfa,K\xf4_\
-\x08\x09h\xe6\x01\xf2l\xeb\x9a\xc1!1\x04\xa3\x194\
-2\xb8\x00R\xe4\x8f$7\xd4\xf8\xc9&_U\xb7#\
-\x8b\x80P\xaa\x09G\x9a\x81\xc0Q\xf0\xd6\xc9\xa9\xea$\
-L\xf2\xf9\x83\xcd\xba\xd8T\xd3\xbf\xf4/]E\x05^\
-@{x\xfc!(W\x07 \xb7\xe1(\xa8\xe4\x07!\
-\x9f+h\xe9>#\xa0@\x22\xf8\xc02\x5cD-\xd8\
-\x91\xf3\xde\xff5\x9fL\xe7N\x80\x0b\x9c\xa6\xaa\x87`\
-\xb42\x08\xd5\x91\xd9#\xda\xf3\xad\x09\x8b]f\xe6\x03\
-\x16\x93\x02\xc4\xdf;\xec\x88\xa1\x81\x01\x98\xab\xcf\xc2\x81\
-\xa9C\xe0\xb8\xbc;\xcb\x1f\x01&\x11~D\xfbC\xa7\
-\xf4\x00\x11\xfe\xd0\xb1r\xd2HO*\xf8\xe15\x7f\xef\
-\xf9\xab\xadY\xa86\xe7\xa1\xd6\xaa\xc2\xc4\xf4\x1c\xb8-\
-\x5c1\xca\xb8\xfe\xe5Q\x86\x06\x82\x93\x9d3\xf1S|\
-\xb8)\x1c\x82\xbc\x93\x87ra\x08\xca\xb92\x14sq\
-e\xc0\x0d\xb6\xd9\x22Y\x9fL\xe7\x06\x92\xdd\xd7d\x89\
-(\xed9p%E _\xa43\xdf\x9c\x85\xfa\xf4\x14\
-l.l\xf0\xd2\x80!\xd8?0\xb6\x05|Ip\x12\
-\x07\xb0\xe0\x14 i\x03\xb0F\x042\x87m\x1e,\x97\
-\xa0V\x9f\x11j\xba\xf1\xd9\xfdP\xf2\xa0\xd2`i\x04\
-r\xde\xbfp\xbe\xbf\x8a\x08De\x80\xd1\x86\xe08\xaa\
-G\x1f{\xd4$\xe4z\x06_\x83z\xdb\xdf.\xccu\
-\xdfaO|\xd4\x9c\xc3\x16\xba\xab\xba\x7f\xe9_2\xb8\
-\x002\xfeLhO<T\xc0\xe5\xe2\xd3\xee\x04\xe4\x1c\
-\x07\x0a\xb9\x01\xef\xbc/y\xc8\xa0$\xbe\xc6\x16-\xcf\
-\xacC@\x85\x1cD\x1d-\x04\xf9\x00\x0fp\x8dj\xcd\
-\x03\xfa-X;\xb2F\xac\x81\xe3\x0e\x80\x15\x9c#!\
-\xdbL\x80\xae\x22\x00s\x0a\xe0\xb0M\x95B\x01\xe6j\
->Tq\xdb\xae\xd8j3\xc17\xc6\x14\x06a\xa0T\
-\x86R\xbe,f\xbd9\x9e\xd7tP\x1e\x02\x12V\x04\
-\xdc\xc0\xf8\xc5\x06!A\x22\xb6DO\x01\x87>M\xb7\
-NZN\x99|\x9b\xc9\xcb\xe0\xfb\xe9\x7f\xff\xb2$\x10\
-\x00\xe2s\x0f\x94.R\xce=\xd5\xdc9\xa85\xe7\x22\
-\xe6\xbe\xe8\x14\xc5\xa4\xe3\x9cw\xce\xf3=\x089/e\
-px\xdb\x0c\xe4@\x1e\x00\x02\xd0p\xfd\xb9\x99\xfc\xbc\
-o\xb5\xeab\x97F\xb51'\xee\xcb\xe5\xf20X,\
-{1\x90\x97\x04]/\x05\xa8\xf0\xe1\xfbGX\x0c\xbf\
-#g\x90U\x09\x08\x90$\x04b\xb0\xba\xe89\x00\xfe\
-\xe2\x05\x11\x17\x92\x18\xcc\x9f\xe4Rk\xcfG\xd1\x9aW\
-\x05\x84wdD;\x1f\xdc\x16\x1bq\xc8}\xf1\xcfd\
-C\x97\xfa\xf0IG!c\xfd\xf3\xb4\x7fY\xba\x0bc\
-\xf1$&mf\x09U\xb5\x06\xf75\xdc\x86@\xab\x11\
-\xe9\x87\xe1\x92\x10\xd2\xff\xefb\xac\x03p}\xa4+\xf8\
-\x7f\x97\x94\xcd\x03\x84\xe0s\x01m(\x17\x8b\x9c\xfa[\
-\x97\x90\x9aw\x15\x01\xb0$g\xc0*\xf9\xc1b>_\
-\xf2\xdf\x8cOXD\x19\x13\x93GX\x87\xc8\x9f\x7f0\
-\xa1\xa6>4d\xc7!\x8f\x93\x1c\x83\xff\x1c\x0ec\xe6\
-\x9f+\xcaz4\xeef\xef_\xfa\x97E\x02\x00\xa4\xdd\
-\x8dL_\x1e\xa1t;\xb3L\xf7y\x88\xd7\x89Q+\
-\xedw\xe1\xf6\xc0\xb9\xec\x98\x13\xf3m\x8b\xa3\xebrq\
-\x80\xff\xdeZHV\x02\xd2\xdb\xd6\xbe\x80\x85\x0e\x04\x89\
-\xbew\x06sk*\xa5\x81\x00\xbe\x04b\x1b7\xc6F\
-\xb4\xa3N|\xe70i\xe2/DK.\x13\x8c\x9b\xe9\
-\x9dy\xfe\xf3\x90\xfb\xfa\x10\xa0\x7fY\x1e\x08 -@\
-Ae8\xb5\xb2\x94J\x1e6\x13N\xac\x12\xf9.q\
-\x02t\xce\x15\xa3\xe3\xf1\xc3\xdb,\xe8nt\xc5l\xcd\
-\xb2\x87\xb69\xea\xb6\xd8\xa8\x0d\xc1/\x8a\x03\xb0;\x86\
-bn\x94C\x926\xa9g\x12?)\x0f\xb6`\xe9\xc6\
-\x1f\x1b\xb5\xf9\xbe\x089\xa8\x8e\x05H\xaf@\x1f\x01\xf4\
-/K\xc7\x01\xca\xb3$\x0d3.\xe4\xb9\x17\xf1,\x0c\
-\xe3\xe8C\xa6\x8e\x9b\xf7\xc7\xfb\xd1U\xf5\x18\x0f\x0b\x12\
-N\xa0\x90\xcb\xf1\xc7\x0eAr\x7f\xce\x92\x90\x80\xa6&\
- \xe1\x00\xfc\xdee\x8c\xfb\xff\xa5~xF\xe6\xd8+\
-y;5\xf4\x88\xd5wR\x8d_^\xb4\x11\xf7\xc6\xf7\
-\xbc;\xae\x7fyt\xda?9\xeb\x99&Z\x01y*\
-U\x80\x10\xe2\xd1s\xf2\xf30E\x1c\x17+[Cg\
-\xc1$\xb5k\x9c\x82\x04\xe4b\x81\x9b-\x1b\xe9\xc0\xe8\
-\x17%\x05f\x89\xa4`.p\x00.\x06\x04F\xec\xd9\
-\x18PCW\x8d\x9fu\x18\xf9\x992|RF\x0f\xfd\
-K\xff\xb2,Y\x00\x80b\xe0z\x14\x17\x8aWi:\
-\x0d\x81\xf5 #\x86x7\xae\xea\x04\xe4t \xc0\x12\
-\x22sP\x10@Z\xb0\xeej\x0a\xa0{\x1b\xc6\x06\xf2\
-\xb9\xbc\x90,\xca\x93VL\x10\x7f\x81\xc6O\xc8D\xa9\
-:\x002Y\x18i\xb6\xfb)@\xff\xb2\x04$`t\
-\x9e\x01\xd3\x22?M\x15d\xc7\xc0\xe4uxQ\xd5 \
-\x1e\x84\xa3#\x01%\x85\x88\xb1.!\xda\x8d6\xc9,\
-\x5c\x80\xd5 \x9c.8C\xcf\x01\xe4d\xa6\x94\xc9\x84\
-^h\xf4&\xe3\x87D\xe3\x87d\xe3gLYI\xd5\
-\xbf\xf4/\xcbC\x06\xea\xe7\xa3r\x9b>\x86\xe9\xa5k\
-3\xc1M\xc7\xca1\xc9\x8e0\xce?\x84'\x19(\x14\
-\x81\x0d\xe5\x87\x17\xfbV\xd2t\x00\xe9p\x82A>\xcf\
-\x07.\xa2\xb2d\x93\xbc\x11i\xab\xaf\x95\xed\xef\xc4\xf8\
-I:\xa0\xcc\xc7\xeb#\x80\xfee\xa9\x10\x00\xdd\x81\xa0\
-\x15\xd7\xd4\xdd\x14\x910\x80)P_A\x02\xc1H|\
-\xbfK\xd6\xf1\xbe\xbar\xfe\xcf\xc8\xc4,\xb3\xd0uI\
-\xe7\x01\xa4;\x06\x91\x02\xe4\xe4y\x8eH\xbd\x98\xea\xd1\
-`\xd1\xc6/;\x17\xa2\x0c\xec#\x81\xfeeI\xf3\xff\
-\xf8\x9c\x93\xe1\xbc^\x11\x88\x0d\x9dI\x9dB\xa1c0\
-9\x81h\xe5=\x86CG\x95\xfd\x90d54\xb79\
-\x96w\x060\x9d\xab[\xb4\x03\xc8Vg\x0c>\x81\x08\
-\x9a\xa3j\xfc\xa0l\xd2a\x0aI\x98%\xe7\xb7\x18\xbf\
-4!\xb7_\x05\xe8_\x96\x92\x014#\x00\xbayJ\
-\xe3\x00\xa4\xc7\xc4\x1e\xc3\xec\x04TN\x00\xe4\xe0\x16\xc8\
-\x0dy\xef\x01\xe4X!\xa3\xddv\x15\x01\xa4|:\xf2\
-f\x1c=\xaa+Fn\xca\x99\xac\xc6O\x97b\xe8\xf9\
-W\x80\xd5\xfa:\x80\xfee)r\x00\x02z\xf5*@\
-\x0c\xff\xd5\xafL\xda9\x81\xaaP(\xac\x98!\xb38\
-\x01B@R\x1e \xd9\xd03\xa3\x81|\xf7\xcc\x9f\xc9\
-\xe5\xbe\xa4\xc8/\xed\xb8'd\x07d4~\xd0\x7f\xc6\
-\x18\xe8\xab\xa9\xfa\x97\xfe\xa5\xab\xdc_B\x15\xc0b\xb4\
-R\xb4\x072\xf6\x9e1\xc9\x09D\x86\x0fD\x19\xa8:\
-\x18\xc2\xa3\xf1\xd1{\xd0r\x1b\x0b\xcd\xfd\x17\xeb\x00b\
-\x0f\xe3\xe2\x5c\xbd\xd9\x0c\x8c?\xe7\xef\x87\xe1\xf0\x84\xbf\
-@\xa6\x10\x7f\x12u\xc0\x0c\x22\x9f\x85\x19?\xc5\xff}\
-\x12\xb0\x7fY2\x120\xf6\x04\x9a\xfcW\x8d\xfc\x1a\x07\
-\xa0h\x05\xa8\x13\x88\xea\xfd\xb4D\x18\xf0h1\xa7\xe0\
-\x0f\xe1\x0a\xd3e!\xbb\xe7\x9bw\x17y\xc9/\xc2\xf8\
-\x95{\x9d\xa09\x80\xae\x8bV\xcbv\xa0\x19md\xba\
-T\xf0\xa3\xe5\xfc\xc9\xc6\xcf\x16\xd5\x11\xdd\xbf\xf4/\xd9\
-3\x5c\x99\x03\x08\xb7Z)\x82 \xb5\xae\xaf@~\xd9\
-\x09\x80\x99\x18\x8c\x14\x83\x01\xb3\x16t\xd2\xfa\x01\xd6\x9f\
-\x82\x05=r\x00\xb2gtq\x96#\x00\x87\xf9#\x95\
-\xfd\x0dqr\xb9/6pPZz\x01@U\xfb\x99\
-\x08\xbf\x14\xe3\xa7,@\x9f\x02\xe8_\x96\x8a\x02\x88\xf5\
-\xefr^\xaf\xe6\xfer\x9e/;\x01\xa69\x0131\
-\xc8\xe8\xda1\x16\x8c\xc3\xe76\x16XX\x93\xcf\xbd\xac\
-\xb7\xeb\xbdp\x00r%\x12\xbd\xd7\xe2\xc1\x91p;\xac\
-\xc3H\xde\x0f\xb2\x81\xd3\xa5Xf\x98/\xa3\x05\xb9Z\
-`\x7fl(\xb6\xd0\x96N\xf6/\xfdKwI\x00\xd2\
-\x88&\x9fj\xb4\x0a ;\x01f@\x06\xc4\x09D\x11\
->\x1cv\xcb\xa4\x9fE34Y\x10Z\xe3\xf3\xbc+\
-\x83/\x17\x8b\x00\xf8p\xbe\xa9j\xa3\xee/U\x08\xf0\
-\xbf\xc3Xb\xb9O\x17\xf5\x98\xd0\x02K\xe0\x03\x14\xe3\
-'\xb8\xbf?\x10\xac\x7fY\x12\x04\xa0\x90\x81\x11*0\
-\x18=j\x1c\x00\xca\xd5\x00-]\xa0b!\x8c\xca\x87\
-q\xc7`\x10\x5c\x1d\x9e\x06\xe4\xa0\xd1l\xf1\xe7\x98\xee\
-\xc6\xa9\xbe\xf8\x14\xa0\xe9N\xce\xd7k\x90\x0b^ \xff\
-\x1aN*\xa6\x9e\x92\x1a;\x7f\x8f\x8e\xa3\xb6\xf4\xc6\x89\
-\x16Cf,\xf51\xc5Q\xc8S\x83\xc8V\xe1~\x0e\
-\xd0\xbf,A\x0e\x10\x03M\x16Q\xf4\xaaQ\x83f\xe4\
-,>/\x15]@\x8c\x1c\x98\xbe\x189\x9a\x80\x0d\x11\
-\xb1\x1e\xa6\xd9\xa2\x02\x808k\xf1O]w\x00\x89O\
-\x8e\xb5\xf6\xc4\x5c\xbd.v\xac\xf1+\xf3<\x94\xc3@\
-\x22\xfd\x22\x96NQ\xf9\x01\xa5\x02\x13#\xbd!\xe7W\
-\x7f\xdeg\x00\xfb\x97eb\x02\xadR`J\xdeE\xec\
-\xbf\x1c\xf9e\xc6?\x9c{-\x8b\x85\xa2\xcc\x99,\xc8\
-\x11\xf4\x9fg\xfc\xdc\xc6\x1a\xed\x08\x01\xd8\xec\x13\xb3:\
-\x86N\x11\x00\xaa\xb7q\xae\xe5\xa7\x00\xb9\xbc\x9f\xa7\x04\
-pE\x9f\xe3\xc7T\x0d\xb1Q\x04dw\x06J\x0a\x81\
-\xf1T \x19\x01\xf4\x01@\xff\xb249@t\x8e\xa9\
-\x03>\x18(\xdf3\xe2\x04\x0c\x1c@\xd8\xe1\xc7\xe4%\
-8\xa0=O\x98\x1e\xf8\xf9\xbfp\x00\x9em\xd5\x1aM\
-\xfe\xf8\xc9\x94@\x9d\xc9\x0a\xf2\x1dD~4\xa4\xd9\xe8\
-\xa5\x00\xcdv\xdb\xad\x82\xeb\x96\xf9\x9ct\xc7\xc9\x09\xa8\
-\xc2\x02\xcf\x16\x93~\x0a!(\xa1\x02f\xec\x8a\x22\xcd\
-\x84\xd6\x0e,\xbd\x1b\xb0\xcf\x02\xf4/K\xcb\x02\x88\x81\
-5\xe1\x1e?\x83\x13\x10\xaa>\x0d\x09\x988\x03T\x9c\
-G\xf0{\xe1H=\xf1\xbd_\xfa\xe3\xd2_>O\xd8\
-\xc9\xe5\xa0Z\xab\xf1\x09\xa1\x87,6\xda\xd1\xc9\x9f\xcf\
-\xf8\xae\x93a\x06\xe2\xa1Z\xb3\xb5\x85w\x05\xf2\xf1\xc7\
-\x22\xbf\xa7\x03A\x15B\xd0&\xf4\x89U\x83`D\x06\
-V\xe3'U\x80\xbe\xf9\xf7/Kf\xfe\xd2\xdc\x09=\
-\xf7\x97D;\xc4?\xd8K\x84L\x1e\x1f\x16T\x02P\
-\xea\xe0g\xc1\xd6\xe2\x1c\x14r\x0ep\x1b\x9b\xadW\xb9\
-\x038\xd8\x8d\x88\xb7\xd0\x14@\xfa\x8a.\xec\x99\xa9V\
-\xb7\xf0\x0e\xa5\x5c\xce\x11L%\x1fk\xca\x5c\xb4\xc0{\
-\xd0\x22\xbc\xea\x1c\xb2\xa5\x05\xf1\xe3\x06\xca%\x98\x9b\x99\
-\x87\xff\xf8\xfd\xbfB\xa9P~\xcc\x9c\x98\xa7\x1dq.\
-\x9c\xb5\xe5\x89=\xfb\xfb\xbb'\xee\x17\xe3\xe0\xf8\xe5\xa1\
-\xf1{{\xf6:\xc6\xe6\x1e\x81\xb9\xc6\xcc\x92=\x7f\xbd\
-Y\x15\xa7j\xa5R\x89\xf7\x02X\x9d\x00\x93\xbe\x07\x89\
-\x03\x90\xf5\xff\xcc\xf28\x08\x86\xdb\xf0KXU\xe3N\
-\x80\x0f\xdf\x99\x9c\x9d\xe5\xe4\xfb^SJ\x9er{\xd1\
-\x0e\xc0\x94\x0a\xf0\xddE\xfbgkuX=X\x12\xc6\
-\x1f\xa7\x00AD'-\x93d\x92\x9f_\x0d\xd0H<\
-\x05)\xf8[CS\x91\xc0\xea\xf5\xab\xa0:_\x83\x9b\
-v]\xff\x98\x8aL\x95\xe20\xec\xe8\xa1\x03\xf8\xe8\x7f\
-\xbd\x11\xaa\xcd\xb9\xc7\xc4g\xed\xe4\x1dX\xbfq\xbdA\
-\xc7\xaf:\x01\x99#\x88\x11\x84\xce\x15\x00\x82\x96\xc0\xc6\
-\x011\xfa\xcb\xc2\xae8\x01X\xf0\xd2\xec\x89\xb9\x19>\
-[\x7f/\xe8\x13\x02\xba\x9e\x02\x00\x98\xc7\x10\xc8\x7f\xa4\
-\x85{\xa7\xab\xf3\xb0~dP@\x14Q\xaf\xe4z\xe5\
-\xd0\xf2\x9d\xce\xa3;38\x83\xa4\xc7\xe6\x0b\x058r\
-\xdbf\xa8W\xebb\xd9B\xfc\xb7\xc0\xd0d\x04@\xa7\
-\x16\xab#\xc6\x00d\xc5\x22(\x92d\xda\xf2\x14\xdfG\
-\x9f\x93<\x93\xc2QH\x22\x12\xe9\x95\x81\x04\x89\xe8\xf3\
-\x80\xc2r\xf8;\xea\x9ap\xcf\x83wv@\xf7,\xed\
-etx\x15\x8c\x0c\xad2\x9e\x22\xa6[\xda\x9eL\xf5\
-Qd\xbe\x1c\x9a\xde$\xa2\xf4\x1b\xa5R\x19\xf2\xf9<\
-\xb9_]\xb9M3Vy\xfd\x16*\xf7G\x9b\xfb\xe2\
-\x85~\xa2\x0cW\xae\x94\xa1P\xc8\xc7\xc3A,\x22\xa0\
-\x98\x03\x00M\x1f\x10M\x0d\x06e\x1c\xb8\xe4 0\xd2\
-\x018A\xc9</*\x00y\xb1%hrn\x16\xdc\
-j\xfb\x91\x944=\x933XH\x0a\xa0!\x00l\xb9\
-{\xb9W*\xe4\x8f\x10\x83\x0a8\x19\xe87\x04\xb9Z\
-\x99\x8eYI?\x85\x1cT\x0c\xdf\xc8\x09\x80\xecP\x0a\
-\x9e\x13(\xf2QI\x16'a\xe7\x10\xd2\xab\x12\xb6\xc7\
-\xa7\xb67S'`\x9d\x92L|>\x03\xa5iJv\
-\x14\xe1\xcf\x1f\xdc}/y\x8e\xdey\x800'>o\
-\xc7\x93\xbd\x1c\xb5`4Z\x94\x8c\x19#\xe3\x8e\x0dO\
-\xffy\xbc<S7H\xe91H\x96m*\xa3\xe9\x11\
-QZ\xc2I\x7f/\xfe\x1eS\xbe\x97\x1f\x1f\xea\xf7m\
-\xf2_u*0\x98\xa6\x00E\xed\xbf\xa0\x95\xff\xa8z\
-\x90\x05\xe87\xc7\xe9?\xcf\xf0\xf90\xd0\x82\xf7uj\
-\xdes\x00\x93\x8d}\xb6\x94\xbc\x93\x8a@V\x12\xd0t\
-;v\x00\x0dw\xdf\xd4\xdc\x9c8\x01r\xa2\x1c\xe8\x97\
-+\x5cuf\x08SH\x11G\xe9\xe1a\xf2\xe3t\x9e\
-\x00\x12\x89\xc4\xcc\xf7'>\x16t\x83O\xd0#\x98\xc6\
-\x94\xdbf\xbfY\x97\xa0h\xce\xc1l\xf42\x82`\x9d\
-\xd5{\x96\x1a\x1eKM^\x18\xff?0\x98\xe8\x1e\x11\
-\x1d\xe5\xa4Y\xd4\xc65:\x1d\x94\xdbdK\x0e2\xc2\
-\xc2\xd3i\x1bj8&\x1f\x10S\x7f\x0f\xccC=\x81\
-\x9e\xa0\x18.\xb5W\xc1G\x82\x13`\xc9\xbd\x01\x88\xc6\
-\x94@*]\x93\xa9B\xfc\xab\x93\xf3\xab\x00\x1c\xe1\xcc\
-7\xea|;\xd0>h\x07\xeb\xb7\xcdi@\xd7I@\
-[\x8e!\xbe\xf7\xbc\xd1\x83\x07\xa7'\x05A\xc1s\x94\
-|P\x0a\xd4\x22\xab\x0a\xeb\x0dQ\xdcF\xf21i\x9c\
-\x18u\x14\xdd4~Y\xac\x94(HJ\x8c\xfa&\x94\
-\x00\xd6\xc1\x8fiH@\x1e\xad\x16\xa7,R\x07T\xcf\
- @x\x98|\xa5\x1a\xd2\x958\xa0\xec\xc3R\x0a\xe6\
-&g\xa0\x1b\x7fhA\xca\xfdF\xe3'\x1b\xa2U\x87\
-@\x9f\xc3tvk5|\xb0\xe7\xf9\x89N 8\x8e\
-.\x10e`\xbc\xfa;&\x03\x99\x81\xfc#:\xc0\xe0\
-~\xce\x91\xf1\xcaZ\x9e_\x9d\x82\x07\xff\xe7x\x8a\xbb\
-3\x83\xf1gB\x01\xf9\x0e\x8d\xdf\xc4\x09 \xce\xb5f\
-j\x8d\xfaX\xa3\xd5^W\xc8\x17\x84#\xe0\xf5J\xa7\
-\xed\x10\x97\xa6\xcc\x05\xd0Z\x82e\xa8o\x8b\xcc\xaa\xfa\
-OF\x09\xd9\x8d?k\x99\x1129\x030\xf67P\
-\x95\xe3\x82\x0c\xdf\xc8C\xc8#Wz\x8d\x00$\x8e\x86\
-1\xa0\x9d.\xc1\x94{\xffQA\xcd;\xbaWS\xcf\
-\x90h\xacD~\xb9u\x0e%\x8c\xa1\xd7\xda \x11\x0d\
-\x98\xf5\xf8\xc4A(\xc6o\xfd\xeaW\xbf\x0c2`\x16\
-\xaf\x00#\x9c\x00\x00\x184\xfe\xa0L\x06\x8a\xcb\x82\xe0\
-\xc6)\x80 \x00=\xbb\xe2\xf0\x7f\xef\xc4\x18\xe7\xdc\xee\
-M0\xfe\x8eH\xc14!\x10K\xad\x00\x84\xc0\xa6\x0d\
-\xf7{\xdei\x1d\x7f\x91\x82\xac\x10\xc3\x0b\x1c\xb1/@\
-\x19\xd9g\x88\xea\xea\xb2a\xc5\xc8,\x95\x00\x1d%@\
-W\x8d\x9f\x19\x9e\xdb\xca\x0f\x18\x17\x97(\xbb\x0b\xacP\
-_w\x02*jP\x89A\xc6\xf4\x8e\xb4^#\x80x\
-\x92M\xcafL\xd5h\x89\xa1\x86\xa8\xc0\x0f\x88&G\
-`\x80\xf2\xb4\xbd.\x15\x0d\x98R\x82\x94\x88oP\xfb\
-\x013?\x96!#\x22\x1e\xe2$([H#\xbf\x92\
-\xfb\xa3\x922s\xe3\xe7\xbc\x1aG\xd6\xc5|\x09\x1e\x99\
-\x1c\x07/\xe5\xbe\xcfd\x83\x0b9\x13:I\x01\x92\xaf\
--\xf7\xdeC3S\xe7oY\xb3\x1a\x0a^\xae\xc2_\
-\xb4\xd3r\xc4\xce\xc0\xf8\x00\xd3.\xbe\xa4\xbc?\x99\xf1\
-g\xcc\x5c2T\x0d\xb5\x13\xe3\xcf\xe6\x14\x00\x92\xfa\x15\
-\xccQ\xdf\xbe\x0f\x81e\xe5\x01\x98\xa1\xea\xc02q<\
-\xcb\x8b\x04\x98\x13\x02\xd8X\x05\x1aL\xba\x85\x80\xf5F\
-\xc5\x19\xb0\x10vK\xa8 6N\xdd\x110\x05\xca\x1b\
-\x8c\xdf\x8a\x062\xf0\x01\x09_\x8dN\x00bv\x1f\x22\
-\x82\x90i\x93\x81T#\xa7~\x0bi\xed\x87 \x07\x88\
-*\x009\xcf\xf8\xf3P\xf2P\xc0\xfe\xa9q.\xbf\xbf\
-?\x93M.\xc2\x01\xa0\xc4\x84\xa4;\x03\x17\xeb\xee\xdd\
-{'\xc6\xe1\xb8\x0d\x9b|2\x90\xcb\x829\x11\xe8\xeb\
-\x1ae\xc36E{QjaQ\xfe\x13\xea\x07\x98\x12\
-\xf9Q\x8d\xf2F\xde\xc0\xfe\x98\x85\x1b\x7f:\x22\x00\x13\
-\x91h\x19\x8aj\x1a\x9a\x9a\x9e\x0e\x00I9\x1c`+\
-`\x0ar(\xc2t\x98\x5cb\xd5\x92^%\x5cj\xce\
-\xa0\x93\xfc\x1f\xd4\xdc\x1e\x92\x1d\x821\xe2c\xe7\x11\xdf\
-t?\x80\x22\xfaa\x0a\x22P>\x12U#\x10H\x86\
-1\x84\x03d\x15\x18\x13\xc6\xcfK\x7f\x1c\x05\xf8\x04\xfb\
-\xd8\xf4$\xb4\xc7\xea;\x13\x8c\x1d\x97\x1a\x01\x18\x1d\x81\
-;\xd3\xbcs\xef\xf8\x18\x14\x8b~\xae\x22d\xc1\xde\x0b\
-\x17\xa3\x8b\x98\xcc\x03H\x86)M:5D{0L\
-\x0eb\xe6\x12!\x18\x90\x809U\xc8\xe0\x14X\xc6\xb2\
-%@j\xb9\xd0\xb6\xd0\x04\x94]\x08\xa0LE6!\
-\x01&\xc9DV\xc2\x1ct\x8a\xb4\x9c\xb8n\xceXT\
-\xe8\xa3\xc6\x1e\xa1\x03\x9b\xf1[6Y\xc5\x84\xa1\x01\xba\
-\xd3\x9f\x1b\x8d\x9fe\x0f\x8a\x19\x9d\x00h\xd0\x9e\xcc\xfc\
-w\x09\x93/\xbd%\x94\x08>\x168\xa1\x08\xe5\xb9J\
-7 \x80 \x00y@-\xe6\x8b01;\x03n\xcb\
-\xbd\xd3\x0b\xb7\xad\x80f\xc4\x042pIu\x00Q\xe4\
-\x0f_\x88{\xa8\xbe\xc7{\x81\xe3\xed6\xac\xe1k\x8b\
-\xb8\x13\xf0\x15\x81N\x04\x08\x19=\x16\x8e\xc2\x07DH\
-\x80EH@\x22\x0a1\xee\xc56\x0a\x83\x8c\xa9\x02X\
-\xf5\x07F\xa3\xcd\x1c\xfd-h\xc0\xf23\xeb\x12\x14\xe5\
-\xe7\x00\x06\x87\xa0\xf2\x00L\x9e\xf8\x8c\x92\xc8\xa5\x17\x97\
-\xc0\xc8\x83iPH\xb7d\x98\x86\xe6\xeb\x03\xf1\xe5\xf1\
-7\xda\xbc,\xb0\x97\x06!\xe6\x04P\x81\xce\xf49\xc5\
-\xf9\x97b\xd8\xd2\x88/*V\xb28\x01\xf9\xa5\x86\xe5\
-L\xb9\x04\xe8j\xea?\x16E|\x88\x88\xcc\x98\x17\xa0\
-\x13\x83\x80\x8b\xd9\xc0\xef\x01\xe0\x81\xb4\xe8\xc1\xff\x87\xc7\
-\x0fq\x09\xf0\xad\xdd\x80\xfe\x8bQ\x02\xa2\xcd\x11`\xcb\
-\xbdu\xff\xd4\xe4\x85\x95b\x11\xf2\xbc\x1a\xe0\xc1\x97\xa6\
-\xd3\x12;\xcd%\xbc\xea\xa8\xec\xbe\xc2(\xd9\x8c\x90\xa9\
-\x9bR\xcci\x80\x96\x0et\xc1\xf8Y\xa6y\x05`\x11\
-.\x01h\xad\xd1\x06\xc3\xb79\x01j\xf8!rp\x18\
-\xe1QzY\x05d\x94\xb7q\x82\x9a\xbe\xce\xf6+A\
-P\x82\xf1!*`d\xb5<\x22\x1a\xf2y\x83.\x00\
-\x99\xdcD\xa3\xa5\x02\xd9\xf3|S\xb9/\xd5\x09\x90\x07\
-\xd0\x1e\x00P|V\xf4{.q\xe2n\xac\x08T\xb5\
-\x00\x22\xfa\xe7\x1c!\xfe)\xe5\x8a\x02\x01\xec\x1a;\x00\
-^\xaa}k\x06\xe3_\xb2^\x80d\xcf\xd3po\xf1\
-\xd2\x80\x0bO;j\xab\xf0Xb@\x88\x13\xec;\xb3\
-A\x7fP\x87\x85(\xab\xc4\x03)1(K\x11\x98%\
-\xcf\xb7\xa6\x1a\x19\x8d\x7fa|@r\xd4O\xe5\x01l\
-\xd1\x9f\xd9u\x00 \x8dB\xeb}\x19@J\xb5\x22i\
-\x9b\xb1\xc1\x9d\x88\x85\x18\xd1\x0d\xe8\x91_r\x04\x12)\
-\xa8\xd7\xf6#\x9b\xb50\xfb\xa9\xc6\x9eP\xee\xd3^\xba\
-K\xfd\x12\x93\xca{R\xe3\x0f\xf5_\xa42@\xb9\x03\
-\xc9i\x00Q\x19\x06\x1d\x80\xa2\xfc\xe7\x19\x7f\xb98\x00\
-\x0f\x1d\xdc\x07\xeeD\xfd\x16\x82\xbc\xdd\x8c\xe5\xc0\x05;\
-\x00\xd5_cB\x1a\xe0\xbas\xad\xdbv\x1d\xda\x0f\xe7\
-\x1c{<\x14s~\x1a\xc0\x15\x81\x18\xce\x0a\x07\xa5\xb0\
-\x88\xb2\x01\xaa\xa5.0\xa8\xf2\xac\x8c?2i[0\
-K\x88\xee\x9d\x1a\x7fv\xcd@\x96\x89\xc6 \xcdD`\
-\xa9\x86o\xd7\x01\x84z\x9b\x15@\x01\x04\xa4\xa4\xa3\x08\
-|\x88\x16\x80X\x90\xa6\x030\xc1~\xf56$\x90\x7f\
-\x0a\x1a\xe8\x84\xd9\xcf\xca\xf4\x9b;\xf6 \x12=\x99\xc6\
-zQm\xbf\xef4\x98Fu`\xb8\x13\x10C\x97\x18\
-\xa7\x0b\x5cOS\xf4\xae%/\xa5\xe6S\xb7f\xe6\xe7\
-\xf6\xb8S\xcd\xb1\x84\xfc\x1f\x13\x88\xfbE\xa7\x00\xa9(\
-\xa0\xbd\xbfv\xe7\xde\x8dc\x02\xae\x94\x8a\xc5\x08\x05\xb4\
-\xdb.i~P'\xfc(\x11\x8dT\x04(\x09h#\
-\x0dA!\xfb\x98\x85H\xb4\x93\x8c\x1d\x1a\x7fF\x85\xa0\
-1\xea\x1b\xa5\xc1\xd9\x0d_.\x03\xb2\x95Q\x05\x0c\xfe\
-\xb6#\xad\xaeB#\x12\x88\x22:$\x09}\x92\xb8\x00\
-\x9b\xcc\xd7\x00\xf73\xbc\xee\x850\xfd\xf2:\xaf\x90\xd4\
-\xd3\xe1\x7f\x0c\x5c\x5c\xa9\xfe/\xc9\x1f\xc8\x02\x10\xba\x14\
-\x84\x03f1\xff/ \x00\xb9\x03805\xc1\x17\x81\
-\xdcN\x8c\xdfM1\xfc\xaeL\x04\xb2\x8d\xda\xd1\xa2\xbf\
-\xb8\xba\xd8j7\xdb7\xee\x9d\x18\x7f<w\x02yQ\
-\x0d\xc8C\xcbi\x82\xeb\xc6F\x18\xf2\x00\xa0\x0c\x05e\
-\x00F\x03\x14\xf2JG\xce\xfbe\x85\x1e$\x94\x04\xcd\
-\xf2\xdel\x15\x02\x87\xecwW\xa3\xbb\xa3\xa5!`u\
-\x06\x90\xda3\x90%\x05\x90\xbb\x1aC\x1f\x80\xbd%\x01\
-#\x0e\xc0QJ\x95J]\xdfxFeC\x01\x8c\x94\
-\xd0l2_4I#4\x89\xae+\x0b\x84\xc2\xab\xf8\
-{\xae\xce\xf4\x9bf\xff\xbbq\xcd\x1f#^\x8b\xe9\x8a\
-@B\x0e\x02\x1dU\x17\xbd\x057x\x1c\xd3\x88B\xfe\
-\xd9\xf1\xee\xbfB@\xfe\x0d\x14Jp\xdf\xfe\xbb\xf8\xfc\
-\xcd\x1b\x15\xe8\xeffp\x04\x89\x17g\x81\xbd\x00v\x22\
-\xb0\xe6\xfe\xe2\x81\x03{\xa1R({\x9e\xab\xe4\x0b\x82\
-XN\x9f\xfa\x13F4\x94\xf3d\x94\xda\xa2T\xa2O\
-\xde:\xa4\x19%Bf\x0e \xa9\xd4\x97l\xfc\xf1\xcf\
-X\xa0v\xf4GDYR\x8fpF\xa2\xf63GA\
-\x14\x8et;\x8c\xa8Np\xbf\x13\xfeM\x16\xff\xedX\
-\x8e\x06\xbd\xbb\x92\xf4\xc6\x91\xdeS\xfcz\x1d\xe5{\xfa\
-~\xc2\xd9\x11\x8e\xfa9I\xb7\xd5\xcfG\xf9\xcc\xac\xa9\
-\x5c||\xe4\xe3\xa6<\xce\xf2\xb3$%\xa9\x91{\xa2\
-\xf3\xad\xd5\xf9\x95\x9a\x08N\x1f\x8d\x17\xf9\xd4`\xf8'\
-7~nC\xfcz\xcf\xde]\xd0>X\xbb1!\xff\
-_\x10\x0ap:\x07{\x92\xc1\xeb<\xc0x\xfd\x17w\
-\xef\xd9\x05\x03%\xef\x85\xf3T\xc0\xbb\xe6\xc8\x9c@:\
-\x15(v{\x06C#\x1bQU\xf2\x90BzHQ\
-\xfd\xd9\xee\x03X\xa8\xf1'9\x05'\xc1\xd98\x86\x93\
-Xw\x02\x8e\xc5!\x84\x8f\x0f\x0de\xc5\x0cA\x8e\x0e\
-\x81\xc9p\x9dtg\xa0\x18\xbcc2~\xd58\x8d\x9f\
-\xa5\xe2\x18l\xc6n;\x9e)N\xc0\xac:5\x88\xce\
-\x98\xba\xa3NE\xba\x86\xd43<\xdf\x83\xc7\xe7\xc4\xf0\
-\x0f\xae\xa6\xe5\xf6S\x12\xe2\x9f\xf9\xf9\xeam8\xdb\x9a\
-4\xd8]\x92F\xa7ke@\x96F\x00F\x0e`\xa2\
-\xb1orf\xe6\xc1\xd9Z\xfd\x18\xce\x5c\x16\xf2\xbe*\
-P,3\x84\x00\x82iD\x1e\x18;\xf0\x08+H\xc6\
-'(+\xc85\xc7\xa1\xab\x07\xe5\xb9\x83\x19\xbcz\x82\
-\xf1g\xab\x08@\xe2L\x01\xb9\xec\xa7J\x833\xf0\x00\
-\x0c\xa4V\xa0^\xa6\x00\xf1\xb1\x0b\x97VQ\xe9/\x81\
-\xbd\xc6\x8e\xbf\xb4\xfc?\xab\xee\x1f\x0c\x9d\x7f\x0b \xff\
-@\x96\xf1&K~\x99\x04\xe1\x81\xfeL\xda\x1d\x18\xbc\
-$7\xeegFDC\x05\x87E:\x00N\x9cs\x02\
-}@\xc0\xff\x22\xdc\xf6\xf0N\xc0F\xfb\x97\x06{\xb3\
-q\x01K\xa2\x04d\x19\x00\xa1\x9f\x064\xdd_\xee\x1a\
-\xdb\x7f\xcc\xb6\xf5\x1b\x04!\xc8u\xcc->\xcb\x9c\x7f\
-\x08\x8eJ\xfc\x85U\x12F\x1a,X\xb48\xc4\xa4\xea\
-\x93\xe0T\x0a\xe9\x07I\xd1>a\xc0hf\xe3\xb7*\
-\x04Y\xe2&\xa4\xec\xd2`3\x0f\xe0\xac\xb0f P\
-\xe6\x01\xe8\xd2_\xea\x0c\xb2\xe4\xff\x19u\xff\xa6\xe6\x9f\
-\x8438\xa9\xfc\x17u+\x9a\x1c\x05\xc8NFJU\
-1\x96\x1cQB/^\xf3%O\x07f\xb4]\x9a\x9c\
-\xaf\xe2\xb1\x0e\x88!\xa0\xbc\xf7\xbf\xe8A\xffJ\xa9\x0c\
-\xf7>\xb2\x1b\xdc\x99\xd6\xafL\x01w\xb1i\x80\xb3\x80\
-C\x9e\x8e\x02\xa6\x9b7\xdc\xb9g'T<\x04\xe0\xab\
-\x02\x8bB\xcd\xc4\x98\x81\xf83\x1a%\x15\xbb\xaaHA\
-\xd7\x04\x80\x96K\x19H?\x96\xecL\xb2\x0a\x8b\xe4\xdc\
->YJ,AU#L\x8d\x1f\xeb\x80\x85\x13`\xcc\
-\x98W\xd3\x9c\xb3\xa7\x14@\xe4\xec\x1c\xf9\xbdH\xf79\
-Z*\xa3\xbd\xb7,\x9fG\x87\x9f1\x18\xf9\x98de\
-hb\x13\x9a\xea\xd4%\xf8\x1f\x18\xb1\x06\xffA\xd2l\
-\xa8\x95-\xb5\xdd[\xf4\xfe{\x88\x99\x8b\x7f\xca\xc5\x12\
-\xd4\x9b-\xd83\xb6\xff@\xfb\x91\xea\x9d\x09\x86\xef.\
-4\x14,D\x07\x00I\xc6\xcf\xaf\xed}\xd5[w\xad\
-{\xe4@\xab\x8d\x1b\xca\xc5\xb2\xe7\xc9\xe6!\xdfp\xa0\
-\xcd\xc7\x84!y\xe3(\xcf\xc7\x93\xf3z\xfd>\x04=\
-\xeaK\xa4\xa2f\xc0\x90\xa8\x1f\xb0\x1e\xec\x0e\xc9\xa0\xec\
-\x22!H\x1e(\x92I\x1aL\xd5\x8d\x00\xbdV\x02\x84\
-G'\xe2&\x94\xe6\x9c\xc4\xa6\x1f05\xf3t\xda\xf4\
-\xb3\x80\xba?$ \x01`\x86r\x1f\xc4\x9c\x15\x15\xfc\
-\x84'\x1f\x81\xf7\xb4\x8e\xef\x0b{\x18\xa9\x1c0^*\
-\x93\xc9\x1b2\x07\x5c _>\x00\x84\xd7\xff\xf3~\xfe\
-\x7f\xcf#\xbb\xb8\xfa\xefG\x19\xa3?@\x87\x93\x81\xba\
-^\x05\xf0\xae|TQ\x1b\x1b\xee\xf5\xf7\xed\x7f\x18\xb8\
-\x03\xe0o\x84K\x83\x1dp\x14\x19\x14\xed\xf9\xc7h\xa6\
-zT\x1d0\xb4\x08G\x86\x8d\xaa\xd1*N\x00\xed\xe5\
->H\x82\xfaKf\xfc&r+\x8d\xf0r\xc8VX\
-'\xea\xb8\x8b\xaa\x1e,\xc3QY\xea+\xfd8MQ\
-\xdf\xf0\xd9E\x9b\xa4M\x8c\x7fR\xe4W\xee\x83\x05*\
-8S\x91\x80!\x9d\xd3RJ\x06))\xa5\xc2\x03\xa1\
-\x8cx#\xe1\x1a9\xbf9Q\xceK\xe7%\x0f\xfe\x0f\
-x\xd1\x7fp\xa0\x02\xb7\xee\xba\x0f<D}}`W\
-\xa6\x12\xa0\x0b\x8b\x18\x0b\xd6\x8d*\x80\x11\x05\xb8S\xcd\
-\x1f\xfd\xf7\xae\xfb\xbd7Q\x86r\xc1\xd72\xe7\x83y\
-\x81q\xf4R\xc9/\x99\xf8\x93=e\x80\x02P\x87\xfe\
-H\xeb\x8b6$\x91\x91\x03\xc8:S \x15J&2\
-\xd4\xd9\x9c\x80c\xa9\x068Q\x0a\xd0{\xfb\x8f\x8f\x22\
-qP\x91q;\x0a\xc3of\xff\x9d\x05\x18\x7f'\x9f\
-{\x9a\x13\x80\x14=\x89Uc\xa2\x9c_1\xfcG\xa5\
-,\x18n\xffU\xd3W\x8c\xcfi\xb2\xfb\x8fK\x7f\x07\
-\x0a\x03P\xab7\xe0\xe1\xb1\xfd{\x09\xfcog\xc8\xfd\
-\x97\x84\x04L\xca\xff\xd5\xe8/\xbe\xf2\x17\xbdg\xfd\x81\
-G\x1a\xcd\xd6\xa6\xb2\xe7\x04J\xb5y\xa8\xe5\xea\xe0\xb4\
-\xdb\x1ebB_\xd8C\x97\x05\x00\x93\xc6*1\xa6J\
-\x851\x9d\x044M\x05\xb2\x1e\xd8$a\x90\x93\x22A\
-\xce\x10q\x12\xa6\x19gR\x08\xda\xd2\x810\x8a0\x87\
-(\x02{?\x15Xm\x07\xd6;\xfc\xd4\xf1\xb7I\x1d\
-\x7fi\x8a?\xb0\x0e\xf6\xcc\xac\xf17\xf6\xf2;\xbeX\
-\x88\x92\x86ak/)\x15`\xc4\xf4s\x89/\xd9\x80\
-M5\xff\xd2[@E\x06\x8c\xd1\xda\xef0m\x10\xe4\
-\x1f\x84\xec\xff\x00T<\xe4|\xd7\xbe\x878\xfc\xbf\xde\
-\x16d\x13\xca\x80]\xd5\x01`\x8a#P_P;\x16\
-\x05\xb5\xbfw\xc7\x9e\x87<\x040 \xd4L\xbc?\xc0\
-\x17\x06\x99\xf2s\x90R\x00)\x12\xa3:\x1f@\x15\x06\
-\xcb,\xba\xd5h\x13\x08\x1f\xb9Z\x00\x9d\xf5\x13X\xc5\
-=\x06\x02*\xa9V\x9d(~Q\xa3g\xe6\x16\xade\
-\x81\x00\xf1g\xeah\xaf\xdd1\x92\x9bNFQ\x94\xac\
-\xb1\x00f\xfe\x5c\xd3DC\xd9\xb8\x1e\xb9n\x8fH\x95\
-\xa7)i\x02R\xa8\xafT\xa4\x00d\xd9w\x98\xdeb\
-\xfcw\xf9\xbb+\x08\xf8_\x12\xe4_\xc5\x0b\x9a\xbfy\
-\xe0\x0eh\x1f\xaa\x7f'L\xab3\xb2\xff\xb8\x5c)@\
-R5@\xbc\xe0\xf6\x81\xfa\xb7~\xed\xbd\x89\xc1R\x05\
-\x06J\x03P,\x04\x1d\x82\x11\x84\x0d\xe7\xb7+\xe2\x09\
-\x0b\xc4\x8a\x8a-\xa8\x94\xf9\x98\xa1C.\x92\x1d'U\
-\x0b \x13\x07\x90\x0dN:1\x1b\xae\x9e\xb0\x90\xe0\x14\
-LN$\xcd\x89\x85\x9f\x1f[\x01\xf6\x1f\x1d&Gg\
-\xf4\xc1R\x05HDW\x8e\xfd\x18$2\xfd\xf1\xe7\x0e\
-\x09\xcf\x03\x1d\x1eo\xa6\x9cO(o\xacU\xce\xd3\x84\
-\xf30*\x17\xaaiC\xf80' \xff\x0a\x22`\xee\
-\x9f\x1c\x87\x83\x13\x13\xbfw\x0f\xd5w\x19\x8c\xdf\x84\x02\
-\x16tYH\x0a\xc0\xb2T\x02\xf8\x8bv\xa7\x1a\xfb\xa7\
-\xa6fn\xda;1~>w\x02s\x85y\xa87\x1a\
-B\x14\xd4\xe6\xc3B\xd5f\x9f` \x08\x10\x15 \x84\
-}\x00\x08\x0a\xb4\x86x\x80\x08\x937\xf7\xd8+\x00&\
-\x83\x87L\xbc\x00\xa4\x18\x7f:\x09\x05)\x0dDr-\
-]~\xbc\xde\x0c\x14#\x80\x95\xb1\x0e5\xfe\x1cP\xae\
-\xf7\x9b\xce\x1a0L\x00\xeah\xcc\xb7\xa9\x09\xc8\x94\x1a\
-8\x10\x8d\xd916\xf3\xe8\xf5}}ni<\xe6<\
-^\xd7\x8d\xcacQ\x1ax\x8b\xd1\xb4\x1fF\x16\x85\x04\
-\xf9~T\xcb\xc2\xe8\xf9\x84\xf1;\xbc\xef?/\x90r\
-e\xa0\x02\xbf\xb8\xedW|\xf6\xdfw\xd4\xa0\x9a\x01\x05\
-t\xd4\x0c\xb4X\x1d\x80k\x8b\xfeQ\x1a0\xd3\xfa\xd6\
-\xcd;\xef\xf2Q@!F\x01N\xd4\x22\x1coR\xa5\
-\xc3CMRJ\x9a\x0b\x22\xea\x038\x8c\xd5\x02\x93a\
-gH\x13$T\x91D4e2~3y\x05ir\
-W\x139F\xa3k\xd4O\xd1;\x08\xa0K[\xd3d\
-\xbfNb\xc5\xc3\xf4\x9e!\x85LM\xae\xc48\x89\x03\
-a2u\x95\x9a\x02\x08\xb2\x84`\x03R*`B\x06\
-\x18\xa2S\xf0;\xff\xf2\x82\xfc\xf3\xe0\x7f\xa9\x22\xde\xfb\
-m\xbb\xef\x83\xf6\xde\xf9\x9ft\x08\xff;\xd6\x02,\xa4\
-\x0c\xd8Q\x1a\xd0\xda3\xff\xf3\xbb\xf6\xec\x14\x0ep\xb0\
-\xe4\x97\x04y\x8b\xa3(\x09\xa2\xc5h\xd5\xae7\xd4\xfb\
-\xe7%xFE1J\x7f\x81\x11\xaaiy\xbf\xde[\
-\x90\x8a\x0a$(\x9e\x8d\x91\x86\x04\x06;SI\x92\x12\
-\x95+\xa0\x0fHJ\x014\xfe\xc2\xa6\xf9\xcf\xc6\xcf\x00\
-[\xd8\xe7h\xce\xfb\x9d\xd4f\x1e\xfax\xb4\xa5\x8d\x86\
-JS\xa4q@5E`\xca\xa2OB\xf8\x11\x14\xeb\
-\x04[\x7f}\xe6\xbf$\xc4sw\xef\xdb\x09\x8d\xb9\xfa\
-\xd7\xb0\xe1\xce\x13\x07\xd0\xce\x00\xff;\x86\x82\x0bE\x00\
-\xf4\xb6k!\x02\xfd\xab\x8b\xcd\xf6\x5c\xf3\xd3\xb7\xec\xba\
-\xcfs\x00\x83\x22\xbf\xe1c\xc3\xf9\xba#S.\x0b\xc8\
-$\x11\x15\x85\x8f\xb1\xf7EE'\x98\x01\x09\x80\x85H\
-L\xf3\xf8\x89\xcdD\x19\xc7\x8dehT\xc9\xd2!\xa8\
-\xd5\xc1{\xce\x00\xa0\x5c\xcc\xa5J?\xd3gk\xed\xf6\
-\xcb\xd2\xf9\x97\xdcp\x95,\xdf\x86\x94\x9a?\xe8d\x9e\
-\xe6\xb0Lkl,\xe7\x1d\x82v\xdeI\xba?$S\
-\x8f\x82\xe8\xcfs\xffJi\x00\x06\x8b\x15\xf8\xf9=\xbf\
-\xe7\xe4\xdf\xd73\x18\xfe\xa2v\x02,\xd4\x01@\x06!\
-\x10u\x02\xad\xd6\xde\xea\xd7~q\xcf-\xfe\x9b\x1c(\
-\xc3\x80\x87\x02\x8a|\xdc\xb1\xe3\x04\x1f\x06#\x13Tc\
-!\x0fh\x83@\x02\xe8\xc4t\x88\x1e\xcd\x97\xa3\xc3F\
-T\x83M\xaa&d\xec7\xc8\xd2L\x04\x09U\x00\x96\
-\xd2y\xc6 \x9b\x13\x80\x15'\x04\xb283p:p\
-\x04\x19?\x17\xd6\x81$;m\xeeC\x9ad\x5c=\x0f\
-\x94\x89\xcc\xcc\xc4\xe10BTG}\x03(K\x82\xa3\
-\xee\xce\x5cT\xfa+\x17\xca\xb0k|?\x1c\x1c\x1f\xff\
-\xa5\xeb\x8f\xfen\x1b\xaeY\xc7\x81-i\x15 k)\
-\xd0W\x05\xce\xb5&\xab3\xd5\xeb\xee\xde\xb7[p\x01\
-\xbcKP(\x03\xa59\x014?\x92\xe8e\xb9\xb4\x22\
-yY\x90{\xad\xd1$\x0e\x92\xa1\x7f\x04\xef\x94\x93F\
-\x9d\xd6k*\x0fB\x1a{\xdc\xc9\xf4 \x96\x02MY\
-\xdam'z\xad\xbd\xb5\xff\x90\x91H`\xfa\xad\x8e \
-\xfd\xf3\x8cR-\xc6\x16\xd4\x94e{\x0c\x18\x8e3\xa2\
-e\x85\x1b5fk\xe5\x89\xc9u\xfd\x90'\x90\x90\x81\
-,]\xe7\x9f\x19\x1f\xfc\xc1Er<\xfa\x0f\x95+\xf0\
-\xd3\xbb~\x038\xdd\xbc\x8e\x07\xce\x8c\x86\x8f\x0b\x85\xff\
-\xddF\x00hM\x03xE\xe0P\xfd\xba\x1b\xee\xfe\x1d\
-\x0c\x0exi\x00W\x07\x0a. 'P\x80\x94\x1f)\
-\xb9\xbf\x94\xb7\x1b\xf2,H\x84\xfb\xa0\xad\xeaf\x86U\
-^\xc0\xd2\x1a\x82 5M\x80\x05L\x19\xb6\x93T\x8e\
-\xb9O]\xba\x0d++\x05`\xbas\xd2\xde\x9b\xe5\xbd\
-@b\xc3\x8f\xb3\xa0\xceLH\xed\x07a\xc6\xa1\x1d\xf4\
-w\xe9\x12\x0fu\xaec\x04\xf3Q]\x04#\xe1\x82x\
-\x1e\xa2Z\xd2\xe6$i\x8e\x09>\x8c#b.\xfc9\
-4;\x0d;\xf7\xed\xb9\xb3\xf5\xf0\xfc\x8d\x19s\xffE\
-\x19\xffb\x1c\x80\xc9\x19X\x8d_h\x02\xc6\xea\xf7\x1f\
-\x1a\x9f\xfc\xc9C\x07\x1f\x81\xa1\xe2 \x0c\x94\xca>\x19\
-\xc8\x0f\xb0\xe3h\xf5TDy\xb1F8\x1a\xca\xc4\xb4\
-\xa2J\xf4\x85z\x01\x95;0\x1c k\xe5 \xa3l\
-8M`\x92\xb9W \xb5o\xc0\xd1O\xf2\x15\x97\x02\
-8\xb2\xf0\xc7\xe6\xe4\x12d\xbf\x90@\x8cB\x87u\xfd\
-\xd4\x0eOj\xfcI\x8c~\x02\x9f$I|\x11\x15\xfd\
-\x89\xbc\xc4\x15 ^\xfb\xcd\xdfm\x9e\xf9M?e\xcf\
-\x16x`\xfc\xa5\x97&\xbbs\xado\x18\x8c\x9f\xde\xee\
-d$x\xd7\x1d\x00f\x94\x04\xab\x8e\xa0\x15\xe8\x02\xae\
-\xfb\xf1\x1d\xbf\xf1\xa0\xce\xa0\x80<|\xd4\x91X#\xc6\
-\x08\x9cG\xb5\xf5Wk<\x8f;\x03\x95\xc1\x18\xc6j\
-\x82E\xa0\x81`P\xfee\xd0\x0b\xa46\x13\xc1Bz\
-\x05\x9c\x0c\x02!5*\xae(\xfb'\xef;\x89\x08t\
-\xb2\x89pR\xf9\x80\x04'\x90Z\xeeKBu\xaa\xca\
-\x14IuI\x1dk\x1d\xe7\xf9\xf4wAJ# :\
-\x9f\xe5\x00\xe7\xafR/\x04\x13\x7f+\xc5\x0a\xcc\xd6\xab\
-p\xeb\xee{\xa0\xb5k\xee\xfb)\xf0\xdf\x86\x02z\x82\
-\x00\xd2\xfa\x02d\x14\xb0\xb7z\xf3\xde\x03\x07~\xb2\xf3\
-\xe0>\x18*\x0d\xc5\x15\x01\x96'\x0b/\xe3\xed2\xa1\
-\xe6:\x96P\xcas\x02\xb4\xc6\x8bh\xa0\x83=\x1d\x90\
-\x16\x8c\x18v\x09X\xe7\x0c$\x96\x07!s\xa7\x99}\
-\x94xB\x94\xb4h\x03V\x92\x0b\xb0\xcb\xa0\x9d\x94\x8a\
-\x86\x85\x1f\x88\x86\x8cv\xb8\xb4\x85\xa5\xeb@\xd4\x16s\
-c)\x98V\x0e\xa4\xe7\x02\x83\xb3PgU\x80\xd4\xa0\
-\x86(?\xc6\xcf\xfdsP\xe4\xc6_\xaa\x88\xdc\xff\xfa\
-\xdb\x7f\x05\xad\xe9\xc6\xdf\xf3\xaa\xd9\x02\xc8?X\x09)\
-@R%@B\x01?\xbc\xed&\x18\x1a\xa8\x88vG\
-\xce~\xf2a!>\x89Dc=)\xe1`\x0cyQ\
-i&\x91\x1c\x02\x92=\x82\xa8\x8b\x87LMA\x80\x09\
-\xd0?3c\xac\xcf)\x5cH\xf7`*\xb1\xa5\xccA\
-X\x11\xf6\x0fJ;pR\xbd\x1f\x12\x9a\xa4\x16\xf39\
-i\x1dz\xe9\xc7J\xd6\x9a\xa4\x94\x06\x0d\xcdeh0\
-vT\xd0+\x0dZq\xfe\xef\x88iW\x051\xee\x8b\
-\x97\xfd\x06`z~\x16n\xddy\xf7\xbd\xad\x07f\xbf\
-N\xa2\x7f\xcb`\xfci\xf3\xff\x96U\x07\x80)\x15\x01\
-\xa3\x13\xf0P\xc0\xef\x0e\x1c<\xf4\x03>\xe6h\x88\x13\
-\x82|jP\xbe\xe4;\x01\x22\xacA\x04\x00\x09\x84\xe9\
-\xb5V\xa0\x07BZ\xd2`\xc8\xf3\x0d:l\xbdU8\
-\x8b^\x00\xac}\xe2i\xba\x81\xcej\xd7\xe9e\xb2\x95\
-\xd4\x0e\x0c\x89\x13\x80Rr\x7f\xd6\xc1\xfe\xc6\x0c-\xbe\
-\xa6\x91p:i\x0b\xda\xa4)u m\x84\x10\xb4A\
-!q\x8a@k\xfb,\x1a_\xa8\x9eg\x18\x95\xbbs\
-\xc1\xc6_>,\x97\x8b~\x86\x07\x86\xe1\x87\xb7\xdd\xc8\
-s\xffo\xa6\x18\x7fR\x05`E!\x00\xb4p\x00\xd1\
-\x9bs'\x1b\xdf\xf8\x91\x07y\xb80\x88C \xfea\
-\xe4\x9dB\xa4%W\x85\x14\x08to\x1a\x93\xcaO\xb4\
-\xc4\xa2\xe6Z\x08\xb2\xd6\x9eYn\xc7,-Kn\xe8\
-\x90&\x1a\xa7\x93KI=\x04`\x1dc\x9d\xb2\xb8D\
-\xcaa\xa1\xe7\x93\x81\xa3\xdd\x80\xcc\xb0\x05\xc9\x02\xf9\xd3\
-\x95\x96Nf\x02\x10:\x22kA\x0a.\xc6\xe3M\x88\
-<]\xdc#\xf3\xfb\x91\x0b`LZ\x15\x16U\xb0P\
-\x09^\x8e\xdf4U\x084\xff\xfc\xfc\x1f\x9b\x9d\x84;\
-w\xdd\x7f{\xeb\xc1\xd9o\x19\x8c\x7f\xc5\xa7\x00Y\xc6\
-\x84\xa9i@\xab\xfdH\xf5\xb6Cc\xe3_\xff\xfdC\
-w\xc1\x88 \x04\xb98\xc8o\x15f,\x175v#\
-\x90\x81\x8bd\xe1B<u\x15\xa5\xb2 #\x0b\x1a\x8c\
-\xe3\xc3\xc1V>\x04}v{\x129\x94\x18\xedA\x99\
-^\xdcY\xe47Cc\xdd\x80\xcc;[z8\x19\xd0\
-D\xe4\x99R\x99\x84\xdc\xbf\xa3\xcf\xc5\xba!\x1a\x12\xd5\
-~\x80&^\x08\xf4Q\xf4\x86U\xee\xb2L\x988:\
-\xa4\xc7\x5c)_C,\x04r \x07\x05/\xf7\x17\xd0\
-?H\x81\xaf\xfb\xed\x7f\x81;\xdb\xfc&\x09\x92\x0b\xad\
-\xff/\xbb\x0e \x0b\x0ah\xdbP@{\x7f\xed\xcb?\
-\xbc\xf5&1\x84a(h\x14*x(\x80OE\x89\
-\x1b^\x80t\x08\x82\xb4Y\x08Q\x91\x05Kl?\x80\
-<q\x95\x92\x87\xa8\x1dT\x0d10\x9320\xb9\xb1\
-(u\x5c\xd4B\xe0\xacU\x13\xef\x10u\xa3\xef\x07{\
-v%\xd4\x96\xda\xac\x04,!\x9d\xe9\xca\xf8u}F\
-\x7f\xeab\x18\xab\x03\x97\xf5\x1c\x92\xd6$\xec\xe0\x8b`\
->J\xf3(\xc3.?y\xd5u\xb0.,\xf8;\x0e\
-\x0b\x97}\x94D\xda\xcb\xa3\xff=\xfbv\xc2\xc3\x8f\xec\
-\xfbA\xeb\xa1\x88\xf9O\xcb\xff]\xe8r\xfb\xa7\xd3E\
-4\x88\x9d\xa0\x00/\x0d\xd8[\x9b\x9a\xbf\xf6\x17\xf7\xdd\
-\x02\xc3\x95a\x18,\x97E*Pp\xf2\xc1\x9ey\x90\
-W\xcbA<Q%4f\xb5iC\xf2\xf0\x86\x01\x0f\
-@\x92\x0a)\x1dP4\x02\xc6Y\x04\xcc6\xab\xc0\xa2\
-3\x07\xc84D$3\xcbm\x84\xb5\xbdO\x01\xecR\
-`e@\x08dk\xf6\x81\x8cN@\xbf\x1f\xac\xfd\x1a\
-R$\xb6\x1dG\xa4U!\xfa\x5c\xa8 E eA\
-\x16\x0f\xff\xa4\x9d\x99\xb4\x5c\x18\x0dE\x09\xa2?\x9f\xf5\
-\xc7\xd3\xde\x5c\x11\xbes\xcbO\x81\xa7\xc3\x8a\xe1\xb7\x0c\
-\x1a\x804\xfd\x7fO\x84@Y;\x03M(@\x5c\x9b\
-\x0f\xcc~\xfe\xc6{o\x81\xb9z\xcd/\x0bz\xa9@\
-Q\xe8\x02r\xfe\xe0\x10\x90\xa7D\xc5\xb3\xd5B\xc8\x1e\
-\x7fe\xa4O \xca\xf1\x90\x8e_\x96G1\xab\xf2c\
-u\x82Kw\x84B \xcd\xcc\xef\xf4dO\x14\xb9\xac\
-\x84\xad@*\x09\x98I\xc2\x9cq\xc9jV\xd6\x9fA\
-\xc2~\x08}\xdc\x9a\xb9u\xd7\xb2\xb4%\x1a\x1c\xc0$\
->)\xfa\x9bJ\xd5\x09\xc9~\x03Ff\x0e\xf0\x80\xc6\
-\xcb~%/\xf2\xf3\xe8\xcf\xc9\xef_\xdc\xf7;\x98<\
-4\xf9\x15/\x1d\xbe\xdd\x02\xfd\x93\xc4?\xb0\x12\x11@\
-G<\x80\xb8\xba\xd8hM5\xfe\xbfo\xde\xfcc\x18\
-\xf1>\x94!\x0f\x16\x0d\x08qP>\xd8\x1d\xeaHa\
-&\x5c \x12u\xf4\xa2,\xce\x90\xca\x87H\x1600\
-\xb3x\x88\xe6|\xa9\xfd\x08\x89B!{\x0f\x81)/\
-\x85\x85\x0e\x14UK\x82\xd1'\xde\xbb\x1c@\xda\xef\x90\
-0\x098\xa9\xa4\x99U\xec\x03)|\x8b\xeds\x07c\
-\xed\x9en\xef1\x11\x82\xea\xb9\xa4\x1a<\xe1\x0cQO\
-W\xc3\x14B\xb4\xfb\xf2\xdc_L\xfa)\x89s\xbc\xd6\
-l\xc0\x7f\xddq\x13\xb4v\xcf}\xce{P\xd3\x92\xff\
-g\x1d\x03\xdes\x12\xb0\xd3\xee\xc0\xd0\x09\x887\xdez\
-p\xf6\x1b\x0f\xee\xde\xfd\xcd\xff\xde}\x1f\x8c\x94\x87\xc4\
-4\x14\xbe\x11\xc5\xe1|@x0\x91l\x05\x08\x0e\x1a\
-M\x0d\x00\xe59\x8f\x11_``p\xb5\x12\x8dD\xfc\
-\x80\xa2.\x04\x0b_`\x1a1\x96\x16\x89(Ea;\
-\xb9\xc1\xbeiXc\xd2a%\xed\x06U\xa0\xbdc\xde\
-\x7fg\x1c\xa1f_\xadf\x86\xff \xa1\xb94\xe4\x85\
-\x0a\x1c\x07\x85\xac\x93\xfef|\xdaD\x95(\x8a&C\
-\x9eH%\x8e\xe3L\x80\xc2~_\xee+D?\xc1\xac\
-?\xde\xea\xcb\xa3\xffW\x7f\xfd\x9f\xd0\x9c\xaa}\x02\xab\
-\xed\xa9\x04\xf2/\xad\xfe\x0f\x8b\x85\xffK\x81\x00 %\
-\x0dh\x19\xf2\x9dV{\xac\xfe\xb5\xef\xde\xf23\xf1a\
-s\x0f\xc9\xeb\xa3|6:O\x05\x9c\xa0\x13,^\x9e\
- \xcb\xe0\xe5\xd1\xca\xb245^\xf8\xa6\xaceRr\
-\x7f5\xfa\xd3\xedB\xa9\xe9@\xca\x881Z\xaf\xd3\xf6\
-!2\xe5\xa4\xb3\x1a?i8!\xb9\xf5J\xda\x0ej\
-c\xfcM\x04\xa0u*2\xd3\xb7\xe8\xca\x9f\x0fXV\
-\xbf\x9b\x1b\xb7l\x91\x9f\x19\x8c\x1f\x01\x0cS\xa7\xe4M\
->\x84}\x02\x95\x80\x919\xa4p~\x98\x17\xfb\xf3\x1e\
-\xf4/\x14\x84\xe0\x87+\xfen\xdb}/\xdc\xbfk\xe7\
-\xb7[\x0f\xcc~\xc5\x10\xfd\xa9}tm\xff\xdf\x92:\
-\x80\xf7\xbf\xe3\x8dYP\x80-\x0d\x10\x1f\x80{\xa8\xbe\
-\xb365\xff\xe9o\xfe\xee\xc7\xb0\xaa2$\x18\xd2R\
-a@\xe4ML\x1d\xd9\x14i\x02h\x07\x00J\xea\xed\
-x\xa1<\xc8S\x87\x94t \xf2\xd6\x08Z\xf4g\x09\
-\xe9@\xbad\x18R\xb5\x02\xb0\x00\x96[[t\xba\x92\
-\x18\x00\xc3\xd4\x22\xb9\xcc\x07\xe9\x13\x96:\xa9\xf7\x1bk\
-\xfc1\xd9\x97\x14\xf9U\xd8\x8f\x94\x1f@]-(\xf7\
-\x8e\x90\x8a\x00}L4\xd6\x0e\xe3%\x1f\x5c\xef\xef\x04\
-\x8a?/\xf2\xf3 u\xdd\xcd?\x04\xef|\xff\xe6\x02\
-\xa1\xbft\xf9\xd0;\xdf\xb6hG\x90_\xa2\xf3\x013\
- \x81\x1cq\x02N\xf3\xbe\x99/\xdc\x91\xbf\xef\xe8{\
-\xb7\x9d\xf2\x07G\xad\xdd$\x96\x89\xba|(;\x1f\x22\
-\x8a-\xb1}\x09\xa5\x9cN\xf6\xba\x18\x96]\xe8\xba-\
-\xaa\xdcr(c\xaf\xece#\x8b\x1b\x8d\xbb\x05\xd5\x93\
-<u\xe2\x90\xfd\xa4\xefD\x1f\xa0m\x14\xd6f\x17\x10\
-\x0e\xa0\xb7E\x00E\xbaM~\xa8n\x013\xac\xe6\xa2\
-{BM\xdf\xcb\xb3\xfb\x95\x95\x01\x8c<Y\xb0y\x97\
-1&\xcd\xe3\x07\xba\xda\xcb\xa5]\x94\x18\x19\xbf\xb8\x8d\
-\xb1\xbe$\xeaF\x0d\xab\x03\xe2\x17\x5ca\xfe\x88\xb1=\
-\x86\xe7]8\x184\x0c,\xbc\xc1\x95w\xfbq\x95+\
-G\xb5\xc3\x03C\xf0\x85_~\x03x\xe5\xcbC\xbc\xf7\
-$D\xfe,\x9d\x7fJcR\x8fS\x80\xf7\xbf\xe3M\
-\x9dp\x01-SE\x80;\x02^\x12\xf9\x8f_\xff\x00\
-\xd0uE\xaeT)\xf8\xeb\xc5y\xb3\x90Ca\x1d2\
-\xb32\x90\x0c\x05Ab\xd8\xf1,v_7 \x894\
-\xd4\x09\xc3J\xf4\x97\x88\xc1\xe0D3w\x93\x81\x81d\
-\xd27\x1de%\xb8\xc0\xc2\x82\x83\xa1\x1f`\xa5p\x00\
-`\x81\xff`\x9c\x82\x9c\x04\xff\x93\x89R\x1b\xd2\x02I\
-A\x0azj&\x95\x8dU\xd8\xaf4\x9d\x05\xf5~\x93\
-\x1cXJ\x1d\xa5\x9e\x13\xffk\x8e\xef\xf7s\xf2\xa2\xd9\
-\x87\x0f\xf9\xe4\x0e\xe0\xbfw\xdf\x0d\xb7\xdf\x7f\xf7w\xbc\
-@\xf7\xb9\x14\xc3og\x8a\xfe\xefz;b\x17\x1c\xff\
-\xa2\x1d\x80\xe5E\xa4U\x03L\xde\x8f+\x04o\x9d\x9f\
-\x98\xfb\xd4W<'0R\x1e\xf6\x9c\xc00\xa9\x0a\xe4\
-\xe3hO\x16\x95Sm7\x22]\xd2\xc8$\x05!\x10\
-\xdd\x00\x8b\xba\x0cA\xf2\xda\x11\xd7\x80\xa0\xd7\xf3\xa3\x93\
-\x0cex\x99 \x1df\xa6\xbc\x1f\x92g\x09$\xb1\xdd\
-\xfa\xd4\xe2\x15W\x04\xech\xf2r\x96\xea\x88\xd6\xd3o\
-\x1a%\xaf\xd6\xf8\xc1\xa0\x96Dy\xa8,]\xb0\x1a\xc2\
-~\x88\xc4\xa5d\x86?\xa9\x00\xd0\xd1\xe1H\xd0\xa4\xbf\
-\xd7\xd2\x0f:\x5c\xc8\xc6\x87|\xf2r6\xefv\x1d\x1e\
-\xa8@\xbdU\x87\xaf\xfd\xe6\xfb\x1c\xfa\x7f#@\xbc\xf4\
-\x9a\x94\x02te\xee\xdf\xb2\x90\x80\x0a\x0a\x80\x8c|\x00\
-\xe5\x02\xc4\xb5u\xff\xcc\xbf\xdf\xbfk\xe7\xb7~\xf3\xc0\
-m0Z\xe1\xd0i\x10\x06\xf8\x081.\x13\x86\x9c\xe4\
-\xddc\x15\x1cF\xc8\x00\xb49\xect\xac\x18\xf1\xd8\xa4\
-\xc6+\xc1Y\xba\xbf\x9d\xe9\xfb\x09\xb5\x0a\x81q\xb7\x80\
-\x99\xa5V\x11A\x16]\x000\xb0F\xcf\x15\xc7\x01X\
-\x9arRQL\x16\xf1\x8f\x89[\x91\x22?\x98\xcb\xb3\
-Lo\x0fGIE-w\x8dR)y\xe8\x0c\x906\
->\x90q\xe8\x91\xc3\x08\xc7{;\xde\x19\xea\xe5\x9aE\
-\xc7g\xfdy\xe4\xe7\xa2\x9f\xcf\xfd\xe2:\xa8O\xce\xff\
-\xb3\x07\xfd\xef\xcd\x08\xfd\x13\x99\xff\x0f\xbd\xeb\x1d]\x89\
-\xfe]s\x00\x96\xd7\x92&\x0f\x0e\xdfxSu\x02\xed\
-}\xd5\x7f\xff\xce-?\x81\xa9\xea\xbc@\x01\x5c<Q\
-\x12\xe9@N|\xc0\xbe\x07\x8e\x13JF'\x09c<\
-\xaa\x99!\xc6\x8c\x81\x84\x04@\x92\x11\x13U\xadlt\
-Z\x03H\xb2V\xc0\xac\x14L\x8a\xea\xaah\xcc\xc4~\
-3\xebJq\x85\x08\xe8\xcd\x95\xc9\xb5w\x93\xc1\xdby\
-\x0cex\x06\x93\x11\x1d\x15\xf2\x99\xd0B(G0+\
-6c\x81\x0eE\x06H\x1d\x05*\x5c\x0a\x8b\xb7T\x89\
-\x9c\x9e\xc9*\x13$\xbd\xe8\x18\xc0\x80x\xb5e\xd8\xe7\
-\x9f\x17el\xde\xee>\x5c\x1e\x82\xeb\xef\xbc\x11v\xef\
-\xd9\xf3\x0d\xc2\xfa\x9b\x22\x7fK)\x97#,A\xe3\xcf\
-\xd2\x96\x01\xbd\x97\xf7\x81w\xbc\xd9$MLJ\x07\x8c\
-|\x80;\xdd|\xa45Y\xff\xd8go\xb8N\xc0\xff\
-Q\xcf\x09T\xc4nA\xbfW@\x94\x06Q]\xf8N\
-\xb9\x1e\xa6-\x81\x8cD@\x81\xd1#*\xd5\x02z\x22\
-J9\x9f\xd26\xac\x91\x83\xa8,\xc80\x8d\x942C\
-\x7f\x13\xb4\x85\xc4\xedAj\xeb2\xf4\xbc\x17@\x16\x02\
-Y6\xe9f\xe034=D\xca\xe7\x05\x98\xb0:\x1e\
-\x98f\xe0\xaav\x9f\x1eW$\x9b\x88\xe8$ :\xf4\
-<\x1aNC\x16\x80Fi%\x84j\xbf\xbc\xd8\x7f9\
-X,\xc3\xb0\x17\xfd\x1f>\xb4\x0f\xbe\xff\xbb\x9f\xfe\xa6\
-\xf5\xd0\xdc\xa7\x0c\xc6\xdf\x04\xb3\xee\x9f\x06L\xad\xce\xff\
-\xe1w\xbd\x13\xe5\x15c=w\x00\xccFJv\x22\x0f\
-\xd6P@k\xe7\xdcw\xc6\x0f\x1c\xfa\xf7\xaf\xfc\xea{\
-\xc2\x93\x8a\xd9\x01\x85r0B,\x17\x89\x84Bm\x00\
-H\x02\x10\x00:Y\x88\xa1,\x15\x8e\x8e8\x1d\xec(\
-\x95\x16Q\xaa\x160d\xba\x8cX\xe2\xc0A\xdeW\x08\
-\xc9Q)\xb5\xa3M\x9b3\xc3\xa45a\x0cV`\x0a\
-@\x0c\x1a\x0c\xaaE`\xfa\xf8l\xa6\x0f\x14K\xef\xa4\
-\x0c\xa3\xaf\x11mQ\x81\x17ST\xa4\xc4\xd1\xd3\xe3\x19\
-\xd2FH\xca\x13\x8a\x86\x80\x9e/Q\xe7i\xacI\x0f\
-\xd6z\xe7E\x80\xe2\x9d\xad\xfc\x5c\xad\xb7\x9ap\xed\xcf\
-\xbf\xca'\xfc~\x13\xeb\xedi\x83\xf1\x9bj\xfe\x89\xe3\
-\xbec\xe3'\xcd\xb0=w\x00\x14\x16q\x14\xf0\xce7\
-\xdb\xd4J\x89\xf3\x02\x0d\xe4H\xb3y\xdf\xccg\xee|\
-\xf0\xdeo\xfd\xec\xee\xdf\xc0\xaa\xca\x88\x80U\xdc\x09\xe4\
-\xc5\x18\xb1\x9cT\x12\xf4C\x12\xed\x15\xa09?\xc8;\
-\xdfH5\x80\xea\xb7e\x86\x17\xe5\x13\x0b\x15\xd1\x87a\
-\xe4X\xf8Y\x18\xa3\xbf\x11\xfaw\xd2$\x04\xca\x5c\xc2\
-\x95\xa6\x03\x00\xeb\x8a5\xb3\x13\x80\xccM?R\xed\x10\
-0\x99o\x01\xa6\xf1Dam\x9e\xd1hO\x8e}4\
-\xb2+T\xff\x91\x1af\x14\x5c\x94\xfd\x86a\x8bo(\
-V+:\x05/U-\xfb\x8d>^\xfe\xff\xe9\x9f}\
-\x19\xe6\x0e\xcd|\xb2\xf5\xf0\xfc\xcf-\xc6\x9fE\xf5g\
-\x81\xfe\xdd;\xfe\xdd\xd1\x01\x90\x02/J\x0c\x8b\xb1m\
-\xd8%\xa1\xb3\x1d|mA8/I\xbe\xb2\xd6\xae\xb9\
-O\x7f\xdf\xf9\xd9\xba\xa3\xd7n~\xfc\x91\xab7\xfaz\
-\x00\xef_\x0d\x1a\xe0\xba-p\xa5!\x8d\x9c\x8du\x82\
-\xf3\x86\xees\x0f\x861\x08\x82\xd0\xf1_\xae\x13\x16\xa6\
-}N\xc1\x1f\xd6\x10\x9c0\x0e\xc9\xf3\xc2)\xb7\xa0N\
-xU\x0cQ\xe2\x060V\xea\x19\xd7\x93\xa91\x9e>\
-\x8ci\xea7\xb0\xa9\x04WP7`\xf8\xe9`\x90f\
-!\xed\x9ec\xb2s\x8e\xf5\x19H\x1e\x03RZ&\xd5\
-\xfa5v\x9e\x9cN\xd2}tF\x19\x88r2%\xef\
-B\x8d\x80\xefG\x5cq\xdb\x7f\x08\xca\xda~\xf1\x86\x5c\
-\x09\x15\xd0\xf4\x12\xd1\x0d`\x7fN\x9c%y!\xf6)\
-\x8a\x005Z\x1e\x81\xffs\xe3u\xb0w\xef\xbe\xffP\
-\xf2\xfe\x96E\xf9gC\x00\xd2\xe5#\xef~W\xf0g\
-1\x89w\xeb]\x0a@\xcf\xc3\x0f\xbe\xf3\xad\xb8\x00a\
-P\xcbT\x15\xc0j{\xd2\xf5`\xd4\xb57|\x0d\xa6\
-k\xb3\xa2_`\xa8X\x11\x1fx^\xec\x18dQ\xd3\
-PX\x92\x89[6)\x12\x00\x09\xfe\xc7D\xa0\x8a\xfc\
-\x98\xb2\xb3P&\x1c\xd5\xf7l\x1b\x1a\x12\x86\x09U\xda\
-\xaa\xae\x8b\x92\xdb\x94\xf5~\x00c\xad\x1cV\xa8\x12\xd0\
-2\x18U\x9d\xbc\x0c\x89eO\x90\x5c#R\xd2\x16\x94\
-\xcf1\x1a\xe1\xa5\x8e\x8dc\xdag/\xd7\xfc\x91H}\
-\xe3&\x1f\xaa\xf6\x8b\xa4\xe5\x18\x93\x81\x94`\xe6A!\
-'\xf2\xfe\x22\x0c\x14\x8bb\xd2\xf5\xc8\x00'\xfd~\x01\
-\xbf\xbd\xfb\x96\xef6\xef\x9d\xfe\xe7\x0eK~\x89\xd1_\
-2\xf8.\x0a\xbf\xbaF\x02\xd2\xb2\x04\xbf\xfd\xc1X\xa6\
-\x98\xb6K\xd0\xc4\x07H\xd7\xf6\x9e\xf9_\xd5\xc7\xe7?\
-\xf6/?\xfe2\xb4\xdb.\x8cp\xb9pqP\x08-\
-x:\x90\x03&i\xffQ)\xd5P\xa3\x0fC\x0bS\
- `\x14P@I\x1d\xa8\xd2\x90\xa9CH\xd5|_\
-\xcf\xfd\xa3\xcfE\x85\xb3\x06f[\x12\xb9\xd8\xb8\x00\x85\
-\xfcA\xa1Z\xeb\xddU\xe6\x00\xc0\xb2\xde\x5c\xef\xaa\xb4\
-\xbdG:\xd7!N\xb7@GZ\x8an_\x1a\xecB\
-\xc4^Q\xd2\x10V}\xb4&\x1f5\x0d\x88\xd1\x8a\x86\
-\x0a\x88\x10\xcc\x11-\xeby(\x97\x8aB\xba\xceI\xbf\
-\xdf\xef\xba\x03\xbe\xf3\xab\x1f~\xb7\xb5{\xfe\xd3\xa6\xf3\
-8\xc5\x09Xa\xffG\xde\xfd\x1eLa\xdfV@\x15\
-\x80\x81\x5c&A\xccJ\x08\xbai(\xc0\xbb6Z;\
-\xe7\xbe;=6\xf5\xbf\xff\xf9\xfa/\x08x=\xccG\
-\x89\x15\xfc!\x22\xfe@Q\xa2\xe8\x8a\xfe\x22F\x15\x80\
-\x90\xc5\x8d\x1a=\x08\x94\xa2\xad\xc5(U\x16d\x83\xc7\
-\xe0\x9fd\xech\xda-\xa0\xb7&\xc7\xad\xb3*\x01\xa6\
-\x96\x02\xc1\xd2%\x08\xf2t\xa3\x15\x82\x06l]\x7f&\
-' \xf5\xd230V=\xfc\xe8\x8b\xca\xd9m\x18\xb6\
-\x82T\xb7o\xa8\xc8\xa8\x03cI\x10\x88\x9a|\xa2\x94\
-@\xaf$\xc9\xe4 J*PQ\xeec\xfep\x0f\xbe\
-\xd1\x87kU\xee\xdb\xbf\x13\xbex\xd37\x85\xce\x1f\xe7\
-[\xe3\xe1y\x9b\x00\xfbm\xc2\x1f=}V\x82k7\
-\x81@~\xf1\x91\xdf\xccI\xf1\xbb>\xf4\xce\xb7\xe3[\
-\xde\xf7W\xcc\xf0\xa6(\x17\x00z\x92l\xbe\xb6\xee\x9f\
-\xf9\xf2!\x06\xa5\x7f\xfd\xe9\x97\xaf|\xed\xd3\xae\x00\x18\
-\x88\xe1b\xa3\xe5\xf7\x0e0\x15)\xb1\x80L\x08\xe0\x1b\
-c\xf2\x8c\x00\xa6zz\x22Pg\xcc\xe4k\x0d-\xc4\
-a4q\xc0\xcc\x0f\xd0u\xd1\xe1k0\x18\xb2*x\
-\x91\xeb\xe22T^?\xbaY\xdcu\xa0\xb6\x1b~?\
-\xfe\xb3\x9e9\x806?\x9f\xf9[\x17C]\xa9\x98?\
-44\x02\xb7\x8d\x9a~\x8c\x1e\x8bt\x8c\x1b\xfd\xe8\xc4\
-\xef\xa0>m\x87\x9cR\x94\xb8\x8b#\xba4MF.\
-\xfd\x86i\x80\x8br+9\xc49\xbeo\xfc\xaeTr\
-\xe6\x878\x17\xee\xf3\xe3\x1d~\xa5\x0a<2y\x10\xae\
-\xbd\xe1\xcb\xd0\xdc?\xff\x96@\xec\xd3\xc8\x10\xf93\x11\
-\x7f\x1fy\xd7{\xa27\x81\x92\x7f`]\x91\x06t\x89\
-\x04\xa4+\xbdh\xaa\xa5\xa1\x00\xa68\x02\x97\xbc\x9b\xb6\
-b\xf0\x8e\xe16o\x1a\xfa\xfc\x1e\xb6\xa7|\xed\x0d_\
-}\xd1\xd5Oy1\x89\xc9u/Wh\x89\x83\xc7\x0f\
-\x1c\x121\x0f?yX\x9c\x96\xfb\xfa@F\xbb\x09\xc3\
-[\xa1\xc8\xc8'\x0d1 \x0d#4@\xd4m!\x0b\
-\x1c\xaf5\x03\xd0\xeb\xb3*\x22\xa0\xf0S\xe1\x07%\xa5\
-\xa1\x19\x16\xd3\xfb\xb6\xac\xde\x06\xa3\x95\xd5\xf0\xc0\xcc\xed\
-\xe2\xda\xcb\xcbi[\x1f'6?\x87\x81[|\xde\xaa\
-\x13\x80Xr\xcd\x08\xfa\xc6\x90`\xa3\xea:\xe2\x18$\
-\xa3GY\x82\xe5\x13}r$D\xa5\xe4'\x91f\xfc\
-%\xb91G\xe4FjQr\x1a\xf2 \x82\x04\xed\x85\
-#\xbfx\xde\xcf\xa7\xfb8\xfe6_Q\xee\xf3\xae\xd3\
-\xf33\xf0/?\xf9<4\xc6\xaa\x1fl\xef\xab\xdeL\
-\x8c\xbf\x91\xd1\xf8\xadb\x9f\xbf~\xf7{\xd1E\x97\x9c\
-Kq\xcb\x11\xed\x88\xed\xbd\x03P2\xc18\x92\x82\xe0\
-\x02\xde\xfa\xbe\x0f\xb0\x84\xaa\x00E\x03\xed\x0cH\x00\x9a\
-\xf7\xce\xfc\xeb}\xec\x81\xc2\x17o\xfa\xd6\xa5/\x7f\xc2\
-\xa5\x04\x88zN\xc0m\xfbH@r7,p\x02N\
-\xb4\xe9\xd5\x7f\x8dj\x0e\xabD/Z) ,\xb54\
-p\x02QH@\xb5\x9d\x85LA\x10t\xfc\x18=t\
-js\x8948D\x9d}\x10\x7f_(\x94\xe0\xaa\x0b\
-_\xefA\xcf\xdba\xcf\xa1\x9d\x1a!\xa7\x1f\x95\x84,\
-\x92\xd9\xe2\xaa\xf1\x86t\xd9\xb2\xf6\x188\xf5\xa8s#\
-\xe5\x1cu\x02!\x8a\x8a\x8c\x8fF\xfbp\xa2\x90\x82\x0a\
-\x80)\xfc\x8d\x82w\x91p2\x92#E\xa2\xde\xc3\x98\
-\x08BZ\xc6w\xe3\x08\x8f\x06\x9d\x0d\x22iEt\xc3\
-\x19\xff\x01\xb8CG\xa4\x99b\xa1G\xd1\x1f\xeeQo\
-6\xe0\x1f\xff\xebZ\x98;8\xf3\xf7\xad\xdds?N\
-1\xfeN\x16}\xe8\x01\x14\x97\x84\x03\xec\x8e\x03`j\
-|\x97~\xc0\xbcT\xe0\x1d^*\xf0~\x93\x13p\x0d\
-\x9cF\xa2\xf1\x87\xb7\x9b\xf7L\xff\xf3-p{~\xb4\
-<\xfc\xbc\x8bw<=\x8e\x94\xdeAi\xb9Mh\xb3\
-\xf8\x00\xc6\x9d`\xb1\xa0#\x84\x89Np\xa2\xca\x02\x8f\
- \xf2\xabjA\xc7Q\xb2R\x9a^\xa2<\x9e*|\
-\x97\x8e\xe1CQ\x04C\xb1t\x19\x8c\x8bGm\xac9\
-\x97\x9c\x9e\xb2\xe5l8u\xcb9\xfa\xf0\x10e\xc6\x9d\
-\x94\xf2\xa8\xaa\xb8t\x88\x17Ei\x88\xd9\x93X\x92M\
-~F\xd9\xf5\x08\xd4\xb3XD\xc3!w\x14\xcf\xa8\xdc\
-\x02uP\x09\xae\x02y#\x14\xe7J\x1e12\xe8\xc8\
-\xf8\xdd\xd8\xe0\x03\xee%L\x09\xdc\xa8\x02\x80\x12\xf1K\
-:|\xa5NS&\xd0LN\x1cF1\xd6KL\xf6\
-)\x8b\xda\xff'\xae\xff7\x98:8\xf9\xa9\xd6\xce\xd9\
-o'\x18\x7f\xa7\x0d?\xe2\xf2\xd1w\xbd7\x9a\xb9\xec\
-\xa2\x0e\xfb\xbb\x93\x00t\xc1\x010\xab\x1e U\xafb\
-\xe3\x03\xdaI\x86O\xbf\xf7\x9c\xc0?\xfc\x94\xdd\x98\x1b\
-,U\x9e\xfd\xb4S.\x10F\x9bs\xe6\xa1\xd6p<\
-$\xd0\xf2\x9e\xc8\x8d{\xbd\xc3\xbe\xed\xe0h;Qt\
-bR.\x1a\x99Ix\xa2\xd0(\xcdO&\x87\xe4\xf3\
-L\x19\x1a\x11\xa6\x05\x14\xca\xa3*\x95\xd5%\xac\xba3\
-\x00-\x09\xd0\xca\xee\x8a(\x09@F\x1c\xb2\xf1\xab\x86\
-\xcf\xf4\x82&\xb3\x1d!\x8c\xd3$\x16\x97\xf5iM?\
-\xac\x90\xc4\xef\x9f~\xae \x10\x19F\x22\x1e\xb9\x95_\
-\xfaSL\xd5\xbe\x91W\xea\xfd!\xe1<\x94~\x7f\xa4\
-I\x1ci\x0e\xa0y\xfc\xffe\xefJ\x83\xe4\xaa\xae\xf3\
-\xb9\xafG\x0b\x1a$\xb4a\x1b\xdb\x91 x\x01\x1b\x14\
-\xbc\xa4\x8c1\xc6\xa6\xca)\xe3\x10g)R\xe5r\x12\
-W%\x7fR\x95\xd8\xf1\x9a\xb8\x12'\x96\x10\xc8\x8e1\
-\x9b\x90\xc0\x88=\x18\x85\x22\x80\x8d\x05\x08\x84\x90\xb0\xb0\
-$$!\xb3\xc8\x96\x18$1\xa3\xd1,\x92F\xdbH\
-\xb3\xb4f\xa6\xbb\xef\xc9\xbb\xf7m\xe7\xdcw\xdf\xd2\xad\
-\x19I\x88\xf7\xa8\xa6{fzZ=\xfd\xde\xf7\x9d\xfd\
-;\x94\xa4\x04\xf1\x04@\x13G\x00~\x8cJ\xbe\xec\xf3\
--\xe9\xe5\xb5\x0a\xfc*\xe1\xac\xc0\xaf\xf6Y.Zy\
-/\xf4\xec\xdd\xf7H\xb5m\xe0Q\x02\xfc<\xb1\x7ff\
-\xdc\x7f\xd3\xdc\xeb\x11\x13\xe0\x8d\xa3\xac\xfd0\x16\x92`\
-\x9c\x0f\xfc\xc77\xfc\xf0\x87\x98\xd0 \xd4HU \xfc\
-\xc0U\x9f\xf5\xb3\x9b_X\xf1\xfc\xd6\xb50Mw\x0b\
-z\xeb\xc6T[\xa6\x96\x18\x0fS7@\x5cF\x11\x9e\
-t:\xde\x1b\xcd\x7f\xd3w\x86\xac,\xc5\x058\x04D\
-c\x07|\xb0\x04\xcd\xc5yh\xc4\xb3 bn\xbd`\
-\xdb\x0b\x80)\xdb\xa4\xf5\x06D\xf9\x84\xb8\xba-0\x8f\
- \xbe\x13\x0fD<\x11\xc9\xea\xe9B\xc4%\xb6\xa87\
-\x11S\xdd\xa5\xb5tdZ\x0dI\xdeL\xf4\x19\x89H\
-\xaa\x0bx.\x09\x8d\xfc\x8a\x86>\xef\xfd\x8e\x88\x1b\x90\
-w\xfd\xd1\x8aP\x10\xd3\xa31G\x82|\xddi\xf0\x19\
-+U\x1f=\xd7\xefz[\xaa\xd4\xa7\xa6R\xefX\xf5\
-\x00tvw\xfe\xa2\xf2V\xff\x83\x0d\x00?5\xee\xbf\
-e\xde\x02\x84\x84\x92?\x8e\x81\xf0\x8b3\x16\xa0Ob\
-,\x0b\x09d\xcd\x09\xd8z\x03F\xe8\x0d\x87j\xbd.\
-\x0b\xdf\xf5\xfc+/\xae\xf8\xc5\xe6gt3\x86\x9a\x1d\
-P\xe5\x99\x09.k\x97\xfc\xec4\xef\x09\xf0S<\xb4\
-\xdeK\xda;\xc3\x0b\x05\x81\xb5\xf8\x22\x95~F\x08\xa7\
-\x0d\xc3\xf5e\x86]\xa3\xa3\xca\x0c\xf8\xecJ3\xec\xbc\
-\x88\xbb:\xac\xeeN\x1bS\x00\xe2\xfaHl\xa0\xc92\
-\x92K\xba\x08c\x9d\x8d\x16\xc7\x8bm\xc91K}\x82\
-+*!b8%g]\xf0\x9e4\xbf\x82d\x5c\x9b\
-\xcdr\xb0\xd6|\xf2\x99\x9aW\x11\xf1\x00\xc8lFX\
-\xea\x0b=\x81(V\x0d_\x836\x8e\x91:\xa0j0\
-Sr^z\x83\xef\xb8\x89p\xe6\xf8f\xfd\xdc\xc5\xcf\
-\xdf\x07\xed\x1d\xed\x8fUv\xf6\xdfk^\x8b9\xca~\
-9\xe2\xfe$\xc0\x8fM\xb9wt\x08@d\xb9)\xd1\
-\x13n\x98;\x173\xfa\x03lc\xc3I^\x80&\x04\
-\xac\xc8\x81\xca\xf6\xbe\xc5\x1b\xb6\xfe\xf6\xe9\x07\xd7=\xae\
-K3\x8a\x08To\xb6^9\xa6w\x0c8|\x86[\
-\x00;\xe1H.\x0c\x0c\xae\xc8\xa4\x0e,4\x1e\xd3\x8b\
-V\x90^\x01\x01\xc6\x8c\x80\xe1\xfe\xa3I\x06\x06\x10\x13\
-\xac%]\x9a\x12\xba\xdd\xb4G\xc0\x04?\xf0\x5c\x00\xeb\
-n\x10D\xd3@\x80\xe5q\xbc\x09)l\xa2\x22:x\
-\x10[\xa9E$\xb4\x8d\x0a\x06\x84\xb5w:\xaeK\xba\
-\xff\x90\x97\xbc\xa2\x85\x1b\xc8\xa8)R\x83F\xe3\xd4\x08\
-Vx2\xdb\x0aBkO\x9b~\xfc?&\x90\xf1\xf6\
-\x94|\xc7As\xd3D\xbd\xb3\xa2&kp\xdb\xaa{\
-\xa1\xb3\xab\xf3a\xd7\xf2\xdf\x9fb\xf9\xa9\x07P\xcf\x8a\
-/\xb8y\xee\x024\xb2.\xf1kO\x8cn+\xd0\x98\
-\x84\x00\xc2\xd2\x19\x98\xf1\x86\xf3\xee\x13\xb0z\x01\xc1\xad\
-\xb2\xa3\xef\xce\xad;[\x9e\x5c\xf2\xc2R\x97\xb9\xc7\xc1\
-\x94\x09\x1e\x09L\xd0\xaaB\xa5PN$8\xf1\x82\xe4\
-\xae\xc0\x14\x16\xa1\xe1(\xedzC\x1a\xaf\x9bV\xc4\xa8\
-(\x18\xd1n\xf4:\x16\xf7\x1f\xc9TbB_\x85H\
-\xfc\x1e!\x85\x80\xc0\x02\xb7\x99\xea\xe4\x090\x80\xcf\xbd\
-\x07\xbek\x80Z[\xa4\xceS\x18\xf3G\x7f\xab\xb1\x04\
-\x85k3S\x09>\xd2\xa5\x197\x1aH\xdb\xa7Iy\
-\x96\xcf\xe1\xf3\xc2\x04\x06\x9a\x0f\xc4\x13\x08\xceG\x10:\
-`X\x95@R!\x00\xf6\x1c\xf5\xaf\xa9\xc1\x1e\x95G\
-\xd2K<\xb4\x8e\xbf\x9a\xec;\x13\x86+Cp\xcb\xca\
-%\xb0\xa7{\xcf\xcf]\xf0?T\xa7\xe5\x97\x8d\x80_\
-\x98n\xcf\x18\xf9\x01\xa3;\x0e\x9c\xf2\xf6X(0w\
-\x1e&$\x03\xeb\x9d\x15\x88\x93\xc0\xce\xbe\xbbZ\xdb[\
-\x1f_\xfc\xfc\x03Z\xc2QuiM\x1a\xef\xed\x1eT\
-\xac\x1e\x8c\x12\xa3q\x11\xf0x\x10y\x19\x89v\x9a\x85\
-\x17\xb2`\xf1i\xa85\x80\x22\xa6De\x8e\xaf\x06\x17\
-{\xf4\xef\x1a\xe58\xa4\x17\xb4\xb1\xf0B\xd8*\x04\xc0\
-\xd5\xc8\x80'\x05\x99\xc5\x0e\x92gh\xc4\xc6\xf4\x8ad\
-\xb1?\x97R\xe7R\xac\x22\xf1\xdf\xa4\x1a,\xc1\x0eA\
-k\xecO\xdc\x7f\xc1z\xadx\xad\x1b\x99`\x8b\xa0\x09\
-\x1drma\x14J\x00\x99\xf6d\xcd@\x18>/|\
-\x09'\x9a\xe9WS}\x13\xc6\x8d\xd7\xad\xe6jYM\
-\xcf\xd1\xfd\xf0\x93g\x16\xc3\x81\xbd\xfb\xefWjU)\
-\xe0\xcf\xb2\xfc\x89I\xbf[\xe7\xfd\x18\x13K\xb5\x98l\
-\xf1OeM\xc0XLf>7\xeap\xca\x9d\x14L\
-\xd2\x0e\x88\x93\x80\xeb\xa2uuu?t\xdb\xca{a\
-hdH\x9f\xc8\xe6\x09gx\xaaBz\xf7\xe08\xd7\
-\x1bp\x8c\xda*3yl\x12\x8cI\x91\xd3\xe7\xd0~\
-\x15\xe6%\xd0\xb4vz>\x80\x93\x01@\x5cr\xdc\xb4\
-\xc6\xb6K\x81W\x13b\xd6X\xd8@L\x80\x0e`O\
-\x02\x1a\xcf\x89\x91\x800\xb6\xe2\xd2\x84]\xda\xfb\x0dr\
-\x194\x9fA\x14~\x90\xb8\xbbh8\xfe\xc02\xfd\x11\
-\x89bx\xde\x90\xbd\x87\xe0\x15\x22N\xa7\xcf\xc7\xd0\x03\
-S\x86AiMx*\xbe\x93\xb4\x8a\xef\x9b{\xdf\x82\
-[]\xcb\xdf\xbf\xef\xc8\x8d\xd5\xb6\x81\xc72\x80_\x81\
-\xfc\xda\xfeY\x05\xd7\xb4\xd6\x8bS/\x07\x90\x16\xf3\xc7\
-~\x94N\x02\xb6[-\x81\x04\x92\x12\x83\xc3\xba:\xe0\
-\xb2\xf5\xc1\xbd\x07\xee\xb9u\xe5=px\xe0\x88K\x02\
-\x93a\xb2\xdeB<\x01&(O@o!.\xc5\xaa\
-\x15H.2\x06zz\x11\x05\xed\xc0D](\xf8>\
-s\xf3C\x97Y\xb0\x13\x1c'\x03N\x12\xb6\x9f\xd1\x9e\
-\x03\x1a\xfb\xf3\xf2\xa5\x91\x10d\xa5J[\xf6\x9e\xbb\xf0\
-|\xb57K\x01ZI \x08\x07\xb8w!b\x8b\x9a\
-\x05-\xb4#\xc6\xc2\x99\xf8\xdf,\xe2HA:\xb2\x1b\
-\xf5\xe6\x9b\x9f=\x189\x00\xb6\xb0\x93\xa9\x19a4\xd4\
-#J\xba\xc47\xb14\x01&)\xf0\xbb\xa1\xe3\xba\xed\
-\x1b`\xc9s\x0f\xac\x1f\xde7\xf8\x83j\xc7\xe0\xea\x04\
-\xf0'u\xfbei\xfb\x13\xeb\xff\xdf\xc9\xadVB4\
-dxOJ\x0e \xed\xfd &\xbb57\xce\x9d\x9f\
-U\x19@\xc875\x18\x82?,\x11\xee\x1a\xf8e\x7f\
-\xcf\x91\x85\x0b]\x12h\xd9\xb3\x13\xceRJ\xc3\xee\x09\
-\xd6eB\x97\xe9\x9b\x1c\xc7_\xdd,\xc2\x92\x15\xc6\xac\
-\x05]D\xe2\xf9\xab\xc8N\xa5\x11\x9f\x22\xedT\xb3\xea\
-\x07\x03S\x15D*)f\x09\x98\x91\x97\x13\x85\xad5\
-\x02y\x0c\xcdA\x89F\x99\x10\xd8\xeb\x84\xb3\x06B\xd8\
-O\x11\xb5\xe8\xf4k\x88O\x022\x19D\x0c\xa4\xd9\x04\
-\x0be\x98\x9e\x9f\xe5BFJ\x12a\xa5\x05\x89\xe8\x0b\
-r\x19DZ\xd9\x09\xe4\xe2\x05\x1a\x1f!!\xf4\xa0\x0f\
-\xc4_@\xab\xe3\xfd\x92\xb7\xbcC\x0b\xce\xb8\xd7\xc5\xd2\
-\x0d\x8f\xc1\xa3k\x9fx\xae\xb6\xb7|\x1fi\xef\x1dN\
-\xf1\x00\xea\x11\xf7\xcc\x05\xfet\xcf\xfam\xd2\x07\xc0\x93\
-\x82\xc9=\x02^\xd7Sfy0OR\xb0\x12\xf3\x04\
-v\x0f>7\xd4\xdd\xf7\xfd\xfbV-}\xf1\xc9\xd7\x9e\
-\xd3\xae\x9d\xaa\xe76\xeb\xf5c\x13t\xa9\xa7Dv\xd9\
-\x81%\xc9\x14&\x93\x8c\xd3\x15\x96\x05\x0d\xff\x9c6\x96\
-\xb0\xe5\x9d\x10\xf4\xaas\xf8D\x9e\x81i!-\xae/\
-\x065l\x88\x05\x01\xb1\xd2\x9b\x00\xe2\xa1\x90\x9e\x07b\
-q\xa3l8\xff\xd4\xe9\xca\xb4(\xe1G=\x01\x9e\x0f\
-\x08\x0b'(\xa2\x9dy\x96+\xd7j\xed\xd1\x00\xb7\xf1\
-\x97\xd1\xdfA\xe4%<a\xc0\x0b\x0d\xc1\x0c\xfe\xb7\xa1\
-\x1f\xeb{\xba\x92\xe3D\x93\x0b~\xaf\xb3O\x19\x86\xa1\
-\x91a\xf8\xe9\xb3\x8b`\xc3\xef7=Y\xd9\xd1w\xbb\
-<Z\xe96\x80?\x9c\x10\xf3\xa7\x81_\xdax\xf5\xd6\
-y?\xc1\xe4\xd2yr\x96\x0dGu-\xc8h\x13\x00\
-\xa6\xd7\x07\xcd\x9c\x00=T\xf7\xd3q\x92@\xc5r\xa2\
-\xf4\xe3Z\xcf\xd0\xef*o\xf6\xdd\xf4\xc2kk\x9f\xbe\
-}\xf5\xfd\xfa}LvC\x82f_XD\xeb\x0c:\
-%\xbe\xe3\x9d\xc6\x91\xd45\x0f~F\xc6V\xa3\xd8\x9f\
-_\xc4\xb1\x8b\xdd\xd8\xe2\x93\xb8\xed\xd1\xc8\xbe[I5\
-c[Gl\x84>\xd6?h\x01\xb1\xa0\xbb\x0c!\x9e\
-W\xa0eK:v\x0d\xf6\xb6b\xb3\x7f!\xe9g\xc2\
-\x5c\xd7f\xf9\xfc\xd8K`\x9cL(\x11s\xbd\x82\xe8\
-\xdch\x11\x0fU\xe4\x13\x9en\xbf\xd7\xd9\xa7\xca|\x93\
-\xa1\xfd\xc0nX\xf0\xf4\xcd\xd0\xd1\xb1\xfb\x81\xca\xce\xbe\
-\xbbs\x00?\xaf\xe5\x8f\x9d\xea\x85\xf3n\xc0$K\x9f\
-\xed\xda\x8fn\x1d`\xf4W\x83\xc5\xb7wf>5'\
-\x9d\xc8\x06h\x88A\xc3e\xf5%;ko\x1d\xbd\xa1\
-\x7f\xf1\xdf\xfe\xfd\xe5_\x85\xf3\xce\x9e\x05M\xc3M\xae\
-\x9b0\x0c#\xb5\x8a7HD\xfb\xd7\x81\xae\x9a2\xc7\
-Z\x83p@\xb0\xf8\xd3\xd1\x92c\xc8\xb2\xe2Q{o\
-<l\x88J\xdcqu\xe2\xd0j\xc6BC\xc1\xddm\
-\x8b\xfb\x0d6\xad\x00\xa2\x80\xc4\xb6&\x99+\xbd(\xa4\
-\xd9\x22\x14?!\xca\xd4\x94I#T\xd0\x93O\xeb\xf8\
-\x22R\x04S\xad\xbcf\x8d\xdf\xe6\xcd\xd3\xe7 \xfd\xfb\
-\x8d\x95\x5cq\xb2\xc4p(\x08\x8c\xbcD\xb8\xaa[[\
-\x7f\xaf\xcc7\xd1\xbd\xa9)\xc6\x15\xbf_\x0d\xcb^^\
-\xfe\xaa\xec\xab<S\xeb.\xbfd\x18\x94J\x8a\xd5\xaf\
-;\xe3\xbf\xf0\xda\x9f\x22P\xd2\xaa\x03\xfco\x8bN\xc0\
-\xac %\xed\x8f\xbei\xee\x02L\xe9\x11\xc8\xbbl\xd4\
-\x9a\x14\xf4\xef\x87\xab\xad\xfd\x0f\xf7v\x1d\xfc\xf1\xc2\xe5\
-K^_\xbe\xe5yo\xa6[5\x0d\x8d\x9b\xa43\xc0\
-j\xa9\x83\xce\x0d\x10 \x86\xd9~\x12K\xf2f\x93x\
-\xbc\xc9\xe6\xdc\xd1\xb0z\xe6h\x97%\x0e\xa6\xd6\xcd\xec\
-\xfdHS\xe6\x89\x1b\x0a\xd36\xf3\xc5&fv\xc26\
-\x81\xc0\xc4WA\x90\x98\x1ac\x80M\xb2\xf2,\xb3\x8f\
-|\xf8\xc6\x04\xb7\xdd\xfa\xa3\xf1\xb7S\xce4\x9a\xb6H\
-\xcf\x86\xe3\x87wJ\xb2[\x85{\xca\xeaO\xd6\xa3\xbc\
-\xcdP\x1e.\xc3\x8d\xae\xcb\xbfl\xc3\xd3\xcb\xab\xed\x03\
-7\xbb\xe0_O\xaf\x15\x8b7y\x9c\xe0\xbf\x91\x7f\x08\
-\x09\x15\xb2\x13\x05\xfeQ\xf1\x00D\x03\xe6=\xb4\xaa\x96\
-\xc6\x07\xd5\x10\xf1\xbd\xeb\xfe\x8b\xb7r%O\x10B\x8a\
-\xab\x95\xe8$W\xbb\xcak\xa1I\xfcveu\xf5?\
-l\xeb\xde\xfe\xe5\x7f\xbc\xe2k0\xf5\xcci0T\x19\
-\xd2r\xcej1\xa9\x1a&\xd2\x8c\xc3\xcaK\x82\xbdt\
-\xa8\x1b'\xc8\x84\x1b\x1bQ\xa5\xb5j\xc1\x12\xbb\xd4=\
-\x15\x96\x04\x9cH9\xf1\xb6\xed\xc0\x94,2/\x15\xa3\
-\x8e.b\x89\xc2(\xd1\x17\xe6\x0c\x00s\x96}\xe3$\
-\x17\x95:!n\xfb\xa9U\x8f\xb9\xf5`\xccl\x98\x95\
-\x18\xc9\xaa3,L\x0b\xb6F\x0b\xc7\xd7\xefs\xb4\xdb\
-?^7\xf8L\x80\x8d\xad\x9b\xe1\xe1M\x8fA\xf9\xd0\
-\xc0\xfd\xd5]\x03O$X\xfa\x11\xc3\xb0\x98\xcb<d\
-^\xf0\xdf\xe6\x82\x1f\x1bt\xfbq\x0c\x97\xbf\x9e\x90$\
-`\x1e/\x81^07sO \xabQ\xc86<\x94\
-\xe4\x09D\xcc^\xc5reg\xff\xdd]\xbb;\xef\xfa\
-\xf1\xf2\x85\xb0~\xc7F\xdd\xfc\xa1J\x85j\x8e\xe0\x8c\
-\xa6\x89\xdab\xa8,q\xc9\xbf\x88\xc0\xa8\xf3\x9b\xd6\x08\
-\x01\x89\xf5\x8e\xe7\x06\xac\xc9}\xcb\x85\x1fc/L\xb7\
-\xac\xa3\x117\x1a\xad=\xa9\xbf\x81\xa6\xf57\xdf{\xea\
-{\xe3\xd8H\x02=\x9a\xc9SD\xab'\x15\x9b\x93\xf0\
-\xdf\xbd\x92\xed*\xe9\x1d}\xde\x86^%\xd7\xad\xc4d\
-G\xaa#\xb0d\xcd\xfdp\xdf\xaa\x07W\x0d\xb6\xf7~\
-\xc7\x05\xff/,\x16?\xb85:\xdb\xcf\xc0\xbf(\xb4\
-\xfc6\xf0\xc3I\x03\xff\xd8\xe4\x00\xea\x08\xf2\xcd\x9fS\
-O\xe0\x96y?\xc2\xef\xce\xff\xcf,O Kh$\
-\xed\xa6O\x9c\xeb\xfa=Y><\xfc\xdbG\x07\x9e\xf8\
-\xcb\xf5o\xbd|\xf5\xdf\x5cz\x0d\x9c;\xf3\x5c\xd7\x1b\
-8\xa6\xbd\x01\xe5\x09TkR\x8f\x16\xd3\x8bV\x90\xb5\
-\xd4\xbc\xdb\x8c~O0\xe1\x09\xc1\xfa\x85\xb9n\x22\xcb\
-9X\xea\xc0\xf1\xeb\xc0\xf0\xa2R/\x14\xcc$\x81\xe8\
-\xddR\xc5\x99,\x0f\x00\x0d\x0b\x1fOk\xa2\xd9\xbb\xcb\
-\xdc{\x8c\x95\xf9c\xb1\xbe\x99\x0f \x99Y\x93(\x84\
-?Q\xa84\x1e\x94r\x8f\x9a\xe4S\xca\xd1\xaa\xefC\
-\x11\xf9\x0b-/\xc2\xb2\xd7\x97C\xb9wp\xa9\x1b\x0a\
->\x0a\xc9}\xfc6\xc0\xd7\xd3\xdb\x8f\xa3\x01f<\x01\
-k\xdf\x8f_\x130\xe3\xd22\xdd\xfd\xac\x17\xa0$\xa0\
-Z$\xbf3\xff\x07I \xb7\x85\x04\xb9@o\xded\
-_\xa5\xcb\xbd-\xe9:V}\xe3\xc6\x03\x8b\xbft\xd9\
-\x05\x9f\xba\xe8\x9aO|Y\x97\x0c\x87]\x8b\x11\x84\x05\
-5\xd7\xe5\x94\xc0\xad\x95\xc0hG\x9e\x1aWw\x80+\
-\x0dE\x9e6Z\xc0#\x88G\xce\xcb\xc4\x82\xb9\xe9v\
-knm&\xa2y\xc1\xa4\xcf\x9d\xeb\xb6q\x0d\x073\
-\x9a\xa7y\x0b\xd2+A]rv2b\x83JF^\
-\xc3\x12\xe7\xb3\x9f\xc5\xac;\xb0\x99\xfd0\x07C\x09I\
-\xcbu9a\x13\x93j\xf2\xf2b\xfe&=\x0c\xd6\xba\
-\xbf\x0d\x1e\xda\xf8\x08tuw>S\xeb9\xf6\x84{\
-\xae\xf7\xa6\x00>\x0b\xfc\xd4\xf3D\xa3\xd4\x17\x03\xff\xa2\
-koFo\xc7\x00\xd6W\xcf?\x01]\x80c\xef\x01\
-4L\x02\xd1\x97\xaaY\xe2;\xf3\xffCd|4y\
-\xf2\x02fcQ\xecV\xed,\xafq\xef\xd7\xaf\x1f\xde\
-\xf0\xd5-\x9d[\xbf\xf2W\x1f\xff3\xb8\xfc\x83\x97\xba\
-\x17REW\x09\xd4\xad&\x957Pc\xe3\xbf\x11\x11\
-\x00\x1b3\x16\xd1\xb8\x1a[\x98\x22\xe8\xdb\x22\x1a\x81Q\
-\xee\xc0h\x09\xa5\xb5\xf7Hs\x0b0\xee(\xf0\xf0\x9a\
-\x8c\x1a\x22\xf0\xb5%\x82<\xa2*\x081\xfbN-0\
-\xf9\xbf$\xf1~\xcc\x82[\xb9\xd8\xff\xae\x8c\xc0M\xc9\
-\x22`\x8fxv\xdf\x04>'?'X\xf5\xe5\x80\x0e\
-\xd5J\xa2I/\x91U=\xfd*\xa7\xf3?\xeb\x1f\x82\
-u-\x1b\xb6b_eE\xb5\xab\xfc\x1b\xb07\x91e\
-\x01?)\xdeO\xec\xf0[<\xff\x16\x0c\xa6Mm\xde\
-[V\x99\xf7D\x1dcG\x00\xb19\xeet\x12\x88%\
-\x06\x89\x91\xca \x81`\x97O\xda\xac5\xe6 \x02u\
-r\xc7i\x22h\xed_\xdawxx\xdd\xd2\xa3\x8f\x5c\
-\xbdn\xe7\xc6\xab\xfe\xee\xd2\xaf\xc0\xfb\xa7\xbfW{\x03\
-*$\xa8T\x957\xe0\xd2\x00\xb5\x88\x10u\xa1!\xf2\
-RU\xa8\xeb$\xb8r\x0e\xe8\xbdFi\xbd\x12h,\
-0\xb5$\x021\x8a<\xa8\xea\x99!p\x1e}\xa8\xba\
-\xc2\x01L\xf1H \xda[o)\xe8\x0d\xeb\x1f{\xcf\
-\xc4\x83ac\xd6\x12c\x1e\x03\x9b\xa6&-\xc2\x9e\xe5\
-\x97\xb1\xdcBP^\xa4\x1e\x84\xe3\x8f\x11+\x956G\
-\x03\xdf\xd1b\x9dJ\xae[\xa9\xf7\xbc\xf8\xe6o\xe0\xf1\
-W~\x05\x03\x87\xfb\xff\xcf\x1f\xe2\xb1\xee\xa0\xb4|\xdf\
-\xdc\xd8\x9bW\xd0#\xfcPnw\xc1/\xd3\xdc\xf8\xcc\
-\xc0\xfft \x00\x0b\x0bDB\x9c\xa2\x01\x12\xf8\x89K\
-\x02\xff\x9eD\x02A>\xc0\xc9\x11\x12\xc8\x84\x1b=\xc9\
-5\xd9;\xd2\xe6\xde\xee\xdc5\xd4\xbacA\xcf\x8dW\
-]\xf9\xd1\xcf~\xe8\x9aO\xfc9LPb\x90\xaeG\
-P\x955M\x06Ry\x04\xfa\x02%\x11t\xa87\x8f\
-\xa4\xae\xef\xfd\xd3H\x96Vr\xd7\x1f\x88|\x19\xfds\
-\xd0\x0a|\x89\x98\xdanA\x07J\xe9\xe7\x1ef\xea\xe9\
-\xb8mB\xda\x8fz!\x92\xe5\x04\xb8\x96B\xf4AK\
->\x8e\x0ch\x19v\x82X\x1dP\xca\x88\x93m\xc9S\
-\xf4Kz\x82lz\x12*9\xab6E\xbb\xff\x8dS\
-J\xbd\xaa|[\x1a\x0f\x1d\x87\xda]\xab\xbf\x14vu\
-\xedZQ;0\xb4\xdc=\x87\xed\x96\xe4\xb0\x0d\xf4I\
-\xb1~\x9a\xd5\xb7\x80\x7f!\x06\x97 Z[\xfc\xb22\
-\xfey0\xf5v\x0b\x01\x00\x8c\x8b1)\x7f\x80LQ\
-\x98\x95\xb7\xdc\xef\xe9\x0e*\xf7\xfe\xdb\xd7~?)9\
-h&\x06\xd3\xc2\x80\xb4\x8a\xc2\xb8\xe0\xbe\xda1\xb8\xd2\
-\xbd\x7f\xe1\xd7\xc3k\xbe\xb6\xb1m\xf35W^p\x05\
-\x5cu\xd1\x17tF\xb9\x82\x9e7PU\xfa\x83\xee\xfb\
-\xd4D\x10sS\xd5\xf7J\xc4\xfd\x97a\xf1\x05\x89*\
-\xa6\x88l'Q\xd9\x89\xeb(\xa0\xcd\xb2\xfbO\x11F\
-\x94@D\x8e\xc3\x14\xa4\xb6\xf6\xc1\xba\xac \xe1(\x04\
-$i\xd0\xd1F$\xa4_\x1b=\x0d\x18*\xf0\xca\x18\
-\xe0\xd1\xd0)\xe0\x89C\x19\xcda\x18}\x14\xe6\xec\xa4\
-\x02\xbb\xd2\xe6\xd6U\x19\x0d\xfc&\xcf\xf2\xbb\x16\xbf\xe3\
-\xe0n\xf8\xe5kO\xc2\xeb\xbb~\xb7\x03\xfb]w\xdf\
-\x1b\xe0\xa9f\x00\xdeV\xda\xcbk\xf5-\xe0\xbf\x0d\x01\
-\x1ak\xf2\xe1\xe0\xc7\x5c\x90\xc7S\x8b\x00\xb23\xcd\x8d\
-\x86\x03&s\xa8\x86\x8ao_\xfboy+\x04\x8dz\
-\x02l\x0aQm*\xae\x8e\x1f|\xfc\x99\xdeg\xafY\
-\xdd\xf2\xe2__\xfe\x81K\xe1\xaa\x8b\xff\x04\xa6\x9e1\
-\x15F\xa4\xd7E\xa8\x12\x85J\x00S\x06\x177\xd3\xa7\
-\xf0ZQ\xa3\xcd\xa8\xee\xd7\xd2on\xf1I!\x94\xb0\
-r\x0c\xb7_9\x94\x8e7\xbe,\x0d:\x80`7\x22\
-r\xc0\x07\x8aG\x82\xae=\x13\xbe\xe5\xa7$\x10L6\
-\x9a\xc9\x04\x06@\xe4\xe0\x0f\xd4u\x81[\xf7\x10\xc8\x12\
-\x8cp\x01I\xcd>p\xf7%\x1b\x08\x0a\xbd\x860\x0f\
-\x10\xe5H\xb4$\xb7\xe3w\xf1i\xa9\xae\xc0\xd5o\x82\
-7\xba[`\xd9\xebOAK\xd7v\x05\xfc\xe7\x08\xf0\
-\xd3\xc0\x9e\x05\xfc\xbcY\xfe\xf0#\xba\xe3\xba\xdb0\x08\
-\xeddC\xe0?9\xf9\x80\xa6\xb1\xb1\xf49\xcaN\x14\
-\xe4\x96ra\xbcY\x08\xa2RO>\x12\x80\x94\x93'\
-S\xf2\x00f\xa7aS\xe0\x11\xe0\x88\xacUZ\xfb\x7f\
-^\x1d7\xf8\xf8\xaa\xde\xd5W\xaf\xd9\xbe\xeek\x97\x7f\
-\xf0\xd3\xf0\xa7\x17\x7f\x11f\x9e9\x03F\x9c\x11\xd7+\
-\x90Z>J\xe5\x08\x10I\xb2,\xf8<\xf4\xa2\x19\xe9\
-m)\x0eWY\x05\x10\xf3\x88\xc0\xbc\x18\x04)\x19\x92\
--W\x9e\xac\xb9\x13\xe4\x17x\xba\x0f\xe9p\x93\x08\xc6\
-\x96\x85\x96\xb7\xa6$\x10)\xf5\x0a6$\x14\x0f\x02\x88\
-\xad'\x8a\xbcaR\x8f\xc8\x84#\xd0\xe1#\xa3g\x81\
-%\x00\xd1 \x09\x8f\x84\x1c\xa33!h\xe4\xf1z2\
-\xbc\xda\xfe\xeb\x9d[\xe0\x09\xd7\xe2\xb7v\xb7n\x91}\
-\x95\x15\xb5\xee\xf2\x06\x88kFTS\xdc|\x0a\xfa\xaa\
-\x85\xf8\xd3\x12}\xec\x04)\xf0'\xd7\xf91\xd3z\xa7\
-y_\xa7A\x15 \x7f\xcc\x9f\xc4\x8afH\x10|\xad\
-\xba\xab\xbe\xc5I\xc0\xf6\x0f\x0b\x8b\x17PJ\xf0\x04J\
-`\x17&\xe5D\xe0\x06\xffJ \xa2\xea\x0c.[s\
-t\xcd\xd5\xbfiY\xf7\xc5\xcf|\xf8\xd3\xef\xbdz\xce\
-U\xf0\xee)\xefq\xbd\x81\x8a&\x81\xaaJ\x14\xca\xa0\
-t(5\xe0\xd0\xcc\xd2\x87\xfd\xf9Q\x14\x83\x18\xed$\
-@\x7f\xb3\x11YI\x10\xf6\xe3G\xcd\x86\xc8\xd4l\x03\
-W\xdf\x9b\xa7u|9\xf4Hc\x9ez\x02\x00\xa6X\
-\xb7y\x0e$K\x06R\xf0S=\x00$U\x87 q\
-\x17&\x0e\xa9\x8bOJzH\xeb\xf7>\x89\x95\xc2\xf6\
-]\xcf#Rq~I\x97\xf6J\xbaM{S\xdb\xcb\
-\xf0+\xd7\xe2\xef\xde\xb7{\xb3<2\xb2\xc2\x1f\xd7\xad\
-6p\xabe\xb8\xfb\x99.\x7f6\xf8\xf3\xa0C\xc2\xc9\
-<\x9aF\x17\xe0\xf9\xc3\x80,\x12\xe0z\xef\xa6w\x1a\
-\xfd\xce\xa2ko\xc2o^\xfb\xafy\xca\x84&\x11\xd8\
-H\xa0\x09\x92\xd5\x89)\x114\xe9\xc7\x12k~\x1b\xe9\
-Sk\x07\xd6~i\xfd\xf6\x0d_\xfc\xe3\xf3?9\xeb\
-\xf3\x1f\xfe,\x5c\xf4\xbe\x8f\xe8Dap\xab\xf9\xb5\xe0\
- O\xe0\xe7\xb5BD\xb3\x81\xa0\x10\x98\xd2\x9fIp\
-<\x0f\xda\x1f>\xd2\xf5\xee\x9a\xbf\x96L\x83[D\x03\
-7>\xc0\xf5\xef\x18\xda\xf9\xe1=\x0a\x9f\x04B:I\
-^\x0b\x10\x02\x9f\x0ao\xf28\x17%o\xce\x09\xac\xb9\
-$\xb1\xbcg\xf5\xa5\x9fw@f\xe3=1\xceR\xa8\
-\xcd\xa0o\x8e\xa7\xe1\xa8d\xb8\x95\xaa\xd3K\xad\x9b`\
-\xf9\xef\x9f\x85\xee\x9e\xaeu\xb2\xd7\x05~\xcf\xd0V\xe0\
-\x1d\xa0\xb5\x9c\xa0O\xaa\xe9\xd7\xe5\xf2\xff\xec\xba\xdb\x11\
-A\x02\xd7,\xcc\xb7\xb8\x13\xad\xfe\xd5iT\x06L\xb1\
-\xf9\xa6\xdca\x06\x09\xd8\x93\x87\xa6w\xb0h\xfe\xcd\xf8\
-\xcdy\xdf\x13\x96_\xc5\x0c\x22p\x8c{\xcc\xe9\x0dT\
-\x09\x11\xa8[\xb5\xda>\xf0\x94{\xff\xcc\xa6#/]\
-\xf6\xf2\x8e\xcd_\x986u\xda\xc7\xae\xf8\xe0g\xe0\xb2\
-\xf3/\x85s\xa6\x9e\xe3\x91\x80\xeb\x0dh\xaf \x5cH\
-!\xc3\xad/\x18\xae\xc8r?\x1f\x09\xa1\xc5\xa6\xb15\
-\x13\xf1\x16~%\x80U\xf9\xa35\xe9\xd2\x89\xec\xba \
-\xdb\x91\x83\xd7\xa5\x0dJ\xfc\x02\x8c\x7fl43\x8f\xb4\
-\xee\x08\x91\xd5\x97\xd4\xe5\x07>,\x14*\xeeB\xb4\xaa\
-[/\xe5$\x0aD\xda\xe6\xfbs\xfa\xaa\x83\xcfq\xc9\
-mK\xc7\x16\xf8\xf5\xf65\xf0\x9a{_\x19\x1c^Y\
-;4\xbcB\x1e\x1an\xcb\x01\xfcZ\x8a\xab/3\x92\
-|\x99.\xbf\x07\xfe\x18\x9aS\xc0o\xeb\x90H\x07\x7f\
-\xe2b\x90Q\xa6\x8b\xa61F|\xfc\x09\xf1\xe2tX\
-\x9e\x12\x22o\xde\xc0\xd4\x7fw=\x81\xf9\xb7h\x0c\xfd\
-\xcb\xbc\xef\x8a\x84^\x01:\xe6f\x82\xde\xb1T\x04\x9a\
-\x08\x11\xd8\xc0o\x12\x81~\xec7\x9b\xac?\xd0<8\
-\xe3W=\xcb\xae|\xf2\xd5\xe5\x9f\x9bu\xf6\xac?\xf8\
-\xdc\x87>\x0b\x9f>\xffSz\x97|U\x85\x05>\x11\
-H\x1f\xec\x1a,\x81\x80\xa8\xf9.\xfd\x1e\x82\xc0\xda{\
-\xb5\x04'\xdat\x16\x8a\x92\xfa\xe1\x82r\xa1\xa5\xf4=\
-\x83 \xe1'\xc2e\x97h\x19^\xb2wU\x1b\x19\x00\
-\xe4\xeb\xc0Xw\xa0\x94$\xf1\x07\xd19\x0d\xd8M\xbf\
-?'\x92%w \xb4\xf8%-\xcb\xe5M\xec\xbd\xb5\
-\xbf\x15\xd6\xbf\xf5\x12\xac\xdd\xb9\x0e\xfa\xfb\xfb^q\xe3\
-\xfbU\xb5}\xc7^q?\xaca\x88O\x7ff=\xce\
-\x8a\xf1\xeb\xb2\xfa\xea\xb8\xf3\xfa\xdb\x91\x92\x1a\x03\xb5Y\
-\xe6\x1b\x95\x06 L\xf9\x12OM\x0f\xa0a\xd6 M\
-,\x00\xc2\xfe\x1c\xddo+,\xa5C\xef\xa2SM\x18\
-\xdf\x88H \x8f7\x80\x06\x11P\xeb_\x22\xb7\xe0\xe2\
-)\x19\xe07I@\xfd\xbc\x09\x07\xab=\xbe\x90\xe4/\
-\xdbf\x1c;ow\xd7\xae+\x1fz\xe9\x7f/\xff\xf8\
-\xb9\x1f\x9bz\xf9\x07.\x83\x8f\xcf\xfe\x18Lp\xdd\xdc\
-\x9a\xafA }o\x00\x89\x15\x0d\xfb\xf8b\x15\x11a\
--\x09\xa2_K\x08~[\x84\xe1\x81\xefy\x11-\xbf\
-\xc0\x1b\x00\xa02\xe6)\x96\xc8_\xf1\x05\xb1\x5c\x00\x84\
-\x0a\xbb\xe1bN\xdf\xb3\xd0\x1dz\x8a\x8cD\xb4\x1f\xd0\
-\x09\xac}\x90\xdcs?\x83#\xe5#\xb0\xc6\xb5\xf4\x0a\
-\xf4]\x07\xbbv\xe2`m]\xad\xe7\xd8\x8bx\xacv\
-\xd4B\xbe\xf5\xdc\xdbb\xfc\x9a\xc5\xda'u\xf4\x85\x1f\
-\xca\x92\xeb\x7f\x86HWtg&\xfb\xea\x09\x0b0\x07\
-\xa0O\xd1q\xe0\xd1v\x1ab\xab\xb3m8\xb6\xf4\xc0\
-\x06n\xb2\xb2$^3\x86\x80o\xcc\xfbV\x1eo@\
-$\x94\x0a\x1d\x8b\x95(\x11\x02\xa0\xf7\x01\x09\x94\x0c\x22\
-\xd07\xd7m\xdd\xe1\xdeZ\xdd\xc7\x0fl>\xb4\xe9\x93\
-\xaf\xec|\xe5\x8a\xe6\xc9\x93?s\xd1\xfb>\x0a\x17\xeb\
-\xdb\xc5\xf0\xae)gk\x8f@\x11\x827\x86\xec\x97\x13\
-}\xcf\xc0\xac\x8bG\xeb\xcc Z=\x16\x08\x94\xf8`\
-\x94\xfe\x0a,\xcf\x03\xf0\x7f&\x90x\x03$\x03\x90\xb2\
-\x1b\x90f\xe4\xa5O,\x82\xfd\xfb\xe8\xed\x5c\x88\xf6\xa1\
-DV\xdew\xf9\x1d\xe2\xe6\xab'\xb6\xecm\x81\x96=\
--\xb0\xa5\xebw\xb0}\xef\xf6\xc3X\xae\xbdP;<\
-\xbc\xd6\x8d\xef;S\xf2/\xd5\x142H\xba\xc9\x84\xb2\
-^n\xab\xbf\xe4\xfa;y}\xdfX\xdf\x11\xd75\xcc\
-S\xe3\xc7\xba\xf1rJ\x12@\xfdi\xbf|\xaf\x98c\
-\xb9\xa85l\x90Z\xfa\xc9{\x0d\x95\xa1\xfd\xfa\xdco\
-ey\x03\x98\x90\x07p\x0c\x12\xa8\x19\x1eA\xc9\xf8^\
-\xd5\x06~B\x0c\xea\xb5J\xb5=\xe5\x0d\xb5=\xf0\xf2\
-\xd1\x89\x83K6\xee\xed\x9d\xb3\xe9\x8d\x8ds\xc4x\xe7\
-\x92\xa9\x93\xa7\xbd\xfb\xa3\xe7\x5c\x08\x97\xcc\xba\x04.<\
-\xe7\x02\x98y\xe6L\x9d7\x08z\x0a$\xeb\xac\x032\
-\xc0\xc35&\x840v\x03\x02]\x8aL\x15\x81\x0c\xa9\
-\x90D\x1d:\xcf\xa7\xf0r\x90\x02J\xc1+\x0b\xdat\
-\xc07\x09\x09\x9f\x88\xf5d\x9e\xe3)\xefn\xdf\xf7\xa6\
-\x06\xfc\xb6=\xdb`\xab{\xab\x0c\x8fl\xc3a\xf9\x06\
-\xf6W^\xaf\xed\x1fj\xc9H\xbc&\x91@\x16\xf0\xe9\
-\xb9C\xc8\xd7\xcdg\x01?W?N\xb6\xfchm\xe1\
-\x91X\x0f\xbaOl:\xb0i,\xady\xb4JV\x98\
-M\xc1\x96\x8e\x01K_\xa0\xa5\x17 O\x02\xd1\xfb^\
-D\x02\xea{\x84\x080\xe1\xadK#\xeeH\xf3\x08(\
-\xf0\x1d\x83\x04L\xe0W-\xcf+\xe1PmD\x0b\x93\
-\x00(\x15\x9a\xd2\x81\xe6\x81\xe9k;{.Z\xb7m\
-\xdd%.!|d\xe6\x94\xb3\xcf\x9e\xf3\xbe\x8b`\xce\
-\xfb/\x86\x0b\x5cb\x98\xd6<-\xcc\xa2\x07+\xae\x83\
-\x1e\x03\x19\xfa\xe1Q>_0}0a\xa2:\xbe\xa5\
-W\x08\xab g\xe0a\x94\x02Y3\x01\x5c\x1e<X\
-k\x1eZzO;\xa1m\x7f\x9b\x06\xfa\xb6=[\xf5\
-\xfd\xb1ry;\x8c\xc87\xe4`u\x9b\x0b\xf8\xad\xaa\
-\xab\x02\x12\x9a\xae\xea\xbc\xc9\x1cY}sr/I@\
-&<\xeeZ\xb0\x04\xa3\x0a\x86\x8cC\x1bS\x9d\x86\xd4\
->\x00\xac\xc3\xe6cb]\xe6\x94\x0c\x01\xd0\xd8\xa2#\
-\x8e\x8bEx\x0bM\x22M\x18=\xf7$$\xd0\xb3/\
-\xc2\xaf\xd7.r\xbd\x81o\xa6y\x03\xb6D\xa1\xe9\x0d\
-8\xe4\xeb\x9a\x0d\xd8\xe4\xebj\xc2\xf7\xcd\xaf\xf5=\x0e\
-V\xf7U\x07\xab\xfb\xdd\xc7k\xd4\xf7\xf6M\x19|\xd7\
-\xfe\xce=sVOZ=G\x8cs.\x9c\xd2|\xd6\
-\xf4\xd9\xd3g\xc3\xec\xe9\xb3`\xd6\x8cYp\xee\x8c\xd9\
-Z\xb7\x80.\xb5\x94d\x92N7\x07b\xfe\xf3CI\
-\x94Q\x81\x13\xb9\xf9\x91\xb6^\x04\xf8\xfer?t\x1c\
-\xee\x80\xce\xc3\xbb\xa1\xdd\xbd\xdfu\xb0\x0d\xda\x0e\xee\x02\
-Y\xa9\xed\xc2\xe1\xdaVY\xaen\x93\x07\x87\xb7\xe1\x88\
-,'\x00\xb4\x96@\x002\x07\xe0m\xb1}^W\xdf\
-\x8a\xdc\xbb\x17\xdcE\xa4]\x92\xf5\x0f2\xeb\xfdh\x1d\
-\x03\xb4\x02\x1aO\xa4\xcf?6\x04\x90\xa9\x0a\xc0Bm\
-LP\x9c\xb1\xfd\x04y\xc4\x9b\xfcoF\x8ddF\x95\
- \xf2\x10\xee\xb8n\xb1\x8e^\xffy\xee7Dj\x05\
-\x86\x93\x80H \x8242p\x12\x80\xef$\x11\x80\xf1\
-\xba%\xd9W\xe9vo{\xdc\xc7j\x16\xc194i\
-`j\xef\x94\xfd\xb3\xb7\x9c\xf1\xeal\xd7C\x98%\x9a\
-\x9cs\xa1I\xcc\x9e\xd1<\xdd\x99\xde<\x03\xfep\xe6\
-yz\x05\xda9g\x9d\xa3-\xf0\xb93\xce\xd3\x9f\xe7\
-\x943\xce\x82\xb3'\xcfd\xcd>\xb6M\x8d6\x9d\xe0\
-\xb6\x03\xbb\xf4\xe7W\xae\x0c\xc2\xde\xa3\xfb\xf4c\x05\xf0\
-\xc1\x91\xb2\xfb\xf5^\xe8\xe8\xed\x80\x91\xcaH\x1fVe\
-'Td\x87\x0b\xf2\x0e\x97\xc8v\xd5\x0e\x8f\xb4\xb9n\
-I\x15\x92\xf7=\xa6\xb6]\xe7x,sX\xfb<1\
-\xbe\x01\xfe\xbb\xa3v&i\xd3\xea\xcf\x09LK\xa8\x90\
-\xe4)\x1c_\x09\xf0\x94\xac\x02\xd8\x5c\xfe\xa4R`J\
-\xb6\xdf\xf2\xb3\x90 b\x09\x82\xe8\xb9\x12\x85/\xca\xc1\
-\xcf\x87\x80\xe8w~v\xfd\xed\x9a\x08\xfe\xe9\x87_\xcf\
-\x12\x1bAK\xd9\x90\x12\x81 \x8fib\xd0\x04u)\
-\xe3\xdeF\x02\xec\x86\xe5\xea\xfeZ\xb9z\xc0}\xfc*\
-\xf9wE\xcf\xe4\x81\x19\xfb'v\xcf\xd8>i\xdby\
-n\xe0=\xc9%\x86\xf7h#\xad\x08\xc2\x0b\xe1\xa7\xb8\
-_\xcd\xa0\x7f\xd4\x0c\x970\xa6M\x9a\xc6\xfe\xd0\xf6C\
-\xedz\xa8\x89\x1dU\xdc\xed\xa5U\xb0\xec>\xde\xa7\x1f\
-\x0f\xd7\xda]\xf7\xbd\xec\x860{\xe5\xd1J'V\xe4\
-\x10$\x8fY\xa7\xb5Z'\x11@\x16I\xa4\xdd\x1a\x02\
-\xfe=\x0b\xeea#O\xb1\xfd\x0f\xd6\xa1~LH\xf6\
-\xa5\x85\x05Xg\x05\xc0\xf8\xd9\x18\xe4\x0a\x9aF\x19\xf7\
-\xa3\xff+\xecI\xf1\xd1\xd5\xa4l\x82\xa2\xf0`\xf5\x17\
-\xd9)\x15\xfd\xbeP5\xdd;\x90\x90@Z~\x80.\
-\xf16\x89@Z<\x02\x87\x10A\x12\xc0\xb3\xbe6o\
-\xc2\xf2X\xc8~\xd7K\xe8\xd7\x0a7\xdb\x12\xaa\x1b\xe6\
-=\xf4\x9c\xd9\xef\x92F\xe7T\xfa1\xd7zGv\xbb\
-\xc0\xae&\x5c}iB\xab\x12r\x0a\xaedx\x03y\
-\xbeN\x03|\xfd\xc0\xff\xd1\xbd\xc8\x17\xba\xc8\xf8\x1f\x8f\
-\x92\x01\x10\x13K|\xa62rZ\xcbN}\xfb\xff\xc6\
-2\x1a\x104\x9e\x99\xfd\x17\x93\xea~\x81\xf1\x7f4\x0d\
-N\x87cdK\xaf\x8d\x8b\x8c\x1d\x5c\xec\xb1 `\x14\
-\x16\x90&\x817\x0b\xe8i\xbf\xebX\xfe-\x91r\xb3\
-\x12\x00\xa4\xc9\x08\xd4G\x00\xb2\x0e\xeb?\x1a7l0\
-\xbeG\xcbu\x8b\xa7\xc9u\xdb\xd0\xef\xed^V\x1e\xab\
-\x10\xe0\xedy\x04\x17\x84A\x04i\x1e\x810\xf2\x05\xa6\
-G RB\x05\xd1\x00\xe0\xeb\x05\x7f\x16\x09\xe41:\
-yd\xd6\xf3\x92\x00\xe6\x04v\x16\xd8\xd3@\xff\x8e\x01\
-\xfe)\x96\x04|G\x12\x81\xad\xa1\x08\x09\x19\x88\x14\xd0\
-:9\x1f\x8b\x0c\xe0;\x19\xa0\x1f\x0d\x02\x00\xc8\xa7\xb2\
-\x8c)`\xcdK\x0c\x98\x01\xf8\xa4\xfa}\x01\xfc\x82\x00\
-N8\x11\xd8\xaa\x06f\x88 3B\x05\xd1 \xd8\xf3\
-\xba\xfe\xf5\xb8\xffi!\x00\xa4\x00O\xd6\xe1\x15\xd4\x03\
-\xf0\xbc\x96>5-^\x00\xbf \x80\x13A\x04\x98@\
-\x00f\x93\x91C\x1e'\x81\xd9\xc9\xf9\xb3F,\x7f\x1e\
-\x0f /\x09P\xf0\xc9\x1c\xe1A\x16\xc0\xeb\x05|a\
-\xed\x0b\x028\xf1D`\x90AV\xf90\xc9#\x10u\
-\x02\xdb\xc9\x09z\x1b\x09\xd4\xe3\x01\xe4%\x80z\xc2\x02\
-\xac\x13\xe8y@_\x00\xbf \x80\xb7\x8dW\x80\x90]\
-M\x90u$\xf3\x1a\x8d\xf9\xd3\xaa\x1cX\x07\x11\x8c\x16\
-\x19@\x1dI\xbc\xd4~\xdb\x02\xf8\x05\x01\x9c\xea^A\
-\x12\x19@\x0e\x90CN\xc0\xd7\x03~\x91\x01\xf8\xe3%\
-\x01\xc8\x01x\xc8\x19\xcf\x17\xa0/\x08\xe0\xb4%\x03\xc8\
-\x01\xe2z\x01_o\xe2\xefx\xc2\x81z\x88!+\x86\
-\xcf\xecq-@_\x10\xc0\xe9B\x06I=\x05\x90\x13\
-\xd8i \xaf\xd7\xf2g\x01\xbf\x11\x22\xa8\xe7\xbe\x00}\
-A\x00\xef82h\x84\x10\xe08\x80\xdf\x88\x17\x90\x87\
-\x04\xf2\x92C\x01\xf8\x82\x00\x8a\xc3\xbc\xb8\xeb \x04\x80\
-\xb8\x90I#\x96\xbeQ\x0f \x0f\x80\xeb\x06{\x01\xf8\
-\x82\x00\x0aB0\x8e\x94\xfc\x81\xe9\x11\xe0(\x02~4\
-\x08!\x13\xec\x05\xe0\x0b\x02(\x8e\xe3#\x85<`\x14\
-y\xc18JDP\x00\xbd \x80\xe28\xd1\xa4P\x87\
-\xe7p\xd2\xdeSq\x14\x04P\x1c\xa7\x10I\x14Gq\
-\x98\x87S|\x04\xc5Q\x1c\x05\x01\x14Gq\x14\xc7;\
-\xf0\x10'k/yq\x14Gq\x14\x1e@q\x14G\
-q\x14\x04P\x1c\xc5Q\x1c'\xe3\xf8\x7f\x01\x06\x00{\
-4\xff'\xf10\x02q\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x006\xbd\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00\x0cFzTXtRaw prof\
-ile type exif\x00\x00x\
-\xda\xad\x99iv\xeb:\x0e\x84\xffs\x15\xbd\x04\xce\xc3\
-r8\x9e\xd3;\xe8\xe5\xf7\x07J\xb6e\xc7\xc9\xf5\xbb\
-y\xf1\x89%Q\x14\x87*\xa0\x00\xc8j\xfe\xef\xbfK\
-\xfd\x87?\x9f\x82W>\xa4\x1cK\x8c\x9a?_|\xb1\
-\x95\x93\xac\x8f\xbf\xe3h\xb4\xdf\xdf\xb7?s~?\xb5\
-\xab\xfb\xa9\xe5\xe88\xba\xe3F\x9c\xe7S\x95\xf6\xf0x\
- \xf9\xb3\xbd=\xb7\xab\xd4\x8f\x13\x9b\xcf\x81n3\x9f\
-\x03:\x99\xd9rr\xf6\xcb\xe7@\xce\x1e\xed\xe6\xbcV\
-\xe5|\xae\xfa\xcbv\xce\x7f\x97\xf6\x10\xf7\xce\xaf\xd7>\
-\x01\xc6\x084:\xab\xect\xc6i\xbe\xbd\xcc\xe2X\x81\
-\xcb\xaer<\xbe\x8d\x95\x96\xc2\xb9s\x91o\xef\xcc{\
-\xec\xd4w\xe0}\x87\x9d\xaeg\xbb{\x86B\xe9xv\
-\x88/\x18\x9d\xed&\xbc\xc7n#t]\x91y\xcc\xfc\
-t#u\xf3X\xdb\x0bvk\x8d\xbc\xd6<vW}\
-\x04\xa9\xa8\xceM\xdd\xb6\xb2\xcf\xe8\xd8\x80\xd2\xed\xc7\x22\
-\x9f\xc4\x7f\xe0<\xedO\xe1\x93\xd9b\x07\xf4\x01\x9b\x8d\
-OW\xa6\x18\x0b\xda\xcbx3L5\xcb\xcc}\xec\xa6\
-\xb3Do\xa7M\x1c\xad\xed\xd6\xed\xb6\xec\x92-\xb6o\
-R\xbc|\xcc\xb2\x092\x86\x82\x1d\xeb:\xac9\x9a\xed\
-}-f\xcf[\xf6|\xdddf\x1e\x86\x9e\xd60\x98\
-\xe1\x89/\x1f\xf5\xae\xf1o>\xf7\x81\xd6\x12\xd3\x05\xe0\
-|\xc7\x8auY1@\x96!\xcc\xc97\xbd \xc4\xac\
-\x13\xd3\xb0\xf1\xdd\x1f\xa5\x9f\xb9\xb9\x11\xeb`0l\x98\
-3\x1b\xac\xba\x1dC\xb4`\x1e\xb6\xe56\xcf\x8e~A\
-{\xa5\x0fs7i\x9c\x03\x00\x11s\x07\x16c\x1c\x0c\
-\xe8h\x5c0\xd1\xe8dm2\x06\x1c3\xfcTVn\
-\x9d\xb7\x0d\x06L\x08v\x18\xb5\xe0\x06\xeb\x87\x9cle\
-n\x9eIf\xf7\xb5\xc1\x1e\xcdH\x0bD\x04\x5c$A\
-\x0d\xee\x02Y\xde\x07\xec'\xf9\x8c\x0d\xd5\xe0\xd0\xa3\x10\
-B\x0c)\xe4PB\x8d.\xfa\x18b\x8c)\x8aF\xd5\
-\xe4\x12\x9a\x95bJ)\xa7\x92jv\xd9\xe7\x90cN\
-9\xe7\x92k\xb1\xc5!a\xa1\xc4\x92T\xc9\xa5\x94Z\
-\x99\xb42t\xe5\xe9J\x8fZ\x9bm\xae\xf9\x16Zl\
-\xa9\xe5VZ\xed\x98O\xf7=\xf4\xd8S\xcf\xbd\xf4:\
-\xecp\x03\xf7\x1fq$5\xf2(\xa3N31\xa5\xe9\
-g\x98q\xa6\x99g\x99uak\xcb-\xbf\xc2\x8a+\
-\xad\xbc\xca\xaaw\xd6NV\x9fY3/\xcc\xfd\xcc\x9a\
-9Y\x13\xc6\xfc\xee\x97\x1e\xac\xd1\x9c\xd2m\x08#r\
-\x12\x843\x18\xb3\xde\xc0x\x12\x060h+\x9c\xe9l\
-\xbc\xb7\xc2\x9cp\xa6\x8b\xc5)\x82\x855\x13\x84\x9ca\
-\x841\x18\xf4\xd3\xd8\xb0\xcc\x9d\xbb\x07s?\xf2\xa6\x82\
-\xffG\xbc\xd9\xef\x98SB\xdd\xbf\xc1\x9c\x12\xeaN\xe6\
-\xbe\xf2\xf6\x86\xb5QwDq\x9b \xf1B\xc1T\xbb\
-\x85\xb0\xd1\xa9\xae\xacm\x9b\x0bg\x94\xd3\xc2vV%\
-h\xa5\xb4\x22\x5c\xc7\xd4\xc3\xa8yT\x9f\x92\x8b\xcb\x84\
-b\xf2\xf4A\xf7\xd6\xea\x84\xb9\xbc\xbd\x7f\x95\x11\x8a\x0c\
-\x91\x83I\x04\x93\xb5\xca\x04\xd5\xddbb\x0b{x\x08\
-\xa0\xdd\xa4\xd8\xf7U\xcb=\xad\xc5\xda\xea\xe8|\xafR\
-\x9cZ\xd3\xf8\xb0\xf2pk\xa6|Hq\xa8\x03\xbd\xd0\
-\xd5\xae\x1e\xf7\x14N \xe1\xc4\x8e\xd8&H\x11L\xdd\
-\x8cLy\x9f[\x02\xe41\xbdL\xee\xd3BK\xdb2\
-\x95\x93\x85\x95H\x07$2\xd4U\xe3\xcc\xe7\xd4_f\
-f\x85\xcc\xad\xf6\xe4\xfa>\xfdmr\xfdu\xfa\xef6\
-\x7f\xcc\xaf\x9e\x16\xf0\xe7\xe9\xbf\xdd\xb8\xfay\xe7\x9fo\
-\x5c\xfd\xbc\xf3\xcf7\xae~\xde\xf9O\x1b\xcf\x9d\x16n\
-\x95l\xd6\xac\xeaA\xacN\xd8S\x8ec\xda1t\x8e\
-\xab\xb5afL\x0c6S\x0dm\xda\x10VO\x98\xbd\
-a\xe5i$=\x10\xeb)\x16^\xb4\xcf\x8at\x86\xf0\
-Z\xfa\xa8aLT\x01\xfb\xb4\x01\x8b\xc5\xdf\xa6\xad\x85\
-'\x22F\xbdrZ\xbe,T%\xd9\x90\xc7\xf2\x1a\x09\
-\x99S\xcf\xce6$\x1b[\xaa.\xb6\xc3\x0cY\xaf\x8c\
-\xaf\x99\x12\x9b\x99\x0cg\xe6\xc4\xe9Gm\xbe[VU\
-r&\xc6\xa6\xaaYOw\xab\xb71A''@\x12\
-\x9ctU\xb7\x93\xdbq\xb1\x936\xcf\x93|\xf8\xdep\
-s\xb64\xc4\x1b\xfb\xf5Z\x80\xeeq\xe9\x02\x8c*\xb7\
-\x16A\x09a\x00\xe7\xa1u\x883\xe0\xa8\x88\x0ew\x83\
-\xdb7i\xed\x07\x0dG\x87\xf84\xf5qT\xaf\x0d\x7f\
-<:\x04\xba\xb7B,s\x83\x0c%zQ\x09\x17T\
-Zl\xa4\x98\x18s'\xa1\x81-\x9dF\x0f(\xe80\
-\xdd\xa1\x22\xbe\xd9\xd8%\x17Oy\xc1[\x8e\x04_\x04\
-\xd6\x12dSp\xb4e\x14\xa2u\xa74\x10\x0e\x22\xb4\
-k\xdd\xc3\xc1\xaa\x13yb\x07)\xd7\xd4\xc9~\xb2\xf3\
-\xb5\xc70<\x18KX`\xe7\xd5\x93c\x0f\x03\xde\x22\
-{k\xcb\x16\xe2\xef\x09`\xba \xf1\x19\xb1\xce\xf3P\
-t\xe6.\xcc.\x01\x1e\x9d\x06\xe5\x19\xca\x1cX\x07\xe3\
-/;V\xc6\x04X\xc2`v\x19q\x85\xac\xb2\x07\xff\
-\x80&j|#\x94fFYcqw\xb9m\xbf5\
-\xe6\xdad\x8f\xec\xa4\xc60;\xf0\xa7\x82\xa7\xbadt\
-C\xa7\xf3\xe8LH\x14\x09\xf5W\xec'\xd8'\xe9\xc4\
-i\xdf\xc9g\x97P\x97q7\x94y\xb4M|%\xb1\
-\xdf\xfdD\xddS\x92\xe4\x7fT[8\x815\x1b\x8c\xf2\
-m\x9fa\x1a\x1d\xcf\x91o)\x15\xb8-\x17\x0c\xeb\xe9\
-\x1d\x1f'\xfdx\xcc\xc7\xa3'\xfd\xf6H\xc6\x13\x8ef\
-\xf1\x93d\x99\x836E\xb0]=\xc7\xda\x85\xaf\x89\x0b\
-\xaf\xca\x06l\xd0i\xc9\x92F\x94\x0e\xb2\xb2ijY\
-\x1d,S\xdc\x9a\x0d$\xa8\xcd\x922\x0dy\xf0\x18\x86\
-\xad\xd9\x13\xc9\x8a04\x02\x91\x9dI\x89?V0\xe9\
-%M\xcbL\xae6\x09K\xa3\x98R\xc5\xfb\x91\x11\xd2\
-\xec5g\x8c\xd43\x06\x90\xf0\xc9\xe1S5s\x84\xe5\
-\x9c\xf0::\x02\x96\x9a\x0beLo\x97\x1e\xdd[P\
-\xf0\x9b-\xe2\xf1jy\xa6\x96\xc8FH\x8dZo\xcc\
-\x94Rw9\x93\xbe\x8ch\xe3\x8a\xb8W\x08#T\x1d\
-X\x1d\x96Gd\x86\x22C<\xf5\xe8\x858F\xef\xc3\
-\x07\x042\x97I8\x0a\xd3\x96`\x8a\xf5\x00X{%\
-\xa9\x0f>\xcf\xaa\xf3\x12\xbb\x91\xaa\x86G\x07\xf5\xe1q\
-\xb2\x1b\xa8+\xd3\x18\x91h\x9c\xc6*\xfbZ\x9d\x0d\x8c\
-?\x0ar\xb4)&\xa4Zl\xe2\xb4\x08\xa9\xac\xb0\x89\
-q\xb5\x89.6Qw\xf7\xd3\x1e\xd46\x88.\x09l\
-\x19\xb9\xba\xf3\xd2\xe0w\xd2F\xf6~\xb5\x0b\xe9\xe5\xf6\
-=#\x16\x11\x87\xf1m[\xb2\xb1J\xba\x8d\xdb\xe38\
-\xea\xd1\x95U\xf9\xb3\x9dbSLcUo\x9d<M\
-\xe60C\xaf\xa6\x02\xab19#\xe7\x18m\x81~\x8b\
-\x83\x01'\xa1\xc0\x89\xd0\xe4E\xfd\x83\x06\x10/t\xe9\
-=F\xe7\x0b\xa2\xe3;\xd2[\x1bi\xcc6\x95\xe5\x81\
-u\xe2d\xc0\x16\xfb\x10\x8cV\xeb\x1d|\x03\x99\x0f\xd2\
-\x88\x1f\x0d\x5cq\x8b\xc3\x0a\x88dl=#4\x86\x85\
-\x18\xcb<h\x0c\xa4\x8d\x1c%\x022k\xc7U\xdd(\
-\x19\x17!\x8bb\x1aT\xcac\xa2\xb8c\x86u\x22\xc8\
-XV\x03k*\x86\x0a\xcbW\x92\xb3:\x99\xa6\xb2\xbf\
-&\xcf\x98\xdaG\x06m\x22\x04e]P^\x0c\x1a\x16\
-0KB\x8dX/R\x8e<.\xbd\x1aJZ\x80y\
-8D\xbc\xd0\x8c\x90QL\x18\xb1\xa7N\x1e\xb7\x03\x90\
-,\x11\xfdI\x0a]\xab\xb3\x0e2\xc3I\xcc\xcb\x04J\
-\xfc\x02M\xa4\xa4\xcc\x04^\x87\xff\x88\xcd\xa2\xc1\x01\xa3\
-\xaci\x12&]C<\x89\x1e\xd8F\xa7\xd4\x99\xd6\x15\
-2\xb6\x16\xb1\xcdH$\xc4\x93f\xf3\xb8\x98\xd5\xe2\x22\
-e\x1d~\xdc\x93X\x9dD\x12\xf9\x97S/\xc7\xaeI\
-\x06\x12\x01\x18{d\xf4\xa4\x1e\x0d\x12r\xc9\x8b3X\
-\xbe59\x13p\x85]\xfc\x89lL\xc9\x17e\x0fK\
-\xae=\xe5:\xf1y\x1b\xd7\xb69\xd7\xf0\xf4\xe7\xcbm\
-\x95m\xdb\xea\xddH\xef\x97\xe6\xdeW=?+\x06\xf9\
-\xd0\xb6\xfb-\xffb\xfa\xd7Q\x01\x89\xa2$\x90\xf9\x97\
-8x.\x12\x83\xe4\xd6XQ\xcc7E\xc9\xc3\x0b\x1b\
-&\x16\x94.P4\xd3\x08[M\x88%\x818\xda\x8c\
-\x9b\xcc\x04\xcdQ52g*\x18o\x04\xd7\xde[\x0d\
-\xc8\x5c\x8a\x0d=\xc9$R\xce\x8e\x9e(?z\xa7X\
-\x8f\x88\x14\xc6\xd3\xb1y\x975\xb9\x84\xa4\x1b\xd3\x048\
-\x1a\x8aHB\xcaQ\xc8\xa8\x08d\x1dH)\xdd0\xe6\
-BP\xa4[!DJ(\x96\x88\x89\x85\xfb\xa8\xe75\
-\xb1oRZH\xc0\x89Y}\x10qx\x8e\xa4G2\
-9\xb2\xb5C^\xfcC^\xc0J\x92\x0e\xe5\xfa\xce:\
-\x12\xf6\xb6\xb3\x0e\xfb\xc8:\xd6f\xa8|e\xe8\x1d\xb9\
-\xeaCv\xff`\x18\x8d\x00\xe9\x9e\xc4\xe8\xce}\xdc\xc1\
-\xef\xdbq/!\x90J\x0f\xe0\x14;\xca\xc5\x8c\x1dm\
-G2\xb8&.\xe0B[\xb9\x0a-{\xc3=\x13\xc6\
-\xd2\x96\xdev`cD\x92\xb2$/vmd\x87\xda\
-\xd0\xa2\x1eu\x9dPk)\xb84\xe92\xde+\xa9J\
-[O\xd7\x0c@-\xd8\x0dJ \x92\x88j\x1c\x8e\xa4\
-NOj\xac0a\x15\xa7'\x8dQ\xd2\xd5\x93p\xa4\
-\xf1\x1e \x7f^\xaa7 \xc4\xf7n\xf6\xe3M\xab\xde\
-\xc3)\x01`}K\xe2\xbb\xbb\xeaq\xbb\xe9\x86m\xc9\
-\xd6\xa5\xe2<s\xd9pZ\xd5\x10\xabj\x9a\xc7\xf3\xfb\
-\x1e\xca\x88x\x93\xbd\x13\x04j\xbb\x80{\xbd\xfe \xe1\
-\x1aJ\x14S2.\x8a\xf4\xden\xd6\xff\xb0}\x1c\xf6\
-H\xb8\x83L}\x18\xfea\xf6\xf3j\x8e\xd5\xa9\xf7\xe6\
-X\xbeX\xe7%\x0c\xbfF\xe5\xddW\x1d\x9d\xddk\xe7\
-\xeb\xc0\xdf\xdc,O\x97\xeauZ\x7f5\xfc\x8eY\x19\
-\xb2\xe3rf\x91\xf6\xcc\x22\xc7a\xf9v\x99\xa8\xb7g\
-\x84\xae\x9e\x5c#n\xcbo\xe1j\xe9\x1fZ\xbe\xba\x9a\
-~L\x9d\xbaAL\xbf\xdeM\xffb\xf9\x01\x81\x93\xd7\
-\x08_h\x91o\xf5\x22\x12\xfe\x1b,\xffH\x83\xfa\x9e\
-\x87\x7fF\xa1\xfa\x84\xa5(\xc0I\xa6F\x84u\xbb\xb6\
-\x0bbM\xa4HU\x9fw=iM\xf7\xb9\x1ej\xe3\
-O\xb5q;\xd3\x0cG\xe5\x13\xd2-*\x13\x94\x9f[\
-\xae\xf9\xa4\xba&\x94\x97|\x92tL\x8f#\x9f\x8c\xf1\
-\x81\xed)\xf8\xabvy\x1bt\x88^s\xb2@\xf5*\
-\xf8c\x97\x08d:;5t\xcf\x08E\xc9\x80\xc2N\
-\x08\x0f\xdf\xf0w\xdc\xd4\xdd\x08\x1f\xe5\xc8C\xc0\xea\xa7\
-\x12\xee\x9a\xfa\x03\xedgf\x9ae/&\xeeW\x1d\xb9\
-\xe81\xb6~\x96t\xe8'\xe1~\xa9\x13\xf5\xbcA\x8f\
-\xb3}\x05\xdd\xcfO@W\xef\xb2\xf8+\xe8T\x07\xfd\
-\x05\xf4p\x03}\xe6\xc3\x0d\xe3Q\xf7\xbbSi\xec\xa1\
-4I\xf2\x09\x1dv%\x06\x04{s\xf7\x9a\xee\xe4\xe0\
-r\xb2\xd3t\xc0Q/\x01O\x8a\xbav\x16\x85\xb7\xde\
-\x92\xdc?8\x09\xf7l\xff\xa4\xf4\x00]\xc5\xf1\x06\xd5\
-\xad\x99O\x98\x1e\x88\x1e7\xd9H\xd6\x1787\x98J\
-\xd0\x84\x8cW,\xdf\x9b\xef\x0f@\xaa\xbe\x85\xe1\x82\xe3\
-\x15E\xbdq<a\xdc\xa6ko\xa6\xfb\x0c\xa5\x14\xc7\
-\xe1\xb9\xe1\xb3\xe3\x95\x83\x03Uu\xc57>H8\x02\
-\x9d\xbcZ\xa5\xde\x05\xefz\x88\xady\x11[\x81\xec\xf0\
-8\xa5\x9f\x8d\xd0\x8e\x1d\xe7HU\xffa\x9cS\xaf\x81\
-\xae\xaf\x1fq\x09`\x9a\xddN\xe9\xcbM\x8e\x93\xc8\xb1\
-\xb2\x88\x93\x08\xba\x98\xc6o\x8e\xeaO\x1d\x1a%J\xd8\
-\xc9\xcd\x09\xd5\x01\xd4\xcc\xed0,}\xa2\xa4\x9em\xeb\
-\xefQR_\xd3\x81\xbfCII\xd4\xfa7PR\x7f\
-\xee\xf8\x19Jj\xe7\xac\xff\x02J\xea]\xd2\xf47(\
-\x9dY\xed\xefQR\x9ft\xfc\x04%uf\xf6\x7f\x8f\
-R\xa1\xd2Z\xc8\x88\x88\xd7~\xa9s\xe0C\xe2J\xf9\
-\x88\x06P\xa4\x8f\x1c\xa9\xd8K\x5c\x891\xe5\x95d\xa1\
-B\xcc\xf2\xae\xb1'\x9b\xb4\xe7\x01\xa9\x1d\x9bd\xc2\x86\
-dt\xc9\xf5\xcc\xd1\x93'0\x13}v\xf6\xef\xc22\
-C\x17\x0aRF-\xd5\x9d\xc5\xdb\xfeM\x80\xd5\x1f\xd5\
-v5\xc5\x224R\x8b\xf4\xad\x84\xf2\x82s+\x22\x83\
-uM\x04\xf7\xce\x86\xbd\xcd\xb1Z\x91\x9f\x0f\x0a\xdb\x80\
-\xe1a(s\xd3\xd3\xb8\xf2\xb2\xbf-\xb5\x87>\x07F\
-\xb2\xd6\x90\x91\xcfqo\xa3\xca\x8f\xd2{\xdcsT\x89\
-\xb6\xaf\xe3\xaa\x9f\x17\xfc\xf9z\xd5\xcf\x0b\xfe|\xbd\xea\
-\xe7\x05\x7f\xbe^\xf5\x1b\x80\xaf\xebU\xbf\x01\xf8\xba^\
-\xf5\x1b\x80\xaf\xe3\xaa\xdf\x00|]\xaf\xfa\x0d\xc0\xd7\xf5\
-\xaa\xdf\x00|]\xaf\xfa\x0d\xc0\xd7\xf5\xaa\xdf\x00|\x1d\
-W\xfd\x06\xe0\xeb\xb8\xea\x1f\x01\x1c}\xca\x05q*+\
-[d\xca\xa3i9\xca\x8f#F+_\xacCql\
-\xad9O?}\xf1\x16y\xd2\xf2\x9a\xb2\xd70I\xad\
-}e%i\xab\xba\x8fnh9\x95wO\xf2\xab\xc7\
-l\xe7Kn\x91\xdaQ\xd4\xff\x01c\x16\xf9\xaa\xe6\x93\
-\x86\xbd\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\
-\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\
-\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIM\
-E\x07\xe2\x08\x01\x10$)\xb0\xe8\xe67\x00\x00 \x00\
-IDATx\xda\xed}{\x8c]W\xb9\xdf\xb7\xd6\
-^{\x9f\xf1\x8c\xc7O\x06\x13\xdbI:\x98&\x84\x06\
-\x92`\xf2 \x09\x11\x109(5\x94\x9b4\x98\x97*\
-A{-\x91\x90\x1ah\xdd\x82B\x9c\xd4\x06n\x90.\
-\xb7\x89\x00\x095\x8e\x82\xe0\xea\xde\xa6\x0fD\x85J\x11\
-\x89Cte\xc4\xd5\xa5JP\x9a(\x0aq\x03\x1e;\
-\xb5cc;\x19{\x1eg\xbf\xd6\xea\x1fg\xef3\xeb\
-\xec\xd9\x8fsf\xf6z\xec3\xdf/:\xb1\xc7\xe3\xf1\
-\xd9g\xef\xf5\xfd\xd6\xef\xfb\xd6\xf7 B\x08(\x03!\
-\xa4\xf4\xdb\x80@\xe8\x87\xc0[\xd0\xe7\x8d\xaa\xb0o\xb6\
-\x8c\x7f\x9b\xe4\x90\x00\x12\x02B\xa5\xb1\x8b\x9cu\x86d\
-\xb0\x0c\xb0e\x1a\xbe\xfc\x82\x9c\xdf\xe3\xc3A\x0c\xba\xae\
-D\x1f\xbf\xca\xbfG2\xd0H\x00\xb2qS\xe9W\xda\
-\xf1\x16H\xfa+PJI*?*\xdc\x08\x04J\xd4\
-\xee\x1a\x11B\x80H\xfeP$\x90\x8c^~\xf1\x1cR\
- H\x04\x03\x1a\xf4\x001\x80\xac\xf1\xd3\x84@b\x00\
-\xf0\x01\xc0I^\xe9\xf7\xd0%@,U\xee\x8b\x1c\xc9\
-\x9f\xae\xad\xd4\xf8\xe5W\x96\x1cP\x11(\x8c\x01\x10\xd9\
-\xf8\xaf\xbc\xf2\xca\xeb\xaf\xbf\xfe\xfa\x7fN\x08\x09W\xaf\
-^M\x5c\xd7M\x95\x00\xee\xfe\x88\x81\x16h\xfa{!\
-\x04\x07\x80\xc8\xf7\xfd\x99?\xfd\xe9Oo\x9c>}\xfa\
-\xb5#G\x8e\xbc|\xfc\xf8\xf1\xd7\x92\x0d\xc7\xa5\x94\x82\
-\x10\x82;\x8e\xc3=\xcf\xe3\x8e\xe3pJ)\xf7}_\
-\x84a\xc8\xe38FEP\xa3\x0b\x90\xde\xc8tww\
-R\x02\xb8\xe6\x9ak\xae\xb9\xfb\xee\xbb\xf7\x00\x00l\xdd\
-\xba\x15\xc6\xc6\xc6\xf0\xae\x22\x96\xbcC%.@\xf7\x15\
-\xc71\x84a\x08\xa7O\x9f>\xfb\xec\xb3\xcf\xfe\xfa\x99\
-g\x9e\xf9\xf9\xaf~\xf5\xab\xbf;q\xe2\xc4i\xcf\xf3\
-\xc4\xc6\x8d\x1b\xbd5k\xd6\x90V\xab\x153\xc6\xe2\xb9\
-\xb9\xb9xvv6>u\xea\x14\x0f\x82\x80\xa3kP\
-\x7f\x0c\x80\x02\x80\xc3\x18s\xa3(\x22a\x18z33\
-3\x00\x00p\xfe\xfcy\x88\xe3\x18\xef*\xa2\x16\x02\x00\
-\x00\xe0\x9c\x83\x10\x02\xd6\xae]\xbb\xf1\xb6\xdbn\xfb\xf8\
-\x8e\x1d;>~\xf2\xe4\xc9\xe3/\xbe\xf8\xe2\xb3\xbf\xff\
-\xfd\xef\xff\xfe\xf9\xe7\x9f\x7f*\x8e\xe3S\xeb\xd6\xads\
-\x09!|vv\xb6\xfd\xc6\x1bo\xf8\x8c\xb1\xf0\xc4\x89\
-\x13\xb1\xef\xfb\x5cr\x1b\x90\x08\x96A\x00i\x84\x9f\x12\
-B\x1cJ\xa9\x9b(\x01\x17o#b\xa9 \x84T\xfa\
-\xa9\xa9\x12\xf0}\x1f8\xe70>>~\xf1M7\xdd\
-t\xf1\xad\xb7\xde\xfags\xb3\xb3_\xfc?/\xbc\xf0\
-\xf3#G\x8e<}\xfe\xfc\xf9\xe3333\xe7\xc7\xc6\
-\xc6\xe6\xa2(\x9a\x99\x9b\x9b\xf3O\x9d:\x15%\xc6\x0f\
-\x80\xc1\xc2%\x11\xc0\xa2c?Ji\x1a\x03 \x00\xe0\
-\xe12F\xe8DJ\x06\xd3\xd3\xd3\xe08\xce%7\xdd\
-t\xd3\xdd\xef\x7f\xff\xfb\xff\xc5\xb1c\xc7\x9e\x7f\xee\xb9\
-\xe7\x9e8r\xe4\xc8\xff\xf6}\xffOQ\x14\xcd\xce\xcc\
-\xcc\xcc\xcf\xce\xceFI\xec \x1b4\x5c\xf1G\xd5K\
-\x09\x02RJ\xa9#\xc5\x01\x18.I\x84*e@\x08\
-)\x0c$SJ\xa1\xddn\xc3\xab\xaf\xbe*\xb6l\xd9\
-2v\xc5\x15W\xdc\xb4u\xeb\xd6\xed/\xbd\xf4\xd2S\
-\xbf\xfc\xe5/\x1f\xbdp\xe1\xc2\x8b\x13\x13\x13\x22\x8a\xa2\
-\xd0\xf7\xfd\x10\x00\xa2\xc4\xe8e\x22X\xd1j\x80\x0d\xfe\
-\x5cH\xaa\x00R\x02pp\xb9\x22\xea4\xfc\xbc\xd8@\
-J\x04Y2H\xbe&SSS\x22\x8a\x22\xb1n\xdd\
-\xba\x91\xf7\xbe\xf7\xbd\x1f\xdb\xb6m\xdb-\xbf\xfd\xedo\
-\xff\xe7\x8f~\xf4\xa3\xbf\x0a\xc3\xf0\xb5\xe9\xe9ign\
-n.\xe4\x9c\xa7j \x86\xde|\x82\x15\xa9\x06\xe8\x12\
-\x1eP7\x16\x00\x00\x0e!\x04\x09\x00Q\x8b\xd1\x97}\
-O6~\xf9\xef\xa7\x7f\x1e\xc71\x99\x9a\x9a\x22\xedv\
-\x1b8\xe7\xb0z\xf5\xea\xb5\x1f\xf9\xc8G>\xfb\xado\
-}\xeb\x89;\xee\xb8\xe3\x93\x13\x13\x13c\xabV\xadr\
-\x18c-\xe8\xc4\xad\xd2\x18V7\x91\x0dz3Y\x91\
-\x00\x8a\x1eH\xca\xba\xd2\x8dC \xb4\x10\x84\xac\x04d\
-R\xa0\x94B\x18\x86\xf0\x87?\xfc\x01:\x02\x15\xa0\xed\
-\xb7\xe1\xe2\x8b/\xbe\xec\xbe\xfb\xee\xfb\xde\xf7\xbe\xf7\xbd\
-'\xae\xbf\xfe\xfa\xf7q\xce#\xc7q<\xc7qZ\x92\
-\x0bK3k\x99 \x01T<\x93\x95\xca\x98\x08=\x06\
-\x9f\xdd\xf1\xb3\xf2\x9fR\xba\x88\x08\x1c\xc7\x81s\xe7\xce\
-\xc1\xd4\xd4\x14\xb8\xae\x0b\x0eu \x8ec\x08\x82\x00\xb6\
-o\xdf~\xc3\xc3\x0f?\xfc7{\xf6\xec\xd9;11\
-1\x11\xc7\xb1p]w\x84\x10\xe2\xe5\xa8\x01X)k\
-\x9b.\xe7!!\x10\xba\xdc\x00\xf9\x95g\xfc\xe9\x8b1\
-\x06SSS0??\x0f\xae\xeb\x02\xa5\x14(\xa5\xe0\
-\xfb>\xac[\xb7\xee-_\xfb\xda\xd7\xf6\x1d<x\xf0\
-o\xdf\xf9\xcew^\x19\x86a\xaa\x06\xbc\x95\xaa\x06\x06\
-&\x80T^!\x10:\x08\xa1H\x05d\x09!%\x05\
-J)\xc4q\x0c\xc7\x8f\x1f\x07\xc6\x188\x0e\xed~_\
-\x08\x01\xb3\xb3\xb3p\xd5UW]\xf3\xc4\x13O\xfc\xec\
-s\x9f\xfb\xdc\x17\x19c#\x9cs\x9a\xa8\x01\x17\x16\x02\
-\xdb+\x82\x04\xe8R\x1f\x0c\x02\xa1Z\x05\xe4}\x9d5\
-zY\x0d\xa4_3\xc6\xe0\xe8\xd1\xa30==\x0d\xae\
-\xeb\x81\xe38\xdd\xef9\x8e\x03a\x18\xc2\xf8\xf8\xf8\xfa\
-\x03\x07\x0e|\xeb\xf1\xc7\x1f\xff\xcf\x17_|\xf1d\x18\
-\x86\x01c\xacE)-s\x09\x90\x00rb\x01\x08\x84\
-\xf2X@\x9e\xfc\x97\x8d\xdaq\x9c\x9eX@\x1c\xc7\xf0\
-\xea\xab\xafv\xbf\x97\xbeR\x82 \x84@\xbb\xdd\x86\x1b\
-o\xbc\xf1\xe6\x1f\xfe\xf0\x87?\xf9\xc4'>\xf1/\xa3\
-(\x22\x94R\x8f1\x96\x92@\xd6%\x18\xba\xb8\x00\xea\
-yD\xe3b\x01E1\x00Y\x150\xc6\xe0\xcc\x993\
-\x10EQ\x8f\xf1\xcb\xa4\xc1\x18\x03\xdf\xf7\xe1\x92K.\
-\xb9\xf4\xa1\x87\x1ez\xe4K_\xfa\xd2\xbf\x17B\xb08\
-\x8e\xa9\xe7y\xad\x95\xe0\x12 \x01 \x1aC\x08yq\
-\x00\xd9\xa8e\x97\x801\x06sssp\xfa\xf4i\xf0\
-<\xafG)\xc8$\xe0\xba.\x08! \x0cC\xb8\xe7\
-\x9e{\xf6>\xf6\xd8c\xffmrr\xf2\xf2 \x08b\
-\xd7uG\xa4\x00\xe1P\xba\x04H\x00\x88F\xa8\x80l\
-\xf0/\xeb\xffg]\x824X}\xf4\xe8\xd1\x8e[@\
-\x1d\xa0N>\x09t\x82\x85\x9d\xd8\xc0\xcd7\xdf|\xd3\
-\xa3\x8f>\xfa_>\xf0\x81\x0f\xdc\x16\x04AH)\xf5\
-\x86\x99\x04\x90\x00\x10\x8d#\x842\xa3\x97_\x9e\xe7\xc1\
-\xa9S\xa7\xe0\xc2\x85\x0b\xc0\x5c\x06\x0e]\x1c\x0f\x90\x95\
-\x80\xeb\xba\x10\x04\x01l\xd9\xbcy\xeb#\x8f<\xf2\xd7\
-\xbbw\xef\xfe\xb7q\x1c;B\x08\xe6\xban\x9aA8\
-T\xd9\x83H\x00\x88FI\xff\xb2\xc0`\x96\x00\x1c\xc7\
-\x81 \x08\xe0\xf5S\xa7\xc0u\xdd\xdc\xc0a\x96\x04<\
-\xcf\x03.\x04x\x9e\xe7}\xe5+_\xb9\x7f\xff\xfe\xfd\
-\x0f\x8f\x8e\x8e\xae\x8d\xa2\x88\xe4\xc4\x05H\xd3\xe3\x02H\
-\x00\x88\xc6\x12DQ\x000\xfb\xfa\x7f\xaf\xbd\x06\x00\xd0\
-=)\xc8\x92@J\x04\xa9;\xe0y^\xd7%\xb8\xf3\
-\xce;?u\xf0\xe0\xc1\x9fLNN\xfe\xe3 \x08\xb8\
-\xeb\xba#I/\x8c\xa1\x08\x0e\x22\x01 \x1ao\xfce\
-j\x801\x06333\x10\xc718\x0e\xcd=\x0d\xc8\
-\x8b\x090\xe6\x82\xeb2\x88\xa2\x08\xde\xf3\x9e\xf7\x5c\xf5\
-\xedo\x7f\xfb\xb1\xcb/\xbf\xfc\xea \x08\x84\xeb\xba-\
-\xc7q\xf2\x8e\x09\x1bG\x02H\x00\x88F\xba\x01\xf2\x9f\
-eO\x00\xb2\x06\xee\xfb>\x84a\x08\x8e\xc3r\xdd\x84\
-l\x0c\xa1\xe3\x0e0p]\x0f\x5c\xd7\x85(\x8a\xe0\xf2\
-\xcb/\xff'\x8f?\xfe\xf8/n\xbf\xfd\xf6\xbb|\xdf\
-\xf7\x1d\xc7iI\x95\x85\x8dU\x02\xac\xce\x07\x95>\x90\
-\xaa\x16O\x08\x84*\x15\x90g\xe0\xf3\xf3\xf3p\xfe\xfc\
-y\x18\x1f\x1f\x07\xcey\xcf\xbf\xc3\x85\xc8mh\x91-\
->\x0a\xc3\x10\xc6\xc6\xc6Z\xf7\xddw\xdf\xb7GGG\
-\xc7~\xfa\xd3\x9f\xfe\xad\xe38\x84\xb1\x8eJ\x90\x0c?\
-m6\xd2\x88\xfe\x02T\xc7\xc3\x01L\x1fF\xd4\xa0\x02\
-\xca6\x9d<\xf9/\xd7\x06\x9c9s&?F@\x08\
-\x90\x9cx\x00M~\xd6u]p=\xb7\x1bD\x1c\x1b\
-\x1b[\xfb\xe0\x83\x0f~\xe7\xf3\x9f\xff\xfc\xbda\x18\x86\
-\x00\xe0z\x9e\xd7\x82\x86\x1e\x13ji\xe7\xd5\xe9\x1eP\
-q/\x84\xc0\x0e\x8d\x88J2\x90\xd5e\xb6\x1f@6\
-KP\x96\xf5\xe7\xce\x9d\xeb\xfeL'G\x80t\xfe#\
-\x04 \x8eAd\x8a\xdcx\xb2qu\x89\x06Hg!\
-\x07\x1d5\xf0\x85/|\xe1k[\xb6l\xf9G\x0f?\
-\xfc\xf0\xfe\xd9\xd9\xd97=\xcf\x830\x0c\xc3\x8c\xfa\xb5\
-~H\x09\xb3\xe8\xe9\xe6\xd2%\xba\x13\x88*E\x90\xa7\
-\x06\xe4?s\x1c\x07\xa6\xa7\xa7\x81s\x0e\x94P\xe0\xc0\
-\x81R\x00\x0e\x04\xa8\xe8\x18~\xd65X\xb0Y\xda\xb3\
-\x16\xd3U\x1a\x86!\xdd\xb5k\xd7g\x5c\xd7e\x07\x0e\
-\x1c\xf87Q\x14\x81\xe7y$\x08\x02y\xcd\xca\xe3\xcb\
-\xact\x09X\x13\x1f8\xaa\x86\x95\x0dy\x9e`Q\xcb\
-\xb0\xecq\xdf\xec\xec,\xf8\xbe\x0f### b\xd1\
-U\x0d\xd5\x1b\x0c/$\x9bv\xbb\x0d\x1f\xfd\xe8Gw\
-\x8d\x8f\x8f\xaf\x7f\xf0\xc1\x07\xff\xf5\xf4\xf4\xf4\x1b\xadV\
-\xab\x15\x86a\x96P\xac\xedB\xdc\xecS\x80\xbc@\x10\
-\x10,Q\x5ca*\xa0\xaaj0M\x08j\xb7\xdb\x05\
-\x7f7?xXtD\x98f\x0dz\x9e\x07Q\x14\xc1\
-\x87?\xfc\xe1\x1d\xfb\xf6\xed\xfb\xcb\xf1\xf1\xf1ua\x18\
-R\xd7u\xe5\x84!\xab\xdb\xe6\x0d\xdf1 ) \x06\
-\x0cH\x0e%\x11\xf4\x9b1\x18E\x11\xcc\xcd\xcd\xf5\xfe\
-=\xdayQ\xea\xe4\x16\x14U\xa5\x0d\xbb\xae\x0b\xadV\
-\x0b\x82 \x80[o\xbd\xf5c\xdf\xff\xfe\xf7\xff\xeb\x86\
-\x0d\x1b\xde\xe6\xfb>\xf1<\xafU\x900D\x90\x00\x8c\
-\xf3\x03)l.\x89h\x98\x1bX \xff\xb3j@\x08\
-\xb1\x98\x00\x80\x00\x01ZZUXTk \xab\x80T\
-\x09\x5c}\xf5\xd5W\xed\xdb\xb7\xef;\x1b7n\xbc(\
-\x08\x02\xc7u]\x8f\x10bu\xc6 \xab\xfb\xe14\xb9\
-\xb9z\xfeB\x13\x00\x82\x00F\x1b\xecyFE~{\
-Y\xbf\x00\x00\xe8!\x80\x85\xd5\xca\xbb\xbf\xef\xb6\xbb#\
-\xd2|\x02\xce\x01\x92\x14\xe2\xec\x1aI\x8f\x06S\x04A\
-\x00\x1f\xfc\xe0\x07w\xac]\xbb\xf6\x87\xf7\xde{\xef\xa7\
-fff\xceK1\x01\x91\x09,Xa*\xb4\xce\x07\
-C\xa4\xa3\x93\xe1\xd9YIwA\xe4\xc5\x1b\x10v\xb9\
-\x01\x00\x8b\x83\x84\xe9\xf7\x83 \xc8\xfc\x5c\xf2k\xba9\
-\xa7;>I^\x0e\x05\xea8@\x88\xac\x02\x16\xd7\x0e\
-\xc8j \x0cC\xb8\xfa\xea\xab\xde\xbb\x7f\xff\xfeG\xd6\
-\xaf_?\x11\x86\xa1#\xc5\x04\xac\xcb\x13`\xba\x1e\x12\
-\xe4\xef\xad\x1d\x1al\xeaQ\x1f\x81R\x12\xc0#L}\
-\xeb)/\x00\x98\xfds)c\xaf\xf7\xdf!\x00T\x00\
-\x08\x91\x1c\xfcQ\x0a\x82\x08\x00\x0e\xc0\xa13\x9d\x98\x0b\
-\xba\xb0[&?\xc6y\x0c\xf2`\xac\xf4}|\xdf\x87\
-\x1d;v\xfc\xd3\xf1\xf1\xf1u{\xf6\xec\xf9L\x10\x04\
-\xedV\xab\xe5\x05A\x90=\x1d0\xae\x04\xa8a\xfb\xa9\
-\x08\xde\x0c\xc7\xee\x84\xc1H\xbd\x0a \x8f$\xd2\x8c\xc0\
-\xdc\xbfG2\x8a \xaf\xe7\xa0|B \xa9\x81<%\
-\x90\x06\x06\xaf\xbd\xf6\xda\x1b\xbf\xfe\xf5\xaf\x7fg\xf5\xea\
-\xd5\x1b\x82 `I\xafA\xabJ\x89-\xcf\x03\xc8'\
-\x01\xd1\xd9^\x9b\xeeX\x14\x90\x80\x00!V\xfc\xd0\xda\
-Z\xd4A\xd6\x05\xc8O\xf6\xe9\xa88\x01\x02\x08\xa1\x8b\
-\xee{^\x1b\xfc\x85\xc1X9d$}\x1d\x04\x01\xdc\
-y\xe7\x9dwEQ\x14\xef\xdf\xbf\x7fO\x1c\xc7\xae\xe7\
-y\x22\x0cC\x10\x0b\xf2\xd0\xe8lB6\x5c\xc63\x0c\
-\xd2\x9b\x14.\xb0\x0e9\xa0\x91W\x19\x7fQ\x0c\xaal\
-]\xc8\xd3\x88\xe5u\xc6sH\x80s\x00\xeapH\xc7\
-b\xca?\xc3\x5c\xb7gm\xb6\xdbm\xf8g\x1f\xff\xf8\
-'/\x5c\xb8p\xee\x07?\xf8\xc1_\x86a\x08\x8c1\
-\x08\xc30\x1b\x144B\x02l\x98\x17\xc2\xb0\xa9\x86B\
-E$`\xc5+\x86~\xba\x09\xf7\xf5oH\x03\xc3E\
-\xfa\xb3\x9c\x03d\x95\x00\x07\x10T\x14^\x87L6a\
-\x18\xc2\xee\xdd\xbb\xef\x8e\xa2(\xfc\xeew\xbf\xbb\xdf\xf3\
-<\xcfu]\xd1\xa9%2K\x02+\xa6\x1c\xb8\x5c5\
-$\x87|M\x8dE\x92\x127rH\xd2\xa5\xfb]W\
-Y\x17`\xd0\x9f\xcf\x0d\xec\x12\x024G]\xc4q\xdc\
-U\x07\xe9\xcf\xc8n\x86L<\xedv\x1b>\xfb\xd9\xcf\
-\xde\xf3\xe6\x9bo\xbe\xf1\xe3\x1f\xff\xf8?y\x9e\xd7r\
-]7U\x02\xc6\xdc\x01\xa6\xeaa5k\x07N\x1e\x1f\
-\x19B\x03\x22\xc5\xe7\x14xJ\xd1\xcf\x1a\x16 \x08\x05\
-\x10\x1c(\xa5\xc09\x97*\x0a3q\x05Rn\x07\x84\
-\x10\xb6w\xef\xde\x07O\x9c8q\xfc\xd0\xa1C\xff\xa3\
-\xd5jy\x8e\xe3\x88$8\x19IF\xdf,\x05P\xcb\
-\x0e,\x9ag@M\x97\xdfe\xb2X\x80\x18:\xafb\
-\xd0\x9c\x94\xaeK@\x05\x10\xd1\xc9&L\x0d?\x8f<\
-\xf3\xfe}9Y(\x0cC\x88\xe3\x18\xf6\xed\xdb\xf7W\
-\xbe\xef\xcf\x1d>|\xf8\xe9V\xab\xd5\x02\x00\x11\xc7q\
-\xaa\x04\xb4\xaa\x00KR\x81\x9b{TF\x08\x0ceJ\
-1\x81\xe1H\x97.r\x09\x06\xf9y\x22\x05f\xcb\xba\
-\x10SJr\xa7\x10\xc9G\x84\x94R\xd8\xb8q\xe3\xda\
-\x03\x07\x0e<299\xf9N\xdf\xf7\x811\xe6%u\
-\x03\xdaS\x86\xa9\xdd\x8b\xb0<G\xc0\xd6\x05Y\xde\xc6\
-\xba\xf9\xbbh\xe1\xcb2\xa3\xaf\x1a6:\xe8g\xa6\xb4\
-\xbc\x0b\xb1\x9c1\x98%\x02\xd7u\xc1s;u\x03\x00\
-\x00\x9b6mz\xeb7\xbe\xf1\x8d\xff\xb8~\xfd\xfa\x89\
-\xa4n \x9b-\xa8\x85\x04\x1a\x5c\x0cT\x5c\xfca\xfd\
-\xde\x9a\xabv\x86Bc\x97\x90\xb5\xb9\x8f\x98\xae\x09\xc7\
-qj_oE\x05D\x8b[\x8eS`n\xa7\xe5\xb8\
-\xeb\xba\xc09\x87\xeb\xae\xbbn\xfb\x03\x0f<\xf0\x17\x94\
-R/\x8ec\xc6\x18\xd3\xden\x9c\xd6u\x83\xbb\x92\xdd\
-\x02\x03,\xcd\xc0k\x98\xe4\xb6mw]\x86\x96\xcb\xaf\
-\x13Q\xf4L\xf2v\xff\xbc\xa4\x9e\xc1\xdd\x81\xcc\xfa\xa2\
-\xf9S\x8a\x17\xb7\x1dwz\xe6\x0e\xa4u\x03;w\xee\
-\xfc\xd8\xbf\xfa\xf3?\xffB\x14E\x11!\xa4\xe5\xban\
-V\x05(}\xf4L\xc1c.|\xa86D\x9d+\x03\
-_\xb6\xc6\xf4*\x83\x91\xa2\xb1\xd4P\x9a\xd4\xd5\xf9p\
-\x03\x11i\xee\xe6\x04\x00\x8c\xb1\x9a\x9f\x03\x01\x10\x1c\x08\
-M\xcf\xfeywO-\xca:\xcc\xae\xc18\x8e\xe1\xde\
-/~q\xef\xeb'O\x9e\xfc\xd9\xcf~\xf6\xdf\x93>\
-\x02<\xf9y\xe5AA\xaa\xdb\xf8l\xee\xe0C\xa4F\
-\x91M\x0b~\x0dk\xbd\x01)t\xf3H\xae\xcf\x9f\x92\
-xQD\xbeF>\x06B\x92f\xa4@zb\x00E\
-\xdd\x85\x16\xf7\x13\xe8L \x1a\x19\x19q\x1fx\xe0\x81\
-o^z\xe9\xa5\xefH\x06\x8fh\xeb#@-y\xc2\
-%\xd2\x97Xk`\xf6\xbb\x15e\xcdO\x9a\x1dw\xc8\
-;}\x91\xc9;\xfb\xcc(\xa5022R{,\x07\
-\x00:\x0a !\x83\xdc\xe0`a`\x90u\x83\x82\x1b\
-6lX\xb3o\xdf\xbe\xff\xb0f\xcd\x9a\xb7\x84a\xc8\
-\x5c\xd7M\x0b\x87\xb2\x93\x87VX\x10\x90T\xef\x00\xb6\
-\x92\x83\xcd\x06FHI\xdc\xa1\xc1r!\xb7\x1e \x09\
-\xc2\x8d\x8e\x8e*s)\x09\xa1=\xef\x97\x9d=\x90?\
-\xc1x\xa1\x8a0\x8a\x22\xb8\xfd\xf6\xdb?\xbcw\xef\xde\
-\x7f\x97\xe8\xff\x96\x14\x14T\xa6\x02\x1a{\x0a@H\xc5\
-\xeefy`\xcf\xf6\x9b\xdb\xb42\xe6\xb2\x96`\x04\x00\
-\x18skV\x00\xc5\xc1AZq:\xc0\x18\xeb\x90\x81\
-\xd3;\x95\xb8\xddn\xc3]w\xdd\xf5\xa9\x0f}\xe8C\
-\xb7\x05A\xc0\x1d\xc7iQJ\x95\x0e\x1c\xa1\xb5|x\
-\xcb\x16x19\x80=\xe4\xd0\xd0<\x81B\x9f\x9c\xd8\
-E\x06\xd9\xe6 \x9e\xe7)#\x00\xf9=\x8b\xf2\x00\xf2\
-z\x0c:\x99F\xa3\x8e\xe3\xc0\xea\xd5c\xado~\xf3\
-\x9b\xdf\xd8\xbcy\xf3%\xbe\xef\xd3\xcc\xd1`\xed\xbb\x1b\
-SyC\x8a`\xae.\xa0\x9c\x04\xec\x88\xa4\x97\x93\x80\
-\xad\xd1~R\x11SPu\xdde\x0dA\xe5\xde\x80\xab\
-V\xad\xca%\x808\x8e!\x08\x02\x98\x9b\x9b\x13\xb3\xb3\
-\xb3033C\xce\x9f?/\xe6\xe7\xe7\x89\xef\xfb\x10\
-E\x11p\xce\xbb\xaf\x14\xe9q_*\xe1GGGa\
-l\xf5jX3>\x0e\xe3\xe3\xe3\xb0z\xf5jh\xb5\
-Z]\x1f\x9fs\xdeI\x05\x8e\xe2\xc2\xcf\x92\x14\x07\xc1\
-\xdb\xdf\xfe\xf6K\xef\xbf\xff\xfe\xaf\xdfs\xcf=\xf7\x0a\
-!\x08c\x8cGQ\x94\xce\x1c\xacu\xc6\x003\xb3X\
-\x00\x8a\xeaZM.\xef\xc2\x22&\x8b\xf2\xe2IA\x87\
-\x14A\xec\xce\xdd'5\x1e\x0d\xe7U\xf6\x15\x05\xfe\xd2\
-\xd7\xaaU\xab`~~\x1e^\x7f\xfdu8w\xee\x1c\
-\x9c={\x16\xce\x9c9\x03\xd3\xd3\xd3\xe2\xc2\x85\x0bd\
-nn\x8e\xcc\xcf\xcfC\x10\x04\x10E\x11\xc9\x1a|\xbf\
-D\xe48\x0ex\x9e\x07ccc\xb0v\xedZ\xd8\xb4\
-i\x13l\xdd\xb2\x15.\xda|\x11\xac_\xbf\x1eFF\
-F`\xc4\x1b\x01\x01\x02\x02?($\x81\x9d;w\xee\
-\xdc\xb1c\xc7O\x9ez\xea\xa9_\xb6Z-\x8f'\x90\
-\x08\xa0\x16\x12`\x96\xad\x92J}\xa3{\x07$\xdd\xe8\
-\x92\xc5;2)\xdf\x81m.\xec\xa9\xab \xa9\xc8\xf0\
-Sy=??\x0f\x87\x0e\x1d\x82\x0b\x17.@\xbb\xdd\
-\x86tw\x8f\xe3\x98\xc4q\x0c\x84\x10\x18\x19\x19\x01\xcf\
-\xf3:=\x00\x13\xe3\x1f\xf4\xf9\xa6?;;;\x0b\x17\
-.\x5c\x80\xa9\xa9)\xf8\x07\xf1\x0f]R\x18\x1f\x1f\x87\
-M\x9b6\xc1\xb6m\xdb`rr\x12\xd6\xacY\x03a\
-\x18v_]\xdf\x9cR\xfa\xd0C\x0f\xfd\xc5\xd4\xd4\xd4\
-\xd4+\xaf\xbc\xf2\x8a\xeb\xba.\xef4!LI\x807\
-V\x01\xd4\xb9`\x04\x00t6?a\xd7\x026xM\
-\xfd\xcas\xdb\x93\x87\xca\xae;\xaf\xc8\xa7\x88\x04\xd2\x11\
-\xde\xa9\x12HI!\x0cC\x88\xa2\xa8[\xa5\x17\xc71\
-p\xdei\x02*\xbf\x06Q\x22\xf2\xd7\xe9\xefSR\x08\
-\x82\x00N\x9f>\x0d'N\x9c\x80\xdf\xfd\xeew\xb0a\
-\xc3\x06\xb8\xec\xb2\xcb\xe0\x8a+\xae\x80\x8d\x1b7\xc2\xaa\
-U\xab@v;\xb6m\xdb\xb6y\xf7\xee\xdd\x9f\xff\xea\
-W\xbfz?\xa5\x948\x8e\x13\xc5q\x5c\xab\x0a`u\
-\x1aBn\x8bf\xc5\xfe>\x91w\xc0\x5cF\x060\xb2\
-\xfd\x95u\x0c\xb6\x84\x1cHC\xdb\xaa\xf5\xb4\xf9\x02\xe8\
-\x1c\xbb\x09\x01\x5c\x08 \x9c/R\x00\x9cs`\x8c-\
-2j\x99(8\xe7\xb9\x040(d\xa3O\x7f\x95\xff\
--\xf9\xdf\xf7}\x1f\x9e{\xee9x\xfe\xf9\xe7a\xed\
-\xda\xb5\xb0}\xfbvx\xd7\xbb\xde\x05###\x10\x04\
-\x01\xf8\xbe\x0f\xbbv\xed\xfa\xe4\x93O>\xf9\xbf\x0e\x1f\
->\xfc\xf7\x8c1\x8fs\x1e\x8bN\xca\xa1L\x02\xf6*\
-\x80\xd2TO\x0d\x86\x90\x1f\xf43\xdcx\xb3\x94\xb0\x84\
-uFf39\xc8\x9d\xa5)! \x92)@\x8e\xe3\
-\x00\x8f\x17\x0c\x9fs\xde\xb1\x16\x01=\xc6\x9fF\xebc\
-\x1e\x03\x8f\xfb\xdf\xfd\x97B\x00\xd9\x17\xe7\x1cV\xadZ\
-\x05\x9cs\x98\x9b\x9b\x83g\x9ey\x06^~\xf9e\xb8\
-\xe1\x86\x1b\xe0\xa2\x8b.\x02\x87RX\xb3fM\xeb\xcb\
-_\xfe\xf2\x9e#G\x8e\xfc\xfe\xec\xd9\xb3\xe7\xe28\x8e\
-\xa4\x80\xe0\xb2\xd3\x84\x99\xe9\xa7\x97g\x08\xa2\xf7\x7fj\
-\xc4eE\x1b-C\xba\xa1\x11\xd3\x90M\xb9=\xb2\xe4\
-\x96\x9bx\xa6\xbff\x8f\xe28\xe3I\x1cA\xda\xf5\x01\
-\xbau\xfbi\x83\xce\xac\xfc/\xf3\xff\xfb\x09f\xf6c\
-\xfc]R\xca|===\x0d\xbf\xf8\xc5/`\xeb\xd6\
-\xad\xe2\x96[n\x81\xd5\x8eCn\xb9\xe5\x96\x1b?\xfd\
-\xe9O\xef:x\xf0\xe0\xa3\x9c\xf3V\xd4\x19p\x10C\
-\xe7\x18\x7fY*\xc0\xca\x18\x00\xe9\xfd\x9f\xfe\xa0\x16!\
-PB\x0f\xe6v@\xdb\x0b\x82\xaa\x06\xa5(~n\xe9\
-\x0c\xc0\x94\x10\x1c\xc7\xe9~\xed\x02,\x92\xfd\x8e\xe3\xf4\
-\x18\xff\x22\xff?s\xbdU\xf9-Y\x12\xa82|\xf9\
-\xfd\xb2\xbf?}\xfa4y\xf2\xc9'\xc5\xb5\xd7^+\
-\xde\xf1\x8ew\x90\x9d;w~\xf4\xd0\xa1C??v\
-\xec\xd8\xc9 \x08\x820\x0c\xe3:T@\xadMA\x8d\
-\x07\x87\x14\xc7\x1b\xaaw\x01S\xba\xa1\xf8\xbaljY\
-Vw02\xb7\x95\xb74\x0c4\xcf\x07\x97\x09@6\
-\xfc~v\xff\xa5\xca\xff\xac\xef\x9fG\x02\xd9kH\xe2\
-\x00\xe47\xbf\xf9\x0d\xf8\xbe\xcf\xb7o\xdf\xfe\xee;\xee\
-\xb8\xe3\xcf\x0e\x1e<\xf8X\x18\x86#o\xbe\xf9f\x94\
-\x9c\x0a\x10\xe3.@6\x0akjg2=/\xa04\
-\xc9H\x139\x0drM\xb6\xf4b,\xdf@\xb2\xd7\xb8\
-\xb0\xd6\xf3~.\xdb\xb3/M\xd8\x91\xdd\x838\x8e\xbb\
-\xbb\x7f\xee\xce\xbf\xe4\x9b\xd2\xb9\xd6\x94tE2kL\
-@\x8e\xdc\x17\x1c\x04\xe7\xc0y\xe7\xeb8\x8e\x17\x11B\
-\xab\xd5\x828\x8e\xe1\x85\x17^ \x9e\xe7\xc1\xae]\xbb\
->s\xf8\xf0\xe1\xbf{\xf1\xc5\x17_\x9e\x9f\x9f\xf7\xe7\
-\xe7\xe7#X\x98n\x1a/\x85\x08\x0c\xcf\x06\xd4{>\
-]\x98D\xa3\xe1\x22\xca'\x01\x19\xdc\x93m\xceo\xc8\
-\xbdF\x916\xec/\xf4\xd1\xe5\xe6\x1f\xb2BH[y\
-\xa7\xdfg\x8c\x0dL\x00\xfd\x06G\xe5\x7fG\x08\x01\x82\
-\xf3\x84\x08\xc4\xa2\x1d_\xfe:O\x8d\xc4qL^z\
-\xe9%q\xf3\xcd7o\xbe\xe1\x86\x1b\xae\xfb\xe3\x1f\xff\
-x\xd4\xef \x94r\x03\xcc\xb9\x00uKB\xad\xd2\xd5\
-\xf8\x80O;S\x7fm\xed\x18\xdc\xa9\xf9\xef5\xf6\xb4\
-U\xf7\x82\xff\xdf\xfb3\x1dC\x22\x8b\x8e\x06\xf3\x0c?\
-+\xe3\x8b\xeeG\xd1\xc4\xa1\xaa` O\xc9 G\xfe\
-\xe7\x11@\xfas\x09\x09\xc0\xf6\xed\xdbo}\xfa\xe9\xa7\
-\x9fi\xb7\xdb\xfe\xe8\xe8h{ff&L\x82\x81K\
-\x8a\x05X\x9b\x08T$]\xadP\x0d:\xdd\x1a\x0b\xbb\
-+\xe5\x12\xb7\x90\xd2\xa6u\x90\x80\xf4\xf9;\xf7H\x1a\
-\xe9\x03\x14\x1c\xa7W\xf2\x13\xc2A\x88\x85\xc15yF\
-Vd\xc8\x83\xc4\xb9\x8a\x12\x83\xaa\x02\x81\xb2\xe1w\xdc\
-\x01\xde\xa3\x16\x00\x00\xe6\xe7\xe7\xe1mo{\xdb\xfb\xde\
-\xfd\xeew_y\xf2\xe4\xc9\xd3###\xee\xcc\xcc\x8c\
-#\xc9\x7f\xfd.@\xcf\x8dYV8b\xf9\xaaA'\
-A\x94\x1f\xd7\xe9\xc8o\xb0\xec\x9c\x9eHi\xd3\x9a\xe3\
-\x0d\x1d\xa3\xee\xbc\x87|_\xe4``\xe7\xf7\x1c8\xa7\
-=F\x98'\xd7\xeb \xe4~\xf2\x01\xf2N\x01\xbaD\
-\xc0\x05\xc4<\xee\xb9N\xd7u\xe1\xec\xd9\xb3\xde\x95W\
-^y\xeb\xaf\x7f\xfd\xeb\xdf\xcc\xcd\xcdy\x8e\xe38q\
-\x1cg\x1b\x86\xf4m\x85\xacn\xe3\xcc7P}~n\
-q\xa4Y\x93KQ\xe2V\x08!\xb4L{ \xc4\xc6\
-\xc1\xa2\xf5Nz\xceW\x01\xf9i\xc2\x0b\xbb>\x01B\
-\x16\x0c\xb0p\xc8\xc72\x09\xbc\xc8\x0dX\xe4\x0e\x14\x10\
-@\xde\xa9@\xfa\xeb\xfc\xfc<\x8c\x8f\x8f_711\
-\xf1\xd63g\xce\xbc\xe98\x0e\x8b\xe38\xcd\x0b\x10\xc9\
-\xaf\xb6\xc5\x00\xcc\xfb\xb9\xe5e\xc0\xfa\xa4k\xc9U(\
-6\xd0\xaag\x00@\x0c$(/\xe7\xe4\xa6_\x12H\
-\x91\xe6\x05d\x0d\xb1\x8eu\x98\xf7\xb3y\xc6_E\x06\
-E\x86\x9f\x04\x03\xa1\xd5j\xc1\xdc\xdc\xdcE\xe3\xe3\xe3\
-\x97s\xce\xff/\xa5\x94QJ\x1d\xce9\x19t\xf7\xb7\
-&\x06`z\xc7*\x8c7h\xdd2\xcb\x0cT\xfd\xbd\
-\xe8N\xbe\xb1L9TI\xeeA\x94\x80\xfcg\xcb1\
-\xfeE\xeb%\xa3\x18zTM\x92\xbd)\x1f\x0d\xe6\x11\
-@\x1a\x98\xcc\x9e\x0a\xc8D\x90\x9e\x5cx\x9e\x07\xa3\xa3\
-\xa3\x97\x84aH\x84\x10\xccq\x1c\xca9_R\xdf@\
-\x8b\xab\x01\xabw,0\xe8g\xeb5\x0c\x93\xc7u\xf6\
-\x9fR\x10Y\xbb$\xb1\xc0\xdeS\x01\x92\xeb*\x0a\xa2\
-\xf6\xda\x8b\xe2\x02\xd9\xd8\x83\xec\x92t~\xcfA\x08'\
-\xd7MH\xc7\x8bMNN\xbe/\x8a\x22O\x08\x11\x10\
-B\xe4\x96a\x03\x9d\x06(K\x04R\x1d\x8c+\xcf\xe5\
-\xd7q\xb6o\x87a\x98\xae\x1d(\x0fFj\x8a\xbb$\
-1\x17\xd1\xf1c\xba:FV\x07\xdd\xba\x81n\x1eA\
-zi\xea\xa22\xd9\xa3\xc2\xbc\x91e\x8b\x02\x83\xd21\
-a/)\x88nU#\x00\xc0\xe4\xe4\xe4ek\xd6\xac\
-y\xcb\xf9\xf3\xe7\xe7\x18c\x0e!\x84\x8aN\x85\xdb@\
-\xa1x\xa6\xd0<\xcc\xd5\xa0[Pmg\xc5\xf1]Q\
-\xed\x80\xae\xe4\xa7\x22\x92V\xf4\xfeU\x9d\x82:A\xd8\
-\x85u\xb9\xf0w\x89\xd6 q\x9e\x9b\xd25x!@\
-H\xa3\xc7\x17\x92\x88`\x81\x00\x08\xc0\xc4\xc4\xc4['\
-&&.:v\xec\xd81\x00\x90\x09\xc0n\x17`\x90\
-\x82\x0a\xad\x86)\xfbm\xc6vL\xb3\xa7\x14\xda\x5c\x9b\
-\x8a\xe4\xab\xe5(\x17\xd9\xa0\xaa\xee}\xaf!B\xdf.\
-t]m\xcc\xf2\xbe\x9f\x8dg\x88\x84\x10\xe4\x02'J\
-(\x8c\x8e\x8e\x92\xc9\xc9\xc9\xcd\xcf>\xfb,\x10B\x1c\
-J)I\x02\x81\xc4j\x02X\x92\x81\xe8\x90\xb2\x0b[\
-\x96\x85r\xde\x92x\x83\xae$\xac\x02\xe52X\xa0\x8e\
-\xf4\xfd3\x83\x16\xb3\x15e\x01.\x97\x04\xb2\x7fG\xae\
-fL\x15A\xda\xbf i1\xb6!\xf5\xfd\x09!\xe6\
-\x82\x80\xf2H&\xadRV\x93\xa45\xdf\xe1\xd8\xec\x09\
-A\x95[gC\xbc\xa1\xe8\xfd\x17u\xa8\xaa\xf9f\x15\
-\xf7F\xa8\xbe\x9e\x22\x92*:\xd9\x00\x80n\xa7\xe3\xa4\
-\xe5x+\x87\x00\xe4\x18@e,\x80\xd5\xb98\x16U\
-\x03\xeaJ\x0f-I\xbc\xd1\xa0\xa6s\x95\x83\xbe\x94e\
-RTc\xa4\xf7T\xbfh\xd7\xd6\xe4Z\xe5\xbf\xffb\
-r,\xadV-<\x0a]b\x00$\xf7sW_S\
-\xe1\xc9\x85T\xca\x9c\xd8ZwlX\xf25\x19t\xcd\
-3\xf5\x86Y\xe2[)\xde5L\xc6\x1bL\xf5\xc9\xef\
-\xd7\xcf^\x19%\xda\x15\x83V\x92\xf5G4\x8d(_\
-\xb8#\xa2T\xfe/(\x00\x01\xd9!\xa8\x99W2\xa7\
-\x85\x10!\x04M~\xaeA1\x00\xc3\xbb\x0618\x9b\
-\x80\x10\xb3\x85N\xb6\x14\x19\x19M\x02+<%\xd1\xbb\
-1\xe5\xc9\xfd\xbc\x84%Jh\xcf\xc0\x93\x8c\xe4_\xc4\
-\xbbZ\x08`a\x16_}\xb7\xac|\xd7P\xbc8*\
-\xe3\x0dBe\xa7B\xb3\xaa\x01l\x99\xe8T\x91c\xa1\
-\xa1%\x5ci1\xb4Pw\xcf\xf3\xe2\x01\xe9\xf79\xf0\
-\x9e\x11c\xa9\x02\x10B\x90\xe4\xcf\xc8 \xc3LjS\
-\x00\xdd4\xd2\xdc\x18\x80\xd0\xb78t\xf8\xbd9\x8bc\
-\xe1\x99\x19:\xc2\xb4@\xce\xebT\x0e\xc5\xe5\xc8\xe6\xc8\
-I,\x0c\xa8\xa8\xe5\x19\x975;)h\xc1\xbf$?\
-FC\x0c@c\xa6Xi/~\x85;7)\x7f\x06\
-\xea\xb3\x22-\xf0\xf5M_\x83\xc2\xdc\x82A6\xc1\xba\
-\x1a\xdcT\x1dc\xf6s\x9a`}\x0c@k\x0f\xbd\x12\
-Y\xa7:\x0b\xcc\xe4\xd8\xae\xea@\xa89\xe5\xa23\xe6\
-\xa2[\xd6\x0f\xb2\xd6\xcb\xde\xbf\x8f\xdc\x01\xd2\xef\xb3\xb6\
-\x8e\x00\x96\x227U\xf8\xa1\xc5\x0fG\xc3\xc2(\xecp\
-\xac\xab\xb1\xc9\xe2\xcf\xaeu j\x0dI?\xea\xdcJ\
-]9\x16E\xbd\x12:\xcf\xa0_\xc3N\xfb\x1b\x18\x88\
-\x01\xe4t\x05V\x95\xef]\xe2\x87\xd6\xbf\xa3U\x05\xa3\
-@YP\xac< \xa8va\x96\x0eD\xd5VG`\
-CO\xc2\xb2*L\x0d\xca)\xe7\x19\xc8#\xcf\xeb8\
-\xbed*WQ\xf1\xd4\x1f\x95Y{\xfav\xf3B\x95\
-b03\xd0d~\x81\xbe`\xa4\xf9i\xcde\xebL\
-\x07?\xd5\x95\xbb\xa0\xbf\x18\xa8d\x07WK\x0ee9\
-\xee\xf5\xbeoU@Le[0R~Db.\xf1\
-\xca\xb4r\x10]\xed\xa0~\x85\x97gL\xf78Z\xa6\
-aU\x0c\xc0\xd41\x93\xcet\xde\xa2\xb6`\xea%e\
-\xf1\xc2\xd4R\x0a[\xa4\x1c\xb4\x05\x01\xbb\xda\xc1h\xbc\
-\xa1\xe8\xc4\xc8\xd4\x04\xa7\xda\xba\x02w|\x92\x92\x14h\
-\xa5\xbb\x8b\x9aE\xa4\xb3\x03\xb1\xc9\x09>F\xfb%\x96\
-E\xe7m\x887\x18w)\x92\xfb@\xd4<\x07V\xb7\
-\xc9\xe4Im\xe5\x19d\x85\xc99\xfa\x834j>\xab\
-\xb9\x82\x9frr0\x15o\xd0\xd9/\x92\x18t'z\
-\xc4\x1b\xe4&\xdb5\xc1\x05(\x97\xf6j\x0c\xb5\xaa\xc1\
-\x83P\x16\xbd\x07\x00]j\xc5\xf04^s\xfd\x0b\x0c\
-\xb7c\xeb\xa3j\xd0\x9e\xd1j\x96\xc7\x00J'\x00)\
-\xdc\xc4\x8dM\xf8\xd5x\xeemn\x8a\xb2\xd9\x12e\x1b\
-\xe6\x22\x98\x1c\x92k\x80\x00\x88\x9a\xc5[\xea\x16+\xf2\
-\xfb\x0d\xf9\xe2:\x8bp\xaa\x8a\xad\x94\x09\x07R\xb9o\
-*4R\xc3\x05F`K\xa1\x95\x02\x02H?\x97\xce\
-\xae\xc0E\x0d \xd4\xbem\xbd\xd3m\xeaq\xa1\x84\x0a\
-+\xcd\xab\xb51\xd8\xf9\xc8\x5cF\xa6\xf9\xe9\xd1j?\
-\xbf\xf6\xae\xc0j\xa5v\xf9\x19\xac\xba\xd3\x020\xd6\xf4\
-B\x97\x1f\xae5\xb61\xc8\xee\xad\xda@\xadh\xacB\
-\x16m\xb2\xf6g\x02.Cj\x0bu:\xbb\x22p\xa3\
-\xc6\xff7S\x0cS\xd1\x0d\xa7\xee]\xc5\xd4q^Y\
-f\xa2\x06\xd5b\xba\xcbtc\x09\xc0\x86]\xad_R\
-R\xea\xce\x18\xeb\xdd_T\xd7.\xf4\x19\xa9\xea\x12]\
-\xad\xae\xd3\x00\x8aIw\xbfF\xf51\x80\x85\xec\xb6N\
-\x87`U\xecW\xde\x1dW\x95\x9d\x1a\xc9=/\xdd\xd9\
-\xd2\xcc\x10\xcdj\xa5\xee\xcf[J~PK\x83\x0d+\
->\xe7 n\x85\xd0K\x0d\xb5*\x00Q\xc5~\x8a\xfd\
-\xc4|;U\xad\x1a\xf4\x1f9-\x10\x92\xfe\xa3\xa6\xfc\
-\xe3\xad\x9a]'RP\x91($\x024\xa1Bu\x18\
-'!@\x9aJ\x00\xcb\xf9pfT\x83*\x831X\
-Fl`\xa0\xa9\xb6\xa3S\x22\x11\xa0\x91\x9d\xdbL\x0c\
-)\xfb|\xeb\xcc\x06\xb4&\x06\xa0\xb3\x01H\x7fA\x1c\
-\x85\xf2\xd3\x98oj\xe2\x18So\xe9\xb2\xc9\xbe\x89v\
-\x8c\x99\xd7L\x00)\x1b\x89L\x0fs-\xc1\x14\x85\xb2\
-\x8c\xd4\xd8\xdf\xad\xae\x1d\x5c\xd9)E\xe9=6\x93\xfc\
-T\xf7s5\xd9\x96\xcc\x8ay\x90\xaa\x15\x00\x81\xb4\x1a\
-\x90X\xe03\x09\x10B\xe5\xd8gS\xfew\xce\xfb\x1a\
-:-0\xd7\x9e]\xc1\xfb\x16\xa6g\xeb\x91\xf4y\x92\
-L\xcbD-\xe5.@\x1f\x01\x0d\xb5>\xb8^\xe65\
-\xb2\xcb\x18\xeb\x86\xdb\xdf\xd4\x1d\xad\xef[\xbbj\xd0\x14\
-\xdb\xc8}\xa6\x8b\xdf\xbbR\x0d71\x06`jB\xce\
-\xa2\xe9,\x90\x9e:iNBR\x9e\xc9ff\xfaM\
-\xf1\xd4'\xfd9\x15j\xde\xb3\xa8\xe0I\xdd\xde-;\
-\xd9Ve\x02\xf63\xf6\xb8.\xff[\xd9\xee]\xb9\x9b\
-\x0aP\x97\xbdl\xc0G$f\xcaY\xcd<[\x8d\xef\
-IJ\xa7aZ\x17\x10\xac/\x06Pv<\xa11\xa0\
-\xa3\xf48\xb1\xe4\xc9\x8a!:\xd6\xab\xbc\xc7CP\xdb\
-\xd0\xff=\xae\xf7\xf3\xda\x16\x10\xd4\xe3\x02\xe4\xed6\x9a\
-\xdb\x86+\x1f\xfea$q\xc4L\x80\xce\xc4\xd1i\xe9\
-H.\x18\x82\xe4'0\xd3\xd0\xd5\x5c\x0c@s\xf0\xca\
-H\xdf;b\xaak\x8c\x99\x8e9\xa5R[\x15\xe1\x9b\
-\xea\xfc\xa4\xf5}\x17\xb2\x5c\x876\x11\xa8\xef\x80\x8e\x12\
-\xe6-#\x07\x03rWq`\xd0H\xb2\x8c\xa1y\x02\
-\xc4@rY\xb1\x22\xb4\xa7\x08Hi\x0c@i\x16]\
-\x05\xf3j\x8b7\xa8\x94\xf7\x86\x02\x83+%\xde`\xac\
-\x7fC\xa5\xea\xd5O\x10L\xcd\xe748\xbeY\xd7Q\
-P^'\xe2^\x992\x5c;x\xc5\xfc\xbaa\xfa\xac\
-fb\x1cP\xda\x05\xb9\xf91\x80\xca\x0e\xb6\xa0\xb8\xad\
-\x96\xfa\x92^\xd2+S\xf4\xc6\x1b\xc0L\x84\xb9|\xf2\
-1\x98)z2\x91\x1e\xaet\xfd\xae\x80\x18\x80\x99\x12\
-\xe2*\xc6\x07-\x93\x88uL\xe3%\x16M\x5cR\x1f\
-o\xd0\x9f\xfcdr\xfd\x9a%\x00B\xea\xceN\xec\xef\
-a\x1a_\xc0\xf5\xed\xe4\xa5\xd3x\x15KOb\xa1Z\
-Q\xe6.\x92\xca)\x0a\x0a\x12\xbd*\xd2\xe1\x0d\x13\x04\
-\xabk\xf1f\xa5\x89\xbe\x91Jf\xa2\xad\xc5\xed\xc3\x14\
-\xa8\x86\xc2\xfe\xfeBe\xd3\x1cs\xe5\xadE\x93\xa5U\
-\xc78r>n\xe7=\x15\x8es%f\xe7\x152\xad\
-\x86\xa9\xcb@\x8d\x15\xc8\xf4\x11a\xaes\x9e`_\x93\
-h\x1b\xde6\xcc\xf0\xfb.\xbc\xa7^y\x9f\xf7Y\xe5\
-\xcd\xd6z\x02X\x9e\x81\x1a*\x90\xd1\xe2V\x10m\xc3\
-NJ\xf3\x1b\x14(\x15\xbb\xdd\x0a\x05+Js\x87+\
-\x01\xf938\x9aG\x00K\x95\x80\x0a\x17m\xd5B\xd2\
-\xf2\xdeZ\xc7\x86AA\xca\xb4\xa9a\xa3\x06\xfa\x0b(\
-\x1c\xf2i\xaa\xc3\x95\x11\x02 \x15\x15P\xda\xe4\xf5\x10\
-\x04\x04MK\xdfj\xd7M\xd5g\xd5\xdb:Lz\xa8\
-Z]\xa8\xea\x9a~\xbd3\x0cY\xcd+5\xa7\xce^\
-\x00\x98\x1c\xe5ltW\xd3\xd5\x8bN\xd3{\x174\xaa\
-0\xd6\xb7\xd1\xd0s5\x91p\xd5\x0c\x02\x18\xd0\xe7\xd5\
-E\x0e\xc4\xe0\x80\x06\x93\xfd\xe7u\xa5\xf6\x9a\xda\xd5l\
-L]\xd6\x11\xe7h~\x10\xb0\x82\x1c\xb4\xf9IU\x0d\
-@\x0c\x90\x93\xe8\xfd\x9f\xfe\x9dF\x09)\xe6\xbc\x97\x00\
-\x10D\x7f\xf9\xb01\xe5`a!\x90q\x02X\xd2\x8e\
-\xd2\x1d\x8acjR\xad\xe2\x08z\xef\xff\xf4/`]\
-\xa4H\xf4\x9e\x88\xf4\xbb\x83\x0bu\xe3\xa5,\x182\xaa\
-\x88\x00\x14\xa6I\x14\xfb\xa1\xb9=\xfd\xf4p\xac\xa9\x08\
-z\xb5O\xacZ9,&Ee\x05P&z\x0a\x96\
-\xa9\xd2\xa1l(S\x97\x02H\x1eV\xbe\x7f\x22t\xa9\
-ys\x13j\xfb\xdaY@C\x95`\x91rP97\
-\xb1\xe7\xcd\x95\xefn\xe6TC\x99*S\xb4\xc63\xeb\
-Y\xb6/\xd2\xe9\xc1\xdf\x04\x17\xa0\xd8\xd7\xd4\xea\x15\x19\
-I/\xedG5\xe8\xf1\xf7\x8b\xecF\x0cS^\x05!\
-\xda\xb3\x22\xf5'\x0d\xa4\xbc\x00\x00\x09\xecIDAT\
-\xc7Sr\xc8\xb7\x911\x80\xca3X\xb3rZ\x9f\xf4\
-3\xb0\xb3\xf4\xabZ\x0c\xe5U\xa8\xb8\xef\xa5\x09H@\
-\xd4\xa8\xb3\xca\x12x\x01\xa6\xe3\x82\xd6\xb6\x043\xd2\x89\
-\xa7\xdf\x85\xa3-\xa2[\x16\xc9V\xaf\x1cJ\x8fO\x89\
-\xea\xf2\xe5<\x83U1\xf1\x89\x18+\xe5-\x8e7\x88\
-\xe6\x10\xc0b\xbfD\xf1\xba42ax@f78\
-\x88R\xcb} \xa6\x8ep\x89\xde\xa4\xab\xaa\xf2a\xcd\
-y\x06\xdd\xcfG,\x22\x80A\x824\xea#\xb8P~\
-|\x08\xe6\xdd\x0a-S\x8fJ\xee\x83\xd1g\xa0xW\
-\xd5\x9b\x18TvL\xac\xfe\xa4\xa2\x91\x1d\x81\x8cJ\x9e\
-\xb2][\xa3[A\x8a\xa3q\xba\x9c\x0a\xed\xc3M\xfa\
-\xd9U\x85\xc9\xbc\x0eM\xfd\x1bt\xcb\xfb\xc6\xc4\x00L\
-\xa6\xcb\x96.\xca^\x87\xdb\xc85\xe8\x90\x9c\xd5\xcf\xa1\
-\xd3\x14\xc3X\xda\xb2\xa1\xf1\xdd*Z\xb5\x99\xfc\x9c\xd6\
-\x12\xc0Rn\x9a6)] i\xf5Gp\x8b\x87Q\
-j\x888\x14<\x07\xb5c\xd8+\xc9Q\xcb1[\xde\
-n\xdeIG\xad\xfd\xbdK7\x225\xeb\xad\x11\x040\
-\xa8\xcc\xd2\x92\xf4cA\x91S\xb5rP\xad\x1a\x88\xb1\
-\xc9<\x95n\x1d\xa8<)!Z]J\x99\x88\xe4\xd6\
-{VM\x07N\x7f]\xb8(a\xae\xefAI\x7fu\
-\x1dy7\xa6\xfd\xfc*\xd5\xa0'\xf9\xa8B^\x1b<\
-)1\xeaR\xae\x9c\x18\x80\x99\xf9t}\x98\xa6\xb9\x0a\
-\xc4\xaaVd\xda\xca\xa3+vm\x1d\xee\x95\xc1)\xb9\
-\xf6&?\x0d\xebt\xe0~\xfdz\xd1\xeb\xf5h\x16\x0d\
-fz\xd8W*\x07\xfdJ\xca\xf4u\x10R\xe2\x09\x1b\
- &\x1ds\x1bJ\xdf[\xa1b\xb3*\x06\xb0\xf0\xf9\
-\xedbI\xa3\x1d\x8e\xab:\xc4\xd8\x90\x95\xa8E\xda\x12\
-(\xdf@\x15&\xe6H>\xb8\xee\xcf\x9f-\x0f_9\
-\xd3\x81\x07\xdc\x1d\xac\x8a7(\xed\x9d\xd7_\xbcC'\
-Q\xda\xa0\x9e\x8ag\x17\xaa'\xa7\xf2\x06\xa0f\x14\xed\
-\xd0\x12@#\xe2\x0d\x05\xbd\xf3\xb4.J\xc3\xa5\xc9\xb6\
-\x5c\x87\xf9F\xb2\x05\xeb\xc0\x92\x0eA\xac\xae\x07\x9c'\
-Ml\xc9z\xd29\xfb\xaf\x96E\xa9\xf8\xbat\x0e/\
-Y\x96r\xd0\x92b`g\xe7%]'\xc9\xcc\x88\xe1\
-\xd9B\x0c\x85\x0bP\x18=\xad)\xaeN\xd3\xb3k\xd8\
-P\xa5\xd6];\xc46\xf5\xa2\xc38\xcb'>5\xde\
-\x05\xa8\x0c`\x18\x9f\xa8Z\xd5\x9a\xd9\x10A\x94\xec\x1a\
-\xa6\xdd\x0a\xdd\x9d\x9f\xcc)\xba\xaaql\xea\x9f\xc1\xf0\
-\x07\x01s\xce\xcb\x85U\xc1\x14\xf3\x096\xb6\xa9\x06\x93\
-]x\xfbv)L\xba\x9b\xc2\xce@`c\x82\x80F\
-\xeb\xdfk\xb9F!]\xac\x1d\xaaA\x97\xbf_Vd\
-$\x0c\x0f\x8d\xd1E\x92\xc4\xa2i@\x8d$\x80\xa50\
-\xbfM\xc70]#\xb4N9\x98\xf4\xf7\x8b\x94\x940\
-\xd0i\x9a\x18|.\xe6\x8e0k\xad\x05\xb0\x93\x18J\
-vekN)\xec\xbb\xc6\xf2\x12Y\xd02\x0a\xccL\
-\x83\xcf\xfe\x9e\x8b\x16\x7f?gc\xeb\xc6\x00j\xb2;\
-V\xe7C\xb3\xf5\x18\xb0\xc9\xfe\x9a-\xbd\x11{\x16e\
-a\xbcAS\xb4\xa1\xa8\xc8Gs\x896!\x06UC\
-\x13\x82\x80\xc6\x1b}\xa8R4\xc2\x82\x14\x8e\xd2\xde\x88\
-\x86\xba\xcd\x9a\x9e\xcb`\xc5\x1c\xcaR\xedb[1\xa0\
-\xe1\xd9\x80\x86\xfa\xd6\xa9Z\xe8\xf6\xe47\x98?\xc7\xef\
-\xdb\xcf\xd6\x96tD,\x88\xbf\x98\xed\xf2l\x1d\x01,\
-\x89\xc9-\xce\xad.\x9fBl\xfe\xba+\xd3r\x0d\x10\
-\xaf\xe9]\xbbt\xc7\xd6\xd9+\xb2\xe2:T\x8d.h\
-`1P\xc1\x8dJO\xd9\xb4\x0c\x0e]\xca\xeeW\xfc\
-\x80m \xb5\xca\x8a7#)\xd3\xe5\xe9p\xca\x09\xa2\
-\xaa\x7f\x83f\x7f\x9f\x90\xde\xd4\xfb\x15I\x00\x15+\xd8\
-\xf8\xe0\xce\xbaI\xcd\x96\x91\xd2\xe6\x06\x92.A\xd6\x1b\
-\xf6\xf7m\xec\xfc3\xfc\x04\xb0\x1c\xf9k\xeb\xc3*K\
-\xfdm\xc4\x11\xa6\x19r(W\x0e\xeas\xf9\xcd\xa7+\
-#\x01\xd4\xb3\xbbY\x1c\x8cl\x02\xa1\x95\xbbk\xc2\x5c\
-\xd2tq\xa3_\xc3\xbd\x03\x1a\x1a\x04\xcco\x0ajw\
-\xc0n\xb9;\x89\xdd.\x85\xe5\xe4`\xc9`\xd8\x1c^\
-0VKP9QI\xd1\x11\xa2\xe2<\x80\x22y(\
-\x9a\xe2\x22-\xc1'\xc6\xe4\xa7aTd\xc4x\xaa9\
-\xe9\x06\x01\xeb\xcc\xbc5\xe4\x02T\xf5\x97k\xaer\xa8\
-\xdc}\x89\x9d\x1f\xad\xec\x08\x13\x88\x1d\x84]6\x90\x94\
-\x18i\x9e\x0a\xa5\xa9\xe6\xa6&\x1a5:\x06P|S\
-\x054\xdc\xa3\xc8or!,=\xba\xcc\xcau\xcb\x8a\
-\x98\x16]\xa2\xd1\xc9I\xc5\x12\xd8\xc4D\xa3F\x13@\
-\x05\xff\x97V\x884\x92\x1bH\xb3\xa2\xc6\xfd\xbax\xd6\
-\x5c\xb6\x95)\xd3\xe6\xc7\xcb7\x90\x00\x9a\xcf\xb6K\xdf\
-\x80\xed*\x08\xea{O\xb6<\x80jk\x90Wgu\
-\xed\xf0\x1f\x03Z2\x16\x5c\xfb\xee\x86\xa7\x14\xea\x8c\xd0\
-\xe0\xbaY\xf1s\x01\x94\x1b\x90\xe8\x8984?\xde\x90\
-#{\x89\xc5\xb5V\x8d\xc8\xc9(X7M\x5c3\x98\
-\x08\x94\xaf^\x8d6\xdf\xd4!{\x9b\xe6.U\xc9u\
-\xe3\x87+\x16\xf9\xf5H\x00\xa6|\xf2\xa6\xc7\x1c\x1a\xba\
-\x88\xcb;\x08\x09\x10\xc2\xfc\xd9keo\x0cC\x0a\x07\
-\x09@\x93\x115=+\xb21\xf2<O;\x98\x1a\x13\
-\xbe\x1c\x85\xa3\xa9\x84\x1c\x09@\x9f\xdb\x08\xb6\xf7&T\
-!\xcf\x9b\xa0\x1c\x0a.\xda\x02\x97b\xf1\x9a\xc1 \xe0\
-P\x92\xc3p\xc6\x1bJ?\x9f\xed\xaeR\xe1\xb1r\xd3\
-\xc3\xc3H\x00C\x13oh4AT\xcc\xc6\x13\xa2a\
-\xc4\xd0P5\x87\x040T\x04\x91d\xc5\x0b\x01\xd6\x16\
-\x1d\x0c\xe4\xb7g\xc8\xce\xf6^\x91P6\xbe\xde\xce\xe7\
-\x81\x040|\x94 -\xc2\xe1\x899T\xb5,K\xcc\
-\xccR\x82 V6NA\x02\xc0\x98\x83,\x1c\xa0\xe9\
-e\xday\xc1H\x1d\x83Lj\xf0*\xc0\xd4)\x05\x12\
-\x00B\x9e\xf6Q0\xa2J@\x83S\x1bd+\xcb\xfd\
-l\xb6fF\xe6\xba\x13RA\xe9P\x96\x03#\x9a\xb1\
-\xb36\xd5\x95(\xfal6\xcfy\xc8^/\xe9t\x06\
-A\x05\x80\xb0p\x87\xea\x91\xdeb8\xfa7\xe4|\xb8\
-a9\x0cD\x02@(\x94\xde\xc5E\x07I\xa3\xa1\x06\
-\xf7p\xb0{\x08\x0c\x12\x00\xc2v\xe1]\xc0\x0f\x0d\xef\
-\x17Y6\x04\xc6B\xe5\x80\x04\x80\xb0\x8f\x1c\x0c\xf6\xf4\
-7\xa2\x1cDV\x1b!\x01 \x10\x85\xdb\xeb\xd0\xa5\xe8\
-\x92E\xda(\xf3\xd1\x04\x12\x00\x02QnD\xc5-\xe1\
-:\x835\x1b\xdc\xc3!G\x12a1\x10\x021\xc0\xee\
-\x9a\xdf\xd7_\xc0PU\xf6 \x01 \x10\x03E\x1b\x1a\
-9\x86\x1e\x09\x00\x81P\xefQ@^^\xb1\xd53\x1c\
-\x90\x00\x10\x08\xb5\xeeDu\x89v\xb3\xdc\x0a$\x00\x04\
-B\x87[!\xecL\x0fB\x02@ \xf4\xf9\x14E\xa3\
-r\x8d1\x03\x12\x00\x02a\xabjH$\x83\x00uC\
-e\x91\x00\x10\x08\xbb\xd9a!9\xa8;\x1e\xbc\xbe\x7f\
-\x9e\xe2\x1dF \x1a\xa8\x19j\xea\x0c\x8c\x04\x80@\xac\
-` \x01 \x10H\x00\x08\x04\x02\x09\x00\x81@ \x01\
- \x10\x08$\x00\x04\x02\x81\x04\x80@ \x90\x00\x10\x08\
-\x04\x12\x00\x02\x81@\x02@ \x10H\x00\x08\x04\x02\x09\
-\x00\x81@ \x01 \x10\x08$\x00\x04\x02\x81\x04\x80@\
- \x90\x00\x10\x08\x04\x12\x00\x02\x81@\x02@ \x10H\
-\x00\x08\x04\x02\x09\x00\x81@ \x01 \x10\x08$\x00\x04\
-\x02\x81\x04\x80@ \x90\x00\x10\x08\x04\x12\x00\x02\x81@\
-\x02@ \x10H\x00\x08\x04\x02\x09\x00\x81@ \x01 \
-\x10\x08$\x00\x04\x02\x81\x04\x80@ \x90\x00\x10\x08\x04\
-\x12\x00\x02\x81@\x02@ \x10H\x00\x08\x04\x02\x09\x00\
-\x81@ \x01 \x10\x08$\x00\x04\x02\x09\x00o\x01\x02\
-\x81\x04\x80@ \x90\x00\x10\x08\x04\x12\x00\x02\x81@\x02\
-@ \x10H\x00\x08\x04\x02\x09\x00\x81@ \x01 \x10\
-\x08$\x80\x04\x02o!\x02\xb1\x82\x08@\x08\xb4y\x04\
-\xc2F,\xc56\x07&\x00\xce9\xdei\x04\xc2\x22\xbb\
-_\x8em.\xd9\x05@%\x80@\xd8\xb5\xf3\x13B\xb4\
-\x11\x80\xc8\xbc\x10\x08\x84\x99\xdd\x7fYv\xb8\xa4\x18@\
-\xc28\x02\x008\x12\x00\x02a\x94\x00x\xc7,\x05p\
-\xceE\xd6-PA\x00Bz\xe38y\x01!dI\
-\x12\x04\x81@\xf4\x07B\x08PJ\xbbv&\x84\xe0\x89\
-\x1dr\x00\xe0Kq\xcb\xd9\x12\xec_p\xce9!$\
-\x06\x00\x02\x00\xb1\xe7y@)\x05\xcf\xf3\xf0)!\x10\
-\x0a\xe1y\x1ex\x9e\x07\x8c1H6\xdf0%\x02i\
-s\xee\x9fT\xaaX\x83,l\xeb\x14\x00\x1c\x00`\x8e\
-\xe3\xb4\x1c\xc7\x19\x8b\xe3xt\xcb\x96-\xdb.\xbd\xf4\
-\xd2\xf7\x00\x807222\xe28\x8e\x0b\x00n\xf2\xf7\
-e\x85\x81\xf2\x00\x81\x18L\xde\xa7Hw\xf90\x0c\xc3\
-\xb0\xddn\xb7\x19c\xc1\xf1\xe3\xc7_<z\xf4\xe8+\
-\x8c\xb1\xf98\x8eg\xe38\xf6\x01 \x94\xfe~\xaa\xd8\
-\x97E\x00\xa9\xf1\x92\x94\x00\x08!\x9e\xeb\xba\xab\x00`\
-T\x081\x12\x86\xa1\x07\x00\xab\x01`\x14\x00Z\x19\x02\
-@\xc3G \x96\xef\xe7\xf3\xc4\xb8\xdb\x000\x0f\x003\
-\x8c\xb1\x80R\xda\x06\x80\xb90\x0c\xe7\x85\x10\x81D\x00\
-\xa2\x0f\xfb\x1f\xc8\x05\xe8\xfa\xfeB\x88\x98s\x1eRJ\
-}J)m\xb5Z\x0e\x00\x04\x00@\x13\xd7\xc0\xc9(\
-\x00$\x01\x04b\xe9* %\x8081\xf2 \x91\xff\
-\x01\x00\xf8q\x1c\x87B\x888\xdd\xf5\x95\xc6\x00\xd2\x0b\
-\x89\xa2(\xf4</U\x10\x9c\x10\x12\x02@[\x08\xe1\
-\x00\x80C\x08\xc9\xdb\xfd\x91\x08\x10\x88\xc1\xe4?\xc8\x1b\
-/\x00D\x89\xdf\xef\x03@ \x84\xf0\xa3(\x0a\x13B\
-\xe00\xe0\xc9\x1c\x1b\xe0\x82\x88\xc401\x00\x900\x0c\
-\xc1q\x1cA)M\x99\x89%*\x80\x0a!Ho\x08\
-\x01\x81@\x0c\xcc\x04\x0bG\xee\x22\x09\xf6\xa5'o\x11\
-\xe7<\x8c\xe38\x90\xfeL6\xfe\xbeH\xa0\xdf\x18\x80\
-\xbc{\x13I\xde\xa7\xbb\xbd\x93@\xf6\xfb\xd1\xf2\x11\x88\
-zUAz\x08\xc7\xe38\x8e\x13E\x10\x17\xec\xfeB\
-\x22\x90Z\x08 \x8f\x04d2 \xa9\xecO\xce+\xc9\
-rR\x14\x11\x08\xdc\xfdE\xd7v8\xef\x9c\xf2%Q\
-=\x0e\xbd\xc1AQ\xb4\xfb\xd7M\x00Y\x12 \x99\xdd\
->\xfb{\xcc\x12D \x96\x07\x921\xeal\xea/\xcf\
-\xf9>\xf4K\x00l\x09\x17$rb\x03\xd9\x8bE \
-\x10j\xdd\x01(3\xfc~\xc1\x96y\x11\xa4\xe0b\x10\
-\x08\x84~2\x18\x18\xff\x1f\x02<\xed\x02\x15G\xde0\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\xd6\x11\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00\xd5\xd8IDATx\xda\xec]\x07`TU\
-\xda=\xd3KzOH\x03\x92PB/R\x04\xa4\x88\
-\x88\x88\x026,\xa8k_\xbb\xb8vwE]\xcb\xaf\
-k\xc3\xdeE\x11\xc1\x86\x05\x01Q\x10\x05A)\xd2\x09\
--\x09\xe9\xbdO\xef\xffw\xef{3\x99\x84 \x09$\
-\x19 \xef\xb8o\xdf0\x99y3\xf7\xce=\xe7+\xf7\
-\xbe\xef\xca A\x82\x84.\x0bY\xa0\xbf\x80\x04\x09\x12\
-\x02\x07I\x00$H\xe8\xc2\x90\x04@B{@C\x87\
-\x8e\x0e5\x1d5t8\x03\xfd\x85$\xb4\x0e\x92\x00H\
-8\x1e\xa8\x1e\xba\xf7\xe6\xd7\x13\x12b{\xa9U\xca`\
-\x9dV\xa3\xd7j\xd5:\x85\x5c\xa6\xce/(,\xcb\xcb\
-/\xda\xb5s\xf7\x81e\xeb\xff\xdc\xb5\x85^[B\x87\
-;\xd0_XB\xcb\x90\x04@B\x9b\x91\x9a\xdcm\xf0\
-w_\xbc\xbd\xb1[|\x8c\xce\xe1\xb0\xc1\xe1\xb0\xc3n\
-\xb7\xc3a\xb7\xc1i\xb5\xc2b6\xa3\xa6\xbe\x1e\xe5\xe5\
-\x95U;\xf6\xe4\xfc\xbe`\xc9\x8a\xfb\xea\x0d\xe6\x9c@\
-\x7fo\x09GB\x12\x00\x09m\xc6\xbf\x1f\xb8\xed\x8d\xdb\
-n\xba\xf26\xb9\x1c\x8d\xe4gB@\xe4\xb7\xdb\xacp\
-\xda\x84\xb3\xdb\xe3\x86L&G^qe\xd9Ok7\
-\xbf\xfb\xe9W?\xbdDo\xaf\x0f\xf4\xf7\x97\xd0\x08I\
-\x00$\xb4\x15\xfa%\x1f\xbf\xb2\xf9\xec\xf1\xa3\xfa5\xb7\
-\xfev\x8bE8\xdb,\x5c\x00\x14\xa4\x10\x1a\xb5\x1aj\
-:\xacv\xb7g\xf3\x8e\xfd;\xdf\xfa\xe8\xeb\x9b\xf6g\
-\x17l\x0dt#$\x08\x90\x04@B\x9b0lp\xbf\
-q\x0b\xde}nMlt\x84J ?\x89\x00\x17\x00\
-\xb2\xfa\x16+\x1cD~\x1b\xf3\x02H\x1c\x18\xf1\xd5*\
-:4L\x044P(\x95\xd8\xbe'\xb7\xe8\xcd\x0f\xbf\
-\xbce\xdd\x1f;V\x04\xba-\x12$\x01\x90\xd0F<\
-\xf1\xe8\xdd\x9f\xdcr\xfdeW{<.N|\x9f\xf5\
-\xb7\x92\xf5'\xe2\xdbD\xeb\x0f\xb7\x9b\x0b\x80F\xa3!\
-\x11PAE\x22\xa0\xa2\x7f+\x14J\xec\xcb.\xaaz\
-\xf3\xc3\xaf\x1e\xfaa\xd5\xfa\x0f\xe9\x92\x9e@\xb7\xa9+\
-C\x12\x00\x09mA\xd8\xd2\xc5on\x1d7jH\xba\
-`\xf9m\xb0\xb10\xc0\xe6\x8d\xff-\x5c\x00\xd8c\x85\
-R\xe1s\xff\x99\xf5gg\xa5J\x09\x05\x89\x81R\xa1\
-\xc2\xfe\x9cb\xc3M\xf7<y\xce\xe1\xfc\x92M\x81n\
-TW\x86$\x00\x12Z\x8d)g\x8f\xb9`\xfes\x8f\
-~\x1b\x19\x11\x22\xb7\xdb\x05\xf7\x9f\x1fV+\xb7\xfe\x0e\
-\xab\xe0\xfe\xb3p@M\x96_\xebG~\xe6\x01(\x95\
-*\x12\x06\x12\x00\x12\x81\xad;\x0e\x16\xcd\x983w8\
-]\xb6<\xd0\xed\xea\xca\x90\x04@B\xab\xf1\xf4\xbc{\
-\x97\xdex\xedE\xb3\xdcN\x17\xb7\xfcv\x9bMt\xff\
-E\xebo5s!\x80\xc7#\xb8\xffL\x00H\x084\
-$\x02J\xb5\xca'\x00r\xb9\x02\xef/\xfa\xe1\xfb\xc7\
-\x9f{{F\xa0\xdb\xd4\xd5!\x09\x80\x84\xd6\x22f\xf9\
-W\xefm=chf\x8a\xcf\xf23/\x80\xac\xbe\xdd\
-\xda\xe8\xfa3!P*\x95\x9c\xfc\x1aN~f\xfd5\
-\x9c\xfc\xcc\xf2\xb3\xa3\xb2\xda\xe0~\xe8\xc9\xd7.Y\xb5\
-\xf6\xcfo\x02\xdd\xa8\xae\x0eI\x00$\xb4\x0a\x97\xce\x9a\
-z\xf5S\x8f\xdd\xfdqXH\x90\x8cY~\x7f\xf7\xdf\
-N\x96\xdf&\x0a\x81\xd3i\xe7\x16_#f\xfe\x99\x08\
-\xa8Tj\x9f\x07\xc0\x8e\xdf\xfe\xdc\x9d}\xe5\xcd\x8f\x8c\
-\xa0\xcb\xd6\x06\xba]]\x1d\x92\x00Hh\x15\x9e\xfb\xef\
-\xfd?^w\xd5\xccs\xbdS\x7f>\xf2\xb3E?\x16\
-\xb3\x90\xfd'\x01`\x03\x8aM\xfbiE\xf2\xf3\xe4\x9f\
-\x18\xff\xb3\xc3\x0d9\xdeZ\xf0\xcd\xa2\xe7\xe6/\x98\x13\
-\xe86I\x90\x04@B\xeb\x90\xf4\xf3\xf7\x0b\xb6\x0e\xec\
-\x97\x16\xe7\xb5\xfe6\xbb\x98\xf9\x17\xc9/x\x00f\xb2\
-\xf6*\xc1\xf5\xd7hE/\x80Y\x7f\xaf\x00\xa8Q\x5c\
-V\xeb\xbc\xf3\xe1\xe7\xa7l\xd9\x9e\xb56\xd0\x8d\x92 \
-\x09\x80\x84V\xe0\xfa\xab/\xbe\xfb\x91\xfbn~%H\
-\xa7\xe1\xc4\xe7\xd6\xdf&\xac\xfcc\x89?!\x07`\x86\
-\xcb\xe1\x10\xac>\x9f\x01\x10\xdd\x7f>\xfd\xc7b\x7fA\
-\x04V\xae\xdd\xbc\xfb\xa6{\x9e\x1aM\x975\x05\xba]\
-\x12$\x01\x90pl\xc8_z\xf6\xe1_\xae\x9e=}\
-<'?s\xf9\x99\x07\xe0\x8d\xfdE\x0f\xc0!\xba\xff\
-\x8d\xd6_\xc8\x03p\xe2\xd3\xc1<\x03\x87\xcb\x83W\xdf\
-\xff\xea\xcd\xf9\xef,\xbe=\xd0\x8d\x92 @\x12\x00\x09\
-\x7f\x0b\xadF\x93\xbe\xea\xdb\xf77\xf7\xceH\x89`V\
-\xdf\xc6C\x00a\xd9\xafML\xfe\x09^\x80YL\xfa\
-y\xe3\x7f-\xd4Z1\xfb\xcff\x02\xe8\x9cSXa\
-\xbe\xfa\xd6\xc7\xc6\x15\x16\x97o\x0bt\xbb$\x08\x90\x04\
-@\xc2\xdf\xe2\xb6\x1b\xaf\x9cw\xff=\xd7=\xaeQ)\
-\xf9\x22\x1f\xc1\xfa3\xf7\xdf\x04\xab\xd7\xfd\xa7\xb3\xdb\xe9\
-\xf0Y\x7f\xadV+L\xff\xf1\xf9\x7f\xc1\xfa\xb30\xe0\
-\xcbe\xeb\xb6\xcc\xfd\xf7K\xe3\xe8\xb2\xb6@\xb7K\x82\
-\x00I\x00$\xfc\x1dT\xaf\xbf\xf0\xd8\xba\xcbfM\x19\
-%\x90\xdf*\x88\x00\xb9\xff\xdc\xf5g\xe4'!`g\
-\x85\x5c&\x0a\x00\xc5\xff,\x04 \x11\x10\xac\xbf\x8aO\
-\x03Z\xac.\xbc\xfc\xce\x92g\xde\xf9\xe4\x9bG\x03\xdd\
-(\x09\x8d\x90\x04@\xc2Q\x91\x98\x107\xe8\x8bO^\
-\xd9\x90\x96\x9a\x10\xc4\x5c\x7f\x1b\x13\x00\xabMp\xfd\x89\
-\xf8\xdc\xfas!0\xfb\x88\xaf\xd5\x8a\xee\xbf\xc6\x1b\xfb\
-\x0b\xe7\xac\xec\xa2\xfaK\xaf\x7fh\xa4\xc1h>\x10\xe8\
-vIh\x84$\x00\x12\x8e\x8a{n\xbd\xf6\xa5{\xef\
-\xb8f\xaeB\x01\x1e\xfb3\xeb\xcf\x93\x7f\xcc\xfd\xb7\xb0\
-i?\x13\x17\x02\xb7\xdb%\xba\xfeL\x04\x98\x00\xe8\xf8\
-\xf4\x9f\xc2O\x00>\xf9r\xd5\xfaG\x9fyk\x22]\
-\xd6\x15\xe8vIh\x84$\x00\x12\x8e\x06\xfd\xbb\xaf\xfd\
-\xf7\xf7\x19\xe7\x8d\x1f\x22\x90\xdf\x22$\x00-\x82\xdbo\
-\xe5\x96\xdf\xc4=\x00%)D\xa3\x000\xf7\xdf\xbb\xfa\
-O \x7f\x83\xc1\x8a\xe7\xdfXt\xdf\xa7_\xfd\xf8b\
-\xa0\x1b%\xa1)$\x01\x90\xd0\x22\x06\xf4\xeb5\xf6\x83\
-\xd7\x9eZ\x9d\x94\x18\xa3\xb1\x89%\xbelb\xec\xef#\
-\xbf\xd9\xc4\x9f\xe7n\xbfV\x98\xfa\xd3iu|6\xc0\
-\xb7\xfc\x97\xce\xdb\xf6\xe4\x94\xcd\xba\xf6\xc1\x91t\xd9\x82\
-@\xb7KBSH\x02 \xa1E\xdcw\xe7\xf5\xef\xcf\
-\xbdm\xce\x0d\x1e\xb8\x85d\x1f\xf3\x02\xf8\xc2\x1f\xb2\xfe\
-f!\x07\xc0\xc4\x80\x15\x06\xf1f\xfeu\xa2\x08\xa8D\
-\x01`\xb7\x00\xcb\x15*\xbc\xfb\xe9\x0f+\x9f~\xf9\xa3\
-\xf3!\x15\xff8\xe9 \x09\x80\x84\x96\x10\xf6\xf1;\xcf\
-m<w\xd2\xc8Ln\xf5\x89\xfcV\xb6\xd4\x97Y\x7f\
-\x96\x004\x9b|B\xa0b\x85?\xb4^\x01\xd0\xf9\xdd\
-\xfc#T\x00\xaa\xaa5\xe1\xbf//\xb8\xfe\xbb\x95\xeb\
->\x0at\xa3$\x1c\x09I\x00$\x1c\x81\xf1c\xce\x98\
-\xf6\xca\xb3\x0f-\x8b\x8b\x8d\x903\xeboe\xee?Y\
-\x7f\xabw\xe5\x9f\xd9\xc8\xcf\xec\xd6_-\x91\x9e\xc7\xfe\
-\xa2\x08\xb0e\xc0*\xa5\xc6W\x02l\xdd\xa6\xac\xbc9\
-\xb7\xcdcK\x7f\xcb\x02\xdd.\x09GB\x12\x00\x09G\
-\xe0\xc1\xb97.\xbe\xfb\x9fW]\xeer:|\xe4g\
-B`a\xe4\xb7\x18\x05\x0f\x80\x1e\xc3\xe3\xf6Y\x7f=\
-\xb3\xfeZ?\xf7\x9f\xcer\xb9\x12\xaf~\xb8\xf4\xab\x97\
-\xde^|i\xa0\xdb$\xa1eH\x02 \xa19b\x96\
-|\xf4\xd2\xc6\xf1g\x0eIg\x99\x7f\xab\xd5\x9b\xfc3\
-\x09\x02 Z\x7f+\x09\x01\xab\xf8\xcb\xe7\xfeuB\xfc\
-\xcf\x84@X\xfb\xaf\xe1E@\xca*j\xdd\x0f?\xf3\
-\xce\xc5\xbfn\xdc\xfem\xa0\x1b%\xa1eH\x02 \xa1\
-\x09\xa6\x9f;\xe1\xcag\x1f\xbb\xfb\xd3\x88\xc8\x10\x99\xb0\
-\xce_\x14\x01\xb2\xfa\x16n\xf9\x8d|\x16\x80m\xfe\xc1\
-\x88/\xb8\xfe:1\x01\xa8\x15\xef\xfe\x13<\x80\x95\xbf\
-\xfe\xb5\xff\x9f\xf7?w&\xa4\xc2\x1f'-$\x01\x90\
-\xd0\x04\x8f\xfc\xeb\x96\xef\xee\xba\xe5\x8a\x0b\xd9\xb2_N\
-|1\xf6g\x09?\xab\xe8\xfe[\xc9\x0b`\x03\x87\x0b\
-\x00\x91^\xaf\xd3\xf1P\x80O\xff\xf1\x02 \x1ax<\
-r\xbc\xf4\xeeW\x1f\xbd\xf9\xd1\xd7\xd7\x07\xbaM\x12\x8e\
-\x0eI\x00$\xf8#\xe9\x9bE\xafo\x1c5<3\x99\
-\xad\xf4\xb3\xb2\x10\xc0\x22,\xf7e\xa4\xe7\x87\x18\x06\xb0\
-\x95~:\x1d[\xf4\xa3\xa7\xf8_X\xfb\xaf\xe27\xfe\
-\x08\xee\xff\xe1\xc2J\xfb=\xffyu\xea\xae}\xd9R\
-\xe1\x8f\x93\x18\x92\x00H\xf0a\xf6E\xe7\xdd6\xef\xa1\
-\x7f\xbe\x11\x1a\xa4\x87\x85\xdf\xeak\xe5\x84\xb7\xb09\x7f\
-\x93QX\x01H\xe4w\xda\xed\xd0\xea\x85i\xbf&\xd3\
-\x7fj\x8dx\x07\xa0\x06_\xad\xf8}\xdb}\x8f\xbf6\
-\x9e.k\x0ct\xbb$\x1c\x1d\x92\x00H\xf0B>\xef\
-\xa1\xdbW\xdev\xfd%S,V\xe1^\x7f\xabE\x14\
-\x00\xd1\xfa\xdb\xc4\x1c\x00\x1b4:r\xfb\xb5\xec \xf2\
-\xebuZ1\xfb/\x08\x80\xdd\xe5\xc6\x0bo}1\xff\
-\x83\xc5?\xdc\x13\xe8FI\xf8{H\x02 \x81C\xa3\
-V\xa7/]\xf4\xea\xc6\xc1\xfd3b\x84\xc5>\x16\xbe\
-\xf8\xc7\x22Z}+\x8f\xfd\x0d\xfc\xcc\xe6\xfd\xb9\x00h\
-\x04\xf2k\xe81#\xbf7\x07\xb0/\xb7\xc4t\xcb\xfd\
-\xff\x1b_XR\xf1W\xa0\xdb%\xe1\xef!\x09\x80\x04\
-\x8ek\xaf\x98\xf1\xc8\xa3\xf7\xdd\xf4\xb4N\xa3\xe2V\x9f\
-\xe7\x00\x98\x00p\xf2\x13\xf1M\x82\x10\xb8\x9cv\xee\xf2\
-3\x01`\xc4g\x09@\xb5F\xeb[\xff\xaf\x22q\xf8\
-\xf8\x8b\xd5\x1b\xe6\xbd\xf0\xc1\xd9\x90\x0a\x7f\x9c\xf4\x90\x04\
-@\x02\x83\xea\xe9\xc7\xee\xf9\xf9\x86\xabf\x8c\xe7\xe4g\
-S\x7f<\xf6\xa7\xc3d\xe4\xd9\x7f\xabI\x08\x03\x94r\
-\x19w\xfdu^\xf7_\xaf\x17\xd7\xfd\xb3M@50\
-[\x9d\xf8\xbf7\x97<\xb1h\xe9O\x8f\x07\xbaQ\x12\
-\x8e\x0dI\x00$ >6j\xe0\xc2w\x9f[\x9f\x99\
-\x91\x1a\xea#\xbf\xd7\xfa\x9b\x0cB\x08 \x0a\x80\x10\xfb\
-\xeb\xf9Y\xaf\x13\x92\x80J\xb5\xe8\xfe\x93\x08\xec\xd8\x9b\
-W{\xf5]O\x9di2[\xf7\x07\xba]\x12\x8e\x0d\
-I\x00$\xe0\x869\x17?\xf7\xe8}7>\xa0\x94\x83\
-\x13\x9f\xbb\xff$\x02f\x91\xfc6\x0a\x01,F#\xdc\
-.\x07tz\xc1\xfa\x0b\x02\xa0'\xe2k9\xf1y\x0e\
-\x80\xceo~\xf2\xc3\xea\xe7\xdf\xfc\xec<\xba\xac3\xd0\
-\xed\x92plH\x02 A\xff\xc2\x7f\xef_s\xe5%\
-SGq\xeboe+\xfe,|\xd5\x1f\xb3\xfe\x8d9\
-\x00#/\xfc\xa1#\xd2s\xcb\xaf\x17\xe3\x7f>\xed'\
-\xe4\x00\xea\x1a\xacx\xe6\xf5Es\x97\xae\x5c\xf7J\xa0\
-\x1b%\xa1u\x90\x04\xa0\x8b\xa3wF\x8f1\xef\xbc<\
-ouZ\xf7\x04\xad\xb0\xe2O\xb8\xe9\x87\x11\x9f\xc7\xff\
-\xdc\x0b0\xf05\x00^\xcb\xaf\xd3\xeb\xb9\x10\xe8\xd8\xd2\
-_v\x889\x80\x8d\x7f\x1d(\xbe\xfa\xae\xa7\xc7\xd0e\
-\xf3\x03\xdd.\x09\xad\x83$\x00]\x1c7_{\xe9\x9b\
-\x8f\xfe\xeb\x86[=\x1e7\xb9\xfd\x82\xf5\x17\xce\x82\xdb\
-\xcf\xceV\xa3\x01\x1e\xb7\x8b\x13_\xefu\xff\xe9\xb17\
-\xfb\xcfr\x00\xec\x06\xa0\x97\xdf_\xfa\xfd\xeb\x1f-\x9d\
-\x09\xa9\xf0\xc7)\x03I\x00\xba6\xc2^{\xee\x91\xb5\
-\x17_8q\x88\xc5,L\xfd\x99\xc5e\xbf\x82\xf5o\
-\xe0g\x0by\x01j\x95Rt\xfb\xf5\x82\x10h\xf5\xbc\
-\xf2\xaf\x8a\xbb\xffZ\x94\xd54\xe0\x89\x97\x16^\xfb\xf3\
-\xba-\x9f\x04\xbaQ\x12Z\x0fI\x00\xba0\xce\x18\xd2\
-\xef\xdcW\xff\xef\xa1\x1f\x92\x12b\x94\x16^\xe1\x87\x09\
-\x80\x89'\xffl\x22\xf1\xd9\xc1\xdc\x7f\xbd>\x88\x0e\x9d\
-\xe0\xfa\xeb\x85)@f\xfd\x05/@\x8bU\xebwd\
-\xdf\xfa\xf0Kg\xd1eK\x03\xdd.\x09\xad\x87$\x00\
-]\x18\xb7^\x7f\xd9\xc7\x8f\xde{\xc35N\x87\x1df\
-6\xedg\x12\xee\xf9\xb7\x18Y\xf2\xaf\x81\x9fm$\x00\
-,<\xd0\x89\xd6\xdf+\x04\x8c\xf4\xde\x10@\xa6P\xe1\
-\xff\xde\xfc|\xf1\x07KV\x5c\x19\xe86Ih\x1b$\
-\x01\xe8\xba\x88y\xf7\x95y\xbfM;gL_!\xe6\
-7\xf3\xf8\xdfl1p\xe2s\xf7\xdf(x\x00l\x9b\
-/!\xfe\xd7s\xf2\xf3\xc5?j!\x01\xc8D\xa0\xa0\
-\xa4\xda\xfd\xe8\xf3\x1f\xce\xfas[\xd6\xf7\x81n\x94\x84\
-\xb6A\x12\x80.\x8aI\xe3F\x5c\xf6\xfc\xe3\xf7,\x89\
-\x89\x09\x971\xabo\x15\xad?s\xff-F\x16\xfb\x0b\
-\x02\xe0\xb0Y\x05\xd7\x9fe\xfe\xb9\xf5o\xcc\xfe{C\
-\x80\xaf\x7f\xfcc\xd7\x03O\xbf\xc36\xfd\xa8\x09t\xbb\
-$\xb4\x0d\x92\x00tQ\xdc~\xe3\x15_<2\xf7\xba\
-KY\xd9/\x8bIX\xf6k6\x8bq?\x17\x00\xe1\
-\xcc\x06\x08#\xbd\xff\xa1\x11-?\x13\x01\x0f\x14x\xfa\
-\xf5\xc5\xef-\xfc\xfa\xe7\x9b\x03\xdd&\x09m\x87$\x00\
-]\x13I\x0b\xdf~f\xdd\xc4\xb1C{\x08\xae\xbf\x89\
-g\xff\x85\x8c\x7fC\x13\x01\xe0\x05?\xfd\xac\x7f\xe3\xcd\
-?\x82\x00\x1c\xca/\xb7\xff\xeb\xbfo\x9f\xbb\xefP\xfe\
-\xaf\x81n\x94\x84\xb6C\x12\x80.\x88\xf3\xa7\x9cu\xd3\
-3\xff\xbe\xe3\xdd\xf0\xd0 \x9e\xf5g\x22`f5\xff\
-L\xfe\xb1\x7f\x03\xb9\xff6\x81\xf4Az\xdf\xf4\x1f\xdf\
-\xf9\xc7\xeb\x01\x90\x08,\xfcv\xed\xe6\xc7_\x5c\xc0\xee\
-\xfc\x93\x0a\x7f\x9c\x82\x90\x04\xa0\xebA>\xf7\xb6k\xbe\
-{\xe0\x8e\xab\xa7\x0bn\xbf\xbf\x004Z\x7f&\x04r\
-\x99\xac\x89\xf5\x0f\xf2-\xfe\x11\x04\xc0\xe6\xf2\xe0\xe9\xd7\
-\x16\xbf\xb4\xe4\xbb_\xfe\x15\xe8FI8>H\x02\xd0\
-\xc5\xa0V\xa9\xd2>{\xef\xb9\x0d#\x87e\xc6\xb1b\
-\x1fB\xfc\xcf\xe6\xfe\x8d\xbe\xc4\x1f?\x93\x080k\xef\
-\xb5\xfe\x82\x10\xe8\x9bL\xff\xed>Th\xbc\xf3?\xaf\
-O,*\xad\xdc\x1a\xe8vI8>H\x02\xd0\xc5p\
-\xc9\x85\xe7\xdc\xff\xe4#\xb7=\xaf\xd7\xaa|\xf3\xfe<\
-\xfe\xf7\xcb\xfc\xb3\xb3\xcba\x17\x93~A\xc2\x14 \x1d\
-Zmc\xf1\x0fv~\xe7\xb3\x1f\xd7=\xf7\xe6\xe2)\
-\x90\x0a\x7f\x9c\xb2\x90\x04\xa0kA\xf5\xc8\xbd7\xad\xb8\
-\xe3\xc6\xcb&[D\xd7\x9f[\x7f\xf6\xd8/\xf1\xc7\xce\
-J\x85\xdcG|\xaf\x07\xe0\x8d\xfd\x99\x17`\xb2:\xf1\
-\xd4k\x9f\xcd\xfbz\xc5\xba'\x03\xdd(\x09\xc7\x0fI\
-\x00\xba\x10\x22#\xc2\x06,|\xeb\xe9u\x033\xd3\xc2\
-\x85;\xfe\xbc\xd9\x7f\xc3\x11\x02\xd0\xdc\xfa\xb3\xec\xbf\xca\
-/\xfe\xdf\xba;\xa7\xe6\xe6\x87^\x1e\xdb`0\xed\x0b\
-t\xbb$\x1c?$\x01\xe8B\xb8\xf2\x92\xf3\x9fz\xf2\
-\xe1\x7f>\xca\x0a\x7f\x98\xcd\xde\xb9\x7fS\x93\xc4\x1f\x0b\
-\x01\x84\xc2\x1f~s\xff:\xc1\xfd\xf7\x17\x80\xf9\x1f}\
-\xb7j\xfe\x07_O\x87T\xf8\xe3\x94\x86$\x00]\x07\
-\xba\xa7\x1e\xbd\xf3\xe7\xeb\xae\xbc`\x8c\xd7\xfa\x0b\xd9\x7f\
-c\xa3\xf5'\x01`\xb7\xfe*\x95\x0aq\xcd\xbf\x90\xf8\
-\xf3f\xffU\x22\xf9\xeb\x1a,\xf8\xefk\x9f\xdd\xb3\xec\
-\xe7\x8d\xf3\x03\xdd(\x09'\x06I\x00\xba\x08\xd2{\xa6\
-\x8c~\xfb\xc5\xff\xac\xe9\x95\x96\xa8\x13\x8a}z\xb3\xff\
-\x86&\x99\x7f\xb6\xeb\x8f\x97\xf8\xbe0@L\xfe\xa9\xc4\
-\xe4\xdf\xfa\xad\xfb\x8a\xaf\xbb\xf7\xf9\xb1t\xd9\xbc@\xb7\
-K\xc2\x89A\x12\x80.\x82k\xaf\x98\xf1\xea\x13\x0f\xde\
-r\xa7\xc7\xe3j\xcc\xfe\xfb\xe6\xfe\x1b\x05\xc0\xe3r6\
-\xb1\xfe\xbe\xec?/\xfa\xa9\xe5\xb5\xff\x9e\x7f\xe7\xab\xef\
-\xde\xf9t\xd9,H\x85?NyH\x02\xd05\x10\xf6\
-\xd2S\xf7\xaf\x99=k\xf20a\xe9\xaf\xff\xdc\x7f\xd3\
-\x04\xa0Z\xadjb\xfdy\xe1OM\xe3}\xffe5\
-\x06<\xf1\xf2\xc2\x7f\xac^\xff\xd7\xc7\x81n\x94\x84\x13\
-\x87$\x00]\x00C\x07\xf5\x9d2\xff\xd9\x07\x97\xa7&\
-\xc6*-\xe2\xd2_\x93o\xe9o\xa3\x004\x16\xfeh\
-\xb4\xfe:\x9d\xdf\xbd\xfft\xfc\xb8n{\xf6\xed\x8f\xce\
-\x97\x0a\x7f\x9c&\x90\x04\xa0\x0b\xe0\xc6\xab/\xfep\xde\
-\x037]\xc7\x0b\x7f4\x99\xfboL\xfc\xb13x\xe1\
-\x8fF\xeb\x1f\xd4l\xee_\xaeT\xe1\xd97>_\xfc\
-\xe1\xe7+\xa5\xc2\x1f\xa7\x09$\x018\xfd\x11\xf3\xf6K\
-\xff\xf9u\xfa\x94\xb1\x99\x16_\xe1\x0f\x16\xff\xfb%\xff\
-\xc4\xb3\x86\xe2\xfc\xe6\xb7\xfe\xaa\xfc\xac\x7fA)+\xfc\
-\xf1\xd1\xc5\x7fn\xcb\xfa6\xd0\x8d\x92\xd0>\x90\x04\xe0\
-4\xc7\xf81\xc3/\xfd\xdf\xe3s?\x8f\x8b\x15\x0a\x7f\
-\xb0\x04`K\x8b\x7f\x1c6\x8b\x9f\xeb/\x86\x01\xbe\xb9\
-\x7f!\x07\xb0t\xd5\x1f\xbb\xef\x7f\x8a\x17\xfe\xa8\x0et\
-\xbb$\xb4\x0f$\x018\xcdq\xdb\x0d\x97\x7f\xfe\xe8\xbd\
-\xd7_v\xbc\x85?\xbce\xbf\xc4\xc2\x1f\xef/\xfc\xfa\
-\xe7\x9b\x02\xdd&\x09\xed\x07I\x00No\x1c\xa3\xf0\x87\
-\xc1w\x0b0+\xfc\xe1o\xfd\x9b\x17\xfe\xc8\xce/\xb7\
-\xdf\xf7\xf4;S\xf7\x1e\xc8[\x1b\xe8FIh?H\
-\x02p\x1ac\xfa\x94\xb3nz\xfa\xd1;\xde\x0d\x0f\x0b\
-\x12\x13\x7f\xc7_\xf8\xe3\xd3o\xd7n\x9e\xf7\xe2\x82\xc9\
-tYC\xa0\xdb%\xa1\xfd \x09\xc0\xe9\x0b\xf9\xdc[\
-\xaf\xf9\xf6\x81;\xaf\xbe\xe0D\x0b\x7f\xd8\x85\xc2\x1f/\
-/\xfe\xee\x97{\x03\xdd(\x09\xed\x0bI\x00NS\x88\
-\x85?~\x1f9,3\xfeD\x0b\x7f\xec\xc9.2\xdd\
-\xfe\xe8\xab\x13\x8b\xcb\xaa\xb6\x04\xba]\x12\xda\x17\x92\x00\
-\x9c\xa6\xb8\xe4\xc2)\xf7?\xf9\xf0?\x9f\xd7\xeb\xd4'\
-\x5c\xf8\xe3\xdd\xc5\xab\xd6\xff\xdf\x1b\x9f\xb1\xc2\x1f\xd6@\
-\xb7KB\xfbB\x12\x80\xd3\x13\xaa\x87\xe7\xde\xb8\xe2\xce\
-\x9bf\x1f\xb3\xf0\x87B!or\xdbo\xf3\xc2\x1ff\
-\x1b+\xfc\xb1\xf8\xf1\xaf\x96\xff\xf6D\xa0\x1b%\xa1\xfd\
-!\x09\xc0i\x08_\xe1\x8f~i\xe1M\xb3\xffm/\
-\xfc\xf1\xd7\x9e\xdc\x9a\x9b\x1exq\x5c\x83\xd1\x9c\x15\xe8\
-vIh\x7fH\x02p\x1a\xe2\xa8\x85?D\xd7\xbfM\
-\x85?\x16|\xf7\xf3\xfc\xf7\xbf\x9e\x06\xa9\xf0\xc7i\x09\
-I\x00N?\xe8\xfe\xfb\xc8\x1d?\xddp\xd5\x85c\xcd\
-\xedP\xf8\xe3\xa9\xd7\x17\xcf\xfd\xfe\xa7\x0d\xaf\x04\xbaQ\
-\x12:\x06\x92\x00\x9cf\xe8\x99\x9a4\xea\xddW\xe6\xfd\
-r\xac\xc2\x1fv~\xe7\x9f\xbe\x89\x07\xa0\xd5\xea\x9b\x14\
-\xfe\xd8\xb0\xed@\xc9\xb5w?;\x06R\xe1\x8f\xd3\x16\
-\x92\x00\x9cf\xf8\xc7\x153^}\xdc\xbf\xf0\x07\xdb\xf6\
-\xbbI\xe1\x0f\x0a\x01\xccB\xe1\x0f]3\xeb\xafa\xd9\
-\x7f\x95P\xf8CI\xe7\x97\xde_\xba\xec\x8d\x05\xdf\xcc\
-\x80T\xf8\xe3\xb4\x85$\x00\xa7\x17\xc2^~\xe6\xc15\
-\x97\xcd8{\x18\xdf\xf1\xd7?\xfb\xcf\x88\xcf\x04@\xbc\
-\x0b\xb0\xb1\xf0\x87N\xbc\xf1'\xc8W\xf8\x83y\x00\x15\
-5&\xfc\xf7\x95O\xae\xff\xf1\xd7\xcd\x1f\x05\xbaQ\x12\
-:\x0e\x92\x00\x9cF\x18>$s\xca+\xcf>\xb4<\
-\xa5[\x8c\xd2\xcao\xfd\xb5\xc0l5\x0b\x89?\xb3X\
-\xfc\xc3d\x84\x9d\x9e\xd3\x89S~Z1\xf3\xaf\xd5\x09\
-\xd6\xdf\xbb\xeb\xef\x9a\x8d\xbbro\xbe\xff\x7f\xe3\xe8\xb2\
-%\x81n\x97\x84\x8e\x83$\x00\xa7\x11n\xbd~\xf6\x82\
-G\xee\xbd\xfeZV\xf8\x83\x91\xdfb\x15<\x00\x8b\xd1\
-\xe8\x13\x00\xab\xd9(\x14\xfe \xc2\xeb\xc4\x8a?A:\
-\xc1\xfa\xf3\xec?\x89\x80\x5c\xa9\xc6\x0b\xef~\xf9\xe5\x05\
-\x9f|7\xc7)\x97_E\x83d8<\x9e\x0c:\x17\
-\xb8e\xb2=N\xb7\xfb\xe3\x8b\x81\xda@\xb7\xf7T\xc3\
-\xb7\xc0H\xb9\x5c>\xdd\xe3\xf1\xf4g\xff\x96Q_B\
-._q\xa1\xd3\xf9G\xa0\xbe\x93$\x00\xa7\x0f\xa2\xdf\
-\x9f\xff\xc4\xba\xa9\x93G\xf7\xb5\xb2\xe4\x9f\xc5\x02\xabx\
-\xeb\xaf\xd5$\x08\x80E<3\x923\xd7\x9f{\x01\x5c\
-\x08t\x14\xf3k\x05\x11 \xf7\xbf\xa4\xa2\xce\xfd\xe1\x7f\
-^}h\xe6\xe1\x92\xf3\xe5\x1aMO\xa5V\x0b\x05\x1d\
-\x1e\xa7\x13\x0e\x12\x13\x97\xc5R\xad\xf1x\x1e\x9ef\xb7\
-\xff\x18\xe8F\x9f\x0a\xf8\x1c\x08\xd2*\x14\xffv+\x95\
-W*4\x1a\x19\xebK\xd6\xa7.\x87\x03.\x0a\xd3<\
-\x0e\xc7\xe7\xda\xb8\xb8'\xa7\x1c>\xdc\xe97ZI\x02\
-p\x9a\xe0\xec\xf1\xa3.{\xee\xb1{\x96\xc4\xc4\x84\xc9\
-\xacV!\xfbo\xe5\x09@\xa3\x98\xf8\x13\x84\xc0a\xb7\
-\x08\xf3\xfd~\x1e\x80NC\x02\xc02\xffj5\x17\x80\
-\x95?m*\xd0\xbe\xfc\x89'\x22.N\xae\xef\xde\x1d\
-\x11\xbd{#4%\x05\xa6\xf2rT\xed\xdc\x09\xcb\xa1\
-C\xf0TUy\x5cv\xfb\xe3\x979\x1c\x0b %\x09\
-\x8f\x8a\x85\x91\x91\xc1\xba\x86\x86\x85\xd4\xd1\xc3\xe411\
-\xd0&%!,-\x0da\xc9\xc90\xd5\xd4\xa0f\xcf\
-\x1eXsr\xe0\xae\xaf\xdf]\xa4\xd3]swyy\
-\x0d:\xb1?%\x018M0\xf7\xb6k\xbe\xfa\xd7\x1d\
-W_l\xb7Y\x89\xec\x16N~3\xb9\xff\x02\xf1\x99\
-\x00\x98\xf8\x99\xfd\xe0\xfe\xee\xbfp\xdb\xaf`\xf9\xd9\x01\
-(\xf0\xc9\xe3o\x1a\xfa\xe6W\xd4\xa9h\x90\x86ed\
- \xb6\x7f\x7fD\x91\x10\xd4\x15\x15\xa1\x8c\x04\xa0\xfe\xc0\
-\x018\x0a\x0a\xa0\xac\xac\xf4\xc8\xed\xf6y\x97\x0a\x22 \
-\xa1\x19\xde\x07\x82\xc3\x94\xca\x85\x0e\x22\xbf\x87\xc8\xaf\x22\
-\xf2\x87\xa6\xa7#\xb6_?D\xa6\xa6\xa2\xbe\xb4\x14\xe5\
-\xbbw\xfb\xfaSVS\xb3\xb7B\xab\x9d\xd3\x99\x22 \
-\x09\xc0\xe9\x81\xc4\xc5\x1f\xbc\xb0a\xec\xc8\x01\xa9V\xee\
-\xfa\x0b\xf1?\x9b\x05\xb0Z\x0cb\x08 x\x00\x1a\xad\
-F\xb0\xfe:\xaf\xf5gI?\x0d\x9f\xf6c\x02\x90_\
-X\xe9\xf9\xe3\xbe\xffU\xa5\x84\x84Y\xb5d\xf5\xc3i\
-\xc0\xc63\x01\xa0\x01[SX\x88\xb2\xbd{Qw\xf0\
- \xac4`\xe5\x15\x15\xd0\x18\x0c\x1e\x85\xcb\xf5\xd8\xc5\
-n\xb7T&\xdc\x0f\xcc\xedW\xcad\x0b\x1d*\xd5p\
-[H\x08<\xb1\xb1\xd01Ae\xfdI\x02\x10A\x8f\
-\x1bH\x00\xca\xb2\xb2P+\xf6\xa7\x8c<,\x95\xd1\xb8\
-\xdb\xa9\xd1\x5c9\xa7\xbe\xbe\xbe3\xbe\xa7$\x00\xa7\x01\
-fM?\xfb\x96'\x1e\xbc\xed\xed\xd0P\x9d\xe0\xf6\x8b\
-\xf1?\x9b\xff\xb7\x99E\xebO\x02\xe0\xb4\xdb\x05\xd2\xeb\
-\xb4\x5c\x04\xd8\xb2_\xad8\xed\xe7=\x96\x7f\xb6\xdc\xa1\
-Y\xfcc\x8566\xd6\xad\x15\x07l\x02\x09\x00\xb3X\
-\xb5\xa2\x00\xf0\x01K\x8fQY\x09uC\x034\x0e\x87\
-G\xee\xf1\xfcg\x16\xf0I\xa0\xfb\xe2d\x00#\xbf\x9a\
-\xbc\x7f\xb7L6\xdc\xa6R\xc1\x1e\x1a\x0a\x19\x09\x80\x86\
-<\x80pQ\x00\xc2\xfd\x05\x80B*\xd6\x9fn\x12\x00\
-\xb1?w\xb8\x5c\xae\xabfwB\xf1\x15I\x00N}\
-\xc8\x1f\xb9\xf7\x96\xe5\xb7\xdfp\xe9T\xab\xcd\x8f\xfc\xfc\
-l\xe4[}1\xf2\xb33+\xfc\xc1\x89\xcf\xac?+\
-\x01\xc6n\xfca\xc4W\x09\xf1\xbf\xc3\xed\xc1\x97\x0f\xcd\
-7\xf6\xda\x7f\xb8\xd6\x15\x17\x07\x0d\x91>\xf4o\x04@\
-F\x1e\x80\x96\x06\xac\xca\xe9$\x87\xd5\xc3\x06\xd3\xbf\xbb\
-\xba\x08x\xc9O\xfe\xfbp\xe6\xc3\xbb\x94JXI\x00\
-<\xac?\x89\xf4\x7f'\x00\x9e\xb22hX\x7f\x92P\
-\x93\xa0nw\x00s:Z\x04$\x018\xc5\xa1\xd1\xa8\
-\xd3\xbe\xf8\xe8\xa5?\x06\xf7\xcf\x88\xb1\xda\xcc\xbe\xf8\xdf\
-\xca\x17\x02\x19\xb9\xf5\xb7Y\x84\xb3\x86\x5c}o\xdc\xaf\
-e^\x00\xbb\xf1G\xa5\x16E@\x8dC9\xc5\x9e}\
-\xb7>^\x91\x0c\x99\xddA\x16KI\x835\xacwo\
-_\x08\xc0\x04\xa0T\x0c\x01\xecyyP\xd2\x00V\x99\
-L\x90\xbb\xdd\xfe_\xe9?\x17\x03]2\x1c\xe0n?\
-\x91\x1fl\xdaT\x84G.\x87\x93\xfa\xdc\x11\x1f\x0fu\
-\xcf\x9e\x08\xcd\xc88\x22\x04\xa8#\x01\xb0\xe4\xe7CN\
-\xfff\x02 'Ae\xc4$\x01\xd9\xee\xea`\x11\x90\
-\x04\xe0\x14\xc7\x9c\xd9\x17<\xfc\xf0\xdc\x1b\x9e\xd1jT\
-`\x95\x7f\x99\x00X\xe8l#b\xb2\xc5@\xdc\x03 \
-\x01p9\x1d\x02\xf1\xfd\xc8\xaf\xf1&\xff\x94L\x04\xd4\
-\xf8\xee\x83\xa5\xf6\xc4\x8f\x96V\xa8\xe4r\x8f;,\x0c\
-\xa0\xc1\x1a:x0\xe2\x07\x0d\x22\x0f \x05\xb5\x05b\
-\x0e\x80\x06\xad\x8bD@I!\x80\x9c\xacU\x0b\x83\xa8\
-\xcb\x89@K\xe4g`^\x80\x87\xbc\x00WD\x04\xe4\
-}\xfa \x84\xc8\x1f?\xa0\xbf(\x00e(g\x1e\xc0\
-\xfe\xfdpdgsAUZ\xad\x80\x9f\xa0v\xb4\x08\
-H\x02pjC\xf5\xdf\x7f\xdf\xb5\xfa\xda\xcb\xa7\x9f\xc5\
-\xac\xbe\xcdb\x05\x9b\x02\xe4\x1e\x80\xb9Q\x00l\xe4\x0d\
-\xc8\xe5\xa2\xfb\xcf\x5c\x7f\x8d\x96\x9f\xbdq\xbf\x92\xac\xbf\
-\xcd\xe1\xc6\xf7\xf7\xbf`\xe8\xb7#\xab\x8e\xa7\x9f)v\
-\x95%$ \xf8\xcc\xd1H\x18;\x1a\xd1=\x92QS\
-T\x82\xe2\xad;a\xd8\xfa\x17@\x03VN\x22\xe3i\
-j\xfd}\xa0k<v)\xb0 \xd0\x1d\xd4\x19\xf8\x16\
-\x08v\x0a\xa1\xcf\xf0\x16_@\xa1\x97\x9b\xfa[\xde=\
-\x15!\xa3F\xa0\xdb\x88!\x14\x02$\xa1\xae\xb4\x1a\xa5\
-\xbb\xf6\xa0~\xfb\x0e\xb8\xf7\xed\x83\xbc\xae\x0e2\x97\xab\
-\xa5+t\x98\x08H\x02p\x0a#:*r\xc0\xa7\xef\
->\xbb\xa1Wzr\x88@~\x22>\x9f\x064q\xd2\
-\x0b\xd6\xdf\xc4\xf7\xfcc\x84\xe7V_\xab\xe3\xf1\xbfV\
-+\x10\x9fg\xff\xe9\xbcoo\xae;\xff\xce'+\x92\
-]n\x07\xbf8\x0dZyp\x10\x82\x87\xf5G\xf7\x8b\
-'!\xbaW,\x0d\xd8\x06\xe4\xaf\xd9\x81\xda5\x1b\xe1\
-.\xaf\xa4\x00\xd7\xf5\xb7\xdf\xaf+\x88\xc01\xc9\xef\x85\
-B\x0eEL$b&\x8f@\xea9C\xa0\x8b\x8bG\
-u\x89\x03\x05\xeb\xb7\xa3a\xfdFx\x0a\x8b\x00\xf2\xa6\
-X.\xe5(\xe8\x10\x11\x90\x04\xe0\x14\xc6\x8d\xd7\x5c\xf2\
-\xfc}w^{\xbfB\xee!\xa2[\x05\xf2sO\x80\
-Y~\xb3p\xa6\xc3\xedr\x12\xf1\xb5\xa2\x08hy\xe6\
-\x9f\xb9\xff\x0a\x91\xfc\xec\xf8\xe6\xad%\xb6\x1e\x8b\x7f\xa8\
-T\x88\xf3\xcf2\xf2\x184\xe1z\xc4\x8d\xc9@\xf7Y\
-\xc3\x105\xeev\x18\xf7\x7f\x85\xbce\x7f\xa2h\xc5\x0e\
-X\xca\xea\xe0q\xba[\xf35O[\x11`\xe4w\xb4\
-\x86\xfc\xc42\x05\x85h\xe1\x19\xd1H\x99>\x08\xc9\x97\
-\xdcBO\xb9Q\xbd\xffO\xe4|\xb7\x1d\x95k\xb6\xc2\
-Y[O\xae\xff1\xa7\xfe\xb7\xbb\xdbY\x04$\x018\
-u\xa1{\xf1\xe9\x07\xd7]4}\xe2pNz+#\
-\xbf\x10\x02\x08\xc4o<\xb3\xba\x7f>\x0f\x80%\x02\xd9\
-RT\x8a\xf9\x95J\xc1\x030\x99m\xf8\xe9\xfe\xe7\xea\
-\xfb\xee\xcbm`\x17f\xe4W\x87i\x1130\x01\xc9\
-S\xfa\xa2\xdb\xb5\xafC\x96\xd8\x1d\xa8(G\xf5w\x0f\
-!\xff\x87\xcd(\xdbT\x08K\xb5\xa9U\x22@\x83l\
-\xde%\xc0iuW\xa1H~\x16\xf3\x0f;V\xe3\x19\
-\xf9\xc3zD \xf9\xect$\xcf\xb9\x17\xda\xe13y\
-\x9co\xdb\xfc\x05\x0a\xbf]\x80\xfc\xe5\xbb\xd1\x90[\x0d\
-\x97\xdd\xd9\x9a\xe5?\xed*\x02\x92\x00\x9c\xa2\xe8\xd3\xab\
-\xc7\x99o\xbc\xf0\x9f5\xc9\x89\xb1ZF~.\x00,\
-\xf9\xc7\x04\xc0k\xfd\xe9\xb1\x9d\xc4\x81\xb9\xfb\xcc\x03\xd0\
-h\x04\xd7_\xc3v\xfb!\xab\xaf\x10\xad\xff\xaem\xfb\
-\xdd\x95\xffz\xb6<\x01pz\xc9\x1fM\xe4O9\xa7\
-\x0f\x12\xaf}\x032\x0f\xf9\x05\x87\x0e\x01\x93&q\x11\
-\xa8\xfc\xfa~\x14\xae\xdc\x8a\xd2\xcdE\xb0\x92\x08\xb8[\
-\xe7\x09\xcc\xbb\xec4\x11\x01F~{\x9b\xc9\x9f\x86\x94\
-\xab\xe6B;t\x06\xb0z50n\x1c\xe8\xc7\x80e\
-\xfd'(\xfc\xea\x03\x14\xac\xcdF\xc3\xe1\xdaV\x8b\x80\
-\xa7\x9dD@\x12\x80S\x14\xb7\xdf|\xd5\xbbw\xdct\
-\xf9M\xf0\xb8x\xf2\xcff\x13<\x00\x9b\xd5\xcf\xfa\x93\
-\x00x(N\x17b\x7f\x8dO\x00\xd8\xcd@J\x95\x8a\
-\xe7\x00\x14\xe4\x05|\xfb\xda\xa7\xd6^K\x7f\xaa\x94\xb7\
-D~\x0b\xd9\xb9oi\xc8\xb3\xb9\xfea4\xde\xa7L\
-i\x22\x02e$\x02\x96V\x8a\x00\xf3\x04.=\xc5E\
-\xe0\xb8\xc9\x7f\x05\x91\xff\x0c\xb2\xfcK\x97\x02\xb9\xb9@\
-D\x04p\xd5U\x5c\x04\xcc\xeb>F\xd1\xd7\x1f\x06D\
-\x04$\x0185\x11\xfa\xe6\x8b\x8f\xfd1y\xc2\xc8L\
-n\xfdmV>\x05h\xe3\xf1\xbf\xc5G~v\xa8\x14\
-J\x1f\xf95>\xeb\xaf\x12\x13\x80j\xd4\x1a,X?\
-\xf7\xe9\xda>\x05\xa5F\xaf\xdb\xef#\x7f-\x8d\xad\x15\
-+\x9aLK\xe1\x8c3\x80\xc9\x93E\x11\xb8\x0f\x05+\
-\xffj\x93\x08\xd0\xa0\x9dw\xf9)*\x02\x8c\xfc\xb66\
-\x92?\x85\x93\xff\x1e\x22\xff,\xe0\xfb\xef\x81\x83\x07\x1b\
-_\xc7D\xe0\xca+\x05\x11`\x9e\x00\x89@!\x89@\
-}\x1bD\x00'(\x02\x92\x00\x9c\x82\x183j\xe8y\
-O\xfd\xe7\xeee\xf1\xd1\xe1\x0a\x81\xfc\xcc\xfd\xb7q\xe2\
-\xdb\xbdI@:;\xe8y\x9f\xd5\xd7hx\xfc\xaf\x16\
-\x17\xfdp\x0f\x80\xac\xff\xb6?v\xba\xac\xf3\xe6\x97w\
-\x0b\xd3\xba\x9a\x90\xbf\xb4RpU[\xc2\xc8\x91~\xe1\
-\x00\x89\xc0\x8f$\x02\x9bNo\x118^\xf2'_~\
-\x17tg\x5c\x04,_\x0e\xec\xdf\x7f\xe4\xeb\x99\x08\x5c\
-q\x85 \x02\xbf/\xect\x11\x90\x04\xe0\x14\xc4\xdc\xdb\
-\xfe\xb1\xe4\xa6k/\x9a\xcd\x16\xf7\xd8\x88\xf8V\xd1\x03\
-\xb0[,b\xdco\xe6a\x00\x1b=\x1a\x91\xf8\xc2\xa1\
-\xe5V_%\x92_N\xde\xc1\xf7\xf3?\xb6\x0c\xda\xb0\
-\xa9\xcaK\xfe$\x96\xf0\xcb\xce\x87g\xe3\x86\xbf\x99\x91\
-\xa2\x813z4d\x13'\xc2C\x22P\xb5\xf4~.\
-\x02\xa5m\x10\x01\x1ax\x8f\xd3\xa0\xfd0\xd0}\xd9\x1a\
-x\xc9\xefi%\xf9\xc3}\xe4\xbf\x13\xba\xe1\x17\xc1\xb3\
-\xeaGxv\xef9\xfa\xdb\x22#!\xf3\x8a\xc0\x86O\
-\xb9\x08\x14\xb4A\x04d' \x02\x92\x00\x9cz\x88\xfe\
-\xf0\x8d\xa77\x8d\x1c\xde\xbf\xa7\x9d\xb9\xffv\x1b\x17\x01\
-\xc1\xe5\xb7\xf8\xc8\xcf<\x01Ft\x8dZ\xcd\x89/x\
-\x00B\xcc\xcf=\x00\xa5\x12UuFl\x7f\xe4\x7f\xd5\
-\xe3\x92\xb5fn\xf9\xafy\x0d\xb2=\xfb\xe1\xde\xb6\x0d\
-\x9ecOIA1f\x0cd\xe3\xc7\xc3SY\x81\xaa\
-o\x1e8-E\xe0\xb8\xc9?\x9b\x91\x7f\x16<kV\
-\xc3\xbd}\xfb\xdf\x8a)\x7f;\x89\x80\x82\x85\x03\xf4;\
-\x997.B\xe1\xd2\x8f:E\x04$\x018\xc50\xf5\
-\x9c\xb3\xaexh\xee\x8d\x8b\x22B\x83dv\xbb`\xfd\
-\xed$\x00\xdc\xf5\x17\xb3\xfe\xec\xcc\xf6\xfc\xe3.\xbfF\
-\xb8\xd1\x87\x8b\x80\x9a\x09\x80\x0a*\xa5\x90\x03\xd8\xf2\xdb\
-\x16g\xe2\xaf+\xcb\x07O\xeb\xe7N\x9c\xf3\x0ad\xdb\
-v\xc3\xb5w\xaf@\xfec\x8dX\x066\xe8\xc7\x9d\x05\
-\xf9\xb8q\x5c\x04*\xbf}\xb0\xcd\x22@x\x82l\xdf\
-\x07\x81\xee\xd7\x96\xc0\xc8O~\xd4BY\x1b\xc9\x9f2\
-\xfb\x0e\xe8\x86\xcd\x82\xfb\xb7\xb5pm\xde\xda\xba\xbe$\
-\xc8\xa3\xa2\x1aE\xe0\x8f\xcfP\xd0F\x11 l\x97\xb7\
-Q\x04$\x018\xc5\xf0\xe0=7\xfd0g\xf6\xb4\xf3\
-\x1dv\xbb`\xf9\x19\xf9y\x08`\xe6!\x80\x9d%\x03\
-\xc9\x03`?\xacW\x00\x98\x17\xa0\xd6h|q?\xf3\
-\x0c<P`\xed\xc2/\xccs\xfa\xab\xaa\x13\xafx\x11\
-\xb2M\x7f\xc1\x99\x9d\x0d\xb7\xab\x95\xe4\xf7\x82>HI\
-^\x80b\xccXx\xaa+Q\xf9\xcdC(Xu\xea\
-\x8b\xc0q\x93\xff\xd2\xdb\xb8\xdb\xef\xfe}=\x9c\x7f\xfc\
-\xd1*O\xca\x1f\x8a\xe8((\xaf\x10\x13\x83\x7f2\x11\
-X\xd0\xa1\x22 \x09\xc0\xa9\x85\xc4\x85\xef>\xbfe@\
-\xdf\x9e\x09v\x9b]p\xff\xed\xe4\x01X\x99\x17`\x16\
-\xceb(\xa0&\x92\xabD\xb7_\xc3\xd7\xfc\x0bY\x7f\
-\x85B\xc5\x05\xa0\xbc\xb2\xde\xe3\xda\xbc\xa2j\xe6=\xaf\
-Y\xb1a\x13\x9c\x05\x85D~\xb7\xc0\xfd6\x09\x80\x8c\
-\x0f\x22\xd5\xc4\x89P\x9cy\xa6 \x02\xdf2\x11\xd8\x86\
-\x92V\x88\x80\xa7\xf1\xfc\xe4\x1c^D'\xf0\xf0\x92\x1f\
-m \x7f\xaa\x97\xfc\xc3f\xc2\xfd\xe7\x1fp\xac\xff\x1d\
-\xee\xd6zR\xcd\xfaSI\x22\xa0\xf2\x8a\xc0\xa6\xc5\x5c\
-\x04\xf2\xdb(\x02\x8aV\x8a\x80$\x00\xa7\x10.\xbb\xe8\
-\xbc;o\xbb\xf1\x8aW\x83u\x1aN~;\x8f\xff\xad\
-\xdc\x03p\xf0\xf8\xdf\xc2=\x01\x97\xc3\xc9\x89\xaf\x16\xeb\
-\xfc\xf1\x92_\xa2\xf5W\xa8\x94$\x02j\xec\xda\xba\xdd\
-q\xd9\xb4\xcb+\xc2\xb6\xefq;K\xcb\xe0r2\xf2\
-{\x8e\xbb\x10\x95\x8c\x06\xae\xfa\xecIP\x8e\x1a\x0dO\
-M\x15*\xbf{\x98D`;\x89@\xe1QE\xa0\xf9\
-G\xb9\x80\xff^\x03\xbc\x17\xc8>f\xe47\xf9\x91\xff\
-\xa8\x049\x82\xfc\xb7B7d&\x5c[\xb7\xc0\xbev\
-\xed\xf1\x91\xbf\xb13\xa1\x8c\x89\x86\xe6\x0a1\x1c\xd8\xbc\
-\x04\x05\xdf|\xdc!\x22 \x09\xc0I\x8ay\xf3\xe6\xc9\
-G\x8e\x1c\xf9JN\xce\xc1\x9fW,\xf9\xa0\xa2\xbc\xaa\
-\xd6<e\xda\xb47.\x9by\xce8\xe6\xfe[}\x02\
-`\xe3n\xbf\x83\x93_8\xcb\xe9WU\x8bV_#\
-\xe6\x00X\xec\xaf\xa4\x83\x9d\x99\x97\x9f\xb3\xaf\xd8\xf4\x8f\
-\xd0\x98\x1aGe5\xdc\x0e\x91\xfc'\x0a\xfa\x5c\xcd\xe4\
-\xc9P\x8d\x1c\x05Om5\x17\x81\xfc\xa3\x88@K\x9f\
-\xc6\x9e\xa3W<u\xad \x02\x9d^h\xf4m $\
-XX\xdb\xdf\xc4\xf2\x1fA\x12\x16\xf6\x88S}\x8c\xfc\
-\xa9\x97\xdcB\xe4\x9f\x05\xd7\x8em\xb0\xfd\xfc\xb3\x10F\
-\xb5\x03\x94\xb11\xd0rO@\x03\xd3\x96\xcf\xc9\x13h\
-\xbb\x08(\x8f!\x02\x92\x00\x9c\xa4x\xef\xbd\xf7\xe2\x86\
-\x0f\x1f^\x9a\x94\x94$\xfbs\xcdR\x98\x0a\xb7\xc0b\
-wy4a\xd12\x95>\x1ca\x11\x11d\xb5]\xdc\
-\xfa3\x01\xe0gq\xee\x9fe\xf9\xb9\xe5\x17\x0f\xee\xfe\
-\x8b\xe4g\xd9\xff\xb2\xca:O\xe2\xfe\xf2\x8a!\xfa`\
-\xbb\xab\xbd\xc8\xef\x05\x8d(\xdd\x94)P\x9d1\x02\x9e\
-\xba\x1a\x12\x81\x87\x90\xff\xd3\xce&\x22\xd0\xfc\xd3<\xcd\
-\xce\xe4\x09<}\x1d\xf0.:Q\x04^\x02B\xa3\x89\
-\xfc\xf4\xf5\x87\xb6D\x0a\x99\xdf\x83&\xe4\xbf\xf8&\x81\
-\xfc\xbbw\xc2\xb2\xf2\xc7v#\xbf\x17*\x12\x01\xdd\x95\
-\xc2\x8aA\xd3\xd6\xf6\x17\x01I\x00NR\x0c\x1f\x9e\x1a\
-?$\xa3\xcf\x81a\xe3.\x08\x9d1\xebbd\xed\xd9\
-\x89\xea\xac\x95P\xb8-\xfc\xef\x0d\x16'\xdcJ\x1d\x5c\
-r\x0d\xf4AAd\xc5\x85\x99\x00\xb7\xcb\xd5\x84\xf8j\
-\xb5\x98\xfcS(}^\xc0\x9e-Y\x8e\xd9.m\xb9\
-\x8a\x15\x9ejc\x92\xaa5\x901\x11\x98:\x15\xea\xe1\
-g\x08\x22\xf0\xfd\xc3\xc8\xf3\x13\x01W3O\xa0\xb9\x00\
-\xb03\x0d\xedgo\x02\xde\x01w\x0a:\x16\x8c\xfc\x11\
-D~9\x91\x9f\x7f\x7fo;Zh\x97\xd2\xdf\xed'\
-\xf2\xeb\x07\xcd\x843k\x0f\xcc?,\xe79\x94\x8e\x80\
-*.\x16AL\x04\xc8\x9b3\xfd\xf5\x05\x85\x03\x9fp\
-\x11\xa8k\xa5\x08\xb0\xa2\x22\xea\xa3\x88\x80$\x00')\
-\xee\x9es\xf6\xed\x15U5\xaf\xd7\xd6\xd4#\xbe\xd70\
-\xdcu\xef\xc3\xbc\x98\xe7\xde?\xbe\x87\xac\xfe0\xd8\xcf\
-\xca\x7fw\xb2\xde\xb5F;L\x0e\x99\x98\xe9W\x0a[\
-|\xa9U\x82\x08\xa8D\xf7\x9f\xc7\xfe*\xd8\x89|\xc5\
-\xbfn7^\x1a\x1a[\xeb\xee\x00\xf2{\xc1r\x02A\
-\xd3H\x04\x86\x91\x08\xd43\x11x\xc4'\x02f?O\
-\xc0\x9f\xf4\xcd\x85\xc0F\x22pk\x07\x8b\xc03@X\
-\xbc\x90\xed\x1f\xcc\xbf7\x9a\x0a\x80\xbf\xe5W\xf9\x93\xff\
-\xa2\x1b\x04\xf2\x1f\xdc\x0f\xd3w\xdfS{\x5c\xc7\x1d\xf2\
-\x1f\xbb/)\xa4\x8b\x8bk\x14\x81m_\x1e\x97\x08\xd0\
-\xe9\xaa\xab\x01c\x93kwT\xc7J81\xfc\xdf\xdc\
-\x0b\xdeVX\x1an\xf9e[\x01\xdc\x0a\x0d\xc2\xa3\xe3\
-1c\xf6\x8d\x181j\x14\xb2\xb3\xb6\x91\x0b\xf8'\x94\
-n\xa3O\x04\x18*j\xcd09\xe5\x88\x89\x89%1\
-Ps\x11`\xe5\xbe\x14J\x81\xfc,\x01XZR\xed\
-\xe9\xb1=\xbf<3\x22\xd2\xd1\xd1\xfe5\x13\x81\xe0\xf3\
-\xcf\x83f\xe8px\x1a\xeaP\xb1\xac\xa9\x08\xb8\xfcD\
-\xa0\xf9\xe1\x85\x1dx\xeev\x1e\x9e\xc3u\x1c_\xe1o\
-1\x0f\x08O\x12,\xff`\xdfwn\xe1\x80\x9f\xe5\xef\
-\xce\xdc\xfe\x8b\xae\x87n \x91?\xe7 \x8cK\xbf%\
-\xef\xcb\xd9a\xe4o\xecK\xe2~|<\x17\x01\x19\x13\
-\x81\xed_\x22\xff\x9b\x85m\x12\x01\xc2W$\x00\xf76\
-\xb9n\xc7~m\x09\xc7\x8b\xf9wM.5\x99m\xf1\
-\xf5\xc4\x80\x90\xf0H\xec=T\x02\x87G\x8e\xf4\xfe\xa3\
-0e\xda\x0cDFF\xa2(w/LE\xdb\xa0p\
-\x19|\x22\xc0\xe2\xf9\xb2\x1a3\x0d\x92P\xc4\xc7\xc7q\
-\xf7_\xce\xe2\x7f\x16\x02\xd0\xb1\xf7\x8f]\xf6\xcb\xdd\xfa\
-\x0a\x95L\xde9\x1bO\xc8I\x04\xa6O\x87f\xc8\x10\
-\x8a[\xeaQ\xb1\xfcQ\xe4\xad\x22\x11\xd8\x5c\x08c\x95\
-\xe0\x090\xf3.&\x00\x8f\xf0\x04\xd8\x00\xa5\xa0\xe7\x7f\
-\xf7\x00o\xa2\x1dE\x80X\x10\xd9\x0b\xf8\x98\xc8?\x08\
-h$\x82\x1c\xcd\x04\xc0\xcf\xf2\xfb\xc8?`\x06\x9c\x87\
-s`\xf8\xeak\x91x\x9d\x94\xaa\xa0/\xa3\xa1\xdf4\
-d\xce\x1c\xfa}\xb5\xdc\x13\xc8\xff\xb6m\x22@\x7f\xbe\
-\xe6\x1a\xe0W\xdf%;\xe7\x9bKh\x0b^\xbfs\xd2\
-\xd5N\xa7\xe3\xe3}\xc5\x06\xd9\xe4\x09#)nW\xa0\
-\xba\xce\x80?v\xe6\xc2h\xb2C\xa5\x0dF\xef\x81\xa3\
-0|\xf4Y\x88\x88\x88@y\xe1!\x98KwB\xe5\
-\x14\xf6\x92`\x22\xe0\xb4\xdaPeS\x22>\xb9;\xdf\
-\xf1W\xa1P\xc0J\x03\xa4v\xed\xce\x86\x0b\xc2\xa2;\
-e\xd3\x09/d\x0a9B.\x98\x0e\xed 2\xb4\xc6\
-\x06\x12\x81\x7f\xe30\x89@\x11\x89\x80\x89D\xc0)\x8a\
-\x80\xbf\x004\x1f\xc7$\x02/\xde\x07\xbc\x01\x9e\x1e8\
-1\xdc\x01D\xf5\x11\xc8?\xd0\xfb\x9c?\xf1\xe5\xde\x7f\
-\x8b\xe4\x8f\x10\xc9\xdf}\xd6u\xd0\xf5\xbf\x10\xce\x82<\
-\xd4\x7f\xf1%\xdc6G\xfb&P[\xd3\x97L\x04\x12\
-\xe2\x11v\xfd\x0d\xfc\xcb\x9a\xb6\x7f\x8d<\x0a\x07\x0e\xaf\
->\x84\xfa\x82:\xb8\xed\xc7\xd4\xc8\xaf\xae\xf1\xf3\x02$\
-\x018\xc9\xf0\xc6\xddgG\xbb\x9c\xce\xac\xec2\x83:\
-#\xa3gXrb\x1cx\xbcO\xe3\xcc\xe9ra[\
-V\x01\x0e\x17U\xf1\x81\xa7\xd4\x04!\xad\xdf\x19\x18:\
-b,\xc2\xc3\xc3Q[U\x0ekm\x01\xc2\x94V\x98\
-w\xae\xe3\x84\xaa\x0cM@hL\x0a\xc2#\xc2QR\
-T\xe1\xce\xdcSR\x9e\x16\x1e~\xc2$j+\xe4r\
-9B/\xbc\x80D\x808g4p\x11\xc8\xf9i\x17\
-\x8aEO\x80\x89\x00\x1b\xba\xcd\x85\x80\xc1KL3\xf0\
-\xd2\x83\xa4\x8f8\x01\x11\xb8\x85\xc8\x9f)\xb8\xfd\x03\xd0\
-\xec\xfar\xff\x83\xc5\xdd\x22\xf9{0\xf2\xcf\xbcV \
-\x7fQ!\xea?\xff\x82\x0bl's\xdf\x07eH\x08\
-b\xee\x158\xec\xae\xabB\xd5\xeaG\x90\xff\xf3!\xe4\
-\xfd\x9aC\xbf\xbf\xe5X^\xc0^\x12\x80\xf3\xfc\xdb.\
-\xe1$\xc2kwN\xfc\xc4`\xb2N\xc8.7\x07_\
-x\xde\xb8\x08\xfek\x8a?\xa8\xd7\xda\x18\xcdV\xec\xcd\
-.A^q5\x7fN\xa1\xd1\xa3{z\x7f\xf4\xec3\
-\x98\x88\x1e\xc9\x17\xfd\x98h`4\x94\x1e\x84\xb96\x1f\
-\xa1A*@\x1f\x8f\xaa\x9c2\xdbU\x9e\xa0\x0a\xb6A\
-H\xa7\x83\xad\x18$O l\xc6\x05\xe4B\x0f\x84\xc7\
-l$\x11\xf8\x0f\x17\x01\xe6\x094\x1cE\x04|o\x87\
-@L\x13\xf0\xf2#\xd4M8\x0e\x11 \x9b\x19\xdd_\
-\xb0\xfc\x03Z\xba\xb6\x02M\xc9\x1fE\xe4\xef\xc9\xdc\xfe\
-\x99\xd7@\xdf\xefB8J\x8aQ\xbfd\x09\x1c&k\
-\xe7\xb9\xfd- d\xd80\x84\xcc\x98\xc1\x1f;\x0aw\
-\xa3v\xf3\xeb( \x018\xbc\x96\x09\x80\xf9X\x02\xb0\
-\x8f\x04\xe0\x5c\xff\xb6K8I\xf0\xfa]\x93z\xbb]\
-\xae\xfd\xbf\xed\xc8[;v\xec\x19\x19=\x93\xe3\x93\xd8\
-\xf3\xfe\x89>\xaf7\xc0\xce\xac\x96_VN)\xf7\x08\
-\x5c\x1e7B\xc2\xa2\x10\x15\x11\xcb\xa7\xfa\x12\xfb\x0cE\
-Hh\x18\xb7\xbcl{0\x87\xb1\x14\xd6\x83\xf9\x96\x8b\
-d\xfa*\x99\xbb\xc3g\xd6Z\x86(\x02\xe13g\x90\
-5%\x03l!\x11X\xf1\x18\x0e\x91\x08\x14\x88\x22\xe0\
-\x10E\xc0\x85#\xbd\x00\xafu6\x00\xaf\xce\x03^A\
-\x1bD\xe0Z \xa6\x1f\x91\x9fH\xde\xdf\xff\xba>w\
-\x1f\x82\x00(X\xb2M$\x7f:\xb3\xfc3\x88\xfc\x99\
-\xd3\xe1(+E-#\xbf\xc1\x1cP\xf2+\xc3B\x11\
-w\xcb?!\x0b\x0ef\xdb\x8a\xc3\xb8\xe9\x1d\x14\xaf[\
-\x8b\x9cU\x07P\x97+\xe6\x01\xfe\xee'\x00\x96\x92\x00\
-\xdc\xe3\xf7o\x09'\x0b\xc8\xfa\xdf\xe3r\xba\xfe\xfd\xe3\
-\xa6\xec\x1dW\xcd\x9e6.4X\xa7\xe6\x7f\xf0x\x8e\
-*\x02\xecl&w\xb4\xb2\xc1\x05\x83]\x8d\xbd\xbf\xff\
-\xc2\xd7\x02\xd4\x10\xc7cI?R\xd33\x11\x9b\xd2\x9b\
-\x97\x05cp\x99\xcd\xee\xd4\xdaZ\xe3\xa0\xca\xcaN\xcd\
-\x03\xf8C\xa6T r\x16\x89@?\xb2\xc7\x163\xca\
-W\xfe\x87D`7\xf2H\x04\xeaE\x11`\xc3\xd8?\
-\x14\xf0w\xd3\x19QI\x04^{B\x10\x01\xc7\xb1>\
-\xef*\xea\x8aAD~z\x7f\xbf\xe6\x9e\x85\xdc\xef\x9a\
-\x8c\xfcl\x83\x95h\x22\x7f\x06#\xff\x85s\x10\xc4\xc8\
-\xcf\x8a\xa1.^\x02g\x831\x90\xdc'OO\x8d\xf8\
-[n\x81\x22&\x16\x1e\xbb\x1d\xa6m\x8bP\xf4\xcb\x0f\
-\xc8[\x93\x8d\x9a\x9c\x1a\x0aK\xec\xad\xb9m\xf8&\x12\
-\x80U~\xff\x96p\xb2\xe0\xd5;&,/\xaf6h\
-v\xe6U\x97\xde|5\x8d>\x8fo\xb6\xbfI\x96\xdf\
-\xff\xcc^\xc1,\x7f\xffac\x91\xf3\xfbrdm\xde\
-\x8a=Uf\x1c\xa6X\x90\xad\xf9W\xaaU\xf4#\xcb\
-\x11\x1d\xdf\x0dQ\xf1\xdd\xa1\x0f\x8f\x87N\xa1p\xcf\xc8\
-\xce)\x0e\xe4hf\x22\x10u\xd1L\xe8\xfbRDn\
-\xb7\xa2l\xe5c8\xf0\xf3n\x1c\xdeT\x88:\x12\x01\
-{\xb3p\x80\xa1\x09Y\xc1\xc3\x81\xd7I\x04^\xc6\xdf\
-\x88\xc0l n0\xb0\x80\x91\xdf\xdf\xabh.(^\
-\xf2\xc7\x12\xf9{\x11\xf9{^x\x15\xf4}\xce\x87\xa3\
-\xaa\x0a5\x9f}\x06{\xbd!\xa0\xe4gQ[\xb7\xeb\
-\xaf\x83\xaaG\x1a\xb7\xfc^\xf2\x1f\xf6\x91\xdfqL\xcf\
-\x84\xfe\xfa\xfdu<\x07\xeaw\xdd\xc05I\x82\x17\x0b\
-\x17.\xec\xa5T*/\xae\xdc\xf8\xc1\x8d{s\x8a\xb7\
-k\xc3\xa2B\xcf\x1e7\xf4\x1c\xdf\x0b\x9ay\x00\xfe\x22\
-\xa0\xd3\x07a\xd0\xc8\x890\x96\xe7 k\xcd*\xd8\x1a\
-\x0c8ds\xa1W\x9f~\xa8\xac\xa8D\xa5\xd1\x86\xc2\
-\xb2ZX\x1c\x1e\xbe)\xe8\xde\xed{=\x97g\x0c\xac\
-\x9d\x99\x98br\xb3P\xa0\x93\x07u\x93\xd8[\xa5D\
-\x0c\x89\x80\xaeo_\xc8H\x04J\x7f|\x1c\xfbI\x04\
-rH\x04j\x9b\x89\x80\x17\xfe\x02\xc0\x0e#\xf0\xe6S\
-|1\x1f[2\xd0\x14S\x81\x841\xc0G\xf4\xbaL\
-v\x8d\xe6\x02\xe0\xbd\x96R$\x7f\x1c\x91\xbf\x8fH\xfe\
-\xa0\xde\xe7\xc1QS\x83*F\xfe\x9a\x06\xde\xd7\x01#\
-\x0b\xb1?\xfe\xa2\x8b\xa0\x1b:\x94\xc8o\x87q\xfbg\
-(\xfeey\x9b\xc8O\xd8K}0\xfbz\xa0\xa1\xc9\
-\xa5\x03\xd5&\x09\x8dX\xb1b\xc5\xf7g\x9du\xd6\x05\
-\x87\x0eda\xd1\x9b\xff\xcdN\xeb\x16\x9c\x98\xd4-V\
-\xe7u\xf39\xfcD\xc0{Vk\xb5\x18<b\x02,\
-\xb5\xa5(\xcd\xcdB\xc9_\xdba\xa1\x9f\xb4\xd0\xe1\xc6\
-\xd83\xcfB\xe1\xe1C\xd0\x86\x86\xf0\xb7\xbbd*\xd4\
-[=X\xf2\xe9w\xee\x19\xe9\xfd\xea.\xeb\x99n\xb2\
-\x1a\xed\xad\xbd_\xbf\xdd\xd0|\x98*\xc8Ca\x9e@\
-P\x9f>\x909l(^\xf58\xb2~\xde\x83lQ\
-\x04l~\xeb\x04|\xef\x81@^\xa5\xf8\x98b\x99\xb7\
-\x9e\x17D\xc0\xe6}\x0d\xa9g\xb7\xb1\xc0\x87\xf4\xba\xcc\
-\x96\x12\x8b\xfe\x96_G\xe4O\x10\xc9\x9f1\xfd\x0a\x81\
-\xfc\xb5\xb5\xa8\xfcl1l\xd5u>\xc1\x0d\x04Y\x98\
-\xe5\x8f\x9e8\x11\xa1\x93\xcf\x11b\xfe\x1d\x8b\x88\xfc+\
-\x90\xdbF\xf2SHu\xc5M@\xdd\x11\xd7\x0f@\x9b\
-$4\xc3\x8d7\xde8 \xadg\xcfUW\x5cye\
-\x02K\xdam[\xb7\x0c\x0aC6\xf8\x90m\x16\x06x\
-\xc9\xcf\xf6\xf4\x1b8b<\x1c\x0d\x95\xa8*9\x84\x82\
-\xdd\x07\xe0\xaa\xabA\x01\x91_\x15\x12\x8a\xc1\x03\x87\xe2\
-\xf0\xa1,\x04GD\xf2\xf7\x07\x05\x87 \xae[\x22>\
-\x98\xff\x8e\xfb\xb9\x99\xe7\x14\xbbk\xb5|\xfa\xcdj\xb0\
-\xf1\x1bX:{>\xdb\x0b\x0f\x8dp\xb6B1\xe6\x92\
-\x8b\xa0\xef\xd5\x0b2'\x89\xc0OOb/\x89\xc0A\
-\x12\x81\x1a\xd1\x13\xf0\x92\xb7\xb9\xeb\xee\x15\x81\x1a\xe0=\
-\x8a\x05^\xa0\x87\x96q@\xf2\x04\xe0}\xfa[_o\
-B\xd1\x9f\xfc\xbe\xf7\xd3\x03\xbdH\xfe~D\xfe^\xd3\
-/\xa7\xef0\x15\x8e\xbazT,&\xf2W\xd6\xb4f\
-\xb7\x9e\x0e\x03[D\x15>x\x10\xa2/\xb9\x0c\x1e\x97\
-\x93\xc8\xffY\xbb\x92\xdf\xdb\x17\x12\x02\x07\xd9\x9c\xe9\xa3\
-'\x1a\xcc\xb6\xbb\x1c\x0e\xdb\xe4\xe0\xb0\xb8\xa0\x1b\xefz\
-\x08\x83\x06\x0dB\xd6\xee\xbfPw\xe8W\x1a\xe0\xb6&\
-\x22\xc0\x88\xca\x96\xf7\xf6HNCM\xc1A4T\x16\
-\xc3Tg\x80\x9b\xed\x0b(W \xcfbGFF/\
-t\x8bOD\xce\xc1\xbd\x08\x8d\x8a\xe2\xef\x09\x09\x0bC\
-Dd\x0c>\x9e\xff\xae\xf3\xc1s{\x95F\x84\xf6\x84\
-\xa7VC\xef7\xc2\xda`k,\x06\xd2\xc9\xf0Yd\
-\x8d\x1a\xb1$\x02\xc1\x19\xe9\x90\xb9\xec(\xfa\xf9)\xec\
-&\x11\xd8\xef\x17\x0e\xf8\x8b@\xf3|\x00{\x5cI\x16\
-\x7f\x03\xf0\xd94\xe0\x0d\x15\xd0\xdb\xdf\xf2{\xfd\x1c\x7f\
-\xf23\xcb\xdf\x8d\xc8?\x80\xc8\xdf\xfb\xfc\xcb\x10\xc4\xc8\
-_\xdf\x80\xf2\xc5K`-\xaf\xe2\xd5|\x02E\x10F\
-\xfe\x90\x9e\xa9\x88\xbf\xeeF\xdeh\xe3\xce\xcf(\xe6\x17\
-\xc8_K\xe4w\xb4.\xe6gn\xffQ\xc9\xef\xed\x0f\
-\x09\x9d\x0b\xf95\x17\x8f\x9b\xdc\xafG\xb7s\xc2Bt\
-\xd3\x92\xe2#2\xeb\x1a\xccX\xb1z\x13jj\x1b`\
-rip\xd1\x957\xe0\xc2\x99\xb3`4\x18\x90\xf3\xd7\
-\x8fP\xd9K}Y\x7f\x9d.\x08\x91\x1a=r6\xac\
-\x86\x5c\xa9\x84CA\x07\xfd\xcdB\xf1|\x85\xc9\x82\x90\
-\xd0P\xf4\xee\xd5\x07\x1a\x95\x06\x87s\xf6#,:\x9a\
-\x0b@\x18y\x02Z\x8d\xde\xf3\xc5\xfc\x0f\x9d\x97\x84i\
-\xcazLLCdh\x0f\xb8jH\x04*\x98\x08X\
-\xe1ruNN\xa0\xa5\xdb\x81\xd9\xc1\xb2\xdcq\x97\x92\
-\x08\xa4\xa7A\xeev\xa0p\xf53\xd8I\x22p\x80D\
-\xa0Z\x14\x81\x96\xa6\x05\xfd\xa7\xf2\x88\xf4U$\x08\xd1\
-\xfe\xc4o\x9e\xf8\xf3\x92?\x91\xc8?\x90\xc8\xdfg\xda\
-\xa5$<S`o0\xa1|\xc9\x12XJ+Z$\
-\x7fg\x91\x85\x91_\x17\x1b\x85\xa4[\xef\x80L\xa5\x12\
-\xc9\xbf\xb2M\xe4'\xecu\x1d\x83\xfc\x9d\xd9\xa6.\x8d\
-\xb44h\xce?\xf3\xdcKS\xbaE\x9e\x1d\x1e\xa2\x9b\
-\x98\x10\x13\x91\xea\xbf\x16\x87\xdd\xcb\x7fx\xdf\x1e\xac\xd9\
-Q\x02\xb5>\x84o\xe3\x15\x9e\x90\x86+\xae\xbe\x09\xf1\
-\xf1\xf1\xdc\x957\x14mGl\xb8\x0a\x19\x99\xc3\xb0\xf9\
-\xd3\xd7\xf9\xf6_\x07\xd8\xae=t!\x9dN\xc7o\xfd\
-\x0d\xd2\xeb\xf9\x8a\xbf\xf0\x90\x08X\xcc&\xd4\xd6UA\
-O\xae?\x13\x80\x88\xe8\x18xln\xf7\xb27\x17:\
-F\x17\xd6U$\x0cMD\xa3\x08\xa8\xd1Pn\x84\x85\
-\x89\x00\xcb\x09t\x92+\xe0i\xf6\x98\x87\x03D\xcc\xf8\
-K/APZ\x0f(<N\x14\xacy\x16;H\x04\
-\xb26\x15Q8`\xe4S\x84\xcdE\xc0{\xf6>w\
-\xb4\x9b\x8b\xd8\xdf\x94\xe2<\x7f\xb2H\xfe\xcc\xf3\x98\xe0\
-\x9c\x0b\x87\xd1\x8c\xb2\xcf\xbf\x80\xa5\xa8\xb4\x09\xf9;\x9b\
- |S\xd6\xd0 \xa4\xdc~'\xe4\x14\xca1\xb7\xbf\
-h\xedJ\xe4\xb4\x91\xfc\xc7\xb2\xfc\xbe\xcf\xeb\xe4\xf6u\
-)dfB=}\xec\xb4[z\xa7v\xbb-!6\
-\xbcOK\xafa\x05<*\x0a\x0e\xa3\xa8\xa2\x0e\xba\xb0\
-(\x84FD`\xf3\xae\x1c\xd8\xed.\xb8\x14:\x8c:\
-\xeb<\x9c1r4\xc2\xc8\x85//-\x82\xabd\x1b\
-\xea\xb7\xfc\x84Z\x1a\x03u2%z\xf5\xee\xcd\xd7\x87\
-\x0b\xe5\xbc<|\xcd\x7fhp8J\x8b\xf2 W\x0b\
-5\x00\xd8\xdf\x22\xa3\xe3<\xe6\xaa:\xf7\xda\x0f\xbf\xb6\
-\xf7\xdf_^\xa5\x0b\xd7\xc1+\x02\x11$\x02\xee\x1a\x15\
-\xea\xcb\x0c\xb0\xd4w\x8e'p4/\x80\x1dr\xad\x06\
-\xdd\x98'\xd0\xb3;\xe4L\x04\xd6>\x8f\xedG\x11\x01\
-\x06\x7f\x01h~\xfd\xe6\x96_+Z\xfe\xc1D\xfe~\
-Sg\x22\x84\xc8o7ZP\xf6\xe5\x970\x17\x94\xf8\
-b\xfe@X\x7fF~\x95V\x89\xd4\x9b\xff\x09%\x85\
-p\xdc\xf2w \xf9;\xab]]\x12\x0f\xff\xf3\x829\
-=\xba\xc5\xfc;)!\xb2\xb7\xefI\x19\xfb\x9f\xd0\xe5\
-.\x97\x13u\xe5\xe5(*,D\x9d\xc5\x89~\xfd3\
-\x11\x15\x15\xc1\x7f`\x13\xc5\xf1\x1b\xb7\x1fDEu\x03\
-\xb4\xfaPD\xc6\xa5 \xa9{o\xf4\x1b8\x98\x0bA\
-\xc9\xe1C\xc8\xdd\xb9\x1a!J3\xa2c\xa2\x85\xe4 \
-#\xbf\x5c\x8e\x90\xa0PX-f\x14\x17\xe6!\x226\
-V\xb8g@\xc9,^O\xfc\xf4\xcd\x8f\x1e\xf3/\xdb\
-\x1aR\xf3j\x1ad\xc4\x06\xaf\x08\xf4d\x22\x10\xd6\x1d\
-\xaej\x12\x81R&\x02\x16\xb0JA\x1d\x89\xbf\x13\x00\
-\xaf\x08$^v1\x82{\xa4\x12\xb9I\x04~}\x01\
-\xdbD\x11\xa8>\x8a\x08x\xcf\xcd\x9f\xf7'\x7f\x12\x91\
-\x7f\x08#\xff\xb93\x10\x92Fn?\x85M\xa5_}\
-\x03s^A\x13\xf2w\xb6\x00\xc8H\xc1\x94Z\x15R\
-\xae\xbc\x0a\x9a\x8c\xbe0\xee\xfa\x0c\x85k\x7f\xf4%\xfc\
-Z\x1b\xf3\xab\x80+\xff\x01\xd4\xb6\xfas;\xb8]]\
-\x12\x8f\xdf9\xeb\xc9\xa1\x99\xa9\x8f*\x95J\xb9?\xe9\
-=\x14\xa7\x9b\x0d\x0d0\xd4\xd5\xa1\xb0\xa8\x04r\xb2\xd6\
-\x11\xb1\x09H\xcf\xe8\xc1\x05\xc1\xdfl\x91\xc5Fi\xbd\
-\x1b\x7fl\xde\x0ec]\x05\xdf\xf8S\xa1\x8bDZ\xe6\
-p\xf4\x1f<\x1c\xa1\x14\xeb\xd7\xd5T\x13YK\xe0n\
-(\x221\xb0\x22X\x17D\xe47\xa1(?\x17a1\
-1|\x190\x13\x00\x96\xfdw\xd9\x5c\x9e\x85\xef/\xc2\
-\xf0M\xf9%*\xbbP\xba\xe6H\x11H\xe5\x22PW\
-\xd2\x00K\x9d \x02\x9d\x95\x17\xf4~\x8e\x7f\xcc\xae\xd0\
-i\x91\xc8<\x81\x1e)P\xc0\x8e\xfc__\xc1\xb65\
-{\xb1\xd7O\x04\xbc\xef=Z\x19\xaf\xe6\xe4\x1f\xca\xc8\
-?e:B{\x12\xf9\xcdV\x94.\xfd\x0e\x86\x9c<\
-\xc8D\xb7?\x10\xae?\xfdLd\xf9U\xe8v\xfe4\
-\x04\x8d\x18K\xe4_D\xe4_\xd5&\xf2\x13\xb2\x94d\
-\xf9\xff\xd1\x06\xf2wv;O{\xb0X\xff\xc6Y\x97\
-\xbd=\xb0W\xca?X\x8c\xcf\x5cs\xb6\xd8\xc6b4\
-\xa0\xa1\xa6\x06\xc5\xc5\xa5D:\x05\xba\xf7\xe9\x8f\x94\xee\
-\xa9\xd4\xf9\x1e8XqO\xb6\x8b/\xbdN\xa3\xd5#\
-.\xae\x1b\xc2c\x12\xe0\xb4\x19a\xac\xccCUU\x15\
-6\xed)\xc0\xde\xecRz\x9d\x0d\x8e\x9a*(#H\
-4\x86\x8dAz\xaf\xfe\xdc#`\x95\x7f\x8c$,\x8e\
-\x862\x18\xcb\x0e *\xc8C\xe2\x02>h\x82C\xc3\
-\x10\x1d\x1b\x87/\x17~\xe5Qn>\xc8\xad\xbf\xffw\
-n.\x02\x91$\x02\xcej%\xea\x8a\x1b`\xae\xb5t\
-h\xa5\x1b/\x8e\xc8\x05\xa01\x81\xa7\xd4k\x91t)\
-y\x02\xdd\x93H\x04\x1c(X\xf7*\xfe\x22\x11\xd8\xe3\
-\x17\x0e4\xbf\x86?\x89\x9b\x93\x7f\xc09\xd3\x10\xe2%\
-\xff7\xcb\xd0p(\xb7\x09\xf9e-\x5c\xa7#\xc1\xdd\
-~\x9d\x0aqcF!|\xca\x050\xee^\xcc\xc9\x9f\
-\xd3F\xf2\xab\x8e\x83\xfc\x9d\xd5\xc6.\x81\xa9c\x07\xc7\
-L\x9b\xd0\x7fazj<\xbf\xd3\xcabl\x80\xb1\xb6\
-\x06y\x85\xa5\xdc\x05\x0f&\x8b=d\xf48D%$\
-\xa2\xb6\xbc\x98\xacz\x15\x7f\x9f\x9c|\xbf\xa8\x98xD\
-\x13\xf1Y\xc1NsM1L\xb5e0\x11\xd9\xcdv\
-\x0f\xec\xdc\x0a\xd3\xd9\xeeD\xd6\x9eld\xed\xda\x8fZ\
-\xbb\x0b\xea\x90P^($&.\x11\xd1\x09=\x11\x9b\
-\xd8\x1dz\xbd^\xb8\xef\x9fB\x00\xb7\xb9\x12jW-\
-2R\xa2\xb0g\xc7.lY\xb6\xd61t[Q\x99\
-\xac\x85\xb1\xd4\xb2\x08(PWT\x0fSM\xe7\x89@\
-\xf3\xf2`\xfe\x22\x90L\xe1@Hj\x22\x11\xda\x81\xfc\
-\xf5op\x11\xf0z\x02\xce\x16\x163y\xc9\xaf\x11\xc9\
-?\x8c\xc8\xdf\x7f\xf2T\x84\xf6\x98\x0c\x9b\xd9\x81\xd2e\
-\xcbQ\xbf\xef\xd0\x11\xe4\xefL\x0f\x80\x91_M\xe4\x8f\
-\x1eL\xe1\xdf\xcc+a\xdc\xfb\x05\x0a\x7f\xed<\xf2w\
-V;O{\x5ct\xf6\xf0\x9e\xe7N\x18\xf0er|\
-\xd4P\xb6=wCU9\x0e\xe7\x17\xc3\xa3\xd4b\xc0\
-\xc0L\xc4\xa7tG\x5cj/\xd4\x95\x15\x11\xf9\x8b\xb8\
-[\xae\xd1\xea\x10\x97\x90\x84\xb0\xa88\xd8\x1a*a\xac\
-.\x82\xc5DV\x97~s\xb6l\xd7I^\xbap\xdb\
-\xae\xc7\xb7Y\x87\xa3\xba\x02\xe6\xc2\x02l(\xae\x87\xc1\
-\xa3\x05\x0b\xd3\xd9\xa6\x1f\xec3Y\xf8\x9a\x90J\xe4\x8d\
-\xef\x8e\xe8\xf8\x14\xee\x150\x0f\x84\xed\x1bP]\x94\x03\
-\xf5\xc6-\x0d\x91\xeb6\xd4\x1fm@yE\xa0\x9bW\
-\x04\xc2S\xe0\xa8\x14D\xc0\x5cc\x16r\x02\x1d\xa0\x02\
-\x9e\x16\x1e\xfb\xe7\x02\xb8\x08\xb0\xd9\x81 \x1dR.\xb9\
-\x88D \x81\x88mC\xc1\x86wy8\xb0G\x14\x01\
-oy1\xef\x80V\x88\xb7\xf4&\x8b\x96\xbf\xff\xa4s\
-\x04\xf2\x9b\x88\xfc+W\xa1~\xcf\x01\xbe\xedy\xf3\x0a\
-@@'y\x01\x8c\xfcz\x15\x222\x92\x11;\xfbz\
-\x98\x0e~\x8b\x82_\x7fj+\xf9\xf7\xa9\x81\xcb\xffq\
-\x9c\xe4\xef\xd0\xf6u\x15\x5cr\xf6\x98\x94\xa9\x13\xfb,\
-K\x88\x0d\x1fXW^\x8a\x12\x8a\xed\xab\x8c6\x0c\x1e\
-:\x10\x11\x11\xe1\x88\xee\xd6\x1d\xe1d\xa5\xf3\xb3\xfe\x82\
-\x93\xdc\xfd\xa0\x900$&\xf7\xe4\xd5zM\xd5\x85d\
-a\xc9\xe2\x93E\xb7:d\x9c\xd0\xecGw\x92\xc5\xad\
-\xa97!&\x22\xb8q\xf9/\x13\x80\xb2b\x22e9\
-r\xe8\xf5\xe9\x99\xfd\xc8Kp\xa2\xba\xd6\x8a\xed;\xf7\
-\xc2!S\x0a\xebFY\xd2O\xa5\xe1\x1eE\x5cJo\
-\xe8B\xa2x.\x80\x85\x22\xca\xef\xbf\xaf\xd3\xac]{\
-\xf4\x1a\xf1-\x8a\x80\x1c\xb5\x85u0W\x0b\x22\xd0\x91\
-+\x06[\xf2\x00\xbc\x8f]l\xb3\x0c&\x02\x97^\x84\
-\xd0\x14\x12\x01XP\xf4\xe7\x87\xbep\xa0\xce\xcf\x13\x90\
-\x8b\x96?\xd1K\xfe\x09\x93\x88\xfc\xe7\x90\xe5w\xa2\xe4\
-\xc7\x9fP\xb7k\xdf\x11\xe4\xf7\x9fE\xe8\xf8\x84\x9f@\
-\xfe\xf0\x94\x18\xc4]y#\xccy?\x06\x84\xfc\x9d\xd1\
-\xd6\xd3\x1a\xb3/8\xb3\xdb9#3\x89\xfc\xa1Ck\
-JKP\x5cT\x8c\x1a\xab\x0c\x13\xc7\x8f\xe4\x09\xbe\xc4\
-\xb4\xfe|\xad{\xe1\x81\x9d|\x143\xe2G\xc6vC\
-]\xe1^\x0a\x01\xcaav*`s\x09Sx\xfe\xeb\
-\xfc\xb7\xec\xca\xc1\xf0\xfe=\xe0o\xfd\xd9\x7f\x8e\x8a2\
-\x12\x81\x12\xe4\x12\x11\xfb\x0e\x1a\xcc\xc3\x87\xd0\xa0P\xe4\
-\xe7\x1e\x80K\xa5GAi\x0d\x0a\xcbj`0Yy\
--@\xb6\xfcw\xf7\xce,\x0c\x19>\x1cZm\xf4\xa1\
-\xb4\x1f\x7f\x0aR\x16\x14\xfcm\xcd(\xaf\x08$2\x11\
-\x98\xc4\xc2\x81d\xee\x09\xd4\x16\xd4\xc2Te\xe6{\x11\
-\xb4wf\xb05^\x80\xf7F\x1ee\xb0\x1e\xa9\x97\xcc\
-\x22\x11\x88'\x110\xa3h\xf3'\xdc\x13`\xb3\x03\xb5\
-$\x02lE\xa3Z$?\xcf\xf6\x8f\x1f\x8f0\x22\xbf\
-\xd5\xe4B\xe9\xcfkP\xbdc\x0fw\xfbY\x8a\xa4\xc5\
-\x02\xa0\xfe}\xd1\x01c\xc6K\xfe\xd0n\xe1\x88\xbb\xf4\
-jX*7P\xcc\xff\x13\xb2\xdbH~z\xc5\x15\xff\
-\xe4+\xa0O\xf0\xfbt@\x1b\xbb\x04\xe6\xcc\x1c\x1d;\
-~X\x9f\xe5\x09\xb1\x11\xc3\xeb\xcaKPTX\x8cj\
-\x0b0i\xc2(\xfa\x91\xe5\xe8\xde\x7f8lF\x03\xca\
-\xf2\x0f\xf1;\xf6z\xa4\xf7\xa3X\xdaBD\xda\x0d\x83\
-\xd5\x05\x8bK\xc1\xaf\xd3x_\xbfP\xf9g\xc3\xb6\x03\
-\xc8H\x8dG4Y\x7f\xe1\xef\x1e\x9f\x008\xab\xab`\
-/.\xe0\xeb\xfd{\x0d\x1e\xc2\x05 D\x1f\x82<\xb6\
-\xe2/&\xc6'\x16\xb5\xe4=\x94\xd7\x9bQ\xd5\xe0\xc0\
-o\xbflD\xcf\xf4d\xec\xd8_\xf4\xf3\x80\xfc\x8ae\
-S\x80\xb9\x10\x96\xd0\x1f\x15\xcdE \x82\x8b\x00y\x02\
-y5\xe4\xb5\x90\x08\x1c\xbb\xee\xdcq\xe3h^\x80\xff\
-\xca>5\x89@\xca\xa5$\x02IL\x04\x8c(\xfek\
-\x11\xb6\xaf\xc9\xc2\xfe\xcdE0\x1b\xac\x88K\x0e\x17\xe6\
-\xf9\xc7\x8dE\x88\x97\xfck~C\xf5\xb6\x9d|\xaa\xaf\
-\xf9\xea\xc1\xce\x8a\xfd\xd9T\x9fZ\xaf&\xf2\x87\x22v\
-\xfaE\x14\x8e\xec\xa6\x98\xff\xe7\x80\x91\xbf\xa3\xdb{\xda\
-\xe2\xf2\xe9C\xa3'\x8d\x1c\xbc\xac[l\xf8\xa8zr\
-\xfb\x0b\x0b)\x0e\xb5x0q\xc2hN\xca\x84\xb4\xbe\
-<\xfe.\xcd\xdd\xcfk\xf5\xf7\x190\x12\x0d\xa5\x07P\
-_Y\x08\xa3K\x0d\x97G\x06\xff;\xfd\xbc\xe4\xcf-\
-,\xc7\xbe\x9cb\x9cw\xd6 a\xed\xbf\xa7\xa9\x00\xb8\
-\xea\xeb`\xcb\xcfE1\x09@j\xff\x01<\xfe\x0f\xd6\
-\x05\xf3%\xbf\xe1\xa2\x00x_\xaf\xd1\xe9\x10\xdf-\x11\
-\xaf\xbe\xf8\x0ez\xf4\xed\x85\xadY\x05\x9b~\xf8m\xf7\
-\xccw\x80\xa1\x1e\xa1\xae^\xabE \x8d\x8b@\x12\x89\
-\x80\x0c5\x87ky!O&\x02\x1d\x11\x0e\xb44#\
-\xc0C\x00\xf8\x89\x01\xf5\xad*$\x08\xdd/\x99\x89\xb0\
-\xe4x\xc8\xdd\xf5(\xdd\xbe\x04\xbb\xd7\x1fBmi\x03\
-\xd2\xe8;\xf79s$\xb9\xfdS\x04\xf2\xff\xba\x01\x95\
-[\xb6\xd1E\xdcM\xaa\xfft*\xf9\xa9?5\x8c\xfc\
-\x89a\x88\x990\x01\x0ey\x89\x8f\xfc\xd5\xad'\xff~\
-6\xfc\xda\x8b\xfc\x1d\xdd\xe6\xd3\x15\xf2\x17\x1f\xba|y\
-\x9f\x9e\xdd\xa6\xd6U\x94S\xcc_\x88\x92:'&O\
-\x1a\x03\x05\xfd\xc8\x91\x09)\x08\x89\x8cA\xc1\xbe\x9d$\
-\x02\x1e\xf4\xca\x1c\x02\xb7\xa5\x01\x95E\xfb`pi\xd1\
-\xf4\x0e_ax\xb33+\xef5\xff\xe3\x95x\xf0\xa6\
-\x0b\x84P\xbe\x05\x01p\x9b\x8c\xb0\xe6\x1cD\x19\xc5\xba\
-q\xbd\xfa 8(X\x10\x80\xec}\x08\xe7\x8b~\x1a\
-_\xcf\x84\xa7[r\x0a\xdey\xf5}L>w\x0cJ\
-\xab\x1a\x0a\xeez\xf6\x8b\xee\xec\x03I\x04\xa6\xb5V\x04\
-\xf4bN\x80\x89@dx\x12\xec\x15$\x02\xb950\
-V\x92\xbb\xed\xe8\x98\xd9\x81\xa3&\x03\xd1\xd4+P\x85\
-\x06\xa3\xfb\xc53\x10\x9a\x1c\x07\x85\xbb\x0e\xd5\x07\xbf\x83\
-\xa5\xde\x88\x88\xa4t\x04w'\xcbot\xa3l\xfd\x9f\
-\xa8\xfcs\x0b\xb7\xfc\xcd\x97\x0e\xfb/\x1f\xf6?\xb77\
-\xb8\xdb\x1f\xa4FXR\x18\xa2\x86\x0d\x823\xc4\x84\xa2\
-u\xbf\x04\x9c\xfc\x1d\xd9\xe6\xd3\x16\xf3\xee\x98\xf1\xc2\x88\
-\x01i\xff27\x90\xd5!k\xbc\xbf\xc4\x80s'\x8f\
-\xe5\x1bq\x04\x87G!.%\x1dyY\x7f\xf1\x1f4\
-\x9e\xc4 *6\x1e\xa5\xfb\x7fG\xbd\x83\x91_\x5c\x10\
-\xe4%7Dr\xd3\xe9\xa97\x96b\xf6\xf9\xa3\x91\x9e\
-\x22\xac\xdec\x99,\x8f\xcb\xddD\x00<V+,\x07\
-\xb3P\xe5\xf2 \xac{O\x84\x87Gp\x01\xc8\xcb\xd9\
-\x87\xd0\x98X\xdf\xb5x\x22P\xadBRJw\xbc\xf7\
-\xfa\x87\x98t\xceh\x1e\x1b/\xfan\xcb\xa8\xef7\xec\
-\xde\xc4\xbe\xc3\x9b$\x02\xb2\xb6\x88\xc0\xb0$\xa4ML\
-CTx\x22\xec\xe54\x0as\xaba\xac0\xc2\xd5I\
-\x22\xe0>\xca\xd9+\x02a\xc9\xb1P\xbaka\xaf\xdf\
-\x01u\xcc\x04\xb2\xfcN\x94o\xdc\x8a\xf2\x0d\x9b\x8e \
-\x7f\xf3\xc7@\xc7\x93?<9\x0c\x91\x83z\xc3\x19j\
-F\xd1\xc6?\xdaL~Y\x07\x90\xbf#\xdb}Z\xe2\
-\xa1\x1b\xcf\xbbz\xc4\xe0\xf4\x8f\x14n\x97\xa2\xe4p6\
-\x0e\x14\xd5a\xe8\xf0\x01\x88\x89\x8a\xe4\x9bnt\x1f0\
-\x02\x05\xfb\xb7\x13)\x1c\x08\x0a\x0aE:Y\xff\xf2\x83\
-\x1bPgr\xc0\xc1y&.T\x15-\xb5W\x00~\
-\xdb\xbc\x8f\xbb\xfe7\xcf\x9e\xe4\xcb\xf8G'\xf5De\
-aN\xa3\x00\xb0\xc3\xe9\x80e\xdfn\xd4\x93\x00\xa8\x12\
-\x93\x11\x1d\x1d\xc3\x05\xa00\xef\x10\x82#\xa3\xe0\x9fK\
-`\xeb\x01\xd8\xf2\xdf\x05\xef|\x823\xc7\x0d\xe5\xcb\x84\
-\xb7\xec\xcf\xbf\xe7\xf9\xf7W\xcf\xf7\xb6\xe7-\x12\x01\xb4\
-Z\x04\xf4$\x02\x89Hg+\x06\xb9\x08x(n\x15\
-E\x80\xe5\x04\xdaI\x05\x8e\xb6D\xd8}\x94\xc7\xec\x06\
-\x225\x89@\xea\xac\x0b\x11\x9a\x14\x0d\x85JA\xb1\xb5\
-\x0d\x15\x9bw\xa0|\xfd\x1f\x5cD[\xaa\xf9\x0ft|\
-\xe2\x8f\xf5\x9b:X\x83\xc4s\xcfF\xe8\xf0\x110\x17\
-\xadE\xe1o\xabO\x1a\xf2\xb7w{Ok\xdc<{\
-\xf2\xf0\x09g\xa4\xff\x14\x12\xa4\x8e\xa8(\xc8\xc7\xe1\xe2\
-JD\x90u\xcf\xec\x93\xc6\xa7\xdf\x12\xba\xf7\x86\xa1\xae\
-\x1a\xe6\x86\x1a\x1e\xff\xf7\x1dH?xU\x01\xaa*\x0a\
-a\xf1h\xc1\x17\x04\xcb\xd0\x98\xd5\x17\x05\xc0h\xb2\xe0\
-\x91\x17>\xc7s\xf7_\x01\x8dF\xe9\xfb\xdb\x80\xb3\xa6\
-QL\xbb\x5c\xd8m\xd6\xfbz\x8f\x0b\x96=;a\x22\
-\x8b\xe6\x88\x8e#\x0f#\x01!\xba\x10\x14\x17\xe4\x22(\
-\x22\x02\x8d\x02@\x16O&GjZ:>\xfbh\x09\
-\x86\x0c\xeb\xcb\xb7\x09\xcb-\xa8\xfc\xec\xc1W\xbf\xbf\xca\
-\xbf]o\xb52\x1c\x90\xf3\x9c\x80\x1e\x89>\x11\xe8&\
-\x88@v\x15\x8c\xe5\xc6\x0e\xc9\x09\xf8{\x01\xfe\x05=\
-\x8e\xd8A\x88\xe5\x04BC\x904\xfd<~\xae\xdf\xbb\
-\x0f\x15\xbfo\xf4Y\xfe\x96b\xfd\xe6\x1e@{C\xa9\
-\xd7!q\xc6tD\x8d\x9b\x00\xb9N\x07\xc3\xceO9\
-\xf9\x0f\xb5\x8d\xfc\x07\xe8U\x97\xdf\x0dTw\xd0\xd7\x94\
-\x04\xa05\xb8d\xea\xe0\x98\xa9c\x86\xfc\x1a\x1f\x13\x9e\
-YWQ\x8a\xe2\xa2\x12T[\x81\x09\xe3Fp\xb2\xeb\
-B\xc2\xf8\x82\x9e\x8a\x82\x1c\xde\xa3\x91\x11QH\xec\xde\
-\x0bE{~C\x83[\xc7\xd3\xbf2\xf1\xfe\xdf&\x16\
-\x9d\xfe{\xe5\xc3\x15\x18=4\x03\x14V\x08n\xbe\xf8\
-\xf7!\x93/\xc2\xe1\x9d\x7f\xa0\x86/\x1c\x82\xef=\x96\
-\xbd;`&\xabf\x0c\x09GrJ\x0a\x9f\x06,)\
-\xcc#\x0b\x1d\xde\x18*\xf0k\xb8\x91\xd2#\x1d+\x97\
-\xfd\x84dr\x8f\x83\x82\xf5(\xa9\xa8\xcd\xb9\xe7\xf9\xa5\
-\xe9\xcd\xdbwb\x22\xe0F\xf5\xa1*\x98\xca\x0cB8\
-\xd0\x0e\x15t<Gy\xae9\xf1\xdd\xcd^\xaf\x0c\x09\
-FHF/\xd4n\xdf.\x88\xa0\xf7{\xa3)\xd9\xe5\
-hy\xe0\xb7\x07\x194\x14\x8a%\xce\x9a\x89\xf0\x91#\
-!\xd7P\xd8\xe7\xb4\xc3\xb8\x9b\xc8\xff\xeb\x9a\x93\x8e\xfc\
-\xed\xd5\xe6\xd3\x1d\xb2\x17\x1f\x9a\xfd}\xaf\xee\x09\xd3m\
-&\x13J\xf3\xb2\xb1\xb7\xb0\x1e\xe7M\x19\xc77\xe0`\
-\x8bl\xba\xf5\xcc\xa4\xe7\xf7\x8bw\xa5\xc8\xd0\xa7\xdf`\
-Xj\x8bQ^^\x06;\xd4>\xf2s\xf8\x5c\x7f`\
-\xf7\x81\x02|\xb7z+\x1e\xb9u\x86_\xac/\xbcf\
-\xe0\xf8\xf3Q\x91\x9f\x83\x92\xdc\xbd~\xa2\x01\x0a\x01v\
-\xc1\xe4p\xc2\x10\x1c\x86\xd4\xd4T\x04i\x83QU^\
-Lqf\x90o!\x10\xbf\x0a\x111>9\x05;\xff\
-\xda\x05\x97\xd3\x86\xb8\xf8h>\x87\xff\xc1w\xbf\x0fY\
-\xfdG\xf6\x8e\xe6\x8d|\x038\x1f\xc2\x86\x1bm\x12\x81\
-\xc8\x08\x12\x812\x17\xaa\x0eV\xc2\xc8D\xc0\xd6\xfe\x9e\
-@s\xa2\x1fM\x00\x8e\xf8\xe1\xbc\xdf\xb9\xd9\xbf\x9b?\
-\xdf\x1e\x08\xcb\xccD\xc2\x85\x14\x86\xb0\xfd\x0e\x14r\x22\
-\xbe\x13\x8e\x9a\x5cXs\x7fD\xe1\xc6Mm&\xbf\xb3\
-\x13\xc8\xef\xdf\x17\x12\x8e\x82\xc7\xef\x98\xf9\x7f\xc3\xfa\xa5\
->\xc8V\xd2\x95\xe7\xe5 \xbb\xb8\x16i\xbd\xd2\x90\x9c\
-\x18\xcf\xff\x1e\x9d\x90\x02c}\x0d\xec6\x0b\xbf\xeb/\
-(\x98b\xff\xbe\x83Q\xb8k5\xea\x9d:\xee\x9ez\
-w\x98\xf5m\xf2\xc3V\xf5\xd1\x00\xf9\xd73\x0b\xf1\xd8\
-\x9d\x97 2L\x7f\x84g\x90y\xe6\x14\x98\xe9\xba\x87\
-wm\xf6\xe5\x0a\xdc\x0e;\xac\xfb\xf7\xf2\x1c\x80-,\
-\x82,{2t\x1a\x1d\xea\xab\xab\x00\x8a}\xd9\xbd\xff\
-\xdek\xc8\xc8\x03\x88\x8aO@yY\x15r\x0f\x1eB\
-\xcf\xf4\x14\xfe\xb7-{\xf2n\xff\xdf\xc7\xbf\xbc\xd9R\
-[\x8f_\x04\x12`#\x11\xa8\xde_\xd1\xa9\x22\xd0\x5c\
-\x10\x9a\xa3\xa5$_\xbb\x92\x9f~\xdb\x98\xf1\x13\x10?\
-m\x1at$\xc6\x0cN\x93\x11\xf5Y\x9b\xe1\xae\x5c\x03\
-\xb9\xca\x82\xb2\xdde'-\xf9\xfd\xfbCB\x0bx\xf8\
-\xc6i\x97\x0f\x1b\xd0\xe3S\x8dZ\xa9\xa8\xaf,'\xd7\
-\xbf\x14\xb56\x19\xc6\x8d\x19\xc6\xad\xbaZ\xab\x87\x8e\x08\
-o\xa8\xa9\x10v\xbd\xa1\xff\xd2{\xf5\x83\xdb\xd6\x80\xd2\
-\xe2\x5c\xd8x\xec\x0f\xb4\xa0\x00X\xf8\xcdz\x84\x87\x05\
-\xe1\xfc\x09\x83}\x89\xbb\xc6Y\x01\x0fz\x8f\x18\x0fK\
-C\x03_B\xec\x15\x05gM\x15\x1c\xc5\x85|\x1d\x80\
->6\x8e\xacz<tj-L\xf5\xf5px\x1cP\
-\x91\xcb\xe9\xf5\x14<$\x00\xe1\x91Q`k\xde\xd6\xad\
-\xfe\x15\x03\x06\xf5\xe6\xd7\xc8.\xaa\xfa\xf8\xd1\xf9\xcb\xfe\
-q\xb46\x13\xfb\xa7\xd37}\x15\xad\x14\x81$&\x02\
-|\x8a\x90\x89\x80S\x10\x81\x12\x03\xdf\xa1\xa6\xbdg\x07\
-\x9aW\x07n)ax\xac\xa4^K\xc5C\xda\x0au\
-T\x14b\xcf\x9e\x8c\x98\xc9gC\x15\x1e\xc1\x9f\xb3\x94\
-\x96\xa0p\xf9\xb70\x1eX\x85\xc4\xd1I\x14\x8eh|\
-\xe4\xafj=\xf9\x0f\xba\x80\xd9\x9dE\xfe\x96\xfaG\x82\
-\x88[\xaf\x18?x\xec\xd0\xde\xabC\x82tQv\xb3\
-\x09e\xe4\x8e\xef-\xaa\xc7\xb9g\x8f\x85\x8am\xb6A\
-\x84\x8f\x8cKBmE\xb1@~\xb6k+\x91\xb1\xef\
-\x90\xd1(&\xeb_cS\x89\xd6\xbfi\x173\x126\
-\x18,x\xe6\xado\xf0\xcc\xbf.\x17e\xa1\x91\xf8\xfc\
-5tN\x1f|&\x1a\xaa\xcb\xf8JB/\xa9\xed\xf9\
-\xb9p\x19\xeaq\x90,l\xcf\x8c\x0c\xe8\x83\xf4\xd0\xaa\
-u\xb0\x18\x0c\xb0\xda-\xd0\xe8\xf4\x8d\xd7\x22\x8f%(\
-$\x14Q\x14\x93.\xfe\xf8s\x8c\x1e3\x84_\xb7\xa4\
-\xa2~\xff\xdc\x17\x96\xf6\xfd\xbb\xb6\xb7Y\x04\x86\x8b\x9e\
-@x<l\xa5$\x02\xfb*`(i\x10\xb6\xa9:\
-\xc1\x9c\xc0\xd1\xca\x92\x1c\xcb\xfa{\xf1w\xd3|m\x11\
-\x02Ud$b&MB\xe4\xc8Q\xd0\xf7\xe8\xc1\x7f\
-s\xd6\xc7\xb5{\xf7`\xff\xfb\xef\xa2r\xf3\xafH\x1a\
-\x95\x82\xa4q=\x8e\x9b\xfc\xf4}f\xdf\xd6\x89\xe4?\
-Z\xbftyPl\xad}\xe0\x9aq\x1b\x93\x13\x22\x87\
-\xb0\x1f\x99\x95\xec\xca.\xaeA\x8f\xf4\x1eH\xee\x16\xcf\
-\x7f\xfc\xe0\x88(X\x8d\x0d|\x1b.\xaf\xf5OJN\
-\x85^\xa7Cq\xee._\xe6\x9f\xc3\xdb\xcb\xe2\x18\xf8\
-\xe0\xcb_0\xbc\x7fO\x0c\xec\x93rD\xec\xef]\x1c\
-\xc4\xa6\x14\xab\x0ar\xd1@\xde\x85\x10\xd3\xbb\xf9\x14\xa0\
-\x8d\x1e\xb2\xa5\xc0\xfd\xfa\xf7\xe7\xd7\xd2\x92\xe8\xb0\xfa\x80\
-F\xb3\x01\xba\xa0`\x9f\x00\xb0\xd7+5\x1a$w\xef\
-\x89\x8f\xdf]\x881\xe3\x86\xf2k\xdb\x1dN\xcfK\x1f\
-l\xe8\xb5=77\xfb\xef\xfa\x80\x89\x80p\x82\xe2\xef\
-^\xe7/\x02\x19<\x1c \x11(q\xa0*\xab\x9c<\
-\x01\x12\x01\x9b\xb3C*k\xb7\xf5\x92\xc73\xd0\xd5a\
-a\x88\x998\x11\x91g\x9e\x09}Z\x1a\x9fYap\
-Y\xad(_\xbf\x1e;_|\x11u\xd9\xfb\x11\x14\x13\
-\x8cD?\xf2\x97\x1e\x07\xf9\x15\x01 \xff\xf1\xf6\xcbi\
-\x8fGn\x9e\xf6\xc4\xc8Ai\x8f1\xab\xdePY\x89\
-\x92\x92bT[\xc9\xf5\x1f=\x94[z%\xb9\xda\xec\
-f\x1b\x1by\x062\xa1\xf2\x07\xef\xc8\x01\xc3\xc6\xa2\xfa\
-\xf0_\xa8`%\xb5<\x0a\xb4\xb4\x09o=Y\xff\x17\
-?\xf8\x01O\xdc}\xc9\x91\xae\xbf\xdf\x1a\x81\x8c\xa1c\
-p\xf0\xaf\xdfy6\x9f\xbd\xccEbc\xcf\xcbA%\
-\xdb-'$\x0c)\xdd\xbb\x0b+\xfeT\x1a\x22\x99\x0d\
-u\x0d5\xd0\x93\xc5\xf7\xbe\x9f\xe5\x00\x98\x07\xd2\xb3W\
-\x1f|\xf5\xd97\xc8\xec\xdf\x03*\xa5\x92\xff\xed\x9b_\
-\xb6O\xfc|\xd5\xce_\x8f\xd5\x0f\xe4\x02\x5c z\x02\
-\xc7!\x02vT\xef-\x87\xa1\xb8\xbe\xc3D\xc0\x8bc\
-%\x01\xdb\x02Uh\xa8@\xfa1c\xa0'/K.\
-\xf7\xde\xb3\xe1\x81\x85\xc6A\xf1O?a\xf7\xcb/\xc3\
-VWG1\xbe\x1cz\x91\xfc\x89\xa7 \xf9\x8f\xb7\x8f\
-Nk\x5c~\xc1\x88\x81\xd3\xc7\x0d\xfa=$H\x1b\xe2\
-\xb0XP\x9a\x7f\x18\xfb\x8a\xea0y\xd2h\x22\x9b\xe0\
-\xfa\xebC\xc3\xc9\xed\xae\xf7\xb9\xfe\x0c\x11\x11\x91H\xee\
-\xd9\x17\x05\xbb\xd6\xa0\xc1\x15\xe4\xd7\xb3\xfe]\xec\xc1G\
-_\xff\x863\xc8\xfa\xf7\xeb\x95\xd4\x84\xfc\xfc\xaf~\xab\
-\xfeR\xfb\x0cA^\xd66\xdf\xdf\xed%Ep\xd5T\
-\xe1\xb0\xdd\x8d\xb8\xe4d\x84\x8b\xf3\xfe*\xa5\x86g\x9c\
-k\xaa+\x10\xe4\x9d\x0a\xe4\x8aA18\x0d\xde\x94\x9e\
-iX\xf7\xcbF\x84\x06\xab\xe9=B\x85\xe0_6\x1f\
-\xba\xf8\xdd\xaf7.mM\x7f0\x11\xc0q\x88@T\
-D\x1c\x17\x81\xaa=e0\x167\x10\x19\x9c\xed\xb2X\
-\xe8D\xaf\xd0\xd2\x80W\x86\x84\xf0\xddw\xa2\x88\xf4A\
-\xbd\xfb\xf0\xaaM\xfc\xb3\xc8\xbb3\xe6\xe6\xa0l\xdd:\
-\xe4,\xfa\x0c\xf5\xd9\x87\x1a\xdb\xdb\x8c\xfc\x0a\x91\xfc\x07\
-\xdbF\xfeC\x14c]\x16(\xf2\x1f\xad?\xba4^\
-\xbc\xff\xd2\x95\xe9\xa9qS\x19Q*\x8b\xf2\x91]T\
-\x8d\xee=\xbb#)1\x8e\xbb\xf9\x1ar\xb3\x1d\xac\x84\
-\x97\x07>\xf2\xb3sF\xef\x01pZjQZ\x9cO\
-n\xbaJ\xecXY\x93\x1e6\x18\xc9\xfa\x7f\xb8\x02\xf3\
-\xee\xbc\xa8\x89\xdb/\x9c\xbc\xf7\x05\x00\x1am\x10\xd4z\
-\x1d/,\xe2\xbdi\xc8z0\x0bN\x87\x13\x87h`\
-e\x92\xfb\xaf\xa4A*l\x12\xa2\x82\x9c\x02\xe5\xca\xca\
-\x12\x04\x87\x0b\xbb\x00\xc9]6\xb8eJ\xfe^6\x15\
-\x98s\xf00\xaa+\xca\x91\x98\x14\xc7\xaf\xb5-\xab\xe0\
-\xe6\xe7?^\xfb^k\xfb\xe4\xc4D\xc0\x86J\x22\x86\
-\xb1\xa8\x1eN\xab\xb3\xddf\x07N4\x04PSL\xcf\
-\xac|\xd4\xd8\xb1\x08\xee\x9b\xc97+ep\xdb\xec\xa8\
-\xdf\xbb\x17%k\xd6 \xe7\xb3E\xb0VU\x1d\xd9N\
-/\xf9G\xa7\xa0\xdb\xd8S\x97\xfc-\xf5K\x97\xc6\xbd\
-\xff\x98r\xe3\xb8\xa1\x19\xef\xc9\xe52\x18j\xaaQR\
-\x5c\x82*\xb3\x1b\xe3\xced\xf1\xb3\x8c\xd7\xdeg=\xe6\
-&\x8b+X\x7f\xf6.z^\xa5\xc6\x803\xc6\xa3p\
-\xe7*\xd4X\x14\xe07\x9c\xb6\xd0\xb3\x0b\x96\xae\xe3\xb1\
-\x7f\xff\x8c\xc4\xa3\x92\x9f\xbb\xf5:=\x0f/\xbc\xcf\xb3\
-]\x7fl\xd9\x07POD\xaf'\x97?\x9d\x5cS\xef\
-\xeb\xd5\xf4\xd9\x1e\xa7\x0b\x95\x15\xa5\x08\xa5A\xcd\xab\x03\
-;\xcdp*t\xc2\x92\xe2\xd88\x18Ixvl\xd9\
-\x86^}z\xf0\xeb\xef<P\xf4\xc0\xb3\x1f\xad\xf9_\
-[\xfa\xe6\x15\xe0Bj\x12[F\xdc*\x11H\xf6\x89\
-@,\x17\x81\xaa]e0\x14\xd6\xc1I\xe1@{,\
-\x16j+\xd4\xe41E\x8c\x18\x81\xb0\xc1\x83\x11D\x84\
-\xd7\xc4\xc7\xc1\xfb#9\x0d\x06\xd4l\xdf\x8e\x92\x15+\
-\x90\xff\xcdR8\xcc\xe6\xa3\xb7\x8f\x93?\x04\xdd\x18\xf9\
-\xc9\xf2\xcb\x83\x05\xf2\x1f\xf8\xe5\x10\xaa\xb2[O~\xd5\
-I@~@\x12\x00\x1f\xce\x1b\x9f\x19?\xfb\xdc\x91[\
-\xc2C\xf4IN\x8a\xa9\xcb\x0b\x0fcoA-/\xee\
-a\xb3\xbb\x10\x12\xa4\x83F\xa7%+l\x172\xfb\x22\
-\xf9\x99\xf5OLLAXX8\x0a\x0en\x85\xc9\xad\
-m\xb1SY\x91\x8e\x97\x17\xac\xc4\x7fn\x9f\xe5\x9b\x0a\
-\xe4\xff\xefO~q\x15\x1f\xf3\x00\xac\x16\xa3/\xfb\xef\
-\xac,\x83\xb3\xa2\x0cE\x0e7\x82\xd8\xf4_\x5c\x9c\xef\
-},\x09\xc8f\x01\x8c&\x03\xf4aa\xc2\x8d@6\
-r\xb9UB5\xa1\xb0\xf0\x08h\xf5\xc1X\xfe\xedr\
-\x0c\x1d\x96\xc9\xdf\xf7\xe7\xce\xfc\xeb\xe6/\xfemA[\
-\xfb\xe8xE 22\x16\xf6\x22+\x89@)\x0c\x05\
-\x9d#\x02\xda\x98X\x84\x0e\x19L\xc7\x10\x84d\x12\xe1\
-\x13\x12\xe0\xcd\xfb\xb3\xf5\x14\xb6\xf2r\xd4\xee\xdc\x89\xc2\
-\xef\xbeE\xc9\xaaU<\xa3\x7f,x\xc9\x9f@\xe4O\
-\x18\xd7\x13rn\xf9Kq`M\xdb\xc8\xcfv\xe9\x9d\
-\x0bT\x1d\xf3\x03;\x01\x92\x00\x88x\xec\x9f\xe7\xbf8\
-$3\xf5^\xf6\x03\xb2\xd2^9E\x15\x88\xa0A\x14\
-\x1f\x1f\x0b\xa3\xd9\x86\xe4n1\xbct\xb7\x97\xfc\xc2\xd9\
-\x9b\xfc\x1b\x83\xba\xc2=(\xab\xa6\xc1\xed\x11\xb9\xd1,\
-\x03\xb8x\xd9F\x0c\xea\x93\x82\xcc\xf4D\xfe\xefFW\
-\xd8\x9f\xfc /CK\xef\xa5\x98\xdfb\xf6\xbd\xce\x96\
-\xbd\x1fn\xbb\x1d\x07\xc9\x85N#\xeb\xcfv\x02\xf2\xbe\
-\x9e-\x04\xaa\xab\xaa$\x97_\xa8\x01\xc0\xa0\xb2\xd6\xc2\
-\xae\x0e\x13\xb6\x0f\x0f\x0aBBR\x0a\xbf)h,\x9b\
-\x09\xa0\xff\xbe]\xbdk\xf2\xe7\xabw\xac9\x9e~b\
-\x22\x80V\x8a\x80\x9e\x8b@\x12\x89@O.\x026\x12\
-\x81\xea\x9d%\x82\x08\x10Y\xda#\x1a\x90)\x95\x08\xa6\
->\x09\xa6\xd8]\x9f\x9e\x06]jwh\x93\x93\xa1\x0c\
-\x0e\xe6\x22c\xaf\xae\x84\xa5\xb0\x08\x86\x9c\x1c\xd4ge\
-\xa1z\xeb\x16\xd4\xee\xda\xc5\xe3\xfb\xb6\x80\x91_\x17K\
-\xe4\x1f\x95J\x96\xbf'dD\xfe\x12N\xfe\x83m!\
-\x7f6\xbd\xe2\xb2\x93\x85\xfc\xbc\xff\x02\xfd\x05N\x06L\
-\x1b\xd3\xbf\xe7e\xd3\x86\xff\x15\x16\xa2\x0f\xb7\x1a\x1aP\
-RX\x88\xbc*3\xce\x9e0\x8a\xace\x0e\xc6\x0c\xcd\
-\x10w\xdf\x11y\xed\x9d\xdf\xa7\xff\x85\x84\x86#\xa3\xef\
-\x10\xe4n_\xc5o\xf9\xf5\xdf\x07\xc0\x0b\x17Y\x97W\
-\x16\xfc\x88\x7f]?\xadi\x0c\xdc\xc2\x96\xdfz\xf2$\
-Lu\xac\xcc\x9b\xe0\x0d\xb8-\x16\xd8s\x0f\xa2\xde\xc3\
-\xfcE\x05\xfa\xf4\xed\xd3\xa4L\x98^\xa3GE)[\
-\x0a\xac\xe7U\x85\xd9\xa0\xd7Z\xab`\xd1F\x09\x85A\
-\xb4Z$\xf7H\xc3\xbb\xaf}\x80\xf1\x13\xcf o\xc6\
-\xe1y\xf1\xe3_Sv\xe7\x94\x14\x1do\x7f\x11\xfbg\
-x\xb8\x16\x1cK\x04\xe4\xfcVbA\x04(\x1c\x88\x8c\
-!\x11\xb0\xa0jG1\x0c\xf9\xad\x17\x01\xa5^\x0fM\
-\xb7n\xd0vK\xa4#\x01j\xf2\x804th\x93S\
-\xb9+\xcfD\xc0\xd1\xd0\x00kq1Lyyh\xd8\
-\xbf\x0f5\xdb\xb6\xa1f\xcb\x168\x0c\x86c\x7f\xc01\
-\xe0#\xff\xe8\xee\x88g\xe4\x0fV\x13\xf9\xcbD\xf2W\
-\x9f\xb2\xe4g\x90\x04\x80\xf0\xf8m\xd3\xdf\x1e\xd4;\xf9\
-\x16\x96d\xab)-\xc2\x9e\xc3\xe5\x18q\xc6 l\xdd\
-W\x88\x11\xfd{ $X\xd7\xb8\x9e\xdf\x8f\xfc\xde\x95\
-\x7f2\x97\x05Ey\x07a\xf5\xa8[\xbc\xfe\xba-\x07\
-\x10\x13\x19\x82\xbei\xdd\x84'\xbc\x84oR\x17\x80m\
-\x10\xc1\xb6\x86\x22\xf7\xdf\xd4\xe0\x13\x0aV\x03\xd0EV\
-,\x9f\xdc\xff\x10\xf2H\x98\xfb\xef\xb5\xfe\xec\x1biT\
-Z\x94\x15\xe5!$*\x8a\x7fG\xb6\xbd\xb6\xd2i\x86\
-M\x15\xca\xaf\xcb\x8a\x8f\xa6\xa6e\xe0\x837\x17`\xcc\
-\xb8\xc1\xa8\xac1\x94\xdf\xfd\xbfo\xe3O\xb4\xcf^\x22\
-\x11\x90\xb5Y\x04\xd2\x11\x1d\x97\x08\xb7;\x09\xc6\x123\
-\xecF'\xb1[\x03\x85F\xcbw\x02\x92\xd1we\xeb\
-\x17\xd8*F\x85VG\xf1u0\x14t\xc8U*8\
-\xcd\x16\xb8\xcc&8\x8dF\xbe\xdc\xd6a\xa03\x91\xde\
-RT\x84\xea-\x9ba.)\xe9\x90\xaa\xc5\x02\xf9C\
-\x11?:\x95\xc8\x9fF\x96\x9f\xc8\xbf\x8b\x91\xff\x00*\
-\xdb@~\x9c\x84\xe4g\xe8\xf2\x02p\xd99\x03\xfaO\
-\x9f4|S\x88^\xab7TW!\xaf\xa0\x98\x17\xd8\
-\x0c\x0e\x8b@YU=\xce:\xa3w\x93l\xbf\xf7\xb6\
-^vf\xbb\xf3\x0e\x1d5\x09\xc5\xbb\xd7\xa0\xc2\xc0\xb6\
-\xaf\xf6[\xf7\xef\xd7\xb5K\x96\xff\x89\xcb\xcf\x1f\xd9\xb8\
-\x12\x98\xa3)\xf9\xd9\xff)\xc9\xfdw\xd8,MV\x04\
-\xda\x0f\xee\x83\x93\xdcU\x96\xfdg\xfb\x00j4\xea\xc6\
-\xa2\x1f\xf4\xf9r\x8f\x0ce\xc5\xf9\x08\x8f\x15\xf2\x02\x1a\
-K\x0d\xec\xaa \xb8\xe5\xc2\x9e\x80\xec\x86\xa5\xee\x19\xbd\
-\xf1\xc9{\x8b0\xfc\x8c\xbe\x14\xa6\x18\xb6\xde\xf7\xf2\xf7\
-g\xb4G\xdf\xb5Y\x04\xceH\xe6\x9e@L\xef\xa1\xb0\
-V\xdaP\xb3\xbd\x08\xb5{\xf3`.\xae\x80\xad\xa6\x86\
-[q\x16\x8b\xb7&\x1e\xef\x0c4\x92\x9f,\xffYi\
-\x00\xb3\xfc\xbbJO\x1b\xf23ty\x01x\xf2\x8e\x0b\
-?\xe9\x9f\xde\xedj\xb6\x9a\xae\x8a\x5c\xe9=\xf9\xd5\x18\
-{\xe6P,\xf8\xf6\x0f\xdc5\xe7\xec#,~c\xf2\
-\x0fHL\xea\x8e\xc8\xe8\x18\xe4\xed\xdd\x00\xa3S{\x04\
-\xf1Yq\xd0\x9c\xfcr~\xe3O\xef\x1e,\x09\xd5\xa8\
-\x00\x9e#\x1e\xb3\x8d=\xc9\xd29\xed\xc2s\xcc\xfd7\
-\x1a\xe0(8\x8c\x1a\xe2\x83A\xa9\x16\xb2\xff~\x85D\
-tZ=\xea\xab\xaba\xb5\x99\x11D\xa1\x03\x83\xceX\
-\x0a\xb3>\xae\xd1\xabP(\x90\xd6\xbb/\x16/\xf8\x1c\
-\xfd\x07\xf4DI\x95\xe1\x9b\x87_[~Q{\xf5\xdf\
-\x8b\xc0Lj\xf1\xcbh\x95\x08\xe8I\x04\x92\xd0\x8b<\
-\x81\x88\xb8\x10\x98\x88D\xc5\xab\xf7\xa3fo9Yv\
-{\x87\x96\x1co+dJ\xfa\xbeq\xa1\x88#\xf2\xc7\
-\x9d\x95\xce\xc9_\xccb\xfe\xd5\x8c\xfcU\xad\x22?\xf5\
-K\x0e\xfd\x9a\x97=\x08T\x06\xba=\x7f\xf3\x1d\xbb&\
-h\xb0\xc9.\x9f6j\xc4\x85\x13\xfa\xadS+\xe4j\
-Cu\x05\xf6d\x17\x93\x95\xcd\xc0\xa2\x95\x7f\xe1\x8ai\
-#\x90\x18\x17!\xf6\x92\xac\x99\x17\xc0 '\xeb?\x01\
-U\x87\xb7\x91\xa7P\x0b\x07[\xf9\xe7O~\xb6l\x94\
-\xfe\xf7;\xb9\xff,\x87\xe0\xfb\xdcF\xd6\xc3?\x01\xc8\
-s\x0c\xec?wcM\x00'\xdb\x0d\xb8\xae\x96/\xfe\
-\x89\x8c\x8f\xe7\x1b\x81\xfaW\xfcQ\xd0\x07\x94\x15\xe5#\
-4:\x9a\x8b\x8d\xcc\xed\x82\xd6R\x01\xb3.N, \
-\xe2\xe1%\xa92\xfa\xf6\xc7\x97\x8b\xbe&\x01IBA\
-Y\xed\xff\x9ex\xf7\xe7\x07\xda\xb3/\x8fG\x04z\x9f\
-\xdd\x8b\x8b\x80\xf1@%\x8aVd\xa1v_9\x5c\x8c\
-T'\x03\xd8\xbe\x02\x11z\xb2\xfa\xe9H\x98D\x1e`\
-\xa8\x16E\xbb\x8a\xb1\xff\xe7\xfd\xa7\x15\xf9\xc5\xef\xd95\
-\xf1\xf1\xc7\x1f\xff\x9fB.\x9b\xab\xae\xdc\xa8v\x18\x1b\
-P\x5c\x5c\x88\x92Z;\xb9\xffA,N\xc6\xe5$\x00\
-\xf0\xdd\xca\xdbx\x16N2\x22c<\x92{\xf6\xc6\xe1\
-\xed?\x09\xc9\xbff\xeb\xfe\x15*\x0d\xea\xeb\x1bPU\
-k@\xf7\xc4h\xe1I\xdf\x98\xf1\xf8\xcd\x04\x8a\xf1\xbc\
-\x9c\xad<k\xb4\xee\xec\xb0\x1d\xda\x07\x07\x09B\x0e\x0d\
-8\x96\xfcSzo\xf7\xe5\xd3\x7f:\x18\xeaj`\xa1\
-\xb888B\xd8UXe7\xf0%\xc0VU\x08\xfc\
-\xf3\x04\x19\xfd\x06\xe0\x9b\xcf\xbfGJJ4\xb6\xee+\
-\x9a\xfd\xce\xd2M_\xb4w\x7f\xbe\x00\x5cE\x9f\xf5\xec\
-\xb1^''\xcb\x1a\x1a\x1f\x86>\xe7d\x90'\xd0\x0b\
-r\xa7\x1b\xe5\xab\xf6\xa3\x98\xc8e\xab\xb5tH\x1c\xdf\
-V0\xd1\x0cN\x8dD\xda\xd5#\x11\xdc?\x01\xb5%\
-\xf5\xd8\xb5t\x07\x0a\xb7\x15\xc2f\xb2\xb7\xe6;V:\
-\x81\xa9';\xf9y[\x03\xfd\x05\x02\x85\xb7\xdex\xfd\
-\xb7k\xaf\xbb\xfe\xac\xaf>y\x0b\x96\xec5\xd8\x99]\
-\x82\xcc\xcc\xdex\xed\xb3_\xf1\xd4\xdd3\xa1R\x8a\x85\
-\xa3\x8f\x22\x02\x03\x87\x8d\x81\xa9\x22\x17\xc5\x146\xd8\x5c\
-J\xbfE\x7f2n\x8d\xe5r%\x0e\x17\x96\x22%!\
-J\xfcD\x8f?\xff\xbd\xff\xd7\xe8\xf66[\x16\xec2\
-4\xc0I\xd6\xbd\x92\xdd\xfbO\xae~\xf7\x1e=|\xe4\
-W\xc8\xc9\xfa\x93b\x94\x17\x15 82\x12\x0aq\x8d\
-\x7f\x90\xa9\x0cfm\x04\xdc2\x95o\x9d\x00\xfb[Z\
-\xefL,\xf9\xe4\x0b$%\xc7\xd9?Y\xb93uk\
-V~Y{\xf6%\xb1>D\x0d|J\x0f\x87\xfc\xed\
-\x0b\xa9\x83T\x1a\x15b\xd2c\x90y~&\x92\x07%\
-\xc2UeB\xc9\x0f{P\xf1g\x1e\x1c\x06k\x9b\x97\
-\xf8\xb5\xf6n\xc0\xb6\x80\x09\x80.!\x1c\xa9\x17\x0fB\
-\xc4\x88\x1e0[\xec\xc8\xfa1\x0b\xb9\xbf\xe7\xc2Tm\
-\x80\xdby\xec\x1c\x05}\xaf'\xee\x03>h\xcf~\xee\
-\x08tU\x01P>z\xfb\xec_z\x0e\x9d2\xee\xdc\
-s\xcf\xc5G\xcf\xcf\x85\xa5\xa1\x12\xbf\xed,\xc4y\xe3\
-\xfa\xa3\x9f8W\x7f\x84\xdb/\x8a@HX\x04\xfa\x0c\
-\x1c\x89\xdc\xad?\xa0\xd6\xa6\xf6\x1b\x84\xc2\xebTDX\
-\x07\xc5\xe5\x0dF\x0bB\x83uh\xc6|\xe1\xd1Q\xa6\
-\x03\x9dn7\x91[\x06gY1\xdc\xe4\xfe\xe7\xda]\
-\x88IL\xe2\xdb\x8cy\xdd\x7f\xadFK\xd6\xbf\x16f\
-\x93\x01!\x91Q\xbe\xf5\xff!\x86\x024\x04'\xc3;\
-\x85\xc8^\xae\xd5\xe9\xf8,\xc0\xfbo|D\x1eK\xca\
-\xf6\x87\xdfX1\xb4=;r>E\xc7d\xed\x16y\
-ZI\xfe\xe8\x9e\xd1\xe8=\xb97\x92\x07'Bav\
-\xa2j}6\xca\x7f\xcf\x81\xa5\xbc\x01\x9eV\x10\xab\xb3\
-\xa0\xd0\xaa\x10\xd6'\x0e\x09\xe7f\x228\xb3\x1b\xeak\
-\xcc8\xf0\xcb\x01\xe4o\xcek\xb5\x08\xe0\x14\x10\x81\xae\
-(\x00\xb2\x99\x13\x06\x8c\x1f;,cuN\xb5Lq\
-\xce\x85W!*2\x02?,\x9a\x8f\xbfv\xed\xc3\x1d\
-WN\xf2e\xf9\xbd\xe7&s\xfb\xac\xe0g\xff\xa1p\
-\xdb\xeaQt\xf8 \xcc.\xa5\xdfk\x85\xc4\x9f\x8a\xdc\
-s\xab\xd9\xc8\xa7\xf5\xfc\xe1\xbf\x19\x88\xf7\x09\xff%\xc1\
-\x8c\xfc\xac\x8a\xad\x92\xdcd{\xf6\x01\xbeAh\x8e\xcd\
-\xc9\xdd\x7fV\xd5\x97W\x0b\xa73\xb3\xfe\x15%E\xfc\
-\xe6\x1f>\xf7O\xefU:,P\xdb\xeb`\xd2\xc56\
-Y'\x10\x1c\x12\x8an)\xdd\xf1\xe6\xcb\xef 9\xa3\
-\xc7[\x8f\xbf\xf3\xd3m\xed\xd5\x91\xc7E\xfes\x88\xfc\
-\x83\x92\x88\xfc\x0eTm\xc8A\xc5\xfa\x5cX\xcb\xeb\xf9\
-\x1e\x03'\x15\xd8]\x9fl\x0b\xaf\xdeq\x88?\xa7\x1f\
-B2)\x14 \x118\xb8v?\x0a6\xe5\xc1\xd8z\
-O\xe0\xf1\xfb\x81\x0f\x03\xdd\x9c\xa363\xd0_ \x10\
-m~\xea\xce\x0b\xbe\x0e\xd1kfe\xe7\x16\xa3\xcc\x16\
-\x8as/\xbc\x14\x89\x89\x89\xc8\xd9\xba\x02\x09!\x0ea\
->\xfd(\x22\xc0v\xf5\x1d<\xeal\xe4\xfd\xf5\x03*\
-M\x10\xd6\xfd\xfbA\xa3\x0b\x81\x9d\xac\xbf\xc7\xfd7\x03\
-\xda\xe3\x1f\x0e4\x86\x02F\xb3\x15Az\x0d<f\x0b\
-\x9c\x05\xb9<\xfboRk\xd1\xa3Gw\x9fx\xa8U\
-\xac\x02P\x1d\x8c\xc6z\x84EE\xfb\x04Dk\xad\x84\
-K\xae\x81M\x19\x0c\xff\xf2\xe0aQQ\x08\x8b\x8c\xc6\
-\xa7\xef/\x8224\xe2\xfa\xd7\xbe\xd8\xf0Q{t\x22\
-#?E\xc3\x8b\xd0\x06\xf2\xf79\xa7\x0f'\xbf\xd2l\
-\xe7\xe4\xaf<Y\xc9\xef\xfb\xee^\x11\x88G\xdc\x14\xf2\
-\x04\xfavCm\xad\x09\x07\x99'\xb0\xe9p\xabE\x00\
-'\xb1\x08t9\x01\xb8\xfe\xd2\xd1gM\x1a\xd2k\x8d\
-\xc5dU\xee\xddw\x00\xbb\x0bj!\x0fI\xc6\xd8\x09\
-\xe7`\xd2\xa4I\xd8\xbdy\x0db\x14\xe5P\xfa\x0a\xca\
-5\x15\x81\xf4\x8c~\xd0\xaa\x15\xc8?\xb8\x0dF\xa7\xba\
-I'\xcad\x0ah\x82Ba5\xd55\xfdPo\xb2\
-\xaf\xc9s\x1e\xbf?\x09\x8fk\xeb\x8d\x08\x0f\x0d\x82\xab\
-\xb2\x1c\xee\x9a*\xbe\xf8',6\x0eQQB\xcd\x7f\
-\xa5B\xc5\xf7\x1c\xa8*+Aht\x14\xe4\x0a\xa5\xcf\
-\xd2\x87\x92\xfbo\xd0u\x83[\xf4\x14\xbc\x22\x10\x1d\x17\
-\x0f\xb9R\x83e_.\xc3\xd6\xfc\x86\xde\x1bv\x91\xdb\
-r\x828>\xf2\xf7\x15\xc8O\xf1t\xcd\xef\xd9\xe4\xfa\
-\xe7\x92\xdb\xdf>\xe4o\xcfz\x00G^\x84\x89\x80\x1a\
-!\xe4\x09\xc4M\xe9\x87 \x12\x81\xbaZ#\x0e\xac%\
-\x11\xf8\xf3\xd4\x17\x81\xae&\x00\xf2W\x1e\xbc\xf8\xd7\xc4\
-\xe8\xf0qU\xe5\xa5\xd8~\xa0\x185\x16\x0f6\xef-\
-\xc2\x05\x93GA\x11\xd6\x033/\xba\x18\xf9\xd9\xfb\xa1\
-1fA\xa7p5\x11\x01\xa5R\x8d\xe1\xe3\xceE\xd1\
-\xae\x9fQVk\xe3{\xfc\x09\xbd(\x9c\xb5Aa|\
-!\x8fK\x9c\xcb?\x02~q\xbf\xa7\xc9\xbf=\xa8\xa6\
-A\x15\x1e\xa6'\x7f\x82\xe2\xff\xbc\x1c\x22\xba\xb0\xf6?\
-##\x83\xd7\xf4g\xd3\x8a,\xf9WM\xe4W\xa8\xd5\
-\xd0\x05\x07\xfb\xde/w\x92\xe7`\xa9@}Pb\xb3\
-\xda\x82@|R2\xbf\x1b\xf0\xe7\x95k\xea_[\xb6\
-+\xfcD;\xb0\xed\xe4\x8f\x11\xc8?8\x99,\xbf\x8d\
-\x93\xbfz}\xce\x09\x93\xbf3*\x025\xbe\xd9_\x04\
-\xfaCO\xe1@]-\xcb\x09\xec'\x11\xc8=\xa5E\
-\xa0K\x09\xc0\xbds&\xfes\xd4\xa0\x1eo9\xacV\
-\x14\x15\x15\xe2p\xb9\x19\xcb6\xe6\xe0\xf2\xf3\x86\xf1\x1f\
-\xd9\xe1\x92\xc1\xaa\x8a\xc3\xe4\xa9\x17B\xa5R\xa2\xe2\xc0\
-\xef\x88\xd5Y\xf9\xcd9\xac\xabz\xa6\xf7AHH\x08\
-\xf2\xb26\xa2\xc1\xaen\x9c\x16\x84\x90(\xd4\x87\xc5\xc0\
-TWq\xd4\xcf\xf7_\xfe\xeb}\xc6\xab\x01\xa5\x15\xb5\
-\x88\x8f\x09\x87\xc7A\xc2r8\x07\x0dl\xed\xbfL\x89\
-\xf4\xf44\xdfm\xbf\x86\xda\x1a\x9e\xf8\x0bc\xdb\x80\xf9\
-U\x0f\xd2[\xab\xe0\x92\xa9\xf8\xf4_cu!\xf0s\
-R\x8f4\x14\x15\x96b\xc3o\x7f\xee~c\xf9\xae\x81\
-'\xd2\x7f\x8c\xfc\xd4\x1b\x9fR{\xff>\x91\xd8\x84\xfc\
-\x99H!\xf2\xab,\x8c\xfc\x87P\xbd.\xa7\xcdn\x7f\
-k\xc8\xde\xfc5\xad\x19\xd8m\x1a\xfc\xf4\xfb*\xd8\xe6\
-\x9e\x14\x0e\xc4\x9c\xcbD\x80<\x81\x1a\x13\x17\x81\xbc?\
-sZ-\x02\xb2\x93L\x04\xba\x8c\x00\x8c\x1f\x9a\x11}\
-\xd5\xf9\xc3\xb6\x85\x07\xeb\x92\xabJ\x8b\xb0+\xb7\x02E\
-uN\xe8u\x1aL\x1d\xd3\x0f\xd5\xe4~W\xd7\x99`\
-\xb5\xbb`\x91G 1m \x86\x0d\x1b\x86\x82\x9c,\
-\x84:\x0a\x11\xa2\x03\xce\x187\x95/\xfb-\xa38\xd0\
-\xe9n\xba\xe6E\x17\x12\xceo\x15f\x1e@SxZ\
-\x18\xc1\x1e?g@(\x12\xea\xf6\x90\xbb\x1f\xa2'\xd7\
-\xbf\x06\xee\xaar~\xeb\xaf62\x0a\xb1\xb11|\xfe\
-\x9f\x89V\x0d\x85\x06\xa1\x14\xf7+\xd8\x14\xa5\xa7\xb1\x82\
-P\xa81\x1fU\x9axq\x9d@\xd3\x22\xa3={\xf7\
-\xc5\xae\xed{\xb1y\xf3\x8e/>\xf8y\xdf\xec\xe3\xed\
-\xbf6\x93?\x8d\xc8?\x99\x91?\x85\x93\xbf\x96\x91\x7f\
-}6\xace\xed\x1b\xf3w\xc44\xe0\xd1/&\x88@\
-\x08\x89@\xec\xd4\xfe\xd0\xf5M$O\x80D`\xcd\xbe\
-6\x89\x00a\xde\x03@\xbb\xe4bN\xb8I\x81\xfe\x02\
-\x9d\x85\xc7o=\xef\x95\xbe\xdd\xe3\xef\xb6\x92\x05\xcd-\
-(AY\x83\x0b+7\x1e\xc2ssg\xf2E8v\
-\x1a\x94u\x0d\x16T\xd6\x1a`4\xdb\xe1\x94\xeb\xe0\xd4\
-\xc4`\xf8\xc8\xb1\x08\x0f\x0f\x87\xa9\x22\x07#\xfaD\xa3\
-\xe4\xc0\x06\xd4\xdb5\x8d\x1d\xc8{PN1y74\
-T\x15\x1f\xe5\xd3\xbd\x89\xbef\xcf\x89\xda\xc0\xb6\x05\xef\
-\x99\x14\xfb\xff\xe4\xbd\x05\x9c\x1c\xd7\x95=|\xaa\x19\x86\
-\x99g\xa4a\x16\xb3-Yl9f;\xd9\x0d\xa3\xb3\
-\xd9\x8d\xb3\xd9\xec\xdf\xc9n\xe2X\xcef\x03\x1b\x87\xd1\
-\x1bp\x1cp\x0cI\xcc Y\x92m1\xb34\xd20\
-\xf3L\xf7`sW}\xf7\xbd\x82\xae\xee\x99\x91e\xc7\
-\x9b8\xfe\xea\xa7V\xf7TwWW\xbdz\xe7\xdcs\
-\xe1\xbd\xc7\x81+\xf6t\xf1\x11\x80\xcd\xfe\x10\x0a\xe7\x15\
-\xc1\xe1pr\xb7\xc05\xd4\xcf'\xf9\x94\xa5\x7fd\x1e\
-\x01s\xc0\x03sh\x8a\x08\xc3\x09\x22\xb7\x19\x0a\xa0\xbc\
-v\x01v\xbd\xb8\x07\xe7/4\xde\xfd\x87\x03\xed?~\
-3m\xa7\x82\x1fo\x00\xfc\x95\x9b\xaa9\xf8-\xcc\xf2\
-\xefo\xe6\x8f\xb7\x12\xfcW\x9a\x1e\x5cw:\xb3\xbe\xfe\
-\x8b6\x95\x04*\x98\x12\xa8%%\x90\x07\x17S\x02{\
-\x1a\x14\x12\x98\xb8Z%\xf0\xb6 \x81\xff_\x10\xc0\x87\
-o]\xbeh\xfd\xe2\xd2\x03\x16\x83\xc1>\xd0\xdb\x85\xf3\
-\x9d.\xec9\xd5\x8b\x8f\xde\xba\x02\x95\xf3\xb2\x94\x15u\
-\x88\x04BaLL\xfb0B\xfe\xf8\xf8\x94\x8f||\
-\x09!c\x22,I\x05X\xb1r\x15<S\xe3\x08\x0f\
-\x9fG\xb2\x8d\x95\xacFf\xa1\xb7\xc7%\x81-\x1c\xe2\
-\xf7L\xbc\xce\x99\xe8\x8b~\xe4\x17!\x02DW\xff(\
-\xe6\xe5\xa7\x03\xf4\xfb\xe1\xf6fx\xe8\xb8}\x84\x93\xb2\
-\xb2R\x1e\xf8\x9bt\x8f\xc2\xe7\xf5 1-]\xfe\x96\
-n\x12\x918\xef \x06\xfd\x16\x18l\x0eX-\xa6\xa8\
-\xac\x82\x95\x08c~E5\x1ey\xe8Q\x8c\x8e\xb8\x96\
-<\xbc\xaf\xed\xe4\x1bm\xbb7\x07\xfe\x1a.\xfb-\xde\
- \xdc\xfb\x1b\xe9\xd1\x0c/\x81_z\x0b\xc0\xaf\x87\xd6\
-\x95H@x\x9d\xd7oEL \x8eH mK\x1d\
-\xec*\x09\xbc\xc2H\xa0\x05S#\x7f?$\xf0\x8e'\
-\x80\xaa*X>\xbe\xf5\x96=\xb9\x99Ik&FG\
-\xd0\xd0>\x80\xd6!\x0f\xbc\x01\x11\x9f\xb8}\x15\xd4Y\
-}\xd4\xe6`#\xef<>\xea\xb8\x13\x1e\xb8\xc7\xa7\xe1\
-\xf1\x07\x91\x92\x91KV\xdf\x8e\xd4\xec\x22\x94\x97\x97\xa3\
-\xaf\xe3\x12\x12\xc5\x01\xc4\x99C\xfc[\xc9YEp\x0f\
-vbN[\xa4/\xff\x8f\x19\x0bp\xb9\xad\x1f%\x85\
-\x990\x1a\x04\x88\x93\x13\x90\x06\xfb1\xc0:O|\x22\
-\xf2\xf3\xf3\xe0\x9b\x9a\xc6\x04\x11\x80,\xfdMQ\xe0\x17\
-\xa40\xe2=\xfd89bB\x09\x11\x88>\xfa/(\
-s\x15\xe4\x14\xce\xc3O\xbe\xf3\xa0D\x04\xe5$\x02\xf0\
-\xe2\x0dl\x0c\xfc\xde\xab\x06\xbf\x05\xe9L\xf6\x93\xe5/\
-\x5c\xc8,\x7f\x00\xe3\xfb\x9b\xe0\xda\xd7\x0c\xff\xc0\xd8\xeb\
-Z~i\xf6\xc3\xce|_\x98\x1d\xf8s\x11\xc0\xacD\
- \xcdq\xecY\xbe3\xf75\xcb$\xe0\xac\xc8&\x12\
-\xa8\x85\xad:\x1f\xae\xd1i\x5c~\xe5\xe2\x1b\x22\x01\xda\
-\xb6\xff\xc7\xdf\x90\x04\xde\xf1\x04\xf0\xc5\x8fn\xf8jm\
-Y\xee\xbdb \x88\xee\xee\x1e\x5c\xea\x19\xc7\xcb\xc7;\
-\xf1\xcd\xcf\xde\x08\xbb\xd52\xa3\xc4\x975\x09\xf3\xc7\x03\
-\xe4\x83Oz|\x18\x9f\xf4!=\xbf\x12\x03\xed\xe70\
-2M*\xc1\x92\x85\xfaEKI\x9a;\xe0\xeakF\
-N|\x10\x09\x0e\x13\xa6\xc7\xe7\x1a\xed)\xcdx\xa9\x1f\
-\x10t\xeer\x17\xea*\xf2\xe5\xf2\xff\xc1>HS\x93\
-h\x09\x84\x91\x93\x9f\x0f\xa7\xcd\x0e\xf7\xf0\x10\xec\xf1q\
-\xf2\xa2\x1f1\xd3\x87Y\x02\x93\x90\xc8\x7f9\xde2\x8a\
-:6\xcb\xb0\x0a~\xc8A\xc9\xd4\xcc,X\x1dq\xf8\
-\xf5\x83\xbf\x1bxxok\xf6\x1bi\xb77\x05\xfe\xcd\
-5(T,\xff8\xb3\xfc\x0a\xf8U\xcb\x1f\x0b\x07\x83\
-\xee\x18W\xdaD\xe5\x03\xb1`\x97pu\x040\xdb\xeb\
-\x99\x15\x1c\xd1\x07\xd2\x9f\xeb\x9c\x0b\x88(\xee\x00#\x81\
-\xd4-\xf5D\x02y\x0a\x09\x5c\x90\xdd\x81\x91\xf1\xb7=\
-\x09\xbc\xa3\x09\xe0c\xb7/_wm}\xf1K$\x8d\
-m\xae\x81~\x9ci\x19\xc4k\xe7\xfbq\xe7\xa6\x85\x04\
-\x98\xdc\x19%\xbe\xd1\xd3x\x09|&\x1f\xb6\xf6\x9fd\
-\xb0\xe1\xf4\x91W00\x16\x86H\x9f\x09\x93[ 8\
-2P][\xcfe\xf6\xc4@+R\xcdn\xd8\x8d\xa1\
-9\xce$\xb6\x06@\xfe\xaf\xb3o\x84@nCj\xb2\
-\x93Kw\xb1\xa3\x15~z\xee$uRAJc|\
-d\x88W\x16\xca\xd3}+\xc7\xd1=;\xfc#\xf0X\
-Rp\xf8l;V\xd4\x15i\xe5\xc5j!\x13\xab\x00\
-t\xbb'\xa5'\x1f\x7fn\xc7o\xf7\xb7m\xbb\xdav\
-\xdbN\xe0\xb7\xbd!\xf0g\xa0\x92\xc0_@\x96\xdfF\
-\xe0\x1f\xdbw\x99\x1eM\x1c\xfcP-\xbf0\xc7\x010\
-\x13\xbcs\x819v\x7f\x18W&\x00\xf5\xa1\x07\xb0\x88\
-\xb9\x01\x1d\xd9?\x1bi\xcfq\x19\x0a\x098*r8\
-\x09Xk\x22$\xd0~\xb8\xe5\x0d\x91\xc0\x7f\xfe\x0dH\
-\xe0\x1dK\x00k\xeb\x0b\x93\xee\xd8\xba\xe8@ZR\x5c\
-u\xc0\xe3\xc1\xe5\xd6n\x5c\xec\x9e\xc4\xa4/\x84O\xde\
-\xb1z\xce:\x7f=\x09\x98-V,\xbef\x0b:\xcf\
-\xbe\x8a\x96\xaeA\x0c\xb9\xbd\xdc5\xf0\xf9\xd9\xac\xc0F\
-\x18\xe2\xb2\x116'\xa2\xa2\xb2\x8aO\xbc15\xd4\x82\
-4\xf3\x04l\xa6\x18\x22\x88\x19\x0b\xa0V\x04\x1f=\xdb\
-\x82\xe5\xf5\xc52p\xe9\x1c\xa5\x81^\xbe\xf0G\x80\xac\
-v\x0aY}\xee\xf7\xa7\xa7+e\xc8\xd1\xe07J\x01\
-\x18\xc2!\xf8`\xc5\xbe\x93MX\xbb\xa4T\xbd\x0c\x99\
-\x00\xe8uQY%\xce\x9di\x08\x1d\xda{\xf8\x1b$\
-\xff\xef\xbb\x9avc\xe0\xb7\x03\xbf\xa3\x9fX|\xc5\x0f\
-\xb2\xba\x08\x15\xfc\xe4\xf3\x17-,\x84\x95\xc0?q\x80\
-\x81\xbfQg\xf9g\x079pEN\x98\xb1I\x88\xb6\
-\xf8l\x13c\xde\x9b\xeb0F\xcct\x09\xf4\xee\xc0,\
-/c\x8e!\xcdx\x8a:M\x95\x04*s\x90\xb2e\
-\x01l5\xf9\x18\x1d\x9d\xc2\xe5=\xe7\xdf\xf6$\xf0\x8e\
-%\x80\xedwm\xfa\xdf\xf2\xa2\xcc\xbb\x04j\xf7\x8e\x8e\
-N4\x0fLb\xc7\xd1v\xfc\xf7\xa7\xb7\xc1\xc1\xa6\x9f\
-\xd2M\xde\xa1'\x01m/\xbd\xae\xaa_\x06\x9b\xc5\x84\
-\xf6\xf3\xfb0\xea5\x22\x10\x08ar:\x00\xf7\xa4\x07\
-\x1e\xbf\x08\x835\x81\xa4\xff0B\xe6d\x18\xe3\xb2P\
-V^\xc1\xc7\xe9{\x86\xdb\x90j\x99\x84\xc3\x14\x19\xdf\
-.E\xff\xc7\x07\x0au\xf6\x8e\xa0\x86Kw\xdaK\xd6\
-\x1e\x13\xe3h'\xf9\x9f\x90\x92\x0a!\x14\x88\xf8\xfd\xba\
-Y\x83T+o\x0ey\x11 e\xd2?<\x86\xde\xa1\
-1,\xae*\x88\x02?\x1b\x87P\x5cU\x8f\x97\x9e\xdd\
-)\xb54\xb6\xbe\x87\x08\xe0\x8f\xaf\xdbf\x04~+\x81\
-\x1f\xb3\x80_\x0f\x0e\x83b\xf9\xd3J\x98\xe5\xaf%\xd9\
-_\x08\xbb7\x84\xf1\x03\x970\xb6\xf72\x81?\x12\xf0\
-\x8b\x06\xca\xcc\xdf\x8c\x06S\xcc\xd8\x09\x85\x93g\xb3\xf2\
-\xec\xf5\x5c\xcb\x86\x0b1\xc7UU\x80A\x11b*%\
-\xc5~.\xf6b\xf5\xbf7\x83\xc6\xa4\x18U\xa0\x91@\
-.'\x01+\x91\xc0\x88K!\x81C\xcdWM\x02\xc2\
-_\x99\x04\xde\x91\x04\xf0\xcfw\xaez7I\xe2G-\
-F\x93a\x98\xac*\xcb\xf9\x1fm\x1c\xc1\xd6\xd5\x95X\
-H\xfe\xb6\x0a~\x16\xb97*\xab\xc0DH@\xfe/\
-5-\x0bU\x8bW\xa3\xed\xf83\x18\x1a\x0f!$\xca\
-\xef\x87E\x89O\x13nO-Bs\xc3\x19\x8cMN\
-#\x18\x0a\x93T7#dI\x86\x99T\x01\x1b\xba\xcb\
-\x8e\xeb\x9f\x1c\x86S\x1aC\xb2\xc5C\xa0\x89\x1e\x09x\
-\xf0T3Y\xff\xf90\x19d\xe1)uu\xd0o\x84\
-\xd1B\x0a%-1\x9e\x0f\xe2\xb1:\xec\x91\x01D\xba\
-\xe9\xc3\xf8\xe2\x1f\x22sG\x0c8q\xb1\x13I\xf1\x0e\
-\x94\x14\xa4i\xe0g\x97\xc2b\x06\x05\xc5\xe5\xf8\xdd/\
-\x1f\x81\xdb5VE\x04p\xe9Jm\xf6M\x02\xbf\xa8\
-\x80?\x0a\xecZ\x9b@k\x1f3\xb9=id\xf9+\
-6\x11\xf8\x172\xf0\x070I>\xff\xf8\xfeK\x08\xf4\
-\x8f\xf3u\x0af\xdf\x14\x18\xe9fN\x99K\xde\xabo\
-\xeaGZ\xc6\xaa\x00=\x09\xcc\xbe\xc9~\xbe\xca\x22z\
-\xb7 \xb6\xe3\x0b\xfa)\x9a\xa2\x0f1\xe3\xfc\x84\x987\
-4\x12QH\xc0\xceI`!,\xb5D\x02\xa3\x93D\
-\x02\xcc\x1dh\xc2\xd4\xf0\xdb\x8f\x04\xdeq\x04p\xd3\xa6\
-\xea\xfcm\xcb*\x0f&8\xed\xf9\xde\xf11\x9ci\xea\
-\xc1x@@{\xdf\x18\xfe\xf9\xddk\xb4A=aI\
-D8,\xc9\xa93\xddd\x1e\xec=Vc\xbfb\xdd\
-6\xb8\xba\xce\xa1\xb7\xab\x0dS\xc1\xe8Er\xd3\x0a*\
-16\xd4\x831\xd7\x08\x9f2\x9c\xb9\x05\x93\xf4\xac\x12\
-A\x98\x14\x81dKFVv\x1e\xaf\x1c\x94H\xaa\xc3\
-\xd3\x87d\xb3\x07vc\x80g\x1a\x0e\x9el\xe6\xf3\x0d\
-\xf2\xcd\xef\x03\xfaz\xe0\xa6\xbe\xe1&t\xa4\xa7$!\
-.)iN\xf0\xeb\xd5\xc0s\xaf\x9d\xc7\xea\x85\xf3\x91\
-\x96\x1c\xa7\x81\x9f\x11A|R2\xd2\xb3\xf3Y\x06 \
-H\x9fs\x10\x01\xcc\x15\xa0\x10\xbe,\xcb\xfe\xdf\x82Y\
-\xfe\x99N\xae.\x02/\xf0T_\x06\xb3\xfc\x04\xfe\x82\
-\x85E\x04~?\xa6\x08\xfcc\xfb/#\xd4\xcfd\xbf\
-\xdc\xc1%\xfd\x00J\xc4Xo\xdd\xdc\x09\xda>\xf5'\
-\x0c\xd1\x7f\xeb_G\x83_%\x04I\x09\x12J3~\
-L\x05\xbf\xfa\xcc\xa6\x1a\xd4\xc7\x04\x04\x1d\x88\x85\xe8\xaf\
-j\x84\x10\xa5\x10\xa4X\x22\x90f\xec\x174\x12\xc8C\
-\xd2V\x22\x01\xae\x04&\xb9\x12h;\xc4H\x80e\x07\
-^?\x1dJ\xc7\xdb~\xef_\x81\x04\xdeq\x04\xf0\xcd\
-O_\xffTaN\xea-\xe1`\x08\x8d-\x1d\x98\x0e\
-\x19\xf0\xf8\x9e\x06\xdc\xff\xc9-p\xd2\x8dQ\xe7\xf5\x9b\
-\x9c\xf2!\x81\x95\xf7\xcd\x18\xee\x0bTT/BBb\
-\x12\xda\xcf\xec\x22\xe9o\x8e\xea\x04q)Y\xb09\x12\
-0\xd2\xdb\xcc\x01\xc8\x86\xec\xfa\xfcAN\x00c\x0a\x11\
-\x84\xe8\x06\xb3\xb9\xf8Dc\x1cDK\x12,qi\xc8\
-\xce\xce\xe6q\x82\xc0\x94\x0b\xee\x81\x16d:\x83\xc8J\
-q\xca\x07\x1ds\xd1\xc3\xcdW\xfd5\x90u\xcd\xce\xcd\
-\xd5B\x11\x11\x12\x98m)1\xe0\xe7\x7f:\x80O\xdc\
-\xbe\x1a&\xa3!\xca\x05H\xcd\xca!\xa0\x99\xa5\xdf\xfe\
-\xf2\x0f\xe7~\xb3\xafm\x81\xfe~\xebC\x12?LC\
-\xdc\xb4\x8b\x81_X\x1ck\xff\xa2\xac\xb3AP&\xf3\
-\xc8@\xd5\xc6:\x14\x90\xecw\xf8\x02\x98\xd8\xdf(L\
-\x92\xdf\x1f\xec\x8fN\xf5I\xba6\xd5\x83;\x1a@\xd1\
-\xb3(\xa9\xed<#\xda/\xc4\x92\x80A#\x03Q\x0d\
-\xeb\x11G\x9b\x98kG\xed\x1e&E\x82`P[\x9a\
-\x5cO\x02\x82\xd2\x9ez\x15 \x89zU i\x84\xa0\
-6\xbd\x103[\xa1\x10+\xffc\x0a\xbd\xa2I`\x11\
-\xcc\xb5\x8a;\xb0\xfb\x9cB\x02\xe3WE\x02t\xec\xfb\
-\xbe\x08<\xfc\x17\x83\xe2\xca\xbf\xf1\xce\xd9>\xf7\x81k\
-\xef^VU\xf0CH\x06twv\xa0}p\x12'\
-[F\xb1j\xc1<,\xad\xca\xd7\x02}\x13\xd3~\xd8\
-\xac&X\x09\x90\xfa\x89<\x19\x80\x12\x92\xd3\xb0p\xe5\
-\x06\xb4\x1f\x7f\x16\x03n\x1f\x1f\x1f\xa0~\xc6d\xb6\x22\
-\xaft\x11:\x1b\x8e@\x7f\xd3\xd9+\x961\xe0D@\
-\xc7\x9e\x98\xf6\xf2\x95\x80\x82* \x8cV\x1e,\x94l\
-)|*1\xae\x0a\xd8pa\xef0\xe2\x0c\x1e$\xb8\
-\xda \xf8<h\xf2\x87\x90\x97\x93\x0d\x87\xd31\xd3\xda\
-+?\xa6>\xb3Sb\x85K\x0f>\xb1\x1f\x9f}\xff\
-uQ\xe0g\xaf\xb3\x0a\x8b\xd1\xdb3\x18x\xe9\x99\x9d\
-\x7f\xf8\xf5\xbe\xb6\x8f\xc6\xa6!\xee\xbf\xff~\xc1\xf6\xa3\
-\x1f\xc5\x85\xddnf\xf9\x17i\x1d>\xa6G\xc8\x97n\
-\x90\x8b|J2\x84\xaaMu$\xfb\xc9\xf2\x13\xd1M\
-\x1dh\xc4\xe4\x01E\xf6\xd3\xb5J\x88\x06yd\x12\xd5\
-\x18p+\xd5\x93Qg$D\xe7`\x22\xd6>Z%\
-H\xcaAD\xe8\xc8\xc4l\x8495\x1eN\x02\x9c)\
-\xd9\x09_{?|\xcd\x83\x08\xd19\x92\xd4\xe3\x9eD\
-\x94\xe5\x97D\xed\xa8*)\xa8y\x1a\x163\x8a\x10~\
-4\x19\xe8U\x01\x10K\x041.\x01]\x8dA%\x81\
-\xeb\x97\xc0\x5cS\xc8\xa7\x87\xbb\xb4\xfb,\xda\x0f^\xc6\
-\xe4U\x92\x00\x1d\xeb\xbe/\xff\x1f\x92\xc0;\x86\x00>\
-t\xd3\xa2\xda\xeb\x16\x97\xedsZ\xadI|\xa4_s\
-?\x1f\x9a{\xbc\xa1\x07w\xff\xc3\x1a\x0d\xfc\xec\xe6\x0c\
-\x91_\x96\x95\x96\x183\xdc\x97u^#I\xff\xeb1\
-I\x16\xba\x9b\x5c\xe6\x09\xbf1J\x1d\xcc\xabY\x8d\x9e\
-\xe6\xd3\x08\x06<3\x9a\x8e\x13\x01Y\x1c\xe6Z\xf8\x03\
-!x\xc9:25\xc0\x88\x80\xbdf\xb1\x036\x99\xc7\
-\x18\x1d\xd3hOCBj6RRR\xb8*0\xd0\
-\x09\x88S\xc3\xf0O\x0f\xa00\xd5\x06\x8b\xc1\xaf\x1ct\
-v\x12\x10\x94s\xea\xe8\x1b\xc5\xde\xe3\xcd\xf8\xc8\xad+\
-\xa2\xc0\xcf^\x17\x94U\xe3\xd0\xbe\xa3\x813'\xce~\
-\xa1`\xdd\xfb\x7f\xa8?\xd7\xfb\xe9\xf1\xfd\x1f\xfe0\xde\
-31\xf6\x1b:\xdc\xa2HG\x88\xf6\xd1\x0d\xfc\xb5\xa0\
-\x82\x9fd\x7f=\x8a\xea\xe7\xc1\xe6\xa5k\xa2N<A\
-\xb2?\xc0R}!Q\xf3\xd7# \xd7%\xd5\x94&\
-\xd6\x00=+\xc9\x08\x88U J\x13\xcc\xfa\xd06\x06\
-\xfe\xf4x\xc4/+C\xfc\xaa\x0a\x04\x12\xed0u\x0c\
-\xc1M\x92\xdbs\xb1\x1b\x22\xdd\x03A\x94tq\x80\xc8\
-k\x8d\xab\xe8\x9e\x19t?\xa8A\x5cT\xafG\xe2`\
-\xd7\x13\x81F\x18WE\x02\x05H\xdc\xc6H`\x1e/\
-5\xbf\xb4\xeb\x0c\x91\xc0\xc5\xb7\x05\x09\xbc#\x08\x80U\
-\xfb\xddu\xc3\xcd{r\xd3\x93\xd6L\x8d\x8d\xe3\xd4\xe5\
-\x0e\x14\xe6\xe7\xe0\xe7O\x1d\xc7\xe7?\xbcN.\xf8\x81\
-|C\xba\xfa]\xc8\xcfN\xe1\xa0\xd3wF\xd6\xe7\x8b\
-+j\x90\x99\x93\x8f\xd6\xe3/`\xd8c\xe4\x0b\x82\xaa\
-[fQ\x15\x02\xbei\x8c\x0dv\xcdz\x0e|\xad;\
-MM\x90_\xca\x96\xa5\xa2\x9b\xcb\xc8`\xca\xeb\xe7%\
-\xc6\xd3\xa4\x0e\x0e\x9fm\xc5\x82\xf2\x02\x98\xd8B\xa3l\
-\xf2N\x13\xb9\x09\xd6D\xbe\x86\x1f[\xf2\x8b\x05\x0f\x05\
-\xd1\x0fs\xc0\x8d8\xa3\x07\x0e\x83\x87w\xacH\x8e?\
-bY\x0f\x9dn\xc3\xc8\xd8\x14n\xddP\x1f\x05~\xa3\
-\xc9\x8c\x82\xd2*\xfc\xf1\x91'1\xdc?\xb8~S\xda\
-\x82}\xb83r\xae\xa3\x9f\xdf\x1d\xef\xea\x99|\x98\x0e\
-\xba\x88\x81\x93\x03]\xd7#4\xe9N\xc7\xb2\xd8\x14\xf0\
-o\xa8Ea}1\xec>?\xa6\xc9\xeaO1\xd9?\
-\xc4|~\x05C\x1a\xc8\x15\xa2U\x08\xc1 \xa8\x82;\
-r\xfc\x08Q\xe8c/\x91\x02\xbd\x19u\x01\x86\x18\xf0\
-+VZ\x06\x7f\x82\x0c\xfe\xd5\x15\x98HK\x90&\xc9\
-%K\xa57-m\x83\x18\xdbs\x06\x1e2\x00ar\
-\xf7\x0c\xaa;\xa0\x0e\xa1F\xb4;\xc0\x9aX>\x1b\x11\
-Z\xbcV%\x031Z\x11\xc8\xc7\xd1Q\x85\x14uy\
-\x88\xa4lU\x12\xb0r\x12H\xb8a)\xb9\x03\xf3\xf9\
-\xa4\xb3\x0d\xbbN\xa3\xfd\xc0\x05\x22\x81\xb1\xab\x22\x01\xfc\
-\x1f\x91\xc0;\x82\x00\xee\xbbk\xc3W\xebJr\xef\xf5\
-\x12\xc8\xce^j#\x7f;\x1d;\x8e\xb6b\xed\xe2b\
-\x14\xe7\xa6\xf2\xdb\xc4n\xc8\x04u\x84@0\xc4W\xe9\
-\x89\xf8\xfe\xe0\xc8q\xc6%b\xd9\xbam\xe88\xf5\x02\
-\xfa\x87'\xe0\x0f\xc96\x81\xf5jG|\x0a2\x0b\xab\
-\xd0~\xe1\xe0\x9c\xad\x17\xf6\x87I\xe9\xebF\x08J\x8a\
-*\xa0\xff\x98{\xc0\x88\x80\xb1\xff\x81S-\xa8+\xcf\
-\xe7\xaa\x80\x91\x844\xee\x86\x89\xde\x1f!\x17!!=\
-\x0f\x82\x8d-\xe6\x19\x8f\x84\x84\x04y\xeao6\xbbx\
-`\x1cf\xc9\x0b\x9b\xe0\x87\xdd\x18\x84\xd5\x10\xe0\xbf\xfd\
-\xc7\x9d\xa7\x91I\xd2\xf7\xba\xa5\xa5\x1a\xf8\xd9\xe6\x88O\
-@f\xde<<\xf8\xfd\x9f#\xce\x22\xa4\xbfk\xe9{\
-\xc6\x9a\xb2\xfb\xf8\x9b\xa6\x9f\xec\x88\x1b\xb8\xd4\xc7\xc1\xaf\
-fCT\xe9\x1eua\x84\x5c\x93E\x0e\xf8\x95m\xac\
-EQ\xed<\xf2\xf9\x83\xf0\x1c\xbc,L\x1d\xbc\x84 \
-\x9f\xc3O_\xe4\x13\x01\xbe\xbaS\xd2\xcb\x0a%\x9d\xa0\
-\xceT<W\x19\xe0L\x7f\x7f\xe6k\xf9x2\xf8\x9d\
-\xcb\xca\x11\xb7\xba\x12C\xf1\x16\x9cj\xe9G\x0f)\x92\
-\xba\xf2<\xd4g\xa6\xc0\xd2>\x80\xf1=g\x89\x04\xba\
-!M{%\xd9\x1d\x90t\xb1\x00\x96\x1a\xd4\xa7\xf6\xb4\
-\xf7$\x95\x08\xf4q\x17\x8d\x08$]\x0aQ\x92\xf4\x03\
-;\xd5+\x8f\xf4\x01DH\xc0VY\x88\x84\x1bW\xc0\
-\xa4\x90\xc0\xa5\x97O\xa0\xed\xc0y\x99\x04\xaen\x9c\xc4\
-[N\x02\x7f\xf7\x04\xf0/\xefY\xbe\xee\x9a\xfa\xd2\x1d\
-RX\xb2^\xb8\xdcL\x9d?\x1e\xfe\xb0\x81\xcd\x7f\x8f\
-\xad$\x09#\x81t\x09\xe7\x9b\xfbPS\x92\x13)\xfa\
-\xd1\x91\xc0\xf2k\xb7\xc27\xde\x8f\xce\xa6\xd3\x18\xf7\x99\
-\xb4\x961PG+_\xba\x15\x8d'^&\xc0\x86f\
-\xcdY\xb3u\xef\x8d\x16#\x9fM6\xb2E:\x96\xbc\
-\xd0\x8d\x84=G.\xa3\xa4 \x1d\xc9\x89\x0ex\xbcA\
-LNy\xe1\xef\xeb\xc3\x14\xdd\xfc\x81\x80\x88\xf4\xf4T\
-\xc2\x9d\x81\xcdH\x09\xc1\x1a\x0f\xc9\x92\x04\x03=;\x9d\
-N>\xf7\x1f\xefHl\xc6a&\xcb\x89\x10\xfe\xf4\xd8\
-\xef\xb0fy=\x16\x94\xe5\xc0j\x0c\xf1T#;\x03\
-{R:<\x92\x03\x87\x8f4L\xcf\xcfO\xcb\xca\xc0\
-P .%K\xe8ydw\xdc\xd0\x99\x96_S\x07\
-](_\x81\x06R\x0d\xbc\x02_\xda\x9c\xc9~\x93\x90\
-V\x9c\x89\xf2\x0d\xe4\xf3\xd7\x15\xc2\xe1\x09\xc0{\xa4\x11\
-\xd3$\xfd\x83\x83\xe3|\xe0\x92\x1e\xe42\x89\xc8\x00W\
-\xc1\xad\x1e?\xe2\x16D\xfb\xf3\xba\xf0\x0b\x83[T_\
-\x8c\xcd\x02D\x1e\x12\x0b\xf4I&\x06\xfe%\x0a\xf8\x9d\
-v\x1c\xba\xd4\x85\x17\xf7]\xc0 \x81\xa9\xbe2\x1f\xdb\
-\xd6\xd6aA\x96L\x02\x13\xaf\x9e\x81\xf7B\x17\x91\x80\
-\x0fBXT\xafWR\xc1\x1f\xb1\xf8z\xf7 b\xe0\
-Y\xcc@\x1f{\x81\xa8u*\xe5\xfb\x11\x12PIC\
-\xd0\xb26\x11#\xc3I\xa0\xaa\x08\xf17\xae\x82\xb1\xae\
-\x18\xc3\xe4\x8a6\xbc|\x0cm\xfb\xcf\x11\x09\xb8\xaf\x96\
-\x04\xbe|\x1f\xf0\x9b\xb7\x0a?\x7f\xd7\x04\xc0\xaa\xfd\xde\
-\x7f\xe3\xb2\xc3\x89N{\xc5\xa5\xc6\x16\x04H+V\x96\
-\xe5\xe3\xb1\x1dg\xf0\xc1\x1b\x96h\x96\x9f\xdd\x84\x86\xd6\
-\x01\xf2\xfb\xe3y\xce\x5c\xbe\xf2H2\xba\xa0\xb8\x02\x85\
-%\x15h9\xfa4\x86&\x0c\xba\xdc\xb2\x80\xd2\x05\xeb\
-0\xd0\xd5\x80)\xf7\x90\xb6/v\x0bL\x06`\x89\xb7\
-\xccq\x96r\xd7`\xd9\x82\xc7_<\x8e\x7f\xbca9\
-_\xfb\x8e\xa9\x82\xc9\xa1aX\xa6&1H\xea\xc1-\
-\x19\xe1p\xc6\x912\x08r\xd7\x81\xa9\x03\xc6'\x82\xd1\
-\x0c\xc1\xec\xa4\x87\x9d\xcc7{8 \x11A\xb0\xd4\xe2\
-\xaeg\x1f\xc5\x86\x1b\xeeDRj\xban@\x13x}\
-\x83< H@\xbc]X^d\xbbt~\xe2\xcfM\
-\xf1C\xa7/\xff\x92\xde\x5c\xa8\xfa\xe8\x0a\xe8\xd5\x05\xcf\
-d\xb0\xb2A.$\xfb\xd3\xe7g\xa2l}-\x0aj\
-\x0b\xb9\xe5\xf7\x1e\xba,x\x0e5\x22\xc4\xd2X\xa4\xa2\
-\xb4\x02\x81\xd9\x00.[q\xde\xc2*p\xe5\xdf\x8a\x88\
-\x81\xd8\xb4`l\x11\xcf\x0c\xeb\xaf\x82\xcdD\xaa(=\
-\x11\xce\xa5\xe5p\xae\xa8\xc0\xb0\xd3\x86\xc3\x97\x09\xfc{\
-\xcf\xf1{\xcc\x8a\xb5\x92\x13\xed\x12\xab\xb1\xd8\xb6v\x01\
-\xea\xb3\x92am\x1f\xc4\xf8+g\xe0\xbf\xd8\x81\xf0\xb4\
-\x17\x86\xb0\x1cGan\x9b\xe2\x0aH\x82\xe2\xe7+V\
-]\xfe-\xd5EP\x14\x81<\x00K9#\x9d\x1aP\
->+\xc5\x96\x12\xccJ\x02N+\xacU\xf3H\x09\xac\
-\x86\xa1\xae\x94H`\x1c\x0d;\x89\x04\x0e\x9c\xa1\xfe\xf0\
-\xd7'\x81\xbfk\x02\xf8\x9f\xcfl\xfbMq^\xe6\x07\
-\x9b\x9b[0:\xe9\xc7\xca\xc5\x15x\x91\xfc\xd3k\x16\
-\xcd\x87\xc3f\xd1,?\x1b\xddw\xf4\x5c\x07/\x97\x95\
-t7\x85m6G\x1cVm\xbc\x19\xddg^F\xef\
-\xe0\x08\xbc\xc1\x88:H\xcd-\x8631\x1d]\x97\x8e\
-\xf0\xbfY\x87\xe1\xc16\x9d\x5c\xf6\x8f\xfbaI\xb0D\
-\x01\x90o\xd1Ec8{\xb9\x9b\xe7\xff\x17W\x17\xf2\
-\x1dA\xbf\x0fa\xd7(\x1c\xa1 :\xc8\xfa[\x13\x93\
-x\x0c\x80u`\xaf\x9f\x00\xe7\x0f\xd0y\x87\xb8\xcb\xa2\
-OB\xc93\x0d\x1b14\xe6\xc5\xe9\x0b\xcd\xd8\xb4i\
-\x13\xa9\x8482g\xf2\xb4a\xec\x93l\x06aC`\
-Bt\xf5u=Y[g\xfdX\xdc\xd1aG\xdf\xbe\
-\x0b\xbf\xa0\x8e\xbd0*\xee\x11U\xfc\xc4\x0f.[\xfe\
-yY(]_\x87\x22\xb2\xfcv\xb2\xfc\xbe\xa3\x8d\xf0\
-\x1cR,\xbf\x18V#\xf9\x1a\xc0\xf95\xea\x82\xac\xea\
-\x1c\x09\xfa\xac\x02\xb7\xdcJ\xc3I\xba~\x17\xdb\x01\xd5\
-\xe3\xc5T\xf9\xc9\x00$\x97\xc8\x94\x96\x08\x07\x81\xdf\xb1\
-\xb2\x0a\xc3\x0e\x1b\x8e^\xee\xe4\xe0ol\xeb\xc34\xb5\
-\x17\x83!k\xa3\xd4D'/\xb3\xde\xb2\xb6\x1e\xf5\xd9\
-i\x92\xa5\xad\x1fS\xaf\x9c\x22\x12h'\x12\xf0)\x81\
-A\x19\xc8\x5c9\xc9i\x05\xc9\xa0\xf3\xdf\xf9\xb1\x94g\
-u7S\x03\xea{2\x09\xcc\xa2\x04$\xfd\xb5\xe9\xe2\
-\x01r\xa3\x13\x09\xd88\x09\xc4\xdft\x0d\x8c\xf5e\x18\
-\x1c\x19\xc7\xa5\x9dG\xd0\xba\xff\xd4U\x93\x80\xf0\x16\x91\
-\xc0\xdf-\x01\xfc\xe7G\xd6\xff\xcb\xd2\xaa\xa2\x1fw\xb4\
-\xb5\xa1ch\x02\xd7\xae\xa8FG\x1f5\x1e\x9b\x05'\
-'E\xb3\xfc\xec\xf9\x05\x92\x86\xd7,*A\x1c\xb1\xaf\
->\xca\xcb\xde[\xb2z#\xa4\xc0$:\x1a\x0e\xc3\xe5\
-Q\x17\x03\x01,6'*\x97m\xc5\xb9}OA\xed\
-\xb2,\x90\x97\xe0\xb4i\xe7\xc0\x08\xc1?\x1e\x80-\xd9\
-z\xe5\x93\xa5\xaf\xb3\xb5\x06\xffq\xdb\x12X,rQ\
-\xd1\xc4\xe8(\x12\x02>\x18\x89\x14\x9aH\x01\xe4\xe5\xe6\
-\xc2l6\xca\xb9m\xb2\xe0\xc1\x90\xc8\x0b\x8b\xd8D%\
-\x8c\x04\xd8\xf8\x83@\x88\x1e\x810\xa9\x870.\xb7\x0f\
-\xa1\x7fx\x1c\xd7-+ET&\x83\x8d\x02\xcc.\xc0\
-\xc5\xd3\xe7\xa4\xd1a\xd7\xbf-KN|\xc6x\xac\xf9\
-\xc7\xd4Y\x17D$\xb7\x1c\xe9\xe3);5\x0a\x08\xd9\
-\xf2s\xf0\xaf\xabC~M!\xe2|~x\x8f6\x0a\
-^r]\xc2\xe4\xf3\x8b\xe1\x88\xcf\xcf\xa1\xa1\xfd&\xaf\
-M\x14\x221\x00\xa5\xeb+\x1f\x89\xf0\x97p\x85\xa1u\
-ZS\xf1\xfc\xbd\xa6\x1c\x04\x99\x0c\x04\xa3\x01\xc6\xd4D\
-\xd8\x97\x94\xc1N\xf7z$\xce\x8e\xa3\x97:\xb1k\xff\
-Y\xe9rk/'K\xd9\xd5\x92\xe5:\xab\xb0L&\
-\x12XFR{\xcbu\x0bQ\x9b\x95\x06[{\x9f4\
-\xb5\xe7$\xfc\x0d\x1d\x10'=\xdc\xd2k\xd6^\x94\xe3\
-\x01\x82>\xb2'E\xd4\x00\x97\xffz\x12\x88R\x02:\
-\x8b\xa2p@\x94+\xa0\xb4A\x84\xf5\x18\x09\xd8a\xad\
-\x9e\x8f\xb8\x9b\xaf\x85\xa1\xbe\x5c&\x81\x1d\x87\xd0\xba\xef\
-$\x91\x80\xeb\xafF\x02\x7f\x97\x04p\xf7{\xaeY\xb5\
-nI\xe9\xde\xbe\xee.Sc\xf7\x08\x81\xbf\x86_H\
-\x03I\xbd\x9a\xe2\xecH\xce\x9c^\xb4\xf6\x8c\xa2\xb5k\
-\x18\x1bW\x96k\x1dQ\xbdwY\xf9E(\xabY\x82\
-\xe6\xc3\x7f\xc6\xc0\xb8\xc8'\xf9T\x1bd\xc1u\xef\xc6\
-\xe5\xa3;\xe1\xf3\xca\x93|\x8c\xba\xa7\x91\x94`\xe7\x05\
-7j\xb3y\x86=p\xa4;\xe68KI\xfb\xbf{\
-\xc0\x8d3\x97\xbaq\xe3\xba:\xbe\xc7\xef\xf5\xc275\
-\x85T\x22\x00\x0f}\xa0O\x14P\x94\x9f\xabE\xe0\xf5\
-yhFh\xec\x11\x0e\x89<\xc5\x18b\xcf\x04\x90\xa7\
-v\x9f\xe5\xc0e\xc4\xc6\x88\x82\xb9\x18\xac\xef\x99,V\
-\xa4f\xe6\xe2\xc0\xae\xd7H\x05\x04o\xadi\x1b\xfd\xa4\
-!$\xd6\x09\x065,\x0fM\xaa\x0bJ\xea\x8d\x9e\x05\
-3\x81?\xb5(\x0b%\xe4;\xe7\x93Jq\xfa\x02\xf0\
-\x1fk\x84\xf7\x18\x81\x7f\x88\x97\xb0\xea\xc2&2\x90%\
-5\xcc\xaf\xebM\xb1\xf9~\x09\x10\xae\xa6\x93E\x85\xe2\
-t\xf7\x89\x1f\xcfD\x8a&\x85\xc0O\x0a\xcf\xbe\xa2\x12\
-#\x04\x9e\xe3$\xfbw\xed;\x8b\xa6\xf6^\xee6)\
-\x98\x94\x22++\xb3\xf5\x13\x81\xe4\x848,YP\x8a\
-\xadk\x17\xa2&;\x8d\xdc\x81~L\xef9.\x05.\
-\xb6A\x9c\xf2\x12\xf0\xc5\x88\xd4\x17\x95\xac\x85()Y\
-\x01\x89\x8d\x1f@L\xc7\x91db\x98I\x02\x82\xa4v\
-;\x09\xba\xca\xef\x99\xae\x80\xdc\xf8\x9c\x04,\xd5\xc5D\
-\x02\xeb 0\x12pM\xa0\xe1\xa5\x03h\xdd{\x82H\
-`\xf4\xaa\xdd\x81\xfb\xff\x02\x12\xf8\xbb#\x80\x7fX_\
-\x9dy\xcb\xa6%\x0dc\xc3C)\x17\xe8f\xaeYZ\
-\x09\x9b\xd5\x82v\xb2\xfe\x85\xd9\xf2\xa4\xb7\xaa\xf5\x0f\x92\
-\xe5\xfc\xe5\x93G\xf0\x81\x1b\x97r\x97@\x92\x22\xe4\xce\
-\x80\xb2j\xe3-\xe8\xbb\xb8\x17=\xbd\xbd\x98\x0eDL\
-Sq\xdd\xb5\xf0L\xba1\xd0q\x81\xff\xed#Y>\
-2\xe6A^F\xa2\xd6b,\xea\x1f\x9c\x0e\xc2\x96b\
-\x9b\xfdDu\xa1\xe1'w\x9f\xc12\xf2\xa5\xf32\x93\
-9\x98'\xc9\xfa\xdb\xd9B\x99\x9ei\x0c2@;\x9c\
-\xc8LO\xd3e%\xe4\x05@\xa0\xa6\x16\x15\x141\xe0\
-\xb3\x89C\xd8U|\xf3W\xbb\xb1\xa0<\x97g\x00\xd8\
-\xfc\x05j\x1fu$$\xc1\x99\x94\x8eG~\xf9\x88\xbf\
-\xbcq\xf45\x93(\xd6\xea\x00\x1fIT\xaak\x1f\xb0\
-\x22\x1f\x9b\x09)d\xf9\x8b\xd7\xd4\x09\x0c\xfc\x0eo\x10\
-\xfe\x13\x97\x89\x00\x08\xfc\xea \x16]\xe5\x8cf\xcct\
-\xd0\xd6g\x14\x22\xbfq\xe5{\xa9Z\xc9\x08iH\xb2\
-\xb5\xd7\xef\xa7v2\xa4\x92{\xb4\xb8\x5c\xb2-\xab\xe2\
-\x96\xff\x14\x81\x7f\xf7\xfe3hn\xef\x83\xd7\xab\xac\xa6\
-\xac\x0b\xccqhJ\xf2r\xed\xcc\x1dHI\x8c\xc3\xe2\
-\xfaRlZ\xb7\x98H \x15vr\x17\xa6\xf6\x1c'\
-w\xa0M\x02\x91\x00sk\xe4\xe8?\x1bc\x01->\
-\x005P(\xe9\xac\xbc\xa4\xad\xb9\xc8\x7fCP\xdf\x13\
-\xa1\x15j\xa9)\xc29\x03\x82\xbaF\xe3$PS\x02\
-\xe7\xcd\xeb!,\xa8\xc0 \x8b\x09\xbc\xb8\x9fH\xe0\x98\
-\xa2\x04B\xb8\x8a\xedM\x93\xc0\xdf\x1b\x01\x18~\xfb_\
-\xef;\x1d\xf2N\xd5\x9dm\xea\xc2\xe2\xba\x12>\x91&\
-K\xb1\xb1K\xe1\x12Zg\x01^>|\x99[\xecu\
-\x04\x12\x9d\x92c\xff\xa3v\xc95$\x13E\xb4\x9f{\
-\x8d\xa4\xbfYs\x0b\xe2SrPT\xbd\x92\xa4\xff\x9f\
-\xb5&:\xd7\xdc\x87\xfa\xb2\x9c\xa8\x13\x99\xec\x99B|\
-^\xdc\xeb\x9e0s\x1b\x1e\x7f\xe9\x04>~\xfbj\xfe\
-\xb7oz\x1a\x01\x9f\x0f\xc9\xacc\x13\x01\xb0\xa5\xbfR\
-3\xd2\x11\x1f'\x97\x05\x0b\x82\x9cy\xd0\xf2\x88\xba \
-\x1b\xeb\x94l\xd5 6y\xe9\xf7~\xf7\x1an\xdbP\
-\x8f%\xd5y\xba\xa1\xcd@bz\x0e\xb9\x0b\x22\xfe\xfc\
-\xd0\x13SE\x97G&\xa1-rbP\x00/W\x11\
-\x88J,\x83|~\xa4\x14\xe5\x10\xf8k\x90SY\x04\
-\xa7\xdf\x87\xc0\x89&\xc1w\xa2\x09\x22\x8bL\x87\xc3\xba\
-\xba\x80HZK\x15\x13\xd1\x96>&\xa5\xa7\xb5\xe0l\
-[$t\xce\xde\x97\x81\x1f\x91\xfe\xfc\xf2M\xe4\xf3\x93\
-\xec\xb7-\xaa\x80mY\x0d\x86\xe3l\x04\xfev\xbcr\
-\xe0\xac\xd4J \xf6\xf9\x02\x9a\xb4\x16T\xb2\x14e'\
-@T0\x17VVHN&\x12XBVv\xe3\xfa\
-%\xdc\x1d\xb0\x12yL\xef:\xac\x91\x80\xa0\x90\x00\xb3\
-\xf8\x91c\xc9g\xc2\x89A\xa7\x04$I\x8aJ\x15\xc6\
-\xc6\x03\x14\xa1 \xe9\x8b\x1a\xaeH\x02Dj\xe6\xea2\
-8o\xd9@\xd2\xb3\x8aH`\x8cH`\xafL\x02\x83\
-#WE\x02t\xcc{\xb7\xcb\xe39\xde\xd0\xf6wE\
-\x00\x0f~\xf1\xce\xc7\x1c&\xe9=\xe7\xa8\x13T\x94\xe6\
-\x93\xd5\x94\x07\xcc\x88:K)\xdf\x0f\x09\x03#\x13x\
-\xf8\x99c\xf8\xd7\xf7\xaf\x83U\xf1\xad\xd5\xf7\xd3\xb3\xf2\
-P\xbe`\x15\x9a\x0e=\x81\xe1\x09&\xa9\xe5\x0em4\
-\x9a\xb1d\xebGp|\xc7\xaf\xf9\xdc\xfe\xec\xd8-\xe4\
-b$R\xc7KO\x8e\x80=0\x11\xe0\x16\xc7\xaa\xf7\
-\xfdc+B\x94\xed\xb5\xe3\xcd\xa4>\xccX^[D\
-\xe7\x19\xc6\x84\xcb\x0d\xbb\xd3\x09\xe7\xe48\xfdF\x98O\
-\xfeY<\xbf@\x19\x15\xa8\xac?`6\xd1{!-\
-h\xc4\x9e\x99\xcc\xb7\xd0u0\xf0\x9d\xbd\xdc\x8b'^\
->\x8dO\xbd{5\x0asR\x22n==\xd2s\x8b\
-\xd1\xdc\xdc\x81\xc3\x8f\xed\xf4\x16\x0cL\x8f\xcb\xf9\xae\x98\
-\x15\x8ed\x22\x10X\x85_RA\x16\xe6\xad\xaeEn\
-E!\xecDL\xe1\xd3\xcd\xf0\x9flDx\x94\x97\xf7\
-\x0aQi<D\x02\x87\xfa\x8e\x1cm\xe9\x85\x19\xed\xa0\
-\xcaa\xbd{\xa0\x82=\x02~Y\x01\xa8!\x1a\x0e~\
-\x92\xfdV\x92\xfd\x96\xa55p\xc59p\xaa\xb1\x1d\xaf\
-\xed?\x8d\xd6v\x19\xfc,\xe8\xc6\xbegP%\x89\xd2\
-\x0f\xd8\xbd\x09)\xc1\xb7\x90B\x02\x06\xa3@.\x1c)\
-\x01\xb2\xb2\x1b6,Cm&\x8b\x09\xf4\xc2\xf32#\
-\x81\x16\x8d\x04\xd4\xa0\x9f\xa0(\x01\xe8\xdc\x01AG\x02\
-\x82\x12\x18\xd4\xbb\x02\xbc\x8c8\xf2~L,@\xfeL\
-T,@k \x85\x04j\xca\xe1\xb8e\x13\xb0\xb0\x0a\
-\x03\x9c\x04^C\xeb\xabG\xfeOI\xe0\xef\x86\x00\xbe\
-\x7f\xcfm\xff/#\xde\xf6\xc0\x85\xc6\x16d\x13\x83\xcf\
-+P\xd7\xc0\x8b\x80^s\xc9\xe8\xf5\xcf\x9e8\x88\xaa\
-\xf9\x99\xb8vq\x09\xff\xber\xbf\xf8\xe2\x1e\xcb\xd6\xdf\
-\x8c\x81\xcb\x07\xd1\xd7\xdb\x05O0B\x0eu\xd7\xde\x81\
-\xceKG16\xdc\xcd\xfff\xd2\xff\xd8\xc5N\x5c\xb3\
-p\xbe|\x12\xcao\x8d\xb7O q^\xc2\x95\x1b\x95\
-Iv\xf2\xcb\x7f\xf2\xe8>|\xe2\xce5p\x10\xd8\xa6\
-&&\xf8\xca>\x89\x89\x090\x0e\x0e\x80\xb8\x07.\xa3\
-\x09\x85y9\x9a\x9a62e@d\xc0\xc8A\xdd\xc7\
-\xaeG\x22_\x95\xadU\xc0v=\xbf\xf7\x02\x0e\x9d\xed\
-\xc0\xf6Om\xe5\xe4\xa2'\x8a\xac\xf9U\xd8\xfd\xd2+\
-p\xbfvf<e2\xe0\x85\x1a\xafWK\x05\xd9F\
-\xc77\x91\xe5O\xce\xcf\x16\x8aV\xd6 \xbb\xbc\x80,\
-\x7f\x00\x81\xd3\x8d\xf4 \xcb?:\xc1\x18'\xaawH\
-\xaat\xc0l47w;\xa8m+\xf0\xe4gl\xa9\
-\x9f>x\xa6\x86\xef\xc0\x07\xf4\x08\xa9\x89\x92mQ\xa5\
-\x0c~\xa7\x0d\xa7\x1b;\xf1\xda\x81\xd3ho\xef!\xf0\
-\x079\x00\x8dr\x94^2JJlQ\x92\xc1\xcfX\
-!\xa4\x90@X\xe23\x07I!U\x09$\xc5a\x11\
-'\x81U\xa8\xa1~do\xef\xc6\xf4\xceC\x08^h\
-\x96\x04\xc5\x1d\xd0$\xbf\x12\x13`$ h\x1dL\x03\
-\xbfR\x17 *1\x01\xe5sZ\x87\x8cN7]\x91\
-\x00\xd4\xfbG$g!\x12\xb0\xdf\xb6\x85\x94@5\x91\
-\x80\x1b\x0d/\xbc\xa2\x90\xc0\xf0\xff\x09\x09\xfc]\x10\xc0\
-\xb7?}\xe3\x86\xfc\x9c\xe4\x9d\x97\x1a\x9b\x8dv\xa7\x03\
-\xb5\x15\x05Z\x95\x9d\xde\xb2\xab\x7f\x1f:\xdd\x8e=G\
-\x9bp\xcf\x87\xd7\xf3\xa8\xbb^\xfeW.\x5c\xc9\x15A\
-\xdb\x99=\x18\xf3[\xb4\xfd\xec\x08&\x8b\x8d\xa7\xe7\xd4\
-\xed\x85\x03\x97\xb0iE\x19\xcc\xc6H\x85\xdf\xf4\x80\x07\
-&\xa7\x09\x96x\xf3\xac\xcd\xa9o\xd0\xb3M\xbdh\xeb\
-\x1e\xc6\xad\x1b\x17p\xe0O\xb8\xc7\xe0L\x8c\x87\x8dY\
-w\xb7\x1b\xbdA\x11\x96\xa4Dd\xa4&kR\xdfb\
-\xa7s\xf0\xc9c\x01T\xbc2\x22b\x04\xa2~\xe6\xa7\
-\x8f\x1f\xc4\xd8\xa4\x07\xf7\xde\xb5Y)\x01\x96?\xc8\xca\
-\x8b\xd3\xf3\xcb\xf0\xfb\x87\x1eE\xd2\xc5^\x97#\x10\x0e\
-F\x0d\x12`\x9bR\xe1\x97T\x90\x89\xc2\xa5\xb5\x02\x03\
-?\x1b\xd5\x17:G\xe0?\xd3L\xe0\x1f\x97\x87/C\
-\x1f\xb9\x8eD\xf51\xebUC\xcb\xdb\xc9\xe9>\xe5\x0d\
-\xdd\xd0w-\x9a\x8e\xe8\x0a:\xd5\xf2kUw\xac\xe0\
-)9\x01\x96\xc5U\xb0.\xa9\xc1\xa8\xd3.\x9dm\xea\
-\xc4\xbe\x03\xa7\xd0F\xe0\xf7\xd3\xb9\x1aX\xed\xbe$\xcf\
-\xf4cb\x81O\xee\xabG2\x0eL\x11\xb21\x5cl\
-dr\x90\x8e\x1a`$@\xfeSX\xa9pLJb\
-J\xa0\x0a\x1b\xd6\xaf@Mn&l-\xdd\xf0\xbd|\
-P\x0a^h\x84\xc4\xb3\x03b4\x09H\x11W@_\
-\x94\x10\xab\x02\xd4\xcf\xc7\xaa\x80H\xd0d\x0e7@k\
-$\x99\x04\xcc\xb5\x15\xb0\xdf\xba\x15XTCJ\xd6%\
-\x93\xc0+\x87\xae\x96\x04\x98 \xfb\xf2\xd5\x92\xc0\xdb\x9e\
-\x00~\xf0\x85;Jr\x92\xe3/\x5cnj\xb4\x0ad\
-\xbd\x17\xd7\xce\xd3\x82|\x98\x85\x04\xd8\xd8\xfc\xef\xfdn\
-/Y\xfeb9E\xa6K\xfb%\xa5g\x13\x01\x5c\x83\
-\xa6\x83\x8f\xc35%\x22\xa4\x14\x99G\x1b$\xf9\xaf\x86\
-\xb6A\x0e\xbc\x85\xe5\xb9\x91\x96\xa5\x8e\xe5j\x19GJ\
-\xd9\xdc+l\xe9\x1b\xf4\x17\x7f:\x88M\xab*0/\
-7\x15\xe3$\xfd\xf99\xa4\xa4\x00\xa3#|\x0a\xb0f\
-\xf2\xff\xf3\xf2\xb2\xe1\xb4\xdb\xf87Y\xc0\xcal\xb3\xf2\
-E@\xe4c\x09|\xc5`v\xc1L\xfe\xb3\x8du\xee\
-\xed?}\x89K\xffO\xde\xb1R\xb7\x90)`\x8bK\
-DBZ.~\xfa\x9d\x07Q\xd9\xef\x196\xf0X\x9f\
- \xa8\xe94\xe6\xf4\x1b\xc9\xf2'\xe5e\x22\x9f,k\
-6\xb9Q\xf6@\x00\xe1\xb3-\x08\x9ekb\xb2_\x10\
-\xc2\xa1\xab\xb6\xf0\xea\xf5\xea|y\xd5\xfd\x8d|@\xf5\
-\x8d\x05\xe8F\xdaE,\xa1\xa8\x81K\x96\xfd\x86\x94$\
-X\x17V\xc2\xcce\xbf\x13gI\xf6\xef?pBj\
-#\xd9\x1f \x95\xc2r}\xcc\xe2\xb3y\x92\xcc\xfcY\
-&\x01\xa3r\x0cA\xb6\xf8\x04~\x09A\x85\x04\x02\xf4\
->\x0b\x15\xb2\x89\x118'\x91\x02Jb1\x81\xc5\xd5\
-D\x02\xabPM$`m\xee\x82o\xe7~)t\xe1\
-\xb2F\x02jP\x90\x1fT\x8c\x04\xf7\xb4\xf4\xa0\xa4\x82\
-<\x12\x0b\xe0C\x8bu\xc5AoH\x05\x00:\x12\xa8\
-\x84\x8d\x94\x80\xb4\xb0\x96H\x80)\x81\xddWM\x02\x06\
-\xa3Q\xb2\xc5\xc7\xdf\x7f\x8f\xdb\xfd\x07\xfa3L]`\
-\xce/\xbc\xad\x09\xe0\xa9\xef\xdc\x95\x19\x0a\x85\x9a\x1a\x1b\
-\x1b\x13\xc2\xd4yW,,\xd5\xa4\xbc\xb2(\x8e\xdc\xa4\
-:\x12\xf85\xf9\xfdl\x94\xdc\x17>\xb2Q\x99\xecC\
-\xc9~\x91\xd4^\xbc\xf6&\x0c5\x1fE\x7fO;\xbc\
-a\xb3\xc6\x22z\x02a\x1bK\xa9\xfd\xfe\x85\x93\xf8\xd0\
-\x8dK\xa1\x17\xbccm\x13pd\xd1\xcdq\x98f=\
-_}c\xb2\xd4\xdf\xd3\xaf\x9c\xc3\xdd\xef]\xc7\x83~\
-\x93\xe3\xe46\xa4$\xf3u\xfe\xa4\x9e\x1e\x04\xa8\x83v\
-P\xef,/.\xd4\x96\x11\xb7\xc7;\xe0\x9b\xf2DI\
-z&\x8b\x8dBd\xear6\xfd\xd7\x8f\xfe\xb0\x1f+\
-\xeb\x8bp\xdb\x86:ep\x90\xfcygR\x1a`v\
-\xe2\x91\x07\x7f'\x96\x0f\xfbF\xe5\xdd2\xfcx\x85\x1f\
-\xfdv\x02\x81\xbf`I\x152J\xf2\xe1\xf0\x07\xc9\xf2\
-7!t\xbe\x05\xa2k\x9c\xf9,\xb3\x82?Z\xb6\xab\
-\x9bRR\xab\x04\xc0\x05\x0d\xfe\x9a\x14\xe0{\xf4)1\
-A\x07&U\xb1\x09\xea\xb3\xc9$1\xf0\x9b\x09\xfc\x96\
-%u\x18%\x10\x9coj\xc3\x81\x03'I\xf6\xf7\xc2\
-\xe7\xf7K,8\xa7\x80\x1d\x16\x85\x04\xf8\xb3\xb2\xcf,\
-\x08\xae\x94d\xc7\x0b\x83#\xd3\xef\x0d\xd2-'\xc0\xc3\
-O\xbf\xe5WT\x00\x91\x80\xc4\xf6\x85y\xc0G@J\
-R<\x16/\xaa\xc5\xfa\x8d\xabQ\x93\x9dMJ\xa0]\
-\xf2\xed\xd8G\xee@\x030)\xa7\x08U\xdf\x1eZ\x8d\
-@$ \xa8\x8d\x0b\xe0c\xb5d\xc2\xd0\xe6\x16P;\
-jT6@\xe9o\xd2\xeb\x00O%\x81:\x22\x01R\
-\x02\xe2\x22\x85\x04\x9eg$pP\x89\x09\x04g\xfd\x9e\
-\xd1l\x86%.\x0e\xb6\xc4D)\xb9\xb8\xf8\xbb\x1f\xd8\
-\xb5\xebazg\x8a\xee\xff\xac9\xc5\xb7-\x01<\xfd\
-\x9dO\xa6\x84\xc2\xa1\x8bMM\x8dY~:\xf5\xd5K\
-\xcac\xac\xfdL\x128\xd3\xd8\x87?\xbcx\x12\x1b\x96\
-\x97a#Iw\xe5\xa3\xfc\xbf\x92\xea\xa5\xb0;\x1ch\
-=\xf5\x12\xa6B\xf6\xc8\xf7t\xff\xa9}|\xe7\xa1F\
-,(\xcfA\x06\x1f4$o,\xed\xe7&\x02H\xab\
-H\x9e\x1b$\xba\xd6\xfc\xd3\xcb\xa7\x91\x95\x9e\x805\x0b\
-\xe6\xc352\xca\x87\xfd&$'B\xf0\xfb!\x0e\x0c\
-b\x94z\xa1\xcffCAn\x96f\xc1\x1d\x09Nx\
-'=\xda\xb1T\x1f\xda\xa0MX\x0a\x1c!\xdf\xff\xa9\
-W\xce\xe3\x96\xf5\xb5X\xb3p^\xc4\x05\xa0\x7f\xf1\xa9\
-9\x98\x98\xf2\xe3\xf9\xdf?\x1d*\x1d\x0b\x8e\xe9g\xde\
-1\x92\x0b\x91\x98\x93\x8e\xbcEUB&\x81\xdfF~\
-t\xf8b\x0bB\x17\x9a\x01W\xf44^R\xecuE\
-\xd8Q\x0d\xfa+\x9dX\x8a\xf9\x82\x9aS\xd7\x91\x81\x96\
-2\x93\x22\x01?Q\x19z\xa7\x00\x8b\xcb\xfe\x94D\x02\
-\x7f\xb5dY\x5c\x8b\xd1x;\xce\x93\xe5?t\xf0\x14\
-\x81\xbf\x9b\x07\xfc\x18\xb2\xc8\xf2K\xcc\xf12\xb3EO\
-\x94g\xa6\x02\xd8>\x8bA\x18\xaeZ[uON\xed\
-\xfc\xfe\xb3\x8f\xed\xbb\xbe\xa7\x7f\xecn\xbf(\x19\xfc\xf4\
-;\x01\xfa\x1d\x1f#\x03:\x0a\x9bu\x99]i\x88\x9d\
-\x17\xab\x18LVH`\xd35\xa8\xcc&w\xa0\xb9C\
-\x0a\xec\xdcK\xc4H$\xa0\x04\x06%\xa5ZPv\x07\
-\xd4k\x89R\x02\x91`\xa0\x18\xf17\xf5\xd7\x1d\x01\xfd\
-U\x10\x00oB\x99\x04LD\x02\xd6\xdb\xae\x87D\xe7\
-\xd8?\xec\xc6%R\x02-{\x0e*J \x18\xf5y\
-\xb6h\xac-!\x81H>\x0fqYY,\x83#\x99\
-l\xb6\x1f\xfc\xc33\xcf\xfc/}\xc2\xa3\x88\xc1\x99\xfd\
-\xf6\xed\xb6\x11\xf8\xe3\xc3\xa2x\xb6\xa9\xf1R\xe1tP\
-4\xac]^\x195#n\xac\xfcg\xfbX1\xc8\xb7\
-\x1e~\x85G\xcb\xff\xf3c\x1ba\xb3\x9a\x95\xfb !\
-.!\x19\xd5+\xb6\xa0\xe9\xc0c\x18\xf3D\xa2\xfe\xca\
-}\xd26\xf6r\xda\x13\xc0\x8eC\x97q\xfb\x86\xda(\
-\xd7`\xe8\x82\x0b)\xa5\x890)#\xfef\x82$\xb2\
-\xb1\xd4\xdf\x0f\x1f\xd9\x8b\xcf~`\x1d\x04r\xc3\xbd\xd3\
-^\xa4\xa4\xa7\xf25\xfd\xa4\xb11z\x8c\xf3\xd9\x7f\x12\
-i_*\xf9\xbb\x0c\xdev\x02\xbf\x9f>'\xe9&\xab\
-`J\xc4l2FY\xf9'v\x9c\xc6\x89\x86n|\
-\xf2\xceU(+L\xe3\xdfU\x09$)\xb3\x10\x1d\x9d\
-}8\xf8\xe4\xee@\xb1_\x9a\xe4v\x99\x8d&d\xe4\
-\x93\x9d\x8e\xdc\x85UH\x9f\x9fG\x96?\x00\xa9\xa1\x15\
-!\x22\x00\xd1\xcd\x06\xf6\x84\xa2\x1bAw]Q~\xba\
-\xf6:J\xc6K*\x19\xa8\x9f\x8d\x00_\x0e\xc9\x0b\xda\
-\xad\xd3)bQQ\x06\xdc\xe7O\x84eQ5\x8c\x04\
-~W\xbcS\xba\xd0\xd8\x86#\x07N\xa0\xbd\xa3\x07\x1e\
-\x9f\x9f\xfb\xe0\x06\xd9\xe2K\x0c\xf0V\x06|\xc8*\xc0\
-JG\xb3\x1a\x0cCe\xd7T|!\xb3\xaep\xc0\xca\
-\xc6V\x1aC\xd2\xe9?\x1c\xde\xd2\xdb\xeb\xfa,\x81\xde\
-\xe0ST\x80\x97\xa9\x00\xf2\xe3\x02\xcc\xb5\xe2\xae\x82\xc8\
-S\xae\xa9,&\xb0\xb8\x9eH\xe0ZT\xe6fH\xb6\
-\xa6\x0e\x04^z\x95\x94\xd1%Y\x09\x84\xc3Q\x19\x01\
-C\x14\xf8e\x05 h\xb5\x18\xd1\x8aA\xd0\x19\xad\x18\
-2}\xfdMG\x02\x96\xdbn %P\x83~R\x02\
-\x97\x9eg$p@#\x016u\xbc\x91-\x1b\x97\x94\
-\x84\xf8\xdc\x5c$\xe4\x93kG\xae\xa6H\xf7u\xa2\xab\
-K\x0ay\xbd\xdf\xfa\xe8\xe1\xc3\x8c\x04\xc2\xb1$\xf0\xb6\
-#\x80\xdf|\xe5\x83\xce\x848\xfb\xd1\xc6\xcb\x0d\xe5\x93\
-\xfe\x90i\xfd\xca\xea(\xa0\xcf \x01\xe5\xef'^>\
-\x83c\xe7\xbb\xb8\xdf\x7f\xfd\xea\x0a}\xac\x065\xcb6\
-b\xda\xd5\x85\x9e\x96\xb3$\x09m:`G\xcf\xd7\xcf\
->\xff$Y\xd7\xcd\xa4\x1e\x9c\x0e\xab\x06\x08\xdf\xb8\x1f\
-S\xfd\xd3\xdc\xfa_\xcd\xc6\x02\x90\xc3\xae)\xdc\xb9\xb9\
-\x1e\xaea\x17\x1ct\x13\xe3\xe2\xe54\xa2\xd8?\x00\x91\
-T\x00+\xff--. 7E\x8e\xe2;S\x12\xe0\
-qO(\xf7]\xbe-l<\x80\xd3f\x89\xda\xf7\xed\
-\x87_\xc5\xa0k\x12\xdb?\xb5\x85\xa7'u\x95\xbdH\
-\xce-\xc1\xf1#\xa7\xd1\xbd\xff\x94';$\xf8\xc0S\
-\x8af\xc4\x13\xf8s\xea+\x91>\x8fd?\xf9\xfcb\
-C3\xc2\x0d\x0c\xfc\x91!\xbd\x11\x99/\xc5Xy\xad\
-\xa1u\x00\xd7|\x5c\xe8,\x9a\xd6\xd3U\x12\x88\xa8\x01\
-]\x84P\xfd\xc7v1\x9f?9\x99\xcb~#\xc9~\
-\x97\xd3\x89\x86\xa66\xe90\x81\xbf\xa3\xb3\x9b\x0f\x99V\
-\xcbu\x99\xdfoa`\xa7c\xb0\x16\xb1(\xd6\xdfn\
-\x14\x86*\xd6\xd6|!\xad\xb6`\xd0$\x86%1L\
-tA\x04 \x8a\x06\xe9\xd2\x9f\x0eo\xee\xe9q}\xd6\
-K\xe2\xc1G\xdf\xf5\xb3{I?\xcd\xd4@P!\x00\
-\xe6\x0e\xb0\xe9\xdbR\x88\x04\x96,\xaa\xc7u\x9b\x89\x04\
-r2%{K'\x91\xc0+\x08\x9d%\x12\x98\x9af\
-UXQ\xc1@\xd5\xe7\x17\x948\x80F\xdcR\x84\x00\
-\xe46\x9a\xa54\xf8\x0d\x05Yd\x1202%p\xfb\
-\x0d\x08\xabJ\xe0\xf9]\x9c\x04\xa6\x86G\xf9\xf93\xc0\
-\xc7\xe7\xe4\xf0\x87\x8d\x88\x80\x91>\xcb\x1cyGG\xe1\
-jn\x96\xbc\xe3\xe3_\xfd\x5cw\xf7\xafc]\x81\xb7\
-\x13\x01\x08/\xdf\xfb^\xab/-\xf1\xc0\xa5\x8b\x17j\
-\xc6\xbc\x01\xeb\xc6\xd55jW\x8c\xaa\xed\x8f%\x81\x96\
-\xeea\xfc\xf4\xf1C<P\xf6\xc5\x8fo\x82\xc3n\xd1\
-\xc0\x9d\x96Y\x80\x82\xf2\x85\xb8|\xe0QL\x87lP\
-'\x93\x8cR\xaf\x0a\x91\x8c\x8cM\xe3\xd8\x85nl[\
-S\x11\xa5\x0cz\x8e\x0d\x22{a:\xf9W3\x97\x8e\
-\x88m@f\xb5\xbf\xfd\xf0\x1e\xdc\xb1i\x01R\x9d&\
-\x9e\xceK\xcbL\x95\x83u\xac\xc6\x9f:6\x13\xf9\x03\
-\xd4I*J\x0a\xf9\x01lt\x83Y\x96 \x1c\x08\xa9\
-\xf7\x5c)n\xa2\x0e\xae(\x19\xb6\x8f\x05%\xbf\xfc\xa3\
-\x17\x11O\xc0\xbf\x9f\x08 \x12\xdc\x97U@j~%\
-^xf'\xa4\xb6\xde\xa9\xe40\x02lPP|f\
-\x1a\xb2\xeb\x18\xf8\xf3`g\x853\x97\xc9\xf2_j\x86\
-\xc4\xc8&\x14\x8e\x02\xbaZ\x8d'D\x83]\x8a\x92\xfc\
-R\x14YD\xda1\xa6\x8e>\x96\x04$)\xda\x1d\x90\
-\x8c&\x02\x7f\x12L\x04~\x03\x01\xcf\xed\xb4\xe3Rs\
-\x07\x8e\x1c<!\xb5w*\xb2_\x94g\xea1\xca\x91\
-~\x06~\x06|\x8d\x00\xecF\xc3p\xd5\xfa\xba\xcf\xa7\
-\x96e\x0f\x99\x8c\x06\xea\xefD\x00\x06\x82)\x81\xdf(\
-\x86\x88\x08\x0c\xd2\xf9\xc7\x0el\xea\xeeu\x7f\xce\xc7H\
-\x80\xbe\xc3\xc2\xab\xf4,\xb1\xa0\xa0\x92\x1d\xe0\x9e\x08k\
-+\xa6\xc6\x16/\xa9\xc7\xda\x0d\xd7J\x95y\x99p4\
-\xb7#\xf8\xd2kD\x02\x17I\x09xd%\xa0\xcaz\
-\x1d\x01\xc8\xcf\xa2\xf4\x7fB\x00\xca\xcdWI\xc0|\xfb\
-\x8d\x08/f$\xe0\xe2J\xa0\xeb\xd0q\x84HM:\
-32\xf8\xc3\x12\x1f\xcf\x09A.g\x94x@y\xb2\
-\xa7\x07\xae\x96\x16\x22\xc7\xf0\xa7\xbf\xe0r=\x17u\xe8\
-\xbf\x16\xba\xafty\xac=^y\xf8\xddf\xcfx\xfa\
-^\x02\xff\x82\xd1)\x9fm\xcb5\xb5\xf2\xfcrR$\
-\x87\x8fYH\x80\x0d\x9ay\x80\xac\xe2\xb0{\x0a\xeb\x96\
-\x96\xe0]\xd7V\xe9fc1\xa0\xfe\x9a\x1b\xd1\x7f\xf9\
- \xd8\xf4\xe0A\xa8i?\x9dC\xab#\x82GI^\
-\xdf\xb1\xa1\x8ed\xb7A\xbbG\x13}\xd3\x08N\x87\x90\
-J\xf2\xffj\xb6\xd3\x97z\xb8\x02\xf8\x97w\xaf\xc48\
-\x81,95\x196\xbb\xac&\xa4i\x0fB\x83C\xbc\
-\xfc\xd7\x90\x10\x8f\xbcly\x18o\x1c\xf9\xbfS\xe4\x87\
-\xeb\x07\xe7\xb1\xd2\xe3\xf4d\xa7n\x90\x0f\x11]\xd7(\
-\xafo\xa8/\xcf\xc1\x87oZ\xaae\x00x\x05\x9b\xc9\
-\x8c\xa4\x9cR<\xfa\xf0\xe3H\xf3\x85&\xe2\x05c8\
-!)\x11\x99\x95eH/\xca\x85\x9d\x08F\xba\xd4\x0a\
-\xf1R\x0b06!1\xcb\xaf/\xc6\x91]\x5cI\x07\
-n\xe8:\xb1\xfc\xc7l\xe3\xe6\xa3s\xf9\xba\x1b\xa3~\
-OR\x83\x85\x8a\xd3\xcf\xde5\x1a9\xf8\x8d\xf5U\x8a\
-\xe5w\xa0\x91\xc0v\xe4\x10Y~\xf2\xf9I\xf9Hj\
-N\x9dY~\xe6\xeb\xcb\xa0\xe7*@b\xcfv\xf2\xf9\
-+7\xd4|!\xb94o\xd8d\x08s\x8b\xcf\x08\x80\
-\x81^u\x03\x18\x110?\xb8\xe1\x8f\x877w\xf7\xb8\
-?\xe7\xa1w}\xf4]?\x81\xd5OGg\xaf\x83l\
-ZQ\xc5\x9dd\xc0IKJ\xc0\x92\xa5\xf5\xd2\xb5\x9b\
-\xd6\xa1\x22\x87H\xa0\xa5\x03\xc1\x17\xf7 |\xe6\x22W\
-\x02\x86\xb0\xa8)\x001\x86\x00\xf4EDo)\x01(\
-\x1d\x80\x91\x80\xa1\xae\x0a\xe6;n\xe4J`\x80\xdc\xb7\
-\xb6\xfd\xc70\xd2\xdc\xc5i\x9a\xc5\x00\x04c\xf4\xb2\xf5\
-\xac\x92\xd332\x02wk+|n\xb7[\x9c\x9e\xde\
-p/u/\xed\xb0o\x09\x84\xdf\xdc\xa6\xa9\xc9S;\
-~m\xe8k:\xf1j\xe3\xa5\x0b\x8b\x07\xc6\xa6\xed\xdb\
-\xd6\xd5\x0b\xac\x18F\x92\xa2A?\x1b\x09\xbc\xb0\xef\x12\
-v\x1di\xe2\xbe\xf2\xbdwmB\x9c\xdd\xa2\xd4a\x00\
-y\xf3\xaa\x91\x90\x9c\x8e\x96\xe3\xcfb\xd2g\x87\xd9n\
-\x8a\xe9\xaf\x91;\xd1\xd6\xe7Bw\xff\x18\xae]$\x17\
-\xfd\xc8}WB\xe7\x81~\x14\xae\xce\xd6M\xf61g\
-\x08\x90?\xfd\xf4\xb1\xfd\xa8\x98\x9f\x89\x9a\xfcd^\xb8\
-\x93\x92\x96\xac\xbd\x17\x1e\x19Ex|\x92\x97\xff\xe6\xe4\
-e\xf1\xca43\xb9\x00Fz\x04\xa6=\x91\x1bMO\
-\xfd#\x13\xc8IO\x88\xca\x08\xbcr\xac\x19\xcf\xefk\
-\xc0-\xd7\xd5p\xb2S\xc1\xcf\xab\x07\xadN\xc4g\x14\
-\xe2\x7f\x7f\xf0K\xd4\xa4\xa6\x8d%\xa4$K\xd9\xf3\x8b\
-\x90\x9e\x9b\xc5\xf3\xfcb\x13\x81\x9f\xac?\x81\x9fO\xe0\
-\x19\x13\xc0\x93\xa2\xf2\xf43\xc7\xc3ko\x5c\x89\x04\x04\
-\xcd'\xd3wt5\xe4\xaf\xe44\x0c&6\xb0G2\
-RG6\x10\xf8\xc7\xa8S76v\xe0\xd8\xe1\xe3\xdc\
-\xe7\xf7\xb1\xf8\x84(\xca\x15~J\xaaO\xb5\xf8*\x01\
-0\xcb_\xb9\xa1\xee?RJ3\x87\x19\xf05\x02 \
-\xf0\xc7\xba\x01\x5c\x19\x10\x09\x5c|\xfc\xf0\xa6\xee>\xd7\
-\xbfs%@g\xe3\x95d\x97\x80\x11\x00W\x02\xcau\
-\x9b\x05\x22\x81\x94xi\xd1\x92\x85\xb8v\xcbZ\x22\x81\
-,Y\x09\xbc@$p\xf6\x02\x0c\x93\x1e\x89eK\xb4\
-B \xc5\x05P\xc7\x05\x5c)\x06 w\x837I\x00\
-j?\xe0J\xa0Z&\x81\xa5\x0b0J\xf7\xb6\xf7\xd4\
-E\xf4_l\x86ob\x0aR8:\xd8\xcfN\xcd?\
->\x8e\xf1\xae.F\x00\xe4\xce\x8e?x?\xf0\xf5\x98\
-\x9e\xfb\xd7\xdd\x22\x01dyv\xdae\xa9\xa3\xbb\x9a\x1a\
-\x1bVv\x0e\x8e\x19o\xda\xb8\xc8b2\x0a:\xc9?\
-7\x09\xf4\x0dO\x90\xdc~\x8dO\xae\xc1\xa6\xff\xba\x99\
-\x80\xa1\xba\xb1f\x9b\x135\xabn\xe0#\xfd\xfa\xda\xc6\
-\xe0\xc8\x88SW\x01\xd7NB\x7f\x1f~\xf3\xfcI|\
-`\xdb\xa2\xc8t\xdc\xf4\x18i\x1a#\xcbj@\xca\x15\
-\xaa\xfe\xf4[W\xbf\x1b?\xff\xd3!|\xea\x8e\xe5|\
-\xe1\x8e\xcc\xac4\x1e\xf8S\xb7`o?B\xd4\xc1\x9b\
-|!\xd4U\xca\x8b\x87\xc4\x91\xec\x9c&\xa5\xa0\x1f\x9b\
-?8:\x89\xd4\x04\x07/b\xd2g\x04\x1ez\xfa\x18\
-\xce7\xf7\xe3\xdf\xde\x7f-\x8arS\xa2\xe6\x07\xb4:\
-\x12aM\xc8\xc0\x83\xdf\xff\x85\xb4\xb2\xact<\xaf\xa2\
-\x14\x19y9p\x04\xc9*^j\xe2\x96_rMp\
-\x19\xab\xf7o\x22\xc3]\x95\xffu\xe9-\xf9}m\xb7\
-\xa6\x04\x22n\x80\x149F41h*\xc0\xc0\xad\xab\
-\x9c(\x94X\xb0*%\x89Y1\xc9@\x16\xccM\x9d\
-\xb9\x89\xc0u\xfc\xf0It\x10\xf8\xbd>\xbfr\xbf\x09\
-\xbf`\xe9=\xc5\xd7\x87B\x00\xf4\xec0\x1a\xc9\xe7\xaf\
-\xfabRy\xee0!\x9b\xc4\x84@\x96\x97,>\xbd\
-\x9e\xcb\x0d`\x04\xc0\xc8\xe1\xd2\x1f\x0en\xee\xeeu\xfd\
-\xbb\x97\x8c\xbd\xea\x0e\xf8%\x99\x00\x98\xc3%*`5\
-\xd3\xf7\xd3\x92\x13\xb1\x88\xdc\x81k\xb6\x5c\x87\x8a\xdcl\
-\xd8\x9b\xda\x10~a7S\x02\x9209\x15\x89\x09\xe8\
-\x82\x80Z\xc7\x8eI\x1b\xce\x16Oy\xd3\x1b+\x1b\x8e\
-\x8f\x83qa-\x8c\xffp+\xc4\xe5\x0b12>\x8d\
-\xd6\xbdG\xd1\x7f\xb6\x01\x01\x8f7&\xb2-\x91q\x99\
-\xc6T\x7f?\x03?\xbc.\xd7\xc1\xfb\x81\x7f\xd4\x0e\xf7\
-\x97A\xf9\x8d\x9f\xbe\xa4\x03>\x9d\x08^Hs=\xdf\
-\xdat\xe9\xba\xa6\xae\xa1\xd0\x1d\xd7/\x8d3\xb1H\xb9\
-\x1e\xe8\xba@\x9f\xda\xe7\xf8\xdfd\x9d\xbf\xf7\xfb\xfd\xe8\
- \xcb-[\xff\x8d|\xac\xbe\xca\xb6\xf3\xabW\x90_\
-\xedA\xe3\x91\xbd\xf0zY\x14\xdc\x19\xe9\xe7z\x17\x80\
-\xb6\xd3\x97\xfbx.\xbe\xae4\xb2\x80n\xd0\x1bB\xc7\
-\xa1~\x14\xaf\xcb\x8d\x99\xeak\xee\xed\xd1\x97N\x91\xef\
-\x1e\xc4\xe6\xc5\x85\x88'\x89\x9f\x90\x18\x19?\xc0.\xdc\
-\xdb\xd6\xc9#\xd1C\xe4\x9aT\x96\x14\xf0\xe8\xad\x9dT\
-\x80w|2J\xfe\xf7\x8fLr\xeb\xaf\x8d\x0e\x84\x1c\
-\x04\xdc\xfe\xd3\x1d\x98\xf2\x06\xf0\xc0\xbf\xbd\x8b\x0f\x0a\xd2\
-g\x00\xec\x89\xe9\xd4\x91-\xf8\xc3\xaf\x1e\x13WUU\
-L\x14\xd5\xd7\x22#%\x19\xc2\x88\x0b\xd2\x89\xb3\x10;\
-{Y`!\xe2\xbf*\xed\xa0Zq]\xbe>\x9a\x04\
-t`W\x5c\x85(F\xd6\x7f_\x8b\x8cc\xa6\x0a\xe0\
-\x96\x9f\x05\xa7\xea+`X\xbc@r\xc7\xd9\xd0\xd2\xd4\
-\x81\x13\x04\xfeN\x16\x17a*E\x01\x91A\xa9\xee3\
-+\x81?\xb3B\x04\x0e\x93q\xa8r]\xed\x97\x92\xca\
-3\x86e\x803\xc9/HQ*`\x0e7@&\x07\
-\x83t\xee\xb1\xbdD\x02c\xff\xcfK\x7f\xa8n\x00'\
-\x01\xb0x\x80\xa4T1H\x92\x09F\xa4\xa7$`\xd1\
-\xb2\x85X\xb3e\xbd\xa2\x04\xda\x10zn\xb7$\x9d9\
-\x0fLNs25D\xa5\x01\x15\xeb\xaf\xb5\x85R\x07\
-\x80\xb7\x96\x00\x04\x13\xb5ev&\x8c\xb7\xde\x00\xe3\xbb\
-o\x86\xc7j\xc1er\x9fZ^9\x04/\xcb\xeaD\
-|`9\x0e\xe0\xf1\xc034\x04\xdf\xe4$S\x01\x9d\
-\x84\xbbk\xb4\xc3\xbdU\xc8~\xbd\xd3V\xcf\xe9\xfe\xfb\
-\xb7s\xe0?QuQ\x88\x1b\xca~\xb2\xad\xa5q\xeb\
-\xd9\xe6\xde\x89\xf7\xdd\xb4\x22\x8d\x8d\xe6\x8b\xf4-]\xce\
-\x7f\x16\x12\xd8w\xb2\x15\x7f\xdcu\x8e\xff\xcdf\x00\xba\
-}c\x9d\xd6\x09-\x8exT.\xdd\x82\x8b{~\x83\
-\xe6\x93\x93(X\x9a\xa9\x9dHt\xfe_>\xe6\xef^\
-<\x85\x0f\xdc\xb0H\xf7\x06\xd0}j\x08q\xe9\x0e$\
-\xe5\xbf\xfe\x88?\xb6\xb1\xd4\x1f\x1b\xa2{\xd3\x9ar\x14\
-e%\x22\x8b\xf9\xf7:\xe2\x90\xc8\xf2\xfb\xbazy\xfe\
-_$\x06/\xca\xcb$\xd0\xc6\xd3M\x99\x8a\x00I\x91\
-\xfa}$\xffs\xd3\x13\xb4{\xc8n\x13;\xfe}?\
-\xd9\x81\xa2\x9c\x14\xfc\xfb\x07\xd7j\xe4\xa0\xaa\x00{r\
-6\xcf<\xec|rG\xb0n^\xe1tv\xf1|d\
-\x15\xe4\xc2A\x06_h\xed\x80x\xb1\x11\xd2\x88\x1bB\
-(,\xc5\xc8\xfaX)/\xe9\xea\xd9u V\xfd]\
-\xb5\xe1\x22\xef\xa9\x01BAw\x8c\xa8\xf7\xd9\xa2%I\
-\xcc\xe7g\x01\xbf:\xb8\x1dv\xb4\xb4\xb6K\xa7\x0e\x9f\
-BW\xa7\x9c\xea\x0b\x8b\xf2\xc1\xd5\x12_\x16\xec\x93s\
-\xfc\xb2\xf4'\xf0\x0f\x97]W\xfd\xa5\xe4\xa2\xac\x11\xd1\
-\x18V\x00N\xdd\x8a\xa9\x00\x02\xb6\xf4:n\x80\x819\
-\x16\xfc\xfd\x90t\xf6\xf7\x876\xf7\xf5\xb8\xee\xf1\xb2\x14\
-\xa1B\x00\xac\xf8:\xa8\xd4\x08\x88J\xbc\xc3LD\x9d\
-NJ`\xe1\x0aF\x02\x1bQNJ\xc0\xd1\xd8&\x85\
-\x9e\xddIV\x83\x91\xc0\x94<\x94X\xb6Hr'\xd7\
-\xcd\x0d\x80\x19\xa5\xc0\xf2\x1fWU\x070\xd7\xc6f{\
-JJ\x84a\xd9\x22\x18\xdfs\x0b\x82\xf5U\x18\x18\x18\
-A\xd3\xce\xbd\xa4\x00.\x12\xd8\xbd\x11\xd0\x09\xf2\x92&\
-\x8c\x00\xbc##\xf0\xb3\x91\xa8\x93\x93\xaf\x12\xfe>\xa4\
-}\xe6\xad\xc1\xf7\x9c\xdb\xac\xc0Oo\x18\x16\xbc\xe9\xf5\
-\x8fv\xb46\xdf|\xecb[\xff\x87o[]`#\
-?X\x9c\x01\xf4\x99$\xc0\xfe\xb1\x00\xd9\xd7~\xb9\x9b\
-\xcf\x96\xc3\x06\xcf\xdc\xf7\xc9MH\x8a\x8f\xac\xa3\xc7\x16\
-\xef@\xc8\x87\x83O\xecFR^\x12\xe22\x1dZ\xc3\
-k\xb7Ay\xfd\xda\x89V.\xa7\xf9\x5c\x02\xca>\xef\
-\x98\x1f\xdd'\x87Q\xba!o\xe6\x15\xe9\xd9[\xd7z\
-\xbb\x8f4\xe1\xf0\xd9\x0e|hK\x0d22SaW\
-\x02\x7f\xaa\x86\x0fOL\xc2?0\x8c\xbe\xa0\x88$r\
-\x0d2\xd2\x92d\x02\xa0\xfd\xda\x18\x02\xfa\x8f\xcdH\x9c\
-\x9c`\xe7\x83|\xa0\xb3\xf0L\xfa\xff\xf2\xc9\xa3\xb8\x8e\
-|\xff\xdb7\xd6*7\x18\x9a\x0ap\xa4\x15\xe0\xf2\xe5\
-\x0e\x5c8x\xc2_\x98\x92\xec\xb5\xc7\xc7#3?\x1f\
-\xe9\xf9\xe4\x06\xb0\xb9\xef\xda\xba\xc8\x0dhb3\x9b\xb0\
-%\xbb5+\x1e3\xa5\xd5\xac\xae\x80:'\xbe\xfe\xc6\
-\xe8\x09\x84\xbd4H\xd1Sii\xf2\x97\x0dmf\x01\
-\xbfZf\xf9\xc9\xe7w:\xd0\xda\xda\x8e\xd3\x87OI\
-\x9d\x1d<\xe0\xc7]8\xb5J\xc8\xa8H}3#\x00\
-\xfe\xccd\xbfa\xb8bC\xed\xbdIE\xe9#\xcc\xe2\
-\x1bUK\xcf\xa5\xbe\xec\x060p3\x90_\xc9\x0d0\
-\x08\xb2*\x10\xc3F\xe9\xc2#\xafm\xee\xed\x1f\xff\xbc\
-\x97\x94\xbcW!\x00V2\xccJkB\x0ap\xb9\x12\
-\x11\x8c\xc8 7m\xe1\x8aEX}\xfd&\xa9<\x97\
-\xda\x93eR\x9e\xdd\x01\x89\x91\xc0\xc4\x04\x8f\x09\x18b\
-\xfc\x7f\xa5=#\x03\x88t\x1d\xe8M\x13\x00\x81_H\
-L\x80\x81|\x7f\xd3\xed7\xc3\xcf\xc0?\xecB\xdb\xab\
-\x07\xd0\x7f\xe6\x22Y\xff1u\x1e\x83\xc8\xaf\xb1\xcc\x13\
-#\x00\xf2\xff\x83D\x00!\xbf\xff{\x84\xc3\xef\xcd\xd2\
-\x85\xdf\xd2M3\x06\xb1\xc0o\xca.\x13\x0aB\x8e\xdf\
-w\xb67\xdfv\xf0ts\xcb\x87o_S\x1e\xe7\xb0\
-hD\xa1\xfaas\x91\x00\x8bT\xff\xe0\x91\xfdh\xee\
-\x94\x03\x99\xd7,\x9c\x87;\xb7\xd4k\xca\xc1h\xb2\xa2\
-j\xe5\xbbp\xe8\xb1_\xa1\xb7i\x0aeksc\x82\
-\xd5\x11\x05\xcb\x08\xe4O{\xce\xe3\x1f\xb7,\x88:\xf9\
-\xe6\xd7z\x91Q\x91\x8c\x84,\xfbU\xc95V\x9f\xff\
-u\x22\xa4\xb2\xfc\x14\x5c\xb7d>22RbZ\x83\
-~kh\x14A\x16\xb5\x0d\x84Q<?\x0f)\x19\xa9\
-\x08\x93\xbb\xc0\x8a5\xf4R\xffB\xcb\x00j\xc9\x15\x89\
-Y\xab\x14\xcf\xefm\xc0\xcb\x87\x9b\xf0\xb1[\x97aQ\
-e\xae\xe6\xfb\xab\xef\xc7e\x94\xe0\xe0\xbe\xa3\x18i\xe9\
-\xf4f\xd8\x1d~#\xf9\xa8l\xe0T\xc6\xbc\x22\xa4\xcf\
-+\x00\xa3@C{7\xc4\x86&H\xa3.\x08\xc1P\
-\xd4\xe8\xb6\x19* \xa6T2z(\xac\x9c\xd8{]\
-7\x80\x83?\x91\xc0O\x96\x9f|V\x16\xf0ko\xee\
-\xc0\x99c'\xd1\xd5\xd1#y\xfd~Yv+\x13\xa0\
-\xb2\xba{\xb5\xc6_\xf1\xfd%\xbb\xd18\x5c\xbe\xa1\xfa\
-\xbe\xd4yY\xc3d\xc29\xd8\xb9\xac'\x8bo\xd2$\
-\xffL7\xc0`6\x893\x08\xc0J\x04\x10\x96\x09\xc0\
-L\xcf\xa7\x1f;\xb8\xb9\xa7\xd7\xfd\x05/Q\x89R)\
-\xc8\x0b\x86X\xcb\x84\xa5\x08AZ\x89\x04d%\xb0X\
-\xbaf\xdbf\x94\x90\x12p6\xb5\x22\xf8\xccK\xc0\xc9\
-\xb3\x92H$n`\xb1\x15}\x19\xb0\x8a\xf4\xb7\x8a\x00\
-T\xf0/Y\x00\xe3\x9d\x04\xfe\xeaJ\xf4\xf6\xf6\xa1y\
-\xe7\xab\xdc\xf2\xfb\xc9%\x99\xb5o\x86\xc3\x1c\xf8>6\
-\x12\xd5\xe7\xeb\x0d\x87\xc3\x9b\xbe\x02L\xe9\xba\xe6[\xba\
-]\x11\xf8\xc9\xfdn!.=\xf77\xdd\x1d-w\xee\
-=q\xf9\xdc\xfboYU\x9e\x9e\xe4t\xc4J\xfc+\
-\x91\xc0k'\xda\xf0\xf8\xce3|?\xcb\xfbo\xff\xa7\
-\xcd\xca<}\xf2\xf73\xf2\xcb\xc8\x993c\xe7O\x9f\
-A\xd9u\x05\xb0%\x98\xb5\x9b\xa0\x8f\xc6\xb2'\x16Q\
-_YW\x88\x94\xc4\xc8\xb4^c=S\x18j\x1eG\
-\xe9\xba\x5c\x5c\xed\xc6\xac\xf3o\x9f;\x8e\x0fl\xa9E\
-UE\x01\x8fID5\x0a=<]}\x08y\xfdh\
-\xf4\x87\xb0\xb8\xb6\x04N\xb2*\xfe\x89)\xed\x03\xea8\
-\xc2c\x17\xba\xb0\xbc\xb6 \xaa\xc0\x87\xfd\xfb\xf1\xa3\x07\
-\xd0\xd81\x8c\xaf\xdd\xbd\x15\xc9\xf1\x8e\xa8\xf4 Kw\
-:\xb3\xca\xf0\xec\x9f\x9f\x87\xc5=9\x9d(\x18\x83\x02\
-\x91\x0b\x9b\xfd\xd6A\xd67\xbd\xbc\x04\xe9\xc5\x85D\x02\
-t\xb4\xb6NH\x8c\x04F\x5c\x12\xaf\x00\xd4\xab\x00\x1d\
-\xd8#\x00\xbf:7@?\xaaOv\xe4\x8d\x12\x92\x14\
-\xf0\x93\xec\x1f\x8f\xb3s\xf0\x9f=z\x0a\xdd\x8a\xcf\x1f\
-fwZ\xb9\x1f\xcc\xda\x9au\x04\xc0\xac?\xb3\xfc\xe5\
-\xd7\xd5\xde\x974?u\x84\x83\xd9\xc0\x80N\xdf\x11\xe9\
-\xf9\x8an@\x98\x93Dl\x1c@O\x00\xec\xd9`3\
-\x89\xe7\x1fzuKO\xdf\xf8\x17|\xf4-^#@\
-\xd7\xc5\x83\x82\x92<\x15\x9b\xaaJ\xcct=\xe9)\x89\
-X\xb4r)V\xdf\xb0\x19\xa5,\xc0z\xa9E\x0a?\
-\xfd\x02\xc4\x93\xe4\x8aNN\x90{%^!\xfd\x07\xbc\
-u\xe0\xaf\xa06\xecA\xc3\xd3\xcf\xa3\xe7\xc8I\xf8=\
->>\x06\x80\x15\xff\xc4NN\xcb*\x05\x03^/\x82\
-SSL\xd8|\xf0\xbeP\xe8@l\xdf|+\xb6\xd7\
-\x05\xfe4\x9c\x86\xac\x8c\xa4_u\xb7\xb7\xbe\xe7\x95c\
-\x0d\xc7\xef\xd8\xb6<\xb7(;1_\x03\xfaU\x90\xc0\
-\xb0{\x1a\xff\xfd\xf3=\xf0+\xa3\xa1\xb6\xac*\xc7\x8d\
-k\xab\x94\xf7e \x94/\x7f\x17\x9e\xf9\xc6O\xe1H\
-\xb5 \xb76]'\xfb\xa3]\x00\xb6l\xd7\xcb\x87\x9b\
-q\xdb\xfa\x9a\x88\xea%Kt\xf1\xa5.\x14-\xcb\x84\
-3\xcd\x86\xab\xdd~\xf6\xf8A\x1e\xc1\xfe\xd8\xcd\xcb\xf8\
-P\xd3H\xcbF\x06\xd3N6\xb5\xc3K\xc7\x1f\x80\x01\
-\x8b\xeaK\xf9\x98\x7f\x92c\x91\xcf\xd0\xd3\x10\xf9\xf0l\
-\xee\xc1\xaa\x92\xcch\x0bO\xdb=\xdf}\x9e\xafg\xf8\
-\xb5\xbb\xaf\x9fQ\x00d0Y`O\x9b\xc7\x87\x01\xe7\
-\x850i'M-1\x99\xcf\xa7\x103\xc0\x9e\x92\x8c\
-\xb4\x0a\x22\x81\xf9Ep\xb28C[\x07\xa4K\xcd\x92\
-4<BJ \xac6\xb0\xdaq\xffr7\x80\xe5\xa2\
-\x93\x12\x08\xfcU\x92qQ-\xc6I\x89\xb4\xb7t\xe2\
-\xc2\x91\x13\xe8\xeeR|~H\xf2Hz\xe57\xccl\
-\xa0\x8f\x00N\x02,\xefo'\x9f\xbfb}\xf5\xf6\xa4\
-y\x99#\xec\x97\x8c\x0c\xf8*\x01\xcc\xe2\x06X\x04\xa3\
-\xa8\x8f\x03\xb0}3\x08@P\x08\xc0h\xa4\xd7,q\
-@\xa4Bw\xfd\xe4\xef^\xdb\xda\xd7\xef\xfe\x0f/$\
-\x83\x9f\xc7\x04\xe4JA6\xa2P\xc9\xf5\xb3\xcf\xc1b\
-`\xee@\x22\x160\x12\xb8i\x9b\xc4\x95@c\x0bB\
-O>\x07\xe9\xc49H\xe3\xe3\xa4b\xc4\xe8T\x15t\
-\xb1\x907\x03\xb89\xc0\x7f\xf1\xc9g\xd1\xb1\xef0<\
-\xeeqy5(\xab\x95\x0f\x07\xe7s)\xe8V\x96e\
-\x13\xcb\x84\xbc\xdeP(\x1c\xfe\xcc\xf6@\xe0\xf9\x19\xc0\
-\xfdk\x00\xdf\x990-$\xd8r\x7f\xd1\xdd\xd1\xfa\x0f\
-{\x8e^<\xb2u]\x9d\xb5\xb6$g\x89\x0a\xecH\
-U_4\xe8\xf5$\xc0\x9e\xbf\xfb\xdb}h\xea\x1c\xe6\
-\xef9\xed\x16|\xf5\x9f\xb7\xc0j5i\xfd7)-\
-\x0f\xfdM\x93h<p\x12\xb57\xcc\xd7\xa6\xae\xd2\xf7\
-[\x95\x08\x9e|\xf5\x22\xae_U\xc6+\xed\xd4k\x18\
-\xb8\xec\xc6\xd4\x88\x17%krb\x94\xff\xdc~\xc0\xc0\
-\xc8$/D\xda\xb2\xbc\x18\x9b\xd6T+s\xe3FZ\
-\x97\xbb\xb6d\x8d'[\xbb\xe0\xe2\x01@'\xaakK\
-\xb9d\x8b\x9d\x95\xfb\x95c-|\x80\x0f\xbb\xa6H\xf4\
-\x9f\xa5\x05\xa7\xf0_\xff\xbb\x0b\x8b+\xf3\xf0\xf1\xdb\x97\
-)U{\x0aA\xb0\x1a\x00\x8b\x13\x96\xe4<\xfc\xf4{\
-\xff\x8b\x85\xb6\xb8q\x03\x03\xb5\xa8\x06\xa0\xf8B\x1a\x9c\
-\x042*JI\x09\x14qw@Q\x02\x9242\xc2\
-b\x02\xfcs\x06\xedR_\xdf\x0d0\xcc\x95\x0d`\x93\
-\xa62\xcb_\xc3e\xbf4\xe1t\xa2\xbd\xb5\x0d\x0dG\
-O\xa3\x87Y~\xe6\xf3K\xf2\xaa\xbe\x92RW\xcf\x87\
-\xf72\xe0\xd3\x0f\xb0g\x87\xd90Tq]\xedW\x12\
-\xf2RF\x19\xe8\x0d\xcc\xba\x93U7\x80h@\xef\x06\
-(\x04\xa0f\x03\xd4t\xa0J\x00\xeco\xd5\x05P\x83\
-\x80\x0c\xf0\x0c\xf8\x06\x9b(z\x89\x0c\x1c\x82E\xf4\x84\
-\x82\xd2\xd9\x87\x88\x04\x86\xc6\xbe\xc8\xdc\x01N\x02l8\
-1\x9d \x9fh\x5c!@6\xea\xd0*\x93\x80\xb4`\
-\xcdrF\x02\x98\x9f\x97\x0d\x07+\xad&@\x8aD\x02\
-\x18\x9f`)`\xdeJ\xaf;'\xe0_\x08\xfe\xe9Q\
-\xb7\x9c\xf7g\xa9AV\x5c\xc5\xb2\x03L\x09(\xc5@\
-\xcc\xff'\x05\xc0\x86=|\xe6^\xaf\xf7\xf9\xd9~\xe2\
-\xcd\x12\xc0\x9c\xc1\xbdX\xe0'\x86m\x06\xc9\x99\xf6\xb3\
-\x9e\xae\xd6\xf7\xed9r\xf1\xd0\xcaEeC\xd7,\x9a\
-w\x9b\x06\xecH?\xbd\x22\x09\xbcz\xac\x15\x8f\xee8\
-\xa3\x9d\xc0\x9d\x9b\xea\xb0~Y\x89\xee\xb3\x12\xe2\x13+\
-\xb1\xeb\xc1gP\xb1.\x13\x09\x99\x89P\xa88:\xf3\
-B/\xdc\x93^\x1c\xbd\xd0\x8d-+K\xb5\xf7\x83\xbe\
-0.\xbc\xd8\x81\x8a\xf5y\xb0'Y\xa3!\x7f\x858\
-\xc0#\xcf\x1f\xc7\xb9\x96Al\xff\xe4f\xbe\xfc\xf8l\
--\x1c$\xa9\xef\xe9\x19D?I\xc4\xe4\x9c\x0c\x14\x16\
-\xe5\xf0\xc2\x1f}\x8e\x9f\xfd\xff\xa7\xdd\xe7\xf8u\xa9\xc0\
-WA~\xf4|\x17~\xf3\xec\x09\xdc\xb9\xb9\x0e\x1b\x96\
-\x95\xea\x06\x07\xc9\xcffG2$k\x12~\xf1\x83_\
-J\x8bmq\x13\xba\x95k\xb4\x89\xf7\x8c\xd4q\xedi\
-\xe4\x0eT\x94q\x12p\xb2\xa3\xb7vJb\xc3eH\
-\xc3\xa3$_CQn@4\xc0\xaf\xec\x06\xa8\xe4!\
-q\x9f\x9f,\x7f5\x93\xfd\xb5\x98t8\xa5\xce\xd6\x0e\
-4\x90\xcf\xdfK\x1dwZ\xf1\xf9\xc3Ji0\x07\x15\
-+\x0c\x94\xe4q\xfd\xdc\xf2\x93\xcf_\xb9\xa1\x9a\xc0\x9f\
->\xaa\x82[T\x08@\xef\x06\x18\xc8\xe2\xb38\x80>\
-\x1d\xa8'\x00\x06x\x99$B2\xf8\xd9>n\xf5e\
-\xebo\x14\xcc\xf4V\x88\xbe\xc6^[\xc4i\x22\x813\
-\x0f\xed\xda\xda7<y/)5#'\x01:7\xe6\
-\x0a\x84\x95~\xca:\xbd\x89\xae\xd8f\x14\x90\x91\x92\x82\
-\x05\xab\x97c\xc5\xcd\xdbP\x92\x97K$\xd0\xa8(\x81\
-3\x12#\x01\xb6\x02Q\xac\xf4\x7fC\x80\xbbZ\xf0\xeb\
-\xbb\x1a\xfb\x0e#\x02\x83\xbc\xba\x13\xbbxR;\x9f\xb9\
-\xcf\xe3ya\xb6\x91\x80o\x86\x00\xde\x10\xf0}\xa2\xd9\
-`MH\xfcqOg\xfb\xfb_9r\xfepM\xd5\
-\xbc#[W\x95\xfd\xbb \x08Q@\x7f=\x12\x18$\
-i\xfc\x95\x07wk\xd2?5\xc9\x81\xaf|j3\xcf\
-\x00\xa8\xfd\xd2\x00\x0b\xce\xee\xe8\x86-\xde\x8b\xe2\x95\x85\
-\x11\xdcjF,\xc2\x02O\xbd\xd6\x80w\xad\xa9\xe0\xb9\
-t\xf57\xda\x8f\x0dR\x83\x8a\x98\xbf2+\xea{W\
-\xda\x86G\xc6\xf0\xed\xdf\x1f@mI\x16\xde\xff\xae%\
-\xbaIr#\xcd\xca^y\x87F\xe1\x1bq\xa3= \
-\xa2nq%u\xf4\xb0\xce9\x90\xc1>>\xe5\xc3\xbe\
-\x93m\xb8i]\xd5\x0c\xf9\xcfb\x1e,\xf6\xf1\x9f\x1f\
-\xbb\x8e\xa7\x01\xf5\xa3\x03\x19\xf0L\xf1\xe9\x18\x9b\x0e\xe3\
-\xd9\x87\xff\x14\xaa\xb28\xa6\xb5\xe5\xae\xb5y\xec\xe5\x17\
-\xac\xa8\x89+\x81\xcard0%@`\x12Z\xc8\x1d\
-`\x93`\x8c\x8c\xca\xd3\x80av7@_\xec#\xc4\
-\xdc(\x9e\xe7f\x9d.1Q\x8e\xf6/ \xf0\x93\xe5\
-\xefjm\xc7\xe5\xe3\xa7\xa5>\xc5\xe7gG\x0fKJ\
-\xc11\x1b\xde\xcb\x88\x89\x8e`R\x8a}l\xbc\xc2\xaf\
-\xf6\xbf\xe2s\xd2\x5c\x12+\xade\xd6\x9fuc&\xf3\
-c\xdd\x00\x91\xce\xdd,\x89\xd1\x04 [y\xfe\x11%\
-\x0d\xc8d\xbf\xde\xfa3\xab\xcf\xf6\xb1\xd7\x0c\xfc\xe1\x90\
-Q\x0ar\x12\x08\x8b&X\xc5\xa3\x0f\xbep}\x8fk\
-r\xbbO\x84A\x9dG@\x8b\x070\xc5B\xe7\xcd\xc8\
-\xca\xc6R\x84\xa9\xa9Xp\xcdr\xac$\x12\x98\x9f\xcf\
-H\xa0I\x0a\xfd\xe9\x19\x80\xd5]0\x12\x10#\x8b\x98\
-\xbf!\xdf\xffM\x80?\xd2\xe1\xb4\xb9#B\x92 \xdc\
-}\x7f8\xfc\xc2\x15\x01\xfd\xc6\x80\x1f)\xe0Q\x81\x9f\
-@\xc0o\x9d\x05\xf8\xa2E4\xdam\xc9\xdf\xef\xed\xea\
-\xf8\x00\x81\xffh\xc9\xfc\xfc\xc7\xae_S\xf6-\xbb\xd5\
-d\x9d\x0d\xe8s\x91\x00c\xdf\x07\x1e~\x8d\xa4\xbfV\
-\xbe\x8c\x8f\xde\xb2\x94\x07\xca\xf4\xc1\xd6\xce\xd3S\x18\x1f\
-\x9aD\xf9j;\xcc\xceD\xedX\xea\xa6\xbe\x1e\x1d\x9f\
-\xc6\x85\xb6A\x5c\xbb`\x1eT\x9c{\xdc~4\xec\xea\
-B\xed\xb6\x22X\x9d\xe6\xab\xaa\xd3\xf0z\xfdx\xf9`\
-\x03^=\xd5\x89\x7f}\xdf5|\xd6\x9f\xd89\x01\xd4\
-?';z\xc9\xe2{\xd1\xe8\x0f\xe3\xda5\x0b\x10\xf6\
-\xfa\xa2&\xcb\x17\x14+\x9f\x18gG\xe5\xfc\x8c(\xf9\
-\xcf\x8e\xf0\xcd\x87^A\xef\xd0\x04~\xf0\xf9\x9b\xb4\x02\
- \xb5\xc4\x80}\xc6\x9c\x98\x8b\xf6\xce\x01\xe9\xe8\xb3{\
-\x82\xf3\xcd6\xafva\xbaF\x8d\xc4\xe6\x88\x04RS\
-\x90^Y\x86\x8c\x92y\xa4\x04H\xea\xb72\x12h$\
-%0\xcc\xea\x04\xf4\xc5\x12:7@\x8d\x8aC'\xf9\
-\x958\x00\x93\x9c\xac\xc3r\xd9_\x83)\x06~\x22\x96\
-\xc6c\xa7\xd0\xd7\xd3#\xb1\xa9\xbb\x03\xca}\x12\x95\xd2\
-`#\xab]\x87:\xc6_\x22\xf0\x93\xe5\xbf\xae\xee\xab\
-\xf1\xf9\xc9.\x06n\x83Q\x06\xb9\xa4\x80\xde\xcc|\xfc\
-9\x08@\x1f\x03`\xe0\xf6+\xf2_\xb5\xfe\xaa\xefo\
-\xb4\x9a\xc5`@\x94\xc1o\xa7]S\xd1\xe07\xd1k\
-?\xbd>\xfc\xc3\x1d7\x0c\xb8\xa7\xee\xf7\xb3\xb1\x03\x90\
-\xeb\x03B\xca\xa4\x1f\xbc\x0d!\x07,\xd9\xd4\xee\x8c\x04\
-\xea\xafY\x81\x95\xb7l\x93\xe6\x15\x90z\xa4v\x0c\xfd\
-\xf9Y\xa6\x04\x88\xd5\xc7y\xc5\xe0\x1b\x92\xfe\x7f\x09\xf8\
-#\x1b\x93\xfd\x9f\xfe\x0a\xf0\xe2\xeb\x02\xfb\x8a\xa0W;\
-\xd2\x0c\xe0W\x13\xf0\xfb\xe6\x04\xbe\xe4\x15\x8d\x8e\xe4\xd4\
-o\xf7ww~p\xcf\x91s\xc7\x0b\x0a2\xbf\xbbi\
-E\xf9\x8fR\x13\x1d\x19\xd1@\x97t9\xfe\xd9H\x00\
-\xd8u\xb4\x19\x7fx)\x22\xfd\xf3\xb3\x92p\xef]\x1b\
-\x22s\xc7\xd3\x7f\xc3\x1d\xe3h=6\x82\x857\x14\xc2\
-d%\xebj\x8c,\x0b\x16K\x04\xcf\xee\xbb\xc4\xad\xbf\
- \xa8c\xdf\x80\x86\xdd\xddp\x90\xec/Z\x9c\xa1}\
-\xeeJ$\x10\x22\x90tu\x0d\xe2\xd1=\x17y\x13~\
-\xe9\x13\x1bg6\xa4N\xda\xbb.\xb5\xc2OL6\x99\
-\x94\x80\x8a\xc2,\xee\x9b\xe9\xd5\x02{\xf9\xdb\xe7O\xe2\
-\x1f\xb7.Pf\xfeU\xf6\x0b\xf2\xe8\xc2\x7f\xfd\x9fg\
-\xc8\xf2'\xe3\x0b\x1fY\xa7\xc5\x18\xf4+\x01\x99\x92\x0b\
-q\xf2\xc4\xf9P\xf7\x89\xf3\x83\xb9aC\x9c\xfe\xbe\xe9\
-\xdd\x00U\x19\xf0\xe1\xa3\xa9\x8a\x12(\x99O~0\xbd\
-\xc7\x94\xc0\xc5K\x90\x86\xe4\x98\x80R\xcc\xa2+\xca\xd0\
-g\x0b\x22\xc7#\xdfBb\x96\xdfPU\x0e\xe3\xa2:\
-L9\x9c\xe8nkG\xf3\xb1\xd3\xe8\xef!\xcb\xef\x0d\
-H\xf2\xd0[5\xd6\xa3\xce\xe7G\x04\xc0\xac)\xbd\xb6\
-\x99\xc8\xe7_W\xf3\xb5\xf8\xfc4\x17\x13\xae\x06\x06|\
-\x8d\x00\xe4\xe8\xbeA\xb1\xec\x92\xde\x05Pb\x00\x5c\xda\
-\x8b\xaa\x9f/\xa7\x00\x0d!\x02\xb3\xe2\x0a\x18\x82\x04r\
-\x06~\x06v\xbf\xc4\xe5\x7f\x98\xe4\xbf\x1e\xfc~zm\
-\xa2\xd7f\xc1N$\xe1\x93\x0e\xfc\xf0\xb9\x1b\x86&\xbc\
-_\xf5B2\xb2\xfa\xc9\x10[\x94Em?]\xbd\x82\
-\x8d\xdc\x9e\xb4\xb4\x14\xa9\xfe\xda\x95X~\xcb\x0d\xa4\x04\
-\x88\x04\x98;\xf0\xa7\xa79\x09Hc\x13\xea\xea\xb0o\
-;\xf0\xcfE\x003\x80_u\xf1\xa2\xc0\xd6\x97\xbf\x92\
-\xd4W\x81O\xfa\xd6\xe8\x8cK\xfbf_O\xd7\x87\xf6\
-\x1c>w2/7s\xfb5\x8b\x8b\x1e(\xccJ\xaa\
-\xee\x1a\x1c\x0f\xe4\xa4'X\xb4a5\xfa\xc8\xff,$\
-0@\xd2\xff\xbe\x9f\xbe\xcc\xf3\xf5\xea\xc9\xdeC (\
-\xcdO\xd5\xfa\xb7w*\x88S\xcf\xb5c\xcd\xfbo\xc0\
-\x94\xfb\x00\xb9\x00\x193\xd2~\xaa\x9ae\xc14:\x07\
-,\xa9\x8c\xa4\xf8F\xbb&\xd1rx\x00\x0bo\x9a\xc7\
-\x17\xc8\xd0U\x0b\xcc\xba\xb1e\xbb\xba\xbb\x87\xf98\x84\
-Gw_$\xc9^\x8dM+Jg6\xa7B\x00,\
-\xd7\xefn\xec\xc0\x98H\xfem~\x0e\xf2R\xe3\x22\xb0\
-\xd7\xc9\xfc\x1f>z\x00\xff\xfa\xde5\x1a\xf0\xd5\xa3\xb5\
-\xf7\xb9\xf0\x8d_\xbd\xca]\x83\x9b\xd7V\xe9\xde\x8b|\
-\xdf\x94V\x82\x1d\xcf\xed\x22\x9c\xf8\x1fO\x1b\xf3\x97\x06\
-'<%s\xb9\x01\xea\x0e6F\xc1A~lzu\
-\xb9\x94\xce\x95\x00\xa9\x8a\x96v\x88\x17\x14\x12`\x13\x97\
-\xea\xdd\x80\xa88\x80\x22\x09\x99\xcf\x9f\x14/\x19\xaa\x14\
-\xcbow\xa0\xa7\xbd\x13\xcd\xc7Oa\xa8\xab\x97\x07\xfc\
-\x94\xea:I\xd4)\x08YF\x13q\xd1\xb3\xd5dd\
-\x01\xbf\xaf\xc7g'\xb9\x18\x98E%\xa5'[\xf7\xd7\
-'\x00\x16\x18\x94\x03\x84\xb2\xa5\x0fq\xdf_\x96\xf9!\
-\xbeO\xf6\xf7\xd9s\x88e\x0f\xfd\x22\x11\x81E4*\
-\xe0\x0fp\xe0\xdb\xa8\x07\x87\xc50\x01\xdfkp\x10\x09\
-\x84\xc5\xa0\xdf\x22\x1d\xfe\xf6\xe37\x0eN{\xbfFJ\
-\x80O/\x16\x14\xd52\x7fIs_,\xb2zA\x06\
-)\x81\x1a\x22\x81e\xb7\xbd\x8bH \x07\xb6\x8b\x8d\x08\
-\xff\xf1\x19\x84\xb9\x12\xb8\x0a\x12\xf8\x1b\x80?\x96\x00\xae\
-`\xf1\xaf\x0c|\xbbd4x\xc2\x01\x139s\xc68\
-[\xfa\xd7\xfa\xfb\xba?\xb4\xe7\xd0\xd9S\xa5%\xf9\xff\
-Q\x9c\x9f\xf6\xf9\x05\xa5\x99\x9b\x9b\xbbG\x87|\x81\x90\
-\xb1z^F\xeaLk?\x93\x04\xd8\xdf_\x7f\xe8\xd5\
-(\xe9\x7f\xed\xa2y\xf8\xd0\x8d\x8be *n\xc3\xe9\
-\x97:\x901/\x0f\xd5k\xcb0\xd4q\x06&[\x02\
-\xf4\xc1?=\x11\xec8\xdc\xc4\x03\x7f\x1a\x98\xc9*\x9f\
-&\xf2H\x9f\x97\x80\xfc\xba4m\xbf4\xe3\x85\xf2'\
-\xfd^O\xef0_\xc0s\xff\xf9\x1e\x9cn\xec\xc3W\
-?\xbd\x15\x89\xce\xd9S\x86|\x5c\xff\xf8\x14&:\xfb\
-\xe12[\x90\x94\x95\x8a,e\x9a1\xbd\xccgd\xc2\
-R\x92\x1f\xb9yI\xe4=\x05\xdc\xaf\x1co\xc5\xa3\xa4\
-\x80\xfe\xeb\x9f7#/#zt \xff\x8c\xc1\x0cc\
-r\x11\x1e\xfd\xcd\x13\x98W\x90\xf6\x93\x8c\x8c\xe4!\xf7\
-\xb1\xe6\x9b\xc2\x93\xbe\x12iV7@\x07b\xb6:\x11\
-u\xdc\xf4\xaa2\x89\x94\x00\xe2X'ln\xe3$\x80\
-\xa1a9;\x809\xdc\x00\xf6YR4\x04~\xc9P\
-_\x8di\xa7\x03\xbdm\x1dh\xa5\x0e?\xc8\xc0\x1f\xf0\
-s\xc0(\xf5\xf5\xda\xacA\xb2\xf5\x97-\xbf\xc5h\x1a\
-.__\xf5\xf5\xc4\xecT\xee\xf3sk\xaeXuA\
-\x88&\x00Aq\x01\xf8\x12\xadFA~\x16e\xeb\xaf\
-\xf7\xfd\xc3$\xfd\xd5}!\x0er\x89,z\xc4\xe7\x0f\
-\x12\xb8\x8d\x82\x95\x80\x1f\xe6\x7f3\xf0\xfb\x09\xfc&z\
-XH60\xe0[\x8dA1\xe8\xb5J6\x92\x0e/\
-~\xe3\xa9\x9b\x87\xa7}_\xf7\x93\xb7\x12\x90S\x97\xbc\
-\x5cX]QX\xadY\xb0\x13\x09\xa4\xa7\x11\x09\xac%\
-\x12 %P\x98\x9fKJ\xa0\x89H\xe0i\x88L\x09\
-\x5c\x89\x04\xfeF\xe0W\xfb\xdaU\x01\x9f\xad/?\x15\
-\x1a0\xf8\x08\xf8\x89\x04|G\x92\xc9\xe0\x9e\x0e\x1b\xe3\
-\xa8m\xbd\xe1\xa0\xc9(\x9aM6G\xd2\xfd\x83}=\
-\x1f\xdes\xf8\xec\x99\xf2\xf9\xf9_JK\x8f\xbb\xfd\x9a\
-\xba\x82\x8f\xb7\xf5\x8fu\x0c\x8cNN\xae\xa8\xce\xab\xd5\
-)\xd3\x19\x03|\xf4\x0as'\x01\xe2\x91\x17Ok'\
-\x9a\xe0\xb4\xe2k\x9f\xde\xc2\xd3\x7f\xea\xf7\xdaN\x0f\xc3\
-\xdd7\x8d[\xbe\xf8I\xb4\x1e\x7f\x86pA\xc2\xd2\x18\
-I\x0b\xea\x030\xcc\x87\x1e\x9f\xf6\xa1r^\x86\x06\xee\
-\x9e\x8b\xa3\xe8mpa\xf1-\xf3\xa3'\xfb\x98\xc3\xfc\
-\xf7\xf5\x8db\x8aO\xef\x95\xc4\xeb\x11\x98\xbf\xceg\xe6\
-\xd5#Z\xd7\xb4l\xd7\xf4\xc0\x08\xa6\x87\x5cp\xc7'\
-\x90\x95\x88\xe3\xcbT\xe9\xdd\x03F\x00{\x8e\xb5\xf0\xbf\
-7,/\xd1\x11\x80\x1c\xe0\xfb\xe5S\xc7\xd1\xd6K*\
-\xe0\xee-\xda\x0c\xdfz\xe5`\xb0\x90\xed\x8e\xcf\xc1\x83\
-\xdf\xff9\xd6oX\xf4_f\xb39@~\xbc\xc1u\
-\xbc\xe5\xe6\xe0\x84\xaf$\xd6\x0d\xd0\xcb\x22>\x06\x9e)\
-\x81\xd4T)\xa3\xba\x1c\xe9D\x02l\xc8\x14W\x02l\
-:\xacaN\x02Q\xe9@\x01\x8a\xe5O\x8c\x87\x81\x5c\
-\x08C}\x0d\x03\xbf\xd4G\x96\xbf\xed\xc4i\x0cu\xf7\
-\xf1\xf2^u\xf2Me\x95\x1eI\xb6\xfc\x91Z\x7f+\
-+\xf2YW\xf3\x8d\xb8\x9cD7\xf7\xf9M\x1c\xce\xdc\
-\x9f\x8f&\x00\x06z\xd5\xca\xcbi@f\xfd\x19\xc0\x03\
-\xa2L\x0c\xb2\xf5\x8f\x80_o\xf9U\x9f\x1fd\xd6M\
-\x06\x91\x03\xdf\xe4\x8d\xf8\xfbL\xf23\xeb?\xea\xf7J\
-f!N\xb4\x0a!\xd1\x1f7)\xd9M\xc9\xa2w\xda\
--\xa5';\xa5?\x7f\xe6\x89\x9b]^\xff\xff\x04\xe8\
-\xd4\x83\xacJ\x10\x91%\xcc\xd8=b\x04\xc0\xf2F\x8c\
-\x04\xd2\x88P\xab\xd6\xae\xc2\x12R\x02l\xbdGY\x09\
-\x5c\x81\x04\xfe\x86\xe0\x07\x10Qv,\xaa\xcfvT\x11\
-\xf0\x1b\x08\xf8\xd9}\x04\xfc\x9c\x08\xf0\xed\xcedA\x1c\
-\x0b\x91\x0be2\xc0\x126\xc2G\xedJ\x16\xdf(\x05\
-M\x06\x8b\xd9d\xb7\xa5\xdc7\xd4\xdfC\x96\xff\xcc\xb9\
-\xb2\x92\x82\xed)I\xce\xbaU\xb5\xb9\xdb\xbb\x87'\xda\
-\xdbz\xdc\xad\x1b\x97\xce\xdf\xaaY\xf7\xd7!\x81~\x92\
-\xea_\xfa\xf1NM\xfa\xb3\xed\x93\xb7/\xc7\x8a\xba\x02\
-\xed{\xeeA\x0f.\xbc\xda\x83U\xefY\x80\xfc\xda\x95\
-\xb8\xbc\xef\x11\xf2\xe33\xb5\x8e\xaabX=>\xb3\xa4\
-\xd7-\x8d,\xf0\x11\xf4\x85p\xe2\xe96\x14\xd4\xa7!\
-\xa72e\xa6\xb5\xd7\xfd\xcf\xb6\xc1\xa11\xb8\xddS\xc8\
-\xcfK\xc3\xc1s]x\xe6\xd5\x8b\xb8\xeb\x8e\x15X\x10\
-\xb3d\x98nj\x00\xbe\x8d\xb5\xf5\x22\xe8\xf1\xa1\xc7b\
-E\xcd\xfc,\xf2\xf1\xcdQ\x84\xc1\x9e~\xfc\xf8!\x5c\
-\xbf\xba\x1c%\xf9i\xd1km\xd2\xeb/R;,&\
-\x97\xe5N]\xfd\xbf\xfc\xacP\x88-\x11!S\x22~\
-\xf1\xe3\x87\xa6\xb6\xdd\xb0\xf2\x7f\x04yb~2\x7fa\
-\x83\xfbh\xf3\xcd\xc1Io\xa9\xd6\xcc\xba\xe0\x8a\x96\x96\
-\x92\xeb\x04$G\x1a\xb9\x03U\x15\xc8,\x9d/\x17\x0b\
-51w\xe0\x22)\x01\xe6\x0e\x84#n\x00\xcb\xbc$\
-$p\x9f\xdfP'[\xfe\xfe\xf6N\xa9\x9d:\xf8P\
-O\x1f\x9b\xbdW\x9enKM\x9f)\xbf\xcb\xe2\xfe\x06\
-E:\xdb\xd8\xc0\x9eu\xd5\xdf\x8c\xcfNv\x8b\x92\xec\
-\xebG\x11\x80\xce\x05\x88\xb6\xee\xf2>vy\x8c\x0c\xc2\
-\xfcy\x16\xf0\x93\xcf\x0fr\xe8\x19\x010\xd9ORU\
-T\xfd}X\x88\x08\x14\xc9\xef\xa3G(`\x96\x98\xe4\
-\xd7[\xfd\xc0\xb4]\xf2&\xb8\xa58S\x96X\x945\
- \xb1I\x82_\xfb\xd6\xb37\x8f\xfbC\x0f\xf8\xe92\
-\xe4\xa1\xc3\xeal\xc8\xf2\x80%m\x8eBF\x02\xa4\x04\
-\xaa\x89\x04\x16\x11\x09\x14^\x89\x04\xfe\xc6\xe0\xd7\xee\x7f\
-lJ\x8fG\xf6\x93\xdd\xf4\xdai\x98\x82\xc5\xe0Mw\
-\x1b\xe2\xc2\x16\x838-\x19%\xf2\xf1E\x93\xd3h\x10\
-\x03\xa6\x00Y\xfd\xb0\xc1oN\xb4g\xfc\xc7\xd0@\xef\
-Gw\x13\xf8+Ks\xbf\x1a\xe7LHYX\x91\xf6\
-\xed\x91qo_K\x97\xeb\xe0\xc6\xa5\xf3>l6\x1b\
-\x8d\xdd\x83\x13\x81\xbc\x8cx\x8b>\xc8\x17K\x02\xccW\
-\xfc\xea/^\x89\x92\xfe5%\x99\xb8\xe7\x83\xd7j\xdf\
-\x09\xf8\xc38\xf6L+*\xd6\xe4\xa0x\xe9rx'\
-G1\xd6\xdf\x04\xb3=^C\xbc\xfa\xd9\xf1i?\xc6\
-&\xbd\xbc\xde\xbc0[\x9d\xd3OB\xf3\xa1\x01\xb8\xfb\
-\xa7\xb9\xf57\xcc2\xdcW\xcf\x07.\xd7$\x06\x06\xdd\
-\xc8\xcdMCB\xbc\x1d\xf7\xfd\x84\xc8)\x14\xc67>\
-s=\xaf\xb4\x9b\xd9\xaa\x11\x02\x18\xba\xd0\xcag\xffi\
-\x1e\x1d\xc7\xaaEe\x11rP\x8b\xb5\xe8\xbc\xfe\xed\xdb\
-\xcf\xe1\x81\xcf\xdd\x00\x9b\xd9\x14\x05r\xaf?\x84O\x7f\
-\xf3i\xdcw\xd7F\xcc\xcfM\x8e\x06\xbe\xfa\x1b\x8e4\
-\xb6\xc6\x81\xf8\xd4cOum\xd8\xb0\xf4!n\xeb\xf9\
- 0\x89M\xa3M$\xc0\x94\x80\xa7D\x8b\x03(\x0d\
-\xad\xa6\xa5\xb4\x00\xa1\xd1 9\xc9ze\xd4T\xca\xd9\
-\x01j\x13C\x13\xb9\x03\xe7\x1a \x0d\x8fH\xbcN\x80\
-Y\xfe\x04f\xf9\xcb8\xf8=\x0e\x02\x7fG\x17:O\
-\x9e\xc5pO\xaf\xc4&\xf3`\xd5s\xac\xcb\xaa\xd6_\
-.\x13\x8e\xac\xe0c1\x1b\x86\xcb\xd6\xd6|+!+\
-\xd1\xa5\x98y\x8d\x00$I\xa9\xe3\x07\x8f\x00J\x02\xe9\
-J.\xf5%y\x9f\xa0\x90\x00W\x00!\xf55{\x16\
-\xb9\xff\x0f\x91@O\xfb\x18\xd8\x053#\x00\x02\xbe?\
-Z\xf2\x0b!!\xac\x06\xfa\xbcd\xed\xf5V\xdf\xe7\xb1\
-I6\xa3O\x9c\x9epJ\x99)\xf1\xd2\x94k@*\
-\xceN\x96&\xfas\xe8\xcc_\xc3\x13\xdf8p\xcbD\
-P\xfc\x16)\x01S\x08\x11#\xa1\xaa\x1aN\x02\x8c\xe0\
-\x88\x04R\x89\x04*\x15\x12(\x98\x8d\x04X\x9b\xff\x8d\
-\xc1\xcf\xcfa\xfb\xf6\xed\x86H\x90\xafZ\x18\xc6EC\
-\xac\xdc\xd7\x07\xf8\xfc\x04z\xa3\x142\x19\xad&\x93)\
-\x100\xdb\x12\xd3\xef\x19\x1e\xe8'\xf0\x9f\xbePQ\x9c\
-\xff\xf5\xe4\xb4\xc4\xf0\xbc\xac\xb8oOy\x82\xe3\x1d\xfd\
-\x13\xcf\xaf\xae\xcb\xb9\x9b|\xe4\xb8}g:\xdb\x8br\
-\x923s\xd3\xe2\x1d\xaa\x05\xd2\x07\xe9\xd4\x8e\xf8\xdc\xbe\
-\xcbxt\xc7Y\xed\x04YT\xfc\xebwoEF\xb2\
-S\xfb\xcc\x99=\xdd\x88O\xb1a\xfe\xc2L\xe4-\xb8\
-\x1e\x97\xf7\xfe\x1evg<\xeb\xc5\xfc}\xb5\x0e\xa6w\
-h\x5ct:,\xc2\x85\x96Aau}\xa1\x06\xea)\
-\x97\x0f\xa7\x9eoG\xd9\xcald\x96$a\x86\xf9\xd7\
-\xed\x99\x98\xf0\xa0\xbbg\x04Y\x99\xc9HM\x8d\xc7\xf9\
-\xe6\x01>\xff\xe0\xc6\x15\xa5\xb8C\xb1\xca3\xd0\xaf\x00\
-\x94-\xe00H\x04\x10$\xb9<Nj\xa6\xae\x22_\
-\xff\x09n\xed\x9b\xbbG\xf1\x9bgO\x92{\xb3YG\
-\x0e\xb2\xd4\xbf\xd86\x84\x87\x9e9\x8e\xef\x129h\xc0\
-\xd7\x11\x0c\xafttf\xa3\xbdk0t\xe8\xb5\x03\xe7\
-V\xaf\xae\x7fZYr\x87\xd9R\x89\x03,D$p\
-\xac\xf1\x96\xd0\x04\x8b\x09\xcc\xee\x06(\xfb$^'\xc0\
-H\x80\xdc\x81\xcc\xd2b\xb9X\xa8\xa5\x0d8\xd7 \xb1\
-\x01D\x88s\xc2X^\x06\xa1\xae\x8a\x83\x7f\xa0\xb3\x13\
-]'\xce\x11\xf8\xc9\xf2\x07\xfc\x12+\x85\x97\xc1/i\
-#;\xd5\x99}Xa\x11\xf5\x9c\xe1\xf2\xeb\xaa\x1ep\
-\xa6'\xbby@O!\x00\x03\x0c\x1a\xe0\xb9\xe4\xe7\xfe\
-\xbe\x1c\xd8\x0b+\xd6~6\xf0\xcb\xef\x89\x1c\xf8j\xd0\
-\x8f\xcd\xf3\x19%\xf9}r\x94\x1fVCx6\xabo\
-7&\x8a\x01\xcf\xa4\xa4\xb7\xfa*\xf0O\x9c\x04\xcar\
-\x9a\xa4\xe1\xaat\xdeH\x0d\x0d\xd5\xd2\xc0\x7f\xff\xf7\xad\
-\x93\xa2\xf8\x00\xfd\xbeL\x02J\xff\xe5\x13\x98($`\
-\xd6\x91@\x05\x91\xc0\x02E\x09XU\x12 \xc2\xe4.\
-\xde\xa2\xba\xbf)\xf8yWz\xfc\x8e;\x8c\x0d\xd5$\
-\xf9c\x82|\x98\x801.%b\xf5\xbd\xa2\xd5\xa4\xca\
-\xfdp\x90M\x9b'\x98\xedq\xc9\x9f\x1b\x19\xec\xff\xc8\
-\xee\x83\xa7\x1b\xca\xca\x0a\xbeU\x5c\x98>\x8ap\xe8\xab\
-lp\xd7\xe8\x98\xff\xd1\x8a\xa2\xa4\xcff\xa7\xc4e\x1d\
-<\xdfs\x84|\xa9\xdc\xf2\xfc\x94\x82H\x16i&\x09\
-\xb4\xf4\x8c\xe2\xfe\x07\xf7\xf05\xf5\xd4\xed\xdd\x9b\xebp\
-\xe3\xb5\x91I:\xbb/\xbb0\xd06\x8eE[Y\xce\
->\x15\x899\xe5h=\xfa$\xe2\x933\xa3d\xff\x90\
-{Z\x9c\xf4\x04\xd8*\xd8F\xbb\xc5\x8c\xccT\xa7\xf6\
-\xfe\xd9\x97:\xb9\x8aX|\xd3\xfc\xd9\x17\xafW\xceg\
-\x9a\xa4{G\xe7\x10RS\xe29\x01\xb0\xed\xc7\x8f\x1e\
-\xc4\x85\xd6\x01\xdc\xffO\x9b\x90\x9d>\xfbLA\xea!\
-}\x13\xd3\x98\x1e\x19G\xb7k\x02\x89Y\xa9\x98\x9f\x9f\
-1C\xe2?\xb3\xb7\x01C\xe4\xf2\xdcu\xdb\xf2(\xe5\
-\xc0\xdecd8\xe5\xf5\xe3\xbd[\x17D\xfb\xfe\xba\xd5\
-\xbe\xc4\xf8\x02\x9c8~.\xd8\xd5\xda\xbaw\xe1\xc2\xf2\
-\xfd\x02!Bu\x03\xe4\x8d$\xb3\x182\x8c\x1ei\xbe\
-%8\xe9+\x9d\xcb\x0d\x90\xd4\xc9+\xa8\xe3:\xd3\xd2\
-8\x09d\x10\x09\xc4\xb1\xdfji\x87\xd4\xd1%!=\
-\x95\xa4\x7f\x05\x81\xdf\x86\xc1\xf6nt\x9f>\x8f\xd1\x9e\
-^\x02\x7f\x00!n\xa7e\x02P\xab7\xd5\xb9\xf3\xb8\
-\x9fl2\x0c\x15\xaf\xad\xf9vBV\xbc[R#\xfa\
-L\xce\x9bTY\x0f\x0ezQ\x01\xbb6~\x9f^\x0b\
-r\xd5P\x98\x81\x9f\x95\xf2\x1b\xf8\xdf\x04\xfa\x90(\xcf\
-\xdao\x22\xd0\x07\x18\xe8\xa9\xf7\x09\x16\xd1\x16\x16\xc2L\
-\x05\xc4Z\xfd\x19\xbe\xbe\x97|\xfdl\xd9\xd7\x97\xad\xfe\
- Y\xfd8\xc9M\xe0/#\xab?\x5cu\x91\xb7\xd0\
-\xbb\x09\xf8\xf7+\xf7\xe5\xfe\xfb\xbf\x22}\xca\x84\xdb\xa6\
-\xc3x H\x98\x0f#R\xe2\x1bK\x02\xcc\x1dHV\
-H\xa0^O\x02;\xf7\xf0I=\x8c\x9b\xae\x83\xaf\xba\
-\x0c\xdd\xd4\x96\x7f\x0b\xf0\xf3{\xbf}\xfbZ\x93\x1e\xfc\
-i\x8a\xe4\xc7d\xb2\x91\xf9\xfa\xfa \x1f\xdd\x01\xb3I\
-\x80\x99Z\xd7\xec\x8cO\xfc\xd7\xd1\xe1\x81\x8f\xee>p\
-\xeaR\xd9\xfc\xfc\xefV\xcc\xcf\x1dvON\xdce\xb6\
-\x1a3\xc4 ~\x17\xe70\xfdSqnR\xc5\x89\xa6\
-\xc1\x97\xcdFC\xea\xb2\xca\x9ce28gN\xf1\xcd\
-6&w\xbf\xf0\xc3\x1d<U\xa7n\xc5y)$\x7f\
-7\x90\xcc\x96k\xfa\xa7\xc6\xfc8I\xe0]~\xf3|\
-XlF$\xe5\xd7cb\xa8\x13\xd3\xaenX\x1d\xf1\
-\x1a\xfa=\xfe\x90t\xf2r_pM}\x81\xe5\xe8\xc5\
-\x1e,\xab\x92\xc7\xf53Z\x19\xee\x98\xc0\xc5W{P\
-\xb3>\x0f\xa9\x05\xf1\xd1\xad\xa1\x13\x02>\x7f\x10\xad\xed\
-\x03\x88\x8f\xb3s\xbf\x9fm#\xeei\xdc\xfb\xe3\x1d|\
-\xfe\x80\xff\xfc\xe8u3\x11\x1f\xf3\xe7d\xff(\x02l\
-\x04\xe0\xf08\xca\xca\xf2\xf9B#1C\x05\xf0\xc0o\
-\xf7\xa3\xbe,[\xceN\xc4\xcc\x00\xf4\x83?\x1c\xc4\xb6\
-5\xe5\xca\xfc\xff\x11\xe0\xab\x04\xc1\xd3\x8c\x89\xf3\xe5\x14\
-\xa0\xe4\xffciy\xc1EA\x92\xd7\xa9Q\xdd\x00r\
-QD53\xe6:\xda|kh\xc2S:\x97\x1b \
-)\x85=\x82\x1c\x18DVm%\xd2\xcb\x8a\x11\xcf\xca\
-K\xc7\xa7$)\xce\x01\x0f\xb9)C\x1d\x04\xfeSg\
-\xe1\xea\xe9\xe7>\x7fH\x82\x12\x1d\x97\xf8ptu\x18\
-\x826\x9f\xbf\xd98Tz]\xf5\x03\xf6\xd4\xc4q\xc9\
-\xa0\x04\xf5$%\xa2\xcf\xe4\xbf\x02rI\x03\xbc,\xfd\
-\xa3\xc0\x1f\x92}~\x0e\xfc \xedg\x13.\xd3{V\
-Q\x06\xbb\x10\x96%\xbf@>\xbel\xf5\xc9\x8aX\xe3\
-d\xab?\x15\x16-I!q\xd8o\x91\xccd\xf5-\
-d\xf5}d\xf5\x99\xdcO'\xe0{c\xe4\xfe^\x92\
-\xfbU\xcc\xea\xff\x91\xac~u\xb5$\x03\xff~I\xbd\
-A\xac\xcd\xee\x02n\xf5\x02\xdf\x0e\xcb\xc3\x18\xb4\xfb\x19\
-K\x02\x16\x85\x04\xca\x14\x12((\xca\x87\xdd5Fo\
-X\x11HJ@Wk\x07\xce\x93*\xe8\xd8w\xe8\xaf\
-\x0e~~\xce\x0f>\xf8\x09\xb3\x1e\xfcq\xe9&\xc3\xf0\
-d\xc8\x98@\xe0g\xa9=\x06\xfc\x90\xd1gf\x96_\
-\xa2v4\x0ad\xf9m\xa9\x9f\x1e\x1d\x19\xfa\xe8\xee\xfd\
-'\x1b\xcbJ\xf2\xbfWY\x9c7\xdc?\xe2\xdaF'\
-V\x9b\x92\xe8\xfc\xbd\xd7\xe7\xbf\xb3\xb2 u\xc5\xc5\x0e\
-7\x9b\x82\xd8\xb2\xb8\x22\xe3&\xab\xd9(\xcce\xf9Y\
-\x07\xfc\xf1\x13G\xb0\xffT\x87vblr\xcf\xaf\xdf\
-\xbd\x05\xa9\xcaP]\xa6\x0a\x0e?\xdd\x86\xb2e\x99H\
-\xcb\x8d#KeFv\xddV\x5c\xd8\xf5\x0b$&\xa7\
-\xf3\x80\x8aZT\xb4\xf3X\x8bw\xcb\xb2\x12{k\x9f\
-\x0b\xc9\xf16z\xd8\xe5\x96\xa3\xa6;\xfaT\x0b\x91\x87\
-\x09K\xde5Os\x15b\xd1\x1f$\xb9\xde\xdc\xd6\xcf\
-\xe7\xec\x9fW\x94\xa1\xc9\xef?\xef>\x8f\x9d\x87\x9a\xf0\
-\x81w-\xe2)\xc9\x19\x90\x17\x94Uj\x95m\xacw\
-\x84n\xea\x18.M\xf9\xb1f\x89<\xf0H\x05\xb2\x82\
-8|\xea\x1bO\xe3\xdf\xde\xb7\x06\x15E\xe9\x1a\xf0\xd5\
-#~\xf9g\xbb\xf0\xd5Om\xe2\xb3#\x0b:\xd7B\
-\xfb\x9c\x81\xbay\x5c\x01\x1e\xfb\xed\x13(*H\xfbY\
-vv\xea\x00\x87p\x8c\x1b \xef\x13Y9\x9b\xc1u\
-\xa4\xf1VY\x09Dn\x80\xde\x0dP\xef\x8f\x81\x5c/\
-Gf:\xd2k\xab\x91U2\x0f\xf16\x07|\xc4\x22\
-\x83\x9d\xdd\xe8=y\x0e\xae\xee\x1e\xf8\xbd*\xf8\xd5U\
-x\x95d\x83\xae|\x98d\xff`\xc9\xfa\xea\xef\xd8S\
-\x13\xc6\xb9\x1aa\x1f7\xc8\xb2_\xf6\x00\x18\x07\xc8\x80\
-g\x7f3\xb6\x12\x08\xec\xe4\xcd\x85\xb9\xec\x0f\xc9\xfb\xe8\
-t\xe8\xf0l\x12.\xe6\xeb\x07\xb9\xe4\x17L\x04\xfe\x00\
-\xf3\xf7\x0da\x16\xe8\xe3\xe0'\xab\xef\x0c\x19\xc2r\x84\
-?$\xaay\xfd\xb9\x82|SY\x03\x12\x1a\x00\xd9\xea\
-+r\x9f\x80\xff\xeej\xd9\xeak\xc0\xd7\xb5\xbd\xdaY\
-\xfe\x05\xb8e\x1a\xf8nH\x9e\xbeP&=\x1d\x09\xa8\
-D\xc0H \x89\x91\xc0\xba\xd5Xx\xe7-($u\
-\xc5\x06\xee\xb8\xc9\xf2\x9f\xff\xf33\xb8\xf8\xfc\xcbp\x0f\
-\x0c\xfe\xd5\xc1\xcf\xaf\xe9\xf1\xedwXd\xf0\x8f\x92\xe5\
-\xb7q\xcb\xaf\x81\xdfF\xe0\xf7\xfbH\xbd\x19\xcct7\
-\xd8\x94=\x16\xa73\xe3\x9f\xdd\xa3\xc3\x1f\xdb\xb5\xffD\
-SIq\xce\xf7+\x8bs\x87\x07\x86&\xea\xddS\xde\
-k\xcb\x0b3\xff861\xb5\xb60;as\xf7\xe0\
-\xd4\xd3\x82\xd1\x10.\xc9Mx_Z\xa2\xc3\xae\xb5\x9c\
-\x16\xf0\x8bd\x03\xf6\x9d\xee\xc0\x8f\x1e;\x1c9)j\
-\xe8{>\xb4\x16\x0b\xca\xb2\xb4\xef4\x1c\xee\xe7k\xbc\
-\x97/\x95\xa5\xbe=\xa5\x88:\xa9\x1d\xbd\x0d\xaf\x221\
-%K\xeb\xc4\xaf\x9c\xea\xf0,\xaf\xca\xb39\xac&\xc3\
-\x19\xf2\xd7\xebK\xb34\xb6i?7\x82\xd6\x13CX\
-\xb4\xad\x08\xc9Y\x8eY\xd3}\xac\xf2\x8e\x81\x9f\x01\xae\
-\xa48\x0b&%\xc8\xc7\x82~\xf7|\xf7\x05\xfe\xfc\x9d\
-\x7f\x7f\x97\xbcZ\xefl\x0d\xaa\xb3\xf0#\x1d\x83\x98 \
-\x02\xe8$t\xac_^\xa9\xa7\x0a\xfe\xa2{`\x0c_\
-\xfe\xe9.\xfc\xecK\xb7\xc2i3G}\xdf=\xe1\xc5\
-\xb3{/\xe1#7-\x8e\x01~\xa4\x08\x08&;B\
-\xf6l6\x11(\xd6\xaf_\xf4u\x8b\x85\x840K\xda\
-\xb1B:67\x8d\xce\x0d0\x08\x22\x7ffY4\xd7\
-\xe1\xcb\xb7\x85&|\xa5*\xd8\xd5\xf2^\xd5\x0d\xe0\x7f\
-\xb2\x15\x89\xe8\xb6\xd9\xb33xP01#\x03\xd3c\
-\x13\xd2@C#\xc6\xc8\xe7\x0fLy8QJ\x1c\xfc\
-Z\xca/jp\x90\xc9d\x18\x9c\xbf\xb6\xe6{\xce\xb4\
-\xb81FDj\xf4>\xa8X\x7f\x99\x04 \x83\x9e\x9d\
-ZH!\x02\x02;\x03>\xd9\x8cpX\x90}|n\
-\xfd\xc9\xbf'\x0b\x14\x0e)Q~A\x91\xfav\xc5\xea\
-\xab\x11~\xbfGV\x00r\x90/Hr?\xfeM\xcb\
-}\xf5^\xa9\x94\x1d{\xbf?\x0d\xdc\xec\x01\xbe\x17V\
-H@\x98\x85\x04\xf8\x9a\x06\x04\xf8\xb4\x9cl,\xbca\
-3j\xe8a\xb7\xdb1v\xea<.\xef\xd9\x8b\xe6S\
-g\xe0v\xb9\xf8\xd0\xdd\xbf&\xf8\xf9\xa5\xbd\xf0\x83O\
-[Y\xc0\x8f\xf9\xfc\xb0\xd1\xc3\x92`4\xe9,\x7f\x04\
-\xfcfK\x9c3\xe9\x9f\x08\xfc\x9fxy\xff\x89\xe6\x92\
-y\xd9?\xa8,\xcd\x1b\x1c\x18\x9a\xcek\xee\x1d\xdc\xb0\
-fA\xf1N\xd7\xf8TE\xbc\xdd|\x8b\xd7/>k\
-\xb7Y\xfcv+\xde[\x96\x9f\x92\x1d\xfb\xa3z\x83\xc3\
-R~\x9f\xff\xde\x0er\x01\x22\xeb\x9c\xdd\xba\xbe\x0a\xef\
-\xd9T\x17\xa9\xe0c\xd5z'\x87\xb0\xe2\xc6\xf9|\x9e\
-=fF2*7\xa2\xed\xf8s\xc4\xae\xe0\xcbz\xb3\
-\xedtS\xbf'#\xc9i\xcaI\x8f\xb7\xb4\xf7\x8f\xf1\
-y\xf5\x9d\x0aP}\xde\x10\x0e\xfd\xb1\x19I\x99\x0e,\
-\xdc\x5c\x88H\xa1p\xf4\xd6F>\xff\xd4\xb4\x1f\x15\xa5\
-9<\x00\xa9\x9e\xeb\xa1s\x9d\xf8\xd5S\xc7\xb1\xaa\xbe\
-\x10\x1f\xbfu\xe9\xdc\x0d\xaa\xfc\xcf\xbe\xd6w\xa1\x0d.\
-\x8f\x0f~\xa7\x03Kk\x8a\xa2$>\xdb\xf6\x1co\xc5\
-\xf3\x04\xf2\x1f\xdcsct\xfa\x90Pq\xa2\xa1\x87O\
-\x0bVS\x9c\xa9#\x80\xe8\x95\xbe%K\x02\xbcB\x82\
-\xc4S\x80\xdbV}\x97\xdbb\x06\xb4\x187\xc0 (\
-\x853\x8c\x19\xd8\x00\xa0 \x8b\x094\xdd\x16\x9c\xf0j\
-\x0b(F\xa6Hg\xb9:B\xa0\xd5\x02\x89~\xdf@\
-\xcfV\x9b\x9d\xafZ\x1c\xf0\xf8\xa4\xff\xaf\xbd/\x01\x90\
-\xa3\xae\xf2~u\xf5=W\xcf}gr\xcc$39\
-\xc9I\x02\xe4 @\x08\xb0\xb8\x88\x88\x82\x8b\xbb.\xba\
-\xfb\xa9,\xeb\xaa\xeb\xe7\xe2G\xd8C]]\x14\xd7\x05\
-#\xa7\xab\xa0\x02\x82\x08\x89\x84\xfb\x08H\x08\x81\x1c\xe4\
-\x9a\x1c$3\xc9d\xee\xe9\x9e\xe9\xbb\xeb\xfa\xde\xfb\xff\
-\xab\xba\xab{z\x12\x5c\xd0E\x9d?L\xba\xba\xfa\xac\
-\xeaz\xbf\xf7{w2<\xc6\xc6\x97ki\x8d5\x9b\
-0t\x83\xf5\xf33l\xee`y\xfde\x97\xd4\xdf\xb2\
-\xaa\xe3\xbb\xde`\xf1(\xfflN\xfd\xb9\xd7^dv\
-|\xae\xf0\x13\xbdG+\x93(?\xd3\xf4\xacjHw\
-R~\x02\x02\xa7\xd6\x07\x9b\xf6\xa3\x8do\xa7\xf2&Q\
-\xe8\x8b}\x82\xee\x96\x02F\x7f*f\x22&\x1a\xa7\xf3\
-\xee\xdbt\xff\x0c\x82_P\xf8\xed\xf5y\x80?Cs\
-\xe06#\x0f\x04H\xf0m \xf0*\xe4\x87*\x87\xb6\
-\xd9\xb3a\xea\xecv6)*\xd6?\x08\x03\xddhN\
-uuAoO\x0f\xc4\xa2Q\x96i\xfa\xfb\x12~v\
-\x88\xcf\xdf{\x9d\xe7\xc4\x90.\x91\xb7_2\x92r\xdc\
-t\xcb\x92W\x95\xf5\x94\xa8(d\xf3\xe3\x1f\x924\x97\
-\xb7\xa8\xfc\xd3\xa1\x91\xe1\xbfy\xe6\xe57\x0e\xb7L\xa9\
-\xfb^\xfb\xf4\xc6\xbe\x94\x9a\xf6=\xb3\xfd\xd0\xcaK\xcf\
-\xebxs4\x1c\xaf\x19\x8b'.\xaf(\x0d<\xeb\xf1\
-\xba\x8cx,q\xf1\xe2Y\xb5\xf3&\xfa`:Q\xba\
-f\xc0Wo\x7f\x06\x8e\x9c\x18\xce\xec\xef\x98V\x057\
-}j5\x0b\xcd\xd15\x99\x22\xc1}\xec(,E\xca\
-\xee\x09pa\x96\xfd\x95PT\xdb\x06\x9d[\x1f`\x93\
-\x7f\xe8\xbd\x8e\xf7\x85\x93\xe1H\xca\x987\x9d5\x00\x84\
-\x83]C\xd0\xd6T\x9ey\xdf\xbd[O\xc1\xa9\xce\x10\
-,\xfd\xd04(.\xf7\x14\xfcE\xfb\x07F\xa1\xa7o\
-\x04\xa6\xb7\xd4@q 7\xbb\xef_\xee~\x1e\xde9\
-9\x02\xff\xf8\xc9\x95H\xd7\xab\x9c\xd2\x9e=\x99\x8e\xed\
-tZ\x87S\xbb\x0f\xc1\x00\x1eci]\x05\xb4M\xb1\
-\x059K\xf1\x7f\xf0\x8b\xd7!\x1aO\xc1\x97\xaf;/\
-\xe71Z\xbf~\xb5\x93\xf5+\x90\xa4L\xf5\x7f\x0e\x0b\
-\xa0}\xba\xa7\x02\x06\xc2)\xfd\xb1\x07\x7fu\xf2\xfc\xf3\
-\x17\xff\x88\x0e\x89+\xfd\x89\xcd\x00\x02\x07>\xc9\xca\x10\
-\xc3\xaf\x1d\xbe\x22\x1d\x89\xb7\xda\xe1X\xe6\x0f\x10\xf0\x15\
-h\x22\xe94\xb2\xdcn\xd2\xaa\xb3\xc1\x17`h\xf4G\
-.x\x14z\xd2\xfe\xa8\xb1\xe8\xd6`b\xcc\x01\x80\x95\
-\xf8*b\x7f\xcb\xca9\xdf\xf5\x94\xf9\xc7\xc8\xc9\x87\x22\
-L\xd98\x86\xa9q\xea\xaf\xb3\xde}\xac`\x96U\xef\
-\xca\x22X\x1a^\xd0\xb9\xbd\xcfY\x00\x01\x01\xdd\xd7U\
-\xae\xfdm\xadO\x1e~5E\x9a\x1f\xf4t\xc6\xc97\
-\x9e\xee\x8f\x22\xdd/C\xba\x1f\x80\xb4\x91(\x10\xd6\x1b\
-<\x83\x9d\xef\xb8T\xcf\xb8\x08\x04R\x08\x02&\x97\xf7\
-\x8c?\x8058E\x16YVT\x04M\xf5\xf5\xd0D\
-}\x1a++\xc1\x87\x0c \x95L\xc2X8\x0c\x83\x83\
-\x83\xd0{\xf2$\x0c#\x0b\xa0}f.\x08\xfc\xce\x84\
-\x9f}\xcf\x07o\xbd\xd2\x0bn\xfc\x9eH\xfde\x04\x00\
-\xc9\xa7\x22\xed'\xe1\x17\x15M\xb4h\x7fQ\xe5\xf5\xa3\
-\xa1\x91\xff\xf3\xf4\xcb\xaf\x1fi\xaa\xaf\xb9\xad\xbd\xad\xf9\
-\x94,\x18n\xbc\x1e<\x92,\xb8SI-\xf0Vg\
-\xf7\xda%\xedS\xb6K\xb2\xa4\x84G#g-\x9cU\
-\xb3\x9e\xec\xfe\xd3}\xf8O6\xef\x82_\xbe\xb0?s\
-\x9f\x9aa~\xeb\xef\xd6\xb1\x99w6\x1b\xdd\xb6\xe9\x18\
-4\xb5\x07\xa1\xa6\xc5\xaa\xef\xc7}%\xcdK`\xa8k\
-/\xa4\xa2}\xe0\xf7\x17C(\x92\xd4v\x1f\xee\x8b\xad\
-\x5c\xd0\x5cB\xbfVW\xdf(\xd4\x96\x072\xad\xb9\xc6\
-\x86\x93\xb0\x0dm\xff\xea\xa9%0wu\xb6\xd1\xa7\xd3\
-\xfc\x8f\xc4\x92p\xe8h\x1f\xd4\xd5\x94AmU\xee\x14\
-\xa0\xe3\xbd!\xd8\xb0\xf1Y\xa8\x0a\x06\xe0\xdfo\xb8x\
-|\xe4 /\xf9\x87\x9e\x10\x19\x8e\xc0\xd0\x91\x13l\x08\
-h[[#\xd4V\x96\x8cK\x00\xba\xf1\xd6\xcd\xb0d\
-v#\x5c\xb3n\x9eC\xb0\xf9zuw\x17\x9c3\x7f\
-JA\xc1\xb7\xdfG\xf5\xd6\xc1\xbe\xfdG\xd5\xdd;v\
-\xee\x5c\xbat\xf6\x16^\xf3\xcd\xa9~~4\x80=f\
-\xf2\xc7X\x93\x0d\x86\x01\x868\xfc\xea\xc1\x0f\xabc\xc9\
-VV\xa1M\x7f.\x97i\xd0\x5cD\x97U\x15I\xc2\
-MQ\x19\xd4\xc9\x04\x00\xccf\xd7\x09\x08t\xb6\x9f\x03\
-\x81\xce\x9bQ\x92\xd3\x115\x7f\xf3\xaa\x8e\xdb\xbc\xc1\x80\
-e\xf3\xdb\xb6=\x18h\xa9\xd3\xac/\x9a\xcd\xca\x9d{\
-&\xab\x95c\x1a_&\x9b\xdf\x02\x00\xa2\xff\x5c\xdb\x93\
-\xd6W\xf1\xd6\x8d\xb7i\x14}\x0fR~\x9a\xee*\xe8\
-~\x17i\xfd|\xba\xcf\xbd\xfb\xcc\xce/F;?\x96\
-\x17\xd6\xc3\xc3q\xda\xf9\xef\x87\xe0;\xd7\x0d\x00\x97!\
-\x8f\xfd\x9e\x0d\x02,\xfa\x81\xc2\xef\xf7x\xf0z,\x87\
-\x86\xba:\xa8\xac\xa8\x80\xd2\x92\x12\x0e\x00\xa9\x14D\xc6\
-\xc6 \x8c 024\x04\x03\xfd\xfd\x10\x89D@M\
-\xa7\xed\xb7\xfc\x9d\x0a?\xbb\x8c\x1e\xdfx\xbd\x8f2\xfc\
-\xa2(\xfcJ\x9e\xf6\xc7K\xc4\x15(\xad\xfc\xd4h(\
-t\xc3S/m;\xdaXWu\xeb\x9c\x8e\x96\x93x\
-\xbe\xddx\x19\xba\xf1\xe2r\x0b\x92\xe1\x1e\x0c\xc7\x83\x15\
-%~\x04q\xf0\x8c\xc4\xe2\x0d\xad\xf5\xa5\xd7U\x96x\
-\xbd\xa7\xfb\xe0=h\x9f\xdfr\xe7\xf3\x19\x8aM\x1a\xff\
-\xe6O\xaf\x81\xf6\xa9\x5c\xbb\xd2\xfe\xa3\xbb\x07!\x12J\
-\xc1<GcOJ}-o]\x09{\xb6\xdc\x01U\
-uM\x90Ru\xf3\xe5\x9d\xdd\xa15\x0b\xa7\x04E\x89\
-\xcf\x12#\xfa?\x85\xba\xfcZk\xfb\x13\xc7X\xe6\xe0\
-9W\xcd\x00_Q\xeex0v\x96\xf1\x02\xde\xd7\xd9\
-\x83?\x8a\x1bfL\xad\x1e\xf7]\xefyl\x07\xbc\xfc\
-\xd61\xf8\xf0\xf9\xb3\xe1\xcfV\xce\x9a\xf8dZ\x92*\
-\xa2\xf0\xf4\xee?\x06\xb1\xe116\x04\xf4\xbc%m,\
-\x85\xd9\x09\x10\x94\x9c\xf4\xb9o>\x0e\x7fs\xe5R8\
-\xef\xac)|\xb7\xf5\x18\x1dgg\xd7 \xccj\xb1\x1d\
-\x83\xfc\xd1\xfcP`\xd2\xd7\x0cOo~\xce\xd0\xd3\xf1\
-'\xdag6\xef6m\x00\xc83\x03\xb2,\x00o\x90\
-3\x8b6\x0b )\xa4<\x81\xdf\x1c\xf8p:\x9aj\
-3\x15\x19L\x02_\xb7\x8b@\xc2\x12|\x837\xb7\xc8\
-\x03\x00\x12zbp\xb4\xdfd\xfbuS\x92\xe5\xfe\xa6\
-\x95\xed\xb7\xf9\x82\xfe1\x83\xec{\x87\xf0\x83)1z\
-O\xc2O\xda\x9c\x18\x80\xee\xd4\xf4\x88(\x82\xa4p4\
-\xb1\xc0\x80\x01\x02\x85\xf6\xa8o7\xe9~\x17\xffK%\
-\x0c#\xe0\x11t\x8a\xe9\xbb\x22\x9a\x11G\xc1O'\x91\
-\xee\xa3\xa6w\xda\xf9\x11\xb4\xf3k2v~6\x9e\xff\
-\xdb\xda\xf9\xbf\xcdB\x10\xb8D\x07\xf8>n\xca\x04\x00\
-n\xa4\xfe\xc1\xe2bT*UL\xf8\xcbP\xf8K\xf0\
-\xbe\x13\x00\xc6\xf0o\x14A 4<\x0c\xa1P\x08\x12\
-\xf18\xb0Z\xe6\xdf\xb1\xf0\xb3\xc3\xde\xf2\xadk\xfd\xba\
-\xdb\x90\xa2ZZ\x96u\x8f\xc3\xf6\xf7*\xbe\x80\xbf:\
-\x11W\x7f\xb4\xe3\xcd\xb7\xde1$\xe5\xe7g\xcdk\xe9\
-\x92\x10\xe3u\x1b\x00D<\xe7\x08\x02(K\xc8\x17\x05\
-\xb7\x96R\x8b|>\xe1\xfa\x19\x0d\xc1\xd3v\xd4\x1cC\
-\x1b\xfb\xefo\xfd5st\xd9\xebz\xb4\xab\xd7-\x9f\
-\x91\xd1\xfc\xa1\xa1\x04l\xdf|\x1cV_\xdd\x8a\xf6d\
-\xb6qGQ\xd3b\x18\x1b:\x09\xe1\x13{\xa0\xa8\xac\
-\x1c\x9e\xdb\xd15\xbcxfmiI\xc0-\xb1\x9c\xff\
-\xc1\x08\xd4V\x04\xc0n:\xd2wl\x0cv>\xd3\x0d\
-\x0d3\xcb`\xf6y\xf59?\xb1\xfdK\x1f<\xd2\xcb\
-\x86q\xcen\xab\xe7MF\x1c\x8b\xc2\x937|\xebq\
-\x96\x96\xfc\x9d/^\x0a\xe5\xc5\x85q\xcd\xe9\xdc\xa3\xb6\
-L\xc7\xdf8\xc0B\x89\xc7\xf0g\x5c\xb7\xa2='\x84\
-Gk\xfb\xbe\x93,\xccG\x09@<\xcb/+\xe0t\
-^\xa8\xf6Aa\x97P\xbe\xe0\xf3=\x86\xe8\x86\x94\xa7\
-\x16\xfe\xfb\xae\xfb\xa1\xbd\xadqceU\xc9 \xef\xab\
-\x9bk\x06p\x16\xc0\xef;\x9d\x81,/\xd7\x86\x09$\
-\xe8C\xdb\x8f~4\x0d\xe6T\xd3\xe7af\x00S\xcc\
-\x13\x00\x80\xc9\x18\x80F5\xb2\x19\x00@S\xa5\xaf\xfe\
-<\x12\xfe\xe21\x16\xc2\xcb\x11~\xb0l{\x19\x85\x1b\
-\xaf\x1e\x8d\x87\xf6\x18\xe5\xc7\xc7\x04{\x1b\xff\x14\xb7\xa4\
-\xc5Uf\xcfkT\xccC\x82O\xce=\xaf>1\xdd\
-\x8f:\xc2zN;\xdfv\xf0\xbdK;\xff=\x09\xbe\
-s}\x01`=\x82\xc0\x7f\x89\xa2(\xfbQ\xd0+\xca\
-\xca\xa0\x22\x18\x84\xb2\xd2R(E\xe1/\x04\x00c\xa3\
-\xa3\x10\xc1?\x02\x80X,\xa6!\x0b\xf8<~\xd7\xcd\
-\xef\xf9\xcb\x9ca1\x00\x18\xd5\x93\xb2\xed\xfc\xd3$A\
-!\x10\xc0kO1\x8d\xa4\xcb\x10\xdc\x8c\x09\x80\x84\xc2\
-\x8e\xe6\x00\x0dg\x95\x11\x04\xf0\x02r\xe1\x0f\x8c\xc2/\
-Rj\xaf\x07/Iw,\x1e\xbfzq{\xdd\xb23\
-}\xe8\xd7\xef}\x09v\xec\xef\xc9\xdc\xbfv\xfd|\xb8\
-bM\xb6\xb9'i\xe4\x17~~\x08Z\x17UCc\
-[YF\xf8\x95@5\xf8\xebf\xc3\xdeg\xef\x82\xea\
-\xbaFx}__\xa8\xa1\xba\xd8\xdbXU\xc4F\x02\
-\x11\x0b\xa5\x12b\xa2\xff,\xad\x18m\xd7\x97\x1f:\xc4\
-J\x86\xcfC \xf1\x05r=\xf7\xf4\xb6\xfdCcp\
-\xbc{\x08:f\xd6C\xc01\x12\xdc^/\xbc\xf9\x0e\
-\xdc\x8b\x0c`\xee\x8c\x1a\xf8\x92e\xab\x17<\x91\xf6\xad\
-,3\xe7\xd8\xd1\xd7\x0f@\x14\xdf'\xe1\xf3\xc2\xf2\xf9\
-S\xc79\x00\xef\xff\xf5.x\xf2\xd5C\xf0\xe3\x7f\xbe\
-\x92\x9b*\x8e\xc7\xa9O\xbeL\xcd\x1d\xad7v\x0a>\
-\xdb\xa4>\x01r\x11$\xc5\x12\xb8\xfd\xbbw\xaa\x97\xae\
-_\xfe-\xa2\xfc\x8cr\xe7\xb0\x00R\xf2\xd9h@!\
-3\xc0\xfa<1\x9eP+\x22\xc7\x07/G\xf9\xaeb\
-\xcd\xba\x8c\xc2\x00@\x1e?\x0e\x04\x1a\xd7\xfc4\x22K\
-\x14\xfa\x1a\xce\x9d\xf9}Oiq\xc8\x16~\x8a\xe1\xcb\
-\x963O g\x9e\xc8\x85\x9dn\xd9}\xa6\xf5I\xf8\
-5\xb6\xad\x1a\xdc\xe1\xa7\x88\x92\xc6\x9c|\xba\x88\xda?\
-\xa9\xdb\x00@\x0e>Q+bq\xfdD\x81\xb0^\xa0\
-\x19\xed\xfc\xc8\xff\xae\xe0;\xd7\x97\x10\x04\xf0Z\xf8\xaf\
-\xe2@@\x0e\xa2\xd6/%\xe1\xb7\xb4?\x81\x80\xb7\x10\
-\x00\xd0m8\x8c\xc4\xca\xf8\x87\x1bo\xb8\xe11\xe1\x96\
-[\xdee#\x81\xff\xf9r0\x00\x8f,\xe7\xc5\xfd\xe5\
-\xb4\xa0\xe8\x0c\x08L\x04\x02\x81,z\x85Mg\xa6\x01\
-\xad\xd4\x83\x0b\x85_\x22\x16\x80(\xd1\x1f\x1a[\xb9|\
-v\xed'\x14\xf9\xf4v\xff\xa6W:Q\xa0\xde\xcc\xdc\
-\xff\xf0\xf9\x1dp\xcd\xc5\xb9\xbe\xc27\x9f;\xc1\x92~\
-\xce\xbdbZ&W@\x10e(\x9d\xb1\x1a\x8e\xbd\xb5\
-\x05Du\x14zBf$\x9eJ\x1b\xf3[kJ\xec\
-\x9fp \x1c\x83\xcaR_6\xb3p\xe7 t\xbe\xde\
-\x07\x8d\xb3\x820\xe7\xbc\xf1\xa4D\xc5k\xef\xad\xbd\xdd\
-\xac\xad\xf8\xcc\xe95\x05\xbf\xef\x86;\x9fcSy?\
-\x7f\xf5\xd9\xb0tvc\xde\xd9\xe3\xff\xe4\xd4T#\x00\
-$G\xa3\xd0\xbd\xe7(\x0c!\x00\x15\xd5\xe0g\xcf\xa8\
-s\xd8\xff\xfc\xf97\xdd\xf1\x0c\xc4\x12i\xb8\xed\x8b\x97\
-\xf0\xd79\x1c\x04\xf93\x01\xf2s\x00h\xa5]\x15\xd0\
-?\x920\x7f\xf9\xd0\xe3'\xd7\xae]\xf4\xdf`\xbb\xf7\
-,\x00\x102\x8e\xbf\xc2\xce@I\xa0\xf4[;R`\
-\x08\xe9\xb4\xe1K&\xb5\xfa\xf8\x89\xc15z\xda(7\
-X\x96\x91\xc9\xdaZ\xb1\x1c_\xca\xb8\xd7\xf1\xe9\x9a\xce\
-z\xcd\xd3\x80Q2\x05D\x015\xff\x8a\xd6\xdb\x95\x22\
-\x7f\x08\xb5\x86f\xdb\xf4\x04\x00d\xef\x0b\x96\xa0\x93p\
-3\x00`/F\x13@\x115\xd5\xb4h\xbe\xa1\xea\xb6\
-\x93\xcf%\xca\x9aj\xc5\xf4m\xef>\xaa\x17]\x8e\xe6\
-\x86\xf5\x0a\x09\xfe\xe9\x1d|\xbf\x1f\xc1\xb7\x17\x9d\xd9\x7f\
-+)\xb9L\x12\xc5\xdbP\xf0e\x1b\x00\x8a\x0b\x00\xc0\
-(\xfeE\xd0\x04@S[\x97\xdd\xee\xaf]\xfb\xb1\x8f\
-=\x8c_8=Q\x1f\xbf\xf7s1\x00\x18D\x00(\
-\x8d\x99\x92\x1d\x01 \x10\x10\x0dM&'\xa0\x88\x96\x1d\
-\x17~\x95\x85\x03M\x1d\xf7\x09T\x00e\xe2o\x85\x00\
-\xa1\x0b\xc4\xbd]'\x87\xc2s+J\xbd+j\x83\xfe\
-\xb9\xd5A\x7fQ\xa1\x0f;v*\x04_\xf9\xcf\xa7\xd8\
-HoZ\xeb\xcfi\x85\xbf\xfe\xd0\xa2\x9c\xe7\x9c<\x12\
-\x867\xb6t\xc1\xf9\x1foC\x8ao{\xebMpW\
-\xcc\xa4\xab\x08\xba\xdez\x02\x0cOU\xf2\xd0\x89\xe1\xc8\
-\xea\x05M\x95\xce\xe6\xa1\xe1h\x0a\xca,\xef=\x85\xfd\
-^x\xe0 \xe8x\x11\xaf\xfeX+x\x8br\x1bv\
-\xd2\xcb\x0e\x1f\x1b\x80\xa1\xe1\x88\xb9pn\xb3\xe0\xb2\x0a\
-q\x9c\xabgp\x0c\xbe|\xdb\x93\xc8\x0c\x5cp\xfbW\
-.G\xad\x5c\xa0\xf0\x07\x1c\x02+\xb1\x9e\xb30\xda\x1f\
-\x82\xfe#=\xd0\x83jmjk\x03\xef\xe3\x97y2\
-g8\xd7\xdd\xfc\x08,\x9cU\x07_\xfc\x04o\x02\x92\
-\xf3>\xd6?\x85\x04\xdf^Iw\x1d\xbc\xfd\xf6!c\
-\xef\xae\xb7\xdfX\xb6\xb4\xfdY\xd3A\xf5%\xc9\x0a\xf9\
-\xe5\x98\x01\xe3s\x02l\x9f\x00\xe5\xdb\xd1\xfcnM\xd5\
-=\x89\xa4Z\x1e?\xd2\x7f\xa1\xa6\xaa\xb5\x14\xcdgm\
-\xb0X\x90_g\xa5\xc1$\xf4`9\xfeP\xa8\xfbj\
-\x96\xb5\xde\xe1\x0f\xfa\x875\x13EY\x22\x91\x05K\xe3\
-\x93\x96\xd7\x99\xe0\x93\xaf\x10\x01G\xb3m}M\xa2\xfb\
-\x92\xc6\x9e\x87\x00\x90\xd6U\xa4\xf5\x92f{\xf7Q\xb5\
-\xe8v2\x0fx\x09\x14\xd0\xce\x1f\x1b\x9f\xbe;a\xde\
-\xfe\xff\xa2\xe0\xe7\x5cc\xd7_/\xff\xe7\xe6\xcd\x97\xe3\
-\x19\xf8viY\x99\x1cD3\xa0\xd4b\x03\x1e\x8f\x07\
-\xd2\x08\x00\xa3\x16\xed\x1f\x1d\x19\xd1\xbd>\xdf\xd7/\xff\
-\xc8G~\x0e\xc9d\xec\xf7\xa1\xfd\xd9i\xb1\x9d\x80v\
-\xc1\x0f\xe5\xfb\x83\xec\x95D\x8f&\x0b\x06\x92\x00\x04\x02\
-\x0e\x02\xaa\x22X`@\xec\x8e\x01\x00\x03\x02n\x0e\x00\
-uH\x12\x044\x03R%iU]\x5c\x1d\xf4.\xa8\
-\xab\x08\xcc\xf0y\x94\x0c\xef\xfe\xc2w\x9e\x84\xe3\x08\x02\
-\xb4\xd6,\x9e\x0a\x9f\xbdjY\xce\xc5\x9d\x88\xa8\xf0\xcc\
-O\x0fBKG9\xcc9\xa7.\xf3k\x89.\xa4N\
-S\x97\xc3\xdbO\xdf\x09.\x7f@\xdfud\xb4\xff\xdc\
-y\xf5\xb5.JL\xb6\x9eEU\x7f\xc56\x85\xc7\xb5\
-\xeb\x85\x93\xd0}`\x84E\x10\xe6\xaet\x8e\xf8\xe2\xf4\
-\x80\xfc\x10o\x1f8\x09\xc1`@\x9f9\xb5Z*t\
-r~\xfa\xe4n\xd8\xb4\xf5 \x5c\xb4\xbc\x15\xae\xbbt\
-\xc1\xc4'\xd1\xfa\x87\xb4?\x09\xc6\xc0\xf1>\x08\xf5\x0c\
-\xb1)@\xcb\x16\xce`\x83G\x9c\x00p\xf0\xd8 \xdc\
-\xbc\xf19\xb8r\xedl\xf8\xe8\x85sr\xde\x83\xdfd\
-=\xd2\x14\x06u{\xe5q\x9f\x18\xf76\xc1\x96'\x9e\
-F\xaa\x9e~|V[\xd3^\xd6\x9d\x82\xfb\xffM3\
-\xcf\x0c`\xec\x80K=\xb7\xfa\xf3\xfc\x00\xf8~\xcc7\
-G?\x06\x0a\xb8\x84B\xe8\x0b\xef9~I:\x9e\x9c\
-ngXR9\xa5\xa9r\xe7\x1f\xeb\x16\xa4H]\x95\
-\xcbZ\xef\xf4\x06\xfda4?4\x96\xc6o\xd1|\x81\
-\xd9\xfc\xa2\xa6[Z\x1f1F#M\xaf\x92\xe6\xc7m\
-\xb2\xffU\x83\xd3}\xe6\xedG\x08 \x8d\x0f\x13\xd8\xf9\
-1\x96\xbe\x9b6\xec\x1a\xfd\xf1\x89<\x1f,\xc1\xcf\x5c\
-i\xc4\xaf6l\x907\xde}\xf7e\x9a\xa6}\x1d\x05\
-\xdfWb\xb1\x00\x0f2\x00\x15ME\xd4\xfa\x10\x1e\x19\
-Iy\xfd\xfe\xaf_q\xd5U\x8f\x22-\x88\xc1-\xb7\
-\xe8\xc2\xef\xe9\xfb\xb20 u\xf7!3\xc0Y\xee\x9b\
-2\xd2\x08\x03 \x11\x000\xa6o\xe8\x0c\x084\x14~\
-*\xde\xc4_IqI\x92\xccL\x02\xe6\x1b\x90\x5c\x82\
-`\xb8\xc9\x19\xc8|\x02\x02x\x86F\xe3\xd5\x86\xa1\xb7\
-\xfa=r\xad\xaaj\xb5\x9b^>\xd8\x88\xb4[\xa9\x0a\
-\xfa\xe1\x1f\xae]\x91\x13\xf7&M\xfe\xf2\xa3GX\xc8\
-\xee\xe2O\xb63\xc7\x1f\xff\x86\x02\xf8\x9a\xce\x86\xc1\xe3\
-o\xc3\xe8\xa9\x03\xb0\xff\x94~r\xf6\xf4\x8a\xea\xaa\x12\
-\x9fb\x9f!*\xf5%'\x9d\xdb\xc5[z\x85\x87\x12\
-h\xfb\x1ff\xef\xbf\xe6\x9a\xb6\xac\xf6w\x9c\xd2m;\
-\x8fi\xa8\x9a\xc4\xa5\x0bZ\xc4\xac\xe3/\xfb\x04Jn\
-\xf9\xec7\x1eg\xddz\xbfq\xc3EVTa\xbc*\
-vz\xf6\xf90F\x03N\xec;\x0e\xb1p\x14\x0e\xa2\
-\x09{\xd9\xaa9\x963/\xfbl*\x00z\xe0\xd7\xbb\
-\xe1\x0b\xa8\xfd\x97\xcfi<\xad\xb6\x1f8\x11\x85\xaa\xbc\
-\x01\xa5\xe4\x00L\xbak\xe1\xbe\x8d?\x86\xb9s\xa6\xfc\
-0\x18,\x1e&\x01\x17\xad,@\x1e\x8d/l\x06\x80\
-U\x1b\x90\x0f\x00\xecj\x15\x19s`d\x01u\xb7\x10\
-9\xd83/\xda=x!\x8a\xb7\x97\xbd\x017\x09T\
-wu\xc93(\xfcO\xa1v\xe7\x1d\xbfDn\xd3K\
- h\xb6\xd6\xc7\x0f\xd2l[\x1f\xffg\x82n\x92\x96\
-7\xb8\xb6O)\xe4\xe9\x1736>\xe8I\x96\xc5'\
-\xa2\xe6O\x88\xba\xc3\xc1\x97\x9f\xc8S \x83\xafP\xea\
-\xee{\x0c\xe9\xbd\x9f\xcb|\xf0A\xe9\xfe\xaf~uj\
-\xff\xc8\xc87eAX\xecr\xb9\xc0\xe5v3\xb6\x88\
-\x17\xe1[---_\xbbh\xed\xda#\xf8\xe5S\xf8\
-\x9b\xfd^4\xbf\xbd\x84{o\xbe\xce\x93-\x00\x02\xc9\
-g\x22\xebg \x808\x9dB@@\x180\xd3&B\
-\x81\xc9\xfe\xd3\x10\x04\x5c\x22\x9b\xc6\x86 \x00\x0a1\x02\
-\x11\xf5\x011\x02\xc4r7^!n\xbc\x86<\x14\x12\
-\xc4\x8b\x80\x86\xeby\xf1\x8a\xf2\xe1\xf3}\xaaa\xfa\x12\
-\xc9\xf8'\x17\xb5\xd5\xfa\xf3\xbd\xed\x07\xde\xe8g\xe9\xbe\
-\xb3W\xd4A\x9b\xa39\xa7R\xda\x02RQ\x0d\x1cx\
-\xf1>\xe8\x89\xfa{\xab\xca\xfd\xc53\xea\x83~\xfe\xab\
-rmN\xc2\xcf&\x0b[?\xf5\xd6_\x1e\x85\xe1S\
-Qhn/\x87\xf9\xab\xb3!D{\x1d\xee\x1eJ\xf7\
-\xf5\x85]\xb5H%\xa75\x96;Z\x01e\x9f\xb3\xe3\
-@\x0f\xfc\xc7\x8f\xb7BK]\x19\xeb\xc6\x93=c\x05\
-7-\xed\xcfS9\x0fo?\x08\x09\xfcN\xbd\xa8\x1a\
-)\x02\x90\x1f\xff\xff\xe6\x8f^fN\xd0\xef}\xe9\x12\
-h\xb0r\x0e\x0a\xd1|\x8a\xad\xbf\xb3o\x18\xa6\xcd\xa9\
-\xc8\xd9\xaf\xc9\x94\x01X\x04\x1b\xbfw\xb7\xb6~\xfd\xf2\
-o\xa3\xe6\xb5\xb4\x7f\xd6\x0c\x10\xac\xd4\xdbB~\x80l\
-V w\x12rW\x00\x07\x06\xe0\xc8AF\x01/\xd0\
-\xc1\x17'{G\xcb\xd2#\x91r\xa9\xc8=\xe2\xad-\
-?%\x93:\xd6\xb9\x8dO\xd4^3\xf5\x1c\xadO\x1a\
-_3\xf9c\xb8\xa9\x1b\x16\xdd7\x04Y\xe3\xf1|\x9e\
-\xcc\xc3B}d4\xb8\x91\xee[\xf1|\xc1\x8b\xba\xc8\
-\x91\xc8\x93_\xb03Q\xea\xee\x07Q\xf0\x1d_\x82g\
-s=\xf8\xa0p\xd7\xe7>W\x16I\xa7\xdb]\x8a\x22\
-\xb755u^p\xd9e\x03\xf8\xe5u`\xbf\xcb\xef\
-\xff\xfb\xb2T`oQD\x88\xa6\x11\x044\xde\xf8#\
-\x84L\xc0k\xca\xa2' \x89\xd1\xa4)\xb9\xa9G\x93\
-lJ\x0a\xde&%\x9a\xa5\xa0\xc9@3\x1a\x10\x0c\xc8\
-/ i\x9a\x02\x92\xc4\x22\x04\x14\x1e4L\xa4\x14\xa2\
-\x84\x00\x80\xc2\x8fB\x8fG\xe6CM@<\xd8\xa7\xaa\
-\xa9\xd5\xf3\xa7W-t~\x89\xe1\xde\x18\xbc\xf4\xc8\x11\
-DE\x09\xd6\x91\xf6\xb7\xdas\x89\x1e\xa4KS\x96\xc3\
-\xbe\xe7\xef\x83\xe1HjL5]\xa9\x853k+3\
-'6c\xff\x1bV\xd8\x0f\xed\xf6\xa3\xa3\xb0\xfd\xc9\xe3\
-,\xaf`\xed'f\x82/\xe0\xca9\xab\xd1x\xca\xd8\
-\xb9\xefd\x8a\xcc\x97\xb3\x17\xb6\xc8B\x01\xadN\x8b\xaa\
-\xf4HH\xff\xea\xf2\x859}\x04\xb3g.W\xfb\xb3\
-\x8a\x1d\x8aZ!E\xee|m?\x8cQ\x1f\xac\xd2\x00\
-\x8b\x00\x089\xaf\x11\xe0\x93\x1b\x1ea!\xc2\x9f}\xfd\
-\xa3\x05\x9b\x91d\xceK_\x8c1\x222\x89\x9c\x8b\x1c\
-\x80\x03#qx\xf4\xc1'\x06\xd6\xae]t\x0f\xf7\xee\
-s\x87^\xbe3\x90\x85\x06'`\x00\xac\x04\x97\xb7\xeb\
-2X\xc3{\xc3*\xd0\xb1\x84\x9fb\xf9\x12\x8b\x03\x80\
-\xe5\xd0\xc3m\xb4\xdaEVzO\xee\x15\xee\xe0\xa3\x0b\
-\x82\xb6\x09\x00\xa8\xf6\x98\x1eC:A6\xa4F\xde}\
-\x99\x00\x00\xed|\xd2\xfa\x0a\x82\x00\x09>\x15\xed\x00j\
-{\x16\xcf\x8f\x16H\xe4\x99\xc0\xb3\xff\x87$\xf8\x7f\x08\
-K\xd8\xb1\xf1z\xa5?\xe5\x16\x19\x08t!\x08@H\
-DD\x10\xa8\xf5\x97\xcf\x8c\x8a\xe9\x22r\xedJ\x22Z\
-\x08\xf8\xeb&E@6\xe0\xf2Hb\xda\x90\x91\x09\xa0\
-\xbd\x88\xa6\x01\xfe\xbc\x8c\x09 C@\x00\x10\xb9\x09`\
-Pn\x00\x02\x80\x88\xc2o\x08>4V\xfd\xd1x\xa2\
-\xb1,\xe0^\xd7\xda\x14\x9cj\x7f\x01\x15\xed\xe4g\x7f\
-\xda\x09\xf1\xb14\xcc9\xb7\x1eZ\x17X\xc9/\xa2\x0c\
-\xfe\x96s\xa0\xf7\xe0k\xd0\xd7\xb5/\xdd\x17\xf5\x9cZ\
->\xb7~\x8a4Q\xf7\x1e+\xec\xf7\xcc\x03\x07 6\
-\x9a\x86)\xb3\xcba\xc1\xaa\x86\xec\xe3\xc0\x01\xe3\x95]\
-\xdd}F*U3mJ\x95Y_]RP\xfa\xc2\
-H\xfb\xff\xf6\xdf\x1ec\x13V\xee\xbc\xe9C,\x89\xa7\
-\xe0\xc9\xb3\xfea\xce?\xab\x92+>\x1a\x83c\xbb\xdf\
-a)\xc0\x95MU|\xd2\xaf\xe3\xd2<54\x06\x9f\
-\xff\xf7M\x8cY\xdc\xfa\x85\x8bO\xfb\xe3t\xbe9\x00\
-\x81R7\xd4O\xcb\xcdLd\x0e\xc0=\x9d\xb0k\xe7\
-\xdbo\x9d\xb3\xbc\xfd\xe9\x8cCOt&\xf9\xe4f\x05\
-\x9a\xa6\xd5%\x88\x01\x02)v\xd1\xea\xb6\xc3\xf7\x99V\
-\xdc\x9e(\xbb\x1d\xca\x03\x90P3\x91\xae7\x0dQ\x12\
-\x99`C\x86\xd6\x1bL\xab\x13\xd5\xe7\x1a\x9f4\xbf\xae\
-q\xc1\x974\xb2\xf1)\x96\x9f\xb6l}\xa7\x9d/Z\
-\x1a\x9f9\xf8\xacD\x9e\x89\x04\xff\x8c9\xfb\x93\x82\xff\
-\x9e\x96\xf0\xfc\xcd7\xcb\xd4\xe3\xff\xd5\xd4\x09\xb1h\xa4\
-Z\xa0f \xd4\xff\x8f\xd8\x80;J@\x10\x11\x15\xb7\
-\x1f\x8d=I\xf4\x1aqQE`p\xe3vL6$\
-\xee#\x90\x09\xe8\xf1\x1fAIS\x8e\x002\x01\xc3\xd0\
-<\xa2!3\x06\x80\x17\x9f/\x12K\x94\xa3R\xbfl\
-zC\xe9\xca\x22\xbf;G\x9a\xb6o\xe9\x82\x13\x87B\
-\xe0\xf1+\xb0\xee\xbaY Y\xf6\xb2\xbbj6\x1bc\
-\xdf\xf9\x9b\x87\x0d\xa4\xfe\x9d\x0bg\xd6\xb4\xe2k\xa5\xd3\
-\x1d\x0c\x09\xcc\xdeWO1\xadz\xe1_\xcc\xb2\xb2\xfe\
-\xb2E?o\xec\xef\xedO\xc5\x92>\xf2O\xacX\xd8\
-\xa2Lt\xb5<\xfe\xd2A\xf8\xc9\xe6\x9d\xb0b~3\
-\xdc\xf8\xf1\xe5\x85O\x9cs\x8b@\xc9\xe4\xa6\xdb\xc8\xa9\
-a8u\xf8\x14\x9c@\xd57{v\xb3\xa3\x0d\x19_\
-\xcf\xbd\xf1\x0e\xdc\xfe\xe068o\xe1\x14\xb8\xf1c\xcb\
-\xe1t\xeb\x95_\x1d\x85\xb6E\xd5PY\x1f\xc8\xf9\xe4\
-\xb8\xb7\x196\xff\xf2IS\x91\xf4\xc7\xdb\xda\x1a\x0e\x98\
-\xb6\xe3\xcf2\x03\xec\x9c\x80|\x06\x90\xa1\xf5\x96\xf6g\
-\xc9:\x05\x84\x1f\x1cq{\xc1\xb2\xefu\xa2\xf8\x96\xa6\
-'[\x9fh?Q|\x02\x02~\x8b\xa6@\x0a-\x00\
-\x17Z\x89\x1a\xda\xfc\xc8\xe7I\xf0\xd3\xcc\xce\xcf\xc6\xf3\
-m\x07\x1f\x1a\x85z\x8eg\x1f\xca\x8c\xfc\x8e<g*\
-\xd6\xc9/\xcf\x9d\x5c\xbf\xfd\x12\x1e|\xf0J\x89Z\x81\
-\x1dB\x10\xb0\xbb\xff\xf6\x8fD2@\xe0\x1aK\x08\xa3\
-\xbe\x22!\xad\x8f\x8a\xae8\x01AT,w{\x851\
-\xea\xb4\x8c\xe6\x81\x17o\xd3,q(\xc5\xc2\x84\x82*\
-\xb9\x05\x81\x5c\x8a2c\x00\x03C\xe1\xf5mMe\x1f\
-\xad\xab(\xaa\xca\xff\xf0\xe3\x07F\xe0\xcdg\xba\xd9\xf6\
-\xbc\x95\x0d0}\x1e\xb7u%J\xf8\xa9\x9d\x03\xbb\x9f\
-\xdah\xf6G\xa4=\xf5\xb5\x953\x1a\xab\x02\xbe\xd3\x1d\
-H*\xae\xc1\x96\x1f\xef\x07\xbc\xe2\xa0\x05\xb5\xffYk\
-\xb21{\xd2\xfc\x87N\x8cDB\xe1\xe4\xb1x4:\
-w\xce\xacz\xb3\xa2\xd47a\x90\xf5\xef\xbe\xbd\x99u\
-\x11\xfe\xda\xa7W\xf3r\xe2B'\xce\x86\x00Q\xcc6\
-y\xc4]=\x87z\x18\x08\x1cAfs\xfe\xf2Y\xac\
-\xae\xc1\xb9n\x7f\xe8uxn\xfbQ\xf8\xc4%\xf3\xe1\
-\xcfW\xb7Ox<D\xc4\x1f\xff\xe1\xdb\xb0\xe6\xa3\xad\
-\xac\xfd\x99\xbdl\x07\xe0=w\xdc\x07g\xcd\x9fqg\
-\xb0<0b\x03\x00\xb3\xf1\x0b\x01\x80\x95\xf5\x0b\x19a\
-\xa7o\xcc\xed|\x93\x95\xe5Z\xd5\xbcbV\xc3\xdb\x94\
-\x9f\x02\x7f\x22s\xeeq\xad\x8f\xccA#  \xcdo\
-\xeaY\xbaO\x8f\xc9L\xfbs\xadO\xffQL?i\
-9\xf8H\xe3\x17\xb9\x8b2\x0e\xbe\xd8\xa8j\xb8*s\
-=\xfb~\x88\x19\xf9\xb1\xfcI\xc1\xff\xdd.\xc1\xbc\xf9\
-f\xd1n\x06\x0a\xb0\x0a\xec\x89?\x81`\x14\xefO\x07\
-2\x0d\x06C\xb9`\x10@0H!\xbe\xd3<\x00\xc3\
-\xd11\x88*\x07\xd3i\xd5\xad\xc8\x8aK\x97L\xcf\x9b\
-\xfb\x8e_\xbe\xb8\xbd\xee\xca\x86\x8a\xa2\xa9H\xa3\xc7i\
-\xef]/\xf5\xb0|\x7fo\x11j\xff\xbfhg\xf5\xfe\
-\x8a\xbf\x02|\x0d\x0b\xe1\xf0k\x8f\xc2\xd0P\xff\xdb\xba\
-TT5gZe\xf5\x99\x0e\x84\x92\x87\x8e\xef\x1bf\
-\xda\xff\xa2\xebfer\xfei\x0d\x84b\xe9#=c\
-;\xb4D\xa2\x1dM\x08?i\x7f\xda\x9f\xef\x1c\xa4\xd5\
-\xd95\x04_\xfd\xaf\xa7Y)\xf1\x0f\xfe\xef\xe5\x05\x0b\
-\x7frv9\x01\x00\xd7\xd1\x9dG!:\x16\x87\xc3)\
-\x1d\xae\xb8`^\xee\xb4`\x5c7|{\x13\x9c\xec\x1f\
-\x83\x7f\xfa\xd4*\x96\x070\xd1\x1a\xee\x8b\xc3K\xbf8\
-\x0c\x1f\xfa\xdb9l\x9c\x97\xbd\xc8\x01\x18\x87\x00\xdc\xf9\
-\xfd{\xf5\xf5\xeb\xcf\xbe\x95\x9ctL\xab;\x01\x80;\
-\xf2X\xf9\xbf\x00Y;\x9fQ{\xb4\xf4%Qdv\
-\xbd\xc9i\x0bjr+I\x87J~\x04\x83;\xf4P\
-\x98m\xad\x8f\x07\x99\xd5\xf8\x94\xc8+\x88\x96\xd6\xd75\
-r\xf0\xc9\x1aQ\x7fn\xe7\x1b^Icy\xfb\x0e\x07\
-\xdfx\xcf~\x09\x0a\xbe\x96\x15\xfcv\x14\xfc\xd0\x99c\
-\xf9\x93\x82\xff\xfe/\xd6\x14\x946\xec\xc6\xa0\xd4\x12|\
-%\xde\xa7y\x00\x94\xa2C`\x00\xa8\xa8\x02}\xb9\xcc\
-\xc0\xe90,\xb6z\x06\xba$^>\x9c\x06\xd5M\x13\
-\xcbM\xcd\xf0\xa2>\xf7\x9e\x18\x08M\xf1(\xc2\x92`\
-\xb1\xa7#\xe0SZ\x9b\xaa\x8b\xab(\xa9f\xe0d\x14\
-\xb6>z\x04\x96\x5c<\x05\x1ag\xf0\xe2\x1d\x14\x8e\x88\
- Jzd\xe8x<\xa4\x95\x86\xce\x9eS\xdfq\xa6\
-\x83\x18\x1dL\xc0s?\xefd\x9a>_\xfb'S\x9a\
-\xf9\xc6\xc1\xbe]hy$\xc3#\xe1\xb3\xe7u4d\
-\xba\x0c\x15Z?xx;<\xf3\xfa\x11\xb8\xea\xc29\
-p\xf5\x85sN\xff\xc1y\xc2Ok\xdf+\xfb\x80\xcc\
-\xdb\x11Y\x86\x8bV\xe4\x16\x0eE\xe3i\xb8\xee\xe6_\
-\xb0\xef\xf9\xc3\x9b.\x87\xcaR\xff\x84o}pG?\
-\x9c8\x18\x82\x0b\xae\x9d\x99\xb3\x9f\x1c\x80}CQ\xd8\
-\xf4\xd8\x96\xd0\xaa\x95\x0b\xeer\x02\x80S\xd3\xdb\xda\x9f\
-i|[\xf8Q\xf3K&\x17~\x9b\xde\x1b\x86\x8e\xf6\
-=\xd7\xf0\x06\x13x\x812\xfc-\xcdn\xa2\xc0\x0b\xcc\
-\xc6\xb7\xb5\xbc\xa9\x89\x8e\xfb:\xb3\xf7\xb9\x9d\x8f\x16\x80\
-\xa5\xf5\xb9\xad\x8fv>~T1\x09\xff\x049\xfb\x05\
-\x8bu>`\xb1\xfc?\xf6%X-\xdb\xd9@\x10\xda\
-\xb1\x01x{p\xfb\x0963 \x13\xc1\x06\x84\xfcY\
-\x01,\x89H1$-.*\x04\x02\xd4:L\x10E\
-7\x1a\x8b\x1e\xc9\xa0p\xa0\xe1e\xfe\x00\xb2\xfcD\xf0\
-\x1c\xeb\x1di+\x0bx\xda\x8b\x5cRk\xe8p\xa4\xf5\
-\xdcK\xa6\xc9\xc3c\xc9\xf8\x91\x93\xa1\x9d\x08\x1c;\x03\
-~\xb76\x14\x8a\xb6/\xe9\xa8\xb9\xc0s\x86\x92bZ\
-\x94?0\x88`B\x0c\xe2\xa2\xbf\xc8\xd5\xfe[w\x9d\
-8T\x1e,\xda;\xdc\x1fZ\x812Rq\xce\xa2\xa9\
-\x13\xfa\x11h\xfa\xf0_m\xf8%$\xd3*\xdc\x81\xda\
-\xbf:\xe8?\xfd\x07[\x05G\xf6RS*\x1cx\xed\
-\x00\x1b\x03\xa6T\x94\xc0\xd9s\xa7\xe4<}\xc7\x81S\
-\xf0\xf5{^d\x8d>\xee\xff\xd7\x8f\x9c\xf6\xad\xb7>\
-v\x94\xb5.[\xba\xae9g\x7f\xd2S\x0f\xbbw\xed\
-\x87}\xbb\xf7\x1dZ\xb6\xac\xe31;\xd4\xe7\xd4\xf4\xa4\
-\xf9\xc1\xaa\xc6\xcbx\xf4\x05\xe6\xfd\xe7\x9e|\x0e\x10:\
-\x17|\x1e\xbe3P\xc3\x8b\xb6\x90\x13\xbd7l\xdb\x9e\
-\x0b\xbd\xe9\x10z\xca\xe2#;\x9f\xc5\xf3\xa9K\x0f\xee\
-K2\x1b\x1fY\x84\xc3\xb3o\x87\xf4\xa8\xf3\xee\x89\x09\
-\x8bu&\x05\xff\x7fse\x06\x83\xd8\xcb\x1e\x10\x92\xb9\
-\x8f\x7f\x0fY\xec\x80\x96\xd3_\xe0\xec#\x18N\xc7\xe5\
-\x84\x9e\x92K\x90\x09\x18n\x84\x04]q\x09\xa0\xb9\xf1\
-j\xa3\xf9\x89\x1e\xe4\x90\xe4\x10\xf4\x08V\xa2\x10~\xb2\
-\x1b\xf5\xa7\x92J\x9b\x9e\xfe\xd0X{\x91\xdf3P\xe6\
-\xf7&\x0c\xd1\x94\xfb\xfbG\xeb\x83%\xae+K\x8b\xbc\
-D*\xe3\x1a\xfe\xa5\x911\xaa*\xfeiz\xb2\xbc\xc4\
-3\xb3\xb5\x91W\x1cR\xd8o\xdb\xe6c\xec\xbb\xe5k\
-\xff\xb7:\xfbN\xc9\x8a\xfbEC\xd3\x82#C\xa1u\
-\xb3g\xd6\xb1\x9a\xfe\x89\xd6\x0b;\xde\x81\xef\xff|\x1b\
-\xccA\xbb\xff\x96\xcf\xac9\xc3\x99\xcb\x15~Z\x91\x91\
-\x08\x1c\xdbs\x0c\xfa5\x03\xea\xa7\xd6B{^i\xf1\
-\x03O\xee\x86G\x9e\xdbw\xc6\xf7'\xb1\xfd\xd5\xc6\xb7\
-a\xe6\xe2j\xf6\x97\xd9\x8f\x86y\xc2\xdb\x04\x8f?\xb2\
-\x19\x0c-\xf9\xdc\x82y3v\x90G\xdf\xc8\xb7\xf3\x89\
-\xfaS\xd1\xad\x00\xdc\xa9\x07\x02M\xfbd\xde|&\xf0\
-\x92M\xef\xa9EGV\xebS7>\xd2\xfa\x12\x90\x87\
-_R\xc1\x12zC\xcf2\x00\xb2\xf3Q\xe1k\xb6\x83\
-\xcf%RW\x10`4\xdfN\xddMD\xb29\xfbv\
-,\xff\xdd\x09\xfe\xb8\x90\xde\xa4\xe0\xff\x8e\x97\xe0\xbc-\
-\xd0\x1f\x93-'(8g\x08\x90\xbf\x80B\x88\xfaH\
-J\xb2A@\xd6]rZ\x8a+\xd4S\xca\xa5\xe8.\
-5\xad\xbb\x05At\xb3\x92\x0e\x01\xaf\x09*\x1f\xb6\x0a\
-\x89(\x16\x8f\xd7\xa9B\x0d\x9d%\x8a\xa5\x81A\x99\x85\
-r\x22\xa5\xb9\xa9\x81&\xd5\x8f\xa2V\xe2\x8dUL\x13\
-\xd9+\x9bB/\x86F\x93e5\xe5\x9e\xab\xa7\xd6\x95\
-\x96$c*l\xbeg\xdf8\xed\x7f\xbc7\x1c\xee\x1d\
-Io*\x0e\xb8\x93\xc3\x03#k\x91\xfd6\x9d\xbbx\
-\x9ax\xba\x93q\xd3\x1d\xcf\xc2\xfew\x06\xe0\xc6k\x96\
-\xc3y\x0b\xa6\x9c\xe1\xcc\x8d\x07\x80\x81\x13\x83\xd0w\xb4\
-\x975\x01Y0\xaf\x05\xea\xf3\x1a\x8b|\xed\x07\xcf\xc2\
-\xbe\xa3\x03,\x05\xf8\xe3\xeb\xe6N\xf8\xd6\x14\xff\x7f\xf1\
-\xa1\xc3\xb0\xfc\xf2iP\xdb\x9c-\xab0D\x0f$\xdd\
-5p\xd7\xf7\xef\x81E\x8b\xda6\x96\x96\xf1v[\xdc\
-\x99\xc72\xc8r\x84\x9f\x1cy\xac\x97\x0e+\xb9\x15\xac\
-\xcc<6OK#\xadO\x02\x8eV<\x9a\x02\xa2\xca\
-\xedz\x83\xd9\xf8\xa2$\xab\xa6\x9e\xd5\xf8\x86fX\xe1\
-=n\xf3\x13\xcd'\xba\xcf\xbc\xfb\x96g\xbfPH\xaf\
-H\xaa0Rc\xa1\xbc$\x9eI\xc1\xff -\xe1\xdd\
-<\x96\x0b\x0c\xd6\xc4`\xcbq8\x08\x95l\x90\x88\xee\
-NI\x99\xc6\x22~\xb7\xecN\x08T\x18\xa8$\x10\x04\
-\x5c\xba\xe9B\xcd\xed\x06Ivek\x08L2\x13d\
-\x12z\xc3\x14e\xb4Ed\xca\xa7\x03\xd63\x9a:F\
-\xe1-\xdd\x07\xd6\x15\x1c\x01\x80\xee\x9b\xb8\x9b\x8a\xd5A\
-L$\xd3>]S\x17W\x97\xfb\x17\x1ex\xb2'\xd8\
-\xdc\x11\x84\xf6%\xdcc\x1f\x8a$\xd3\xbb\x0e\x0f>Z\
-]^rJU\xd5\xf2\xe1\x81\xe1\xeb\xa8\xda\xaf\xae\xaa\
-x\xc2\x83\xed\x1d\x8a\xc0g\xbf\xf9\x04\x8b\xf9\xdf{\xf3\
-\x9fg\xba\x09\x15>3\xe3\x85\x9fV\xf7\x81\x13\x10\xee\
-\x0f1\x07\xe0\xba\xf3:r\xf2\x07\xc8\xc0\xbe\xf6\x9f\x1e\
-ff\xc6W?\xb5\x0a\x16\xe59\x00\x89\xbf\xdb\x0eC\
-\xb2\xff\xf7\xbf\xd6\x07\x97}f\x0e(\xae,f\xa9r\
-\x09\xc4t/\xdcy\xfb}\xfa%\x97\xac\xf8\x8fL\x1c\
-_\x10y;~j\xba\x99\x1d\xc9\x97I\xd1\x05\x96\x9c\
-C\xe9\xb9(\xf8d\xd7#\x00\xe0\xb3\xd8-iu\x05\
-\xb5\xbd\xc6\xec}\xd4\xfc\x92\xa4r\xdaohnY\xa6\
-p>n\xa3\xb6\xb7\x0av\x88\xea\xbb\xfc*w\xf4\x15\
-\x08\xe9M\x9c\xc43)\xf8\x1f\xc4uF\xfb:\xff\xf9\
-\xb6\xe7\x9cX\x01\x07\x01>M\x88\x99\x03\xb5.\x91@\
-\x80z\x0b\x8a\x08\x02*\x82\x80\xc6\x1c\x83\xa9LWa\
-J\x18r\x99\x92\x8c2\xa2\xc8\x0a\xa0@s\x000\xa9\
-\xa1\x8c\x08\x12\xb5\x88\xa3\xcc\x1a\xc9\x02\x026N.\xc3\
-\x02h\x12\x97\xc1\x00\x80\xa5\xbdP\x05[ZW\xfa:\
-CWN\x9d\x1bl\x98\xd6\x10\xac\xd7\x0d\xc3|\xe1\xad\
-\xee_\xd7W\x05_'6140\xfc\xe7((\xb3\
-\xcf]<U\x10\x84\x89\x0f\xd7\xa6\xe7\xd4\x94\xe4\xd3W\
-,>\xc3Y(\x0c\x00\x87v\x1c\x86x,\x09\xef \
-\x03\xb8bmn\x89\xf3\x91\x13#\xf0\xe5\xefma\xdb\
-?\xba\xe5\xc3\xac\xe1\x87\xbdb\x09U?tr$\xba\
-`F5\xa3\x0c/\xfe\xe20U\xcb\xc0\xf9\x1fk\xcb\
-y\x8f\x94\xab\x0a\xbaz\x86\xb5-O<\x938\x7f\xed\
-Y\xb7So\x1d[\xf8\x81\x85\xf2x,\x9f\xb7\xdd\x03\
-\x16\xbe\xe3\xb5|h\xc5\x93\xb0\x1b\xa6\x86_^CS\
-L\xb5\xe9>\x9eH\x95\xe5\xedK\xc0\xb4\xbe(#\x00\
-0\x8d/e\xa8~\xcaHg2\xf8\x12ZB\xf7\xb9\
-i(\x07\xe8\x09\xaa\xfeM\x97\xe9\xef*{oR\xf0\
-?\x90\xeb\xb7\x05\x80\xcc\xeb\xcc\x02 P\x89 p\xc2\
-\xaf\xb3\xb4AV^\x8c  9\x86\x8a\x08Ve!\
-\xaa\x1a\xca\xf6\x954\x14|\xd2\xf8x\x89J\xa8\xadP\
-\xd0M\x9a\x1c\x8d\xc2O]\xadYG\x0c\x89\xf5\x8ea\
-\xf7\xd9Ti\x1a/'r\x16`\xe05MI\xf0\x06\
-\x9b?\x81\xb6\xa900\x12Y\xa8\xebjceE\xe9\
-\x162\x1dT5]\x86\xf4\xff\xa6`0\x90\x98\xd1T\
-\xe1\xf5\xfb\x5c\x13\x9a\x00\xd4\xa1\xa8\xab7\x0c\xdf\xbaq\
-\x1dLo\x08\x9e\xf1\x04\xc4\xe2i\xc3\xf9~\x14\x7f\xdb\
-\xbbu/\xc4Q\xe2\x22\x1e7\xac]\xd6\x9a\xf3\xfcM\
-[;\xe1\xde_\xbd\x095\x15Ep\xc7W.\xcby\
-\xac\xb3{\xa4\x87L\x9c\xb6\xe6\xf2\x9atR\x83Mw\
-\xed\x85i\xf3*a^^\x0f\x83\x84\xa7\x11^\xdd\xba\
-]=\xd9\xdd\xd5\xb7t\xd1\xac\x1f\x9bV\xba\xae\x08\xdc\
-\xb9G\xb4\x9f\xdaw\x08\x14\xb7wh}j\xc7\x89g\
-\x8c\xd1|r\xee\xd1\xa9a\x82o\x03\x00\xc5\xf6MP\
-9\xdd\x972\xe1=\xf2\xec\x1b\x96\xe0\xf3\x90^B\xa7\
-\xa6\x1cvHOL\xa3\xddo%\xf1L\x0a\xfe\x1f\xe6\
-\xfa\x9f\x02\x805):k\x0e\x84Be\x229\x06+\
-\x9b\x11\x04\x868\x08\x08V\x88\xd0Y]H\x85E\xd4\
-9\x92j\x09\x90t\x226\xa0Y\xaf\xa5h\xf6\x8cH\
-\x82nR{H\x0b\x0cL\x1d\xc1\x00%\x9b\xd8\x01\xaa\
-3\x09/R\x91\x12\xd6\x89\x12\x18\xc4\x00D\x9a\x1fM\
-`\xc0\x01A\xc4m\x91\xde\xd9`\xe6\x82\x1c\x1a\x0c_\
-\x8d&\xc0\xf2\xca\xaa\xf2\x7f\x1e\x1cK\xf8P\x036\xf9\
-\xbcRuU\xa9w\xc1\xd4\xba\xd2L\xbbr\xa2\xdf\xdf\
-\xb8\xefe\x88\xc4R\xf0\xcd\xcf_x\xda\xe3N\xab\xba\
-\xf1\xfa\xfeS{\xa7\xd5\x97\xb6\xd5U\x14e\xd4x*\
-\x9e\x82\xce\xed\x9d0\x82\x22\xe7\xaf)\x83\xc5\x1dM9\
-\xaf\xfb\x8f\x9f\xbc\x02\xbf\xd9\xdd]0\x03\xf0\x8d\xfd}\
-\xaf\x15\xf9\x95\xa6\x99\xcd\xe5\xf5\xdd\x9d!x\xe3\xa9.\
-XvIKN\x0a\xb0\x89\xd6P\xc2\xd3\x00\x0f\xfd\xe4\
-\x17PR\xea\xdd6\xb3\xb5\xe1i\xea\xe4\x01V\x0c\x9f\
-\xd1z;iG\xe0\xda\x9d\xb4<\xbe\x92l\x7f\x95\x1e\
-\xe7\xb7\xa8\xe5\x91\xf2\xe3yRUF\xf9\x11\x00t\xee\
-\xe0\xf3\xc8\xb8\xad\xe6z\xf6\xdd~Yc!\xbd8s\
-\xe7\xea\x99\xf2\xdc\x91l\xff=;{o\xe2\x0a\xbdI\
-\xaf\xfe\x07u\xfd\x8f\x01\x00\x1c,`\x03P\xb4\xe0E\
-\x91\x8d\x18\xa3\xa9\xc21\x0e\x02\xf6`QJ#\xb6\xc7\
-\x89Sa\x91\xe6M\xb1\x9a\x02\x94k\x91\x0a\x8cPu\
-\x89\x8aK\x13)\xa5L\xa6\xc2#\x9d@C\x1493\
-\xa0\xfe\x16T\xc1\x82\xc4UP%\xd4^\xd4\xdcZ4\
-5\x8aZ\x89\x0c\x00\xf0z\x15\x15\x8ai\xe1\xf3\x91>\
-0\x00 \xd3bt,\xba\x0c5^Qi\xb0d\x1b\
-9\x1aM\x01\x14\xd4\x8e\xcaX4Q\xe6\x96\xe12|\
-}4\x96L\x0f\xc5S\xc6@\x91W\x0eT\x96\xb8\xaf\
-D3\xc2=\xd1\x01\x87\x22\x89xgW\xe8\xc5\x94\xa6\
-++\xe77^\xe0|ltp\x14\xba\xf6uA/\
-\xb2\xe2\x96\x19\xf5\xd0\xda\x5c\x99\xf3\xda\xbf\xfe\x97\xc7`\
-d4\x0e\xd7\xa3yq\xf1\xf2lq\x11\xd1\xff\x9d\x87\
-G\x1e,/\x91\xce\x99\xd5\x5c\xd1\xb4\xfd)\x9e\x1a}\
-\xd9\xf5\xb3Y\x18\xd0^\xba\xe4\x87\xa4R\x0ew|\xe7\
-Ns\xd6\x9ci?mi\xac:\x84\x87\xcf\x84\xde\xa9\
-\xf5\x89\xce\x8b\xa8\xe5\x11&U`\xda\x9e\xe8>\x0a=\
-\xde\xa7F\xc2\x06\xd3\xf8\x04\x022\xd3\xf8\x5c\xf3s\xcf\
->\xbeFs\xa5u\x16\xc7O\xe8<\xa4\x07\xa8\xf9\x8b\
-=\xceX~6{\xef\xcc\x82?\xa9\xf1?\xe8\xeb\xbd\
-\x00\x00{}\xc6\x14\xd8\x87\xa6@\xc7\xa0p\xc8\x02\x81\
-\xd8~k\xce \x84\xc4t\xd0%\xfauE$ \xd0\
-\x8c\xb8X\xea\xf2\x08\xaaU\x5c$\xa7]x\xe5\xa6D\
-\x1b\x0c\xd0\x98D\x10@nI\xdb&y\x09\x11\x14\x90\
-%\xe8\xa6\xca\xee\x13\x10 \x03\x15\xd8-2\x00\xdaG\
-L\x80X\x01c\x03\xd46H\xe4&\x83AE\xa7\x92\
-)\x8b$\xfcT\xb2,\x09\xd6\xb6\xa1\x90\x83Q$\xbf\
-\x82\xe5`\xa4\x86\xf5\xd1h\xb2\xb5}J\xf0\x9a\x80W\
-\xf1\xe4\x1fhw\xffh\xdf\xa9\x91\xc4\xa6b\x9fwD\
-SS\x97\xcc\x9d^\x95\x93\xa0\xd4w\xbc\x1f\x06\xf0\xef\
-x\xda\x80\xa5\x8b\xa6Au0\xeb\xbd\x1f\x0c\xc7\xe03\
-\xff\xfa+\xb6\xfd\xed\xbf_\x07\xd3\xea\xb3&Fg\xd7\
-\xf0I\x1d\xe4'\x0c=}QGK\xe5T\xa2\xff\x1e\
-\x9f<>\x01H\x09\xc2PD\xd7~\xf6\xdf\x0f\xa7\xce\
-]5\xff\xd6\x80\xc7\x9d\xe4\xde|\x1e\xca#\xe1ft\
-_ \x8d\x8fBn\x88\x8c\xf6\x8b\x96\xd0\x0b\xe4\xd9\xd7\
-\x0cF\xf9\x0d\xd4\xf4\x86\x15\xcb'\xc1\xf7*\x8a\xea\x0c\
-\xe9%H\xf0\xad6\x5cv,\xbf\x90\xe0\xdbi\xbb\xef\
-\xa2BoR\xf0?\xa0\xeb}\x01\x00gd\x802\x09\
-\xeda\xa3\xce\x84\xa1D/\xaf2T\xbc)\x81\xd2\x88\
-\x95dZ\x88\xbb\xbd\x82\xecR\x05mLB!\xd7\x90\
-\xb7J\xa2\x84\xb7.b\x05\xb8\xad\x9b\x1c\x18|2\x12\
-O\x0b\x14$\xc9`\x01)U\xd2\x99\xf0\x13\x18\xe0N\
-\xb6-\xa1\xcaR\xc9_\xa0SM\x91\xccz\x16\xa01\
-\x22\x8b\xba\xc6\xaa\x15)\xea\xc0\x06GS\xc4\x01\xc1\x80\
-\x9c\x84\x88*\xf8Nh^\xd0\xcc!\x04\x81d\x225\
-\xab\xb5)\xf8)\xbfGf @\xc7\xb7\xf7\xe8\xe0.\
-\xd5\x10\x9fp{dMM\xebJy\xb1|ccU\
-q\xe0\xcd\xce\xbewZ\x1b\x83\xcdE>\x97t\x1c\xb5\
-\xff\x18\xb2\x80\xce\x94\x0e\x7f\xb6z\x8e\xd5\x9c\x84\xaf\xad\
-\xbb\xba\xe0\xbb\xf7\xbf\xca\xf6Q\x02\x90\xb3\xa2q\xfb\xfe\
-\xbeW\xfd~\xef.0\xd2\x17T\xbb}\xad\x94\xfe\xdb\
-2\xa7\x02\xceZ\xdd\x90s\xa2)\xff\x7f\xdf\x81c\xc9\
-W^zmx\xed\x9a\x05\xdf'\xff'\xd1{\xd3\x8a\
-\xe1\x0b\x80\x87\x8e\xda\x9e\xbc\xfbh\x9b\xa9\x86e\xe7\x13\
-\xed\xd7x\xe5\x9e\x9a\xb1\xf7\x89\xeak\xdc\xc9g\x8aD\
-\xf1\x93,\x83\x8fb\xf9B^\x12OT\x9a8_\x7f\
-\xbc\xe0OR\xfd?\xb4\xf5^\x01\x80\xbdG\x0e\x08\xe4\
-\xe5\x09\xd8\x99\x83\x85j\x0a\xdc\xd1\xa4\x10A@\xa0\x22\
-#\xc5\x9d\x16\x08\x14d\x04\x05\x15Y\x82d\xb1\x049\
-M\xc0 \xd2\x98\x12!-#7\x8d\xa7EIF\xe5\
-\xa6\xba\x04U\xd6Q\xb1\xa1\x5c\xab\x14\x94&\xbf\x00^\
-\xdb.jP\xc5Y\x00\xc2\x8cD\x0eG\xbc\xfc\x15\xd4\
-\xf7\xb2\xa9\xeb\x8a\x8co\xa9[]\x8d\x9c\xceE\xda&\
-\xe7\xa2\x81\xdbc\xb1\xf8\x82\xa5\x1d5\x9fO\xa5uu\
-\xd7\x91\x81M%\xfe\xc0\x0b\xecy\xf8\x9cS\xfd\xe1y\
-\xcb:\xea\xae\xde}d\xe0\xc5\xd2\xe2\xc0+(k\xd7\
-v\xb4T\xcc\xe8|\xbd\x13\xe2\xc94t\x1b\x00\x97\xaf\
-\xceM!\xbe\xeb\x97;X\x07\xe0%\x1d\x0d\xf0\x95\xbf\
-\xccv\x16f\xf4\xff\xd0\xd0\xfde\xa5\xbeQCK\x9f\
-\x0f\x03Z\xc7\xa17\xfaa\xc9\xba)\xd0\xd8Z\xea<\
-\xc5\xac\x05\xd8S\x9b\x9e\xd5N\xf5\xf7\xef_\xbdb\xee\
-}\x8c\xee[Z\x9e\xbc\xfbx\x86P\xd3\x03\x13x\x11\
-\xedz\xc3!\xf0zf\x1b5\xbejy\xf7\xc9\xcbo\
-\x09\xbf'\xa0hvy\xae\xa0\xda\x82\x9f\x9b\xb6\xeb\x14\
-\xfc\xfc\x0a\xbdI\xc1\xff\xc3]\xef\x0f\x00\xd0\xbf\x0e\x10\
-\xd8\x00<\x9d\xd8\x99FL\x8c\x80\x9eaW\x1bNi\
-FjL\x800V&@-\x00\x07\x85\xa4@%\xc8\
-\xc4\x12\xa2V\xe5\xa1B,!\xa9\x0a\x0a2\x85\x04\x82\
-\x82\x9c\xd2\x84$\x82\x81\x1f\xfc@\xe0@\xdb2J\xbd\
-\x16O!0\xb8\x04\xbbi\x09\x8a\x00s&\xa2M \
-S/C]\xe6\xb7\xc4\x0ad\xa4\x0c<\xdch9\x1b\
-)\xf2@&\x04m\xa3\xc4\xf4\xf4\x0e\x9f\xbb`f\xcd\
-\xb5\x87\xba\xc3w\x97\x95\xf8\xf7\xdb\xcf3tQ>\xd4\
-\xdd{iuY\xd1\x91\x92\x22\x7f\x171\x86\x91\x91\xc8\
-\xb2\xe5s\xeb\xae\xa4\x08@\x0c\x85?\x15\xf0\xc1\xaa\xc5\
-\xd3sN\xd0\x17\xbf\xbb\x05\xde\xe9\x19\x81\xcf^\xb5\x14\
-\xce_2-\xb3\xbf\xb3{\xb8K3\xe4G\xa9nG\
-\xd3\xd4\xf3\x07^\x1f\x997:\x94\x80\xf5\x9f\xea\x00\xaf\
-?\xdb\xc2\xdc\xd9\x02L\xf2y\x9e]\xb5t\xe6#f\
-\x9e\x9d\xcf\xb4>\x13t\xee\xe0c\x1d\xfctC\xa3&\
-\x8f)\xd4\xf6\xcc\xc1\x87T\xc8H\xf3D\x9ed^\x12\
-\x0fe\xef\x95\xf9\x05}R\xf0\xff\xb4\xd6\xfb\x01\x00\xec\
-}\xf2A\x80\xb66@\xb6\xae\xc0\x09\x06t?Sh\
-\x04\x1c\x14\xe8\xd6\x8b\xc00X\xccA!\xe4O\x08\x9e\
-XR\xa09jc\xc8\x148( Kp\xfb\xd9s\
-\x89-@\x09\x80\x9c\xf4\x0aq\x04\x07%\x89\x8c\xc1L\
-\x88dFd\x1d\x8d\x1e\xd6\xca\xcc\xd9\xc1\x88&T\x12\
-(p_\x81\xcc\x05\x9b\x1c\x8c\xba&Q,\x91\x00`\
-\xcf\xe1\x9e\xcb\xeb*J\xde*/\xf6\x0f\x81\x15\x92\xb4\
-\xf3\x12\xd0x\x96\x15\xc9f\x0d \xc5\x93Io\xb5_\
-\xfe\x97\xd0\x91\x1e\x1f\xb5\x01/\xab/\x87\x053\xb3\xf4\
-\x9d\x06\x8e\x5cs\xd3\xc3\xcc\x94\xa0\x04#gy\xf0\xeb\
-\xfbz\x9f/\x0a\xf8vPAO<\x1c]\xd7\xfd\xd2\
-\xc0<\x7f\x89\x9b\xf5Ep.\xaa\x00\x8c\x99\x01\xfd\x87\
-\xffyO\xba\xb4\xae\xfa\xd1s\xce\x9a\xfe,\xb3\xe5m\
-\x07\x1f\x0a\xbe!I*\xd9\xfe\xb4\xad[\x9e}\x02\x02\
-n\xe7\x93\xb6\xd74\x8a\xe5\x1b\x12\xd7\xfaN\xc1/\x94\
-\xb6kW\xe8M\x0a\xfe\x1f\xf7z\xbf\x00\x80\xbdWn\
-ym\x16\x08hm\x80\xdc\x9a\x02Zv\xe5a~\xb1\
-\x91\xb3\xfa0\x9f)\x84\x90)Pv\xfc(\x82\x03T\
-\x02\x10c\xe0f\x04\x07\x072%\xd2\x06\xefb\x04\x8e\
-vf&9\x06U\xde\xd7\x909\x09-3\x81\xc2\x8f\
-\x14U\xa0m\xeeG\x10X8\x92|\x02\x19\x96@m\
-\xf4)Y\x89e'R\x96\xa2\xc4\xc0\x803\x03\x90\xf4\
-\x91\x91\xaf@8\xd2Jm\xc0\xeb\xa7T\x1bsg\xd4\
-f\xf2\x03\xf6\x1c\xe9\x87\x0d\x1b\x9f\x83\xb6\xe6\x0a\xf8\x86\
-#\xc4H\xf4\xff\xcd\xce\xa1;*\x90\xfeS\xfd~\xef\
-\xfe\xa1kB\x87\x22\xd3\x9ag\x05a\xd1\x05\xb9!\xc4\
-\xb4\xab\x12\xbazGc\x9b\x1f\xfduwy}\xf53\
-\x0b:\x1a\x7f\x83\xdfG\x15\x99\xe6\xe7\xda\xde\x8e\xe3\xeb\
-\xa6\xac:\x05\xdf\x19\xcb\xd7EU#\xc1g\x13tU\
-\xb4\xa6&\x05\xffO~\xbd\x9f\x00\x90y\xbf\xc25\x05\
-\xb9\x80`\xaf\x0d\x90\x0b\x0c\x1c\x14V\xb1\xed\x1cP\x00\
-b\x0a\xbcG\x01-\x06\x0exK\x8c\x81\xee\x93o\x81\
-\xc0\xc1c5/\xa9F\x13\x22U\x1c\xa5\xd6e\x22$\
-\x08\x08x\x17#\x17\x11\x01\x12v\x14|2\x13\xec\xf0\
-\xa3\x1dq0X\x182-\xc9,\xff \x9b\x93\xc0\x1c\
-\x8a\x08\x02RN\xb6\x22\xbe\x8ff\xca\xa3\xa1\xd0\x02=\
-\x12\xfd\xf8`Jm\xf2\x95\x94|\xb7\xa3\xa5\xe2\xaa\x86\
-\xaab\x96\xc5\xf3\xf0\xb3{\xe1g[\xf6\xc05\xeb\xe7\
-\xc1\x87\xd7d\x03\x07H\xff\x8f\xea\x86\xfc#\xc1j\xe7\
-=\x1a\x8e_\xdc\xf7\x9b\xa1s\xe6\xafj\x80)\xed\xb9\
-\x89H\x09w=l\xdb\xb6+\xba{\xd7\xde\xb7\xa6\xb7\
-M\xb9\x7fZCy\x1fu\xe7g\x1a\x9fe\xf0q\xc1\
-g\xe1=YQ\x15Ug\x1a\xdf\xc8d\xef\x09\xba\xa9\
-%\xf4\x227\xa0\x8dO\x82\xcf\xd3v\xdf\xbd\xe0Oz\
-\xf5\xffX\xd7\xfb\x0d\x00\x13\xbe\xb79\xe1\x1d\xbe\xe3t\
-l\xc1\xc9\x14h\x156#r\x1b\x98$u\x8f\xe8q\
-4/\xc9oiF\x8eE\x16~\xf4H\xa2\x12G\xcd\
-\x1f\xd0\x05\x8a2\xc8\x16\x18P\x92\x12OV\xb2\xc2\x8a\
-\xac\x13\xb2$\xdb`@X@y\x0a:\xf3)\x80\xd4\
-?\x1c\xee\x18\x1d\x8b\xaem\xae\xaf\xb9?\x9aL\xb7\x9c\
-5\xa3\xe2\x1f\xbd\x1e\xc5\xf5\x9d\x07^\x85Wvv\xb1\
-\x09@M5<\xb1\x87\x12\x8f~\xb3\xa7\xe7\xf1\xb2\xd2\
-\xa2\xadv\x0b\xafh,\xbefx{\xf8\xd2s?4\
-\x15\xc8\x0c\xc8\x9c\x19Ab\x19\x80\x8f\xfc\xec1\xb3\x7f\
-$\xfc\xd0\xc5k\xcf\xfa\x91\xe0\xd0\xf8\x14\xcfO\x93\xe0\
-\x1b(\xf8V,?\xa5\xa7y]~&{\x0f\x05?\
-/_\x7f\xd4Q\x93\xbf\xc2\xddhL\x0a\xfe\x9f\xe6\xfa\
-]\x02\xc0o\xf5\x1d\xc6w\xe7\x19\x0f\x0a\xf6\xca7%\
-N\xdb\xb3\x00M\x07\x97?!$\x0dE\xb4C\x90\x04\
-\x06g\x0a?*xK\xceDJL\xb2M\x06;\xaa\
-@\xf7\xa9=:MJ!\xb3\xc0\xaeg \x84\xd0M\
-S\x16LA\x8e\xc4b\x97\xbad\xa9\xf6\xc1\xa7\xf6\x94\
-\xf6\x0fGf\xddy\xd3\x87\x8a\x87#\xf1\xd8\xa9\x81\xd8\
-\xdb\x83\xe1\xf8\xce\xba\xea\xb2\xfd\xb2h\x8d\xe72\x053\
-\x86\x00\x00'S\x1fYrQn\xfd\xbf.\xf9 \xa9\
-T\x9a\x1bo\xbb\x0b\xa0(\xf0\xb5\x8bVtl\x15\x0a\
-\xd8\xf8\xca\xbb\x16\xfc\x0a\x14\xfc\x10\xeb\xaf_m\x09~\
-~\xfb\xadI\xc1\xff\xd3Y\x1f\x04\x00\x98\xf0{\x15j\
-\xd9\xc5\x17\xdf9\x8e58\x1c\x8e\x872\xb9\x08Q\xa1\
-\xdf\xd1\xec\x94\xa2\x0d\x04\x069\xe1G\xb7WH\x87c\
-\xa2\xe2\xe2\x8eDIAqqt@N\xe0\xad\xe2&\
-\x93\x813\x01\xe6L\xccc\x06\x8c\x09\x90\xc3\x90\x86\xa6\
-HV\x98\xd1\x02\x86m\xbb\x8e^\xdbR\x1f\x0c\xcbn\
-\xf7\xb6\xf2\x12O\x9c\x86se\x8e\x84\x9a\xf9H\xa2\x11\
-\x0eG\xd6\xcc\x08\x96|2\xb7\x01(\xf2|\xa5\x0c\x86\
-cB\xec'w\xfftX*.\xfd\x7f\xeb\xcfk\xdb\
-w\xfa|}j\xc1\x15\x1bW\xa83)\xf8\x93\xab\xd0\
-\xfa\xa0\x02\xc0\xbb\xfa\xbe\xf9\xbe\x06\xbbo\xc1\x06\xe0`\
-`\xfb\x13\x0a5<\x0d!3\xa8\xcb\x84\x1fyN\x82\
-\xdd\x01\x999\x12\xc32*PIt\xfb\x92,\xb2`\
-\x83\x01\xafe \xc1wI\xb6\x99@\xd3\x92\x14\x81'\
-\x1e\xd9\x93\x93\x18+\x908+`ELV\x88\x91\x82\
-\x8d\x06\xd51\x19lH\x1f\xb5\xe3g\x0d=\xc2c\xf1\
-\x8a`\xb1\xb2\xb6\xc8\xef:\xbb\xa1\xb2(\x13FH(\
-\xd5f\xe7\x91\x93\xc3/>\xfd\xe26_u\xf0\xb6\xb3\
-\xe7O\xef#mo\x88z\xa6\xf7\x1eU\xe8\x99(\xfc\
-\xcc\xc6\xf7\x95\xa2\xc6\xd7\xc7Q\xfd\xccD\x9dSe\xa6\
-\xddwoR\xf0'\xd7\x1f\x1a\x00\x9c\xf6X\x9c\x8c\xc1\
-\x06\x83lb\xd2\xbb\xc8I\xc8k|\xaa\x90#\xd1\x9a\
-\x8d\xe0Ai\xa6\xc4$H\x19\x92\xe2\x15\x19+\xa0\x10\
-#\xcdF\x00\x15$\x95U8r\x13\x81\xfb\x05d\xc9\
-f\x05\xa6\x08L\xf8E\x96\xae\xac\xb3\x0cd\x9d+~\
-\xde\xb7\x9fU\xf5I\x06\x1b\xa4\xa9\xab\xc6\xc9\xde\xf0\xbc\
-\x86\xca\xc09\xa5\x01\xf79\xe5\xcds\xaa\x9e\x7f\xfa\xa5\
-\xe4\x89\xae\xaeo\xaf\x5c9\xff\xa7\xd4m\xd7N\xe0\xb1\
-\xe3\xf8Y\xaf\xbe\xb3\x19G\xd2\xe8\x9c\x14\xfc\xc9u\x86\
-\xf5\xc7\x04\x009\xc7e\x16b\x05y\x8dO'\x02\x04\
-\xbf\x95\x8b@\xbe\x03\x17\x82A\xa2\x80#\x91B\x8b\xe4\
-3@Y\x96\x08\x0c\xdc6+ F\x90\xe2\xe5\xce\x80\
-\xac\x80\x85\x1fu\xca!\xd0Y\xd5\x22\x9b\xc7\x01v\x9a\
-0\xd5\xf2\x88\x0c\x00D\x81\x00\x00\x98F\xd7\xb4\xb4!\
-\xbbD\xcd[T5\xbd\xb2\xa6\xee\x91\x9f\xdc\xfd\x00\x04\
-|\xca%\x8b\x97\xb4\xee\xcdo\xbf\xc5\xbb\xf0\x14j\xbf\
-eQ\xfd\xd6:\xf3\xa5\x97&\x9d{\x93\xab\xf0\xfac\
-\x05\x80\xcc\xf1M\x94\x9b\xb0\x01\xf2{\x1d\xe62\x84|\
-\xdf\x81]\xcb\x90\x99\x98d\xda&\x02g\x05\xe3r\x0d\
-4\xde\xe3\x80\x95.\xcb\xd9\x22&*`\xd2\x0c\xde\xe8\
-T\xa6L\x03\x04\x00\x91:\xf9\x80l\xa0\xf4S\x11\xbf\
-\xe16hv\x1e\xe85\x8d\xadW\x0a\xb2\xf2\xb5\xdbo\
-\xddh\xac[\xb3l\x96\xa7\xc4\x9b\xa6\x94\xdd\xdc\xea\xbc\
-\xbc\xcc=G8o\xd2\xc6\x9f\x5cgZ\x7f\xec\x00\x90\
-s\xac\xa7\x8b4l\x80|\x86\x90\xeb;\xa0\xf0\xa2;\
-T&\x1c\xd1\x87\xc4\xc6q\xac\x80\xcfGp:\x0eM\
-V\xee,\x8a\xb2\x9b\x87\x15\xf5\x94*\x8a\x92,h\x8c\
-\x01\xf0%\xa3\xf0\xd3\xab\x0c\x1d\xb1\x03\x85_\x22\x00\x10\
-\x5c\x86\x984\x0c*\xc9\x15}\x1e\xe5\xf8\x91\xbe\xbf|\
-{\xd7\xbei\xab/^xC1\xda\xf7j*a\xe6\
-\x8f\xcb>\xd34\x9dI\xc1\x9f\x5c\x13\xad?%\x00\x18\
-w\xec\xf9\x80P\xb8\xf9\xe9\xc4\x11\x05b\x05T\xea\x5c\
-\xed\xf6\x0b)]\x12\xc7\xe2a\xc9C\xcc\xc0NG\xb6\
-\xca\x9c\xfd\xb2\x22\xc4\xcc\xb4HI\xc0*n\xdb\x9f\xa1\
-h\xaa\x99\xc4[?\x0a}LA(\xc1[\x19A@\
-N\x18\x06Q|E\xf0\x1a\x0a\xd2\x86a\x14z;]\
-\xf7=\x0e\xce\x9c\x14\xfc\xc9\x95\xb3\xfe?\x22\x09+\xae\
-L\xf9\xd2\x82\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00T\xcf\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00T\x96IDATx\xda\xed]\x07\x9c\x16\xc5\
-\xf9~\xf6\xbb\xfb\xae\xf7\xc2q\xc0\xc1\x1d\xed\x80\xa3\x17\
-\xe9\x88(\x08\xd8kb\xaa-1Qc\xd4Dc\x8d\
-5\x8a-\x96h\xd4DcM\xf4\xafX\x12\x0b\x0aH\
-\xefp\xf4\xde\x8e\xceq\x1c\xd7{\xdb\xff\xccW\xb7\xcc\
-\xcc\xeew\x1c|W\xe6\xf9\xddw\xbb;mgg\xe7\
-}\xe6\x9dw\xca*\x90\x90\x90\xe8\xb0P\x82\x9d\x01\x09\
-\x09\x89\xe0A\x12\x80\x84D\x07\x86$\x00\x09\x89\x0e\x0c\
-I\x00\x12\x12\x1d\x18\x92\x00$$:0$\x01HH\
-t`H\x02\x90\x90\xe8\xc0\x90\x04 !\xd1\x81!\x09\
-@B\xa2\x03C\x12\x80\x84D\x07\x86$\x00\x09\x89\x0e\
-\x0cI\x00\x12\x12\x1d\x18\x92\x00$$:0$\x01H\
-Ht`H\x02\x90\x90\xe8\xc0\x90\x04 !\xd1\x81!\
-\x09@B\xa2\x03C\x12\x80\x84D\x07\x86$\x00\x09\x89\
-\x0e\x0cI\x00\x12\x12\x1d\x18\x92\x00$$:0$\x01\
-HHt`H\x02\x90\x90\xe8\xc0\x90\x04 !\xd1\x81\
-!\x09\xa0\x99\xb8\xef\xbe\xfb\xc2\xc8!r\xd6\xacY\xa5\
-\xc1\xce\x8b\x84Ds!\x09\xa0\x19 \xc2?\x9a\x1c\xae\
-!\xbf\xc3\x84\x00^\x0ev~$$\x9a\x0bI\x00\x01\
-\x80\x08~&9\x5cG~\xbd5\xce/\x12\x12\xd8\x1a\
-\xec\xbcIH4\x07\x92\x00l\x80\x08~<9\x5cE\
-~\xe3`.\xb3\xe3\xe4\xf7\x08!\x81\xc6`\xe7SB\
-\x22PH\x02\xb0\x00\x11\xfe\xb1\xe4\xf0s\xf2\x0b\x17\x04\
-\xfb\x98\x10\xc0\xbc`\xe7UB\x22PH\x02\xb0\x00!\
-\x00\xaa\xee\xdfo\x11\xac\x8a\x86!$P\x11\xec\xfcJ\
-H\x04\x02I\x006@H\xe0\x16r8\xc7\x22\xd8b\
-B\x00\xef\x07;\xaf\x12\x12\x81@\x12\x80\x0d\x10\x02H\
-\x22\x87\xbf\x90_\x98 X\x13\xf9=NH\xe0p\xb0\
-\xf3+!a\x17\x92\x00l\x82\x90\xc0\xa5\xe4p\x99E\
-\xb0]\x84\x00\x9e\x0dv^%$\xecB\x12\x80Mx\
-&\xfeP- \xc9\x22\xe8\xdf\x09\x09\xe4\x06;\xbf\x12\
-\x12v \x09 \x00\x10\x12\xa0v\x80[,\x82\x15\x92\
-\xdfC\x84\x04\xea\x83\x9d_\x09\x09+H\x02\x08\x10\x84\
-\x04\xee#\x87>\x16\xc1\xbe \x04\xf0u\xb0\xf3*!\
-a\x05I\x00\x01\x82\xc8\x7f\x0frx\x18\xe2\xb2\xab%\
-\xbf\x07\x09\x09\x14\x07;\xbf\x12\x12\x22H\x02h\x06\x08\
-\x09\x5cO\x0e\x13-\x82\xad$\x04\xf0V\xb0\xf3*!\
-!\x82$\x80f\x80\x10@\x1c9<E~\x91\x82`\
-*\x0dCH`\x7f\xb0\xf3+!\xc1\x83$\x80f\x82\
-\x90\xc0\x85\xe4p-\xc7\xbb\x8e\xfc\xe6\x90\xdfw\x84\x00\
-\xea\x82\x9dW\x09\x09\x1e$\x014\x13\x84\x00B\xc9\xe1\
-q\xf2K3x\xad&\xbfOe\xff_\xa2-@\x12\
-\xc0i\x80\x90\xc0\x10r\xb8\xc3sy\x80\xfc>\x22\x82\
-\xbf7\xd8\xf9\x92\x90\xb0\x0bI\x00\xa7\x09B\x027\x91\
-\xc3.\xf2[N\x84_\x0dv~$$\x02\x81$\x80\
-3\x80\xfa\x1f\xa1\x0b9\xdcE~\xfd\xc8\xaf/\xf9\x9d\
-\x84\xbbk\xe0\xfa9\xff\x0f\x07\x83\x9dG\x09\x09\x0aI\
-\x00-\x0c\x22\xfct\xaa\xf0\x12\xf2\xcb\x11\x04;\x01\x0d\
-!\x90\xdf:B\x0aro\xc1\x0e\x00\xa21:\x88\xa6\
-\xd8\x14\xec|x!\x09\xa0\x85A\x08\xe0[r\x98\x11\
-`4\xdau\xd8\x09=)l!\xa4\xd0\x10\xec\xe7\x91\
-h9\x10\xe1\x1fJ\x0eW\x93\xdf\xf3\x84\x04J\x82\x9d\
-\x1f\x0aI\x00-\x08\x22\xfc\xa3\xc8aM\x0b%WM\
-~\xeb!\xbb\x0e\xed\x02\x9eu$\xbf\x22?\x07\xdc\xdb\
-\xc8=CH\xa0<\xd8\xf9\x92\x04\xd0\x82 \x04\xf0\x05\
-9\x5c~\x06o!\xbb\x0em\x10D\xf8\xc7\x93\xc3\xf5\
-p\x0b\xbf\x17\x87\xc8\xef9B\x02U\xc1\xcc\x9b$\x80\
-\x16\x02\x11~\xda\xe7\xdf\x82\xb3[\xa6\xb2\xeb\xd0\xcaA\
-\x84\xff<r\xf8)\xd8\xf5b\x1f\xf9\xbd@H\xa06\
-X\xf9\x93\x04\xd0B \x04\xf0\x019\xfc,\xd8\xf9\x80\
-\xec:\xb4\x1aX\xcc\x16\xf5\x82\x12\xf8K\xc1Z>.\
-\x09\xa0\x05@\x84\xbf'9\xec&\xbf\x90`\xe7\x85\x03\
-\xd9u8\xcb\xb0\xb9\x83\x94\x17+\x08\x01\xbc\x1d\x8c|\
-J\x02h\x01\x10\x02x\x03\x16\x1b\x85\x1c\xef2\x0a1\
-\x15\xc7\x11S~\x14\x8a\x1a\xf4\xf9B\xb2\xebp\x06A\
-\x84\x9fZ\xfa\xed\x8e\x04\xd1)\xe3\xb4\x1bp<\x18y\
-\x95\x04p\x9a\xf0L\xfa\xa1+\xfe\xb8\xdf\x0d(M\xc8\
-\xc2\xc2\xf3\x9fq\x9d\x876T#\xa1x\x1f\x92\x8a\xf6\
-\xa0\x97Z\x88\xf0#\x9bI\x80\x13\xc1~\x0c\x0a\xd9u\
-8M\x10\xc1\xa7\xf2\xf4\x13\xf2\x9bb3\x0a\xdd=\x8a\
-\x0e\x09\x9e\x0cV\x9e%\x01\x9c&\x08\x01<O\x0e\x7f\
-\x10\x85Y3\xe6n\x1c\xeb:\xc6\xe4\x1e\x13\x1d\x83i\
-\xe7\x9f\x0fG\xf1\x11\xa8\xfb\xd6\xf8\x7fy\x1b\x80\xba\xa0\
-\x1a\x87\xbd\xd0v\x1d\xe8\xf0\xe6Z\xd9u`\xc3#\xfc\
-\xd7\x93\xdf\x04\x9bQ\xf2\xe1\x16\xfe\xa0.\x1a\x93\x04p\
-\x1a \xc2\x9fL\x0e\xb4\x95\x8c\xe6\x85\xa9\x88\xed\x82\x1f\
-\xa6\xbe\x08Ua\x17\xf5\xe0\x81\x83\xd0\xb77\xfd\xf6\x88\
-\xa7[@\x0f\x8d\x0dP\x8fn\x83\xba\x97\xc8\x1d%\x84\
-\xfd\xe4wl7\xf1\x0b\xfa\x042\xd9u`\x80\xce\xee\
-\x83{\x8c\xdf\xea\xdb\x11^\x1c\x81[\xed/\x0bv\xde\
-%\x01\x9c\x06\x08\x01<F\x0e\x7f\x16\x85\xd90\xf2V\
-\x1c\xec1\x99\xeb\xef\x0c\x0d\xc5\xf4\xa9S\x11\x1e\xc6\xe9\
-Ax\xcd\x05\xd5eD3XK4\x84\xb5nB \
-\xc4\x80\xd2\x82`\x17\x81+g\xe8\xc0]\x07\xcf\xb2\xf0\
-\xdf\x90\xdf0\x9bQ\xf2\xc8\xef\xaf\xc1\x1e\xff\xf7B\x12\
-@3Qw\xad#\x96\x1c\x0e*P\x13]\x0e\xac\x92\
-L\xc9\xc0\xc6\x9f\xfc\x07\x07\x8e\x1e\xe3'D\x04\xbcg\
-f&\x86\x0f\x1djrg\x06\xd6\xfa\x9d:L\x88`\
-\xb5\x87\x10\x081\x1c\xdc(\xbb\x0eg\x19\x84\x00\xe8\x82\
-/\xda\x05t\xd8\x08NG\x8a^&\xc2_\x13\xec|\
-{!\x09\xa0\x99\xa8\xbb6\xe4\x1erx\x96#\xa9.\
-\x84\x5c\xff\x12j'\xdc\x80\xef\xe7\xcdEC\xa3\xe1\xe3\
-\xc1\x9ah\xb4wp\xfe\xe4\xc9H\x88O\x10%G\xfc\
-\x04\x9e\xd4\xab\x89t\x1d\x8elu\x91\x02\xf6\xafs\x13\
-\xc3\xf1]\xe2xg\x07\xed\xba\xeb\xe0\x99\xe9w\x03\xc4\
-\xf2D?!\xffZk\xdb!J\x12@3PwM\
-h\x04\xdc\xaa\x5cg\xbd\x8f\xea/\xd1\xf8T8_\xda\
-Ct\xfc\x08\xec\xdc\xbd\x0b[\xb7o\xf7\x05a!%\
-)\x09\x93'Nb{Z\x09\xbe(\x0e\xed:\x1cX\
-\xe76.\xeeww\x1fP\x164\xa3\xb3\x16\xed\xaa\xeb\
-@H\x80Z\xfe\x7f\xca\xf1\xa6\xcf\xf9&\x11\xfeVG\
-x\x92\x00\x9a\x81\xdak\xc2n%\x12\xf6\x1a\xcf\x9ft\
-\x0b\x10\xf2\xe3'\xe1\xb8\xc4=8\xd0\xd8\xd4\x88\xb9\xf3\
-\xe6\xa3\xb2J\xac\x9e\x9f;~\x02RSR\xfc\x0e\xcd\
-\x12|\x81\xa7\xaf\xebp\xc8\xddu\xa06\x85<o\xd7\
-\xa1:\xb8\x85\xeaF\x9b\xee:\x10\x12\x98I\x0eW\x19\
-\x9cW\x91\xdf\xdb\xadi\x09\xb0\x16\x92\x00\x02D\xed\xd5\
-\xe1\xd4\xe8C\xb7\xfd\xea\xe1va\x08[t<\xc2\xfe\
-F\xba{\x111>!>z\xec\x18V\xaea/\x14\
-\x8c\x8b\x89\xc1\x90A\x83\x91\xd6\xa9\x93\xdfQ\xb5\x10b\
-\xa6\xbb\x1a`x\x0f\x9a\xeaI\xd7a\x1b\xd1\x0eh\xd7\
-\xc1C\x0a\xf9\xbbe\xd7\xa1\x19 $p\x059\x5c\xec\
-\xb9\x5cL~\x1f\xb4\xe6\x9d\xa2$\x01\x04\x88\x9a\xab\x22\
-~I\x0e\xef\xfa\x1c\x5c%\xa8\xfaO\x09B\xae\xf8\x13\
-B\xae~\xc8\x14w\xf1\xb2e8YX\xe8\xbb\x0es\
-:1\xa0_\x7f\xf4\xca\xca\x82B\x0d\x01\xbejb\xa8\
-/B\xbb\x00\xc7\xc1V\x1c\x01\xc9T\x97\xba\xbb\x0e^\
-B \xbf\x8e\xdcu \x82MU\xb3\x10\x22\xcc\x96\xb3\
-\xb6H\xd8\xeb\xc8\xa1\x89\x84\xfd\xbf`\x17\x96\x15$\x01\
-\x04\x80\x9a\xab\xa2\xa8\xa5w\x1b\x91\x90~\xdc@\xe1\x91\
-\xa4\xf5\xdf\x0e%\xc6\xfc\x0d\xd1\xd2\xd2R\xcc_\xb8\xd0\
-e\xf5\xeb\x95\x99E\x84\xbf\x1f\xc2\xc2\xc2\x0crhC\
-\xf8\xb9\xc2\xad\xdak\xf1u\xeev\xba\x19\x9e\x13\xdau\
-\xa0\x86\xc5\xbcunR8\xb4\x09\xa8o\xff\xa3\x0eD\
-\xa0\xd3\xe1\x9f\xecE\xe4zV\xe1\xe9\xa4\xd7\x9a \x09\
- \x00T_\x19M\xfbw\xb3\xbd\xd7\x8a\xce\x94\xef>\
-\x84\xcc\xbc\x15\xa1?{\xca\x1c\xd9\x13t_\xde~W\
-??.6.p\xc1\xe7\xb9\xbb\x84X\xb1\x9f\x8e\x95\
-\x06\xc0\xf52\x10\x8ck\xd4a\x0b!\x05J\x08D\xee\
-()\x9c\xd8\xcb\x88|\xd65\xe0\x16\xeb:\x10\xe1\xcf\
-\x80[\xf8c=NT\xf8g\x05{\x06_KA\x12\
-@\x00\xa8\xbe\x22&\x97\x94\xd8p\xbd\xab\xa6r;\xc3\
-\x11\xfe\xf2F(\x89\x9d\x99\xdel\xb7\xd3\x11|\xceE\
-\x8bw\x19\xec\x08\xb0\x87\x1c\x5c\x13\x96\xd6\xb9\xbb\x0f\x84\
-\x10\x9a\xc89\xca\xfd\x0d\xa6\x8f4\x15N\x1ag\x0e\x01\
-w\x1d\x88\xf0\xd3U\x9ets\xd7(\x83\x17]\xb8\xf3\
-lk\x98\xc9w\xba\x90\x04`\x13UW\xc4M'\x15\
-\x94~\xed\x87Sh*B\xce\xff\x05\x9c\xbfz\xc9{\
-\x09N0p\x03\x04\xa2\xee\x9b\xd2Q\x02\x1c5P\xed\
-\xc9\x9b\x95]B\xf1\x9e\xf3\x13S]\xa3\x0ek|\xa4\
-\xa0\x1e\xdeL\xba\x0e\xfc\xb90,\xcd\xca\xba@\x9a\x05\
-n\xd7\x81\x08\x7f69\xfc\x1e\xfcE^t:\xef3\
-\xadeF_s!\x09\xc0&\xaa.\x8f\xa7;\xfd\xba\
-?\x08\xaa0*\xa1#\x04\x11/\xad\x81\xd2\xa9G\xcb\
-\xb4\xfa\xc4\x8d\x0e\x1bFGE\xd9\x08\x1b\xe0\x88\x81\xce\
-\xcf\x8e\x06\xa2\xd1\x12\x14\x88\xbb\x07\xcc\x9e\x88!Bc\
-\xbd{\xad\x03\xed:\x1c \x84p \xd7\xddu\xd0=\
-\x87\xb5\xa0\x9f\x01m\xc2\xd5u\xa8\x08\x89\xde\xbd!f\
-`\xe2\xfe\xc8\x1e\xc5y\x11=\x8a\x1b\x95\x10\xde\x10\x1e\
-\x9d\x0b\xf2|k\x9a\xd9\x17($\x01\xd8@\xd5\xe5\x09\
-t\x85\xd7R\xb6\xaf\xbb\xa2\x85\x8c\xbf\x12a\xbf{\x93\
-\xe7\xcd\xba\xe0\x0a~qI16n\xd9\x8c\xca\xeaj\
-L\x9fr\x01BCB\xf9\x99Smj\x12\xbc\xfc\xd8\
-\x95\x13V+o\x12x\xab\xc4T~zt\xd4!/\
-\xd7E\x06M\xae.\xc4zO\xd7\xe1\xf4\x84\xfct\xb5\
-\x09\x22\xfc\x0d;\xa3z\xef\xfc6\xe9\x82Me\xa1\xb1\
-\xc6\xad\xbb\xa8M\x81\xee\xe6\xb3\xc3f)\xb6:H\x02\
-\xb0\x81\xca\xcb\x92\xbe%\x95\xc5\xbc\xc1\x83\xe2?F<\
-\xbb\x18\x8e\x0c\xc3\xe0@ \xad,q\xab\xa9\xa9\xc1\xd6\
-\x1d\xdbq\xf0\xc8ar\xe9\x16\xce~}\xfab`\xbf\
-\x01\x9c4\x0d\xcdm \xb6\xb7\x80\xba\x22V\xf9\xb7\xd0\
-@\x5cZC \x86\x09\xf7\xb5ZxPC\x0a\xb9\xc0\
-a:\xeaP\xcbOC\xb1\x9b\xbe\x19V\xdaD\xad#\
-\xbc\xfa\x85\x8c\xdf~Z\xed\x88\xf0\x1a\x12\xe9\x16^t\
-j\xef\x16\xcb\xc4[1$\x01X\xa0\xf2\xd2\xe4a\xa4\
-\x94\xd6\xfb]\xcc\x95)d\xe4\x85\x08\xbf\xe7=N\x10\
-\x0b\xe1Q\xe9L\xc1&\xec\xdd\xb7\x17;\xf6\xecFC\
-c\x83.\x8c\xc3\xe1\xc0\x85\xe7\x9dO\xba\x02\xd1\x81\xf5\
-\xe3[\xca\xf8h\xf2\xb7\xb23\x04\x90!U5w\x19\
-\xb86\x05\xd5\xdfu\xc8s\x13\x82\xab\xebP\xb0_G\
-.\x8a\x1d\xd6k\xa66\xb1<~\xe4\xaa\xef\x93\xa7\xd0\
-9\xdd\x94\x85^!\xc2\xbf\xd32R+\x87$\x00\x0b\
-T\x5c\x9a\xfc)\xdc\x1fs`\x82\x16`\xc4S\xdf\xc2\
-\xd1\xdb\xb3\x1a4\xc0V\xbf\xa4\xac\x14+\xd7\xaevO\
-\x13\xe6\xd4\xc1.i\xe9\x187j\xb4>\xa2\xea\xbd\xfb\
-\xe9\xcc\x1b@\x00\xf6\x03+MA\x90\x8eO\xc8\xed\x92\
-C\x00\xe1H\xd7\xa1)o\xbd\xab\xcb\xe0&\x06\xc2\xd5\
-\x95E\x96\x0fnI\x14\x0c\xc9\xa8\x0a\x89\xaa\x98\xd5\xe3\
-\xb6w\xe1V\xfb\xf7\xa1\x1d@\x12\x80\x00\x15\x97\xa4f\
-\x93\xca@\x19\xdf\xbd\xd4\x93QZ!\x03' \xe2\xcf\
-\x9f\xb8/x\xfdd#4n\xf5\xf5\xf5\xf8n\xc1<\
-\xd4\xd6\x8a\x17\x89M\x1a3\x1e\x9d\x5c\xeb\x04\x14\xf3}\
-\x02\xd7\xaea-\xd0\xbc\xb4l\x04\x12\x19\x12y\xee,\
-{\x82\x96\xdf\x14U\xaf%\xb8\x820\x1e\x8e\x16O\xe1\
-!\x8f\x81q=\x9a\x0el\x80zx\x0b\xbb\xeb\xa0\x99\
-\xc5\xc9\x02\x8b$\xdeO\xbf\xba\xff\xcd\xaf|\xdc\xe6[\
-~]\x11H\xb0Q~I\xa7w\xc9\xe1\x97~\x17\xd5\
-T`\x11\x8f\xfc\x1fBr\xc6\x9b#\xdbm\x89\x89[\
-\xde\xc1\x03\xc8\xdd\xbcQ\x98\x97\xb8\xd8XL\x9d8\x05\
-\xba\x8d\x85\x9a\xad\xfe\x1b\xfd\x02\x98\x0d(L\x97C*\
-F\x81U\xac\xd2\xb5\xf3`v\xb4\x06\x8f\x9b\xab\xeb\xb0\
-\x15M\xfb\xa9\xa6\xb0\xd1\xad-\x14\xe4\xd9\x1buPL\
-\xfe\xdd\xc2?\xad?\x8av\x02I\x00\x1c\x94_\x9c\xd6\
-\x03\xeeE?f\x13\xbcg\x180\x84\xa8\xfd\x91O\xfd\
-\xcf\x1c\xd9N\x9d\xd66\xe0\xa4\x22\xfe\xb0d\x91\xab;\
- \xc2\xb0\x9c\xc1\xe8\x95\xd93\xb0a?a\x83,\x1e\
-\xdbW\xec\xc6c\xdd\xd0R\xc8E\x99g\x8d6p4\
-\x00\xd6\xb9\xa80\xbc\xa8*A\xe1\xc6E8\xben\x1e\
-\x12\x8a\xf6!\xa1$\x0fa\xb5\xe5\xba\xe49\xf9\xcc\x09\
-\x9f]\xb7\xdd\xc6\x03\xb5\x09H\x02\xe0\xa0\xec\xa2\xf4W\
-I\xa5\xbb\xcd{\xcd*\xa8\x88{\xff\x89\xd0Q\xd3\xfc\
-\x0e\x01\xb4\xfaF\x14\x16\x9e\xc2\xa2\x95\x9c\x91F\x0f\xc2\
-\x9ca\x98>\xf9|\xd7\xd1\x9f+\xbf`\xd8\x927n\
-\xe3j\xbf\x85\xe7\x8e\xa6YN\x0ab\xcd\x15\xb0\x9b\xd9\
-@\x0b\xd7\xe0\xa7\x18\xee\xed\x09s$?\x1f\xab7m\
-r\x8d\xbaDU\x9e\xc4\xe8\x15/#\xa6\xe2\x04;m\
-w\xdc\xf1\x11\xb3kV\xa0\x9d@\x12\x00\x03e\x17u\
-I#\x87\x03\xe4\x17\xe1v1W\x06G\xf7lD\xbf\
-\xf0\x9d{;\x9f\xd3\xb1mi\xdcV\xe7\xae\xc1\xe1\xe3\
-\xc7\x84i\xf5\xee\xd1\x0bC\x07\x0e\x82W\x98\xec\xd8\xe1\
-\xc4y\xb1\x9a\xe1\xc7\x8a\xa7\xb5\xba\x0bndw\xb8\xf0\
-t\x8c\x80\xb6\xaf\x0d\xf3\x014\xdd\x91\x03G\x8f\x22w\
-\xeb\x16W\x88\xb1\xcb^@\xca\xc9]\xa2\xbc\xcc\x8c\xf8\
-\xacz\x0e\xda\x09$\x010P:\xb3\xeb3\xa4`\xee\
-\xf59\x98\xfb\x81\x88\xf8\xfd\xcbpN\xbc4`u_\
-\xe4^U]\x85\xef\x17\xfe\xe0\xda@\x84\x17\x86.\x1b\
-\xbe`\xe2y\x88\x8b\x89\x15\xa6\x15\xb0\x16p:\xf3\x02\
-<NJ\xa0}{_\x8b\xac\xda\xd0\x22\x8c\x02\xec=\
-W\xf5\xe7\xact\x19\xef\xcf\xa8)\xec;t\x08\x1bv\
-\xee\xc0\xc8U\xaf\xa3\xf31\xb3=Fc\x10\xfcI\xc4\
-\xe7U\x1f\xa1\x9d@\x12\x80\x01\xa533\xe8&\x9ft\
-\x91H,O\x8a\x1c\x9d\xbb#\xe6o\xf3I\xe9\x19\xbe\
-\x04v\x1a]\x00\xaf\xdb\xf6\xdd;\xb1}\xcfN\xa1\x00\
-wJN\xc5\xc4\xd1\xe3\xc1\xec\xe0\xb7\xc4\xbc\x00\xc6\x1c\
-#}<\x961O\x9f\x8eI\xe6\xec\x08v@\x19\x0e\
-\xc4\xdf@\x1e\xdeg0drW^\x1e\x1c\x1f=\x88\
-\x8c\x83+\xf5a\xf5\xe9\xfc6\xf2\xf3\xca7\xd0N \
-\x09\xc0\x80\xd2\x19\xdd\x1f&\x87\xc7\xfd.\xc6&\x98\xb4\
-\xfe\xb7<\x89\xb0\xa9?\xd6\xbb\x07\xa8\xee\xf3\xdc\x1a\x1a\
-\x1a\xf1\xfd\xa2y\xa8\xae\x11O/\x1f7|4\xd2\xd3\
-:\xc3h\x07\x10\xde\xcb\xca/\xe0!B\xd52\x0dE\
-\x9c\x00;-\xee\x04!\x91\xa1\x8f]\xb8\xf5\x0d\x0d8\
-q\xaa\x10\xdd\xd2\xd2\xd8a\x0d\xe9\x9e\xfa\xd7}\x88Z\
-\xfd\xa9/\x1cC@\xee\x8f\xfc\xa2|\x16\xda\x09$\x01\
-hP2\xbdG4)\x11\xda\xfa'\x9b}\xdd\x95\xc6\
-\x91\x94\x86\xd8\xd7\x17\x02\xa1N\xad3+(\xff\x9a\x1b\
-\xce\xdd\xf4\x1e:z\x04k6\xae\x13\x86\xa73\x03\xa7\
-M\x9a\xe2\x9a)\xd8l\xf21\xb9\x0707\xc0+4\
-\x5c\xb9\xd6{\xf8\x87\xdcY\xf1\x9a3\xec\xc7p\xf7u\
-\x07\xdc\xf7\xa8\xab\xab\xc7\xb2\xf5kQ\x5cV\x8a\x119\
-\x83\x90\xd9\xb5+#\x9e>\xdd\x86\xaf^F\xfd\xd7\x7f\
-\xd3\xdfB\xbf\xf8kV\xd4\x17e\xf7\xa3\x9d@\x12\x80\
-\x06%\xd3\xb3\xee&\x87\x17D\xadU\xc4\xf5\xf7!\xfc\
-\xd2\x1b\xdc\x17\xcd\x15~\x9f*\xec)~\xcd\x86\x1e\xaa\
-\xe7z\xe1\x8a%(*)\xe6\xa7A0\xa8_\x0e\xfa\
-f\xf5\xf1'\xda\xa2Z\x80\xe6B\xd8x\x07f\xd9g\
-k\x046\x19K8\xec\xa7\x8fW[W\x8b%\xb9k\
-PZ\xe1\x1f\xda;g\xd0\x10d\xa4\xa7\xeb\x89Hw\
-/\x15\x0d?\xbc\x8b\xfaO\x9e\x02\x1b\xaepoD}\
-Y\xfa[\xb4\x13H\x02\xf0\xa0\xf8\xc2\x9et\xdd7\xfd\
-\xc8g\x17\x97\x83\x86\xf5}k~\xe2\x12\x11\xfb\xe6\x02\
-(\xe1\x91\x81\x1b\xa4\x99a\xf4\x03\xdb\xaa\xcfMAq\
-i\x09\x16,_\xcc\x1d\x9e\xeb\xd1\xa5;r\xb2\x07 \
-2\x22\xfc\xf44\x00\xae\x9f\x85\xf0\xfb\xc6\xfa\x03LX\
-U\x05\x95.PR\xd0h\x13\x1ac`um\x0d\x11\
-\xfe\xd5(\xaf\xac\xd4\xd5p\x87\xa2`\xcc\xe0\xa1\xe8\xe2\
-\xdd|Uk\x97\xf0\x84kX\xfe\x19\xea\xde\xe34\xf0\
-n5\xe6\xa3\xe8/K~\x82v\x02I\x00\x1e\x14_\
-\xd8\xeb\xd7\xe4\xf0&\xdb\xd7]\xb3\x22\xae\xbb\x03\x11\xd7\
-\xfc\x96\xe5%p\xf3H\x8a\x8dV_\xf7:\xc8u\xee\
-\xa6\x8d8pT\xbfiMb|\x22\x86\x0e\x18\x8c$\
-\xfa\x11\x11\x1f4:u\x8b\x8d\x06\x18.\x98\xc3\x83\x16\
-s\x07\xb8\x04a\xd7>\x10`\x17\x80\x9cWVW\xb9\
-\x84\x9f.\xa5\xd6\xdd\xc4S\xbc\x94\x04\xc6\x0f\x1b\x8e\xb4\
-\xe4\x14f\xfc\xc6\x0d\xf3Q\xfb\xc6\xefD\xf7\x9d\x13\xfd\
-\xdf\xa2\x99h'\x90\x04@P4\xad\x0f5\xe7\xd3\xcf\
-6\xf5d\x8eq\x93\x13%2\x1aq\xff\xf8\x01J\xb4\
-w\xf8\x8d\xb68\x86\xda\xe5:5\xe8\xc3\xaan\xcc\xca\
-\xdc\xea\x1b\xae\xb5\xf1kHKF\x0d\x82\xf4\xabB\x11\
-\xe1\x11\x18\x94\x9d\x83\xee]\xba\x19sg\x102\x85\xe1\
-\x06{\xf2\xc3\xf4\x17\x08y\xb3\x87\xfd\xfc\xe9*\xc6V\
-\x985\xaa\xc0\x0c\xa3m\xfd\xdd!i\x8b\xbf$w\x95\
-K\x03\x10!$\xc4\x81\x09\xc3G 51\xc94\x1a\
-\xd0\xb8k5j^\xb8\x9e\x19\xcf\x13lE\xf4\xffN\
-\x8dG;\x81$\x00\x82\xa2\xa9}\x7fJJ\xe2C\xbd\
-\xab\xbe&F\x5cq#\x22\x7fA\xb7\x87\xf3Z\xddE\
-\x82\xedUGy-\xb3\x02U\x17\xc6{K\xb3\x16\xb0\
-\xf7\xc0~\xd2\x9f\xadCv\xaf>\x08u\x84\x80-\xf8\
-<2\xd0>\x8aA\xba,5\x03\x8b\xd6\x9d\xe7\xd8\xcc\
-a?\xc5\xe4\x17\x98\x81\xa5\xa4\xa2\x0cK\xd7\xafq\xf5\
-\xfd\xc5p\xc7\x19\xdc\xb7\x1f\xfa\xf6\xc8\xf4\xdc\xdc\xff\x8e\
-\x9a\x0eoC\xf5\x13W\x9b\x8aU\x13\x7f{\xcc\xffN\
-\xe5\xa0\x9d\xa0\xc3\x13\xc0\xa9\xa9\xd9\xb4\x0c\xe8\xa6\x0e9\
-\xbcYm\x8a3\x1cq\xff\xfc\x0e\x8e\x84d\x0b\xc1\x06\
-\xdb\xcdJ\xf8\x19\x82o}\xad\x8do\xbc\x91\xd1\xdds\
-\x11\xe8\x90\xbbi.\x00o\xae@\x00C|\xe0\xa7\xa5\
-\x98\x0c\x8a\xd6F?\xaaA\x15\x97\x97\xb8\xac\xfdu\x0d\
-\xf6>\xbb7$\xbb\x1f\xfat\xef\xc1\xcc[\xd3\xa9#\
-\xa8\xba\xffBp\x86\x00)\x8e\xc6|u\xb2\x1b\xda\x09\
-$\x01\x5c\xd0\xff2r\xf8\xd2W\x11\x18%\x121\xe3\
-ZD\xdd\xf2@\xe0\xc66\x8e!\xdb\x7f\xa3\xd3%\x02\
-\xed\x09\xcb\xdds\xa1r^s \xdb\x89\xb1\xc6\xe6\xd9\
-\x01\x0d\xdd\x03\xbbF\x08\xa3]\xc0\xba@)\x91\x16\x96\
-\x14a\xf9\xc6\xb5\x9e\x8f\xaf\x8a\x89\x88\xa6=\xac\x7f\x0e\
-\xb2\xbav\xf3\xdf\xcb\xd7\xfa\xbb\x9fO\xad,E\xe5\x9d\
-\x134\x91LiV\xc6~U\x10\x83v\x02I\x00\x17\
-\x0c\xa0;\xc2\x9e\xa3w\xd5\xbc\xf4\x90P$\xbc\xf1?\
-8R\xd3\xb9Al]\x03\x9c\xd5\xa7\x0c\x22\xf0\x05V\
-\xb8\xe9\x1d+W\xb0\xfc\xb0\x03\x87\xca\xdd[\x15\xa8M\
-M\xaeI/\xfe\x85B\x22X\xb5\xd8\xcd\x0b\x1a\x18\xd8\
-\x09w\x89n\xc2\xc8\xb4\x06\xf4\x89kp\xdb\x07\x18\xb3\
-\xf1\xbc1\x0b\x8aNb\xc5\xa6u\xae\x1d\x95\xac2K\
-\xd3\x1a\x993\x18\xdd;\xfb\xdf\xa3\xc9\x08I\x85\x9d\xa4\
-Uq\xcbPN*\xbe\xf4\x9d\xb1_\x9fh\xb5\x9f'\
-\x0b\x04\x1d\x9a\x00\x0a\xcf\xcf\xb9\x80\x1c\xe6\xb1}\xdd-\
-B\xf8\x94K\x10s\xc7c&\xaf@\xaf\xfd\xed\x1b\xab\
-\xd57^\xf3\x89\xa0\x96T\xbbWsC\xb1\xbb\xc8\xce\
-\xe7\xe8\xdb.\x06'7\xe0\xf6\xc1\xd5\x86\xde\x96\xbf`\
-\x8f\x17\x9e\xc0\xaa-\xeb\xd1\xa46\xf9\xcb\x89S\x9b\x1d\
-\x8a\x03\xa3\x07\x0dA\x97\xd44\x18\x8d\x87\x0a\xe3eU\
-\xdc>\x16j-g\xb7o\xb7F\x90\x12\xf7u\xfe\xa9\
-`\x97QK\xa0\x83\x13\xc0\xa0\x05\xe4p\x1e\xb7\xe5 \
-\x15'\xe1\xb5O\x11\xd2\xd5\xd3_l\x86\xe0\xeb\x9c-\
-\xd5\x7f\xe3\xb5Y\x03x\x7fK(\x96\x1fi\xdf\xc2\xef\
-\xc5m\x83k0$\xa5^\xf3\xf8\xee\xff\xf9\x85\x05X\
-\xb1y\x9df\x04ESH\xda\x91\x01\x95Z\xfcC0\
-v\xf00\xcd\xb0\x9f?\x1dox\xc5;\x8f\xc0\x83\x8a\
-{\xa7C-\xe6,\x09v\xa3W\xdc7\xc7\xf6\x07\xbb\
-|Z\x02\x1d\x96\x00NN\x19<\x86\x1cV\xea]\xf5\
-C\x80a\xe3\xceG\xec}\xb3\x9a\xd5\xd7\xd7\x09?\xd7\
-\xdf\x06\x11h\xe2\xef/Q\xf0\xccJ\xe7\x99\xd3\xca[\
-\x19R\x22\x9a\xf0\xd4\xd8J\x7fqx\x0a\xb3\xb6\xbe\x16\
-\x8bsW\xa2\xbc\xaa\x92\x11\xcb_:\xa1D\xf8\xc7\x0d\
-\x19\x89\xd4\xa4D\x8d}\xd4L\x1a\xc6\x11\x88\x8aG\xae\
-F\x93N\xbeM\xf6\x89\x11q\xdf\x1e]\x8fv\x80\x8e\
-K\x00\xe7\x0d\xf9\x0a\xfe\xcf8\xbbaXh\x92\xf0\xd2\
-\x07\x08\xed\x99-n\xe9\x03\x15\xfe\x80\x8c\x80\xfe\xd3&\
-r\xfe\xe4r'\x0e\x97u\xacW\xf6\xcc\xf8\x0a$\x85\
-\x9b\x0b\x91\x8e\xf5/\xce]\x81\xca\x9aj\x9f\x9b\x16\xce\
-P'&\x0c\x1b\x89\xa4\xb8\x040_\x98atAK\
-\x02\x95\xb3nD\xe3\xdeM\xa2\xa9\xc6S\xe2\xbf=\xb2\
-0\xd8e\xd3\x12\xe8X\xb5\xc9\x83\x82\xf3\x86\x0d&\x87\
-\x8d,\xf3\xb8\xd7!l\xf8h\xc4=\xfa\xb2\xde3\x80\
-.\x80I\xf8\x03\x22\x02\xef?\xff\xf5\xfc\x83!\xf8x\
-\xbba\xf9q\x07\xc0\x1d\x83\xab18\xc5co3\xf4\
-\xf3+k\xaa\x5c$P]\xeb\x1d\xfbw\x17j\xb83\
-\x0c\x13\x86\x8eB\x02\xfd\x00+c\xbe\xbf\x1f~2\xd0\
-\xda\x02*_\xfe=\x1a\xb6,\xf7z1\xa0^\x19?\
-\xe7\xf0\x17\xc1.\x9b\x96@\xc7$\x80\xc9\xc3\xe9\x86\x0e\
-\xfc\xf5\xbc\xa4T\x12f\xbd\x01\xe7\x80!Lo;\xd7\
-\xaaj3\x9e\xcf\x8d1v\xef9/\xadU\xf0\xd0b\
-'\xaa\xdb\x85\xdd90\x5c\xde\xb3\x0e\x17gj'\xf7\
-h\xdf\x93\xea\x9a\xfd\xb7x\xfdJ\xd2-\xa8s\x15z\
-Dx8&\x0d\x1b\x8d\xd8\xe8hs\x1c\x0b2P<\
-a\xaa\xfe\xf10\xeaW\x7f\xef\x0fc\x96\x92\x1b\x12\xe6\
-\x1c|7\xd8e\xd3\x12\xe8p\x04p\xe2\xdc\x11\xbd\xc9\
-S\xd3m\x9dC\xd8\x05\xa0\xc2\x993\x84\x10\xc0\xdfa\
-G5\xe7[\xfc\xed\x85u\x83q\x1fM\xd8\x7fn\x0c\
-\xc5\xaac\x1d\xc3\xf0g\xc4\xc8N\x0d\xf8\xed\xc0j\x8d\
-Bd.P\xba\xe2o\xc9\x86U\xaeO\xa8M\x1av\
-\x0e\xa2#\xa3\xa0\x17\x5cN\x17@g\xfc\xf3\xdb\x02\xaa\
-?|\x16u\x8b>7\xe4D\xf7\xf2\xeeJ\xf8\xee\xc0\
-K\xc1.\x9b\x96@\x07$\x80Qo\x91\xc3M\xa21\
-\xe3\x84G\x9fC\xd8\xc816\xc6\xeaa:g\x0a\xbf\
-\xc5\xcc@\x9d\xe1\xcf\x10v\xd7)\x05\xcf\xacr\x0a\x9f\
-)\x04\x0d\x18\x12\xb6\x0a!J\xa3\xce\x9dn\x1f6x\
-\xd8(DFF\x9a#\xd9\x9c\x15\xcc\xcdv\x0b\x80Z\
-\xf1\x0f\x15\x03_o\xe2W\xc3$g-\x9e\x9fh\x9c\
-\xe1g\x16\xee\x92\xb2\x12\x84\x93\xd6?2<BS\x00\
-\xdew& \x03\xc3\xda\x02zY\xf3\xd9\xdfQ\xf3\xed\
-\xfb\xe6\xcc\xf8\x0d\x88\x8f&~\x97\xf7\x18\xda\x01:\x14\
-\x01\xe4O:\x87N\x01\xdbG\x1e\xda?[\xc6`\x15\
-\x0e\xed\xd9\x07I\xaf\xbc\xcd\x11Z\xcd\x18\x93\xb6\x9f.\
-\x12~\xed\xb9I\x82\xc4\xc2O\xe7\xb7\xfcy\xa9\x13G\
-+\xc4\xaf)\xdb\xb9\x05\x99\xa1\xbb\x98~\x9d\xd2\xd21\
-j\xf4x\xf6\xed9\xb0\x9c\xc0\x17@Z\xcc\xb8\x9a\xe1\
-\xbb\x92*\xe0\xf1o\xf8\xcfG\xfb\xe6\xf7\xf5\xd9\x89\xbe\
-\x19\xdd8w\xd5w\x09|N\x0a\x87u\x0d3\xff\xf4\
-~n\xef\xda9\x1f\xa0\xfa\xb3\xbf\x8b\x1e\xe1\xa5\xc4\xef\
-\xf7\xddu\x1aE\xd0j\xd0\xc1\x08`4U\xdb~\xcf\
-\x0f\xa1\x22\xfe\xfe\xc7\x101~\xb2\xd1\x99}nP\xdd\
-\x85V\x7fK-\xc0\xec7g\x7f\x08\xfeo\x87\xd8\xf0\
-\x17\x1bR\x81q\xe1sI\x0aM\xdc0\xa3\xc6LD\
-j\xa74\x93;S\x88\x03\x98\x1d,\x0a\xc8\x8c\xc3Y\
-\x1e\xfc\xe0\x97\x0a\xaa\x04\xd3\xf8'8\xe6a\xda\x80\x0c\
-t\xef\xd4\x15\xe6>9\x87i\x19k\xfdM\xe1\x15\xd5\
-\x14\x8f\x06\xad]\xf4%\xaa>x\x9e\x19\xc7\x93\xd4;\
-\x89s\xf7\xdeh\xb7XZ3:\x0c\x01\xe4O\x1c\x9b\
-\x0a\xd7V\xdfj\x14\xaf$B\xbbe \xf9\x8d\xf7\xc0\
-U\xf3M\xd7\x8a=\xe1\xd7\x9e\x9b\xc2(\xcc8\xc55\
-\x0a\xee[\xe4Dm#\x84\xf8\xf1\xc0|\x94\xec_&\
-\x0c\x13\x1d\x13\x8b\x89\xe7Msu\x09D\xd2\xdc\x9cV\
-]\xb5\x19\xd9;\x8bOa\xc4}m\xa1\x82}'\xf9\
-q\x07+\xeb\x90\xa9\xec\xc5\xe8\x9c\xe1\xe8\xea\x9a\x92\xcd\
-\x10t\xae\x81Oo\xdc\xb5$\x0cB\x0a\xf5\xab\xe7\xa3\
-\xf2\xcd\xc7x\x9b\x82R|\x914w\xcf\x95\xcd(\xae\
-V\x87\x0eC\x00\xc7'\x8e\xfb\x0b9<\xa0w\xd5\xd7\
-\xda\xf8;\xefE\xe4\xd4\xe9<o\x8e&\xa0]\xd7\xaf\
-\x04\x10\x0f\x5c\xe1\xa7\xa0\xd3}\xd7\xe6\x8b\x0d\x7f#{\
-\x00\xbf\x18\xa3b\xf9\x92\x05(+-\xe6\x86\xa3\xc9\x0e\
-\x188\x14\x99Y\xbd\xb9\xfeB\xa86\xc31\xc3X\xf7\
-%\xbe\xd8\xa8`\xc9\x1e~\x10*\xfc\x83\xb1\xce\xb5\x99\
-\xc7\xd8A#\xd199\x95\x91\xbeA\xd0Y*\xbe\x1d\
-2 \x04\xd0\xb0e5\xca_\xbc\xc7\x1f\xcc\xfc<\x0b\
-\x92\xe6\xed>\xdfFq\xb4zt\x08\x028>aB\
-<yqtk\x9dxv\x08\x15!DEN}\xeb\
-}\xa2\x06\x84\x066\xf3\xcfg\xf5\x17[\xf2u\xd7&\
-\xe3\xa2\xfe5l=\xe9\xc0\xb3\xab\xcd_$\xd3\x22\xc2\
-\x09\xfc\xf9\x22 .\x92h\x0bE\xa7\xb0r\xd9B\xa1\
-\xa89C\xc30\xe9\xfc\xe9\x08\x0bc,\x16\xd2FT\
-\xac[u\xfb]\x02\xd5V\xbc\x15\xfb\x1a\xf1i.\xff\
-y\x93P\x88\x89\x8e\xf9\xae\xf3\x10\x87\x82\xc9\xc3\xc7#\
-!&\xce \xc4\xbc>?\xc4d\xa0\x98\xe36\xec\xdd\
-\x82\xf2\xa7n7\x84\xd1a}\xf2\xbc\x9d#\xec\x16C\
-kF\x87 \x80c\xe3'\xd2M\xde<;=\x9a_\
-*=\x8d\xfb\xed\xed\x88\xba\xe4\xb2\xc0\xc6\xfbu-\xa3\
-\xbf;`\x9b@\x8c\xa3\x0a\x04\x0dD\xe5\xbf\x7f\x89\x13\
-\xf9\x95\xe2Ws5\xa9~\x93\xfb\xfa\xd3\xda\x90\xbb\x06\
-\xc7\x8f\x1d\x12\xc6\xe9\x93\x9d\x83\xde}\xfb\xfb\xb3q:\
-\x86>aW\xc2\x9a\x22\xbc4YWW\x8byK7\
-a\xde\xa9\xd1\xdc\xb0\xa1h\xc0\xc5\x8e\xd9\xae\xf3\x8c\xd4\
-\xce\x189`\x98K\x1b\xf0\xa5d\xea\xef\xdb\x1b\xf63\
-\xc5\xf7\xf85\x1e?\x88\xb2\x07\xaf\x17=\xf0\xbe\xe4\xf9\
-;\xd8\xeaT\x1bC\xbb'\x80c\xe3'\xd110\xda\
-\xfak\xf4F}\x05u$$\xa2\xd3{\x1f@q:\
-\xc1\xed\xffs\x88\xc0\xdc\xf7Wl\xc53\xcf\x01p\x1f\
-\xfe\xbb'\x04\xb3w\x89\x0d\x7f]\x13\x80?M\xa7\xab\
-\xdc\xfcn5\xd5\xd5X\xbc\xe0;\xfdW\x85<p:\
-\xc3\xd0\xa7_\x0e2z\xf4\x14\xda\x01\xac\xc4\xd6h\x5c\
-\xb7R\xf7Y\xa3\x22\xda}\x89jkk\xb0v\xd5\x12\
-\x94WTb^\xe5\x15\x10m\x17:5\xe4k\xe4t\
-N\xc0\xf0\xbe\x83\xa08\x14\x83\xc03\xee\xc8\xb4\xf6s\
-\xc2hG\x08\xc8_Si!J\xee\xba\x96]\x02\xee\
-\xb4N\xa5\xcc\xdf\x9e\x82v\x80vO\x00G\xc7M\xbe\
-\x83\xbc8\xdd\x9c^\xddC\x93\x97\x1e{\xc3\x8d\x88\xb9\
-\xf6Z\xbd*nk\x02\x8f\xa1\x15\x15\xf4\xe9u\xd7Z\
-\xe1\xd7\x84)\xacRp\xefb'\xea\x04\x86?z\x87\
-\xbb\xa7\x02=S\xcc\xc9\xef\xdd\xbd\x03{vm\xf3\xdd\
-CQ\x1c\xc8\xc8\xecIZ\xfe\x01.\x12\xe0\x81;|\
-\xc9w\xd2\xfbk\x0bA\xb1\x17\xb9\xba\xba\x0akW.\
-!G\xf7\x82\x9e\xa5\xd5\xd3P\xd1\x14\xc7\xbd\xc7e)\
-\xbbq\xcd\xe0tC\xa26\x8d\x80\xa6n\x80\xc6\x9d\x11\
-G%ZI\xf1oD\xfb~\xaa\x0d)?l\x13O\
-\xceh#h\xd7\x04pt\xecy\xf4%\xed#O\x99\
-\xe1v1\xd7FGt4\xd2>x\x1f\x8ak\xb2\x0c\
-\xbbO\xce\xebf\xf2?//\xd0\x02L\xc2\xef\xef6\
-\xbc\xb06\x14\xebO\x88\x0d\x7fcz\x02?\x1f\xc3\xf6\
-\xa3\xbb\xe2,]\xf0=\xd1\x06\xaa\x90\x9c\x9a\x86\xfe\x03\
-\x87 &&\xce|k\x16T{\x1a\x80\xd9\xd1\xdc\xea\
-+\x16q\xaa*+\xb0\x8e\xb4\xfc5\xbe\x85<\xc0\xc6\
-\x9asp\xac\xa1;\xf7\xdeWf\xd5\xe1\xaa\xacZ\xb1\
-%_S\xb4<\x03\x9f/\xcf\x16dp\xea\xe6\x19\xa4\
-/\xd0\xa0KG\xdfp &\xe5\x87-\xac\xe5\x88m\
-\x0a\xed\x9a\x00\x8e\x8c\x9dB\xc7j\xdf\xd6?\xa8\xbeJ\
-\xc6^\xf7c\xc4\xfe\xf2\xe7`{\x8b\xd5y\xe6|\x7f\
-\xe3N\xc1\x96\xf3\x00\xdca6\x148\xf0\xdc\x1a\xb1\xe1\
-/\x8a4\xe2\x8f^\x02\xc4\x84k\x920\xa4{\xb2 \
-\xdf\xd5\x22\xa7\xa6\xa53\xee\xc5\xce\x0a\x0bV\x93\x81T\
-\x83`\xd8%\x8f\x8a\xb22\xe4\xae^\x82\xbaZ\xfd\xe6\
-\x9d\xfb\xeb\xb3\xb1\xa3n\x107\xfe\xc8\x94\x06\xdcM7\
-\x08\xe1Z\xfb\x0d\xaa\xbd-\xad\x00\x86\x09C~\x22(\
-\xba\xfdj\xa8\x15e\x829\x07\xe8\x9a\xba`3\xe7S\
-\xcem\x07\xed\x96\x00\x8e\x8c\xb9\x80~3\x8b\xce\xf9\xef\
-\xe3s4\xbcL%\x22\x02\x9d\xdf\xff\x17\x1cqq\x01\
-O\xd4a\xaa\xcdv\xc8\x831\x0f\xa0\xbe\x09\xf8\xe3B\
-'NV\x89_\xc7\x8f\xcf\x01&\x0aLO\xbc\x89=\
-\x22\xe1\xb4\x9a\x0c\x14\xd0\xb0\x9e\x0d-b\xc3\xda\x15(\
-,8nJ\xb1\xb01\x0dk\xaa'r\xe3\xa5F4\
-\xe1\xe5\xf1\x95`\xbe(\xae\x81Osn\xa5\x15\x18\xae\
-\x8b\xef\xbd\x01\x8d\x9e|r\x1a\x8f\x9c\xd4\x85\x9b\xb6\xa3\
-\x8d\xa3\xdd\x12\xc0\xe11S\x7fD\x1e\xeec\xf7\x15\xbb\
-Z\xc6\x5cy)\xe2o\xb9\x99\x1d\xc4d\xa9\xd7\xb7\xe8\
-\xaa\xad80\xa7\xcd\xd0\x16>\xd9\x19\x82/\xf6\x88\x0d\
-\x7f\xdd\x93\x80?]\xe8\xde\xdb\x8e\x95T\xa0}\xf7\x80\
-G\x00\x8c\xaa\xbe\x95\x9e\xafq\xd6\xeaD\x0d\x0d\xf5X\
-G\xfa\xfe\xe5e%\xba\xb0\xb5j8\xe6W^\x22\xcc\
-\xd3\xbf&U 2\xb4I\xb0S\xb0\xca\xd7\x0aL\xa3\
-?\x1c\xad\xc0s]\xf2\xe8\x1dh8\xa0\x99\x9c`\x9e\
-\x144\xae\xd3\xc2\x8d+\xd1\xc6\xd1~\x09`\xf44\xfa\
-\x91\xf7!f\x1f\xf7\x8bVBCI\xeb\xff\x0f\x84$\
-'\xf3\x05Tw\xad\xef\xb3\xabB\xe1\xf7\x867\xf4\x88\
-\x19a\xf2+\x80{\x16\x85\xb9\xb4\x00\x1e\xa8\xd0S\xe1\
-\xefn\xfcd\xa9jHN\x00\xe3\xd8~Iq\x11\x8a\
-O\x9dDf\xefl\xeb\xb8\x16l\xa1Z9\x18\x8a\xa0\
-\xbe\xb6\x0e\xebV-B\xa5\xe7\xbb}^\xcc\xab\xb8\xc4\
-E\x04<<6\xa2\x0a\xd9\x09\xda\xdd\x7f-,\xfc\x81\
-j\x05\x9a8\xa5\xcf<\x80\xfa\x1d\x9bxOH1\xb3\
-\xd3\xa2\xf5sl\x14}\xabF\xbb$\x80\xc3\xe7L\xbf\
-\x88\xbc\xb4\xaf\xf9O\xa7\x22z\xc6T$\xdey\x9b\xd1\
-\xd9\xfa\xdc(\xfcL\x22\xb0#\xfc\xee\xf3\xa7V9\xb1\
-\xe9\xa4\xd8\xf0G\xd5\xfe\x9f\x8c\x86)-\xab\xe9\x06\xac\
-\x00\xd55\xd5\xd8\xbdc+\xf2\x8f\x1dt\xe5o\xf4\xb8\
-)\x88OH\xe4\x04\x17\x0c\xeb\xb1\x8b\xd5vX:\x04\
-\xb8n\xe5\x22Tk\xb6\xf5ZU=\x09'\x1b:q\
-\xe3\xdc\xd0\xa7\x16\xd3\xbb\xd7\x81\xdbz\xfb\x8a\x9c\xd1\xaf\
-\x0f\xc4V@\xdc\xcb^y\x0a\xb5\xb9+\xcc\xe9x\xa3\
-\x02\xd7uZ\x94\xfb\xb1U\x91\xb4v\xb4K\x028t\
-\xce\x0c\xfa\xe6\xc6\xba\xaf\x18U\xd1\xe1@\xfa;\x7fC\
-h:g\xabo\x91=@\xf5|\xd8C\xb0\x81\x07o\
-\x98\xcf\x98\xee\x9ac\x0e\xbc\xb0V<\x9aD\x0d~\x8f\
-]\xea6\x00\x06\xa2\xd2\x1b\xc3656\xe2\xc0\xfe\xdd\
-\xc8\xdb\xbb\x0b\x8dM\x0d\xbe\x00q\x09I\x18=~\x8a\
-!\xae*\xbc\x8f\x0d\xed\x9f\xe9o4\x16\xd6TU\xb9\
-H\xa0\x96\x90\x92#$\x04\x05q\xd3\xb0\xf2P47\
-\xad)]\xeaq\xcb\x80\x1a\x88\xa7\xf9\xf2F\x03\x04\xb6\
-\x02F\xb8\xf2\x7f\xbe\x8c\x9ae\xf3EO\xf4\xdb\xb4\xc5\
-\xeb\xde@\x1bG\xbb#\x80C\xa3fN&\x87\x85\xe6\
-\xa7\xf4W\x8c\xa8\xf3& \xf9\x81;\xe1\xfb\xbc\x97h\
-\xfc\x9eq\xee\xee\x09\xd8\x993\xc0\x99\x1dH\xce\xe9\x22\
-\x9f;\x17\x84\xe1T\xb5\xf8\x15\xfcl\x0c0\xbe\x97\xd9\
-]5\x9d0/]\xc8?~\x04\xbb\xb7oFMM\
-\x95\xf99\x08\x06\x0e=\x07\xe9]\xbb\x03\x16\x82o\x05\
-m\x90\xd2\x92\x22\xc4\xc7'Y\x86\xab\xaa,\xc7\xc6u\
-+\x903x\x04\xf6\x94\xa5\xe0\xc3U\xfc\xf2\xe8\x15\xd7\
-\x88\xa7GU\x9aS\x0b\xb4\xdf\xaf\xf0H\xc3O,\x15\
-\xffy\x1bU\xdf\xff\xcfT&\x9a\xdc\xdd\x97\xb6d\xcd\
-3\xd6\xa5\xd2\xba\xd1\xee\x08\xe0\xe0\xa8\x8b\xe6\x92\xc3T\
-\xf6\x83\xaa\xae\x0eu\xe77\x9f\x873\xcb3\xe6\x1c\xc0\
-\xb0\x9fOp\xb4\x86A\xdbD\xa0w\xffp[(\xfe\
-\xbbOl\xf8\xa3\x93}\xee\xb9P?\xd3\xd5\x08\x91\x15\
-\x9f\x1eh?\x7f\xdd\xaa\xc5\xc2x\xe1\x11\x91\x18\x7f\xee\
-4\x84\x84\x84\x8a\xd3\xd5\xfa\x09\x0c\x7fG\x0e\xee#\x84\
-\xb3\x11=z\xf5C\xaf\xbe\xd6\x9f\xd1S\x9bT\xd7\x0c\
-\xc5\xe3\xa5\xc0\xac\xef\xf9U2\x8c\xf4\x94><\xb7\x8c\
-\xee\xd6\xce.p\xde\xbc\x7f\xabU\x80\x8cIC\x95_\
-~L~\xff'*\xe9Y\x9d\x97\xac\xe6|G\xbc\xed\
-\xa0]\x11\xc0\xc1\x91\x97\x8c\x22\x875\xee+F\x0d%\
-O\x1b9v\x04R\x1f\xbf\xd7\x1c\xc4&\x11\xe8*?\
-\xcf\xda\xcf\x9c\x17\xe0w?Z\xae\xe0\xeeEaD\x15\
-\xe7?\x0b\x9d\xed\xfa\xc0\x0c\xa0[\x22\xdb\x9f\xdbKa\
-<v\xee\xea\xa58UxBXv\x99\xbd\xfb\xa1\xb7\
-AX\xad\xc8\x85\x05\xda\xcd\xd8\xb7s\x8b\xef\xbag\xf6\
-@d\xf5\xcc6\x15/+\x11\xba\xf3\xf1=\xb3\x154\
-\x08\xca\xe5\xe5\xb1\x15\xe8\x1a\xd5\x04K\x03\xa0\xce\xcd\xaa\
-[`&\x8d\xaa\xb9_\xa1\xfc\xdf\xff2\x08\x88.\xc3\
-\xafw^\xba\xeaV\xb4q\xb4+\x0280\xe2R\xba\
-S\xeb\xe5\xde\xa7b\x8d\xdfv~\xf5I\x84\xf5\xebm\
-\xd9\xcf7\x0e\xfb\xf9\xbcX\xc2-4\xf8\x99\x0d\x82\x8f\
-.wbk\xa1\xd8\xf0w^6\xf0\xa3\x91\x82\x96\x98\
-ap\xe3\x85\xad,/\xc3\xca\xa5\xf3I6\xf8\x92\xe5\
-p\x84`\xcc\xb9S\x11\x19a\xee\x83\x0b\xb5\x7f\xcdX\
-\xdf\xbe=\xdbq`\xcf\x0eS\x90\xbe\x03\x86\xa0[\x8f\
-\xde\xe2t=\x17\xcf\xcdSp\x94\xbf\xb2\x19w\xe5T\
-c|\xe7z\xb0\xfb\xf4\x8c\x12\xe1\x1a\x00\x8d\xd7\xfaQ\
-\x83\xea\xa5?\xa0\xec\x9f\xafi\xc2\x9a\xd2\xff(}\xe9\
-\xca\x9f\xa0\x8d\xa3\xdd\x10\xc0\x81\x11\x97\x93\xe6K\xdd\x22\
-z\xa6\x88a\x03\x90\xf6\xfcC\xee\x0b\x9b\x16\x7f\xa3t\
-\x99ZZ\xad\x16 L\xd3\x1df\xe9\x11\x07^Z'\
-6\xfc\xd1%\xbeO\x5cJ\xb7\xb7\xd6\xbb\x8b\xfa\xe1\xbc\
-\xd6\xda\xeb\xbek\xdb&\x1c>\xb8G\x98@j\xe7n\
-\x184\x9c\xbf*O\x94\x97=;6\xe3\xb0g\xdc\xdc\
-h\xf8\xa3\xc8\x1e8\x02]22\xb9\xe9x\xc3\xfd{\
-\xb5\x825\x07\xf8\xf7\xbd\xb2G-~\xda\xa7\xd6\x1fY\
-(\xd8V\xaa>\xcc\xe4\xe1\xb9\xae]\xb7\x1a%\xaf<\
-\x07\x01\xfd}\x9b\xbel\xf9E\xb6\x0a\xab\x15\xa3\xdd\x10\
-@\xde\xf0+> \x87\x9f\xf9\xfb\xfa\xe60i\xcf=\
-\x80\x88\xe196\xc7\xfd\xb5\xe7\x9a\x09@\xdca?N\
-z\x9a0\xd5\xa4\xe1\xba\xfd\x870\xd7n?\x22\xdc8\
-\x01\x18\x9d\xa9\x89.2\xf4\xd90\x02R4\xd4\xd7a\
-\xd9\xa2\xef\xd0P\xc7\xde{\xcb\x1bo\xf8\x98IHL\
-J\xb55\xc7@\x85{\x8e\xc0\xaem\x1bq\xec\xb0\xd5\
-\x97\xb2\x14\x0c\x182\x0ai\xe9\x19\xc2P\x8bv\x03_\
-l\xe0\x97\xcf\xf0\xe4\x06<4\xd4\xfb\xdd>\x95#\xf0\
-\xb0\xad\xea3G\x04H\xb8\xba\x1d\xdbP\xf4\xb4q\xdf\
-O]\xbdZ\xd1e\xd9\xb2\xf1h\xe3h\x17\x04\x907\
-\xfc\xca\x9e\xe4@\xaa\x0e\x0cV5\x7f\x85\x08\xef\xd7\x13\
-\xe9\x7f\x7fL\xaf\xdek\x83Xv\x09<\xa7\xcd\x1d\xf6\
-#i\xbc\xbd%\x14_[\x18\xfe\xfa\xa6\x01\x7f\x98\xc6\
-\xce\x93Q\xf0E\xa3\xf4,\x928rh?vn\xdd\
- \xbc\x7fLl<F\x8d?\xdf\xbdl\x98S4>\
-w\xd2i\xdf\xbe9\x17'\x8e\x1f\x84\x1dD\x93\xb4G\
-\x8e;\xdf\xb7\x96\x9f\x95\xc7\xdd\x05\xee-\xc2x\xa0_\
-\x09z{b\xb9>\x12T\x81J\xcfp\xd7\xc6\xe5L\
-\x18\xaa?\xb8\x1f\xa7\x1ef\xd9\xf8|im\xeb\xb2|\
-\xe9@[\x0f\xde\x8a\xd1>\x08`\xd8Ut<\xf6\x16\
-Q\x98NO\xdc\x81\xa8\x09#4u\x86C\x04\xa2s\
-\xed$ \x95\xed\xcf\x1e\x96Vp\xb0L\xc1\xdd\x0b\xc3\
-\x5c\x86.\x1eB\x1c\xc0\xc3D\xa9L\x8f\xd7&\xc1f\
-\x01;F@S\x18\x92\xf9\xd5\xcb\xe6\xbbl\x02\x22d\
-\x0f\x1cN\xd4\xf5,\xf6\xfd\xbc\x83\x1fMM\xd8\xb6i\
-5N\x9e\xb0\xb7\x1e&&6\x01CFN\x84\xd3\xb0\
-#\x91\xb1\xbb@7\x07\xbd\xff\x0bq\xb5|\x7fR9\
-b\xc3T\xf0[x\x1e\x11h\xfc8k\x00\xbc\xd7\x8d\
-\x85\x05(\xb8\xeb\x0e\xdd}\x0d\xcb\xc8\x8fvY\xbe\xa4\
-\x9b\xad\x87o\xc5h\xf3\x04\xb0\x7f\xe85]\xe8\x81<\
-\x89v\x8d\x9c\x0eaY]\xd1\xf5\xad'9\x13\xe9\x05\
-\x9a@ s\x00\x04#\x02\xf4\xf4\xfe\xc5a\xd8i\xf1\
-I\xefi\x03\xe8N?\xaa\xf9\xb6\x82!7\xa1\x1f\xcc\
-\xadl\xf1\xa9\x02lX\xb3\x14\x82\xa8DH\xc31f\
-\xd2\x85\x08\x0de\xdb*\x9a\x9a\x1a\xb1e\xfd*\x14\x15\
-\xe6\xf3\x8a\xdcW\x1cT\xae\xe8d\xa3\xc1#' $\
-\xd4b\x09\xbd'\x9dG\xfe\xa7\xa0\xa4\x9a\x1f\xec\x89\x11\
-U\x18\x94T\xcfh\xe1\xed\xa8\xfa0\x5c\x1b4\x01O\
-\x1aM\x15\xe58\xf1\x9b[\x98[\x86yP\xd9u\xc5\
-\xa2\x18\xb4q\xb4\x03\x02\xb8\x96\xee\xdf\xfc\x07\xb3\x8f\xff\
-\xa5\xa5>\xf8k\xc4\x5c0\x96\xe5\x150\x11\xa8*#\
-\xac)\x9e\xde\xff\x87C!x%W\x5c\xf9\x13\xa3\x80\
-\xc7/U\x11\x1ejN\x9a\x95mQK\xafsgx\
-n^\xbf\xd2\xb2\xe5\xee\xd6\xa3\x0f\xfa\xf4\x1flJ\xaf\
-\xb1\xb1\x01[rW\xa0\xa4\xe8\xa4-;ABR*\
-\x06\x8d\x18G\xb4\x9bPSq\xf3\xe67\xbc\xb9D\xc1\
-\xf6\xe3\xfc4o\xecS\x83\xcbzx\x0c\x81\x0a\xe7E\
-\xf1\x86\x02Y\x84\x01\x86[c#\x8e\xfd\xf2\x17\xfe(\
-\xec\xa7tv]\xb9\xb0M\x7f\xb0\xadM\x13\xc0\xbe!\
-?\xa6\xcbcH\x07T\xf5\x8f]\x19\xf6\xfa\x0bMO\
-A\xc6\x87O\xbb\xa6\xff\x0a\xa5\xca\x0e\x11\x00\x86.\x00\
-\x8f\x08\xfc]\x81\xca:\x05\xbf\x99\x17\xe6\xfa\xbe\x9f\x08\
-\xb7\x9c\xabb\x04g?\x0c{\xea=?m\xa3Wu\
-e%\xe9\x0a\xcc%-9\x7fX\x90\xda\x00F\x8d\x9f\
-\x8a\xa8\xe8X\x9f\x1b]\xc9\xb7i\xdd2\x94\x95\x14\xc1\
-\x0e\x92R;#g\xe8\x18\xd7\x10\xa3\x08\xda\xe7\xa3J\
-\xdaW\x9b\x15\xcc\x13,\xb4\x9d\x92^\x87;\x072\xf6\
-\x06\x10\x0c\xeb\x994\x01\xee\xa6 \xfe\xf0\xc7o\xfe\x15\
-\xd4\x9a\x1aM\xfa\xa6\x1c\xa7t[\xb9\xe0\x94\xad\xc2h\
-\xa5h\xe3\x04p\x1d5\xd3\xfe\xd9}\xc5\x96\x80\x94?\
-\xfc\x0cq\x97\x9c\x0b\xdb\x0bt\x8c\xe1\x0c\xaa\xbc>\xae\
-b\x99\xc6\xeb\x1b\x9c\xf86O,\x00\x03\xd2\x81\xbb.\
-\xd0K\xb7\xc8&\xa9s\xb7\xa1\x09\xf8\xfc4\x01\xf6\xed\
-\xde\x86C\xfbv\xea\xb2l\xbc\x7f\xef\xfe\xfe\xf1\xfb\xfa\
-\xfa:lZ\xbb\x14\x15\x86e\xbc<\xa4\xa4uC\xff\
-!\xa3\x5c\xdb\x92y\x937\x16\xbf6K\xda\x8f\xfa\xac\
-?\x0c\xbc\xb7\x82_5{\xc66\xe2\xe51\x15`0\
-/[\xf5g\x11\x81\x0d\xc3\xe1\x89;\xeeBc\x91H\
-\xbe\xd5^\xddV\xfd`5\xfc\xd1\xaa\xd1f\x09`\xef\
-\xe0\x9f\xd0\xa6\x89\x9a\x9fus\xe5\xb4\x9fy\x0eII\
-@\xf7\x8f\x9f\x82\xe2\xd4\xea\xd5\x02\x22\xd0\x9ds6\x01\
-\xb12\xfai\xce\xf7\x16\x87\xb8f\xfc\x89Z\xe7P\x07\
-]\xec\xa3\x225\x96\x91\x0e8D`sXPD\x22\
-\x8d\x0d\x0dX\xbd\xe4{\xd7\xaa<#h\x9f\xbdO\xff\
-\xa1\x88\x89w\x17-\x95\x8bF\xa2\x12oZ\xb7\x94\xb4\
-\xfef\x81\xf0\xe5\xc9S\xa4i\xe9=\x90=h\x84\x7f\
-$A\x15\x93\x93\x11\xf9\xe5\xc0\xd3\xdf\xf2\xab&-\xb3\
-\xd9\xe7\x95\x22Da\x091\xec\x0d\xf7q\x87\x10\xfdq\
-\x0b\xfe\xf4 \xea\x8f\x1c5\xa4\xa3\xbb\xd5\x88n\xab\xe6\
-\xad\x0f\xe0\xd1Z\x1d\xda.\x01\x0c\xfa\x19\xfdr\xc3\xb3\
-\xe6Y`~$\xdfz\x15\x12~4\x95#\x09\x0c\xf5\
-]{\xcd\x99\x0d\xa8Z\x91\x85\xb7%#\xda\xf5\x1f\x16\
-\x85cw\xb1\xd8\xf0w\xd1 \xe0\xf2a*[H8\
-\xc2\xcc\xec\xc9\xd8\xed\x02h.\xe8\x92\xe0\x1d\x9b\xd7\xf9\
-\xae\xe9\x9a\x80^\xd9\x83\xd0)=\x83I4\x0d\x844\
-6\xad\xa5\x9by\x14so\x90\x9e\xd1\x13}\x07\x0c\xb3\
-\xb4a\x98f\x03\x1b\xca\xf8\xde\xcf\x14\xe1\xe6\xa8\xaf\x8e\
-\xad@fL\x83?rs\x89\xc0\xd4%\xf0\x1b\x12O\
->\xfe\x14\xeav\xef\x15\x95\xfc\x94\x8c\xd5s\x17\xa2\x0d\
-\xa3M\x12\xc0\x9eA?\xa7\x9f\x80\xcd#\xbf\xce\xee\x87\
-0W\xb7\x90\xb8ht\x9f\xfd\x14\x1c\x11a\xecV\xda\
-\x0b5\x00\x22\x008\xc3\x80fmb\xce\xfeP\xbc\xba\
-Al\xf8K\x8e\x01\x9e$\xad\xbf3\xc4^\x9f\x9eI\
-\x02\xacp\x16q\xb5\xc8]\xb1\x00\x95\x15e\xe8\x96\xd5\
-\x17=\xb2\xb2]\xcbrE\xf7pw\x05\x96\xa0\xb2\xbc\
-\xd4\x94V\xd7\xcc\xbe.\x02a\xde\xcf\x06AiI\xe1\
-\x85y\x0a\x0e\x09L\x0d\x7f\xc8\xa9\xc2\x94.u\xfe\x18\
-\xc2\x85@\xdak\x9eq\xd0\xec^\xf8\xdcK\xa8\xd9\xb8\
-Ew_\xdd\xec\x08\x05Wf\xac\xfe\xfe\x0b\xb4a\xb4\
-M\x02\x18\xf8\x0b\xba\x08\xe35\xf3\x93\xf8kY\xd2\x8d\
-\x17#\xe9\xfa\x99\xe2\xa6S\xe7g\xd1%\xf0\x08\xba\xca\
-q\xd7v+\xcaj\x15\xfc\xea\xfbp\x94\xd7\x89\x8b\xf7\
-\xf6)*\x86\x1aF\x92\x99}z\x8b~~\xc0\xe14\
-\x17U\x15\xe5.\xa1\x0f\x8fd\x7f2\x91E&\xf4c\
-\x1e\x9b\xd6,Fu\xa5\x7fG\x9f\x8c\x9e\xfd\x91\xd9{\
-\x00\xf7~\xc6\xbd\x00\x8cat\xdf\x1b\xa0{\xb9\xadQ\
-\xb0R\xd0\xbb\xa6S\x82o\xce\xae6\xa4b\xdd\xaf\xd7\
-\xb9k\xe324\x81\xa2\xd7\xfe\x89\xaa\x15k `\xaf\
-\x1b\xba\xaf\x99\xf3.\xda0N\x8b\x00\xee\xbd\xf7\xde\xcb\
-H?\xef\xd2\xd3I\xe3\x99g\x9e\xb9)\x90\xf4\x1dM\
-\xaa\xe3\xba\x1f\x0a\xaf\x8e\xack\xe4\x8e\xc16\x85\x85`\
-\xdbm\xe7\xa21\xdc\x89\xabg\xd2}\xe6\xcc\xaa\xbc\xf7\
-|\xf6w_\x99[q\x168\xb5\xf7\xaa\xa9\x97j\xfc\
-\xdd\xf7x)7\x0cs\x0fX|\xdc#\xec8&\xc5\
--\x17\x8e\xe5S\x9c7\xe3*aV\x16\xce\xf9\x8c\x9f\
-e\x1b\x1d\xefs/\xbcJ\xf4x>\xf8\x86\xc9=\xa8\
-\xab\xab\xc6\xc6\xd5\x8bQ[]\x89\x1e}\x07!#\xb3\
-\xaf\xb0\xec\x98Y\xe1\xb1\x02\xc1\xd2=\xe4\xdd\xac\xe7\xbf\
-\x93aI\x0d\xf8\xcb\x88\x0a\x8by\x00,\x81\xd7\x84\x83\
-!\xae6\x1c9\x16\xbf\xfdoT\xce_l\x08\xa7\xc3\
-]\xdd\xd7~\xfb\x92u)\xb7^\xb49\x02\x18\xba\xa7\
-\xb2\xcf\x88]\x95\x86\xedc\xf5/\xa7`l&\x8e\x9f\
-\xd7\xd7\xe5|\xf5\xcc\x8b=A\xd8\xe6\xe7\xd9s\xbe\xb2\
-.\x12\x81t\xb8\x08@c\x0b\xd8u\xca\x81\xbb\x16\x84\
-\x0b\x8d^!J#f&\xccEL\x08\x7f[yo\
-\xfc)\x1a\x02`i\x07\x8b\xbe3\x13\x80\x1d\xc1\xf7b\
-\xd2\x85b\x82\x11\x19\x1ck\x88\xf0\xd3\xf9\x00\x9d\xbbf\
-\xea\xeei\xd5\xdas\xc3h\x0c\x89\xfb\x0a\x81W\xe6\xf3\
-\xabgB\x98\x8a\x8f&\x97\xfa#\x06L\x04\xda.\x82\
-\xd9\x00H\xcfK\xff\xf3\x19\xca\xbe\x9a\xcb_v\x0c<\
-\xdac\xed7\xc6\x05\x03m\x0am\x8e\x00.Z^r\
-^\xe7\xe2\xfa,}H\xffKQC\x1d\xd8~\xdbD\
-4D\xb9\xa7\x9c\xfa\x09@\xf3\xc8\x9awh&\x00C\
-\xf1p\xc7\xdf\xdc\x87\xab.\xd0k\x00oo\x0e\xc5\xa7\
-\xbb\xc5}\xff\xc1Q\xdb10j\xbb(Y\x1f|\x1a\
-\x80j\xf6\xa7\xe7:\x02\x08\xc4\xd4\xee\x01%\x80@l\
-\x06,\xa1e\x8c\xee\x89m\x00F\xb3\x8bF\x16\xbdn\
-5\xf5\xc0}\x9f+\xc2G\xfahr\x19\x12\xc3\x1a5\
-\x919D \x9a\xf8\xc3\xea\x0a\xd0\xf9\xdau\xf5(\xfb\
-z.J?\xfbZT\x12/\xf5X\xf7\xf5]\x81\x97\
-z\xebA\x9b#\x80+\x16\x97LO,k\xe8\xc2\x8b\
-S\x9f\x10\x81]\xb7\x8cES\x88\xdb\xfa\xee\x22\x00\x81\
-\xe5\xde\xd5\x05\x10\x15\x8fES\xe6#\x00\x8f\xfb\x03K\
-\xc2\x91{\x82\xaf\xfe\xc7\x86T\xe0\xe2\xc4\xb9p(M\
-\xc6\xa4\x98\x98<\xdd\xd0B\x1b\x88\x80\xa5\x01XA{\
-\xcfI\xd3\xf8]\x00\x9f;G\x0b\xe0\xeeT\xa4\xf0\xe3\
-\xb2\xd2\xe7\x91\xc7\xe3_)8%\xf8\xf6\xceS\xc3+\
-0\x22\xb5^\x1f\xcbH\x04Bb\xd0\xc6\xf3\x1c\x1b\x1a\
-\x88\xf07\xb8\xae+\x16\xad@\xd1\xfb\xb3\xcd\xa5\xe6\xdf\
-o\xe2\x9d\x1e\xeb\xfewc\xc0/\xa0\x15\xa1\xcd\x11\xc0\
-\xb5\xf3K.\x8f\xa9j\xf2l6\xa72\x9f\xa0xP\
-g\x1c\xbe\xc4m\x90\xbaz\xc6\xc5zO\x83u\x7f\xf6\
-w<\x86\x87\x9e,\x98\xeeF\x0d\x00\xf8\xf97\x91(\
-\x10|\xe0#9\xb4\x18\xd3\x13\x7f\xb0\xddXS\x02\xe0\
-\x09\x12uZ, \x00;\xf7\x988\xd5\x9e\x0d@t\
-\x03^\x5c\xad\x8cq\xcd,*?\xde[\xcb\x14l9\
-\x0a.n\xea[\x8dk\xb3j\x189\xb0\xd1%0v\
-\x0d\xe8\xb8-\x15|\xef\xc7U\x09\x01T\xad\xde\x80\xc2\
-7?\x14\x95\xc8\x17\x99\xb9\xff\xbd\xd2F1\xb7Z\xb4\
-9\x02\x98\xb8\xberD\xef#u\xba\xfd\xfeY\x8a\xe2\
-\x91\x19\xd9(\x1a\xde\xc5O\x00\x9c\x11\x00.\x01\xe8\xc2\
-sF\x08@\x09\xe0\x12\x9d\x01\xf0\x995a\xf8\xe1\xa0\
-\xf8\x13_\x93\x13\x96\xa1kX\xbee\xd9\xd0d]\x1a\
-\x80Q\xd04yX\xfc\xfdg\xccxV\xe9zO&\
-N\xb3o\x03\xb0\x1c\x81\x10\xf4\x03\xec\x8c\x08\x181g\
-\x8b\x82\xef\xb6\xf1\xfd\xcfK\xaf\xc3\xfd\x83+\x18\xad\xb9\
-\xf1\xae\x82.\x01\xfdQ\xc1o\xf4\x0b\xbe\xf7X\xbdy\
-'\x0a^|KwO\xc3~\x13\x0b2s\xbf<\xdf\
-\xc6\xa3\xb4Z\xb49\x02\x88\xa8S\x9d\x97/(\xbb,\
-\xb2V\xd5\x7fJ\xd60!H%]\x80}\xbf\x18\x86\
-\x8bn\xba\xce\xe3\xa0\xa9\xa1Z\x1b\x80-\x02\xd0\xba\xe9\
-\x8b\xccH\x00y\xa5\x0e\xdc27BX\xc1\xa9\x160\
-#\xe9\x07\xae\xbf\xb6\xc5?W\xdb\x05`\x08\xd4\x12B\
-\x00v\xb5\x09\x16\x81P\x02`>\xaaj\x91\x06\xe8\x8e\
-\xbee(8z\x08=z\xe7\xf8f\xfd\x05\x94\x17^\
-`\x0fCl\x22\xad\xff\xbf\x96\xf1\xabh\x8f\x98F\xbc\
-5\xdeh\x08\xd4$,4\x00z\x04\xbf\xa1\x11:b\
-\xd0\x1ck\xf7\x1c@\xfeS\xaf\x81\x0fu}\xd6\xfa/\
-F\xd8|\xe4V\x896G\x00\x14\xe9\x85\x0d\x89\xd3V\
-V^\xe2h\x02\xa7\xa9u\xbf\xe8\xfa\xf8\x08\xf4\xff\xe8\
->\x84\xc4y\xc7\xb8\xcd\xf3\xfcg\x7f\xff5/:\xc7\
-\xdd@\x00\xe7{>g\xa5\xfa\xdb\xb5\xc7VD`\xe9\
-\x11\xf10\xe0\x14\xaa\x05\x84\xbb\xb5\x00\x91\xd5\x9e\x12\x00\
-W\x18\x89\xfb\x92\xb9\xa77\x0c8a\xeaU\xe2\x96\xdd\
-p\xe1=\xad\xad\xa9\xc2\xd6\xb5\x0b]S\x89S\xd22\
-\xd0g\xe0H\xdf\xbc\x7fc\x5c\xd1\xa8\x00g\x7fP\x17\
-\x0aI\xe3\xfe\xc4\xd7\xfc*\x1aB\xbc\xbe\x9eZ\x04\xa7\
-Cs#\x93\xda\x0fM\xab\xee)\x14*\xf4\xf5T\xf0\
-=\x8b\xa1\x14\x86\x86@\x8e\xf5G\xf3q\xf4\xc1\x17!\
-0E\xee\xcb\xda\xf0\x99\xe0k\x8d\xad\x1fmr\x22\x10\
-\xc5\x8e\xec[\xe9'}\xdf7U\x1d\xdd\x5cm\x15\xd1\
-\xe7\xf4E\xb7\xe7oto\xb3K\xa1\x15b\xa3\x86\x08\
-\xe8\xc3\xb0\xf6\xf4\x07\xd8K\x825\xc7\xbc\xd2\x10\xfc\xda\
-B\x0b\xc8L\x06\x1e\xbaH\xd5\xdf\x92\x01\xaf\x10\xab\x9c\
-\x80\xaa\x9d8\xc6\xf06\xad\xfe<\x02\xa9\xaf\xab\xc5\x96\
-\xb5\x8bPS]\xe1sKHJC\xf6\xe0\xb1\xaeI\
-E\xc6\xde\x00\xb7\x1c\x8c\xcf\xa2\xe8\x1bq*\x9e\xf7\x7f\
-\xae\xb8F\x04xx}\x5c\x19\xfa\xc45\x80\xee\xa2\xa0\
-W\xcf\x19BM\xb7a\xa6\xf3\x8bU\x83\xe0s\x8e\x8d\
-\xc5\xa58|\xe7\xd3\x1e7f\xa6O\xf5\xdc0;\x05\
-m\x18m\x96\x00(vd\xdf\xf6:9\xfc\xc6J\xf1\
-L\xb9q\x0aRn2\xac\x09`\x091\xf3\x9c\xb3(\
-\xc8u\xce\xdf\x18\xe4\xd1\x15\xe1XzT\xac\x05\xdcq\
-\xbe\x8a\xc1]9i\x1b\xb3\xc1\x19\x0649\xc2,\xe4\
-\x1c\xf3\x87\xfb\xbc\xa9\x09\xbb\xb7\xe5\x22\xb5K\x0f$&\
-1>\xcbeH\xa7\xb1\xa1\x1e[s\x17\xa3\xaa\xc2<\
-\x158&.\x09\xfd\x86M\xf0o$\xc2\xc8\xb3\xdd\xfe\
-\xbf7\xde\xcb?(\xc8+\xe4\x87\xf9\xe3\xc0JL\xef\
-V\xe3K\x9b9\xb7\x9f\x0a~}\x83{xO\xdbU\
-\xb0 \x00\xb5\xbe\x0e\x07o~D\x90;4\xf4\xdc\xf8\
-\xa9\xc5.'\xad\x1bm\x9a\x00\xb6\xf7\xbd\x9d\x0e\xf6/\
-#\xbfQn\x17\xd5\xfcP\xf4\x82\xb4\xfe\x19\xcf\xfd\x12\
-\xd1\xa3\xfbj\x83\xf9\x03p\xbe\xde\xe3\xf77\xbb[}\
-\x1cd\x7f\x89\x03\xbf\x9a\x1b)\xd6\x02H\xdb\xf1\xf0L\
-\x95/\xf4\xda\xfbq\xae\x99\xe9\x8b\x88\xc4\x10\xa6 \xff\
-\x10\xf6n]\xebr\x8a\x8e\x89Gzf_\xd7R^\
-\x05\x0eS\x5c\xba\x13\xd0\x8e\xf5KQ^z\xcat\x1f\
-\xaf`GE\xc7\xa1\xffp\xba\xf5W\x84\xee\x9e&\x8d\
-\x803th\xcc\xe8\xa7\xb9\x0a\x96\xed\x05\x17W\xf6\xa8\
-\xc1m\xfd+=\x9b=\x19^\x94W\xd5W\xb5\x82\xcf\
-;\x82I\x04\x07\xae\x7f\x04j\xa3f\xcf\x0f\xc5x\xaa\
-\xc6\xf4\xdc\xf8\x89`\xb0\xb2u\xa3M\x13\x00\xc5\xf6\xbe\
-\xbf\xa3\xdbh\xd0%\x99\x86o\xe7\xeakXH\x5c$\
-\xb2\xde\xb9\x0d\xce\xce\x89\x1c\xe9\xe1\xef\x03\xe0OR\xb3\
-\x14\xc4\xd0\xe2\xb3\xe2<B\xb4\x80%G\xc5#\x02T\
-\x0b\x18\xd2U\xdc\x9a[\xa9\xff,\x7fU\x10^\xeb\xb0\
-q\xd5|TU\xea[\xf3\xb0\xf0Ht\xee\xde\x07i\
-\xe9Y\x08\x09u\xe7\xbf\x89\xee\xfe\xbbi\x05JNY\
-\x8f^\x84GF\xbb4\x81\x88\x08\xf3l\xed@\xb5\x81\
-\xe5\xfb\x80O\xd6\xf1\xab\xe9\x90\xa4z\xbcxN\x99\x9f\
-\x00\xe8\x8b\xa1j~c#t\x8b\x83x\xad\xbd\x05!\
-\x1c\xba\xf5i4\x96W\x89r\xda\xb5\xd7\xa6\x8f\xedm\
-\x8c\xd8\x0a\xd1\xe6\x09\x80b{\x9f;\xe8>\xba\xf4S\
-\xcd\x8c\xb5\xb7\xfe\x17\x1a\xd1\xaf+2\xdf\xf8\x95\xeb\xd3\
-\xe0Zo\xdd\xd1u.\xda\xf3\xcf\xdd\xe2\x9b\x85\xce\xac\
-IP-\xe0f\x1bZ\xc0C3US\x16t\xd7\xc6\
-\x16\xddJ\xbd\xb7i\x03(>u\x02;7.c\xe6\
-\x8b>\x0a\xdd\xc3\xaf\xcf\xc0\xd1HHNs\xed\x1e\xb4\
-w\xebj\x14\x9d\x14\xd7u\xef=\xe9\xbe\x82\xd9C'\
-\xba\xb4\x0a\xa3\xbfq\xe1\x8f\xa6\x04Mv\x87\x83E\xc0\
-\x8b\xf3\xf8\xd54\xd6\xa9\xe2\xbfS\x8b\xa0\xd0\xcf\x09\xd1\
-\x16\xbfA\xfb\xd5\xa0\xc0Z{\xdd\x91\xda\x14H\xd8C\
-w\xbf\x84\xfa\x02\xff\xb2D\x9dA\xd0\x9dVN\xafM\
-\x1f\x09\xf6/j\xddh\x17\x04@\xb1\xad\xcf\xef\xe9\xce\
-@\xdcy\xd9\xde\x17\x97p\xf1p\xa4\xdf\x7f9\xb8*\
-\xbfI+`\xb8{\xc8@\xb5A\x1e\x0f\xbbl\x01b\
--\xe0w\x1e-@\x97<K\x88Uv\x96\x8d\x0e\x22\
-\x1b\x80\x96T\xb6\xaf_\x82\xb2\xe2\x93\x5c\x82\xa2[y\
-\x0d\x1b7\x03\xa1D\x98\xdd\xfc\xa6\x22o\xc7\x06\x9c<\
-\x9eg\xdd\x8f\xf7\x12\xc8\x90q\x88\x8bO\xe16\xf7<\
-\x83\xa1\xd7\x8d~D\xf5O\x9f)\xc2\x11\x8dOF\x9f\
-D\xa7\xb0z\xbep7\x93\x08h\x90#\x0f\xbf\x81\xda\
-<\xde\x06\x85\xae\xb0\xe3zo\xfe\xcfJ\xab\xe2h\xad\
-h?\x04\xd0\xfb.\xfa,\xdf\x90\x972\x83\xff\xb4\xee\
-\x97\xdb\xe5w\xd3\x10?s8\xe9\xb0\x86CqM\x19\
-\xe6\x91\x81W\xb57TS\x1f\x01\xf0\xba\x0c\xfe\xf4\xf6\
-\x11-\xe0&+-\xc00\x22\xa0\xbd\x0dS\xfdW9\
-|\x05\xd8\x1a\xbf\xa7\x17\x95\xe5%\xd8\xbc\x86?\x17\x81\
-\x22\xb5KO\xf4\xecg\xde\xdc\xe3\xd0\xde\xad8~h\
-\x17\xbb\x1fop\xa3\xa3\x02\xbd\x06\x8e!ZDgs\
-F\x8c\x13,U\xbd\xb3\xeay_O}\xe3@A9\
-\xb8x:\xa7\x08\xe3\x92k\xec\x0b\xb9MB\xa0NG\
-\x9fz\x0f5\xdb\xf2D\xc54\xb3\xf7\x96\x0f\xe7\xa0\x8d\
-\xa2\xdd\x10\x00\xc5\xd6^w\xd3)\xc2\xb9\xe4\xa92\xdd\
-.*\xf3\x01\x95\xb0Pd\xfe\xe5\x1aDd\xa6\x92\x0e\
-/i\x9d#\x09\x11D\x86\x99\x8b\x83#\xd4.'V\
-\xab\xaf\xed\x0e\xf8\xa4T\xc1C\xcb\xed\xd9\x02\x06\x1b\xb5\
-\x00@\xdf\xea\x0b\xfa\xf4B\xd5\x9fa\x14\xdc\xb3u\x0d\
-N\x9d8\xcc\xcc\x8b\x97\xd6\x06\x8f\x99\x86\x88\xa8Xf\
-z\xc7\x0e\xee\xc6\x91}[`\x0bD\x97\xce\xec?\x12\
-)i\xdd\xed\x85\xf7\xdc\xc4\x9b\x8fwV(\xd8x\x98\
-_Uo\xce,\xc7/zh>\x16\xd2\x5c\xf5\xdf\x10\
-\x86\x9e\xe6\xbf\xf8\x09*\xd6\xee4O*\xf2\xe3\xba>\
-[>\xf88\x80\x07kUhW\x04@\xb1\xb5\xd7\x1f\
-\xe8\xcc\xac\xe5\xe4\x17\xeew5\xbf\xb8\xb0\xce\xf1\xe8\xf9\
-\xcc\x8f\xe1\x88\x0e\xf3\x0c@\x93_\x84\xd3M\x06a!\
-`\xb5\xf8\xaeS\xe3\x88\x81\xce\x08\xc8\xd2\x08\x14\xec\xb5\
-\xa3\x05xl\x01\xa2a>\x9e\xc0\xc3\xe0n\xa5\x05\xd0\
-5\xfc\x1bW~\xefy\x166\x12S\xba\xa0\xcf\xa0\xb1\
-\xbax\xbe\x96\xd9\xe3p\xf2\xf8\x01\x1c\xd8\xb5^\x98\x8e\
-\x16\x19\xbd\x87\xa0s\xb7\xde\xa6\x95\xd9<\x03G\xbdg\
-z\xfe\x82\x1d\x0a~\xd8\xc9\xaf\xaa\x93S\xab\xf1xN\
-1\x98B~\x1a\xea?\x0d[\xf0\xe6W([\xbcI\
-\x94\xe1\xdf\xf6\xd9\xfa\xfe\x1b\xb6\x0a\xa0\x15\xa2\xdd\x11\x00\
-\xc5\xd6\x9e\x7f\xfc\x159\xfcC\xb0\x8e\xdb\x85\xd8QY\
-\xc8\xb8\xd7\xfb}G\xaf\xe0zf\xa38\x9dn\xed\x80\
-\x92\x01=\xf2\xfa\xf9\xda\xa4\x19\x9a\x82\xd7\xed\xc1\x00\xb5\
-\x00\xaf\x80\xb3d#\x10\xf5\x9f5Rp`\xf7&\x9c\
-8\xc2\x19[\xf3\x04\xec7b2b\xe3\xcd\x03+\xc6\
-[P\xa3\xe0\xfe\xed\xab]\xf3\x09\xac@m\x0a9\xa3\
-\xa7!,\xdc\xbf\xfb\x90\xbf\xd7\xa0\xbaW\xe16\xfam\
-y\xde\xe7\xd9sB\xc1\x7f\xd6\xf0\xabjFd\x03\xfe\
-3\xba\x00\x01\x09\xbb\x0d\xf5\x9f\x1eO\xbe?\x1f%\xdf\
-\xae\xd6\xdfP?\xd9\xec\xbe>[\xdf{\xc6\xf2\xe1[\
-)\xda%\x01Pl\xe9y\xcf;\xe4p\xbd\xd9G\xd5\
-=x\xa7\x9f\x8dA\xca\x15#4j\xbca\xc6\xa0\xab\
-Qw\xf8\x89\x80\x1e\x9d\x1e\x0d\x81\xb3\xbe\x805\x8a\xb0\
-\xb7\xd8\x81\x1b\xe6FYk\x01\x17\xa9:A\x17\xb6\xf4\
-\x86{\xd8\x19\xfa\xa3\x1f\x09\xdd\xb0\xfc[45\xf2w\
-\xdc\x8c!\x82\xdf\x7f\xf8d\xf6(\x82\xa1\x0fO/\xcb\
-\x8bOb\xdf\x96\x15\xae\x8f\x86\xf0\xa1\xa0\xd7\xe0q\x88\
-O\xea\xec+\xff&\x22\xf1uM\xee\xa1\xfa\x86F\x98\
-L-\xdepe\xa4{\xff\xd7\xb9\xfc\xcdU\xe9$\xcf\
-\xb9\x13\x8e\x11\x05.0!g\x87\x85\x8e\x00\x8af/\
-\xc5\xa9\xd9K\x05\xcf\x85Y}\xb7\xbds?\xda(\xda\
-/\x01d\xfd)\x92\xbc\xd4\x15\xe4t(\xffI\xc9\x8b\
-&\xb5\xa7\xc7\x9f/A\xf4\xc0n\xf0\xb7\xde\x022p\
-\xf9)n2\x08\x0f\xf1\x13\x02s\xb8P\x1b\x0f\xb8\x7f\
-y\x84m-@$\xdc\xb6\x87\x0ba\xd6 \x8e\xe6\xed\
-$?\xf3\x12;m\xb8\xdeD\xf5\xa7]\x00c\xda\xac\
-{{QYV\x8c=\x9b\x97\x13\x82\xa9u=\xb2q\
-\xaf\x80\xcc\x01\xe7 1\xb5\x9bK\xd8\xeb=-|\xa3\
-iD\xcdp\xadq|f\x8e\xc3\xf5ue\x1e\xfe9\
-\xfc$\x06$\xd4A(\xf46\x09A;\xa5\xb8\xf8\xdb\
-\xb58\xf9\x9e\xdfX\xca\x18\x06|\xbd\xef\xb6\x7f\xdd\x8a\
-6\x8avK\x00\x14\x9b\xb3\xee\xa3_\x0d\xce%\xbf\x04\
-\x9eA\x90\x224>\x02=\x9f\xbf\x06\xce$\xcf\xc4\x15\
-\xae\xe0s\xfc\x1c\x0e\xa8\x84\x08\x14J\x04te\x0a\xdd\
-\xb8\xdea\x8c\x07\x97-\xe0\x97VZ\x80gD\x80\xb5\
-\xfd8O\xf57\x1a\x0ayC\x85t&\xdf\xa6\xe5s\
-P__\xcb\xbd\x7fDd\x0c\x06\x8e\x9e\x06CU\xd7\
-'\xa6\x98\x89\x85\xa2\xaa\xaa\x1c{7-E}m\xb5\
-+\xff\xd4\x99\xaa\xf5i\x99C\x11\x97\xde\x13\xac^\x82\
-b:a\x93\xc1\xbb+\xe9\x94`~u\xbd'\xbb\x04\
-Wt\xad\x0cL\xd89a\xb4S\x8a\xcb\x16mF\xfe\
-\xeb,#\xbf\xaf\x04>\xca\xde\xfe\xf6O\xd0F\xd1\xae\
-\x09\x80bs\xe6\xfdt\xb9\xde\x7f\xe1\xad\xb6\x9c'\x8e\
-\xcaNC\xd6\x13\x97B\x09\x09\xe1\x08\xbe\xc1\x8d\xe1\xa7\
-[$D\xe7$\x85*\xeeO\xfe\x12BP\xe8\xd25\
-r\xbc\x7fu\x14\x16\xdb\x98\x17\xe0\xd2\x02x\xea<\xab\
-\xa5\xb71BPp,\x0f\x07w\x89\xbfc\xd1={\
-8R\xd3\xb3|\xf1\x14\x8b\xf4\xa9{=\x91r\xda\xa3\
-hP\xe9>\x81\xd58\xb8m)\xea<\x0b\x85\x92\xbb\
-\x0e@rF?}d\x85\xfd\x1a\x8cd\xa0\x0d\xf3\xdd\
-V\x05\xab\xf6\xf3\xab+\x15\xfe{\xfa\x15\x9b\x05:@\
-\xbb\x80b\xf0\xabX\xbb\x1b\xc7\x9e\xfbRTd\xdff\
-\xef\xf8\xe7Eh\xa3h\xf7\x04@\xb19\xf3\x81\xa7\xc8\
-A\xd3Oc\xb7\xc1\xc9\x17\x0dD\xfaM\xe3=A\x02\
-\xd4\x02\xbc-\xa6\xd7\xadI\x1b\xde\x1fno\xa5\x13\xbf\
-\xdc\x90(\xd4\x02\xb2\x88\x16\xf0\xc0L\x7f\xb3\xcfk\xd1\
-]\xd7,\xd5\x9c\xe9\xa6b\xf3\xea\xb9\xa8\xd5\xac\xe0\x83\
-!\x0e\x9d\xf03h\xcc\x0c\xd2-\xf2/b\xa2-x\
-C\x93\xdb@GU\xf6\xa6&\xf3\xd1\x88\xc6\x86:\x1c\
-\xdb\xb1\x0c\x91\xb1\xc9H\xcd\x1ab\xf27V\xba\x9a\xca\
-\x228\xc3\xa3\x10\xea\x8c0\x87\xf1\x9cl<\xa4\xe0\xcb\
-\x8d\xfc\xea:(\xbe\x0e\xff\x18U\xe0\x7f\x18\xdb\xad\xbf\
-\xdeO1\x84\xa9\xdav\x08\x87\x1f\xfdT?}Q\x8f\
-\x15\xfdv\xfcc<\xda(:\x04\x01l\xea\xf1 \xad\
-\xd1\xdf\x93\x9f\x7f\xf7\x16\xcd\xb8\xae\xb6\x102\xee>\x1f\
-\xf1\x13z\xd9\xb4\x05\x98\xfdtZ@\x936\xbc\xff\xfc\
-\xbe\xed\xf1X|J3J\xc9\xc0/\xc6\xa8\xe8\x97\xee\
-n\x91\xe8\xcf\xbb\x9a\xd9w\xed:W<G\xcfOs\
-\xee\xca\x92\x0a\x9f*N\xad\xf5y[W\x0a\xe7\x0e\xa4\
-v\x1f\x80\xa4\xae\xfd\x5c\x82M\x17\xd05\xa9\xfc!E\
-E\xe0\xe0\xea\xff\x93\xee\x86b\xf8(\xa8\xc2\x88XW\
-Y\x82#\xdb\x97 $4\x1c]\x07L@XD4\
-3\xd9\xe3\xa5\xc0\x1b\x8b\xf9\x86\xc0\xa8\x10\x15?L9\
-\xea\xa6an\xdf\x1f\xb02\x02*\x06\xbf\xda\xfd'p\
-\xe0\xde\x7f\x1b\xee\xa6+\x94m\xfdv\xbe9\x10m\x14\
-\x1d\x82\x00(6\xf5x(\x15\xeeEC\xdd\xd8!\xdc\
-/\xd5\x11\xe1D\xefg/GxF\x82\x85\xe0\xf3\xdd\
-\xf8$\xe0v\xdbS\x11\x8a_\xacO\x12j\x01]\xc8\
-\xedo\x9a\xd0\xa4\xcd\x9a\xf1T\xf0\x14f\x87\xba\xcaR\
-\x14\x1f\xdb\x81\xca\xe2c\xccDh\xd7\xa7\xc7\xd0\x19p\
-\x84\x86\x19<\x84\x97\xe6t8\x17\xac~}}m%\
-\x0eo]D4\x06\xb7M\x82j\x00]\xfbO@x\
-T\x9c\xa9\x9b@\x8d\x86\x7f\xf9\xc6\xe1^\xd1\xcb\xc1\xe7\
-\xe3\xf3\xd15\xaa\xfe\xf4Z\x7f\x83_\xfd\x892\xec\xbb\
-\xf5m\xce3\xb9\xe2\x1e\xed\xb7\xf3\x0dN\x9dj\xfd\xe8\
-0\x04@\xb1\xb1\xfb\x9f\xc7\x92\x17\xbc\x98\x9c:\xd9\x15\
-\xd5]\x19\xc2\xbb%\x10\x12\xb8\xccE\x06\xf6\xb4\x00\xb3\
-\x9b\x8f\x04\x9a47\xd1\xf8\xdf\xbb5\x1eK,\xb4\x80\
-\xebF\xa9\xe8\x95\xc6\xae\xf1\xaa\xe9\x04\xe2p\x1e\xd4\xd7\
-T\xa2\xf4\xf8\x1e\x94\x17\x1e\xd0\x8d\xdd\xc7\xa7\xf5Br\
-\xa6\xb5\xba\xce\x0b\xa0\x88\xbdMd\xd0PW\x83#\xdb\
-\x16\xa1\xa1\xb6J\xe7\xef\x08q\xa2k\xf6xD\xc6%\
-\xf9\xc3{\xfc^[ \x9e\x12<kH!\xce\xeb\xec\
-\xf9Z\x90\x1dc\xa0\xc0\xf8\xe7\xdb\x14\xa4\xa2\x1a{~\
-\xf9\xa6\xa8\x04*\xfa\xef\xfa{,\xda(:\x14\x01P\
-l\xec\xfe\xc8\xef\xc8\xe1\x15\xb1\xe4\xa8H\x18\x9f\x85\xee\
-\xf7L1\x0b\xbe\xeb\x9c\xe5\xe69\xb7i\x0f\xd8M\xb5\
-\x80\x5c\xfbZ\x80h>\x80-\x18\xb4\x08\xda\xea\x96\xe5\
-\xefGY\xc1^456 c\xf0\x85\xae~\xb8\x0f\
-6k\x86\xc2q\x14\x19\xf9\x9a\x1a\xeaqd\xc7b\xd4\
-U\x951\xbb\x12t\xc2P\xe7>c\x10\x9d\x98\xa6\xf3\
-\xffl\xbd\x82\xcdG\xf8\x19\xbb\xa9W\x19n\xe9]\x8a\
-\x96j\xfd\xddNM\xd8q\xd5\xab\xbaBd4\x1e\xa1\
-\xfdw\xbd&\xf8\x94i\xebE\x87#\x00\x8a\x8d\x19\x8f\
-\xfe\x87\x1c\xbc\xbb\x85rK\xa3\xcbM\xe7 \xe5\x92\x9c\
-\xe6w\x05\xb4\xfe\x0c\x12\xb8\x87h\x01\x8b\x0b-\xb4\x80\
-sT\xf4\xee\xe4\xcf#S\xe0-\xc6\xe8E\xa0}\xf5\
-\xea\xb2BD%\xa4\xd9\x8e\xc3j\xd5\x05N:B\xa0\
-\xf7;\xb6c)j*\x8a\x84\xf1\xa8}#\xad\xf7(\
-\xc4\xa6t\xf3\xf9/\xdb\xa3`\xeev~\x95=\xb7S\
-5\x9e\x1f~20\x1b\x00\xa7\xef\xef\xcf\x88\x8a]\xd7\
-\xbd\x89&\xd3\xbed\xba\xd2N\x1e\xb0\xfbU\xc1\xa7L\
-[/:$\x01l\xc8x\x8cZ\x9a\xe8\xfc\xce\x1c\xbd\
-\x8f~\xae\x00])\xd8\xf3\xc9\xe9\x88\xeeO\xb7\xca\x12\
-\xb5\xfe|\x8d\xc0oD3\x93\xc0\xee\x0a'~\xb6.\
-\x00[\x807\x97\x01\xaa\xfd-\x05\xcb\xfe\xbf\x0dB\xa8\
-.-\xc0\xf1]\xcb\x85\xb9\xd4\xc6I\xcd\x1c\x8a\x84\xf4\
-\x9e\xae\xf3\xbd\x05\x0a\xde_\xc9\xcfEzd\x03\xbe\x9a\
-\xec\xdd\xaf\xc0\xfeD n\xeb\xef9\xee\xbd\xe9=\xd4\
-\x9f\xe2\x8c\x9e\xb8\xe3\xf5\x1a\xb0\xfbo\x82O\x99\xb6^\
-tH\x02\xa0\xd8\xd0\xed\xf1lr\xa0{a\x19\xfao\
-\xfa\xb9\x02\xce\xa4(\xf4\xfd\xeb%\x08M\x88\xf4y\xdb\
-i\xfd\xb5\xe7L\xa3\xa0\xc7\xff\x8f[\x12li\x01\xbd\
-:\x99\x05F\xb5ph)\x22P,\x1c\xb8\xfd\x7fN\
-\xb8\xca\xa2\xe3(\xd8\xb7\x9a\x94\x8bx\xfd\x807|R\
-\xb7\x01H\xee\xd6\x0f\x15u\xc0\xb3s\x1c\xc28\x8b\xa6\
-\x1dALh\x13\xb75\xd7\xbb\x89Z\x7f\x7f=\xd8\xf7\
-\xbb\x8fQ{X\xd8\xc0\x0f\xcf\xd9\xf3\xf2\x86\x16*\xee\
-\xb3\x8a\x0eK\x00\x14\xeb\xbb=q59|\xca.\x08\
-\x7f\xc5\x89\x19\xd4\x19=\x9f\x98\xea\xdb\xf6\xda\xb6=@\
-s\xce#\x81]\xe5\xa1\xf8\xe9\xdad\x88\xe0\xd5\x02X\
-c\xfd\x86SKX\x85\x0d\xa4B\xd8\xb5\xf8\xbb\xdc\x0c\
-\x8e5\xa4\xdb\x91\xbf{\x85{\xbf=\x8b\x9bRoj\
-\xa4\xa4s\x0a\x9e\xfd\xce\x81\x0a\xfeDF\xbc5\xe6\x04\
-\x86%\xd7\xf8\x9f6\x10\xc3\x9f\xf6\x5c\xbb/\xe0\x9f\xfe\
-\x8b\xaa\x1d\xf9\xfe\xf8fL\xc9\xd9\xfb\xd2\xc2\x00\x8a\xae\
-\xd5\xa0C\x13\x00\xc5\xfa\xae\x7fy\x81\xbc\xd4\xbb\xb9\x01\
-<\x15\xa1\xd3U9\xe8\xf2\x8b\xe1\x08\xb4\xf5\xd7\xce\x01\
-0w\x07\xdc\xe7wo\xb6\xa1\x05\x8c\xf2\xdb\x02xB\
-\xac\x1d\x19\xa0\x86\xbd\xfc\x1d\x0b\x11\x93\x9c\x89\x98NY\
-p\x84\x88g\x1f\xda\x82]\x8b\xbfEX/\x19\xd4V\
-\x94\x10\x12X\x86\xa6\xfa:q\xc2\x1e\xc4\xa6d\xe0\xfb\
-\x82s\xb0\xf7$?\xe0\xbd\x03\x8a\xf0\xe3,\xcfP\x81\
--\xc3\x1f`e(<\xf8\xd8\x1cT\xac\xd3\xec\x9d\xa0\
-\x195\xf2\x9c^\x91\xb3\xf7E\xe1t\xc1\xd6\x0aI\x00\
-]\x9e\x0a%\xa5\xb0\x80\xbc\xcc\x89\xc2\x80\xa4\xa4\xb2\x1e\
-\x98\x84\xf8\xd1\x19\x08\xb4\xf5\xd7\x9e\xebH\x80\xa2\x89j\
-\x01N\x5c\xb7\xc6\x9e\x16\xe0\x85h\x18\x90:\x95\xe5\xef\
-E\xf1\xe1\xcd\xaek*\xfc1\xa9=\x11\xd7\xb97B\
-4\xb3\xed\x02\x85\x22p\x0ctj\xaf\xebZ\xa1\xc3\x92\
-\x158\xbes)\x1ak\xab-n\xe4\xc6\xe6\xba1\xd8\
-P\xc4\x1fv\xbf\x22\xa3\x02\x7f\x1er*p\xd5_`\
-\x038\xf2\xfc\x02\x94.\xde'(\x19\xf5\x86\x81\xfb\xfe\
-\xfan\xb3\x0b6\x88\xe8\xf0\x04@\x91\xdb\xe5\xe9t\xb8\
-'\x09\xe9\xf6\xad2\xb6h!QN\xf4}q:\xc2\
-\xd3\xe34\xc1\x9aA\x02Fw\x22\xd7woN\xc4\xa2\
-\x936l\x01\xa9z\x89g\x8f\x0a\xa88\xba\xf9;4\
-\xd4U\xeb\x9ci\x17&*\xa9;!\x82>pF\xda\
-\x1b\xbaf\xcd\xde3\xf9\x1b\x1c\x14\x1b\xe9h\xc34\x92\
-|\x1e\xdf\xb5\x14\xf5\xd5\x15\xdcn\x85\x17\xfb\xab{`\
-i\xe9(n~r\x12\xea\xf0\xe1\x84c\xf6T\x7f\xe1\
-\xe8\x80\xff\xfc\xd8\xdf\x97\xa3\xe8\xdb\x9d0-(\xf3_\
-\xdc9p\xdf\xf3/\xdb*\xd0V\x06I\x00\x1e\xe4\xa6\
-\xcf:\x97\x1c\xe6\x93\x12al\x19\xecGdf\x02\xfa\
-\xfeu\x1a\x1c\xcePM\x90\xd3'\x81\x9d\xa5D\x0bX\
--\xd6\x02\xba\x12-\xe0\x86\x09\x0c\xc3\x99a\xbd@\xe5\
-\xa9\xc38\x95\xb7\x96\xf9\x0c\xaa\xeb\x8e\x0a\x92{\x8dF\
-T\xa2\xf9+\xeb\x8a\x0d\x17\x9f\xab\x95\xd5\x9fA\x06<\
-\xad\x80\xae\x1f8\xb1k\x19j+K\x98\xe9xQ\xda\
-\x98\x84/\x0a\xa6p\xcb(<D\xc5\xca\x99\x07\xddS\
-\xa79Z\x00_\xf5g\xb8\x91\xe3\x89wsq\xf2\xd3\
-\xcd\x86R\xd4\xe1\xd1A\xfb\x9f{\x0cm\x10\x92\x004\
-X\x97\xfe\xcc\x1f\xc9\xe19\x91A\x90\x22iJ&z\
-\xfcaL\xb3\xba\x00\xc6sm\x97\xe0\xce\x0d\xf6\xb4\x00\
-j\x0b0\x0f\x05\xfa\xed\x03\xf9\xdb\x17\xa0\xae\xaa\x84\x9b\
-\x86\xc3\xe1D\x97\xc13\xac\xed\x02B\x01\xd7{Z\x0d\
-\x01\xf2F\x04\xb4D@\xed\x16'\xf6\xacDM\xd9I\
-f8\xaa\xc1\xa4\xf5\x1d\x8f\xe7\x96\xa4\xb9w\xff\xe6\xe0\
-\xcb\xf3\x8e\x22+\xb6\x8e\xab\x05\xd8U\xfd\xbd\xe7'?\
-\xdd\x82\x13\xef\xe42\xee\xe4\x0b\xf7\xe2\xa0\xbcg\xf9v\
-\xa4V\x0cI\x00\x06\xac\xeb\xfc,\xfd\xda\xe6\x95\xfc\x92\
-q\xbf\xf4\xee\xb7\x8d@\xca\xcc\xde-C\x02\x9e\x7f;\
-\xcb\xc2\xf0\xa3\x95\xd6Z\xc0\x8d\x13\x9a\xa0\x15xm\xd6\
-j\xca\x0aP\xb0g\x990\x8d\xb8\xb4l\xc4w\xcbA\
- \xb0\xb6\xf8k\xce\x14q\x5c\xc5\xe8\xa7!\x01:4\
-X\xb0w\x0d\xaa\x8a\x8f\x19\xc2\xd0\x89A\xa3\x11\x93\xdc\
-\xc55%\xf8\x98\xf9\xcbd><;\xa2\x00\xd33<\
-\x1f\xeb1\x08\xb3\xa5\xd5\x9f\xe1V\xf4\xcd.\x1c}u\
-\x95HZ\xde\x19\x9c7\xeb\xc6\x80\x0a\xb4\x95@\x12\x80\
-\x01\xeb:?O:\xf8*\xd5\x9f\xfb\xf2C\x91\x8a\xe4\
-t \xfb\xb9)\x88\xeaC\xe7\xac7\x93\x04\x0c\xd7\xb4\
-U\xff\xfdz\xaa\x05\x88\x0du\xd7\x9d\xd3\xe4\x9e\x17\xc0\
-\x98\x01xr\xf72\xd4\x94\x17\xb0#\xba\xf4\x7f\x07\xd2\
-\x07NGH\x98\xe0\x1e\x16Cz&?\x9d:\xcf\xd7\
-\x0cl\x13\x01)\x88\x93y\x1bPQx\xc0\xe7\x9f\x9a\
-5\x02q\x9dz\xb8\xce?_\xaf`\xfd!\xc1\x94\xe0\
->%\xf8=c\x93Pn\xbf_{\xcep+Y\x94\
-\x87\xc3\xcfxI\x95iu\xf9|\xf0\x81\xa7\xafB\x1b\
-\x84$\x00\x06\xd6\xa6\xbd@\x97w\xd2\x99\x82Q\xda\x0a\
-a,\xac\xb0N\x91\xe8\xf7\xcaT\x84\xc6j\xb6\x14o\
-\x86\xe0k\xcf\xb7\x97:\xf1\xa3\x15\xe2\x0f\xcevMP\
-\x99\xb6\x80\xba\xaaR\x9c\xd8\xf1\x03w\x9c\x90:G'\
-g\x221s\xb80}\xc5\xc2\xc3\xbe\xc5\x9f\xad\x15\xf0\
-\xba\x06:u\x9f\x1c\x8a\x0emEi\xfen$w\x1f\
-\x84\xf8\xf4>\xbe0+\xf6*\xf8f\x0b\xbf\xeaNL\
-\xab\xc2\xdf\xc7\xe53\x84\x1fb\xd5\x9fC\x0e\xe5k\x8f\
-\x22\xefa\xcd0\xbfg6\xa1&\x07\x0b\x06\x1fx\xca\
-\xbf\xd4\xbc\x0dA\x12\x00\x07k\xd3\xfe\xfaSr\xf8\xd0\
-\xef\xc2\x96\xaa\xb8\x11i\xe8\xf3\x04\xdd\x0fB\xc1\xe9\x08\
-\xbe\xf6\xfaw\xb9\x89XX \xd6\x02~\xe2\xd1\x02\xb4\
-\x8b\x84\x8a\xf2rQUtP8\xc96m\xc0\xf9p\
-F\xc65\xabL\x9ac\xf1\xb7E\x04\x02m\xa0\xb6\xac\
-\x10\x11q):\xb7\xbc\x93\x0a\xdeZ\xc6\xaf\xba\x9d\x22\
-\x1a\xb0`\xe6!\x7f\xa1\x9a\xfa\xfd\x80\xbd\x99\x82nT\
-m?\x89\xbdw\xcf\xe5\xdc\xcd\x156w\xc8\xc1\xbf\x8c\
-lV\xa1\x06\x19\x92\x00\x04X\xd3\xe9\xc5\xd7H\x01\xf9\
-7|\xd4L\x00\xd1\x22\xfd\xa7\xfd\xd0\xe5g\x03<^\
-\x01\x0a\xbeq^\x80\xea\xd6\x02\xaeY\x9e*\xcc\x1b\xd5\
-\x02n\xd4\xac\x14\xa4Ci\xf9[\xbf\x17N\xaf\x8d\x88\
-\xeb\x8c\xe4\xde\xe3\x02.\x87\xd3\xb2\xf83\x88\xc0\xec\xee\
-9WDq\xfdn\xd5u\xc0\x13_\x8b\xa7\x04/\xbf\
-\xe4 \x12\xc2\x1a\xc4\xc2o\xd5\x1d\xf0\xa0\xe6`\x19v\
-\xfd\xfak\xees\x93t\xf6\x0d9\xf8d\xef\x80\x0b\xb6\
-\x15@\x12\x80\x00k:\xbdDu\xfb%\xe47Z\xef\
-chcI\xcd\xed\xfb\xf8X\xc4\x8d\xf2\xac\xa8S\x9b\
-'\xf8\xda\xd7q\xdb\xda$\xdbZ\x00E\xe9\xe1\xad(\
-/\xd8-\x0c\x9f\xdcg\x12\xc2c\xc5\xdd\x0b\xddc\x89\
-\xdc\x05V}\xdbD\xc0\xd0\x06\xec\x92\xc0\xac9\x0e\x94\
-V\x83\x8b\xc7\x06l\xc25\x03b\x9a\xdd\xef\xd7\xa2\xbe\
-\xb0\x1a\xdb\x7f\xfa_\xcf\x15S\xbf*\x1cz\xe8q1\
-c\xb7RH\x02\xb0\xc0\x9a\xd4W2\xc8K\xa7\x93\x84\
-\xfc\x92\xa3+5w\x85\xa0v\x80\x01\xafNFX\x9a\
-gM\xbd\x1d\x12\x10\x5co/q\xe2\xeae\xd6Z\x00\
-\xb5\x05\xa8\x0d\x0d8\xbeu\x0e\xd4&\xc6\xbe\xd9\x9e\xfa\
-\xea\x8cJDJ\xbf\xf3l=\xb3h2\x0ek6\x1f\
-\xd3\xdf\xc2\xda/\x22\x01m\x5c\x1e\x09\xbc\xb7B\xc1\xce\
-|~\xf5\x9d\x91\xb0\x16\xd7\xf7)\xc6\xe0\xcc\x9e\x16\xad\
-<\x87\x1c4h\xaam\xc4\x96Kf3||\xe1\x1b\
-\x86\x1e~\xcci\xabp[\x19$\x01\xd8\xc0\xea\xd4\xbf\
-M%\x87\xef\xc8\x0b\xf7\xe9\x9d\xac\xb9\x02\xd1}\x13\xd0\
-\xef\xaf\x13\xdc\xdb\x83\xbb\x9d\x10\xa8\xe0k\xafo]\x9b\
-\x8c\x85'\xac\xb5\x80N\xean\x94\x1d\xdd\xa2I\xc7\xdc\
-N%f\x8dFdbW\x9d\x9b7\x8c\x9dJ\xa0\xc0\
-\x1c\x98'\xe0\xc6\xf0\xacp\x96]\x02\x0b\x12\xf8~K\
-\x13\x16\xed\xe1\xcfc\x18\x16\xbd\x17W%-Efj\
-'\x8c\xe8\xd5\x17\x8a\xb6\xc7`\xa3\xdfo\xc4\xa6\x99\xb3\
-\x09\xd1\xf2\xbaW\xae\xb8\xd1\xc3\x0e?Ze\xa3([\
-\x15$\x01\xd8\xc4\xea\x94W\x1f\x22\x87'D\x1b\x88P\
-\xa4\xce\xec\x8e\xcc\xdf\x0f\x86-\xc1gv\x03\xfc\xd7\xdb\
-\x88\x16p\xd5\xd2N\xc2|Q-`f\xfc7h\xaa\
-\xab\xe6\x1a\xffB\xc2\xa3\xd1\xa9\xdf4\xff\xce\xa2v \
-\x18\x0a\xe4\xcd\xe6s\x9d\x07h\xe4S\x04$ \xea\x0e\
-,]\xb7\x17\xdf\x1c\xe2\x8f\xd4\xa6;\x8bp{\xba[\
-mOOH\xc4\x98\xec\xfe\x08q8\xf8\xea\xbe\x05\x01\
-l\xbd\xfa+4\x94\xd6\x08B\xa8]\x87\x1dy\xe4\x18\
-\xda\x18$\x01\xd8\xc4\xaa\x94\xd7h}\xfc\x8a\x9cz\xf6\
-\x80\xe7W\x98\xac{\x06#e\xaaf\xd1\x90/x \
-\xda\x80\xdb\xed7\xab\xad\xb5\x80\x0b\x93\x97\xa2[x>\
-\xd7?\xae\xebPDu\xea\x19\xd0\xf3*\x1c\x07\x85\x15\
-\xc6&\x11\xf0\x05:0\x12\xa0\xc7\xfcS\xb5xqQ\
-$7\xff!J\x13\x1e\xcd\xf8\x80\x1c\xdd;u\xa5\xc4\
-\xc6c\xfc\x80\x01p\x86x\xb4\xb3\x00\x84\x9fb\xfb/\
-\xbeC\xed1\xf3\xe4\x22M\xf6\x06\x0c;\xf2\xf0\x8e\x80\
-\x0a\xb9\x15@\x12@\x00X\x95\xfc\xf7D\xb8\xbf4\x94\
-\xa5\xf7\xd1o\x22\x12\x12\x1e\x82\xfe/\x8fCT\xafX\
-\xbe-\xc0\xe6\xf5\xb6\x920\x5c\xb9D\xac\x05\xa4GW\
-\xe3\xe2\xe4yhj\xa8\xd5'\x05\xba\x120\x0c\x9dr\
-f\xb8?x\xd2ds?\x00\x07\xc7]s\xc1#\x82\
-@\xb4\x01&\x09\xd8%\x0e\xf2 \x0f\xff\xd7\xe1\xfa\xcc\
-\x18\x0fwt\xf9\x02\x9d\x9d\xc5\xbe\xeb\x84\xe8hL\x1c\
-0\x10\xe1a\x9a\xae\x83\x0d\xe1\xa7\xd8\xf5\xdb\x05\xa8\xda\
-\xc3\x9a^\xed\x8b?n\xf8\xd1\x87V\xdaJ\xac\x15A\
-\x12@\x80X\x95\xfc:\x9dEC\xf7\xb4b4\xcb\xfe\
-\xca\x14\xde%\x0a\x03\xff>\x1e!1\xa1\xcd\x12|\xed\
-\xf5oV\xa5`A\xbeX\x0b\xb8vx\x03:9\x0e\
-\xa1\xb2p\x1f\x1a\xeb*}\xee\xd1\xa9}\x11\x93\x96m\
-R\xe9\x8d\xd5\x9ee\xdc`\x09\xa0\xae\x17\xe1\xd0\xcd~\
-\xd0\x0b\xb4\xe6\xa8\x08\xd2c\xda\x04l\xda\x03\xe8\x94\xe0\
-C\x82\x8dz\xaeMY\x8ca1\xfae\xbc1\x91\x11\
-\x98\x943\x10Q\xe1\xe1\xb6\x85\x9fb\xcf\x1f\x97\xa1|\
-\xc3I\x8e\x81\xd4\x95\xce\x8c\xe1G\x1f\xfc\xcev\x82\xad\
-\x04\x92\x00\x9a\x81\x95\xc9o\xdcD\x0eoy\xafY\x06\
-A\x8a\xc4q\x9d\xd0\xe7\xb1\xe1\xfe\x00\xa6\xcf\x8a\xb3\xd5\
-~\xa3\xdb\xd6\xe2p\x5c\xb1X\xac\x05\xb45X\x19\x15\
-}n\x82\xf9\x07\xf4\x03&\xa2\xfd\x11'\xc5o\xc5\xcc\
-\xc45\xa6\x88\x91aNL\xcc\xc9A\x5cT\x14\xecb\
-\xff#kP\xb2\xec8\x04:\xd4u#\x8e\xdd\xff\xf1\
-\xd9,\xc3\x96\x80$\x80fbe\xf2?\xde&\x95A\
-\xb0\x00\xc4]Q2n\xea\x83.\xd7\xf548\x0bZ\
-\x7f\x8e\xdb\xafV\xa4`a>\xbf\xcf+aF\x9f\xc8\
-c\xb8\xb9\xb3\xa7Q6\x0c\xdd\x86\x85\x86\xbaH 1\
-&\xc6VZ\x07\x9f\xdd\x80S\xdf\x1d\xd6\xa5a\xc0o\
-F\x1c\xbf\xefM[\x89\xb5\x22H\x02h&\x96'\xfd\
-3\x82h\xc0\xf4\xf3\xe3\xc3\xdc.\x8c\x96\x81\xaa\xae\xa4\
-\x09\xeb\xf7\xdcp\xc4\x0dMD@\xdd\x00\x83\xdb\x96\xa2\
-0\x5c\xb1\xc8\xfe\xd6\xdd\x12D\xdd\x0f\xa9\xc1\xc3\xdd\xff\
-\xc3\x9c\xb7\x11\xe1t\xe2\xbc\xc1\x83\x11\x1dao\x87\xa4\
-#\xafm\xc3\x89\xcfx\x1b\xff\xba\xd2\xbco\xe4\xf1?\
-=\x13\xecg\x0e\x14\x92\x00N\x03\xcb\x13\xdf\xca\x22%\
-H\x8d\x82\x89~W=\x11\xd0\xbe\xb53>\x0c\x03\xff\
-q\x0e\xc2R\xc3\x19\xdd\x00\xfa\xcf\x0e\x11\x10-`y\
-*\x16H-  <\x9e\xf5!\x22\x1c\x9e=\x07=\
-\x05\xe9$\xad\xff\xe4\x81\x03\x11\x1f\x1dm;\x9d\xe3\xef\
-\xee\xc6\xb1\xf7D3-\xd5\xa7G\xe6\xdf\xfb@\xb0\x9f\
-7PH\x028M,O|\xfbbr\xf8\x1f\xd8\xe3\
-xn\x10\x9f\xb8\x01\xf1\x18\xf0\xd2p(\xa1\xde\xa1@\
-k\xb5\xdf\xe8F\xb5\x80\xcb\x16t\x0e\xf6#\xb7\x19\x84\
-*\x8dx4\xf3?\x08w\xd0\x19\x92\xeewB\xe7\x02\
-P\xd5?%.\xb0\x05Q'f\xe7\xe1\xf0\xab\x9eQ\
->\xf60\xe0\xeb#\xf3\xffxk@\x89\xb6\x02H\x02\
-h\x01,K\xf8\xd7\x93\xa4$\x1f\xa4\xe7\xfa\x025,\
-\x1a\xba\xa2+2\xef\xe8k\xf0\xb6K\x04n\xf7_/\
-O\xc6\xbcc\xf6[\xae\x8e\x8ck\xb3\x8ecl\xe8w\
-h\xf4,\x90r\x90\xee\xd8\xd8~\xfd\x90\x9e\x94\x14p\
-Z\x85s\x8e\xe0\xc03[\x0c\xae\xba\xf7\xfb\x9fQ'\
-\xfe\xf0\xd3`?s\xa0\x90\x04\xd0\x02X\x96\xf0.\xd1\
-\xf4U\xfa\xf9\xf1\x0b\xf8\xa1\xdcs\x05\xb2\x1f\x1e\x80\xe4\
-)t\x8e\x7f\xe0\x86@\x8a\xcd\x87\x0f\xe1\xfeMY\xd8\
-^\xd5f?H{V@\xf7\x06\x5cz\xe5~(\xf5\
-\x85X\xb1c\x07\x1a\x1a\x1b1\xb2wo\xf4Hk\x9e\
-\x1d\xa5x\xe9\x09\xec}\xc8\xfd\xed\x0f\xceP\xe0\xb7\xa3\
-N\xdc}Q\xb0\x9f;PH\x02h!,\x8b\x7f\x8f\
-.\x16\xa2\x8b\x862D\xe3\xcb\xa1\x11\x0e\x0czs\x18\
-\x223\xa38\x82\xcfx%\x9ep\x8dMM\x98\xb3i\
-%\xaa\xeb\x1b\xf0M\xf1Hl#$P\xda\xe8\xb6\x09\
-\xb8&\xd2(\x0e\x97\xd1\xd1;\xceoL\x89\x0e\x99y\
-\x87\xd5T\xcd\xdc%\xd5x+Mx\xa3\xbb\xde\x9f]\
-}\xac\xd28\x93\xe8\x12]\x8fk{\x95\xe1\x9a\xde\xa5\
-\xe8\x16\xeb\xee\xfb\x17WT\xa0\xb8\xbc\x1c=\xd3\xd3-\
-\xe3\xd3<\xe6\x1d?\x8e\xac\xce\x9d]e\xe9E\xf9\x86\
-\x22\xec\xbcs\xad(\xe6\xf2s\x0a\xee\x9ap\x16\x1e\xb1\
-E!\x09\xa0\x05\xb14\xfe}\xbal\x98.\x1f\x0e\xe3\
-UwZ\xe0Q\xdd#1\xe8\x9fC\x11\x12\xc9X4\
-\xe4\x05\xc3-\xef\xc4Q\xac?\xb8G\x93\x92\x19\xa3\xb2\
-\xfa\xa3{\xb2\xb6\x95;\xddW,^\xfb`\x0a\xa7p\
-\xfc\x14\xb6\x9b\x9e|T_\x12\xee\xc7\xf7\xee{\xe8\x9d\
-\x19d\xd8\x06\xcd\xeb\xaf\xfa\xcf\x9d\xa4\xe5W\x02\x98\xe0\
-c\xc4\x86}\xfb\xb0/?\x1f]H7atv\xb6\
-{\xfd\x00A\xd5\xeerl\xbby\x15\xbb\x5c\xdc\x99\xde\
-vN\xc1\xef\x07\x9efa\x9fuH\x02ha,\x8d\
-\xfb\xe06rp\x7fO\xdaU\xba\xec\xca\x98z^2\
-\xfa>\xd6O\xef\xc8Q\xfb\xdd\xdb~+\x98\xbby5\
-*jx\x8b\xe0\x15D8\xc30c\xc8\x18\xd2\xd7\x15\
-o\x96\xd12\x10\x09\xbc\xc7\xdf.\x19(\xaa!)\xd5\
-<t\xa7\x98\xc33\xafOC\xf8\xb7\x1f<\x88\xedG\
-\x8e\xf8\xaeS\xe3\xe31\xae\x7f\x7f\xd7\xfa\x81\xdac\xd5\
-\xd8\xf4\xe3\xe5\xfcr\x00\x8e\x8e>yG\x9b\xeb\x97I\
-\x028\x03X\x12\xf7!\xddJ\xcce\x10\x12\x19\x05{\
-\xde\x91\x89\xf4k\xd3\x85j\xbf\x17G\x8b\x0a\xb1j\xcf\
-6\xe1}\x07v\xcbBv\x97\x1e\x86\xdb\x9c-\x0d\xc0\
-\x13\xd6\xb6\x06\x00\x1b\x82\x8f\xc0\x84\xfd4\x84\x7f\xef\xb1\
-c\xd8\x98\x97grO\x8c\x8e\xc6\x84\x9c\x1c\x84\x10\xde\
-]\x7f\xd1\x12Q\x19U\x8c.\xfc\x9d\xbd\xaf\xad\xb4\x22\
-H\x028\x03X\x12\xfbo:\xc7\x94n*\xeaV\x09\
-Y\xea/u\x0eU0\xf8\x95\x01\x88\x1d\x1c\xabqf\
-\x93\xc1\xc2m\x1bPTQ\xce\xbdg(i\xa5f\x0e\
-\x1dKZ\xab\x16\xf8\x06\xa0m\xa8\xa7\xa5\x014[\xf0\
-\x8d\xd7\xa7!\xf8\x14\x87\x0a\x0a\xb0v\xcf\x1e\xae\x8d\x22\
-62\x12\x13\xfa\x0f\xc0\xd6\xa9+a\xd4|\x0c\x04\x1f\
-:\xba\xf0v\xc1\xf2\xa4\xd6\x07I\x00g\x08Kb?\
-\xea\xeb\xd9^\x9c3\xe0\xec\xaeH\xe1\xc9N\x0c{g\
-\x10\x9c\xe4\xa8\xdf\xe3\xdf\xffj\x0a\xcbJ\xb1x\xc7F\
-M4\xf3k\xeb\xd3\xb9+\x06\xf7\xe8\xadM\x1a-\xf7\
-z\xad\xd4}M8^\x18\xe6\xd8\xf9i\x0a>\xeb:\
-@\xe4\x17\x15a\xc5\xce\x9dhR\xc5\xe9D\x86\x85\xa1\
-\xd3\x03\xd5h\xaa\xd6n\x0ab\x8a\x93<\xe6\xd4\xad\xc2\
-\xef\x88\xb76H\x028\x83X\x1c\xf3\xf1\x95\xe4\xf0\x19\
-O\x8dv\x9f\xaaH\x18\x16\x8b\x81\x7f\xcb\xf6\x7f~\x1c\
-\x9a\x18\xe4d\xc5\xaem8^r\x8a}\x13\x97e\xdf\
-\x81\xe9CG#*L\xfcU\xa1\x96\x87\x0aK\xc3 \
-\xab\xa5d\x09\xad\xc9-@;@3\xb1q\xdf>\xec\
-\xcd\xcf\xb7\x156\xfd\xa9F\x84\x94\xaa\x8cG\xf6\xe5\xa5\
-\xd7\x98S\xbf\xddo+\xb1V\x02I\x00g\x18\x8bc\
-\xfe\xefyr\xf8\x83\xfb\x8a_i3~\x96\x86\xac\xdb\
-\xbai\x82\xb9_MYu\x15\xe6nZ'\xbcG\xf7\
-\xe4N\x18\xd5\xbb\xbf\xdf\xa1\x95\xd8\x00\x14\x81\x9f?\x90\
-\x95\xe0\xa3\xc5[}#\xb6\x90\xbe\xff\xaec\xd6\x9b\xf9\
-tz\xa1\x09a\x05\xbc{\xbb\xdc\x87\x8f=\xf5\x9b\x0d\
--\x9a\xb93\x0cI\x00g\x18\x8b\xa2?\xa1\x9d\xf2\x1f\
-\xc8o\x92\xb0\x15$\x9e9O\xf7B\xf2\xb9\xf1:\xe7\
-\xdc\xbd\xbb\x91w\xf2\x84\xf0\x1e\x17\x0c\x1a\x89\xf8\xa8`\
-\xcc\x0e4\x0b\xab-\xa1\x17\x0c\x0b\xea\x13;\xb3\x82\xaf\
-\xc5\xae#G\xb0\xe5\xe0Aa\x98\xd4\xd7T\x84\x1f\xf4\
-\xe4\x95\x05\x05S\xc6\x9e\xfa\xf5B\xb4!H\x028\x0b\
-X\x14\xfd)\x9d\xc0O'\x09\x19f\xa2\xe8+Rh\
-t\x08\x86\xbf\xd7\x17\x91\xdd\xa8*\xaf\xa0\xa6\xbe\x0e\xdf\
-\xae_\xa3\xef\x9f\x1a\xea^Z|\x22&\xf4\x1f\xc4I\
-\xf6\xcc\xda\x00\x98\xaap\xa0FA;\xdd\x813(\xf8\
-Z\x1c ]\x81\xdc\xfd\xfb\xa1r\xec\x01Io\x03\x11\
-\xbb\x18\xe5\xe2\xc7\x15\xe3\x8b~\xf5\xe5Y\xc9l\x0bA\
-\x12\xc0Y\xc2\xa2\xa8\xd9\x13\xc9a\x01\xf9\x99\xcd\xf4\x9a\
-\x0a\x1e\xd3+\x02\xc3\xde\xe9\x03G\xb8\x03[\x0f\xe6a\
-\xe71:.\xcd\x7fM\x93\xb2\x07\xa1SB\x22\xd3\xaf\
-\xa5\xc4\x86\x7fw\xfb6\x00\xd13s\xdd\xce\x92\xe0k\
-q\xb4\xb0\x10k\xf6\xecq\xcd\xba4\x22\xf1\xdf\x0a\x22\
-72\x9e\xd1\x8f\x1b\xc6\x17\xdf\xfc\xeeY\xcf\xf4i@\
-\x12\xc0Y\xc4\xc2\xa8\xcf\xff@*\xcc\xf3,?\xafA\
-\x90\xa2\xf3\x8cD\xf4\xfas\x17|\x93\xbb\x06\xf5\x8d\x0d\
-\xcc\x90\x14\x09D\xed\xbf`0\xe7;\x7f\xbc!\xc5f\
-\xc1J\xd0m\x86e\x0a\xb4\x0d\xd5\xff,\xa3\xa0\xb4\xd4\
-\xb7~@\x8b\xf8\xcf\x1c\x88\xa2#\x81|;\xc7\x9d\xe3\
-\x8boz9\xa8\x99\x0f\x10\x92\x00\xce2\x16F~1\
-\x9bT\x14\xf6\x97d5o#\xf9\xd6(\xec\xca>*\
-Lkt\xefld\xa4tB\xf0^\xa3\x0db\xe0\x09\
-\xb3\xad\x91\x80\xe0\x81\xae\x1fX\xb6};j\xeb\xfd\x1f\
-[\x89\xfd\xd6\x81\x98\x05\xde\x91\x1af^\x1f\x9dPr\
-\xc3c\xc1\xce{ \x90\x04p\x96\xb1 \xf2K:\xeb\
-g-]\x18\xe8vaWzG\x98\x82n\xcf'\xe2\
-P\x5c\x01\x0a\xcb\xcaL\xfe\xd1\xe1\x11\x98>l\xa4n\
-\xc1\x8a\x0emF\x03@\xab\x12|-\xca\xab\xab\xb1t\
-\xdb6T\xd5\xbaw[\x8e&\xc2\x1f\xfb\x8d{\xfd\x86\
-\x7fOC]\xde_\x9cPr\xfd\xdd\xc1\xcew \x90\
-\x04\x10\x04,\x88\xf8o\x0e\xdc3\x055\xa6{\xf3p\
-[dg'F|\x98\x85\xf2\xd0*\xec>z\x04G\
-\x8bN\xf9V\xd7\x0d\xcd\xea\x89\xde\xe9]\xd8\xd3\x88\xcf\
-&\xac\x84\xb7\x8d\x09\xbd\x11T\xf8)\x09P2\x88Z\
-\xe9@\xdcl\xd6LK\xdf\xb3\xbc3\xb1\xf4\x977\x06\
-\x90|\xd0!\x09 HX\x10\xfe\xbf\x9f\x90\xd2\xff\xb7\
-\xd9G/\x18\xc9c\xa21\xe8\xd5n\xaeO[UV\
-\xd7`\xcf\xb1\xa38V\x5c\x84i\xc3F \xd4\x11\xc2\
-\xbfAk\xd4\x00\x5cYj\x1b\x82\xafE\x1d\xe9\x06,\
-%\xdd\x81\xea\xa5\xd5H\xf8\xc0\x09\xde\xfe\x8f\x04\x9fO\
-,\xfd\xf9U\x81\xa5\x1e\x5cH\x02\x08\x22~\x08\xff\xea\
-o\xe4p\xbb\xd1\xdd8U6\xeb\xd7I\xc8\xfc\x8d\xff\
-\xdb\xa4tX\xd0\xe1[\xd8\xdfF5\x806\x06j\x10\
-\x5c\xf1\xc96(/i\x8d\xb2\xfag#ob\xc1\xc4\
-\xb2\x9f\x9dO\xcf\xef\xbb\xef>\xaa*\xc4\xcd\x9a5\xab\
-UO\x0d\x96\x04\x10D\xfc\x10\xf6\x0dmN\x96\x10!\
-\x19\xc3\x0f\xe5&\x81\xd0h\xf3\x12_\xed\xc8\x017\xae\
-\x1d?\xa6U;\xc0t\x15\x0b\x7f[\xf9\x85\xf5\xb0\xa2\
-(\xb8\xd2\xdc\xb2\xd0\xf8k?\x82b\xf0kjT\xd1\
-X\xd3$J7wR\xf9OG\x12\xe1\xa7Q\x7fC\
-~\xbd\xc8\xef\xaf\x84\x04\xc4\xd6\xdc B\x12@\x901\
-?\xec\xdbn\x8a{\x92P\xaa\xb0\x926\xb3r\x0b\x17\
-\xde\xd8\x88o\xb5\x8e!\xe0<\xb5\x04Q4\xa3,Z\
-\x86(,\xcbb\xdf\xa4\xf2\x9f\xf4&\x04\xf0Kr>\
-\xc9\xe3M\xbf\x18\xfc\x22!\x81V\xb9F@\x12@+\
-\xc0|\xe7\x9c\xf3\xe9~\x1f\xf05:\xa7\xd3\x82\x9e\x0e\
-QX\xec\xeac'\xddV\xa5M\x04v\xdf\x16 \x89\
-\xc29\xb7o\xfc-9\xce0\xb8\xd3a\x84\xd7\x08\x09\
-\x887t\x08\x02$\x01\xb4\x12\xcc\x89\xfd\xfa\x09gM\
-\xe8Cf\x1f\xf3\x9a\x01\xae\x1fl\x0a\x9d\xd4&N\xab\
-,\xb8D\xa1\xa0a\xcem\x1b\xde\xe7$F\x8d\x07o\
-\x11\x12\x10m,x\xd6!\x09\xa0\x95\xe0\xfe?\xdd\xff\
-\xa3\x91\x1f\x8ex.\xeeDl\x86\xcbA' 6\xfb\
-\xaf\xfe\x08|?]\x10\xa9M\xb4dY4\x847V\
-\xcf\xff\xf5\xa6\x8f,\x02~@H`1Z\x09$\x01\
-\xb4\x02\x90>#\xdd\xda\xf7\xf9\xf0\xca\xf0\xb8s\xde\x1b\
-uYXU\x18gk)\xbe\xa0[\x93\x848\xbe\xd4\
-&\xac\xc3X\xa5}p\xc8\x89\xb5;\xce=\xbc\x05\xd6\
-\xf8\x9c\x90\xc076\xc2\x9dqH\x02h\x05 \x04@\
-\xfb\x8cW\xd3\xf3\xc4\x83II\x03\xbf\x1ex~X\x95\
-\xd3M\x02\xa7\xd3\x82z!\xb5\x893\xaeM\xa8\x0e\xb5\
-h\xe1\xaf6|V\x1f\xde(\x98\x9c\xa1\x03\xb5\xf9|\
-B\x88 \xa8\xe3\xa4\x92\x00\x82\x0c\xcfx\xf1\xb3\xe4\xe7\
-\xdb\x08 \xb464\xa4\xef\xfc~C\xd3v\xa6\x0dR\
-\x9a\xd8[\xfc\xb6h\x0b\xaaOPj\x13\xbaS\xcbx\
-\xd4\xba\xff\x0e\xf9\xbd\xfb\xfd\xef\xd7\x84\x91\xe3\x9d\xd0\xcd\
-\xf0\x14\x82n3\xfc.!\x81&\x9b\xe1[\x1c\x92\x00\
-\x82\x0cB\x00\xf4c\x127\xb0\xfc\x1c\x0d\x0eGh\x8d\
-34\xa2<\xfc\x93\x91\x1f\x8c^\xda\x9c\xca\xddb-\
-\xa8>A\xcf\xa9\xd4&\xc8i\xe9y\xd5\x97\xfb<\xc9\
-\xfb\xecB\x0et=@\x22\xec\x81\xee \xf4\x06!\x81\
-\x06\x9b\xe1[\x14\x92\x00\x82\x08RYh\xf9?\x01\xd3\
-F!:T\x90\xdf=\xa4\x82\xd4\xd9KU\x22\xd8 \
-\xef5\x19\xeem\xe0\xec~\x87\x8cn3\xf2\x0ay\xc7\
-5g;\xaf\x92\x00\x82\x08RQ\x86\x90\xc3\x1d\x16\xc1\
-\xfeK*\xc6\xff\x82\x9dW\x89\xc0@\xde-\xdd\x0d\xfa\
-.\xf2\xebn3\x0a\xddl\xec\x19\xf2\xaek\xcff>\
-%\x01\x04\x11\xa4\x92\xfc\x89\x1c\xfa\x0a\x82\xd0V\x9f\xb6\
-\xfe\x15\xc1\xce\xabD\xe0\xf0\x8c\xee\xfc\x0e\xbe\xa5\xdfB\
-,$\xef\xf9\xc3\xb3\x9dGI\x00A\x02\xa9\x1c=\xc9\
-\xe1A\x8b`A\xa9\x14\x12-\x07\xf2\x9e\xe9z\x0f\xba\
-.`\xa8 \xd8\x1a\xf2\xfbG0F\x04$\x01\x04\x09\
-\xa4b\xdcJ\x0e#\x04A\xa8e\xf8\x01R)N\x06\
-;\xaf\x12\xa7\x07\xcf\xe2 j\xe8\x1d\xc7\xf0\xa6\xd3\x83\
-_&\xef9(_\x14\x92\x04\x10\x04\x90\x0aA\xf7\xf1\
-z\x0a\xe2\xf2_G*\xc5\xeb\xc1\xce\xabD\xcb\xc0c\
-\xf0\xbd\x96\xfc\xa6i\x9c\xe9\x10\xe2\xf3g\xbb\xdf\xaf\x85\
-$\x80 \x80T\x86\x9f\x93\xc3d\x8b`O\x92\x8a\x91\
-g#9\x896\x04\xf2\xeeg\x92\x03\xdd4\x84~\x89\
-\x84\xbc\xe2Y\x95\xc1\xcc\x8f$\x80\xb3\x0cR\x01\xe8\x0c\
-\xbf\xe7\xc8\xcf)\x08\xb6\x8bT\x8cg\x83\x9dW\x893\
-\x03R\x07\xc6\x92\xc3N\xf2\x8e\x8b\x83\x9d\x17I\x00g\
-\x19\xe4\xe5_N\x0e\x97X\x04\xa3}\xc2\xcd\xc1\xce\xab\
-D\xfb\x87$\x80\xb3\x0cB\x00Y\xe4@\xd5\xc0a`\
-\x97?\xdd=\xe6\x91`\xcf\x11\x97\xe8\x18\x90\x04\x10$\
-x\x0c\x81\xd4 4\x9e\xfc\xc24^o\x13\xe1_\x11\
-\xec\xfcIt\x0cH\x02\x082\x08\x11\xc4\x90\xc3\x14\xcf\
-\x8f\xce\x07\xffS\xb0\x86\x84$:\x1e$\x01\xb4\x12x\
-&\x8ct&\xc2\x7f8\xd8y\x91\xe88\x90\x04 !\
-\xd1\x81!\x09@B\xa2\x03C\x12\xc0Y\x00\x9d\x05&\
-\xad\xfa\x12\xad\x11\x92\x00\xce0\x88\xf0w#\x87\xdf\x93\
-\xdf<\xf2[\x12\x8c5\xdf\x12\x12<H\x028\xc3 \
-\x04p39\x8c\xf5\x5c\xd2\x8fD,\x22\xbf\xf9\x84\x08\
-J\x83\x9d7\x09\x09I\x00g\x10D\xf8\xe9\xb6P\xcf\
-\x90\x9fq\xa3H:\xdc\xb7\x92\xfc\xbe'Dp<\xd8\
-\xf9\x94\xe8\xb8\x90\x04p\x06A\x08\x80\xae\xfe\xbaP\x10\
-\x84\xda\x05\x1e\x93C\x7f\x12\xc1\x82$\x803\x04\xcfn\
-0t\xd1O\xa4 \xd8A\x22\xfc\x8f\x07;\xaf\x12\x1d\
-\x17\x92\x00\xce\x10\x08\x01L'\x87k,\x82\xd1]`\
-V\x07;\xaf\x12\x1d\x17\x92\x00\xce\x00\x88\xf0\xd3>?\
-\xed\xfb\x8b\xb6\x86>E\x83\x06sOx\x09\x09I\x00\
-g\x00\x84\x00\xe8\xd6O7Y\x04\xfb\x88\x08\xff\xfc`\
-\xe7U\xa2cC\x12\xc0\x19\x00!\x80\xc7\xc8\xa1\x9b \
-\x08\x1d\x0e\xfcc0\xb7\x82\x92\x90\xa0\x90\x04\xd0\xc2 \
-\xc2?\x10\xee\xfd\xe0E\xf8\x86\x08\xff\xe7\xc1\xce\xab\x84\
-\x84$\x80\x16\x06!\x80?\x92C\x7fA\x10:\x07\xe0\
-^9\x11H\xa25@\x12@\x0b\x82\x08\x7f\x0fr\xf8\
-\xb3E\xb0\xa5D\xf8\xdf\x0dv^%$($\x01\xb4\
- \x08\x01\xfc\x9a\x1cF\x0b\x82\xd0\x89?\x0f\xcb\xd9\x7f\
-\x12\xad\x05\x92\x00Z\x08\x9e\x0fB\xce\x22?\x87 \xd8\
-&\x22\xfc\xaf\x04;\xaf\x12\x12^H\x02h!\x10\x02\
-\xf8\x11\xf4\x1f}`\x81~\xfcqw\xb0\xf3*!\xe1\
-\x85$\x80\x16\x02!\x80(r8\x8f\xfc. \xbf8\
-F\x90<\x22\xfcO\x06;\x9f\x12\x12ZH\x02ha\
-\x10\x22\x08\x85{\xa7_\xba\x08H\xfb}\xf8\xd7\x09\x01\
-\xac\x0bv\xfe$$\xb4\x90\x04p\x86\xe0\xf9\x16\x1c\xdd\
-\xfb\x9f\xae\x09\xa0_\x03z@\xee\x0a$\xd1\xda \x09\
-\xe0,\x80~\x0e\x8c\x08\x7fy\xb0\xf3!!a\x84$\
-\x00\x09\x89\x0e\x0cI\x00\x12\x12\x1d\x18\x92\x00$$:\
-0$\x01HHt`H\x02\x90\x90\xe8\xc0\x90\x04 \
-!\xd1\x81!\x09@B\xa2\x03C\x12\x80\x84D\x07\x86\
-$\x00\x09\x89\x0e\x0cI\x00\x12\x12\x1d\x18\x92\x00$$\
-:0$\x01HHt`\xfc?\xf4\x1f\xd6\x0e\xce\x08\
-\x22\xe0\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00(c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00(*IDATx\xda\xed\x9d\x07x\x14\xd5\
-\xda\x80\xbf\x14\x08\xa1\x84\x12\x90*$t\x04R\xc8\x06\
-\xa4\x13\xec\xde+\x8a\xa8\xf4\x12\xec],\xf7\xde\xdfr\
-]\xae\xd7\x8e\x0a\x22\x22*\x10\x8a\x1d\x15\x1b\xd6\x0b\x01\
-\xe9$!\x09\x84*&(\x90\xd0B\x08%\x04B\xf2\
-\x9f3\xbb\x1b'\x9b\xdd\xd99\xe7\xcc\xee\xd9\xd9\xfd\xde\
-\xe7\x19\xa6\xcf\x1cf\xf6{\xe7;g\xcenB\x00A\
-\x90\xa0%Dv\x01\x10\x04\x91\x87O\x050\xf9\x8b=\
-S\xc8h(\x19\x86\x91S\xc7\xd0e\xe7\xcf\x97C\xf1\
-\x89c\xcc\xc7zeD<\xc4\xb5i\xe2\xcb\xe2#\x12\
-Y\x9a\xb9\x1f\x96n)\xe0\xda\xb7a\xc3(h\xd8\xa0\
-a6\x99\xa4\x07\xc8!C\xfa\xa2\x9b\xbb\xa6\xcb\xfe?\
-\xf9\x03^\x17\xc0\xa4/\xf6\xd0(}\x84\x0c\x0f\x93\x93\
-\xd5\x8a\xd8\xf2\xf3\xe7\x89\x00\x8e2\x1f\xf7\xd5\x11\x09(\
-\x80 b\x89\x22\x80|\xae}\xa9\x00\x1a5hTk\
-y\x15\xc0r2ZM\x86\xb4\xc57w-\x91\xfd\x7f\
-\x94\x81W\x050\xe9s\xe5\x89\xff\x06\xb8\x08|\x07\xb6\
-\x0c\x80C\x007&\xa2\x00\x82\x88%\x19\x05\x02\x02h\
-L2\x80F\x9e6\xa32X\xb4xT\xd7\xe5\xb2\xff\
-\xaf\xbe\xc4+\x02 \x81O#\x93\x06\xfe\x14O\xdbR\
-\x01\x1c\xe7\x10\xc0\x0c\x14@PA\x05\xb0\x84S\x00\x8d\
-\x1aD)Y\x80N\x0a\xc8\xb0\x88\x0c3\x89\x0c\x02>\
-+0\x5c\x00\x93>\xdfM\xa3r\x15\x19\x12\xb4\xb6k\
-\x1cY\x07\xe2.m\x04GJ\xce\xc0\xaa\xdc}\xcc\xe7\
-y\xed\xa6>(\x80 bqF>,\xd9\xcc'\x80\
-^\x1dZBO2\xfcq\xbc\x0c\xf6\x93A'4\xf8\
-g\x81\x22\x82n\x01+\x02o\x08\xe0K2\xba\xc9\xd3\
-v5\x04\x90\xf3\x1b\xf3yf\x8cL\x82x\x14@\xd0\
-\xb0x\x0b\x15\xc0\xef\x5c\xfb\xf6\xec\xd0\x0az\xc5\xb4T\
-\x82\xff\x0f\xfd\x02pPP\x050}\xc9\xa8ni\xb2\
-\xaf\x8170T\x00\x13?\xdfm%\xa3g\xf5l[\
--\x80\x13\xa7\xb9\x04\xf0\x1a\x15@\xdb\xa6\xc2e^D\
-?X\x9b\xd83\x10\xeek\xd4\xaf\x13LN\x8e\xf5\xd9\
-\xf9\x02\x05\x91\xfb\xd43\xa6\xb5\x22\x80?\x8e\x91\x0c\xa0\
-\x98Y\x00\x0e\xd2\xa1\x0aR\x97\xdc\xd2\xad@\xf6\xb50\
-\x12\xc3\x040q\xd9n\x9a\xf2o\xd5\xbb\xbdZ\x00+\
-s\xf72\x9f\xef\xf5\x91\x16c\x04@\x9e*\x8b7\xfb\
-N\x00\x93\xfa\x12\x01\xf4\xed\xe8\xb3\xf3\x05\x0a\x22\xf7\xa9\
-W\x07*\x80V\xacU\x00W\xd0\xaa\xc0t\x22\x81\x99\
-\xb2\xaf\x87Q\x18(\x80]\xa4\xde\x1f2L\xef\xf6\x8d\
-#\xc3\x89\x00\xa2\x14\x01\xfc/g\x0f\xf3\xf9\xde\xb89\
-\xd90\x01,\xda\xc4\x9e\x81\xf02\xb9_g\x14\x00\x07\
-\x22\xf7\xa9wL\x1b\xa3\x04`\xa7*\x8d\xfc3m\xc9\
--\xddM\xdf6`\x88\x00&,\xdb5\x0cl\x0d\x7f\
-\xbaiB2\x80\xdev\x01\xac\xcc\xe6\x10\xc0(c\x04\
-\x90F\x9e*\x8b7\xfa0\x03\xb8\xbc\x13L!Y\x00\
-\xc2\x86\xc8}\xeaE\xab\x00\xb1\xad\xed\x028kT\x91\
-h\xc7\xa2\x94\xa5&\x97\x80Q\x02X\x08:^\xf9\xa9\
-\xb1U\x01\xec\x19@\xf6n\xe6s\xce\x1c\xd5\xd7\x18\x01\
-\x90z\xa5\xaf3\x80)\xfdP\x00\xac\x88\xdc'%\x03\
-0^\x00\x94\x022\x8c$\x12\xc8\x96}}x1F\
-\x00\x9f\xed:\x01\x1a\x9d}\x5c\xf1\x97\x00N\xc1/<\
-\x02\xb8\xa5/$\xb4m&\x5cv\xfa\xc1J\xdb\xc8\xde\
-\x06\xc1\xcb\x94\xcb\xbb\xa0\x008\x10\xb9OT\x00\xbdc\
-\xdb\x10\x01\x9c5\xa8\x0aP\x83\x02R%H\x5czk\
-\x0fSf\x02\xc2\x02\x98\xf0\xd9N\xa6\xc6?\x07\x0e\x01\
-\x1c\xa6\x02\xd8\xca.\x80Y\xb7\xf4\x83\x84v\xe2\x02X\
-H\x9e*i\x1b|(\x80\xfe] \x95d\x01\x08\x1b\
-\x22\xf7).\xb6-\x11\x80W2\x00\x07\xb6\xea\x80\x09\
-% ,\x80\xf1\x9f\xed\x9cB\x0e\xb2\x90u?\xbf\x11\
-\xc0\xc6\xdf|\x9e\x01\xa4^\x8e\x02`E\xe4>\xd1\x0c\
- \xaec\x1b{?\x00\xaf\x08\x80~\xaf \xfd\x83[\
-{\xa4\xc8\xbcF<\x18!\x00+\xe8|\xf7\xaf\xa6\x86\
-\x00\xb2v1\x9f\xf7\xcd[/7H\x00{a\xa1\x0f\
-3\x80T\x9a\x01\x10\x09 l\x88\xdc'%\x03 \x02\
-\xb0\xf5\x03\xf0\x8e\x00\x14\xaa \xed\x83\xdbz\xa4J\xba\
-D\x5c\x88\x0b\xe0\xd3\x1dV\xe0\x11@}*\x80\xc6p\
-\xb8\xf8\x14\xfc\x9c\xb5\x93\xf9\xbc\xb3o\xebo\x88\x00\x16\
-\xd0\x0f\xd6z\xf6\xb7\x10\xbc\xa4\x0e\xe8\x0aSQ\x00\xcc\
-\x88\xdc\xa7\xb8\x8e\xed\x94\x0c\xe0\x8fcg\xbdU\x05P\
-3\xfd\x83\xdb.\xb3\xfa\xfa\xfa\xf0\xe2'\x02\xd8\xc1|\
-\xde7\x89\x00\x12\xdbE\x0b_\x80\x05\xeb\xc9\x07k#\
-{\x15\x84\x97\xd4\xcb\xbb\xc1\xd4\x01(\x00VD\xeeS\
-\x5c,\x11@\xa7\xb6\xbe\x12\x00%\x95H \xcd\x97\xd7\
-\x87\x17?\x10@)\xfc\x94\xc9\x91\x01\x8c6F\x00\xf3\
-\xc9Se\xe1\x06\x1ff\x00\xfd\xbb\xc2\xed$\x0b@\xd8\
-\x10\xb9O4\x03\x88\xf7\xad\x00()D\x02\xe9\xbe:\
-\x19/\xc2\x02\x18\xc7+\x00\xda\x06\xd0\xde.\x80\x0c\xf6\
-\x0c\xe0\xad\xd1\x03 \xf1Rc\x04\xb0`\xbd\xef2\x80\
-\xa9\x03\xba\xa1\x008\x10\xb9O\xf1\xb4\x0a\xd0\xb9\x9d\xaf\
-\x05P\x02UU)\x1f\x8e\xee\xe9\xd7}\x04\xc4\x05\xf0\
-I\x9e\x15\x043\x80\x1f9\x040g\xcc@c\x04\xb0\
-n\x0f\xf9p\xb17B\xf2r\xfb\x80\xeep\xfb@\x14\
-\x00+\x22\xf7)\xbe\xd3\xa522\x00\x0a}-\x98H\
-$P\xe0\xcb\x93\xb2 ]\x00EJ\x06\x90\xc7|\xde\
-9c\x06\x19\x22\x80\xf7\xd7\xed&O\x16\xdf\x09`*\
-\x11\xc0\x1d\x03\xbb\xf9\xec|\x81\x82\xc8}\x8a\xefH\x04\
-\xe0\xfb\x0c\xc0\x81\xd2G\x80H\xc0/\xfb\x08\xf8\x85\x00\
-~\xdc\xb2\x9d\xf9\xbco\x8f\xa5\x02h.|\x01\xe8\x07\
-k\xfe:\xf66\x08^n\x1f\xd8\x03\x05\xc0\x81\xc8}\
-\x8a\xef\xd4\x1e\x12\x88\x00\xf6\x13\x01x\xab\x1f\x80\x16U\
-D\x02\x1f\x8d\xee\x99\xe8\xf3\x13\xeb@X\x00cE\x05\
-p\x9cV\x01\xf8\x04\xd0\xc7\x08\x01\xac\xdd\x05\xef\xfb0\
-\x03\xb8\x83f\x00\x83\xba\xfb\xec|\x81\x82\xc8}J\xa0\
-U\x80\xce\x97\xca\xca\x00\x1c\xa4\x11\x09\xf8]\x1f\x01q\
-\x01|\xbc\xdd\x0a\xbc\x02h\xdf\x84\x08\xe0$\xfc\xc0\x91\
-\x01\xcc\x1d7\xd8\x10\x01\xbcG?X>\xcc\x00\xee \
-\x19\xc0\x9d(\x00fD\xeeSBg\x9a\x01\xd8\x05p\
-\xec\x8c\xcc\xff\xc6\xcc\x8f\xc6\xf4\x9a&\xb3\x00\xce\xf8\x87\
-\x006oc>\xef\xdcqC\xa0O{#\x04\xb0\x93\
-<]|(\x80AT\x00=|v\xbe@A\xe4>\
-)\x02\xe8\xd2\xde\x1f\x04@I%\x12H\x93]\x08\x07\
-~!\x80\xef7\xe72\x9f\xf7\x9dqC\x8d\x11\xc0\xaf\
-;\xe1\xbdu\xeco!x\xb9s\xe0ep\xe7`\x14\
-\x00+\x22\xf7)\xb1s\x07E\x00J\x1b\x80|\x01P\
-F\x12\x09\xf8\xc5\xcf\x8f\x0b\x0b`\x0c\xa7\x00\x9a\xa8\x04\
-\xb0bS\x0e\xf3y\xe7\x8d\xa7\x02h!|\x01\xde\xa5\
-\x1f\xac\xb5\xeco!x\xb9sPO\xb8\x0b\x05\xc0\x8c\
-\xc8}J\xec\x1c\x03\x89]\xdb+O\x7f*\x01?\xa0\
-\x04\xa0*\xe5\xe31\xbd\xa5\xf7\x110@\x00\xdb\xac\xc0\
-#\x00\xda\x11\xa8C\x13(<F2\x80M\x1c\x19\xc0\
-\x84\xa1\x90d\x88\x00v\x90\xa7\x8b\x0f3\x80\xc1\x97\x11\
-\x01\x5c\xe6\xb3\xf3\x05\x0a\x22\xf7)\xb1K\x07\x9b\x00\x8e\
-\xd2F@\xbf\xc8\x00\xe8\xab\x01\xa5\x8f\xc0\xc7c{\x17\
-\xc8,\x86\xb8\x00>\xe2\x14\x80=\x03(\xa4\x19\xc0F\
-\x8e\x0c`\xe20c\x04\xb0f\x07\xf9p\xf9.\x03\xb8\
-k0\xc9\x00\x86\xa0\x00X\x11\xb9O}\x14\x01tP\
-\x9e\xfe~\xd0\x06\xa0F\xe9#@$ \xad\x8f\x80\xb0\
-\x00F\x0b\x0a\xa0\x88d\x00\xdfmb\xcf\x84\xde\x9d\x90\
-\x02I\x1d\xc4\x050O\xf9`\xb1\xbf\x85\xe0\xe5\xae\xc1\
-\xbd\xe0n\x14\x003\x22\xf7\xa9O\x97\x18\x7f\x15\x00%\
-\xfb\x93\xb1\xbd\xa5\xf5\x110@\x00\xb9V\x10\xc9\x00\xa8\
-\x006\xb2\x0b\xe0\xbd\x89\xc3\x0d\x12@\x1e\x19|'\x80\
-\xbb\x87P\x01\xf4\xf4\xd9\xf9\x02\x05\x91\xfb\xd4\xa7k\x0c\
-\x19\xfcV\x00\x94\xb4O\xc6\xc6I\xe9#\xe0\x07\x02(\
-\x81\xef6p\x08`\x12\x15\xc0%\xc2\x17`\xdej\xfa\
-\xc1b\x7f\x0d\xc9\xcb\xddCz\xc3\xddCQ\x00\xac\x88\
-\xdc\xa7>]c\xa1O\xb7\x0e\xfe\xd5\x06P\x1b)\x12\
-\x10\x17\xc0\x87\xe2\x02\xf8\x96#\x03x\xdf \x01\xbc\xb3\
-z\xbb\xcf3\x80{\x86\xf6\xf2\xd9\xf9\x02\x05\x91\xfb\x94\
-D\xaa\x00}\xba\xc5\xf8s\x06\xe0 \xf5\x93qqi\
-\xbe<\xa14\x01\xd0~\x00\xf1D\x00\x87\xa8\x0060\
-\xff\xa6(\xbc?\xf9\x0a\xb0\x18$\x80wV\xfb.\x03\
-\xb8gho\x14\x00\x07\x22\xf7)\x89d\x00I\x8a\x00\
-\xfc\xe65\xa0[\xaa\xa0*\xf5\xd3q\xf1i\xbe:\x9f\
-\xb0\x00n\xfb0\xc7\x0a\x5c\x19@\xdd\xbf2\x80\xf5Y\
-\xcc\xe7}\x7f\xca\x95\x86\x08`n:y\xb2\xacf\x7f\
-\x0d\xc9\xcb\xddC\xe3\xe0\xdea(\x00VD\xeeS\x9f\
-n\x1dU\x02\xf0\xeb\x0c\x80B\xdf\x08\xa4\x10\x09\xf8\xa4\
-\x8f\x80t\x01(\x19\xc0\xfaL\xe6\xf3\xce\x9f|\x15X\
-b\x8c\x10\xc06\xf2d\xf1\x9d\x00\xeeQ\x04\xd0\xdbg\
-\xe7\x0b\x14D\xee\x93\x92\x01t\xefh\x16\x01P|&\
-\x01q\x01|  \x80\x0eT\x00'\xe0\x9bu\xec\x19\
-\xc0\x02\x9a\x01\xc4\xb4\x14\xbe\x00\xf4\x8357\xddw\x02\
-\xb8w\x18\x0a\x80\x07\x91\xfbd\xe9f\x17\xc0Q\xd3\x08\
-\x80\xa2\xf4\x11\xf8t|\xbcW\xfb\x08\x18 \x80l+\
-\x88\x08\xe0(\xa7\x00R\xaf2D\x00o\xaf\xca\x85w\
-|(\x80{\x88\x00\xeeK\x89\xf3\xd9\xf9\x02\x05\x91\xfb\
-\x94\xd4=\x16,\xe6\x13\x00%\xfb\xd3\xf1\x09^\xed#\
- ,\x80[\x0d\x11\x00{\x15`A\xea\xd5\x90l\x90\
-\x00\xe6\xa6\xb3\xf7D\xe4\xe5\xdea\xf1(\x00\x0eD\xee\
-SR\xb7\x8e`\xe9aJ\x01P\xd2>\x1b\x9f\xe0\xb5\
-\xd7\x83~!\x80\xaf\xd7f0\x9fw\xe1\xd4k\x8c\x11\
-\xc0\xca\x5cx;\xddw\xdf\xc9\xb8oX\x02\xdc7\x1c\
-\x05\xc0\x8a\xc8}\xa2O\x7fK\x8fNf\x15\x00e$\
-\x91\x80W\xbe=(_\x00GN\xc0Wk\xb70\x9f\
-7\xed\xf6k\x0d\x11\xc0\x9c\x959\xe4\xe9\xe2C\x01\xa4\
-$\xc0\xfd\xc3\xe3}v\xbe@A\xe4>%w\xef\x04\
-\x96\xcbL,\x00\xdb\x17\x87b?\x9b\x90`x{\x80\
-\xb8\x00\x96\xf2\x09@\xe9\x07\xd0\xa1)\x1c$\x19\xc0W\
-\xbfnf>\xef\x22*\x80\xd8V\xc2\x17\x80~\xb0\xe6\
-\xacd\xef\x87\xc0\xcb\xfd\xc3\x13Q\x00\x1c\x88\xdc\xa7d\
-\xf2\xf4O\xee\xd1\xd9\xbc\x02\x00\xa5\x7f@\xda\xb2\x09\x89\
-\x86W\x05\x84\x05p\xcb\xd2\xadV\xe0\xce\x00\x9a*U\
-\x00\x14\x00\xe2\x09Q\x01X\xaa\x05pZ\xf6\x7fE\x84\
-\x14\x22\x81t#\x0f\x88\x02@\x01\x98\x02\x14\x80B:\
-\x11\x80\xa1\x7f\x81X\x5c\x00K\x0c\x10\xc0Z\x14\x00\xa2\
-\x8d\x90\x00\xba\x07\x8c\x00(\xa9\xcb&&\xa6\x19u0\
-\x03\x04\x90e\x05\xae6\x80\xbaJ\x1b\x80M\x00\xec\x8d\
-\x80(\x80\xe0B\xe4>Y\xbawR\xb2\x80\x00\x11@\
-\xc1\xb2\x89}b\x8d:\x98\xb0\x00Fq\x0a@\x9d\x01\
-|\x8d\x02@< *\x00K\xe0\x08\x802\xf2\xf3\x89\
-}\x0cy-\x88\x02@\x01\x98\x02\x14@\x0d\xd2\x89\x00\
-\x0ci\x0b\x10\x17\xc0\xe2L+\xf0\x0a \xa6\x19\x0a\x00\
-\xd1\x851\x028\xad\x0c\x01B\xec\xe7\x93\x92\x0aD\x0f\
-\x22,\x80\x9b\x0d\x10\xc07(\x00\xc4\x03\xa2\x02H\x0a\
-<\x01\xa4}1)I\xb8_@\xd0\x0b`K~\x11\
-l\xce?,|\x1c\xbd\xf4\x8dmiH\xb9\x03\x91S\
-\x15\x07`S\xf1k\x90\x7f\xfa\x07(\xaf,\x95]\x1c\
-\xafQR\xda\x1b\xfe,\xbc\x01\x8e\x15\xf7\x17:\x0c\x11\
-@S\xd1\xb2\x04\xbd\x00\x10\xff\x80\x06\xfd/G\xa6A\
-\xf9\xc5\xc0\x0d|g\x8a\x8e\x5c\x01;\x7f\x7fD\xe4\x10\
-#\x89\x04\x84\x1a\x03\x0d\x10@\x86\x15\x84\x05\xc0\xfee\
- \x14@\xe0p\xac<\x0f\xbe<p\x8b\xcb\xa7~d\
-D;\x08\x0b\x8d\x94]D!.V\x96AY\xf9\x01\
-\x97\xeb\x0e\x90L`\xef\xfe;y\x0fM\xaa\x01\x16\xa1\
-j\x80\xb8\x00\x16\xf1\x09@\xe9\x07\xe0\x10\xc0:v\x01\
-\xfc\xeb\xfa\xbe0i\x00\xfe\xbe~ @\x83\xff`\xd9\
-\x86\x1a\xcb\xa2\x1a\xc6A\x9b\xe6\xa3\xa0n\x9df\xb2\x8b\
-g\x08T\x02\x87\x8f\xaf\x80c%\xe9\xb5\xd6m\xcd{\
-^\xa9\x16\xb0RE\xaa\x01_N\xb6\x08U\x03\x84\x05\
-0\x92S\x00M\x04\x05pE\x8f\xf60{\xfcp\xd1\
-\xe2#\x929X\xb6\x9e\x08\xe0\xd6\x1a\xcb\xda\xb4\x18\x05\
-\xcd\x9b\x0c\x93]4\xafp\xa2t\x13\xfcyxi\x8d\
-e\x85G\x86\xc3\xce}\xdcU\x81\x91D\x02\xdc\xd5\x00\
-\x03\x04\xb0\xc5\x0a\xdc\x02\x88\xe6\x16\x00e\xd3\xd3\xe3\xa0\
-Q\xbd\xba\xa2\xff\x05D\x22\xbf\x1e}\x16rJ\xe6W\
-\xcf\xd3'\x7fL\xeb;d\x17\xcb\xab\x1c:\xfaE\x8d\
-L\xa0\xe2b\x03X\xb3\xf9\x03\xde\xc3\xcd\xfcrr\xf2\
-4\xde\x9dM-\x00|\xa5f~\xe8\xd3_\x9d\xfew\
-\x8f\xb1*i\xff\xf9\x0b\xc5p\xb8\xf8{\xe5\x89\x19\x08\
-P\xb1\xb5lv\x1dDF\xb4U\xaa\x03\xbb\xf2\xad\xca\
-\xd8\xc1\xfa\xacyp\xae\x9c\xeb\xf7-\xb2\x89\x00\xb8\x7f\
-6LX\x007\xa5q\x0a\xa0\x81M\x00\x85\x02\x02\xa0\
-O\xff/\x1e\x18\x01m\x9b4\x14\xfdo \x92P\x0b\
-\xa0ad\x17\xe8\xd8\xeeA(+?\x08\xbf\x1fx\xb3\
-F\x80\x04\x0a\x97\xb6\x1c\x0fM\xa3\xfa\x91j\xc0\x075\
-\xe4\x96\xb5\xfd92\xcf\xf7c\xb1\xcb\xa7$s\xc7\xb1\
-\xa9\x05@\xe9\xde\xba\x99\xf2F\x00\xab\x02\xe6D-\x80\
-\x96\xd1\xd7)u\x7f\xe7\xa7c A\xdfhti\xff\
-O8S\xb6W\x91\x80\x03\x11\x01\x10R\x88\x04\xd2y\
-v4\xbd\x00((\x01\xf3\xa2\x16\x00\xad\xfb\x9f<\xb3\
--`\xd2~w\xd0\x0c\xa0\x19\x19\xf6\x91,\xc7\x81\xa0\
-\x00\xa6\x11\x01\xcc\xe4\xd9\xd1\x00\x01l\xb6\x82\xb0\x00\xd8\
-\x7f\x15\xd8\x19*\x81\x17n\x1e\xa4\x8c\x11\xf3\xa0\x16@\
-\xa7v\x0fA\xc1\xa1\xf7\x02\xf6\xe9\xaf\x86\xca\xae\xa0\xf0\
-\xfd\xeay\x9b\x00\xb8\xffb\xd4\xcc\xe5S\xfar5\x04\
-J\x13\x00\xed\x07\x90\x10kk\x04\xfc\xd6\x00\x01T\x97\
-'\xb13\xdc\x7fE\x02\xb6\x0b\x98\x84/T\x02hE\
-\xaa\x00E\xc7\xbf\x97]$\x9f\xd0\x82Tu\x8e\xaa\xde\
-\x04P\x01\x94\xf0\x0b \x9d\x08\x80\xeb\xdb\x81\xc2\x02\xb8\
-q\xa1`\x06p\xccX\x018\xa0\x99@rLk\x88\
-\x8a\xc4j\x81?Sy\xc9\xbf\x00\x22l\x7f\xf4\x93\xa6\
-\xc5\xc5\x01\x9e\xfe;\xa0\x0d\x9e\xa7\xcb\xf6V\xcf+\x19\
-\xc0I~\x01|\x95*M\x00\x9b\xac\xc0%\x80\x08\xa5\
-#\x90\xf2\xc7A\xbd \x00\xc4\x1c\xdcx\xf5|h\xd3\
-:_\x99\xa6\x0dd\xc1\x90\xfe\xbb\xfa\xbffm\xfb\x8f\
-H\x15\x00\xbeJ\xed\xc7\x15\xcb\xf2\x04@\xfb\x01\xc4\xd2\
-6\x00\xbe?\x0e\x8a\x04\x06\x8a\x00Z\xe5\xcb.\x86t\
-\xb2\xb6\x9bU\x00\x0bx3\x00G\x15\x00\x05\x10\xcc\xa0\
-\x00l(\x02\xe0\xaf\x02\xc0WS%\x09`\x84\x01\x02\
-\xf8\x0e\x05\x10\xb4\xa0\x00ldn\x9fN\x04\xc0\xffW\
-\xa3\xbf\x96'\x80\x8dV\xe0n\x03@\x01\x04;(\x00\
-\x1b6\x01\xf0g\x00_O\xbd\x1c\x05\x80\x98\x0f\x14\x80\
-\x0d\xd3\x0a\xe0\x86\xf9\x02\x02\x88\x8d\x86\xf3\xe7+`\xc9\
-\x0f\xabE\x8b\x81\x98\x94\x11D\x00mQ\x00\x90\xb1M\
-L\x00\xdf\xdc.M\x00\x1b\xac  \x00\xca\x92\xef\xd7\
-\xc0\xf9\x0b\x15\xa2EAL\xc8\x08\xcc\x00\x142\xb7Y\
-\x05\x05\xd0\xdf\xbc\x02X\xb3u\x07\xec\xfd\xb3H\xb4(\
-\x88\x09\x19q\xf5\x02\x14\x008\x04\xd0\x93{\x7fS\x0b\
-\x80\xb6\x03\xacX\x9f%Z\x14\xc4\x84\xa0\x00l\x04\x9d\
-\x00\xc2BC`\xd0e\xad\xab\xe7W\xac\xcb\x82\xc2\xe3\
-%\xa2\xc5AL\xc6\x88\xabP\x00\x94\xccm\xcf\x0au\
-\x04\x92&\x80\xbf\xbf\xbf\xce\x0a\x1c\x02\xa0\xf4\xeb\xda\x1a\
-\xea\xd5\x0dS\xa6O\x9f=\x07\xcb\xd7l\xc6\xb6\x80 \
-\x03\x05`#\x83\x0a\xe0$\xff\x8f\xdc~{\xc7@\xf3\
-\x09\xa0[\xdbf\xd0\xaai\xfd\xea\xf9\xe2\x93\xa7\x15\x09\
- \xc1\x03\x0a\xc0FP\x0a\xa0a\xbd\xba\x90\xd4\xf9\x92\
-\x1a\xcb\xa8\x04Vl\xc8\xc2L H\xb8\x01\x05\xa0\x90\
-iV\x01\xfcM@\x00\x94\x9e\xed\x9bC\xf3\xa8z5\
-\x96\xd1\xea\xc0\xa6\xbc=\xf0G\xd11\xd1\xe2!~\x0e\
-\x0a\xc0\x86h\x06\xf0\x9d4\x01\xbc\xb7\xd6\x0a\x02\x02\x08\
-\x0f\x0b\x83~]ZBxxh\xaduT\x04y\xf9\
-\x7fB\xd1\xf1\x12(.\x0d\x98?\xea\x88\xa8@\x01\xd8\
-\xc8\xc8\xfd\xb7\x98\x00\xee\x1cdN\x01PhU >\
-\xa6\xb9K\x09 \x81M\x9dF\x0fBH\xb8\xef\xfe:\
-\xb3\xbf\x12\xd4\x02\xa0P\x09\xf4l\x1f]\xfdV\x00\x09\
-\x0e\xea4D\x01P2\xb6\x05\xb9\x00(aa!\x10\
-\xd3\xa21\xb4k\x8e\xbf\xe7\x17,\x84\xa3\x00\x142\xcd\
-*\x80\xeb\xdf\xfd\xd5\x0a\x06\x09\xc0A\xbd\xbau\xa0y\
-\xa3z\x10\x1d\x15\x09M\x1aF\x18yh\xc4\xcf\xa8\xd3\
-\xf0!\x14\x00\xd0*\xc03D\x00=\xb8\xf7_q\xd7\
-\xe0\xc0\x11\x00\x12<X\xe2\xfe\x0bM\x1b\xef\x90]\x0c\
-\xe9\xa0\x00\x90\xa0\xc4\x12\xf7\x1c\x11\xc0N\xd9\xc5\x90N\
-F\xee\xd3BU\x00i\x02\xb8\xee\xdd5V@\x01 \
-\x9c$+\x19\x00\x0a\x80\x0a\xa0X \x03\xf8\xfe\xae!\
-(\x00\xc4|\xa0\x00l\x98W\x00\xf3P\x00\x08?\x16\
-\x14\x80\x82\xad\x0a  \x80\xbb\xa5\x09`\xb5\x15P\x00\
-\x08'\x96\xb8\xe7Q\x00@\x05\xf0\x94\xa0\x00\x86\xca\x11\
-\xc0\xb5(\x00D\x80d\x14\x80\x02\x15\x80H\x15\xe0\x07\
-i\x02x\x07\x05\x80\xf0\x93\x1c\x8f\x02\xa0d\xe4\x08\x0a\
-\xe0\x1e\x14\x00bB,\xf1/@3\x14\x00l\xc9y\
-R\xa8\x0a Q\x00\xe9V@\x01 \x9cXz\xbf\x08\
-M\x9b\xa0\x002r\xa9\x00\xbas\xef\xff\xc3=\xc3\xe4\
-\x08\xe0\x1a\x14\x00\x22@2\x0a@\x81\x0a\xa0X@\x00\
-?\xa2\x00\x103\x82\x02\xb0a^\x01\xcc]e\x05\x14\
-\x00\xc2Ir\x1c\x15\xc0.\xd9\xc5\x90NF\xce\xff\x89\
-\x09\xe0\xde\x14\x14\x00b>,D\x00\xcdP\x00\xb0\x85\
-\x08@\xa4\x0d@\x9a\x00\xaeF\x01 \x02`\x06`C\
-4\x03\xf8\x09\x05\x80\x98\x11[\x1b\x00\x0a #\xd7\xac\
-\x02x\x1b\x05\x80\xf0\x93\x1c\xf7\x12\x0a\x00h\x06\xf0/\
-1\x01\xdc'M\x00+\xad\x80\x02@8\xb1\xc4\xbd\x8c\
-\x02\x00*\x80\x7f\x0a\xb5\x01\xfct\xdfp9\x02\xb8\x0a\
-\x05\x80\x08\x90\x8c\x02P\xa0\x02\x10\xc9\x00~F\x01 \
-f$\xb97\x0a\x80\x92\x91kV\x01\xcc\xf9\x9f\x15P\
-\x00\x08'\xc9q\xaf\xa0\x00\xc0\x91\x01t\xe3\xde\xff\xe7\
-\xfb\xaf@\x01 \xe6\xc3\x82\x02P\xb0\xb5\x01\x98P\x00\
-W\xa2\x00\x10\x010\x03\xb0!\x9a\x01\xfc\x82\x02@\xcc\
-\x88M\x00\xbbe\x17C:\x199O\x08\xb5\x01H\x14\
-\xc0/V@\x01 \x9c$\xf7~\x15\x05\x00\xb4\x11\xf0\
-\x09\xc1\x0c\xe0JI\x02x\x0b\x05\x80\xf0c\x89C\x01\
-Ph\x06 \xd2\x06\xf0\xcb\x03\x92\x04p\x05\x0a\x00\x11\
- \x19\x05\xa0`\xab\x02\xf0\x0b\xe0\x7f\xf2\x04\xf0\xb3\x15\
-P\x00\x08'\xc9q3P\x00@\x05\xf0\xb8\xa0\x00\xae\
-\x92$\x80\xd9(\x00\x84\x1fE\x00MQ\x00\x19\xd9\x82\
-\x02x\x10\x05\x80\x98\x10\x0bf\x00\x0a4\x03\x10i\x03\
-\x90&\x80\xe1(\x00D\x00[\x15`\x8f\xecbH'\
-#\xe71\xa1\x0c`\xa5<\x01\xfcd\x05\x14\x00\xc2I\
-r\xdck(\x00p\x08\xa0+\xf7\xfe+\x1f\xbcZ\x92\
-\x00\xdeD\x01 \xfcX\x88\x00\x9a5E\x01l!\x02\
-8Q\x22 \x80\x87P\x00\x88\x09\xb1`\x06\xa0@3\
-\x80\x13\x22\x19\x80,\x01\xa4\xbc\xf9\xa3\x15P\x00\x08'\
-\xc9q\xaf\xa3\x00\x80\x0a\xe0Q\xa1*\xc0\xaa\x87\xaeA\
-\x01 \xe6\xc3B\x04\xd0\x0c\x05@\xaa\x00\x8f\x0ae\x00\
-(\x00\xc4\x94X\xe2\xde\xc0\x0c\x00h\x060\xcd\xa4\x02\
-\x98\x85\x02@\xf8A\x01\xd8\x10\x16\xc0\xc3\x92\x040l\
-\xd6\x0fV@\x01 \x9c$\xc7\xcdD\x01\x80M\x00\xc5\
-'\xbbp\xef\x9f\xfe\xf0\xb5(\x00\xc4|XP\x00\x0a\
-\xb6\x0c\x00\x05\x80\x04\x19(\x00\x1b\xe6\x15\xc0L\x14\x00\
-\xc2\x8f\xad\x0d`\xaf\xecbH'#\xe7\x11\xa16\x80\
-\xf4G$\x09`\xe8\xcc\xef\xad\x80\x02@8\xb1\xc4\xcd\
-B\x01\x00\x15\xc0\xc3B\x19\xc0\xeaG\xaeC\x01 \xe6\
-\x03\x05`\x03\x05\x80\x04%\x96\xde(\x00JF\xaeI\
-\x050\xe4\x8d\x15V@\x01 \x9cX\xe2\xde\x84f(\
-\x00\x92\x01<$\xf4\x1ap\xcd\xb4\xebQ\x00\x88\xf9\xa0\
-\x02\xc0\x0c\xc0&\x00\x91\x0c\x00\x05\x80\x98\x12\x9b\x00~\
-\x93]\x0c\xe9d\xe4<\x88\x02@\x82\x0fKo\x14\x00\
-%#\xd7\xac\x02x\xfd;+\xa0\x00\x10N\x92\xe2f\
-\xa3\x00\x08\x99J\x06\xd0\x99{\xff5\x8f\xfeM\x8e\x00\
-\x06\xa3\x00\x10\x01,(\x00\x85\x0cA\x01\xfc\x8a\x02@\
-\xccHR\xef\xd9\xd0\xac)\x0a\xc0\xc4\x02\xf8\xd6\x0a(\
-\x00\x84\x93\xa4\xdeoa\x06@\xc8\xcc}@P\x00\x7f\
-\x97#\x80A\xaf\xa1\x00\x10~,qT\x00\xfbd\x17\
-C:\x199\xf7\x0b\x09`\xedc\x01(\x80\x86\x11u\
-`p\xa7V0\xa8KK\x88\x22\xd3\x9d[4R\x96\
-!\x81\xc3\xa2\xdd\x13\xa0\xe0\xd4f\xd9\xc5\x90N&\x0a\
-\xe0/\x1aF\x84C\xea\x80np[b\x8c\x91\x87E\
-\xfc\x90E\xbbP\x00\x94\xcc\x5c\xd3\x0a\xe0\x1b+\x18(\
-\x80\xce-\xa2\xe0\xc5\x1b\x93\xa1UT\xa4Q\x87D\xfc\
-\x18\x14\x80\x0d\x9b\x00:q\xef\xbf\xf6\xb1\x1b\xcc/\x00\
-\x1a\xfc\xb3o\xeb\x8fi~\x10\x91\x86\x02P\xa0\x02(\
-1\xa3\x00\x06\xce0F\x00\xf4\x89\x9f6i\x08\x06\x7f\
-\x90\x91\xb6k\x22\x14\x94\xa2\x002s\xef\x13\xca\x00\xd6\
-=nr\x01\xcc\x1e\xdd\x1f\x12\xdbE\x8b\x1e\x06a\xe4\
-\xdc\xc5S\xb0\xb1(My\x0ac \x06\x0d\xd9dX\
-4\xbd\xdf\x9e\x99\x06\x08\xe0k+\x08\x0a \xf1\xd2h\
-\x92\xfa\x0f\x90}Q\x82\x0e\x1a\xfcod\x0f'\xe3R\
-\xd9EA\xe4\x90&,\x80\x01\x06\x08\xe0\xa9k\x13\xe1\
-\xfa\x9e\xedd_\x8c\xa0c\xd5\xc1\xd9\x90~\xe0-\xd9\
-\xc5@$\x22.\x80W\xc5\x05\xf0\xe3\x83\xd7b\xdd_\
-\x02(\x00D\xba\x00ZGE\xc2\xb2\xbb\xae\x94}\x1d\
-\x82\x92\xec\xa3_\xc0\x17\xbf?)\xbb\x18\x88<\x0a\x0c\
-\x10\xc0WV\x10\x10\x00\xad\xff\xbf5z\xa0\xec\x0b\x11\
-\x94\xd06\x80\xb7\xb7\xdd\x04%\xe5\x07e\x17\x05\x91\xc3\
-Ha\x01\xf4\x7fE\x5c\x00s\xc6\xa0\x00dA[\xfe\
-\xe7\xef\x98$\xbb\x18\x88\xefY\xfe\xdf\xfe\xbbQ\x00\x08\
-\xc0\x8a\xfd/\xc0\x86\xc2\xc5\xb2\x8b\x81\xf8\x8e\x122\xc4\
-\x12\x01\x94\x18 \x80\xe5V\x10\x12@s\x14\x80\x1f0\
-'\xf7&(:\xbbKv1\x10\xdf\x90B\x82?\x9d\
-N\xa0\x00\x10\x85\xc23\xbb`N\xceH\xd9\xc5@\xbc\
-\xcf\xcc\xe7\x07\xee\x9a\xe6\x98\x11\x16\xc0\xe5\x82\x02\xe8\x83\
-\x02\xf0\x1b\xd6\x17.\x82\x15\xf9/\xc9.\x06\xe2=h\
-\x0f\xc0\x14\x22\x80\x12\xc7\x02q\x01\xbc,*\x80h\x98\
-3v\x90\xec\x0b\x83\xd8y?o2\x14\x9c\xc4.\xc1\
-\x01J\x22\x09\xfel\xf5\x02\x03\x04\xf0\xa5\x15D3\x00\
-\x14\x80\xdf@_\x09\xce&U\x81s\x17N\xc9.\x0a\
-b,\xd3_\x18\xb4\xcb\xea\xbc0\xe0\x04\xf0\xcd\xca\x0c\
-\xc3\x8e\x15\xac\x1c\xae\xdc\x04\xf9\x91sd\x17\x031\x8c\
-\xaal\x12\xfc\x89\xae\xd6\x08\x0b\xa0\x9f\x01\x02x\xdb@\
-\x01\xcc\xfb\xf8'\xc3\x8e\x15\xcc\x1cm>\x1f\xceFn\
-\x93]\x0cD\x1cZ\xdfO|q\xd0\xce\x02W+\xc5\
-\x05\xf0\xd2\x17V\x10\x11@{*\x80\xc1\x86\xfdoQ\
-\x00\xc6P\x19Z\x06\x85-_\x85\x8a\xb0b\xd9EA\
-\xc4\x98\xf6\xe2\xe0\x9d3\xdd\xadD\x01 n9\x17\xf1\
-\x1b\x14\xb5\xc0/\x0b\x99\x98\xe5/\x0d\xde\xa9\xf9nW\
-\xba\x00\x12\x89\x00\xe6\xa2\x00\xfc\x96\xe2&_Bi\xc3\
-\xd5\xb2\x8b\x81\xb0\xa3\xf4\xf6#\x02(\xd1\xdaHX\x00\
-}\x0d\xc8\x00P\x00\xfe\xcd\xa1Kf\xc0\xf9:\xf8\x85\
-!\x931\xf2\xa5!;\x96{\xdaH\x5c\x00/~n\
-\x05Q\x01\x8c\x1bb\xd8\xff\x1a\x05`<4\xf8\x0f\x12\
-\x09 \xa6!\xed\xe5!;R\xf5l\x18p\x02@\xbc\
-\xc3\xdaC\x8b\xe1\xdb}/\xcb.\x06\xe2\x99\x022$\
-\x12\x01\x94\xe8\xd9\x18\x05\x80\xe8f^\xee\x14\xf8\xbdd\
-\x8b\xecb \x1a\x90\x80Nyy\xe8\x8et\x86\xed\xc5\
-H~q\x99\x15\x84\x04\xd0\x02\xdeA\x01\x98\x82\x13\xe7\
-\x0e\xc1\xac\xacQPV\x81\xbd\x04\xfd\x94\xe9\xaf\x0c\xcd\
-\xb3\xb2\xec\x80\x02@\x98\xc8;\xfe?X\xb4\xfda\xd9\
-\xc5@j\x93\xfd\xea\xb0\xbcD\xd6\x9d\xc4\x05\xf0\x82\x01\
-\x02\x18\x8f\x020\x13\x8b\xf2\x1e\x82\xbcc+e\x17\x03\
-\xa9I\x22\x11@6\xebN(\x00\x84\x19Z\x05\x98I\
-\xaa\x02'\xca\x0e\xc9.\x0aB\xf8-\xff:\xf82u\
-\x86\x9c\xbf\x0cdy\xe13+\x08\x08 I\x11\xc0P\
-\xef]\x1d\xc4+\xd0\xc6\xc0\xb9\xd9Se\x17#\xe8)\
-)\xed\x00\xd9yS \xe3\xc9[%\x09\xe0y\x03\x04\
-0\x01\x05`F\xbe\xda\xf72\xac\xfds\xa9\xecb\x04\
--\x15\x15\xf5 #\xe7n8W\xde\x042\x9eB\x01\
- \x12x=\xf3\x168tj\xb7\xecb\x04%\xbb\x7f\
-\xbb\x11\x8a\x8e$(\xd3\xa6\x15\x00m\x03\x98\x87\x020\
--\x87N\xef\x86\xd7\xb7\xdc\x22\xbb\x18A\xc7\xb1\xe2\xee\
-\x90\xb7{t\xf5\xbc4\x01$=\xff\xa9\x15\x043\x80\
-y\x13\x86\x19\x7f\x85\x10\x9f\xb1\xe6\xc0\x12\xf8z\xef\xab\
-\xb2\x8b\x114TTD\xc0\xc6\xad\x0f)U\x00\x07\x99\
-O\xdd\x86\x02@\xe4\xf1v\xf6T\xd8W\x8c\xbf\xc6\xe4\
-\x0brvLR\x1a\xff\xd4\xc8\x13\xc0\x7f\x05\x05\xd0\x01\
-\x05\x10\x08\xd0^\x8236\xdf\x0a\xe7\xb0\x97\xa0W9\
-P\xd8\x0f\xf6\x15\x5c]ky\xe6\xd3\xd2\x04\xf0\x89\x15\
-\x84\x05\x90b\xe0%Bd\xb1\xfd\xd8JX\x90\xfb\x88\
-\xecb\x04,\xb4\xb5?+\xf7\x8e\x1a\xa9\xbf\x83\xcc\xa7\
-G\xcb\x11@\x1f\x03\x04\xf0\xae\x81\x02\xc8\xcc\xfb\xdd\xb0\
-c!\xec|_h\x85\xe2\x90\x1c\xd9\xc5\x08H2\xb7\
-\xdd\x01\xa7\xcf\xb4t\xb9.\xcb\xb4\x02hO\x040\xd1\
-8\x01\xe0\xef\x01\xc8\xa52\xa4\x0c\xf2\x9b\xbe\x01\x17\xc2\
-N\xc8.J@\xb1\xff\xc0\x102\xb8\xff\xe1\x1cy\x02\
-x\xce\x80\x0c\x00\x05\x10P\x9c\xad\xb3\x0f\xfeh\xf2\x8e\
-\xecb\x04\x0c\xf4\xa9OS\x7f-\xb2\x9e\x91&\x80\x8f\
-\xad $\x80KP\x00\x01\xc8\xe1\x06_Cq\xe4\xaf\
-\xb2\x8baz*.\xd6#\xc1\x7f;\x94\x977\xd6\xdc\
-.\xeb\x991r\x04\x90h\x80\x00\xdeC\x01\x04$\xf9\
-Mf\xc2\xb9p\xfc\xc2\x90\x08\xfb\xf6_\x09\x07\x0b\x93\
-=n\xb7\x15\x05`\x03\x05\xe0?\xd0\xe0\xff\xbd\xf1L\
-\xf1\x03\x05)'K\xdbC\xee\xce\xf1\xba\xb6\x95'\x80\
-\xff|d\x05Q\x01L\x1a.Z\x8cjP\x00\xfeE\
-q\xbd\xb5PD\xaa\x03\x08\x1b4\xf5\xdf\xb2\xf5^\xa5\
-\xd7\x9f\x1e\xb6\xfe{,\x0a\x80\x82\xaf\x01\xfd\x8fU'\
-\xa7\xc3\x1fg\xf0\xd5 \x0b;\xf7\x8c\x82\xe3\xc5]t\
-o/M\x00\x09\x82\x02\xb0\x18,\x00\xc4\xff(.;\
-\x04/o\x18\x83\xbf%\xa8\x93\xe3'\xba\xc0\x8e=7\
-3\xed\x93\x8d\x02@\xfc\x99\xdc#\xab\xe0\xbd\xecGe\
-\x17\xc3\xef\xa1\xad\xfd[\xb7MQ\xaa\x00,\xc8\x13\xc0\
-\xf4\x0f\xad *\x80\xc9W\x88\x16\x031\x01\xefeO\
-\x83\xdc\xc3\xe9\xb2\x8b\xe1\xd7l\xdb9\x16N\x96^\xca\
-\xbc_\xf6\xb3\xe3\xcc)\x00\xda\x06\xf0>\x0a (\xa0\
-U\x80\x17\xd7\x8f!U\x82B\xd9E\xf1K\x0e\x15%\
-A\xfe~\xbelX\x9a\x00\xe2\x0d\xc8\x00P\x00\xc1\xc3\
-\xde\x13\x990k\xf3\x9d\xb2\x8b\xe1w\x84V\xb6\x855\
-[\xc6q\xef\x9f\x83\x02@\xcc\xc2\xb2]3`U\xc1\
-\x87\xb2\x8b\xe1W\x5c\xd5v\x16X\xbf<\xc0\xbd\xbf<\
-\x01X?\xb0\x82\x88\x00b\xa8\x00\xae\x14-\x06b2\
-^\x5c7\x06\x0e\x9c\xda#\xbb\x18~\xc1\xf5\x9d\xef\x86\
-\x96uF\xc2\x1di\xbfp\x1f#\xc7:\x1e\x05\x80\x98\
-\x07\x1a\xfc/\xac\x1d+\xbb\x18\xd2\xe9\x12\x9d\x04\xd3\xfa\
-\xbe\x0b\x19\xfb\x8f\x98S\x00q\x06\x08`>\x0a (\
-Y\xb9\xffCX\xb6\xe35\xd9\xc5\x90Fd\x9dF\xf0\
-\xe4\xc0\x8f :\xb2\xb5\x22\x80\xdb\x05\x04\x90\x8b\x02@\
-\xcc\xc8\x1b\x9b\xef\x82=\xc73e\x17C\x0a\x93\xe3\xac\
-py\xdb\x1b\x94i\xf3\x0a\xe0\xd9\xa5V\x10\x12@K\
-\x98?\x05\x05\x10\xac\x1c/+\x84\xe7IU\xa0\xecB\
-p\xf5\x12\x8co5\x0c\xee\xe9\xf3W\xf6\x93Q@\x05\
-\xf03\xf7\xf1r\xa7O\x90#\x80\xde\x06\x08`\x01\x0a\
- \xa8\xc99\x9c\x0es3\x1f\x97]\x0c\x9f\x11\x19\xde\
-\x08^H\xf9Z\xa9\x028\xa0\x02\x98* \x80m(\
-\x00\xc4\xcc\xcc\xcd|\x0cr\x8aV\xcb.\x86O\xb8\xd7\
-2\x03\xe2[\x0e\xab\xb1\xcc\xc4\x02Xb\x05a\x01\x5c\
-%Z\x8cj\x0a\x8f\xe0o\xd1\x99\x91\xb3\x15\xa7`\xee\
-\xb6\xbb\xe1T\xc5Q\xd9E\xf1*W\xc4\x8e\x85\xdb.\
-{\xac\xd6\xf2\x8c\x82\xc3\x82\x02\x98\x88\x02\xa0\xe0\xef\x01\
-\x98\x97\xd3a\xf9\xb0'\xf2=\xd9\xc5\xf0\x1a\xd1\x91m\
-\xe0\x99!\x1f\xd4H\xfd\x1d\x98W\x00\xff6@\x00\xa9\
-(\x00\xc4\xc6\x9f\x11\xdf\xc1\x91:\xebe\x17\xc3+<\
-\xde\x7f\x1et\x8d\xee\xe3r\x9d\x22\x80\x85\x02\x02\xf8\x8f\
-$\x01\xf4\x12\x14@r\xcc%D\x00W\xf3\xee^\x0b\
-\x14\x80\xf9\xd9\x11\xf9\x16\x94\x85\x06\xd6\x17\x86\xfe\xde\xed\
-N\x18\xd1\xf5.\xb7\xeb\xa9\x00R\x05\x04\xb0]\x9e\x00\
-\x16[AH\x00-Q\x00H\x0d\xce\x92\xe0\xa7\x12\x08\
-\x14.\x8d\xea\x0a\xff\x1e\xfa\x81\xe666\x01\xf0\x7fv\
-\xb7\xffg\x12\x0a\x80\x82\x02\x08\x0c\x0e\x93j\xc0\x9fu\
-W\xc8.\x860\xb4\xbe\xff\xc4\x80\xb9\x8a\x04\xb40\xad\
-\x00z>#.\x80\x85SQ\x00Hmv\xd5\x9b\x0f\
-\xa7B\xf3e\x17C\x88\xd1\xbd\xa6\xc1U\x1d=\x7f\xe7\
-a\x0b\x15\xc0\x02\xfe\xcfn\xdes\xd2\x04\xb0\xc8\x0a\xc2\
-\x02\xb8F\xb4\x18\xd5|\xb3\x12\xffDu\xa0P\x1er\
-\x02\xd6\x9c{\x09\xce\x9a\xb4\x97`\xb7\xe8>\xf0\xc4@\
-}\x7f!\xc9&\x80\x1f\xb9\xcf\x95\xf7\xdcd\x14\x00\x12\
-xd\x17\xa5\xc3[\x9b\xff!\xbb\x18\xcc\xd4'\xa9\xff\
-\xb3C\x97Bt\xfd\xd6\xba\xb6G\x01 \x88\x1b\xde\xda\
-\xf2\x04d\x17\x9a\xab\x97\xe0\x03}_\x81\x84V\xc3t\
-ooZ\x01\x5c\xf6t\x9a\x15D\x04\x10\xdb\x0a\xd2P\
-\x00\x88\x06\xb4\x0a0}\xf5\x048~\xd6\x1c\xaf\x06\x13\
-Z\x0f\x85\x07\x92_e\xda\x87\x0a`\xca\xfc\x1f\xb8\xcf\
-\xb9\xe3\xbfSP\x00H\xe0\xb2\xfbx\x16\xbc\xba\xee\x1e\
-\xd9\xc5\xf0\x08M\xf9i\xea_\xdfEo?-P\x00\
-\x08\xe2\x81\x8f\xf3^\x87_\xf6},\xbb\x18\x9a\xd0F\
-\xbfnnz\xfbi\x11\xbc\x02\x88i\x09i\xb7_+\
-Z\x0c$H\x98\x9e>\x01\xfe,\xf5\xcf\xdf\x12\xbc\xb2\
-\xd3\x18\x18\xd3\x93\xef\x8f\x9fl\xc9/\x82)\x02m\x00\
-\xd2\x04\xd0\xe3\xa9\x85V\x10\xcc\x00\x16\xa1\x00\x10\x9d\xd0\
-\xe0\xa7\x12\xf07hG\x9f'\x06\xceeN\xfd\x1dP\
-\x01L\x16\xc8\x00v>\x9f\x8a\x02@\x82\x83\x9f\x7f\xff\
-\x08>\xd9\xfe\x86\xecb\xd4\xe0\xd9aK=\xf6\xf6\xd3\
-\x02\x05\x80 \x0c\xd0\x06A\xda0\xe8\x0f\x8c\xe8N\xbf\
-\xe8#\xf6\xc7NP\x00\x08\xc2\x00}%H_\x0d\xca\
-\xee%\xc8\xd2\xdbO\x0b\x14\x00\x820\x22\xbb\x97 k\
-o?-P\x00\x08\xc2\x81\xcc^\x82z\xbf\xe8\xa3\x87\
-\xa0\x15@B\x93\xd30;\xc1?_\xeb \xfe\xcf\xd9\
-\x0b\xa7aVy\x1e\x94\x84V\xf9\xf4\xbc\xdd+\xc2 \
-5*\xd9\xb0\xe3e\x954\x82\x87\xb3\xbbp\xefoZ\
-\x01\xc4\xd7/\x82\xd7:\x98\xff{\xdf\x88<\xf2\xc3*\
-aa\xfd\xf3>;_\xbd\xaa\x10x\xf4L\x04\x19\x1b\
-w\xcc\xec\xb3\xad\xe1\xf1\xfd\xd7q\xef\x8f\x02@\x82\x9a\
-\x15\x11\x15\xb0\xb1n\x85O\xce5\xb6\xac.\xf4\xa8\x08\
-5\xf4\x98(\x00\x04\x11\xe4\xed\x06\xe7\xa1(\xb4\xd2\xab\
-\xe7H\xb8\x10\x067\x9f\xabc\xf8qQ\x00\x08\x22H\
-Qh\x15\x91@\xb9\xd7\x8e\xdf\xa42\x04\xee;kl\
-\xea\xef\x00\x05\x80 \x06\xb0\xa1\xeeE\xf8>\xe2\x82W\
-\x8e\x9dz\xb6.\xc4^46\xf5w (\x80\x02\x22\
-\x80X\x9e\x1d\x8d\x10\xc0Md\xf4%\xef\xfe(\x00\xc4\
-h\x16\xd4?\x0f\x05a\xc6V\x05R\xce\x87CJy\
-\xb8\xd7\xca,(\x80t\x22\x80\x14\x9e\x1d\x8d\x10@\x0c\
-\x19q\xffr#\x0a\x001\x1a\xfaJ\xf0m\x22\x81s\
-!\xc6\xe4\xea\xad*C\xe1\xbe3u\xbdZfA\x01\
-L'\x02\xb0\xf2\xec(,\x00\x0a\x91\x00\x15@\x0c\xcf\
-\xbe(\x00\xc4\x1b\xec\x0c\xaf\x84\x8f\x22\x8dy5x\xdf\
-\x99\x08\x22\x01CB\xc5-\x82\x02H!\x02H\xe7\xd9\
-\xd1(\x01X\x81\xb3\x1d\x00\x05\x80x\x8b\x0f#/\xc0\
-\xae\xf0\x8bB\xc7\xb8\xae\xbc\x0e\xf4?\x1f\xe6\xf5\xb2\x0a\
-\x08\x80\xbb\xfeO1J\x001 P\x0d@\x10o\x10\
-\x1eV\x0e\xf1\xbd>\x85\x88\x08\xbe/\x0c\x95\x9ej\x0b\
-\xdbw\xde(\xfb\xbf\xe1\x09\xee\xf4\x9fbX^C$\
-\x90FF\x93e_\x0d\x04Q\xd38\xea\x10\xf4\xec\xbe\
-\x9cy\xbf\x8a\x8b\x11\x90\xb3\xfd6(/\xe7\xfb\x81\x0f\
-\x1fQB\x86X\x22\x80\x12\xde\x030\x0b`\xe9\xd2\xa5\
-\xae\xf6\x09\x99\xb9\xf7B\xe33\x15\xf0;\x99n\x22\xfb\
-\xaa \x88\x9a\xd8\xf6k\xa1u\xab\x5c\xa6}v\xed\xbd\
-\x0e\x8aOpg\xd6>\x81\x04\xe2\xb4'{\xd4\x99\xe5\
-\xbc|\xc2\x84\x09\xba[?=\x0a\xc0E\xc0\x87\xb8\xd8\
-\x97N\x87\xbc\xb2\xfb\xc2\x88\x0b\x95\xb0L\xf6\x85A\x10\
-ghU\xa0A\xfdc\xba\xb6\xa5\x81O\x05\xe0\xcf\x90\
-\x80\xfb\x9a\x04\xff(2\xa9\x0e\xf6*\xa7\xb1\x82\x96\x10\
-\x5c\x0a\xc0)\xe8\xd5\x01\x1f\xe2f\xbez\x98\xb1\xfb\xc2\
-\xfd\xe5\x95\xf0\xb2\xec\x0b\x84 jh\xf0S\x09x\x82\
-\xa6\xfeY\xd9\x13\x94\xb1\xbfB\x02m[\xcf\xc6\xa1\xd7\
-\xdc\xd8&\xec\x84}Q\x95\x8b\x01\x9c\xc7\xaeDPK\
-\x00\xf6\xe0w\x0e\xf2P\x17\xd3\xae\xc6\xca\xf4\xac\xbd\x17\
-\xfey\xba\x02\xf8~\x1e\x15A\xbc\x04\xad\x06\xd0\xea\x80\
-\x16y\xbbn\x82\x93\xa5md\x17\xd5-a!\x907\
-\xacE\xd8\x8d\x97G\x87\xd2\xe0\xa7\x01]\xe9a\x5cK\
-\x0cj\x11T\x0b@\xf5\xd4w\x15\xd4aNc\xf5r\
-\x97\xcb\x16\x15T\x8c:t\xae\xea\x1f\x95U\xe0\xd7\xad\
-(Hp\xd1\xab\xc7W\x10\xd5\xe8\xa0\xcbu\x85Eq\
-\x90\xff\xc7 \xd9EtKd\x18\xac\xfc{\xeb\xb0\x7f\
-tm\xa4\x04\x7f\xa5}\xb8\xe8b\xfa\xa2\x9b\xf5\xd5\x22\
-pH@\x09zU\xf0;\x02?L5\x84\xbb\x18\x9c\
-\xd7\x85\xb9\xd8'lGie\xdb\x9f\x0f_\xfc\x07\xc9\
-\x06z\xc9\xbex\x08B\xa1\xaf\x06/m\xbb\xa5V\xa3\
-\xe0\x9f\x07\x93\x95\xc1\x1f\x09\x0d\x813=\xa3B_\x19\
-\xd1&,\x1dl\x01]\xe14\xbe\xa8\x9aw\x1e\xe8\xf2\
-\x0b\xaam\xaaE@%\xa0\x16\x80:\xf0i\x00\xd3\xef\
-<\xd6\xb5\x0f\x11\xf6\xa1\xae}\xb9\xf3\x10\x0e\xeeE\x11\
-\xbe\xa5\xb8\xb2gvI\xe5\xf0#\xe5U=d_L\
-\x04\xa1\xd0\xbe\x01\xf5\xec\xfd\x03\xce\x9c\x89\xf6\xcb:\x7f\
-\xbd08\xd1\xb9a\xe8\xea\xc1\xcdCW5\xab\x1bR\
-\x0a5\x03Z\x1d\xe4\x8e\xf9\xf3\xf6\xe1\x82j\xba\xdc>\
-\x5cPmW\x9d\x11\x84\xa8\x82\x9f>\xfd\xd5\x81_\x8f\
-\x0c\x91\xf6\xa1\x81}L\x97\xa9e\x10\x01\xaeE\xa0\x9e\
-\xae\x96\xca\xa9\x8a\xaa\x06\xd9%U]\x8e\x96W\xb58\
-^^\x15\x1db\xcb;\xaa\xdb\x1cBj\xbfa\xb0o\
-R\xeb\x8d\x03]\xe1\xaa\xa1R\xbd\x8f\xabu\xb5\xe6C\
-\x5co\xe3n_\xcdu!!\xcc\xc7\xf0\x84w\xfb\x9f\
-\xfa\x16\x91\x8e\xf9\xb5\xf6\xad\xaa\xd2\xb7\x9d\xa7uU\xae\
-\x97W\xb9\x9a\xaf\xd2Xg/\x93\xcb\xc67\xd5~\x8e\
-\xf9\x9a\xeb\xab\xfeZ\xd70\x1cJ\x9bG\x84\x1c\xed\xd8\
- \xf4\x8fN\x0dCh]E\xfd\xb4W\x07\xfc\x05\xd5\
-\xb4#\xe8\xcf\x81-\xd8\xcf\xd9\x8722\x9c\xb5\x0fe\
-\xf6u\xe7U\xc7\xact\x08\xc0Q\x7fw\x045\x0d\xf4\
-\x06\xf6\xa1!\x19\xa2\xec\xe3\xfa\xe0Z\x04tP\x07\xbe\
-+\x01\x84\xa9\xe6\x9d\xdb\x13\x9c\xdb\x11\xd4\x83\xab\x06G\
-\xe7iO\x03h\xcc\x03\xc7Xk\xda\xdd\xf6\xae\xe6=\
-\xed\x1fhTy\x98w\xb7\xaeJ\xe71\xb4^\x89\xe9\
-\x19W\xb9\x99\xd7Z^\xe9f\x99\xabF9w\x83\xba\
-\xee\xae\x9eV\xa7\xf1\xae\x04\xe0\x18\x1cOz\x1a\xe44\
-\xf0\x1dA\x7f\xda>\x94\xda\xc7\x8e\xf5\x0ey\x5c\xa4\x02\
-p\x04\x12\x0dNu\xf0\xd3\xc6\xbb(\xfb\xd0\xcc>\xef\
-,\x01:8\xaa\x05\x0e\x09\xa8\x05\x10\xe6b\xd0\x0ax\
-w\xc1\xae\x15\xf0\xe0f\x1e\x80-\xc8\xf5N\xeb\x99\x07\
-\xc6\xf5\xac\xdb\x05\x02z3\x02\xd6\xa7\xba\x1eY\xf0H\
-Ck\xda\xd3\xa0\xd5R\xefI\x06\xceu~g\x01\xa8\
-S}G\xe0\x9f\x81\xbf\x02\x9f\x0e\xc5PS\x02\x8e*\
-A\xb5\x00\x1c\xe9?\x0dh\x1a\xe0\x8e\xa7>\xed\xd5\xd7\
-\x94\x0c\xd1dh\x0c6\x094\xb0o\xe3\x10\x80\xba\x1a\
-\xa0\x15\xfc\xee\x02?\xc4i\xda]\xc0\x03\xb8\x0f~\xad\
-1\xcf\xb4\xd62=\xebD\xb6\xe5\xd9\xde,\xf0T\x03\
-X\xf6\xa9bX.\x9aI8\xa6\xb52\x09-\x198\
-g\x0b\xeed\xe0J\x04\x8e\x94\xdf18\xea\xf9\xce\xc1\
-\x7f\x12l\xdd\x85\x8f\xd9\xc7\xa5\xf6\xf5\xd5Y\x80C\x00\
-\x8e\xf4\xdc!\x00\x1a\xe84\xe0\x9b\xda\x87\xe6`\x93\x81\
-:\x0bp'\x00\x87\x04D\x82_O*\x0f\xc0\x17\xf4\
-\xae\xe6\xdd-\xd3Z\xce\xba\x8d^\x025\xf8\x1d\x18\xfd\
-\x83Z\x9e\x8e'\x92A8\xcf\x1bQ\x9d\xa8\x04\xf7\xd9\
-\x81V6\xe0.\x0bP7\xf4\x9d\x81\x9a\x02\xa0AO\
-_\x19\x1e\xb5\x8f\x1d\x02(\xb3\xefW\xa1\x95\x01P\x01\
-\xb0f\x00\xceo\x04\xd4\xc1\xef)\xed\xe7\x91\x80\xd1u\
-v\x9ee \xb0\x9d\xb7\xf6\xf7g\x0cm\x0cd\xdc\xd6\
-S\x1b\x04K\x95\xc1\xd3\xd3\xdfy\xde\x95\x00<\xb5\x0f\
-\x5c\x04\xd7Y\x80\xab\xfa\xbf\xbb\x0c\x80\x06\xfeq\xfb\xf8\
-\x14\xfc%\x80\x1a\x19\x80h\x1b\x80\xa3\x1d@\xab\x01\xd0\
-9#0\xaa\xc1\x0f\xc0s\x96`d\xf5\xc0[U\x05\
-\xa3\x83^$\xa3aI\xa5E\xd0s<\xd6'<k\
-j\xaf\x9e\xf6V\x1b\x80\xde\xfa\xbf\xbb6\x00\xe7\x0c@\
-\xab\x0a\xc0\xdc\x06 \xf2\x16@\xdd\x08\xe8\xae\x1d@O\
-c\xa0Z\x0a\xea\xf28g\x06\xee\x1a\x08y\xde\x06\xb8\
-\x9a\xd63\xd6\x9af\xd9N\xcf\xfe\xa2\xf0\x1e\x9b\xa5\xb5\
-\x9e\x15\xbd\xc7\xd6\xf34v\x9e\xf7\xc6[\x00\xe7uz\
-\xeb\xf5z\xdf\x008?\xed\xd5\xd3\x15\xc0\xd6\x08\xc8\xf5\
-\x16\x80\xb5\x1f\x80\xfa\xa9\xef\x9c\xfe\xbb\xea\x14\x14\x06\xee\
-e\x10\x0a\xfa\xde\x0ehU\x19\xb42\x05o\xbd*\xd4\
-\x92\x82\x968<\xcd\xeb\x11\x86^\xb4\xca\xa6\x07\xad\xc6\
-/^D^\xedyJ\xc7\xdd\x8dY\xd2s#Z\xf5\
-\xf5\xbe\xf2\xd3J\xf3\xdd\xb5\xfe\xbb\xaa\x02\xa8E\xc0\xde\
-\x0f\x80^\x09\xa7,@\xdd\x90\xa7\xee\x05\xa8~\xe7_\
-\x07j\xbe\xfas\xd7\x1b\xd09\xe8\xdd\xbd\x1d\x08\x07\xcf\
-}\x03\x1c\xf3!N\xd3Z\xd5\x07\xd6W\x8az\xe5\xa0\
-7\x83\xd0\x9b=\xb8\xdb\xd6\xd5\xbc^\xf4\x0a\xc9\x15\x9e\
-\x02\x8b\x15\x96\xa0\xf5\xb4\x0d\xef{|\xf52w_\x94\
-ay\xa2\xbb\x0at\xc7\xb2\x8b\xe09\xbdW\x8f+\xc0\
-u\x83\x9f;\x09\xa8{\x02:w\x08R\x0f\x8e\x80?\
-\x07\x7fU\x1bjt\x09V\x0b\x80\xe2\xfc%\x1f\xb5\x0c\
-<u\xf9\xd5z\xd2k\x0dZY\x80;\x09\xb8\xcb\x08\
-\xdc\xc9\xc0\xe8lAo\xe6\xa0^\x06\xe0Y\x16\x9e\x84\
-\xc1\x02\xeb\xb1\xb5\x1a\xba\x8c\x16\x80\x9e\xe3\xebI\xc5]\
--\xf3\xf4\x84\xaf\xd4\x98w\xd7@\xa7\x0ev\xad\xc0w\
-\xf7\x94\xd7\x0a~\xf5\x13\x9f%#p5v%\x06\xf5\
-t\x8d/\x06U\x7f\x17\x80\xe2\xe2\x0bA\xee\xbe\xf5\x17\
-\xe6a\xb9\xa7`f\xe9\x09\xc8Z%\xd0\x13\xfc\x9e\xb2\
-\x03\x11\x19\xb8\x13\x80\xa7*\x83\xa7mY`\xcdX\xd4\
-\xe8\x09*\xf5\x98\x05O\xef\xcb\xc1\xc3\x985\xd0\xf5\xb4\
-\xbe{z\xc2\xbb\x0b|\xe7\x80g\xa9\xe7{\x12\x83\x96\
-,\x5c\xb5\x15h\xf5$tu\xce\xeakWC\x00\x0e\
-8\x7f\x0f\xc0\xdd2#\xe6\xdd\x9dGo`{z\xfa\
-\x1b%\x00\xd0\xb1\x1e\xa0v\x00z\xda\x1e\xc0u\xb0j\
-!\x22\x17\xbd\x12\xd0\x83VC\x9e\xbb\xe3\xbb\xdb\x8eR\
-\xa9\xe3\x18\xa2B\xd0\xca\x02\xb42\x02wU\x03\xd1y\
--\xf9\xe8\x91W\xadk\xec\xf2\xf7\x00\xd4\xb8\xf8E\xa0\
-\x10\x8di\x96A+\xed\xf6\xc6:=\x01\xad'\xd8\xf5\
-\xfc\x7f\xc1\xc3rOc\xd1\x0c\xc0\x954\xf4\x88H\x8d\
-\x9e'\xaf\xab\xed\xf5\xc2\x22\x17\xbd)\xbe\xbbmD\xa5\
-\xc0\xba\x5cO\x86\xe1\xeeX\x9e\xd6km\xaf\xe7z\xd6\
-\x0a|\xad\x0fA\x0dt\xfc&\xa0\xde\x0f\xb7zZo\
-\xd0\xb8[\x17\xeaa\x1b\x16I\xe9)\x83\xa7\xb2km\
-\xeb|\x9d=\xc9\xd5\xc8*\x80\xd6qy\x04\xe0\xbc\x1d\
-\x0bZ\xc7v\xb5^\xef\xb6Z\xdb\xf0\xb6\x13h\xadc\
-\x15\x8f\xa7\xed\xf4\x96\x1d<,sw\x0d\xd9\x7f\x13P\
-\x0bw\xbf\x0a\xac1\xaf\x95\xfe\xbaZ\xa6W$Z\xeb\
-\xf4\xee\xcb{.\x96mX\xae\x87\xbb\xe0\xe4\x91\x81V\
-y]\x1d\xd3\xd5\xd3]+8\xf5\xe2\xa9\x1a\xa0\xb5\x8d\
-\xa7\xedY\xc6F/s\xb5\x8e\xa5\x1c\xee\xae\xab\xa7k\
-\xeeQ\xc4\x86\xfe*\xb0^\xdc\x88A\xeb<\x9e\x96i\
-}X\xf5l\xa7W<\xae\xd6\x1byL\xd1\xff\xab\xbb\
-ez\xd0\xf3\xd4w\x877\x82\xdf\xdd\xb1E\xb7\xf5\xb4\
-\x8d\x9e,\xc3\xd3z=\xe7\xd4[NO\xeb<]\x13\
-\x05\x96@w\x87a\x02\xf0\x84\x07A\xb0\x96)\xc4K\
-\xcb\xf5<yY\xce\xc1\x1a\xcc\xac\xe5\xd7\x83'\xb9\xb8\
-C4\xe5\xf7\xb4\x9f\xa7\x80\xd7\xb3\x9c%h<\x05\x1c\
-k\x00\xb2\x96_\xef\xfaj\x8c\x08pO\xfc?SV\
-\xc8`\xde\x11\xb2$\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00[0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00Z\xf7IDATx\xda\xed\x9d\x09\x9c\x1c\xf5\
-u\xe7_\xf5}\xce\xf4\xdc3\x92f4\xa3\xfb@\xa0\
-\x03a\x0b0H\xc666\x06[xw\x13\xc7v\x1c\
-)Y\x1b\x13\x1f\x80\x01'\xb1\x1d\x1b6\xbbI6\x1b\
-\x1b%\x0e`\x0c\x18q\x83\xcd}\xdf\x12\xc67\x16\x08\
-c\x04\x12\x02\x06\x10\xe8>\xe6\xbez\xba\xf6\xff\xfeu\
-\xf4\xbf\xaa\xfeU]\xd5]U\xdd#\xd5o>=u\
-Ww\xff\xab\xdf\xb7\xde{\xff\xa3\x04\xf0P/=\xf8\
-\xd5\x1c\x99\x5cH^\x17\x90WN\xb7\xb9\x97y\xbdM\
-^G\xc8k+NO8\xe7\xca\xad^~\xae@\x81\
-\x02I\x12\xbc:\xf1\x1b\xbf\xffVnb$\xbfI,\
-\x88K\xf3\xa3y\x80\xc9\x02\xc4\xb3\x8d0\xd2\x7f\xc8\xee\
-)\x14 \xa0\x9e\x95\xa7\x9b\xf1\x1f\x01\xc4\xe6*\x95W\
-\xa0@G\x95\xbc\x04\xc0\x8bd\xb2TYNf[\xa1\
-a\xfabHd[\xe8\xf2\xf8\xc8 L\x0c\x0f\xd2\xe9\
-8\x9d\x0e\xd0\xe5\xc9\x89q'\x90\xa0\x1e\x83<\xed\x03\
-\xc6\xab \x90\xe8\xadBy\x06\x0a4\xa5\xe4%\x00D\
-\x9c\xd6\xb7\xcd\x83\x81\x03oAar\x82\xaeG\x10\xd4\
-\xb5\xcd\x85t\xc3t\xcb\xe3\x11\x04\xa3\x04\x04,\x10\x86\
-\x0e\xee\xa6\xd3\xc1\x83{\xec~\x8c^\xf9\x85\x90x\x09\
-\x820#P \x8d<\x07\xc0\xac\x95\x7fF\x8d\xbfo\
-\xef\x0e\xe8\xdb\xb3C\x05A$\x9e\x86\x86i\x8b!\xd3\
-0\x0d\x84p\xac\xac\xf7\x18\x92A0\xa2\x82\xe2 \x14\
-d`\xe0\xb2Mm\x96\xa7\xcf\xea\x96\xb7\x12H\x1c\xf1\
-\xaa|\x02\x05\xaa\x05y\x0f\x80\x13\x96\x00D{`\xb4\
-\xefub\xe8)\x18\x1f\x0b\xc3\xe1\xf7_\x81\xfc\xd8\x10\
-\xdd/\x04\x22$\xc5\x02$\xe2I\x08\xc73\x10\x8a\x91\
-\x17\x81\x83\xf4\xca\x90c\xa2\x10N5\x94\xf5\x19\xf4a\
-\xc6\xe4\xc4\x98\xc1\xab\xb0\xa1 \xcc\x08t\xd4\xca{\x00\
-\x1c\xd7L\x97G\xfa\x0e\x93\xdb~+$\x9b?D\x97\
-\xfb\xf7n\x83#{\xdf\xd2\x80 A@\x10'SA\
-(~0A\xfe\x87^\x82\x02\x82H]+\x9d\x863\
-m\xd24\xdbZ\xd6gT\xc2\x0c\x94\x12V\x94\x11f\
-\xa8a\x05h\xc3\x8c Y\x19\xa8\xe6\xe5\x1f\x00\x0e\xbd\
-A\xa7\xc9\xe6\x13\xa9G0rd'\x84\xd0#\x98H\
-i<\x02\xfc@\x09(@\x92\xbc\x04(\x02\x00\x98y\
-\xf6C\x0bBq)\x9cl\x00!\x12\x05\x81Nc\x10\
-J\xe6(8\x84X\x9a\xbe\xca\x11z\x0alX\xa1\x84\
-\x19\x8aWaS\x9b\xe5\xa9\x12f\xa8^E\x10f\x04\
-\xaa\xa6\xfc\x07@\xe3li\xf9\xc8^r+o\x82d\
-\xcb\xc7\xe8\xf2\xe0\x81Wa\xe0\xc0^\x18\x19\xd8\xa7~\
-\xb0\xa4\x02\x02\xd6\xe8-\x00`\x80\x85n\x7f\x84@\x08\
-a\x10G d\x88\xdb!A\x02\x10\x12I}3\x05\
-{r9\xcc\xe8\x05\xa9MD/\x04aF \x1fT\
-=\x00\xe02\xd9#\xd9\xb4X\xf2\x08\xfa\xdf#v\x98\
-\x83\x82X\x0f\x87\xdf{E\x05\x01*AvL\x09\x05\
-\x08\xe3\x01\x15\x00@\xda\xbf\xb8A\xd0\x1c(\x85\x19\x0a\
-\x08B\x19)\xac\x10\xd2\xf24A\xc2\x8fp\xb4\xac\xb2\
-P\x92\x95\xfa0\xc3A\xb22\x083\x02y\x22\x7f\x01\
- \xea\x00\x00\xcc\xf2\xe1w\xc9\xddx\x16\xc4\x1bV\x91\
-O\x15\x81\xd1\x81\xfd\xb4\xfap\xe0@\xafzN\x0a\x82\
-P\x01\x22 \x16\xbf\x80\x9b\x00\xd0\x95\x8c\xbephH\
-\x92\x94A@\x80\x80\x09J@\x8f\x22\x9a\xa6S\x88\xba\
-\x13f(m\x22\xca\x0c3\x94de\x10f\x04*)\
-\xef\x01\xb0\xd8\xc2\x03\xd0-\x87\xa2I\x88\xd7u\x91\xd0\
-\xa0Sz\x11\x10`n\x00s\x04\x1a\x10\x08\x92G\x10\
-\xa1\x09C\x7f\x01\xa0_)\xe8w\x8e\xca\xf9\x86\x90\x94\
-\x8b\xc0)$\xa40\x83N\xcb\x90\x12fL\xaa\x90(\
-+\xcc\xe8\x05m\xd3ke>h\x13q\x0c\xcb7\x00\
-\x0c\xcb\x06\x9f\xe2\x00@\x04\x06\x00\xd9i\xf2'\x8b\x10\
-\xa3i!w\xd7\x1e\xf4\xbf\xb9 \x88\x11\x10\xa4\xc9\x0b\
-\xa7\xea\x97\xf1\x12\x00\x9c\xd2\x128;s\x0b\x95}\x0f\
-9\xac\x80\x94<MK\xad#\x89\xfbSKa\x06j\
-3\xfe\x0b\xc2\x8c\xa3W\xbe\x03\xa0\xa4\x07\xa0\x00\x80U\
-\xa4C\x03\x82\x81\x83\xbd\x9aFE\x08\x80\x0c\x82 \xc4\
-\x80\x80\xf9\x86\x8e\x01\xc0\x03\x02\x18\x01 \x98\xec\x5c\x12\
-\x00\xa5\xa4x\x0cqy\x1aM\x15C\x8c\x0a\xc3\x0c}\
-\xd3\xeb \xcc8\xb6\xe5\x0b\x00pF\xef\x01\xf0<\x02\
-S\x00(\x0a7\x13\x10\x90\xd0 \xd4\xc0m]H=\
-\x02\x02\x81\x84\xec\x11X\xdf\xc5\xad\x01\xc0+\x18\xdf\x00\
-PJr\x0eB\x0a/\x94\x9c\x84\x1c^\xa4*k\x13\
-\xa1\x0f3Pe4\xbd\xc6W\xd0\xc3s\x0a\xc8s\x00\
-\xf4\x98\x84\x00\xf6\x00 \xf2O\x1en\x90<\x02\x13\x10\
-\x84\xc9\xb7\xca\x86\x0a\x90$0\xd0\xdc\xfd\xb5\xff\x1c\x01\
-\xc02\xfe\xd7m3\x03\x80g\x85\xcd\x93>\xcc\xa0^\
-E\xd4\xd50\xa3\x8c\xa6\xd7A\x0f\xcf\x1aS\xcd\x00`\
-\xf8\xd0N\xf2\xbb,\xe1\x01\xe8\x15\xca\x82@\x13\x86\x1d\
-\xd4\xf8\x87\x0e\xbf\xa7iT\xa4\x80 \x15\xd2\xe7\x08\x04\
-\xdd\xb2\xae0\xcaM\x00Z\x15\xaa\xdf\x00(%%\xcc\
-P\xc2\x0a\x0f\xc3\x8c\x0a\x9b^\xabm$\x826\x11\xee\
-\xab\x8a\x00\xd8\xa9[~\xc3>\x00\xf4\x8e\x81\x90\x00!\
-6\x8b\x82\x00\x85\x89B\x1e\x08\xd0#\x08\x99\x00\xc0\x95\
-\x1a\x00\xab\x02\xad5\x00\x94\x92\x0fa\x06\xaa\x82\x1e\x9e\
-\xf8z[^\xb7\x19\x82<DY\xf2\x11\x00F\x83\xd7\
-/s\x01 \xdaz;\xf9\xdb\xc8 \x08\xb7\xd0Z\x04\
-=\x08B\xe4\x95\x09\x8b\x90&\xaf\x10\x04\x00\xa8XJ\
-\x98\x11g\xaa9i\x98!/\x97\xa1!&\xbcP@\
-\xe1 \xcc\xd8H^\x97\x07\x9e\x82}\xf9\x00\x80&\xba\
-<|P6\xf8&\x0b\x00D\x1c\x86\x00\xa6\xdf*\x02\
-B\xb4KmK\x80\xa1A\xff\xde\xd7\xd5\xd6\x85\x0a\x08\
-\xf0\x15\x0a\x00\xe0\x9d\xd4\x06R\xa9bh!\xb7\x91\xa8\
-\xb4M\x04[{\xd1\xbf\xe7\x1d}\x88\xb1\x01$\x10\x04\
-\x1eA\x09U\x1f\x00\x0de\x84\x00\xb6\xbf\x9d\x16\x04\xd8\
-\xba\x90mf\xac\x82 \x22BXW*\x01\x00|\x90\
-&\xcc\xd0\x85\x17J\xdb\x08\x9bB\x18\x1c\xde\xb5\x13\xf6\
-\xeeP+\x1bpfM\x00\x01k\xf9\x0f\x00\xa7!\x80\
-+\xdf2\x22\xb7%\xe8\xa2a\x02\x0f\x04i\xd9#\x88\
-\xc8]\x10\x03\x00\xd4\x88\x0c\xb5\x18rxa\xe2E\xa0\
-'\xf0\xf6\x1f\x9e\xa1\x1e\x02\x04\x10()\xef\x01\xb0H\
-\x06@\xc9Z\x00w\x01`\x96:\x10\x10\x04\x98'\xe0\
-\x80\x00\x85 \xa8#\x1eA\x94g\xec\x01\x00jK\x08\
-\x84\xfan\x10\x1b\xe7Ia\x86,\xcc\x15\xec|\xeeA\
-\x05\x02\x1b\x08\x00.\xaa\xf6G\xadUMy\x008\xc9\
-\x11j\xbe8\x03\x02^3c\x04A}D\xf6\x08 \
-\x00@M\x8b\x80@l[Ja\xa0\x08k\x1b^'\
-\x10\x90\xd5\x13$\x06\xf9\x9aR\x00pl\xec6\x0e\x10\
-\xa2\xf6@\x10UG'\xd1\x17^\x00\x80\x9a\x11z\x03\
-\xd3V\xaa\x8b\xbb^\xfa\x15\xcd\x0b@\xe0\x05\x98\xaaf\
-\x01\xe0\xc8\xd8\xcbu\x03\xd8\x82(\x01\x02\xcc\x0f\xd4G\
-\x8b\x1eA\xb1\xf0\x02\x00\xd4\x92(\x00dO\x00k\x07\
-\xde\xde\xb2\x09g7\x13\x00\xac\xa9\xf6g\xabE\xd5\x0c\
-\x00\x86\xec\x86\x00.\x18\xbbe\x818\x00A\x00\x80\x1a\
-\x14\x86\x03\xb3\xcf\xa2IB\xcc\x05l{\xf2\x0e\xba\x9a\
-\x00 (~\x8e\xaa\x06\x80!;!\x80\xc7\xc6nY\
-06@\x90\xa3 \x08\x00Pk\x12\xdbN\x00h\x98\
-K\xe7_~\xe4&:\x0d\x00\xc0\x97o\x00\x18\xb2\x13\
-\x02\xb8\xd5\x10\xc8\xcd\x02\xa2 `\xc7$\xd8\xa6\x82\x00\
-\x1b\x11\xd5E\x80\xd6\x1ap\x1b\x14iN\x14\x00\xc07\
-a.\xa0\xe3D:\x1b\x00\xc0Z\x9e\x03\xa0{\x91E\
-C \xd1\xa7v\x00\xb6e\xeer\xd0Z\x83\xf8<f\
-\x94\xa2\x22\x08\x04Q\x84\x86\x98\x08uQ!\x00@-\
-(\xd5\x02b\xd7it\xf6\xe5Gn\xa6\xd3\x00\x00|\
-\xf9\x0b\x00\xb1DS`\xcf\x01`#\xa6\xb0\xdaEn\
-YH\xc7$\x90[\x16\x1e\x22\xa1\xc1p\xdf>\x98\xcc\
-KC\x94\xb5\xa5\x04H\xc7B\x9cc\x03\x00\xf8\xa6\x00\
-\x00\xb6\xe5=\x00\x16\x9ax\x00\x1c\x8f\xc0\x1d\x00\x88e\
-mr\xa4\x90\xd2\xfb\xb0\x9d.b_\x83\xbdo\xbc\x00\
-#C\x03\x14\x04\xed\x990\xb4f#\xdac\x02\x00\xf8\
-\xa7\x00\x00\xb6U[\x00\xc0\x1c@\x9d\x13\x00\x88\x8eV\
-WxV\xa3(\x08zhx\x80\xda\xd7\xfb2\xbc\xff\
-\xfaV\xc8\xe7'aF.\x06\xed\xf5\xcc\xc0\x1b\x01\x00\
-\xfc\x13\x02\xa0S\x06\xc0\xa3\x01\x00\xacT;\x008(\
-{\x00\xa6\x00\x10m\xad\xb2#\xb7+\x17\x04\x1c\xa1(\
-\xb1\x84\x86\x05\x07\xdf{\x03\xde\xdc\xfa\x1c\x85\xc0\xf1\x9d\
-iH'\xe4nF\x01\x00\xfc\x13\x01@\xa1Sz\x04\
-\xdd\x9f\x1e\xbd\x85N\x03\x00\xf0U\xc3\x00\xa8\xcc\xe0}\
-\xafA$\xde@(y\x12\x85\xc0{\xdb_\x84\xb7\xb7\
-m\x81\xe6L\x04\xe6M\x97G\xd7\x09\x00\xe0\x9f\x02\x00\
-\xd8V\x0d\x01`\xa7\x16\x006-\xb8\x8aM\x05\x0c\xc2\
-q\x0a\x85X7\x8c\x0d\x0f\xc2\xf3\x8f\xdf\x01P\x10\xe1\
-\xd4E\xf2\x93\x8d\xdd\x1c\x144\x90\xb5\x02\x00\xd8V\x15\
-\x01\xb0S\xbb|\xa0T\x08P%cw\xf0\xa6B8\
-\x07Br\x19\x9d\x7f\xee\xee\xeb ?1\x09kNh\
-\x927j&\x81\xbcT\xaa\x99\x01\xc0\xadt\x1a\x00\x80\
-/\x1f\x01`4x\xcd2'\x07\xe0\xb9\xc1\xbb\xfd\x06\
-\x18\x06\xa4V\xd1\xd9g\xef\xba\x96\x02\xe0\x8c\xa5\xd2\x90\
-h\x01\x00|\x14\x02`\x86\x04\x80\x97\x1f\xbb\x95^\xe7\
-\xa5\x9f\x0a\x00\xc0\x93\x0f\x00h\xa4\xcb\x86v\x00\x9c\x90\
- \x14uZ\x0b`C>\xbb\x0d\xa1\x8c\xd4\xe7d\xf3\
-\xcf~B\x01\xf0\x91\xe5\xcc\xc86A\x1e\xc0\x1f\xb1\x00\
-\x90C\x80\xa5\x9f\xba*(z\x8e\xbc\x07\xc0\x02\x06\x00\
-\xa05x\x11\x9c\xd4\x02\x94P\x8d$\x03B\x99\xd5t\
-\xba\xe9\x8e\x9f\xc0\x04\x01\xc0\xc7NdF\xd0\x0d\x00\xe0\
-\x8f(\x00N\xa5\xb3/\x93\x10@$\xbf\x8de\x9f\x0e\
-\x00\xc0\x93\xaf\x00\xd0\x1b<@\x99\x00\xa8\x11c\xe7I\
-\x01\xc0\xd3\xb7_C=\x803W\xb6\x157\x06\x00\xf0\
-G\x0c\x00\xfe\xf8\x88\x94\x03\x08\x00\xc0\x97\xe7\x00\x98i\
-\xe1\x01\xe8\x97M\x01P\x83\x06o\xf6\x91\xc2\xe9\xd5t\
-\xfa\xd4m?\xa6\x1e\xc0'>\xd0^\xdc\x18\x00\xc0\x1f\
-1\x00x\x09\x01@\x5c\x80\xe5k\xaf\x0e\x8a\x9e#\xdf\
-\x000$\x1b|\xda\x0e\x00\xaad\xf0n\x8c8\x14\xca\
-\x9cN\xa7O\xde\xf2c\xea\x01\x9c\xb5\xaa\xa3\xb81H\
-\x04\xfa#\x16\x00\x0f\xdfB/\xd3\x8a\x00\x00\x5c\xd5\x06\
-\x00D\x17r\x006T\xd2\xc0]\x00\x8f\x02\x80'n\
-\xbe\x9az\x00g\x9f\xcc|\x9f\x00\x00\xbeHL6\x83\
-\xd8y\x0a\x9d\xdf\xfa\xb0T\x0b\xb0\xe2\xdc\x00\x00<U\
-\x07\x00\x22\x1f\x08n\x01@,{c\xe5\xef\xaa\xe4\x00\
-\x1e\xbb\xf1*\xe2\x01\x14\xe0\x9cSu\xdf'\x08\x03<\
-\x17\x02\xa00C\x02\xc0K\x04\x00xeN\x0c\x00\xc0\
-\x95\x7f\x008\xa05x\x1e\x00\xb0\x1a0\xe1\x10\x00\xa2\
-\xed\x95\x15\x9f\xd5\x96\x14\x00<z\xc3\x95\x90\xcf\x17\xe0\
-S\x1f\x9a\xae\xdd!\x00\x80\xe7b\x01\xb0\x95\x84\x00x\
-9O\xfc\xcc\x8f\x83b\xe7\xc8{\x00\xcc\xe7\x87\x00\xbc\
-\xe5p\x09\x00\xb8g\xec\xde%\x19\x94\x10\xe0\xe1\xeb\xaf\
-\x84BA$\x1e\xc0t\x10\x0c\xcf(\x0f \xe0\xa5$\
-\x00\x9cL\xe7\xb7>$y\x00+\x03\x00p\xe5\x1f\x00\
-\x14\x0f\xa0\xd9>\x00\x0cf\xea\xf7P\xc1e(\x94\x96\
-\x00\xf0\x10\x01\x80(\x8a\xf0\xc9S\xa6\xc9\xcf\x14\x10(\
-\x08\x84\x00\x00\x9e\x8b\x05\xc0\x8b\x0fI\xed\x00N\xfao\
-\x01\x00x\xaa)\x00\x18B\x00\xdb6\x5c;\xf5\x84\xa1\
-\xb4\xd4\x0f\xfd\xc1\xeb\xae\xa4S\x04\x00+\x04@($\
-\x04\x00\xf0P,\x00^x\x10\xdb\x01\x88\x04\x00\xd7\x04\
-E\xceQ\xf5\x00p@j\x18\xc4\x02\x01\x07\x04)\x9d\
-\x03\xf0\xd9\xd8\x1d\xbe](\xa3\x05\xc0Y'wh\xb6\
-\x0b\xb2\x0b\x10\x0e\x09\xda\xd0 \x90k\x12\x93Mj\x0e\
-\xe0\x85\x07o\xa1\x1e\xc0\x99\xef\xdd\xd8p\xe4\x82\xd1\xe0\
-\x19\x81:\xf9\x0e\x80\x14\x03\x00T\xe9\x1c\x80\x87\x06\xef\
-\xc1\xa9K\x01\x80JN\x04\x22\x0c\xc2\xa1\x80\x02n\x8b\
-\x02`\xba\xe4\x01lyP\xca\x01|\xfc\xbd\x1b7\x13\
-\x10\xf4\x92\xd9\x8b\xfa.\x0c@\xa0\xc8s\x00t\xcd7\
-\xa9\x05\xe0\x84\x04\xe1H\x02\x12\xf5\x1e\xb4\x03p\xc1\xd0\
-\xed\x9e\x22\xac\x03\xc0'Vu\x18\xef\xf4\xba<\x00\x86\
-\x04\xa1\xc0\x1dpM,\x00\xfe\xf0\xa0\xd4\x12\xf0\xe3\xef\
-\xdf\xb4\x95L\x96\x92U\xc4\xf8\xc5\xcb\xfb.\x1c\xdbP\
-\xed\xcfY\x0b\xf2\x07\x00\x22?\x04\x90\x96g\xa9\xcb\xd4\
-\x03\xa8\x04\x0050DX8#\xf5B{\xf0\xba\xab\
-\xe8\xf4\x13\xabL<\x00]u z\x03!!\x08\x0b\
-\xdc\x90\x06\x00\x0fH-\x01\xff|\xe8N\x18\x1d\xcd\xc3\
-\xd8\xe8$\xee\x81L\xc0G\x87\xaf\xef\xbfhlk\xb5\
-?o5\xe5=\x00\xe6\xf1r\x00\x22\x17\x08\x8e\x00\xe0\
-\xd0j\xfd\xca\x1c\x84\xd2\x12\x00\x1e\xba^\x02\xc0\xc7\xd1\
-\x03\xe0\xedh\x00\x80||\xe0\x0dT,\x09\x00\xd2\xb8\
-\x0c\xcf? \xd5\x02\x9c\xb5\xfb&\xc85$H\x01\x03\
-\xf4\x1f\x19\xa3\x8d\xb4d]N\xb6o\x18\xf8\xe6\xd81\
-\x19\x16\xf8\x08\x00i@\x10\xa3\x07`\x13\x00\xb54D\
-\x98\xc5\x9b\x842Z\x00\x9c\xf9\xc1v\xc3\x9d^\x9a\xd1\
-L4\xc2]\xc2\xa1P\xe0\x0d\x94)\x04\xc0\xa4\x02\x80\
-\xfb\xa5Z\x80\xb3v\xdfLAP\xdf\x18\x87x\x22\x0c\
-\x03}\xe3084\x0e!Q\x00)7 \xae\x1f\xf8\
-\xe6\xf8\xe6j\x7fv\xbf\xe5\x03\x00\xa41\xf1\xccC\x00\
-\x13\x00T\xf8\x0c\x0f\xc7r\xe9d\xa5\x00\xa0\x91 \x01\
-\xc1l;z\x03A\x92\xd0\xb9(\x00\xa6)\x00\x90B\
-\x80O\xee\xb9y=1\xf4\x1bp]]C\x0c\xe2\xa9\
-\x08\x8c\xe6\xf3\xd0G\xbc\x01\x18\xa1G\xe1?\xe2\x09\x8c\
-\x1fS\x8f\x11\xaf=\x00x9&\xa0\x0f\xeeA(#\
-\xf5B{\xe8\xfa\xab\xe9\xf4c\x1fh7\xc4\xfb\xaa8\
-^\x80\xc0\xb9\xed\x87\xc3AX\xe0D,\x00~\x7f\xbf\
-T\x0dx\xeag\xaf\x15\xea7$\xd6\x91U7\xe0\x0f\
-!\x9b\x8bC,\x15\xa6\x8d\xb5\xfa\x86\xc6`t \x0f\
-\xe1IA\xcd\x0d\x0c^<~L\xe4\x06\xaa\x0f\x00'\
--\x01\x9d\xc8\xb7\xe6\x02\xda7*z\x00E\x00\xa0\x0c\
-\x15\x01\xca\x0a\x1b}\x03\xa8\x97\x80U\x86\xe1\xa0\x01\x91\
-\x1dI\x00\xf8 \x9d\xff\xdd}\xd2\x90`\xa7~\xf6:\
-Zt\x04\x02\x97\x91=\xbe\x8fP\xa8k\x8fC\x94\x84\
-Z\x05\xb2\x80\xde@\x7f\xff\x18\x84FI\xe8%\xd2\x8a\
-\x83\x8b\x86.\x19?\xeak\x0a\xfc\x05\x80\xe8\xb0%\xa0\
-\x1dyb\xe8\x95t\x06\xb2\x07\x00Uj\x9b\x00{\xe7\
-\x0f\x87CAXPBz\x00\xa0\xb1\x7f\xe8/\xaeS\
-\x0b\xad~C\xfc\x06\xb2n\xdd`z\x1c\xa6e\xb3\x10\
-&\x85\x8f\x10\xc8\x17\x0a\xd0?2\x06\x85Ar\x1d\xf3\
-t\xf7\xfb070t\xc9\xc4Q\x9b \xf4\x1e\x00s\
-\xcd=\x00CK@;\x00p\xc5\xe0\xbdq\x0f\xf0\xac\
-\xe1\xb4\x1c\x02\xfc\xf4\xc7tj\x07\x00\xbc\xedV@\x08\
-)\xde@\x10\x16p\xc5\x02\xe0\xb7\xf7b\x0e@\x84\xd3\
-\xfe\xe2zMa\xd5]\x11\xdf\xd4\x9f\x1a[\x1d\x0b\x87\
-\xa1--=\xbc\x05!\x80\xaf\x11\xe2\x0d\x0c\x0fL@\
-d\x8cz\x03\xd8~`\xfd\xf0\xa5\x13GeH\xe0;\
-\x00R\xcd\x16\x0d\x81x\x00\xa8R\x1cP\xee\x91z\x00\
-|\xf4\xa46\xd5P+}t\xb8\xde\xde#\xc4\x1b\x08\
-\x05\xde\x80A\x12\x00>@\xe7\x7fs\x8f\x14\x02\x9c\xf6\
-9\x03\x00r\x04\x00\x87q>\x1d\x8dAc2\xa1\x02\
-\x00_\xe3\x93\x9308:\x0e\xe1\xe1\x10z\x03\xe8\x01\
- \x04\xee\xab\xf6ws[\xbe\x00\x00g\xdcH\x02Z\
-\xcb\x99\xc9\xda\xda\xbb\x0c\x0a\x843F\x00(R\xc3~\
-\xbd%\x979F\x00\x9e&\x80\x80Q\x14\x00\x1d\x12\x00\
-~}\xaf4\x1e\xc0\xe9\x9f\xbf\xdeXH\xd7\xc0\x15\xe4\
-\xff\x858\xdb\x98LB2\x12\xd1@ _\x10ah\
-b\x1c\xc4a\x80\xe8\x18}\xe4\xfbE\x04\x02GU^\
-\xc0s\x00t\xce\xb5Q\x0b :m\x08d\xdf2\xfd\
-\x1e\x1d\xc8\x0a\x00(~\xbd\xbfP\xd1@!\xb1h8\
-h3\xc0H\x03\x80{\xa4\x10`\xf5\xe7\x7f\xca/\xa1\
-k\xe0E\xf2\x7f)\x86U-\xa94 KY\x08\xe0\
-k\x98\x84\x04\xf9\xb1I\x88\x0dG\xc8F\xd88\xf2\xad\
-\x89\xf5\xd5\xfe\x8en\xa9:\x00\x10\x9d6\x04\xb2g\xa9\
-\xa2\xe3\x0d\xee+\x9c\x91z\xa1=\xf4\xd3k\xe8\xf4#\
-8,8\x13\xe7\xdb\x0d\x03\x9c\xc4\xf7\x98\x14\x8cDB\
-\xfe}\xc9\x1a\x17\x0b\x80_\xdd#5\x00Z\xf3\x05S\
-\x00`\xff\x00\x84\x00\xc4\xc3a\xea\x09\xe8\x01\x80\xaf1\
-\x12\x12\x8cM\x10\x08\x0c\x85!4\x89\xc9AX?\xf2\
-\xad\xfc\x94O\x0e\xfa\x07\x80\xfdN\x1a\x02\x95\xb6Xo\
-\x86\x02\xab\x5c!\x19\x00\x0fs\x00\x80\xe2\x0c\x0e\xa4Y\
-0\xbb \xa5\x80\x10x\x01E\x89\xc9F\x02\x00)\x09\
-\xf8\xcb\xbbo\xa6SS\x00\xa0\xae\xa1a\x00\x86\x03P\
-\x17\x8f\x1bB\x81bHP\x80Q\x02\x81\xe8(\x09\xbb\
-\xc6\x04L\x0a\xae\x19\xfd\xbb\xa9\x0d\x01\xef\x010\xc7n\
-C\xa0\x9d\x96!@\xad\x1a\xbc^\xa1\xb4\x0c\x80\x1b\xf8\
-\x00@Y\x15\xba`;!\xa8\xdd\x0bs\x01X3\x10\
-H\x02@^\xf1\x00\xee\x92B\x80\x0f\xff\xe5\x0d\xd6\x85\
-s\x0dl\x22\xffWc(\x80^\x00\xee\xac\x07\xc0$\
-\xbe\x08\x04\xd0\x1b\x88\x0e\x87!<>\xf5!PE\x00\
-\x18\xfb\x06\xb0\x00\xa8l80\x8fd\xe33\x842R\
-/\xb4\x87o\xf8\x09\x9d~Dy2\x90\x89\x17\xc0\x13\
-\xaf\x93P\xc9\xf7%a\x00z\x01\x81\xb4\x00\xf8\xe5]\
-R\x08p\xc6\x17K\x02\xa0\x1b\xa4P \x87U\x83\xf5\
-\xc4\x13\xe0\x01@\x99\xe6\x09\x04B\xe3!\x02\x82\x10V\
-\x13\xae\x19\xfb\xfb\xa9\x09\x01\x9f\x01 Z\x86\x00!\xbd\
-\x07\xe0\xa7\xd1\xbb\xd4\xd9(l\x00\x00>\x1bPp\xe6\
-\x05Xm\xb3\xd8\x98\x88G\xfc(\xa9\x9a\x97\x98(\x02\
-\xe0\xb9\xbb0\x04\x10\x09\x006\x96\xfe\xad_\x03k\xc9\
-\xff{q\xb6>\x91\x80\x88\xdc@H\x0f\x00u\x99x\
-\x03\x08\x81\xc8P\x88z\x02S\x11\x02>\x00 G\x97\
-K6\x04: \x0f\x09\xe6\xc5\x80 \x8a\xc4\xb269\
-\x92\x1e\x00g\x9c\x88O\x07\x16\xd4\x8e?\x8a\x9cx\x01\
-\xa5\xa4\x9c6\x1e\x8b\x04y\x00P\x00p\x12\x9d\xff\xc5\
-\xcf\xa5\x1c\xc0G\xfe\xca\x06\x00P\xd7P\x00\xac\xc5\xd6\
-\x81\xb9D\xc2\x12\x00\xca+2\xa4\x84\x03\x22\x81\xc0\xe4\
-\x94\x82\x80\xef\x000\x1d\x12\xcc\x8d\x01AX\x89\x8eV\
-\xbb&=\x00>L\x00\xa06\x03\xd2\x85\x01V\x89\xbd\
-r.L<\x16\x0e\xda\x04\x80\x11\x00\x18\x02|t\x9d\
-m\x00\xe0\x0f\xf6-\xf2\xca\xa5\xa2QZ3P\x0a\x00\
-(\xe2\x05 \x04\xee#\x008\xb7\xda\xdf\xdf\x89|\x01\
-\x80\xa1!\x90\xe3j\xc0\x12\x12m\xad\xf2@\xc6w)\
-\x02\xe0Z:\xd5\x00\x80\x99\xe8f\x8b\xeb\x1cx\x09z\
-\x05\x00\x90\xc4\x02\xe0\xd9\x9f\xddL\x93\x80\x1f[w\xa3\
-\xfd\x82\x91k\x05\xf0Z`\xad\x00\xd8\x00\x00*\xda\x1f\
-\x02!/l\x1c\xff\x87\xc9)\xd3N\xc0s\x00\xccP\
-<\x00G\xd5\x80%$Z.V\xa8\xca\x86\x1aR\x01\
-\xb0\xb1\x08\x00\x14\xcf\x0b(\xae\xe7H\xe9$\xe4\xe0\x12\
-\x05\x00\x90\xc4\x02`\xf3\xcfn\xa2\xd7\xe8c\xeb\x1d\x00\
-\x80(t\xb5\xf0V!$v'\x22\x11\xd5\x0b(\x05\
-\x00|\x9fh_\x18\x84\x02\xac'\x10\xd8X\xedr\xb0\
-#\xef\x010\xdb<\x07\xa0_6\x05\x80\xeb\x06/V\
-\xb4\xd9Jz\x00\xacY!\x03@`\x8c\xd9N\x8d\x80\
-Y'!\x8bK\x16\x00@\x92\x04\x80\x95t~\xd3\x9d\
-7\xd3\xeby\xe6_;\x03@\xecG\xe1u\xe3\xb1\xc9\
-\x1b\xd0\x0b\xc8\xc6bt\xdc\x80\x92\x00 \x12&\x05\xea\
-\x09\x90\xf7\x5cC \xb0\xb9\xdaeQJ\xb5\x09\x00W\
-\x0d\xde\xdfd\x80\x19\x00P\xac\x17 T\x00\x01\xe3n\
-\xd2\x1e\x01\x00$Q\x00\xb4+\x00\xb8I\x1a\x16\xfc\xaf\
-or\x5c0\xe1+CoMF\x0a\xd4\x0b\xc0q\x03\
-\xec\x00\x00\x15\x1a\x130'p\x84l\xea\x99\xf8vm\
-'\x05k\x07\x00\xfb\x8b\x00p\xb5\x0f\x9f\xcf\xed\x07l\
-\x01\x80\x99\xb0\xb3\xdc\x9c\xa0\x83>\x02\x89X$\x00\x00\
-h\x01\xf0\x0c\x02\x80\xfc\x06>\xf17\xce\x01\x90\xfca\
-d\xddh*\x7f\x83@\xca4\x1d\x8d\xda\x06\x00*2\
-\x10\x02a\x5c\xd8L\x00\xb0\xa6\xda\xe5a\xa5\xea\x02\x80\
-\x19 d\xd0q\x12\xb0\xfa\xc6\xceS(#\x0dE\xf5\
-\xc8\xc6\xeb\xe8\x94\x05\x00\xcaI.\xc0\xc9\xa8A\xa8\x00\
-\x00\x92$\x00\x9cH\xe7\x9f\xbe\xe3f\xea\xbe\x9f\xf5?\
-o.\xab`\xa2?\x0a\xbd5\x11\x93\xbc\x80\x90\xae]\
-\x80\x15\x00\xf0\xb7\x189\x12\xc2|\xc0\xe5\x13\xdf.\x5c\
-V\xed21\x93\x7f\x00\xd8o\xa3\x1d\x80%\x00\xaac\
-\xf0\xa2\xc3\xf7\x08gm\x02\x80\x99\xe8f\x8d\xb29j\
-P\x00\x00I,\x00\x9e\xba\xfd&:-\x17\x00\xa9\x1f\
-F.\x1bI\xe5\xbf\x1f\x0a\x874U\x82%\x01@$\
-L\x90P\xa0\x9f\xbe\xed2\x02\x81\x9a\x1cP\xc4\x1f\x00\
-\x88E\x00\xa4Z\x9c$\x01=M\xf7K\xa7t\xf9\x9c\
-a\xc5\x03\xb8Q\x02\xc0\xea\xe5\xc5$\xa0\xa2J `\
-X\xcd\xac\x0c\x00 \x09\x010\xa1x\x00\xb7K!\xc0\
-'\xbfT\x1e\x00\xd2\xff\x1e\xcd\x8d\xc7\x0a\x87'\xe2\x93\
-\x90\x8cDi\x95\xa2]\x00\xa0\xc2\x83\x02\x08\xa3Bo\
-\xfe;\x85\x9ej\x97\x0bO\xde\x03`\x96\xdc\x0e@\xf1\
-\x00Z\x8a1\xbff\x99\x02 \xe1YS`\xb7\x0d\xdd\
-L\xe1\x8c\xd4\x0b\xed\x91\x1b\xaf\xa7\xd3\xd5\xcbZ\xb8\xee\
-\xbed\xb8\xce\xaa\x05-\xb7\x83\xd4\x148\x18/\x10\x01\
-\xd0@\x00 \xe5\x00\x9e\xba\xedF\xfa3:\xfbK\xb7\
-\x94]0\xc9\x7f\x8f\xde0\x9a\x99X\x87\xe31F\xe4\
-AD\xed\x02\x80\x86\x02\x87h\xad\xc0\xe5\x04\x02\x97U\
-\xbbl\xf4\xf2\x1c\x00\xd3g\xe9B\x00\x03\x00t\x8f\x06\
-+{D\xa0\xa2\xfc2v\x9e\xec\x00\x00\xc5\xed\x0al\
-c\xe80\xab\xed\x01\x00$Q\x00\xb4I\x1e\xc0\x93\xb7\
-I\xb5\x00\xe7|\xb9|\x00\xa4\xfe_t\xedxb\xf2\
-\xde\xd9\x1ds\xe1\xd0\xc8>\xe8\x1b\xeb\xb7\x0f\x00\xa2\xd0\
-\x88\x00\xa1!\xfa\xf6=\x04\x02\xbd\xd5.\x1fVU\x02\
-\x80\xa8]v<\x22\x90V\xd54x\xbd\xf4\x008}\
-\x99\xdc\x12\xd0\x0a\x02&^\x00\xb7\xa9\xb0\x10\x00\xa0\x94\
-X\x00<q\xdbM\xf4\x07r\xcey\xb7VT0\xc9\
-\x1fD\xde\x1a\xc9\xe4\xbb\xcf]\xf8ixx\xc7C\x8e\
-\x00\x80\x8a\x1c&^\xc0$l&\x00\xa8\xa9Z\x01\x1f\
-\x01 w\xffU\x0c\x9e\xe3\x11P\x00\xe4J\x03\xa0\xaa\
-\x06_\xe2\xbd\xc3Y-\x00N[\xda\x5c|\xfa\x8f\x95\
-\xbbo\xabV\xa0\xe8\x02\xf0\xb6\x07\x00\x90\xc4\x02\xe0\xf1\
-[o\xa4\xd3OU\x08\x00\xe2\x05\x5c1\x96\x9a\xbc\xf0\
-K\x1f\xfc\x12\xfc\xf4\xc5\xeb\x1c\x03@\x18\x17 \xdcO\
-\x1f<r\xee\xe4w\x0b53\xb8\xa8\x0f\x00\xa8\xa7\xcb\
-\xd4\xe0E\x8b\x1c\x80\x05\x00|3x\xdb\xefc\xbec\
-\x11\x00?\xa5S\x04\x00J\x0f\x00\xae\xbb\xef !\xa8\
-LX/!\x00\x80$\x0d\x00n\x91r\x00\x9f\xfeJ\
-\xc5\x00X:\x19\x11_\x5c\xb5\xe8T\xd8?\xbc\x17\xb6\
-\x1f\xd8\xee\x08\x00\xa8p\x1f\xf1\x02\xc6\xa1\x97\x00\xa0f\
-\x12\x82\xde\x03\xa0\x87\x01\x00\xd8\x03\x80\xe7\x06\xef\xc2H\
-\xa1f{EL\x00\x80\xb2\xf2\x02\xf4\x0f\x0d\xe5\xec\xca\
-=\x90\xdd'\x99\x88\x06\x00\x00\x05\x00+\xe8\xfcc\x08\
-\x00r\xb1\xd6\x9e\x7f[\xc5\x05C px$\x9b\xcf\
-}e\xe5\x97\xe1\xda\x17\xaeu\x0c\x00\xac\x16\x0c\x1d\xa1\
-\x1fc=\x81\xc0\xc6j\x97\x13\xfdL^\x9d\xd8)\x00\
-\x06\xf7\xbb\xdc\x1d\x18U\xc6(\xa1\x95\xb2'\xa2\xe4\x00\
-n2\x02\x00%\x98\xe6\x02\xb4\x16-\x94H\xf8)\x1b\
-\x03\x00\x18\xc5\x02\xe0\xd1\x9b\xa5\x10\xc0%\x00\xdc0\x91\
-*\xac\xbb\xe0\xb4\x8b`\xc3o\x7f\xe8\x18\x00\xa80\xd6\
-\x08L\x8a\xc4\x0b\x10k\xc2\x0b\xa8*\x00\x9c5\x04\xb2\
-!\x07\x03\x07z\xe5dD2\xd2H4\x8f\xdcD\x1f\
-Dk\x04\x80\xfa\x0f\x8c\xebM\xd2\xfcv\x9b\x0a\x07\x00\
-\x90\xe4\x15\x00\x92\xff\x16]'\xc6\xe0\x86\x8f/;\x0b\
-\x06\xc6\xfaaS\xeff\xc7\x00\x10F\x89\x170@g\
-\x89\x17 n\xacvY\xf9\x0a\x00\xbd\xc1\x03T\x08\x00\
-\x1b\x03\x07\xfa\x92>`\xde$\x92\xd5\x02\xe0C'4\
-\x83\xc03h\x07\x100\x1f)\xb8\xb8\x03\xce\x06\x00\x90\
-\xe4!\x000\xa3}8\xdd\x9e\x85\xf5\xcb\xfe\x1a~\xf0\
-\x9b\x1f8\x06\x00*|@\xc0\xdfLMx\x01\xbe\x01\
-``\x9fd\xf0\x19\xcb\x86@%\x00\xe0\xa7\xc1\x97y\
-\xa2\xb0\x0c\x80Ge\x00\x9c\x8a\x00\xd0\xed\xa36\x042\
-\xcd\xfc;\x1bCP\xd9\x98F\x00\x04#\x03K\x00h\
-]N\xe7\x1f\xbdEj\x0a\xec\x06\x00P\x04\x02/B\
-\x9d\xb0\xf4\x9f?\xfe\xafp\xf1\x13\x17\x97\x05\x80\x10\xb6\
-\x0e\x1c\xa1\xc9\xeds\x0b\xff(V\xb5F\xc0s\x00L\
-\xeb\x96\x000\xb8\xbf\x0c\x00xm\xf0^<\x19\xc8\x06\
-\x00P\xc6Z\x01f}\x89P\x80+\xb21E\x00\x10\
-\x09\x00\x00\x05\x06\x00\x8f\xb9\x0f\x80\x1bB)a\xdd\xd7\
-\xd7\x5c\x08\xf7\xbdv?\xbcv`\xbb\xf3\x93Lb.\
-\x80V\x09n&\x00\xa8j\xbb\x80\xaa\x01\xc0\x00\x04\xd3\
-\x96\x80\xa2\xc5\x92\x03\xf9\xd5\x148+\x8dD\xf3\xe8M\
-\x1b\xe9\xf4\x94\xe3\x9b47tA{\x9f7\x0d\x05\x04\
-\xc19\x04RI\xc9\x038\xd6\x11\xe01\x00\xd6\x09Q\
-\xb8\xe1\xec\x93>\x05Q!\x0e\xb7\xbe|[Y\xe7\x09\
-\x1d&\x1fg\x82\xce\xf6\x10\x08\xf4V\xab\xacj\x03\x00\
-\xa2\xbe\x1d@\xd1Z\xcb\xb2\xdb\xaa6\x05\x96\x01p\xf3\
-F:U\x00\x80\xe2\x86\x02&\xadz\xca\xa9\x19@\x0f\
- \x1c)\xd1\x9c\xf8\x18\x90\x04\x80et\xfe\xb1[\xa4\
-Q\x81]\x04\xc0R\xf2\x03{q\xf1\xe2%\xf0\x17\x8b\
-\xbe@\xc3\x80r\x84!\x800@?\xd2\x06\x02\x80\x8b\
-\xaaUV\xd5\x03\x80&' 5\x0d\xc6\xe7\x02$s\
-e\x0c\x08\xe2\xb1\xc1;\x09\xf3\x22Y\x0e\x00Pf\xbd\
-\xf9\xd4\x7f\xca\xb2\xde\x80\xed\x0f \x92Rr\x006G\
-\x12:Z\xe5%\x00P\xc9\x7f\x8b\x88\x89\xe6\x04\xdc\xfb\
-\xf9\x07a\xf5\xc62=x\x12\x06\x84\x0e\xd2\x8f\xd4K\
-\x00P\xb5d\xa0\xbf\x00\x10\xf5\x1e\x80\xa8.\x0f\xc8\x1e\
-@\xd2FS\xe0Z\xee\x16l\x0a\x00\x94M\x08h\xd6\
-S$\xd8K\x0a\xa6\x93L\x12\xf0\x18\x86@!\x8e\xb5\
-\x00\x9e\x02\xe0\xc5Dcb\xe9\xad\x9f\xbd\x13.z\xec\
-\x22\xd8~pGY\xe7\x09\x1d\x22\x1f)Og\xab\x96\
-\x0c\xf4\x07\x00\x22\xeb\x01H\xbd\xff\x06\xe5j\xc1\x8c\xae\
-!\x10\x17\x005\xd3-\xb8\xf4\xc1E\x00H\xd5O'\
-/)\x02@\xc9\xfc\x97\x03\x01\xed\x84\xef\xe6k\x00`\
-<\xec\x98\x11\x05\x80\xe2\x01\xdc\xea\x09\x00\xeeM\xd4'\
-\xd6^\xb1\xf6?\xe1\xeem\xf7\xc2\x83;\x1e,\xeb<\
-\xc2\x10\xb9\x92C\xf47\xb9Q\xfc\x9e\xb8\xbe\x1ae\xe5\
-=\x00f\xa2\x07 \xaa\x00H\x9b$\x01\x0d\x00p\xc1\
-\xe8\x9d\x1b{\xe5o\xaa\x07\xc0*\x02\x00n\xd7_\x80\
-\x8a\xdb\x07\xa8\xe7\x91W\x1a\x00`~X\xcd\xeb\xa5\xc9\
-\xfd\xf0\xd0\xc4[\xf0na\x10\x9a\x84\x04\xac\x8at\xc0\
-\xd9Q{\x9er!\x9ec\x00p\x0b\x9d\xba\x0c\x80\xcb\
-b\xa9\xe8\xf7\xbf\xf3\xc9\xef\xc1\xde\x81\x03\xb4=@Y\
-\xcaK^\x00\xf9\x9d\x1e!\x00h\xf0\xb8H\xb9\xf2\x01\
-\x00uty\xa0D-\x80\x0a\x80\x0aZ\x02\xda7x\
-\xef\x92\x06<\x00\xa0\xf4\x100\x1b\xdd\xa7\x92\x96\x82\x08\
-\x00|J\xb0\xc9\xc1S\x06\x02\xbf\xc9\xef\x86\x1b\xc7_\
-5\xac\xef\x0ce\xe0+\xf1\xe3)\x10\xac\xe4\x03\x00.\
-\x8c&\xa2W\x9cw\xc6W`n\xc3\x02\xf8\xf2\x83\xe7\
-\x95}.\xcc\x03\x88R\x18\xb0\x8c@\xc0\xf7a\xc3<\
-\x07@\x87\x0c\x00\xd3Z\x80f\x1b!\x80\x89\xec\x19\xbc\
-\x17\x09\x03\xf3M\x91:\x1b\x00\x90W8i\x1fP\x5c\
-m\x0e\x01S\x00\x98\x1fVsb\x8d\xbf{\xfa|h\
-i\x9c\x0e\x07\x8e\x1c\x80;\x9e}\x0a\xf6\x1d\xe9\x83\xd9\
-\x8d9\xf8\xd9\xdc\xb3\xa1=\x9a6=\x87\x0f\x00X\x1d\
-\x8a\x847}\xed\xe3_\x85O\xcc>\xa7\xfcD \x91\
-0H>\xd6\x10\x9d\xdd@\x00\xe0{m@u\x00 \
-\xda\x08\x018*m\xf0.\x19\xbb\x8d\xd3\x98\xed\x12\xcd\
-JCQ)-\xd0V\x1dg^\x0dXN>@`\
-7\xea\xf6\xc9X\x01@s\xf2\xda\x04\x01k\xfc\xf3\xbb\
-\x8f\x87\xe6\x86\x0e\x98,L\xd2\xa7\xf0\x0e\x8d\x8e\xc0u\
-\x8f=\x00{\x0e\x1d\x84\x93\xc9o\xe4\xbe\x13\xd6\x9a\x9e\
-\xc7\x0f\x00\x90\xdf\xe2\xa6\x8f\x9d|\x06|\xff\xd4\xff\x03\
-+~rb\xd9\xe7\x12\xc6\xc8?\xa9\x87\xe0V\x02\x80\
-e\xde\x97\xb2\xee\xfd\xbd:1\x17\x00\xa2\x8d\x10@\x07\
-\x00k\xa3\xaf\xc0\xe0=zR\xb0\x1e\x00\x1f\x5c\xdc\xa8\
-\x19\xf2\xabR\x08\x14W\xcb\xff\x99&\xc5\xe8\x01DK\
-\x01\x809o-A\x805\xfe\x05\xddK\xa1\xadi:\
-\x0e\xbfI\x8d?&faFx%\x8c\x8f\x17\xe0o\
-n\xfdK\x18\x1c\x1b\x80gV\xfc9\x1c\x97i\xe6\x9e\
-K\x02\xc0R:\xff\xd8\xad\xb7\xd2\xa9\xcb\x00\xc8\x91\xdf\
-\xe5\xe1O\x9c\xfaQ\xf8\xee\xc9\xff\x04_~\xe8<\xd8\
-\xf2\xfe\x96\xb2\xcf'\xecU>\x9a\xd8 ~\x0f|}\
-\x90\x88\xf7\x00\xe8*\x11\x02p\x00\xe0\xba\xd1\xfb\xf8p\
-\xa0\x88\x0c\x80\xc7X\x00\xa0\xb8\xf5\xf8EK\xac\x04\x02\
-\xca$\x93*z\x00%/l\x0dA\x805\xfe\x85\xdd\
-+\xa0\xbdi\x065~|\xc5 \x0b]\xc2\xa9\x10\x86\
-(\xdd\xfe\xad\xfb/\x80?\xbe\xff\x22\xdcK<\x80S\
-r\xd3\xb9\xe7\xf3\x1a\x00\xa8\xc4\xff\x8d\x88\x9f\xfc\xd0\x99\
-\xf0\xedU\x97W\x0e\x00l\x158\x8es\xe2\xb9\x04\x00\
-\xbeV\x07\xd6\x0c\x00\xb0\xb3\x90y\x08P\xd9\x03;\xcb\
-8C\xd9\xef\x17\xa9\xd3\x02\xe0\x03\x8b\x1a5\xbd\xf6\xc0\
-8\xab\x02\x807\x06\xa0\x13\x08\xb0\x00\xb08\x8c\xfb!\
-\xaa\x05\x02\xd6\xf8\x17u\xaf\x84\x8e\xa6.\xc6\xf83\xd0\
-)\xac\x82\x90l\xfc\xa8\xaf\xdf\xfd?\xe1\xf5};J\
-\x02`\xbcE\x02\xc0\xe3\xb7y\x07\x80\xb9\xc7u\xc1\xc6\
-\xb3~Fk\x01n{\xf9\xf6\xb2\xcf\x85\xd5\x810\x88\
-s\xe2\xe5\x04\x00\x97yX\xdc\xc6\xf7\xf6\xea\xc4v\x00\
- \x8af!@e\x06_\xcd\x1e\x81\x91:)\x1eT\
-\x1a\xa0\x9c\xb4H\xf2\x00\xd4\x82\x16L\x9a\xf4\x9a\xd6\x0c\
-\x08\xb6!@\x01\x10\x09q\xb6\x97P\x95\xbc\x01\xd6\xf8\
-\x8f\xeb\xfe\x001\xfe\x99t\xdc}\xc5\xf8\xa7\x0b'\x11\
-\xe3\x8f\xa8\xfb\xff\xfc\x95\xab\xe0\xce\xe7\xef\x81\xc1\x91\xf1\
-\x9a\x00\xc0\x82%\xddp\xfd'\xee\x80\x9fl\xf9\x09\x5c\
-C^ek\x8c\x94=\xcd\x03\x88\x9b\x09\x00|\xed\x1c\
-\xe4;\x00\xd2\xcd\xa5B\x80\x8e\xd2'w\xd3\xe0]v\
-\x0d\x8c\x00\xc0\xea]\xc1`\xec\xcc\xc4\xd6#\xc0\x14\x08\
-\x98z\x09\xe4?\x0f\x00\xec\xfbX\xcag\x08\xb0\xc6\xbf\
-\xa4{\x151~\xac\xe3/0\xc6\x8f\x9eT\xf1\xbb\xdc\
-\xb5\xed*\xf8\xc3\xfb\x9ba\xe7\xaeC6\x01p\x02\x9d\
-\x7f\xfc6\xa9\xb3\x8e\x17\x00X|\xc2l\xf8\xc9\x99\xb7\
-V\x0e\x80IR\xee\x07(\x00\x8e\x10\x00\xf8\xda\x1e\xc0\
-7\x00\xe8\xc7\x030\xb6\x0c|\xd3\x1a\x00n\x18\xbd\x0f\
-\x9d\x84\x22Y\x19\x00\xb7\xb2\x00@YC\x80]\xcfk\
-$\xa4\xee\xab\xaf\xfec\x06\x17\xcd\xa4b\xc5\x10\xc0I\
-Wb\xceN^\x82\x805\xfe\xe3\xbbO\x81iM\xb3\
-\xd4;\x7f\x9c\x18\xff\x0c\x01\xcb0D\xecb\x92\xees\
-\xf7\xb6\xabI\x8c\xbd\x99\xe2\xa1\x16\x00p\xde\xf3+\xba\
-oy\xf6\xe5\xb7\x8e;~6\x5c\xf5\xd1\x9b+\x07\x00\
-\x96\xf7>\x81f\xbc\xf1\x89\xc2\xf0}\xe8\xf5\xb0\xf8\xb5\
-\xef\xeb\xd5\x89\x15\x00\xb4w\xf2B\x00\x91\x1a\xbc\xb4l\
-\x01\x00\x91;kO\xae\x1a\xbb\xfd\x93\xa9I@\x0e\x00\
-\x8a\xff\xc1\xda\xd88\x9e\x80&l0\xb9j\x8du\x09\
-\xed\x19M\x1b\x14\x95\x90\x87 `\x8d\xff\x84\xee\x0f\xc1\
-\xf4\xa69j\xcc\x1f\xa71\xff\x89d>\x84\xf9\x7f\xfa\
-w\xcf\xabh\xfc\xcf\xd2\x07|\xd6\x10\x00\xd6\xde\xf3\xfc\
-\xeb\xf7\xce\x9d\xd7\x09?:\xe3Fw\x00@\x13\x81\x14\
-\x00k\x08\x006\xbb\x5c\xec\xe6\xef\xeb\xd5\x89\x0d\x00P\
-<\x80\xd6\xa2\xc1\xd3e=\x00\xea\x8b\x00pd\xc3\x15\
-\x1b\xbc\xf5\x09\xec\xb62\x8c*!\x80\x5c\xff\xbcra\
-\x8e\xb9\x9b\xb3\x0dw\xc11\x044g\x11\x8c\x075\x10\
-\x00X\xf5\x224}/3\xb9\x1c\x16\xb0\xc6\xbf\xb4\xfb\
-tb\xfcsAr\xfbEb\xfcib\xfc8\x8c\x17\
-\xde\xf9\x0b\x14\x00w\xbdz%\xbc\xb0\x1b\xc7\xdd\x83Z\
-\x03\xc0\x15\x8fo\xdbuagg\x1blX\xf3S\xd8\
-\xb2{KE\xad\x01i\x19\xe38\x81\xc3\xf4wv9\
-\x01\xc0en}\xd6\x92\xef\xeb\xd5\x89\x8b\x00\xc8\xd2\xe5\
-\xc1}\xb2\xc1\xf3\x00 \x16\x01\x90\xb0\x93\x03P\xe4r\
-\x1c\xe0F\x8f@.\x00p\x86g\xf5\xca\x1a\xb3G\x82\
-\xd9\xc8\x09\xb0j\xacO\xe8\xce\xe3\x1e\x04\x1c\x1d\xc3\x11\
-k\xfc\xcb\xba\xd7\xc0\x8c\xa6y\xf2\x9d_\x84z\xe8\x80\
-Va.9\x7fH\xbe\xef\x17\x88\xf1\xff\x88\x18\xd6f\
-\xf9a\x9ce\x00\xa0\xf9x:\xff\xf8\xedRv\xdee\
-\x00\xbc\xf5\xebw\x0eu75\xd5\xc3\x0fN\xbf\x8e\xd6\
-\x00\x94\xdd\x1f@)[l\x0d8H\x7f\x83\x1b\x08\x00\
-|k\x11X=\x00\xec+\x02\x00w,\x99\x03@\xb9\
-d\xf0^>w@\x0f\x80\x13\x17HOF\x12\x04\xd0\
-y\x02|\x19\xaa\x03\x1d@@\x01\x80\xf6]\xac-\xd8\
-\x0f\x10\xb0\xc6\xbf\xbc\xfb\x0c\xe8l\x9a\xaf\xc6\xfc\xf5\xd0\
-\x0e\x1d\xc2\x22z\xc7/\xc8\x8e\xff\xcf^C\xe3\xdfD\
-\x8d\xbe\xd6\x00@\x8c\x7f\xe9\xa1\xc1\x91\x17\x0f\x85\x12\xd0\
-\x98l\x86\xbf_\xf9\xcf\xae\x84\x00\xd8\x0e@8L\x7f\
-\x9b\x9b\x09\x00|\xab\x09\xf0\x1f\x00\x8c\xcb/\x82\x8d$\
-`\x85\xc1\xbf\xdf\x8f\x113\x03\x00J\xd3\x8aW\xb0\x86\
-\x00\xbb\xa0\x8c\x07P\xaa\xb1\x90\x1e\x00\xdas\xb9\xe0\x0d\
-\xe8v\xb6s\x1ck\xfc+\xba?J\x8c\x7f\x015|\
-\xa0w\xfev\x98&,TM\x7f(?\x007\xfd\xe9\
-\x9f\xe1\x8d#\xaf\xd0\xc16k\x14\x00W\x8c\x8a\xa1\x0b\
-\xf7\xe7C0\xbfa\x09|a\xc1W\xdc\x06\xc0V\x02\
-\x00\xdf\x9a\x04\xfb\x03\x00\xa6\xed\x7f\xb1;\xb0E\x12\xb0\
-\x82\xe0\xbf\xda\x0f\x0a\x8d\xd6\xc9O\xa4\x91[\xa0\xb1\x00\
-@Y\x85\x03\x82\x95q\xe9\x00\xa0\x07\x08.5\xe6\xf8\
-\xbd\xe4\xec@\xc0bu\xc9\x9d\xcd\x8e\xd3\x1a\xff\x99\xd0\
-\xd5\xb4\x10\x94\x98?G\x8d\x7f\x81l\xfa\x05\x18\xce\xf7\
-\xc3\x8f_\xfa\x0e\xbc7 \xdd\x18j\x11\x00\xc4\xf8\xf1\
-b\xbe\xd5'FsC\x85\x10\x9c\xd9u.\xac\xeaX\
-\x03\x97m\xbe\xbc\xec1\x014E\xbaW\xfe\xfd~\xdf\
-\xbf&\x19\xde\x03`\x86\xe4\x01\x18\xbb\x03s\x00\x10\xb1\
-\xd9\x0e\x80\x1d3\xb0Z\x06o\xf2\xbe\xd1z-\x00V\
-,\xc8\x193\xfa\xea?\xcd\x8ca\xd1\x90\xe7\xb3\xb0_\
-\x04B\x13z\x00\x16W\xd4\xd5\x90\xc0\xe4\xf3*B\xc3\
-G\x00\xa0N\xec\xf98\xcclZ,\xc5\xfc\x22\x1a\x7f\
-\x1bL\x97\x8d\x1f\xff\x86\x88\xf1_\xfd\xd2\xb7\xe1\xfd\xc1\
-7%\xc3\x87J\x01P\xcf\x00\xe0\x0e:u\x09\x00\x97\
-\x89 |\xff\xa0\x90\xa2}\x14\xbe\xb4\xf8RhOM\
-\xaf\xb8)\xb0Z~G#\x00\xdad\x00\x0c\x9a\x01\xa0\
-\xd9N;\x00\x9f\xef\xf26\xcf\xcf\xdbM\xf1\x00\x94\x16\
-h+\x94\x1c\x80n?\x81g\xd9\x9cEA\xbf\xda\x02\
-\x02M\xb9\xa4e5\xa1v\x93\x8b\xde\x80\xee\x80\x9b\x18\
-\xe3_\xd9s\x96l\xfc\x22-\xb1\x1c\xb4\xc2t\xd0\x19\
-\xff\x1f\xff\x01\xde#\xc6/\xca\x8f\xda\xaaE\x00`\xdd\
-?\x99\xbc8\x16J\xe4\x86\x85\x18d\x22\xf5\xf0\xd5%\
-\xdf\xa5\xdb*\xe9\x0d\xa8)\xc2\x03\xa0\x8c\x0d\xe0[[\
-\x80\xea\x00@\xe4\x03A\x0b\x00\x1f\x8c\xde\x83\x1e\x81z\
-\x00,\x9f\x97S\x9b\xff\xba\x01\x01v\x85\xdeC@\x00\
-\xa8\x9b\x9d@\xc0b\x7f\xa7?\x90\x9b&\x8a\xc6\x7fR\
-\xcf\xd9\xc4\xf8\x8f\x83\xa2\xdbO\xee\xfc0\x9fz\x02\x8a\
-\xf1_\xf5\xc7\xbf'\xc6/\x0d\x0f\xe7&\x00\xc6d\x00\
-<\xe1\x1e\x00\xee%\x17l\xedp4\x07y\xf2YV\
-\xb5}\x04Ni\xff\xa8+U\x80jYc\x0e`\x8c\
-\xce\xfa\xd6\x16\xc0?\x00\xec+\xd5\x1b\x10\x01\x90\xd0x\
-\x00\xae\x1b\xbd\x0f\x9d\x84\xa2u\xd2x\xf4J\xfd3\x05\
-\x00\xca\xa4\xf9o\xd9\x10\x90W\xb2\xeb\x9be\x00h\x8e\
-q\xc1\x1b(\xb1I\x15\xbd\xf3O*\xc6\x7f\x0e\xf44\
--\x91\xb3\xfd\x224\xd0;\xff|j\xf8\xa2b\xfc/\
-\x7f\x8b\xde\xf9\x15\xa3w\x15\x00M2\x00\xee\xa8\x1c\x00\
-\xd8\xf0\x87L\xee-\xc4\xb20\x11N@\x9e\xb8\xff\x7f\
-3\xffR\xa8\x8b5T\xdc\x11HS\xc6G-\x00D\
-\xb6!\x10\x0f\x00b\xb1\x1d@\xbd\x83v\x00V\xf2\xb3\
-G C*%\x07\xa0\x00`\xd9\xdc\xfa\xe2~\x02p\
-\xc7\x04\xd0\xc2\xa0|\x08\xe8\x01\xa0\x1eS\xe2*\xdb\xc9\
-\x0d\x94\xda\xc4\x1a\xff\x07z>\xad\x1a\xbf\xe2\xf6\xcf\x80\
-y\xb2\xe9K\x09\xbf+_\xbe\x14\xde\x1b\x92:\x84y\
-\x03\x80%t\xfe\x89;\xee\xa4\xd3r\x01\xa0\xb8\xfe\x10\
-\x89\xe7\xc4D\x13\x1d\xa0d^\xfdR\xf8\xc8\xf4\xcf\xd0\
-\xed\xe7\xdc\xfe)x\x7f\xe0\xfdrNm,\xdb\xa3\x12\
-\x00\xd3u\x1e@+\xbf/\xc0\xc0>\x1b\xed\x00\xac\xe4\
-\x95\xc1;tC\xf4\x00XJ\x00`\xdd\x11\x881?\
-\x93v\xfe\xa0\xdbf\x16\x12\xb4p\x00\xa0\xd9\xdf\xa5\xb0\
-@\xbf\x895\xfe\x0f\xf6\xac%\xc6\x7f\x82l\xfc\x05\xd5\
-\xf8E\xf9\xdeO\xef\xfc\x7f\xba\x04vQ\xb7_\xaci\
-\x00\xc8Y\xffM\x82\x10Z\x1a\xce\xb4AA\x08\xd3\xe4\
-\xdf\xe7f_\x00Y\x12\x0al\xee}\xb6\xec\x07\x83p\
-\xcb\xf4\xd8\x00@\xb1!\x10\xed\x0e\xdcj\xb33\x10O\
-n\xf5\x0at1\xd6\xe0\x01\x00e'\x9b/\x98\xf4\xf6\
-Svf\x9f\x0f\xc0\x83@\xb3\x92\x04\x04\xd3S\xd8\xf4\
-\x06t;Z\x1cs3c\xfc\xabz\xce%\xc6\xbfT\
-\xbd\xf37@\x0b1\xfe\xb9r\x06\xa0@\xeb\xf9\xaf\xfc\
-\xd3\xc5\xb0\x8b\xde\xf9\xc5\xa9\x00\x00|\xc0\xe3\xbax\xb6\
-\x15\x84h\x9a\xde\xfd\x17\xd6\xaf\x84\x0f\xb6|\x8cn\xff\
-\xcaC_\x81\xe7\xdf\xff\x83\xd3\xd3\x9a\x97\xfd\x11\xf2=\
-G\xe9\xec\xb9\x04\x00\xbe\x0c\x0c\xe2\x1b\x00\x94\xde\x80Y\
-b\xf0\xa2\xc8o\x1al\x0b\x00\x95t\x10\xa2\x07y[\
-\x85\xa0\xe6\x00\xe4\xfa\xe7\xa5s\xea\xf9Fk\x06\x01\xcd\
-J\xd9;\x10\x8c\xc7)\xb3,0h\x08 @i\x08\
-\xf0\xde\xd8l?\x0b\x10\xe0\x9d\xff\xb7\xaa\xf1\x7f\x06f\
-5-3\x18\xbfr\xe7G\xb7\xff\xbf^!\xc6?\xb8\
-S5\xf6Z\x06\x80j\xfc\xc9zHd\xdb\xa8\xf1\xe3\
-\xc0$\x9f\xe9:\x1fb\xa1\x04\xbc\xb0\xfb\x058\xef\xa1\
-\xf3\xcaz:\xb0i\x99\xe33\x02\x06\xe8\xaco\xfd\x01\
-|\x00@\x86.\xf7\xef\x95\x0c>\xabo\x0al\x07\x00\
-\x15\xf5\x0at\xe7\x02\xd9=K\xcc\x02\x00\xa8\xb2!\xa0\
-\xdf\x81slKC\xca\xf2\xbc\xe6\xefQb?\xfd\xd9\
-\x04\xad\xf1\x9f\xdc\xf3\xdf9\xc6?Gm\xee\x8bw\xfe\
-\xffz\xe5\x9b$\xe6\xdf\xa91\xf6J\x01p\xb2U5\
- \xad}@\x00\xfc\x8cN\x9d\x00@1\xfeh4\x01\
-9\x12\xa2\xa2\xdb\x8f\xafS\x9a?\x053Rs\xe9>\
-\xe7?|>\xfc\x81\xdc\xfd\x03\x00\x98H\x01@\xeb4\
-\x09\x00\x03\xfb\xb4\x00\xd0/#\x10\xc21\x06\x00\xe5\x1a\
-}\x05\x17\xc4\x8d\xa1\x08c\xf5Z\x00\x1c?G\x9b\x03\
-0T\x07\xda\x82@q\x81{\x07\x97\xcf\xa9\x02\xc0\xe2\
-\xbcz9\x0b\x0b\xa4%\xac\xea+\x1a\xff\xff\x80\xd9M\
-\xcbu\xc6?[\xcd\xfe\xe3\x9d\xffG\xdb.\xa2\xc6\xaf\
-7\xf6\x8a\x00p<\x03\x00\xdd\xe7/\xc4\xb0\x1d@y\
-\x00P\x8c?F~\x8b\xcd\xad\xb3\xc9{\x0a\xf4\xee?\
-+\xbd\x14N\xa8?\x9d\xee\xf3\x8b\xb7\x9f\x85K\x9f\xbc\
-\x94~\xc6\x00\x00&*\x0b\x00\x8c\x07\xe0\xb5\xd1\x8b\x8e\
-7\xd8\x13\x0f\x00(\xae\x81\x03h\xba\xf5\xf2[\xf8\x19\
-\x8f2\xab9lmLqN`~n\xc3)l\xfc\
-\x1an\xa6\xc6\xbf\x87\xce\x9f\xd2\xf3g\xb2\xf1K\x05\xd7\
-\x00\xcd\xd0\x09\xb3\xe5\x98\x9f\x18\xff$\xde\xf9/$1\
-\xffN\xae\xb1\xbb\x06\x00\x9d4\x1e\xc0\x9d\xf6\x01\xa0\xba\
-\xfd\xf1\x14tt\xcc\xa7\x9f\x03\xef\xfc\xe9P#\x9c\xde\
-\xfcY\xba\xcf\xe0\xf8 \x9c{\xe7Z\xe8\x1f\xebw\x1f\
-\x00\xc4\xf8E\xe9\x19\x01\xeb\x09\x006\xbavb\xab\xf7\
-\xf4\xea\xc4\x8e\x00 \x16=\x00[\xdd\x81\x1d\x16\xbah\
-{e\xe5\x8a\xd5K\xfd8\x94\x16hKf\xd7\x99w\
-\xf7\x05\xa31\xdbm0\xc4\x83@\x0b\x01\x80YU\xa1\
-\xd9\xfbs?\x8b\xc9\x8eZ\xe3\xffs\x98\xd3\xb4Bs\
-\xe7\xef\x84Y\xb2\xd3/\x1b\xff64\xfe\xd7\xe9\xe5\xaa\
-e\x00\xc8\xd9\xfe{\xc9ku\x22\x9e\x86\xae\x19\x8b@\
-\x14\x04iHrH\xc1\xaa\x86\xff\x0eQ!N\xf7\xfd\
-\x87\xa7\xff\x0e6\xf7nV\x8d\xdfU\x00\x1c\x8d\xb5\x00\
-\x96\x00\x10\xe5\xa4\xa0\xbc\x8c\x00H\x99\x0e\x09f\xbf\xa0\
-\xfd4x\xbdx\x00`\xa5\xb8\xdc\x02?\xba\xe6t\xfa\
-\xd1\x1e\xa7?\x82]\xd5\xc2x\x00\x15\x83@\xb7\x13k\
-\xfc\xa7\xf6|\x96\xdc\xf9O\x94\x0bU\xb9\xf3\xcfR\xdd\
-\xfe!b\xfc?\xdav\x81\xe4\xf6\xcbF\xee?\x00\x16\
-\xd3\xf9'\xee\xfc9\x9d\x9a\x01\x00\xbb\xf7\x92\x09\xde\xf9\
-\x97&\x13\x19\x98=\xf3x\xd5\xf8\x051\x0cK3g\
-A6,=\xdd\xe9\xd1\x9d\x0f\xc3\xff\xfe\xc5?i\x8c\
-?\x00\x80\x89L\x01\xc0\xd4\xfb\xe3\x0e,\x10\xb8\x00\xb0\
-Y\xc0b\xc9\x15.\xca\xe2\xdc\xd1\x9c\x04\x00\xa5\x09\xea\
-q\xb3\xb2\xdc\x9e{\xec\x8c\x14\x05h\x93l\xa6\xde\x82\
-\x00\x86q\x05\x94E\x0a\x00\x1b\x0d\x87L\xb7\x99\xbc\x9f\
-\xd6\xf8\xff\x82\xdc\xf9%\xe3\xc7bh\xa4\xc6\xdfS\x8c\
-\xf9\x89\xf1\xff'\x1a\xff\xb0\xf6\xce_\x8b\x00 \xc6\xbf\
-\x8eL\xae \xaf\x5cK\xe34\xe8\x9e\xbe@J\xf8\x89\
-\x93\xe4$\x11X\x9c\xfc\x18d\xc2\xd2\xa8\xce;\x0f\xbd\
-\x0e\xeb\xef\xff\xa2\xc1\xf8\x03\x00\x98\xc8\x00\x00\xa6\x16@\
-\xb9\xe3+\xcb\x00:\x00\x94c\xf4>4\x1b\xd6n\xe6\
-\xef\xa0\xe4\x00\x94&\xa8\x08\x00T)\x08\xe8f\xad\xc3\
-\x06\x9d\xcb\xa0,\xab9\x00\xf3\xc6\x84\x86\x95\xa5~\x00\
-\xb7\xe4\x8b\xc6\xff\xa1\x9e\xcf\x11\xe3_\xa9\xba\xfd<\xe3\
-\xff\xd1\xb6o\xc0\xaea\xe3\x9d\xdfm\x00\xdcs|\x89\
-\xce@\x16\x00\x90]~\xbc\xeb\xd3\xe7\x8b\xcd\xee\x5c\x08\
-\xed\xcd]\xeac\xc8\x80\xdc\xf9\xe7\xc7\xce\x80TH\x1a\
-\xcf\x11\x8d\xff\xc2\xc7\xbe\x06}L\xdc\x1f\x00\xa0\x84T\
-\x00t\x14=\x00\xfd\x1d\x1ft\xcb\xd8\x17 U\x22\x07\
-\xe0\xba\xd1\x9b>5\xa8\xbc\x93+!\x80R\xff\xbc\xb8\
-'\xcb4\xf5u\x06\x01C\xabA\xd6\xf5\xe7\xec\xd8\xda\
-\x94\xe2\x1eo\xb2\xc8}\x0fVF\xe3?I-\xb0\x06\
-h\xa2\xc6\x0f\xec\x9d\xff\xd5o\x10\xb7\xffu\x19\x0f\xde\
-\x03\xc0\x8e\x07\xf0\xa4\x0e\x00\xc4\xf8W\x83d\xfc\xdd\x91\
-p\x14\x8e\x9b\xbd\x12\xea\xb3\x0d\xa0<\x86\x0c\x8d\x7fV\
-\xf8tH\x0aR\x1f\x0eL\xfa]\xf4\xf8\xd7\xe0\xf5\x83\
-;\x88g \x06\x00\xb0+\x05\x00-\x1d%\x92\x80-\
-=\xea\xb2Y\x0e\xc0U\xa3\xe76\x19v\xef\x22\xf2\x00\
-\xc0\x8a\xf6\x05\xe0\x19f\x89\xa6\xbe\xfc\x90@{\xae\xd6\
-\xa6\xb4\xf1x;\x10`6(\xdb\xb5\xc6\xffy\x98+\
-\x1b\xbf\xe4\xf67\xa9w~`\x8c\x7f\x17q\xfbA1\
-\xe6j\x02 V\xa7V\x03*\x00x\xf4\xc4\xedx;\
-Gw\x7f\x1d.\xb7\xe4\xa6\xc1\xc2\xee\xe5\x10\x0e\x87\xc1\
-\xec1dh\xfc\x17?\xf1uj\xfc\xf8y<\x07\xc0\
-\xd18\x1e\x80)\x00\xf6\xbe\xa1]\xd6\x01\xc0\x15\xa3\xf7\
-\xd8\xd8y\xef\x13\xcbi\x01\xb0\x08=\x00\xdd\xee\x06O\
-@\x00n\xe2\xcd*9\xc8\xdb\xaf\xad9\xad9\xaa\x5c\
-\x10\xa0\xf1\xffN6\xfe\xd3z\xbe@\x8d_\xa9\xeac\
-\x8d_u\xfb_\xfd:5~\xbaO\xad\x00@\xf1\x00\
-~v\x17\xbc\xd7\xdc\x07\x7f\xec\xde\x83\x0f\xdd\xccE\xc2\
-1\x98=m1t\xb6\x16\x87#\xc7W\x1aZ\xa1]\
-8A}\x0c\x19\x1a\xff%O|\x83\xb8\xff;TC\
-\x0f\x00\xe0@\xa6\x00`\xee\xf8tY\x07\x00\xb3\xe7\x02\
-\xd8\x96\xa1\x7f@\x85\x17\xc8\xe1\xe1z\x00,\x9c\x99Q\
-\x8d\x975\xfcR\xcf\x014{|\x98a\x1d\xb3I\x02\
-\x80vg\xb3\x8eC&\x8b\x92\xf1\x17X\xe3\xff\x80Z\
-\x10\xe8\xf6w\xe9\x8d\xff5\xd9\xf8e\xc3\xf5\x15\x00\xf5\
-f!\x80\x04\x80\x1d\xc3o\xc1-o\xdc\x05\x83i\xfa\
-\xe4Mh\xcdu\xc2\x82\xce\xe5\x90 \xbf3Qm\xad\
-P\x80&a\x1e\xe4\xa0[=\xfe\xcd\xc3;\xe1\xf2g\
-\xbf\x0d\xbb\x07vk\x0c=\x00\x80\x03\x19\x00\xc0\xb9\xe3\
-+\xcbj5`4Y2\x07\xc0\x95\xa6\xd5`\x99\x17\
-\xc4\xa5\xeb\xc8\x05\x00\x8a[\xbf/\xd8\xce\x0b\xe8\xfb\x03\
-\xf0.\x5c\x1b\x09\x01\xcc\xc6\x17\xb0\xf2\x06\x94U\xac\xf1\
-\x9f\xde\xf3\x97\xd4\xf8\xb5w\xfen\xb5\x8c\xa9\xdb\xff\xda\
-\xd7\xa4l?@\x95\x000\x8d\xf3-\x00v\x91=\xef\
-\xc8\xf7\xc2\xf6\xd17\xe8\x93\x92R\xf1,,\xec\x5cI\
-\x000C5z\xec\xa9\x18\x868\xb4\x09K\xa8\xeb\xaf\
-\xe8\xe5}[\xe1\x7f=\xfb\x1d\x18\x18\x1b0\x18\xba\xa7\
-\x008ZG\x05ni\x97\xeeJ\xbc;\xbe&)\xb8\
-\xb7D;\x00\xbd*1z\x0f\xab\x08c9\xe9\xa1\x94\
-J\x13T\x15\x00(\xb3X^\xc9\xf8\xeb3\xff\x16y\
-\x01\xa5\x05!\xbb\xbe\x8d\xcd\x018\x04\xc1\xad\x06\xe3\xff\
-\xa0ZX\xd2\x9d\xbf[-g\xc9\xf8\xbf*\xc5\xfcr\
-q\xfa\x0d\x80\xbb9\x00\xd851\x00\xf7\x0c\xed\x84\xe7\
-'\xf7B4\x12\x22w\xfa\x04\xcc\xed8\x1e\xe6O_\
-\xa6\x1a\xber\xe7Ob\x1d\x860_\xf3\xf0\xd1\x07\xb6\
-\xdf\x0d?\xd9\xf2#\xae\x91\x07\x00p(+\x00h\xaa\
-\x01[J\xb4\x03`U\xae\xd1\xbbp\x8d\xec\x9e\x22^\
-/\x03@n\x81\xb6\x80\x00\xc0V\xdb\x7f\x13O@\xd0\
-5\x0d\xb4:W\xbb&\x04\x00\xce\xf3\x05\xf9a\xc1\xad\
-\x93\xac\xf1\x7fQ6~\xe9\x1bKw\xfe\x99r\x19\xc8\
-n\xff\xf6\xaf\xc1\xae\xa1\x1dj\x99T\x1b\x00\xdb\x86\x0e\
-\xc2\x83\xc3o\xc2\xf3\x13\x92\xe1\xe3]\x7ff\xeb<8\
-~\xe6\xc9\x90N(^\x91d\xf8\x98\xe0\xcb\x09\xdd\x04\
-\x00M\xea\xf7\x1f\x9a\x18\x84\xff\xfc\xed\xff\x85\xdf\xec\xfa\
-\xa5\xa9\xf1{\x0e\x80a\xb9)\xf0\xd1\xf6`\x10\x16\x00\
-\xea\x1d_,\xd1\x0e\x80\x95\xcfF_i\x1f\x81x\xce\
-\x08\x00E\xbc\x06@\xac\xcc\x9f\xfc\xcb\x1c\xc3k\x1f \
-/t\xe8\x00\xa0n\xb2\xf0\x06\xf4\xc6?O\xbe\xf3K\
-\xd9\xfeF\xe3\x9d\x7f\xfbW5\xd9~e_\xbf\x01p\
-\xdb\xe2\xb3\xa1@\xbe\xc0]};\xe0\x1dq\x80\x1a}\
-4\x12\x86\xce\x969\xb0`\xc62\xc8\xa5\x1b!\x1e\x89\
-B,\x12\xa1\x00\xc0\xf3d\xa0\x15\xb2\xc2\x0cr\xd7\x0f\
-\xabe\xd0{\xe4\x0d\xf8\x97_~\x0f\xf6\x0e\xee\xb64\
-~\xaf\x01\xc0<\x19\xe8\xe8z4\x18\x02@\xbd\xe3\x8b\
-%\xda\x01\xb0\x00pj\xf8e\x5c\x07/\x9a\x0c\xeb\x01\
-0\xbf+\xa3k\xf1\x07\xc5\x05(\x0f\x02\xec\xa2\xc0d\
-\x0b\xd1\x03\xb0\xac)\xd0\x81\x00\x8d\xff\xf7\x1a\xe3_\xa5\
-\x16\x82\xfe\xce?B\x8c\xff?\x88\xf1\xbf\xa7\xcb\xf6+\
-E\xe6\x17\x00^\xddq\x00\xfa\x0f\x8d\xc1\xdc\xe9\x8d\x90\
-\xce\xe0\xe3\xd0\xc3\xf4\xae?\xbd\xb9\x87\xac[J\x0c?\
-G\x0c?\x06\xf1h\x8c\x02\x80\xbe\x84\x0c\xd4\x11\xc3\x8f\
-\x82\xb6\xb3\xd4\xcf_\xb9\x19\xee|\xe5\xc6\x92\x86\xef\x0b\
-\x00\xb0\x8eb\x8c\x16\x9fo\x83\x81p~R\xeeI\x01\
-@3z\x00b\xe9\xde\x80\xfa$\xa0\xdbF\xef\x9e\xb1\
-[\x1fT\x04\x80T\xffL\x01\x80\xe2\xb8\xf1\xc5~\x01\
-F\xd9\x05\x01\xbbWGK\xc6\x14,\x9a\xfd\x05\xbc\xf3\
-\xbf\xc6\x18\xff_\xc9\xc6_t\xfb\xbb\x88\xf1k\xef\xfc\
-\x7f\xab\x89\xf9\xab\x01\x80\xa1\xe1\x09\xf8\xd3\x0b\xfb`|\
-l\x12f\xcf!1|C\x06f\xb4\xcd\x81\xee\xf6\xf9\
-\xd4\xd5O\xa0\xe1G\xe2d\x1a\xa5\x00HE\xd2\xd0\x14\
-\x99\xa9\xb6\xe8S\xb4m\xff\x1f\xe1\xc6\xadW\xc3\x9bG\
-v\xaa\xefYu\x00\x1c\xadO\x07nn3O\x02\xaa\
-\xcb\xa2\xe2\x01$\x1c\x8d\x08TJ\xe5\xf7\x0f(\xff\xa2\
-\xea\x010\xafS\x97\x983i\xe2k\xc8\xf4\x83so\
-\x80\x02@\xb7\x9dw\x81o+\x14\x8d\x7f51\xfe\xb9\
-\xea\x9d_q\xfb\xd9;\xff \xb9\xf3\x9f\xaf\x1a\xbfZ\
-:U\x04@\xae\xae\x11\x96\x9d\xb0\x10fN\x9b\x0dI\
-b\xe8\x09b\xf4\xf1h\x9cN\x11\x02\xa9H\x0a\x1a\xa2\
-\x1d\x90\x8b\xb6\x93\xe5\x04\x84\x84\x10\xfd\x9c\xc3\x13Cp\
-\xf3K?\x86\xcdo?\xa1\x1ao\xcd\x00`\xaf \x95\
-\xda\xf7\xfc\xab\x024\xfb}\xb8\x22[\x00\x10\x95\xa4\xa0\
-h\x1c\x10D\xafr\x1c\x02[\xd7\xc6\xad\xd8AR\xbc\
-\x81\x0f\x00\x94\xa9\xf1\x0a\x02\x98l\xe2\xb6\x1c4;\xd7\
-4\x16\x00\xcc6\xf6p\xbd\xf1+n\xbf\xd2\xc2o&\
-1\x7f\xe5\xeb\x0dS\xb7\x1f\xef\xfc;\x8c_\xbfJ\x00\
-\xa8K\xcc\x86\xb6\xe66z\xa7OF\x13\x90\x88JF\
-\x8fS4\xfc\xfah\x1b\xd4G\x9a\xc96\xf2[\x8a$\
-U\x00<\xfe\xc6}p\xcf\xb6[h\x03\x1fZ\x17P\
-K\x00\x98$\xd7\xe8\x00\x05\xc0\x11\x02\x80\x86\x8a\xcf\xe7\
-@\xd5\x01\x80\xa8$\x05E\xeb$\xa0'Fo\xf3\x82\
-\x89\xe5mV\x00\xa04A\x9d\xdb\xa9\x8d\xcb-\xfb\xdc\
-\xab\x06+\x98\xe6\x06\xb8\x03\x05+I@\x19\x00f\x8d\
-\x7fn\xd7\x18\xff:\xae\xdb\xaf\x04_\x18\xf3o\xe0\x18\
-\xbf\xfa\xdd\xab\x04\x80\xe6\xec\x02h\xa8o\x92\xee\xf6\xd1\
-\xb8j\xf8u\xd1fb\xf8d=5\xfc\x84\x0a\x80-\
-\xef\xff\x12\xee\xdf~;\xec\x1f\xda[4\xdaZ\x03\xc0\
-\xb8\x1c\x02\x80\xb8\x99\x00\xc0\xb7*@\xeeo\xc5-q\
-\x01\xc0\xdc\xf1\xad{\x03\x96>\xbf\xfd\xa6\xc2\xe5\xe7\x12\
-\xca\xb9\xb4\x06\x00\xccH\xf3\x1b\x01\xa9\xff8\xd2\xed\xaf\
-\xe0\x80\x1b\x120\xfbv\xb4f\xf4\xa7QE\x8d_\xd4\
-\x1b\xbf$\xd6\xedW\xda\xf6\x9b\x19\xbfZ.U\x03\xc0\
-B\x19\x001HG\xeb\xe8\xf0\xdc\x99H\x1d1\xf8\x14\
-\x01AR\x05\xc0\xfb\xfd\xbd\xf0\xd4\x1b\xf7\xc3\xce\xc3\xdb\
-\xd4\xf3\xd5*\x00\x84!\x81\xd6\x00\x90o\xb9\x81\x00\xc0\
-\xb7*@\xfdo\xc4Ui\x00`r\xc7G\x99%\x01\
-yr\xcd\xe8EG{;z\x9bx\xc3\x09t\x8am\
-\xd0Q\x14\x00\xa82 \xc0\xdbl\x06\x03\x5c\x9a\xd6\x9a\
-\xe1\xe6\x06\xac\x8d\x1f\xef\xfc]\xea\xb2d\xfc\xe7\x9b\x1a\
-\xbf\xfa\xb5\xab\x04\x80\x96\xecbh\xae\xef\x80t$C\
-\x00\x90Q\xef\xf4\x0a\x00v\xec\xfb#\xfci\xef\xf3\xd0\
-{\xe4u\xa0\xa1\x7f\x08j\x1f\x00\xfd\xe4*\x8d\xd0\xc2\
-[O\x00\xb0\xb1\xe2\x13:yo\xafN\xac\x02\xa05\
-mz\xc7W\x97E\xf3v\x00\xae\x18}%\x06\xef\xf0\
-\xfa\xea\x010g\xbaR\xf5$0}\x02\x8a\xfb[\x86\
-\x04\xc5\xc38\xab\xf5\x1d\x8a\x04\x0a\x00\xfd\xf9\xd0\xf8\x9f\
-\xb70\xfe\x99L\xb6\x1f\xdd\xfe+J\x18\xbfZ$U\
-\x02@g\xc3\x07\xa1>\xddH\xef\xf2)b\xf4\x08\x80\
-\x10\xf9\xdb}\xa4\x17\xb6\xbc\xfd,\xf4\x8f\x1f\x81P\x98\
-\xd8}4D\x01P`\xde\xa3f\x01p\x90\x5c,\xfa\
-PPq\x0d\x01\xc0\xe6\x8aO\xe8\xe4\xbd\xbd:\xb1\x02\
-\x80\xa6V\xc9\x00\x8c\xbd\x01\xad\xdb\x01\xd83|{\xbe\
-\xbbW\xb9@\x9e\xf4\x00\x98=\x9d\xed\xa3_\xbc\xadk\
-\x5c|\xa1<o@ZW\x5c;\xbd-\xab9\xe4v\
-\xb1\xb4\xf1K_]\xb4m\xfcjQU\x09\x00\xfbv\
-\x8f\xc2\x82\xeee0\xbbc!\x88\x93\x93\xf0\xd6\xdeW\
-\xa1\xf7\xc0\xab0!\x8e\x13\xc3\x17 \x9a\x08\x13OR\
-\x90\x8fS\x8c\xbc\xc6\x01\xb0W\xba\x86\xe2\xf7D_k\
-\x00\x94\xdf\x89'2\x00`\xaf\x8dv\x00&\xc3\x82k\
-\xe5\x92\xd1\xbbd\xf0z\xe9\x010\xabC\x1a\xa6\xab\x18\
-\xab\xf3!\xa0n\x11\x80\x9b\xf5\xb7\x03\x01\x16\x00w\xd8\
-4~\xd4\xf0d\xbfm\xe3W\x8b\xae\x0a\x00\x18\x9f\x98\
-\x84w\xde\xee\x83\x02Y\xd1\x90i\x82\x81\xb1\xc3\x10\x0a\
-\x09\x10\xc6v\xff\xe9\x081\xfe\x90\xfa\xde\xac\x81\xd62\
-\x00\x84\x09\xf2\xef\x10\xbd~[\x09\x00\x96Ut\xb2r\
-\xde\xdf\xab\x13s\x01\x80I\xc06>\x00\xfaK\xe6\x00\
-J\x1b~\xa5\xb9\xc0J\x85?\xa6D\xa3\x02\x80\xbb\xe9\
-\x94\x02\x00\xa51`\x81\x19%H{\x0enc\x1fN\
-5\x82\xfe\xc2\x85h\x08 \x01\xc0\x99\xf1\xe3\x9d\xff+\
-\xb6\x8d_-\xca*\x00\x00\x0dwt4\x0f\xef\xef\x92\
-\x06\xcf\x8f'\x22\x90\xcaF!\x9e\x0ak\x8c|J\x01\
-`\x98\xfc\x1b\xa0Ws\x03\x01\x80\xaf\x09@\xfa\xfe^\
-\x9dX\x03\x00\x91\xf1\x00t\x00\xc8X\xf6\x06\xac\x1d\xa3\
-\x17m^h=\x00z:R\x06\xa3\xd6\x87\x04<\x18\
-\x94\xac%\xd0\x9d+\x1e\x0bCs.\x05w\xc2v\xdb\
-\xc6\x8fn\xff\x0f\x1d\x1a\xbfZ\xacU\x02\x00\xae\x9f\x98\
-(\xd0i\x98\xb8\xfc\xca\xba)\x0b\x80>r\x05\xa5\xe7\
-\x01\xae'\x00\xd8X\xd1\xc9\xcay\x7f\xafN\xac\x02\xa0\
-E\x17\x02\xc8\x00\xe8\xb7\xcc\x01p\x0a\xd5'\xa3\xb7k\
-\xe8f\xd2\x03\xa0\xbbCzbo\xb1\xf9\xaf\xa0s\xff\
--B\x02\x07\xb9\x01\x04\xc03\xb9w\xe1y\xe0\x1b\x7f\
-\x93Z\xcf/\xa9\x5c\xe3W\x8b\xb8\x8a\x00P\x8f\xe1\xac\
-\x9bj\x00\x08\xed\x17@,\xd0\xd9\x1e\x02\x80\xde\x8aN\
-V\x86|\x07@\xa6\xcd*\x09\x98(\xd1\x1b\xd0D\x15\
-\x5c\x83J\x0d^\xaf\x84\x92\x03\xf8\xb9\x0c\x80\xf6$\xbf\
-\xed\xbe\xa0\x83\x82\xce\x1b`e\x99\x1b\x90\xb7=Y\xf7\
-6lK\x1c\x84X8\x05g\xce9\x1f:\xb2\xf3\xd4\
-\xcdM\xf4\xce\xdf\xad\xc9\xf6\x97k\xfc\xb4\xcc\xa4\x82\x0b\
-\x00P)\x00\xf2\x04\x00$\xfe'\xa7\xe8%\xc6\xdfS\
-\xc1\xcf\xael\xf9\x06\x80~\xcb$\xa0h\xda\x1b\xd0m\
-\xa3w\xdb\xe0Y\x09B\x18\xe29y0J\x19\x003\
-\xdb\x93\xe6\x83~\x9a\x86\x04\x02?A\xc8;\x8fb\xfc\
-I\xc9\xf8\xcf\x99\xffMhJu\xaa\xfb(\xc6/\x15\
-\x99X\xb1\xf1K\xe7\x81\x00\x00.\x00\x00\xe3\x7fa\x90\
-\x02`#\x01\xc0\xfa\xf2\x7fy\xe5\xcbs\x004\xb6X\
-\xd5\x02\x88\x16\xbd\x01M\xe4\xb0\xbc]7x\x8b\xd3\x85\
-\xa2\x19\x88e\xa5\xef\xf3\xe4\xcf\xef\xa1\xd3\xce\xd6\x04\xcd\
-T[v\x03\xe6\x85\x04\xcc\x1c\xb7\xaf\x80<\xf3d\xfd\
-\xdb\xf0\xaa\x0d\xe3Ga\xb6\xbfR\xe3W\x8b \x00@\
-\xe5\x00 \xf1\xbf \x0d\x03\xbe\xbe\xf0\x8f\xfe\xc7\xff\xf4\
-3xub\x0d\x00D\xfe\x1d\xbf\xb8\x5cL\x02\x96z\
-<\xb8\x1d\xb9b\xf4e\x9c\x82\x07\x80\xae\xb6\xa4\xba\x9d\
-\x17\xd3\x97\xf2\x06t\xbb\xab\xcb\x08\x85'sN\x8c\x1f\
-\xef\xfc\xe7Ul\xfcj\xd1\x04\x00\xa8\x0c\x00\xa2\x14\xff\
-\xcbj \x008R\xf1\x85)C\xde\x03\xa0\x99m\x08\
-\xc4i\x0a\xdc\xc2T\x03\x96\xd1\x19H\xdd\xb5\x12\xa3/\
-\xe3P\xde!\x91D3DR\xd3`th\x18~\xf9\
-\xc8c\xb4jnFK\x82\xdb<\x97\x1d\xfd\xd7\x897\
-\xa0\xe8i4\xfe\xd4![\xc6?\x22\x1b\xff\xbb.\x18\
-\xbf\xfa\xdd\x03\x00T\x04\x00aTn\x02\x0c\xb0\x99\x18\
-\xbf\xaf\x1d\x804\x9f\xc3\xab\x13k\x01 \x9a\xb6\x04\xcc\
-\x94\xd9\x19HQY\x86o\xf3\x10\xa7g\x8ee\xba!\
-\x14\xab\x83\xdd\xbdo\xc3+\xcfo\x81d<\x0c\xcdu\
-Q\xc3\xb8~\x8ax\xde\x00\xffq\xe1\xda\xb9j\x1a\xbf\
-Z.\x01\x00*\x02@\x08\xab\xff\xaa\xec\xfe\xa3|\x00\
-\x80\xe4\x02\xebs\x00\xfdet\x06R\xe4\x85\xd1\x97u\
-\x19\x99\xcf!\x84b\x10oX@\xe7\xb7l~\x0e\x0e\
-\xef?\x00\x8d\xd9(\xa4\x13\xc5\xf1\xe7\xb4\x8d{\x98v\
-\x81&#\xfc\xf0Z\x10\xa2\xf1\xbfVE\xe3W\xcb*\
-\x00@\xf9\x00 \x87\x84\x0f\x08\xca\xcf\xa7j\xee?\xca\
-?\x00\xec\xd1U\x03\xda\xec\x0c\xa4)7\xa7\x85-\x96\
-\xb5I\xff\xa6\xb6v\x8b\xd5\xcd\x86P4\x0d\xfb\xdf\xdb\
-\x0d/\xfd\xfa\xb7\xc4\xfd\x07ho\x8ck\x13\x80\x8a8\
-!\x81\xe9\xe8\xbf\x8c7\xf0L\xc3;U7~\xb5\xec\
-\x02\x00\x94\x0d\x00a\x84x\x00R\xf6\xff>b\xfc\xe7\
-\xba~\x81\x9c|\x16\xafN\xac\x01\x80\xdc\x12\x10Wh\
-Z\x02\x8a6F\x05\x06\x87\x86_\x89\xd1\x97s1\x85\
-0\x8d\xfb\xc3\xf1\x06\x188\xd2\x07[\x9e}\x0e\xf2\x13\
-\x13P\x9f\x8e@&\x19VKY\xd0\xdc\xc7\xa1dH\
-\xa0\x1f\xfd\xf7\x99\xc6w`{\x0d\x18\xbfZ\x8e\x01\x00\
-\xca\x06@\x18\xdb\xfeO\xd2\xa2:\x97\x00\xc0\xb7\x01@\
-y\xf2\x1e\x00MIzA5-\x01M\x9a\x06\xeb\x01\
-`\xdb\xf0K\xb7\x186\xd9\xa1\xc2V\x5c\x91\x0cD\xd3\
-\x1d \x84\x93\xf0\xce\xebo\xc0\x9b\xdb^\xa5\xc6\x9f\x22\
-\xb1\x7f.[|\xe0\x84\xc0\xfc\xe3\xb5\xf6\xd3,\x1bf\
-\x0067\xbe\x0b\xdb\xd3\xb5a\xfcj\xb9\x06\x00(\x0b\
-\x00\xc2\x98\x00\xa1~:\xdb;\xf9\xdd\xea4\xfe\xd1|\
-\x1e\xafN\xac\x00\xa0\xa1\x89\xc9\x01\x88\x8c\xc1\xf3\x00\x10\
-\xb51((+\xa7\x86_\x81\xc1\xb3\x87\xa2\xab\x1fM\
-\xb6\xd1j\xbf\xddo\xbfC\x0d\x7fdh\x98n\xc3\x98\
-\xbf.\x1d\xb14lNP\xc0\xaf\x0e\x14j\xcf\xf8\xd5\
-\xf2\x0d\x00P\x16\x00BGB L\xd0c.\x22\x00\
-\xd8\xe0\xe9\x85\xb2!\xff\x00\xb0Gg\xf0\x1c\x00\x84\xa2\
-\x89\xd2I@\x1f\x8c\xde\xec\x10L\xf4\xe1\x1d?\x1c\xab\
-\xa3I\xbem\x7fxA5\xfc0\x89\xf5\xb3\xa9\x08$\
-b\xd2\x08\xb4\xa6\x1d|\xd4\x19\x8b\xd6~\xb2\xb6\xe4\xf6\
-\xc2\x96\xfa=5e\xfcjY\x07\x00p\x0c\x00a\x82\
-\xdc\xfd\x8f\xd0\xb1\xff0\xe9\xd7C\x00P\xb5\xe4\x9f\xfa\
-\x99\xbc:\xb1\x0a\x80F]-\x00\x07\x00x\x11\xd4\xde\
-\x80\x0d\xceF\x05\xe6\xaevpQ\xec\xee\x1a\x8a$ \
-V7\x8b\xc6\xfc;^z\x99\xba\xfc(4|\xbc\xeb\
-c\x95\x9fR\xa2fn\xbe\xe1\x89\xbf\x16\xde\xc0@d\
-\x1cn\x9f\xfe*]>g\xfe\xc5\xdc\xb6\xfd\x8a\xfc4\
-~Zfr\xc1\x05\x00p\x06\x80p_\x88\x0e\x00J\
-t\xf9\xe4w\x0b\x97\xf9r\xb1J\xa8\xaa\x00\xc0\xc2g\
-\x97\xb9\x00\xe0\x94o\xa5w\xfbr\x22\x8181~t\
-\xfd\xd1\xe5\x7f\xe5\xf9\x17\xe8:L\xf2\xa5\xe2a\xcd~\
-\xec\x93z\x0c\xdd\xf8M\xeb\xfc\x8d\x18\xf8S\xdd~\xf8\
-M\xc3\xfb0\xafy\x15\xac\xee^\xa7\xae\xaf\xb6\xf1\xd3\
-\xf2\x93\x0b1\x00\x80}\x00\xe0\xdd?\xdcG3\xff\xf2\
-\xdd\xbfP\xf5\xbb?\xfd\x5c^\x9d\xd8\x0a\x00\xca\x1d_\
-YV\xb6k\x00`\xd7\xf0m\x5c\x80\x0aB\x7f\xa9\x90\
-\x88\xeb\x9fh\x98O\xe7\x7f\xf7\xd4&\x9a\xed\xcf\xa6\xc2\
-Ew\xdf\xac\x18\xd51\x00\xf9u\xfe\x9aEA\xdb\x09\
-\xe8\x05\xd9\xfd_1\xed\x1c\xf2:\x9b\xae\xab\x05\xe3\xa7\
-\xe5)\x17j\x00\x00\xfb\x00\xc0\xbb?\x8e\xfeCv\xaf\
-\x99\xbb?\xca7\x00\xd0\xde\x80\xba;>\xca\x00\x00^\
-5 \xef\x0d\xbc6|]\xd2/^/%l\x9f\xba\
-\xeb~:m\xae\x8fj\x0bQ0\xc1\x00\xd7\x13\x10,\
-\x07\x06\xc5\xc9\xeb\x99\xc3\xf0l\xf3\xbb\x10\x8f\xcc\x81\xbf\
-Zzi\xcd\x18\xbfZ4\x01\x00l\x03 \x84\x99\x7f\
-i\xd4\x9f\xde\xfcw\x0aU\xcf\xfc\xb3\xf2\x0d\x00}{\
-\xa4\x98\xb9\xce\x01\x00\xca1\xfc\xb2\x8d\xde\xe28\x0a\x80\
-:\x19\x00wK\x00h\xaa\x93\x00`4d\x81\x9b\x07\
-\xb0\x0a\x09\x0cO\xfc%3\xe3\xa1I\xb8\xb9\xeb\x15\xf8\
-\xcd\xae]p\xde\xf2K\xe0o\xbb.Q\x8f\xad\xa6\xf1\
-\xabE\x15\x00\xc0\x1e\x00\xc8\xe6\xc8\xa1\x90\xf2\xfb:\x97\
-\x00\xa0\xaa\xf5\xfezy\x0e\x80\x5cC\x82.+\xe3\x01\
-p\x01\xa0k\x09\xe8\xd4\xf0\xcb2z\x1b\xc7(?\xf1\
-0\x05\x80\xf4\xb9\xf5\x00\xa0\x85hp\xebM\xda\xfes\
-\xba\x02\x9b5\x05F(\xbc\xd0\xb0\x17\xae\x1a\xdc\x02'\
-6\x9f\x0c\xd7\x9f*\xf5.\xac\xb6\xf1\xabE\x17\x00\xc0\
-\x16\x00\xc2C\xe4\xd70\x22u\xfa!\xc6_\xb5N?\
-f\xaa>\x00\xccF\x05V\xe4\xa6\xe1\x97\x845\x7f\x07\
-\xf4\x00\x12:\x004b'\x1f\xb6 \xb9\xb1=\x1f\x04\
-jn\xa0\xe4\xf1\x00\x17\xc4\x9e\x82a\x98\x80\x97\xd6J\
-C}\xfdx\xe7%\xb0\xf5\xc8f\x87_\xdc]\x05\x00\
-\xb0\x07\x00L\xfcE\xfa\xd5\xc4\xdf2\x02\x80\xde\xaa^\
-8\xdeg\xf4\xea\xc4\x96\x00\x10\xb5\xcb\xb4\xa5\xa0aD\
- \x97\x0c\xdf\xb2i\xb0-7@\xce\x01H\x00xZ\
-\x06@C&bH\xf2\xd1\x025\x09\x09\x0c\xe2U\x17\
-\x82\x11\x04\x1b#\x7f\x84_\x87\xde\x83\xff\xb5\xfc?\xe0\
-\xd3]\x7fN\xef\xfe;\x06\xb6\x94wQ\x5cR\x00\x00\
-\x1b\x00@\xd7\x1f\x1b\xfdH\xe3\xfd]4\xf1\xedB\xd5\
-\x1b\xfd\xf0\xe4?\x00Zu\x83\x82\xeaZ\x02Zw\x06\
-r\xf0\x01L\xafK\xe9\x98M/6\x09\xf8\xf4\xdd\x0f\
-\xd0)\x05\x80R\x88\xfa\xbb\xb7\xa0\x1f\xc5\x877\x0c\x90\
-\xba\xd1\xb2A\xd0Ka\x12\x06D^\x80L\xa4\x1e\x1e\
-;\xf3yxl\xcf\xb5\xf0\xf4\xde\xdb\x1d\x14\x84\xfb\x0a\
-\x00P\x1a\x00\xe1\xc1\x10M\xfe\x91O\xbe\x99\x18\x7f\xcd\
-\xb9\xfe\x8a\xfc\x03\xc0\x1em\x08\xd0g\x08\x09\xde\xb0\xe8\
-\x0cd\xf3M\xcb1z\x1b\xe7\xe6\x01\xa0\x9e\x00@\xe3\
-\xc6[4\x00\x92\xe6\x05\xd3\xdc\x80\x19\x1f\xa2\x91\x10\xb4\
-7\xa7\xe1\x1b\x03O\xc2\xce\x89\xc30\xbf~1\xfc\xbf\
-\x93\xae\x84\x7f}\xed\x0b\x8e\xae\x85\xdb\x0a\x00`\x0d\x00\
-4\xfc\xc8PHv\xfd\xc5e\x04\x00\xbdU\xbd`\x16\
-\xf2\x07\x00\xa2\xf1\x8e\xaf\x0d\x09D\xba\x1c\xd15\x04\xaa\
-\xc4\xf0+5zV\x5c\x00\xa4#\x06\xc3\xe5\xb9\xf0f\
-\x09B\xc1\xe4\xd6\xcf\xae\xea\x9eVO[\x1a\x0e\x8a\xe3\
-p\xf1\xe1g\xe0\x8d\xfc!\xe8\xca\xcc\x84Y\x8dI\x18\
-\x17\x87\xca\xbe6\x95*\x00\x809\x00\x84I\x01\xa2\xfd\
-R\xd6\x9fl:w\xe2\xdb\x935\x95\xf5\xd7\xcb{\x00\
-\xe4\x8a!\x00\xae\xa8c\x01@J\x88]V\x00\xe0\x89\
-\xe1;0z\xfd\xfb\xd3Z\x80\x1c\x07\x00L\x09\x1a2\
-\xfb\xca\xbci\x9f\x00\xc1x,SMP\x97\x8eAK\
-CJ=f\x88B\xe0i\x02\x81\xc3\x90\x8aF\xe1\xb8\
-\xd6V\x88\x84Be]\x9bJ\x15\x00\xc0\x04\x00d6\
-\xda\x17V\xe2\xfe\xcb\xc7\xffa\xf2\xb2\xaa\x5c \x07\xf2\
-\x05\x008\xc3\xbb\xe3\xab\xcb\xf2v:\x22P\x83\x8d\xde\
-\x80v\x0d\xdf\xa6\xd1\x97\x02N\x98\xf5\x00\xee\x91\x00P\
-\x97\x0a\x83\x1a\xdd\xcb\xb1@\xa9\xce=\x82`\x13\x04D\
-m-\x19H'\xb55\x0d\xe8\x09\x5cB \x80\xe1@\
-c2\x09\x0b[\x9a\x1d_\x177\x14\x00\x80\x03\x004\
-\xfe\x81\x10\x08yz\xc5\xee#\xc6_\xd5\x81>\xec\xca\
-s\x00\xd4\xe7\xf4I\xc0\x1e\xed\xb2\x92\x13\xd8c\x0c\x01\
-\x0c\x12\xf5\x8b\xe5\xdf\xed\x9d$\x14%\x00t\xd3\xf9\xa7\
-\xefyP\xfa\xdc)\xa5\x0f\x80q\xc8o:k\x95\xf7\
-\xd3\xed\xa7O\x12\xe2dVg\x83a\x1d\x8a\x86\x03\x87\
-$O\xa05\x9d\x86\xb9M\x8d\xf6\xbf\x88K\x0a\x00`\
-\x04\x00\xc6\xfc\xe1qZ\xe5\xb7\x95,\xae!\x00\xa8\x89\
-\xb6\xfe\xa5\xe4\x1f\x00t-\x01\xf5\x0f\x0a\xe1\xe5\x00T\
-\xd91|\x97\x8d\x9e=\xa1\xd6\x03\x90\x00\x90\x95G\xfb\
-\x11\x98\x96<\xbc\xb6\xfe\xc5}\xec\xd4\xfbK\xde@:\
-\x15\x85\xf6\xe6\x8ca|@e\xa2@\x00=\x81\xb6\x8c\
-\xff\x10\x08\x00\xa0}E\x86\xc2\xd4\xf8\xb1\x9b/Y\xec\
-\x99*\xc6\x8f\xf2\x07\x00&.?^\x18^\x0e@\x95\
-\x0b\x86o\xdf\xe8\xcd\xcf\xad\xc9\x01\xe8\x00@\x0b\x91q\
-\x01\xac\x86\xfc\xd2>\x0eL\x7flq}c}\x12\x1a\
-rI\xfei\xe4\x15C\x1a\x08\xa4\x08\x04\x9a\xec~\xd1\
-\x8a\x15\x00\xa0\xf8\x0a\x0f)\xd5}4\xe3\xbff\xec\xef\
-'\xb7\xfav!\x5c\x90\xf7\x00\xa8\x8f\xd3eM\xc3\x1f\
-\x11\xb8@P\x01\xe0\x9b\xe1\x8b\x96\x8b\x8ax\x00\xc0\xae\
-\xc0\xfcj?\x1bc\xff\x99\xacSVOk\xcbB*\
-\x1e\x01\xb3\xfc\x80\xb2\x02!\xf0M\x0c\x07&\x0e\xd1p\
-`^\xb3?\x10\x08\x00 \xbdp`\xcf\xd0\xb8\xda\xd2\
-\x8f\x18\x7f~J\x19?\xcaw\x00d[9\xd5\x80\xf2\
-r\x84\x93\x04\x14m\x1a)\xdd\xe4\xd4\xe8\xed5\x04\xa4\
-\x00H\xe4\xba\xe9\xf2\xd3\xf7<D\xa7\xe9\x84\xd2\x15\xd8\
-\xac%\xa0}o@\xb3\x9a\xac\x9c5#GG\x13.\
-\x1ej\x0e\x02\xa9\x8a\xf0)\xd89.\x85\x03~@ \
-\x00\x80\x08\xc2\xa04\xbe\x1f\x11\xba\xfdS\xd2\xf8Q\xbe\
-\x01\xa0o\x8f\xd1\xe05\xcb\xba$\xa0\xbb\x86\xef\xe0\x5c\
-\x9c\x15\xe1\x98\x11\x00)\x02\x00\xab\xaa\xbf\x22\x14\x9c\x83\
-`\xee\xcc\x06\xcen\xc6D\xa1\xa2A\xea\x09<E<\
-\x01\x7f pL\x03\x00?\x0c6\xc1\x18\xa5_\x9d\xde\
-\xf9G\xffnj\x1a?\xca\x17\x00\x98\xb9\xfct\x99\xf1\
-\x08\xe8\xe3\xc1m$\x01\xd5\xd5N\x0c\xdfn\x85\x01g\
-?\x1e\x00\x92\xf1\xa2\x07\xa0\xcc\x98w\xf0\x11\x8a\x83}\
-\x98\x8d\x1d\x22\xaf\x8f\xc7\xc2\xd0\xd9^\xa7;\x9e\xd9\xcf\
-\x04\x04,\x040\x1c\x98\xdf\xe2\x1d\x04\x8eY\x00\x90\x0f\
-\x22\xf6\x91\x0f\x97\x17U\xb7\x7f*\x1b?\xcas\x00\xd4\
-\xd5\x19s\x00\xea\xb2.\x09h\x00@\xa5\x86_\x81\xd1\
-\xb3\xd2\x84\x00\xf7\xca\x00\xc0\xd1\x80xn\xb9e\xa2O\
-`\xd6\xf1\x1b\x0e`\xec?\xbd-\xab]\xcd\x05\x81\xee\
-\xcd@\xce\x09\x1c|J\xad\x1d\xf0\x0a\x02\xc7\x22\x00&\
-'\xc8\xb4\x9f\xec?I\xbf$\xad\xea\x1b\xf9V~\xca\
-d\xfb\xcdT\x1d\x00\x88\xfa\xde\x80XK\xf0\x16\x09\x01\
-\x12\xdc$ +k\xe3w`\xf8\x0e\xdb\x01\xe8\x01\x90\
-\x88\xb2\x8d\x80\xf8\x89?CX\xc0\xac\xe5\xeeKvJ\
-\x22\x00\xda\xb3%\xdb\x0fh\x0f/\x82`\xa80\x0e\x17\
-QO\xe0\x10\x81@\xc6\x13\x08\x1ck\x00\xc8\x8f\x12\x00\
-\x0c\x14\x94\xe6\xbd\xf7\x91\xff\xeb\x8f\x06\xe3G\xf9\x07\x00\
-\x93\x1c@\xb6Mi\x18D\x00\x10M\x986\x04*\xd7\
-\xf0\xcb5zV\xa1h\x8a\x00@\xfa\x9c\xcf0\x00\xd0\
-\x14\xa2\xae\xe3\x8f\xb2\xc1\xbc\x83\x90P\x0c\x19\x98\x9dR\
-\x89h\xd1\x03\xb0H\x14\x1a\xd61\xff\xa5p\xe0I9\
-'\xe0>\x04\x8e%\x00L\x10\xc3\xcf\x0f\x17\x94\xaf\xbe\
-a\xf8\xd2\x89\x8b\x5c-\xcc*\xabj\x00(\xf6\x06\x94\
-\x01\xb0\x87\xf1\x00\x18U\xcb\xf0\xd9\xa7\x12\xb19\x80g\
-\xee}\x98N\xe3\x11\xce\xb8~\xa6I>\xc1\xa2\x93\x90\
-v,A\x04\xc0\x8c\xf6,\xe7\x1c\x9cS[\x80\x80B\
-\xe0\xa0\xd4\x8b\xb0=\xeb.\x04\x8e\x05\x00\xe4I\x9c?\
-~$\x0f\x052MB\x14\x86\xc5\x89s\x89\xf1\xd7t\
-\xc7\x9er\xe4\x0f\x00\xb8.\xbf>$\xd0\x02\xa0b\xc3\
-wh\xf4V\x8f!\xe3\x01 V\x1c\x0e@3\xa6\x9f\
-5\x088\xc7\xe8@\x90d\x00 \x948\x87f\x13g\
-\xc3Pa\x82z\x02;eO`A\xab;\x108\xda\
-\x01064\x09\xe3\x83\x93 \x92\x1b\xff\xccP=\x5c\
-\x948\x19\xbe\xf4\xb7\xf7{f+\xd5\x94\xf7\x00\xc8\xea\
-\xda\x01\xa8.\xbf>\x09X\x04\x80\xb9-\xbak\xf8v\
-\x9f=Hs\x00\x0d\xddt\x9e\x07\x00Z\x90\x82.$\
-\x00\xbeQ\x9a\x85\x05\xca\xf1\xd4\x03h\xab\xd3\x9c\xa8\x12\
-\x10\x0c\x16\xa4\xda\x01l'\xd0\x9eM\x13\x08T\xde\x81\
-\xe8h\x05@>_\x80ar\xd7\x9f\x1c/\xd0c\xbe\
-\xb4\xe0#\xb0\xfa\xdd\x1c\xfd\x8ek\xcf\xbf-\x00\x80\x13\
-\xe9\x01\xd0\xb7W\xd7\x17\xc0\x90\x13xK\x1a\x11\x88\x9b\
-\x03\xa8\x8e\xe1+\xe7\xa4\x1e\x80\x0e\x00Q\xa93 \xc7\
-\x98\x8d (nc\x17\xf8\xdb\xa5\x10\xa0^{|\x85\
- \xa0\x10\x90k\x07\xdc\x80\xc0\xd1\x08\x80\x91\xc1<\x8c\
-\x0c\xe4\xc9]_\x84\x19\xf1,l8\xf5+\xb0\xaau\
->l\xba\xff1\xfa\x1d\x03\x008\x14\x0b\x00\xbe\xcbo\
-\xb77 \xdf\xf8\x9d\x1a~%O\x1a6\x05\x80\x5c\x82\
-V\x10\xe0\x15\xb2\xc6\xb0u\xc7#\x00:;\xea4{\
-r{\x1b\x82\xf1\xa4V0(B\xe0\x10\xb4e3\xb0\
-\xb0\x02\x08\x1cM\x00\x18\x1f\x9d\x84\xc1\xbe\x09\x98\x9c\xa0\
-\xf5{\xb0\xae\xfdx\xb8`\xc6Jh\x99\xb3\x8a.\x07\
-\x00(S\x0a\x00\xb2\xd9\x18]\xe6\xd5\xfb\xa3\xd8\xbe\x01\
-Z\x00\xf8d\xf866#\x00\x92\x0d3\xe9\xf23\xf7\
->B\xa7\x11v,\x0e\xa5\x11\x90!\xd1g\xe1\x0d\x98\
-,\xa4\x92QNC w@0$'\x06_\xc7p\
-\xa0\xae|\x08\x1c\x0d\x00\x98\x98(\xc0\xe0\x911\x18#\
-\x00\xc0\xed\x0bSM\xf0o\xb3?\x0c\x8bR\xcd\xf4\xfd\
-\x13=\xcb\xe9w\x0b\x00P\xa6\x0c\x00\xd8\xe3\xa47`\
-\xe5\xc6_\xae\xe1\xf3VS\x00\xe4d\x00\xdc'\x03@\
-\xdf\xec\x8f)M=\x0c\x9c\x80@\xeb\x01(\xc7k\xf7\
-\xae\x04\x04\x92'P\xac\x1dX\xd8\xe6\x1c\x02S\x19\x00\
-\x93\x85\x02\xf4\xf7\x8d\xc1\xd0\xc0\x04\xfd\xecu\xe18|\
-\xa7\xeb\x14\xf8L\xcb|\xcdw\x0c\x00P\xa14\x000\
-q\xf9\xd9e\x09\x00\x09\x93\xde\x80\xfa\x19sY\x1a\xbe\
-\x03\xa3g\x85I@\xd5\x03\x90\x01\x10\x12D\xd9\x83\xe7\
-\xb7\xe8\xe3\x85\x05\x82\x85\xc1*\xcb4\x070\xad\x8e\xbf\
-\x8f\x8e\x16f\xe3\x05\x18\xa4\xfb<\x95B`*\x02 \
-?Y\x80\x81\x811\x18$\x86_(HI\xbeoL\
-_\x09\x7f\xd5\xb6\x04\xea\x22q\xc3w\x0c\x00P\xa1T\
-\x00dt\x1e@\xbbEw`]\x12\xb0j\x86\xaf\xdb\
-\x10\x8e\xa5\x08\x00\xba\xe9<\x0b\x00^!\x0a:+\xb7\
-L\x12r\xb6k<\x00\x13\xa3\x168\x96o\xcb+`\
->\x13B\xe0\xa2\x03\x12\x04:\xea\xd2\x04\x02-\xa5\x0b\
-\x99-\x9e)\x02\x80q\x12\xdb\x1f!\xae\xfe\xc8\x08\x89\
-\xf3'\xa5O|n\xf3<\xf8z\xc7J\x98\x1e\xcf\x9a\
-~\xc7\xe4\xac\x00\x00\x15\x89\x07\x00\xea\xf2\xb7\xf3z\x03\
-\x8a\x86\x86@v\x8d\xdf\xa9\xe1\xdb5zv\x85\x94\x03\
-\xe8\xa6\xf3\x0a\x00\x04\xdc\xcei\xf7\xcf+a\xf6\xa9\xbf\
-\xeajN\xa2\x10W%e\x00\xd8\xbd\xbb\x9b\x86\x07%\
-\x8e\xa3\xe3\x09\xa8\x108Ds\x02\x8blB`*\x00\
-`\x88\x18\xfc\xc0 \xb9\xe3\x0f\x8e\xab\xd5\xca\xe76\xcd\
-\x87\xafM;\x11\xa6\xc7\xb2%\xbfcr\xd62:\xdd\
-t\xff\xe3t\x1a\x00\xc0\xa1\xf4\x00\xe8\xdb]\xf4\x00P\
-\xfdlK@]C \xe9\x87d}~W\x0c\xdff\
-sA\x1e\x00\xd4_\x95.\x01h\x09\x02eV\xe3\x05\
-h\xf3\x034\x09\xc8\xe4\x00\x9c\x83@\xda\xc3,\xc9\xa8\
-?\x96\xb6\x18<\xf0\x04M\x0cv \x04\xdaKC\xa0\
-V\x01@\xdd\xfc\xa118\xd2?\x0a\xa3c\x93\xf4S\
-dI\x8c\xbf\xb6q>|\x91\xb8\xfav\x0c_Q*\
-\x00@eb\x01@]\xfe=\x1c\x00\x88LS`l\
-\x07`\xa33\x10\xca\xd4\xf8]4|\xf6-\x10\x00\xa9\
-F%\x07\xf0\xa8\xbc\xbd\xa0\xbd\xe7\xea\xbd\x01\xc1^<\
-NW\x09\x82\xa6!P\x97.\x04\xd0\xcd:\x02\x81\xd9\
-\xb1\xec\xac\x14\x0e<!\x87\x03\xa5!Pk\x00\xe8'\
-wzj\xf8$\xc6W4-\x9a\x85\xbfl]\x02\xe7\
-\x12\xe3\xcf\x86c\xe0T\xa9\xd9\x01\x00*\x92\x02\x80L\
-\xda\x98\x03P\x5c~\x0a\x80v\x09\x00}%:\x03\xa1\
-\xdc3\xfc\xd2F\xcf\x8a\x0b\x80\x82\xd4A\xc4\xe0\x82\xeb\
-\xab\x02\x99R\xd6\x1b\x22\xaf\xf0\xd3\xa9\x18\x01@=\xf7\
-x\xc39,\xcec\xfc,\xd60\x18r\x00\x81j\x03\
-\x80\xde\xe9\x87\xc7\xa1\x9f\x18=\xbe\xa4\xd8^:\xd7\x87\
-\xeb\xbb\xe9\x1d\xff\x0cy\x14g\xbb\xd2_\xfat\x00\x80\
-\xcad\x0e\x00\xd9\xe5G\x00\xc8\xcb\x22\x98w\x06Rd\
-\xd7\xf8\x9d\x1a\xbe\x9d\xf6A<\x00`&\x99\x7f\x076\
-\x82\xc02A\xa7o\x08\x94\x8cR\x00p\x1b\x13\xf1\xe0\
-\xa2[\xa8\x04\x06\xb4v@\x0e\x07\xb2\xf1\x18\xac\xe8\xea\
-\xe0>|\xa4\x9a\x00\xd8\xb5\x7f\x00\x0e\x1c\x19\xd2\x5c\xb7\
-\xf9\x89&\xf8t\xc3<\xf8t\x99w\xfb\xe2\x97*J\
-\x05\xc0\x03\x01\x00\xca\x92)\x00\x98\xde\x7f\xa8\xac\x02\x84\
-\xbdf\xbd\x01\xabg\xf8\xca\xa1\x14\x00MF\x00\x94*\
-@AN\x0e\x18\x12\x85\x16\x1e\x01\x8e\x058\xaf\xbb\x89\
-9\x87I\xabBW\xbc\x82\xe2\xd1j8 \x12O`\
-\xbf\xe4\x09d\xe3Q\x02\x81i\x06\x08T\x13\x00;w\
-\x1d\x82\xc1\x91q\x98\x17\x97\x8c~M]7\x89\xed3\
-6/\xa6\xe5e\xd6(3[\xae\x05\x08\x00P\x9e\xb8\
-\x00`]~\xc5\x03`\xc7\x03\xd0\x01\x80k\xfc^\x1b\
->g;M\x02\xca\x00\xd8$\x03 \x9f\x9f\xd4&\xfe\
-8\x99~\xb5\x90\xf5\xc6\xaa\x1b\x1eL\x0f\x82\x85\xb3\x9a\
-9\xe7(\x0f\x04\xdc\xf5\x9c\xcf\xc5\xeeY\x0c\x07\x0eA\
-\x86x\x02'\xea P\x0b\x00\xb8\xae\xe7l81m\
-\xe3)Re*\xa3z\x00O\xd0i\x00\x00\x87B\x00\
-\xe0\xc5\xcdf\xa2t\xb9\x7f\xb7\xd1\xe5\xa7\xcb&\x00(\
-\xcb\xf8]6|e5\xb6\x03PB\x00\xa5^\x18\x01\
-\xa0\x16 \xc7\x08\x05NW@\xb3\xfc\x00\xdb\x9d\x18\xb5\
-\x00\x01`r\x17\xe7\x9eW\xf7\x198\x8b\x8ea0X\
-\x98\x90 0~\x08\xb2\x09-\x04j\x01\x00\xd7v\x9f\
-\x0d+3\xee\x02\x80\xfd\x8dd\xe7\x04\x00\xa8H\x08\x00\
-\x1cA\xb5Ni\x09\xc8\xba\xfc\xc0\x07\x00\xad\x05\xc8\xb5\
-\xf3O(rgu+\x1c\x1a\xbe\xcd\x9c\xa2\x15\x004\
-\x05\xa972^\xd5\x1c\xbf\xe1\xa0f\xe5\xa2\xd9-\x9a\
-\x8d\xe6F[\xda+\xe0,\x96\x84\x81tn\xb9v@\
-\x0d\x07d\x08\x84C5\x03\x00/=\x80\x00\x00\x15\x0a\
-\x0109Y\x80ze<\x00b\xf0xa\xeb\x98\x98\
-\x1f\xa5\x01@4nL\x02\x96y\xd7wj\xf8\xa2\xc5\
-\x1a6\x09\xa8\x00`B\xee=f\xf58p3\x10\xa8\
-\xffu\xc6\xad\xac[\xc8\x00\xc02o\xa0\xbe\xa7\x89W\
-\xc09\xc0)\x0ch;\x01\x19\x02\x18\x0e\xac$\x10\x08\
-\x87C\x01\x00\x8e\x12y\xf6\xa5v\xfe\xeeR\x11\xabg\
-ru\xcas\x01\x8c\x06\xcf.K\xdd\x81\x13%\x1e\x0d\
-\xc6[p\xd3\xf0\xf9n\x06\x9b\x04T\x000>Q\xf4\
-\x00\xd8\x86@j\xa1\xda\x04\x01;\xa7\x9cC\xf5\x00,\
-\xceQ)\x08\xb8\xabL\xce\xad\xb6\x13\xc0\xda\x015\x1c\
-\x10\xaa\x0a\x80\x9f\xcc\xb4\x01\x00\xfd\x17\xb1\x9b\xf8%\xaa\
-\x9bk\x00@T\xdeTP\xbe\xb2\xfd\xb3\xd5\xae<\x03\
-\xc0\xeb\xbf\xbd\x94z\x00\x0d\xf5\x89b\xcc\xcf$\x01Y\
-\x00\xe0\xc55$\x01\xcbp\xf9M\x8d\xdf\xd2\xf0E\xcb\
-\xfdP|\x00\xe4\x0d\xc5\xa7\xed\x13\xa0\x9dj\xb6\x97\x00\
-\xc1\xa29-\xa6\xfb\xdbo\x10\xe4\x0e\x0c\x94\xd9b8\
-\x80\x89\xc18\xac\x9c\xd9\x01a&'P\x93\x00\xa8@\
-Y\x19\x00\x9b\x8b\x00H\x01h\x98\x87ba\xc0\xbe\xa6\
-\x8c<\x03\xc0\x8e\xdf\x5c\x22N\xe6\x09\x00\x1a\xa4\x87\x5c\
-\xf6\x1b\x9a\x02K@\xc8\xb6u\xab\xcb\xbc\xde\x80\x15\xdd\
-\xf5+4|E<\x00\x8c\x8d\xe5\x8b\xc6]j\x00\x10\
-A\xeb\x15\x94\x02\xc1\xe29-\xfc\xf3\x99\xb9\xf3%\x13\
-|\x15\xc2@^I\xdb\x09\xec\xc7v\x02LbP\xce\
-\x09T\x03\x00+<\x04@\xdd\xdc\xa5t\xba\xf9\x81'\
-\xe9\x94\x00 -ob\x7f-\xa2\xc9:\xb3W\xcd\xc9\
-3\x00l\xff\xb5\x04\x80\xc6\xc6\xa4\x9c\x04\xd4\x01\x00s\
-\x02\xe4\xa2\xb2\x1e\x81io@\xcd\x82\x0d\xe3w\xc9\xf0\
-\x95sG\xe2)\x06\x00R\xbd\xf0\xe8X^[\x80\x02\
-\xd8\x1b\x09\x88\xf1\x0c\xcc@\xa0\x84\x00\xa6\xa3\xfeV\xd4\
- \xc8\x02\x06\xa5\xce\x0dZO\x00!\xb0B\x81\x80\xcf\
-\x00\xb8\x06=\x80\x94\x87\x00\x98g\x00@\x16\xf8\xc6o\
-6\xcf\x9b\xeaaPu0x\x06\x80\xd7~y1\x0d\
-\x01\x9a\x1aStY\x0f\x80b\xe7\xa0b\xad\x80\xa63\
-\x10+\x8e\xf1\xdb\xbd\xeb;5|\xdeyy\x00\x18\x19\
-\xcd\x9b\xba\xf7Z\x83\x12,A\xc0.+S\x09\x00\xda\
-\x1d\xb8\xe7\xd0\x9d\x87\xb7\xde:\xd3\xcf\xdfZ\xca;\xd0\
-\x86\x03\xc4\x13\x90\xc3\x01\x7f\x01\xf0IX\x91\x9a\x06\xde\
-H\x84z%\x04xP\x05@\x9d\xba\x91\xdd\xd1\xfe<\
-\xcfK`\xe7E\x93}=\x95g\x00x\xf5\xb9oR\
-\x0f\xa0\xb9Y\xf2\x9c\xb4\xe3\x01\x88\x9a\xa6\xc0J\xad\x00\
-\x02 \xc9\xad\x05p~\xd7w\xc3\xf0\x15\xf1\x000<\
-\x22\x8d(#\xdd\xc9\x05\xad\x91\x9a4\xf0\x91&\xba\x98\
-\x9f\x03\x91Esu9\x00N\x87#\xc3\xa9+\xf0\x0a\
-\xa4\xefQ\x02\x06\xba\x05}8\x80\xcd\x86\xd9\xda\x01\xaf\
-\x01\xf0\xe3\xaeOz\x96\x03\xc0\xcf\x94\x9bg\x00@\x0e\
-\xcc\x8d\xb9\x9cy\xb3uV`p]\x9e\x01`\xdb/\
-\xbe)b]yk\x8b\xd4L\xb3\xcf\xa4)0\xbbL\
-\xdb\x014\xea\x93\x80.\xdc\xf5\xcb4|e\x87H<\
-\x0d\xa9f>\x00\xd4\x82\xd4\x19\xb2\xe9\xd3\x81\x0c\x86*\
-\x18\x8e\xd7\xe4\x00\x04\x0e\x08t\xfb\x1b\xb6z\x04\x03\xfd\
-q\xb4\xd9\xf0>\xf4\x04\x0eRO`\xc5\xccb\xed\x80\
-\x1f\x00X\xe1a\x08\xc0\x01\x00\xfb\xc8\xe6RF\x0c\x9c\
-\xf5v\xe6\x9d\x86\x0f\x15\xcb3\x00\xbc\xf2\xecEb~\
-\xa2\x00mmE\x00\xe0\xc5\xaeg\x1b\x02\x89\xda\xa6\xc1\
-\x11\x05\x00v\x8d\xdfc\xc3WD\x01\xa0x\x00\x0f\xf0\
-\x01\xa0\x16\xa6YX \x08\x96 `W-\x9e\xdbj\
-\xdcEc\xb8\xd6\xe1\x81\xfe\xbdM\xdf\xd6\xaa\x191\xbb\
-\x9b\x05\x10h\xb3\xe1\xfd\x8f\xab\xe1\xc0r\xec@D\x13\
-\x83S\x17\x00\xf8\xfe\x0dF\x0041\x9b\xd9\xa9\xd9\xbc\
-\x17^\x02\xbb\xbe \xbf*\x92g\x00xy\xd3\x854\
-\x04h\x97\x9frsD\x8e\xf9U\x00p\x9a\x06k\xdb\
-\x01xc\xfc\xd6\xed\x04\xf8\x1b\xc3\x04\x00i\x1b\x00\xd0\
-\x97\xacP\x9cef\x04C\xbb\x01\xfdU8nN\xab\
-\x83\xd8\xde%\x18p\xcfm\xf2\xd5t@\x18T  \
-\x87\x03\xcb(\x04\x04O\x01pu'\x07\x00N\x7f\xcd\
-\x16\xbf\x85\x86\xf9r\x12\xf0\xc1\xa7\xe8\x94\x00\xa0Ew\
-\x94\xd9\xd4l\xdeM \xa0\xe1\xe7\xc1\x05/\xc03\x00\
-\xfc\xf1\x99\x0b(\x00::\xea\xe8\xc5S\x1a\x02\xd5\xcb\
-1\x7f\x1f\x9b\x03\x00=\x00\xec\x1b\xbfW\x86\xcf\xae\xc1\
-\x1c@\xba\xa9\x9b\xce+\x00\x18\x1a\x1e/\x16\xa2\xc5\x1d\
-RoT\x02\xf3O\x7f7VN\xb3xN+sn\
-\xee\xe98\xe7.\x0d\x02\xcd^6a\xc0\xdd\xc6\xd1\x90\
-8A\xc2\x81\xa2'\xb0lf;\xed;\xe0+\x00\x5c\
-\x14\x07\x00m`\xdf\xf5\xafd\x9d\xd9>\xca<\xdey\
-\xf2n}O\xcf\x00\xf0\xd2S\xdf8\x9c\xcf\x17r\x89\
-x\x04\x1a\x9bRE\x00\xa8-\xff\xa4\xa6\xc1\xf5\x06\x00\
-\x14\xfb\x02\xb8a\xfc\x95\x18\xbe\xa2H\x8c\x00@\xc9\x01\
-\xc8\x0dCX\x00\x18\x0a\xd52@\xd77\x182\xd6\x12\
-\x1c7\xaf\x95\x7f\xb8\xed\x06A\x95\xc1\x80\xbb\xca\x06\x10\
-\xd8\xc4`&\x81\xe1@;\x84u\x9e\x80\x9b\x00X\xee\
-!\x00\x1a\x8d\x00`\xefLN\xe2\xf7R\xeb\xecn\xc7\
-\x17\x0ey\xa4\xed\x84R\xa1<\x03\xc0\x8bO|c\xdd\
-\xe4\xe4\xe4\x15\xf9\x89B.\x99\x8aB\x02\x0e\x82\x88}\
-\x03d\x83?\xa2\xf3\x08\xa4Z\x80\xb8\xf5\xc3A\xcd\x8c\
-\xdf\xe9]\xdf\xa6\xe1++\xa9\x07\xe0\x00\x00\x86B6\
-\x19\x0f\x5c\xdfj@\x09\x0d\xd4\x1c\x80+\xed\x00*\x87\
-\x01w\xb5\xc9\xf7P\xab\x08)\x04\xa2$\x1ch\x97\xab\
-\x08\xdd\x05\xc0U3\xbc\xf5\x00\x1a\x17\x18\x000\x1d*\
-7\xf6r\xc3\x86q\xf9\xe5zm\x80g\x00@\xfd\xfe\
-\xa1\xbf]J\xc2\x80M\xe8\x09\x00q\x11\x9b\xb2c\xd0\
-\xd0\xd1M\xbf\x85\xde#\xc01\x02\xb1\x16 \xcd{8\
-(7\xde/\xe3\xae\xef\xd0\xf0\x15U\x0a\x00\xbd\x04M\
-\xc5\xbf\x11\x04Kx\x1e\x80\x8f0\xd0\xeci\x17\x08\xcc\
-J\xea\x09\xc8\xe1@\x9a\x84\x03K\x09\x04\x94\x9c\x80\x9b\
-\x00\xf0\xd2\x03h2\x02`\x86\xbc\xc9\x8ea;\xddf\
-\xb6\x0e\xef\xf6#\xe0\xa2\xcb\xaf\x97\xa7\x00@\xfd\xf2\x9e\
-\xf3d\x08L\xe6\xc2B\x01f\xcfo\xa7\xf5\xc5}r\
--\x80\xe4\x11\x88\xd2\x98\x80\xb4;\xb0yo\xc0\x8a\x5c\
-~\xdd\x06;\x86\xaf\xc8m\x00(\xd2\x180\x13\x0a\x1c\
-7\xb7U\xdd\xc8kV\x5c\xf2\x5c\xec:\xdd\x82\xc0\xdf\
-j\xcf;\xe0\x1cf\xb6I\x0a\x07\x1eW\xc3\x81\xa5]\
-m\xd4\x13p\x0b\x00W\xce8\x0b\x96';\xe42\xa9\
-\xecg\xcc\x1b{\xa2y\xa1R\x0b\xa0\x02\xa0K\xd9]\
-7\xe5\xads\xc3#@w\x7f\x18<\xb8\xeb\xb3\xf2\x1c\
-\x00\xa8Mw\xfc\xcdR\xe2\x05\xdc\x90\x9f\x98\x5c\x1a\x8b\
-E`\xde\x82V\x18\xdc\xff6\xddV\xdf\xdeM\xa7}\
-\xf2\xd3\x81\xd3&\xbd\x01\xcb6\xfe\x0a\x0c_9\x1c\x01\
-\x90i\xd1\x02`p\x88M\x02VV>z\xe3=n\
-^\x1b\xb7\xe6\xc0p\x9cM\xaf\xc0\xb0\xca\x06\x0cLN\
-cy>\xbdh\x15!\x93\x18<\x81@ \xa4\xb4\x13\
-p\x11\x00^\x88\x03\x80nf\xb3Y}\xbc\x1b9\x02\
-|\x0d\x80\xe4\xf2{._\x00\x80z\xfc\xc6u\xb9\xc9\
-\xfc\xe4\xa6\x89|ai,\x1a\x86\x8e\xe6\x09\x88\xc7D\
-MN \x12c\x00\xe0 \xde/\xfb\xaeo\xb3\x9d\x00\
-\xf5\x00d\x00l\xe6\x00\xc0P\xa8\x15\x94*\x1ez\xdc\
-\xfc6\xcd2\xbb\xc0C\x81\x13\xaf\x80wN\xe3\xac}\
-\xef\xc0\xe4\x08\xd3p\xe0\xf8\xaeV)'P!\x00\xfe\
-K\x06\x80\x1b?`\xde\xcf\xa0e\x81\x0c\x80\x87T\x00\
-\xcc\x06\xfb\x86_nh0J^\xfd\xe0\xf1]\x9f\x95\
-o\x00@=x\xed\x17r\x18\x0e\x90\xd9\xa5\xd8\x93\xb4\
-\xab\xa3\x00\xad]=\xf4G\xa04\x04J7vTn\
-\xfc\xae\x18~q'-\x00\xa4\x86!V\x00\xd0\xcb)\
-\x10\x16\xcdA#\x11L\x8c\x13\x1c{\x05\xcc!\xfc\xf5\
-\x9c\x15\x82\xd5^6\xdb\x0b(\xfb\xb0\xed\x0401\xb8\
-\x04\xc3\x01A\xa8\x0c\x00\xd3\xbd\xf5\x00Z\x16\xca9\x80\
-\x87\x9e\xa6S\x02\x80\xb9\xa0\x05\x00\x80}\xc3/\x05\x02\
-\xac\xd7\xef\x03\x09\x00\xbe\xcaW\x00\xa0\xee\xbb\xfas\xd8\
-\xa6\xfa^\xf2Z\x1d\x8e\x84`\xc1\xa26H\xa5bE\
-\x00p{\x03\xbad\xfc\x0e\x0d_\x11\x0f\x00o\xbe{\
-\x18b\xb10$\xe3Q@\x8f\xc6iaZA\xa1\xa7\
-\xb3\x01\xd2\xc9X\xf1\x9c%c\xfb2`P\xea\xbc\xba\
-\x15\x82\xf5\x9e%\xa1P\xf4\x04\x0eRO`I\x97\x04\
-\xb9J\x00\xb0\xccC\x00\xb4\x1a\x01\x80\x8f\x0f\xae\xd4\xe0\
-\xcd\xee\xfa\x87\xc0\x85V}\xe5\xc8w\x00(\x22 \xb8\
-\x81L\xd6!\x04\xe6\xcek\x81\xc2\xf0n\x0d\x00*5\
-~\xbbw}+\xc3\xd7T\x03*\x00\x90\x9b\x86n\x7f\
-\xf3\x80\xa6\x04\xe3\xb1\x08$\xc8\x0b\xa1\x10\x8dT\x06\x04\
-\x16\x00\x9a}8'\x158\x1b\x9d\xc0\xc0\xec\xbc\xdcU\
-\x96m\x01JCA\x82\xc0c4\x1cH!\x04:[\
-\x0c\x89A\xdb\x00\x98&\x03\xc0\xad_\xb0\xee\xf2\xb7.\
-2\x00`!\xb8k\xf8\x98\xe1\xc7\xbb\xfe\x80K\xdf\xa0\
-,U\x0d\x00(\x05\x028\xdf\xde,BcC\x5c\x0a\
-\x01\x80\xa9\xea\xf3\xc8\xf8\xed\x18\xbe\x22\x1e\x00n\xbaw\
-\xeb\xd7fw5~(\x9b\x8e/\x8f\xc7\xc2s\xd9\x12\
-\x0d\x11k\xc3\x06P\x98\xf0\x8c\x13\xef\x80\xf6\x92sP\
-\xd8\xb3\x10\x00)\xf3\x07\x5cT\xe2\x15\xd0-v2\xf9\
-v\x80\xa0[i\x07\x0aR\xed\xc0c4\x1cH\x13\xef\
-\xe98\xe2\x09\x84\x04\xc11\x00~4\xcd[\x0f\xa0\xcd\
-\x08\x80\xc5\xe0\xcc\xc0E\xceve\x19\xab\xf6\xf0\x0e\xe2\
-Y\xf5\x9e]U\x15\x00(\x16\x023:\xe2\xd0\xd1\xd5\
-\xee\x9e\xf1;\xbd\xeb\x9b\xb0\x80\xad\x05`:\x87\x9c\xac\
-\xec3sz.\xf3\xa1\x153\x97wv\xd4\x9f\x96I\
-\xc5\x96E\x22\xa1\xe2/\x93\x940\xde\xe5\x12\x09\x84\x81\
-\xe4!\x84t\x0f\x04\xd5\xab\x14\x00X\xd9\x85\x81\xd9{\
-\x95\xcaOT\xd2\x1e\xc0l\x1f\x1cr\xbc\xe8\x09\x10\x08\
-\x10O $'\x06k\x18\x00K\xe4M<\xc3\xb6\x9b\
-\x17\xc0\xbb>\xba\xfb}\x9e}p\x87\xaa:\x00P\x04\
-\x02\x17\x92\xc9\x158\xdf3\xab\x09\x9aZ\xe4\xd1\x97\xf4\
-\xf6ih \xe4,\xdewj\xf8\x8aL\x00p\x8a\xd9\
-!+\x8f\x9f\xde\xb1r\xc9\xf4\xd3\x1a\xebS\xcb\xd2\xc9\
-\xe8\xf2PH\xd0<\xba&.\x87\x0at*\xe7\x0f\x14\
-\xe1\x05q\x02\x00\xfd\xb1\xf6z\xff\x95\xe7\x1d\xe8NQ\
-z\x1f\x8b\x0djN@\xf6\x04\x16\xd1p@\xb0\x0d\x80\
-\xff\xec\xf0\x16\x00\xed\x8b\x0d\x008A\xdeTn\x1e\x00\
-c\xfd= \xd5\xef\xd7\x8cj\x02\x00(\x02\x81ud\
-\x82\xde\x00\xb4\xb5g\xa1\xb3\xabA\xb3\xdd/\xe3\xe79\
-\x0d\xd8\x17 \xd3*\xb5\x03a\xea\x85O\x81\xd2\xa2\xa7\
-\xfb\xcc\xc7\x16-\xef\x9aV\xbf,\x97M,O&\xa2\
-\xcb\xd8\x1d\xb0^\x1c!@s\x08$l\xc0pav\
-\x99\x00`U\x12\x06\xccN\x96\xf5\xfd6~!v\xa0\
-\xc0\xdb\xac4\x16\x92 \x10\x81\x85\xe8\x09\xc8\xe1\x80=\
-\x00\xb4\x83Wj_\xacT\x03\xaa\x00\xc0g\x85\xf1\x8c\
-\xdbNX\xb0\x1f$\x97\xbf\xe6T3\x00@\xb1\x10\xc0\
-\x91\x84\xbagI]\xb0\xad\x8c\xdf~\xbc\xef\xdc\xf0\xd9\
-$ \x07\x00\xa7Z\x1dj\x22\x91\x84\x0bY\x12.,\
-\xebh\xcd\x22\x10N\xd3\x84\x0bD\x08\x80y=\xc4\x0b\
-\xca\xa5\xe8\xa3\xc2\x11\x10\x95\xcaY{\x80\xca\x81\xa0;\
-\x9d\xa5\x94\xc4\xe0\x1b\x18\x0e\xc4\xa2\x04\x02\xcd4\x1c(\
-\x05\x80\xff\xf0\x02\x00\xcc\x95l?N\x02\xc0\xb3E\x00\
-\x9c\x08\xa5]~\xfdv\x8c\xf5wA\x15\xaa\xf7\xec\xaa\
-\xa6\x00\x80\xd2C`fO\x93q'Q\xcd\x12\xe8\xd6\
-sw\x03+k\xb7n\x19(\xcdH\x00PB\x00\x03\
-\x00J|\x0aK\x89\x18.\x9c0\xbf}YKcz\
-y]&~\x1a\x86\x0b\x9d\xd3\xea\xa9\xf1\xa3\xd0;@\
-\xcf\x00k\x05pZ\xa9\x9ce\xfc\xcds\x07\x9a]\x1d\
-\xfe\x8a\xf4pPk\x07\xc6\xa5\x9c\xc0\x82\x19\xcdR\x8b\
-\xc1R\x00H\xb8\xef\x01(\x17\xaf\xe38)\x04x\xf6\
-\xa1g\xe8\x94\x5c\xef\x0f\x00\xdf\xc8\xcd\xda\x06\xec&\xaf\
-\xbd\xae\x7f@\x97Us\x00@\x11\x08`\xe9c\x83\xa1\
-\x5c\x13z\x02,\x04l&\xfc\xb8\xc6_\xea\xaeo\x02\
-\x0c\x87\x00\xe0\xc96\x14>w\xce\xf1\xf5\x7fv\xd6q\
-X\xe7\xfci\xf2Z\xad\xdf\xce\xc2@\x9f?p\xaa\xf2\
-\xba\x03\x0b\xb6~4N\xa1\xa0\xf1\x04\x08\x04\xe6\xcfh\
-\x92\xc3\x01\x13\x00\xb4\x9f\x05K=\x0c\x018\x00X\x05\
-\xd6\x0d\x81\x94y\x8c\xf1{\xf1+y\xf6\xe1\x5cTM\
-\x02\x00\xc5B\x00\x1b\x0aa\xff\x810\xe3\x0eWb\xfc\
-v\x0d_9W$\x91\x82\xac\x11\x00\x1f2;\x8b\x0d\
-\x99\xed\x8b\xcd@\xff\xa4+\x87\xd5P\x84\xc1Rv\x1b\
-\xde%S\xc9(m\x8c\x84@\x88\x84CP\x89\xcc\xbc\
-\x03\xd3\xd5\x0e\xbc\x04\xf5\x10\x8b\x1dY\x08$c\x08\x81\
-F\xfa\x1dy\x00\xd8\x80\x00\xf0\xc0\x03P4m\x89\x01\
-\x00J\xce\xc7\xcc\x0b@a\x92\xef=p\xb9\xcf\xbe\x97\
-\xaaY\x00\xa0\xb4\x10\x88\xc2\xbc\xf9\xad4F\xf6\xc3\xf8\
-5}\x01\xec\x01\x80'\xbbP\xc0\xfd\x86\xc8\xeb\x15\xb0\
-\xa8\x1b\x96[Q\xae%\xaf\xd3A\x02B7\xbb]\x09\
-\x17\x14 T\x9a?\xb0\x02\x82\xe9&\x9d[\xe1\xf4\x13\
-\x0c\x89l8\x10\x81\xb9\xd3\x9b\xd4p\xa0\xca\x008\x0d\
-\xcc\xdd\x7f\x8c\xf1\xdf\x00\x09\xe0SJ5\x0d\x00\x94\x0c\
-\x01l:\xdc\x8d\x10\x98+C\x80\xaa\x12\xe3\xb7a\xf8\
-\x8aL\x00p\x1a\xf7\x04\xd62\xdb\x17\x8d\x1f\xef\xfc\x8e\
-\x1a\x86\x90\xb2\xe9\x06-\x10r\xecv\x05\x06\xe8%T\
-\x1a.\xa0\xdc\xa9\x02\x14J\xee[\xf4\x04\x0eB,\x12\
-\x86\x9e\x8e\x06\xe2\x11D(\x00\xb6\xf5\xee\xa7\xcfe\xbc\
-\xb6c-\xcc\x895\x9a\x7f\x0e\x93\x93\x97\x1c\x0cV\xd6\
-\xf4\xe3\x0d\x00\xc0\xf2\xe5\x01\xe0 y\xbd\x0e5\xd0\xa8\
-\xa7\x1c\xd5<\x00P\xf2\x9d\x0f=\x81\xa5I\xc5\x13\x08\
-i\xdd]\xaf\x8c\x1f\x859\x00\x15\x00\x0f\x19\x00\xa0\x97\
-S \xa0\xbb\xf82H\x10\xa8\xb4\x9cV\x83\x04\x02\x05\
-\x08\xaa\xf0.\xca\x02\xa1\xd2pAQ\xb9U\x80\xe6\x1b\
-\xa5\x05\x84\xc0\xc5\xfb\x1e\xa5\x9e\x00*\x93\x8cA~\xb2\
-\x00#cyh\x8f\xa4\xe1\xf6\xe9\x7f\xe6\xca\xe77\x13\
-\x07\x00g\x80\xd6\xfd\xc7\xb1\xf9^\x03\x09\x00SVS\
-\x02\x00(\x16\x02\xb4\xaal^+ \x0cP\x95\x1a\x7f\
-\xa9\xe7\x0dH\x1e\x80\x5c\x0dX\xac\x162\x03\x80\xc5\x99\
-\x0c\xc2\xbb\x86+\xc6oR^\xabA\x82\x01z\x09\xdd\
-\xec\xf6H$$%\x14\x131W\xc2\x05Vv\xa1`\
-g\xb7\x9b\xfa\xb7\xc2\xdd\x03\xdb(\x10\xf0:eB1\
-\xf8a\xdb\xc7-\xef\xfe\xa5\xdfX,\xb9y\xc6\xf1r\
-5\xe0\xc3*\x00>\xaa;\x18\xeb\xf6\xb7\xc1\x14\xbd\xf3\
-+\x9a2\x00@\xf1 \x90H*Om\xb6k\xfc6\
-\xee\xfa\xfa\xbe\x00\x95\x03\xc0\xec\x1d\xd0\xf8}i\x16*\
-\x87\x0b\xab\xa1\x08\x04M\xb8\xe0vu\xa3\x99\x9c\xc2\x01\
-\x85\xc6\x8f\x89A\xd4\x9ch#\x85\x80\x97\xc2\x8b\xd3)\
-\x03\xe0w\xcf\xfc\x1aFGF\xe1\xdf\xaf\xff\xd5\x17\x7f\
-\xf9\x87\xb7\xf72\xbb(\xd3\xc3 u\xe89,\xbf\xa6\
-\x14\x10\xa6\x14\x00P2\x04\xb0\x9d\xc0Z\x84\x00\xf6$\
-L\xaa\x10\x00\xd7\x8d\x1f\x17\xa3\x18\x02\xb4\x19\x00p:\
-8s\xf7\xf5\xda\x01U\xac'\x96s+\xab\xc1\xa4\xba\
-\x91\xad]p#\x7f`Wv\x87\x1f\xf3Z\x9dF\x0f\
-\xe0,\xb0\xd7\xec\xf7\x1d\x90\xae\xed\x94\xd0\x94\x03\x80\x22\
-\xb5;1\x0b\x01\x9b\xc6\xef\xe8A#d\xe7(z\x00\
-mJ\x0e@\x03\x00(}&\xae\xaaj\xfc<\xf9Y\
-\xdd\xe8\x95\x9c\xfc\x98\xad.R,\x99\x84\xf6y\x0b`\
-\xd7[\xef\xc2\x1b\xdb^\xc7\xf1\x1f\xdf\xfa\xfc\xc5w}\
-\x03J7\x04\xc2)\xba*\x7f\xa8vYxQf5\
-'\xb6'\xe1\xcc\x99\x8d\xd0(?\x89\xd8M\xe3G9\
-\x04@\x89\xb3S\xc3\xaf\xe9;\x84\xdf\xd5\x8d\xb5&\x04\
-\xc0D(\x01on\x97\x9ef\xf5\xf8s\xaf\xff\xcb\xd5\
-\xb7=\xff;0\x1a;;\x8fIA\xac\x0d\xe8\xad\xf6\
-\xe7w\xa2)\x7f\xe5\xf4\x10h\x90!@\xe5\xd0\xf8E\
-\x93\x1dM\x00\xb0\xda\xfcL\xa6B\xe3\xdf^\xed2s\
-*\xbf\xab\x1b\xbdP\xa1 \xd2\xeaC3a\x0dC>\
-_\x80\xb1\x89<\x8c\x8e\xe5\xe9\xfe\xa8\x9do\x1fz\xf8\
-\x92\x7f}\xec\xa7`n\xf8\xf8\xc2\x8e>[Aj\xfb\
-?\xa54\xe5\x01\x80\x22?\xd0\xcb\xc8\xe4\xfb8\xdf\xa5\
-x\x02.\x19?\x8a\xe6\x00\xdaK\x02\xc0\xe2\xecT\x98\
-\xec{\xa9\xdae\xe5\x86\xaaQ\xddX\x8e\xd0\xa8\x0f\xf7\
-\x8f\xd0\xe78*\x06mW\x87\xfaF\xb6=\xfe\xdc\xce\
-\x9f\xdf\xf9\xf0\xcb\xaf\xc8\xabx\x86\x8fw\xfdWAj\
-\x044%uT\x00\x00\xc5v\x22\xea\xeaR\xc2\x01\xb9\
-\xd3P\x05\xc6\x0frS\xe0:#\x00\xd6\x80\xfd$ \
-\xb6\x0bG\xe3\x9fR\x19b;\xaafuc)\xbd\xbb\
-\xa7\x8f\xde\xd5Qd:|d`\x14\x13t\xbcD\xa3\
-x\xf0\xf0\xf0;\xe4\xce?\xf4\xf6\xfb}oo}u\
-w\xef\x96?\xbd\xbfO\xde\xc3\xac\xed?n\x7f\x1e\xa4\
-\xb1\xfb\xa7\xac\x8e\x1a\x00\xa0X\x08 \x00\xba\xe41\x05\
-\xac\x9e4$rw(n\xa4\xb5\x00\x18\x02\xb4K\xb5\
-\x00L\xc3\x905`z\x94FG\xad\xf1\xf3T\x0b\xd5\
-\x8d\xf5\xed\xed\x10Mg\xe1\xf9g\x7f\x0f#\xa3\x13\x07\
-/\xfe\x97\xc7.\x7f\x7f\xdf\x00\xfb\x90\x0d\xd1\xe6<o\
-\x1d\x0e\x07\x8d\xad6k:\x8fcWG\x15\x00Pz\
-\x08tvj\x07\x16\xb1e\xfc\xa2vW\x13\x00|\x98\
-\x7fV\x8d\xd0\xe816\x9c\x12=\xc3\xbc\x90\xdf\xd5\x8d\
-R\x06\x7f>\x1c9x\x04^\xfa\xed\x8b\xb0\xff\xd0\xd0\
-\x8e/}\xe7\xfe\x1f\xc8\x9b\x9d\x1a\xbb~\x1es8\xbf\
-\x01\x0f\x1anUKG\x1d\x00P\xe4G\x87w\x1e\x84\
-@N\x03\x812\x8c\x1fe\x03\x00\xbc\xb3\x1c\xf3\xc6\xcf\
-\x93\xd7\xd5\x8dx\xf7\xafokW\x01\xb0\xef\xe0\xd0\xeb\
-_\xfe\xee\xfd\x1b\xa0h\xc4N\xbd\x00\xe5\xae\x8f\xd7\xf2\
-\xd5j\x97\x9f\xdb:*\x01\x80b{\x12R\x08\xcc(\
-z\x02V\xc6\xcf\xeb-H\x01\xd0a\x00\x80\xd26\xdc\
-L/\x92\xd7\x91j\x97C-\xcb\x8b\xeaF=\x00\xf6\
-\x1e\x18|\xf3\xbc\x7f|\xe0j\x90\xc6\xdd\x9f\x94\xa7\xca\
-\xcb\x0e\x04z\xc9\x0b\xab\x00\x8fJ\x90\x1f\xb5\x00@\xb1\
-\x10\xc0\x86B\xb3g5CH\xedIh\xac\xfc\xe7w\
-\x15\x96\x1b\x02uHI@\x1d\x00\xb8G\x80t\xa7\xd8\
-S\xed\xef?\xd5\xe4Fu\xa3\x02\x80\x03{\x0f\xc0+\
-\x7fx\x19v\xef\x1b\xe8=\xff\xfb\x0fn\x04\xc9\xf8\xf5\
-\x00\xd0/+\x0f\xe7\xc0\xeb\x88\x03{l\x86)V\xaf\
-\xefTG5\x00Pz\x08\xcc\x22\x10\x08\xeb\xef$z\
-\xe3\xd7u\x18r\x00\x00\x14\x1a\xff\xeej\x7f\xef\xa3A\
-v\xaa\x1b\x95d\xa2\x12. \x00\xd2\x8d\xcd\xf0\xca\x96\
-\x97\xa9\x17\xf0\xfc\xcb\xef\xbd\xf0\x7f\xaez\x16\xabnX\
-\x00\xe8\xa7\xfayl\xd0\x83\xc7\xd4\xd4\x08\xbe^\xe8\xa8\
-\x07\x00\x8a\x1dS \x99@\x084i\xc6\x14(\xd5[\
-\x90V\x03\x1a\x01\xf0\x11\xceQh\xf8G]\x9cX\x0b\
-*U\xdd\xa8\x8c\xae\x1c\x89\xc5`tt\x1c\xf2\x13y\
-\x18\x1b\xcf\x8f_\xf0O\x8f|o\xcf\x81A\xac\x13\xc6\
-\x18\xd0\x0c\x00\xca\x14\x93{\x0f\x80\x04\x80cB\xc7\x04\
-\x00P\x9a1\x05\x14\x08\xc8c\x0a\x18m\x9ei@D\
-^\xf1L=d\x9a\xa7\xd1\x1f\xd5\xaf\x9e\xf8\x05LN\
-\x16\x06\xff\xdb\xd7\xeeX\xab{\x0b4\xfem\xd5\xfe\x9e\
-\xc7\x8aJ\x85\x0b \xb9\xef\x17\x11Poe\xd6\xcd#\
-\xaf\x04yM\x97\xa7\xd3\xa0x\xd7\xdfI^\xbf\x82\x1a\
-\x1e\xc1\xd7\x0b\x1d3\x00@\xe9\xbb\x13\xcf\xeai\x82D\
-B\xdf\x93Pk\xfc\xa8T\xae\x05\x92\xb9f9\xb1\xf4\
-\x02\xf4\x0f\x8e\xbd\xf4\xc5K\xef\xbe\x84\xd9\x05\xbb\x81\xbe\
-P\xed\xefw,K\xbe\xb6J\xadB/1\xfc\xdej\
-\x7f\xa6\xa9\xa0c\x0a\x00(S\x08\xf0\x8c_^L7\
-\xb5A\xa2\xae\x91\x07\x00\x14\xf6\x05\xdf\x02\xc7HC\x9f\
-@G\x97\x8e9\x00\xa04\x8f(G\x08t7\xd1g\
-\xf7)\xd2G\x02u\x1d]4\x11\xb8\xeb\xad]\xb4{\
-\xe8;\xef\x1f\xb9\xe7\x1b\xff\xf4\x08V-\x05\xc6\x1fh\
-J\xeb\x98\x04\x80\x22vL\x81Y\xdd\x8d\xd4\x13\xe0\x8d\
-.\xd68s\x1e\x08\xa1\x10l\x7f\xe9U\xd8\xb3k\x0f\
-\xbc\xbc}\xef\xd5\xff\xb8\xe1\xe9\x9f\x83\xd4\xef\xbb\xaa\x8f\
-w\x0e\x14\xa8\x12\x1d\xd3\x00@\xb1\x10\xe8h\xaf\x83\x5c\
-.\xa91\xfeH,\x01\xf5\xd3\xbb\xe9\xfc\x96\xe7\x9e\x87\
-\xc1\xfeAxx\xd3\xf6\x8b\xae\xfd\xd9\x96\xeb!0\xfe\
-@S\x5c\xc7<\x00P\x9aG\x94O\xcbI\x10\x90\x85\
-\xc9\xbfTC3\x1d\x17\xeew\xcf\xfcF\xa9\x01\xc0:\
-\xc1C\xd5\xfe\xdc\x81\x02U\xaa\x00\x00\xb2x\x10\x10B\
-ah\xe8\x9c\xadq\xff\x896\xae=\xff\xb6\xf5\xd5\xfe\
-\xbc\x81\x02\xb9\xa1\x00\x00\x8c\xb4c\x0a\xb4@\xe7\xfc\xb9\
-$\x04\x88S\xc3G\x00\xc8\xea\x09\xaa\x98\x02\x1d-\x0a\
-\x00\xa0\x13\x0b\x01\x8e\xd6\x13\xe3\xdfX\xed\xcf\x18(\x90\
-[\x0a\x00\xc0\x91\x0c\x01\x1cb\xac[^\xd5\x0bR\xab\
-\xb2\xfb\xaa\xfd\xd9\x02\x05rS\xff\x1f\xa5^ue\x17\
-F\x91\xb9\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00N>\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00 \x00IDATx\x9c\xed\
-\xbd{\x9c\x1eU}?\xfe>gf\x9e\xfb>\xd9M\
-\xf6\x92\xec&$\x1br\x01\x02\x92(!x\x01\x03\xa2\
-\xadZ.JA@\x90`\x15\xf1\xab\x22^j\xbf\xad\
-\xadD\xabVj[lik\x7f\xb6~\x91b\xa5%\
-(\xd6~{\xd1V\xa1_\x95\xaa\xdc/!$\x04\xb2\
-\x90\x10\x126\xc9nv\x9f\xdd}.3\xe7\xfc\xfex\
-\xe6\xccs\xe6\xf6\x5cg\x9fg7{\xdeyM\x9e\x99\
-3\xe7\x9c9;3\xef\xcf\xe7s>\xe7s\xce\x00\x0a\
-\x0a\x0a\x0a\x0a\x0a\x0a\x0b\x0f\xa4\x9d\x17\xbb\xee\xbe\xdd\xdb\
-8#o\x06\xb0\x95\x10\xb2\x0a\x00\x8a\xc5\x02\x8e\x8d\x1d\
-i\xb8\xae?\xbe\xf8L\xbcf\xb0;\xda\x06*\xccY\
-|\xfb\x91\x17\xf1\xed\x87F\x9a*\x9b\xc9d\x91Ne\
-\x1e\x070B\xc0\x9f\x00\xa5\x0f\xdc\xf9\xae\xb5\x0fD\xd9\
-\xbe\xf9\x0a}\xb6/p\xdd}\xfb\xba\x19+\xde\x0c\xe0\
-\xe3\xe0\xa4\x9b8\x22\x87;\xffs{_A!\x0c\xad\
-\xbc'\x1c\x1c\x84`#\x80\x8d\x00\xb9\x14\x9c\xdfr\xdd\
-\xf7\xf6\x80s|\x9f\x03\xffM\xa9\xf1\xad;\xdf5<\
-\x1ei\x83\xe7\x09\xe8lV~\xcd\xbd\xbb\xb71\xab\xb8\
-\x8f\x80\xdcB@\xba9\x07\xbc\x9b/\xa1\xdeMaa\
-\xa1\xd9\xf7\x84s \xfc\x15\xba\x94\x00\xb7qV\x1a{\
-\xdfw\xf7\xdcw\xcd\xbd\xcf^\xda\xe1\xbf\xb2\xed\x98\x15\
-\x0b\xe0\xba\xfb\xf6usV\xba\x0d\xc0\xb6z\xf2+:\
-+\xd4\x83\xa6\xdf\x93\xfa\x14\xc6\xa5\x94\xd0K\xaf\xbdw\
-\xcf\x08\x08\xbf\x93\xd2\xd8\xd7\x16\x82U\x10\xb9\x05p\xdd\
-}\xfb\xba\x99U\xb8\x1f\xe0\xdb\x84\xe1\x16\xb4-J\xea\
-8w]\x0f\xceX\xde\x05\xcey\xc3\x9b\xc2\xc2\x02G\
-\xe3\xef\x88\xd8NZ\x92\xc0\xb9\xebz\xb0rI\x02\xd5\
-\xdeI\x80\x83\x10\xbe\x8a\x00\xb70\xab\xb0\xef\xda\xef\xee\
-\xde~\xdd}\xfbNhGS\xe4\x02\x80\xb3\xe2\x1d\x84\
-\x90\x8d\x8d\x15j\xdc\xacS\x22`\x81\xa1\x85\xee\xa2\xd0\
-\x17\x8d\xbc3\x84\x90\xee\xb2 (>v\xcd\xbd\xbb\xb7\
-\xcd\xc2_4'\x10i\x17\xe0\xda\xef\xee\xde\xce\x81\xba\
-\xfaQ\x8e\xccmV\xa3Gd\x05\xdc\xf9\xd0>\xdc\xf5\
-\xcb\xe7#\xa9\xab\x1e\x5c\xbb\xe5d\x5c\xb7y\xb8m\xd7\
-;Q \xde\x95\xa6\xcb\xda;\x0d\xd7@\xb0\x8a\x00w\
-\x5c\xfb\xdd\xdd\xd7Q\xca\xae\xbf\xf3]\xa7\x8e4\xd5\x88\
-9\x8a\xc8,\x80\xeb\xee\xd9\xbd\x11\x1c\xb7\xd4\xb0\xb0\x02\
-7\xde\xc4\xbf\xc8\xc0\x9b\xb9z\xf3\xff\x94\x03\xb3I\xb4\
-\xf0\x9c\x84#\xb0\x5cO\xd3\xdbV\xcb$\x8f]\xfb\xdd\
-gon\xf3_>\xab\x88\xcc\x02`\x94\xdf\xd6XX\
-A\x85\x08\x9d\xee\xd3w\xfa\xfa\x0a\xf5\xa1\xd3\xcf\x89\x10\
-\xd2\x0d\x8e\xdb\xae\xdd\xf1\xec\x99T\x8f\x7f\xe2Dp\x12\
-Fb\x01\xbcw\xc7\xae\xad\x1c\xd8\xda\xa8\x06\x97M\xb3\
-\x86\xb7\x88P\xd6\x10M\xb6\xa1IkG\xa1q\xb4\xf2\
-\x9c\xb8\xed3\xe2h\xce\xda\xf4\xfd#\xd8fY\xf9\xfb\
-O\x04\x07aD]\x00r]\xa3%\xb8k\xbf\x09\xb3\
-.*4\xd9\x05i\xf6_\x94M_Ph\xe19\xcd\
-\x0e\xc8F\xd3,<v\xf5=\xbb\x1bsx\xcf1D\
-#\x008\xbf\x14MkE\xde\xdc\xf0N\x84\x0f\xb6\xd9\
-\xe1%5|\xd9^\xb4t\xdf\xedw\xad\xf9\xf7\xd4\xbf\
-\x11`\x15!\xfc\xbe\xeb\xee{l\xdeZ\x02-\x0b\x80\
-\xab\xefyz#!\xe8n\xf6.r\xb4\xf0@#@\
-\xb3\xd7ozS&@Sh\xe59\x89\x1a*\xbf\xd1\
-m\x04|\x95e&\xee\x9f\xafB \x02\x0b@\x9b\xd7\
-&P\xdb\xf9\xa8\xf8\xdf\x1cZ\xb8oB\x08\xcc\xe2\xad\
-\xdfX*\xc5\xef\x9b\xbd\xeag\x0f-\x0b\x00B\xb0\xaa\
-e9\xdaQS\xba\xbd\x16\x80\x92\x00\xcd\xa25\x0b\x80\
-\xdb\xffE\xab\xff+\x1b!d\xeb{\xefy\xe6\x8e6\
-\xdd\x8c\xc8\xd0\xba\x05\xc0\x98\xdd\xb7jp\x13D\xe0\x9d\
-\x15\x00\xcd\x0a\xa0\xe6\xbb\x00\x0a\xcd\xa0\xa5\xe7$\xd7\xd2\
-\xcc\xbbZ\xf7;\x8dm\xef\xfd\xa7\x9d\xdb;t\x8b\x9a\
-\xc2\xac\xce\x06\xac\x1f\x8d\xcb\xdc\xc8\xa8\xc4\x9a\xbb~\xd3\
-\x1b\x8b\xa6\xd9\x0b\x0e\xad<\xa7\x08\x15FM\x10r\xcb\
-\xd5\xf7\xec\xda\xd6\xbe\x0b\xb6\x869 \x00x\x93\xc26\
-\xb2\xab\xcf\xaaR\xf0m\xca\x06h\x0a-=\xa76\xb7\
-\x95\x80\xdf\xf1\xde\x1d\xbb\xb6\xb6\xf9\xb2M\xa1e\x01\xc0\
-\xd0\xa4\x5c\xe6\xf2~\x13]\x80(\x85\xc0l\x99\xfbA\
-\xedVh\x1aM\xdfs\xce\xdbi\xe3\x81\x03`\x8c\xdf\
-w\xf5=O\xcfy\x07yTq\x00M\xa8\xf0\xca~\
-G\x89\xc4\xdb,\x00\x94\x0ch\x0e\xad<'\xa0\x8d&\
-^y#\xe0\xdd\x9c\x91\xfb\xdfs\xf7\xaeU\x1d\xbes\
-U\xd1\xf1.\x00w\xfeot\x8b\xea\xfa\xed\xd5\x0d\xaa\
-\x0b\xd0\x1cZzN\x1d\xb2\xbc\x08A7%lN\x07\
-\x0a\xcd\xfa\x9a\x80\xf5\xa09\x8d\x1e\xa1\x10P\xa6\xf9\xbc\
-@\xb3\xcf\x89{~\xdb\x09B\xb0\xb1P\x88\xdd\x0f`\
-S\x07._\x13\x91X\x00-\xe9D\xde|\xd9H\xd0\
-\xe6\xfea\xa7\xb4\xd1\xbcG\x0b\xcfI\xd8\x0fh\xb2|\
-\xab\x1b!\xd8x\xe5?\xee\xbc#\xea[\x12\x05:\x17\
-\x07\xe0\x10\xa1\xb3>\x80\xb2\x10j\x9f\x0f@\xd1\xbf9\
-\xb4\xf4\x9c\x5c\x155\xf9\xae\xb6\xee\x13\xd8v\xd5\xddO\
-\xdf\xd6\xa1\xdb\x17\x8a\x8e\xfb\x00\x004yS#\xbbx\
-{_\x06%\x02\x9aD\xab\xf7}\x0e\x80\xe0\xe6\xab\xef\
-~z[\xa7\x9b!cN\x08\x00\xde\xc4\xbf\x08/\xde\
-\xd4\xf5\x9b\xfd\xa7\xf8\xdf$ZxNR\x15\x1d\x07'\
-\xb8\xe3\xaa\x7f\xdc9g\x96\x1fo\xd9\x09\xc8\xd0\xfa\xe7\
-\x85:\xe9\x04\x14\xa6e\xbb0\x17^\xc2\xf9\x88V\x9e\
-S\xa5X\xf4]\xb0E/\xef\x851\x93\x03\x01PL\
-fp|hM\x1d\xed\xe1w\x5c}\xcf\xd3#\xdf\xb9\
-\xe2\xf4\xc7#nN\xc3\x88h\x14\xa0\x89\xdbj\x9b\xc3\
-\xcd\x8e\x8dG\xea\x05h++\x95\x08h\x0e\xad<'\
-.\x95o\xfd\xfe\xf7>\xf78V\xfc\xf2\x87X\xf6\xe4\
-\xcf\x91\xb1\x8a\x88\x19\x86\xa3\x04'\xa9\x8e\x03\x1b^\x8f\
-g~\xfd}\x98^\xb24\xb0<!\xe8\xb6,\xdc\xff\
-\x9e\xbb\x1f\xdb\xf4OWm\x1ai\xb9A- \x1a\x01\
-\xd0\xec=\xb5\xcbut\x18\x8e\xb7\xf9\xfa\x8a\xff\xcd\xa1\
-\x95\xe7$+\x99\x16\xee\xbf1\x93\xc3\xc6o\xdf\x8a\xa1\
-g~\x81\x81\xc5\x8b\xb1dh)b\x86\xe1\xcbw\xca\
-\xab{p\xc6\x9f\xdd\x88_\xbe\xe9]x\xe6\xd7\xaf\x0b\
-\xac\x8b\x00\xdd\x1c\xda}\xd7\xdd\xf1\xd8\xf9w^\xbf\xa9\
-ck\x0bF\x22\x00\x9a5\xe0\x85@n\xca0\x8b\x88\
-H\xb6\x1d\x12Meu^O\xa1q\xb4\xf2\x9c\xb8g\
-k\x06\xc6L\x0e\xe7\xfc\xc5'\xb0|\xec\x15\xac9\xf9\
-dh\x9a\x16\x9a7\x11\x8fc\xe5\xd0\x10z\x9e\xfa\x09\
-\x96\xef\xfc\x05~y\xe5\xa70\x1e\xd85 \x1b\xf3\x09\
-\xed~t0F \x02\x01\xd0\xac\x17@<R\xdeY\
-\x0b\xa0\xed\xd7W\x22\xa094\xff\x9cx\x8b\x22\xc0\x98\
-\x99\xc4\x96?\xff$\x86\xa7\x8eb\xf5\xca\x95N\xfa\xf8\
-\xe4$&\xa7\xa71\x93\xcf;\x0cH&\x12X\xb2h\
-\x11\x92\x89\x04\xb2\x99\x0c\xb60\x86\xfeo\xdd\x82_\xbc\
-\xe9]x\xee\xcd\x97\x05U\xbf\xf1\x8a\xef<y\xc7=\
-W\xbf\xe6\xfa\xc6\xff\xb2\xd61\x07\x22\x01\x9b\x1d\xa6\x89\
-\xd2\x04P]\x809\x8fV\x9eS\x8b\xe6\xff\x19w\xdd\
-\x8a\xa5G\x0e`\xf5\xc9'\x03(\x13\xff\xa5C\x87P\
-,\x95\x00\x00\x84\x10G\x00\xe4\xa6\xa7q\xe4\xd81d\
-\xd2i\x9c\xb4l\x19b\x86\x815\x8b\xbb\xd1\xfd\xf3\xef\
-a\xc5\xce_\xe0\xa7\xd7\x7f\x0e\xa5d\x97\xab~B\xb0\
-\xed\x8a\xef<\x89N\x08\x81\x08\x02\x81\xe0\xb7\xb1\x1a\xdc\
-\x9a)\x16\x15\xc4@Q\xfb6%\x01\x9aA+\xcf\xc9\
-\xe7\x03h`\xeb\x7f\xe2g\x18\xdc\xf9\x0b\xac;\xe9$\
-\x00\xc0\x8b\x87\x0ea\xcf\xfe\xfd\xc8\x97J\x95*\xa5`\
-#Qtrj\x0a\xbb\xf7\xed\xc3\xf1\xc9I\x00@o\
-O\x0f\xde`N\xe0\xf2\xaf~\x08\x83O\xfe\xdcw\x1d\
-\x02l{\xcf\xb7\x9f\xd8\x16\xe9M\xab\x03\x1d\x8b\x03p\
-\xdd\xb0V\xa3\xbbZmK3\xd7orSh\x1e\xad\
-G\x026v\xff\x13\xc7^\xc1\xe9\xdf\xfe\x0a\x86\xfa\xfa\
-\x107\x0c\x8c\x1c:\x84W\x8e\x1eu\xeatm\x9e4\
-\x000-\x0b\xfb\x0e\x1c\xc0\xbe\x03\x07`1\x06\xc30\
-\xb0\xbeo1.\xfd\xe7\xdb\xb1\xf9;\x7f\x0ccf\xd2\
-}AJ\xee\xb8\xbc\xcdB \xa2\xf5\x00\x9a\x0b\xcep\
-\x1eG\x07#\xbb\xb80-\xdb\xb4)\x19\xd0\x1cZy\
-N^\x0b\xac\xde\x7f\x1b\xee\xba\x15\xfd:\xc5\xe0\x92%\
-8:9Y&?*V\x85O\x10\x04\xa5\xa1\xdce\
-\xd8\xfd\xc2\x0b\xc8MO\x03\x00\x06z{q\xe1\xe8s\
-\xb8\xe8\xf6\x9b\xd1\xbb\xf7q\xd75\x09\xc5m\x97\x7f\xfb\
-\xb1\xb6\xad#\xd0\xf1H\xc0F\x1f\x8a#@\x22#R\
-3Wo\xfe_\x84\x0d_`h\xe1\x9e\xf3\xc6\xd7a\
-;\xe9\xfe{\xd1\xf7\xc2SX;4\x04\xd3\xb2\xb0\xf7\
-\xc0\x01\x1f\xb1\x834\x7f\x985P(\x95\xb0\xf7\xc5\x17\
-\xf1\xf2\xe1\xc3\x00\xca#\x05\xa7g\xe2\xb8\xec;_\xc6\
-\xc6\xfb\xbe._\xba\x9bPz\x7f\xbb\x84@D\x0b\x82\
-4\xb9\xd9\x85\x9b3\x00\xa2\xb5\x02\xda\xb5)4\x8f\x96\
-\xefy\x9d\xefe\xd7\x81\xe7\xb0\xee\xbb\x7f\x85\xb5CC\
-\xd05\x0d{^~\x19%\xc6\xc2_\xe30!\x10\x90\
-\xfe\xea\xb1c\xd8\xbdo\x1ff\x0a\x05h\x94b\xb0\xbf\
-\x1f\xbf\xb6\xefa\xfc\xfa\x9f}\x04\xdd/\xef\x15\x19\xbb\
-\x09\xa1w\x5cr\xc7\xec\xaf#\x10\x81\x00h\xd1\x0b\xd8\
-a&\xf1v\xb2\xdf~)\x14\x1aG+\xcf)\x80\x9e\
-U\xb7S\xef\xba\x15\x83K\x96\xa07\x9b\xc5\xa1\xb11\
-\x1c\x9d\x9c\xac]*\x84\xf0A\xd6\xc0t>\x8f\xdd/\
-\xbc\x80CG\x8e\x00\x00\xd2\xa9\x14\xb6$\x80\xcb\xfe\xe6\
-3X\xfb\xff\xbe+ro\x8c\xc7\xc8\xfd\xb3|[\xe7\
-\xc0z\x00@U\xf3\xad\x9a1\x1d\x15\xda\xdb\x05Ph\
-\x16M\xdfu^\xff\xbb\xb8\xe6\xde\xbf\xc4\x92\xc3/b\
-U\x7f?\xf2\xc5\x22\x9e\x7f\xe5\x95pr\x07l\x8dX\
-\x03\xaf\x8c\x8eb\xefK/\xa1X*A\xa3\x14+\x87\
-\x86p\xc9C\xff\x17\x17|\xfdw\x90:v\x08\x1c\xd8\
-x\xf9?<~\xc7l\xde\xd3\x8e\xfb\x00\x00\xe9\x065\
-\xb0Ew\xf1\xe6\xae\xdf\xf4(\x80\x92\x01\xcd\xa1\x85\xe7\
-T\xefM\xef~\xee1\x0c=\xf0]\x9c\xbab\x05t\
-M\xc3\xae\x03\x07\xdc\xa6\xbf\xfd\xde\xd5k\x0d\xf8\xf2\x06\
-X\x03b\xb8\xf0\xe8\xf1\xe3\x00\x80l&\x837Z\x13\
-x\xd7_\x7f\x1aCO\xfd\x1c\x00\xb6]\xf1\x0f\x8f\xcd\
-\xda\xec\xc1\xce\x0b\x80&\x1flt\x97o\x1f\xf9\xb9c\
-\x8e*4\x8aV\x9eS=\xb7\x5c\x9f\x9e\xc4\xfa\xbf\xbf\
-\x15\xc3\xfd\xfd\xe8N\xa7\xf1\xc2\xe1\xc3\x18\x9f\x9ar\x91\
-\xd5\xab\xcd\x9d\xb4\xb0}\x89\xf0r\x9a7\xafiY\xd8\
-\x7f\xf0\xa0o\xb8\xf07\xff\xf5o\xf0\xc6\xff\xb3\x1d\xfa\
-Tn\xd6\xfc\x01\xadG\x026\x19\x09,\x1e\x8c|S\
-\x1a\xac\xa0\xf12\xd5\xda\xa20\xe7\xd1\xecs\xe2\xce\x8b\
-\x86Pa\xb0\xfa\xde\xbfD\xef\xf48V\xaf[\x87\xdc\
-\xcc\x0c\xf6\xbd\xfaj\xf9\xb5\x16\xd7$\x95\x97\x9c\x88\xb6\
-\x90\xda/>\x11\xc2B\xce\x1bP'P\x1e.\xcc\xed\
-\xdd\x8b\xe1\xe5\xcb\x91I\xa5\xd0\xdb\xd3\x83\xad\xb9Wp\
-\xd2\x9f\xde\xd0\xfd\x8b\x0b\xaf\xb9\x0d@\xe4\x91\x82\x11\xad\
-\x07\xd0\xec\x83QPh\x0fd\x7f\x93\x17K\x9e\xf8)\
-\x86\x1e\xfe/lX\xbd\x1a\xa6e\xe1\xe9\xfd\xfb\xfd\xb9\
-\x82\x08\xcf9\x08\xa9\xf3\xed\x0f)\xef\x15,\xa6ea\
-\xef\x8b/\xa2o\xf1b,\xed\xebC\x22\x1e\xc7i\x03\
-}\xe8\xfe\xf1]\xdb6\xf7\xf5\x8d\xeb\xc5\xe2\xe7\xdfu\
-\xfcxd\xb3\x07;\xdf\x05PP\xe8\x10\xb2:C*\
-?\x81\xb5w}\x05\xab\xfb\xfb\xd1\x95Lb\xef\xe1\xc3\
-\x98\xcc\xe7\x03\xcd\xfc@g^PZ\xc8\x86\xa0|!\
-\xe5\xe5\xe1B\x00\x18\xec\xef\xc7\xea\x95+o\xa6]]\
-\xf7\xdf\xd3\xd7\x17Y\x8c@g\xe3\x00\xea\xf7\xcf((\
-4\x8f\x80w.N8\xde\xb1d\x1a\xdb\x06\xa70\xbc\
-e3V\xf5\xf5\xe1h.\x87\x17\x8f\x1c\xa9M\xee\x90\
-\xb4\x90K\xd5'0\x02\x1c\x84\x85b\xd17\x5c\xb8f\
-\xd5\xaa\x8d\x8b\xbb\xbb\x1f\xdb\xd1\xd7\xb7=\x8a[\xd3\xb1\
-8\x00\xff\x9f\xab\xa00;\x08\xa2\xe6\xd9\xd9\x02z\x0d\
-\x0b4\x95B\xdf\xa7>\x85\xa9w\xbe\x13\xbbj\xc4\xf9\
-# \xad\x1d\xd6\xc0+\xa3\xa3\xd8\xbdo\x9f3\x5c\xb8\
-|\xd92\xac\x5c\xb1\xe2\x96\xef-]\xfa\xd8}\x03\x03\
-\xabZ\xb97\x1d\x8b\x03\x80g_Aa6!\xbf{\
-\x83q\x0bgv\x15\x5c\xe7\xa7\xdf\xf0\x06\xac\xbe\xed6\
-t\x9dqF\xfd\xe4\xae\xa2\xcd\xbd\xd7l\xd5\x1a\x98\xce\
-\xe7\xb1{\xdf>\xbcz\xec\x18\x80\xf2p\xe1\xfa5k\
-6&R\xa9\xc7\xee\xe9\xef\xbf\xb9\xd9\xfb\xa2|\x00\x0a\
-\x0b\x0aq\xcaq\xe1\xe2\x19W\x9a l|`\x00\x1b\
-\xfe\xe4O\xb0\xfc\x9akj\x92\x13\x01ia\xe4\x86\xf7\
-\x9cg\x93\xad\x01\x04\x94\x17\x9biY8x\xf80\xf6\
-\xbe\xf4\x12,\xc6\xa0Q\x8a\xe1\x15+\xba\x07\x07\x06n\
-\xfb\xde\xe0\xe0}\xf7-Z\xd4\xf0PaD\xeb\x01\xf0\
-\xe66\x05\x85\xb6\x82\xe3m\xbdEd\xf5\xe0\xc9A\x82\
-t+\xde\xf7>\x9c\xf9\xf5\xaf#\xb5zu\xb06\x0f\
-\xd0\xd0A\xc1?\x08\xcb\x1b\xb4\x1f@x\xb9\xbc\x9cw\
-rj\x0a\xcf\xec\xdd\xebZk`\xed\xca\x95\x97\x1a\xd9\
-\xec\xbe{\xfb\xfb\x1b\x0a\x1a\xea\xdc\xe7\xc1\xe1\xfeC\x15\
-\x14f\x13\x1c\xc0\xc9)\x86\xb5\x19\x06]\xd7A\xa4\xe1\
-7op\x19\xe7\x1c\x995k\xf0\x9a?\xfb3\x0c\xbe\
-\xfb\xdd\xc1\xda\xdcVb\xb5\xcc\xf7\x86\xba\x04U\xca{\
-\xf9\x22\xd6\x1ax\xe9\x95W\x9c\xe0\xa15\xc3\xc3\xdd}\
-\xbd\xbd\xf7\xed\xe8\xeb\xbb\xad^k`\x0e,\x09\xd6Y\
-\x9c=<\x00\x5c\xd0\xbe5\x19\xcf\x1e\x1eh\xdb\xb5\x14\
-*\x88s\x13\x1b\xf4r\xb8\xad\xa6i\xd0u\x1d\xa6i\
-\xc24MW>\xc6\x98\xb3\xe0\xa7\x96\xc9\xe0\xe4\x8f~\
-\x14\xbd\xe7\x9e\x8b\xdd_\xf9\x0a\x0a\x87\x0f\x87\x8e\xe5\x13\
-H\xca,(\xd0'$\xf8'\x08\x84s\xf0\xa0\xeb\x04\
-\x94?:>\x8e\xdc\xf44NZ\xb6\x0c\x99T\x0a\x03\
-\xbd\xbdX\xd4\xd5u\xf3\x8b\x07\x0e\x5c\xba#\x91\xb8\xfe\
-\xf2\xc3\x87\x1f\xa8v\xad\x05/\x006\x0f/\xc5\xe6\xe1\
-\xe0\xf5\xdb\x15N\x14p\x0c[G\xa1\xc1\x02`\xaf\xe1\
-G\x08b\xb1\x18\x0c\xc3@\xa1Pp\xb4\xbc\xb0\x0c\xe4\
-\xfd\x9eM\x9b\xb0\xf9\x9b\xdf\xc4\xb3_\xf9\x0a\x8e\xfc\xec\
-g\xc1B\xa0\x5c\xb1?\xbd\xd9\xe0\xa1:\xeb$(\x0f\
-\x17\xee}\xf1E,\xed\xeb\xc3\xd2\xde^$\xe2q\xac\
-\x19\x1e^u\xf8\xc8\x91\xfbw0\xf6\xf9\xcbGG\xb7\
-\x87]\xa6\xf3\xd3\x81U'@a\x96\x91\xe4E\xa4\xac\
-\x22\x00\x80\xd2\xf2+/\x84\x80\xa6iH\xa5R\x88\xc5\
-b\x00\x82\xbb\x03\x9cs\xe8]]x\xcd\x1f\xfd\x11\xce\
-\xf8\xf2\x97\xa1\xa7Rsz\xb8P^k@\x0c\x17\x86\
-\x05\x0fu,\x10\x88\xb7\xc8\xff]\xaf\x1ck\xb5\xd5\x0a\
-\xf3\x08/\x8fM\xd6\xce\x14\x82\x19\x12\xc3\x8a\xc43H\
-kS\x0e\xf1\x05\x08!\xa0\x94\x22\x91H \x95J\xb9\
-,\x80 A\xd0\x7f\xdey8\xe7\xce;\xd1\xb3i\xd3\
-\xdc\x1d.|\xe1\x05\xd7p\xe1\xda\xe1\xe1\x8d\xa9D\xe2\
-\xfe\xa0\xe1\xc2\x8e\xc6\x01\xb4\x82\x87\xf6\x1d\x8a\xa0\x16\x85\
-\xf9\x82V\x9e\xf7\xafe\x9e\xc2 =\x88S\xe3\xbf\xc2\
-2\xfdyG\x08\x08\xb2\x8b}]\xd7\x91\xc9d\xa0\xeb\
-\xee\x9e\xb1W\x10$\x96-\xc3\xe6\xbf\xfek\xac\xbf\xf9\
-\xe6H\x87\x0b\xa3\xb4\x06\xc4pa\xb1T\x82a\x18X\
->8\xd8\xadk\xdam;\xfa\xfb\xef\x90\xff\xb6\x88\xe2\
-\x00\x9a\x11\x01\xad\x89\x81\x1f\xefz\x09\x93\xf9bKu\
-(\xcc\x0f<\xfb\xca1\xbc<\x9ek\xaa\xecY}\x05\
-\x5c\xbeJ\xcc\x9d\xe1\x18\xa0\xcfa-}\x00I2\x1e\
-(\x04(\xa5H&\x93H$\x12\xe5\x12\x1e\xf2\xcbX\
-u\xe5\x95x\xd3]w\xa1k\xed\xda\xba5t\xbd\xd6\
-\x00\xbc\xe7\xe5:\xab\x0c7\xca\xe9\xf2\xd2\xe4\x89x\x1c\
-Kzz\x00`\x9bl\x09\xcc\xeb@\xa0\xbf\x7fpW\
-\xa7\x9b\xa0\xd0\x06\xfc\xfd\x83\xcf4U\xae\xcb`\xf8\xc2\
-Yc\xce1\xe7\x0c\xe0&\x12\xfc\x18V\xf1\xfb\xb1\x98\
-\xef\x0a\x14\x02\xc2A\x98\xc9d\xa0iZhw\x00\x00\
-\xb2\xeb\xd7\xe3\xdc\xef|\x07k?\xf8A\xc8c\xf9@\
-u\x0d\x1d\x16\xfc\x03\xf8I\x8f\xa0\xfd\x06\x87\x0bs\xd3\
-\xd3\xe8]\xbcX\x9c\xbbE\x0c\x13\xb6\x1e\x07\xc0\xd0\x5c\
-\x1c\x90\xd4\xc8f\xf1\xf7\x0f\xeelZ3(\xcc\x0f<\
-\xb4\xef\x10\xbe\xff\xd8\xde\xa6\xca~\xfe\xac1\x0c\xa6\xcb\
-\x9e\x7fp\x0b\xe0&8\xb7\xc0a\x81\xb2i\xf4\x9b\xbf\
-\xc0\xf2\xe2\xbf@C1P\x08PJ\x91N\xa7]\xd6\
-@\x98 X\x7f\xe3\x8dx\xc37\xbe\x81\xe4\xb2eu\
-\x07\xf4D2\xbb\xb0\xce\xf2/\x1c8\x00p\x8e\xae\xae\
-.\x00\xe8.\xc6b7\x03\xf3\xdc\x02\x98\xcc\x17\xf1\xb1\
-\x7f\xf8\x89\xea\x0a\x9c\xa0\x98\xcc\x17\xf1\xd1\x7f\xf8IS\
-e\xcf\x1f\xcc\xe3\x82\xa1|\xf9\x80\xb32\xf1\xb9\xe5\x16\
-\x04\xdcB\xd2|\x09'\xe5\xbe\x89\xb4\xf9\x5c\xa0\x10 \
-\x84 \x1e\x8f;\xd6\x00\x10.\x08\x96\x9cu\x16\xce\xbf\
-\xe7\x1e\xac\xb8\xe8\xa2\xc6\xfa\xfbm\x08\x1e\xb2,\x0b\xaf\
-\x8e\x8d!\x11\x8f\x0bAt\x1d0\xcf\x05\x00P\xee\x1f\
-^\xf7\xcd\xffPB\xe0\x04\xc3d\xbe\xd8\xf4s\x1dL\
-Y\xf8\xc2fa\xfasp\x08\xf2\x9b\xe06\xf9\xc1-\
-\x80\x95\xf7\x09\x9bF\xdf\xe4\x0e,\x99\xfa>4\x94'\
-\x09y\x85\x80\xa6i\xc8d2\xcep\xa1\x80W\x10\xe8\
-\x99\x0c^\xf7\xc5/\xe2\x9c\xaf}\x0dF:=\xa7\x1c\
-\x84bd\x80\x97\x03\x8dV\x01'H\x1c\x80\x10\x02\xcf\
-\xaa\xa1\xc1\x13\x02\x0f\xed;\x84\x0b\xff\xe4\xde\xa6\x9f\xe7\
-\xe7\xcf\x1aC\x97a\x7f\xb3\xca&\xbe\xac\xf5\xc1Mp\
-f\xfa,\x82\xe4\xf4#\xe8;r\x1b\xe2\xc5J\x97\xc3\
-+\x08\x92\xc9$2\x99L9\x98\xa7\x8a\x83p\xd9\x05\
-\x17\xe0\xed\xff\xf9\x9f\xe8=\xeb\xac93\x5chZ\x16\
-\xa6\xf3y\xa7\xbdw/Y\xb25\xfc#\xe7u\xe2\x94\
-K?\xb8\x95\x10\xb2\xb5\xd1rqC\xc3\xd2\x9e\x14&\
-\xa7\xf3\xd8\xb3\xff\x95V\x9b\x81#\xb9\x19\xfc\xd3C\xbb\
-\xf1\xf2X\x0e\xa7\x0c.F6\x11\xab]HaN\xe1\
-\xd9W\x8e\xe1\xcf~\xf4\x08\xbe\xf2o\xbfB\xd1\xb4\x9a\
-\xaa\xe3\xbdkr\xb8\xfc\xe4)\x00p\x9c~\x9cy\xcc\
-\x7f+\xc8\x22(\x0b\x09\xc2rH\xe4\x1e\x04\xe5S0\
-Sg8\xbe\x00\xaf5\x10\x8f\xc7\x01\x94M\xeb\xd0a\
-\xc5D\x02\xc3\xefz\x17\x8cl\x16\xc7\x9ex\x02V\xa1\
-\x10\x1c\x0a,}]XN\x0bD=\xa1\xc4U\xf2\x15\
-\x8a\x15\x8b\x8ap~g$\xa1\xc0\xbcI%\xdel\xb9\
-j\xf8\xfec{\xf1\xfd\xc7\xf6\xe2\x94e\x8b\xb1y\xd5\
-2d\x93J\x10\xccu\xbc<6\x89\x87\xf6\x1dj\xd9\
-\xa1\xbb\xbe\xbb\x84\x1b7\xd8\x01C\x1e\xa7\x9f\xcf\xfc\xf7\
-Z\x04\xf6>\xe7&\xc0-$\xc6\x7f\x04}\xeai\xcc\
-,\xbd\x01,1\xec\xb3\x04\x08!H\xa5R\xb0,\x0b\
-333\x8e\xf6\xf5\x06\x12\x11B\xb0\xfe\xba\xeb\xb0\xe2\
-\xado\xc5\xcf>\xf2\x11\x8c?\xfbl\xdd!\xc3\x00Z\
-\x0e%\xf6\xe5\x95\xaeEt}$\xa2\xb9\x00\xcd2y\
-\x16$\x80\x8dg_9\xa6\xba\x04\x0b\x0c_x\x9dm\
-\xfa\xbb\x9c~\xa6\xd3\xd7\xe7N\xbf\xdf\xad\xf5]ym\
-!\xc0\xb9\x09\xad\xf0\x02\xd2#\x9fFa\xe0:\x98K\
-.\x0d\x14\x02\x86a\xc00\x0cLOO\x83\xb1\xf24\
-\xe3 A\x90\x1e\x1a\xc2\xdb\x7f\xf0\x03<u\xfb\xedx\
-\xfa\xf6\xdb\xcbo~\xc8d!ybQ\xad\x89A\xae\
-\xbc\x08`\x94Lxq\xden\xdfU\x87\x0f\x8ft\xce\
-\x09(\xfe\x88\xd9\x93\x01\x0a\x0b\x087\x9e6\x89\xf5=\
-%\xf8\x9d~\xc2\x02\xb0\xdc\x82\xc0\xa7\xf5M\xc8\x16\x80\
-#\x08\x98\x89\xd8\xc1\xff\x0f\xf1\x17>\x0dR<\x1c(\
-\x04(\xa5\xc8f\xb3H&\x93\xae6y\xfd\x02\x9cs\
-\xbc\xe6\xa6\x9b\xf0\x8e\x1f\xfc\x00\xe9\xa1!_\xdf^\xe4\
-\x09\xeb\xdb\xd7\x95W>\x8f\x0a\xe1\x03\xfc\x0d\xdf\x07\x22\
-[\x10\xa4\x89\x0d\xd2\xaf\x82B\x0b8\xab\xaf\x80\x1bO\
-\x9b\x80\xe3\xf4c\xd5\x9c~aZ\xbfB\xfe A@\
-sO\x22\xb6\xfb\x03\xa0G\xff-P\x08\x00p\x1c\x84\
-\x94\xd2\xc0aB\x81\x9e\xd3N\xc3o\xfc\xeb\xbfb\xfd\
-\xb6m\xe1N\xbfY\x1e.d\x9c\xdf\x09\xa8\x05A\x14\
-\xe69\xe4h?\xc7\xe9\xe7\x22\xb7\xd7\xe9g\x05\x08\x02\
-\xd3g\xfe\xbb\xf6m\x17\x1d7'A\xf7}\x11d\xcf\
-\xa7A\xac\x5c\xa0\x10\xa0\x94\x22\x95J\xc10\x0c\x1f\xf1\
-\xe5\xe3X6\x8b\xcd\x7f\xf0\x07\xb8\xf0\xdb\xdf\x86\x91\xc9\
-46\x5c\xd8z\xf0\xd0\xe3\xef;z4\x22\x0b\xa0%\
-\x13@A\xa15|\xfa\xcc\xe3\xe5h\xbf@\xa7_\x10\
-\xd9\x83\x9d~\xce>\x93\xcc\x7fn\x01\xe0 \x84\xc2\xd6\
-\x9b\xe5\xed\xd8O\xc0\x1e\xf95\xe0\xf8\xaf\x5c\x02\xc0\xd1\
-\xc6\x9cC\xd7uW\xcc@\x98 \x188\xe7\x1c\x5cr\
-\xff\xfd\x18z\xcb[\xaa\x9a\xffQZ\x03\x8cR\xe7\x0b\
-C\xf3>\x10Ha\xe1\xe2\xfc\xc1<.Y5\x8d\xda\
-N\xbf\x06\xb4>\xdc\xe6?!\x0688\xc0\x99\xd0\x9e\
-\x008`\x1e\x87\xf9\xe4\xb5\xb0\x9e\xffC\xc0\x9a\xac\x10\
-U\xda\x00\x04v\x07\x04\x84\xd5`d\xb38\xf7\xaf\xff\
-\x1a\x9b\xbf\xfc\xe5v\x04\x0f}\xfe\xfa\xd1\xd1\xc7E\x1b\
-\xa2\x99\x0e\xcc\x9b\xdc\x00,\xcef\xa2h\x82\xc2\x02C\
-\x97\xc1\xech\xbf0\xa7\x9fY\xc3\xe9\x17\xdc\xd7\xe7\xac\
-\x22\x14@\xecA2\xce\xcaB\xc0\xb6\x008\xafL\x80\
-\xb1\xf6\x7f\x0b\xc5G\xaf\x04\x9b\xdc\xe9v\xd6y\xf6-\
-\xcb\xaa)\x08V\xbf\xfb\xddx\xeb}\xf7\xcd^\xf0\x10\
-\xe7\x0f\x5c\x7f\xf4\xe8v\xf9>vx:0G,\xa6\
-!f,\xf8\x95\xc9\x14\x1aD9\xda\xaf\xa2\xe5]&\
->\x93\x83\x7f\xc2\xb4\xbe,\x08L\x9f \x00(\x08\xd1\
-Q\xe9\xe2J\xb3\xde\xc0!\xcf\xe5\xe3\xb9](=|\
-\x11\xac\x17\xff<\xd4\x12`\x8c\xa1P(\xf8\x04\x81\x1c\
-<\x04\x00\xe9\xa1!l\xbd\xf3N\x9c\xf2\xe1\x0f\xd74\
-\xff\x11\x90VE8\x8cS\xcb\xf2}\x5ctNt\x01\
-V.\xed\xedt\x13\x14\xe6\x11\xde\xbb&\x87\x0b\x86\xf2\
->\xcd\xee\x90\x9d\xf9\xb5\xbe\x9f\xf8\xf6\xb1\x14\x12\x5cq\
-\xfa1P-\x0e\x80K\xda^\xb6\x02\xec.\x81\x07l\
-\xe4vX\x8f^\x0c\x9e?\x10(\x088\xe7\xc8\xe7\xf3\
-\xc8\xe7\xf3`\x8c9\x82\xc0\xbbB\x11\x00l\xf8\xc8G\
-\xf0\x96{\xeeAv\xdd\xba0m\xee\xf3\xa8\x05\x0d\x17\
-J\x82\xe0\xf3\xd7\x1f?>\xe2m\xf3\x9c\x10\x00kW\
-\x0cv\xba\x09\x0a\xf3\x04\x83)\xab\x1c\xed\xe7\x90\xd6;\
-\x8e\x1f\xac\xf5\xfd\xe6\xbf_\xeb\x0bA@h\xc2V\xf4\
-\xf6|\x02\xc9\x0a\xe0\x92\x15\x10\x88\xa9g\xc1\x1f\xbf\x04\
-x\xe5N\x9f\x15 \xf6\x8b\xc5\x22&''Q*\x95\
-\x02\xc9/~\x17\x9dr\x0a.\xd8\xb1\x03\xc3W_\xed\
-\xd2\xe6\x80d\xe6\xd7p\x10\xda\xd7\xfd\xfe\x0d\xc7\x8e}\
--\xa8\xb9\x1d\x13\x00\x933\x95\x98\xe4e\xbd\xddX\xb6\
-\xa4\xe1\x8f\x9a(,@\xdc\xf6\xfa\xa3\xe8\xd2\xabhv\
-\x9f\xd3/@\xebKd\xe7\x90\x05\x81\x09P\x03\x84\x18\
-\xf0vU9\xe7\x1e\x81P\x05f\x0ed\xe4V\xd0=\
-\x1f\x037'\x02-\x01\xcb\xb20>>\x8e\x5c\xae\x1c\
-\xfe\xec%\xbf\xbc\xff\x9a\xcf|&t\xad\x81\xaa]\x02\
-\xce\xc1\x80\xf1\x18c>\xd3_ \x82\x05A\xcaN\x91\
-F7\xd3\xb20S\xb0\x9cn\xd5\xb9\x1bOS\xbe\x00\
-\x85\xaa(G\xfb\x15%O\xbd\xd7\xe9\x17l\x11Tw\
-\xfaI\xfd~\x0eP-\x09\xb7\xb3\xcf\xde\xe4\xe1n\x1e\
-\xa2\xfd= c\xf7\xc3x\xe2\xd7@\xc6~\x1c\xda%\
-\xc8\xe5r8z\xf4(L\xd3\xacj\x0d,9\xeb,\
-\x9cw\xf7\xdd\xe8\x7f\xf3\x9b\xeb\xe9\xefW\x86\xfc,\xeb\
-\xfa\xeb\x8f\x1f\x1fG\x08Z\x9e\x0d\xb8\xee\xe2\xdf\xdaJ\
-\x08\xb66S6\x93\x88!\x934\x00\x001C\xc7\xf2\
-\xbe%x\xf6\xc5\x97[m\x92\xc2\x09\x88\xf5\xdd%\xdc\
-\xba\xe5(*N?\x8f\xd6g\xf5h\xfd \xf3\xbf2\
-7@\xd3\xb3\x00!\x15\xe2\x83\xd9\xda^\xcc/\x90\x85\
-A\x9d\xe0Ehc?\x04\xcc\x09X\xe93\xc0\xe1\x0e\
-\x10\x12\xd6\xc0\xccL\xf9{\x85\x86a8\xe9\xe2\xd7\x19\
-R\x8c\xc50\xf8\xb6\xb7!\xb3f\x0d\x8e\xfc\xcf\xff\x80\
-\x15\x8b\xb5f\x17~\xed#\xe3\xe3\x7f^\xady\x1d\xf5\
-\x01\xbc|\xd4=\xfbk\xf1\xa2\x0c.=\xefle\x09\
-(\xb8\xd0e0|\xe1uc\xe1\x8e=\x16\xe6\x07\x08\
-\xd0\xfa>\xa7_9\x0f\xd5\x92\x00\xd1\xdc\xc4\xe7\x12\xf1\
-!\x0b\x84\xc6\xa1\x8f\xde\x8d\xcc\x0b\xff\x0bF~W\xa0\
-%\xc0\x18\xc3\xc4\xc4\x04\x8e\x1e=\xeaL1\x16\xf0Z\
-\x03\xcb\xce?\x1fo\xbc\xeb\xae\xaaK\x933\xceG\x8a\
-\x8c}\xbeV\xbb\x22\xb1\x00\xd0\xa4\x05P4-\xa4\x13\
-1\xa4\xe2\x15\xc2'\x131\xac\x1e\x1c@nf\x06\xc7\
-s\xd3\xad6O\xe1\x04\xc0MgL\xe0\x82\xc1\xa9P\
-\xa7\x1f\xf7Z\x04\x92\x03\xb0\x96\xd6/\x07\xfb\x10hz\
-7 i\xfb\xb2\xd7_\x22\xbe4\x1a\xd0\x0c\x085\x10\
-\x8f\xf7\x22\x9e{\x10\x00C1\xbe>P\x10\x98\xa6\x89\
-\xe9\xe9i\xe8\xba\xeeZ\x82L\xfc\x8a}=\x93\xc1\xd0\
-;\xdf\x09-\x9d\xc6\xf1\xa7\x9e\xf2Y\x03\x94\xf3\xf3?\
-\x1e\xe0\xf5\xf7\x22\x02\x01p\xfdV\xa09\x01\x00\x00c\
-\xb9\x02\x06\xbbS\xa0\xb4\xd2\xf8\x98\xa1c\xf5\xe0\x00\xd6\
-._\x06\x00\xb0\x18\xc3LA-\xf9\xb5\x10qV_\
-\x01\xbf\xbf\xe9XU\xa7\x1f\xaai}\xe6q\xfaI\xfb\
-\xe0&8\x184\xa3\xa7\xcc\x1dQ\x0f\xa4M\xe4\x85\x05\
-G@4\x81Xj\x18\x84\xc6\x000\xc4\xf2\xbb\x10\x9f\
-~\x18\xc5\xd8j0\xba(\xd0\x1a\x98\x9e\x9eF\xa9T\
-B\x22\x91p\xc2\x8ceA ~\xbbO?\x1d\x8b\xcf\
->\x1b\xc7w\xeeD\xf1\xd8\xb1\xb2\x10\xe0\xfc\xf37\x1d\
-?\xfe\x8f\xf5\xb4\xab\xf6\xf2\x225\xf0\xce\xbf\xfd\xe9v\
-\x80\xdc\xd2J\x1d\x99D\x0cg\xae\xea\x85\xae\xcf\x89Q\
-I\x859\x828)\xe2\xfa\xd8\xf7\x10\xe33\xe0\xbcT\
-\xd1\xdc\xcc\x04x\xc96\xe7Mp&\x9d\xb3\xd3\xe5\xe3\
-\xf2\xc8@I*[9\xd6\xf4.\x10\x9a\x92,\x07\xb3\
-\xe2Wp\xac\x06\xd9bh\x5c\x00\xe8\xf1>\xe8\xf1e\
-\x10!\xcb\x80\x05\xce\x19\x18\x89c\xb2\xeb\x12L\xa6\x7f\
-\xcd'\x00\xc4>\xa5\x14\xdd\xdd\xdd\xce\xe4\x22q\x8e1\
-\xe6\xda\xe7\x9c\xe3\xf9\xbf\xfb;\x8c\xdcq\xc7\xe37O\
-L\xd4\xfd\xb5\xdb9\xc1\xb8\x5c\xbe\x88'F\x8e _\
-ln\x19(\x85\x13\x13o\xd3\x1fD\x0c3\x81\x8e=\
-\xce\xbc&~\xd0d\x1e\xff\xb0\x9fLfB\x0c\x10\xad\
-\x0b\xae\xfe}U\xf3\xbf>\xef\xbf\x0c\xaa%\xa1'\x86\
-\x00)zP\xcc'\xa0l\x0a\xd9\xf1\xbb\xd0;\xfa\x87\
-\xd0\xcc\xc3\x81]\x82R\xa9\x84\xc3\x87\x0fc|\xbc\xec\
-\xc8\xaf\xe6\x1b\x18~\xff\xfb\xf1\xc6\x1f\xfc\xa0\xb1\xf65\
-\xfc\x17\xcd\x12r\xf9\x22\x1e~\xfe\x10\x0e\x1cQ\xeb\xfc\
-+\x00\xa7j\xcfc\x98\x8eH\xe4\x0er\xfa\x05\x90\xdd\
-3\x99G^\x07@v\xfa\x813\xe8\xb1>\xb8B|\
-\xb9\xc7\x9d\x16\x12\xfa\xdb\x08\x8c\xe4\xca\xd0\xba\x85 \x88\
-\x17v\xa2\xff\xd5\xff\x8d\xc4\xf4\xaf\x5c\xe6\xbd\x1c-8\
-11\x81\xc3\x87\x0f\xa3T*\x01\x08\x8f\x1b0\xba\xbb\
-\x1fh\xa4}-\xbb\xdb\x19\x03\x08i\xfc\xc6\x04\xc14\
-9\xf6\xbe2\x86\x03Gs\xe8\xedJ`I6\x89\xee\
-L<\x92\xba\x15\xe6\x0f\xb2d\x0ao\xd6\x7fU\x87c\
-\xaf\x8a \xf09\xfd\xdcQ\x82Z\xac\x0f\x00\x817\xc4\
-W\x1e\xfb\xafX\x01\xcd9\xff\x8c\xc4r\x10-i\x0b\
-&\xbb\x0eG\x10\x88zmS\x9fO\xa1w\xec\xab\x98\
-\x8e\xbf\x16G\xba>\x0c\x86\xa4\xcf\x1a(\x14\x0a8t\
-\xe8\x10\xb2\xd9\xacoebB\x08\x18c\x8fs\xcek\
-z\xfee\xcc\xc9\xf1\xb6|\xb1\x84\x03GK8p\xb4\
-\xf9/\xc2*\xcc_\xfc\xe1\xba\xc7\x103f\x1c\xe2\xd7\
-6\xf1\x1bp\xfaq\x0bDK\x82jv\xbf\xdf\x15\xe2\
-+\x22\xfd<Z\xbaZ\xe8o\x08\xa8\x9e\x81\x1e\xef\x87\
-XS@l\x5c\xd4\xeb\x1d\xbc\xb3\xaf\x91\xca\xff\x0a\xcb\
-\x8a\xcfc\xb4\xeb\xc3\x98\xd2Os9\xff\x04&&&\
-P(\x14\xb0h\xd1\x22\xd7Z\x04\x9a\xa6]\x7f\xe6\x99\
-g\x86\x06\xfd\x04\xb6\xb3\xa1\xbfJAa\x96\xf1\x1b\xfd\
-\xfb\xb1\xa1\xeb\xa8\x87\xdcA\x91~!Z\x1fAC}\
-\xd2>\xa1\xd0c\xfdp\x08\xe9\x0b\xf1\xb5'\xfep\xa1\
-\xa5\x1b\x1f\xfb'DC,9\xec\xee\xf3\x87t/\xb8\
-G0\x80s\xe8\xd6a,\x1b\xfb\x1cz'\xbf\x19(\
-\x00\x00\xa0P(\xe0\xc8\x91#\xc8\xdb\xeb\xfc\x13B>\
-\x7f\xfa\xe9\xa7?\xee\xcbX\x03\x11X\x00\x0c\xbc\xf5\xc1\
-\x04\x05\x05\x0c\xa7rx\xffI\xbb\xfd\x91~u;\xfd\
-\xfc\x16\x80\xd7\xfc\xd7\x13\xcb\xcbCeLx\xf4\xbd\xd3\
-}\xa5cp\x9b\xaf\x8di\x7f\xc3\x1e\xf2\xf3i\x7f\xaf\
-\x10pM1\x96\xac\x0f\x9b\xf4\x8bf\xfe\x05\x89\xe2\x13\
-8\x9c\xb9\x09y}\xd8w\x1d\xc6\x18\x8e\x1f?\x8eC\
-f\x1cW^\xf8\xfa\xed\xcd\xdcse\x01(\xcc\x19\xdc\
-\xb4\xf2\x19\x1f\xf1k;\xfd\xc2\x02|\xbcN?\x13T\
-\xef\x06\xa5I\x9f\x09.kh\xb7\x15 \x0b\x88\xfa\xa0\
-\x19\xdd\xd0\x0c\x11T$\xb4\xba<\x8f\x809\x82\xc0\xd5\
-\x0d\xf0\x09\x87\xb2\xf0\x89\x99\xfb\xb0b\xec\xe3X2}\
-w\xe0\xf5\x0a\x0c\xf8\xfeK\xa5&\xefxT>\x80h\
-|\x80\x0a\x0b\x18\xef_\xf1\x1cV\xa5\x8e\xbbL\xfc\xea\
-\xd1|\xfe\xc9<aZ\x1f\xdc\x04\x88\x01=>\x001\
-\xdf\xdf\x1b\xdb_\x19\x02\xb4\x1d\x81\xb2i^'\x08\xd1\
-a\xa4V\xfbM\xfb \xed\x1f0\xc2\xe0\xee*H\x02\
-\x04\xc0\xe2\xa9\xbb\x91,>\x85\xc3]7\xa3\xa4\xf5;\
-\xd7\xfc\xf1\xab\x04\xc7\x9b\xe7\x7fTN@%\x01\x14\x9a\
-\xc7\xe9]\xe3\xb8h\xe0\xc5:\x9c~~\x0b \xf8\x9c\
-\xff;\x001i8.\x8c\x8cn\xab\xa0\xf1\xb1\xffX\
-z-\x08\xd1\xecvU\x1f\xfa\x93-\x02W\x97\x00\x95\
->?\xf7X\x1f\xc9\xd2\xd38i\xec&\x1c\xc9|\x10\
-\xc7\x13o\xc1s9\xe0\xa9\xe3p\xe5i\x14\xad\x0f\x03\
-\x22\x82pB\x85\x05\x8b\xb4f\xe2c\xc3\xcf\x04x\xf4\
-M\xa9?_\x85\xec\x08p\xf4\x89};&\xc0\x88/\
-\x05\xa1\xf1r\x9dR\x80\x8fw\xa2\x8f<\x0f\xc0m\xa2\
-\xd7\x86\x1e_\x0a\xaaw\xa12\xac\xe8v\xec\xb9\xa7\x13\
-\x8b\xeb\x8a<\xc1\xc3\x83A\xc2\x87\xf2id&\xfe\x16\
-\xffx\xec\x1c\xec\x9e\xca\xb4\xacz[\xb7\x00\x94\x04P\
-h\x01\x1f[\xf5\x0c\xfa\x8d\x9c\xa3\xa9\x1dA\x108\x9c\
-\x17\xec\xf4C\x15\xf3\x9fj)h\xb1^[ \x04k\
-b\x99\xa8\xb5\x96\xfd\x0a\x02\xd5R0\x92\xcb\xe1\x10\xd8\
-EfVq\xecy\x97\xd0\x0fh\x83\xdf?\xe0\xc7_\
-N\xfe>v\x97\xa2YLW9\x01\x15:\x86-\xdd\
-\xa38\xa7\xe7p\x9dN\xbf\xe0\x15|\x82\x9d~\xa2.\
-\xc0H\x9e\x84\xaaS{\x03C\x7fer\xd6F,\xbd\
-\x06e*I\x02\xa4\x91\xa1\xbf\x00\xe7_\xd8\xb5\xff3\
-\x7f1v\x97\xceh\xfe\xa6{\x10\xc90\xa02\x01\x14\
-\x1aEZ3q\xd3\xea\x9d\x1e'_\xe3N\xbfj\x8b\
-\x7f\x1a\xc9\x15\xe5u\xfd\x9d\x80\x1f\x8f\x03\xceC>\xff\
-h@m\x18\xc9\x15vP\x91\xe5\xd7\xe8A\xce?\xf8\
-\xaf-\xc7\x22\xb8\xad\x087\x8e\xb0>\xfc`\xfa*\xb4\
-\xd2\xe7\xf7\x22\x9a\xcf\x83GQ\x89\xc2\x82\xc2\xef\xaey\
-\x12)\x9a\x97\xc8]\xaf\xd3\xcf\xad\xf5!\xefKN?\
-M\xcfB3\x968\xfd\xfe\xea\x13}\xe4\x95~\xdc\xde\
-\xf7j\xa0Z\x0aFb\x05\x5c\xe3\xfd5\x9c\x7f\xdc\xe3\
-\x0b\xf0\x09 ;W\x10\xabn\x9f\xfc,\xa6x\xba\xc5\
-;\xef\xf9\x1b\x22\xadMA\xa1\x0e\x5c4\xb0\x1f\x1b\xba\
-\x8e\xa0\xb6\xd3\xcf\x0c]\xc1'\xf0S_b\x22\x10\xca\
-\xc18.\xad^u\xec\xdfC\xd4:\xcc\x7fBt\xc4\
-\xbbN\x83\x8b\xe4\xae`\x9ej\x8e\xbd\xb0\xa1\xbfp\xe7\
-\xdf?O_\x85\xfd\xe6\xeaH\xee\xbf\x8c\x88\xe2\x00\x94\
-\x0d\xa0P\x1f\x86S9\x5c5\xb8\xd7\xa7\xd9\x83\x9d~\
-\xfe)\xbc\xd5\x96\xfc\x16\x11\x84\xf1\xcc\xa9\x00h\xb9l\
-\x95u\xfd|\xe9\x0d\x84\xfe\x96\xbb\x171p\x84k\xff\
-Zq\xff~\xed\x1f\xec\xfc\xdbo\xae\xc2?O_\xe9\
-K\x8f\x02\xca\x02Ph+>>\xbc\x13)Zp\xf7\
-\xed\x99\xa4\xf5\xbd\x82\x00^A\x10\xb6\xfaO\xf9\x9c\x1e\
-\x1f(\x0f\xc7\x85h^/Y\xfd\xe3\xf2\xa8\xa9\xd0\xb4\
-\xd8bg\x8e\x7f]\x8e=_\x1eo\x08\xb07j\xb0\
-\x82i\x9e\xc2\xed\x93\x9f\x8d\xec\xfe{\xa1\xe2\x00\x14\xda\
-\x86+\x07_\xc0\xaa\xd4\xb8o\x0d?\xef\xb8\xbeK\xeb\
-7\xe0\xf4#Z\x02F\xf2$\xb8\xa7\xf6\x96IV\xf1\
-\xce\x07\x8c\xfd\xfb\xd2\xc3\x05\x00!:\xe2\xe9\xf5\xf0j\
-\xf0`\x87b\x80c\xaf\xca\xd0_e\xab\xe0\xfb\xd3W\
-a\xd4\xea\xc7lAY\x00\x0am\xc1pj\x12W\x0d\
-\xed\x85\xcb\xa3_\xd5\xe9W\x87\xf9\xcf\xdc]\x81xz\
-\x1d\x00\x8a\xea3\xfc<\x9a:(&\xa0\x0ab\x99u\
-\xf6\xea\xc1\x01\x8e=\x1f\xe9+a\xc5\xf5\x0c6\xa6\xfe\
-\x81\x00\x00 \x00IDAT\xfdy\xaf\xfdhq\x0b\
-\xfes\xe6\xe2\xe8\x1eB\x00T \x90\xc2\xac#\xad\x95\
-\xf0{'?\xee1\xd9\xad\x96\x9c~\xde\xd5\x7f\x8c\xe4\
-I\xa0Z\x1a\xae!?.\x13_\x12\x08\x22\xbd\xc1e\
-\xbf\x8c\xc4\x10t\xa3\xd7\xee\xf7\xcb\xa3\x05\xb2\x95Q=\
-\xee\xdf%\x18\x82\xf2\xd9\x98\xe6)|s\xe2\xa6j\xc6\
-H$Pq\x00\x0a\xb3\x8e+\x87^@\x7f|*b\
-\xa7_eE`\xa2\xa5`$W\xc17\xd1'h\xaa\
-\xaf/,\xb7B\xcej\xd1w\x84\xc6a\xa4V9\x02\
-\xc47\x93\xaf\xe1\xb8\x7f[h\x84\xc4\xfd\xff\xdd\xe4\xc7\
-1\xcd\xd3\xa1\xed\x89\x0a*\x0e@aV\xb1\xa5g\x14\
-\x17\x0f\x8cTq\xfa\x995\x04A\x98\xd3\xcfN\x07A\
-\xa2\xeb\x0c\x04\x91.,\xc4\xb7\x91/\xfe\x0a\xc43\xa7\
-\x82\x10\x0d\xce\x98\x7f\x98\xf3/\xc0\xb1\xe7\x8d\xfb\x0f\xb7\
-\x10\xca\xf8i\xfe|<Z\xd82\x0bO\xc3\x0f\xe5\x03\
-P\x985\xa45\x137\x0f?\xe5\x22\xac\xdf\xe9\x17\xac\
-\xf5\xbda\xbd\xdc\x16\x1c^AP^o?\x8e\xfaC\
-|C|\x03U\xc6\xfec\xa9U\xd0\x8cn\xf8\xc6\xec\
-\xc5ud\x8d\x0e\xb7`p\x9b\xf7\xc1\x16\x82ly\x1c\
-\xb1\xfapw\xee\x03\xb3\xf4D\xfcPq\x00\x0a\xb3\x86\
-\x8f\x0f?\x8d\x94Vp\xf7\xf5-/\xd9\x1b\xd7\xfaB\
-(\xe8\xb1\xder\xac\xbf\xe8\xf7\xd7\x11\xe2+\x9b\xe3>\
-\xdf@\x00\xa8\x9e\x81\x91\x1c\x06\xa4\xf1~\x9fc\xaf\x91\
-\xb8\xff\xc0~\xbfl\xfa\xdf\x84i\x96r\xa5\xcd&\x94\
-\x05\xa00+\xb8h\xe0%\x9c\xd3s\xc8Mv\x160\
-\xae\x1f\xb8l\xb7\xbf\xdf\xef\x9b\x08\x04\x82x\xd7\xe9\xe1\
-\xda\xde5\xb57 \xf4W6\xfd=\x0e8\x01Bt\
-\xc43\xe5h\xbf\xfa\x1c{\x9e<\xbenAH7\xc0\
-\xbe\xf6}S\xef\xc1\xb3\xc5\xd3g\xe9\x89\x04C\xc5\x01\
-(D\x8e\xfe\xf8\x0c\xae^\xbe\xd7\xad\xd9[\xec\xeb{\
-\x87\x0c\x13\xd9\xd7\x82\x10\x1d\xaei\xbe\xb26n(\xf4\
-7x\xec?\x96Z\x0d\xaagl\x81\x13\xe6\xd8\x0b\xb3\
-,\xbcq\xffA\xc2\x01N[^2W\xe1\xfbSW\
-\xce\xeas\x09\x82\xb2\x00\x14\x22\xc7\xcd\xc3O#E\xf3\
-\x15\xb2\xb30A`6%\x08\x8c\xc4\x10\xf4x?|\
-A<5>\xe9\x1d>-\xd8O~\xcd\xe8\x86\x9e\x5c\
-\xe1\xd1\xf4\x92c\xaf\x9aF\xf7X\x08\xb5\xba\x0a\xd3<\
-\x85\xbf\x9d\xb8i\xb6\x1fK \xd40\xa0B\xa4\xb8j\
-\xf0y\x9cnO\xf4\x09\xec\xeb#\x98\xec\xb5\x9d~\xe5\
-<\x84\xc6\x11\xcfl@(\xa1\xaai\xea@\xab\x00>\
-\xf3\x9f\x10\x1d\x89\xecF\x08\xd2\x07:\xf6\xc2\x86\xfe\x82\
-\xba\x00\xce1\xab\x5cW\x12\x0c\xf7\xe5\xde\x83\x97\xccU\
-\x08\xb2Bf\x1b*\x10H!2\x0c\xa7&q\xd5\xf2\
-\xbd\xeex~\xaf\xd3\x8f5\xa7\xf5\xcby\x19\x92\x8b6\
-\xd9\x91x\xd24__\xff>,\xc4\xb7\x92\xe6\x9b\xfe\
-+!\xdeu\xba\xdd\xbd\x90&\xfa\xd4\xeb\xd8s\x0d/\
-\x8a\xc0\xa3\xb0\x99\x81\x0c\xbb\x8a\x1b\xf0\xa3\xe9\x8bf\xfd\
-\xd9\x84A\xc5\x01(D\x82\xb4f\xe2\xe6\xd5O\xa1\xa6\
-\xd3\xaf\x96\xd6\xe7~\xad/\x04A,\xb3\x0e\x9a\xb1\xc4\
-\xdd\xef\xe7nK\xc0\x97\x1e@V\xb7\x15\xe0\xf6\xfe\x97\
-\xbf\xe4\xdb\x07\xc7\xd3\x1f\xe6\xd8\x935\xba\xe8\x06\x84\x04\
-\x18\xc9\xd7\x97\xb5\xff4O\xe2o'>\xd6Q\xfe\xa8\
-U\x81\x15\x22\xc1\xd5C{1\x9c\x1a\xf7\xf7\xf5Y\xf3\
-}}y\xde\x00\xd52\x88gNq,\x01\xaf\x16w\
-\x85\xf8\xd6\x15\x13 \xb4r\x05TK \xdeuF\x80\
-i\xefu\xec\xc9a\xc3~\xd2\xd7\x13\xf7\x0fp|\xe3\
-\xf8\xc7p\xc4\xeaC'\xf9\xa3\xbe\x0b\xa0\xd02\xce\xc8\
-\x8e\xe1\xe2\xa5\xfb\x82\x9d~!Z?(\xc4\xd7;7\
-\xc0\xd9\x07E\xb2\xfb,[\x83V\x08\xe72\xc1\xc3B\
-|\xab\xc4\x04xC\x7f\xe3]\xaf\xa9\x98\xfe\xd2\xca\xbd\
-\x8e\xb6\xf7j\xf4j\x16\x82\xdc\xce\x80\x00\xa2G\xf2g\
-\xe1\xd1\xfc\xd9\xb3\xfeljA\x8d\x02(\xb4\x84\xb4f\
-\xe2\xb3\xeb\x1e\x85\xdf\xe9g\xd6p\xfa\xd5\xd6\xfa\x82\x88\
-\xf1\xae\xd3@\xf5E\x10\xe4\x11&7\xb8\xa4\x91]\xfd\
-m9\xc4\xb7\xda\xb2_\x15\xf3\xdfH\xad\x84f\xf4\xb8\
-\x88+\xc8\xdcT\xdc?\xb8\xa7\xaeJ\xdc\xff\xa8\xd5\x8b\
-\xbf=\xfe\xd1\xd9~4uA\xc5\x01(\xb4\x84\x8f\xaf\
-~\x0ai{\x81\x0f\xb7\xd3\xaf\xb2JO\xb0\xd6\x0f3\
-\xff\xe5\xd9\x81\x0cZl1\xe2\xe9u\xb60\x09\x8e\xe1\
-w\xc6\xf2]du\x87\xf8\x86\xf9\x0c\x00\x80\xea]\xe5\
-\x80\x1fi\xbc\xdf\xef\xd8\xf3\x9a\xf6\xc1\x8e\xbd\xc0(A\
-\x8f\xb0\xf8\xc6\xf8G0\xc5\xa2]\xdb\xafY\xa8a@\
-\x85\xa6qN\xcf\xabx\xfd\xe2W*&?+/\xe8\
-\x11n\xfe\xfbW\xf0\xf1;\xfd\x84\x05`\x01\x84 \xd9\
-}N\x809\xef\x99\xd4#\x9b\xe9\xae\x98\x7f\xc91W\
-e\xd9\xafD\xf6L\x9f\xa0\xa8\x0c\xfd\xc9\xdd\x0a\xb7u\
-\xd0L\xdc\xff\x7fL\xbd\x1d\xbb\x8ab-\xc1\xceC\x0d\
-\x03*4\x85\xfe\xf8\x0c>1\xfc\xa4\xc7\xe9g\xf9\x9c\
-~\xbeu\xfbj:\xfd*e\xd3\x8b\xcf\xb5\x97\xdc\xae\
-|\xd1G\xb6\x02\x5c\xa4\xaf\xea\x98\xf3\x9a\xf5\xb0\xf3\x01\
-\xf1\xf4Z\xfb\x8b>V\x95\xf2\xad\xc4\xfdW\xeaz\xb1\
-x\x12\xbe7\xf9\x9bs\x85\xfb\x00\x94\x0f@\xa1I|\
-b\xf5SH\xe9\x05\xd4r\xfa\x05\xad\xdbW\xdd\xe9g\
-\x81sV\x8e\xf6s\xbe\xb6SG\x88\xaf4\xf6^\xb1\
-\x0e\x82f\xfeU|\x00Zl1b\xe9u\x952a\
-f{\x80Vo\xf4S\xdf\x00\xc77\xc6?\x8c\xe99\
-b\xfa\x0bD\x14\x070\x87D\x9a\xc2\xac\xe3\x92\xa5/\
-\xe2\x8c\xec\x912a\xad\xa0\xb0\xdeF\xb5\xbe\xdb\xe9G\
-\xb5\x04R=o\x00X\x03!\xbe2\xc1=\xf3\xef\xe5\
-\xbe\xb9H'\xc4\xa8D\xfb\xd5\xeb\xd8\xf3Z\x13\xae\xe1\
-\xc1*]\x00p|w\xe22\x8c\x94VbN\xa9\x7f\
-(\x0b@\xa1A\xacNM\xe2\x86\x95\xcf\xb8\xfa\xebu\
-\xf7\xf5\x99\xdf\xd1\xe7v\xfa\x95\xcb\xa5z\xde\x04B\x0d\
-\x04j\xe10\xf3\xdb5DW\xd1\xc6\xfe\xd1\x80rz\
-\xbck\x03(Mz\xcc\xf6\x10\xc7\x9e\xac\xd1\x83\xb4\x7f\
-\x80\xb3Q\xee*<S8\x05\xdf\x9b\xbc\xac\x8dO\xa9\
-~(\x01\xa0\xd0\x10>\xb1\xfa\xc9\x0a\xd9]N\xbf:\
-\xb4>\xc2\xb4\xbe\xe5\x94\x8bw\x9d\x0a=1\x80\xb0\x10\
-\xdf\xb0\xb5\xfc]!\xbe\x9c{\xd2\xdd\x04\xd5\xe3\x030\
-\x92+ \xb4\xb8\xcb\xb4\x87,8\xaa\x0b\x9ez>\xf5\
-=e%\xf1\x8d\xb1\x0f\xb5\xe9\xe94\x0e\x15\x08\xa4P\
-7\xae^\xbe\x17\xc3\xe9\xf1\xf2\xb4\x5c\x9f\xd3\xaf\x96\x87\
-\xbf\xb6\xd3O\x8b\xf5 \xd9\xb3\xa5\x5c\x86\xb5\x18\xe2+\
-\x99\xec\xf2\x90!!\x14\x89E\x9b\xe0\xf2\x19\x84-\xd0\
-Y\x87cO\x0e\x01\x0e\xb2\x22\xfe\xfe\xf85\x185\xfb\
-\xda\xfc\xa4\xeaG\x04q\x00\x0cD\x0d\x03\x9c\xf08#\
-;\x86\xab\x97\xef\x81w\xe5\xdeFV\xf0\xa9\xe6\xf4\x03\
-gH/>\xaf\xa2\xc5\x83\x16\xf6\xa8'\xc4\xd7\x97^\
-&\xa2\x10&\xc9\x9es@\x88\x0e\xc7\xeb_\xcd\xb4\x87\
-\x9b\xcc\xee\x99\x81\x01Q\x87\x1ea\xf1\xd0\xcck\xf1\xff\
-\xa6\xce\xc5\x5c\xd6\x90\xaa\x0b\xa0P\x13i\xcd\xc4'W\
-?Q&\xbbUgXo\xddN\xbf\xf2\x96\x5c\xf4Z\
-h\xb1\xc5\xf0i\xdb\x10m\x1f\xa6\xb1\xbd\xe9\xf2\x82\x1f\
-\xb1\xd4p\xf9\x83\xa1\xd5\xcc{)\x04\xd8\xb1\x1c\x1a\x19\
-\xfa\xb3\x8f\xa7Y\x12\x7fs\xec\x866>\xa5\xe6\xa0\x04\
-\x80BM\xdc\xb0r\x17\xfa\xe3\xb9:\x9d~\xf2\x0a>\
-\xf58\xfd\x18\xf4\xc42$\xba_[\xd1\xde\xac\x96V\
-\xaf\x91\xee\xb3\x188(M\x94?\xea\xe1\xea\xe3\xcbk\
-\xf9\xfbC\x80]\x82'\xd0B\x08\x10R\xb6\xc0\xf9\xfa\
-\xb1\x0f\xdak\xfb\xcdm\xa8@ \x85\xaa8g\xf1a\
-\x5c\xd8\xf7R\xc5\xe9WS\xebKd\x0fu\xfaU\x84\
-\x06\xa1\x06\xd2\xbd\xe7\xfb4j\x85LM\xa4K\xa4\x15\
->\x83T\xcff@\x98\xfeA\x9a_\xca\x1bj\x1dx\
-\xf2\x84E\x09\xfe\xdb\xe4\xdb\xf0\xf0\xf4k\xdb\xf9\x98\x9a\
-\x86\x8a\x03P\x08EZ\x17\xa6\xbf\xe4\xf4\xab\xa5\xf5e\
-\xb2\x07X\x00.\xeb\x01\x1c\xa9\x9e7\x82ji\x88\x05\
->B\x17\xf6\xa85\x1aPe\xd9\xafr\xb4_\xd6n\
-{\x9d\x1e\xfe*\x8e=o9\xd9B\x185\x97\xe0\xde\
-\xe3\x97\xcc\x1bN\xa8.\x80B(>\xb7\xee\x11\xa4\xf5\
-\xbck\xe5\xde\xe6\x03|d\xa7_9\xe0'\x96\x1aF\
-\xbc\xab\xfc\xa1M\xa7\x0f\xcd<}\xf8*$\xad\xd5/\
-\x078\xa8\xdeU1\xfd=\xe6\xbd\xab\x1bP\xa7c\xcf\
-%<\xe0o\xc3\x9f\x8c~t^\x98\xfe\x02J\x00(\
-\x04\xe2\x92\xa5#8#;\xeaq\xfaY\x01\x82 l\
-\x05\x9fj\x8b\x7f2\x10\x1aC\xba\xef\x02\xa9\xbf.\x13\
-P\x9a\xd0\xe3\x9b\xf9W\x19\xe7\xaf\x1a\x13\x00\x06B4\
-$\x17\xb9\xd7\x11h\xc5\xb1\x17\x9c\xa7R\xd7\xbd\xe3\x17\
-\xe3\xc5\xe2I\xed}P-\x22\x9aa@\xae\x9c\x00'\
-\x12\x06\xe23\xb8fhO\xa8\xd6\x0fw\xfa\x05y\xf8\
-\xdd\xde~\xb1\x04W\xa6\xf7B\x10\x12Cey/f\
-\x8f\xfd\xcb\x04\xaf\xf4\xaf\x83\xbf\xeaS%&\x80s\xc4\
-\xd3\xeb@\xb4\x84S\xce\xa7\xd1\xe1.\x1f\xa6\xd5\xeb\xf9\
-\xd4\xf7Hq9v\x8c_d\x1f\xcf\x1f(\x0b@\xc1\
-\x87\xcf\xad\x7f\x04)=\xef\xeb\xf7G\xe1\xf4\x038\x12\
-\xd9\x8d0\xd2\xc3p-\xcc\xe1\xebc\x0b\x92\xc91\xfc\
-\x954\xff\x17\x7f\xdd\xa3\x01z\xbc\x1fFj\x95OH\
-\xd4\xed\xd8\xf3\x91^\xce\xe3\x168S,\x81\xaf\xbe\xfa\
-\x91\xf6=\xa0\x08\xa1\x04\x80\x82\x0b\xef]\xfe\x1cV\xa7\
-\xc6\x22q\xfa\x05\x91\x9f\xea]H-\xdeR!\x9dK\
-\xab3\x97\xb9\xee^\xfdG\x0e\xf1\x95\xb5p@\x14\x1f\
-\xd1\x91\xe8z\x8d;\xad^\xc7\x9e|\xdd \x0b!@\
-\x80\xec\x18\xbb\x08\xa3\xe6\x926=\xa1h\xa1\x04\x80\x82\
-\x83\xb4f\xe1\x9dK\xa7\xc0@kh\xfd\xb0\x15|\x82\
-\xcd\x7f\xe1\xf4\x03\x80\xae\xa5\x17\x03\xc4\x80K{\x83W\
-B\x7f]\xdaU\xf8\x06\x82\xcc\xfc\x10\xdf\x00g\xe5\xaf\
-\x05\x13\xddW6\xcc\xa2\xa8kT\xc0%|*\xf5\xec\
-\xcc\xaf\xc5\xbfM\xbc\xa5m\xcf(jD\x14\x070\xbf\
-\xfa=\x0a\xc18\xbbg\x02\xc9X\x0cE\xac\x84\xce\x0e\
-\x82\xb0W%A`\xf9\x05\x01\xf3z\xf8\xc3\x9d~\x00\
-\x90\xea9\x07z\xac\xb7\xd2\xefw\x99\xf9A\xc1=<\
-$=\xc0Yh\x13Z|5HX\x1cna\x11\xdc\
-\xc7\x0fu\xfe\xf1\xca\xf5+\x82\xa0bELY\x09|\
-\xf5\xd0\x87\xed|\xf3\x13\xea\xbb\x00\x0a\x0e.\x1a\x1cC\
-9\xaaK\x87i\xac\x04\xd5\xb2\xa0\xf9g\x03\xcc\xff:\
-\xb4>s;\xfd\xf4X\x1f\x92\x8b_oG\x07\x068\
-\xe48\xf7\xa5\xa3J\xba;\xe8G\x8e\xf6;\xa5\xaac\
-\x8f\x07\x94w\xba\x01\x1eG_\xad\xa1\xbf\xbf\x1a}\x1f\
-\xa6X\xb2\x0dOf\xf6\xa0\xba\x00\x0a\x0e\x863\xf9\xf2\
-\x0e)\x8b\x01\xae-\x86\x95\xde\x02\xae-\x81{2\x8f\
-Mn\xf9k\xbd\xde\xb9\x01\xa8\xf4\xfb\x09\x8d\xa1k\xd9\
-\xa5\x12\x99<Z\xbd\x89\xd0_\xfft_\xe6|\xd1\xc7\
-m\xb6\xbb\xa3\x02\xe11\xe5\x9b\xfd\xd4\xf7\xfd\x93[\xf0\
-\xd0\xd4\x99\xedy0\xb3\x08\xb5(\xa8\x02\x00\xe0\xf4E\
-\xd3(3\x9f\x94gw\x12b\x1f\x1b\xe0\xe9\xd7\x02\x85\
-n\xf0\xe9'\xddC}\x9ea\xbf \xa7\x1f\x00\xa4\x16\
-\xbf\xa9\xb2\xee\x9eG\xe3\xbb\xfa\xf7\xbc\xc9tp\x18\xe9\
-\x93\x03\x96\xf5v;\xfa\x1aq\xecU\x8b\xfb\x1f5{\
-p\xe7\x91\xdft\xfe\xbe\xf9\x8ch\x96\x05\x9f\xff\xf7a\
-\xc1\x83s\x04\x90_\xfaM\xac\x01\x89-\x03\x1f\xff\x09\
-x\xe9\xd5`\xad\x1f\xe0\xf43\x92+\x90\xec~\x9dm\
-)\x04k\xf0\xfa\x97\xfd\x0aN\xa7Z\x06\xb1\xf4\xc9e\
-\x0b\xa5a\xc7^5\xdf@\xf0\xa7\xbe\xff\xf2\xf05\xc8\
-Y\xf3\xdb\xf4\x17\x88\xe8\xd3`\xb3\x83L\xdc\xc0\xb9'\
-/\xc5\x9b\xd6\x0e \x1b7\xb0\xa6\xaf\x0b\x99\xb8\xd1\xe9\
-f\x9d\x90\x98y\xf9\x17\x989x\xa0\x92@\xfc\xbfD\
-\xcb\x80\xf4^\x02L>\x02k\xe2\xc1`\xad/\x91\x9f\
-\xd0\x18\xb2\xcb\xde\x8d\xaa\xde|\x16\xace\x03M\xf0\x90\
-\xf4x\xd7\x06\x80\xb1\xe02\xde\xeb\x05\x0c\xfd5\xf2\xa9\
-\xef\xe4\xc9\xdb\xf07\x17\xdf\x5c\xf7}\xdd;:\x81\x5c\
-\xc1\xc4\x9e\xd1\x09\xfc\xec\xb9\xc3x\xec\xc0\x91\xc6\x1e\xcc\
-,cN\x0a\x80L\x5c\xc7\xf5oX\x8f+6\xad\xea\
-tS\x16\x0e\x08\xdc\xda_\xde<\x16\x01\xcdn\x06I\
-\xae\x82y\xe4_\xc1\x0b/\xdbN?\xe1 dN\x95\
-]\xfd\xef\x04\xa1q8\xcbz\xcb\xda;l\x0ao\x1d\
-!\xbe\xee\x89>\xeb@\x8d\x8c\xed\x9f\x08\xd6\xe2r\x97\
- \xd0\xb1\x17f!x\xba\x00z\xf6\x14tm\xf8\x83\
-\x86n\xeb\x9a\xbe,\x00`\xe3\xf2\xc5\xb8b\xd3*\x1c\
-\x9a\x98\xc1_\xdc\xff\x0c~\xfa\xfc\xa1\x06\x1f\xd0\xec \
-\x22'`@\x7f\xa9\xc9mM_\x17\xee\xb8\xf6<E\
-\xfe6\xc3\x9c8\x10l\xfa\xdbB\x80x\x84\x01\x89\x0d\
-\xc0X\xfa^h\xd9\xb3\xe1|\xaa[\xea\xf7'\xbaN\
-G,\xb3\x16A\xe6\xb6C\xacF\x96\xfd\x0aH\xa7F\
-7\x8c\xd4I\xfe\x09D\x1e\xc7^U\xab\x22\xd4B\x10\
-\xc7\x15\xdfAv\xd3\x1f\xb7|\x9f\x97f\x93\xf8\xf2%\
-\xaf\xc3\xef\xfe\xfa\x99\xee\xf6\xb4\xbc5\x8795\x0a\xb0\
-\xa6/\x8b\xdb\xafx=\x96fO\x8c\xfe\xd5\xbc\x02\xb1\
-\xff\x0b\x10\x02\xc49\xef\x81\x96\x80\xde\xfbv\xc4\x86n\
-\xb0\x83{\xca/\xa2\xa6g\x91\xee\xb3\x83c|\x1e\xfb\
-0O\xbe?=hj\xafH'DC\x22\xb3\xa1b\
-\xbe\x07\x05\xea\x04\x0d\xfdy\x89\xe3\xe9\x128\xdd\x00\xcf\
-\xcc\xc0\xcc\xe9\x9f\x85\x9e=5\xb2\xdb\xfd\x8e\xd3\x96\xe3\
-\x8ek\xcf\x8b\xac\xbef\xd1\xba\x00\x10\xa30-n\x03\
-]I\xdc~\xc5\xebU\x1f\xbfC\xb0\xa6\x03\xfa\xa6N\
-\xff\xbf\xbae\xa0\xa5NF\xf2\xe4[\xa0u\x9d\x01\x00\
-\xc8\xf4\xbf\x03\x84\xc6\xd1\x8cV\xaf7& \x9e9\x15\
-D\x8b\xfb\xce7\xee\xd8cU\xaf\xc5\xc1\x11[\xb2\x19\
-\xa9\xe1m\x91\xdeo\xa0\xac\xf0>\xb6uC$\xfci\
-\x16s\xc6\x07\xf0\xd9\xb7oT\xe4\xef \xb8U\xac\xcb\
-\xf4w[\x06R\x97@K!\xb1\xfcC \xc5\x83\xd0\
-\x89{|\xde\xffM>{\xec\xdf\x95.\xb4v\xed\x98\
-\x00-\xd6\x0b-\xdeW\xeer\xb0`\xf2\xbaM\xfb\xe6\
-?\xf5M\xf4\x0c\xba6\xdd:k\xf7\xfd\x8a\xd7\x0e\xe3\
-\xa7{\x0f\xe3\xb1\xfd\x9dq\x0eF\xd0\x05\xf0x_\x9b\
-\xd86\xadX\x8cM\xcb\xe7\xe7d\x8a\x13\x01\xac8Q\
-\x93\xe0\xd5\x9c\x82\xf2H\x01\x8f\x0f\xa1\x10\x1b\x04\xa3\x89\
-\x8a\x96\xf7h\xf6`\x8d\xef\xfd\xb4\x97[\x0b;\x84\xa4\
-q\xc4\xbbN\x05\x02\xea\xae\x04\x19U\xea\x0c\x13\x0c.\
-\x8b\xc2#\x18\xe4\xf6e7\xfe\x11\xb4\xe4\xd0\xac\xde\xff\
-\xf7\xbfa\xad\xbb\x9dMm\xcd\xa1e\x01\xd0:\xfd\x81\
-\xb7o8\xa9\xd5f(\xb4\x00V\x98,\xef\xc8C~\
-\x9ec\xd7/l\xee;in\xa1\xc0\x89\x81bl\x10\
-\xa6\xd1\x07\x7f\xdf^\xd2\xc0Nz\x85\xb8\xf2z\x00n\
-\xaf\x7f9\x7f,s*\x08\xd1\xca\xe5\x1c\xe7\x9fL\xfa\
-\x1a$\x0ft\xfe\xb9\x03\x86D\xbe\xd8\xd2\x0b\x10_\xfa\
-\xd6\xc8\xees\x186-_\x825}\xd9\x0e\xd0?*\
-'`\x8b\x12\xe0\xbc5\x03\x914C\xa19\xb0\xe2$\
-jky\x8feP%/\xb1\x7f-c1\x8a\xa9\xb5\
-\xe04\x09\x17\xd9\x98;\xb0&\xf8\x8b\xbf\xde\xb0\x5c\x06\
-#\xb1\x1c\x9a\xd1]\xa9\x0b\xc1f\xbb\xcf\xf9\xe7h\x7f\
-\x8f\x930\xd4\x8a\xe0 F\x06\xd93\xbf2\xcbw\xbe\
-\x82s\xd7,\xeb\x84\x01\xd0\xf9Q\x80e\xd9\xa4\xea\xfb\
-w\x18\xac8\xd9\x10\xc1\x83|\x05\x8e\xcf\xc0s\x8ek\
-)\x942\x1b\xc0\xe2K=$d\x01f\xbe\xdf\x0a\x10\
-\xe9TK\xc3H\xaf\x82Lp\x99\xf0\xee\xb8\x7f\xd9\xb1\
-\xe7\xf6\xe6\xbb\xb4\x7f\x15\xe7\xdf\xa2\xb3\xfe\x0a\xc4\xe8\x9a\
-\xf5{/\xb0\xb6?\xdb\xb6k\xc9\x88\xc8\x09\xd8\xbc\x08\
-Z\xbaH\x0d\xf9u\x1a\xccrO\x02\x0a2\xf9\x05\x88\
-\xf7\x5c\x95\xbc\xf29+\xb9\x1a\xd4X\x022\xf9\x14\xb8\
-5)\x11\xdco\xe6;V\x81\xad\xa99\xe7Hd\xd6\
-\x03\xb6\xe9\xcf\xc1\xe1,\x1f\xe6\x90\xb7~\xc7\x9e\x97\xf4\
-\xde<\xc9\xd5\xd7\xc0X\xb2\xb9\xb1\x9b\xd8\x22\xba\xe2\x95\
-a\xd4vbN\x0c\x03*t\x16\xd6\xcc\xd1\xdaZ\xbe\
-\x01\xd3?\xcc2\xe0F\x0fX\xcf\x1b\x80\xc4\x00\xbc\x1a\
-\xd7\xaf\x85+\xcb~\xc5\x92+A\xf5\x8c\xd4Mpk\
-\xf5\xa6\xe3\xfe\xb9\xbbK\xc09\x87\x9e]\x8f\xf4\xda\x8f\
-\xce\xfa=\x0fB'8\xd4\xf1.\x80B\xe7\xc1\xad\x22\
-j\x0d\xf95j\xfa\x87\xe6\xa51\xf0\x9e-\xe0\x8b_\
-\x0f\x10\x1d\xe1\xa1\xbf\xb6\xe9\xaf/\x82\x91Z\xe9\xee\xbf\
-{\x87\xfe\x02\x1d{r\x9e\x90\xb8\xff\x00\xed\xdfu\xe6\
-\x97\xdaj\xfaw\x1as`\x18P\xa1\xd3\xb0f\x8e\x84\
-G\xfb\xd9i\xd5L\x7f_1O\x1e_Y\x00H\x0c\
-\x01\xcb.)[\x03!C\x83\x04\x9a\xf3\xdd\x80\xc6\x1d\
-{\x0d\xc6\xfds\x8e\xf4\xba\x0fC\xcf\x9eR\xefm\x9b\
-\x05\xb4\x9fG\xca\x02P@-\xcd=k\x96\x01\x8d\x83\
-\x0e\xbc\x03t\xc9\xeb\x01j\xc0\x1b\xf4c\xa4V\x97'\
-\x13\xc9\xe4\x0d\x9c=\xd8\xfa\xa7\xbe\x8d\xde\xb3\x90Z\xfb\
-\xbf\xdat\xbf\xe7\x0e:\x1e\x07\xa0\xd0Y\x98\xb9\x83U\
-\x09^+\x18\xa8n\xd3\xbf\x8a\xcf\x80,:\x13\xda\xd0\
-\xbbAb}\x10o\x86f,\x86\x9e\xe8wi\xf5\xd0\
-\xb8\xff \x0b\xc1\xe7\xfc\xf3\x8e\xf5W,\x04\xa2g\xd0\
-\xf5\x9a/\xce\xee\x8d\xae\x03\x9d\xe0\xd1\x1c\x88\x03Pb\
-\xa0\xe3\x08%+\xaaz\xfb\x89w\xa7\x1e\xd3\x1f\xc1\xe7\
-H\xbc\x1f\xfa\xca\xeb@{\xdf\x04\x10\x8a\xb8\xfc9\xaf\
-\x86\x1c{\xf2q}\x9f\xfaN\xad\xbb\x11Zr\xb0\xce\
-\x9b5[\xe0\x1d\x91\x00\x1d\x1f\x06T\xe8,\xcc\xdc+\
-\xe5\x9d@\x827n\xf2\xb7j\x19h\xbdo\x86\xde\xfd\
-:`\xecQ\xc0\xcc\xb9\xcd\xf6\xaaq\xff\xcd}\xea;\
-\xb6t+\x92\xab\xae\x99\x85;\xdb\x0c\xda\xcf\xa393\
-\x19(*\xfc\xcbO\x1e\xeet\x13\xe6\x15V&\x0e\xe2\
-\xa4t\x84\xa6\x7f\x1d>\x83j\xc3\x85 \x040\xb2`\
-}o\x02\x99\xdc\x0dL>\x07\x99\xcc\xee%\xbf\xdc!\
-\xc0U-\x84\x80<%\x16\xc7\xcfG/\x06m\xe2\x9d\
-Y\xd2\xd3\x857lZ\xdf\xf8\x0d\x9fc\xe8\xf8\xb2\xe0\
-Q\xcb\xbc\x83\xaf\x1e\x8b\xb8\xc6\x13\x1b\xab\x87&\xd0\xa8\
-\x83\xafBp\xbb\x92*\xdd\x04\x07a\xdd\x02oW@\
-\xfcG\x0c\xf0\xee3\x80x/\xc8\xd1_\x02\x96\x89 \
-s\xbf.\x0f\xbf\xac\xfd%'\xe1\xc33W\xe0\x90i\
-\x02\xe8\xfc;\xd3j_\xbeYD\x10\x08\xd4b$\x90\
-\xea>t\x141\x8d\xf9\xd2jF\xfb\xb9:\xff\xf5[\
-\x06a\xce@_YyK\x0d\x81\x0f]\x04\xa4\x97W\
-\x8d\xeasu\x03\x82\x86\x07=\xdd\x80\xbd\x857\xe2\xa0\
-\xb9\xa1\xc5\xbb\x171:\x10\x09\xa4\x86\x01\x178R1\
-\xcbo\xfa\xd7\xe1\xb9\x0f\xb4\x0cjX\x0f\x81\x04\xaf\xc7\
-W@\xe3 \x03\xe7\x83\xf4\x9e]\xb6\x0c\xeap\xec\x85\
-\x0e\xfd\x81c\x9au\xe3\x99\xc2\x85\xed\xb8\xbds\x1e\x1d\
-\x17\x00J\xffw\x16\xe9\x98\x85\x9a\x04\xac\x93\xe0~b\
-\xa3\xb6\xe9/\x1f\x86u\x0b\xc4o\xf7\xe9\xa0+\x7f\x13\
-$=X\xd5\xb1\x17\xe6\x00\x14y\x1e\x9e\xf9M\x94\xb8\
-\x9a\x83\x02\xa88\x80\x05\x8d\xb4a\xba\x8e#\x8f\xf6\xab\
-S\xcb\xd7o\x19P\xc0X\x04\xba\xfc2\x90\xbe-5\
-\x9d\x7fA\x9f\xfa~\xa6\xf0\x16\x8c\x9a\xab\x1b\xbdUm\
-A'x\x14\xcd(@+c\xf9*\x0e\xa0cH\x1b\
-\x15\xed?\x9b\xf3\x00H\x15b\xd7\xf2\x19\x10\x99\xfcR\
-\x1e\xda\xfbF\xd0\xae50_\xfe\xbf\xc0\xf4AI\x10\
-H\xa4\x97\xfd\x02\xe0\x187\x97bW~\x8e~\xc9\x97\
-\xa3#\x5c8\xe1\x86\x01?t\xe5\xdb:\xdd\x84y\x83\
-\xd2\xc4\x8b\x98z\xf1\xc7hG\xb4_p^\xbb!5\
-L\x7f\x17d\xab$\xb1\x14\xc6\xf0\xb5\xb0^}\x00\xe6\
-\xab?w\xf5\xf9e?\x00P\x8e\xf6[\xf9\xc6?\xc1\
-\x87\xba\xd6Ep\xe7N\x1ct\xdc\x07\xa0\xd09X3\
-\xf6\xf0W\x95\xfe9\xf1\xee\xd4e\xfa\x87\x9c\xf3\x96\xad\
-\xdb\x19(i\x7f\xafe\xa0%\xa1\x0d\xbe\x03\xc6\x9a\x0f\
-\x00Z<\xd4\xf9\x97Z\xfb\x01\xe8\x8a\xfc>D2\x1b\
-\x90\xb7\xf4O\xa1S\xe0\xacT\xbf\xe9\xdfV\xcb \xdc\
-\xf4w\x95\x956\xdau2\xe2\xa7\xff\x1e\xb4\x9e\xd3\xe1\
-|g\xc0\x16\x02\xc6\x92MH\xac\xbcj\xd6\xefg\xab\
-\xe8\x04\x8b\x94\x05\xb0\x80\xc1\xe4\x85@\x1a!x\x1d\x9a\
-\xbbf\xb4_]>\x03Z\xb3\x9b\xe0\xb2<\xb4$b\
-'\xff\x16bk?\x08\xa2%\xc1\xc5D\x9fM_\x8d\
-\xf2\xb6\x9dPh\xdd\x07\xc0\x10h\xfe\xd5\x0de\x02t\
-\x0e\x81\x04\xb4Oyw\x1a\xe8\x9f\xd7\x15\xedW\xa3~\
-w\x03\x82,\x83\xf0_\xadg#\x12\xafY\x81\xc2\xf3\
-\xff\x07\xa9\xd5\xdb@\xf4L\xd8\x1d\x98[\xe8\x00\x17N\
-8'\xa0B\xfd0\xa7\x0eU\xd8\xea\x10\xaf\x05\xd3?\
-\x02\xcb\xa0\xaa\xe9_\xa3~\xd7\x87J\xe2}\xe8z\xdd\
-\xd7\xa0\x19\x8bf\xf5\x1e\xcew\xb4,\x00\xca\x06@+\
-\xa2K\x99\x00\x9dC\x9d$\x95\xc8Z\xf7D\x9f\x06L\
-\xfe`\xd3\xbfF\x19g\xb3\x93Q9\x04\x01\x8c\xe4\xb2\
-yF\xfe\xcex\xc4\x22\x8a\x03\xe8PY\x85\xa6\xf1\xf4\
-\xd3O\xe3\x8b\x9f\xbd\x03\xa7\xae\x19\xc4\x96Mk\xf1\xfa\
-\xd7\xaeCU\xf2;\xbf\x01\x95\xd52\xfd\xe5\xc3\xb0n\
-AH\x19\x91\x16^\xd6-\x10\x08\x8d!\x96Z\x0e\xa2\
-%\xaa\xfc\xf5s\x14\xaa\x0b\xa0\xd0.\x8c\x8f\x8f\xe3\xbf\
-~\xfe4\xfe\xeb\xe7O\xe3/\xbe\xf5Cd\xd2ql\
-\xd9\xb8\x16o;\xefL\xfc\xfa\xd6M\xc8v\xa5BH\
-\xda\xa2\xe9_3o\x88\xe9_E0\x11\x10\x10\xaaA\
-O,\x85\x16\xebn\xc3\xdd;q\xd0q\x01\xa0\x0c\x80\
-\xce`\xe7\xce\x9d\xa0\x94\xdaa\xb3@n\xaa\x80\xff\xfa\
-\xd9S\xf8\xcf\x9f>\x89/|m\x07\xdev\xdeF\xbc\
-\xff\xaa\xb7\xe2\xf4\xf5'\xa1\x1e\xcb\xa0\x1a\xc1\x9b\x8d\xf6\
-\x0b\x152\xb2\xcf\x80h\xd0\xe3\xbd\xd0\xe3\x8b\x01\xa2\xb5\
-\xe9\xeeE\x8fN\xf1 \x02\x01\xc0\xc0\x03\xed\xb6z\xa1\
-D@'011a\x13\xb3\x02B\x088\xe7\xc8M\
-\x17\xf0\xdd\x7f\xff\x05\xee\xfd\xb7\xff\xc1\x96Mk\xf1\x89\
-\x1b.\xc5\x1b7\x9f\x860\xcd\xed'x\xc0\x05k\x99\
-\xfe!y\xc3L\x7fB4\xe8\x89^\xe8\xf1%\xf3\x9a\
-\xf82:\xe1\x03Pq\x00\x0b\x14\x07\x0e\x1c\x00!\xc4\
-\xb5\x01\xf0\xa5\xfd\xf2\xb1\xe7\xf0\x9e\x1b\xff\x18\x97}\xf0\
-\x8f\xb0s\xf7K\xfe\x8a\xc2\xfa\xe5A\x96AU+\xa2\
-J\xb4\x9f\x5c\x1f\xd5a$\x07\x10_\xb4\xbe\xbch\xe8\
-\x09B\xfeN!\x92/\x03ud\x1a\x93BKx\xf9\
-\xe5\x97}d\x0f\x13\x02\x84\x10\xfc\xf2\xd1\xddx\xdbU\
-\xbf\x8f\xcf}\xf5\xdb\x98\x98\x9cq\xf7\xcf\xeb\xb5\x0c\xbc\
-\x0e\xbb\x06M\x7f-\xbe\x18\xf1\xecZ\xe8\x89\x01\x90\x13\
-\x91\xf8\x1d\xe0QD\x16@+-WR\xa0\x138p\
-\xe0\x00(\xa5\x81\x9b }P\xda7\xbf\xf3C\x9c\xfd\
-\xf6\x9b\xf0\xe0C\xcf\xd4\x1c\xd3\x0f\xff\xf5\x98\xfeA&\
-\xbet\xac%\x16#\xd1}*b\xe9\x15 46\xbb\
-7\xa6\xa3h?\x87\x22\x8a\x03h\x1eQ\xd3\xff\x91\x9d\
-/D\x5c\xe3\x89\x09a\x01T\x03\xe7\xdc\xc9#\x1c\x86\
-\x9cs\xe4\xa6\xf2\xb8\xfc\x03_\xc4o]\xfdv\xfc\xe1\
-\xefn+g\xf6\xf6\xed\xe5\x8a|\x04\xf7\x98\xfe^\xc7\
-\x9e\xfd\xfb\xfc+y\xe4Y\x0f\x88f\x028\xd0\xca\x9f\
-\x1b9\xbaR\x09\xac\x1b\x8ev)\xf1N\xa8\xc2\x8e\x8f\
-\x02D\xfdW?\xfc\xd4\xdeh+<\x01\x91\x9f\x99\xae\
-I~\x01Y\x08x\xf1\xcd\xef\xfc;\x1e|x'\xee\
-\xfb\xd6\x17\x90\xcdf\xea3\xfd\xeb\x88\xf6;<f\xe2\
-W{\xa606i\x02\xc8\xb5\xfe\x07\xcf\x02\x06\xfb\x17\
-G+\x00:d\x08w\xfe\xc3 \x0am\xc7\xab\xaf\x84\
-\x9b\xffAf?\x10\xec\x17 \x84`\xd7\x9e\x97\xf0\x96\
-\xcb>\x8d\x9d\xcf\x8e\xa0\xb6\xe9_=\xda\xef\xf0\xb8\x89\
-\x1f>2\x81\x1f>r\xdc&\xff\x02\xc3\xfc\xf4\x01(\
-/\xe0|D\x18\xa1\xe5\xad\x96_@l\x07\x0f\x1d\xc5\
-\xbb\xb7\xfd\x01v\xee\xda\x17:lW\xbe\xa6'\xdd\xc6\
-\xe1\xf1\x12~\xf4\xe8\x04~\xf4\xc8\x04\x0e\x8f\x95f\xfd\
-o\x9f\xbbh?\x8f\x22\xb1\x00\x94\x0bp~a\xff\xc8\
-su\x09\x80FF\x09rSy[\x08\x8c\xa0\xb63\
-\xb0\xac\xfd\xa7\xf2\x1c?z4\x87\x1f=\x92\xc3\xe1\xb1\
-\x05\xa8\xf1=\xe8\x04\x87T\x1c\xc0\x02\x04\x01B\xcd\xfd\
-\xd6\x84\xc0\x0c\xde\xbd\xed\xb3\xd8\xb9k_\x951}\x8a\
-\xa9\x02\xc3\x83\xcfL\xe3{\x0fN\xe0\xf0\xb8\x22~'\
-\x11Q\x1c\x00omSh+\x0e\x8c\xec\xadj\xee7\
-\xe2\x1f\xf0n\x93\xb9\x19|\xfc\xf7\xfe\x1c\x13\x93S>\
-\xd3\x7f*\xcf\xf1\xe0\xae\x19|\xef\xc1\x1c\x9e?\xb4\x90\
-M\xfd t\x86C\x9d\x1f\x05\x88\x18g\x9d\xb1\xa6\xd3\
-M\x98\xf3\xf8\xf7L\xb2\xeeQ\x80z B\x88\xc5\xb6\
-k\xcf\x8b\xd8\xf6\x91/\xe1{w}\xa5\xec\xf5\xa71\
-\x14\xe8R\xbct\xd4DO\x1fpV_d\x97\xee\x18\
-\xbaR\xf3p\xb6a\x00:\x1e\x07\x105^\xb7an\
-\xae\xf9>\x97p\xf0\xc0K\xa0\x94\x821\xffg\xc1\x9a\
-A\xd0P\xe1/\x1f\xde\x89?\xfd\xab{\xf0\xbb\xff\xfb\
-3\xd0\xd3\xcb\x90$:^\xd7\x1b\xc9\xe5NX,\xcc\
-8\x00\x85\xb6#\x97\xcb9f\xbf\xac\xb9km\xd5\x04\
-\x86,\x04\xb2\xd9,n\xbc\xf1F|\xf8\xc3\x1f\x86\x91\
-\x99O\x8br,<D2\x1b\x10\xbc\x05\x1b@\xf9\x00\
-\xda\x8ag\x9f}\xb6i\xf3\xbf\x96\xc0\xe8\xea\xea\xc2\x0d\
-7\xdc\x80\x1bo\xbc\x11\x8b\x16)\xe27\x8c\x85\xf8a\
-\x10E\xff\xf6Bh\xff\xa8\xf1\x9e\xf7\xbc\x07\xbf\xfd\xdb\
-\xbf\x8d\x15+VD^\xf7B@\xa7x\x10\x89\x00P\
-$\x9e?x\xf9\xe5\x97\xeb6\xfd\xeb\xf1\x11\x5cq\xc5\
-\x15\xf8\xd4\xa7>\xa5\x88\x1f\x01\x94\x0f@a\xd6q\xf0\
-\xe0\xc1\xba-\x80j\x82\xe2\xb2\xcb.\xc3'?\xf9I\
-,_\xbe|\x96[\xac0\x9b\x88\xe8\xbb\x00\xad\xc8.\
-e?\xb4\x13\xadv\x01\xb6l\xd9\x82\xcf}\xees8\
-\xed\xb4\xd3\x22l\x95\x02\x80\x85\xe9\x03Ph/\x9e{\
-\xee\xb9\xaa\x9a=\xcc\xec\xdf\xb2e\x0bn\xba\xe9&l\
-\xd9\xb2\xa5\xcd-V\x98Mt<\x0e@\xe9\xff\xf6\xa2\
-\x96\x05\xe0\x15\x0e\x9b7o\xc6G?\xfaQ\x9c}\xf6\
-\xd9ml\xe5\xc2\x84\xf2\x01(\xcc:\x9e{\xee\xb9\xba\
-\xba\x00CCC\xf8\xd2\x97\xbe\x84\xcd\x9b7\xb7\xa1U\
-\x0a\x9d\xc2\x1c\x88\x03h\xbd\x05\x0a\xf5\xc3\xab\xe1\xbd&\
-\xff\xe0\xe0 n\xbc\xf1F\x5cz\xe9\xa5\x1dj\xe1\x02\
-\x05\xc7\xfc\xf5\x01(\x17\xe0\xfc\xc0\xa3\x8f>\xea\xd3\xfe\
-B ,]\xba\x14\x1f\xfa\xd0\x87p\xf1\xc5\x17w\xa8\
-u\x0a\xaa\x0b\xa00\xab\x90\xa7\xf3\x0atuu\xe1\x03\
-\x1f\xf8\x00\xae\xbe\xfa\xea\x0e\xb5J\xa1\x93\x88H\x00\xcc\
-\x1d\x1b\xe0\x95W\xc7\x22\xad\xefD\xc2\xc4t\xc9\x11\x00\
-\xb1x\x12\x17\xbe\xed\xed\xb8\xf2\xaa+\xd1\x95\xe9R\xf7\
-\xadA\xc4b:\x96twEXcg\x96\xc79\xe1\
-,\x80\x1f\xfc\xe4\xa1N7aN\xe3Mo\xbd\x14\xc5\
-B\x1e'\x9f\xba\x11\xb1x\x02\xf7\xff\xea\xd9N7i\
-^b\xb0\x7f1.\xba\xe0\xacN7\xa3eD\x14\x08\
-\xd4By\xe5\x04h+N>uc\xa7\x9b\xa0\x10\x86\
-\x0ep\xa1\xe3q\x00J\x02((\x941O\x9d\x80s\
-mI\x10\x05\x85\xf9\x8a\xf6\x8b\x00\xb5(\xa8\x82\xc2\x02\
-F4q\x00-\x08.\xb5\x1e\x88\x82B\xc7\xe2\x80N\
-\xbca\xc0\xc1\xfe\xc5\x91\xd6\xa7\xa0\x10\x84%=Q\x0e\
-\x01\x0a\xa8a\xc0\x96q\x22\x0c\xcd((\xb4\x0b\xca\x07\
-\xa0\xa0\xb0\x80\xd1\xfa0 c--0\xa1\x5c\x00\x0a\
-\x0ae\xf0\x0e8\x01\x94\x05\xa0\xa0\xb0\x80\xa1\x04\x80\x82\
-\xc2\x02F\xe7\x05\x80\x1a\x07TP\xe8\x18\x0f\x22\x8a\x03\
-h\xbe\xf1\x8a\xfe\x0a\x0ae(\x1f\x80\x82\x82B[\xa1\
-\x04\x80\x82\xc2\x02\x86\x12\x00\x0a\x0a\x0b\x18J\x00((\
-,`(\x01\xa0\xa0\xb0\x80\xd1\xf1\xb9\x00\xa5\xb1\xbd8\
-\xfa_7u\xba\x19\x0a\x0a\x1d\xc5\xf8x\x17\x80\xb5m\
-\xbfn\xc7\x05\x00/\xe6P8\xfcx\xa7\x9b\xa1\xa0\xd0\
-Q\x94\xa6\x97\xa1\x13\x02@u\x01\x14\x14\x160\x94\x00\
-PPX\xc0P\x02@Aa\x01C\x09\x00\x05\x85y\
-\x0f>\xd2l\xc9\xd6\x05\x00\x81\xf2\xe0)(t\x12\x1c\
-#\xcd\x16mY\x00\xb0\x92\x12\x00\x0a\x0a\x1d\x05!\xff\
-\xddl\xd1\x96\x05\xc0\xee[\xaf\x1fi\xc5\x04QPP\
-h\x0d\x0cx\xa0\xd9\xb2\x11\xf9\x00\xc8\x9d\xd1\xd4\xa3\xa0\
-\xa0\xd0\x18\xf8\xc8\xee/]\xff@\xb3\xa5#\x09\x04b\
-&\xbeEu\xdc\xd2L\xd9'\xa6\x97\xe2\xc2]\xef\x8f\
-\xa2\x19\x0a\x0a\x0b\x10\xad)\xdfH,\x80\xdd\xb7^?\
-\x02\x0ee\x05((\xb4\x11\x9c\xf3\xf1\x98\x8e\xaf\xb5R\
-G\xc3\x02\x80sN\xbc\xdb-\xb7\xdcBu\x16\xfb\x04\
-\xe7|\xbc\x95\xc6(((4\x02\xf2\xf9\xc7\xb7o;\
-\xee\xe5c#5\xd4\xec\x02x+\xdc\xbe};\x01\x80\
-\x0d\x1b68\xe9[\xb7n%\x83{\xf6\xe4\xfe\xea@\
-\xec\x03%\x86{\x1bi\x80\x82\x82B\x13\xe0\xfc\x07_\
-\x7f\xeb\xf0_\xee\xd8\xb1\xc3Q\xe2;w\xee\xe4\xe5S\
-\xee\xa5\xc5\x08!\xa1k\x8d\x05\x0a\x00\x99\xf42\xe1\xfb\
-\xfa\xfa\xc8\xe0\xe0\xa08G2\x99\x0c9|\xf80A\
-\xf9\xf3\xc0\xe4\xd3k\xb5\xff\xf8\xd3\xe7\xac\xdf)2\xdc\
-\xda\xec\xdf\xa5\xa0\xa0P\x1d\x84\xe3\xa9\xf5\xbd\xc6\x8d#\
-##:\x00\x0c\x0c\x0c\xf0\x5c.\xc7\x07\x07\x07\xf9\xba\
-u\xeb\xf8\x8e\x1d;8\xe0\x17\x08A\x82\xc0g.p\
-\xce\x89\x97\xf4\xa3\xa3\xa3T\x90\xbdX,\xd2d2I\
-\x8a\xc5\x22\x8d\xc7\xe3\xc44M\x1a\x8b\xc5\x88i\x9a4\
-\x99L\xd2|>O\xfeb\xaf\xf5;S\x16>9\x8b\
-\xf7@AaAB\x03\xdfy~?\xbd\xe4\xdce\xa9\
-\xb1R\xa9\xc4\x0d\xc3`\x85B\x81\xc7\xe3q\x96\xcf\xe7\
-y\x22\x91`SSS<\x9dN\xb3\xb1\xb11\xben\
-\xdd:>::\xcaw\xee\xdc\xc9\xb7o\xdf\xce\x01\xb7\
- p\x04\x80\xd0\xfa\xdb\xb7o'[\xb7n\xa5{\xf6\
-\xec!+V\xac\xa0\xb9\x5c\x8e\x02\xd0\x0a\x85\x02\xa5\x94\
-j\x82\xe8\xa6iR\x00\x1a!D\xb3,\x8b2\xc6\xa8\
-a\x18\xb4X,j\x00\xb4o\xbf\xc4/;X\xe0\x9f\
-a\x1c\xb3\xf1\x15E\x05\x85\x05\x87\x04\xc5O~c\x19\
-\xf9\xcc)\x8b\x8c1J)+\x16\x8b\x8csni\x9a\
-\xc64Mc\x9cs\xcb0\x0c\x06\xc0\x9a\x98\x98`\xb1\
-X\x8cY\x96e\xa5\xd3i\xd6\xd7\xd7\xc7dA \x84\
-\x00\x01*\xe4\xdf\xb1c\x07\xed\xeb\xeb#333\xda\
-\xfe\xfd\xfb5M\xd3\xb4d2\xa9\x1b\x86\xa1\x17\x0a\x05\
-]\xd7u\xbdT*\xe9\xb0\x89\xafi\x9an\x9a\xa6N\
-\x08\xd1\x00h\x22\x9d\x10\xa2[\x96\xa5=\x93\xe3C?\
->\xc4>\x93\xb3pz\xa7n\x9a\x82\xc2|\x07!|\
-jC\x97\xf6\xc7\x97\x0ci\x0f\x00\xb0\x18c\xa6M|\
-\x13\x80\xc59\xb7\x00X\xba\xae\x9b\x96e\x99\xa6i\x9a\
-\xb1X\xcc,\x95J&c\xcc\xd24\xaddY\x96U\
-,\x16\xad\x9e\x9e\x1e&\x0b\x01G\x00l\xdf\xbe\x9d\x0c\
-\x0e\x0ej\xb1XLK\xa7\xd3z\xa9T2\x08!1\
-BH\xacT*\xc5u]\x8f\x03\x88q\xce\x0dy\xd3\
-4\xcd`\x8c\xe9\x84\x10\x9ds\xae\x13Btq,\x84\
-\xc1/\x8f\x9a\x1b\x9e\x18c\x17\xbcZ\xc4\xa9\x1d\xbc\x8f\
-\x0a\x0a\xf3\x0a\x09\x8d\x8f\x9d\x9c\xa1\xff}\xde\x12z\xff\
-\xe28\x9d\xe0\x9c\x9b\x00,\x00%\xce\xb9I)5\x19\
-c&!\xa4D)5\x01\x14\x01\x14\x09!%\xcey\
-\x11@\xb1T*\x15\x0c\xc3(\x18\x86Q\x1a\x1b\x1b+\
-\xf5\xf4\xf4\x98}}}\xec\x81\x07\x1e`\xdb\xb7o/\
-\x0f\x1b\x08\xb3\x7fddD\xb7,\xcb0\x0c#\xc69\
-OPJ\x93\x94\xd2$\xe7<M\x08I\x02H0\xc6\
-\xe2\x94R!\x0c\xe2\x94R\x83sn\x000\x04\xf9\xc5\
->\xe7\x5cG\xc52\xd0'M\x96~l\x9c\xaf\x1d-\
-\xa0\xefX\x9e/!\x04\x00\xe1\x84\xf3\xb2%B\xec\xaf\
-\x8c\x12\xe1\x84\xb4\x13\xc4\xf9rZ\xf9\x1c\x05\xf1\xa5\xc1\
-\xce\xebrlx\xbe\x5cJ<\xa3\x1a$ \x8f\x5cW\
-\xe8\xd3!\xfe\xe1\x96\xa0Z\x08o\xe1\xcb\xa9\x01\xd7\x98\
-\xb7\xe0\xe1\x9e\xe8:\x8a\xfa\xca\x06~C\xa3\xca5\x08\
-\x09\xfe\x06\x0d\x0f\xf8\x1a\x07\xf7:\xcb\xec<<\xa8\x1e\
-\xe9\x9aL\xb4\xcaN\x13y\x85'N\xd4+\xae\xe9\x9c\
-g\x84\xc3\xfe\x1b\xd3\x1a&\xfa\xe2dtu\x9a\xbet\
-r\x17}Y\x90\x9e\x10b\xda\xfb&\x80\x12l! \
-\xc8N\x08)\x01\xc8SJ\x0b\x96e\xe5\x09!y\xc6\
-\xd8\x0c\xa5tZ\xd7\xf5i\xce\xf9L\xa1P(\x14\x8b\
-\xc5bOO\x8f\x09\xc0\xba\xfc\xf2\xcb\x19\xe1\x9c\x93\x1d\
-;v\xd0\xb1\xb11\x9aL&c\x89D\x22n\x9af\
-\x82s\x9e\xb6\x89\x9f\x01\x90e\x8ce\x08!)BH\
-\x92s\x9e\xe0\x9c\xc7\x09!B\x10\xc4l\xc2\x1b\x84\x10\
-\x1d\x80\x01\xc0\x11\x00\xa2\x8b \x1dS\x94\x05\x03\xe5\x9c\
-;\xfbv:\xe5\x9c\xcb\xfb\x84\x10\xe2\xfd%v\x9e\xb2\
-\x08\xa9\xa4\x11\x94\xc5\x86k\xdf\xec\xf1\xa1\x1b\x00\x00\x0d\
-\xc8IDAT\xbe\xe9b\xdf{\x0cx\xbaBr\x19\
-\xf9\xbc\x94\xdf;<\xea\x959\xde\xf2\xae\xf4\x00\xb8\xd2\
-\x1b\x1d\xcb\x9d/\x08\xf0B\x87\x12V&\xa6\x5c.\x80\
-\xb0\xb5\xf2\xb9\x1c_\x15\xf2\x11\xd7\xf92?\x09\xf7\x1e\
-\xdb\xf9\xb9\xa7\xbcs\x8e\x10\xc2\xe4\xb2\xf6y&\xa5;\
-\xbf\x00\x18\xe7\x9cI\xe7\x19\x00\x862\xc1\x990\xe5\xed\
-\xbc\x96MpS\xde\x17\xa4GY\x00\x94P\x16\x06E\
-BH\x81s>C\x08\xc9\x13B\xa6\x19c\xd3\x9c\xf3\
-\x9c\xa6i9B\xc8\x04c,\xc7\x18\x9b!\x84\xe4\xe3\
-\xf1xill\xcc<x\xf0\xa0En\xb9\xe5\x16\xba\
-a\xc3\x06\x92\xc9d\xf4\xa3G\x8f\xc69\xe7\x09\x00i\
-]\xd7\xbb8\xe7Y\x94\xc9\xbf\x98R\xda%\x84\x00\xe7\
-<I\x08I\x00H\x00\x88\xa1L\xf8\x98\xe8\x02H\x82\
-@\xe3\x9c;\xfe\x01\xd8\xe4\xe7\x9c\x8b_\x0a\x89\xf8(\
-\x13\xc1EvTHL!\x91]\xec\xdb\x0f\xd3!\xbc\
-8\xb6\x1fVX\x9aL\xc6@R{\xc8Z\x95\xa0U\
-\x88\x1d\x98\xbf\x0aNH\xe2\x87\xa0.\x8b\xa0\xda\x18v\
-\x90\xf6\xf6\xe4w\x9d\x0f \xbf+\x8f\xf7\xbc,D\xbc\
-\x02@\xe4\xf3\x92\xdf\xbb\xef\x15\x02\xb5\x84\x02\xca&\xbe\
-\xf8\xb5`\x93\x1f\x92\x15 \x04\x80\xbd\x15\x01\x149\xe7\
-\x05B\xc84\xe7|\x1a\xc0\x14!$G\x08\x99\x000\
-\xc1\x18;\x06`\xc2\xb2\xac\x5c*\x95\x9a\xc9\xe7\xf3\x85\
-D\x22Q\x02`\xe9\x00\xd0\xd7\xd7GFFF\x08\x00\
-\x1a\x8f\xc7\xf5R\xa9d\x94J\xa5\x98\xae\xeb\x09\x00\x8e\
-\x15@\x08\xe9\x02\x90\x06\x90B\x99\xfc\x09\xcey\x1ce\
-\x93_h}\x87\xfc\x90\xb4?\xca\x04\xd6\x04\xe9\xc5&\
-\xc8-kt\x94\xc9M\xe1\xd6\xe6\x90\x8fm\x00\x15\xd2\
-\xf8\x88-vy9B\x0a\x9e\xf3U\xb58\xe7<\x94\
-\xd8\x84\x10W\xd9\x80\xf7\xd0W\xa4V\x06O\xfd'\xa4\
- \x08\x22l\x94e\xc2\x84\x85\xb7\x0e^\xb1\xe8]e\
-\xa5\xf7%\xc8\xaa\xf0\xfe\x02~\xc1 v\x85\x90\xa8&\
-\x0c\xc4y\xe6\xdd8\xe7\xc2Bp\x84\x80\xbd\x99\x84\x10\
-\x0be\xd2;\x16\x00!\xa4\x00\xa0\x00 N\x08\x89q\
-\xceu\xce9a\x8c1\xdb\x82\x98&\x84\xe4m'>\
-M$\x12$\x93\xc9\x90\x5c.W\x0e\x04\xda\xb3g\x0f\
-\xe9\xe9\xe9!\xa5R\x89\x14\x8bEb\x18\x06\xb5,K\
-\xb3,K\xb7\xc9l\xf0\xb2\x99\x1f\xe3\xb6\xe9o\x13_\
-t\x03\x0cA|\xfb\xe2\x06B\xb4>$\xf2\xc3\xd6\xf8\
-\x08\xd0\xee\xf0\x90\x1d\x0d\x98\xeer\x9a\x9cO<|G\
-rH<\x0b\xd2\xd2B!x\xd3\xbd\x88\x92\xb0\xb2\xb0\
-:\x01A\xaai\xf4\xb02\xd5N\xcad\x0d\xb1\xb4x\
-X\x1dAm\x09\x10\x16.a`\x0b\x7f\x9fP\x10\xe9\
-\xf6\xfb%w\x07\x1cK\xc1Ncp\x0b\x06f\x97w\
-Y\x03([\x04\x8e5\xc097m\x0e\x99\xb6\xb2\x14\
-\xca\x95\xda\xd7\x04l\xff\x00!$\x06 F)5\x00\
-\xe8\x8c1\x8d1\xe6\xf0nff\x86d2\x19\x00v\
-$\xe0\xbau\xeb\xf8\xc8\xc8\x08\x07\xc0\xe3\xf18/\x95\
-J\x8cR\xeaH \xdb\xdb(\xa4M\x91\x97\xfb\xf22\
-q\xe5?XH;]j\xbcf\xefS[\x188\xfd\
-|\x9b\xd0\xa2\x1b\xe0\xea\xcf\xcb\xfb\xb0\x05\x82\xd0\xbe\xb2\
-P\x08\xfa\xf5j\xe9*\xc2A\x94\xf3j\x04\x91\xa7\xd6\
-\x0b\x16\xa4\xa5Z\x11\x08\xfcD\xb5\x00\x80\xe6\xac\x00\xb9\
-x\xbd\x19\x1b%\xb7(\xe3Q\x0a\x81]\x06I\x08\x04\
-\x09\x02.\xd5\x1b\xe4G`\x90\xc8o\x9f\x0b\xea\x0a\xb8\
-\xba\x01\xb60\x10\xdd\x01_\x17\x00\xe5n\x80\xe0h\x09\
-@\x891f\xa2l50B\x08\xd34\x8dk\x9a\xc6\
-\x13\x89\x84\xf3\xf7\xe8\x000::\xca\x07\x06\x06\xf8\xd1\
-\xa3G\x99i\x9a&!\xa4\xa4iZ\x81s>\x03\xc0\
-`\x8c\xc5(\xa5`\x8cY\x84\x90\x22\x80<q\xfb\x00\
-b\x84\x10\xc3&\xbd\xc1m_\x00<>\x00i\xdf\x11\
-\x04\xf0X\x04\xc4\xe3\xf0\xb3I\xe7s\xf8\x89}\xfb\x01\
-\xb9&BHBC\x1c\x86Z\x0a\x08\xf1\x01\xc0Mb\
-\xc7b\x08\x12\x02\xd5\x08\x1b&4\x02\xd0H\x97\xa2v\
-e!m\xaa\xa7=aZ\xbaE\xf2\x06V\xd9l[\
-\x9c\x0a\x02H\x5c\xe5\x1a\x81\x0eC\x91\x1e@x\xaf\x83\
-\xd0G|\xe9\x9c\xb3\x91\x8a\xb9\xcf\xa5\xfc\x0e\xd9%A\
-\xe08\x03\xb9m\xf6#\xc0\x07\x00\x8f\x1f\x00v\x17\x00\
-v7\x80\x94\x1d\x80\x8e\x0f\x80s>E\x08\xc9QJ\
-'\x01L3\xc6f\x00\x14\x0b\x85B)\x95JY\xf9\
-|\xbe\xe2\xc7\xe0-\x8c\x02@r\x02\x92\xb2\x0f@\x90\
-_\x08\x03\x8dH\xfe\x00Y\x18\x10i$\x00\x92o\xc0\
-&\xafwD@\x10\xdf7\x1a\x00\xd4\x1e\x05\x90\xf2:\
-\x7f\xb3\xfd\xa0]]\x0b)\xad\xe5\x11\x00o\xbe*B\
-b\xd6F\x00\x02\xaeYo\xddU5e+\xa8A\xd0\
-\xd0kz\x08\x18X^\xae[\xd6\xc2A\xe5\xab\x90<\
-\x94\xf4^m.\x91\x5c\x90Z\x9c\x17f\xbe\xf3K\xaa\
-\x8c\x02\x90\x8a\xd7\xdf\x19\x01\x80\x9f\xf4\xf2\xa8\x80k\x04\
-\x00-\x8c\x02\xe8@y\xd2\xc0\xd6\xad[\xf9\xc8\xc8\x88\
-511Q2\x0c\x83p\xce\x09\xa5\x94SJ\xc5\x85\
-gP\x8e\x03H\x10;@\x88{\xe2\x00\xb8\xe4\x07 \
-\x15\x7f\x80,\x04\x5c\xc2\xc0&r\x90@\xf0\x0e\x05:\
-\xfb\xf6K-w?|\x02\x02\xd2\xc8\x818F\x85\xf8\
-.\x01\x81\x00\x81\x10dI\x04\x09\x0d\xe97p\x94\x81\
-\xb8\x9d\x94\x90\xcf{\xcby\x0f[\x15\x04!\x82\xa8\x91\
-:\x1d\xa2\x10w\xbf\xb7\x956U\xf5\xbe\xcb\xf9\xe4\xe6\
-\xcby\xaa\x91\xdc\x9b\x17\x1e'\x9d]\xaf\x8f\xf0^m\
-\xedM\x97\xd3\xec}G\x9b{\x7f%\x81\xe0\xeb\xd3\xdb\
-\xe7\xad\x00\x8d/kz\xd9\xecw\x11\xdf.k\x12B\
-J\x84\x90\x12c\xcc1\xf7y9\xf0'O\x08q\xe2\
-\x008\xe73\x8c\xb1i]\xd7\xa7)\xa5\xf9R\xa9T\
-,\x16\x8bf<\x1e\xb7zzz\xd8\x0d7\xdc\xc0u\
-\xbb\xc1\xd8\xb1c\x07\xb7C\x05\xc9\xc4\xc4\x04\xb2\xd9,\
-\x9f\x9a\x9a\xb2(\xa5%\xc6XA\xd3\xb4\xb8D|A\
-\xf6\x18\xca\xa4v\xcc~)\x0aP'\x84h\x8c1!\
-\x044J\xa9\xce\x18su\x09l\xd2\xea\xb6\x05\xa0\x91\
-\x8a?@\xb6\x0ad\xe1@\xa4r\xc4+\x18d\xe2\xdb\
-\xe7\x08\xf1X\x0c\xa8X\x1arZ\xa0\x90\x90\x88T-\
-\xb6 \x88d$ \xcdGL^qJz\xeb\xf1\xe5\
-o\x10\xb5,\x9b\xf0\x82\x12I\xec\xf6\x09B6%\x04\
-\x04!E]\x22Y>W\x8d\xd8\xb2\x10\x92\xf3\xcb\x82\
-\x89\x10\xbf\xe3\x0d\x12\x89\xa5\xbc\xb2fv\x91\x1c\x15\xcd\
-.\x88,\xea\x0b\x228\xe7\x1emn\xd7\xe3\x90\x1c\x1e\
-\x13\x1f\xd2\x18?q\x9b\xfb&\x97\xb4?\xb75\xbf\x9d\
-&\x13\xdf$\x84X6\xf9\x9d\xa0 J\xa9iYV\
-I\xd3\xb4\x22\x80\x22\xa5\xb4\xc89/\xc6b\xb1\x02\x80\
-\xa2\xa6iy\x00\xc5\xc9\xc9\xc9\xd2\x8a\x15+\xacd2\
-\xc9\x1ex\xe0\x01~\xf9\xe5\x97\xfb\xe7\x02\x8c\x8d\x8d\xd1\
-X,\xa6i\x9a\xa6%\x12\x09}ffFg\x8c\x19\
-\x89D\xc2(\x95J\xba\x88\xff\xd74M\xa7\x94\xea\x96\
-e9\xc1>\xc4\x9e\x03 \xc8\x0f\xf7H\x80\xb3oY\
-\x96\x93F)\xa5\x22M\xec# @\x88\xdb\x9eO\x1e\
-\xdc=\xa8\x15O [\x0e\xde\xeeD\xa0\xf5 \x0b\x87\
-\xa0}\x91\xd7~\xd9\x02\x8feb\xcb\xf7Y\x16*\x22\
-]\xaa\x03\x08\x11\x18\x8d@\xaeK\xae\xdbS\x9f\xbc\xef\
-# \x91\xb4\xa28n\xb2-^'Z\xa8\xd9\xed4\
-L\x12\x14A\xed\x91\xeb\x00\xdc&\xb9\x5c\xce+\x08d\
-r\xa3b\x9e\xbb\x04\x83 ;\xe07\xe3\xedz\xbc\xda\
-\xdde\xe6\xa3L^G\x00\xd8\xe5D\x9a\xd3\xc7\x97\x08\
-\xef\x0a\x00\x82\xc7\x12\x10\xc7\x9a\xa6\x99v=\xae\xb9\x00\
-\x96e\x89\xaeBI\xcc\x07\xa0\x94\x96L\xd34\x13\x89\
-\x84911Q\xcaf\xb3&\x00\xcb\x15\x06L\x5c!\
-\xb4\xee\x09A\xa3\xa3\xa3tjj\x8a\x16\x8bE\xaa\xd9\
-H\xa7\xd3\x14\x80f\x9a&\xb5,\xcb\x99\x0dh\x0f1\
-\x08\x8d\xad\x11B4]\xd7\x9d4\xf9\xbc \xbdeY\
-\x9a\xa6i\x941\xe6\x10\x9bR\xea\x8c\x10\xc8y\xe54\
-q\x0c\x80RJ)c\x8c\xc8y\x84@\x10\x84\xf7\xa6\
-\x05\xe5\x01|C\x90>a\x80:\x05\x83t/\x03\x05\
-\x85\xf7~\x07\xd5%\x9fo\x14U\xda N\x87\xd6\x1f\
-F*\x84\xf4\xa3\x1blWh\x9f[&\xb8\xa7\xfe@\
-\xe2\xd7Ito~&\x9d\xab\xd9g/\xbfR\x8e\xf6\
-wi|Q\x9fDn\x0e\x80\xd9\xe3\xee\xce&\x1f[\
-\x96\xe5\x90>(M>\x872\xa9\x19\xe7\xdc\x12\xa3q\
-\x94R\xef\xc8\x1c\x03`\xc93\x02m\xe1`\xe9\xba\xce\
-\x18cV<\x1eg\x00\xacL&\xc3\xf6\xef\xdf\xcf\xe4\
-\x89@\xe2\xbe\xfa^\x02\xce\x1b_\x0f \x9dN\xd3\x99\
-\x99\x19\x22\xd6\x03\xb0,\x8b\xc6\xe3qjY\x16\xd5u\
-\x9d\xc8\xd3\x85K\xa5\x12\xe1\x9cS]\xd7)c\x8cj\
-\x9aF\x18c\x941Fu]\xa7\x96e\x11\xb1\xcf\x18\
-\x13\xa4'\x82\xfc\x8c1\xc29\xa7\x9a\xa6Q\xcb\xb2\x88\
-\xfc+\x84\x81\xc8\xe3%:\xb1!\xd2\xe4|\xe2\xd8\x9b\
-W\xa4\xc9\xfbr\x9a\x97\xe0ABA&>c,\xc8\
-$\xf7\x09\x1a\xef3\xa9\x9bip\x09\x9a\xd0Q\x93\xb0\
-\xb2\x1e2\xba\xc8%\x9f\xaf\xb3\x1da\xce\xc4@\x92\x8a\
-|\x94R\xb9\x0b\x22k{FB\x84\x14/\xbf \xae\
-_\xef\xbe\x9cW\x10\x97R\xea\xec{\xd3-\xcbb\x94\
-R\xce\x18s\x04\x82$H\x04\xc9y\xf9\x95c\xbes\
-\x96e1M\xd3\xb8eY\x8c\x10\xc2\xe4|\x94Rf\
-\x9a&\xd3u\xdd\x19v\xa7\x942\xcb\xb2\xb8\xa6iL\
-L\xf7\x95\xd34Mc\xa6irM\xd3\x98a\x18\xac\
-\xdaz\x00\x03\x03\x03|\xff\xfe\xfd\xac\xee\xf5\x00<\x0f\
-\xcaI\xdf\xbe};\x11\xcb\x7f\xf5\xf5\xf5\x91={\xf6\
-\x10\x00\xe8\xe9\xe9qV\x04J\xa7\xd3dll\x8c$\
-\x93I\x92H$\xc8\xc4\xc4\x04\x89\xc7\xe3$\x1e\x8f\x93\
-\xa9\xa9)\x12\x8b\xc5\x88a\x18\xa4T*Q\xc30H\
->\x9f'B0h\x9aF\x8a\xc5\x22\x89\xc7\xe3\xb4X\
-,\x12M\xd3\x88\x10\x0a\x94R\x22\x04\x06\xa5\x94PJ\
-\x89i\x9a\xc40\x0cj\x9a&\xa1\x94:\xf9(\xa5D\
-\x08\x0f\xf9X\x10\x9eR\x1aHh!\x00\xe4\xfcb_\
-\x94\x01\xca\xc4\xad&\x08\xe4<v\xbb\x9ct\xf9\xbc|\
-\xec-\x17T\xa6^\x88\xba\x9d\x07+\x09(\xb9\xdd\xf2\
-\xf9\x80\xe7\xce\x81`\x02\x0a\xc8\xf9E\xbez!\xca\x07\
-\x91U>\x1f\xd4\x06\x9b\x88N^o\xb9j\xe4g\x8c\
-qM\xd3\x9c\xf2\xf2\xbe\x5cN&\xba\x5cF\x10\x971\
-\xc6u]w\xce\x09\x02\x8b<\x96e\xb9\xf2\xeb\xba\xce\
-\x05y-\xcb\xe2\x86a\xf0b\xb1\xc8b\xb1\x187M\
-\x93[\x96\xc5c\xb1\x18/\x14\x0a,\x1e\x8fsAn\
-\xd34y2\x99\xe4\xa5R\x89\x17\x8bE\x9eN\xa7y\
-\xa1P\xe0\x85B\x81g\xb3Y>66\xc6zzz\
-\xf8\xd4\xd4\x14\x07*+\x02\xc9\x0b\x80\x00\x95\x15\x81\x82\
-\x88/\x10\xb8$\x98\x9cQ\xdccq\xfc\xc0\x03\x0f8\
-\x02 \x97\xcba\xd5\xaaU\x04\x00\xc6\xc6\xc6\xc8\xcc\xcc\
-\x0c\x12\x89\x04\xc9f\xb3\xc8d2\x04\x00\xa6\xa6\xa6\x88\
-a\x18\x04\x00r\xb9\x9cKH\x00@<\x1e'\xa9T\
-\xca%(\x00\xa0X,\x12]\xd7I\x22\x91 \xf9|\
-\x9eh\x9aF\x0a\x85\x82xi\xa9\xae\xeb\x90\x05\x86\xd8\
-\x8f\xc5b\xa4T*\x11\xcb\xb2\xa0i\x1a\x11B\x84\x10\
-B\x84\xd0\xf0\xecC\xd34\xe7X\x08\x99\xca\xadp\x85\
-\x16;\xf98\xe7\xd04\x8dX\x96\xe58\xf24M#\
-\x00\x10$<\xa4{\xeb\xea\x83K\xe7dgd\xc3\x02\
-@\xd34\x88k\x8b\xfa8\xe7\xf0\x083\x9f0\x92!\
-\x93\xce\xce\xe3\x22\x8bt\xad\x86\xbb\x00\x8c\xb1 \xf3^\
-hq\xd1%\x90\xaf\x0d[;\x03\x80 \x92\xd3.\xce\
-9\x04\x99E\x9aM>\xb9>WyAV\xcb\xb28\
-\x00\x08\x82\x8ar\x00\xb8i\x9a\xaes\x86a8\x7f\x7f\
-,\x16s\xf23\xc6\xe0%2\x00\xce\x18\xe3\x86ap\
-\xce97\x0c\x83\x1b\x86\x81R\xa9\xe4\x08\x1e]\xd7y\
->\x9fwHmY\x16D\xdb\xec\xba\x90\xcf\xe7y2\
-\x99\xe4\x86a\xa0X,\xf2L&\xc33\x99\x0cr\xb9\
-\x9cs\xef\xfa\xfa\xfax__\x1fFGGy.\x97\
-\x03\x00\x1c<x\x90\x1f<x\xd0!\xfc\xe5\x97_^\
-~\x11\xaa\xf8n\x1a\xeeg\xf2\x00sTt\x19\x04\xe4\
-\x05C\xfb\xfa\xfa\x9c}\xd9z\x10iBP\xd8k\x0b\
-\x22\x9dN;\x02\x05\x00\x92\xc9$\x01\x00\xaf\xd0\x90\x7f\
-\x85\xf0\x00\x00\xc30\xc8\xcc\xcc\x0c\x01\x00]\xd7\x9d\xb4\
-|>\xefJ+\x14\x0aD\xec\x0b\xe2\x16\x8bE\xe7X\
-\x9c\x93\xd3\xe4\xdfR\xa9\xe4\x10\x9eR\xea\xa4\xc9y\x84\
- \x11\xe7\xbd\xfb\xde\xf3\xderAe\xea\x85(#_\
-C\xaeG\x12\x14\xb0\xaf\xedzI\x04\xa1\x802\x19D\
-Z\xa3\xed\xf0\x96\x11u\x09\x22\xc9iAe\xe4<\x82\
-\xb8\x86a\xb8\xda\xe3M\x17\xc7\xe2W\x10\xd5\x9b&\xf6\
-\xc59\xa1\x85\x01@D\xcb\x95J%'-\x99L:\
-i\x00 \xb43\x00\x08\x0d\x0d\x00\xd9l\x96\x03\x80\x1d\
-p\x83\x99\x99\x19\x0e\x00\xb2\xd6\x06\xca\x9a\x1b\x80Ll\
-\x8c\x8d\x8dq\xa0\x1c\x9d\x0b\x94\x83\xf4\xe4{#\xb4:\
-P\xd1\xec^T#\xbc/o\xbd\x19k!H0\x08\
-x\x05\x04\xe0\x16\x12\x02A\xc2\x02p\x0b\x0c\xa0\x224\
-\x80\x8a\xe0\x00*\xc2\x03\xa8\x08\x10\xc0-DD\x9a\x10\
-&@\xb0@\x11\xe7\x84`\x01\xca\x82D\xec{\x85\x8c\
-\xf7\xbc\x108\xde<\x02\x925\xe3:/\x84\x80\x0c!\
-\x84\x1a\x85\xa8\xcb+\xcc\xea\x81\xad\xd1\xe0%N#\x10\
-ux\xe1%\x1eP&_P^/!\x81\x0a\x01\xbd\
-y\x04A\xbdy\x8a\xc5\x22\x07\x00\x99\xac\xe2\x9c\xbc\xef\
-%.\xe0&\xaf|M\xd9\xfc\x96\xd3\x83\xc8, H\
-\x0dT'\xb6@\x18\xc1\x05\x1a!zh\x1d\xadVP\
-/\xaa\x09\x08\x19A\xc2\xc2\x8b \xe1\x01\xb8\x05\x88\x0c\
-Y\x98\xc8\xa8&X\x00\xb7p\x11\x90\x85\x8c\x0cY\xe0\
-\x08\x08\xc1#C\x16B^\xc8BI\x86\x10L\xcd@\
-.+\x0b\xb6Z\x10d\x01\xdc$i\x04\xd5\xca\x09\xb2\
-y!\x93O\x86 \xa2\x0c/)\x81\x0a1\xbd\xa8F\
-T\xc0OV\xc0MX/\xbc\x04\x16\x08\x22\xb2\x8cZ\
-\xa4\x96\x11\x05\xc1k\xe1\xff\x07\x8d\x02\xb6Y\xdb`\x14\
-\xc3\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00Q\x87\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x90\x00\x00\x01\x90\x08\x06\x00\x00\x00\x80\xbf6\xcc\
-\x00\x00\x14[zTXtRaw prof\
-ile type exif\x00\x00x\
-\xda\xad\x9akr\xe48\xae\x85\xffs\x15\xb3\x04\xbeA\
-.\x87\xcf\x88\xbb\x83\xbb\xfc\xf9@\xc9\xcet:\xdd\xae\
-\xee\x9e\xca(\xcb)K\x14\x09\x1c\x1c\x1c\x802\xeb\xff\
-\xffo\x9b\xff\xf0/\xdbdMLRr\xcd\xd9\xf2/\
-\xd6X}\xe3\x97b\xaf\x7f\xd7\xd1\xd9x~\x9e\x7f\xf5\
-\xe37\xf7\xf5\xbc\xf9\xfc\x83\xe7\x188\x86\xeb\x0fy]\
-G\xd78\x9f\x1e7H\xbc\xcf\xf7\xaf\xe7\x8d\x8c\xeb\x17\
-_\xee\x81\xee?|\x0c\x18\xf4\xc9\x9e_\xee\xeb\xca=\
-P\xf0\xd7y\x17\x1f3:\xffZ|Z\xce\xfd?\xc8\
-\x19\xe2\xf3\xe2\xd7\xefQ0\xc6L\x9c\x0c\xde\xf8\x15\x5c\
-\xb0\xfc\xf4\xfa\x94\xc0\x0cB\x09\x8dc\xe6\xa7\x0b\x95\x8b\
-l\xa8\xfc\x9e\xceO\x1b\xd2{\xdb\x19\xfb\x83\xf1\xec\x0f\
-\xb6\xb3\xed>\x1f\xbe\x9a\xc2\xd8|_\x90_lt\x9f\
-w\xe9\xbd\xed\x8e\x85\x9eg\xe4\x1eO\xfe\xf2\x872\x5c\
-\xb6\xcf\xff\x9el\xb7\xf7,{\xafku-f,\x95\
-\xcd\xbd\xa8\x8f\xa5\x9c\xdf\xb8\xb0c\xcapn\xcb|\xc4\
-*\xe6\x0aG\xfdT>\x85%\x0e\x8c>\xf1f\xe73\
-\x8c\xab\xcec\xed\xed\xa2\x9b\xae\xb9\xed\xd69\x0e7\x98\
-b\xf4\xcb\x0bG\xef\x87\x0f\xe7\x5c\x09\xe2\xab\x1f\xc7)\
-Q?n{\xc1\x0d\xd3\xe0#\x1f\x06^\x0b\x9c\xf6\x9f\
-sq\xe7\xb9\xf5<o\xb8\xc2\x93\xa7\xe3J\xef\x18\xcc\
-q\xc7\xb7\x8fyw\xf2\x9f|>\x07\xda[\xa1\xeb\x9c\
--\x9f\xb6b^^\x01\xc84\xd4s\xfa\x93\xabp\x88\
-\xdb\xb7M\xd3\xb1\xef\xf9\x98'\xdc\xd8'\xc7\x06<\x98\
-\x8e\x99\x0b\x0bl\xb6_C\xf4\xe4\x1e\xd8\x0a\xc7\xcf\x81\
-\xeb\x92\x8d\xc6^pw2\xef\x010\x11\xcfNL\xc6\
-\x05<`\xb3\x0b\xc9eg\xc5{q\x0e;\x16\xfc\xd3\
-\x98\xb9\x0f\xd1w<\xe0R\xf2\xd3\x99\x8doB\xc88\
-\xa7x}6\xf7\x88;\xd7\xfa\xe4\xaf\xd3P\x0b\x8eH\
-\x04\x8d\xe0\x1a\x02\x05g\xc5\x98\xc0\x8f\xc4\x02\x86Z\x0a\
-)\x9a\x94RN\x92J\xaa\xa9\xe5\x90cN9g\xc9\
-\xcaQM\x82DI\x92E\xa4H\x95VB\x89%\x95\
-\x5c\xa4\x94RK\xab\xbe\x06(,\xd5\x5c\xc5\xd4Rk\
-m\x8d\x876\x86n\xdc\xdd\xb8\xa2\xb5\xee{\xe8\xb1\xa7\
-\x9e\xbb\xf4\xd2ko\x03\xf8\x8c8\xd2\xc8CF\x19u\
-\xb4\xe9g\x98\x84\xff\xccS\xcc,\xb3\xce\xb6\xdc\x02J\
-+\xae\xb4\xf2\x92UV]m\x83\xb5\x1dv\xdci\xe7\
--\xbb\xec\xba\xdb\xa7\xd7n\xaf~\xf5\x9a{\xf1\xdc_\
-{\xcd\xdd^S\x8f\xc5s\x9d<\xbc\xc6i\x91\x8f!\
-\x9c\xd2IR\x9f\xe11\x1f\x1d\x1e\x17\xf5\x00\x80\xf6\xea\
-3[\x5c\x8c^=\xa7>\xb3\xd5\x13\x14\xc9\xe35\x97\
-\xd49\xd3\xa9\xc7\xf0`\x5c\xce\xa7\xed>}\xf7\xf0\xdc\
-_\xfa\xcd\xa4\xf8\xb7\xfc\xe6\x7f\xf2\x9cQ\xd7\xfd/<\
-g\xd4u\xb7\xe7\xbe\xfb\xed\x8d\xd7f;\x19%\x1c\x07\
-i\x14\xaaMm\xd8\x10\x1b\x17\xac\xd2|i\x9a\x93~\
-<&\x0b\xcf\xf4b}\xabQsZ\xe7\xd4d\xba\xbd\
-\xd5\xe0s\xdd\xa6\xb7>\x06\x04Ft\x0d\xacYZ\xa8\
-\xbb\xe3\xde\xc9\x15\x84\x8f\xd4\xc9z\xa5\x8e\xbcB\x19\x13\
-\x83f?d\xaf\xb03T \x8c\xda\x1a\xe99O\xe3\
-\x1a\x8c\xe5k\x8ae\xa45fs\xf8Dj\x08}p\
-\xf7\x9azw\x08\x92\x22\x06\xd8@\xb4\x07\xd9}\xa6\xb4\
-J\x99\xb1\x86X\xbbe\x80\xe4\x9a\xa9L{V\x1c\xcb\
-\x5c\xe1\x85\xdac\x0a\xd8h\x95Qt\xea\xf8%\x8d\xca\
-*f\x94\xde\xf6\x80\xc3\xa7\x8b\x0b#\xe1\xf7\x8c\xc7\x0a\
-\xf1\xec\x18\xc3\xf0\x9fd\xdb\x8e5\xfe\xecx\xac5}\
-g4\x9fBweu\x00el\xcb\x00\xa1\xf5\xe9\xc3\
-j\xde\xc5.-\xf9\xe4@\x1b\xc0\xc3\xe9\xe32x$\
-O\xebY{\xf0\xfbl%nM\xa5\xc3G\xd0f!\
-O\xc9\x9e\xab\xd5\xbaA\x0a\xfc\xafg\x07\xa0k\xacf\
-\xf8\xdd\xcf}Y\xcf~\xdc\xb96\x80\x98\xb5\xebmm\
-\xc7h\xc2\x82\x06K\xe1\xca\xb8g\xda+_ON\x9c\
-K\xe7WK\xdc\x95\xbc\x13X\xf5\x15_'\xd2\xcc\x1a\
-\x99\x89\xe3c+j\xb0\x12\x92\x98\x16\xfb\x8cQ\xfd\x9e\
-H]`\xdd\xce\xd4\x89\xb3k\x94\xf2\x16Z5Z|\
-\x19\xdbVp:\x5c\x01\x09\x9bIDJg\xf46\xfb\
-JS\xb9\xf8\xdc2F\xfe\xb4\xca\xeb\xf1\x9d\x95Lw\
-\xff\x1b+\x19\x96\xf5\x07Vz9.+af\x14\xc0\
-\xc0\xc3\xa1\xb8E\xd06/\xe0\x19\x12\x9b\xba\xf6\xf3\x17\
-2F\x9e\xf6\x1e\xcf?@\x04^V\x18\xd0\xa5\x1c$\
-\xad\x9e\x9a\x0c\xaf\x11\xc6u\x86\xff9\x87\xdf\x91\xd8]\
-\x0e\xba0\xa2\xe4,\xfb\xc4I\x1b\x09}3d\x8d`\
-\xf6\xda)\x8e\xbd\x5c\xcej&\xd6\x17f\x12\xd6\xf7\x12\
-[\xdc\x03\x97\xe8=SoI\x02z\xb7j\x9b(\xdb\
-5Y\x06\x8a\xb9\xe7\xd3\x0a,\xf0\x0b\x9f\x88]\xc4\x22\
-\x18r\xd3W\xc2\x1a\xdf\xcf\xb0<\x1cf\xbc\xeb\xc7\x16\
-g}\x84\x11\xdc\xc2%\x180\x91\xd2%\xc3]a\xb6\
-z\xa1\xa7\xce9\x87\xfd\x163\xe7h~\x83\xc9\xc3\xdd\
-\xee\xb8\xfb\x1bJn\x8c\x98/ y\x82\xc8\xc1\xd6#\
-\x94~\xc5\x88\xf9\x0e\x92\xa7\x10\xbbW%N\xf3\x08S\
-F\xa1\x12r\xe2\xd4P\xb9\x8e\x99\xea\x85\x8a6\x97\xa9\
-\xd1O\xef\xf8\xb2s\xd9\xad\xdc\x01R\xdc\x8f`\xfcv\
-\xbcVm\x9e\xc2\xa3\xed\xef\xd6\xc9\xb2m\x0fy\x5c\x18\
-jn\xb5\x8e\x97_\xc2\x83\xdb \xff/\xf6qv\x17\
-R\xbe\x0f\xbb\xcc\xb0\x93\xecz\xcd\x8c\xa4\xea\x7f\x8c\xe1\
-W\xafyh!\x9dU^\xcbNB\x02\x98\x16l\x81\
-\xd6\xaa\xe1\xb1E\x8fq7\x04\xc4u\x17|rC\xcc\
-\xd8\xdf0\xe8\xaf8\x80\x0b4\x12nTwRM[\
-\xabS\x01T\x92\xa5\x84a*\xb1\x17XI\xaa=\xbb\
-\x9a\x98\xcb\x15\x22\xfe5\x22\xb8\xb7\xf85;)\xa7\x22\
-(\xb9\xd7\xad\x9a\x12\xfe\x11\xd5\xf1\xc6y\x16A\xac\xb4\
-{\x8eJ\x04\x7f\x9cS\x00B:\xabv\xdbHF\xae\
-Q\xbcU\x8a\x83\xd82,\xb3\xaaXp\xe2\xaa@\x10\
-v\x96\x91u\xc63\xabw\x11\x0a{\x09\x9c\xba\xf0:\
-\xd3\x5c\x8d\xec\xe9\xf8S2\xc1N&\x08\xff\xc6\x93m\
-\xab\x8f\x03\x15Q\xda\xaa\x01\x93\xe4\xae\xd6a\x15a\xa3\
-U\xee\x13\xf7\xd7\xd1\xb1\x8a[\x03\xe1\x03\x5cP#\xe0\
-=\xed\x02NI\xbd\xd3\xcb\x97\xc7\xc6o_s\x0b\xb3\
-\x04Hiu\xd9\x14\x0c#^\xcf5\xf5\xe59o\xe6\
-q\x9e\xeb\x14\xb6\xa9\xefZ\x85\x8a\x093$\x0aZf\
-\xd2\x93^[\x97\xb1u\xd7\xe4\xee3u\xdd_q\xc6\
-\xcev3h\x9b\x90\x7f\xdfT\xb7\xbd\xf9\xde\x22s\x99\
-*n\xb7\x8d{p\xd5\xf5\x95\x0a\xf2\xf3LS\x99`\
-u\xb9\x7f\xbdZ<\xbevD\x89\xc5\x5cJ\xe4\xc4\xa0\
-\xac\x10\xc1k^\x9ahH\xab\xa4\xeb\xdd\xd5\xa9\xf2\xa3\
-G\xaa8\x8e\x19@\xa5N6\x5c~\x93/\xa2\x22R\
-\xf2n\x02\xdd \xd0\x06\x1c\x09\x1f\xaf\xa4\xb1\x86\x9a\x98\
-\x1d~j\xa9'\x02l\x94\xear\xc4\x8e\x14(\x14\x94\
-S\xca\x10$\xe4\x0c<\x01%\xda\x93P\xd4\xef\x02Y\
-G<\x97#\xb8\xa85\x8a!Q\xd7>e!\xa6w\
-\xef\xc0\xb8+\x90}\xcfY9\xcc\x05\xc0@\xe6A\x89\
-\x0a\x9a\xda\xee|\xb1\x00\xda\x08\x80\xbb\xc1\xa4\x09\x00\xe4\
-\xf62SIO\xc7\xd6\x1c\xd6\x0b\x81oa\xbd\x0a0\
-Qt\xd31`&\xf8;\xe1\x8a\x01\x04\x82o>n\
-\xbf\x12Kb\x9e\x95\x197]d7\xcf>\xa8\xb1k\
-\x8d\xb6\x06K<v\x22\x1f\x92=\xe3\x8b\xb7?}\xfb\
-p\xbe\xad\x863\xfe\xf2\x18\xd9\xe9W\x97\xfd\x0cP\xf3\
-\x8a\xd0\x7f\x0aP\xf3\x8a\xd0\x7f\x0aP\xf3\x8a\xd0_\x00\
-\x1a(Hxtz}tV\x1a\xa9\xb0\x064\xd2\x07\
-$\xdb\x11\xd7\xe2\xe0\xb9\x0c$\xd1\xec\x11\x8d\x0e@t\
-\x06\xca\x11H\xba\xa9\x0d4\xc4q\xeb6\xcdQsG\
-\xb0\xa2\x14\x0c\x96\xc1\x89\xe4\xf3\x9d\xfb\x1c\x1b\x17\xed*\
-{\xa3\x1a*\x0c\x18'U\x0b\xe9\x1d\x1c%\xc4\x0f\xd9\
-\x9c\x8a\x05p\x96\xed\x87G#\xfb\xad\xb3\xd2;\xcd\xd3\
-\xad\xe4\xd1\x094v\x84\xa2\xbd^\xc0-\x09:\xec\xa4\
-\x99\x84\x00M\x1b\x7fa\xf0\xb10\x12\xd5\xcd\x96\xb0\x08\
-\x90u\x96h\x00\x14\xceKk\x09J{\x8f\xe3\x1f2\
-\x95\xea\x920k\x0c\x98\xe9/n\x7f\xdcm\xfe\xdd\xed\
-\x8f\xbb\xcd\xbf\xbb\xfdq\xb7\xf9\x83\xdb\xc9B\x1e+u\
-\xf4\x04n\xa7\x94\xaa\xc3%\xd2\xe5\xd8Q\x95\x8a\xf6!\
-\x967\x88'\xef3\x5c\xc1\xe0PP\xa7>B\xf0P\
-\x9d2\xe4\xc6\xa3Tv\xc4wj\xaa<C\x17\xbcH\
-\xbdb\xa7\xc2\xc4\xc1\x1a\xe49\xfc\x8b\xc673\x1c\xd5\
-@m\xb5H\x88\xd4\xf7\xcaY\x14`\x14U#P\x8b\
-\xcb\x9a\xcb\x9d\x15\xac\x86\xe7\xfcv\xe5\xf4\xf1 \x91N\
-1\xe7x\x8a\xaa\x06\x06\x22\x9d\xe4\xe7'\x87VO\x8a\
-Ei\x0c4\x07\x9a,\xe9\xa5U\x97\xb0\x18\x8c\xca\x18\
-\xd6\x90\xaa\xd8\xa8\xd9\xcf\xa5\xab\xce\xde,\x95L~O\
-\xea+h\x14r\x89\xc72\xcf\x86\xc2LMe\xc6\xaa\
-\xca\xc5=:J\x02\x92\xa3\xa6\xd9\x02b\xe3\x85\xa3\x07\
-\x06\xd1\x0b\x1b\x82\x9cn\xbf\x1b\xc6\xdf\xa0\xfc\xc91\xe6\
-w\xc7\xfe\x19,\xcc\xbf\xc7\xf4u\xb7\xf9\xf7\x98\xbe\xee\
-6\x7fx{\xc9\xd2A\xe4\xea\xb9Vl9`\x00$\
-\x18\xd2\xaa\x90\x13\xa9\x02P#T\xd9P\xb3\xf7-+\
-AD%\x88\x85/|,\xdaf\x13\x9b3\x10\xaa(\
-~\xae\xecT\xf2\xb9\xceC\xbc\xab\x1d\x0a\x11\x9cC1\
-\xd2\x0c\x95\xa8\x16\xfb\xab\xa1\x0a\xdbX\x8c\xe1\xc9\xc1-\
-C@^\xb5\xb9\x17\xa5\xe5\xad\xbd\x04t\xab \xd6\xc9\
-\xb5\xac\x8f$&u6\xe1O\x1b\xa5\xab\xf2xn\x18\
-\x89D\x8b~MUzHs\xa2z!|\x90'[\
-\xf5\xb2\xf6\x98\xf6\xba\xf0\x12x\xe8\xa1X\xd5\xbcZn\
-Ac\xc80g\xee\xb9\x9e\x99\x92I\xcfL5\x97*\
-vH\x16Sx\xa6\x14,\x88\xa8\x1c\xaa\xcc\x87U\xd5\
-\xec\xbeNR\x01\xf9n\x9eO\x93\x8c\x9fst\xcfS\
-\xb4\xd7$sOh\xe8&i\x98\xe2\x9d~\x888l\
-\x1a\xf1[;t?K\x8cK\xa7\xb4\x90\xd2\xaag\x87\
-\x8e\xdcQ\xbc\xb5j\x1b\xb9zW\xc4\xdb\xa2\x1d\x96\x9c\
-fr&d\x0a\x9f\xacIs\x10\xee\x0d\xa1\x81\xaf\x01\
-\x04\xae\x9cd|h\x81\xa4\x99\x04UD\x16w\xd4\xbc\
-'\x16\x07b\xe1\x1ck\x19\xfb\x98\x8d\x94}\xacvl\
-F]2\xddO\x0e.\x08\xdc9\xad&\x10\xbe_)\
-X\xd2\xc9\xc8\xc7F\xbe\x09D\xb6\x03\x897'\xcc\xe7\
-\xdc5\x08\xd6X\xf8D\xe5\xd2\x8bY\xdf[\xd5\xdcf\
-\xb5\x9aj\xa7\x9e&\xb9\xde\x99\xf7\xe9+\xf5\xc0\xa6\x16\
-\xa2\xe6\xc9\xb5\x94\xcb\xfd\xf1\x04\x08u\x16F\x8f\xfbG\
-\xf7\xf7\x9a\x03\xb8\xa2\x82`\xd5\x8d\xca$9Rj\xbf\
-\xff:\xc6\xd7'\xf5d\x08\x95\x92c\xc9V\xb4\x83\x9d\
-|\xeaa\xecIRl\x1d\x85\xc5\xb0h\x8d\x9c-\xb5\
-d\x5c\xbd\xa1\xe5jc*\xc3#BJ@Lr%\
-\x96\x91i<\x00\x1b\x1dz,YW\x8eS\xdeZ\x84\
-\x9a\x8b\xa2!\xc7\xda\xb4o\xae=T(\x9b*\xccw\
-mmaus+\x1f\xf5\x031L-\x8f\x0f\x8b\x0e\
-\xca\x14|\xefd\x1a\xa4\xed\x99\xc2^%\xee\x9f|\x1a\
-\xcc\xfb\xe7[UfK\xcf\xa3\xc6n\xa1\xf6\xf8\x9aZ\
-jnc>\x94\x8e\xdc\x9e6\xff\xc4\xd5\xef<m\xfe\
-\xbe\xab\xb5=\x8cr\x96l\xf1\x07\xa1\x92\xc3\xc0\x91\xe6\
-\x90\x00\xa7\x1du\xeb\xce\xa3\xa0cK$\x8c\x02\xac\x19\
-\x9c\xb2\x11\xb1\x87\x1e\xaeY;\xe4n\xad\x0a'\x86\xa9\
-M\x10\xa1(\x0b\xb1-\x82\xa9T\x93\x03\x12\x0c\x92t\
-+\x8bD\xe2k\xa2\xe5Qw\xd4\xd5n\xe0\xda\x98\xb0\
-ET\xbb0]\x0cSz\x7fkp\xa3\x16\x7fop\
-\xcd\x07\x13F\xa7\x08\x86\x14\x03r\x17\xd2\xc6\xd4gG\
-\xcc\xabE\xfb~\xc0\xd9|\xc5sxC\xa9\x1f\x19\xe6\
-\x1a\xd0\xee\xb6\xb0X\xbd\xdaR\x85\x1c\xb2U\x00V\xf3\
-\xdd\x1be\xff@\xa7*\x03Q\xc9\xc8\xcf\xbe\xfbx\x9a\
-\xa06\xdd\xcc\xd79~\xcf\x0eL0R\xe6\xc6\xa1\xd1\
-\x86\x03\x10\xe7\xc9NU\xd9*|\x17v$\x82(\xe7\
-\x8d\xb3\xaby-\xba\xfd\x8e\x91\x00\x8a^\xfb\x10\xda\x8f\
-\xa8Z\x8aP\xbf'\x8a\xa9A\xb4\xe5\x1f\xdb/$8\
-gb\xb6\xa3\xc5\x82\x96Fmk\xb7\x97gf\xa8\xb3\
-[b\x09\x81AB$\xc4|\x07\x1f\xf06\xbc\x06;\
-\x22s\x17\xf4ye\x95\xa9\xc6n\xc5 \xdck#\xfb\
-\xa4\xea\xf8\xba\xae\xa6`\xa0\x06\xacTKh\xefL%\
-\xe5|$8\x1c\x8a\xaf\x0d\xaf;\x7f\xe4\x03\x0a\xfe\x99\
-\xe1\xe1\xce$%D\x8f\xf2\xa7\xfc\xa3\xc8\xa1\xac:\x06\
-fH\xa0/\xe9@]\xfd\x80\xa1\xbf|\x05O^>\
-\x9c\xd1ng@lT\x0bn\x11\xe2:\xc1\x1d/0\
- \xc94 \x9an\x86 \xdd\x97\x85\x84\xc7\xbeIX\
-=\xc9\x19|D\x18,bKy{\xce\x8bF(\x02\
-\xa9\x140x.\x94\x97\x05\x9f\x96<Pp\xa8\xd6p\
-?E\x87\x88\x97?\xcfs\xc8CS7\xa8#\x0c\x10\
-\xc9g\x86YO\x8d\x197f\x16\xe5#\x02\x92J\xc8\
-\xcdY\x85\x0a\xb5\x91\x8c(k1#|\xa1\xd6\x85o\
-g\xca\x1a\xacE% \x14Sy&!\x82rh_\
-\x8d\xd0s\xd0N\xb6[\x9e|9X9Y\xdb\x92&\
-wHu\xfe4\xbfD\xe1\xa7\x93HL\xc2\x9e\x9ef\
-\x83?\xe6\xd0\xb6\xe6\xc4\x02\x94\x88T^\xa0\xb3\xb7\xc3\
-k]\x7f\xc4\xaf_\x13\xac\x13\x9a9\x01B\xb9O\x80\
-\xc0\x19\xe0\xf7\xadON\x01\xf7az\xc1\xadA{\xb4\
-c_a\x8e\x92\xc2k\xc1\xbf\xb8\xbbQym\x8f\xc4\
-o\xf0\x22\xb9%\x04\x0aw\xbb\xe7lG\xd1\xf1{\x8f\
-\x1d\x00S\xd2'\x98\xa7lmqEc\x95\x83\xeb\x86\
-\xf3Qx\xb0Y$/\x87]\xa24\x16\x9e\xb1\xecd\
-\x91\xfc\xa9\xae\x86Fp\x8b\xba;\xf4Q\x17\x0f\xe2d\
-\xd7\xca.0\xaa'D\xaa\xa6\xa3\xee\xf2Eq\xf9\x90\
-\xdf\x12\x8a\xc7\x9e\xd7\xfah\xea\xc5\xd7\xa6\xa1/wH\
-\xb6P\x1cR\xd1ti1\x0f\xcf\xe3\xd3\xddPM\xa7\
-\xa1\x8aw\x89\x05\xea\x06\x8c\xa6\xdaPwQ\xcb\x15\xa7\
-\xc9\xbfi\x14\x1b\xe9\x91\x229\x95>\x9b\xee\xbbE-\
-XWAc\xe9\xf6D\x8ag\x178\x1e%\xa4\xad\x94\
-Z\x93v\xdb\xa0\x0d\xb0J\xaa\xdb\x11d#9S1\
-\xda\xea'\x023T\xd5\x90\xb0\x5c\xd9\xd4`=X\xca\
-\xad\xbc(\xc1\xe0\xb3M\xa1\xe4\xbb\x06-\x81\xacTH\
-y\xab\xca\x19\x87\xa6\x18\xb3\x84\xdc!\x7f\x12)\xd7:\
-\x02\x1c\xd3\xc8\x9c0\x1c6\x9d\x11A\x07\x13\x04-\x95\
-\xb0\xee>\x908A\xf3:\x946\x0a\xbb\xc1\xbfI7\
-\xea\xa6w\xc4M\x1e\x96\x0f\x99\x86\x92\xbe\x83\xd3(i\
-%Apw\xc7\x8c(\xd0\xa9\xf5\x1a(M9\xa6[\
-\xb3i#v\xabb\xe3\x0ba\x92\x1az\x93\x1c\xe5)\
-\xb7\x88\x8a\xa6/\xaa\xf8Y\x82v\xf5\xd10\x9a\x12\x1a\
-\x97\xfb\x03\x5cu\xe3\xd2\xbe\x97\xb7\x83R\x22\xa6\xe5\x11\
-\x11\xda\xe0\xd1\xe6\x18hoE\x9bd\x90\xeb,\xba\x95\
-@\xf9\xa8\xed\xea\xfe:\x0c)\xb1&U\xf6\xb6\xc2\x87\
-\xa5\xed\xca\x9c\x8d\xee\xee\xad\xe0\xf3\xe1h\x5c+]\xbb\
-/p\xee\x08\x93\x9c\x0c\xd3k\x97\xe2T\x92\x83\xe5M\
-\xe07\x08{\x10\xe2($\xbb\xe6e\xd1\x92\xd1\xc8\x06\
-\xc0rv,\xb9\xa4\x90\xd7f*<.h\xeb\x95\x1a\
-1\x11\xc9#\x12\xd4\xb8\xc4\x8d\x9ag'K\xa4n?\
-\xda\xdc\x1fP2O\xd8\xb2\xae\x1e\x04\x0auOc\x01\
-\xc3\xc6\xfc\xb1\x97Qj\x00\xfe\x0fDz\xc0\xea\x9c\xae\
-\xc2\xa2\x13\x5c\xa2\xa8\x11\xdc\x88\xc4~\xdeb\xab=\xe5\
-\x1f\x9b\xfe*\xd7b\xcb\x8b\xe2\x8aI\xfa\xd3\x04\x1c\xb5\
-\x9a\xa5\x92\xfe$\x14\x95p\xc7\x878\x97`\x842\xca\
-\x0c,\x09-\x92yp\xc8\xc8B\x88\x8b\xec0kP\
-)\x05\xe4|\xd0F\x13\x8a0\x1cUK\xd0Sl\xa3\
-h\xc2 \xb6\x09\xff\xd6A\x83\x16H\x98M\xce\x96\x12\
-\xc1\xaf\xad\xb5\xbd\x0e\xfc\xaa\x85;`]\x0d|\x19=\
-\x0b\x15\xe4\xac.\x95\xf0\x16\xc3\xdaqc6Tq\xd0\
-1\xc48\x81\x8b/\x03{oj\xb9\xa9\xed\xf0@D\
- \x88\xa0\x10\x03\x98QJ\xe4\xf4\x1e\xc2Y\xdb\xbd2\
-\xd8\x18}J\xf9~md\xac}\x92\x91J\x0dP\x0e\
-\xf5`\x01\x5c\x93\xc1\xab\xca\xd5\x11\x0d\xf6b-0:\
-\x90>\xdb!\xa0\xf3\xea\x9e\xa1]R\xc0\x0f\x82I\xe2\
-B\xc5iYZu\xa7\x93\x0cK}\xe3\x98\xafB\x07\
-\xa2\x18\x83\xdc/\xba\xa7\x99\xc8\xd21_\xe1\x02\x0f\xc1\
-\x85!\xdaf5{5\x19\xa3\x06\xcc\x80\xfdl\xd2P\
-guC\xb1\xb4\xe5\xe4\x13\xd5\x0c\xcd\x1b0\xa2\xb5\xf2\
-\xcf\xdb\xa8\x16\x06=oT\x9dmTt\xe5\xe9\xbbE\
-\xaaq\xd6\xf7\xd8B5\xaf\x5c\x87@\xa8\x5c\xab\x80\xd2\
-mJ\xd2f\x15}\xe5e\xad\xb3\x13\x07\x03\xc2U\x02\
-7!\xda\x80\x8f\x9b\xb5,;5\xf7\xe36j|\xaa\
-\x95u\x92\x0fJt`\x03*\xbcY)Hp\xb6F\
-\x18\xb9\x02\xc5AjQ\xb9u\xea;\xef\xd1\x87Y\xbb\
-Q\xa7\x890\x8dn!\x90$w\x03\x98\xf5\x9cL\x0d\
-\xfbRMvt|\x22\xceN\xfb%|\x8c\x80\x13\x9e\
-\xc6\x00&\xda\xf8d\x08\xf3\x18\x83\x93\xa7\x93\xda\xed\xd2\
-B\xf81D\x8b\xcau\xcb\x87\xecf\x0cV\xcb^h\
-{\x93\xf4\x11\x12\xb3\x17\xf2\x95\x08Y\xc4\xe2\xf8Zp\
-\x07\x92i\xa0\xab`\xfa\x15\xb5j LT\x84\x12\x19\
-\xd2!*D\xbd\x10,\xd1W2\x02\x97 :<4\
-\x8eK{\xd5f]\xb7\xd4&%\xd9\xaa[\xfc\x89\xd8\
-\xd0\xd6\xb3\xdb\x5c\x047\xfb3\xfd%W\x89N^R\
-\xe5\x1d\xd0\x17\xd0\xe8\x18H2\xcah!l\xc5\x99\x8c\
-J\xd1\xb6p\xe9\x88\xe1r\xe9\x0c\xf0L\x92]\xaa\xfc\
-<\xd4L\xc5\xe7\xb3\xb6e\xa9V2\xfc\xd2\x8bf,\
-4/\xc2\xcf\x03`\xe61\xc5hW\xc4\x0f\xb0\xdc\xb5\
-(\x84\xfeW\xcb\x1b\xd1\xe8KNE\xc6t\xb0\x90\xbe\
-\xdb\xb1N\x0cM\x97\xe5\x12\xd1<Na\x02\xfdA+\
-<\xcf\xcc\x18K'\xfd\x0c\x82\x8e\x08\xed\xe8\xfeo\xae\
-\x05b\x80\xda\xe9n\xa8w\x98A_fiT\x9d\x84\
-\xad$\x0d\xa1x\xd5kdJ(EK\xa6\xd5\x88\x14\
-rc\x9b\xbd\x83?R\x04\xa9{ed;@\x93\x0e\
-\xf8\x94\x1b\xaaS\xbaOZ\xf2\xc5Y\x97\xed-VG\
-\xbd\x86\xaa^]u%\xca~\xd5 \x1eX\x07$\xc5\
-\x82\xae\x98:t\xa1\xb2\x14,\x13J\xea\x18 \xca\x1c\
-\x07\x8e9\x12\x1f\x09\xb4+\x0c\xa9/\xa7\x1c\xcf|3\
-\xb7\xfb\x0az\x1d3\x5c@\x1d\x1fH}\xe0\xb4\x9bo\
-\xf6x\x83\xf4\x17\x94>\xdd\xfe\xb8\xfbj\xd6\x81\x804\
-\xe0|$\x11\x15\xa4D\x84\xd4P\xc8)k\x90Z\xf0\
-> \x1b\xfe\xeab\xe6J^\x8e\xe9\xbc=\xb0\xc6\xd2\
-\xf7\xaa\x96\xaf\x10[OL\x03\x9c\xac|m.\xf6\xf0\
-\xfb\xb61\xf1\xe1\xee\xf6\x8f\x05S\x98\xc7\xe0\x06\xc5\xca\
-\xba\x9a\xbfH\x8d\xe1[\x9d\xfa\xe2\x13\xb1;\x00\x1cu\
-\x1a\xde#s5\x95\x84p\xb5 \x0cH\x04\x88\x16m\
-\x13_\xbbIC4\xfa\x8b\xda\x15\xc7\xd4\xab\xda\x81\x97\
-O+\xc3\x91\xf6\xbd%{\x91#\xd1\xee\xa4\x7f\xf4\xa5\
-\x96{Zz\xd7]\xb6\xb6{\xdb\x11\x06\xe3\xe0\x08a\
-Ih^\xfd#\xab\xfdJ\xd4\xb1\xf6\x7f\xfbc\x8a\xc8\
-\xc1\xd3\xddr\xe8\x93\x85\x5c\xb9\x8b\xf8k\xacKd\x98\
-\xa1\xfb1\x87{\xaf\xb1~\x1cI\x9bmEr\xc4w\
-\xfd\x12\xd9\xf8U\xba?\xf7\x92\x8e>\x17z\xb6I\xcb\
-\x95\xffP_\xf3R_([ \xae\xf5\x9e\xef\x94D\
-\x88\x96|\xbdT@\xb9\x80\xc6!s\x22q\x04k\x1b\
-m{\xbaEA\xc4\x841\xe7 /\xe2?\xf8]\x04\
-N\x0e)@\x5cy.\x17s\xa9\x1aE,nX\xaa\
-\x92\xfaa\xd6cT}\x1d\xf6\xb2+X\xad\xba\x87/\
-\xa7\xd7\xafHG\xbf\x22\xa2\x0bLMh\xe6\x02hP\
-7\xe8S\x94bv!\xd7\x0c\xa5\x7f\x18\xe8o\x19\xbb\
-\xdf6\xa2\xaexg%\xf3\x04\x87\xdbJ\xeee\xd2\x1f\
-X\xb8\xda\x08\xe3t\x9a\xf3g=\xa9%3%\xfb6\
-\xefn\x8a\xdf\xe0v\x9e\x90\xce\x8bk\xd5\xea~<>\
-\xc6\x15\xda\x96\xd0\xd7\x15\xd0\x8f\x86\xa5\xcc\x8aj\xc0\x1d\
-\x0b\xd1\xfe\x0c\x04\xf4\xaf6m\xa8R\xd0\xba\x0e&\x85\
-\x7f*(G\xf7S\xbb0\x0c\x19P\xb4\x8c\xcd\xc4\x80\
-!1Pu\xddo>\xf8\x9c\xff\xfa\xcd\x87wG\xf4\
-7!G\xee\xc7\xfc\xd7{W\x05\x1e+\xfa\x86\xdaT\
-\x86\xafL\xb0\xa1\x9dt=\xd9N\xd5\x97\xbau\xab/\
-\x92\xa14t\xc7F\xdf\xcb\x98+^\x12\xc8\xa82\x09\
-\xac\x8a\xe9Y\x22Z\x1a\x95\x1eE\x8d\xee\xb3\xc4\x15\x90\
-oH\xac\x94\xad\xb6\xf1a\x11\x15\xe1\x98\xa5\x1f\xd9t\
-\x89\xa6c\xdb\xe9\x8d\xaa&\x95\x5cd\x8f\x88\xde\xa1`\
-[:\xaa\xaf\xfav\x1e\xc9\xb5\x97\x1c\x82\x8e\x02\x1b,\
-\xed\x93h\xf1\x05`Ie\xed\xc8sm\x86\x0dd\xcd\
-R\xecx{^c\xc0]x\x8fp\xc2RU\xebc\
-}\x99(\xf5\xbc\x7fy\x8bL\x8f0$\xe9\xf6\xbf\xc5\
-\xb0\xf3\xf5\xb4U\xc3\x9c\x00\x00\x00\x06bKGD\x00\
-\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHY\
-s\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\
-\x00\x07tIME\x07\xe2\x06\x13\x06;\x08lP\x06\
-@\x00\x00 \x00IDATx\xda\xed\x9dy\x9c\x14\
-\xc5\xd9\xc7\xbf,\xcb)\x02\x0ah\xe1\x81\x18Q\xc1\x83\
-KQT\x04<\x11Q\x13\x8d\xc63j\xbc\xe25\xb9\
-\xd4\x88G\xa2\xb9<\xf2\xe6\x8d1\xe3\x11\x134\xbe1\
-*\xdeFEQ\x11\x01/\xf0\x04O\x82\xa8xR\x08\
-\x0a\x02\x02\xca\xb1\xef\x1fU\xeb\x0e\xebT\xef\xcc2\xbb\
-\xd3\xdd\xf3\xfb~>\xfd\xd9\x99\xae\xea\x99\xd9\xa7\xab\xeb\
-\xd7OW\xd5\xf3\xb4@\x88\xd4`Z\x01]\x01\x03l\
-\x04t\xf3\xaf;\xd7\xdb:\x01\xeb\x03\xed\x806@G\
-\xa0\x15\xd0\xa1\xc0/Z\x0a\xac\x04\x16\x03+\xfc\xb6\x04\
-\xf8\x02XTo\xb3\xc0|\xe0S\xffz\x01\xd8\x95:\
-W\x22\x0d\xb4\x90\x09D\x82\x04\xa2=\xb0\x95\xdf\xbe\x03\
-l\x01l\xe6\xb7\x1e\xc0\xc6\x09h\xd35\xc0<\xe0\x03\
-\xe0#\xbf\xbd\x0f\xbc\x0b\xbc\xe36\xbbL\xe7ZH@\
-\x84h\x9cPl\x06\xf4\x01\xb6\xf7\x7f\xfbx\xd1\xd8\xa4\
-B\x0c\xf0\x89\x17\x93\xb7\xfc\xf6\x86\xfbk?R\xdb\x10\
-\x12\x10!\x9cP\xb4\xf2\x221\x00\xe8\x9f\xb3u\x94m\
-\xf2\xb2\x18\x98\x9e\xb3\xbd\xe2\xc4E\x8f\xc4\x84\x04D\xa4\
-_0z\x01\xbb\x00\xbb\xfam\x00\xd0ZvY'\xbe\
-\xf6B2\xcdo\xcf\x83\x9d-\xb3\x08\x09\x88H\xb2X\
-\xb4\x04\xfa\x02\xc3\x80!\xc0P\xdc\xa0\xb6hz\xe6\x03\
-S\x80\xa7\xfd\xdf\x19`W\xcb,B\x02\x22\xe2,\x1a\
-\xdb\x03\xfb\xfam(\xe5{\x14\xb5\xdaw\xa2\xf3\xfc\xf6\
-\x19\xdf\x9e\x1d\xb5\x04XN\xdd\x8c\xaa/\xfc\xb1+\x81\
-/\x8f\xc6\x0e\xde\x06n\x07\x98\x05G\xdf\x8e\x99\x0a\xac\
-\x87\x9b\xad\x05n&W\xed\xcc\xadv\xb8Y]\xf5g\
-{u\xc1\x0d\xeco\xec\xc5\xb3e\x99\xec\xb1\xd8\x0b\xc9\
-\x04\xb7\xd97\xd4VE)\xa8\x96\x09\xc4:\x08\xc6\x06\
-\xc0\x01\xc0H/\x1a\xdd\x9b\xe9\x8b-0\x1bx\x0f\xf8\
-\xb0\xde6\x17\xec\xfcu\xfd\x82\xdd\xa1g\xed\xeb\xae`\
-o\xc7\xce)\x81\xbd\xba\xe1&\x02l\x06l\x9e\xb3m\
-\x09\xf4\xc2M9n\x0a:\x02\x07\xf9\x0d0s\xbd\x98\
-<\x02<\x0a\xf6s\xb5e!\x01\x11\xcd!\x1a;\xf8\
-\x8eh\x94\xebg\xa9j\xa2/Z\x0e\xcc\xc4\xcdBz\
-\xd3o\xb5\xd3\x5c\xbfL\xa6\xed\xec|\xef\x19\xcd\x08\xd8\
-v=\xea\xa6)o\xe7\xb7>@o\xef\xe5\x94\x8a\xee\
-\xc0\x0f\xfd\xb6\x06\xcc\xb3\xc08\xe0!\xb0\xaf\xab\x8d\x0b\
-\x09\x88(\x95`\xb4\xc0\x0dx\x1f\x0a|\xdfwn\xa5\
-\xe6\x13\xdc@p\xee\xec\xa2\xf7\xc0\xae\xa9,[\xdb/\
-\x81W\xfdv_\xce9\xa8\xf2^J\xeel\xb5\x01\x94\
-fZs\x15n\x8cj\x08p9\x98w\x80{\xfc\xf7\
-O\x03[\xa3k@H@DcD\xe3\x18/\x1a\xa5\
-\x5c\x7f\xb1\x04x\xdeo~\xe6\x90\xb5\xb2y\xa4\xb0\xac\
-\xa9\xf3\xbe\xb8;\xe7<\x19\xeaf\xb4\xed\xe2\xb7\xf5\xd7\
-\xf1\xcb\xb6\x02~\xe9\xb7O\xc0\xdc\x0b\xdc*1\x11\x12\
-\x10\xd1\x90p\xec\x08\x1c\x0b\x1cI\xce\x18\xc0:2\x0f\
-x\x0a\x98\x8c\x9b\x15\xf4j\xe5y\x16M&,\x16\xf8\
-\x8f\xdfj=\x95\xbe\xd4\xcdz\x1b\x8a\x1b\xc0o,\x9b\
-\x00g\xfbm\x0e\x98;\x80\xdb\xc0\xbe*\xdb\x0b\xd0,\
-,\xe1\x06v\x8f\x05N\x04\xfa\x95\xe0\x03\xbf\x00\x9e\xc4\
-\x0d\xd2>\x01vf\x12\xad\x92\x85\xe1\xfe\xff\x00\xd8+\
-\x03\x93\x12z~{\x03\xfb\xe0&9\xec\x85\x9b=\xb6\
-\xae\xcc\x00n\xf6b\xf2\xa9\xae!\x09\x88\xa8,\xd1\xa8\
-\xc6\x0d\x82\xff\xc8\xff]\x17O\xb4\x06x\x117\x08;\
-\xde\xbdN\xfe\x9a\x83\xf4\x08\xc8Z\xe7\xbd%\xb03n\
-\xe6\xdc\x81\xc0\xa0u\xec\x03V\xe1fr\xdd\x84\x1b\x80\
-_\xa5k\xab\xb2\xd0#\xac\xca\x12\x8e\xcd\x81S\x81S\
-X\xb7)\xb7_\xfa\x8ec\x1c\xf0\xb0\xeeB\x93\x82]\
-M\xdd\x8a\xf5\xdf\x80\xd9\xc8\x0b\xc9(\xdcT\xec\xf5\x1a\
-\xd1\x7f\x1c\xec\xb7\xb9`n\x04\xc6\x80}_\xb6\x96\x07\
-\x22\xd2!\x1a-\x80\x11\xc0Y\xbe\xb3h\xec\xb4\xdb\x85\
-\xb8g\xed\xf7\xe2\x16\xa3-O\xb3\xd5\xd2\xe9\x81D\xb6\
-\x93\xb6\xc0~\xc0a\xc0w\x81\x0d\x1a\xf9Ak\xdcM\
-\x05\xd7\xe2\xd6\x98h\xe0]\x1e\x88H`\x87\xd0\x017\
-\xae\x91\x01\xb6i\xe4\x87,\xc6M\xe9\xbc\x037\x9e\xa1\
-G\x14\xe9\xf5NV\x00\x0f\xba\xcdT\x03{\x03G\xe1\
-f\xe1\x15\x13Q\xa0\x8a\xbaE\x8b\xb3\xc0\x5c\x03\xdc\x0c\
-v\x89l,\x0fD\xc4_86\x07~\x86{L\xd5\
-\x98P\x22_yOc\xac\xbb\x93\xb4_U\xa2\x15+\
-\xcf\x03\x09\xb6\xa76\xb8\xc7[G{\xcf\xa4M#o\
-D\xc6\x00W\x83\xfd@\xd7hz\xa8\x92\x09Rs\xa1\
-\xef\x08\xe6\x16\x5cb\xa2_4B<\xa6\x01g\x00\x06\
-\xec\x91`\xef\xabT\xf1\x10ky&_\x81\xbd\xdf\xb5\
-\x09\x8co#\xd3\x8a\xfc\x90\x8e\xbeM\xbe\xe3\xda\xa8\xe9\
-+\xbbJ@D<\x84c70\x0f\xe3V/\x1fG\
-q\x8f%?\x03\xfe\x04\xf4\x01;\x18\xec\xdf\xc0.\x92\
-ME@L\x16\xf962\xd8\xb5\x19\xfe\x07XP\xc4\
-\x07T\xfb6:\x03\xcc#`\xf6\x90M% \xa2<\
-\xc21\x1c\xcc$\xe0Y\xff\x88\xa1\x18&\xe3\xd6~l\
-\x0a\xf6\xbc\xa4\xae\xd5\x10e\x15\x93\x99`\x7f\x89\x0b\x0c\
-y\xacoS\xc5p\x00\xf0\xb4k\xc3f\xb8\xec)\x01\
-\x11\xcd#\x1c{\x83\x99\x82{>?\xac\x88\x03\xbf\x04\
-\xae\x07\xb6\x03;\x1c\xecmzD%J $_\xf9\
-\xb64\xdc\xb5-\xae\xf7m\xadP\x86\xb9\xb6l\x9e\x06\
-\xb3\x8f\xec)\x01\x11M#\x1c\x83\xc1<\x09<\x01\xec\
-Y\xc4\x81s\x80s\x81\xcd\xc1\x9e\x09\xf6-\xd9R4\
-\x91\x98\xbc\xe5\xda\x18\x9b\xfa67\xa7\x88\x83\xf7\x00&\
-x\x8fd\xb0l)\x01\x11\xa5\x11\x8e~`\x1e\x04\x9e\
-\xc3\xcd\x0c*\x94\x17\x81\x1f\x00\xbd\xc0\xfe/\xd8\x85\xb2\
-\xa5h&!\xf9\xc2\xb59\xb6\xf2m\xf0\xc5\x22=\x92\
-\xe7\xc0<\xe4\xda\xbe\x90\x80\x88\xc6\x08\xc7f`n\xc6\
-\x856?\xa8\x88\x03\x1f\x01\xf6\x01;\x08\xec]Je\
-*\xca($k|\x1b\x1c\x84\x8b\xc3\xf5H\x11\x07\x8f\
-rm\xdf\xfc\x9f\x9f\x9a.$ \xa2\x00\xe1\xe8\x04\xe6\
-2\xe0m\xe0\x04\x0a[\xabS\x83[\xbb1\x10\xec\x81\
-`'\xca\x8e\x22fb2\xc9\xb5M\x06\xe2r\x8d\x14\
-\xb2B\xbd\x05p<nA\xe2\xe5\xee\xda\x10\x12\x10\x91\
-O8\xaa\xc0\x9c\xe6\x85\xe3\x02\xa0m\x81\xc2q\x07\xb0\
-\x03\xd8\xef\x81}Ev\x141\x17\x92W\xc0\x1e\xe6\xda\
-,w\x14($m\x81\xd1\xee\xda0\xa7\xf9\xb0\xf5B\
-\x02\x22\xbcx\xec\x81{N|\x03\xd0\xad\xc0\x83\xee\xf3\
-\xc2q\x14\xd87eC\x910!y\xd3\xb5]v\xc0\
-\xc5W+\x84n\xfe\x1ay\x11\xcc\x9e\xb2\xa1\x04\xa4\xd2\
-\x85\xa3;\x98[q\x89\x96\x06\x14x\xd0\xa3\xee1\x80\
-=L\xc2!R\x22$\xdfwm\x9a\xf1\x05\x1e4\x00\
-\x98\x02\xe6vw\x0d\x09\x09He\x09GK0g\x03\
-3qic\x0b\xe1\x05`(\xd8\x03\xf4\xa8J\xa4P\
-H^\x01;\xd2\xb5q\x9e/\xf0\xa0\xa3\x80\xff\x82\xc9\
-\xf8\x5c'B\x02\x92z\xf1\x18\x84\x8b%\x94\xa5\xb0x\
-U\xef\xf9\x0beW\xb0O\xc9~\x22\xe5B\xf2\x140\
-\x18\x97V\xf9\xdd\x02\x0eX\x1f\xf8\xab\x13\x1d3H\xf6\
-\x93\x80\xa4U8\xda\x83\xb9\x0a\x98\x0a\xecT\xc0\x01\x8b\
-\x81s\x80\xde`\xefP^\x05QA\x22R\x03\xf6N\
-\x5c\xbc\xadspi\x92\x1bb\xa0\xbb\xb6\xcc_\xc0\xac\
-'\x1bJ@\xd2$\x1e\xfb\x00o\xe0\xc2\xac7d\xf3\
-\x1a\xe0F`k\xb0\x7f\x06\xfb\xb5\xec'*TH\xbe\
-v\xd7\x00\xdb\x00\xff\xa0\xe1\x19[U\xc0O\x81\xd7\xc1\
-\xec+\xfbI@\x92.\x1c\x9d|\x9a\xcf\x09@\xcf\x02\
-\x0e\x98\x0a\x0c\x02{\x8a\xd2\xc4\x0a\xf1\x8d\x90|\x0a\xf6\
-4\x5c>\xf7g\x0b8\xa0'\xf08\x98\x9b\xc0t\x96\
-\xfd$ I\xf5:^\x03N*\xa0\xf2\xe7\xb8\x5c\xe5\
-\xbb\x83}I\xb6\x13\x22\xaf\x90\xbc\x0c\x0c\xc1%K\xfb\
-\xac\x80\x03~\x04\xbc*oD\x02\x92$\xe1h\xef\xd3\
-xN\x00\x0a\x09\xc1p3\xb0-\xd81\x1a\xe7\x10\xa2\
-A\x11\xa9\x01{#\xd0\x1b\xb8\xa9\x80\x036\xf7\xde\xc8\
-\xb5\xee\xda\x14\x12\x90\xf8\x8a\xc7\xce\xc0\x0c\xe0\xac\x02*\
-\xbf\x0d\x0c\x03\xfb#\xb0\x0bd;!\x8a\x12\x92\x05`\
-Ov\xd7\x10\xb3\x0a8\xe0Lwm\x9a]d;\x09\
-H\xdc\x84\xa3\x0a\xcch\x5c\xc4\xdc^\x0dT^\x0d\xfc\
-\x11\xe8\x0bv\x8al'\xc4:\x09\xc9\x14\xa0\x1fp\xa5\
-\xbf\xb6\xa2\xe8\x05<\xe3\xaeU\x85C\x91\x80\xc4C<\
-6u.2\x97\xd3p:\xd9\x19\xb8\xf5\x1c\xe7\x83]\
-!\xdb\x09Q\x12\x11Y\x01v4\xb0\x8b\xbf\xc6\xa2\xa8\
-\xf6\xd7\xea\x13\xfe\xda\x15\x12\x90\xb2\x89\xc7H\xdf`\xf7\
-.\xc0\xeb\xb8\xcc5p\x0d\x92\x0b\xd1DB\xf220\
-\x08\xf8C\x01\xde\xc8p\xdc\x00\xfbH\xd9M\x02\xd2\xdc\
-\xc2\xd1\x12\xcc\x15\xc0\xc3@\x97\x06*\xcf\x02\x86\x80\xbd\
-Hk:\x84hr\x11Y\x09\xf6b\x5c\x86\xc3\xff6\
-PyCw\x0d\x9b+\xc0T\xcbv\x12\x90\xe6\x10\x8f\
-M\x80\x89\xc0\xf9\x05T\xbe\x0e\x18\x00v\xaa\xec&D\
-\xb3\x0a\xc94w\xedqm\x01\x95\xcf\x07&\xf9k[\
-H@\x9aL<\x86\x01/\xe3\x02\xbeE\xb1\x008\x04\
-\xecY`\x97\xc9n\x89\xa7\xadL\x90H\x11Y\x0e\xf6\
-l\xe0`\x7fMF\xb1\x07.\x03\xe20\xd9M\x02\xd2\
-\x14\xe2\xf1\x13\xdc\xda\x8e\x8d\x1b\xa88\x01\xe8\x07\xf6A\
-\xd9L\x02\x22b!$\x0f\x01}\x81\xc7\x1a\xa8\xb8\x91\
-\xbb~\xcd\xcfd3\x09H\xa9\x84\xa3\x1d\x98[\x80\xab\
-\x89\x9ee\xb5\x06\xb8\x10\xd8\x1f\xec'\xb2\x9b\x10\xb1\x12\
-\x91\xb9\xc0\x01\xb8l\x9fQ\x03\xec\xd5\xc0U\xee\x9a\xd7\
-\xc2C\x09\xc8\xba\x89\xc7&\xc0S\xc0q\x0dT\x9c\x0b\
-\xec\x0d\xf6r\xad&\x17\x22\xb6\x22R\x03\xf6\x0aw\xad\
-2\xb7\x81\xca\xc7\xe1\x92Vi\x5cD\x02\xd2(\xf1\xd8\
-\x19\x97f\xb6\xa1\xd0\xeb\x13\x80\xfe`'\xcbfB$\
-BH\xa6\xb8k\x96\xc7\x1b\xa8\xb8\x93\xeb\x03\xcc\xce\xb2\
-\x99\x04\xa4\x18\xf18\xd2\xdd}\xd0P\xba\xcc+\x9c[\
-\xac\xc8\xb9B$LD>\x05F\xe2\x16\x15F\xd1\xdd\
-{\x22G\xcbf\x12\x90B\xc4\xe3B`,\xd0.\xa2\
-\xd2R\xe0\x08\xb0\x17\x80]-\x9b\x09\x91H\x11Y\x0d\
-\xf6B\xe0\xfb\xfe\x9a\x0e\xd1\x0e\xb8\x0d\xcc\xc5\xb2\x99\x04\
-$$\x1c-\xc1\xfc\x1d\xb7\x8a5\x8a\xb7q\xe1H\xee\
-\x96\xcd\x84H\x85\x90\xdc\xeb\xaei\xden\xa0\xe2\xef\xc0\
-\x8c\xd1\xa2C\x09H}\xf1\xe8\x00<\x84\xcb\xc9\x11\xc5\
-\x13^<\xde\x94\xcd\x84H\x95\x88\xbc\xe9E\xe4\x89\x06\
-*\x9e\xec\xfa\x0a\xb3\xbel&\x01\x01L7`2n\
-\x8a_\x14\xd7\xbb:v\xa1l&D*Ed\xa1\xef\
-\x07\xaeo\xa0\xe2\x08\xd7g\x98n\x12\x90\xca\x16\x8f\x9e\
-\xb8\x14\x99\x03#*\xad\x01\xce\x02{&\xd8U\xba\xc8\
-\x84H\xb5\x88\xacr\xd7:g\xf9k?\xc4\x00\xe09\
-0[J@*S<v\x04\x9e&:\x7f\xc72\x5c\
-H\x92\xebta\x09QQBr\x1dp\x10\xf0eD\
-\xa5\xad\x5c\x1fbv\x94\x80T\x96x\xec\x8a\x9b\xa6\x1b\
-\x95\x0f`\x1e0\x14\xec8]LBT\xa4\x88<\xe2\
-\xfa\x00lD%\xbf\xd8\xd8\xec*\x01\xa9\x0c\xf1\x18\x8e\
-\x8b\x89\xd39\xa2\xd2[\xc0`\xe5\xee\x10\xa2\xe2E\xe4\
-e\xd7\x17\xf0VD\xa5N\xb8\xbc\xeb{W\x9au*\
-L@\xcc\xde\xb8\x1c\x1e\x1d#*=\xef=\x8f9\xba\
-x\x84\x10`\xdf\x07\xf6\x04\xa6ETZ\x1f7;k\
-?\x09H:\xc5\xe3\x10`<\xd1\x0b\x04\x1f\x03\xf6\x02\
-\xbb@\x17\x8d\x10\x22GD>\xc3\xc5\xd0z4\xa2R\
-;`\x9c\xefk$ )\x13\x8f\xbb\x81V\x11\x95\xee\
-\x00\x0eV\xfe\x0e!D@D\xfc\xa4\x1a\xc6FTj\
-\xe5\xfa\x9a\xca\x10\x91\x0a\x10\x90\x82\xc4c\x0cp\xacR\
-\xce\x0a!\x1a\x10\x91\xafq\x91zo\x90\x88\xa4^@\
-\xcc\xa8\x02\xc4\xe3z\xe04\xc5\xb4\x12B\x14(\x22\xab\
-\x813\x88N\x97[\x11\x22\x92b\x011{\x03w5\
- \x1eW\xfa\x05\x82\xca\xe1!\x84(FDj|\xba\
-\xdc+\x1b\x10\x91;\xd3<;+\xa5\x02bv\x05\xfe\
-C\xf4\x80\xf9\x95`G\xebB\x10B\xac\x83\x90\x8cn\
-@D\xda\x00\x0f\xa6u\x9dH\x0a\x05\xc4\xec\x88\x9b)\
-\xd1A\xe2!\x84\x88\x81\x88\xb4\x07\x1eK\xe3\x8a\xf5\x94\
-\x09\x88\xe9\x05L\xc4-\xec\x91x\x08!\xe2\x22\x22\x1d\
-]\xdfd\xb6\x96\x80\xc4S<\x8c\xf7<\xbaFT\xfa\
-\x8b\xc4C\x08\xd1\x84\x22\xf2\xe7\x88\x0a]]\x1fe\x8c\
-\x04$^\xe2\xd1\x09x\x04\xf8ND\xa51\xc0/\xd4\
-\xc8\x85\x10M\xc8\xb9\xc0?\x22\xca\xb7\x04\xc6\xfb>K\
-\x02\x12\x03\xf1h\x0d\xdc\x03\xf4\x8f\xa84\x168]\xb3\
-\xad\x84\x10M\xec\x85\xd4\xe0\xa6\xf8\xde\x1eQ\xa9\x1fp\
-\x9f\xef\xbb$ e\x14\x8f\x16\xc0M\xc0>\x11\x95\xc6\
-\x01'h\x9d\x87\x10\xa2\x99Dd5p\xa2\xef{B\
-\xec\x05\xdc\xec\xfb0\x09H\x99\xb8\x0486\xa2\xfc9\
-\xe0\x07Za.\x84hf\x11\xf9\xda\xf5=<\x1bQ\
-\xe9h\xe0\xb7\x12\x90\xf2x\x1f\xc7y\x01\x091\x13\xc5\
-\xb6\x12B\x94OD\x96\xb9>(2\x14\xfc\xc5`\x8e\
-\x97\x804\xafx\xec\x89{t\x15\xe2c`\x84\x8f\xa0\
-)\x84\x10\xe5\x12\x91\xcf]_\xc4\xc7\x11\x95\xc6\x80\x19\
-&\x01i\x1e\xf1\xe8\x09\xdcK8D\xc9\x12\xe0 \xb0\
-\x1f\xa8\xf1\x0a!b \x22\x1f\x02\x07\xfa\xbe)\x1f\xad\
-\x80{|\xdf&\x01iB\xf1X\x0f\x17\xa2$\xb4\xd6\
-c\x0dn\xccc\xba\x1a\xad\x10\x22F\x22\xf2\xaa\xeb\x9b\
-X\x13\xa8\xd0\x05x\x00L\x07\x09H\xd3\x88G\x0b\xe0\
-_@\xdf\x88Jg\x83\x1d\xaf\xc6*\x84\x88\xa1\x88\x8c\
-w}T\x90\x1d]\x1f\x97\x9c\x99YI\xf2@.\x06\
-\x0e\x8b(\xbf\x0a\xec\xf5j\xa4B\x88\x18\x8b\xc8\xf5D\
-\xafV?\x14\xf8\xb5\x04\xa4\xb4\xde\xc7\x08\xe0\xd2\x88\x0a\
-\x8f\x01\xe7\xa9q\x0a!\x12\xc0/\x89N\x8d{\x09\x98\
-\x03$ \xa5\x11\x8f-\x80\xdb\x22~\xeb\xdb\xc0QZ\
-((\x84H\x88\x17\xb2\xda\xf5Y\xcc\x0aTh\xe1\xfa\
-\xbc\xf8\x0f\xaa\xc7\x5c@L\x1b\x5cF\xc1\x0d\x03\x15\x16\
-\x03\x87\x80]\xa8F)\x84H\x90\x88,\x02\xbe\x0b|\
-\x11\xa8\xb0\x81\xeb\xfbL[\x09H\xe3\xf9\x0b\xb0sD\
-\xf9q`g\xaa1\x0a!\x12(\x223]\x1f\x16d\
-'\xdf\x07J@\x1a\xe1}\x1c\x0e\x9c\x1eQ\xe1\x0f`\
-\x1fT#\x14B$XD\x1e\x02~\x17Q\xe1\xc7`\
-\x8e\x90\x80\x14'\x1e[\xe2\xc2\xaf\x87\x98@t\x18\x13\
-!\x84H\x0a\xbf\xc1M\x04\x0a1\x06\xccw$ \x85\
-\x89G+\xe0\x0e\xc2Y\x05?\x04\x8e\xd6\xa0\xb9\x10\x22\
-%^\xc8j\xe0\x18\xdf\xb7\xe5\xa3#06\x8e\xe1\xdf\
-\xe3\xe8\x81\xfc\x0e\x18\x14([\x05\x1c\x09v\x81\x1a\x9d\
-\x10\x22E\x22\xf2\x99\xeb\xdbX\x15\xa80\x88\x18F\xee\
-\x8d\x99\x80\x98\xa1D\xaf\xe7\xf8\x15\xd8\xe7\xd4\xd8\x84\x10\
-)\x14\x91\xe7\x80\x8b\x22*\xfc2nA\x17c$ \
-\xa6\x13pK\xc4oz\x94\xe8\xa4\xf5B\x08\x91t\xfe\
-\x07\x08\x85c\xf2\xe1\x9cLg\x09\xc8\xb7\xb9\x06\xe8\x11\
-\x92f\xe0x\xa5\xa4\x15B\xa4\xdc\x0b\xa9q}\x1d6\
-P\xa1\x87\xef+% 9\xde\xc7\xf7\x88\x9e\x0f}\x12\
-\xd8O\xd5\xb8\x84\x10\x15 \x22\xf3\x81\x1fET86\
-.S{c  \xa6\x0b\xf0\xb7\x88\x0a\xd7\x82}D\
-\x8dJ\x08QA\x222\x1e\xc8FT\xb8\x0eL7\x09\
-\x08\xfc\x15\xd88P6\x13\x05I\x14BT&\xbf$\
-\x9c\x0e\xb7\xab\x13\x91\x8a\x16\x10s8n\xfes>V\
-\xb92\xbb\x5c\xedH\x08Q\x81^\xc8\x0a\xdf?\x86\xa6\
-\xf6\x1e^\xeeGYe\x14\x10\xd3\x99\xe8\xc1\xa0?\x80\
-}E\x8dH\x08Q\xc1\x222\xdd\xf5\x85A\xb2\xe5\x9c\
-\x95UN\x0f\xe4J\xc2\x8f\xaef4`4!\x84\xa8\
-\x14\xfe\xe0\xfb\xc4|l\x8c\x9b\xfa[I\x02b\x86\x02\
-\xa7\x05\x0aW\x01'\x82]\xa9v#\x84\x10v\xa5\xeb\
-\x13\x83\x8f\xb2N)\xd7\x02\xc32\x08\x88i\x03\xdc\x10\
-\xed\x99\xd8\xe9j4B\x08\xf1\x8d\x88L\x07.\x8f\xa8\
-p\x83\xef[S\xef\x81\x9c\x0b\xf4\x0e\x94\xbd\x0d\xfc^\
-\x8dE\x08!\xbe\xc5e\x84\xb3\x18n\xeb\xfb\xd64\x0b\
-\x88\xd9\x82\xe8X/\xa7\xf9\x99\x07B\x08!\xd6\xf6B\
-V\x10~\xf4\x8f\xeb[\xcd\x16i\xf6@\xae\x02\xda\x05\
-\xca\xfe\x09v\x92\x1a\x89\x10B\x04Ed2pS\xa0\
-\xb0\x9d\xefc\xd3( \xe6\x00\xe0\xd0@\xe1g\xe5p\
-\xbf\x84\x10\x22\x81\x9c\xe7\xfb\xcc|\x1c\xea\xfb\xda4\x09\
-\x88\xa9&:\xb7\xef\x05`?W\xbb\x10B\x88\x06\xbd\
-\x90\xcf]\x9f\x19\xe4j\x9f\x98/5\x1e\xc8\x99\xb8A\
-\x9e|<\x0f\xdc\xa8F!\x84\x10\x05s\xa3\xef;\xf3\
-\xb1\x8d\xefs\xd3  f\x03\xe0\xd2@a\x0dp\x16\
-\xd85j\x0fB\x08Q\xb0\x17\xb2\xc6\xf5\x9d\x84R\x5c\
-\x5c\x02f\xc34x \x97\x00\x1b\x04\xca\xfe\x09\xf6E\
-5\x06!\x84(ZD^$\xfc\xf4&\xea\xc6=)\
-\x02bzE\xb8RK\x89\x9e\xd2+\x84\x10\x22\x9a\x8b\
-}_\x9a\x8f3|\x1f\x9cX\x0f\xe4\xb7@h0\xe7\
-r\xb0V\xe7_\x08!\x1a\xed\x85\xcc\xc3-0\xccG\
-5M\xbc0\xbb\x09\x05\xc4\x0c\x00\x8e\x0e\x14\xbeO3\
-\xcfW\x16B\x88\x94r\x150'Pv$\x98\x81I\
-\xf4@\xae\x8cv\xbb\x94\xe7C\x08!J\xe0\x85\xacp\
-}j\xa3\xfa\xe28\x0a\x88\x19\x0e\xec\x17(\x9c\x01\xdc\
-\xa6\x93.\x84\x10%\xe3v \x14\x84v_\xdf''\
-\xc6\x03\xb94\xa2\xecBM\xdb\x15B\x88\x92z!k\
-\x88^\x5cxiB\x04\xc4\x0c\x07B\xb1\xe9'\x83}\
-X'[\x08!J.\x22\xe3\x81I\x81\xc2a`\xf6\
-M\x82\x07rYD\xd9h\x9dd!\x84h2\xa2\xbc\
-\x90\x92\xcf\xc8*\xb1\x80\x98\x11\xc0n\x81\xc2G\xc1N\
-\xd5\xf9\x15B\x88&\xf3B\xa6\xba\xbe6/\xbb\x96:\
-\xd0b\xa9=\x90f\x7f\x06'\x84\x10\xa2\xe0\xbe\xb6\xa4\
-O\x81J( f0\xe1\xb1\x0fy\x1f\x22i|%\
-\x13\x88\x14z!\xc3\xc0\xec\x16G\x0f\xe4By\x1f\x22\
-Eh\x9d\x92H\xab\x17ra\xcc\x04\xc4\xec\x00\x1c\x1c\
-(|R\xde\x87\x10B4\xbb\x17\xf2D\xa0\xf0 0\
-;\xc6\xc9\x03\x89\xca&x\xb9N\xa6\x10B4;Q\
-}\xefy1\x11\x10c\x80c\x02\x85/\x80}\x5c\xe7\
-Q\x08!\x9a\xdd\x0by\x82p\xd2\xa9\xa3|\xdf]v\
-\x0f\xe4l\xc2\x11w\xaf\xd4I\x14B\x88\xb2\x11\xea\x83\
-[\xf9\xbe\xbb\x9c\x02b\xda\x01\xa7\x07\x0a\xdf\x03\xee\xd3\
-\xf9\x13B\x88\xb2q\xbf\xef\x8b\xf3q\xba\xef\xc3\xcb\xe6\
-\x81\x1c\x07t\x09\x94\xfdE1\xaf\x84\x10\xa2\x9c\xd85\
-\xae/\xceK\x17\xdf\x87\x97M@\xce\x0a\xec\xff\x02\xb8\
-I'O\x08!\xca\xceM\xbeO.\xa6\x0foj\x01\
-1\xbb\x01\xfd\x02\x85\xff\x00\xbbT\xe7M\x08!\xca\xee\
-\x85,u}r^\xfa\x81\xd9\xa3\x1c\x1eHH\xb9j\
-\x80\xebt\xd2\x84\x10\x226\x5c\xe7\xfb\xe6|\x9c\xd1\xcc\
-\x02b\xba\x02G\x04\x0a\x1f\x01\xfb\x9e\xce\x97\x10B\xc4\
-\xc6\x0by\x0f\x08\xa5\xd28\x02\xccF\xcd\xe9\x81\x9c\x00\
-\xb4\x8eP:!\x84\x10\xf1\xf3B\xf2\xd1\x1a\xf8as\
-\x0a\xc8I\x81\xfd\xef9\x0fD\x08!D\xcc\x18Ox\
-J\xef\xc9\xcd$ f0\xb0]\xa0p\x8c\xa6\xee\x0a\
-!D\x1c\xb1k\x08\x0f\xa6\xf7iL\x94\xde\xc6x \
-!\xa5Z\x03\xdc\xac\x93$\x84\x10\xb1\xe5\xff\x80\xd5\xa5\
-\xf2B\x8a\x14\x10\xd3\x0e82P\xf8\x08\xd8Ot~\
-\x84\x10\x22\xb6^\xc8'\x84\x87\x19\x8e,vez\xb1\
-\x1e\xc8!\xc0\xfa\x812-\x1c\x14B\x88\xf8\x13\xea\xab\
-;\x00\xdfmJ\x01\x09\x8d\xd4/\x00\x1e\xd4y\x11B\
-\x88\xd8\xf3\x100?PVTh\x93\x22\x04\xc4t\x05\
-F\x04\x0a\xef\x00\xbbR\xe7E\x08!\xe2\x8e]\x09\xdc\
-\x19(\x1c\xe1\xfb\xfa\x92{ ?\x00\xaa\x03e\xff\xd6\
-I\x11B\x88\xc4\x10\xea\xb3\xab}__r\x019*\
-\xb0\xff\x1d\xa5\xac\x15B\x88Dy!S]\xdf\x9d\x97\
-\xa3K, f# \x14p\xebV\x9d\x0c!\x84H\
-\x8d\x17\xb2\x07\x98\xee\xa5\xf4@\x0e\x8b\xa8{\xa7\xce\x83\
-\x10B$\x8e\xb1\x81\xfd-(p6V\xa1\x02\x12\x0a\
-\x9c\xf8_\xb0o\xe8<\x08!D\xd2\xb03\x81\x99E\
-\xf6\xf9\xc5\x0a\x88\xe9\x0a\x0c\x0f\x14\xde\xa5\x93 \x84\x10\
-\x89\xe5\xee\xc0\xfe\xe1\x85\xcc\xc6*\xc4\x03\x19\x85\x1e_\
-\x09!D\x1a\xb93B\x1bF\x95B@\x0e\x0a\xec\x9f\
-\x0d\xf65\xd9_\x08!\x92\x8a}\x0dx;Px\xc8\
-:\x0a\x88i\x03\x1c\x10(\xd4\xcas!\x84H>\xa1\
-\xbe|\x7f\xaf\x01\x8d\xf6@\x86\xe1\xe2\xa3\xe4\xe3\x01\xd9\
-]\x08!R+ \x1d\x08\x8f\x7f\x17$ \xa1g`\
-\x8b\x80\xa7ew!\x84H<O\x03\x0b\x03e\x07\xae\
-\x8b\x80\xec\x17\xd8\xff\x08\xd8U\xb2\xbb\x10B$\x1d\xbb\
-\x8ap\x88\xf7\x11\x8d\x14\x10\xd3\x03\xe8\x13(\x1c/\xa3\
-\x0b!Dj\x08\xf5\xe9\xdbz-(\xda\x03\xd9/\xa2\
-\xec1\xd9[\x08!R\xc3c\x8d\xd1\x82(\x01\x09\xb9\
-.\xaf\x82\xb5\xb2\xb7\x10B\xa4\x05;\xcf\xf5\xedy9\
-\xa0H\x011-\x80\xbd\xe4}\x08!D\xc5\xf0h`\
-\xffp\xaf\x09\x05{ \xdb\x03]\x8b\xfc\x12!\x84\x10\
-\xc9%\xe4\x1ct\xf5\x9aP\xb0\x80\x0c\x09\xec_\x0d<\
-';\x0b!D\xeax\x16X\x19\xf6B\x0a\x17\x90\xe1\
-\x81\xfd/\x82\xfdRv\x16B\x88\xb4a\x97\xb9>\xbe\
-p\xa7\xa2X\x01\x99$#\x0b!Dj\x99\xb2\x8e\x1e\
-\x88\xf9\x0e\xb0\xb1\x04D\x08!*\x8eP\x1f\xbf\xb1\xd7\
-\x86\x06=\x90]\x03\x1fP\x83{F&\x84\x10\x22\x9d\
-<\xeb\xfb\xfa|\x0c.D@v\x0b\x1c\xfc&\xd8\xc5\
-\xb2\xaf\x10B\xa4\x15\xbb\xd8\xf5\xf5y\xd9\xbd\x10\x01\x19\
-\x1c\xa1LB\x08!\xd2\xef\x85\xe4c\x97\x06\x04\xc4\xb4\
-\x01\x06\x04\x0e\x9e&\xbb\x0a!D\xea\x99\x1a\xd8?\xa0\
-~~\x90\xfa\x1e\xc8\x8e@u\x91\x1f*\x84\x10\x22=\
-\x84\xd6\xfaU\x03}\xa3\x04$\xe4},\x03f\xca\xae\
-B\x08\x91zf\xf9>?\x1f\xfd\xa3\x04d\xa7\xc0A\
-3\xc0\xae\x96]\x85\x10\x22\xed\xd8\xd5\xc0\xf4@\xe1N\
-Q\x02\xd2?p\xd0+2\xaa\x10BT\x0c\xa1>\x7f\
-`@@L\x15\xf5\x9eo\xe5\xf0\x92\xec)\x84\x10\x15\
-\xc3\xcb\x81\xfd;x\xad\xf8\x96\x07\xd2\x13h\x178h\
-\x86\xec)\x84\x10\x15C\xe8\x11V;\xaf\x15\xdf\x12\x90\
-\x1d\x02\x07\xd4\x00o\xc9\x9eB\x08Q1\xcc$\xbc\x22\
-\xbdo>\x01\xd9>Py\x8e\x8f\xd2(\x84\x10\xa2\x22\
-\xb0\xcb\x80w\x02\x85\xdb\x17\xe3\x81\xbc&c\x0a!D\
-\xc5\xf1F`\xffv\xf9\x04\xa4w\xa0\xf2\xeb\xb2\xa3\x10\
-BH@\xeakE\xae\x80\xf4\x0aT\x9e%;\x0a!\
-D\xc5\x11\xea\xfb{\xd5\x13\x10\xd3\x0d\xe8\x18\xa8<[\
-v\x14B\x88\x8a#\xd4\xf7w\xf4\x9a\xf1\x8d\x07\xb2U\
-#TH\x08!D\xe5y \x00\xdb@]\xe0\xc4\xad\
-\x03\x95\x16\x83\x9d/;\x8aJ!\x0b\x07\xfb\x1b\xaaM\
-sv\x1f\x9cus\xdf\x1f\xcb\x84s%\x08\x912\xec\
-|0\x8b\xc9\xfft\xaa\x17\xf0L\xad\x80\xf4,\xd2\x85\
-\x11\x22\xad\xec\x0d\xec\xc5\xda\x8bj\xf7\xc6\xc5\x00z\x17\
-\x09\x88\xa8,fS/|\x89g\x8b\x5c\x0f\xa4G\xe0\
-\xe0\xf7e?QId\xe0\xe7\xde\x13\xe9O]<\xa0\
-\x9fg\xe0~YGT s\x02\x02\xb29\xd4\x8d\x81\
-\x84\x04\xe4C\xd9O\x08!*\x96\x90\x06\xf4(D@\
->\x90\xfd\x84\x10B\x02R\x8f-$ B\x08!\xa2\
-\x08i\xc0\xe6\x00\xd5`\xd6\x07\xda\x17\xa9>B\xa4\x92\
-,l\x09t\x02\xb6\xcd\xd9\xbd\xa5\x1f\x13\xf9 \x03\x9f\
-\xcbJB\x02B{0\xebW\x01\xdd#\x0e\x9e'\xfb\
-\x89\x0a\xe3*\xdc\xe0\xf9\xd8\x9c}\x7f\xf6\xfb\x0e\x91y\
-D\x85a#\xca\xbaW\x01\xdd\x1ay\xb0\x10i\xe44\
-\x9c\x172*g\xdfY~\xdf\xdd2\x8f\xa80\xa2\x9c\
-\x88n\xd5\xc0&\x81\xc2\xa5`\x97\xcb~\xa2\x92\xc8\xc0\
-\xa7\x00Y\xe8\x9c\xb3{Y\xc6Mg\x14\xa2\xd2\x1c\x90\
-\x15`\x96\x02\x1d\xf2\x14nR\x05t\x0d\x1c9W\xc6\
-\x13B\x88\x8a'\xa4\x05\xdd\xaa\x80.\x81B\x850\x11\
-B\x08\x11\xd2\x82.U\xc0\x06\x81\xc2E\xb2\x9b\x10B\
-T<\x0b\x03\xfb;W\xb1\xf6\xb3\xdeB\x0e\x12\x22\xb5\
-d\xe1\xd6\xac\xbbyz*g\xf7uYX\x94\x85c\
-d!Q\x81\x84\x9c\x89\x0d\xaa\xe5\x81\x08\xb1\x16\x7f\x05\
-\xee\xc2\xcd\xba\xfa\xb3\xdf7\x06\x98\x08\xbc,\xf3\x08y\
- u\x1eH\xb5<\x10!\xea\xc8\xc04\xef\x89\xf4\xcf\
-\xd9\xfd\xb2\x82)\x0ay \xdf\xf6@\xaa\x08g\x22\x94\
-\x07\x22\x84\x10\x22\xe4Lt\xac\x02Z\x07\x0a\xbf\x92\xdd\
-\x84\x10\xa2\xe2\xf9:\xb0\xbfu\x94\x07\xb2Tv\x13B\
-\x88\x8a'\xa4\x05\xebW\x03m\xf3\x95\xf4\xc7\xaewr\
-8S\xa1\x10\xcd\xc5\x82L3\xde\xccd],\xac\xfa\
-\x19\x09\x7f\x9b\x85\x9f\x01\xbf\xce\xc0\x03\xcd\xf8[:\x10\
-^\xe8+D\xb3p#v\xbd\xe9\x98|E\xed\x22\x04\
-\x84kp\x9b\x10\xe5\xe4G\xc0\xcd\xcd\xf8}\x13q\x99\
-87\x05\xce\xf5\xfb\x9e\x06\x9e\xa7\xf9S<\x1f\x0e\xfc\
-SM@\x94\x93\x81\xc0\xf4\xfcEm\x82\x02\xb2\x9e\xec\
-&*\x90\x0c<\xe8\xef\xfe\xfb\xe7\x08\xc8c\x99\xe6\x15\
-1!bC\xbbpQ\xfb*\xa0\x8dL$\x92F\x16\
-\x86g\xf3<\xde\xc9B\xef,\xec\x90g\x7f\xd7,\x0c\
-\xcf\xb3\xbf\xda\x7fV\xe7\x22\xbe\xbbW\xbdi\xbe\x91\xdf\
-\xd1\x98\xdf+D\x02hU%\x1b\x88\x84\xf2$0$\
-\xcf\xfe\xd1\xc0\xef\xf3\xec\x1f\xe2\x8f\xa9O\x07\xbf\xbf\x7f\
-\x11\xdf}6\xf0\x97\x22\xbe\xa31\xbfW\x88\xd8S-\
-\x13\x88\x98\xd3;tW\x0f\xec\x90\xfd\xf6z%\x03t\
-\xc8s\xcc\x0e\xb5\x9e@\x1e\x01\x01\xe8\x9f]{\x7f\xaf\
-\x88\xdf\xb0\x19\xd0\xb9\x88\xefh\xcc\xef\x05\xe8\xad\xd3/\
-\xe2L\x0b05\xf9\x0a~\x82ek\xd9G\x08!*\
-\x9a\xd9\xc0\xd5\xf9ga\xa1GXB\x08!\x1aE\xf0\
-\x11\xd6j\xd9F\xc4\x83+\x81\xf1y\xf6?\x09\xfc\x0a\
-7\xc56\x97\xd1\xb8\xc7R\x17\xd7\xdb?\x04\xf8\x1dn\
-\x8dG.\x1dp3\xaf~\xce\xda\xb3\x15{\x01\xff\x08\
-\xfc\x86\xb3}\xf9\xcf\x0a\xfc\x8e\xc6\xfc^\x80\x03\x80\xf3\
-\xd5\x04D9Y\xd5\x18\x01\x11\x22&\xcc\xcc\xc0\xa4\xfa\
-;\xfdx\xc5\xeb\xf5\xcb\xb2p\x22\xd09\xcf\xfe\xce\x00\
-\xa1\xfd\xc0\xf4\xdc\xb2zc\x153\xeb\x95}\x0f\xe8Z\
-\xe8w4\xe6\xf7\xfa\xb2\x9e:\xfd\x22\x91\x1e\x88\x101\
-g/\xe0\xf5<\xfb\xaf\x08\xb4\xeb\xa7\x03\x9e\xc1R\xbf\
-\x7fz\x11\xdf}\x0d\xf9sD\x87\xbe\xa31\xbfW\x88\
-D\x08\xc8Wh-\x88H\x18\xf9\xee\xd8\xfd\xfe\x99\x81\
-\xfd\x0b\xc8sL\xc6y\xe8\x93\x8a\xfc\xee\xd9\xc5|G\
-c~\xaf\x10\x09`e5\xb0\x22\x9f\x80|)\xe3\x88\
-\x0a$\x0b\x07\x03[\xe1B\x99\xd4\xb2\xbf\x7f<\xf5X\
-\x06\xde\x94\x95D%\xb1<\x5c\xb4\xacV@:\xd5/\
-\x99\x0eg\xef\x04\xe3d>Qf\x164\xf3\xf7\xed\xcd\
-\xb7\x83)\x0e\x01\xb6\x03\xde\xa5y\x05\xe4\xeeb\xbd#\
-!J\xcd\xcbp pm\x9e\xa2\xafZ\x80\x99\x03l\
-\x91\xa7\xf0G`o\x96\xf9D\x85z\x22\xfd\x81Wj\
-\xaf\x05\xc5\xc2\x12\x95\x8b9\x91\xfcA=\xdf\xaf\x02\x16\
-\x07\x8e\xea \xc3\x09!D\xc5\x13\xd2\x82%U\x84\xb3\
-Mi`]\x08!D(k\xed\xd7Q\x1eHg\xd9\
-M\x08!*\x9e\x0d\x02\xfb\x17W\xf3\xed\xe0n\x0d\x1d\
-$Dj\xc9\xc2\xae@w`\xcb\x9c\xdd\x03\xfd\xc2\xc2\
-\x973\xf0\x81\xac$*\x8c\x903\xb1\xb0\x1aX(\x0f\
-D\x88o\xf8\x090\x0ah\x99\xb3\xef\x14\xe0x\xe0L\
-\xe06\x99H\xc8\x03\x01`\x91<\x10!r\xc8\xc0\xb1\
-\xde\x13\xc9\x9d\x85u\xa6fa\x09y \xdf\x16\x90\xaa\
-\x08\x01\x91\x07\x22\x84\x10\x22\xe4L,\xac\x02>\x0b\x14\
-v\x93\xdd\x84\x10\xa2\xe2\x09i\xc1gU\xc0\xfc@a\
-w\xd9M\x08!*\x1e\x13\xd8?\xbf\x1a\xf8$P\xd8\
-\x01L;\xb0\xcbe?Q)da#\xa0=\xb0I\
-\xce\xee\xae>\xb4\xfa\x82\x8c\x8b\xde+D\xa5hG[\
-`\xfd@\xe1'Q\x1eH\x94\xf2\x08\x91V\xfe\x0e\xbc\
-\xc7\xdaq\xe0\xfe\xc7\xef;\x5c\xe6\x11\x15\xc6\xc6\x11e\
-\xf3\xab\x80\xb9\x8d<X\x884\xf2s`\x00pT\xce\
-\xbeK\xfc\xbe\x07d\x1eQi.HD\xd9\xdcj\xb0\
-K\xc0,\xf3n{}6\x07\xa6\xca\x86\xa2R\xc88\
-O\xa36\x83`-\x1fd\x8aK8%DZ\xe8\x11\
-\xd8\xbf\x0c\xec\x92\xaa\xda\x0b\xa4\xc8\x83\x85\x10B\xa4\x9f\
-\xcd\x03\xfb?\x04\x90\x80\x08!\x84(\xd6\x03y\xbf\x10\
-\x01\xd9\x5c\xf6\x13B\x08y Q\x1e\xc8\x87\x81J[\
-\xc8~\xa2\x92\xc8\xc2UY7\xdeqG\xce\xee\xdff\
-az\x16\x0e\x91\x85D\x85\xd13\xb0\xff\x03\x80j\xff\
-\xe6\xbd@\xa5^\xb2\x9f\xa80&z\xf7|S\xe0\x5c\
-\xbf\xefi\xe0y`\xb6\xcc#*\x8c\x90\x06\xbc\x0f\xd0\
-\xc2\xbd6\xbb\x03\xcf\x04*n\x04v\xbe\xec(*\xcc\
-\x13QJ[Q\xe1\x98n\xc0\xa7\x81\xc2!`\x9f\xa9\
-}\x84\xf5v\xc4\xa7l#C\x0a!D\xc5\x11\xd5\xf7\
-\xcf\x82o\xc6@\xec|\xc2\x99\x09\xf5\x18K\x08!*\
-\x8fP\xdf\xbf\xb8\xf6\xa9TU\xce\xce\xd9\xf2@\x84\x10\
-B4\xd0\xf7\x7f\xa3\x15\xb9\x0223Py{\xd9Q\
-\x08!*\x8eP\xdf\xff\x8dVT\xe7\xec|3\x7f\xdd\
-\xea\x01\xd9\xf0T.!\xd2@+\xbe\x1d\xf7m\xeb\xdc\
-\xd7Y\x18R\xaf|\x1e\xb0R\xa6\x13i\xe5Jl\xff\
-\x8f\xf2\x87\xc2z3\x9f\x80\xbc\x96\xffcV\xf5\xf8\x0a\
-\xdek#{\x8a\xca\xe5B\xbf\x09Q\x11\xac\x04>b\
-3`U\xbe\xe27j_\xe4>\xc2z=\xf4as\
-eO!\x84\xa8\x18>v\xceC\xa8\xf8\xf5|\x1e\xc8\
-\x1c`9\xd0\xae~\xed\xe7\xe1\xa6\x9e\xf0\x94\xcc\xda\xec\
-\xac\x87\xcbEQ{N\xde\x05\xae\x01\x16\xca4%\xa5\
-\x07\xf0\x9b\x22\x8f\xb9\x84p\x08 \xd1x:\x03g\x03\
-[\xf9\xf7+\x80\xf3P\x22\xaff\xe5y\xd8\x138)\
-O\xd1r\xdf\x0f\x01\xdf,$\xac\xc5L\x03v\xc9s\
-\xd0u`\xcf\x92Y\x9b\x9f\xac{\x16\x7f/\xb0\x83\xdf\
-e\x81C3\x0a\xb3_J\x1b\xe7.\x1a,\x94\x01\x0a\
-\xf1^\xf2\xf3\xb0\x0bp?u\xe9\xb4_\x07\x8e\xc8\x84\
-'\xf8\x88&\xc3\x5c\x03\xe4\xeb\xf3_\x00\xfb\x8dFT\
-\xd5+\x0c]D\xfde\xd0\xf2\x90q\x8b<w\x01\xfe\
-U{f\x81\xc9Y8A\xd6\x11)\x12\x8fc\x81)\
-9\xe2q+\xb0\xab\xc4\xa3l\x0c\x08\xec\x7f9\xf7M\
-u\xbd\xc2\x97\xc2\x02bZ\x82]-\xbb\x96ED\x96\
-\x03'da\x06\xee\x91Vk\xe0f\xef\x9d\xfc*\x03\
-5\xb2\x92H\xa8p\xb4\xc0=\x0e\xbc\xc4\xefZ\x03\x8c\
-\xce\xb8v.\xca\xe3}\xb4\x8cp\x1a\xd6\x12\x90\xfa\x1e\
-H\xc8%o\x0fl+\xc3\x96]H\xfe\x0c\x8c\x02\xbe\
-\xf0\xbb.\xf2B\xd2Z\xd6\x11\x09\x14\x8fV\xc0M9\
-\xe2\xb1\x188X\xe2Qv\xb6!\x7f\x86Z\xa8\xf7\x94\
-\xaa\xbe\x80\xbcJx\xe8}\xb0\xec\x1a\x0b\x11\x19\x0f\xec\
-N]\x08\xfe\xe3\x81qY\xe8$\xeb\x88\x04\x89GG\
-\xe0!\xe0D\xbf\xeb#`H\x06\x1e\x96u\xca\xcen\
-\x81\xfd\xab\xbcF\x84\x04\xc4~Ex\x1cD\x02\x12\x1f\
-\x11y\xd3\x9f\x8fZ\x8fq_`J\xb6\xee\xf9\xb1\x10\
-q\x16\x8f\x8d\x80\xc9\xc0\xfe97\xae\xbbe\x82k\xd1\
-D3\x13\xea\xebgx\x8d\x08z \x00\xd3\x02\x07\xef\
-.\xbb\xc6JD>\x01\x86\x01\x8f\xf9]}\x81\xa7\xb2\
-u\xd3\x1f\x85\x88\xa3x\xf4\x04\x9e\xa5\xee\x19\xfb\x04`\
-h\xc6y \x22\x1e\x84\xfa\xfao\xcd\xfc\xcc' \xcf\
-\x05\x0e\xde\x0eLG\xd96V\x22\xb2\x188\x08\xb8\xcd\
-\xef\xda\xca{\x22;\xca:\x22\x86\xe2\xd1\x1b\x97\x9c\xab\
-\xf6&\xe7v`T\xa6nLO\x94\x1d\xb3>\xd0'\
-P\xf8l!\x02\x12Z_\xd0B^H,Ed%\
-n\x1c\xe4\x06\xbfk\x13`\xa2DD\xc4L<v\xc4\
--F\xde\xd4\xef\xfa;\xf0\xc3\x0c|-\xeb\xc4\x8a=\
-\x02\xbaP\xa8\x07b\xdf\xc5\x05\x8a\xcb\xc7p\xd97\x96\
-\x22\xb2\x1a8\x037K\x0b\xa0+n\xad\xc8\xae\xb2\x8e\
-\x88\x81x\xec\x84K\x15\xdc\xd5\xef\xfa\x13p\xbao\xb7\
-\x22^\x84\xfa\xf8y^\x1b\x1a\xf4@\x00&I@\x12\
-'\x225\x198\x07\xf8\xad\xdf\xb5\x01\xf0\x98DD\xc4\
-\xc0\xf3x4G<.\xce\xc0yZ\xbb\x14[\x86\x04\
-\xf6\xe7\x0deUULe` \x98\xf6\xb2q\xac\x85\
-\xe4\x12\xe0\x02\xff\xb6\xa3\x17\x11E\x12\x10\xe5\x12\x8f\x89\
-@\x17\xbf\xeb\x82\x0c\xfcA\x96\x89+\xa6=\xf9CY\
-\x81\x9b5W\xb0\x80L\x0e\xeco\x85\xc6A\x92 \x22\
-W\xd4\x13\x91\xc75&\x22\xca$\x1e]s\xc4\xe3\x0a\
-Y&\xd6\xec\xee\xfb\xf8|L*F@\xde\x00\x16\x04\
-\xca\xf6\x97\x9d\x13'\x22]\x81\x09Y\xe5\xb7\x17\xcd#\
-\x1e\xbdp\x0b^%\x1e\xc9\x22\xd4\xb7/ '\x07H\
-\x01\x02bk\x08\x8f\x83\x8c\x90\x9d\x13%\x22\xb5a\xca\
-7\x02&ea3YF4\xa1xl\x86[\xdb\xb1\
-\x89\xdfu\x99\xc4#1\xec\x17\xf6>lM1\x1e\x08\
-\xfe\x0e\x22\x1f}\xc1l,[T*\xb9n\x00\x00\x1c\
-\xa1IDAT'FD.\x05\xae\xf2o7\x05\x9e\
-\xc8B7YF4\x81xt\x01\x1e\x07\xb6\xf0\xbb\xae\
-\xcf\xb8xm\x22\xf6\x98\x8d\x09\x8f\x95>\x16:\xaa:\
-\xe2\x13\x1f\x8f(\x1bA]xq\x11\x7f\xce\x01:\x00\
-\xa7\xe2\x02\xa5\x8d\xcb\xba\x19u\xdb\xf9\xfd\x95Nc\x1e\
-\xed\xed\x9cu\xc9\x8f\x84\xcbQ\xf3\x01.\xb6Uo\xbf\
-\xef6\xf2\xe7\x93\x10\xf1$jh\xe2\xd1PA\x8b\x06\
-T\xe9\xad\x9c\x06\x91\xcbm`\x8f\x95\xcd\x13uw\xd8\
-\x12\xb8\x0b84\xc7\xc3\xdc\xc4y\x94B\xac\x13\xff\xc2\
-\x8dw\x1c\xe8\xdf?\x08\x1c\x96\x89\xc8\x89*b\xe7\x81\
-\xdc\x0a\x1c\x93\xa7\xe0\xbf`{\x87\x8e\xaaj\xe0SC\
-\xae\xcbH0\xd52zr\xf0\x8b\xb6\x8e\xa5n\x8a\xf6\
-\x01h<D\x94\x86\xddr\xc4\xe3\x19\xe0H\x89G\xa2\
-\xc4\xa3\xa5\xeb\xd3\x8b\xd2\x80\x82<\x90\xfd#\xdc\x97\xbd\
-\xc0N\x92\xf1\x13\xe7\x89t\xf2\x17\xf9\xf6~\xd7\x8d\xc0\
-\xbf+\xdc,\xbd\x80\x7f\x14y\xcc\xa9\xc0l\xb5(\x8e\
-\x06N\xf3\xaf\xdf\x06v\xcf\x84gp\x8ax\x0a\xc80\
-\xc2\x93\xa6F\x82\x0d\x8d\x87\xd3\x90\x171\x19\x97\xcc>\
-\xdfs\xf2\x83#\xbeT\xc4\xd7\x13\xf9\x22\xeb\xee\x16\xa7\
-\xe1\xd2\xe3\x9e\x0cL\xc8\xc0\xd8\x0a\x16\xd5E\x8d8\xec\
-\xc5J\xcf\x89\x9e\x85\xc3s\xc4c\x010R\xe2\x91H\
-\x0e\x09\xec_\x0a<\x19u`\x03\x8f\xb0\xecW\x11.\
-\xcc!\xb2{bE\xe4\x03\x5c\x14\xdf\xe5~\xd7\xcd\x0a\
-y\x22\x8a\x14\x8fA\xc0-\xfe\xedr\xe0\xbb\x19xG\
-\x96I$\x07\x07\xf6?V?\xffG\x91\x02\x02\xc0\x03\
-a\xb7\xdfhusrE\xe4%\xe0(\x5c\x0e\xea6\
-\xc0\xfd\xd9\xba\xb9\xfbBD\x89Gw\xe0~\xa0-.\
-\xa6\xd5\x0f3yB}\x8b$`v\x04\xb6\x0e\x14>\
-\xd8\xd0\xd1\x85\x08\xc88\xdf\xc9\xe4\xe3\x07:\x01\x89\x16\
-\x91\x07\x80\x0bk[\x92\x17\x91\xb6\xb2\x8c\x88\x10\x8f6\
-\xc0\xbd\xd4\xddl\x5c\x92\x81{d\x99\xc4\x12\xea\xc3\xd7\
-\xf8\xbe\x7f]\x05\xc4. <\xd6q\x84\xec\x9fx\xfe\
-\x88K\xec\x03\xee\xb1\xc4?d\x12\x11\xc1\xdf\xa8Ky\
-z\x1f\xf0{\x99$\xd1\x1c\x1a\xd8?\x09\xec\xfcRx\
- \xe0\xd6\x0f\xe4c[0\xbdu\x0e\x12\xed\x85\xd4\xe0\
-\x06\xd2_\xf2\xbb\x8e\xcbj\x01\x98\xc8\xef}\xfc\x188\
-\xd1\xbf}\x038^a\xd9\x93\x8c\xe9M\xddl\xcc\xfa\
-\xdc]\xc8'\x14* \xf7\x11n(G\xebD$^\
-D\x96\xfb;\x91\xda\x194WiP]\xd4\x13\x8fA\
-\xc0_\xfd\xdbE\xc0\xf72n\x96\x8eH.G\x05\xf6\
-\xd7\x00\xff)\xa1\x80\xd8y\xb8\xb5\x03\xf9\xd0\x8a\xf4t\
-\x88\xc8\x87\xfef`\x0d.\xa4\xf3]\xd9\xbah\xaa\xa2\
-\xb2\xc5cC\xff\x14\xa2\xb5o\x1fGe\xb4\x06&\x0d\
-\x84\xfa\xeeg\xc0~RJ\x0f\x04\xea\x9e\x93\xd7g+\
-0\x83u.R!\x22\x13p\x09\xa9\x006\x07n\xcd\
-6\xb8\xd8T\xa4\x5c<Z\xe0\x16\x9a\xd6\x06H\xbc$\
-\x13\x11\x1bI$\x05\xb3+\xe1\x18p\x05\xaf\x09+F\
-@\xee$\x1c\x9e\xe08\x9d\x90\xd4\xf0\x07\xe0a\xffz\
-\x7f\xe0\x5c\x99\xa4\xa2\xf99ua.\x1e\x07.\x93I\
-R\xed}\xac\xf2}}\xa9\x05\xc4. |\xe7\xf1\x03\
-0\xadtNR\xe1\x85\xd4\x00\xc7\x03\x1f\xd7\x0aJ\x16\
-v\x96e*\xd2\xfb\x18\x08\x5c\xee\xdf~\x0c\x1c\x93\x09\
-O\xe9\x17\xc9\xf1>Z\x11\x1e\xffx\xac\x90\xd9W\x8d\
-\xf1@ \x1c3\xa9\x1bne\xb3H\x87\x88|\xe6\xbd\
-\xca\xda\xf1\x90;\xb2\xb0\xbe,SQ\xe2\xd1\x01\xf7(\
-\xa3v\xdc\xe38\x85)I\x0d\xa3\x08\xe7\x04**.\
-^\xb1\x02\xf2\x1f\xc23/N\xd2yI\x95\x88L\xa2\
-\xeeq\xc5w\x80kd\x95\x8a\xe2j\xeaV(_\x91\
-Q\xdc\xbb4qr`\xffR\x0a\x9c}\xd5H\x01\xb1\
-\xcb\x81;\x02\x85\x07\x82Q(\x8ct\xf1\x1b\xeaBT\
-\x1c\x9f\x85\xef\xc9$\x15\xe1}\x1c\x94sC8\x8d\xba\
-\x89\x15\x22\xf1\x98\xee\x84C\xb7\xdf\x09vYSz \
-\xe0\xc2\x7f\x87>\xeb\x04\x9d\xa0Ty!\xabp\xe3!\
-_\xfa]\x7fW:\xdc\xd4\x8bG\x17`\x8c\x7f\xbb\x0c\
-\x17\xe7J\xb9=\xd2\xc3\x09\xb8\xe4r\xf9\x18S\xec\x87\
-5B@\xecs\xc0\x9b\x81\xc2S\xc1T\xe9\x1c\xa5J\
-D\xde\xa1n&V7\xe0\x06Y%\xd5\xfc\x0d\xd8\xd8\
-\xbf>7\xe3r|\x88tx\x1fU\xae\x8f\xce\xcbL\
-\xdf\xb7\x17Ec\xb3\x0a\xde\x04\xfc)\xcf\xfe-\xbd{\
-4N'+U\xdc\x80[\xa9\xbe?ph\xd6u2\
-SS\xf4\xff\xf5h\xc41\x87d\xa1\x7f\xca\xce\xf3.\
-\xb8\x1c\x1f\xe0\xd28\xfcMM?U\x8c\xc0\x8dg\xe6\
-\xe3\xc6\xc6|`#\x17\x89\x99\x8dp+\x97[\xe7)\
-\x1c\x07V3\xb2RF\x166\xc5\xc5?\xea$k\xa4\
-\x9e%\xc0\x0e>o\x8cH\x8f\x07\xf2\x10n\x06V}\
-V\x02\x9b\x81\xfd\xb4\xd8Ol\xe4\xe3&\xfb)\xe1\x00\
-\x8b\x07\x82\xd9R'+]d\xdc:\x80sd\x89\x8a\
-\xe0<\x89G\xea\xc4\xa3'uy\xeb\xebsWc\xc4\
-\x03\x1a\xff\x08\x0b\xe0z\xf2\xaffl\x01\x9c\x09\x9c\xa7\
-\x93\x96:n\x02~\x08\x0c\xf3\xef\x7f\x08<\x9d\x82\xff\
-k;\x8a\x7f\xec:\x8a\xf0X`\xd2\xd8\x1d\xb8\xd5\xbf\
-\x9e\x02\xfc]M=u\x9cA\xf8\x89\xd3u\x8d\xfd\xd0\
-u\x8csd\xa6\x03\xfd\xf2\x14|\xe1]\x22E\xebL\
-\x19Y\xd8\x06x\x15\x97X\xe8=\xdc\xa3\x8ee\x09\xff\
-\x9f\xfa\x03\xaf\x14y\xd8\x804\xe4D\xcfB;\xe05\
-`+\xe0+`G\x0d\x9c\xa7\xce\xfb\xe8\x80\x1br\xe8\
-\x9c\xa7\xf0U\xb0\xfd\x1a\xfb\xc9\xeb:c\xea\xda\xc0\xfe\
-Nhaa*\xc9\xc0,\xdc\xfa\x10p\x93&.\x90\
-U\x12\xcdy^<\x00.\x93x\xa4\x92\x13\x03\xe2\xb1\
-N\xdeG)\x04\xe4\xdf\xb8\xb0\x17\xf9\xf8\x99\xa6\xf4\xa6\
-\x96?\x01o\xd5v@\xd9\xba\x0eH$\xcb\xfb\xc8\xbd\
-\x01\x98\x05\x5c)\xab\xa4\xce\xfb\xa8r}q^>\x07\
-n)\xa3\x80\xd8\xe5\x84\xa7\xfamI8]\xa2H\xb6\
-\x17\xb2\x12\xf8\xa9\x7f\xdb\x06\xb8JVI$\xff\x0b\xb4\
-\xf5\xaf\xcf\xca\xb8GX\x22]|\x8f\xf0\x0d\xde\xdf\x8a\
-]y^j\x0f\x04\x5c\x8c\xa4\x95\x81\xb2\xf3u\xfeR\
-+\x22\x8fS\x97\xf6\xf2\xe0lx\x86\x87\x88\xa7\xf71\
-\x22\xe7\x06\xef^\x9f\x0bF\xa4\x8f_\x06\xf6\xaf$<\
-\x04\xd1\x9c\x02b-p[\xa0p\x10\x98}u\x0eS\
-\xcb\xb9\xb8t\xb8\x00\x7f\xc9\xba\xc8\xbd\x22\xfe\xe2Q\x0d\
-\xfc\xc5\xbf]\x81\xa6g\xa7\x14\xb3\x0f\xe1\xd4\xd4c\x0b\
-\xcd:\xd8\xd4\x1eH\xad+\x1cB\x83\xac\xe9\xf5B\xde\
-\xa7._\xc4\xd6\xc0\x8fe\x95Dp2\xd0\xdb\xbf\xfe\
-c\x06\xe6\xc8$\xa9$\xaa\xef\xfdS)\xbe\xa0D\x02\
-b_\x03\x1e\x0a\x14\xee\xad\x94\xb7\xa9\xe6\x7f\x81\xb9\xfe\
-\xf5\xaf\x957$\xf6\xdeG\x07\xeaf\xd1Y\xe0\x7fd\
-\x95Tz\x1f\xbb\x00\xfb\x04\x0a\xc7\x81}5F\x02\x02\
-\xb8T\xa8!.\xd5\x09M\xad\x17\xb2\x0c\xf8\xb5\x7f\xdb\
-\x8d\xf03W\x11\x0f\xce\xa5.X\xe2\xaf2\xe1\xfc>\
-\x22\xd9\xfc6\xa2\xacdi\x89K( v*09\
-P8B^H\xaa\xf9'.N\x16\xc09YP^\
-\x98xz\x1f\x86\xba\xc8\xcao\xf8\xf3&\xd2\xe7}\x0c\
-v}n^&\x83}6\x86\x02\x02\xd4=\x0f\x97\x17\
-RY^\xc8j`\xb4\x7f\xdb.\xc7#\x11\xf1b4\
-\xb0\x9e\x7f}\x91?o\x22}D\xf5\xb5W\x94\xf2\x8b\
-J, \xf6Q\x5c\x063y!\x95'\x22\x0f\xe1\xe2\
-(\x01\x9c\x94m\x5c\x88t\xd1t\xdeGw\xea&9\
-L\xcb\x14\x99\xbaT\xa4\xc2\xfb\x98\x06v|\x8c\x05\x04\
-\x80\x0b\x1b\xe9\xa1\x88\xe4S\x9b\xfa\xb4U\x03\xed@4\
-?\xe7S\xb7h\xf0b\x99#\xb5\x5c\xd6H\xcf$.\
-\x02b'\x12\x1e\x0b\x19\x0ef\xa4\xceqj\xbd\x90I\
-9\xe7^^H<\xbd\x8f\xc9Z4\x98Z\xefc\x04\
-\xb0W\xa0pJ\xa9\xbd\x8f\xa6\xf2@\x1aR\xba\xcb\x14\
-#+\xd5\x5c*/$\xd6\xde\xc7\xa52G*\xc5\xa3\
-\x8a\xe8\xf1\x8dK\x9a\xe2[\x9b\xa8#\xb7\x93\x08\xdf\xe5\
-\xf4\x07\x8e\xd6\x09\xaf\x18/\xa4\xbb\xacRV\xefcc\
-\xd6\x1e\xfb\x98$\xab\xa4\x92\xa3\x08\xa7X\x9e\xe0\xfb\xe4\
-\x92\xd3\xa2\xe9\xfe\x1f3\x10x)P\xf8>\xd0\x1b\xec\
-\x0a\x9d\xf7TvZ\xfb\xe1rj\x83\x0b\x17=?\xee\
-\xb7o\x14\xbf\x8a\xfe\x06\xdcB\xbc\xb8\xb37\xb0\xa7\x7f\
-=2\x03\xe3\xd5BS\xe7}\xb4\xc5E\xc7\xee\x19\xa8\
-\xb03\xd8\x97\x12& \x00f,pd\xa0\xf0B\xb0\
-\x1aTO\xaf\x88\xcc\x00\xfa\xe2\x16\xaau\x90E\xca\xce\
-\x8cL\xf8\x0eU$[@. <x~'\xd8#\
-\x9b\xea\x9b\x9bz,\xe2b`UX@\x8c\xd1\xc9O\
--\xb5!2$\x1e\xf1:\x1f\x22]\xe2\xb11\xe1\x98\
-W\xab\x81\x8b\x9a\xf2\xdb\xab\x9b\xf6\x9f\xb3\xb3\xc1\x5c\x07\
-\xfc$Oa\x07\xe0w\xc0\xa9j\x04\xa9\xe4\x0e\x7fW\
-\xb49\xf0\x01\xb0U&|3Qno)u)m\
-\xb3\xd0\x12\x97]pK\xe0cw'*R\xc8\xef\x09\
-\xc7\x9f\xbb\xce\xf5\xc1MGs\xcc\x86\xfa\x0d\xb00P\
-v2\x98\x9d\xd5\x06\xd2\x87O:u\xb5\x7f\xdb\x038\
-LViV\xbe\xeb\xc5\x03\xe0\xeaL8g\x8fH\xae\
-\xf7\xb1\xb3\xebC\xf3\xb2\x90f\x98q\xd7\x0c\x02b?\
-\x8f\xf8GZ\x00\xd7jZoj\xf9;u\xc1\xfa\xce\
-\x909\x9a\x95Z{/\x03\xfe!s\xa4N<\xaa\x5c\
-\xdf\x19\x1c\xc7\xfe\xad\xef{\x93. \x00\x5c\x8f\xcb\xb9\
-\x9c\x8f]\x22TT$\xdb\x0bY\x02\xdc\xea\xdf\x0e\xcf\
-\xd6\xe5\xa0\x10MH\x16z\x01\xb5\x89\xdcn\xcd\xc0\x22\
-Y%u\x9c\xec\xfb\xce|\xcc\xa2\x04\xd9\x06c$ \
-67\x87v>.\x07\xb3\xa1\xdaD*\xf9[\xce\xeb\
-\xd3e\x8ef\xf5>\xc0M\xa3\x16\xe9\xf2>6$:\
-,\xd4O}\x9f\x9b\x16\x01\x01\xbf\x8c\xfe\xbe@a\x17\
-4K$\xad^\xc8t`\xaa\x7f{|\x16\xda\xcb*\
-M\xea}\xb4\x05N\xf0o\x9f\x8d\xf3@\xbfh4W\
-\xfa>3\x1f\xf75E\xc8\x92\x18\x08\x08\x00?\xa7.\
-\x87v}N\x023\x5cm#\xd5^\xc8\x06\xc0\x0fd\
-\x8e&\xe5\x88\x9c\xce\xe5\x06\x99#u\xde\xc70\xe0\x94\
-@\xe1r\xdf\xc76\x1b\xcd, \xf6}\xa23\x17\xde\
-\xe0WU\x8atq\x07u\xcf\xe1O\x949\x9a\x94\xe3\
-\xfd\xdf%\xc0\xdd2G\xaa\xc4\xa3\x0dnbJ\x88?\
-\xf8>6\xad\x02\x02\xb8d\xee\xff\x0d\x94mC\x13/\
-|\x11\xcdO\x06V\x00c\xfd\xdb\xa1Y\xb76D\x94\
-\x98,lJ]\x1e\xec;}\xbaa\x91\x1e.\xf2}\
-d>f\xf9\xbe\xb5Y)\x83\x80\xd8\xaf\x80\xd3\x22*\
-\x8c\x06\xa3\x90\x0b\xe9\xe3\xdf\xfeo\x0b\xe08\x99\xa3I\
-8\x86\xbai\x9d7\xc9\x1c\xa9\xf2>\xfa\x13^q\x8e\
-\xebS\xedW\x15  \x00v\x0a0&PX\x0d\xdc\
-\x0c\xa6\x95\x1aM\xaax\x16x\xcf\xbf\xfe\xa1\xcc\xd1$\
-\xd4\x0a\xf3\xdb\x19go\x91\x0e\xf1h\xe5\xfa\xc4`\xe4\
-\x90\x1b\xc1N.\xc7/+\xe7\x02\xbe\xf3\x80y\x81\xb2\
-~\xe8QV\xaa\xc8@\x0dp\x8b\x7f\xdb'\x0b\x03d\
-\x95\xd2\x91u\xd7L_\xff\xf6\x0eY$U\x5c\xe4\xfb\
-\xc4|\xcc\xf3}iY(\xa3\x80\xd8E\xc0\xd9\xd1F\
-3\xead\xd2\xc5\xad9\xaf\x8f\x959JJn\x8e\x9d\
-\xdbd\x8e\xd4x\x1f\xfd\x1b\xb8\x99\xce\x80]X\x81\x02\
-\x02`\xef&<S\xa4\xdau8\x9a\x95\x95\x22/d\
-\x16\xf0\xb2\x7f{\xa8,RRj\xed\xf9z\xc6\xe5\x86\
-\x10\xc9\x17\x8f\xb6\xfe\xa6+\xf4\xe8\xean\xb0w\x95\xf3\
-\x17\xc6!\x06\xd5\x99\x84\x13\x0e\xf5A\x0b\x0c\xd3\xc6\xfd\
-\xfe\xefw\xb2\xb0\xa3\xcc\xb1\xeeda;\xeaf\xe7\xdc\
-.\x8b\xa4\x86?\xe2\xcem>\x16\xf8\xbe\xb3\xac\xc4@\
-@\xec|\xa2ge\x9d\x0d\xe6\x00\xb5\xa5\xd4p_\x9e\
-\xbbf\xb1n|/\x8f@\x8bd{\x1f#\x9c\xd3\x1e\
-u\xe3m\xcb\x9e\xe93&Qp\xed\xfd\xac\xfd|\xbc\
->\xff\x04\xb3\x91\x1aU\xf2\xc9\xc0\xeb\xc0\xec<\x1d\x9f\
-h<\xb5B<;\x03o\xca\x1c\x89\x17\x8f\xae\xae\xcf\
-\x0br{\xb9\x1f]\xd5R\x1d#\xab\x9d\x85\xcb\xdd\xdc\
-#\x9fE\x81\xff\x03s \xd8\x1a5\xb0\xc4s?p\
-.0 \x0b7\xe2VM\x97\x93n\x8d8\xe6\xbcl\
-<r\xbdw\x00js\xea\xfcGM+\xf1\xe2\xd1\x02\
-7[\xb1{\xa0\xc2\x87\xc4\xe0\xd1U--bf\xbc\
-a\xc0\xc4\x08\xcfh4\xd8+\xd5\xc8\x92M\x16v\x07\
-\x9e\x91%J\xce\xb0\x0cL\x91\x19\x12- \xe7\xe1\xc6\
->\xf2Q\x03\xecU\xae5\x1f\x09\x10\x10\x00s\x05p\
-~\xa0p\x150\x14\xecsjh\x89\x16\x90\x96\xb8\xbb\
-\xf7\x0dp\xe16\xca}'\xdf:\xe2\x8e/\xc4\x5c\xe0\
-\xeb\x18\x98\xb3\x1b.\xc2\xf1\x17@\x97\x8c\xcb\x83-\x92\
-)\x1e\xbb\xe1n\x00BO\x86\xfe\x08\xf6\xfc8\xfd\xe2\
-8\x0aHk\xe0i`P\x84\x0b7\x00\xecgjp\
-\x89\x16\x91{pin\x17\x03\x1b\x96\xb3\xe3KjN\
-\xf4\xac\xf3\xd4\x17x!\xbe/\xa3\xb4\xc1I\x16\x8f\x0d\
-qS\xdc\xb7\x08Tx\x11\xd8\x03\xec\xd7q\xfa\xd51\
-L%k\xbf\x06\x8e\xf2\x1dK>6\x07n\x03\xd3R\
-\x8d.\xd1L\xf0\x7f;\x12\xce\xac&\xa2\x19\xe8\xc5\x03\
-\xe01\x99#\xb1\xe2Q\xe5\xfa\xb4\xa0x,v}b\
-\xbc\xc4#\xa6\x02\x02`\xdf%:\xcd\xed\xfe\xc0%j\
-x\x89&\xb7\xc3\xdbW\xe6h\x14\xfb\x05\xec)\x92\xc5\
-%\xc0\x88\x88\xf2S\xc1\xbe\x13\xc7\x1f^\x15_\x9b\xda\
-\xbb\x89N\x88\xf3+0\x07\xa9\xed%\x93\x0c\xbc\x03\xcc\
-\x91\x80\x94D@\xde\xcb\xc0\xbb2G\x22\xbd\x8fQ\xc0\
-\xaf#*\xdc\x00\xf6\xce\xb8\xfe\xfa\xaa\x98[\xf7g\xc0\
-K\x11\xe5\xff\x06\xd3[\x8d0\xb1\xd4>\xc6\xda\xcd\xa7\
-b\x15\x05\x92u\x03\xff\xbb\xfb\xb7\x9ay\x95L\xf1\xd8\
-\x96\xe8\xf5o/\xf9>0\xb6\xc4\x5c@\xec\x0a\xe0p\
-\xe0\xf3@\x85N\xc0\x7f\xc0tVcL$O\xf9\xbf\
-\xadp\xcf\xf3E\xe1\x0c\x00\xda\xf8\xd7O\xcb\x1c\x89\x13\
-\x8f\xce\xae\xef\xa2S\xa0\xc2B\xd7\xf7\xd9\x15\x12\x90u\
-\x13\x919\xb8D9k\x02\x15\xb6\x01\xc6jP=\x91\
-L\xcby=X\xe6(\x8a]\xf3\x08\xb1H\x86x\xb4\
-\xc4\x0d\x9ao\x1b\xa8P\xe3\xfa<;'\xee\xffIU\
-2\x0cn\x1f\x05.\x8d\xa80\x02\x05]L\x22\xb3r\
-\xbcK\x09Hq\xec\xe6\xff\xce\xcf\x84SD\x8bxr\
-%02\xa2\xfc7`\xc7'\xe1\x1f\xa9J\x90\xd1\x7f\
-\x0f\xdc\x1bQ\xfes0g\xa8m&\x07\x9fdjZ\
-\xbd\x0eQ\x14F\xad\xe0N\x95)\x12\xe5}\xfc\x188\
-'\xa2\xc2}\xc0o\x93\xf2\xdf$H@l\x0dp<\
-\xf0jD\xa5k\x14\xb97q\xd4v\x80\x9bea\x13\
-\x99\xa3a\xb2\xb01\xd0\xd3\xbf}Q\x16I\x8cx\x8c\
-\x00\xae\x8d\xa8\xf0\x9a\xeb\xe3\x92\x13\xef\xaf*Y'\xc0\
-~\x09|\x17\xb7\xfa6\xf4\xff\xdc\x09\xa6\x9f\x1ak\xe2\
-\x04\x04\xd6~\xae/\xc2\xe4\xda\xe9%\x99#\x11\xe2\xd1\
-\x17\xb8\x0b\x17\xc6'\x1f\x9f\x01\x87\x80]\x9a\xa4\xff\xaa\
-*y'\xc2\xce\xc1\xcd\xccZ\x19\xa8\xb0>0\x0eL\
-\x0f5\xdaD\x90\xdb\x01*\xc1Ta\xec(\x01I\x94\
-xl\x0e<\xec\xfb\xa6|\xac\x04\xbe\x9f\x84A\xf3\x14\
-\x08\x08\xf8h\x94\xa7DT\xd8\x14x\x14L\x175\xde\
-x\x93qw^\xf3$ E\xb1\xbd\xff\xfbI\x06\xac\
-\xcc\x11k\xf1\xd8\xd0\xf5El\x1aQ\xe9\x948E\xd8\
-\xad\x00\x01\x01\xb0\xff\x22z\xb0\xa97\xf0 \x98\xf6j\
-\xc4\xb1\xe7u\xffw;\x99\xa2 v\xf0\x7f\xdf\x90)\
-b-\x1e\xed]\x1fD\x9f\x88J\xbf\xf7}Y\x22\xa9\
-J\xf8\x19\xba\x94\xe8\x95\x9c\xbb\xe1\xc6DZ\xab1'\
-B@\xb6\xf5+\xacE\x80\xac\x0b\xf5]\x1b}A\xd9\
-\x07\xe3+\x1e\xad\x81;\xa8\x8b\x16\x90\x8f\xdb\x89\x0ec\
-\x22\x01ib/\xa4\x068\x09x\x22\xa2\xd2(\xe0f\
--4\x8c5\xb5w\xd2-s:G\x91\x9fmq+\
-\xf7\xe5\x81\xc4W<Z\xe2R\xd2F\xc5\xea{\x128\
-1\xe9\x19V\xab\x92\x7f\xb2\xec\xd7\xc0\xf7\x89\xce\xcdp\
-4\xf07\x9f.R\xc4\x8f\xd7r^\xef sD\x92\
-\xfb\x98O\x1eH\xfc\xc4\xa3\x05p\x1d.zF\x88\x19\
-\xc0\xa1q\x0c\xcf^,)\xeaP\x8d\x01\x9e\x05\xb6\x8c\
-\xa8t\x15\xd8_\xa8\x91\xc7\x8b\xac\x8b\x07\xb4\xc8\xbf\x9d\
-I\xf3\xaf\xac\xee\x04\x0c/\xf2\x98I\xb8,\x80\xcd\xcd\
-6\xd4=S\xef\x92\x09\xc7\x89\x13\xe5\xe9\x87\xfeD\xf4\
-B\xc19\xc0\xee`\xe7\xa6\xe1\xbfM\xd9\x1d\xb9\xd9\xda\
-\x8bH\xd7\x88JW\x82\x1d\xad\x86\x1e;\x11Y\x08(\
-(f\xe1|\x91\x91\xbd\xe2\xd6\xffD\xa5\xe3\x06\xb7~\
-m\x0f\xb0\xb3\xd2\xf2\x1fW\xa7\xeb\x04\xda\xb7\xc1\xec\x8d\
-\x0b.\x17\x8ary>\x18$\x22\xb1\xe3}/ \x8b\
-\xbc\x8b\xdf\x9ct\x00v*\xf2\x98\x97\x80r,\xfa\xea\
-\x8b\xcbB8GM&Q\xe2\xb1\x18\xd8'M\xe2\x91\
-B\x01\x01\xb0\xaf\xf9\x90\x01O\x00\xebID\x12\xc3\x1c\
-\xa0\x1f\xf0Y\xa6\xf8\xc7I\xeb\xea\xfd4&'\xfa)\
-\xe5\xc8\x89\x9eu\x8f\xf76@\x09\xa4\x92$\x1e\xcb\x81\
-\xfd\xc1\xbe\x9a\xb6\xff\xbc*\x9d'\xd4N\x03\x0e\x01\xa2\
-b\xe9\x9f\xefO\xbc\x88\x8f\x07\x02\xd0#\x9b\xdavY\
-\x12\xb6\xc8\x11\x5c\x11\x7f\xf1\xf8\x1a8\xc8\xf7I\xa9#\
-\xc5\x17\xaa\x9d\x08\x1cI8\xe4I\xad\x88\x5c\xab\xd9Y\
-\xb1\x12\x90V(\xa8b\xc8\xfb0\xd4%\x91\xfa@\x16\
-)\xabp\xb4\x00\xf3\xd7\x06\xc4c%p\x84\xef\x8bR\
-I\xca\xef\xf4\xec\x03D\xc7\xcd\x028\x13\xb8A\xebD\
-\xcaN\xee\x1d\xb5\xe2\x98\xe5\xa7gn\xe3\x969\xca&\
-\x1e-qSu3\x0d\x88\xc7\xe1\xbe\x0fJ-\x15\xf0\
-\xa8\xa0 \x119\x15\x97_]\xab\xa0\xcbx\xa2r^\
-w\x939\xf2\x92\x1b\xdbm\xae\xccQ\x16\xf1h\x0d\xdc\
-\x02\x9c^\xe9\xe2Q!\x02R\xb0\x88\x1c\x05<\xa0\xd8\
-Ye\xe3\xb3\x9c\xd7]e\x8e\x06\x05d\x9e\xcc\xd1\xec\
-\xe2\xd1\x1e\x97\xc7\xfch\x89GE\x09\xc87\x22r \
-nFD\x88\x11\xc0DE\xf1-\x0b\x9f\x07:J\x91\
-\xdf3\x93\x804\xafxl\x88\x9b\xd9\x19\x95\xb0n9\
-n\xc0\xfc\x81J\xb1J\x85\xcdv\xb1\x13\xdc\x09fq\
-D\xa5]\x81\xa7\xc0l\xa1\x8b\xa6l\x1e\xc8\x862G\
-^j\xed\xb2*\xe3\x16^\x8a\xe6\x11\x8f\x1e\xaeO\xf8\
-&\x8dp>\x96z\xf1x\xac\x92,S\x81\xd3%\xed\
-D`\x7f\xeaBg\xe4\xa3\x0f0\x15\xcc@]<\xcd\
-C\x06\xd6\xe4x!\xf2@\xf2Sk\x97%2E\xb3\
-\x89\xc7@`\x1a\xd1\xa9\x06\xbe\x00\xf6M\xf3l+\x09\
-\xc8\xda\x222\x0d\x18\x0a|\x1c\xd5r\x80)`F\xea\
-\x22j6$ \x85y \x8be\x8af\x11\x8f\x91\xae\
-\x0f\xc0DT\x9a\x0b\xec\x99\xd6u\x1e\x12\x90\xb0\x88\xbc\
-\xe6N<\xefDTZ\x0fx\x08\xcc\x99\xba\x98\x9aU\
-@\xf4\x08+\xda\x03Y$S4\xb9x\x9c\xee\xae\xfd\
-`4\x0b|\xdf1\xc4\xf7%\x15I\x85\xaf\xf8\xb5\xef\
-\xe1\x92N\xbd\xd2\x80\x8d\xae\x05s\x1d\x98j]XM\
-J\xed\x04\x87\xb62E^Z\xca\x03ir\xe1h\x09\
-&\x0b\x5c\xdf@\xff8\x1d\x17U\xb7\xa2C\xca(d\
-\x04v>0\x0c\x97\xb78\x8a3\x80\xf1`6\x90\xcd\
-\x9a\x8c\xd5\x12\x90H:J@\x9aT<6p\xd78\
-g7P\xf1Q`(\xd8O+\xddb\x12\x10'\x22\
-Kp\xb3\xb3\xc64Pq\x1f`\x1a\x18\xe5\xeen\x1a\
-48\x5c\xd8\xf5\xbaJ\xa6(\xb9xl\x07L\x05\xf6\
-m\xa0\xe2\x8d\xae\xaf\xb0j\xab\x12\x90\xb5Dd\x15\xd8\
-S\x81\x8b\x1a\xa8\xb8\xb5\x17\x91\xef\xcbfM\x86\xf2\x5c\
-\xe4\xa7\x8dL\xd0$\xe2q\xa8\xbb\xa6\xd9\xa6\x81\x8a\xbf\
-\x02{\x8a\xeb+\x04\xa4.\xa1T\xc9\x1a\xd4\x91\xb8\x9c\
-\xc6\xed\x1a\xa8x\xf9\xd5\xd8\xf6Uk\xc7(\x12\x8dg\
-'`3`\x19\xf0x3~oR2\x12\xee\x07\xb4\
-\x07>\xc2\xe5#\x11\xeb\xc0\x1ahq\x0f\xf4\x99\xe2\x12\
-\xd1E\xb1\x028\x09\xec\xed\xb2\x9a\x04\xa4P\x11\xd9\x19\
-x\x00\xe8\x1e\xdd\xe3\xd9%\x87\xc1\xfa\x1de0!\x12\
-\xc3b\x5cL\x92\xe7#g\xe8\xbaG\x13\xc0w\xc1>\
-/\xabI@\x8a\x15\x91M\xbc\x88Df\xab\xdb\x1a\xcb\
-\xfe@o\x19L\x88\xd8\xf3_\xdc(\xf8\xdb\x0d\x8b\xc7\
-+\xc0!`?\x92\xd5\xf2\xa3\x10\xe6\x91,]\x02\x1d\
-n\xc1%\xf1\xe9\x1b\xaa\xf59\x1dx\x81\xce\xb4d1\
-\xbdd4!b\xcb\xa3\xc0\xbf\xd9\x8c\xcfi0f\xea\
-\xad\xc0\xa1`?\x93\xd5$ \xeb\x22\x22\xab`\xe9}\
-\xd0a\x11n\x86F`\xe2\xc1\x1af\xd1\x81\x05,\xa5\
-'\x9a\x87*D\x9c\xf8\x02\xb8\x0bx\x12\x83\x8b\x9a\x13\
-d5p\x0e\xd8_\xc2\xd2\x95\xb2\x5c4z\x84U\x14\
-f\x18p'\xb0QT\xad\xad\xb0\x0c\xc7%\xda\x16B\
-\x94\x97W\x81\x89\xc0;\x0d?\xb2\xfa\x14\xf8\x01\xd8\xc9\
-\xb2\x9a\x04\xa4\xa9Dd\x13`,.\x0cJ$\x83\xb0\
-/\x1c\x06\x8fw\x88\xceC\x22bpR\x81\x1f\x17y\
-\xcc\x0d(+`\xac\xf9\x12\xaa\xef\x81\xfd_\xc0\x0cj\
-\xa8n\x1f\xec{oa\xf6\x04\xfb\xb1,'\x01i\xea\
-\xfe\xa6\x1a\xf8=\xd1\xf9\x90k\xf9/pB\xa5\x06[\
-K\x02Y\xe7,\xbeR\xe4a\x032.\x9c\x85\x88\xe7\
-5\xba\x0b\xf0/`\xdb\x02*_\x09\x5c\xac\xf5\x1d\xc5\
-\xa3\x85\x84\x8d\xc2\xae\x02;\x1a\x97\xa0\xaa\xa1A\xb6m\
-\x81g\xc0\xfc\x01L+\xd9N\x88&\x15\x8eV`~\
-\x0f<[\x80x,\xc4\xad*\x1f-\xf1\x90\x80\x94C\
-H\x1e\x01\xfa\x01O6P\xb1%p!\xf0\x02\x98\x9d\
-d7!\x9aD<\x06\xb8k\x8c\x8bhx\x82\xd0$\
-\xa0/\xd8q\xb2\x9b\x04\xa4\x9c\x22\xf21nv\xd6\x05\
-4\x1c\xa3\xa8\x1f.\x0c\xca\x15`4QK\x88\xd2\x08\
-G[0\x97{\xf1\xe8\xd7@\xe5U\xfefn\x1f\xad\
-\xef\x90\x80\xc4ED\xd6\x80\xbd\x02\xd8\x1d\x98]\x807\
-r>\xf0*\x98\xa1\xb2\x9d\x10\xeb$\x1eC\x81\x19\xc0\
-\xe8\x02\xbc\x8e\xd9\xc0\x1e`/w\xd7\xac\x90\x80\xc4K\
-Hj\xef\x80\xae-\xa0\xf2\xd6\xc0d07\x81\xe9*\
-\xdb\x09Q\x94pt\x05s\xa3\xbb\x86\x1a\x0c\x82\x08p\
-\x1d\xd0_!I$ q\x17\x91e`\xcf\xc6\x05\xbe\
-\xfb\xb0\x80\x03~\x04\xfc\x17\xcc)`4+N\x88h\
-\xe1h\x01\xe6d`&pR\x01\x07|\x08\xec\x0f\xf6\
-,\xb0_\xca~\x12\x90\xa4\x08\xc9\x04`G\x5cT\xdf\
-\x86\xd8\x10\xf8\x07n\xb6\xd6@\xd9N\x88\xbc\xe21\x10\
-x\x1a\x97\xb7\xa7K\x01\x07\xdc\x8c\x1b(\x7f\x5c\xb6\x93\
-\x80$QD\xbe\x00{\x92\xf7F\xe6\x14p\xc0n\xc0\
-\x8b`\xc6\x80\xd9H\xf6\x13\x02\xdc\xb5`\xfe\xee\xae\x0d\
-v/\xe0\x809\xde\xeb\xf8\x11X\xe5\x8f\x97\x80\xa4\xc2\
-\x1b\xd9\x1e\xb8\x9a\x06\x02\xf1\xe0\x16w\x9e\x0c\xbc\x0d\xe6\
-\x17`Z\xcb~\xa2B\x85\xa35\x98\x9f\x03\xb3\x80S\
-ix\xe1s\x8d\xbf\xc6v\x90\xd7!\x01I\x9b\x88,\
-\x03\xfb3`0\xf0r\x01\x07t\x04\xfe\x17\x98\x09\xe6\
-\x07\x1a\x1f\x11\x15$\x1c-\x5c\x9b\xe7-\xe0\xcf\xb8\x84\
-_\x0d\xf1\x8a\xbb\xb6\xec\xcf4\xd6!\x01I\xb3\x90\xbc\
-\x00\xec\x02\xfc\x84\xc2r\x80o\x09\xdc\x01L\x05\xb3\xa7\
-\xec'R.\x1eC\x80\xe7|\x9b\xffN\x01\x07,\xf1\
-\xd7\xd2 \xcd\xb0\x92\x80T\x8a\x88\xac\x06\x9b\xc5\x85Z\
-\x18[\xe0A\xbb\x00S\xc0\x8c\xf7+n\x85H\x93p\
-\x0c\x00\xf3\x08\xf0\x14\xb0k\x81\x07\x8du\xd7\x90\xcd\xba\
-kJH@*KH\xe6\x82=\x1a\x18B\xe1\xc1\xfc\
-F\x00/\x83\xb9\x07\xccv\xb2\xa1H\xb8pl\x07\xe6\
-n\xd7\xa69\xa0\xc0\x83\xa6\x03C\xdd\xb5c\xe7\xca\x86\
-\x12\x90J\x17\x92g\x80\x9dq!\xc5\xe7\x17x\xd0a\
-\xc0\xeb`\xc6JHDB\x85c\xack\xc3|\xbf\xc0\
-\x83\xe6\x03\xa7\x03;\x81}J6\x94\x80\x88:\x11Y\
-\x03\xf6\xef\xb8\x15\xea\x97\x03+\x0a8\xa8\x05p\xa4\x17\
-\x92\xfb\xf4hK$@8\x06\x80\xb9\xd7\x0b\xc7\x91\x14\
-\x96Rb\x05p\x85\xbb6\xec\x0d\x0aC\x22\x01\x11a\
-!\xf9\x02\xec\x85\xb8\xf0\x0c\xff\xc2MM,DH\xbe\
-\xe7\x1e\x03\x98\x87\xc1\xec%;\x8a\x98\x09\xc7p\xd76\
-y\x198\xb4@\xe1\xa8\x01nq\xd7\x82\xbd\xc0]\x1b\
-B\x02\x22\x0a\x11\x92\x0f\xc1\x9e\x00\x0c\x00\x1e*\xe2\xc0\
-\x91\xc0D0/\x809\x02\x8c\xce\xb1(\x97hT\xf9\
-6\xf8<.\xe5\xc1\xc8\x22\x0e~\x18\x18\x08\xf6xw\
--\x08\x09\x88h\x8c\x90\xcc\x00{0n\x95\xfa\xa4\x22\
-\x0e\xdc\x19\x97\xbf\xfd\x1d0\xe7\x80\xe9,[\x8af\x12\
-\x8eNn\x11,\xef\xf868\xa8\x88\x83'\xbb\xb6n\
-G\x81U\xc6G\x09\x88(\x91\x90L\x05\xbb\x17\xb0\x0f\
-.\x1eP\xa1\xf4\x04\xfe\x04|\x04\xe6:0}dK\
-\xd1D\xc2\xd1\xc7\xb51>\xc6-\x82\xedY\xc4\xc1\xcf\
-\x02\xfb\x82\x1d\xee\xda\xba\x90\x80\x88\xa6\x10\x92\x89`\xf7\
-\x04\xf6\xf2wk\x85\xb2\x1ep\x06\xf0&\x98I`\x8e\
-\x01\xd3F\xf6\x14\xeb(\x1am|[\x9a\xe4\xda\x16g\
-\xf8\xb6V\x8c\xc7\xb1\x17\xd8=\xc0>!{J@D\
-\xf3\x08\xc9$w\xb7\xc6\x1e\xc0\xf8\x22\x0f\x1e\x06\xdc\xea\
-\xee\x14\xcd\x1f\xc1\xf4\x96=E\x91\xc2\xd1\xdb\xb5\x1d>\
-\xf4miX\x91\x1f0\x1e\xd8\xd3{\x1c\x93dO\x09\
-\x88(\x8f\x90<\x0bv$\xd0\x17\xf87\x0d\xa7\xd5\xcd\
-\xa5\x0bp\x1e\xf0\x16\x98\xa9`N\xd7X\x89\x88\x10\x8d\
-\xce\xbe\x8dLum\x86\xf3\x80nE|\xc0*\xdfF\
-\xfb\xb96k\x9f\x96M\x93\x8d\x02\xf4\xa5\xef\x22\xef\x01\
-\xfc\x148\x05\x17\x90\xb1X\xbe\x02\xfe\x03\xdc\x0e<\x02\
-\xf6\xab\xb4[,\x0b\xfd)<\x12@-\x032nE\
-t\xda\xdbS\x1b\xdc\xec\xa9\xa3\x81\xef\x02\x8dy\xec\xb9\
-\x04\x97\xef\xe6j\xb0\x1f\xe8\x1a\x95\x80\x88\xf8_\xf8\x1d\
-p\xd9\x0e\xcf\xa6\xb0\x94\x9f\xf9X\x0c\xdc\x83\x8b94\
-\x11\xec\xaa4ZJ\x02\xf2\xad\xb6S\x0d\xec\x8d[\xe8\
-wx#oD\xc0\x85a\xbf\x06\xb8\x19\xec\x12]\x93\
-\x12\x10\x91\xbc\xce\xa0\x05.~\xd6Y\xc0\x814\xfe\xb1\
-\xe5B\xef\x99\xdc\x0b<\x0evEZ,$\x01\x010\
-mq\x89\xcf\x0e\xf3\x9e\xc6\x06\x8d\xfc\xa0\x1a`\x1cp\
--\xf0(\xd8\x1a]\x83\xe9\xa5Z&H;\xb6\x067\
-`9\x1e\xcc\xe6\xc0i\xb8\x84U\xdd\x8b\xfc\xa0\x0d\x80\
-\x13\xfd\xf6\xa5\x8f\x9c:\x0ex\x18\xec\xa7\xb2s\x22E\
-c#\x7fS1\x0a\xf7\x98j\xbdu\xf8\xb0\xb9\xc0\x8d\
-\xc0\x18\xb0\xef\xcb\xb6\xf2@Dz;\x8ej\xe0 /\
-\x06\xa3\xd6\xf1F\xa2\x06\x97jt\x9c\x17\xaa\x17\x93\x16\
-Z\xbbr<\x10\xd3\x12\xb7\xc0\xf4\x00/\x1c\x83\xd6\xb1\
-\x0fX\x05<\x02\xdc\x04<\x94\xd6G\x9cB\x02\x22\xc2\
-\x9dJ7\xe0X/&\xfdJ\xf0\x81_\xe0\xc2VL\
-\x00\x9e\x00;S\x02R\xd6\xf3\xdb\x1b\xb7\xf8t_\xdc\
-\xda\xa1N%\xf8\xd0\x19\xb88m\xb7\x82\x9d\xa7kH\
-\x02\x22\x04`v\xf4br$\xc5\xad\x22\x8eb\x1e.\
-I\xd0d\xdc\x0a\xfaW\xe3\x16M5=\x02b\xaap\
-\xd3\xb9\x87\x00C\xfd\xb6q\x89>|\x0e.K\xe0m\
-`_\xd5\xb5\x22$ \x22\xd4\x11\xb5\xc0e\x85;\x06\
-\x97\xaba\x93\x12~\xf8\x12\xe0y\xbfMs\x9b\xb5\x12\
-\x90F\x9d'\xe3\xcf\xd3\xae\xb8\x8c\x95\xbb\x00\xeb\x97\xf0\
-\x0b>\xc1M\x9a\xb8\xd5\x9f'\x0d\x88\x0b\x09\x88h\x94\
-\x98\x1c\xea\xc5d\xab&\xf8\x92O|\x07>\xddo\xaf\
-\x00\xef5\x97\xa7\x12\x7f\x011U\xc0\x96\xb8\xc8\xcc\xfd\
-\xfd6\xa0\xc4\xc2^\xcb;\xb8\xa9\xdb\xf7I4DC\
-h\x16\x96h\x00[\x03L\xf5\xdb\xf9`v\xc0\x0d\xc0\
-\x8f\x02v\xa74\xd1\x0c6\xf1\xdb\xa8\x9c}\xcb\xc1\xcc\
-\xc4\xadx~\xd3o\xef\xb8\xcd~\x99R\xb1^\xcf\x0b\
-\xf4V\xc0v~\xeb\x03\xf4\x06\xda5\xd1\x97\xae\xc1\x05\
-2|\x18x\x10\xec\xebj\xf3B\x02\x22\x9aJP^\
-\xc7e\x93\xbb\x02\xcc\x86\xb85&#q\x83\xb4\xddK\
-\xf8E\xed\xfc]v\x9e,\x8b\xc6\x02\xb3\x9d\x97\xc2\x87\
-\xf5\xb6\xb9`\xe7\xc7\xd3v\xa6\x9b\xb7\xd1\xe6\xf5\xb6-\
-\x81^\x80i\xa6\x1f2\x177\xc9\xe1\x11\xdcZ\x8d\xcf\
-\xd5\xaeEc\xd0#,Q\xca\x0er{/$\xfb\xe2\
-\x06p;\x96\xe9\x87\xac\xc6\xe5\xcf\x9e\xe7\xb7\xcf\x80E\
-\xf5\xb6%\xce\xcba\xe9\x9e\xd8-\x06\xc3\x18\xbc;\xd5\
-6\xf0\xa1+\xfc\xed:\xce\x1d;\xe5)\xcc\xfb@\x07\
-/v\xeb\x03\x9d\xebm]p\x83\xd8\x1b\xe3bF\xb5\
-,\x93=\x16\x03S\xbchL\x00\xfb\x86\xda\xaa\x90\x80\
-\x888\x8bIK\xdc\xb4\xe0\xa1\xd4\xcd\x0a\xea&\xbb4\
-\x0b\xf3\xbd`<\xed\xff\xceH\xda\xda\x1c!\x01\x11\xa2\
-\xbe\xa8\xf4\xc2\xcd\x14\xaa\x9d94\x00h-\xbb\xac\x13\
-_\xe3&\x00\xf8\x19m<\x0fv\xb6\xcc\x22$ \x22\
-\xed\x82\xd2\x0a\xd8\x9e\xb5g\x17\xf5\xa7|\x8f\xbe\xe2\xce\
-b\xeaf\xaa\xd5\xceV{\x03\xecJ\x99FH@\x84\
-p\xc2\xb2\x19n\xf6\xd1\xf6\xfeo\x1f\xdc\xcc\xa4M*\
-\xc4\x00\x9f\xe0f\x9c\xbd\xe5\xb77\xdc_\xfb\x91\xda\x86\
-\x90\x80\x08\xd18aiO\xdd4\xd7\xef\x00[\x00\x9b\
-\xf9\xad\x07n\xb0:\xeem\xba\x067\xb0\xff\x01\xf0\x91\
-\xdf\xde\x07\xde\xa5n\x9a\xf22\x9dk!\x01\x11\xa2y\
-\x05\xa6\x15\xd0\x157\x1dv#\xdc\xa0\xbd\xe1\xdb\xb3\xa3\
-:\xe1fM\xb5\xf5[G\xa0\x15nFU!,\x05\
-V\xe2\x1e)\xad\xf0\xdb\x12\x5c\x1c\xb0\xfa\xb3\xbd,n\
-P\xfbS\xffz\x81\x1e9\x89\xd4\x08HM\x8d\x16\x9a\
-\x0a!\x84(\x1e\xe5D\x17B\x08!\x01\x11B\x08!\
-\x01\x11B\x08!\x01\x11B\x08!\x01\x11B\x08!<\
-\xff\x0f\xd3Kw\xc6\xa3%\x0c\x03\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x00\xa6\
-<\
-\xb8d\x18\xca\xef\x9c\x95\xcd!\x1c\xbf`\xa1\xbd\xddB\
-\x00\x00\x00\x08\x0a\x8e\xb5\xbd\x00\x00\x00\x00i\x00\x00\x00\
-r\x03\x00\x00\x00>\x04\x14\x048\x040\x043\x04@\
-\x040\x04<\x04<\x040\x00 \x04>\x04?\x04@\
-\x045\x044\x045\x04;\x045\x04=\x048\x04O\
-\x00 \x044\x040\x04;\x04L\x04=\x04>\x04A\
-\x04B\x048\x08\x00\x00\x00\x00\x06\x00\x00\x00\x15Ra\
-nge Finding Diag\
-ram\x07\x00\x00\x00\x0aMainWind\
-ow\x01\x88\x00\x00\x00\x0d\x11\x01\xfd)\x0b\xff\x14\x02\
-\x04\xfd,\x0a\x13\
-"
-
-qt_resource_name = b"\
-\x00\x09\
-\x04\xeb\x98\xc3\
-\x00l\
-\x00a\x00n\x00g\x00u\x00a\x00g\x00e\x00s\
-\x00\x06\
-\x07\x03}\xc3\
-\x00i\
-\x00m\x00a\x00g\x00e\x00s\
-\x00\x0a\
-\x06\xcbO\xc7\
-\x00r\
-\x00e\x00m\x00o\x00v\x00e\x00.\x00p\x00n\x00g\
-\x00\x07\
-\x07\xa7W\x87\
-\x00a\
-\x00d\x00d\x00.\x00p\x00n\x00g\
-\x00\x07\
-\x04\xcaW\xa7\
-\x00n\
-\x00e\x00w\x00.\x00p\x00n\x00g\
-\x00\x09\
-\x0b\x85\x83\x07\
-\x00c\
-\x00l\x00e\x00a\x00r\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x0d\xa2Dg\
-\x00p\
-\x00o\x00l\x00a\x00r\x00p\x00l\x00o\x00t\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x08\xc8Xg\
-\x00s\
-\x00a\x00v\x00e\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x06\xc1Y\x87\
-\x00o\
-\x00p\x00e\x00n\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x04\xd1\xd6\xc7\
-\x00s\
-\x00a\x00v\x00e\x00i\x00m\x00a\x00g\x00e\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x0aaZ\xa7\
-\x00i\
-\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x06\x87q]\
-\x00r\
-\x00f\x00d\x00i\x00a\x00g\x00r\x00a\x00m\x00_\x00r\x00u\x00.\x00q\x00m\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0c\
-\x00\x00\x00\x18\x00\x02\x00\x00\x00\x09\x00\x00\x00\x03\
-\x00\x00\x00X\x00\x00\x00\x00\x00\x01\x00\x01\x10\xc7\
-\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x02\xf6\x0b\
-\x00\x00\x00\xba\x00\x00\x00\x00\x00\x01\x00\x02\x9a\xd7\
-\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x85O\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x02rp\
-\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x03DM\
-\x00\x00\x00l\x00\x00\x00\x00\x00\x01\x00\x01G\x88\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x02\x1d\x9d\
-\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x03\x95\xd8\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+
+import numpy as np
+
+from .rfcache import DiagramProducts
+
+
+class PointDragger:
+
+    # Радиус захвата маркера в пикселях
+    PICK_RADIUS = 6.0
+
+    def __init__(self, plot, products_provider, on_moved):
+        # products_provider возвращает продукты отображаемой диаграммы
+        # или None, а on_moved(row, azimuth, distance) записывает новое
+        # положение измерения в модель (азимут в градусах)
+        self.plot = plot
+        self.products_provider = products_provider
+        self.on_moved = on_moved
+
+        self.enabled = True
+        self.drag = None
+
+        canvas = self.plot.canvas
+        canvas.mpl_connect('button_press_event', self.on_press)
+        canvas.mpl_connect('motion_notify_event', self.on_motion)
+        canvas.mpl_connect('button_release_event', self.on_release)
+
+    def is_dragging(self):
+        return self.drag is not None
+
+    def pick(self, products, event):
+        # Найти ближайший к курсору маркер в экранных координатах
+        length = products.order.shape[0]
+        points = self.plot.ax.transData.transform(np.column_stack(
+            (products.azimuths[:length], products.distances[:length])
+        ))
+        distances = np.hypot(points[:, 0] - event.x, points[:, 1] - event.y)
+
+        position = int(np.argmin(distances))
+        return position if distances[position] <= self.PICK_RADIUS else None
+
+    def on_press(self, event):
+        if not self.enabled or event.button != 1 or \
+                event.inaxes is not self.plot.ax:
+            return
+
+        products = self.products_provider()
+        if products is None:
+            return
+
+        position = self.pick(products, event)
+        if position is None:
+            return
+
+        # Если маркеры прорежены, то перемещаемое измерение выводится
+        # дополнительным маркером поверх отображаемого набора
+        marker_azimuths, marker_distances = self.plot.markers.get_data()
+        decimated = len(marker_azimuths) != products.azimuths.shape[0]
+        if decimated:
+            marker_azimuths = np.append(marker_azimuths,
+                                        products.azimuths[position])
+            marker_distances = np.append(marker_distances,
+                                         products.distances[position])
+        else:
+            marker_azimuths, marker_distances = \
+                products.azimuths, products.distances
+
+        # Копия интерполянта обновляется локально при каждом перемещении,
+        # не затрагивая кэшированные продукты модели
+        curve_azimuths, curve_distances = self.plot.curve.get_data()
+        self.drag = dict(
+            products=products,
+            position=position,
+            interpolant=copy.deepcopy(products.interpolant),
+            marker_index=len(marker_azimuths) - 1 if decimated else position,
+            marker_closure=not decimated and position == 0,
+            marker_azimuths=np.array(marker_azimuths, dtype=np.float64),
+            marker_distances=np.array(marker_distances, dtype=np.float64),
+            curve_azimuths=np.asarray(curve_azimuths, dtype=np.float64),
+            curve_distances=np.array(curve_distances, dtype=np.float64),
+            azimuth=None,
+            distance=None
+        )
+
+        blit = self.plot.blit
+        blit.add_artist(self.plot.curve)
+        blit.add_artist(self.plot.markers)
+        blit.capture()
+
+    def on_motion(self, event):
+        if self.drag is None or event.inaxes is not self.plot.ax or \
+                event.xdata is None or event.ydata is None:
+            return
+
+        drag = self.drag
+        position = drag['position']
+        length = drag['products'].order.shape[0]
+
+        azimuth = float(np.mod(event.xdata, 2.0 * np.pi))
+        distance = max(float(event.ydata), 0.0)
+        drag['azimuth'], drag['distance'] = azimuth, distance
+
+        markers_azimuths = drag['marker_azimuths']
+        markers_distances = drag['marker_distances']
+        marker_index = drag['marker_index']
+        markers_azimuths[marker_index], markers_distances[marker_index] = \
+            azimuth, distance
+        if drag['marker_closure']:
+            markers_azimuths[length] = azimuth + 2.0 * np.pi
+            markers_distances[length] = distance
+        self.plot.markers.set_data(markers_azimuths, markers_distances)
+
+        # Пересчитать только участок кривой, затронутый перемещением узла.
+        # Для расчета азимут узла ограничивается соседними узлами, чтобы
+        # не нарушался порядок узлов интерполянта
+        interpolant = drag['interpolant']
+        if interpolant.azimuths.shape[0] == length and length > 1:
+            previous, following = interpolant.neighbours(position)
+            margin = 1e-6 * (following - previous)
+            clamped = self.unwrap(azimuth, previous)
+            clamped = min(max(clamped, previous + margin), following - margin)
+
+            interval = interpolant.update(position, clamped, distance)
+            if interval is not None:
+                curve_azimuths = drag['curve_azimuths']
+                curve_distances = drag['curve_distances']
+                for indices in DiagramProducts.grid_slices(curve_azimuths,
+                                                           *interval):
+                    curve_distances[indices] = \
+                        interpolant(curve_azimuths[indices])
+                self.plot.curve.set_data(curve_azimuths, curve_distances)
+
+        self.plot.blit.update()
+
+    @staticmethod
+    def unwrap(azimuth: float, reference: float):
+        # Представить азимут ближайшим к опорному значением с учетом периода
+        return reference + np.mod(azimuth - reference, 2.0 * np.pi)
+
+    def on_release(self, event):
+        if self.drag is None or event.button != 1:
+            return
+
+        drag, self.drag = self.drag, None
+
+        blit = self.plot.blit
+        blit.remove_artist(self.plot.curve)
+        blit.remove_artist(self.plot.markers)
+
+        if drag['azimuth'] is None:
+            self.plot.canvas.draw_idle()
+            return
+
+        products = drag['products']
+        row = int(products.order[drag['position']])
+        self.on_moved(row, np.degrees(drag['azimuth']), drag['distance'])
+
+
+class HoverReadout:
+
+    # Количество точек окружности перекрестия
+    RING_POINTS = 361
+
+    def __init__(self, plot, products_provider, on_hover, dragger=None):
+        # on_hover(readout) получает кортеж (азимут курсора в градусах,
+        # дальность курсора, дальность зоны действия, номер строки,
+        # азимут и дальность ближайшего измерения) или None, когда курсор
+        # находится вне графика или диаграмма не построена
+        self.plot = plot
+        self.products_provider = products_provider
+        self.on_hover = on_hover
+        self.dragger = dragger
+
+        self.enabled = True
+        self.active = False
+
+        # Перекрестие состоит из луча по азимуту курсора и окружности
+        # с радиусом дальности зоны действия и выводится только блиттингом
+        ax = self.plot.ax
+        self.ring_azimuths = np.linspace(0.0, 2.0 * np.pi, self.RING_POINTS)
+        self.ring_distances = np.zeros(self.RING_POINTS)
+
+        self.ray, = ax.plot([0.0, 0.0], [0.0, 0.0],
+                            color='gray', linewidth=0.8, visible=False)
+        self.ring, = ax.plot(self.ring_azimuths, self.ring_distances,
+                             color='gray', linewidth=0.8, linestyle=':',
+                             visible=False)
+
+        self.plot.blit.add_artist(self.ray)
+        self.plot.blit.add_artist(self.ring)
+
+        canvas = self.plot.canvas
+        canvas.mpl_connect('motion_notify_event', self.on_motion)
+        canvas.mpl_connect('axes_leave_event', self.on_leave)
+        canvas.mpl_connect('figure_leave_event', self.on_leave)
+
+    @staticmethod
+    def nearest(products, azimuth: float):
+        # Позиция ближайшего по азимуту измерения. Азимуты продуктов
+        # отсортированы и замкнуты через период, поэтому соседние узлы
+        # находятся одним двоичным поиском без проверки границ
+        azimuths = products.azimuths
+        length = products.order.shape[0]
+
+        azimuth = azimuths[0] + np.mod(azimuth - azimuths[0], 2.0 * np.pi)
+        position = min(int(np.searchsorted(azimuths, azimuth)), length)
+        if position > 0 and \
+                azimuth - azimuths[position - 1] < azimuths[position] - azimuth:
+            position -= 1
+
+        return position if position < length else 0
+
+    def on_motion(self, event):
+        if not self.enabled or \
+                (self.dragger is not None and self.dragger.is_dragging()):
+            return
+
+        if event.inaxes is not self.plot.ax or \
+                event.xdata is None or event.ydata is None:
+            self.hide()
+            return
+
+        products = self.products_provider()
+        if products is None:
+            self.hide()
+            return
+
+        azimuth = float(np.mod(event.xdata, 2.0 * np.pi))
+        degrees = float(np.degrees(azimuth))
+        coverage = float(products.lookup_table().lookup(degrees))
+
+        position = self.nearest(products, azimuth)
+        row = int(products.order[position])
+
+        self.ray.set_data([azimuth, azimuth], [0.0, self.plot.range_limit])
+        self.ring_distances.fill(coverage)
+        self.ring.set_data(self.ring_azimuths, self.ring_distances)
+        self.ray.set_visible(True)
+        self.ring.set_visible(True)
+        self.active = True
+        self.plot.blit.update()
+
+        self.on_hover((
+            degrees,
+            float(event.ydata),
+            coverage,
+            row,
+            float(np.degrees(np.mod(products.azimuths[position], 2.0 * np.pi))),
+            float(products.distances[position])
+        ))
+
+    def on_leave(self, event):
+        self.hide()
+
+    def hide(self):
+        if not self.active:
+            return
+
+        self.active = False
+        self.ray.set_visible(False)
+        self.ring.set_visible(False)
+        self.plot.blit.update()
+        self.on_hover(None)
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+PERIOD = 2.0 * np.pi
+
+# Реестр доступных методов интерполяции диаграммы по их идентификаторам
+INTERPOLATORS = OrderedDict()
+
+DEFAULT_INTERPOLATOR = 'cubic'
+
+
+def scipy_interpolate():
+    # Модуль интерполяции SciPy загружается при первом построении
+    # интерполянта, так как его импорт заметно замедляет запуск программы
+    from scipy import interpolate
+    return interpolate
+
+
+def register_interpolator(cls):
+    INTERPOLATORS[cls.kind] = cls
+    return cls
+
+
+def unique_azimuths(azimuths, distances):
+    # Объединить измерения с совпадающими азимутами, усреднив дальности,
+    # так как методы интерполяции требуют строго возрастающих узлов
+    azimuths = np.asarray(azimuths, dtype=np.float64)
+    distances = np.asarray(distances, dtype=np.float64)
+
+    if azimuths.shape[0] < 2 or np.all(np.diff(azimuths) > 0.0):
+        return azimuths, distances
+
+    azimuths, inverse, counts = np.unique(azimuths,
+                                          return_inverse=True,
+                                          return_counts=True)
+    distances = np.bincount(inverse, weights=distances) / counts
+
+    return azimuths, distances
+
+
+def periodic_extension(azimuths, distances, pad: int):
+    # Дополнить узлы с обеих сторон их копиями, сдвинутыми на период
+    length = azimuths.shape[0]
+    indices = np.arange(-pad, length + pad)
+    return azimuths[indices % length] + PERIOD * (indices // length), \
+           distances[indices % length]
+
+
+def close_period(azimuths, values):
+    # Замкнуть таблицу значений, повторив первый элемент через период
+    return np.append(azimuths, azimuths[0] + PERIOD), \
+           np.append(values, values[0])
+
+
+def periodic_interp(azimuths, knots, values):
+    # Кусочно-линейная интерполяция по замкнутой таблице. В отличие от
+    # np.interp с параметром period таблица не сортируется при каждом
+    # вызове, так как уже упорядочена и замкнута
+    origin = knots[0]
+    azimuths = origin + np.mod(np.asarray(azimuths, dtype=np.float64) - origin,
+                               PERIOD)
+    return np.interp(azimuths, knots, values)
+
+
+def chord_errors(azimuths, distances, points, x, y):
+    # Расстояния от точек кривой с азимутами points и декартовыми
+    # координатами (x, y) до хорд отрезков выборки (azimuths, distances),
+    # которым они принадлежат, и номера этих отрезков
+    segments = np.clip(np.searchsorted(azimuths, points, side='right') - 1,
+                       0, azimuths.shape[0] - 2)
+    start, end = azimuths[segments], azimuths[segments + 1]
+    t = (points - start) / (end - start)
+
+    x0 = distances[segments] * np.cos(start)
+    y0 = distances[segments] * np.sin(start)
+    x1 = distances[segments + 1] * np.cos(end)
+    y1 = distances[segments + 1] * np.sin(end)
+
+    errors = np.hypot(x - (x0 + t * (x1 - x0)), y - (y0 + t * (y1 - y0)))
+    return errors, segments
+
+
+def farthest_in_segments(errors, segments):
+    # Для упорядоченных номеров отрезков вернуть индексы точек,
+    # наиболее удаленных от хорды в каждом отрезке
+    starts = np.flatnonzero(np.append(True, segments[1:] != segments[:-1]))
+    groups = np.cumsum(np.append(True, segments[1:] != segments[:-1])) - 1
+    largest = np.maximum.reduceat(errors, starts)
+
+    candidates = np.flatnonzero(errors == largest[groups])
+    _, first = np.unique(groups[candidates], return_index=True)
+    return candidates[first]
+
+
+def adaptive_samples(interpolant, knots, scale: float, tolerance: float = 0.5,
+                     min_segments: int = 64, max_depth: int = 16):
+    # Построить выборку кривой диаграммы, достаточную для отображения
+    # с погрешностью не более tolerance пикселей, где scale - количество
+    # пикселей на единицу дальности. Начальная равномерная сетка
+    # уточняется только там, где кривая отклоняется от хорды отрезка
+    # больше допустимого: в середине отрезка или в наиболее удаленном
+    # от хорды узле интерполяции, который и становится точкой деления.
+    # Отрезки уже допустимой погрешности не делятся, поэтому количество
+    # точек определяется погрешностью и размером области отображения,
+    # а не количеством измерений
+    knots = np.asarray(knots, dtype=np.float64)
+    knot_values = interpolant(knots)
+    knot_x, knot_y = knot_values * np.cos(knots), knot_values * np.sin(knots)
+
+    azimuths = np.linspace(knots[0], knots[-1], min_segments + 1,
+                           endpoint=True)
+    distances = interpolant(azimuths)
+
+    for _ in range(max_depth):
+        # Точки деления отрезков: середины отрезков или узлы интерполяции,
+        # наиболее удаленные от хорд, если они отклоняются сильнее середин
+        points = 0.5 * (azimuths[:-1] + azimuths[1:])
+        values = interpolant(points)
+        errors, _ = chord_errors(azimuths, distances, points,
+                                 values * np.cos(points),
+                                 values * np.sin(points))
+
+        knot_errors, segments = chord_errors(azimuths, distances,
+                                             knots, knot_x, knot_y)
+        if knots.shape[0] > 0:
+            worst = farthest_in_segments(knot_errors, segments)
+            worst = worst[knot_errors[worst] > errors[segments[worst]]]
+
+            points[segments[worst]] = knots[worst]
+            values[segments[worst]] = knot_values[worst]
+            errors[segments[worst]] = knot_errors[worst]
+
+        # Отрезки, ширина которых на экране не превышает допустимой
+        # погрешности, не делятся: детали кривой внутри них неразличимы
+        widths = np.diff(azimuths) * np.maximum(distances[:-1],
+                                                distances[1:])
+        refined = (errors * scale > tolerance) & (widths * scale > tolerance)
+        refine = np.flatnonzero(refined)
+        if refine.shape[0] == 0:
+            break
+
+        # Узлы в неделимых отрезках больше не влияют на выборку
+        active = refined[segments]
+        knots, knot_values = knots[active], knot_values[active]
+        knot_x, knot_y = knot_x[active], knot_y[active]
+
+        azimuths = np.insert(azimuths, refine + 1, points[refine])
+        distances = np.insert(distances, refine + 1, values[refine])
+
+    return azimuths, distances
+
+
+def create_interpolator(kind: str, azimuths, distances):
+    # Построить интерполянт по упорядоченным по возрастанию азимутам
+    # из диапазона [0, 2π) без замыкающей точки. Если измерений
+    # недостаточно для выбранного метода, то использовать
+    # кусочно-линейную интерполяцию
+    cls = INTERPOLATORS.get(kind, None)
+    if cls is None:
+        raise KeyError(f"Unknown interpolation method '{kind}'")
+
+    azimuths, distances = unique_azimuths(azimuths, distances)
+    if azimuths.shape[0] < cls.min_points:
+        cls = LinearInterpolator
+
+    return cls(azimuths, distances)
+
+
+class PeriodicInterpolator:
+
+    kind = None
+    min_points = 1
+
+    def __init__(self, azimuths, distances):
+        self.azimuths = azimuths
+        self.distances = distances
+
+    def __call__(self, azimuths):
+        return self.evaluate(azimuths)
+
+    def wrap(self, azimuths):
+        # Привести азимуты к периоду, начинающемуся с первого узла
+        origin = self.azimuths[0]
+        return origin + np.mod(np.asarray(azimuths, dtype=np.float64) - origin,
+                               PERIOD)
+
+    def evaluate(self, azimuths):
+        raise NotImplementedError
+
+    def update(self, index: int, azimuth: float, distance: float):
+        # Заменить узел с указанным номером без перестроения интерполянта.
+        # Возвращает границы (без приведения к периоду) интервала азимутов,
+        # в котором изменились значения, или None, если метод не
+        # поддерживает локальное обновление
+        return None
+
+    def neighbours(self, index: int):
+        # Азимуты соседних узлов с учетом периодичности
+        length = self.azimuths.shape[0]
+        previous = self.azimuths[index - 1] - (PERIOD if index == 0 else 0.0)
+        following = self.azimuths[(index + 1) % length] + \
+            (PERIOD if index == length - 1 else 0.0)
+
+        return previous, following
+
+
+@register_interpolator
+class PeriodicCubicInterpolator(PeriodicInterpolator):
+
+    kind = 'cubic'
+    min_points = 2
+
+    # Количество узлов с каждой стороны от измененного узла, в пределах
+    # которых сплайн пересчитывается при локальном обновлении
+    WINDOW = 8
+
+    def __init__(self, azimuths, distances):
+        super().__init__(azimuths, distances)
+        self.spline = self.fit()
+
+    def fit(self):
+        # Кубический сплайн с периодическими граничными условиями
+        # строится по узлам, замкнутым через период
+        return scipy_interpolate().CubicSpline(
+            np.append(self.azimuths, self.azimuths[0] + PERIOD),
+            np.append(self.distances, self.distances[0]),
+            bc_type='periodic',
+            extrapolate='periodic'
+        )
+
+    def evaluate(self, azimuths):
+        return self.spline(azimuths)
+
+    def update(self, index: int, azimuth: float, distance: float):
+        length = self.azimuths.shape[0]
+        self.azimuths[index] = azimuth
+        self.distances[index] = distance
+
+        if length < 2 * self.WINDOW + 2:
+            self.spline = self.fit()
+            return self.azimuths[0], self.azimuths[0] + PERIOD
+
+        # Решить задачу построения сплайна только в окне вокруг узла,
+        # закрепив производные на границах окна значениями исходного
+        # сплайна. Влияние закрепления затухает экспоненциально
+        # с удалением от измененного узла
+        indices = np.arange(index - self.WINDOW, index + self.WINDOW + 1)
+        knots = self.azimuths[indices % length] + PERIOD * (indices // length)
+        coefficients = self.spline.c
+
+        local = scipy_interpolate().CubicSpline(
+            knots,
+            self.distances[indices % length],
+            bc_type=((1, coefficients[2, indices[0] % length]),
+                     (1, coefficients[2, indices[-1] % length]))
+        )
+
+        coefficients[:, indices[:-1] % length] = local.c
+        self.spline.x[index] = azimuth
+        if index == 0:
+            self.spline.x[length] = azimuth + PERIOD
+
+        return knots[0], knots[-1]
+
+
+@register_interpolator
+class PeriodicPchipInterpolator(PeriodicInterpolator):
+
+    kind = 'pchip'
+    min_points = 2
+
+    # Количество узлов, добавляемых с каждой стороны периода
+    PAD = 2
+
+    def __init__(self, azimuths, distances):
+        super().__init__(azimuths, distances)
+        self.spline = self.build(*periodic_extension(azimuths,
+                                                     distances,
+                                                     self.PAD))
+
+    @staticmethod
+    def build(azimuths, distances):
+        return scipy_interpolate().PchipInterpolator(azimuths, distances,
+                                                     extrapolate=False)
+
+    def evaluate(self, azimuths):
+        return self.spline(self.wrap(azimuths))
+
+
+@register_interpolator
+class PeriodicAkimaInterpolator(PeriodicPchipInterpolator):
+
+    kind = 'akima'
+    min_points = 3
+
+    PAD = 3
+
+    @staticmethod
+    def build(azimuths, distances):
+        return scipy_interpolate().Akima1DInterpolator(azimuths, distances)
+
+
+@register_interpolator
+class LinearInterpolator(PeriodicInterpolator):
+
+    kind = 'linear'
+    min_points = 1
+
+    def __init__(self, azimuths, distances):
+        # Узлы хранятся замкнутыми через период, а азимуты и дальности
+        # интерполянта являются представлениями их незамкнутой части.
+        # Представления не сохраняются в атрибутах, чтобы связь с узлами
+        # не терялась при копировании и сериализации
+        self.knots, self.values = close_period(azimuths, distances)
+
+    @property
+    def azimuths(self):
+        return self.knots[:-1]
+
+    @property
+    def distances(self):
+        return self.values[:-1]
+
+    def evaluate(self, azimuths):
+        return periodic_interp(azimuths, self.knots, self.values)
+
+    def update(self, index: int, azimuth: float, distance: float):
+        self.azimuths[index] = azimuth
+        self.distances[index] = distance
+        if index == 0:
+            self.knots[-1] = azimuth + PERIOD
+            self.values[-1] = distance
+
+        return self.neighbours(index)
+
+
+@register_interpolator
+class TrigonometricInterpolator(PeriodicInterpolator):
+
+    kind = 'fourier'
+    min_points = 3
+
+    # Наибольшее количество гармоник ряда, ограничивающее размер
+    # системы уравнений и стоимость вычисления ряда
+    MAX_HARMONICS = 32
+
+    def __init__(self, azimuths, distances, harmonics=None):
+        super().__init__(azimuths, distances)
+
+        length = azimuths.shape[0]
+        if harmonics is None:
+            harmonics = min((length - 1) // 2, self.MAX_HARMONICS)
+        self.orders = np.arange(1, harmonics + 1)
+
+        # Найти коэффициенты ряда методом наименьших квадратов по самим
+        # измерениям. Если количество гармоник равно (N - 1) / 2 для
+        # нечетного N, то ряд проходит через все измерения
+        phases = np.multiply.outer(np.asarray(azimuths, dtype=np.float64),
+                                   self.orders)
+        design = np.hstack((np.ones((length, 1)), np.cos(phases),
+                            np.sin(phases)))
+        solution, *_ = np.linalg.lstsq(design,
+                                       np.asarray(distances, dtype=np.float64),
+                                       rcond=None)
+
+        self.constant = solution[0]
+        self.cosines = solution[1:harmonics + 1]
+        self.sines = solution[harmonics + 1:]
+
+    @property
+    def harmonics(self):
+        return self.orders.shape[0]
+
+    def evaluate(self, azimuths):
+        phases = np.multiply.outer(np.asarray(azimuths, dtype=np.float64),
+                                   self.orders)
+        return self.constant + np.cos(phases) @ self.cosines + \
+            np.sin(phases) @ self.sines
+
+
+@register_interpolator
+class ClosedParametricInterpolator(PeriodicInterpolator):
+
+    kind = 'parametric'
+    min_points = 3
+
+    # Количество точек табулирования кривой: общее и на отрезок между узлами
+    MIN_SAMPLES = 4096
+    MIN_SEGMENT_SAMPLES = 4
+
+    def __init__(self, azimuths, distances):
+        super().__init__(azimuths, distances)
+
+        # Построить замкнутые периодические сплайны декартовых координат
+        # по параметру накопленной длины хорды
+        x = distances * np.cos(azimuths)
+        y = distances * np.sin(azimuths)
+        points = np.stack((np.append(x, x[0]), np.append(y, y[0])), axis=-1)
+
+        chords = np.hypot(*np.diff(points, axis=0).T)
+        chords = np.maximum(chords, np.finfo(np.float64).eps)
+        parameters = np.append(0.0, np.cumsum(chords))
+
+        self.spline = scipy_interpolate().CubicSpline(parameters, points,
+                                                      bc_type='periodic')
+
+        # Табулировать кривую в полярных координатах для быстрого
+        # вычисления дальности по азимуту
+        length = azimuths.shape[0]
+        samples = length * max(self.MIN_SEGMENT_SAMPLES,
+                               -(-self.MIN_SAMPLES // length))
+        curve = self.spline(np.union1d(
+            np.linspace(0.0, parameters[-1], samples, endpoint=False),
+            parameters[:-1]
+        ))
+
+        table_azimuths = np.mod(np.arctan2(curve[:, 1], curve[:, 0]), PERIOD)
+        order = np.argsort(table_azimuths, kind='stable')
+        self.table_azimuths, self.table = close_period(
+            table_azimuths[order],
+            np.hypot(curve[order, 0], curve[order, 1])
+        )
+
+    def evaluate(self, azimuths):
+        return periodic_interp(azimuths, self.table_azimuths, self.table)
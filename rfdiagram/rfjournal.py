@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import glob
+import logging
+import os
+
+from PySide2 import QtCore
+
+from .rfbinary import write_binary
+from .rfbuffer import MeasurementBuffer
+from .rfrecords import BASE_DOCUMENT, BASE_SNAPSHOT, JOURNAL_HEADER, \
+    RECORD_INSERT, RECORD_REMOVE, RECORD_SET, JournalHeader, \
+    file_signature, pack_record, replay_records
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class EditJournal(QtCore.QObject):
+
+    JOURNAL_NAME = "session.journal"
+    LOCK_NAME = "session.lock"
+    SNAPSHOT_NAME = "session-{}.rfd"
+
+    # Журнал сжимается в снимок документа после этого количества записей
+    # или при достижении этого размера в байтах
+    COMPACT_RECORDS = 10000
+    COMPACT_SIZE = 16 << 20
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent)
+
+        self.path = path
+        self.journal_path = os.path.join(path, self.JOURNAL_NAME)
+
+        # Файл блокировки не позволяет двум экземплярам программы
+        # вести один журнал
+        self.lock_file = QtCore.QLockFile(os.path.join(path, self.LOCK_NAME))
+        self.lock_file.setStaleLockTime(0)
+
+        self.model = None
+        self.fout = None
+        self.header = JournalHeader()
+        self.records = 0
+
+        self.compact_scheduled = False
+        self.reset_pending = False
+
+    @property
+    def enabled(self):
+        return self.fout is not None
+
+    def acquire(self):
+        if not QtCore.QDir().mkpath(self.path):
+            logging.error(f"Cannot create the journal directory {self.path}")
+            return False
+
+        if not self.lock_file.tryLock(0):
+            logging.warning("The edit journal is locked by another instance"
+                            " of the application and will not be used")
+            return False
+
+        return True
+
+    def snapshot_path(self, generation: int):
+        return os.path.join(self.path, self.SNAPSHOT_NAME.format(generation))
+
+    def attach(self, model):
+        self.model = model
+        model.dataChanged.connect(self.on_data_changed)
+        model.rowsInserted.connect(self.on_rows_inserted)
+        model.rowsRemoved.connect(self.on_rows_removed)
+        model.modelReset.connect(self.on_model_reset)
+
+    def pending_recovery(self):
+        # Журнал, оставшийся после предыдущего запуска, означает, что
+        # программа не была завершена штатно. Возвращается его заголовок,
+        # если журнал содержит несохраненные изменения
+        try:
+            with open(self.journal_path, mode='rb') as fin:
+                data = fin.read(JOURNAL_HEADER.size + 0xFFFF)
+                journal_size = os.fstat(fin.fileno()).st_size
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logging.error(f"Cannot read the edit journal: {exc.strerror}")
+            return None
+
+        result = JournalHeader.unpack(data)
+        if result is None:
+            logging.warning("The edit journal is damaged and will be ignored")
+            return None
+
+        # Номера снимков продолжаются, чтобы не перезаписать снимок,
+        # из которого будут восстановлены данные
+        header, header_size = result
+        self.header.generation = header.generation
+        if header.base != BASE_SNAPSHOT and journal_size <= header_size:
+            return None
+
+        return header
+
+    def base_file(self, header: JournalHeader):
+        # Файл исходного состояния документа или None, если исходное
+        # состояние недоступно
+        if header.base == BASE_SNAPSHOT:
+            return self.snapshot_path(header.generation)
+
+        try:
+            signature = file_signature(header.file_name)
+        except OSError as exc:
+            logging.error("Cannot access the journaled document"
+                          f" {header.file_name}: {exc.strerror}")
+            return None
+
+        if signature != (header.mtime, header.size):
+            logging.error(f"The journaled document {header.file_name}"
+                          " has been modified since the last session")
+            return None
+
+        return header.file_name
+
+    def replay(self, columns=None, length: int = None):
+        # Восстановить измерения по исходному состоянию и записям журнала.
+        # Возвращается буфер измерений или None
+        buffer = MeasurementBuffer()
+        if columns is not None:
+            buffer.attach(columns, length)
+
+        try:
+            with open(self.journal_path, mode='rb') as fin:
+                data = fin.read()
+
+            _, offset = JournalHeader.unpack(data)
+            applied = replay_records(buffer, data, offset)
+
+        except (OSError, TypeError, ValueError, IndexError) as exc:
+            logging.error(f"Cannot replay the edit journal: {exc}")
+            return None
+
+        logging.info(f"{applied} records of the edit journal have been"
+                     " replayed")
+        return buffer
+
+    def write_header(self, header: JournalHeader):
+        # Новый журнал записывается во временный файл и атомарно заменяет
+        # прежний, поэтому после сбоя всегда остается целый журнал
+        temp_name = self.journal_path + ".tmp"
+        try:
+            with open(temp_name, mode='wb') as fout:
+                fout.write(header.pack())
+            os.replace(temp_name, self.journal_path)
+
+            if self.fout is not None:
+                self.fout.close()
+            self.fout = open(self.journal_path, mode='ab')
+
+        except OSError as exc:
+            logging.error(f"Cannot write the edit journal: {exc.strerror}")
+            self.fout = None
+            return False
+
+        self.header = header
+        self.records = 0
+        self.compact_scheduled = False
+        self.reset_pending = False
+        self.remove_snapshots(header)
+        return True
+
+    def remove_snapshots(self, header: JournalHeader = None):
+        # Удалить снимки, на которые не ссылается журнал
+        keep = None
+        if header is not None and header.base == BASE_SNAPSHOT:
+            keep = self.snapshot_path(header.generation)
+
+        for file_name in glob.glob(self.snapshot_path('*')):
+            if file_name != keep:
+                try:
+                    os.remove(file_name)
+                except OSError as exc:
+                    logging.warning("Cannot remove the journal snapshot"
+                                    f" {file_name}: {exc.strerror}")
+
+    def restart(self, file_name: str = None):
+        # Начать журнал для документа, сохраненного в файле file_name,
+        # или для нового пустого документа
+        if file_name is None:
+            header = JournalHeader(generation=self.header.generation)
+        else:
+            try:
+                mtime, size = file_signature(file_name)
+            except OSError as exc:
+                logging.error(f"Cannot access the document {file_name}:"
+                              f" {exc.strerror}")
+                return self.compact(file_name)
+
+            header = JournalHeader(BASE_DOCUMENT, self.header.generation,
+                                   file_name, mtime, size)
+
+        return self.write_header(header)
+
+    def compact(self, file_name: str = None):
+        # Записать снимок текущих данных модели и начать журнал с него.
+        # Снимок нового поколения записывается до замены журнала, поэтому
+        # прежний журнал остается согласованным до последнего момента
+        self.compact_scheduled = False
+        if self.model is None:
+            return False
+
+        if file_name is None:
+            file_name = self.header.file_name
+
+        generation = self.header.generation + 1
+        if not write_binary(self.snapshot_path(generation),
+                            self.model.buffer.azimuths,
+                            self.model.buffer.distances):
+            return False
+
+        logging.debug(f"The edit journal has been compacted after"
+                      f" {self.records} records")
+        return self.write_header(
+            JournalHeader(BASE_SNAPSHOT, generation, file_name)
+        )
+
+    def append(self, kind: int, row: int, count: int, values=None):
+        if not self.enabled or self.reset_pending:
+            return
+
+        try:
+            self.fout.write(pack_record(kind, row, count, values))
+            self.fout.flush()
+
+        except OSError as exc:
+            logging.error(f"Cannot append to the edit journal: {exc.strerror}")
+            self.fout.close()
+            self.fout = None
+            return
+
+        self.records += 1
+        if not self.compact_scheduled and \
+                (self.records >= self.COMPACT_RECORDS or
+                 self.fout.tell() >= self.COMPACT_SIZE):
+            # Сжатие выполняется после обработки текущего изменения
+            self.compact_scheduled = True
+            QtCore.QTimer.singleShot(0, self.on_compact_requested)
+
+    def rows(self, first: int, last: int):
+        return self.model.buffer.columns[:, first:last + 1]
+
+    def close(self):
+        # При штатном завершении журнал и снимки удаляются
+        if self.fout is not None:
+            self.fout.close()
+            self.fout = None
+
+            try:
+                os.remove(self.journal_path)
+            except OSError as exc:
+                logging.warning(f"Cannot remove the edit journal:"
+                                f" {exc.strerror}")
+            self.remove_snapshots()
+
+        self.lock_file.unlock()
+
+    @QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+    def on_data_changed(self, top_left: QtCore.QModelIndex,
+                        bottom_right: QtCore.QModelIndex, roles=None):
+        first, last = top_left.row(), bottom_right.row()
+        self.append(RECORD_SET, first, last - first + 1,
+                    self.rows(first, last))
+
+    @QtCore.Slot(QtCore.QModelIndex, int, int)
+    def on_rows_inserted(self, parent: QtCore.QModelIndex,
+                         first: int, last: int):
+        self.append(RECORD_INSERT, first, last - first + 1,
+                    self.rows(first, last))
+
+    @QtCore.Slot(QtCore.QModelIndex, int, int)
+    def on_rows_removed(self, parent: QtCore.QModelIndex,
+                        first: int, last: int):
+        self.append(RECORD_REMOVE, first, last - first + 1)
+
+    @QtCore.Slot()
+    def on_model_reset(self):
+        # Данные модели заменены целиком. Если владелец журнала не начнет
+        # его заново для загруженного файла, журнал сжимается в снимок
+        if self.enabled:
+            self.reset_pending = True
+            QtCore.QTimer.singleShot(0, self.on_reset_timeout)
+
+    @QtCore.Slot()
+    def on_reset_timeout(self):
+        if self.reset_pending:
+            self.compact()
+
+    @QtCore.Slot()
+    def on_compact_requested(self):
+        if self.compact_scheduled:
+            self.compact()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+class RangeLookupTable:
+
+    # Шаг таблицы по азимуту в градусах
+    DEFAULT_RESOLUTION = 0.01
+
+    def __init__(self, interpolant, resolution: float = DEFAULT_RESOLUTION):
+        self.resolution = resolution
+        self.size = int(np.round(360.0 / resolution))
+
+        # Таблица дальностей на равномерной сетке азимутов, замкнутая
+        # через период, чтобы смешивание соседних элементов не требовало
+        # проверки выхода за границу таблицы
+        self.azimuths = np.radians(np.arange(self.size + 1) *
+                                   (360.0 / self.size))
+        self.table = np.asarray(interpolant(self.azimuths), dtype=np.float64)
+        self.table[self.size] = self.table[0]
+
+    def lookup(self, azimuths, blend: bool = True):
+        # Найти дальности по азимутам в градусах. Без смешивания
+        # возвращается значение ближайшего элемента таблицы. Для
+        # неопределенных азимутов (NaN, ±inf) возвращается NaN
+        azimuths = np.asarray(azimuths, dtype=np.float64)
+        finite = np.isfinite(azimuths)
+        if not np.all(finite):
+            ranges = self.lookup(np.where(finite, azimuths, 0.0), blend)
+            return np.where(finite, ranges, np.nan)
+
+        positions = np.mod(azimuths, 360.0) * (self.size / 360.0)
+
+        if not blend:
+            return self.table[np.minimum(np.rint(positions).astype(np.intp),
+                                         self.size)]
+
+        indices = np.minimum(positions.astype(np.intp), self.size - 1)
+        fractions = positions - indices
+
+        lower = self.table[indices]
+        return lower + fractions * (self.table[indices + 1] - lower)
+
+    def update(self, interpolant, slices):
+        # Пересчитать элементы таблицы в диапазонах индексов, затронутых
+        # локальным изменением интерполянта
+        for indices in slices:
+            self.table[indices] = interpolant(self.azimuths[indices])
+        self.table[0] = self.table[self.size] = interpolant(self.azimuths[:1])[0]
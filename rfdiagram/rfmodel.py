@@ -1,22 +1,53 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
-import logging
 import numpy as np
-from scipy import interpolate
 
 from PySide2 import QtCore
 
+from .rfbuffer import MeasurementBuffer, merge_row_ranges
+from .rfcache import DiagramProducts, LRUCache, build_products, \
+    measurements_digest
+from .rfcoverage import DEFAULT_CHUNK_SIZE, classify_cartesian, classify_polar
+from .rfinterp import DEFAULT_INTERPOLATOR
+from .rflookup import RangeLookupTable
+from .rfstats import DEFAULT_SECTOR_WIDTH, coverage_statistics
+
 
 # noinspection PyArgumentList, PyUnresolvedReferences
 class RangeFindingModel(QtCore.QAbstractTableModel):
 
+    # Количество несмежных диапазонов строк, начиная с которого они
+    # удаляются одним сжатием буфера со сбросом модели
+    BULK_REMOVE_RANGES = 16
+
     def __init__(self, locale: QtCore.QLocale, parent=None):
         super().__init__(parent)
 
         self.locale = locale
-        self.measurements = None
+        self.buffer = MeasurementBuffer()
+
+        # Версия данных увеличивается при каждом изменении измерений.
+        # Производные данные диаграммы кэшируются по хэшу содержимого,
+        # который вычисляется не более одного раза для каждой версии
+        self.version = 0
+        self.digest = None
+        self.digest_version = -1
+        self.products_cache = LRUCache()
+
+        # Последние построенные продукты для каждого метода интерполяции
+        # и последняя серия изменений одного измерения в виде (первая
+        # версия, последняя версия, строка), позволяющие обновлять сплайн
+        # локально без полного перестроения
+        self.incremental = True
+        self.latest_products = {}
+        self.last_edit = None
+
+    @property
+    def measurements(self):
+        # Представление логически занятой части буфера измерений
+        # или None, если измерения отсутствуют
+        return self.buffer.view() if len(self.buffer) > 0 else None
 
     def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.DisplayRole):
         if not index.isValid() or self.measurements is None:
@@ -79,6 +110,15 @@ class RangeFindingModel(QtCore.QAbstractTableModel):
                 modified = True
 
             if modified:
+                # Последовательные изменения азимута и дальности одного
+                # измерения объединяются в одну серию
+                previous = self.last_edit
+                self.update_version()
+                if previous is not None and previous[2] == row and \
+                        previous[1] == self.version - 1:
+                    self.last_edit = (previous[0], self.version, row)
+                else:
+                    self.last_edit = (self.version, self.version, row)
                 self.dataChanged.emit(index, index, [ QtCore.Qt.EditRole ])
 
     def headerData(self, section: int, orientation, role=QtCore.Qt.DisplayRole):
@@ -97,101 +137,103 @@ class RangeFindingModel(QtCore.QAbstractTableModel):
         return 2
 
     def rowCount(self, index=QtCore.QModelIndex()):
-        return self.measurements.shape[0] if self.measurements is not None else 0
+        return len(self.buffer)
 
     def insertRows(self, row: int, count: int, parent=QtCore.QModelIndex()):
-        if row < 0 or count <= 0:
+        if row < 0 or count <= 0 or row > len(self.buffer):
             return False
 
-        if self.measurements is None:
-            if row == 0:
-                # Если данных измерений нет, то создать заполненный нулями массив
-                self.beginInsertRows(parent, row, row + count - 1)
-                self.measurements = np.zeros((count, 2), dtype=np.float32)
-                self.endInsertRows()
-
-                return True
-
-        else:
-            if row < self.measurements.shape[0]:
-                # Выполнить объединение по вертикали текущего массива измерений
-                # с массивом, заполненным нулями, предварительно разделив
-                # текущий массив измерений на две части, в случае, если требуется
-                # выполнить вставку строк в середину модели.
-                self.beginInsertRows(parent, row, row + count - 1)
-                self.measurements = np.vstack((
-                    self.measurements[:row, :].copy(),
-                    np.zeros((count, 2), dtype=np.float32),
-                    self.measurements[row:, :].copy()
-                ))
-                self.endInsertRows()
-
-                return True
-
-            elif row == self.measurements.shape[0]:
-                # Если требуется добавить строки в конец модели, то выполнить
-                # объединение по вертикали текущего массива измерений с
-                # массивом, заполненным нулями.
-                self.beginInsertRows(parent, row, row + count - 1)
-                self.measurements = np.vstack((
-                    self.measurements,
-                    np.zeros((count, 2), dtype=np.float32)
-                ))
-                self.endInsertRows()
-
-                return True
-
-        return False
+        # Вставить строки, заполненные нулями, сдвинув хвост буфера
+        # измерений; при вставке в конец сдвиг не выполняется
+        self.beginInsertRows(parent, row, row + count - 1)
+        self.buffer.insert(row, count)
+        self.update_version()
+        self.endInsertRows()
+
+        return True
 
     def removeRows(self, row: int, count: int, parent=QtCore.QModelIndex()):
-        if row < 0 or count <= 0 or self.measurements is None:
+        if row < 0 or count <= 0 or row >= len(self.buffer):
             return False
 
-        end = min(row + count, self.measurements.shape[0])
+        end = min(row + count, len(self.buffer))
 
-        if row == 0:
+        self.beginRemoveRows(parent, row, end - 1)
+        self.buffer.remove(row, end - row)
+        self.update_version()
+        self.endRemoveRows()
 
-            self.beginRemoveRows(parent, row, end - 1)
-            if end == self.measurements.shape[0]:
-                # Требуется удалить весь набор измерений
-                self.measurements = None
-            else:
-                # Требуется удалить часть данных с начала массива
-                self.measurements = self.measurements[end:, :].copy()
+        return True
 
-            self.endRemoveRows()
+    def insert_measurements(self, row: int, values, parent=QtCore.QModelIndex()):
+        values = np.asarray(values, dtype=np.float32).reshape((-1, 2))
+        count = values.shape[0]
+        if row < 0 or count == 0 or row > len(self.buffer):
+            return False
 
-            return True
+        # Вставить весь блок измерений одной операцией с буфером
+        # и одним уведомлением представлений
+        self.beginInsertRows(parent, row, row + count - 1)
+        self.buffer.insert(row, count, values)
+        self.update_version()
+        self.endInsertRows()
+
+        return True
+
+    def remove_row_ranges(self, ranges, parent=QtCore.QModelIndex()):
+        length = len(self.buffer)
+        ranges = [(row, min(row + count, length) - row)
+                  for row, count in merge_row_ranges(ranges)
+                  if 0 <= row < length]
+        if not ranges:
+            return False
 
-        elif row < self.measurements.shape[0]:
+        if len(ranges) > self.BULK_REMOVE_RANGES:
+            # Множество диапазонов удаляется одной операцией с буфером,
+            # одним изменением версии и одним уведомлением представлений
+            self.beginResetModel()
+            try:
+                self.buffer.remove_ranges(ranges)
+                self.update_version()
+            finally:
+                self.endResetModel()
 
-            self.beginRemoveRows(parent, row, end - 1)
-            if end == self.measurements.shape[0]:
-                # Требуется удалить часть данных с конца массива
-                self.measurements = self.measurements[:row, :].copy()
-            else:
-                # Требуется удалить часть данных из середины массива
-                self.measurements = np.vstack((
-                    self.measurements[:row, :].copy(),
-                    self.measurements[end:, :].copy()
-                ))
+            return True
 
+        # Удалять непрерывные диапазоны, начиная с последнего, чтобы номера
+        # строк оставшихся диапазонов не смещались. Каждый диапазон требует
+        # отдельного уведомления, так как Qt не допускает удаления
+        # несмежных строк одним вызовом beginRemoveRows
+        for row, count in reversed(ranges):
+            self.beginRemoveRows(parent, row, row + count - 1)
+            self.buffer.remove(row, count)
+            self.update_version()
             self.endRemoveRows()
 
-            return True
-
-        return False
+        return True
 
     def clear(self):
         if self.measurements is not None:
             self.beginRemoveRows(QtCore.QModelIndex(),
                                  0,
                                  self.measurements.shape[0] - 1)
-            self.measurements = None
+            self.buffer.clear()
+            self.update_version()
             self.endRemoveRows()
 
+    def update_version(self):
+        self.version += 1
+
+    def content_digest(self):
+        if self.digest_version != self.version:
+            self.digest = measurements_digest(self.buffer.azimuths,
+                                              self.buffer.distances)
+            self.digest_version = self.version
+
+        return self.digest
+
     def empty(self):
-        return self.measurements is None
+        return len(self.buffer) == 0
 
     def flags(self, index: QtCore.QModelIndex):
         if not index.isValid() or self.measurements is None:
@@ -204,77 +246,140 @@ class RangeFindingModel(QtCore.QAbstractTableModel):
 
         return QtCore.Qt.ItemIsEnabled
 
-    def prepare(self):
+    def products(self, kind: str = DEFAULT_INTERPOLATOR, build: bool = True):
+        # Производные данные диаграммы для текущей версии данных. Если
+        # build равен False, то возвращаются только уже построенные
+        # или локально обновляемые продукты
         if self.measurements is None:
+            return None
+
+        products = self.latest_products.get(kind, None)
+        if products is not None:
+            if products.version == self.version:
+                return products
+
+            # Продукты, построенные до серии изменений одного измерения
+            # или в ее ходе, обновляются по текущим значениям этого
+            # измерения, поскольку остальные измерения не изменялись
+            if self.incremental and \
+                    self.last_edit is not None and \
+                    self.last_edit[0] - 1 <= products.version and \
+                    self.last_edit[1] == self.version:
+                row = self.last_edit[2]
+                # Продукты изменяются на месте, поэтому они больше
+                # не соответствуют ключу кэша, вычисленному по содержимому
+                if products.update(row,
+                                   self.buffer.azimuths[row],
+                                   self.buffer.distances[row]):
+                    self.products_cache.pop(products.key)
+                    products.key = None
+                    products.version = self.version
+                    return products
+
+        key = (self.content_digest(), kind)
+        products = self.products_cache.get(key)
+        if products is None:
+            if not build:
+                return None
+
+            products = build_products(kind,
+                                      self.buffer.azimuths,
+                                      self.buffer.distances)
+            products.key = key
+            self.products_cache.put(key, products)
+
+        products.version = self.version
+        self.latest_products[kind] = products
+
+        return products
+
+    def adopt_products(self, products: DiagramProducts, version: int):
+        # Принять продукты, построенные вне модели (например, в фоновом
+        # потоке) по снимку данных указанной версии. Продукты для
+        # устаревшей версии отбрасываются
+        if version != self.version:
+            return False
+
+        key = (self.content_digest(), products.kind)
+        if products.key is not None and products.key != key:
+            return False
+
+        products.key = key
+        products.version = self.version
+        self.products_cache.put(key, products)
+        self.latest_products[products.kind] = products
+
+        return True
+
+    def prepare(self, kind: str = DEFAULT_INTERPOLATOR):
+        products = self.products(kind)
+        if products is None:
             return False, None, None, None
 
-        items = []
-        for i in range(self.measurements.shape[0]):
-            azimuth = self.measurements[i, 0]
-            azimuth -= 360.0 * np.floor(azimuth / 360.0)
-            items.append((azimuth * np.pi / 180.0,
-                          self.measurements[i, 1]))
-
-        items = list(sorted(items, key=lambda item: item[0]))
-        items.append((items[0][0] + 2.0 * np.pi, items[0][1]))
-
-        length = len(items)
-        azimuths = np.zeros((length,), dtype=np.float32)
-        distances = np.zeros((length,), dtype=np.float32)
-
-        for i, (azimuth, distance) in enumerate(items):
-            azimuths[i] = azimuth
-            distances[i] = distance
-
-        return True, azimuths, distances, \
-               interpolate.interp1d(
-                   azimuths,
-                   distances,
-                   kind='cubic',
-                   fill_value='extrapolate'
-               )
-
-    def to_json(self):
-        values = []
-        if self.measurements is not None:
-            for i in range(self.measurements.shape[0]):
-                values.append(dict(azimuth=float(self.measurements[i, 0]),
-                                   distance=float(self.measurements[i, 1])))
+        return True, products.azimuths, products.distances, \
+               products.interpolant
 
-        return json.dumps(dict(measurements=values, version="1.0"))
+    def range_at(self, azimuths, blend: bool = True,
+                 kind: str = DEFAULT_INTERPOLATOR,
+                 resolution: float = RangeLookupTable.DEFAULT_RESOLUTION):
+        # Дальности зоны действия по азимутам в градусах, найденные
+        # по таблице, которая строится один раз для каждой версии данных
+        products = self.products(kind)
+        if products is None:
+            return None
 
-    def from_json(self, json_data: str):
-        try:
-            self.beginResetModel()
-            content = json.loads(json_data)
-
-            # Получить версию файла с данными
-            version = content.get('version', None)
-            if not version:
-                logging.error("Cannot retrieve version of JSON data")
-                return False
-
-            elif version == "1.0":
-                measurements = content.get('measurements', None)
-                if not measurements:
-                    logging.error("Cannot retrieve measurements from JSON data")
-                    return False
-
-                self.measurements = np.zeros((len(measurements), 2))
-                for i, measurement in enumerate(measurements):
-                    for key, value in measurement.items():
-                        if key == 'azimuth':
-                            self.measurements[i, 0] = np.float32(value)
-                        elif key == 'distance':
-                            self.measurements[i, 1] = np.float32(value)
-                        else:
-                            logging.warning(f"Unrecognized key {key} in JSON data")
-
-                return True, None
-
-        except json.JSONDecodeError as exc:
-            logging.error(f"An exception occurred during reading JSON data: {exc.msg}")
-            return False
+        return products.lookup_table(resolution).lookup(azimuths, blend)
 
+    def classify(self, azimuths, ranges, kind: str = DEFAULT_INTERPOLATOR,
+                 resolution: float = RangeLookupTable.DEFAULT_RESOLUTION,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1):
+        # Маски целей внутри зоны действия и запасы по дальности
+        # для целей, заданных азимутами в градусах и дальностями
+        products = self.products(kind)
+        if products is None:
+            return None
+
+        return classify_polar(products.lookup_table(resolution).lookup,
+                              azimuths, ranges, chunk_size, workers)
+
+    def classify_xy(self, x, y, kind: str = DEFAULT_INTERPOLATOR,
+                    resolution: float = RangeLookupTable.DEFAULT_RESOLUTION,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1):
+        products = self.products(kind)
+        if products is None:
+            return None
+
+        return classify_cartesian(products.lookup_table(resolution).lookup,
+                                  x, y, chunk_size, workers)
+
+    def statistics(self, sector_width: float = DEFAULT_SECTOR_WIDTH,
+                   kind: str = DEFAULT_INTERPOLATOR,
+                   resolution: float = RangeLookupTable.DEFAULT_RESOLUTION):
+        products = self.products(kind)
+        if products is None:
+            return None
+
+        key = (sector_width, resolution)
+        statistics = products.statistics.get(key, None)
+        if statistics is None:
+            statistics = products.statistics[key] = coverage_statistics(
+                products.interpolant,
+                products.lookup_table(resolution),
+                products.distances,
+                sector_width
+            )
+
+        return statistics
+
+    def is_mapped(self):
+        return self.buffer.mapped
+
+    def adopt_columns(self, columns, length: int = None):
+        # Заменить данные модели столбцами, прочитанными из файла.
+        # Столбцы, отображенные в память, не копируются
+        self.beginResetModel()
+        try:
+            self.buffer.attach(columns, length)
+            self.update_version()
         finally:
             self.endResetModel()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import shiboken2
+
+from PySide2 import QtCore
+from PySide2 import QtGui
+from PySide2 import QtWidgets
+
+from .rfplot import PolarPlotController, decimate_markers
+
+
+def polygon(x, y):
+    # Многоугольник Qt из массивов координат точек. Точки QPointF хранятся
+    # в буфере многоугольника парами чисел double, поэтому буфер
+    # заполняется непосредственно из массивов без создания объектов точек
+    size = x.shape[0]
+    result = QtGui.QPolygonF()
+    result.resize(size)
+    if size > 0:
+        buffer = shiboken2.VoidPtr(result.data(), 2 * size * 8, True)
+        points = np.frombuffer(buffer, dtype=np.float64).reshape((size, 2))
+        points[:, 0] = x
+        points[:, 1] = y
+
+    return result
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class PolarPlotWidget(QtWidgets.QWidget):
+
+    # Отступ от края виджета до окружности графика в пикселях,
+    # необходимый для подписей азимутов, и шаг радиальных линий в градусах
+    MARGIN = 30
+    AZIMUTH_STEP = 45
+
+    # Ориентировочное количество колец шкалы дальности
+    RANGE_RINGS = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setAutoFillBackground(True)
+        palette = self.palette()
+        palette.setColor(QtGui.QPalette.Window, QtCore.Qt.white)
+        self.setPalette(palette)
+
+        # Перья с постоянной толщиной в пикселях, поскольку кривая и маркеры
+        # рисуются в координатах данных с преобразованием масштаба
+        self.grid_pen = QtGui.QPen(QtGui.QColor(176, 176, 176), 0.8)
+        self.grid_pen.setCosmetic(True)
+
+        self.curve_pen = QtGui.QPen(QtGui.QColor('maroon'), 1.5,
+                                    QtCore.Qt.DashLine)
+        self.curve_pen.setCosmetic(True)
+
+        self.marker_pen = QtGui.QPen(QtGui.QColor('darkblue'), 7.0,
+                                     QtCore.Qt.SolidLine, QtCore.Qt.RoundCap)
+        self.marker_pen.setCosmetic(True)
+
+        # Кривая и маркеры хранятся в декартовых координатах данных
+        # и строятся при выводе диаграммы, а не при каждой перерисовке.
+        # Прореженные маркеры строятся заново при изменении масштаба
+        self.curve_path = QtGui.QPainterPath()
+        self.marker_points = QtGui.QPolygonF()
+        self.data = None
+
+        # Масштаб, для которого выполнено прореживание маркеров
+        self.lod_scale = None
+
+        self.range_limit = PolarPlotController.MIN_RANGE_LIMIT
+
+    @classmethod
+    def range_limit_for(cls, max_range: float):
+        return PolarPlotController.range_limit_for(max_range)
+
+    def radius(self):
+        # Радиус области графика в пикселях
+        return max(0.5 * min(self.width(), self.height()) - self.MARGIN, 1.0)
+
+    def center(self):
+        return QtCore.QPointF(0.5 * self.width(), 0.5 * self.height())
+
+    def set_range_limit(self, range_limit: float):
+        self.range_limit = range_limit
+
+    @classmethod
+    def range_step(cls, range_limit: float):
+        # Шаг колец шкалы дальности из ряда 1, 2, 2.5, 5 и 10
+        raw = range_limit / cls.RANGE_RINGS
+        magnitude = 10.0 ** np.floor(np.log10(raw))
+        for factor in (1.0, 2.0, 2.5, 5.0):
+            if raw <= factor * magnitude:
+                return factor * magnitude
+
+        return 10.0 * magnitude
+
+    def show(self, azimuths, distances, curve_azimuths, curve_distances):
+        self.data = (azimuths, distances, curve_azimuths, curve_distances)
+
+        curve_azimuths = np.asarray(curve_azimuths, dtype=np.float64)
+        curve_distances = np.asarray(curve_distances, dtype=np.float64)
+        self.curve_path = QtGui.QPainterPath()
+        self.curve_path.addPolygon(polygon(
+            curve_distances * np.cos(curve_azimuths),
+            curve_distances * np.sin(curve_azimuths)
+        ))
+
+        max_range = max(np.max(distances), np.max(curve_distances))
+        self.set_range_limit(self.range_limit_for(max_range))
+
+        self.lod_scale = None
+        self.update_markers()
+
+        self.update()
+
+    def update_markers(self):
+        if self.data is None:
+            return
+
+        # Полный набор маркеров не зависит от масштаба и строится один раз
+        azimuths, distances = self.data[:2]
+        decimated = azimuths.shape[0] > PolarPlotController.LOD_THRESHOLD
+        scale = self.radius() / self.range_limit
+        if self.lod_scale is not None and \
+                (not decimated or scale == self.lod_scale):
+            return
+        self.lod_scale = scale
+
+        if decimated:
+            indices = decimate_markers(azimuths, distances, scale,
+                                       self.range_limit,
+                                       PolarPlotController.LOD_CELL_SIZE)
+            azimuths, distances = azimuths[indices], distances[indices]
+
+        azimuths = np.asarray(azimuths, dtype=np.float64)
+        distances = np.asarray(distances, dtype=np.float64)
+        self.marker_points = polygon(distances * np.cos(azimuths),
+                                     distances * np.sin(azimuths))
+
+    def resizeEvent(self, event: QtGui.QResizeEvent):
+        # При изменении размеров виджета меняется масштаб графика,
+        # поэтому прореживание маркеров уточняется
+        self.update_markers()
+        super().resizeEvent(event)
+
+    def clear(self):
+        self.curve_path = QtGui.QPainterPath()
+        self.marker_points = QtGui.QPolygonF()
+        self.data = None
+        self.lod_scale = None
+        self.set_range_limit(PolarPlotController.MIN_RANGE_LIMIT)
+
+        self.update()
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        center, radius = self.center(), self.radius()
+        self.draw_grid(painter, center, radius)
+
+        # Ось Y экрана направлена вниз, поэтому масштаб по ней отрицательный
+        scale = radius / self.range_limit
+        painter.setTransform(QtGui.QTransform(scale, 0.0, 0.0, -scale,
+                                              center.x(), center.y()))
+
+        painter.setPen(self.curve_pen)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawPath(self.curve_path)
+
+        painter.setPen(self.marker_pen)
+        painter.drawPoints(self.marker_points)
+
+        painter.end()
+
+    def draw_grid(self, painter: QtGui.QPainter,
+                  center: QtCore.QPointF, radius: float):
+        metrics = painter.fontMetrics()
+        text_color = self.palette().color(QtGui.QPalette.WindowText)
+
+        # Кольца шкалы дальности с подписями вдоль луча 22.5°
+        step = self.range_step(self.range_limit)
+        label_direction = np.radians(22.5)
+        for value in np.arange(step, self.range_limit + 0.5 * step, step):
+            value = min(value, self.range_limit)
+            ring_radius = radius * value / self.range_limit
+
+            painter.setPen(self.grid_pen)
+            painter.drawEllipse(center, ring_radius, ring_radius)
+
+            painter.setPen(text_color)
+            painter.drawText(QtCore.QPointF(
+                center.x() + ring_radius * np.cos(label_direction),
+                center.y() - ring_radius * np.sin(label_direction)
+            ), f"{value:g}")
+
+        # Радиальные линии с подписями азимутов за окружностью графика
+        for azimuth in range(0, 360, self.AZIMUTH_STEP):
+            direction = np.radians(azimuth)
+            cos, sin = np.cos(direction), np.sin(direction)
+
+            painter.setPen(self.grid_pen)
+            painter.drawLine(center, QtCore.QPointF(center.x() + radius * cos,
+                                                    center.y() - radius * sin))
+
+            text = f"{azimuth}°"
+            painter.setPen(text_color)
+            label_radius = radius + 0.5 * self.MARGIN
+            painter.drawText(QtCore.QRectF(
+                center.x() + label_radius * cos - 0.5 * metrics.width(text),
+                center.y() - label_radius * sin - 0.5 * metrics.height(),
+                metrics.width(text),
+                metrics.height()
+            ), QtCore.Qt.AlignCenter, text)
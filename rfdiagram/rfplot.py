@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def decimate_markers(azimuths, distances, scale: float, range_limit: float,
+                     cell_size: float):
+    # Индексы маркеров, представляющих измерения в ячейках экранной сетки
+    # размером cell_size пикселей при масштабе scale пикселей на единицу
+    # дальности. В каждой ячейке остается одно измерение, а измерения
+    # за пределами шкалы дальности не отображаются
+    visible = np.flatnonzero(distances <= range_limit)
+    azimuths, distances = azimuths[visible], distances[visible]
+
+    factor = scale / cell_size
+    extent = int(np.ceil(range_limit * factor))
+    size = 2 * extent + 1
+
+    x = np.floor(distances * np.cos(azimuths) * factor).astype(np.intp)
+    y = np.floor(distances * np.sin(azimuths) * factor).astype(np.intp)
+    keys = np.clip(x + extent, 0, size - 1) * size + \
+        np.clip(y + extent, 0, size - 1)
+
+    # Каждая ячейка хранит номер одного из попавших в нее измерений
+    cells = np.full(size * size, -1, dtype=np.intp)
+    cells[keys] = visible
+
+    return cells[cells >= 0]
+
+
+class BlitManager:
+
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+
+        # Анимируемые объекты не отрисовываются при полной перерисовке
+        # холста и выводятся поверх сохраненного фона при блиттинге
+        self.artists = []
+        self.background = None
+
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def add_artist(self, artist):
+        if artist not in self.artists:
+            artist.set_animated(True)
+            self.artists.append(artist)
+
+    def remove_artist(self, artist):
+        if artist in self.artists:
+            artist.set_animated(False)
+            self.artists.remove(artist)
+
+    def capture(self):
+        # Перерисовать холст без анимируемых объектов, сохранив фон
+        self.canvas.draw()
+
+    def on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_artists()
+
+    def draw_artists(self):
+        for artist in self.artists:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def update(self):
+        # Восстановить фон и перерисовать только анимируемые объекты
+        if self.background is None:
+            self.capture()
+            return
+
+        self.canvas.restore_region(self.background)
+        self.draw_artists()
+        self.canvas.blit(self.ax.bbox)
+
+
+class PolarPlotController:
+
+    # Минимальный предел шкалы дальности и запас над максимальной дальностью
+    MIN_RANGE_LIMIT = 50.0
+    RANGE_MARGIN = 10.0
+
+    # Начиная с этого количества измерений, маркеры прореживаются
+    # по ячейкам экранной сетки с заданным размером в пикселях
+    LOD_THRESHOLD = 5000
+    LOD_CELL_SIZE = 2.0
+
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+
+        # Оси и линии графика создаются один раз, а при построении
+        # диаграммы обновляются только данные линий и, при необходимости,
+        # предел шкалы дальности
+        self.ax = self.figure.add_subplot(111, projection='polar')
+        self.ax.grid(True)
+
+        self.curve, = self.ax.plot([], [], color='maroon', linestyle='--')
+        self.markers, = self.ax.plot([], [],
+                                     color='darkblue',
+                                     marker='o',
+                                     linestyle='none')
+
+        self.range_limit = None
+        self.ax.set_rmin(0.0)
+        self.set_range_limit(self.MIN_RANGE_LIMIT)
+
+        self.blit = BlitManager(self.canvas, self.ax)
+
+        # Полный набор измерений и масштаб, для которого выполнено
+        # прореживание маркеров. При изменении размеров холста маркеры
+        # прореживаются заново до перерисовки, а при изменении предела
+        # шкалы вне контроллера - после нее с повторной перерисовкой
+        self.marker_data = None
+        self.lod_scale = None
+
+        self.canvas.mpl_connect('resize_event', self.on_resize)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    @classmethod
+    def range_limit_for(cls, max_range: float):
+        return max_range + cls.RANGE_MARGIN \
+            if max_range > cls.MIN_RANGE_LIMIT else cls.MIN_RANGE_LIMIT
+
+    def radius(self):
+        # Радиус области графика в пикселях
+        return 0.5 * min(self.ax.bbox.width, self.ax.bbox.height)
+
+    def set_range_limit(self, range_limit: float):
+        # Пересчет делений шкалы выполняется только при изменении предела
+        if range_limit != self.range_limit:
+            self.ax.set_rmax(range_limit)
+            self.range_limit = range_limit
+
+    def show(self, azimuths, distances, curve_azimuths, curve_distances):
+        self.curve.set_data(curve_azimuths, curve_distances)
+        self.marker_data = (azimuths, distances)
+        self.lod_scale = None
+
+        max_range = max(np.max(distances), np.max(curve_distances))
+        self.set_range_limit(self.range_limit_for(max_range))
+        self.update_markers()
+
+        self.canvas.draw_idle()
+
+    def update_markers(self):
+        if self.marker_data is None:
+            return False
+
+        range_limit = self.ax.get_rmax()
+        scale = self.radius() / range_limit
+        if scale == self.lod_scale:
+            return False
+        self.lod_scale = scale
+
+        azimuths, distances = self.marker_data
+        if azimuths.shape[0] > self.LOD_THRESHOLD:
+            indices = decimate_markers(azimuths, distances, scale,
+                                       range_limit, self.LOD_CELL_SIZE)
+            azimuths, distances = azimuths[indices], distances[indices]
+
+        self.markers.set_data(azimuths, distances)
+        return True
+
+    def on_resize(self, event):
+        self.update_markers()
+
+    def on_draw(self, event):
+        if self.update_markers():
+            self.canvas.draw_idle()
+
+    def clear(self):
+        self.curve.set_data([], [])
+        self.markers.set_data([], [])
+        self.marker_data = None
+        self.lod_scale = None
+        self.set_range_limit(self.MIN_RANGE_LIMIT)
+
+        self.canvas.draw_idle()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from PySide2 import QtCore
+
+
+PROFILE_STARTUP_SWITCH = "--profile-startup"
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class FirstPaintWatcher(QtCore.QObject):
+
+    # Сигнал испускается после завершения первой отрисовки виджета
+    painted = QtCore.Signal()
+
+    def __init__(self, widget: QtCore.QObject, profiler=None, name: str = None):
+        super().__init__(widget)
+
+        self.profiler = profiler
+        self.name = name
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent):
+        if event.type() == QtCore.QEvent.Paint:
+            # Окончание отрисовки отмечается в следующей итерации цикла
+            # обработки событий, после выполнения обработчика отрисовки
+            watched.removeEventFilter(self)
+            if self.profiler is not None:
+                self.profiler.mark(f"{self.name}_started")
+            QtCore.QTimer.singleShot(0, self.on_painted)
+
+        return False
+
+    @QtCore.Slot()
+    def on_painted(self):
+        if self.profiler is not None:
+            self.profiler.mark(self.name)
+        self.painted.emit()
+        self.deleteLater()
+
+
+class StartupProfiler:
+
+    def __init__(self, origin: float, enabled: bool = False):
+        # Отметки времени отсчитываются в миллисекундах от момента origin,
+        # полученного функцией time.perf_counter
+        self.origin = origin
+        self.enabled = enabled
+
+        self.phases = []
+        self.marks = []
+        self.output_path = None
+        self.finished = False
+
+        # Отметки, после появления которых профилирование завершается
+        self.required = set()
+
+    @classmethod
+    def from_arguments(cls, origin: float, arguments):
+        return cls(origin, PROFILE_STARTUP_SWITCH in arguments)
+
+    def elapsed(self, timestamp: float = None):
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        return (timestamp - self.origin) * 1000.0
+
+    def finish_when(self, *names):
+        self.required = set(names)
+
+    def mark(self, name: str):
+        if self.enabled and not self.finished:
+            self.marks.append((name, self.elapsed()))
+
+            if self.required and \
+                    self.required <= {marked for marked, _ in self.marks}:
+                self.finish()
+
+    def record(self, name: str, started: float, finished: float):
+        # Добавить этап, границы которого измерены вызывающей стороной
+        if self.enabled and not self.finished:
+            self.phases.append((name, self.elapsed(started),
+                                self.elapsed(finished)))
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started, time.perf_counter())
+
+    def watch_first_paint(self, widget: QtCore.QObject, name: str):
+        # Отметить начало и окончание первой отрисовки виджета
+        if self.enabled and not self.finished:
+            FirstPaintWatcher(widget, self, name)
+
+    def report(self):
+        return {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'arguments': sys.argv[1:],
+            'phases': [
+                {
+                    'name': name,
+                    'start_ms': round(start, 3),
+                    'end_ms': round(end, 3),
+                    'duration_ms': round(end - start, 3)
+                }
+                for name, start, end in self.phases
+            ],
+            'marks': [
+                {'name': name, 'time_ms': round(moment, 3)}
+                for name, moment in self.marks
+            ]
+        }
+
+    def finish(self):
+        # Записать результаты профилирования в журнал и в файл JSON
+        if not self.enabled or self.finished:
+            return False
+        self.finished = True
+
+        for name, start, end in self.phases:
+            logging.info(f"Startup phase '{name}': {start:.1f} - {end:.1f} ms"
+                         f" ({end - start:.1f} ms)")
+        for name, moment in self.marks:
+            logging.info(f"Startup mark '{name}': {moment:.1f} ms")
+
+        if self.output_path is None:
+            return True
+
+        try:
+            with open(self.output_path, mode='w', encoding='utf-8') as fout:
+                json.dump(self.report(), fout, indent=2)
+
+        except OSError as exc:
+            logging.error(f"Cannot write the startup profile: {exc}")
+            return False
+
+        logging.info(f"The startup profile has been written to the file"
+                     f" '{self.output_path}'")
+        return True
+
+    def set_output_directory(self, path: str):
+        self.output_path = os.path.join(
+            path, datetime.now().strftime("startup-%Y%m%d-%H%M%S.json")
+        )
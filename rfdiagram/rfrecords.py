@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+
+import numpy as np
+
+from .rfbinary import COLUMN_DTYPE
+from .rfbuffer import MeasurementBuffer
+
+
+# Журнал изменений документа. Файл начинается с заголовка, который
+# описывает исходное состояние документа, за которым следуют записи
+# изменений. Каждое изменение дописывается в конец файла, поэтому его
+# стоимость пропорциональна размеру изменения, а не размеру документа
+JOURNAL_MAGIC = b"RFJL"
+JOURNAL_VERSION = 1
+
+# Сигнатура, версия, вид исходного состояния, номер снимка, время
+# изменения и размер файла документа, длина имени файла документа
+JOURNAL_HEADER = struct.Struct('<4sHBQqQH')
+
+# Исходное состояние: пустой документ, файл документа или снимок
+BASE_EMPTY = 0
+BASE_DOCUMENT = 1
+BASE_SNAPSHOT = 2
+
+# Вид записи, номер первой строки и количество строк. За записями
+# изменения и вставки следуют столбцы азимутов и дальностей строк
+RECORD = struct.Struct('<BQQ')
+
+RECORD_SET = 1
+RECORD_INSERT = 2
+RECORD_REMOVE = 3
+
+
+class JournalHeader:
+
+    def __init__(self, base: int = BASE_EMPTY, generation: int = 0,
+                 file_name: str = None, mtime: int = 0, size: int = 0):
+        self.base = base
+        self.generation = generation
+        self.file_name = file_name
+        self.mtime = mtime
+        self.size = size
+
+    def pack(self):
+        name = self.file_name.encode('utf-8') if self.file_name else b''
+        return JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, self.base,
+                                   self.generation, self.mtime, self.size,
+                                   len(name)) + name
+
+    @classmethod
+    def unpack(cls, data: bytes):
+        # Вернуть заголовок и его размер или None
+        if len(data) < JOURNAL_HEADER.size:
+            return None
+
+        magic, version, base, generation, mtime, size, name_length = \
+            JOURNAL_HEADER.unpack_from(data)
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION or \
+                len(data) < JOURNAL_HEADER.size + name_length:
+            return None
+
+        name = data[JOURNAL_HEADER.size:JOURNAL_HEADER.size + name_length]
+        header = cls(base, generation, name.decode('utf-8') or None,
+                     mtime, size)
+        return header, JOURNAL_HEADER.size + name_length
+
+
+def file_signature(file_name: str):
+    stat = os.stat(file_name)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def pack_record(kind: int, row: int, count: int, values=None):
+    # Запись журнала; values - столбцы (2, count) азимутов и дальностей
+    record = RECORD.pack(kind, row, count)
+    if values is not None:
+        record += np.ascontiguousarray(values, dtype=COLUMN_DTYPE).tobytes()
+    return record
+
+
+def replay_records(buffer: MeasurementBuffer, data: bytes, offset: int = 0):
+    # Применить записи журнала к буферу измерений и вернуть количество
+    # примененных записей. Неполная последняя запись, оставшаяся
+    # после аварийного завершения, отбрасывается
+    applied = 0
+    while offset + RECORD.size <= len(data):
+        kind, row, count = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+
+        if kind in (RECORD_SET, RECORD_INSERT):
+            payload = 2 * count * COLUMN_DTYPE.itemsize
+            if offset + payload > len(data):
+                break
+
+            values = np.frombuffer(data, dtype=COLUMN_DTYPE, count=2 * count,
+                                   offset=offset).reshape((2, count))
+            offset += payload
+
+            if kind == RECORD_SET:
+                if row + count > len(buffer):
+                    raise ValueError(f"Cannot change rows {row}-{row + count}")
+                buffer.columns[:, row:row + count] = values
+            else:
+                buffer.insert(row, count, values.T)
+
+        elif kind == RECORD_REMOVE:
+            buffer.remove(row, count)
+
+        else:
+            raise ValueError(f"Unknown journal record {kind}")
+
+        applied += 1
+
+    return applied
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+import pkgutil
+
+from PySide2 import QtCore
+
+
+# Двоичный файл ресурсов, собираемый из rfdiagram.qrc командой
+# pyside2-rcc -binary rfdiagram.qrc -o rfdiagram.rcc
+RESOURCE_FILE = "rfdiagram.rcc"
+
+# Содержимое файла ресурсов, зарегистрированное из памяти. Ссылка
+# сохраняется, поскольку Qt не копирует зарегистрированные данные
+resource_data = None
+
+
+def resource_path():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        RESOURCE_FILE)
+
+
+def register_resources():
+    global resource_data
+
+    # Qt отображает файл ресурсов в память и читает только те ресурсы,
+    # к которым выполняется обращение
+    path = resource_path()
+    if os.path.isfile(path) and QtCore.QResource.registerResource(path):
+        logging.debug(f"The resource file '{path}' has been registered")
+        return True
+
+    # В замороженных сборках пакет может находиться в архиве,
+    # поэтому файл ресурсов читается загрузчиком пакета
+    try:
+        data = pkgutil.get_data(__package__, RESOURCE_FILE)
+    except OSError as exc:
+        logging.error(f"Cannot read the resource file: {exc}")
+        return False
+
+    if data and QtCore.QResource.registerResourceData(data):
+        resource_data = data
+        logging.debug("The resource data has been registered from"
+                      " the package loader")
+        return True
+
+    logging.error(f"Cannot register the resource file '{path}'")
+    return False
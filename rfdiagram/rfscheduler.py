@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PySide2 import QtCore
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class ReplotScheduler(QtCore.QObject):
+
+    triggered = QtCore.Signal()
+
+    # Задержка после последнего запроса и максимальная задержка
+    # от первого необработанного запроса в миллисекундах
+    DEFAULT_INTERVAL = 150
+    DEFAULT_MAX_DELAY = 1000
+
+    def __init__(self,
+                 interval: int = DEFAULT_INTERVAL,
+                 max_delay: int = DEFAULT_MAX_DELAY,
+                 parent=None):
+        super().__init__(parent)
+
+        self.max_delay = max_delay
+        self.dirty = False
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.on_timeout)
+
+        self.elapsed = QtCore.QElapsedTimer()
+
+    def interval(self):
+        return self.timer.interval()
+
+    def set_interval(self, interval: int):
+        self.timer.setInterval(interval)
+
+    def request(self):
+        # Отметить график как устаревший и отложить перестроение. Каждый
+        # новый запрос продлевает ожидание, но не дольше максимальной
+        # задержки, чтобы непрерывное редактирование не откладывало
+        # перестроение бесконечно
+        if not self.dirty:
+            self.dirty = True
+            self.elapsed.start()
+            self.timer.start()
+        elif self.elapsed.elapsed() + self.timer.interval() <= self.max_delay:
+            self.timer.start()
+
+    def cancel(self):
+        self.dirty = False
+        self.timer.stop()
+
+    def flush(self):
+        # Выполнить отложенное перестроение немедленно
+        if self.dirty:
+            self.timer.stop()
+            self.on_timeout()
+
+    @QtCore.Slot()
+    def on_timeout(self):
+        if self.dirty:
+            self.dirty = False
+            self.triggered.emit()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+import numpy as np
+
+from .rfinterp import LinearInterpolator, PeriodicCubicInterpolator
+
+
+# Статистика зоны действия: площадь, средняя по азимуту, минимальная
+# и максимальная дальности, а также статистика по секторам. Для пакетной
+# обработки поля содержат массивы с первой осью по номеру диаграммы
+CoverageStatistics = namedtuple(
+    'CoverageStatistics',
+    ['area', 'mean', 'minimum', 'maximum', 'sectors']
+)
+
+# Статистика дальности по секторам, начинающимся с азимутов starts
+# (в градусах); последний сектор может быть уже остальных
+SectorStatistics = namedtuple(
+    'SectorStatistics',
+    ['starts', 'minimum', 'maximum', 'mean']
+)
+
+DEFAULT_SECTOR_WIDTH = 30.0
+
+
+def piecewise_coefficients(interpolant):
+    # Границы и коэффициенты (по убыванию степеней, как в PPoly) отрезков
+    # кусочно-полиномиального интерполянта на одном периоде или None,
+    # если интерполянт не является кусочно-полиномиальным на узлах
+    if isinstance(interpolant, PeriodicCubicInterpolator):
+        return interpolant.spline.x, interpolant.spline.c
+
+    if isinstance(interpolant, LinearInterpolator):
+        knots, values = interpolant.knots, interpolant.values
+        return knots, np.stack((np.diff(values) / np.diff(knots), values[:-1]))
+
+    return None
+
+
+def piecewise_integrals(breakpoints, coefficients):
+    # Точные интегралы дальности и квадрата дальности по периоду
+    widths = np.diff(breakpoints)
+    powers = coefficients[::-1]
+    degree = powers.shape[0] - 1
+
+    integral = np.zeros_like(widths)
+    for i in range(degree + 1):
+        integral += powers[i] * widths ** (i + 1) / (i + 1)
+
+    # Коэффициенты квадрата многочлена находятся сверткой
+    # коэффициентов исходного многочлена на каждом отрезке
+    square_integral = np.zeros_like(widths)
+    for i in range(degree + 1):
+        for j in range(degree + 1):
+            square_integral += powers[i] * powers[j] * \
+                widths ** (i + j + 1) / (i + j + 1)
+
+    return np.sum(integral), np.sum(square_integral)
+
+
+def sector_boundaries(size: int, sector_width: float):
+    # Индексы начала секторов на равномерной сетке из size точек периода.
+    # Секторы уже шага сетки, начинающиеся в одной точке, объединяются,
+    # чтобы каждый сектор содержал хотя бы одно значение
+    if not sector_width > 0.0:
+        raise ValueError(f"Unexpected sector width {sector_width}")
+
+    starts = np.arange(0.0, 360.0, sector_width)
+    indices, first = np.unique(
+        np.minimum(np.rint(starts * size / 360.0).astype(np.intp), size - 1),
+        return_index=True
+    )
+    return starts[first], indices
+
+
+def sector_statistics(distances, sector_width: float):
+    # Статистика по секторам за один проход для значений дальности
+    # на равномерной сетке азимутов, начинающейся с нуля (по последней оси)
+    size = distances.shape[-1]
+    starts, indices = sector_boundaries(size, sector_width)
+    counts = np.diff(np.append(indices, size))
+
+    return SectorStatistics(
+        starts,
+        np.minimum.reduceat(distances, indices, axis=-1),
+        np.maximum.reduceat(distances, indices, axis=-1),
+        np.add.reduceat(distances, indices, axis=-1) / counts
+    )
+
+
+def coverage_statistics(interpolant, lookup_table, knot_distances,
+                        sector_width: float = DEFAULT_SECTOR_WIDTH):
+    # Статистика одной диаграммы. Площадь ½∫r²dθ и средняя дальность
+    # вычисляются аналитически для кусочно-полиномиальных интерполянтов
+    # и квадратурой на равномерной сетке таблицы дальностей для остальных
+    table = lookup_table.table[:-1]
+
+    pieces = piecewise_coefficients(interpolant)
+    if pieces is not None:
+        integral, square_integral = piecewise_integrals(*pieces)
+        area, mean = 0.5 * square_integral, integral / (2.0 * np.pi)
+    else:
+        # Для периодической функции формула трапеций на равномерной
+        # сетке сводится к среднему значению
+        area, mean = np.pi * np.mean(np.square(table)), np.mean(table)
+
+    return CoverageStatistics(
+        area,
+        mean,
+        min(np.min(table), np.min(knot_distances)),
+        max(np.max(table), np.max(knot_distances)),
+        sector_statistics(table, sector_width)
+    )
+
+
+def coverage_statistics_batch(distances,
+                              sector_width: float = DEFAULT_SECTOR_WIDTH):
+    # Статистика множества диаграмм, заданных строками двумерного массива
+    # дальностей на общей равномерной сетке азимутов периода [0°, 360°)
+    distances = np.atleast_2d(np.asarray(distances, dtype=np.float64))
+
+    return CoverageStatistics(
+        np.pi * np.mean(np.square(distances), axis=-1),
+        np.mean(distances, axis=-1),
+        np.min(distances, axis=-1),
+        np.max(distances, axis=-1),
+        sector_statistics(distances, sector_width)
+    )
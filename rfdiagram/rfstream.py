@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import base64
+import binascii
+import codecs
+import json
+import logging
+import re
+
+import numpy as np
+
+from .rfcodec import COLUMN_DTYPE, V1_KEYS, v1_columns, v1_keys
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Имена столбцов формата 2.0 и их номера в буфере измерений
+COLUMN_KEYS = {'azimuths': 0, 'distances': 1}
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+class StreamingJsonLoader:
+
+    # Размер блока чтения файла в байтах
+    CHUNK_SIZE = 1 << 20
+
+    # Минимальная емкость столбцов и коэффициент их геометрического роста
+    MIN_CAPACITY = 1024
+    GROWTH_FACTOR = 1.5
+
+    # Количество символов base64, кодирующее целое число значений float32
+    BASE64_QUANTUM = 16
+
+    def __init__(self, fin, total_size: int, progress=None, is_cancelled=None):
+        # Файл fin открыт в двоичном режиме. Функция progress(done, total)
+        # получает количество прочитанных байтов после каждого блока,
+        # а is_cancelled() позволяет прервать чтение между блоками
+        self.fin = fin
+        self.total_size = total_size
+        self.progress = progress
+        self.is_cancelled = is_cancelled
+
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+
+        # Непрочитанная часть текста: уже разобранный текст отбрасывается
+        # при чтении каждого следующего блока
+        self.text = ''
+        self.pos = 0
+        self.bytes_read = 0
+        self.eof = False
+
+        # Столбцы азимутов и дальностей заполняются по мере разбора
+        # и растут геометрически, если количество измерений неизвестно
+        self.columns = np.empty((2, 0), dtype=np.float32)
+        self.lengths = [0, 0]
+
+        self.content = {}
+        self.has_records = False
+        self.unknown_keys = set()
+        self.cancelled = False
+
+    def fill(self):
+        if self.eof:
+            return False
+
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise LoadCancelled()
+
+        data = self.fin.read(self.CHUNK_SIZE)
+        self.bytes_read += len(data)
+        if not data:
+            self.eof = True
+
+        self.text = self.text[self.pos:] + \
+            self.text_decoder.decode(data, final=self.eof)
+        self.pos = 0
+
+        if self.progress is not None:
+            self.progress(self.bytes_read, self.total_size)
+
+        return not self.eof
+
+    def peek(self):
+        # Пропустить пробельные символы и вернуть следующий символ
+        while True:
+            self.pos = WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or not self.fill():
+                break
+
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expecting '{char}' at byte"
+                             f" {self.bytes_read - len(self.text) + self.pos}")
+        self.pos += 1
+
+    def value(self):
+        # Разобрать значение целиком. Значение, которое заканчивается
+        # на границе прочитанного текста, может быть неполным
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+
+            if end == len(self.text) and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def ensure_capacity(self, required: int):
+        capacity = self.columns.shape[1]
+        if required <= capacity:
+            return
+
+        count = self.content.get('count', None)
+        if isinstance(count, int) and count >= required:
+            capacity = count
+        else:
+            capacity = max(required,
+                           int(capacity * self.GROWTH_FACTOR),
+                           self.MIN_CAPACITY)
+
+        filled = max(self.lengths)
+        columns = np.empty((2, capacity), dtype=np.float32)
+        columns[:, :filled] = self.columns[:, :filled]
+        self.columns = columns
+
+    def append(self, index: int, values):
+        start = self.lengths[index]
+        self.ensure_capacity(start + values.shape[0])
+        self.columns[index, start:start + values.shape[0]] = values
+        self.lengths[index] += values.shape[0]
+
+    def append_records(self, records):
+        self.unknown_keys.update(v1_keys(records).difference(V1_KEYS))
+        for index, column in enumerate(v1_columns(records)):
+            self.append(index, column)
+
+    def read_records(self):
+        # Записи измерений формата 1.0 разбираются пакетами: все полные
+        # записи прочитанного текста декодируются одним вызовом
+        self.expect('[')
+        self.has_records = True
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        while True:
+            records = None
+            if self.peek() == '{':
+                end = self.text.find(']', self.pos)
+                last = self.text.rfind('}', self.pos,
+                                       end if end >= 0 else len(self.text))
+                if last >= 0:
+                    try:
+                        records = json.loads(
+                            '[' + self.text[self.pos:last + 1] + ']'
+                        )
+                        self.pos = last + 1
+                    except json.JSONDecodeError:
+                        records = None
+
+            if records is None:
+                records = [self.value()]
+            self.append_records(records)
+
+            separator = self.peek()
+            if separator == ']':
+                self.pos += 1
+                return
+            if separator != ',':
+                raise ValueError("Expecting ',' or ']' in measurements")
+            self.pos += 1
+
+    def read_base64(self, index: int):
+        # Столбец base64 декодируется по частям, кратным целому числу
+        # значений, без построения строки столбца целиком
+        self.expect('"')
+        remainder = ''
+        while True:
+            end = self.text.find('"', self.pos)
+            stop = end if end >= 0 else len(self.text)
+
+            chunk = remainder + self.text[self.pos:stop]
+            usable = len(chunk) if end >= 0 else \
+                len(chunk) - len(chunk) % self.BASE64_QUANTUM
+            data = base64.b64decode(chunk[:usable], validate=True)
+            if len(data) % COLUMN_DTYPE.itemsize:
+                raise ValueError("Unexpected length of the base64 column")
+
+            self.append(index, np.frombuffer(data, dtype=COLUMN_DTYPE))
+            remainder = chunk[usable:]
+
+            if end >= 0:
+                self.pos = end + 1
+                return
+
+            self.pos = stop
+            if not self.fill():
+                raise ValueError("Unterminated base64 column")
+
+    def read_numbers(self, index: int):
+        # Столбец в виде списка чисел разбирается по частям до последней
+        # запятой прочитанного текста, чтобы не разрывать числа
+        self.expect('[')
+        while True:
+            self.peek()
+            end = self.text.find(']', self.pos)
+            last = end if end >= 0 else self.text.rfind(',', self.pos)
+            if last > self.pos:
+                values = json.loads('[' + self.text[self.pos:last] + ']')
+                self.append(index, np.asarray(values, dtype=np.float32))
+
+            if end >= 0:
+                self.pos = end + 1
+                return
+
+            if last > self.pos:
+                self.pos = last + 1
+            if not self.fill():
+                raise ValueError("Unterminated column")
+
+    def read(self):
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Expecting a property name")
+            self.expect(':')
+
+            first = self.peek()
+            if key == 'measurements' and first == '[':
+                self.read_records()
+            elif key in COLUMN_KEYS and first == '"':
+                self.read_base64(COLUMN_KEYS[key])
+            elif key in COLUMN_KEYS and first == '[':
+                self.read_numbers(COLUMN_KEYS[key])
+            else:
+                self.content[key] = self.value()
+
+            separator = self.peek()
+            self.pos += 1
+            if separator == '}':
+                break
+            if separator != ',':
+                raise ValueError("Expecting ',' or '}'")
+
+        if self.peek():
+            raise ValueError("Extra data after the document")
+
+    def finish(self):
+        # Проверить согласованность прочитанных данных и вернуть столбцы
+        # измерений и их количество или None
+        version = self.content.get('version', None)
+        if not version:
+            logging.error("Cannot retrieve version of JSON data")
+            return None
+
+        length = self.lengths[0]
+        if version == "1.0":
+            if not self.has_records or length == 0:
+                logging.error("Cannot retrieve measurements from JSON data")
+                return None
+
+            for key in sorted(self.unknown_keys):
+                logging.warning(f"Unrecognized key {key} in JSON data")
+
+        elif version == "2.0":
+            count = self.content.get('count', None)
+            if self.lengths[1] != length or length == 0 or \
+                    (count is not None and count != length):
+                logging.error("Inconsistent measurement columns in JSON data")
+                return None
+
+        else:
+            logging.error(f"Unsupported version {version} of JSON data")
+            return None
+
+        return self.columns, length
+
+    def load(self):
+        try:
+            self.read()
+            return self.finish()
+
+        except LoadCancelled:
+            self.cancelled = True
+            logging.info("Loading of JSON data has been cancelled")
+            return None
+
+        except (TypeError, ValueError, binascii.Error) as exc:
+            logging.error(f"Cannot decode measurements from JSON data: {exc}")
+            return None
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import importlib
+import logging
+import os
+import threading
+import time
+
+from PySide2 import QtCore
+
+from .rfbinary import is_binary_file, map_binary, write_binary
+from .rfcache import build_products, measurements_digest
+from .rfcodec import encode_json
+from .rfstream import StreamingJsonLoader
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class PlotJobSignals(QtCore.QObject):
+
+    # Сигнал передает задание с результатами вычислений
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(object)
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class PlotJob(QtCore.QRunnable):
+
+    def __init__(self, version: int, kind: str, measurements,
+                 radius: float, tolerance: float, range_limit_for):
+        super().__init__()
+
+        # Задание работает с неизменяемым снимком данных модели,
+        # поэтому не требует синхронизации с потоком интерфейса
+        self.version = version
+        self.kind = kind
+        self.measurements = measurements
+        self.radius = radius
+        self.tolerance = tolerance
+        self.range_limit_for = range_limit_for
+
+        self.products = None
+        self.curve = None
+
+        self.cancelled = threading.Event()
+
+        # Объект сигналов создается в потоке интерфейса, поэтому сигналы
+        # доставляются получателям через очередь событий этого потока
+        self.signals = PlotJobSignals()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def is_cancelled(self):
+        return self.cancelled.is_set()
+
+    def run(self):
+        try:
+            azimuths = self.measurements[:, 0]
+            distances = self.measurements[:, 1]
+
+            products = build_products(self.kind, azimuths, distances)
+            products.key = (measurements_digest(azimuths, distances), self.kind)
+            if self.is_cancelled():
+                return
+
+            # Вычислить кривую диаграммы для текущего масштаба графика
+            max_range = max(products.distances.max(),
+                            products.dense_grid()[1].max())
+            curve = products.adaptive_curve(
+                self.radius / self.range_limit_for(max_range),
+                self.tolerance
+            )
+            if self.is_cancelled():
+                return
+
+            self.products, self.curve = products, curve
+            self.signals.finished.emit(self)
+
+        except Exception as exc:
+            logging.error(f"An exception occurred during plotting: {exc}")
+            if not self.is_cancelled():
+                self.signals.failed.emit(self)
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class ImportJobSignals(QtCore.QObject):
+
+    finished = QtCore.Signal(object)
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class ImportJob(QtCore.QRunnable):
+
+    def __init__(self, modules):
+        super().__init__()
+
+        # Модули импортируются в фоновом потоке, а виджеты, которые
+        # их используют, создаются в потоке интерфейса после завершения
+        # задания. Время импорта каждого модуля сохраняется в виде
+        # (имя, начало, окончание)
+        self.modules = modules
+        self.timings = []
+
+        self.signals = ImportJobSignals()
+
+    def run(self):
+        for name in self.modules:
+            started = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except ImportError as exc:
+                logging.error(f"Cannot import the module {name}: {exc}")
+            self.timings.append((name, started, time.perf_counter()))
+
+        self.signals.finished.emit(self)
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class FileJobSignals(QtCore.QObject):
+
+    # Доля выполненной работы от 0 до 1
+    progress = QtCore.Signal(float)
+
+    # Сигнал передает задание после его завершения, в том числе
+    # после ошибки или отмены
+    finished = QtCore.Signal(object)
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class FileJob(QtCore.QRunnable):
+
+    def __init__(self, file_name: str):
+        super().__init__()
+
+        self.file_name = file_name
+        self.succeeded = False
+
+        self.cancelled = threading.Event()
+        self.signals = FileJobSignals()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def is_cancelled(self):
+        return self.cancelled.is_set()
+
+    def report_progress(self, fraction: float):
+        self.signals.progress.emit(fraction)
+
+    def execute(self):
+        raise NotImplementedError()
+
+    def run(self):
+        try:
+            self.succeeded = self.execute() and not self.is_cancelled()
+
+        except OSError as exc:
+            logging.error("An exception occurred during access"
+                          f" to the file {self.file_name}: {exc.strerror}")
+
+        except Exception as exc:
+            logging.error("An exception occurred during processing"
+                          f" the file {self.file_name}: {exc}")
+
+        finally:
+            self.signals.finished.emit(self)
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class LoadJob(FileJob):
+
+    def __init__(self, file_name: str):
+        super().__init__(file_name)
+
+        # Столбцы измерений и их количество. Модель принимает их
+        # в потоке интерфейса после завершения задания
+        self.columns = None
+        self.length = None
+
+    def execute(self):
+        if is_binary_file(self.file_name):
+            # Двоичный файл отображается в память, а не читается
+            columns = map_binary(self.file_name)
+            if columns is None:
+                return False
+
+            self.columns, self.length = columns, columns.shape[1]
+            self.report_progress(1.0)
+            return True
+
+        with open(self.file_name, mode='rb') as fin:
+            loader = StreamingJsonLoader(
+                fin,
+                os.fstat(fin.fileno()).st_size,
+                lambda done, total: self.report_progress(done / max(total, 1)),
+                self.is_cancelled
+            )
+            result = loader.load()
+
+        if result is None:
+            return False
+
+        self.columns, self.length = result
+        return True
+
+
+# noinspection PyArgumentList, PyUnresolvedReferences
+class SaveJob(FileJob):
+
+    # Размер блока записи документа JSON в символах
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, file_name: str, azimuths, distances):
+        super().__init__(file_name)
+
+        # Задание читает столбцы модели без копирования: пока оно
+        # выполняется, изменение документа запрещено
+        self.azimuths = azimuths
+        self.distances = distances
+
+    def write_json(self):
+        text = encode_json(self.azimuths, self.distances)
+
+        # Документ записывается во временный файл, чтобы отмена или ошибка
+        # записи не повредили исходный файл
+        temp_name = self.file_name + ".tmp"
+        try:
+            with open(temp_name, mode='w', encoding='utf-8') as fout:
+                for start in range(0, len(text), self.CHUNK_SIZE):
+                    if self.is_cancelled():
+                        break
+
+                    fout.write(text[start:start + self.CHUNK_SIZE])
+                    self.report_progress(
+                        min(start + self.CHUNK_SIZE, len(text)) / len(text)
+                    )
+
+            if self.is_cancelled():
+                logging.info(f"Writing of the file {self.file_name}"
+                             " has been cancelled")
+                os.remove(temp_name)
+                return False
+
+            os.replace(temp_name, self.file_name)
+
+        except OSError:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+
+        return True
+
+    def execute(self):
+        if is_binary_file(self.file_name):
+            return write_binary(self.file_name, self.azimuths, self.distances,
+                                self.report_progress, self.is_cancelled)
+
+        return self.write_json()
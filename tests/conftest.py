@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def columns():
+    # Столбцы азимутов и дальностей; количество измерений нечетное, чтобы
+    # границы блоков чтения не совпадали с границами значений
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.0, 360.0, 257).astype(np.float32), \
+        rng.uniform(10.0, 200.0, 257).astype(np.float32)
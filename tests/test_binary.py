@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from rfdiagram.rfbinary import HEADER_SIZE, is_binary_file, map_binary, \
+    write_binary
+
+
+def test_round_trip(tmp_path):
+    file_name = str(tmp_path / "diagram.rfd")
+    azimuths = np.linspace(0.0, 350.0, 36, dtype=np.float32)
+    distances = np.linspace(100.0, 135.0, 36, dtype=np.float32)
+
+    assert write_binary(file_name, azimuths, distances)
+    columns = map_binary(file_name)
+
+    assert columns.shape == (2, 36)
+    np.testing.assert_array_equal(columns[0], azimuths)
+    np.testing.assert_array_equal(columns[1], distances)
+
+
+def test_mapping_is_copy_on_write(tmp_path):
+    file_name = str(tmp_path / "diagram.rfd")
+    write_binary(file_name, np.ones(4), np.ones(4))
+
+    columns = map_binary(file_name)
+    columns[0, 0] = 5.0
+
+    assert map_binary(file_name)[0, 0] == 1.0
+
+
+def test_cancelled_write_keeps_the_original(tmp_path):
+    file_name = str(tmp_path / "diagram.rfd")
+    write_binary(file_name, np.ones(4), np.ones(4))
+
+    assert not write_binary(file_name, np.zeros(4), np.zeros(4),
+                            is_cancelled=lambda: True)
+    np.testing.assert_array_equal(map_binary(file_name), np.ones((2, 4)))
+    assert sorted(path.name for path in tmp_path.iterdir()) == \
+        ["diagram.rfd"]
+
+
+def test_invalid_files_are_rejected(tmp_path):
+    file_name = str(tmp_path / "diagram.rfd")
+    write_binary(file_name, np.ones(4), np.ones(4))
+
+    with open(file_name, mode='r+b') as fout:
+        fout.truncate(HEADER_SIZE + 12)
+    assert map_binary(file_name) is None
+
+    with open(file_name, mode='wb') as fout:
+        fout.write(b"JSON" + bytes(HEADER_SIZE))
+    assert map_binary(file_name) is None
+
+    assert map_binary(str(tmp_path / "missing.rfd")) is None
+
+
+def test_binary_suffix():
+    assert is_binary_file("a/b/diagram.RFD")
+    assert not is_binary_file("diagram.json")
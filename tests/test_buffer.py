@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfbuffer import MeasurementBuffer, merge_row_ranges, \
+    rows_to_ranges
+
+
+def filled(count: int):
+    buffer = MeasurementBuffer()
+    buffer.insert(0, count, np.column_stack((np.arange(count),
+                                             100.0 + np.arange(count))))
+    return buffer
+
+
+def test_append_grows_geometrically():
+    buffer = MeasurementBuffer()
+    reallocations = 0
+    for row in range(1000):
+        capacity = buffer.capacity
+        buffer.insert(row, 1, [[row, 2.0 * row]])
+        reallocations += buffer.capacity != capacity
+
+    assert len(buffer) == 1000
+    assert reallocations < 20
+    np.testing.assert_array_equal(buffer.azimuths, np.arange(1000))
+    np.testing.assert_array_equal(buffer.distances, 2.0 * np.arange(1000))
+
+
+def test_insert_in_the_middle_shifts_the_tail():
+    buffer = filled(5)
+    buffer.insert(2, 2, [[10.0, 20.0], [11.0, 21.0]])
+
+    np.testing.assert_array_equal(buffer.azimuths, [0, 1, 10, 11, 2, 3, 4])
+    np.testing.assert_array_equal(buffer.distances,
+                                  [100, 101, 20, 21, 102, 103, 104])
+
+
+def test_insert_without_values_fills_zeros():
+    buffer = filled(3)
+    buffer.insert(1, 2)
+
+    np.testing.assert_array_equal(buffer.view(),
+                                  [[0, 100], [0, 0], [0, 0], [1, 101],
+                                   [2, 102]])
+
+
+@pytest.mark.parametrize('row, count', [(-1, 1), (4, 1), (0, 0)])
+def test_insert_rejects_invalid_rows(row, count):
+    with pytest.raises(IndexError):
+        filled(3).insert(row, count)
+
+
+def test_insert_rejects_values_of_wrong_shape():
+    with pytest.raises(ValueError):
+        filled(3).insert(0, 2, [[1.0, 2.0]])
+
+
+def test_remove_shifts_the_tail_and_clips_the_count():
+    buffer = filled(6)
+    buffer.remove(1, 2)
+    np.testing.assert_array_equal(buffer.azimuths, [0, 3, 4, 5])
+
+    buffer.remove(2, 10)
+    np.testing.assert_array_equal(buffer.azimuths, [0, 3])
+
+
+def test_remove_shrinks_a_sparse_buffer():
+    buffer = filled(1000)
+    buffer.remove(10, 990)
+
+    assert len(buffer) == 10
+    assert buffer.capacity < 100
+    np.testing.assert_array_equal(buffer.azimuths, np.arange(10))
+
+
+def test_remove_ranges_compacts_once():
+    buffer = filled(10)
+    buffer.remove_ranges([(8, 5), (1, 2), (2, 1), (5, 1)])
+
+    np.testing.assert_array_equal(buffer.azimuths, [0, 3, 4, 6, 7])
+    np.testing.assert_array_equal(buffer.distances, [100, 103, 104, 106, 107])
+
+
+def test_remove_ranges_matches_sequential_removal():
+    buffer, expected = filled(50000), filled(50000)
+    ranges = [(row, 1) for row in range(0, 50000, 2)]
+    buffer.remove_ranges(ranges)
+    for row, count in reversed(ranges):
+        expected.remove(row, count)
+
+    assert len(buffer) == 25000
+    np.testing.assert_array_equal(buffer.view(), expected.view())
+
+
+def test_remove_ranges_rejects_invalid_rows():
+    with pytest.raises(IndexError):
+        filled(3).remove_ranges([(1, 1), (3, 1)])
+
+
+def test_shrink_to_fit_keeps_data():
+    buffer = filled(100)
+    buffer.reserve(1000)
+    buffer.shrink_to_fit()
+
+    assert buffer.capacity == 100
+    np.testing.assert_array_equal(buffer.distances, 100.0 + np.arange(100))
+
+
+def test_attach_adopts_storage_without_copy():
+    columns = np.zeros((2, 10), dtype=np.float32)
+    buffer = MeasurementBuffer()
+    buffer.attach(columns, 4)
+
+    assert len(buffer) == 4
+    assert buffer.columns is columns
+
+    buffer.insert(4, 1, [[1.0, 2.0]])
+    assert buffer.columns is columns
+    assert columns[0, 4] == 1.0
+
+
+def test_attach_rejects_invalid_storage():
+    with pytest.raises(ValueError):
+        MeasurementBuffer().attach(np.zeros((3, 4), dtype=np.float32))
+    with pytest.raises(ValueError):
+        MeasurementBuffer().attach(np.zeros((2, 4), dtype=np.float32), 5)
+
+
+def test_assign_and_clear():
+    buffer = MeasurementBuffer()
+    buffer.assign([[1.0, 2.0], [3.0, 4.0]])
+    np.testing.assert_array_equal(buffer.view(), [[1, 2], [3, 4]])
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.view().shape == (0, 2)
+
+
+def test_merge_row_ranges():
+    assert merge_row_ranges([(5, 2), (0, 1), (1, 2), (6, 3), (20, 0)]) == \
+        [(0, 3), (5, 4)]
+    assert rows_to_ranges([4, 1, 2, 7]) == [(1, 2), (4, 1), (7, 1)]
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfcache import DiagramProducts, LRUCache, build_products, \
+    measurements_digest
+
+
+@pytest.fixture
+def measurements():
+    azimuths = np.linspace(0.0, 360.0, 200, endpoint=False).astype(np.float32)
+    distances = (100.0 + 10.0 * np.cos(np.radians(3.0 * azimuths))).astype(
+        np.float32
+    )
+    return azimuths, distances
+
+
+def test_identical_content_has_the_same_digest(measurements):
+    azimuths, distances = measurements
+    digest = measurements_digest(azimuths, distances)
+
+    # Повторное открытие того же файла дает новые массивы того же содержимого
+    assert measurements_digest(azimuths.copy(), distances.copy()) == digest
+    assert measurements_digest(azimuths[::-1].copy()[::-1],
+                               distances.copy()) == digest
+
+    changed = distances.copy()
+    changed[10] += 1.0
+    assert measurements_digest(azimuths, changed) != digest
+    assert measurements_digest(azimuths[:-1], distances[:-1]) != digest
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(capacity=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+    assert len(cache) == 2
+    assert cache.get('b', 0) == 0
+
+
+def test_pop_after_in_place_update(measurements):
+    azimuths, distances = measurements
+    cache = LRUCache()
+    key = (measurements_digest(azimuths, distances), 'cubic')
+    products = build_products('cubic', azimuths, distances)
+    products.key = key
+    cache.put(key, products)
+
+    # Продукты, измененные на месте, удаляются из кэша по прежнему ключу
+    assert products.update(50, azimuths[50], 120.0)
+    assert cache.pop(products.key) is products
+    assert key not in cache
+    assert cache.pop(key) is None
+
+
+def test_repeated_updates_are_bounded(measurements):
+    azimuths, distances = measurements
+    products = build_products('cubic', azimuths, distances)
+
+    for update in range(DiagramProducts.MAX_UPDATES):
+        assert products.update(50, azimuths[50], 100.0 + update)
+
+    assert not products.update(50, azimuths[50], 150.0)
+
+
+def test_updates_of_many_rows_are_bounded(measurements):
+    azimuths, distances = measurements
+    products = build_products('cubic', azimuths, distances)
+
+    rows = 10 * np.arange(1, DiagramProducts.MAX_UPDATED_ROWS + 2)
+    for row in rows[:-1]:
+        assert products.update(row, azimuths[row], 120.0)
+
+    assert not products.update(rows[-1], azimuths[rows[-1]], 120.0)
+
+
+def test_updates_match_full_rebuild(measurements):
+    azimuths, distances = measurements
+    products = build_products('cubic', azimuths, distances.copy())
+
+    for update in range(DiagramProducts.MAX_UPDATES):
+        distances[50] = 100.0 + 5.0 * update
+        assert products.update(50, azimuths[50], distances[50])
+
+    grid = np.radians(np.linspace(0.0, 360.0, 3600, endpoint=False))
+    expected = build_products('cubic', azimuths, distances).interpolant(grid)
+    np.testing.assert_allclose(products.interpolant(grid), expected,
+                               atol=1e-3)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfcodec import FORMAT_VERSION, decode_json, encode_json
+
+
+@pytest.mark.parametrize('encoding', ['base64', 'list'])
+def test_v2_round_trip(columns, encoding):
+    text = encode_json(*columns, encoding=encoding)
+    content = json.loads(text)
+
+    assert content['version'] == FORMAT_VERSION
+    assert content['count'] == len(columns[0])
+    assert content['encoding'] == encoding
+
+    azimuths, distances = decode_json(text)
+    np.testing.assert_array_equal(azimuths, columns[0])
+    np.testing.assert_array_equal(distances, columns[1])
+    assert azimuths.dtype == np.float32
+
+
+def test_v1_measurements():
+    text = json.dumps({
+        'version': "1.0",
+        'measurements': [
+            {'azimuth': 10.0, 'distance': 100.0},
+            {'azimuth': 20.0, 'distance': 110.0, 'note': "ignored"},
+            {'azimuth': 30.0}
+        ]
+    })
+
+    azimuths, distances = decode_json(text)
+    np.testing.assert_array_equal(azimuths, [10.0, 20.0, 30.0])
+    np.testing.assert_array_equal(distances, [100.0, 110.0, 0.0])
+
+
+@pytest.mark.parametrize('text', [
+    "not json",
+    "[1, 2]",
+    json.dumps({'measurements': []}),
+    json.dumps({'version': "3.0"}),
+    json.dumps({'version': "1.0", 'measurements': []}),
+    json.dumps({'version': "1.0", 'measurements': [1, 2]}),
+    json.dumps({'version': "2.0", 'count': 0}),
+    json.dumps({'version': "2.0", 'count': 2, 'encoding': "hex"}),
+    json.dumps({'version': "2.0", 'count': 2, 'encoding': "list",
+                'azimuths': [1.0, 2.0]}),
+    json.dumps({'version': "2.0", 'count': 2, 'encoding': "list",
+                'azimuths': [1.0, 2.0], 'distances': [1.0]}),
+    json.dumps({'version': "2.0", 'count': 1, 'encoding': "base64",
+                'azimuths': "!!!!", 'distances': "AAAAAA=="}),
+])
+def test_invalid_documents_are_rejected(text):
+    assert decode_json(text) is None
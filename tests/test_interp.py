@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfinterp import adaptive_samples, chord_errors, \
+    create_interpolator
+
+
+def smooth_diagram(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    azimuths = np.sort(rng.uniform(0.0, 2.0 * np.pi, count))
+    return azimuths, 100.0 + 20.0 * np.cos(3.0 * azimuths)
+
+
+def closed_knots(interpolant):
+    return np.append(interpolant.azimuths,
+                     interpolant.azimuths[0] + 2.0 * np.pi)
+
+
+def screen_error(interpolant, azimuths, distances, scale):
+    points = np.linspace(azimuths[0], azimuths[-1], 100001)
+    values = interpolant(points)
+    errors, _ = chord_errors(azimuths, distances, points,
+                             values * np.cos(points), values * np.sin(points))
+    return errors.max() * scale
+
+
+@pytest.mark.parametrize('kind', ['linear', 'cubic'])
+def test_adaptive_samples_do_not_grow_with_the_number_of_knots(kind):
+    pytest.importorskip("scipy")
+
+    scale = 400.0 / 150.0
+    sizes = []
+    for count in (1000, 10000, 100000):
+        interpolant = create_interpolator(kind, *smooth_diagram(count))
+        azimuths, distances = adaptive_samples(interpolant,
+                                               closed_knots(interpolant),
+                                               scale)
+        sizes.append(azimuths.shape[0])
+
+        assert np.all(np.diff(azimuths) > 0.0)
+        assert screen_error(interpolant, azimuths, distances, scale) <= 0.5
+
+    assert max(sizes) < 200
+    assert max(sizes) - min(sizes) < 10
+
+
+def test_adaptive_samples_keep_corners_of_linear_diagram():
+    azimuths = np.radians([0.0, 80.0, 170.0, 260.0])
+    interpolant = create_interpolator('linear', azimuths,
+                                      [100.0, 40.0, 100.0, 40.0])
+    samples, distances = adaptive_samples(interpolant,
+                                          closed_knots(interpolant), 4.0)
+
+    assert np.all(np.isin(azimuths, samples))
+    assert screen_error(interpolant, samples, distances, 4.0) <= 0.5
+
+
+def test_adaptive_samples_are_bounded_by_screen_resolution():
+    rng = np.random.default_rng(1)
+    azimuths, distances = smooth_diagram(100000)
+    interpolant = create_interpolator(
+        'linear', azimuths, distances + 2.0 * rng.standard_normal(100000)
+    )
+    samples, _ = adaptive_samples(interpolant, closed_knots(interpolant),
+                                  400.0 / 150.0)
+
+    # Периметр области отображения около 2200 пикселей
+    assert samples.shape[0] < 10000
+
+
+def band_limited(azimuths):
+    return 100.0 + 5.0 * np.cos(azimuths) - 3.0 * np.sin(2.0 * azimuths) + \
+        2.0 * np.cos(3.0 * azimuths)
+
+
+def test_trigonometric_series_recovers_band_limited_signal():
+    azimuths = np.arange(12) * (2.0 * np.pi / 12)
+    interpolant = create_interpolator('fourier', azimuths,
+                                      band_limited(azimuths))
+
+    points = np.linspace(-1.0, 7.0, 1001)
+    np.testing.assert_allclose(interpolant(points), band_limited(points),
+                               atol=1e-9)
+
+
+def test_trigonometric_series_interpolates_odd_number_of_points():
+    rng = np.random.default_rng(2)
+    azimuths = np.sort(rng.uniform(0.0, 2.0 * np.pi, 9))
+    distances = rng.uniform(50.0, 150.0, 9)
+    interpolant = create_interpolator('fourier', azimuths, distances)
+
+    np.testing.assert_allclose(interpolant(azimuths), distances, atol=1e-6)
+
+
+def test_trigonometric_series_fits_noisy_measurements():
+    rng = np.random.default_rng(3)
+    azimuths = np.sort(rng.uniform(0.0, 2.0 * np.pi, 5000))
+    interpolant = create_interpolator(
+        'fourier', azimuths,
+        band_limited(azimuths) + 0.5 * rng.standard_normal(5000)
+    )
+
+    points = np.linspace(0.0, 2.0 * np.pi, 361)
+    np.testing.assert_allclose(interpolant(points), band_limited(points),
+                               atol=0.3)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfbuffer import MeasurementBuffer
+from rfdiagram.rfrecords import BASE_DOCUMENT, BASE_SNAPSHOT, RECORD, \
+    RECORD_INSERT, RECORD_REMOVE, RECORD_SET, JournalHeader, pack_record, \
+    replay_records
+
+
+def columns(azimuths, distances):
+    return np.array([azimuths, distances], dtype=np.float32)
+
+
+def test_header_round_trip():
+    header = JournalHeader(BASE_DOCUMENT, 7, "диаграмма.rfd", 123456789, 42)
+    data = header.pack() + b"tail"
+
+    result, size = JournalHeader.unpack(data)
+    assert size == len(data) - 4
+    assert (result.base, result.generation, result.file_name,
+            result.mtime, result.size) == \
+        (BASE_DOCUMENT, 7, "диаграмма.rfd", 123456789, 42)
+
+
+def test_header_without_file_name():
+    data = JournalHeader(BASE_SNAPSHOT, 3).pack()
+
+    result, size = JournalHeader.unpack(data)
+    assert size == len(data)
+    assert result.base == BASE_SNAPSHOT
+    assert result.file_name is None
+
+
+def test_damaged_header_is_rejected():
+    data = JournalHeader(BASE_DOCUMENT, 1, "file.rfd").pack()
+
+    assert JournalHeader.unpack(b"XXXX" + data[4:]) is None
+    assert JournalHeader.unpack(data[:-1]) is None
+    assert JournalHeader.unpack(data[:5]) is None
+
+
+def test_replay_onto_empty_buffer():
+    data = pack_record(RECORD_INSERT, 0, 3,
+                       columns([0.0, 1.0, 2.0], [10.0, 11.0, 12.0])) + \
+        pack_record(RECORD_SET, 1, 1, columns([5.0], [15.0])) + \
+        pack_record(RECORD_INSERT, 3, 2, columns([3.0, 4.0], [13.0, 14.0])) + \
+        pack_record(RECORD_REMOVE, 0, 1)
+
+    buffer = MeasurementBuffer()
+    assert replay_records(buffer, data) == 4
+    np.testing.assert_array_equal(buffer.azimuths, [5.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(buffer.distances, [15.0, 12.0, 13.0, 14.0])
+
+
+def test_replay_onto_attached_buffer():
+    base = columns([0.0, 1.0, 2.0, 3.0], [10.0, 11.0, 12.0, 13.0])
+    data = pack_record(RECORD_SET, 2, 1, columns([20.0], [30.0])) + \
+        pack_record(RECORD_REMOVE, 0, 2)
+
+    buffer = MeasurementBuffer()
+    buffer.attach(base.copy())
+    assert replay_records(buffer, data) == 2
+    np.testing.assert_array_equal(buffer.azimuths, [20.0, 3.0])
+    np.testing.assert_array_equal(buffer.distances, [30.0, 13.0])
+
+
+def test_replay_starts_after_header():
+    header = JournalHeader(BASE_DOCUMENT, 0, "file.rfd").pack()
+    data = header + pack_record(RECORD_INSERT, 0, 1, columns([1.0], [2.0]))
+
+    buffer = MeasurementBuffer()
+    assert replay_records(buffer, data, len(header)) == 1
+    np.testing.assert_array_equal(buffer.distances, [2.0])
+
+
+@pytest.mark.parametrize("cut", [1, RECORD.size - 1, RECORD.size,
+                                 RECORD.size + 5])
+def test_torn_trailing_record_is_ignored(cut: int):
+    first = pack_record(RECORD_INSERT, 0, 2, columns([1.0, 2.0], [3.0, 4.0]))
+    last = pack_record(RECORD_SET, 0, 2, columns([5.0, 6.0], [7.0, 8.0]))
+
+    buffer = MeasurementBuffer()
+    assert replay_records(buffer, first + last[:cut]) == 1
+    np.testing.assert_array_equal(buffer.azimuths, [1.0, 2.0])
+    np.testing.assert_array_equal(buffer.distances, [3.0, 4.0])
+
+
+def test_invalid_records_are_rejected():
+    with pytest.raises(ValueError):
+        replay_records(MeasurementBuffer(), RECORD.pack(9, 0, 0))
+
+    with pytest.raises(ValueError):
+        replay_records(MeasurementBuffer(),
+                       pack_record(RECORD_SET, 0, 1, columns([1.0], [2.0])))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfcoverage import classify_cartesian, classify_polar
+from rfdiagram.rfinterp import create_interpolator
+from rfdiagram.rflookup import RangeLookupTable
+
+
+@pytest.fixture
+def table():
+    azimuths = np.radians(np.arange(0.0, 360.0, 45.0))
+    interpolant = create_interpolator('linear', azimuths,
+                                      100.0 + 10.0 * np.cos(azimuths))
+    return RangeLookupTable(interpolant, resolution=0.5)
+
+
+@pytest.mark.parametrize('blend', [True, False])
+def test_lookup_matches_table_nodes(table, blend):
+    np.testing.assert_allclose(table.lookup([0.0, 90.0, 360.0, -90.0], blend),
+                               [110.0, 100.0, 110.0, 100.0])
+
+
+@pytest.mark.parametrize('blend', [True, False])
+def test_lookup_of_non_finite_azimuths_is_nan(table, blend):
+    with np.errstate(all='raise'):
+        ranges = table.lookup([np.nan, 90.0, np.inf, -np.inf], blend)
+
+    assert np.isnan(ranges[[0, 2, 3]]).all()
+    assert ranges[1] == pytest.approx(100.0)
+
+
+def test_classification_of_targets_without_azimuth(table):
+    inside, margins = classify_polar(table.lookup,
+                                     [45.0, np.nan, 45.0, np.inf],
+                                     [50.0, 50.0, 500.0, 50.0])
+
+    np.testing.assert_array_equal(inside, [True, False, False, False])
+    assert np.isnan(margins[[1, 3]]).all()
+    assert margins[0] > 0.0 > margins[2]
+
+
+def test_classification_of_broadcast_targets_is_chunked(table):
+    sizes = []
+
+    def lookup(azimuths):
+        sizes.append(np.shape(azimuths))
+        return table.lookup(azimuths)
+
+    azimuths = np.linspace(0.0, 360.0, 1000)
+    inside, margins = classify_polar(lookup, azimuths[:, np.newaxis],
+                                     [[95.0, 105.0]], chunk_size=64)
+
+    assert inside.shape == margins.shape == (1000, 2)
+    assert max(sizes) == (64,)
+    expected = table.lookup(azimuths)
+    np.testing.assert_allclose(margins[:, 0], expected - 95.0)
+    np.testing.assert_allclose(margins[:, 1], expected - 105.0)
+
+
+def test_cartesian_classification_matches_polar(table):
+    x = np.linspace(-150.0, 150.0, 31)
+    y = np.linspace(-150.0, 150.0, 21)[:, np.newaxis]
+    inside, margins = classify_cartesian(table.lookup, x, y, chunk_size=50,
+                                         workers=2)
+
+    xx, yy = np.broadcast_arrays(x, y)
+    expected = classify_polar(table.lookup,
+                              np.degrees(np.arctan2(yy, xx)),
+                              np.hypot(xx, yy))
+    np.testing.assert_array_equal(inside, expected[0])
+    np.testing.assert_allclose(margins, expected[1])
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+def test_classification_rejects_invalid_chunk_size(table, chunk_size):
+    with pytest.raises(ValueError, match="chunk size"):
+        classify_polar(table.lookup, [0.0], [50.0], chunk_size=chunk_size)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PySide2 import QtCore
+
+from rfdiagram import rfmodel
+from rfdiagram.rfmodel import RangeFindingModel
+
+
+@pytest.fixture
+def model():
+    model = RangeFindingModel(QtCore.QLocale())
+    azimuths = np.arange(0.0, 360.0, 30.0)
+    distances = 100.0 + 10.0 * np.cos(np.radians(azimuths))
+    model.insert_measurements(0, np.column_stack((azimuths, distances)))
+    return model
+
+
+def forbid_rebuild(monkeypatch):
+    def build_products(*args):
+        raise AssertionError("the products have been rebuilt")
+
+    monkeypatch.setattr(rfmodel, 'build_products', build_products)
+
+
+@pytest.mark.parametrize('kind', ['linear', 'cubic'])
+def test_repeated_edits_of_one_row_are_incremental(model, monkeypatch, kind):
+    products = model.products(kind)
+    forbid_rebuild(monkeypatch)
+
+    # Перетаскивание: несколько изменений одного измерения с построением
+    # диаграммы после каждого из них
+    for azimuth, distance in ((61.0, 120.0), (62.0, 125.0), (63.0, 130.0)):
+        model.setData(model.index(2, 0), azimuth)
+        model.setData(model.index(2, 1), distance)
+        assert model.products(kind) is products
+
+    assert products.version == model.version
+    assert products.interpolant(np.radians([63.0]))[0] == \
+        pytest.approx(130.0)
+
+
+@pytest.mark.parametrize('kind', ['linear', 'cubic'])
+def test_edit_of_azimuth_and_distance_with_plot_in_between(model, monkeypatch,
+                                                          kind):
+    products = model.products(kind)
+    forbid_rebuild(monkeypatch)
+
+    model.setData(model.index(4, 0), 121.0)
+    assert model.products(kind) is products
+
+    model.setData(model.index(4, 1), 140.0)
+    assert model.products(kind) is products
+    assert products.version == model.version
+
+
+def test_insert_measurements_inserts_a_block(model):
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last:
+                               inserted.append((first, last)))
+    version = model.version
+
+    assert model.insert_measurements(2, [[45.0, 1.0], [50.0, 2.0]])
+    assert inserted == [(2, 3)]
+    assert model.version == version + 1
+    np.testing.assert_array_equal(model.buffer.azimuths[:5],
+                                  [0.0, 30.0, 45.0, 50.0, 60.0])
+
+    assert not model.insert_measurements(model.rowCount() + 1, [[0.0, 1.0]])
+    assert not model.insert_measurements(0, np.empty((0, 2)))
+
+
+def test_remove_row_ranges_removes_few_ranges_in_place(model):
+    removed = []
+    model.rowsRemoved.connect(lambda parent, first, last:
+                              removed.append((first, last)))
+
+    assert model.remove_row_ranges([(1, 1), (2, 1), (6, 2)])
+    assert removed == [(6, 7), (1, 2)]
+    np.testing.assert_array_equal(
+        model.buffer.azimuths,
+        [0.0, 90.0, 120.0, 150.0, 240.0, 270.0, 300.0, 330.0]
+    )
+    assert not model.remove_row_ranges([(model.rowCount(), 1)])
+
+
+def test_remove_row_ranges_resets_once_for_many_ranges():
+    model = RangeFindingModel(QtCore.QLocale())
+    model.insert_measurements(0, np.column_stack((np.arange(1000.0),
+                                                  np.ones(1000))))
+    removed, resets = [], []
+    model.rowsRemoved.connect(lambda *args: removed.append(args))
+    model.modelReset.connect(lambda: resets.append(True))
+    version = model.version
+
+    assert model.remove_row_ranges((row, 1) for row in range(0, 1000, 2))
+    assert not removed
+    assert len(resets) == 1
+    assert model.version == version + 1
+    np.testing.assert_array_equal(model.buffer.azimuths,
+                                  np.arange(1.0, 1000.0, 2.0))
+
+
+def test_products_of_identical_content_are_reused(model, monkeypatch):
+    products = model.products('cubic')
+    columns = model.buffer.columns[:, :model.rowCount()].copy()
+
+    # Повторное открытие того же документа находит продукты в кэше
+    forbid_rebuild(monkeypatch)
+    model.adopt_columns(columns)
+    assert model.products('cubic') is products
+    assert products.version == model.version
+
+
+def test_updated_products_leave_the_cache(model, monkeypatch):
+    products = model.products('cubic')
+    key = products.key
+
+    model.setData(model.index(2, 1), 130.0)
+    assert model.products('cubic') is products
+    assert products.key is None
+    assert key not in model.products_cache
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import warnings
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfstats import sector_statistics
+
+
+def test_sector_statistics():
+    distances = np.arange(360.0)
+    sectors = sector_statistics(distances, 90.0)
+
+    np.testing.assert_array_equal(sectors.starts, [0.0, 90.0, 180.0, 270.0])
+    np.testing.assert_array_equal(sectors.minimum, [0.0, 90.0, 180.0, 270.0])
+    np.testing.assert_array_equal(sectors.maximum, [89.0, 179.0, 269.0, 359.0])
+    np.testing.assert_allclose(sectors.mean, [44.5, 134.5, 224.5, 314.5])
+
+
+@pytest.mark.parametrize('width', [0.0, -30.0, np.nan])
+def test_sector_statistics_reject_invalid_width(width):
+    with pytest.raises(ValueError):
+        sector_statistics(np.ones(36), width)
+
+
+def test_sectors_narrower_than_the_grid_are_merged():
+    distances = np.arange(36.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        sectors = sector_statistics(distances, 2.5)
+
+    assert sectors.starts.shape == sectors.mean.shape
+    assert np.all(np.isfinite(sectors.mean))
+    np.testing.assert_array_equal(sectors.minimum, distances)
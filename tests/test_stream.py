@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from rfdiagram.rfcodec import encode_json
+from rfdiagram.rfstream import StreamingJsonLoader
+
+
+def load(text: str, chunk_size: int, **kwargs):
+    data = text.encode('utf-8')
+    loader = StreamingJsonLoader(io.BytesIO(data), len(data), **kwargs)
+    loader.CHUNK_SIZE = chunk_size
+    result = loader.load()
+    return loader, result
+
+
+def v1_document(columns):
+    return json.dumps({
+        'version': "1.0",
+        'measurements': [
+            {'azimuth': float(azimuth), 'distance': float(distance)}
+            for azimuth, distance in zip(*columns)
+        ]
+    }, indent=2)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64, 1 << 20])
+@pytest.mark.parametrize('encoding', ['base64', 'list'])
+def test_v2_document_at_any_chunk_size(columns, chunk_size, encoding):
+    _, result = load(encode_json(*columns, encoding=encoding), chunk_size)
+
+    loaded, length = result
+    assert length == len(columns[0])
+    np.testing.assert_array_equal(loaded[0, :length], columns[0])
+    np.testing.assert_array_equal(loaded[1, :length], columns[1])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 64, 1 << 20])
+def test_v1_document_at_any_chunk_size(columns, chunk_size):
+    _, result = load(v1_document(columns), chunk_size)
+
+    loaded, length = result
+    assert length == len(columns[0])
+    np.testing.assert_array_equal(loaded[0, :length], columns[0])
+    np.testing.assert_array_equal(loaded[1, :length], columns[1])
+
+
+def test_multibyte_characters_split_between_chunks(columns):
+    text = encode_json(*columns)[:-1] + ', "comment": "дальность"}'
+    _, result = load(text, 1)
+
+    assert result[1] == len(columns[0])
+
+
+def test_progress_reaches_the_file_size(columns):
+    reports = []
+    text = encode_json(*columns)
+    load(text, 256, progress=lambda done, total: reports.append((done, total)))
+
+    assert reports[-1] == (len(text), len(text))
+    assert [done for done, _ in reports] == \
+        sorted(done for done, _ in reports)
+
+
+def test_cancellation(columns):
+    loader, result = load(encode_json(*columns), 16, is_cancelled=lambda: True)
+
+    assert result is None
+    assert loader.cancelled
+
+
+@pytest.mark.parametrize('text', [
+    '',
+    '{"version": "2.0", "count": 2, "azimuths": "AAAA',
+    '{"version": "2.0", "count": 3, "encoding": "list",'
+    ' "azimuths": [1, 2, 3], "distances": [1, 2]}',
+    '{"version": "1.0", "measurements": []}',
+    '{"measurements": [{"azimuth": 1, "distance": 2}]}',
+    '{"version": "1.0", "measurements": [{"azimuth": 1, "distance": 2}]} x',
+])
+def test_invalid_documents_are_rejected(text):
+    loader, result = load(text, 4)
+
+    assert result is None
+    assert not loader.cancelled